@@ -0,0 +1,225 @@
+"""
+스트리밍 ZIP/TAR 아카이브 작성기
+임시 파일 없이 아카이브 바이트를 생성하는 즉시 응답으로 흘려보냄
+"""
+import os
+import stat
+import tarfile
+import time
+import zipfile
+from typing import Generator, Optional, Tuple
+
+# 디렉토리 아카이브에서 파일을 읽는 단위 / 한 번에 내보내는 최소 크기
+ARCHIVE_READ_SIZE = 256 * 1024
+
+ARCHIVE_FORMATS = {
+    "zip": ("application/zip", ".zip"),
+    "tar": ("application/x-tar", ".tar"),
+    "tar.gz": ("application/gzip", ".tar.gz"),
+}
+
+
+class StreamBuffer:
+    """ZipFile이 쓰는 바이트를 모아두는 seek 불가능한 버퍼"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        """지금까지 쌓인 바이트를 꺼내고 버퍼 비우기"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStreamWriter:
+    """
+    엔트리 단위로 ZIP을 스트리밍 생성
+
+    seek 불가능한 출력에서는 zipfile이 data descriptor를 사용하므로
+    엔트리 크기를 미리 알 필요가 없음
+    """
+
+    def __init__(self, compression: int = zipfile.ZIP_DEFLATED):
+        self._buffer = StreamBuffer()
+        self._compression = compression
+        self._zip = zipfile.ZipFile(self._buffer, mode="w", compression=compression)
+        self._entry = None
+
+    def open_entry(
+        self,
+        name: str,
+        date_time: Optional[Tuple[int, ...]] = None,
+        mode: Optional[int] = None
+    ) -> bytes:
+        """
+        새 엔트리 시작
+
+        Args:
+            name: 아카이브 내부 경로 (/로 끝나면 디렉토리)
+            date_time: 수정 시각 (기본값: 현재 시각)
+            mode: 파일 권한 (st_mode)
+
+        Returns:
+            출력할 바이트
+        """
+        info = zipfile.ZipInfo(name, date_time or time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_STORED if name.endswith("/") else self._compression
+        if mode is not None:
+            info.external_attr = (mode & 0xFFFF) << 16
+        self._entry = self._zip.open(info, mode="w", force_zip64=True)
+        return self._buffer.drain()
+
+    def write(self, data: bytes) -> bytes:
+        """현재 엔트리에 데이터 쓰기 (압축된 출력 바이트 반환)"""
+        self._entry.write(data)
+        return self._buffer.drain()
+
+    def close_entry(self) -> bytes:
+        """현재 엔트리 종료"""
+        if self._entry is not None:
+            self._entry.close()
+            self._entry = None
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        """중앙 디렉토리를 기록하고 아카이브 종료"""
+        self.close_entry()
+        self._zip.close()
+        return self._buffer.drain()
+
+
+class TarStreamWriter:
+    """
+    엔트리 단위로 TAR(.tar / .tar.gz)을 스트리밍 생성
+
+    tarfile.addfile은 파일 전체를 한 번에 버퍼에 쓰므로, 헤더만 기록한 뒤
+    본문은 블록 단위로 직접 써서 메모리 사용량을 일정하게 유지함
+    """
+
+    def __init__(self, compress: bool = False):
+        self._buffer = StreamBuffer()
+        self._tar = tarfile.open(
+            fileobj=self._buffer, mode="w|gz" if compress else "w|", format=tarfile.PAX_FORMAT
+        )
+        self._remaining = 0
+
+    def open_entry(self, info: tarfile.TarInfo) -> bytes:
+        """새 엔트리 헤더 기록 (일반 파일이면 info.size 바이트를 write로 이어서 써야 함)"""
+        self._tar.addfile(info)
+        self._remaining = info.size if info.isreg() else 0
+        return self._buffer.drain()
+
+    def write(self, data: bytes) -> bytes:
+        """현재 엔트리 본문 쓰기 (헤더의 크기를 넘는 부분은 버림)"""
+        data = data[:self._remaining]
+        self._tar.fileobj.write(data)
+        self._remaining -= len(data)
+        return self._buffer.drain()
+
+    def close_entry(self, size: int) -> bytes:
+        """현재 엔트리 종료 (파일이 줄어든 경우 0으로 채우고 블록 경계 맞춤)"""
+        if self._remaining:
+            self._tar.fileobj.write(tarfile.NUL * self._remaining)
+            self._remaining = 0
+        blocks, remainder = divmod(size, tarfile.BLOCKSIZE)
+        if remainder:
+            self._tar.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+            blocks += 1
+        self._tar.offset += blocks * tarfile.BLOCKSIZE
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        """종료 블록을 기록하고 아카이브 종료"""
+        self._tar.close()
+        return self._buffer.drain()
+
+
+def iter_directory_archive(root: str, arcname: str, fmt: str = "zip") -> Generator[bytes, None, None]:
+    """
+    디렉토리를 아카이브로 스트리밍 (동기 제너레이터 - 스레드 풀에서 한 단계씩 실행)
+
+    심볼릭 링크는 따라가지 않음: TAR에는 링크로 기록하고, ZIP에서는 제외
+
+    Args:
+        root: 디렉토리 절대 경로
+        arcname: 아카이브 내부 최상위 폴더 이름
+        fmt: zip, tar, tar.gz
+
+    Yields:
+        아카이브 바이트 (ARCHIVE_READ_SIZE 이상씩 모아서)
+    """
+    is_zip = fmt == "zip"
+    writer = ZipStreamWriter() if is_zip else TarStreamWriter(compress=fmt == "tar.gz")
+    pending = bytearray()
+
+    def entries():
+        yield root, arcname, os.lstat(root)
+        for current, dirs, files in os.walk(root):
+            dirs.sort()
+            for name in sorted(dirs + files):
+                path = os.path.join(current, name)
+                try:
+                    st = os.lstat(path)
+                except OSError:
+                    continue
+                yield path, arcname + "/" + os.path.relpath(path, root), st
+
+    for path, name, st in entries():
+        if stat.S_ISDIR(st.st_mode):
+            if is_zip:
+                pending += writer.open_entry(name + "/", time.localtime(st.st_mtime)[:6], st.st_mode)
+                pending += writer.close_entry()
+            else:
+                info = tarfile.TarInfo(name)
+                info.type, info.mode, info.mtime = tarfile.DIRTYPE, stat.S_IMODE(st.st_mode), st.st_mtime
+                pending += writer.open_entry(info)
+            continue
+
+        if stat.S_ISLNK(st.st_mode):
+            if not is_zip:
+                info = tarfile.TarInfo(name)
+                info.type, info.linkname, info.mtime = tarfile.SYMTYPE, os.readlink(path), st.st_mtime
+                pending += writer.open_entry(info)
+            continue
+
+        if not stat.S_ISREG(st.st_mode):
+            continue
+
+        try:
+            f = open(path, "rb")
+        except OSError:
+            continue
+
+        with f:
+            if is_zip:
+                pending += writer.open_entry(name, time.localtime(st.st_mtime)[:6], st.st_mode)
+            else:
+                info = tarfile.TarInfo(name)
+                info.size, info.mode, info.mtime = st.st_size, stat.S_IMODE(st.st_mode), st.st_mtime
+                pending += writer.open_entry(info)
+
+            while True:
+                block = f.read(ARCHIVE_READ_SIZE)
+                if not block:
+                    break
+                pending += writer.write(block)
+                if len(pending) >= ARCHIVE_READ_SIZE:
+                    yield bytes(pending)
+                    pending.clear()
+
+            pending += writer.close_entry() if is_zip else writer.close_entry(st.st_size)
+
+        if len(pending) >= ARCHIVE_READ_SIZE:
+            yield bytes(pending)
+            pending.clear()
+
+    pending += writer.close()
+    yield bytes(pending)
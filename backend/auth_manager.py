@@ -3,12 +3,17 @@ Authentication Manager
 Handles password hashing, JWT token generation, and user authentication
 SQLite 기반 저장
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+import hashlib
+import os
 import secrets
 import asyncio
+import time
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -17,13 +22,53 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
+# Verified token cache size (0 disables caching)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))
+
+# WebSocket tickets: single-use, bound to one scope (a terminal session id or the file watch), valid for a few seconds
+WS_TICKET_TTL = float(os.getenv("WS_TICKET_TTL", "30"))
+WS_TICKET_MAX = 10000
+# Ticket scope for the file watch WebSocket (contains "/", so it can never be a session id)
+FILE_WATCH_TICKET_SCOPE = "files/watch"
+
+# bcrypt runs in its own small pool so logins never block the event loop.
+# Requests beyond PASSWORD_HASH_MAX_PENDING (running + queued) are rejected.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+
+
+class PasswordHashBusy(Exception):
+    """Raised when too many password hash operations are already queued"""
+
 
 class AuthManager:
     """Manages authentication operations"""
 
-    def __init__(self, storage):
+    def __init__(self, storage, token_cache_size: int = TOKEN_CACHE_SIZE):
         self.storage = storage
         self.secret_key = None
+        self._secret_ready = asyncio.Event()
+
+        # Verified tokens: sha256(token) -> (username, exp timestamp), LRU order
+        self.token_cache_size = token_cache_size
+        self._token_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self.token_cache_hits = 0
+        self.token_cache_misses = 0
+
+        # Password hashing pool and queue depth (running + waiting)
+        self._hash_executor = ThreadPoolExecutor(
+            max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+        )
+        self.hash_pending = 0
+        self.hash_pending_peak = 0
+        self.hash_rejected = 0
+
+        # Outstanding WebSocket tickets: ticket -> (username, scope, expires), oldest first
+        self._ws_tickets: Dict[str, Tuple[str, str, float]] = {}
+
+        # Admin credentials cache (None until loaded; only an existing admin is cached)
+        self._admin: Optional[dict] = None
+
         # SECRET_KEY를 동기적으로 초기화 (비동기 컨텍스트에서 호출됨)
         asyncio.create_task(self._init_secret_key())
 
@@ -41,10 +86,13 @@ class AuthManager:
             await self.storage.set_config("jwt_secret_key", new_key)
             self.secret_key = new_key
 
+        self.clear_token_cache()
+        self._secret_ready.set()
+
     async def ensure_secret_key(self):
         """SECRET_KEY가 초기화될 때까지 대기"""
-        while self.secret_key is None:
-            await asyncio.sleep(0.01)
+        if self.secret_key is None:
+            await self._secret_ready.wait()
         return self.secret_key
 
     def hash_password(self, password: str) -> str:
@@ -55,8 +103,49 @@ class AuthManager:
         """Verify a password against its hash"""
         return pwd_context.verify(plain_password, hashed_password)
 
+    async def _run_hash(self, func, *args):
+        """
+        Run a bcrypt operation in the password hash pool
+
+        Raises:
+            PasswordHashBusy: too many operations already running or queued
+        """
+        if self.hash_pending >= PASSWORD_HASH_MAX_PENDING:
+            self.hash_rejected += 1
+            raise PasswordHashBusy()
+
+        self.hash_pending += 1
+        self.hash_pending_peak = max(self.hash_pending_peak, self.hash_pending)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._hash_executor, func, *args)
+        finally:
+            self.hash_pending -= 1
+
+    def hash_stats(self) -> dict:
+        """Password hash pool statistics"""
+        return {
+            "workers": PASSWORD_HASH_WORKERS,
+            "pending": self.hash_pending,
+            "pending_peak": self.hash_pending_peak,
+            "max_pending": PASSWORD_HASH_MAX_PENDING,
+            "rejected": self.hash_rejected,
+        }
+
+    def close(self):
+        """Shut down the password hash pool"""
+        self._hash_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _get_admin(self) -> Optional[dict]:
+        """Admin credentials (read from storage once, then served from memory)"""
+        if self._admin is None:
+            self._admin = await self.storage.get_admin()
+        return self._admin
+
     async def is_setup_complete(self) -> bool:
         """Check if initial admin setup is complete"""
+        if self._admin is not None:
+            return True
         return await self.storage.admin_exists()
 
     async def create_admin(self, username: str, password: str) -> bool:
@@ -64,19 +153,25 @@ class AuthManager:
         if await self.is_setup_complete():
             return False
 
-        hashed_password = self.hash_password(password)
-        return await self.storage.create_admin(username, hashed_password)
+        hashed_password = await self._run_hash(self.hash_password, password)
+        created = await self.storage.create_admin(username, hashed_password)
+        if created:
+            self._admin = None
+            await self._get_admin()
+            # Credentials changed: tokens verified before this must be checked again
+            self.clear_token_cache()
+        return created
 
     async def verify_admin(self, username: str, password: str) -> bool:
         """Verify admin credentials"""
-        admin_data = await self.storage.get_admin()
+        admin_data = await self._get_admin()
         if not admin_data:
             return False
 
         if admin_data["username"] != username:
             return False
 
-        return self.verify_password(password, admin_data["password"])
+        return await self._run_hash(self.verify_password, password, admin_data["password"])
 
     async def create_access_token(self, username: str) -> str:
         """Create JWT access token"""
@@ -91,13 +186,72 @@ class AuthManager:
         return encoded_jwt
 
     async def verify_token(self, token: str) -> Optional[str]:
-        """Verify JWT token and return username"""
+        """
+        Verify JWT token and return username
+
+        Successfully verified tokens are cached until their own expiry, so the
+        repeated polling requests of one client skip the signature check.
+        Only valid tokens are cached; invalid ones are always fully decoded.
+        """
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            if cached[1] > time.time():
+                self._token_cache.move_to_end(key)
+                self.token_cache_hits += 1
+                return cached[0]
+            del self._token_cache[key]
+
+        self.token_cache_misses += 1
         try:
             secret_key = await self.ensure_secret_key()
             payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
-            username: str = payload.get("sub")
-            if username is None:
-                return None
-            return username
         except JWTError:
             return None
+
+        username: str = payload.get("sub")
+        if username is None:
+            return None
+
+        expires = payload.get("exp")
+        if self.token_cache_size > 0 and isinstance(expires, (int, float)):
+            self._token_cache[key] = (username, float(expires))
+            while len(self._token_cache) > self.token_cache_size:
+                self._token_cache.popitem(last=False)
+        return username
+
+    def issue_ws_ticket(self, username: str, scope: str) -> str:
+        """
+        Issue a single-use ticket for opening one WebSocket
+
+        scope is the terminal session id, or FILE_WATCH_TICKET_SCOPE for the file watch.
+
+        Tickets live only in memory and expire after WS_TICKET_TTL seconds, so the
+        long-lived JWT never appears in a WebSocket URL.
+        """
+        now = time.monotonic()
+        # Tickets share one TTL, so insertion order is expiry order
+        while self._ws_tickets:
+            oldest = next(iter(self._ws_tickets))
+            if self._ws_tickets[oldest][2] > now and len(self._ws_tickets) < WS_TICKET_MAX:
+                break
+            del self._ws_tickets[oldest]
+
+        ticket = secrets.token_urlsafe(24)
+        self._ws_tickets[ticket] = (username, scope, now + WS_TICKET_TTL)
+        return ticket
+
+    def consume_ws_ticket(self, ticket: str, scope: str) -> Optional[str]:
+        """Redeem a ticket (one dict lookup); returns the username or None if invalid"""
+        entry = self._ws_tickets.pop(ticket, None)
+        if entry is None:
+            return None
+
+        username, bound_scope, expires = entry
+        if bound_scope != scope or expires < time.monotonic():
+            return None
+        return username
+
+    def clear_token_cache(self):
+        """Drop all cached token verifications (call whenever the secret or the admin credentials change)"""
+        self._token_cache.clear()
@@ -0,0 +1,63 @@
+"""
+인증 토큰 검증 마이크로 벤치마크
+
+AuthManager.verify_token의 요청당 비용을 토큰 캐시 사용/미사용으로 비교
+
+사용법:
+    cd backend && python benchmarks/bench_auth.py [--number 20000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth_manager import AuthManager  # noqa: E402
+from sqlite_storage import SQLiteStorage  # noqa: E402
+
+
+async def measure(auth: AuthManager, token: str, number: int) -> float:
+    """verify_token 평균 시간 (마이크로초)"""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(number):
+            await auth.verify_token(token)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / number * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="인증 토큰 검증 벤치마크")
+    parser.add_argument("--number", type=int, default=20000, help="반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = SQLiteStorage(os.path.join(directory, "bench.db"))
+        await storage.connect()
+        try:
+            # 첫 번째가 저장한 SECRET_KEY를 두 번째가 읽도록 순서대로 초기화
+            uncached = AuthManager(storage, token_cache_size=0)
+            await uncached.ensure_secret_key()
+            cached = AuthManager(storage)
+            await cached.ensure_secret_key()
+
+            token = await cached.create_access_token("admin")
+            assert await uncached.verify_token(token) == "admin"
+            assert await cached.verify_token(token) == "admin"
+
+            print(f"{args.number} verifications each")
+            print(f"  jwt.decode every request   {await measure(uncached, token, args.number):8.2f} us/verify")
+            print(f"  verified token cache       {await measure(cached, token, args.number):8.2f} us/verify")
+            print(f"  invalid token (no cache)   {await measure(cached, token[:-2] + 'xx', args.number // 10):8.2f} us/verify")
+            print(f"  cache: hits={cached.token_cache_hits}, misses={cached.token_cache_misses}")
+        finally:
+            await storage.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
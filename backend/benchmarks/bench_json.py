@@ -0,0 +1,100 @@
+"""
+API JSON 직렬화 벤치마크
+
+10,000개 항목 디렉토리에 대한 /api/files 처리량(req/s)을
+표준 json(JSONResponse)과 orjson(FastJSONResponse)으로 비교하고,
+같은 응답 본문의 직렬화 비용(jsonable_encoder 포함 여부)도 따로 측정
+
+목록 캐시가 채워진 상태에서 측정하므로 요청당 비용은 대부분 인증, 라우팅, 직렬화
+압축 비용을 빼기 위해 Accept-Encoding: identity로 요청
+
+사용법:
+    cd backend && python benchmarks/bench_json.py [--entries 10000] [--requests 200]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# main 임포트 전에 임시 DB/워크스페이스 지정
+_directory = tempfile.mkdtemp(prefix="bench-json-")
+os.environ["DB_PATH"] = os.path.join(_directory, "bench.db")
+os.environ["WORKSPACE_ROOT"] = os.path.join(_directory, "workspace")
+os.environ.setdefault("STATIC_PRUNE", "false")
+os.environ.setdefault("LOGIN_RATE_PERSIST", "false")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import json_response  # noqa: E402
+from main import app  # noqa: E402
+
+
+def measure(callable_, number: int) -> float:
+    """평균 시간 (밀리초, 3회 중 최솟값)"""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(number):
+            callable_()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / number * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API JSON 직렬화 벤치마크")
+    parser.add_argument("--entries", type=int, default=10000, help="디렉토리 항목 수")
+    parser.add_argument("--requests", type=int, default=200, help="측정 요청 수")
+    args = parser.parse_args()
+
+    listing = os.path.join(os.environ["WORKSPACE_ROOT"], "big")
+    os.makedirs(listing)
+    for i in range(args.entries):
+        with open(os.path.join(listing, f"file_{i:06d}.txt"), "w") as f:
+            f.write("x" * (i % 100))
+
+    orjson = json_response.orjson
+    if orjson is None:
+        print("orjson이 설치되어 있지 않아 두 경로 모두 표준 json을 사용합니다")
+
+    with TestClient(app) as client:
+        client.post("/api/auth/setup", json={"username": "admin", "password": "benchmark123"})
+        token = client.post("/api/auth/login", json={"username": "admin", "password": "benchmark123"}).json()["access_token"]
+        client.headers.update({"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"})
+
+        def request():
+            response = client.get("/api/files", params={"path": "big"})
+            assert response.status_code == 200, response.text
+
+        request()  # 목록 캐시 채우기
+        payload = client.get("/api/files", params={"path": "big"}).json()
+        print(f"/api/files?path=big: {len(payload['items'])} entries, {len(json.dumps(payload))} bytes")
+
+        results = {}
+        for name, module in (("json (JSONResponse)", None), ("orjson (FastJSONResponse)", orjson)):
+            json_response.orjson = module
+            ms = measure(request, args.requests)
+            results[name] = ms
+            print(f"  {name:28s} {ms:7.2f} ms/request  {1000 / ms:7.1f} req/s")
+        json_response.orjson = orjson
+
+    print("serialization only:")
+    number = max(1, args.requests // 4)
+    print(f"  jsonable_encoder + json.dumps {measure(lambda: json.dumps(jsonable_encoder(payload)), number):7.2f} ms")
+    print(f"  json.dumps                    {measure(lambda: json.dumps(payload), number):7.2f} ms")
+    if orjson is not None:
+        print(f"  orjson.dumps                  {measure(lambda: orjson.dumps(payload), number):7.2f} ms")
+
+    shutil.rmtree(_directory, ignore_errors=True)
+    # 파일 감시/인덱스 스레드를 기다리지 않고 종료
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
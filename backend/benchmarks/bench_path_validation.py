@@ -0,0 +1,62 @@
+"""
+경로 검증 마이크로 벤치마크
+
+기존 방식(요청마다 Path.resolve() 두 번 + startswith)과 path_validator
+(루트는 한 번만 해석, 요청 경로는 매번 os.path.realpath + commonpath)의 요청당 비용 비교
+
+사용법:
+    cd backend && python benchmarks/bench_path_validation.py [--depth 6] [--number 20000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from path_validator import PathValidator  # noqa: E402
+
+
+def legacy_validate(root: str, path: str) -> Path:
+    """기존 main.validate_path 구현"""
+    abs_path = (Path(root) / path).resolve()
+    if not str(abs_path).startswith(str(Path(root).resolve())):
+        raise PermissionError(path)
+    return abs_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경로 검증 벤치마크")
+    parser.add_argument("--depth", type=int, default=6, help="디렉토리 깊이")
+    parser.add_argument("--number", type=int, default=20000, help="반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        directory = os.path.join(root, *[f"dir{i}" for i in range(args.depth)])
+        os.makedirs(directory)
+        for i in range(100):
+            open(os.path.join(directory, f"file{i}.txt"), "w").close()
+
+        relative = os.path.relpath(directory, root)
+        paths = [f"{relative}/file{i}.txt" for i in range(100)]
+        validator = PathValidator(root)
+
+        # 결과가 기존 구현과 같은지 먼저 확인
+        for path in paths + [relative, "", "."]:
+            assert validator.validate(path) == legacy_validate(root, path), path
+
+        cases = [
+            ("legacy (Path.resolve x2)", lambda: [legacy_validate(root, p) for p in paths]),
+            ("path_validator", lambda: [validator.validate(p) for p in paths]),
+        ]
+
+        print(f"depth={args.depth}, {args.number} validations each")
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=args.number // len(paths), repeat=3))
+            print(f"  {name:26s} {seconds / args.number * 1e6:8.2f} us/validation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+파일명 퍼지 검색 벤치마크
+
+합성한 경로 N개(기본 500,000)로 인덱스 스냅샷을 만들고 질의별 검색 시간(ms)을 측정
+알파벳 순으로 뒤쪽에 있는 정확한 이름(src/zz_.../<질의>.py)이 1위로 나오는지도 확인
+
+파일 시스템을 만들지 않고 스냅샷만 구성하므로 인덱스 구축/감시 비용은 포함하지 않음
+
+사용법:
+    cd backend && python benchmarks/bench_search.py [--entries 500000] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("WORKSPACE_ROOT", os.getcwd())
+
+from file_index import FileIndex, _Snapshot  # noqa: E402
+
+WORDS = (
+    "api", "app", "auth", "base", "build", "cache", "client", "config", "core", "data",
+    "event", "file", "handler", "index", "loader", "manager", "model", "parser", "query", "render",
+    "router", "schema", "server", "service", "session", "store", "stream", "test", "util", "view",
+    "widget", "worker",
+)
+EXTENSIONS = (".py", ".ts", ".tsx", ".js", ".json", ".md", ".css")
+
+# (질의, 1위로 나와야 하는 경로)
+QUERIES = (
+    ("main", "src/zz_late/main.py"),
+    ("rend", None),
+    ("sessmgr", None),
+    ("widgetrenderer", "src/zz_late/widgetrenderer.py"),
+    ("a", None),
+    ("xyzq", None),
+)
+
+
+def synthetic_paths(count: int, seed: int = 1) -> list:
+    """WORDS 조합으로 만든 디렉토리/파일 경로 (정렬, 디렉토리는 끝에 '/')"""
+    rng = random.Random(seed)
+    paths = set()
+    while len(paths) < count:
+        depth = rng.randint(1, 5)
+        parts = ["src"] + ["_".join(rng.sample(WORDS, rng.randint(1, 2))) for _ in range(depth)]
+        for i in range(1, len(parts)):
+            paths.add("/".join(parts[:i]) + "/")
+        name = "_".join(rng.sample(WORDS, rng.randint(1, 3))) + f"_{rng.randint(0, 999)}" + rng.choice(EXTENSIONS)
+        paths.add("/".join(parts) + "/" + name)
+    paths.update(("src/", "src/zz_late/", "src/zz_late/main.py", "src/zz_late/widgetrenderer.py"))
+    return sorted(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파일명 퍼지 검색 벤치마크")
+    parser.add_argument("--entries", type=int, default=500000, help="경로 수")
+    parser.add_argument("--repeat", type=int, default=20, help="질의별 반복 횟수")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    paths = synthetic_paths(args.entries)
+    print(f"{len(paths)} paths generated in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    index = FileIndex(workspace_root=os.getcwd())
+    index._snapshot = _Snapshot(paths)
+    print(f"snapshot built in {time.perf_counter() - start:.1f}s")
+
+    for query, expected in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = index.search(query)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        top = result["items"][0]["path"] if result["items"] else None
+        check = "" if expected is None else ("  top ok" if top == expected else f"  top WRONG ({top})")
+        print(
+            f"  {query!r:18s} median {timings[len(timings) // 2]:7.2f} ms  max {timings[-1]:7.2f} ms  "
+            f"{len(result['items']):3d} items  truncated={result['truncated']}{check}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+정적 파일 전송 크기/비용 비교
+
+index.html에서 참조하는 초기 로딩 파일들에 대해
+- 요청마다 GZipMiddleware가 하던 gzip 압축 (CPU 시간, 전송 크기)
+- 빌드 시 만든 .br/.gz 파일 (전송 크기)
+를 비교하고 느린 3G(750 kbit/s) 기준 전송 시간을 추정
+
+사용법:
+    cd frontend && npm run build
+    cd backend && python benchmarks/bench_static.py --static ../frontend/dist
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from static_assets import HASHED_NAME_RE  # noqa: E402
+
+# Chrome DevTools "Slow 3G"에 가까운 대역폭 (바이트/초)
+THREE_G_BYTES_PER_SECOND = 750 * 1000 / 8
+
+
+def initial_files(root: Path):
+    """index.html과 index.html이 직접 참조하는 번들"""
+    index = root / "index.html"
+    names = {match.group(0) for match in HASHED_NAME_RE.finditer(index.read_text(encoding="utf-8"))}
+    return [index] + [root / "assets" / name for name in sorted(names) if (root / "assets" / name).is_file()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정적 파일 전송 크기 비교")
+    parser.add_argument("--static", default=os.path.join(os.path.dirname(os.path.dirname(__file__)), "static"))
+    parser.add_argument("--number", type=int, default=20, help="gzip 반복 횟수")
+    args = parser.parse_args()
+
+    totals = {"identity": 0, "gzip (per request)": 0, ".gz": 0, ".br": 0}
+    gzip_seconds = 0.0
+
+    for path in initial_files(Path(args.static)):
+        content = path.read_bytes()
+        start = time.perf_counter()
+        for _ in range(args.number):
+            # GZipMiddleware 기본 압축 수준
+            compressed = gzip.compress(content, compresslevel=9)
+        elapsed = (time.perf_counter() - start) / args.number
+        gzip_seconds += elapsed
+
+        sizes = {"identity": len(content), "gzip (per request)": len(compressed)}
+        for suffix in (".gz", ".br"):
+            sibling = path.with_name(path.name + suffix)
+            sizes[suffix] = sibling.stat().st_size if sibling.exists() else len(compressed if suffix == ".gz" else content)
+        for key, size in sizes.items():
+            totals[key] += size
+
+        print(f"  {path.name:32s} {len(content):8d} B  gzip {len(compressed):7d} B ({elapsed * 1000:6.2f} ms)  "
+              f".br {sizes['.br']:7d} B")
+
+    print(f"on-the-fly gzip CPU per page load: {gzip_seconds * 1000:.2f} ms")
+    for key, size in totals.items():
+        print(f"  {key:20s} {size:9d} B  ~{size / THREE_G_BYTES_PER_SECOND:5.2f} s on slow 3G")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+로그인 요청 제한 부하 테스트
+
+실행 중인 서버에 잘못된 비밀번호로 로그인 요청을 동시에 보내고
+상태 코드별 개수와 응답 시간을 출력 (429 응답은 bcrypt 없이 즉시 반환되어야 함)
+
+사용법:
+    uvicorn main:app --port 8000 &
+    python benchmarks/load_login.py --url http://127.0.0.1:8000 --requests 500 --concurrency 20
+"""
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def attempt(url: str, username: str, password: str, forwarded_for: str = None):
+    """로그인 요청 한 번 (상태 코드, 소요 시간)"""
+    body = json.dumps({"username": username, "password": password}).encode()
+    headers = {"Content-Type": "application/json"}
+    if forwarded_for:
+        headers["X-Forwarded-For"] = forwarded_for
+    request = urllib.request.Request(f"{url}/api/auth/login", data=body, headers=headers)
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return status, time.perf_counter() - start
+
+
+def percentile(values, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 요청 제한 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="wrong-password")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--spoof-ips", type=int, default=0,
+                        help="X-Forwarded-For로 흉내낼 IP 수 (TRUST_PROXY_HEADERS=true 서버에서 사용자명 제한 확인)")
+    args = parser.parse_args()
+
+    def run(index: int):
+        forwarded = f"10.0.{index % args.spoof_ips // 256}.{index % args.spoof_ips % 256}" if args.spoof_ips else None
+        return attempt(args.url, args.username, args.password, forwarded)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(run, range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    counts = Counter(status for status, _ in results)
+    latencies = defaultdict(list)
+    for status, seconds in results:
+        latencies[status].append(seconds)
+
+    print(f"{args.requests} requests in {elapsed:.2f}s ({args.requests / elapsed:.0f} req/s)")
+    for status in sorted(counts):
+        values = latencies[status]
+        print(
+            f"  {status}: {counts[status]:5d}  "
+            f"p50={percentile(values, 0.5):7.1f}ms  p99={percentile(values, 0.99):7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""
+응답 압축 미들웨어
+GZipMiddleware 대신 응답 내용을 보고 압축 여부와 수준을 결정
+- WebSocket, 스트리밍 응답, 이미 인코딩된 응답(미리 압축된 정적 파일 등), 부분 응답(206)은 그대로 전달
+- 작은 JSON(세션 폴링 등)은 빠른 압축 수준 사용, 큰 본문은 스레드 풀에서 압축
+- 라우트별로 압축에 쓴 CPU 시간과 줄어든 바이트를 집계
+- 바이트 범위가 의미 있는 응답 등은 엔드포인트에서 disable_compression(request)로 제외
+  (Content-Encoding: identity는 RFC 9110상 보내면 안 되므로 헤더로 표시하지 않음)
+"""
+import asyncio
+import os
+import time
+import zlib
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from metrics import route_template
+
+# 압축 효과가 있는 미디어 타입 (text/* 외)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/x-ndjson",
+    "application/x-asciicast",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# 이 크기 이상의 본문은 이벤트 루프를 막지 않도록 스레드 풀에서 압축
+THREAD_MIN_SIZE = 256 * 1024
+
+# 압축 제외 표시 (요청 scope에 저장)
+DISABLE_SCOPE_KEY = "compression.disabled"
+
+
+def disable_compression(request) -> None:
+    """
+    이 요청의 응답을 압축하지 않도록 표시
+
+    Args:
+        request: starlette Request (또는 ASGI scope를 가진 객체)
+    """
+    request.scope[DISABLE_SCOPE_KEY] = True
+
+
+def is_compressible(media_type: str) -> bool:
+    """압축할 가치가 있는 미디어 타입인지 (이미지/아카이브 등 이미 압축된 형식 제외)"""
+    media_type = media_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Accept-Encoding이 gzip을 허용하는지 (q=0 제외)"""
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip() not in ("gzip", "*"):
+            continue
+        quality = params.strip()
+        if not quality.startswith("q="):
+            return True
+        try:
+            return float(quality[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _gzip(body: bytes, level: int) -> Tuple[bytes, float]:
+    """gzip 압축 (결과, 사용한 CPU 시간)"""
+    start = time.thread_time()
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    compressed = compressor.compress(body) + compressor.flush()
+    return compressed, time.thread_time() - start
+
+
+class _RouteStats:
+    """라우트 하나의 압축 통계"""
+
+    __slots__ = ("responses", "compressed", "bytes_in", "bytes_out", "cpu_seconds", "skipped")
+
+    def __init__(self):
+        self.responses = 0
+        self.compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+        self.skipped: Dict[str, int] = {}
+
+    def to_dict(self) -> dict:
+        return {
+            "responses": self.responses,
+            "compressed": self.compressed,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": self.bytes_in - self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 3) if self.bytes_in else None,
+            "cpu_ms": round(self.cpu_seconds * 1000, 3),
+            "skipped": dict(self.skipped)
+        }
+
+
+class CompressionStats:
+    """라우트별 압축 통계 (라우트 경로 템플릿 기준)"""
+
+    def __init__(self):
+        self._routes: Dict[str, _RouteStats] = {}
+
+    def route(self, scope: Scope) -> _RouteStats:
+        """요청을 처리한 라우트의 통계"""
+        path = route_template(scope)
+        key = f"{scope['method']} {path}"
+        stats = self._routes.get(key)
+        if stats is None:
+            stats = self._routes[key] = _RouteStats()
+        return stats
+
+    def snapshot(self) -> dict:
+        """
+        통계 조회
+
+        Returns:
+            전체 합계와 라우트별 통계 (절약한 바이트 순)
+        """
+        total = _RouteStats()
+        for stats in self._routes.values():
+            total.responses += stats.responses
+            total.compressed += stats.compressed
+            total.bytes_in += stats.bytes_in
+            total.bytes_out += stats.bytes_out
+            total.cpu_seconds += stats.cpu_seconds
+            for reason, count in stats.skipped.items():
+                total.skipped[reason] = total.skipped.get(reason, 0) + count
+
+        routes = sorted(self._routes.items(), key=lambda item: item[1].bytes_out - item[1].bytes_in)
+        return {
+            "total": total.to_dict(),
+            "routes": {key: stats.to_dict() for key, stats in routes}
+        }
+
+    def reset(self):
+        self._routes.clear()
+
+
+class CompressionMiddleware:
+    """
+    내용 기반 gzip 압축 미들웨어
+
+    응답 시작 메시지를 첫 본문 메시지까지 보류한 뒤,
+    본문이 한 번에 끝나는(스트리밍이 아닌) 압축 가능한 응답만 압축
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = None,
+        level: int = None,
+        fast_level: int = None,
+        fast_max_size: int = None,
+        stats: CompressionStats = None
+    ):
+        if minimum_size is None:
+            minimum_size = int(os.getenv("COMPRESSION_MIN_SIZE", "1000"))
+        if level is None:
+            level = int(os.getenv("COMPRESSION_LEVEL", "6"))
+        if fast_level is None:
+            fast_level = int(os.getenv("COMPRESSION_FAST_LEVEL", "1"))
+        if fast_max_size is None:
+            fast_max_size = int(os.getenv("COMPRESSION_FAST_MAX_SIZE", str(64 * 1024)))
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.fast_level = fast_level
+        self.fast_max_size = fast_max_size
+        self.stats = stats if stats is not None else compression_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = accepts_gzip(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, scope, send, accepted)
+        await self.app(scope, receive, responder.send)
+
+    def skip_reason(
+        self,
+        start: Message,
+        body: bytes,
+        more_body: bool,
+        accepted: bool,
+        scope: Scope = None
+    ) -> Optional[str]:
+        """압축하지 않는 이유 (압축 대상이면 None)"""
+        headers = Headers(raw=start.get("headers", []))
+        status = start["status"]
+        if scope is not None and scope.get(DISABLE_SCOPE_KEY):
+            return "disabled"
+        if "content-encoding" in headers:
+            return "encoded"
+        if more_body:
+            return "streaming"
+        if status < 200 or status in (204, 206, 304) or "content-range" in headers:
+            return "status"
+        if not accepted:
+            return "not_accepted"
+        if len(body) < self.minimum_size:
+            return "small"
+        if not is_compressible(headers.get("content-type", "")):
+            return "type"
+        return None
+
+    def level_for(self, start: Message, size: int) -> int:
+        """작은 JSON은 빠른 수준, 그 외는 기본 수준"""
+        content_type = Headers(raw=start.get("headers", [])).get("content-type", "")
+        if size <= self.fast_max_size and content_type.startswith("application/json"):
+            return self.fast_level
+        return self.level
+
+
+class _CompressionResponder:
+    """응답 하나의 send 래퍼"""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, send: Send, accepted: bool):
+        self.middleware = middleware
+        self.scope = scope
+        self._send = send
+        self.accepted = accepted
+        self.start: Optional[Message] = None
+        self.started = False
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.started:
+            await self._send(message)
+            return
+
+        # 첫 본문 메시지: 압축 여부 결정
+        self.started = True
+        start = self.start
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        stats = self.middleware.stats.route(self.scope)
+        stats.responses += 1
+
+        reason = self.middleware.skip_reason(start, body, more_body, self.accepted, self.scope)
+        if reason is None:
+            level = self.middleware.level_for(start, len(body))
+            if len(body) >= THREAD_MIN_SIZE:
+                compressed, cpu = await asyncio.to_thread(_gzip, body, level)
+            else:
+                compressed, cpu = _gzip(body, level)
+            stats.cpu_seconds += cpu
+            if len(compressed) < len(body):
+                stats.compressed += 1
+                stats.bytes_in += len(body)
+                stats.bytes_out += len(compressed)
+
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = "gzip"
+                headers["Content-Length"] = str(len(compressed))
+                headers.add_vary_header("Accept-Encoding")
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+            reason = "no_gain"
+
+        stats.skipped[reason] = stats.skipped.get(reason, 0) + 1
+        await self._send(start)
+        await self._send(message)
+
+
+# 전역 압축 통계 인스턴스
+compression_stats = CompressionStats()
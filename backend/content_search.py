@@ -0,0 +1,191 @@
+"""
+워크스페이스 내용 검색 (grep)
+파일 묶음을 프로세스 풀에 분배하고 결과를 찾는 즉시 NDJSON으로 흘려보냄
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import grep_worker
+
+logger = logging.getLogger(__name__)
+
+# 워커 한 번에 넘기는 파일 수
+BATCH_SIZE = 64
+
+
+class ContentSearch:
+    """프로세스 풀 기반 내용 검색 - 이벤트 루프와 파일 I/O 스레드 풀을 막지 않음"""
+
+    def __init__(self, max_workers: int = None):
+        if max_workers is None:
+            max_workers = int(os.getenv("GREP_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+        self.max_workers = max_workers
+        self.max_file_size = int(os.getenv("GREP_MAX_FILE_SIZE", str(5 * 1024 * 1024)))
+        # 검색 하나의 최대 시간 (초, 0이면 제한 없음)
+        self.timeout = float(os.getenv("GREP_TIMEOUT", "30"))
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """첫 검색 때 풀 생성 (spawn: 서버 프로세스 상태를 복제하지 않음)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"내용 검색 프로세스 풀 시작 (workers={self.max_workers})")
+        return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor):
+        """
+        실행 중인 묶음이 있는 풀을 워커 프로세스째 종료 (다음 검색 때 새로 생성)
+
+        실행 중인 정규식은 취소할 수 없으므로(예: (a+)+$ 같은 역추적 폭주)
+        응답이 끝난 뒤에도 워커를 붙잡지 않도록 프로세스를 종료함
+        같은 풀을 쓰던 다른 검색의 묶음은 BrokenProcessPool로 끝나며 새 풀에 다시 제출됨
+        """
+        if self._executor is executor:
+            self._executor = None
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("실행 중인 검색 묶음이 남아 내용 검색 프로세스 풀 재시작")
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def compile_pattern(query: str, regex: bool, case_sensitive: bool) -> tuple:
+        """
+        검색어를 정규식으로 변환 및 검증
+
+        Returns:
+            (패턴, 플래그)
+
+        Raises:
+            re.error: 잘못된 정규식
+        """
+        pattern = query if regex else re.escape(query)
+        flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
+        re.compile(pattern, flags)
+        return pattern, flags
+
+    async def iter_grep(
+        self,
+        root: str,
+        paths: List[str],
+        pattern: str,
+        flags: int,
+        max_results: int,
+        max_matches_per_file: int,
+        timeout: float = None
+    ) -> AsyncIterator[bytes]:
+        """
+        파일 목록에서 검색하며 결과를 NDJSON 라인으로 순회
+
+        진행 중인 묶음은 워커 수의 2배로 제한함
+        응답이 취소되거나(클라이언트 연결 종료) 시간 제한에 걸리면 시작하지 않은 묶음은 취소하고,
+        이미 실행 중인 묶음이 있으면 풀을 재시작해 워커를 회수함
+
+        Args:
+            timeout: 검색 최대 시간 (초, None이면 GREP_TIMEOUT)
+
+        Yields:
+            {"type": "file", "path", "matches"} 라인들, 마지막에 {"type": "done", ...}
+        """
+        if timeout is None:
+            timeout = self.timeout
+        deadline = time.time() + timeout if timeout else 0
+
+        batches = [paths[i:i + BATCH_SIZE] for i in range(0, len(paths), BATCH_SIZE)]
+        # asyncio 퓨처 -> (풀 퓨처, 제출한 풀, 묶음 번호)
+        submitted: Dict[asyncio.Future, Tuple[Future, ProcessPoolExecutor, int]] = {}
+        retry: List[int] = []
+        next_batch = 0
+
+        def submit(index: int):
+            executor = self._get_executor()
+            future = executor.submit(
+                grep_worker.search_files, root, batches[index],
+                pattern, flags, self.max_file_size, max_matches_per_file, deadline
+            )
+            submitted[asyncio.wrap_future(future)] = (future, executor, index)
+
+        total_matches = 0
+        searched = 0
+        skipped = 0
+        truncated = False
+        timed_out = False
+
+        try:
+            while next_batch < len(batches) or retry or submitted:
+                while (retry or next_batch < len(batches)) and len(submitted) < self.max_workers * 2:
+                    if retry:
+                        submit(retry.pop())
+                    else:
+                        submit(next_batch)
+                        next_batch += 1
+
+                remaining = deadline - time.time() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    timed_out = True
+                    break
+                done, _ = await asyncio.wait(submitted, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+
+                for wrapped in done:
+                    _, executor, index = submitted.pop(wrapped)
+                    try:
+                        results, batch_searched, batch_skipped = wrapped.result()
+                    except BrokenProcessPool:
+                        # 다른 검색이 풀을 재시작한 경우에만 새 풀에 다시 제출
+                        if executor is self._executor:
+                            raise
+                        retry.append(index)
+                        continue
+                    searched += batch_searched
+                    skipped += batch_skipped
+
+                    for result in results:
+                        if total_matches >= max_results:
+                            truncated = True
+                            break
+                        remaining_matches = max_results - total_matches
+                        if len(result["matches"]) > remaining_matches:
+                            result["matches"] = result["matches"][:remaining_matches]
+                            truncated = True
+                        total_matches += len(result["matches"])
+                        yield json.dumps({"type": "file", **result}, ensure_ascii=False).encode("utf-8") + b"\n"
+
+                if truncated:
+                    break
+
+            yield json.dumps({
+                "type": "done",
+                "files": len(paths),
+                "searched": searched,
+                "skipped": skipped,
+                "matches": total_matches,
+                "truncated": truncated,
+                "timed_out": timed_out
+            }).encode("utf-8") + b"\n"
+
+        finally:
+            for wrapped, (future, executor, _) in submitted.items():
+                wrapped.cancel()
+                if not future.cancel() and not future.done() and executor is self._executor:
+                    self._recycle(executor)
+
+
+# 전역 내용 검색 인스턴스
+content_search = ContentSearch()
@@ -0,0 +1,915 @@
+"""
+워크스페이스 파일 인덱스
+백그라운드에서 전체 경로를 수집하고 inotify로 증분 갱신하며, 빠른 퍼지 파일명 검색 제공
+"""
+import asyncio
+import bisect
+import heapq
+import itertools
+import logging
+import os
+import re
+from array import array
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from fs_watcher import DirectoryWatcher, STRUCTURE_MASK
+
+logger = logging.getLogger(__name__)
+
+# 퍼지(순서대로 포함) 단계에서 검증할 후보 최대 개수 (짧은 경로부터, 초과 시 truncated)
+MAX_CANDIDATES = 5000
+
+# 이름 시작 일치 후보가 이보다 많으면 전부 비교하지 않고 짧은 경로부터 훑음
+PREFIX_SCAN_LIMIT = 5000
+
+# 이름 연속 포함을 짧은 경로부터 훑을 최대 후보 수 (넘으면 이름 목록 문자열 전체 검색)
+CONTAINED_SCAN_BUDGET = 2000
+
+# 증분 변경이 이만큼 쌓이면 스냅샷 재구성
+COMPACT_THRESHOLD = 20000
+
+# 변경 이벤트를 모아서 처리하는 지연 시간 (초)
+RESCAN_DEBOUNCE = 0.5
+
+# 한 번에 변경된 디렉토리가 이보다 많으면 전체 재구성
+FULL_REBUILD_THRESHOLD = 2000
+
+# 감시 등록 시 이벤트 루프에 양보하는 간격
+WATCH_BATCH_SIZE = 500
+
+# 항상 제외하는 디렉토리
+ALWAYS_IGNORED = {".git"}
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """gitignore glob 패턴을 정규식으로 변환"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+                continue
+        elif c == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """.gitignore 파일 하나의 규칙"""
+
+    def __init__(self, lines: List[str]):
+        # (정규식, 부정 여부, 디렉토리 전용 여부, 경로 기준 여부)
+        self.rules: List[Tuple[re.Pattern, bool, bool, bool]] = []
+
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            line = line.rstrip()
+
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith(("\\!", "\\#")):
+                line = line[1:]
+
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            # 중간에 '/'가 있으면 .gitignore 위치 기준, 없으면 모든 깊이의 이름과 매칭
+            anchored = "/" in line
+            line = line.lstrip("/")
+
+            try:
+                regex = re.compile(_glob_to_regex(line))
+            except re.error:
+                continue
+            self.rules.append((regex, negate, dir_only, anchored))
+
+    def match(self, relative: str, name: str, is_dir: bool) -> Optional[bool]:
+        """
+        규칙 매칭 (마지막으로 매칭된 규칙이 우선)
+
+        Returns:
+            True: 제외, False: 다시 포함(!), None: 매칭 규칙 없음
+        """
+        for regex, negate, dir_only, anchored in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(relative if anchored else name):
+                return not negate
+        return None
+
+
+class _Snapshot:
+    """
+    정렬된 경로 배열 + 문자별 비트셋 + 이름 색인
+
+    비트셋은 Python 정수 하나에 엔트리별 비트를 담은 것으로,
+    질의 문자들의 비트셋 AND 한 번으로 후보를 좁힘
+    비트 위치는 경로 길이 순위(by_length)라서 후보를 짧은 경로(같은 등급에서 높은 점수)부터 꺼낼 수 있음
+
+    - sorted_names/sorted_indexes: (이름, 경로 길이) 순으로 정렬한 이름과 엔트리 인덱스 (이름 일치/시작 범위 검색)
+    - names/name_offsets: 소문자 이름을 '\n'으로 이어 붙인 문자열과 각 이름의 시작 위치 (연속 포함 전체 검색)
+    """
+
+    __slots__ = (
+        "entries", "lower", "name_starts", "by_length", "path_bits", "name_bits",
+        "sorted_names", "sorted_indexes", "names", "name_offsets"
+    )
+
+    def __init__(self, entries: List[str]):
+        self.entries = entries
+        self.lower = [entry.lower() for entry in entries]
+        self.name_starts = [_name_start(entry) for entry in self.lower]
+        names = [entry[start:].rstrip("/") for entry, start in zip(self.lower, self.name_starts)]
+
+        lengths = [len(entry) for entry in self.lower]
+        self.by_length = array("I", sorted(range(len(entries)), key=lengths.__getitem__))
+        self.path_bits = _char_bitsets([self.lower[index] for index in self.by_length])
+        self.name_bits = _char_bitsets([names[index] for index in self.by_length])
+
+        order = sorted(range(len(entries)), key=lambda index: (names[index], lengths[index]))
+        self.sorted_names = [names[index] for index in order]
+        self.sorted_indexes = array("I", order)
+
+        self.names = "\n" + "\n".join(names) + "\n"
+        self.name_offsets = array("I", itertools.accumulate((len(name) + 1 for name in names), initial=1))
+
+
+def _name_start(path: str) -> int:
+    """경로에서 이름이 시작하는 위치 (디렉토리는 끝의 '/' 제외)"""
+    return path.rfind("/", 0, len(path) - 1) + 1
+
+
+def _char_bitsets(strings: List[str]) -> Dict[str, int]:
+    """문자 -> 그 문자를 포함하는 엔트리 인덱스 비트셋"""
+    positions: Dict[str, List[int]] = {}
+    for index, text in enumerate(strings):
+        for char in set(text):
+            bucket = positions.get(char)
+            if bucket is None:
+                positions[char] = bucket = []
+            bucket.append(index)
+
+    size = (len(strings) + 7) // 8
+    bitsets = {}
+    for char, indexes in positions.items():
+        buffer = bytearray(size)
+        for index in indexes:
+            buffer[index >> 3] |= 1 << (index & 7)
+        bitsets[char] = int.from_bytes(buffer, "little")
+    return bitsets
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    """비트셋에서 켜진 비트 인덱스를 오름차순으로"""
+    if not bits:
+        return
+    text = bin(bits)
+    last = len(text) - 1
+    pos = text.rfind("1")
+    while pos > 1:
+        yield last - pos
+        pos = text.rfind("1", 2, pos)
+
+
+def _prefix_end(prefix: str) -> str:
+    """prefix로 시작하는 모든 문자열보다 큰 최소 문자열"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _subsequence_pattern(query: str) -> re.Pattern:
+    """질의 문자들이 순서대로 나타나는지 확인하는 정규식 (백트래킹 없음)"""
+    parts = [re.escape(query[0])]
+    for char in query[1:]:
+        parts.append(f"[^{re.escape(char)}]*{re.escape(char)}")
+    return re.compile("".join(parts))
+
+
+class FileIndex:
+    """
+    워크스페이스 전체 경로 인덱스
+
+    경로는 워크스페이스 기준 상대 경로이며 디렉토리는 끝에 '/'를 붙여 저장함
+    기본 스냅샷(정렬 배열 + 비트셋)에 증분 변경(added/removed)을 덧붙이고,
+    변경이 쌓이면 백그라운드에서 스냅샷을 다시 만듦
+    """
+
+    def __init__(self, workspace_root: str = None, max_entries: int = None, max_watches: int = None):
+        if workspace_root is None:
+            workspace_root = os.getenv("WORKSPACE_ROOT", "/workspace")
+        if max_entries is None:
+            max_entries = int(os.getenv("FILE_INDEX_MAX_ENTRIES", "1000000"))
+        if max_watches is None:
+            max_watches = int(os.getenv("FILE_INDEX_MAX_WATCHES", "65536"))
+
+        self.root = os.path.realpath(workspace_root)
+        self.max_entries = max_entries
+        self.refresh_interval = int(os.getenv("FILE_INDEX_REFRESH", "600"))
+
+        self._snapshot: Optional[_Snapshot] = None
+        self._added: Dict[str, None] = {}
+        self._removed: Set[str] = set()
+        self._rules: Dict[str, Tuple[int, IgnoreRules]] = {}
+
+        self.watcher = DirectoryWatcher(max_watches=max_watches, mask=STRUCTURE_MASK)
+        self.watcher.add_listener(self._on_change)
+        self.watch_complete = False
+        self.truncated = False
+
+        self._dirty: Set[str] = set()
+        self._dirty_event: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # ==================== 수명 주기 ====================
+
+    def start(self):
+        """인덱스 구축 및 감시 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is not None:
+            return
+        self.watcher.start()
+        self._dirty_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """백그라운드 작업 및 감시 종료"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.watcher.stop()
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    def status(self) -> dict:
+        """인덱스 상태"""
+        snapshot = self._snapshot
+        return {
+            "ready": snapshot is not None,
+            "entries": (len(snapshot.entries) - len(self._removed) + len(self._added)) if snapshot else 0,
+            "pending_changes": len(self._added) + len(self._removed),
+            "watching": self.watch_complete,
+            "truncated": self.truncated
+        }
+
+    async def _run(self):
+        """초기 구축 후 변경 이벤트를 모아서 반영"""
+        try:
+            await self._rebuild()
+
+            while True:
+                try:
+                    await asyncio.wait_for(self._dirty_event.wait(), timeout=self.refresh_interval)
+                except asyncio.TimeoutError:
+                    # 감시가 불완전하면 주기적으로 전체 재구축
+                    if not self.watch_complete:
+                        await self._rebuild()
+                    continue
+
+                await asyncio.sleep(RESCAN_DEBOUNCE)
+                self._dirty_event.clear()
+                dirty = self._dirty
+                self._dirty = set()
+
+                # 루트 .gitignore 변경은 전체에 영향
+                if len(dirty) > FULL_REBUILD_THRESHOLD or ("" in dirty and self._rules_changed("")):
+                    await self._rebuild()
+                    continue
+
+                adds, removes, new_dirs = await asyncio.to_thread(self._rescan, dirty)
+                for path in removes:
+                    self._remove(path)
+                for path in adds:
+                    self._add(path)
+                await self._watch_dirs(new_dirs)
+
+                if len(self._added) + len(self._removed) > COMPACT_THRESHOLD:
+                    await self._compact()
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"파일 인덱스 작업 실패: {e}")
+
+    async def _rebuild(self):
+        """전체 워크스페이스 재수집"""
+        entries, dirs = await asyncio.to_thread(self._walk_all)
+        snapshot = await asyncio.to_thread(_Snapshot, entries)
+
+        self._snapshot = snapshot
+        self._added.clear()
+        self._removed.clear()
+        logger.info(f"파일 인덱스 구축 완료: {len(entries)}개 경로")
+
+        self.watch_complete = self.watcher.available
+        await self._watch_dirs(dirs)
+
+    async def _compact(self):
+        """기본 스냅샷에 증분 변경을 합쳐 다시 구성"""
+        snapshot = self._snapshot
+        removed = self._removed
+        added = list(self._added)
+
+        def merge():
+            entries = [path for path in snapshot.entries if path not in removed]
+            entries.extend(added)
+            entries.sort()
+            return _Snapshot(entries)
+
+        self._snapshot = await asyncio.to_thread(merge)
+        self._added.clear()
+        self._removed.clear()
+
+    async def _watch_dirs(self, dirs: Dict[str, int]):
+        """
+        디렉토리 감시 등록
+
+        수집 시점과 감시 등록 사이의 변경을 놓치지 않도록,
+        등록 후 디렉토리 mtime이 수집 시점과 다르면 다시 스캔 대상으로 표시
+
+        Args:
+            dirs: 상대 디렉토리 경로 -> 수집 시점 mtime_ns
+        """
+        if not self.watcher.available:
+            self.watch_complete = False
+            return
+
+        for count, (relative_dir, mtime_ns) in enumerate(dirs.items(), 1):
+            if len(self.watcher) >= self.watcher.max_watches:
+                logger.warning(f"파일 인덱스 감시 한도 도달 ({self.watcher.max_watches}), 주기적 재구축으로 대체")
+                self.watch_complete = False
+                return
+
+            absolute_dir = self._absolute(relative_dir)
+            if not self.watcher.watch(absolute_dir):
+                self.watch_complete = False
+                continue
+
+            try:
+                if os.stat(absolute_dir).st_mtime_ns != mtime_ns:
+                    self._mark_dirty(relative_dir)
+            except OSError:
+                self._mark_dirty(self._parent(relative_dir))
+
+            if count % WATCH_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+
+    # ==================== 변경 감지 ====================
+
+    def _on_change(self, path: str):
+        """감시 중인 디렉토리 변경 (이벤트 루프 콜백)"""
+        relative = os.path.relpath(path, self.root)
+        self._mark_dirty("" if relative == "." else relative + "/")
+
+    def _mark_dirty(self, relative_dir: str):
+        self._dirty.add(relative_dir)
+        if self._dirty_event:
+            self._dirty_event.set()
+
+    @staticmethod
+    def _parent(relative_path: str) -> str:
+        """상위 디렉토리 상대 경로 ('' 또는 'a/b/')"""
+        return relative_path[:_name_start(relative_path)]
+
+    def _absolute(self, relative_path: str) -> str:
+        return os.path.join(self.root, relative_path) if relative_path else self.root
+
+    # ==================== 수집 (스레드에서 실행) ====================
+
+    def _walk_all(self) -> Tuple[List[str], Dict[str, int]]:
+        """워크스페이스 전체 수집"""
+        self._rules.clear()
+        self.truncated = False
+        entries: List[str] = []
+        dirs: Dict[str, int] = {}
+
+        try:
+            dirs[""] = os.stat(self.root).st_mtime_ns
+        except OSError as e:
+            logger.warning(f"워크스페이스 접근 실패: {e}")
+            return entries, dirs
+
+        self._walk("", [], entries, dirs)
+        entries.sort()
+        return entries, dirs
+
+    def _walk(self, start_dir: str, chain: list, entries: List[str], dirs: Dict[str, int]):
+        """
+        디렉토리 하위를 반복적으로 수집 (.gitignore 적용, 심볼릭 링크는 따라가지 않음)
+
+        Args:
+            start_dir: 시작 상대 디렉토리 ('' 또는 'a/')
+            chain: 상위 디렉토리들의 (기준 경로, 규칙) 목록
+            entries: 수집된 경로 (출력)
+            dirs: 수집된 디렉토리 -> mtime_ns (출력)
+        """
+        stack = [(start_dir, chain)]
+        while stack:
+            relative_dir, chain = stack.pop()
+            try:
+                with os.scandir(self._absolute(relative_dir)) as scanner:
+                    children = list(scanner)
+            except OSError:
+                continue
+
+            if any(child.name == ".gitignore" for child in children):
+                rules = self._load_rules(relative_dir)
+                if rules:
+                    chain = chain + [(relative_dir, rules)]
+
+            for child in children:
+                is_dir = self._entry_is_dir(child)
+                if is_dir is None or self._is_ignored(relative_dir, child.name, is_dir, chain):
+                    continue
+
+                if len(entries) >= self.max_entries:
+                    if not self.truncated:
+                        logger.warning(f"파일 인덱스 최대 개수 도달 ({self.max_entries}), 나머지 생략")
+                        self.truncated = True
+                    return
+
+                relative = relative_dir + child.name
+                if is_dir:
+                    relative += "/"
+                    try:
+                        dirs[relative] = child.stat(follow_symlinks=False).st_mtime_ns
+                    except OSError:
+                        continue
+                    stack.append((relative, chain))
+                entries.append(relative)
+
+    @staticmethod
+    def _entry_is_dir(entry: os.DirEntry) -> Optional[bool]:
+        if entry.name in ALWAYS_IGNORED:
+            return None
+        try:
+            return entry.is_dir(follow_symlinks=False)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _is_ignored(relative_dir: str, name: str, is_dir: bool, chain: list) -> bool:
+        """가장 가까운 .gitignore부터 확인"""
+        relative = relative_dir + name
+        for base, rules in reversed(chain):
+            result = rules.match(relative[len(base):], name, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def _load_rules(self, relative_dir: str) -> Optional[IgnoreRules]:
+        """.gitignore 읽기 (mtime과 함께 저장)"""
+        path = os.path.join(self._absolute(relative_dir), ".gitignore")
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            with open(path, encoding="utf-8", errors="replace") as f:
+                rules = IgnoreRules(f.readlines())
+        except OSError:
+            self._rules.pop(relative_dir, None)
+            return None
+
+        self._rules[relative_dir] = (mtime_ns, rules)
+        return rules
+
+    def _rules_changed(self, relative_dir: str) -> bool:
+        """디렉토리의 .gitignore가 추가/수정/삭제되었는지 확인"""
+        try:
+            mtime_ns = os.stat(os.path.join(self._absolute(relative_dir), ".gitignore")).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cached = self._rules.get(relative_dir)
+        return (cached[0] if cached else None) != mtime_ns
+
+    def _chain_for(self, relative_dir: str) -> list:
+        """디렉토리에 적용되는 .gitignore 규칙 목록 (상위부터)"""
+        chain = []
+        base = ""
+        while True:
+            cached = self._rules.get(base)
+            if cached:
+                chain.append((base, cached[1]))
+            if base == relative_dir:
+                return chain
+            base = relative_dir[:relative_dir.index("/", len(base)) + 1]
+
+    def _rescan(self, dirty: Set[str]) -> Tuple[List[str], List[str], Dict[str, int]]:
+        """
+        변경된 디렉토리의 직계 자식을 다시 읽어 인덱스와 비교
+
+        Returns:
+            (추가할 경로, 제거할 경로, 새로 감시할 디렉토리)
+        """
+        adds: List[str] = []
+        removes: List[str] = []
+        new_dirs: Dict[str, int] = {}
+
+        for relative_dir in sorted(dirty, key=len):
+            if relative_dir and not self._contains(relative_dir):
+                continue
+
+            # .gitignore가 바뀌면 하위 전체를 다시 수집해서 비교 (규칙은 수집 중 다시 읽음)
+            if relative_dir and self._rules_changed(relative_dir):
+                self._rules.pop(relative_dir, None)
+                collected: List[str] = []
+                self._walk(relative_dir, self._chain_for(self._parent(relative_dir)), collected, new_dirs)
+                current = set(collected)
+                known = set(self._descendants(relative_dir))
+                adds.extend(current - known)
+                removes.extend(known - current)
+                continue
+
+            try:
+                with os.scandir(self._absolute(relative_dir)) as scanner:
+                    children = list(scanner)
+            except OSError:
+                if relative_dir:
+                    removes.append(relative_dir)
+                    removes.extend(self._descendants(relative_dir))
+                continue
+
+            chain = self._chain_for(relative_dir)
+            current = {}
+            for child in children:
+                is_dir = self._entry_is_dir(child)
+                if is_dir is not None and not self._is_ignored(relative_dir, child.name, is_dir, chain):
+                    current[child.name] = is_dir
+
+            known = self._children(relative_dir)
+            for name, is_dir in known.items():
+                if current.get(name) != is_dir:
+                    path = relative_dir + name + ("/" if is_dir else "")
+                    removes.append(path)
+                    if is_dir:
+                        removes.extend(self._descendants(path))
+
+            for name, is_dir in current.items():
+                if known.get(name) == is_dir:
+                    continue
+                path = relative_dir + name
+                if is_dir:
+                    path += "/"
+                    try:
+                        new_dirs[path] = os.stat(self._absolute(path)).st_mtime_ns
+                    except OSError:
+                        continue
+                    collected = []
+                    self._walk(path, chain, collected, new_dirs)
+                    adds.extend(collected)
+                adds.append(path)
+
+        return adds, removes, new_dirs
+
+    # ==================== 인덱스 조회/변경 ====================
+
+    def _in_snapshot(self, path: str) -> bool:
+        entries = self._snapshot.entries if self._snapshot else []
+        index = bisect.bisect_left(entries, path)
+        return index < len(entries) and entries[index] == path
+
+    def _contains(self, path: str) -> bool:
+        if path in self._added:
+            return True
+        return path not in self._removed and self._in_snapshot(path)
+
+    def _add(self, path: str):
+        if path in self._removed:
+            self._removed.discard(path)
+        elif not self._in_snapshot(path):
+            self._added[path] = None
+
+    def _remove(self, path: str):
+        if path in self._added:
+            del self._added[path]
+        elif self._in_snapshot(path):
+            self._removed.add(path)
+
+    def _descendants(self, relative_dir: str) -> List[str]:
+        """디렉토리 하위의 모든 인덱스 경로"""
+        if not relative_dir:
+            return []
+        entries = self._snapshot.entries if self._snapshot else []
+        lo = bisect.bisect_right(entries, relative_dir)
+        hi = bisect.bisect_left(entries, _prefix_end(relative_dir), lo)
+        result = [path for path in entries[lo:hi] if path not in self._removed]
+        result.extend(path for path in self._added if path.startswith(relative_dir) and path != relative_dir)
+        return result
+
+    def _children(self, relative_dir: str) -> Dict[str, bool]:
+        """디렉토리의 직계 자식 (이름 -> 디렉토리 여부), 하위 디렉토리 내용은 건너뜀"""
+        children = {}
+        entries = self._snapshot.entries if self._snapshot else []
+        index = bisect.bisect_right(entries, relative_dir) if relative_dir else 0
+        end = bisect.bisect_left(entries, _prefix_end(relative_dir), index) if relative_dir else len(entries)
+
+        while index < end:
+            path = entries[index]
+            rest = path[len(relative_dir):]
+            slash = rest.find("/")
+            if slash == -1:
+                if path not in self._removed:
+                    children[rest] = False
+                index += 1
+            else:
+                if path not in self._removed:
+                    children[rest[:slash]] = True
+                index = bisect.bisect_left(entries, _prefix_end(path), index + 1, end)
+
+        for path in self._added:
+            if path.startswith(relative_dir) and path != relative_dir:
+                rest = path[len(relative_dir):]
+                slash = rest.find("/")
+                if slash == -1:
+                    children[rest] = False
+                elif slash == len(rest) - 1:
+                    children[rest[:-1]] = True
+        return children
+
+    async def list_files(self, relative_dir: str) -> List[str]:
+        """
+        디렉토리 하위의 모든 파일 경로 (.gitignore 적용)
+
+        인덱스가 준비되지 않았으면 직접 수집함
+
+        Args:
+            relative_dir: 상대 디렉토리 경로 ('' 또는 'a/b/')
+
+        Returns:
+            상대 파일 경로 목록
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return await asyncio.to_thread(self._collect_files, relative_dir)
+
+        # 증분 변경은 이벤트 루프에서 복사한 뒤 스레드에서 필터링
+        removed = set(self._removed)
+        added = list(self._added)
+
+        def collect():
+            entries = snapshot.entries
+            if relative_dir:
+                lo = bisect.bisect_right(entries, relative_dir)
+                hi = bisect.bisect_left(entries, _prefix_end(relative_dir), lo)
+                entries = entries[lo:hi]
+            files = [path for path in entries if not path.endswith("/") and path not in removed]
+            files.extend(
+                path for path in added if path.startswith(relative_dir) and not path.endswith("/")
+            )
+            return files
+
+        return await asyncio.to_thread(collect)
+
+    def _collect_files(self, relative_dir: str) -> List[str]:
+        """인덱스 없이 디렉토리 하위 파일 수집 (상위 .gitignore도 적용, 스레드에서 실행)"""
+        helper = FileIndex(self.root, self.max_entries, max_watches=0)
+        base = ""
+        while base != relative_dir:
+            helper._load_rules(base)
+            base = relative_dir[:relative_dir.index("/", len(base)) + 1]
+
+        entries: List[str] = []
+        helper._walk(relative_dir, helper._chain_for(relative_dir), entries, {})
+        return [path for path in entries if not path.endswith("/")]
+
+    # ==================== 검색 ====================
+
+    def search(self, query: str, limit: int = 50) -> dict:
+        """
+        퍼지 파일명 검색 (질의 문자가 순서대로 나타나는 경로)
+
+        점수: 이름과 일치 > 이름이 질의로 시작 > 이름에 연속 포함 > 이름에 순서대로 포함 >
+        경로에 연속 포함 > 경로에 순서대로 포함, 같은 등급이면 짧은 경로 우선
+
+        높은 등급부터 찾고, 찾은 상위 결과가 다음 등급의 최고 점수 이상이면 중단함
+        - 이름 일치/시작/연속 포함: 후보 수 제한 없이 등급별 상위 결과를 정확히 찾음
+        - 그 외: 문자별 비트셋 AND로 좁힌 후보를 짧은 경로부터 최대 MAX_CANDIDATES개 검증
+          (이름에 모든 문자가 있는 후보 먼저, 다 보지 못하고 끝나면 truncated)
+
+        Args:
+            query: 검색어 (공백 무시, 대소문자 무시)
+            limit: 최대 결과 수
+
+        Returns:
+            items, ready, truncated
+        """
+        snapshot = self._snapshot
+        query = "".join(query.lower().split())
+        if snapshot is None or not query:
+            return {"items": [], "ready": snapshot is not None, "truncated": False}
+
+        chars = set(query)
+        path_mask = -1
+        for char in chars:
+            path_mask &= snapshot.path_bits.get(char, 0)
+        name_mask = path_mask
+        for char in chars:
+            name_mask &= snapshot.name_bits.get(char, 0)
+
+        pattern = _subsequence_pattern(query)
+        scored = []
+        for path in self._added:
+            lower = path.lower()
+            if pattern.search(lower):
+                scored.append((self._score(lower, _name_start(lower), query, pattern), path))
+
+        def add(indexes: List[int]):
+            for index in indexes:
+                found.add(index)
+                scored.append((
+                    self._score(snapshot.lower[index], snapshot.name_starts[index], query, pattern),
+                    snapshot.entries[index]
+                ))
+
+        found: Set[int] = set()
+        truncated = False
+        add(self._prefix_matches(snapshot, query, name_mask, limit))
+        if not self._settled(scored, limit, 3000 - len(query)):
+            add(self._contained_matches(snapshot, query, name_mask, limit))
+            if not self._settled(scored, limit, 2000 - len(query)):
+                truncated = self._fuzzy_matches(snapshot, query, pattern, name_mask, path_mask, found, scored, limit)
+
+        items = []
+        for score, path in heapq.nlargest(limit, scored):
+            is_dir = path.endswith("/")
+            path = path.rstrip("/")
+            items.append({
+                "name": path[path.rfind("/") + 1:],
+                "path": path,
+                "type": "directory" if is_dir else "file",
+                "score": score
+            })
+
+        return {"items": items, "ready": True, "truncated": truncated}
+
+    def _live(self, snapshot: _Snapshot, indexes, limit: int = None) -> List[int]:
+        """삭제되지 않은 엔트리 인덱스 (limit이 있으면 앞에서부터 limit개)"""
+        removed = self._removed
+        live = (index for index in indexes if not removed or snapshot.entries[index] not in removed)
+        return list(itertools.islice(live, limit))
+
+    def _prefix_matches(self, snapshot: _Snapshot, query: str, name_mask: int, limit: int) -> List[int]:
+        """
+        이름이 질의와 일치하거나 질의로 시작하는 엔트리 (각 등급의 상위 limit개 포함)
+
+        정렬된 이름에서 범위를 찾고, 이름 시작 일치가 너무 많으면 짧은 경로부터 limit개만 찾음
+        """
+        names = snapshot.sorted_names
+        start = bisect.bisect_left(names, query)
+        exact_end = bisect.bisect_right(names, query, start)
+        end = bisect.bisect_left(names, _prefix_end(query), exact_end)
+
+        # 이름 일치: 같은 이름 안에서는 경로 길이 순으로 정렬되어 있음
+        matches = self._live(snapshot, snapshot.sorted_indexes[start:exact_end], limit)
+        if end - exact_end <= PREFIX_SCAN_LIMIT:
+            return matches + self._live(snapshot, snapshot.sorted_indexes[exact_end:end])
+
+        length = len(query)
+
+        def prefixed(index: int) -> bool:
+            lower = snapshot.lower[index]
+            name_start = snapshot.name_starts[index]
+            name_length = len(lower) - name_start - lower.endswith("/")
+            return name_length != length and lower.startswith(query, name_start)
+
+        ranked = (snapshot.by_length[rank] for rank in _iter_bits(name_mask))
+        return matches + self._live(snapshot, filter(prefixed, ranked), limit)
+
+    def _contained_matches(self, snapshot: _Snapshot, query: str, name_mask: int, limit: int) -> List[int]:
+        """
+        이름에 질의가 연속으로 포함되지만 질의로 시작하지는 않는 엔트리 (상위 limit개 포함)
+
+        비트셋 후보를 짧은 경로부터 CONTAINED_SCAN_BUDGET개까지 확인하고,
+        그 안에서 limit개를 못 찾으면(드문 질의) 이름 목록 문자열 전체를 검색
+        """
+        matches = []
+        removed = self._removed
+        for scanned, rank in enumerate(_iter_bits(name_mask)):
+            if scanned >= CONTAINED_SCAN_BUDGET:
+                break
+            index = snapshot.by_length[rank]
+            name_start = snapshot.name_starts[index]
+            if snapshot.lower[index].find(query, name_start) > name_start:
+                if removed and snapshot.entries[index] in removed:
+                    continue
+                matches.append(index)
+                if len(matches) >= limit:
+                    return matches
+        else:
+            return matches
+
+        names = snapshot.names
+        offsets = snapshot.name_offsets
+        hits = []
+        position = names.find(query)
+        while position >= 0:
+            index = bisect.bisect_right(offsets, position) - 1
+            if position != offsets[index]:
+                hits.append(index)
+            position = names.find(query, offsets[index + 1])
+        return self._live(snapshot, hits)
+
+    def _fuzzy_matches(
+        self,
+        snapshot: _Snapshot,
+        query: str,
+        pattern: re.Pattern,
+        name_mask: int,
+        path_mask: int,
+        found: Set[int],
+        scored: List[Tuple[int, str]],
+        limit: int
+    ) -> bool:
+        """
+        순서대로 포함하는 엔트리를 비트셋 후보에서 짧은 경로부터 검증해 scored에 추가
+
+        이름에 모든 문자가 있는 후보(최고 2000점 등급)를 먼저, 나머지(최고 1000점 등급)를 나중에 보며
+        상위 limit개가 남은 후보의 최고 점수 이상이 되면 중단
+
+        Returns:
+            MAX_CANDIDATES개를 검증하고도 끝나지 않아 결과가 잘렸을 수 있는지
+        """
+        top = [score for score, _ in heapq.nlargest(limit, scored)]
+        heapq.heapify(top)
+        verified = 0
+        for mask, tier in ((name_mask, 2000), (path_mask & ~name_mask, 1000)):
+            for rank in _iter_bits(mask):
+                index = snapshot.by_length[rank]
+                if index in found:
+                    continue
+                lower = snapshot.lower[index]
+                if len(top) >= limit and top[0] >= tier - len(lower):
+                    break
+                if verified >= MAX_CANDIDATES:
+                    return True
+                verified += 1
+                if not pattern.search(lower):
+                    continue
+                path = snapshot.entries[index]
+                if path in self._removed:
+                    continue
+                score = self._score(lower, snapshot.name_starts[index], query, pattern)
+                scored.append((score, path))
+                if len(top) < limit:
+                    heapq.heappush(top, score)
+                else:
+                    heapq.heappushpop(top, score)
+        return False
+
+    @staticmethod
+    def _settled(scored: List[Tuple[int, str]], limit: int, next_best: int) -> bool:
+        """이미 찾은 상위 limit개가 모두 다음 등급의 최고 점수(next_best) 이상인지"""
+        return len(scored) >= limit and heapq.nlargest(limit, scored)[-1][0] >= next_best
+
+    @staticmethod
+    def _score(lower: str, name_start: int, query: str, pattern: re.Pattern) -> int:
+        """검색 결과 점수"""
+        name = lower[name_start:].rstrip("/")
+        position = name.find(query)
+        if position == 0:
+            score = 4000 + (1000 if len(name) == len(query) else 0)
+        elif position > 0:
+            score = 3000
+        elif pattern.search(name):
+            score = 2000
+        elif query in lower:
+            score = 1000
+        else:
+            score = 0
+        return score - len(lower)
+
+
+# 전역 파일 인덱스 인스턴스
+file_index = FileIndex()
@@ -0,0 +1,1134 @@
+"""
+파일 시스템 매니저: 워크스페이스 파일 작업을 전용 스레드 풀에서 실행
+이벤트 루프를 막지 않도록 모든 블로킹 I/O를 분리
+"""
+import asyncio
+import base64
+import bisect
+import fnmatch
+import functools
+import hashlib
+import heapq
+import json
+import logging
+import os
+import errno
+import shutil
+import stat as stat_module
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Callable, Generator, List, Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+from fs_watcher import DirectoryWatcher
+from metrics import metrics, InstrumentedThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# 읽기 가능한 최대 파일 크기 (10MB)
+MAX_READ_SIZE = 10 * 1024 * 1024
+
+# 취소 여부를 확인하는 간격 (디렉토리 엔트리 수)
+CANCEL_CHECK_INTERVAL = 256
+
+# 클라이언트 연결 종료 확인 주기 (초)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+# 이보다 항목이 많은 목록은 캐시하지 않음 (메모리 보호)
+LIST_CACHE_MAX_ITEMS = 10000
+
+# 파일 스트리밍/스캔 블록 크기
+READ_CHUNK_SIZE = 256 * 1024
+SCAN_BLOCK_SIZE = 1024 * 1024
+
+# 줄 오프셋 인덱스 체크포인트 간격 (바이트)
+LINE_CHECKPOINT_BYTES = 64 * 1024
+
+# 줄 단위 읽기 한 번에 읽는 최대 바이트 / 줄당 최대 글자 수
+MAX_LINES_BYTES = 8 * 1024 * 1024
+MAX_LINE_CHARS = 10000
+
+# 메모리에 유지하는 줄 오프셋 인덱스 수
+LINE_INDEX_CACHE_SIZE = 32
+
+# 스트리밍 업로드 시 모아서 쓰는 크기
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 새 파일 권한 계산용 umask (임포트 시점에 한 번만 조회, 스레드 안전하지 않음)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+FILE_IO_WAITING = metrics.gauge("file_io_waiting", "File operations waiting for a free file-io worker")
+
+
+class FileOperationCancelled(Exception):
+    """클라이언트가 떠나서 중단된 파일 작업"""
+
+
+def encode_list_cursor(key: Tuple[int, str, str]) -> str:
+    """디렉토리 목록 정렬 키를 불투명 커서 문자열로 변환"""
+    raw = json.dumps(list(key), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_list_cursor(cursor: str) -> Tuple[int, str, str]:
+    """커서 문자열을 정렬 키로 복원"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        kind, name_lower, name = json.loads(raw)
+        return int(kind), str(name_lower), str(name)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def file_etag(st: os.stat_result) -> str:
+    """파일 ETag (수정 시각 + 크기), 터미널 등 다른 곳에서 수정되면 바뀜"""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+class LineIndex:
+    """
+    파일의 희소 줄 오프셋 인덱스
+
+    약 LINE_CHECKPOINT_BYTES마다 (줄 번호, 줄 시작 바이트)를 기록하며,
+    필요한 줄까지만 앞에서부터 점진적으로 스캔함
+    파일이 뒤에 덧붙여진 경우(로그) 이어서 스캔하고, 내용이 바뀌면 처음부터 다시 만듦
+    """
+
+    __slots__ = ("inode", "lines", "offsets", "scanned_bytes", "scanned_lines", "sample", "complete", "lock")
+
+    def __init__(self, inode: Tuple[int, int]):
+        self.inode = inode
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """처음부터 다시 스캔하도록 초기화"""
+        self.lines = array("Q", [0])
+        self.offsets = array("Q", [0])
+        self.scanned_bytes = 0
+        self.scanned_lines = 0
+        self.sample = b""
+        self.complete = False
+
+    def validate(self, fd: int, size: int) -> bool:
+        """스캔한 부분이 그대로인지 확인 (마지막 스캔 위치 앞 64바이트 비교)"""
+        if size < self.scanned_bytes:
+            return False
+        if self.sample and os.pread(fd, len(self.sample), self.scanned_bytes - len(self.sample)) != self.sample:
+            return False
+        if size > self.scanned_bytes:
+            self.complete = False
+        return True
+
+    def scan(self, fd: int, size: int, cancel: threading.Event, until_line: Optional[int] = None):
+        """
+        until_line 줄을 넘거나 파일 끝까지 스캔
+
+        Args:
+            fd: 파일 디스크립터
+            size: 현재 파일 크기
+            until_line: 이 줄 번호(0부터)가 시작하는 위치를 알 때까지 스캔 (None이면 끝까지)
+        """
+        next_checkpoint = self.offsets[-1] + LINE_CHECKPOINT_BYTES
+        while self.scanned_bytes < size:
+            if until_line is not None and self.scanned_lines > until_line:
+                return
+            if cancel.is_set():
+                raise FileOperationCancelled()
+
+            block = os.pread(fd, min(SCAN_BLOCK_SIZE, size - self.scanned_bytes), self.scanned_bytes)
+            if not block:
+                break
+
+            # 블록 안의 체크포인트 경계마다 다음 줄 시작 위치 기록
+            counted = 0
+            while next_checkpoint < self.scanned_bytes + len(block):
+                newline = block.find(b"\n", max(next_checkpoint - self.scanned_bytes, counted))
+                if newline == -1:
+                    break
+                self.scanned_lines += block.count(b"\n", counted, newline + 1)
+                counted = newline + 1
+                self.lines.append(self.scanned_lines)
+                self.offsets.append(self.scanned_bytes + counted)
+                next_checkpoint = self.scanned_bytes + counted + LINE_CHECKPOINT_BYTES
+
+            self.scanned_lines += block.count(b"\n", counted)
+            self.scanned_bytes += len(block)
+            self.sample = block[-64:]
+
+        if self.scanned_bytes >= size:
+            self.complete = True
+
+    def total_lines(self, size: int) -> Optional[int]:
+        """전체 줄 수 (끝까지 스캔한 경우만, 마지막 줄 개행 없어도 한 줄로 셈)"""
+        if not self.complete:
+            return None
+        if size and self.sample and not self.sample.endswith(b"\n"):
+            return self.scanned_lines + 1
+        return self.scanned_lines
+
+    def seek(self, line: int) -> Tuple[int, int]:
+        """line 이하에서 가장 가까운 체크포인트 (줄 번호, 바이트 위치)"""
+        position = bisect.bisect_right(self.lines, line) - 1
+        return self.lines[position], self.offsets[position]
+
+
+class FileManager:
+    """워크스페이스 파일 작업 매니저 - 전용 스레드 풀 + 동시 실행 제한"""
+
+    def __init__(self, workspace_root: str = None, max_workers: int = None, list_cache_size: int = None):
+        if workspace_root is None:
+            workspace_root = os.getenv("WORKSPACE_ROOT", "/workspace")
+        if max_workers is None:
+            max_workers = int(os.getenv("FILE_IO_WORKERS", "4"))
+        if list_cache_size is None:
+            list_cache_size = int(os.getenv("LIST_CACHE_SIZE", "256"))
+
+        self.workspace_root = workspace_root
+        self.workspace_resolved = os.path.realpath(workspace_root)
+        self.max_workers = max_workers
+        self._executor = InstrumentedThreadPoolExecutor("file-io", max_workers=max_workers)
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+        # 디렉토리 목록 캐시: (경로, 조회 옵션) -> (세대 번호, 결과, ETag)
+        # inotify 세대 번호가 바뀌면 무효 (감시 불가 시 캐시 안 함)
+        self.watcher = DirectoryWatcher()
+        self.list_cache_size = list_cache_size
+        self._list_cache: "OrderedDict[tuple, Tuple[int, dict, str]]" = OrderedDict()
+        self.list_cache_hits = 0
+        self.list_cache_misses = 0
+
+        # 줄 오프셋 인덱스 캐시: 경로 -> LineIndex (스레드 풀에서 접근)
+        self._line_indexes: "OrderedDict[str, LineIndex]" = OrderedDict()
+        self._line_indexes_lock = threading.Lock()
+        logger.info(f"파일 매니저 초기화됨 (workers={max_workers})")
+
+    def start(self):
+        """디렉토리 감시 시작 (이벤트 루프 안에서 호출)"""
+        self.watcher.start()
+
+    async def run(self, func: Callable, *args, request: Optional[Request] = None):
+        """
+        파일 작업을 전용 스레드 풀에서 실행
+
+        func는 첫 번째 인자로 취소 이벤트(threading.Event)를 받으며,
+        긴 작업은 이 이벤트를 주기적으로 확인해야 함
+
+        Args:
+            func: 동기 파일 작업 함수
+            *args: func 인자
+            request: 요청 객체 (주어지면 클라이언트 연결 종료 시 취소)
+
+        Returns:
+            func 반환값
+
+        Raises:
+            FileOperationCancelled: 클라이언트 연결 종료로 취소된 경우
+        """
+        cancel = threading.Event()
+        loop = asyncio.get_running_loop()
+
+        # 풀이 가득 차면 세마포어에서 대기 (대기 수 = 풀 포화 지표)
+        FILE_IO_WAITING.inc()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            FILE_IO_WAITING.dec()
+
+        try:
+            watcher = None
+            if request is not None:
+                watcher = asyncio.create_task(self._watch_disconnect(request, cancel))
+
+            try:
+                return await loop.run_in_executor(
+                    self._executor, functools.partial(func, cancel, *args)
+                )
+            except asyncio.CancelledError:
+                cancel.set()
+                raise
+            finally:
+                if watcher:
+                    watcher.cancel()
+        finally:
+            self._semaphore.release()
+
+    @staticmethod
+    async def _watch_disconnect(request: Request, cancel: threading.Event):
+        """클라이언트 연결 종료 감시"""
+        while not cancel.is_set():
+            if await request.is_disconnected():
+                logger.info(f"클라이언트 연결 종료, 파일 작업 취소: {request.url.path}")
+                cancel.set()
+                return
+            await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+
+    def shutdown(self):
+        """디렉토리 감시 및 스레드 풀 종료"""
+        self.watcher.stop()
+        self._list_cache.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def list_dir_cached(
+        self,
+        path: Path,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        pattern: Optional[str] = None,
+        prefix: Optional[str] = None,
+        details: bool = True,
+        request: Optional[Request] = None
+    ) -> Tuple[dict, str]:
+        """
+        디렉토리 목록 조회 (inotify로 무효화되는 캐시 사용)
+
+        조회 전에 감시를 등록하고 조회 후 세대 번호가 그대로일 때만 저장하므로,
+        조회 도중 바뀐 목록이 캐시에 남지 않음
+
+        Args:
+            path: 검증된 디렉토리 절대 경로
+            (나머지는 list_dir과 동일)
+
+        Returns:
+            (결과, ETag)
+        """
+        path_key = str(path)
+        key = (path_key, limit, cursor, pattern, prefix, details)
+
+        generation = None
+        if self.watcher.watch(path_key):
+            generation = self.watcher.generation(path_key)
+            cached = self._list_cache.get(key)
+            if cached is not None and cached[0] == generation:
+                self._list_cache.move_to_end(key)
+                self.list_cache_hits += 1
+                return cached[1], cached[2]
+
+        self.list_cache_misses += 1
+        result = await self.run(
+            self.list_dir, path, limit, cursor, pattern, prefix, details, request=request
+        )
+        etag = self._listing_etag(result)
+
+        if (
+            generation is not None
+            and self.watcher.generation(path_key) == generation
+            and len(result["items"]) <= LIST_CACHE_MAX_ITEMS
+        ):
+            self._list_cache[key] = (generation, result, etag)
+            self._list_cache.move_to_end(key)
+            while len(self._list_cache) > self.list_cache_size:
+                self._list_cache.popitem(last=False)
+
+        return result, etag
+
+    @staticmethod
+    def _listing_etag(result: dict) -> str:
+        """목록 내용 기반 ETag (캐시가 없어도 304 응답 가능)"""
+        raw = json.dumps(result, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return '"' + hashlib.sha1(raw).hexdigest()[:20] + '"'
+
+    # ==================== 동기 파일 작업 (스레드 풀에서 실행) ====================
+
+    def list_dir(
+        self,
+        cancel: threading.Event,
+        path: Path,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        pattern: Optional[str] = None,
+        prefix: Optional[str] = None,
+        details: bool = True
+    ) -> dict:
+        """
+        디렉토리 내용 조회 (os.scandir 기반, 커서 페이지네이션)
+
+        DirEntry에 캐시된 타입 정보로 폴더/파일을 구분하고,
+        stat은 반환할 페이지의 엔트리에 대해서만 한 번씩 호출함
+
+        Args:
+            path: 검증된 디렉토리 절대 경로
+            limit: 페이지 크기 (None이면 전체)
+            cursor: 이전 페이지의 next_cursor
+            pattern: 이름 glob 필터 (예: "*.py")
+            prefix: 이름 접두사 필터 (대소문자 무시)
+            details: False면 size/modified 생략 (stat 호출 없음)
+
+        Returns:
+            items, next_cursor, total
+        """
+        after = decode_list_cursor(cursor) if cursor else None
+        prefix_lower = prefix.lower() if prefix else None
+
+        try:
+            scanner = os.scandir(path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Path not found")
+        except NotADirectoryError:
+            raise HTTPException(status_code=400, detail="Not a directory")
+
+        # 정렬 키: 폴더 먼저, 그 다음 파일, 각각 이름순
+        entries = []
+        total = 0
+        with scanner:
+            for index, entry in enumerate(scanner):
+                if index % CANCEL_CHECK_INTERVAL == 0 and cancel.is_set():
+                    raise FileOperationCancelled()
+
+                name = entry.name
+                name_lower = name.lower()
+                if prefix_lower and not name_lower.startswith(prefix_lower):
+                    continue
+                if pattern and not fnmatch.fnmatchcase(name, pattern):
+                    continue
+
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                total += 1
+                key = (0 if is_dir else 1, name_lower, name)
+                if after is not None and key <= after:
+                    continue
+                entries.append((key, entry))
+
+        if limit is not None and len(entries) > limit:
+            page = heapq.nsmallest(limit, entries, key=lambda e: e[0])
+            has_more = True
+        else:
+            page = sorted(entries, key=lambda e: e[0])
+            has_more = False
+
+        relative_dir = os.path.relpath(path, self.workspace_resolved)
+        items = []
+        for key, entry in page:
+            is_file = key[0] == 1
+            relative_path = entry.name if relative_dir == "." else f"{relative_dir}/{entry.name}"
+            item = {
+                "name": entry.name,
+                "path": relative_path,
+                "type": "file" if is_file else "directory",
+                "size": None,
+                "modified": None
+            }
+            if details:
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.warning(f"Failed to read item {entry.path}: {e}")
+                    continue
+                item["size"] = stat.st_size if is_file else None
+                item["modified"] = stat.st_mtime
+            items.append(item)
+
+        return {
+            "items": items,
+            "next_cursor": encode_list_cursor(page[-1][0]) if has_more and page else None,
+            "total": total
+        }
+
+    def read_text(self, cancel: threading.Event, path: Path) -> Tuple[str, str, str]:
+        """
+        텍스트 파일 읽기
+
+        Returns:
+            (내용, ETag, SHA-256 - 부분 저장(patch)의 기준 버전)
+        """
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if not stat_module.S_ISREG(st.st_mode):
+                    raise HTTPException(status_code=400, detail="Not a file")
+
+                # 파일 크기 제한 (10MB)
+                if st.st_size > MAX_READ_SIZE:
+                    raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+
+                data = f.read()
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        except IsADirectoryError:
+            raise HTTPException(status_code=400, detail="Not a file")
+
+        try:
+            return data.decode("utf-8"), file_etag(st), hashlib.sha256(data).hexdigest()
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Binary file not supported")
+
+    def check_etag(
+        self,
+        cancel: threading.Event,
+        path: Path,
+        expected_etag: Optional[str],
+        overwrite: bool = True
+    ):
+        """
+        낙관적 동시성 검사
+
+        Args:
+            path: 대상 파일
+            expected_etag: 클라이언트가 마지막으로 본 ETag ("*"이면 존재만 확인, None이면 검사 안 함)
+            overwrite: False면 이미 존재할 때 409
+
+        Raises:
+            HTTPException: 412 (다른 곳에서 수정됨), 409 (이미 존재)
+        """
+        try:
+            current = file_etag(os.stat(path))
+        except FileNotFoundError:
+            current = None
+
+        if current is not None and not overwrite:
+            raise HTTPException(status_code=409, detail="Already exists")
+
+        if expected_etag is None:
+            return
+        if current is None or (expected_etag != "*" and expected_etag != current):
+            raise HTTPException(
+                status_code=412,
+                detail="File was modified since it was loaded",
+                headers={"ETag": current} if current else None
+            )
+
+    def open_temp(self, cancel: threading.Event, path: Path) -> Tuple[int, str]:
+        """대상과 같은 디렉토리에 임시 파일 생성 (같은 파일 시스템이어야 rename이 원자적)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+
+    def write_all(self, cancel: threading.Event, fd: int, data: bytes):
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    def commit_temp(
+        self,
+        cancel: threading.Event,
+        fd: int,
+        temp_path: str,
+        path: Path,
+        expected_etag: Optional[str] = None,
+        overwrite: bool = True
+    ) -> str:
+        """
+        임시 파일을 디스크에 기록한 뒤 대상 경로로 원자적 교체
+
+        기존 파일의 권한은 유지하고, 새 파일은 umask를 적용한 기본 권한 사용
+
+        Returns:
+            새 ETag
+        """
+        try:
+            os.fsync(fd)
+            try:
+                mode = stat_module.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.fchmod(fd, mode)
+        finally:
+            os.close(fd)
+
+        try:
+            self.check_etag(cancel, path, expected_etag, overwrite)
+            os.replace(temp_path, path)
+        except BaseException:
+            self.discard_temp(cancel, None, temp_path)
+            raise
+        return file_etag(os.stat(path))
+
+    def discard_temp(self, cancel: threading.Event, fd: Optional[int], temp_path: str):
+        """임시 파일 정리"""
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+
+    def write_text(
+        self,
+        cancel: threading.Event,
+        path: Path,
+        content: str,
+        expected_etag: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        텍스트 파일 쓰기 (임시 파일 + rename으로 원자적 교체)
+
+        Returns:
+            (새 ETag, SHA-256)
+        """
+        data = content.encode("utf-8")
+        self.check_etag(cancel, path, expected_etag)
+        etag = self._write_bytes(cancel, path, data, expected_etag)
+        return etag, hashlib.sha256(data).hexdigest()
+
+    def patch_text(
+        self,
+        cancel: threading.Event,
+        path: Path,
+        base_sha256: str,
+        edits: List[Tuple[int, int, str]],
+        expected_sha256: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        텍스트 파일 부분 수정 (변경된 부분만 전송받아 서버에서 적용)
+
+        Args:
+            path: 대상 파일
+            base_sha256: 클라이언트가 편집을 시작한 버전의 SHA-256
+            edits: (바이트 오프셋, 삭제할 바이트 수, 삽입할 문자열) 목록 - 기준 버전 기준, 오프셋 오름차순
+            expected_sha256: 적용 결과의 SHA-256 (있으면 검증)
+
+        Returns:
+            (새 ETag, SHA-256)
+
+        Raises:
+            HTTPException: 409 (기준 버전 불일치 - 전체 저장으로 재시도), 400 (잘못된 편집)
+        """
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if not stat_module.S_ISREG(st.st_mode):
+                    raise HTTPException(status_code=400, detail="Not a file")
+                if st.st_size > MAX_READ_SIZE:
+                    raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+                data = f.read()
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        except IsADirectoryError:
+            raise HTTPException(status_code=400, detail="Not a file")
+
+        etag = file_etag(st)
+        if hashlib.sha256(data).hexdigest() != base_sha256:
+            raise HTTPException(status_code=409, detail="Base version mismatch", headers={"ETag": etag})
+
+        parts = []
+        position = 0
+        for offset, delete, insert in edits:
+            if offset < position or delete < 0 or offset + delete > len(data):
+                raise HTTPException(status_code=400, detail="Invalid patch")
+            parts.append(data[position:offset])
+            parts.append(insert.encode("utf-8"))
+            position = offset + delete
+        parts.append(data[position:])
+        result = b"".join(parts)
+
+        try:
+            result.decode("utf-8")
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Patch splits a UTF-8 character")
+
+        sha256 = hashlib.sha256(result).hexdigest()
+        if expected_sha256 and sha256 != expected_sha256:
+            raise HTTPException(status_code=409, detail="Patch result mismatch", headers={"ETag": etag})
+
+        # 읽은 뒤 교체 전에 다른 곳에서 수정되면 412
+        return self._write_bytes(cancel, path, result, etag), sha256
+
+    def _write_bytes(
+        self,
+        cancel: threading.Event,
+        path: Path,
+        data: bytes,
+        expected_etag: Optional[str] = None
+    ) -> str:
+        """바이트를 임시 파일에 쓴 뒤 원자적 교체, 새 ETag 반환"""
+        fd, temp_path = self.open_temp(cancel, path)
+        try:
+            self.write_all(cancel, fd, data)
+        except BaseException:
+            self.discard_temp(cancel, fd, temp_path)
+            raise
+        return self.commit_temp(cancel, fd, temp_path, path, expected_etag)
+
+    async def write_stream(
+        self,
+        path: Path,
+        chunks: AsyncIterator[bytes],
+        expected_etag: Optional[str] = None,
+        overwrite: bool = True,
+        max_size: Optional[int] = None
+    ) -> Tuple[str, int]:
+        """
+        비동기 바이트 스트림을 파일로 저장 (전체를 메모리에 올리지 않음)
+
+        Args:
+            path: 검증된 대상 경로
+            chunks: 요청 본문 등 바이트 스트림
+            expected_etag: 낙관적 동시성 검사용 ETag
+            overwrite: False면 이미 존재할 때 409
+            max_size: 최대 크기 (초과 시 413)
+
+        Returns:
+            (새 ETag, 저장한 바이트 수)
+        """
+        # 본문을 받기 전에 먼저 확인해서 불필요한 전송 방지 (교체 직전에 다시 확인)
+        await self.run(self.check_etag, path, expected_etag, overwrite)
+
+        fd, temp_path = await self.run(self.open_temp, path)
+        try:
+            size = 0
+            buffer = bytearray()
+            async for chunk in chunks:
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise HTTPException(status_code=413, detail="Upload too large")
+                buffer += chunk
+                if len(buffer) >= WRITE_BUFFER_SIZE:
+                    await self.run(self.write_all, fd, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await self.run(self.write_all, fd, bytes(buffer))
+        except BaseException:
+            await self.run(self.discard_temp, fd, temp_path)
+            raise
+
+        etag = await self.run(self.commit_temp, fd, temp_path, path, expected_etag, overwrite)
+        return etag, size
+
+    def move_into_place(
+        self,
+        cancel: threading.Event,
+        source: str,
+        path: Path,
+        expected_etag: Optional[str] = None,
+        overwrite: bool = True
+    ) -> str:
+        """
+        완성된 파일을 대상 경로로 원자적 이동 (다른 파일 시스템이면 복사 후 교체)
+
+        Returns:
+            새 ETag
+        """
+        self.check_etag(cancel, path, expected_etag, overwrite)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            try:
+                mode = stat_module.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(source, mode)
+            os.replace(source, path)
+            return file_etag(os.stat(path))
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+        fd, temp_path = self.open_temp(cancel, path)
+        try:
+            with open(source, "rb") as src:
+                while True:
+                    if cancel.is_set():
+                        raise FileOperationCancelled()
+                    block = src.read(WRITE_BUFFER_SIZE)
+                    if not block:
+                        break
+                    self.write_all(cancel, fd, block)
+        except BaseException:
+            self.discard_temp(cancel, fd, temp_path)
+            raise
+
+        etag = self.commit_temp(cancel, fd, temp_path, path, expected_etag, overwrite)
+        os.unlink(source)
+        return etag
+
+    def create(self, cancel: threading.Event, path: Path, item_type: str):
+        """파일/폴더 생성"""
+        if path.exists():
+            raise HTTPException(status_code=409, detail="Already exists")
+
+        if item_type == "directory":
+            path.mkdir(parents=True, exist_ok=True)
+        elif item_type == "file":
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        else:
+            raise HTTPException(status_code=400, detail="Invalid type (must be 'file' or 'directory')")
+
+    def stat_file(self, cancel: threading.Event, path: Path) -> os.stat_result:
+        """일반 파일 stat (없거나 파일이 아니면 HTTPException)"""
+        try:
+            result = os.stat(path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        if not stat_module.S_ISREG(result.st_mode):
+            raise HTTPException(status_code=400, detail="Not a file")
+        return result
+
+    def open_fd(self, cancel: threading.Event, path: Path) -> int:
+        """읽기 전용 파일 디스크립터 열기"""
+        try:
+            return os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+
+    def pread(self, cancel: threading.Event, fd: int, offset: int, size: int) -> bytes:
+        return os.pread(fd, size, offset)
+
+    async def iter_range(self, path: Path, start: int, end: int) -> AsyncIterator[bytes]:
+        """
+        파일의 바이트 범위를 청크 단위로 스트리밍 (메모리 사용량 일정)
+
+        Args:
+            path: 검증된 파일 경로
+            start: 시작 바이트 (포함)
+            end: 끝 바이트 (포함)
+        """
+        fd = await self.run(self.open_fd, path)
+        try:
+            position = start
+            while position <= end:
+                data = await self.run(self.pread, fd, position, min(READ_CHUNK_SIZE, end - position + 1))
+                if not data:
+                    break
+                position += len(data)
+                yield data
+        finally:
+            os.close(fd)
+
+    def _get_line_index(self, path: Path, st: os.stat_result) -> LineIndex:
+        """경로의 줄 오프셋 인덱스 (파일이 바뀌었으면 새로 생성)"""
+        key = str(path)
+        inode = (st.st_dev, st.st_ino)
+        with self._line_indexes_lock:
+            index = self._line_indexes.get(key)
+            if index is None or index.inode != inode:
+                index = self._line_indexes[key] = LineIndex(inode)
+            self._line_indexes.move_to_end(key)
+            while len(self._line_indexes) > LINE_INDEX_CACHE_SIZE:
+                self._line_indexes.popitem(last=False)
+        return index
+
+    @staticmethod
+    def _decode_lines(data: bytes) -> List[str]:
+        """바이트를 줄 목록으로 변환 (긴 줄은 잘라냄)"""
+        return [
+            line[:MAX_LINE_CHARS]
+            for line in data.decode("utf-8", errors="replace").split("\n")
+        ]
+
+    def read_lines(self, cancel: threading.Event, path: Path, offset: int, limit: int) -> dict:
+        """
+        줄 단위 구간 읽기 (0부터 시작하는 줄 번호)
+
+        희소 줄 인덱스로 가장 가까운 체크포인트로 이동한 뒤 필요한 만큼만 읽음
+
+        Args:
+            path: 검증된 파일 경로
+            offset: 시작 줄 번호
+            limit: 최대 줄 수
+
+        Returns:
+            lines, start_line, next_line (더 없으면 None), start_byte, end_byte, size, total_lines
+        """
+        fd = self.open_fd(cancel, path)
+        try:
+            st = os.fstat(fd)
+            if not stat_module.S_ISREG(st.st_mode):
+                raise HTTPException(status_code=400, detail="Not a file")
+            size = st.st_size
+            index = self._get_line_index(path, st)
+
+            with index.lock:
+                if not index.validate(fd, size):
+                    index.reset()
+                index.scan(fd, size, cancel, until_line=offset)
+                line_number, position = index.seek(offset)
+                total_lines = index.total_lines(size)
+
+            # 체크포인트부터 offset 줄까지 건너뛰기
+            while line_number < offset and position < size:
+                block = os.pread(fd, min(SCAN_BLOCK_SIZE, size - position), position)
+                if not block:
+                    break
+                newlines = block.count(b"\n")
+                if line_number + newlines < offset:
+                    line_number += newlines
+                    position += len(block)
+                    continue
+                cut = -1
+                for _ in range(offset - line_number):
+                    cut = block.find(b"\n", cut + 1)
+                position += cut + 1
+                line_number = offset
+
+            # offset부터 limit줄 읽기 (최대 MAX_LINES_BYTES)
+            start_byte = position
+            chunks = []
+            newlines = 0
+            read_bytes = 0
+            while newlines < limit and position < size and read_bytes < MAX_LINES_BYTES:
+                block = os.pread(fd, min(READ_CHUNK_SIZE, size - position, MAX_LINES_BYTES - read_bytes), position)
+                if not block:
+                    break
+                found = block.count(b"\n")
+                if newlines + found >= limit:
+                    cut = -1
+                    for _ in range(limit - newlines):
+                        cut = block.find(b"\n", cut + 1)
+                    block = block[:cut + 1]
+                    found = limit - newlines
+                chunks.append(block)
+                newlines += found
+                position += len(block)
+                read_bytes += len(block)
+        finally:
+            os.close(fd)
+
+        data = b"".join(chunks)
+        lines = self._decode_lines(data) if data else []
+        if lines and data.endswith(b"\n"):
+            lines.pop()
+        elif len(lines) > 1 and position < size:
+            # 바이트 한도로 잘린 마지막 줄은 다음 요청에서 다시 읽음
+            position -= len(data) - (data.rfind(b"\n") + 1)
+            lines.pop()
+
+        return {
+            "lines": lines,
+            "start_line": offset,
+            "next_line": offset + len(lines) if position < size else None,
+            "start_byte": start_byte,
+            "end_byte": position,
+            "size": size,
+            "total_lines": total_lines
+        }
+
+    def read_tail(self, cancel: threading.Event, path: Path, count: int) -> dict:
+        """
+        파일 끝에서 count줄 읽기 (뒤에서부터 블록 단위로 읽어 파일 크기와 무관)
+
+        Returns:
+            lines, start_line (전체 줄 수를 알 때만), start_byte, end_byte, size, total_lines
+        """
+        fd = self.open_fd(cancel, path)
+        try:
+            st = os.fstat(fd)
+            if not stat_module.S_ISREG(st.st_mode):
+                raise HTTPException(status_code=400, detail="Not a file")
+            size = st.st_size
+
+            # 마지막 개행은 줄 구분이 아니라 마지막 줄의 끝
+            end = size
+            if size and os.pread(fd, 1, size - 1) == b"\n":
+                end -= 1
+
+            chunks = []
+            newlines = 0
+            position = end
+            while position > 0 and newlines < count and end - position < MAX_LINES_BYTES:
+                if cancel.is_set():
+                    raise FileOperationCancelled()
+                read_size = min(READ_CHUNK_SIZE, position)
+                position -= read_size
+                block = os.pread(fd, read_size, position)
+                newlines += block.count(b"\n")
+                chunks.append(block)
+
+            with self._line_indexes_lock:
+                index = self._line_indexes.get(str(path))
+                known_total = (
+                    index.total_lines(size)
+                    if index is not None and index.inode == (st.st_dev, st.st_ino) and index.scanned_bytes == size
+                    else None
+                )
+        finally:
+            os.close(fd)
+
+        # 개행 바로 뒤에서 자른 data는 비어 있어도 빈 줄 하나 ("...\n\n"의 마지막 줄)
+        data = b"".join(reversed(chunks))
+        has_lines = size > 0
+        if newlines >= count:
+            # 필요한 줄 수보다 더 읽은 앞부분 제거
+            cut = len(data)
+            for _ in range(count):
+                cut = data.rfind(b"\n", 0, cut)
+            data = data[cut + 1:]
+            position += cut + 1
+        elif position > 0:
+            # 바이트 한도로 잘린 첫 줄 제거
+            cut = data.find(b"\n")
+            if cut == -1:
+                position += len(data)
+                data = b""
+                has_lines = False
+            else:
+                data = data[cut + 1:]
+                position += cut + 1
+
+        lines = self._decode_lines(data) if has_lines else []
+        return {
+            "lines": lines,
+            "start_line": known_total - len(lines) if known_total is not None else None,
+            "next_line": None,
+            "start_byte": position,
+            "end_byte": size,
+            "size": size,
+            "total_lines": known_total
+        }
+
+    def delete(self, cancel: threading.Event, path: Path):
+        """파일/폴더 삭제 (폴더는 취소 가능한 재귀 삭제)"""
+        if not path.exists() and not path.is_symlink():
+            raise HTTPException(status_code=404, detail="Not found")
+
+        if path.is_dir() and not path.is_symlink():
+            self._rmtree(cancel, path)
+        else:
+            path.unlink()
+
+    @staticmethod
+    def _rmtree(cancel: threading.Event, path: Path):
+        """shutil.rmtree 대체: 엔트리마다 취소 여부 확인"""
+        for root, dirs, files in os.walk(path, topdown=False):
+            if cancel.is_set():
+                raise FileOperationCancelled()
+            for name in files:
+                os.unlink(os.path.join(root, name))
+            for name in dirs:
+                child = os.path.join(root, name)
+                # 디렉토리 심볼릭 링크는 따라가지 않고 링크만 삭제
+                if os.path.islink(child):
+                    os.unlink(child)
+                else:
+                    os.rmdir(child)
+        os.rmdir(path)
+
+    def copy(
+        self,
+        cancel: threading.Event,
+        source: Path,
+        dest: Path,
+        progress: Optional[Callable[[int, int], None]] = None
+    ):
+        """
+        파일/폴더 복사 (심볼릭 링크는 링크로 복사, 파일마다 취소 확인)
+
+        Args:
+            source: 원본 경로
+            dest: 대상 경로 (존재하면 409)
+            progress: 진행 콜백 (처리한 파일 수, 바이트 수)
+        """
+        self._check_transfer(source, dest)
+
+        if source.is_symlink() or not source.is_dir():
+            self._copy_entry(cancel, str(source), str(dest), progress)
+            return
+
+        for root, dirs, files in os.walk(source):
+            if cancel.is_set():
+                raise FileOperationCancelled()
+            target_root = os.path.join(dest, os.path.relpath(root, source))
+            os.makedirs(target_root, exist_ok=root != str(source))
+            for name in files + [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+                self._copy_entry(cancel, os.path.join(root, name), os.path.join(target_root, name), progress)
+            shutil.copystat(root, target_root, follow_symlinks=False)
+
+    def move(
+        self,
+        cancel: threading.Event,
+        source: Path,
+        dest: Path,
+        progress: Optional[Callable[[int, int], None]] = None
+    ):
+        """
+        파일/폴더 이동 (다른 파일 시스템이면 복사 후 삭제)
+
+        Args:
+            source: 원본 경로
+            dest: 대상 경로 (존재하면 409)
+            progress: 진행 콜백 (처리한 파일 수, 바이트 수)
+        """
+        self._check_transfer(source, dest)
+        try:
+            os.rename(source, dest)
+            if progress:
+                progress(1, 0)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+        self.copy(cancel, source, dest, progress)
+        self.delete(cancel, source)
+
+    @staticmethod
+    def _check_transfer(source: Path, dest: Path):
+        """복사/이동 대상 검사"""
+        if not source.exists() and not source.is_symlink():
+            raise HTTPException(status_code=404, detail="Not found")
+        if dest.exists() or dest.is_symlink():
+            raise HTTPException(status_code=409, detail="Already exists")
+        if not dest.parent.is_dir():
+            raise HTTPException(status_code=404, detail="Destination folder not found")
+        if source.is_dir() and not source.is_symlink() and dest.is_relative_to(source):
+            raise HTTPException(status_code=400, detail="Cannot copy or move a folder into itself")
+
+    @staticmethod
+    def _copy_entry(
+        cancel: threading.Event,
+        source: str,
+        dest: str,
+        progress: Optional[Callable[[int, int], None]]
+    ):
+        """파일 하나 복사 (블록 단위로 취소 확인, 권한/시각 유지)"""
+        if os.path.islink(source):
+            os.symlink(os.readlink(source), dest)
+            if progress:
+                progress(1, 0)
+            return
+
+        copied = 0
+        with open(source, "rb") as src, open(dest, "xb") as dst:
+            try:
+                while True:
+                    if cancel.is_set():
+                        raise FileOperationCancelled()
+                    block = src.read(WRITE_BUFFER_SIZE)
+                    if not block:
+                        break
+                    dst.write(block)
+                    copied += len(block)
+            except BaseException:
+                # 중단된 파일은 남기지 않음
+                os.unlink(dest)
+                raise
+        shutil.copystat(source, dest)
+        if progress:
+            progress(1, copied)
+
+    async def iter_blocking(self, iterator: Generator[bytes, None, None]) -> AsyncIterator[bytes]:
+        """
+        동기 이터레이터(아카이브 생성 등)를 스레드 풀에서 한 단계씩 실행하며 순회
+
+        응답이 중단되면 이터레이터를 닫아 열린 파일을 정리함
+        """
+        def step(cancel: threading.Event):
+            return next(iterator, None)
+
+        try:
+            while True:
+                chunk = await self.run(step)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            try:
+                await asyncio.to_thread(iterator.close)
+            except ValueError:
+                # 취소된 단계가 아직 실행 중이면 GC 시 정리됨
+                pass
+
+
+# 전역 파일 매니저 인스턴스
+file_manager = FileManager()
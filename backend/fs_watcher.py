@@ -0,0 +1,280 @@
+"""
+디렉토리 변경 감시 (Linux inotify, ctypes 사용)
+디렉토리 목록 캐시 무효화 및 클라이언트 변경 알림에 사용
+"""
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# inotify 상수 (<sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+# 디렉토리 구조 변경만 감시 (파일 내용 변경 제외)
+STRUCTURE_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+# 같은 디렉토리의 연속 이벤트를 묶어서 알리는 지연 시간 (초)
+NOTIFY_DEBOUNCE = 0.2
+
+
+class WatchSubscription:
+    """변경 알림 구독 (WebSocket 연결 하나당 하나)"""
+
+    def __init__(self, watcher: "DirectoryWatcher", max_pending: int = 256):
+        self.watcher = watcher
+        self.paths: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def add(self, path: str) -> bool:
+        """디렉토리 구독 (감시 등록 실패 시 False)"""
+        if not self.watcher.watch(path):
+            return False
+        self.paths.add(path)
+        return True
+
+    def remove(self, path: str):
+        """디렉토리 구독 해제"""
+        self.paths.discard(path)
+
+    def close(self):
+        """구독 종료"""
+        self.paths.clear()
+        self.watcher.unsubscribe(self)
+
+
+class DirectoryWatcher:
+    """
+    inotify 기반 디렉토리 감시자
+
+    디렉토리마다 변경 세대(generation) 번호를 유지하며,
+    변경 이벤트가 오면 번호를 올리고 구독자에게 알림
+    """
+
+    def __init__(self, max_watches: int = None, mask: int = WATCH_MASK):
+        if max_watches is None:
+            max_watches = int(os.getenv("FS_WATCH_MAX", "1024"))
+
+        self.max_watches = max_watches
+        self.mask = mask
+        self.available = False
+        self._fd: Optional[int] = None
+        self._libc = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 감시 중인 디렉토리 (path -> wd, LRU 순서), wd -> path
+        self._watches: "OrderedDict[str, int]" = OrderedDict()
+        self._paths: Dict[int, str] = {}
+        self._generations: Dict[str, int] = {}
+
+        self._subscriptions: Set[WatchSubscription] = set()
+        self._listeners: List[Callable[[str], None]] = []
+        self._pending: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def start(self):
+        """inotify 초기화 및 이벤트 루프에 리더 등록 (실패 시 감시 없이 동작)"""
+        if self._fd is not None:
+            return
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify 사용 불가, 디렉토리 감시 비활성화: {e}")
+            return
+
+        self._libc = libc
+        self._fd = fd
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._on_readable)
+        self.available = True
+        logger.info(f"디렉토리 감시 시작 (최대 {self.max_watches}개)")
+
+    def stop(self):
+        """inotify 종료"""
+        if self._fd is None:
+            return
+
+        try:
+            self._loop.remove_reader(self._fd)
+        except Exception:
+            pass
+        os.close(self._fd)
+        self._fd = None
+        self.available = False
+        self._watches.clear()
+        self._paths.clear()
+        self._generations.clear()
+
+    def watch(self, path: str) -> bool:
+        """
+        디렉토리 감시 등록 (이미 등록되어 있으면 LRU 순서만 갱신)
+
+        Args:
+            path: 디렉토리 절대 경로
+
+        Returns:
+            감시 중 여부
+        """
+        if not self.available:
+            return False
+
+        if path in self._watches:
+            self._watches.move_to_end(path)
+            return True
+
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.mask)
+        if wd < 0:
+            logger.debug(f"감시 등록 실패 ({path}): {os.strerror(ctypes.get_errno())}")
+            return False
+
+        # 같은 inode를 다른 경로로 감시하면 같은 wd가 돌아옴
+        previous = self._paths.get(wd)
+        if previous and previous != path:
+            self._forget(previous)
+
+        self._watches[path] = wd
+        self._paths[wd] = path
+        self._generations.setdefault(path, 0)
+
+        # 감시 수 제한 (가장 오래 사용하지 않은 것부터 해제)
+        while len(self._watches) > self.max_watches:
+            oldest, oldest_wd = next(iter(self._watches.items()))
+            if any(oldest in sub.paths for sub in self._subscriptions):
+                self._watches.move_to_end(oldest)
+                if oldest == path:
+                    break
+                continue
+            self._libc.inotify_rm_watch(self._fd, oldest_wd)
+            self._forget(oldest)
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def generation(self, path: str) -> Optional[int]:
+        """
+        디렉토리 변경 세대 번호 (감시 중이 아니면 None)
+
+        캐시된 목록은 세대 번호가 같을 때만 유효함
+        """
+        if path not in self._watches:
+            return None
+        self._watches.move_to_end(path)
+        return self._generations.get(path)
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """변경 이벤트 콜백 등록 (디바운스 없이 즉시 호출)"""
+        self._listeners.append(callback)
+
+    def subscribe(self) -> WatchSubscription:
+        """변경 알림 구독 생성"""
+        subscription = WatchSubscription(self)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: WatchSubscription):
+        """변경 알림 구독 해제"""
+        self._subscriptions.discard(subscription)
+
+    def _forget(self, path: str):
+        """감시 정보 제거 (세대 번호도 제거되어 관련 캐시가 무효화됨)"""
+        wd = self._watches.pop(path, None)
+        if wd is not None and self._paths.get(wd) == path:
+            del self._paths[wd]
+        self._generations.pop(path, None)
+
+    def _on_readable(self):
+        """inotify 이벤트 읽기 (이벤트 루프 콜백)"""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.error(f"inotify 읽기 실패: {e}")
+            return
+
+        changed = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + name_len].rstrip(b"\0")
+            offset += EVENT_HEADER.size + name_len
+
+            if mask & IN_Q_OVERFLOW:
+                # 이벤트 유실: 모든 디렉토리를 변경된 것으로 간주
+                changed.update(self._watches.keys())
+                continue
+
+            path = self._paths.get(wd)
+            if path is None:
+                continue
+
+            changed.add(path)
+
+            # 하위 디렉토리 삭제/이동 시 그 디렉토리의 캐시도 무효화
+            if mask & IN_ISDIR and mask & (IN_DELETE | IN_MOVED_FROM) and name:
+                child = os.path.join(path, os.fsdecode(name))
+                if child in self._watches:
+                    changed.add(child)
+
+            if mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+                self._forget(path)
+
+        for path in changed:
+            if path in self._generations:
+                self._generations[path] += 1
+            for callback in self._listeners:
+                callback(path)
+
+        if changed:
+            self._pending.update(changed)
+            if self._flush_handle is None:
+                self._flush_handle = self._loop.call_later(NOTIFY_DEBOUNCE, self._flush_notifications)
+
+    def _flush_notifications(self):
+        """모아둔 변경 알림을 구독자 큐에 전달"""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = set()
+
+        for subscription in list(self._subscriptions):
+            for path in pending & subscription.paths:
+                try:
+                    subscription.queue.put_nowait(path)
+                except asyncio.QueueFull:
+                    # 느린 클라이언트: 알림 유실 (다음 변경 때 다시 알림)
+                    pass
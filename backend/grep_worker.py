@@ -0,0 +1,120 @@
+"""
+파일 내용 검색 워커 (별도 프로세스에서 실행)
+spawn 방식으로 임포트되므로 표준 라이브러리 외의 모듈을 임포트하지 않음
+"""
+import os
+import re
+import time
+from typing import List, Tuple
+
+# 바이너리 판별에 사용하는 앞부분 크기
+BINARY_CHECK_SIZE = 8192
+
+# 결과에 포함하는 줄 최대 길이 (긴 줄은 잘라냄)
+MAX_LINE_LENGTH = 400
+
+_compiled = {}
+
+
+def _get_regex(pattern: str, flags: int) -> re.Pattern:
+    """워커 프로세스 안에서 정규식 재사용"""
+    key = (pattern, flags)
+    regex = _compiled.get(key)
+    if regex is None:
+        if len(_compiled) > 32:
+            _compiled.clear()
+        regex = _compiled[key] = re.compile(pattern, flags)
+    return regex
+
+
+def search_files(
+    root: str,
+    paths: List[str],
+    pattern: str,
+    flags: int,
+    max_file_size: int,
+    max_matches_per_file: int,
+    deadline: float = 0
+) -> Tuple[List[dict], int, int]:
+    """
+    파일 묶음에서 정규식 검색
+
+    심볼릭 링크는 따라가지 않고(O_NOFOLLOW), NUL 바이트가 있는 파일은 바이너리로 보고 건너뜀
+    deadline이 지나면 남은 파일은 검색하지 않고 반환 (한 파일 안의 정규식 실행은 중단할 수 없으므로
+    그 경우는 호출 쪽에서 프로세스를 종료함)
+
+    Args:
+        root: 워크스페이스 절대 경로
+        paths: 워크스페이스 기준 상대 파일 경로 목록
+        pattern: 정규식
+        flags: re 플래그
+        max_file_size: 이보다 큰 파일은 건너뜀
+        max_matches_per_file: 파일당 최대 매칭 줄 수
+        deadline: 검색 마감 시각 (time.time() 기준, 0이면 제한 없음)
+
+    Returns:
+        (파일별 결과 [{path, matches: [{line, column, text}]}], 검색한 파일 수, 건너뛴 파일 수)
+    """
+    regex = _get_regex(pattern, flags)
+    results = []
+    searched = 0
+    skipped = 0
+
+    for relative in paths:
+        if deadline and time.time() > deadline:
+            break
+
+        try:
+            fd = os.open(os.path.join(root, relative), os.O_RDONLY | os.O_NOFOLLOW)
+        except OSError:
+            skipped += 1
+            continue
+
+        with os.fdopen(fd, "rb") as f:
+            try:
+                if os.fstat(fd).st_size > max_file_size:
+                    skipped += 1
+                    continue
+                data = f.read()
+            except OSError:
+                skipped += 1
+                continue
+
+        if b"\0" in data[:BINARY_CHECK_SIZE]:
+            skipped += 1
+            continue
+
+        searched += 1
+        text = data.decode("utf-8", errors="replace")
+        matches = []
+        line_number = 1
+        counted_until = 0
+        last_line_end = -1
+
+        for match in regex.finditer(text):
+            start = match.start()
+            if start <= last_line_end:
+                # 같은 줄의 추가 매칭은 생략
+                continue
+
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+
+            line_number += text.count("\n", counted_until, line_start)
+            counted_until = line_start
+            last_line_end = line_end
+
+            matches.append({
+                "line": line_number,
+                "column": start - line_start,
+                "text": text[line_start:min(line_end, line_start + MAX_LINE_LENGTH)].rstrip("\r")
+            })
+            if len(matches) >= max_matches_per_file:
+                break
+
+        if matches:
+            results.append({"path": relative, "matches": matches})
+
+    return results, searched, skipped
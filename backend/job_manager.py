@@ -0,0 +1,194 @@
+"""
+백그라운드 파일 작업 관리
+여러 항목의 삭제/이동/복사를 하나의 작업(job)으로 실행하고 진행 상황과 취소를 제공
+"""
+import asyncio
+import logging
+import os
+import secrets
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+from fastapi import HTTPException
+
+from file_manager import file_manager, FileOperationCancelled
+
+logger = logging.getLogger(__name__)
+
+JOB_OPERATIONS = ("delete", "move", "copy")
+
+
+class JobOperation:
+    """작업 항목 하나 (경로는 검증된 절대 경로)"""
+
+    def __init__(self, op: str, path: str, source: Path, dest: Optional[Path] = None):
+        self.op = op
+        self.path = path
+        self.source = source
+        self.dest = dest
+
+
+class Job:
+    """파일 작업 상태"""
+
+    def __init__(self, job_id: str, username: str, operations: List[JobOperation]):
+        self.id = job_id
+        self.username = username
+        self.operations = operations
+        self.status = "pending"  # pending, running, completed, failed, cancelled
+        self.completed = 0
+        self.files = 0
+        self.bytes = 0
+        self.current: Optional[str] = None
+        self.errors: List[dict] = []
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def add_progress(self, files: int, size: int):
+        """진행 콜백 (스레드 풀에서 호출)"""
+        self.files += files
+        self.bytes += size
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "total": len(self.operations),
+            "completed": self.completed,
+            "files": self.files,
+            "bytes": self.bytes,
+            "current": self.current,
+            "errors": self.errors,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+
+
+class JobManager:
+    """
+    파일 작업 관리자
+
+    작업은 asyncio 태스크로 실행되며 실제 파일 I/O는 file_manager 스레드 풀에서 수행.
+    동시에 실행되는 작업 수를 제한하고, 끝난 작업은 일정 시간 조회 가능하도록 보관
+    """
+
+    def __init__(self, max_concurrent: int = None, max_finished: int = 100, retention: int = 3600):
+        if max_concurrent is None:
+            max_concurrent = int(os.getenv("JOB_WORKERS", "2"))
+
+        self.max_concurrent = max_concurrent
+        self.max_finished = max_finished
+        self.retention = retention
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def submit(self, username: str, operations: List[JobOperation]) -> Job:
+        """
+        작업 등록 및 백그라운드 실행
+
+        Args:
+            username: 요청 사용자
+            operations: 검증된 작업 항목 목록
+
+        Returns:
+            등록된 작업
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        self._prune()
+        job = Job(secrets.token_urlsafe(12), username, operations)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job))
+        logger.info(f"파일 작업 등록: {job.id} ({len(operations)}개 항목) by {username}")
+        return job
+
+    def get(self, job_id: str, username: str) -> Job:
+        """작업 조회 (다른 사용자의 작업은 404)"""
+        job = self._jobs.get(job_id)
+        if job is None or job.username != username:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
+
+    def list_jobs(self, username: str) -> List[Job]:
+        """사용자의 작업 목록 (최근 순)"""
+        return [job for job in reversed(self._jobs.values()) if job.username == username]
+
+    def cancel(self, job_id: str, username: str) -> Job:
+        """작업 취소 (진행 중인 항목은 파일 단위로 중단)"""
+        job = self.get(job_id, username)
+        if not job.done and job.task is not None:
+            job.task.cancel()
+        return job
+
+    async def shutdown(self):
+        """실행 중인 작업 모두 취소"""
+        tasks = [job.task for job in self._jobs.values() if job.task and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: Job):
+        """작업 항목 순차 실행 (항목 하나가 실패해도 나머지는 계속)"""
+        try:
+            async with self._semaphore:
+                job.status = "running"
+                for operation in job.operations:
+                    job.current = operation.path
+                    try:
+                        await file_manager.run(self._execute, operation, job)
+                    except HTTPException as e:
+                        job.errors.append({"path": operation.path, "op": operation.op, "detail": e.detail})
+                    except FileOperationCancelled:
+                        raise asyncio.CancelledError()
+                    except OSError as e:
+                        job.errors.append({"path": operation.path, "op": operation.op, "detail": str(e)})
+                    job.completed += 1
+
+            job.status = "failed" if job.errors and len(job.errors) == len(job.operations) else "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            logger.info(f"파일 작업 취소: {job.id}")
+        except Exception as e:
+            job.status = "failed"
+            job.errors.append({"path": job.current, "op": None, "detail": str(e)})
+            logger.error(f"파일 작업 실패 {job.id}: {e}")
+        finally:
+            job.current = None
+            job.finished_at = time.time()
+            job.task = None
+
+        logger.info(f"파일 작업 종료: {job.id} ({job.status}, 오류 {len(job.errors)}개)")
+
+    @staticmethod
+    def _execute(cancel, operation: JobOperation, job: Job):
+        """작업 항목 하나 실행 (스레드 풀)"""
+        if operation.op == "delete":
+            file_manager.delete(cancel, operation.source)
+            job.add_progress(1, 0)
+        elif operation.op == "move":
+            file_manager.move(cancel, operation.source, operation.dest, job.add_progress)
+        elif operation.op == "copy":
+            file_manager.copy(cancel, operation.source, operation.dest, job.add_progress)
+
+    def _prune(self):
+        """오래된 완료 작업 정리"""
+        cutoff = time.time() - self.retention
+        finished = [job for job in self._jobs.values() if job.done]
+        excess = len(finished) - self.max_finished
+        for job in finished:
+            if excess > 0 or job.finished_at < cutoff:
+                del self._jobs[job.id]
+                excess -= 1
+
+
+# 전역 작업 매니저 인스턴스
+job_manager = JobManager()
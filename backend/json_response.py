@@ -0,0 +1,27 @@
+"""
+빠른 JSON 응답
+orjson이 설치되어 있으면 orjson으로 직렬화하고, 없으면 표준 json으로 대체
+큰 목록(세션/파일)을 반환하는 엔드포인트는 이 응답을 직접 반환해 jsonable_encoder 변환도 생략
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 표준 json 사용
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSONResponse
+
+    JSONResponse와 같은 출력(UTF-8, 공백 없음)을 내며, dict/list/str/int/float/bool/None 외에
+    datetime, UUID, dataclass도 직렬화. 정수 키 dict는 표준 json처럼 문자열 키로 변환
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,241 @@
+"""
+이벤트 루프 감시 (lag 측정 및 멈춤 원인 스택 수집)
+루프 안의 하트비트가 지연 시간을 재고, 별도 샘플링 스레드가 하트비트가 끊긴 동안
+루프 스레드의 스택을 주기적으로 찍어 어떤 코드가 루프를 막았는지 기록
+(bcrypt, rmtree, 동기 process.write 같은 블로킹 호출 추적용)
+
+평상시 비용은 하트비트(초당 1/interval회)와 스레드 깨어남뿐이며,
+스택 수집은 멈춤이 감지된 동안에만 수행
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 멈춤 하나에 보관하는 서로 다른 스택 수 / 스택 깊이
+MAX_STACKS_PER_STALL = 5
+MAX_STACK_DEPTH = 40
+
+LOOP_LAG_SECONDS = metrics.histogram(
+    "event_loop_lag_seconds", "Event loop scheduling delay measured by the watchdog heartbeat",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+LOOP_STALLS = metrics.counter("event_loop_stalls_total", "Event loop stalls longer than the watchdog threshold")
+
+
+class _Stall:
+    """진행 중이거나 끝난 멈춤 하나"""
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.duration = 0.0
+        self.samples = 0
+        # (task 이름, 스택) -> 샘플 수
+        self.stacks: Dict[Tuple[Optional[str], Tuple[str, ...]], int] = {}
+
+    def add(self, task: Optional[str], stack: Tuple[str, ...]):
+        self.samples += 1
+        key = (task, stack)
+        if key in self.stacks or len(self.stacks) < MAX_STACKS_PER_STALL:
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def to_dict(self) -> dict:
+        stacks = sorted(self.stacks.items(), key=lambda item: -item[1])
+        return {
+            "started_at": self.started_at,
+            "duration": round(self.duration, 4),
+            "samples": self.samples,
+            "stacks": [
+                {"task": task, "samples": count, "frames": list(stack)}
+                for (task, stack), count in stacks
+            ]
+        }
+
+
+class LoopWatchdog:
+    """
+    이벤트 루프 감시기
+
+    - 하트비트: interval마다 깨어나 예정 시각과의 차이(lag)를 기록
+    - 샘플러 스레드: 마지막 하트비트 이후 interval + threshold가 지나면 루프 스레드의 스택을
+      sample_interval마다 수집 (같은 스택은 개수만 증가)
+    - 하트비트가 돌아오면 멈춤을 확정하고 최근 기록에 보관
+    """
+
+    def __init__(
+        self,
+        interval: float = None,
+        threshold: float = None,
+        sample_interval: float = None,
+        history: int = None
+    ):
+        if interval is None:
+            interval = float(os.getenv("LOOP_WATCHDOG_INTERVAL", "0.1"))
+        if threshold is None:
+            threshold = float(os.getenv("LOOP_STALL_THRESHOLD", "0.2"))
+        if sample_interval is None:
+            sample_interval = float(os.getenv("LOOP_WATCHDOG_SAMPLE_INTERVAL", "0.02"))
+        if history is None:
+            history = int(os.getenv("LOOP_STALL_HISTORY", "50"))
+
+        self.interval = interval
+        self.threshold = threshold
+        self.sample_interval = sample_interval
+        self.stalls: "deque[dict]" = deque(maxlen=history)
+
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stall_count = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._beat = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # 샘플러 스레드와 하트비트가 공유하는 진행 중인 멈춤 (멈춤 동안에만 잠금 사용)
+        self._current: Optional[_Stall] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self):
+        """감시 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._sampler, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"이벤트 루프 감시 시작 (threshold={self.threshold * 1000:.0f}ms)")
+
+    async def stop(self):
+        """감시 종료"""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._thread = None
+
+    async def _heartbeat(self):
+        """interval마다 깨어나 지연 시간 측정 (루프 스레드)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._beat = time.monotonic()
+
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            LOOP_LAG_SECONDS.observe(lag)
+
+            if lag >= self.threshold or self._current is not None:
+                self._finish_stall(lag)
+
+    def _finish_stall(self, lag: float):
+        """멈춤 확정 및 기록 (루프 스레드)"""
+        with self._lock:
+            stall, self._current = self._current, None
+
+        if lag < self.threshold:
+            return  # 샘플러가 경계에서 잡은 짧은 지연
+
+        if stall is None:
+            # 샘플 간격보다 짧아 스택을 찍지 못한 멈춤
+            stall = _Stall(time.time() - lag)
+        stall.duration = lag
+
+        self.stall_count += 1
+        LOOP_STALLS.inc()
+        record = stall.to_dict()
+        self.stalls.append(record)
+
+        top = record["stacks"][0]["frames"][-1] if record["stacks"] else "스택 없음"
+        logger.warning(f"이벤트 루프 멈춤 {lag * 1000:.0f}ms (샘플 {stall.samples}개): {top}")
+
+    def _sampler(self):
+        """하트비트가 끊긴 동안 루프 스레드 스택 수집 (샘플링 스레드)"""
+        while not self._stop.wait(self.sample_interval):
+            silent = time.monotonic() - self._beat
+            if silent < self.interval + self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            stack = self._format_stack(frame)
+            task = self._current_task_name()
+            del frame
+
+            with self._lock:
+                if self._current is None:
+                    self._current = _Stall(time.time() - (silent - self.interval))
+                self._current.add(task, stack)
+
+    @staticmethod
+    def _format_stack(frame) -> Tuple[str, ...]:
+        """바깥 → 안쪽 순서의 'file:line function' 목록"""
+        summary = traceback.extract_stack(frame, limit=MAX_STACK_DEPTH)
+        return tuple(f"{entry.filename}:{entry.lineno} {entry.name}" for entry in summary)
+
+    def _current_task_name(self) -> Optional[str]:
+        """루프에서 실행 중인 태스크 (콜백 실행 중이면 None)"""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return None
+        if task is None:
+            return None
+        coro = task.get_coro()
+        return f"{task.get_name()} ({getattr(coro, '__qualname__', coro)})"
+
+    def snapshot(self, limit: int = None) -> dict:
+        """
+        감시 상태와 최근 멈춤 (최신 순)
+
+        Args:
+            limit: 반환할 멈춤 수
+
+        Returns:
+            설정, 지연 시간 통계, 멈춤 목록
+        """
+        stalls: List[dict] = list(reversed(self.stalls))
+        if limit is not None:
+            stalls = stalls[:limit]
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "threshold": self.threshold,
+            "last_lag": round(self.last_lag, 4),
+            "max_lag": round(self.max_lag, 4),
+            "stall_count": self.stall_count,
+            "stalls": stalls
+        }
+
+    def clear(self):
+        """기록 초기화"""
+        self.stalls.clear()
+        self.max_lag = 0.0
+
+
+# 전역 이벤트 루프 감시기 인스턴스
+loop_watchdog = LoopWatchdog()
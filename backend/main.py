@@ -2,23 +2,41 @@
 iTerminaLlist - 백엔드 FastAPI 서버
 모바일 최적화된 웹 터미널 에뮬레이터
 """
+import asyncio
+import fnmatch
+import hmac
 import logging
+import mimetypes
 import os
-import shutil
+import re
+import time
 from pathlib import Path
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Header, Depends, Query, Response
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Header, Depends, Query, Request, Response, UploadFile, File, Form
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from starlette.background import BackgroundTask
+from json_response import FastJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional
-from starlette.types import Scope, Receive, Send
+from typing import List, Optional, Tuple
+from urllib.parse import quote
 
-from pty_manager import pty_manager
+from pty_manager import pty_manager, WS_SEND_SECONDS
 from sqlite_storage import storage
-from auth_manager import AuthManager
+from auth_manager import AuthManager, PasswordHashBusy, WS_TICKET_TTL, FILE_WATCH_TICKET_SCOPE
+from file_manager import file_manager, FileOperationCancelled
+from file_index import file_index
+from content_search import content_search
+from upload_manager import upload_manager
+from path_validator import path_validator
+from rate_limiter import login_limiter
+from job_manager import job_manager, JobOperation, JOB_OPERATIONS
+from archive_stream import iter_directory_archive, ARCHIVE_FORMATS
+from session_exporter import iter_asciicast, iter_asciicast_archive
+from static_assets import static_assets
+from compression import CompressionMiddleware, compression_stats, disable_compression
+from metrics import metrics, MetricsMiddleware, install_default_executor
+from loop_watchdog import loop_watchdog
+from profiler import cpu_profiler, allocation_tracker, process_memory
 
 # 로깅 설정
 logging.basicConfig(
@@ -31,7 +49,9 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Terminal List",
     description="영속적 세션 지원 웹 터미널 에뮬레이터",
-    version="1.0.0"
+    version="1.0.0",
+    # 모든 JSON 응답을 orjson으로 직렬화 (없으면 표준 json)
+    default_response_class=FastJSONResponse
 )
 
 # CORS 설정 (프론트엔드 통신 허용)
@@ -43,27 +63,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Gzip 압축 미들웨어 (성능 향상)
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# 응답 압축 미들웨어 (스트리밍/이미 압축된 응답 제외, 작은 JSON은 빠른 수준)
+app.add_middleware(CompressionMiddleware)
 
-
-# 캐시 헤더를 추가하는 커스텀 StaticFiles
-class CachedStaticFiles(StaticFiles):
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        # 응답 헤더에 캐시 추가
-        async def send_wrapper(message):
-            if message['type'] == 'http.response.start':
-                headers = dict(message.get('headers', []))
-                # JS, CSS 파일은 1년 캐시 (immutable)
-                if scope['path'].endswith(('.js', '.css')):
-                    headers[b'cache-control'] = b'public, max-age=31536000, immutable'
-                # 기타 정적 파일은 1시간 캐시
-                else:
-                    headers[b'cache-control'] = b'public, max-age=3600'
-                message['headers'] = list(headers.items())
-            await send(message)
-
-        await super().__call__(scope, receive, send_wrapper)
+# 요청 지연 시간 메트릭 (가장 바깥에서 압축까지 포함해 측정)
+app.add_middleware(MetricsMiddleware)
 
 
 # Pydantic 모델
@@ -95,6 +99,43 @@ class FileWriteRequest(BaseModel):
     """파일 쓰기 요청"""
     path: str
     content: str
+    expected_etag: Optional[str] = None  # 읽을 때 받은 ETag (다르면 412)
+
+
+class FilePatchEdit(BaseModel):
+    """부분 수정 단위 (기준 버전의 UTF-8 바이트 오프셋 기준)"""
+    offset: int
+    delete: int = 0
+    insert: str = ""
+
+
+class FilePatchRequest(BaseModel):
+    """파일 부분 수정 요청"""
+    path: str
+    base_sha256: str  # 읽을 때 받은 sha256
+    edits: List[FilePatchEdit]
+    expected_sha256: Optional[str] = None  # 적용 결과 검증용 (선택)
+
+
+class UploadCreateRequest(BaseModel):
+    """분할 업로드 시작 요청"""
+    path: str
+    size: int
+    expected_etag: Optional[str] = None
+    overwrite: bool = True
+
+
+class BatchOperation(BaseModel):
+    """일괄 작업 항목"""
+    op: str  # delete, move, copy
+    path: str
+    dest: Optional[str] = None  # move/copy 대상 폴더
+    name: Optional[str] = None  # move/copy 후 이름 (생략 시 원래 이름, 이름 변경에 사용)
+
+
+class BatchRequest(BaseModel):
+    """파일 일괄 작업 요청"""
+    operations: List[BatchOperation]
 
 
 class FileCreateRequest(BaseModel):
@@ -108,19 +149,91 @@ class SessionNameRequest(BaseModel):
     name: str
 
 
-# Workspace 루트 디렉토리
-WORKSPACE_ROOT = os.getenv("WORKSPACE_ROOT", "/workspace")
+# 스토리지 유지보수 설정 (보관 기간, 세션별 최대 청크 수, 실행 주기)
+HISTORY_RETENTION_HOURS = int(os.getenv("HISTORY_RETENTION_HOURS", "168"))
+HISTORY_MAX_CHUNKS = int(os.getenv("HISTORY_MAX_CHUNKS", "10000"))
+MAINTENANCE_INTERVAL = int(os.getenv("MAINTENANCE_INTERVAL", "600"))
+
+# 로그인 제한 상태를 system_config에 저장할지 여부
+LOGIN_RATE_PERSIST = os.getenv("LOGIN_RATE_PERSIST", "true").lower() == "true"
+
+# 리버스 프록시 뒤에서 X-Forwarded-For의 클라이언트 IP 사용 (프록시가 헤더를 덮어쓰는 경우에만)
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+
+# 시작 시 참조되지 않는 오래된 프론트엔드 번들 삭제
+STATIC_PRUNE = os.getenv("STATIC_PRUNE", "true").lower() == "true"
+
+# 이벤트 루프 멈춤 감시 (하트비트 + 멈춤 시 스택 샘플링)
+LOOP_WATCHDOG = os.getenv("LOOP_WATCHDOG", "true").lower() == "true"
+
+# /api/metrics 스크레이프용 고정 토큰 (설정 시 로그인 토큰 대신 사용 가능)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+WS_CONNECTIONS = metrics.counter(
+    "websocket_connections_total", "Terminal WebSocket connection attempts", ("result",)
+)
+
+# 히스토리 페이지 크기 (청크 수)
+HISTORY_PAGE_SIZE = int(os.getenv("HISTORY_PAGE_SIZE", "500"))
+HISTORY_PAGE_MAX = 5000
 
 # 인증 매니저 인스턴스
 auth_manager: Optional[AuthManager] = None
 
+# 유지보수 백그라운드 태스크
+maintenance_task: Optional[asyncio.Task] = None
+
+
+async def run_storage_maintenance(vacuum: bool = False) -> dict:
+    """
+    보관 정책 적용 (실행 중/연결 중인 세션은 제외)
+
+    Args:
+        vacuum: 기존 DB를 incremental auto_vacuum으로 변환 (전체 VACUUM, 수동 실행 전용)
+    """
+    live_sessions = list(pty_manager.sessions.keys())
+    attached_sessions = [
+        sid for sid, session in pty_manager.sessions.items()
+        if session.connected_socket is not None
+    ]
+    report = await storage.run_maintenance(
+        retention_hours=HISTORY_RETENTION_HOURS,
+        max_chunks=HISTORY_MAX_CHUNKS,
+        live_sessions=live_sessions,
+        attached_sessions=attached_sessions,
+        vacuum=vacuum
+    )
+    logger.info(
+        f"스토리지 유지보수 완료: 만료 {report['expired_chunks']}청크, "
+        f"초과 {report['trimmed_chunks']}청크, 세션 {report['deleted_sessions']}개 삭제, "
+        f"{report['bytes_reclaimed']}바이트 반환 ({report['duration_ms']}ms)"
+    )
+    return report
+
+
+async def maintenance_loop():
+    """주기적 스토리지 유지보수 루프"""
+    while True:
+        await asyncio.sleep(MAINTENANCE_INTERVAL)
+        try:
+            await run_storage_maintenance()
+        except Exception as e:
+            logger.error(f"스토리지 유지보수 실패: {e}")
+
 
 # 시작/종료 이벤트
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 초기화"""
-    global auth_manager
+    global auth_manager, maintenance_task
     logger.info("=== iTerminaLlist 서버 시작 ===")
+
+    # asyncio.to_thread 기본 풀을 계측 풀로 교체 (대기/실행 시간, 포화 상태)
+    install_default_executor(asyncio.get_running_loop())
+
+    if LOOP_WATCHDOG:
+        loop_watchdog.start()
+
     try:
         await storage.connect()
         logger.info("SQLite 스토리지 초기화 완료")
@@ -131,6 +244,23 @@ async def startup_event():
         # 인증 매니저 초기화
         auth_manager = AuthManager(storage)
         logger.info("인증 매니저 초기화 완료")
+
+        # 로그인 실패/잠금 상태 복원 (재시작 후에도 잠금 유지)
+        if LOGIN_RATE_PERSIST:
+            await login_limiter.load(storage)
+
+        # 스토리지 유지보수 스케줄러 시작
+        maintenance_task = asyncio.create_task(maintenance_loop())
+
+        # 디렉토리 감시 시작 (목록 캐시 무효화 및 변경 알림)
+        file_manager.start()
+
+        # 파일 검색 인덱스 백그라운드 구축
+        file_index.start()
+
+        # 이전 빌드에서 남은 번들 정리 (index.html에서 참조하지 않는 해시 파일)
+        if STATIC_PRUNE:
+            await asyncio.to_thread(static_assets.prune)
     except Exception as e:
         logger.error(f"스토리지 초기화 실패: {e}")
         raise
@@ -140,7 +270,19 @@ async def startup_event():
 async def shutdown_event():
     """서버 종료 시 정리"""
     logger.info("=== iTerminaLlist 서버 종료 ===")
+    await loop_watchdog.stop()
+    cpu_profiler.stop()
+    if maintenance_task:
+        maintenance_task.cancel()
+    if LOGIN_RATE_PERSIST:
+        await login_limiter.save()
     await storage.close()
+    await file_index.stop()
+    await job_manager.shutdown()
+    if auth_manager:
+        auth_manager.close()
+    file_manager.shutdown()
+    content_search.shutdown()
 
 
 # 인증 의존성
@@ -158,16 +300,6 @@ async def verify_auth_token(authorization: Optional[str] = Header(None)) -> str:
     return username
 
 
-async def verify_auth_token_ws(token: str) -> str:
-    """WebSocket용 JWT 토큰 검증"""
-    username = await auth_manager.verify_token(token)
-
-    if username is None:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
-
-    return username
-
-
 # 헬스 체크
 @app.get("/api/health")
 async def health_check():
@@ -221,7 +353,10 @@ async def setup_admin(request: SetupRequest):
         raise HTTPException(status_code=400, detail="비밀번호는 8자 이상이어야 합니다")
 
     # 관리자 생성
-    success = await auth_manager.create_admin(request.username, request.password)
+    try:
+        success = await auth_manager.create_admin(request.username, request.password)
+    except PasswordHashBusy:
+        raise HTTPException(status_code=503, detail="요청이 많습니다. 잠시 후 다시 시도해주세요", headers={"Retry-After": "1"})
 
     if not success:
         raise HTTPException(status_code=500, detail="관리자 계정 생성에 실패했습니다")
@@ -234,11 +369,23 @@ async def setup_admin(request: SetupRequest):
     }
 
 
+def get_client_ip(request: Request) -> str:
+    """요청 클라이언트 IP (TRUST_PROXY_HEADERS 설정 시 X-Forwarded-For의 첫 번째 주소)"""
+    if TRUST_PROXY_HEADERS:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
 @app.post("/api/auth/login")
-async def login(request: LoginRequest):
+async def login(request: LoginRequest, http_request: Request):
     """
     로그인
 
+    IP/사용자명별 요청 제한을 비밀번호 검증 전에 확인하므로
+    거부된 요청은 bcrypt 비용 없이 429로 응답
+
     Args:
         request: 로그인 정보 (username, password)
 
@@ -248,17 +395,33 @@ async def login(request: LoginRequest):
     if auth_manager is None:
         raise HTTPException(status_code=500, detail="인증 시스템이 초기화되지 않았습니다")
 
+    client_ip = get_client_ip(http_request)
+    retry_after = login_limiter.check(client_ip, request.username)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=429,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(retry_after)}
+        )
+
     # 초기 설정이 완료되지 않은 경우
     if not await auth_manager.is_setup_complete():
         raise HTTPException(status_code=400, detail="초기 설정을 먼저 완료해주세요")
 
-    # 사용자 인증
-    is_valid = await auth_manager.verify_admin(request.username, request.password)
+    # 사용자 인증 (bcrypt는 전용 스레드 풀에서 실행, 대기열이 가득 차면 503)
+    try:
+        is_valid = await auth_manager.verify_admin(request.username, request.password)
+    except PasswordHashBusy:
+        logger.warning(f"로그인 요청 과다, 거부: {request.username}")
+        raise HTTPException(status_code=503, detail="요청이 많습니다. 잠시 후 다시 시도해주세요", headers={"Retry-After": "1"})
 
     if not is_valid:
-        logger.warning(f"로그인 실패: {request.username}")
+        login_limiter.record_failure(client_ip, request.username)
+        logger.warning(f"로그인 실패: {request.username} ({client_ip})")
         raise HTTPException(status_code=401, detail="사용자명 또는 비밀번호가 올바르지 않습니다")
 
+    login_limiter.record_success(client_ip, request.username)
+
     # JWT 토큰 생성
     access_token = await auth_manager.create_access_token(request.username)
 
@@ -285,31 +448,49 @@ async def verify_token(username: str = Depends(verify_auth_token)):
     }
 
 
+async def send_history(websocket: WebSocket, session_id: str, chunks: List[str]):
+    """히스토리 청크를 하나의 텍스트 메시지로 전송 (비어 있으면 무시)"""
+    if not chunks:
+        return
+    logger.info(f"히스토리 복원: {session_id} ({len(chunks)} 청크)")
+    start = time.perf_counter()
+    await websocket.send_text("".join(chunks))
+    WS_SEND_SECONDS.observe(time.perf_counter() - start)
+
+
 # WebSocket: 터미널 세션
 @app.websocket("/ws/{session_id}")
 async def terminal_websocket(
     websocket: WebSocket,
     session_id: str,
-    token: Optional[str] = Query(None),
+    ticket: Optional[str] = Query(None),
     cols: int = Query(80),
-    rows: int = Query(24)
+    rows: int = Query(24),
+    after: Optional[int] = Query(None, ge=0)
 ):
     """
     터미널 WebSocket 연결 핸들러
 
+    POST /api/sessions/{session_id}/ticket으로 받은 일회용 티켓이 필요하며,
+    티켓이 없거나 유효하지 않으면 accept 전에 거부 (1008)
+
+    연결 시 전체 히스토리 대신 최신 페이지(HISTORY_PAGE_SIZE 청크)만 전송.
+    클라이언트가 GET /api/sessions/{session_id}/history로 최신 페이지를 먼저 받았다면
+    after=end_seq로 연결해 그 이후 청크만 받고, 이전 스크롤백은 prev_cursor로 필요할 때 조회
+
     프로토콜:
     - 클라이언트 → 서버: 사용자 입력 (텍스트)
     - 서버 → 클라이언트: 터미널 출력 (텍스트)
     """
-    # 인증 확인 (optional)
-    username = "admin"  # 기본 사용자
-    if token:
-        try:
-            username = await verify_auth_token_ws(token)
-        except:
-            pass  # 토큰 실패해도 기본 사용자로 진행
+    username = auth_manager.consume_ws_ticket(ticket, session_id) if auth_manager and ticket else None
+    if username is None:
+        WS_CONNECTIONS.labels("rejected").inc()
+        logger.warning(f"WebSocket 연결 거부 (유효하지 않은 티켓): {session_id}")
+        await websocket.close(code=1008)
+        return
 
     await websocket.accept()
+    WS_CONNECTIONS.labels("accepted").inc()
     logger.info(f"WebSocket 연결 요청: {session_id} (사용자: {username})")
 
     try:
@@ -323,11 +504,18 @@ async def terminal_websocket(
             await storage.update_session_activity(session_id)
 
         # 2. SQLite 히스토리 전송 (재접속 시 이전 상태 복원)
-        history = await storage.get_history(session_id)
-        if history:
-            logger.info(f"히스토리 복원: {session_id} ({len(history)} 청크)")
-            full_history = "".join(history)
-            await websocket.send_text(full_history)
+        if after is None:
+            page = await storage.get_history_page(session_id, limit=HISTORY_PAGE_SIZE)
+            await send_history(websocket, session_id, [chunk for _, chunk in page["chunks"]])
+        else:
+            # 클라이언트가 받은 페이지 이후 청크 (배치 단위로 전송)
+            batch = []
+            async for _, chunk, _ in storage.iter_history(session_id, after=after):
+                batch.append(chunk)
+                if len(batch) >= HISTORY_PAGE_SIZE:
+                    await send_history(websocket, session_id, batch)
+                    batch = []
+            await send_history(websocket, session_id, batch)
 
         # 3. WebSocket을 세션에 연결
         await pty_manager.attach_session(session_id, websocket)
@@ -340,6 +528,9 @@ async def terminal_websocket(
             # PTY에 입력 전송
             await pty_manager.write_input(session_id, data)
 
+            # 활동 시간 갱신 (메모리만, DB에는 주기적으로 일괄 기록)
+            storage.touch_session(session_id)
+
     except WebSocketDisconnect:
         # 클라이언트 연결 종료 (프로세스는 유지)
         logger.info(f"WebSocket 연결 해제: {session_id} (세션 유지)")
@@ -351,16 +542,30 @@ async def terminal_websocket(
 
 
 # REST API: 세션 관리
-@app.get("/api/sessions", response_model=List[dict])
+@app.get("/api/sessions")
 async def list_sessions(username: str = Depends(verify_auth_token)):
     """
-    사용자의 세션 목록 조회 (DB에서)
+    사용자의 세션 목록 조회 (메타데이터 캐시에서)
+
+    이미 JSON으로 바로 직렬화 가능한 dict 목록이므로 응답을 직접 만들어
+    jsonable_encoder 변환과 응답 모델 검증을 생략
 
     Returns:
         세션 정보 리스트
     """
     sessions = await storage.get_user_sessions(username)
-    return sessions
+    return FastJSONResponse(content=sessions)
+
+
+@app.get("/api/sessions/usage")
+async def get_sessions_usage(username: str = Depends(verify_auth_token)):
+    """
+    사용자의 히스토리 저장 사용량 및 할당량 조회
+
+    Returns:
+        사용 바이트, 세션 수, 할당량 및 초과 정책
+    """
+    return await storage.get_user_usage(username)
 
 
 @app.post("/api/sessions/{session_id}")
@@ -422,6 +627,27 @@ async def delete_session(session_id: str, username: str = Depends(verify_auth_to
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/sessions/{session_id}/ticket")
+async def issue_session_ticket(session_id: str, username: str = Depends(verify_auth_token)):
+    """
+    터미널 WebSocket 연결용 일회용 티켓 발급
+
+    재연결할 때마다 새 티켓을 받아 /ws/{session_id}?ticket=...으로 연결
+
+    Args:
+        session_id: 연결할 세션 ID (티켓은 이 세션에만 사용 가능)
+
+    Returns:
+        ticket, expires_in (초)
+    """
+    session = await storage.get_session(session_id)
+    if session is not None and session.get("username") != username:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+
+    ticket = auth_manager.issue_ws_ticket(username, session_id)
+    return {"ticket": ticket, "expires_in": int(WS_TICKET_TTL)}
+
+
 @app.post("/api/sessions/{session_id}/resize")
 async def resize_terminal(
     session_id: str,
@@ -483,28 +709,486 @@ async def update_session_name(
 
 
 @app.get("/api/sessions/{session_id}/history")
-async def get_session_history(session_id: str, username: str = Depends(verify_auth_token)):
+async def get_session_history(
+    session_id: str,
+    before: Optional[int] = Query(None, ge=1),
+    after: Optional[int] = Query(None, ge=0),
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_PAGE_MAX),
+    username: str = Depends(verify_auth_token)
+):
     """
-    세션 히스토리 조회
+    세션 히스토리 조회 (시퀀스 번호 커서 기반 페이지네이션)
+
+    커서를 지정하지 않으면 최신 페이지를 반환합니다.
+    스크롤백을 더 불러올 때는 prev_cursor를 before로 전달합니다.
 
     Args:
         session_id: 세션 ID
+        before: 이 시퀀스 번호 이전의 청크 조회
+        after: 이 시퀀스 번호 이후의 청크 조회
+        limit: 최대 청크 수
 
     Returns:
-        히스토리 텍스트
+        히스토리 텍스트 및 커서 정보
     """
-    history = await storage.get_history(session_id)
+    if before is not None and after is not None:
+        raise HTTPException(status_code=400, detail="before와 after는 함께 사용할 수 없습니다")
+
+    session = await storage.get_session(session_id)
+    if session is None or session.get("username") != username:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+
+    page = await storage.get_history_page(session_id, before=before, after=after, limit=limit)
+    chunks = page["chunks"]
+
     return {
         "session_id": session_id,
-        "history": "".join(history),
-        "chunks": len(history)
+        "history": "".join(chunk for _, chunk in chunks),
+        "chunks": len(chunks),
+        "start_seq": chunks[0][0] if chunks else None,
+        "end_seq": chunks[-1][0] if chunks else None,
+        "prev_cursor": chunks[0][0] if chunks and page["has_more_before"] else None,
+        "next_cursor": chunks[-1][0] if chunks else after,
+        "has_more_before": page["has_more_before"],
+        "has_more_after": page["has_more_after"]
+    }
+
+
+def parse_range_header(range_header: Optional[str], total: int) -> Optional[Tuple[int, int]]:
+    """
+    HTTP Range 헤더 파싱 (단일 바이트 범위만 지원)
+
+    Args:
+        range_header: Range 헤더 값 (예: "bytes=0-1023", "bytes=-500")
+        total: 전체 크기 (바이트)
+
+    Returns:
+        (start, end) 포함 범위 또는 헤더가 없으면 None
+
+    Raises:
+        HTTPException: 만족할 수 없는 범위인 경우 (416)
+    """
+    if not range_header:
+        return None
+
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_str, _, end_str = spec.strip().partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else total - 1
+        else:
+            # suffix range: 마지막 N 바이트
+            suffix = int(end_str)
+            start = max(total - suffix, 0)
+            end = total - 1
+    except ValueError:
+        return None
+
+    end = min(end, total - 1)
+    if start > end or start >= total:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{total}"}
+        )
+
+    return start, end
+
+
+@app.get("/api/sessions/{session_id}/history/raw")
+async def get_session_history_raw(
+    session_id: str,
+    request: Request,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    세션 히스토리 원본 바이트 스트리밍 (HTTP Range 지원)
+
+    바이트 오프셋은 현재 보관 중인 히스토리의 시작 기준입니다.
+
+    Args:
+        session_id: 세션 ID
+        range_header: HTTP Range 헤더
+
+    Returns:
+        application/octet-stream 스트리밍 응답
+    """
+    session = await storage.get_session(session_id)
+    if session is None or session.get("username") != username:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+
+    # 크기 계산부터 본문 전송까지 같은 스냅샷에서 읽어 Content-Length/Content-Range가 어긋나지 않게 함
+    snapshot = await storage.open_history_snapshot(session_id)
+    total = snapshot.size
+    try:
+        byte_range = parse_range_header(range_header, total)
+    except HTTPException:
+        await snapshot.close()
+        raise
+    start, end = byte_range if byte_range else (0, total - 1)
+
+    # 바이트 범위가 어긋나지 않도록 압축하지 않음
+    disable_compression(request)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(end - start + 1 if total else 0)
+    }
+    status_code = 200
+    if byte_range:
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+
+    async def stream_history():
+        try:
+            async for data in snapshot.iter_bytes(start, end):
+                yield data
+        finally:
+            await snapshot.close()
+
+    return StreamingResponse(
+        stream_history(),
+        status_code=status_code,
+        media_type="application/octet-stream",
+        headers=headers,
+        # 본문을 시작하기 전에 연결이 끊긴 경우에도 스냅샷을 닫음
+        background=BackgroundTask(snapshot.close)
+    )
+
+
+def _session_size(session_id: str) -> Tuple[int, int]:
+    """실행 중인 세션의 터미널 크기 (없으면 기본값)"""
+    session = pty_manager.sessions.get(session_id)
+    if session:
+        return session.cols, session.rows
+    return 80, 24
+
+
+@app.get("/api/sessions/export")
+async def export_sessions_archive(
+    session_id: Optional[List[str]] = Query(None),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    여러 세션 녹화를 ZIP 아카이브로 스트리밍 내보내기
+
+    Args:
+        session_id: 내보낼 세션 ID 목록 (생략 시 사용자의 전체 세션)
+
+    Returns:
+        .cast 파일들을 담은 ZIP 스트리밍 응답
+    """
+    sessions = await storage.get_user_sessions(username)
+    if session_id:
+        wanted = set(session_id)
+        sessions = [s for s in sessions if s["id"] in wanted]
+
+    if not sessions:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+
+    sizes = {s["id"]: _session_size(s["id"]) for s in sessions}
+
+    return StreamingResponse(
+        iter_asciicast_archive(storage, sessions, sizes),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="sessions.zip"'}
+    )
+
+
+@app.get("/api/sessions/{session_id}/export")
+async def export_session(session_id: str, username: str = Depends(verify_auth_token)):
+    """
+    세션 녹화를 asciicast v2 형식으로 스트리밍 내보내기
+
+    Args:
+        session_id: 세션 ID
+
+    Returns:
+        asciicast v2 (.cast) 스트리밍 응답
+    """
+    session = await storage.get_session(session_id)
+    if session is None or session.get("username") != username:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+
+    width, height = _session_size(session_id)
+
+    return StreamingResponse(
+        iter_asciicast(storage, session_id, width, height, session["name"]),
+        media_type="application/x-asciicast",
+        headers={"Content-Disposition": f'attachment; filename="{session_id}.cast"'}
+    )
+
+
+# REST API: 스토리지 관리
+@app.get("/api/storage/maintenance")
+async def get_maintenance_status(username: str = Depends(verify_auth_token)):
+    """
+    마지막 스토리지 유지보수 결과 조회
+
+    Returns:
+        유지보수 리포트 및 설정
+    """
+    return {
+        "last_run": storage.last_maintenance,
+        "retention_hours": HISTORY_RETENTION_HOURS,
+        "max_chunks": HISTORY_MAX_CHUNKS,
+        "interval": MAINTENANCE_INTERVAL,
+        "incremental_vacuum": storage.incremental_vacuum
+    }
+
+
+@app.post("/api/storage/maintenance")
+async def trigger_maintenance(
+    vacuum: bool = Query(False),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    스토리지 유지보수 즉시 실행
+
+    Args:
+        vacuum: 기존 DB를 incremental auto_vacuum으로 변환 (전체 VACUUM 동안 쓰기가 막힘)
+
+    Returns:
+        유지보수 리포트
+    """
+    try:
+        return await run_storage_maintenance(vacuum)
+    except Exception as e:
+        logger.error(f"스토리지 유지보수 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# REST API: 서버 통계
+@app.get("/api/stats/compression")
+async def get_compression_stats(reset: bool = Query(False), username: str = Depends(verify_auth_token)):
+    """
+    라우트별 응답 압축 통계 (압축 CPU 시간 대비 절약한 바이트)
+
+    Args:
+        reset: True면 조회 후 통계 초기화
+
+    Returns:
+        전체 합계와 라우트별 통계
+    """
+    snapshot = compression_stats.snapshot()
+    if reset:
+        compression_stats.reset()
+    return snapshot
+
+
+async def verify_metrics_access(authorization: Optional[str] = Header(None)) -> str:
+    """메트릭 접근 검증 (METRICS_TOKEN 또는 로그인 토큰)"""
+    if METRICS_TOKEN and authorization and hmac.compare_digest(authorization, f"Bearer {METRICS_TOKEN}"):
+        return "metrics"
+    return await verify_auth_token(authorization)
+
+
+@metrics.collector
+def _collect_service_stats():
+    """각 모듈이 이미 집계하고 있는 캐시/제한 통계"""
+    if auth_manager is not None:
+        hash_stats = auth_manager.hash_stats()
+        yield "auth_password_hash_pending", "gauge", "Password hashes queued or running", [({}, hash_stats["pending"])]
+        yield "auth_password_hash_rejected_total", "counter", "Password hashes rejected (pool full)", [({}, hash_stats["rejected"])]
+        yield "auth_token_cache_total", "counter", "Verified token cache lookups", [
+            ({"result": "hit"}, auth_manager.token_cache_hits),
+            ({"result": "miss"}, auth_manager.token_cache_misses)
+        ]
+
+    limiter = login_limiter.stats()
+    yield "login_rate_limited_total", "counter", "Login attempts rejected by the rate limiter", [({}, limiter["rejected"])]
+    yield "login_locked_keys", "gauge", "IPs/usernames currently locked out", [({}, limiter["locked"])]
+
+    yield "file_list_cache_total", "counter", "Directory listing cache lookups", [
+        ({"result": "hit"}, file_manager.list_cache_hits), ({"result": "miss"}, file_manager.list_cache_misses)
+    ]
+
+    assets = static_assets.stats()
+    yield "static_cache_total", "counter", "Static asset body cache lookups", [
+        ({"result": "hit"}, assets["hits"]), ({"result": "miss"}, assets["misses"])
+    ]
+    yield "static_cache_bytes", "gauge", "Static asset bytes held in memory", [({}, assets["cached_bytes"])]
+
+    compression = compression_stats.snapshot()["total"]
+    yield "http_compression_bytes_total", "counter", "Response bytes before/after compression", [
+        ({"stage": "in"}, compression["bytes_in"]), ({"stage": "out"}, compression["bytes_out"])
+    ]
+    yield "http_compression_cpu_seconds_total", "counter", "CPU time spent compressing responses", [
+        ({}, compression["cpu_ms"] / 1000)
+    ]
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def get_metrics(access: str = Depends(verify_metrics_access)):
+    """
+    Prometheus 텍스트 형식 메트릭
+
+    Returns:
+        카운터/게이지/히스토그램 (text/plain; version=0.0.4)
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+# REST API: 관리 (이벤트 루프 멈춤 진단)
+@app.get("/api/admin/stalls")
+async def get_loop_stalls(
+    limit: int = Query(20, ge=1, le=1000),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    최근 이벤트 루프 멈춤과 멈춘 동안 수집한 스택
+
+    Args:
+        limit: 반환할 멈춤 수 (최신 순)
+
+    Returns:
+        감시 설정, 지연 시간 통계, 멈춤 목록
+    """
+    return loop_watchdog.snapshot(limit)
+
+
+@app.delete("/api/admin/stalls")
+async def clear_loop_stalls(username: str = Depends(verify_auth_token)):
+    """멈춤 기록 초기화"""
+    loop_watchdog.clear()
+    return {"status": "cleared"}
+
+
+# REST API: 관리 (프로파일링)
+def _cpu_profile_response() -> PlainTextResponse:
+    """CPU 프로파일 collapsed stack 응답 (상태는 헤더로)"""
+    status = cpu_profiler.status()
+    return PlainTextResponse(cpu_profiler.collapsed(), headers={
+        "X-Profile-Running": str(status["running"]).lower(),
+        "X-Profile-Mode": status["mode"],
+        "X-Profile-Samples": str(status["samples"])
+    })
+
+
+@app.post("/api/admin/profile/cpu")
+async def start_cpu_profile(
+    seconds: float = Query(10, gt=0, le=300),
+    mode: str = Query("cpu"),
+    wait: bool = Query(False),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    샘플링 CPU 프로파일링 시작 (seconds 후 자동 종료)
+
+    Args:
+        seconds: 프로파일링 시간
+        mode: cpu (유휴 스레드 제외) 또는 wall (모든 스레드)
+        wait: True면 끝날 때까지 기다렸다가 결과 반환
+
+    Returns:
+        wait=True면 collapsed stack (flamegraph.pl/speedscope 입력 형식), 아니면 상태
+    """
+    cpu_profiler.start(seconds, mode)
+    logger.info(f"CPU 프로파일링 요청: {username} ({seconds}초, {mode})")
+    if not wait:
+        return cpu_profiler.status()
+
+    await cpu_profiler.wait()
+    return _cpu_profile_response()
+
+
+@app.delete("/api/admin/profile/cpu")
+async def stop_cpu_profile(username: str = Depends(verify_auth_token)):
+    """CPU 프로파일링 조기 종료 후 결과 반환"""
+    cpu_profiler.stop()
+    return _cpu_profile_response()
+
+
+@app.get("/api/admin/profile/cpu")
+async def get_cpu_profile(username: str = Depends(verify_auth_token)):
+    """
+    마지막(또는 진행 중인) CPU 프로파일
+
+    Returns:
+        collapsed stack 텍스트 ("frame;frame;frame count" 줄 목록)
+    """
+    return _cpu_profile_response()
+
+
+@app.post("/api/admin/profile/memory")
+async def start_allocation_tracking(username: str = Depends(verify_auth_token)):
+    """tracemalloc 추적 시작 및 기준 스냅샷 (이미 추적 중이면 기준만 다시 찍음)"""
+    await asyncio.to_thread(allocation_tracker.start)
+    logger.info(f"메모리 할당 추적 요청: {username}")
+    return {
+        "tracing": allocation_tracker.running,
+        "frames": allocation_tracker.frames,
+        "baseline_at": allocation_tracker.baseline_at
+    }
+
+
+@app.get("/api/admin/profile/memory")
+async def get_allocation_diff(
+    limit: int = Query(50, ge=1, le=1000),
+    format: str = Query("json"),
+    rebase: bool = Query(False),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    기준 스냅샷 대비 할당 변화
+
+    Args:
+        limit: 반환할 스택 수 (증가량 순)
+        format: json 또는 collapsed (늘어난 바이트 기준 flamegraph 입력)
+        rebase: 현재 스냅샷을 새 기준으로
+
+    Returns:
+        스택별 size/count 변화 또는 collapsed stack 텍스트
+    """
+    if format not in ("json", "collapsed"):
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+
+    stats, summary = await asyncio.to_thread(allocation_tracker.diff, limit, rebase)
+    if format == "collapsed":
+        return PlainTextResponse(allocation_tracker.collapsed(stats))
+    return {
+        **summary,
+        "stats": [allocation_tracker.to_dict(stat) for stat in stats]
+    }
+
+
+@app.delete("/api/admin/profile/memory")
+async def stop_allocation_tracking(username: str = Depends(verify_auth_token)):
+    """tracemalloc 추적 종료"""
+    allocation_tracker.stop()
+    return {"status": "stopped"}
+
+
+@app.get("/api/admin/profile/sessions")
+async def get_session_memory(username: str = Depends(verify_auth_token)):
+    """
+    세션별 메모리 사용 추정
+
+    Returns:
+        프로세스 메모리와 세션별 히스토리(SQLite 저장분), 대기 중인 출력 태스크, WebSocket 송신 버퍼
+    """
+    sessions = pty_manager.memory_usage()
+    for session in sessions:
+        usage = storage.get_usage(session["session_id"])
+        session["history_bytes"] = usage["bytes"]
+        session["history_chunks"] = usage["chunks"]
+
+    sessions.sort(key=lambda s: (s["pending_bytes"] + (s["socket_buffer_bytes"] or 0), s["history_bytes"]), reverse=True)
+    return {
+        "process": process_memory(),
+        "tasks": len(asyncio.all_tasks()),
+        "sessions": sessions
     }
 
 
 # 파일 시스템 헬퍼 함수
 def validate_path(path: str) -> Path:
     """
-    경로 검증 및 정규화
+    경로 검증 및 정규화 (path_validator 사용)
 
     Args:
         path: 상대 경로
@@ -515,27 +1199,20 @@ def validate_path(path: str) -> Path:
     Raises:
         HTTPException: workspace 외부 접근 시
     """
-    # 빈 경로는 루트로 처리
-    if not path:
-        path = ""
-
-    # 절대 경로 생성
-    abs_path = Path(WORKSPACE_ROOT) / path
-    abs_path = abs_path.resolve()
-
-    # workspace 외부 접근 차단
-    workspace_resolved = Path(WORKSPACE_ROOT).resolve()
-    if not str(abs_path).startswith(str(workspace_resolved)):
-        logger.warning(f"Path traversal attempt: {path}")
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    return abs_path
+    return path_validator.validate(path)
 
 
 # 파일 시스템 API
+# 블로킹 파일 I/O는 모두 file_manager의 전용 스레드 풀에서 실행
 @app.get("/api/files")
 async def list_files(
+    request: Request,
     path: str = Query(""),
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    cursor: Optional[str] = Query(None),
+    pattern: Optional[str] = Query(None),
+    prefix: Optional[str] = Query(None),
+    details: bool = Query(True),
     username: str = Depends(verify_auth_token)
 ):
     """
@@ -543,50 +1220,202 @@ async def list_files(
 
     Args:
         path: 디렉토리 경로 (루트 기준 상대 경로)
+        limit: 페이지 크기 (생략 시 전체)
+        cursor: 다음 페이지 커서 (이전 응답의 next_cursor)
+        pattern: 이름 glob 필터
+        prefix: 이름 접두사 필터
+        details: False면 size/modified 생략
 
     Returns:
-        파일/폴더 목록
+        파일/폴더 목록, 다음 페이지 커서, 필터 적용 후 전체 개수
+        (ETag 포함, If-None-Match가 일치하면 304)
     """
     try:
         safe_path = validate_path(path)
+        result, etag = await file_manager.list_dir_cached(
+            safe_path, limit, cursor, pattern, prefix, details, request=request
+        )
+
+        # 브라우저가 매번 재검증하도록 no-cache (변경 없으면 본문 없이 304)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        return FastJSONResponse(content=result, headers=headers)
+
+    except HTTPException:
+        raise
+    except FileOperationCancelled:
+        raise HTTPException(status_code=499, detail="Client closed request")
+    except Exception as e:
+        logger.error(f"Failed to list directory {path}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/files/search")
+async def search_files(
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(50, ge=1, le=500),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일명 퍼지 검색 (워크스페이스 인덱스 사용)
+
+    Args:
+        q: 검색어 (글자가 순서대로 포함된 경로와 매칭)
+        limit: 최대 결과 수
+
+    Returns:
+        items (name, path, type, score), ready (인덱스 준비 여부), truncated
+    """
+    return file_index.search(q, limit)
+
+
+@app.get("/api/files/grep")
+async def grep_files(
+    q: str = Query(..., min_length=1, max_length=1000),
+    path: str = Query(""),
+    regex: bool = Query(False),
+    case_sensitive: bool = Query(False),
+    glob: Optional[str] = Query(None),
+    max_results: int = Query(1000, ge=1, le=10000),
+    max_per_file: int = Query(100, ge=1, le=1000),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일 내용 검색 (NDJSON 스트리밍)
+
+    .gitignore로 제외된 경로와 바이너리 파일은 건너뛰며,
+    파일 묶음을 프로세스 풀에서 검색하고 찾는 즉시 한 줄씩 전송함
+
+    Args:
+        q: 검색어
+        path: 검색할 디렉토리 또는 파일 (루트 기준 상대 경로)
+        regex: True면 q를 정규식으로 사용
+        case_sensitive: 대소문자 구분
+        glob: 파일명 glob 필터 (예: "*.py")
+        max_results: 최대 매칭 줄 수
+        max_per_file: 파일당 최대 매칭 줄 수
+
+    Returns:
+        {"type": "file", "path", "matches": [{line, column, text}]} 라인들,
+        마지막에 {"type": "done", "files", "searched", "skipped", "matches", "truncated", "timed_out"}
+    """
+    safe_path = validate_path(path)
+
+    try:
+        pattern, flags = content_search.compile_pattern(q, regex, case_sensitive)
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid regex: {e}")
+
+    relative = os.path.relpath(safe_path, file_index.root)
+    if await asyncio.to_thread(safe_path.is_dir):
+        paths = await file_index.list_files("" if relative == "." else relative + "/")
+    elif await asyncio.to_thread(safe_path.is_file):
+        paths = [relative]
+    else:
+        raise HTTPException(status_code=404, detail="Path not found")
+
+    if glob:
+        paths = [p for p in paths if fnmatch.fnmatch(p[p.rfind("/") + 1:], glob)]
+
+    return StreamingResponse(
+        content_search.iter_grep(file_index.root, paths, pattern, flags, max_results, max_per_file),
+        media_type="application/x-ndjson",
+        # 결과를 찾는 즉시 전달되도록 프록시 버퍼링 비활성화 (스트리밍 응답은 압축 미들웨어가 건너뜀)
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
 
-        if not safe_path.exists():
-            raise HTTPException(status_code=404, detail="Path not found")
 
-        if not safe_path.is_dir():
-            raise HTTPException(status_code=400, detail="Not a directory")
+@app.get("/api/files/search/status")
+async def search_index_status(username: str = Depends(verify_auth_token)):
+    """
+    파일 인덱스 상태 조회
+
+    Returns:
+        ready, entries, pending_changes, watching, truncated
+    """
+    return file_index.status()
 
-        items = []
-        workspace_resolved = Path(WORKSPACE_ROOT).resolve()
 
-        for item in safe_path.iterdir():
+@app.post("/api/files/watch/ticket")
+async def issue_file_watch_ticket(username: str = Depends(verify_auth_token)):
+    """
+    디렉토리 변경 알림 WebSocket 연결용 일회용 티켓 발급
+
+    재연결할 때마다 새 티켓을 받아 /api/files/watch?ticket=...으로 연결
+
+    Returns:
+        ticket, expires_in (초)
+    """
+    ticket = auth_manager.issue_ws_ticket(username, FILE_WATCH_TICKET_SCOPE)
+    return {"ticket": ticket, "expires_in": int(WS_TICKET_TTL)}
+
+
+@app.websocket("/api/files/watch")
+async def watch_files(websocket: WebSocket, ticket: Optional[str] = Query(None)):
+    """
+    디렉토리 변경 알림 WebSocket
+
+    POST /api/files/watch/ticket으로 받은 일회용 티켓이 필요하며,
+    티켓이 없거나 유효하지 않으면 accept 전에 거부 (1008)
+
+    프로토콜:
+    - 클라이언트 → 서버: {"action": "watch" | "unwatch", "path": "상대 경로"}
+    - 서버 → 클라이언트: {"type": "changed", "path": "상대 경로"}
+    """
+    username = auth_manager.consume_ws_ticket(ticket, FILE_WATCH_TICKET_SCOPE) if auth_manager and ticket else None
+    if username is None:
+        WS_CONNECTIONS.labels("rejected").inc()
+        logger.warning("파일 변경 알림 연결 거부 (유효하지 않은 티켓)")
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    subscription = file_manager.watcher.subscribe()
+    logger.info(f"파일 변경 알림 연결: {username}")
+
+    async def forward_changes():
+        while True:
+            changed = await subscription.queue.get()
+            relative = os.path.relpath(changed, file_manager.workspace_resolved)
+            await websocket.send_json({
+                "type": "changed",
+                "path": "" if relative == "." else relative
+            })
+
+    sender = asyncio.create_task(forward_changes())
+    try:
+        while True:
+            message = await websocket.receive_json()
+            action = message.get("action")
             try:
-                relative_path = item.relative_to(workspace_resolved)
-                items.append({
-                    "name": item.name,
-                    "path": str(relative_path),
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else None,
-                    "modified": item.stat().st_mtime
-                })
-            except Exception as e:
-                logger.warning(f"Failed to read item {item}: {e}")
+                safe_path = str(validate_path(message.get("path", "")))
+            except HTTPException:
                 continue
 
-        # 폴더 먼저, 그 다음 파일, 각각 이름순 정렬
-        items.sort(key=lambda x: (x["type"] == "file", x["name"].lower()))
+            if action == "watch":
+                if not subscription.add(safe_path):
+                    await websocket.send_json({"type": "unavailable", "path": message.get("path", "")})
+            elif action == "unwatch":
+                subscription.remove(safe_path)
 
-        return {"items": items}
-
-    except HTTPException:
-        raise
+    except WebSocketDisconnect:
+        logger.info(f"파일 변경 알림 연결 해제: {username}")
     except Exception as e:
-        logger.error(f"Failed to list directory {path}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error(f"파일 변경 알림 WebSocket 에러: {e}")
+    finally:
+        sender.cancel()
+        subscription.close()
 
 
 @app.get("/api/files/read")
 async def read_file(
+    request: Request,
     path: str = Query(...),
     username: str = Depends(verify_auth_token)
 ):
@@ -597,58 +1426,134 @@ async def read_file(
         path: 파일 경로
 
     Returns:
-        파일 내용
+        파일 내용, ETag (저장 시 expected_etag로 전달), sha256 (부분 저장 시 base_sha256으로 전달)
     """
     try:
         safe_path = validate_path(path)
+        content, etag, sha256 = await file_manager.run(file_manager.read_text, safe_path, request=request)
+        return {"content": content, "path": path, "etag": etag, "sha256": sha256}
 
-        if not safe_path.exists():
-            raise HTTPException(status_code=404, detail="File not found")
+    except HTTPException:
+        raise
+    except FileOperationCancelled:
+        raise HTTPException(status_code=499, detail="Client closed request")
+    except Exception as e:
+        logger.error(f"Failed to read file {path}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        if not safe_path.is_file():
-            raise HTTPException(status_code=400, detail="Not a file")
 
-        # 파일 크기 제한 (10MB)
-        if safe_path.stat().st_size > 10 * 1024 * 1024:
-            raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+@app.get("/api/files/raw")
+async def read_file_raw(
+    request: Request,
+    path: str = Query(...),
+    download: bool = Query(False),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일 원본 스트리밍 (HTTP Range 지원, 크기 제한 없음)
 
-        try:
-            content = safe_path.read_text(encoding='utf-8')
-            return {"content": content, "path": path}
-        except UnicodeDecodeError:
-            raise HTTPException(status_code=400, detail="Binary file not supported")
+    gzip 압축은 적용하지 않음 (대용량 파일 압축이 이벤트 루프를 막고, 바이트 범위가 어긋나므로)
+
+    Args:
+        path: 파일 경로
+        download: True면 첨부 파일로 내려받기
+        range_header: HTTP Range 헤더
+
+    Returns:
+        전체 파일 (200) 또는 요청 범위 (206)
+    """
+    safe_path = validate_path(path)
+    st = await file_manager.run(file_manager.stat_file, safe_path)
+    media_type = mimetypes.guess_type(safe_path.name)[0] or "application/octet-stream"
+
+    disable_compression(request)
+    headers = {"Accept-Ranges": "bytes"}
+    if download:
+        headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(safe_path.name)}"
+
+    byte_range = parse_range_header(range_header, st.st_size)
+    if byte_range is None:
+        return FileResponse(safe_path, media_type=media_type, headers=headers, stat_result=st)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        file_manager.iter_range(safe_path, start, end),
+        status_code=206,
+        media_type=media_type,
+        headers=headers
+    )
+
+
+@app.get("/api/files/lines")
+async def read_file_lines(
+    request: Request,
+    path: str = Query(...),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10000),
+    tail: Optional[int] = Query(None, ge=1, le=10000),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일 줄 단위 구간 읽기 (대용량 로그 보기용)
+
+    Args:
+        path: 파일 경로
+        offset: 시작 줄 번호 (0부터)
+        limit: 최대 줄 수
+        tail: 지정하면 마지막 N줄 (offset/limit 무시)
+
+    Returns:
+        lines, start_line, next_line, start_byte, end_byte, size, total_lines
+        (end_byte 이후를 Range로 요청하면 새로 추가된 내용만 받을 수 있음)
+    """
+    try:
+        safe_path = validate_path(path)
+        if tail is not None:
+            result = await file_manager.run(file_manager.read_tail, safe_path, tail, request=request)
+        else:
+            result = await file_manager.run(
+                file_manager.read_lines, safe_path, offset, limit, request=request
+            )
+        result["path"] = path
+        return result
 
     except HTTPException:
         raise
+    except FileOperationCancelled:
+        raise HTTPException(status_code=499, detail="Client closed request")
     except Exception as e:
-        logger.error(f"Failed to read file {path}: {e}")
+        logger.error(f"Failed to read lines {path}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/files/write")
 async def write_file(
     request: FileWriteRequest,
+    if_match: Optional[str] = Header(None),
     username: str = Depends(verify_auth_token)
 ):
     """
-    파일 쓰기
+    파일 쓰기 (임시 파일에 쓴 뒤 원자적으로 교체)
 
     Args:
-        request: 파일 경로 및 내용
+        request: 파일 경로, 내용, expected_etag
+        if_match: expected_etag 대신 사용할 수 있는 If-Match 헤더
 
     Returns:
-        작업 결과
+        작업 결과, 새 ETag, sha256
+        (expected_etag가 현재 파일과 다르면 412 - 터미널 등에서 수정됨)
     """
     try:
         safe_path = validate_path(request.path)
-
-        # 부모 디렉토리가 없으면 생성
-        safe_path.parent.mkdir(parents=True, exist_ok=True)
-
-        safe_path.write_text(request.content, encoding='utf-8')
+        etag, sha256 = await file_manager.run(
+            file_manager.write_text, safe_path, request.content, request.expected_etag or if_match
+        )
 
         logger.info(f"File written: {request.path} by {username}")
-        return {"status": "written", "path": request.path}
+        return {"status": "written", "path": request.path, "etag": etag, "sha256": sha256}
 
     except HTTPException:
         raise
@@ -657,6 +1562,185 @@ async def write_file(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/files/patch")
+async def patch_file(
+    request: FilePatchRequest,
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일 부분 저장 (변경된 구간만 전송)
+
+    큰 파일의 한 줄 수정도 전체를 다시 보내지 않도록, 기준 버전(sha256)에 대한
+    편집 목록을 받아 서버에서 적용한 뒤 원자적으로 교체함
+
+    Args:
+        request: 파일 경로, 기준 sha256, 편집 목록
+
+    Returns:
+        작업 결과, 새 ETag, sha256
+        (기준 버전이 현재 파일과 다르면 409 - 클라이언트는 전체 저장으로 재시도)
+    """
+    if len(request.edits) > 10000:
+        raise HTTPException(status_code=400, detail="Too many edits")
+
+    try:
+        safe_path = validate_path(request.path)
+        edits = [(edit.offset, edit.delete, edit.insert) for edit in request.edits]
+        etag, sha256 = await file_manager.run(
+            file_manager.patch_text, safe_path, request.base_sha256, edits, request.expected_sha256
+        )
+
+        logger.info(f"File patched: {request.path} ({len(edits)} edits) by {username}")
+        return {"status": "written", "path": request.path, "etag": etag, "sha256": sha256}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to patch file {request.path}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.put("/api/files/upload")
+async def upload_file_raw(
+    request: Request,
+    path: str = Query(...),
+    overwrite: bool = Query(True),
+    if_match: Optional[str] = Header(None),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일 업로드 (요청 본문 그대로 스트리밍 저장)
+
+    본문을 메모리에 모으지 않고 임시 파일에 쓴 뒤 원자적으로 교체함
+
+    Args:
+        path: 저장할 파일 경로
+        overwrite: False면 이미 존재할 때 409
+        if_match: 덮어쓸 파일의 ETag (다르면 412)
+
+    Returns:
+        path, size, etag
+    """
+    safe_path = validate_path(path)
+    etag, size = await file_manager.write_stream(
+        safe_path, request.stream(), if_match, overwrite, upload_manager.max_size
+    )
+    logger.info(f"File uploaded: {path} ({size} bytes) by {username}")
+    return {"path": path, "size": size, "etag": etag}
+
+
+@app.post("/api/files/upload")
+async def upload_file_multipart(
+    file: UploadFile = File(...),
+    path: str = Form(""),
+    overwrite: bool = Form(True),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일 업로드 (multipart/form-data)
+
+    Args:
+        file: 업로드 파일
+        path: 저장할 디렉토리 (루트 기준 상대 경로)
+        overwrite: False면 이미 존재할 때 409
+
+    Returns:
+        path, size, etag
+    """
+    name = os.path.basename(file.filename or "")
+    if not name or name in (".", ".."):
+        raise HTTPException(status_code=400, detail="Invalid file name")
+
+    relative_path = f"{path.rstrip('/')}/{name}" if path else name
+    safe_path = validate_path(relative_path)
+
+    async def read_chunks():
+        while True:
+            chunk = await file.read(1024 * 1024)
+            if not chunk:
+                break
+            yield chunk
+
+    try:
+        etag, size = await file_manager.write_stream(
+            safe_path, read_chunks(), None, overwrite, upload_manager.max_size
+        )
+    finally:
+        await file.close()
+
+    logger.info(f"File uploaded: {relative_path} ({size} bytes) by {username}")
+    return {"path": relative_path, "size": size, "etag": etag}
+
+
+# 이어받기 가능한 분할 업로드
+@app.post("/api/files/uploads")
+async def create_upload(request: UploadCreateRequest, username: str = Depends(verify_auth_token)):
+    """
+    분할 업로드 시작
+
+    Args:
+        request: 대상 경로, 전체 크기, expected_etag, overwrite
+
+    Returns:
+        id, path, size, offset
+    """
+    if request.size < 0:
+        raise HTTPException(status_code=400, detail="Invalid size")
+    safe_path = validate_path(request.path)
+    return await upload_manager.create(
+        safe_path, request.path, request.size, username, request.expected_etag, request.overwrite
+    )
+
+
+@app.get("/api/files/uploads/{upload_id}")
+async def get_upload(upload_id: str, username: str = Depends(verify_auth_token)):
+    """
+    분할 업로드 상태 (재접속 후 offset부터 이어서 전송)
+
+    Returns:
+        id, path, size, offset
+    """
+    return await upload_manager.status(upload_id, username)
+
+
+@app.put("/api/files/uploads/{upload_id}")
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    분할 업로드 데이터 전송 (요청 본문 = offset부터의 바이트)
+
+    Args:
+        upload_id: 업로드 ID
+        offset: 이 청크의 시작 위치 (서버의 현재 offset과 다르면 409 + Upload-Offset 헤더)
+
+    Returns:
+        id, path, size, offset
+    """
+    return await upload_manager.append(upload_id, username, offset, request.stream())
+
+
+@app.post("/api/files/uploads/{upload_id}/complete")
+async def complete_upload(upload_id: str, username: str = Depends(verify_auth_token)):
+    """
+    분할 업로드 완료 (대상 경로로 원자적 이동)
+
+    Returns:
+        path, size, etag
+    """
+    return await upload_manager.complete(upload_id, username)
+
+
+@app.delete("/api/files/uploads/{upload_id}")
+async def abort_upload(upload_id: str, username: str = Depends(verify_auth_token)):
+    """분할 업로드 취소"""
+    await upload_manager.abort(upload_id, username)
+    return {"status": "aborted", "id": upload_id}
+
+
 @app.post("/api/files/create")
 async def create_file(
     request: FileCreateRequest,
@@ -673,17 +1757,7 @@ async def create_file(
     """
     try:
         safe_path = validate_path(request.path)
-
-        if safe_path.exists():
-            raise HTTPException(status_code=409, detail="Already exists")
-
-        if request.type == "directory":
-            safe_path.mkdir(parents=True, exist_ok=True)
-        elif request.type == "file":
-            safe_path.parent.mkdir(parents=True, exist_ok=True)
-            safe_path.touch()
-        else:
-            raise HTTPException(status_code=400, detail="Invalid type (must be 'file' or 'directory')")
+        await file_manager.run(file_manager.create, safe_path, request.type)
 
         logger.info(f"{request.type.capitalize()} created: {request.path} by {username}")
         return {"status": "created", "path": request.path, "type": request.type}
@@ -697,12 +1771,15 @@ async def create_file(
 
 @app.delete("/api/files")
 async def delete_file(
+    request: Request,
     path: str = Query(...),
     username: str = Depends(verify_auth_token)
 ):
     """
     파일/폴더 삭제
 
+    클라이언트 연결이 끊기면 재귀 삭제를 중단합니다.
+
     Args:
         path: 경로
 
@@ -711,61 +1788,179 @@ async def delete_file(
     """
     try:
         safe_path = validate_path(path)
-
-        if not safe_path.exists():
-            raise HTTPException(status_code=404, detail="Not found")
-
-        if safe_path.is_dir():
-            shutil.rmtree(safe_path)
-        else:
-            safe_path.unlink()
+        await file_manager.run(file_manager.delete, safe_path, request=request)
 
         logger.info(f"Deleted: {path} by {username}")
         return {"status": "deleted", "path": path}
 
     except HTTPException:
         raise
+    except FileOperationCancelled:
+        logger.warning(f"Delete cancelled (client gone): {path}")
+        raise HTTPException(status_code=499, detail="Client closed request")
     except Exception as e:
         logger.error(f"Failed to delete {path}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/files/batch", status_code=202)
+async def batch_files(
+    request: BatchRequest,
+    username: str = Depends(verify_auth_token)
+):
+    """
+    파일 일괄 작업 (삭제/이동/복사)을 백그라운드 작업으로 실행
+
+    경로는 모두 먼저 검증하고, 실행은 /api/jobs/{job_id}로 진행 상황 확인,
+    DELETE /api/jobs/{job_id}로 취소
+
+    Args:
+        request: 작업 목록 (move/copy의 dest는 대상 폴더, name을 주면 그 이름으로)
+
+    Returns:
+        등록된 작업 상태 (202)
+    """
+    if not request.operations:
+        raise HTTPException(status_code=400, detail="No operations")
+    if len(request.operations) > 10000:
+        raise HTTPException(status_code=400, detail="Too many operations")
+
+    operations = []
+    for item in request.operations:
+        if item.op not in JOB_OPERATIONS:
+            raise HTTPException(status_code=400, detail=f"Unknown operation: {item.op}")
+
+        source = validate_path(item.path)
+        if str(source) == path_validator.root:
+            raise HTTPException(status_code=400, detail="Cannot modify workspace root")
+
+        dest = None
+        if item.op != "delete":
+            if item.dest is None:
+                raise HTTPException(status_code=400, detail=f"Destination required for {item.op}")
+            name = item.name or source.name
+            if "/" in name or name in (".", ".."):
+                raise HTTPException(status_code=400, detail=f"Invalid name: {name}")
+            dest = validate_path(item.dest) / name
+
+        operations.append(JobOperation(item.op, item.path, source, dest))
+
+    job = job_manager.submit(username, operations)
+    return job.to_dict()
+
+
+@app.get("/api/jobs")
+async def list_jobs(username: str = Depends(verify_auth_token)):
+    """
+    파일 작업 목록 (최근 순)
+
+    Returns:
+        작업 상태 리스트
+    """
+    return {"jobs": [job.to_dict() for job in job_manager.list_jobs(username)]}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, username: str = Depends(verify_auth_token)):
+    """
+    파일 작업 진행 상황
+
+    Returns:
+        status, total, completed, files, bytes, current, errors
+    """
+    return job_manager.get(job_id, username).to_dict()
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_job(job_id: str, username: str = Depends(verify_auth_token)):
+    """
+    파일 작업 취소 (진행 중인 항목은 파일 단위로 중단, 이미 처리된 항목은 유지)
+
+    Returns:
+        작업 상태
+    """
+    return job_manager.cancel(job_id, username).to_dict()
+
+
+@app.get("/api/files/archive")
+async def download_archive(
+    path: str = Query(""),
+    format: str = Query("zip"),
+    username: str = Depends(verify_auth_token)
+):
+    """
+    폴더를 아카이브로 스트리밍 다운로드 (임시 파일 없이 생성하면서 전송)
+
+    Args:
+        path: 폴더 경로
+        format: zip, tar, tar.gz
+
+    Returns:
+        아카이브 스트리밍 응답
+    """
+    if format not in ARCHIVE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+
+    safe_path = validate_path(path)
+    if not await asyncio.to_thread(safe_path.is_dir):
+        raise HTTPException(status_code=404, detail="Directory not found")
+
+    media_type, extension = ARCHIVE_FORMATS[format]
+    name = safe_path.name or "workspace"
+    logger.info(f"Archive download: {path or '/'} ({format}) by {username}")
+
+    return StreamingResponse(
+        file_manager.iter_blocking(iter_directory_archive(str(safe_path), name, format)),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(name + extension)}",
+            "Cache-Control": "no-store"
+        }
+    )
+
+
 # 에러 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """전역 예외 핸들러"""
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
 
 
 # Static files for frontend (프로덕션 배포용)
-# 정적 파일이 존재하는 경우에만 마운트
-STATIC_DIR = Path(__file__).parent / "static"
+# 정적 파일이 존재하는 경우에만 라우트 등록
+STATIC_DIR = static_assets.root
 if STATIC_DIR.exists():
-    app.mount("/assets", CachedStaticFiles(directory=str(STATIC_DIR / "assets")), name="assets")
+    @app.api_route("/assets/{asset_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+    async def serve_asset(asset_path: str, request: Request):
+        """빌드된 JS/CSS 등 (미리 압축된 .br/.gz 우선)"""
+        response = await static_assets.serve(f"assets/{asset_path}", request)
+        if response is None:
+            raise HTTPException(status_code=404, detail="Not found")
+        return response
 
     @app.get("/")
-    async def serve_frontend():
-        """프론트엔드 index.html 서빙"""
-        return FileResponse(str(STATIC_DIR / "index.html"))
+    async def serve_frontend(request: Request):
+        """프론트엔드 index.html 서빙 (메모리 캐시, ETag 재검증)"""
+        return await static_assets.serve("index.html", request)
 
     @app.get("/{full_path:path}")
-    async def catch_all(full_path: str):
+    async def catch_all(full_path: str, request: Request):
         """SPA fallback - 모든 경로를 index.html로"""
         # API 경로는 제외
         if full_path.startswith("api/") or full_path.startswith("ws/"):
             raise HTTPException(status_code=404, detail="Not found")
 
         # 파일이 존재하면 반환
-        file_path = STATIC_DIR / full_path
-        if file_path.is_file():
-            return FileResponse(str(file_path))
+        response = await static_assets.serve(full_path, request)
+        if response is not None:
+            return response
 
         # 그 외는 index.html 반환 (SPA routing)
-        return FileResponse(str(STATIC_DIR / "index.html"))
+        return await static_assets.serve("index.html", request)
 
 
 if __name__ == "__main__":
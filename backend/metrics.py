@@ -0,0 +1,436 @@
+"""
+Prometheus 형식 메트릭
+카운터/게이지/히스토그램을 모아 텍스트 노출 형식(/api/metrics)으로 렌더링
+
+값은 모두 이벤트 루프 스레드에서만 갱신하므로 잠금 없이 정수/실수 덧셈만 수행
+(스레드 풀 작업도 완료 콜백을 루프로 넘겨서 기록).
+세션 수나 캐시 통계처럼 이미 다른 객체가 가진 값은 수집 시점에 콜백으로 읽음
+"""
+import asyncio
+import functools
+import logging
+import math
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 수집 콜백이 돌려주는 형식: (이름, 종류, 설명, [(레이블, 값), ...])
+Family = Tuple[str, str, str, Iterable[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # 구간별 개수 (누적은 렌더링 시 계산), 마지막 칸은 +Inf
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric:
+    """레이블별 값을 가진 메트릭 (레이블이 없으면 메트릭 자체에 inc/set/observe 호출)"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._default = None if self.labelnames else self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """
+        레이블 값에 해당하는 자식 메트릭 (핫 패스에서는 반환값을 보관해 재사용)
+
+        Args:
+            *values: labelnames 순서대로의 레이블 값
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 {self.labelnames} 필요")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def remove(self, *values: str):
+        """레이블 값 제거 (세션 종료 등으로 더 이상 갱신하지 않을 때)"""
+        self._children.pop(tuple(str(value) for value in values), None)
+
+    def samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        """(샘플 이름, 레이블, 값) 목록"""
+        for key, child in self._children.items():
+            yield self.name, dict(zip(self.labelnames, key)), child.value
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+
+class Gauge(Metric):
+    """증감 가능한 현재 값"""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1):
+        self._default.dec(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+
+class Histogram(Metric):
+    """구간별 분포 (지연 시간 등)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def samples(self):
+        for key, child in self._children.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.bounds + (math.inf,), child.counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, child.count
+
+
+def timed(histogram: Histogram):
+    """
+    코루틴 실행 시간을 함수 이름 레이블로 기록하는 데코레이터
+
+    Args:
+        histogram: 레이블 하나(함수 이름)를 가진 히스토그램
+    """
+    def decorator(func):
+        child = histogram.labels(func.__name__)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 텍스트 노출 형식 렌더링"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def _register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def collector(self, func: Callable[[], Iterable[Family]]):
+        """수집 시점에 값을 읽는 콜백 등록 (데코레이터로도 사용)"""
+        self._collectors.append(func)
+        return func
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 노출 형식 (0.0.4)
+
+        Returns:
+            /api/metrics 응답 본문
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for collect in self._collectors:
+            try:
+                families = list(collect())
+            except Exception as e:
+                logger.error(f"메트릭 수집 실패 ({getattr(collect, '__name__', collect)}): {e}")
+                continue
+            for name, kind, documentation, samples in families:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+# 전역 메트릭 레지스트리 인스턴스
+metrics = MetricsRegistry()
+
+
+# ==================== 스레드 풀 ====================
+
+POOL_WAIT_SECONDS = metrics.histogram(
+    "thread_pool_wait_seconds", "Time a task waited in the thread pool queue", ("pool",)
+)
+POOL_RUN_SECONDS = metrics.histogram(
+    "thread_pool_run_seconds", "Time a task ran on a thread pool worker", ("pool",)
+)
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    대기/실행 시간과 포화 상태를 기록하는 스레드 풀
+
+    submit은 이벤트 루프(run_in_executor, asyncio.to_thread)에서 호출되고
+    완료 기록은 call_soon_threadsafe로 루프에서 처리하므로 카운터에 잠금이 필요 없음
+    """
+
+    _pools: List["InstrumentedThreadPoolExecutor"] = []
+
+    def __init__(self, pool: str, max_workers: Optional[int] = None, thread_name_prefix: str = ""):
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix or pool)
+        self.pool = pool
+        self.submitted = 0
+        self.finished = 0
+        self._wait = POOL_WAIT_SECONDS.labels(pool)
+        self._run = POOL_RUN_SECONDS.labels(pool)
+        InstrumentedThreadPoolExecutor._pools.append(self)
+
+    def submit(self, fn, /, *args, **kwargs):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 루프 밖(다른 스레드)에서의 제출은 기록하지 않음
+            return super().submit(fn, *args, **kwargs)
+
+        queued_at = time.perf_counter()
+        started = [0.0]
+
+        def call():
+            started[0] = time.perf_counter()
+            return fn(*args, **kwargs)
+
+        future = super().submit(call)
+        self.submitted += 1
+
+        def done(_):
+            finished_at = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(self._record, queued_at, started[0], finished_at)
+            except RuntimeError:
+                pass  # 종료 중 (루프 닫힘)
+
+        future.add_done_callback(done)
+        return future
+
+    def _record(self, queued_at: float, started: float, finished_at: float):
+        self.finished += 1
+        if started:
+            self._wait.observe(started - queued_at)
+            self._run.observe(finished_at - started)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        if self in InstrumentedThreadPoolExecutor._pools:
+            InstrumentedThreadPoolExecutor._pools.remove(self)
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+@metrics.collector
+def _collect_pools():
+    pools = list(InstrumentedThreadPoolExecutor._pools)
+    yield (
+        "thread_pool_max_workers", "gauge", "Configured worker threads",
+        [({"pool": p.pool}, p._max_workers) for p in pools]
+    )
+    yield (
+        "thread_pool_threads", "gauge", "Worker threads started",
+        [({"pool": p.pool}, len(p._threads)) for p in pools]
+    )
+    yield (
+        "thread_pool_in_flight", "gauge", "Submitted tasks not yet finished (queued + running)",
+        [({"pool": p.pool}, p.submitted - p.finished) for p in pools]
+    )
+    yield (
+        "thread_pool_queued", "gauge", "Tasks waiting for a free worker",
+        [({"pool": p.pool}, p._work_queue.qsize()) for p in pools]
+    )
+    yield (
+        "thread_pool_tasks_total", "counter", "Tasks submitted",
+        [({"pool": p.pool}, p.submitted) for p in pools]
+    )
+
+
+def install_default_executor(loop: asyncio.AbstractEventLoop, max_workers: Optional[int] = None):
+    """asyncio.to_thread/run_in_executor(None)가 쓰는 기본 풀을 계측 풀로 교체"""
+    loop.set_default_executor(InstrumentedThreadPoolExecutor("default", max_workers=max_workers, thread_name_prefix="asyncio"))
+
+
+# ==================== HTTP 요청 ====================
+
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route (until the response body is sent)",
+    ("method", "route")
+)
+HTTP_REQUESTS = metrics.counter(
+    "http_requests_total", "HTTP requests by route and status class", ("method", "route", "status")
+)
+
+_route_paths: Dict[object, str] = {}
+
+
+def route_template(scope: Scope) -> str:
+    """요청을 처리한 라우트의 경로 템플릿 (라우터가 scope에 남긴 endpoint로 식별, 레이블 수 제한)"""
+    endpoint = scope.get("endpoint")
+    path = _route_paths.get(endpoint)
+    if path is None:
+        path = "unmatched"
+        if endpoint is not None:
+            for route in getattr(scope.get("app"), "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+        _route_paths[endpoint] = path
+    return path
+
+
+# method 레이블로 그대로 쓰는 HTTP 메서드 (나머지는 "other", 레이블 수 제한)
+HTTP_METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+
+
+class MetricsMiddleware:
+    """HTTP 요청 지연 시간과 상태 코드 집계 (WebSocket 제외)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = [500]
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            method = scope["method"]
+            if method not in HTTP_METHODS:
+                method = "other"
+            route = route_template(scope)
+            HTTP_REQUEST_SECONDS.labels(method, route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method, route, f"{status[0] // 100}xx").inc()
@@ -0,0 +1,76 @@
+"""
+워크스페이스 경로 검증
+워크스페이스 루트만 한 번 해석해 두고, 요청 경로는 매번 실제 경로로 해석해 루트 안인지 확인
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+
+class PathValidator:
+    """
+    워크스페이스 경로 검증기
+
+    - 워크스페이스 루트는 생성 시 한 번만 해석
+    - 요청 경로는 캐시 없이 매번 os.path.realpath로 해석
+      (터미널에서 디렉토리를 심볼릭 링크로 바꿔치기해도 바로 반영되도록,
+      감시하지 않는 디렉토리나 .gitignore로 제외된 디렉토리도 포함)
+    - 루트 포함 여부는 os.path.commonpath로 비교 (/workspace2 같은 형제 경로 차단)
+    """
+
+    def __init__(self, workspace_root: str = None):
+        if workspace_root is None:
+            workspace_root = os.getenv("WORKSPACE_ROOT", "/workspace")
+
+        self.root = os.path.realpath(workspace_root)
+
+    def is_within(self, resolved: str) -> bool:
+        """실제 경로가 워크스페이스 안인지 확인"""
+        try:
+            return os.path.commonpath([self.root, resolved]) == self.root
+        except ValueError:
+            return False
+
+    def resolve(self, path: str) -> str:
+        """
+        요청 경로를 실제 절대 경로로 해석 (Path.resolve(strict=False)와 같은 결과)
+
+        Args:
+            path: 워크스페이스 기준 상대 경로
+
+        Returns:
+            실제 절대 경로 문자열
+        """
+        return os.path.realpath(os.path.join(self.root, path) if path else self.root)
+
+    def validate(self, path: Optional[str]) -> Path:
+        """
+        경로 검증 및 정규화
+
+        Args:
+            path: 상대 경로
+
+        Returns:
+            검증된 절대 경로
+
+        Raises:
+            HTTPException: 잘못된 경로(400), workspace 외부 접근(403)
+        """
+        if "\0" in (path or ""):
+            raise HTTPException(status_code=400, detail="Invalid path")
+
+        resolved = self.resolve(path or "")
+        if not self.is_within(resolved):
+            logger.warning(f"Path traversal attempt: {path}")
+            raise HTTPException(status_code=403, detail="Access denied")
+
+        return Path(resolved)
+
+
+# 전역 경로 검증기 인스턴스
+path_validator = PathValidator()
@@ -0,0 +1,299 @@
+"""
+실행 중인 서버 프로파일링
+- CPU: 샘플링 스레드가 주기적으로 모든 스레드의 스택을 찍어 collapsed stack 형식으로 집계
+  (flamegraph.pl, speedscope, inferno 등에 그대로 입력 가능)
+- 메모리: tracemalloc 스냅샷을 기준 스냅샷과 비교해 늘어난 할당을 스택별로 집계
+
+두 기능 모두 요청 시에만 켜지며 꺼져 있는 동안에는 비용이 없음
+"""
+import asyncio
+import linecache
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter as CounterDict
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+# 유휴 상태로 보는 가장 안쪽 프레임 (파일명, 함수명) - CPU 모드에서 제외
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("thread.py", "_worker"),
+    ("queue.py", "get"),
+    ("fs_watcher.py", "_run"),
+}
+
+# 프로파일 최대 길이 (초)
+MAX_PROFILE_SECONDS = 300
+
+
+def process_memory() -> Dict[str, Optional[int]]:
+    """프로세스 메모리 (RSS는 /proc이 있는 경우만, 최대 RSS는 getrusage)"""
+    rss = None
+    try:
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    max_rss = None
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        if sys.platform != "darwin":
+            max_rss *= 1024
+    except (ImportError, OSError):
+        pass
+
+    return {"rss_bytes": rss, "max_rss_bytes": max_rss}
+
+
+def _frame_label(code) -> str:
+    """collapsed stack 프레임 이름 (함수 단위로 모이도록 정의 줄 사용)"""
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+
+class SamplingProfiler:
+    """
+    샘플링 CPU 프로파일러
+
+    interval마다 sys._current_frames()로 모든 스레드의 스택을 수집.
+    mode="cpu"면 select/큐 대기 등 유휴 스레드는 제외, "wall"이면 모두 포함
+    """
+
+    def __init__(self, interval: float = None):
+        if interval is None:
+            interval = float(os.getenv("PROFILER_INTERVAL", "0.005"))
+
+        self.interval = interval
+        self.mode = "cpu"
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.samples = 0
+        self._stacks: CounterDict = CounterDict()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._done: Optional[asyncio.Event] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, seconds: float, mode: str = "cpu"):
+        """
+        프로파일링 시작 (seconds 후 자동 종료, 이벤트 루프에서 호출)
+
+        Args:
+            seconds: 프로파일링 시간
+            mode: cpu (유휴 스레드 제외) 또는 wall
+
+        Raises:
+            HTTPException: 이미 실행 중인 경우 (409)
+        """
+        if self.running:
+            raise HTTPException(status_code=409, detail="CPU profiler already running")
+        if mode not in ("cpu", "wall"):
+            raise HTTPException(status_code=400, detail="mode must be cpu or wall")
+
+        self.mode = mode
+        self.samples = 0
+        self._stacks = CounterDict()
+        self.started_at = time.time()
+        self.finished_at = None
+        self._stop.clear()
+        self._done = asyncio.Event()
+        self._thread = threading.Thread(target=self._sample_loop, name="cpu-profiler", daemon=True)
+        self._thread.start()
+        self._timer = asyncio.get_running_loop().call_later(min(seconds, MAX_PROFILE_SECONDS), self.stop)
+        logger.info(f"CPU 프로파일링 시작 ({seconds}초, {mode})")
+
+    def stop(self):
+        """프로파일링 종료 (실행 중이 아니면 무시)"""
+        if not self.running:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.finished_at = time.time()
+        self._done.set()
+        logger.info(f"CPU 프로파일링 종료 (샘플 {self.samples}개)")
+
+    async def wait(self):
+        """진행 중인 프로파일링이 끝날 때까지 대기"""
+        if self._done is not None:
+            await self._done.wait()
+
+    def _sample_loop(self):
+        """샘플링 스레드"""
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id, frame in frames.items():
+                if thread_id == own:
+                    continue
+                code = frame.f_code
+                if self.mode == "cpu" and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+
+                name = names.get(thread_id)
+                if name is None:
+                    name = names[thread_id] = self._thread_name(thread_id)
+                stack.append(name)
+                self._stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+            del frames
+
+    @staticmethod
+    def _thread_name(thread_id: int) -> str:
+        for thread in threading.enumerate():
+            if thread.ident == thread_id:
+                return f"thread:{thread.name}".replace(";", ":")
+        return f"thread:{thread_id}"
+
+    def collapsed(self) -> str:
+        """collapsed stack 형식 ("frame;frame;frame count" 줄 목록, 많은 순)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def status(self) -> dict:
+        return {
+            "running": self.running,
+            "mode": self.mode,
+            "interval": self.interval,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "samples": self.samples,
+            "stacks": len(self._stacks)
+        }
+
+
+class AllocationTracker:
+    """
+    tracemalloc 기반 할당 추적
+
+    start()로 추적을 켜고 기준 스냅샷을 찍은 뒤, diff()로 기준 이후 늘어난 할당을 스택별로 비교
+    """
+
+    def __init__(self, frames: int = None):
+        if frames is None:
+            frames = int(os.getenv("PROFILER_TRACEMALLOC_FRAMES", "25"))
+        self.frames = frames
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self.baseline_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        """추적 시작 및 기준 스냅샷 (블로킹 - 스레드에서 호출)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            logger.info(f"메모리 할당 추적 시작 (frames={self.frames})")
+        self._baseline = self._take()
+        self.baseline_at = time.time()
+
+    def stop(self):
+        """추적 종료 및 스냅샷 해제"""
+        self._baseline = None
+        self.baseline_at = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("메모리 할당 추적 종료")
+
+    @staticmethod
+    def _take() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+
+    def diff(self, limit: int = 50, rebase: bool = False) -> Tuple[List[tracemalloc.StatisticDiff], dict]:
+        """
+        기준 스냅샷 대비 할당 변화 (블로킹 - 스레드에서 호출)
+
+        Args:
+            limit: 반환할 스택 수 (증가량 순)
+            rebase: True면 현재 스냅샷을 새 기준으로
+
+        Returns:
+            (스택별 변화 목록, 요약)
+
+        Raises:
+            HTTPException: 추적 중이 아닌 경우 (409)
+        """
+        if not tracemalloc.is_tracing() or self._baseline is None:
+            raise HTTPException(status_code=409, detail="Allocation tracking is not running")
+
+        snapshot = self._take()
+        stats = snapshot.compare_to(self._baseline, "traceback")
+        current, peak = tracemalloc.get_traced_memory()
+        summary = {
+            "baseline_at": self.baseline_at,
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+            "size_diff": sum(stat.size_diff for stat in stats),
+            "count_diff": sum(stat.count_diff for stat in stats)
+        }
+        if rebase:
+            self._baseline = snapshot
+            self.baseline_at = time.time()
+        return stats[:limit], summary
+
+    @staticmethod
+    def to_dict(stat: tracemalloc.StatisticDiff) -> dict:
+        frames = []
+        for frame in stat.traceback:
+            frames.append({
+                "file": frame.filename,
+                "line": frame.lineno,
+                "code": linecache.getline(frame.filename, frame.lineno).strip()
+            })
+        return {
+            "size_diff": stat.size_diff,
+            "size": stat.size,
+            "count_diff": stat.count_diff,
+            "count": stat.count,
+            "frames": frames
+        }
+
+    @staticmethod
+    def collapsed(stats: List[tracemalloc.StatisticDiff]) -> str:
+        """늘어난 바이트를 값으로 하는 collapsed stack (감소한 스택은 제외)"""
+        lines: Dict[str, int] = {}
+        for stat in stats:
+            if stat.size_diff <= 0:
+                continue
+            # 트레이스백은 바깥 → 안쪽 순서 (Python 3.7+), 마지막 프레임이 할당 위치
+            stack = ";".join(
+                f"{os.path.basename(frame.filename)}:{frame.lineno}".replace(";", ":")
+                for frame in stat.traceback
+            )
+            lines[stack] = lines.get(stack, 0) + stat.size_diff
+        return "".join(f"{stack} {size}\n" for stack, size in sorted(lines.items(), key=lambda item: -item[1]))
+
+
+# 전역 프로파일러 인스턴스
+cpu_profiler = SamplingProfiler()
+allocation_tracker = AllocationTracker()
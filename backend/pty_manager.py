@@ -6,13 +6,24 @@ import os
 import struct
 import fcntl
 import termios
+import time
 import ptyprocess
 from typing import Dict, Optional
 from fastapi import WebSocket
 import logging
 
+from metrics import metrics
+
 logger = logging.getLogger(__name__)
 
+# 메트릭 (세션별 값은 SessionInfo에 자식 메트릭을 보관해 핫 패스에서 조회 없이 갱신)
+PTY_READ_BYTES = metrics.counter("pty_read_bytes_total", "Bytes read from the PTY", ("session_id",))
+PTY_OUTPUT_PENDING = metrics.gauge(
+    "pty_output_tasks_pending", "PTY output chunks read but not yet stored and sent"
+)
+WS_SEND_SECONDS = metrics.histogram("websocket_send_seconds", "Terminal WebSocket send latency")
+WS_SEND_ERRORS = metrics.counter("websocket_send_errors_total", "Terminal WebSocket send failures")
+
 
 class SessionInfo:
     """세션 정보 저장 클래스"""
@@ -24,6 +35,10 @@ class SessionInfo:
         self.output_task: Optional[asyncio.Task] = None
         self.cols = 80
         self.rows = 24
+        # 메트릭: 읽은 바이트, 저장/전송 대기 중인 출력 청크 수 (WebSocket 전송 큐 깊이)
+        self.read_bytes = PTY_READ_BYTES.labels(session_id)
+        self.pending_outputs = 0
+        self.pending_bytes = 0
 
     def __repr__(self):
         return f"<Session {self.session_id} pid={self.process.pid} connected={self.connected_socket is not None}>"
@@ -206,6 +221,7 @@ class PtyManager:
 
             # 세션 제거
             del self.sessions[session_id]
+            PTY_READ_BYTES.remove(session_id)
             logger.info(f"세션 삭제됨: {session_id}")
 
         except Exception as e:
@@ -234,6 +250,10 @@ class PtyManager:
                 if r:
                     data = session.process.read()
                     if data:
+                        session.read_bytes.inc(len(data))
+                        session.pending_outputs += 1
+                        session.pending_bytes += len(data)
+                        PTY_OUTPUT_PENDING.inc()
                         # 비동기 처리를 위해 태스크 생성
                         asyncio.create_task(process_output(data))
             except:
@@ -255,12 +275,19 @@ class PtyManager:
                 # 연결된 WebSocket이 있으면 전송
                 if session.connected_socket:
                     try:
+                        start = time.perf_counter()
                         await session.connected_socket.send_text(output)
+                        WS_SEND_SECONDS.observe(time.perf_counter() - start)
                     except Exception as e:
+                        WS_SEND_ERRORS.inc()
                         logger.warning(f"WebSocket 전송 실패 ({session_id}): {e}")
                         session.connected_socket = None
             except Exception as e:
                 logger.error(f"출력 처리 에러 ({session_id}): {e}")
+            finally:
+                session.pending_outputs -= 1
+                session.pending_bytes -= len(data)
+                PTY_OUTPUT_PENDING.dec()
 
         # 이벤트 루프에 파일 디스크립터 리더 등록 (데이터 도착 즉시 콜백)
         loop.add_reader(session.process.fd, read_and_send)
@@ -304,6 +331,55 @@ class PtyManager:
             for sid, session in self.sessions.items()
         ]
 
+    def memory_usage(self) -> list:
+        """
+        세션별 메모리 사용 추정 (프로파일링용)
+
+        Returns:
+            세션별 대기 중인 출력 태스크/바이트, WebSocket 송신 버퍼 크기 리스트
+        """
+        return [
+            {
+                "session_id": sid,
+                "alive": session.process.isalive(),
+                "connected": session.connected_socket is not None,
+                "pending_outputs": session.pending_outputs,
+                "pending_bytes": session.pending_bytes,
+                "socket_buffer_bytes": _socket_buffer_size(session.connected_socket)
+            }
+            for sid, session in self.sessions.items()
+        ]
+
+
+def _socket_buffer_size(websocket: Optional[WebSocket]) -> Optional[int]:
+    """WebSocket 전송 계층의 송신 버퍼 크기 (uvicorn 프로토콜에서만 확인 가능, 그 외 None)"""
+    if websocket is None:
+        return None
+    protocol = getattr(getattr(websocket, "_send", None), "__self__", None)
+    transport = getattr(protocol, "transport", None)
+    try:
+        return transport.get_write_buffer_size()
+    except Exception:
+        return None
+
 
 # 전역 PTY 매니저 인스턴스 (storage는 main.py에서 주입)
 pty_manager = PtyManager()
+
+
+@metrics.collector
+def _collect_sessions():
+    """세션 상태별 개수와 세션별 전송 대기 청크 수"""
+    counts = {"attached": 0, "detached": 0, "exited": 0}
+    depths = []
+    for session_id, session in pty_manager.sessions.items():
+        if not session.process.isalive():
+            counts["exited"] += 1
+        elif session.connected_socket is not None:
+            counts["attached"] += 1
+            depths.append(({"session_id": session_id}, session.pending_outputs))
+        else:
+            counts["detached"] += 1
+
+    yield "pty_sessions", "gauge", "PTY sessions by state", [({"state": k}, v) for k, v in counts.items()]
+    yield "websocket_send_queue_depth", "gauge", "Output chunks queued for an attached WebSocket", depths
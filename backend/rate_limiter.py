@@ -0,0 +1,227 @@
+"""
+로그인 요청 제한 (무차별 대입 방지)
+IP별/사용자명별 토큰 버킷 + 연속 실패 시 지수적으로 늘어나는 잠금
+거부는 비밀번호 해싱 전에 O(1)로 판단하므로 공격 요청이 CPU를 쓰지 않음
+"""
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# system_config에 저장하는 키
+STATE_CONFIG_KEY = "login_rate_limit_state"
+
+# 상태 저장 지연 (초) - 공격 중에도 실패마다 DB에 쓰지 않도록 묶어서 저장
+SAVE_DELAY = 5.0
+
+
+class _LimitEntry:
+    """키 하나(IP 또는 사용자명)의 제한 상태"""
+
+    __slots__ = ("tokens", "updated", "failures", "locked_until")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.failures = 0
+        self.locked_until = 0.0
+
+
+class LoginRateLimiter:
+    """
+    로그인 요청 제한기
+
+    - 토큰 버킷: 분당 허용 횟수만큼 채워지며 버킷이 비면 거부
+    - 잠금: 연속 실패가 임계값을 넘으면 lockout_base * 2^(초과 횟수)초 동안 거부 (최대 lockout_max)
+    - 추적하는 키 수는 LRU로 제한 (다수 IP에서 오는 요청에도 메모리 일정)
+    """
+
+    def __init__(
+        self,
+        ip_per_minute: float = None,
+        user_per_minute: float = None,
+        lockout_threshold: int = None,
+        lockout_base: float = None,
+        lockout_max: float = None,
+        max_keys: int = None
+    ):
+        if ip_per_minute is None:
+            ip_per_minute = float(os.getenv("LOGIN_RATE_IP_PER_MINUTE", "10"))
+        if user_per_minute is None:
+            user_per_minute = float(os.getenv("LOGIN_RATE_USER_PER_MINUTE", "5"))
+        if lockout_threshold is None:
+            lockout_threshold = int(os.getenv("LOGIN_LOCKOUT_THRESHOLD", "5"))
+        if lockout_base is None:
+            lockout_base = float(os.getenv("LOGIN_LOCKOUT_BASE", "30"))
+        if lockout_max is None:
+            lockout_max = float(os.getenv("LOGIN_LOCKOUT_MAX", "900"))
+        if max_keys is None:
+            max_keys = int(os.getenv("LOGIN_RATE_MAX_KEYS", "10000"))
+
+        # 종류별 (용량, 초당 충전량)
+        self._limits = {
+            "ip": (ip_per_minute, ip_per_minute / 60.0),
+            "user": (user_per_minute, user_per_minute / 60.0),
+        }
+        self.lockout_threshold = lockout_threshold
+        self.lockout_base = lockout_base
+        self.lockout_max = lockout_max
+        self.max_keys = max_keys
+
+        self._entries: "OrderedDict[Tuple[str, str], _LimitEntry]" = OrderedDict()
+        self.rejected = 0
+
+        self._storage = None
+        self._save_task: Optional[asyncio.Task] = None
+
+    def _entry(self, kind: str, value: str, now: float) -> _LimitEntry:
+        """키 상태 조회/생성 (토큰 충전 포함)"""
+        key = (kind, value)
+        capacity, refill = self._limits[kind]
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _LimitEntry(capacity, now)
+            if len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+            entry.tokens = min(capacity, entry.tokens + (now - entry.updated) * refill)
+            entry.updated = now
+        return entry
+
+    def _keys(self, ip: str, username: Optional[str]):
+        keys = [("ip", ip)]
+        if username:
+            keys.append(("user", username.strip().lower()[:256]))
+        return keys
+
+    def check(self, ip: str, username: Optional[str] = None) -> Optional[int]:
+        """
+        로그인 시도 허용 여부 확인 (허용 시 토큰 소비)
+
+        Args:
+            ip: 클라이언트 IP
+            username: 시도한 사용자명
+
+        Returns:
+            거부 시 다시 시도할 수 있을 때까지의 초 (Retry-After), 허용 시 None
+        """
+        now = time.time()
+        entries = [(kind, self._entry(kind, value, now)) for kind, value in self._keys(ip, username)]
+
+        retry_after = 0.0
+        for kind, entry in entries:
+            if entry.locked_until > now:
+                retry_after = max(retry_after, entry.locked_until - now)
+            elif entry.tokens < 1:
+                retry_after = max(retry_after, (1 - entry.tokens) / self._limits[kind][1])
+
+        if retry_after > 0:
+            self.rejected += 1
+            return max(1, math.ceil(retry_after))
+
+        for _, entry in entries:
+            entry.tokens -= 1
+        return None
+
+    def record_failure(self, ip: str, username: Optional[str] = None):
+        """로그인 실패 기록 (임계값을 넘으면 잠금)"""
+        now = time.time()
+        for kind, value in self._keys(ip, username):
+            entry = self._entry(kind, value, now)
+            entry.failures += 1
+            excess = entry.failures - self.lockout_threshold
+            if excess >= 0:
+                duration = min(self.lockout_max, self.lockout_base * (2 ** min(excess, 32)))
+                entry.locked_until = now + duration
+                logger.warning(f"로그인 잠금: {kind}={value} ({entry.failures}회 실패, {duration:.0f}초)")
+        self._schedule_save()
+
+    def record_success(self, ip: str, username: Optional[str] = None):
+        """로그인 성공 시 실패 기록 초기화"""
+        changed = False
+        for key in self._keys(ip, username):
+            entry = self._entries.get(key)
+            if entry is not None and (entry.failures or entry.locked_until):
+                entry.failures = 0
+                entry.locked_until = 0.0
+                changed = True
+        if changed:
+            self._schedule_save()
+
+    def stats(self) -> dict:
+        """제한 통계"""
+        now = time.time()
+        return {
+            "tracked": len(self._entries),
+            "locked": sum(1 for entry in self._entries.values() if entry.locked_until > now),
+            "rejected": self.rejected
+        }
+
+    # ==================== 상태 저장 (재시작 후에도 잠금 유지) ====================
+
+    async def load(self, storage):
+        """
+        저장된 실패/잠금 상태 복원 및 이후 변경 저장 활성화
+
+        Args:
+            storage: get_config/set_config를 제공하는 스토리지
+        """
+        self._storage = storage
+        raw = await storage.get_config(STATE_CONFIG_KEY)
+        if not raw:
+            return
+
+        try:
+            state = json.loads(raw)
+        except ValueError:
+            logger.warning("저장된 로그인 제한 상태를 읽을 수 없음, 무시")
+            return
+
+        now = time.time()
+        restored = 0
+        for kind, value, failures, locked_until in state:
+            if kind not in self._limits:
+                continue
+            entry = self._entry(kind, value, now)
+            entry.failures = failures
+            entry.locked_until = locked_until
+            restored += 1
+        if restored:
+            logger.info(f"로그인 제한 상태 복원: {restored}개")
+
+    async def save(self):
+        """실패 기록이 있는 항목만 저장"""
+        if self._storage is None:
+            return
+
+        now = time.time()
+        state = [
+            [kind, value, entry.failures, entry.locked_until]
+            for (kind, value), entry in self._entries.items()
+            if entry.failures and (entry.locked_until > now or now - entry.updated < self.lockout_max)
+        ]
+        await self._storage.set_config(STATE_CONFIG_KEY, json.dumps(state))
+
+    def _schedule_save(self):
+        """변경을 모아서 저장 (SAVE_DELAY 뒤 한 번)"""
+        if self._storage is None or (self._save_task is not None and not self._save_task.done()):
+            return
+        self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self):
+        await asyncio.sleep(SAVE_DELAY)
+        try:
+            await self.save()
+        except Exception as e:
+            logger.error(f"로그인 제한 상태 저장 실패: {e}")
+
+
+# 전역 로그인 제한기 인스턴스
+login_limiter = LoginRateLimiter()
@@ -0,0 +1,106 @@
+"""
+세션 녹화 내보내기
+저장된 히스토리를 asciicast v2 형식으로 스트리밍 변환
+"""
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from archive_stream import ZipStreamWriter
+
+ASCIICAST_VERSION = 2
+
+
+def _to_epoch(timestamp: str) -> float:
+    """저장된 UTC ISO 타임스탬프를 epoch 초로 변환"""
+    return datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _header_line(width: int, height: int, timestamp: float, title: Optional[str]) -> bytes:
+    """asciicast v2 헤더 라인 생성"""
+    header = {
+        "version": ASCIICAST_VERSION,
+        "width": width,
+        "height": height,
+        "timestamp": int(timestamp),
+        "env": {"TERM": "xterm-256color"}
+    }
+    if title:
+        header["title"] = title
+    return json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+async def iter_asciicast(
+    storage,
+    session_id: str,
+    width: int = 80,
+    height: int = 24,
+    title: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """
+    세션 히스토리를 asciicast v2 라인으로 변환하며 순회
+
+    히스토리는 배치 단위로 읽으므로 세션 길이와 무관하게 메모리 사용량이 일정함
+
+    Args:
+        storage: SQLiteStorage 인스턴스
+        session_id: 세션 ID
+        width: 터미널 너비
+        height: 터미널 높이
+        title: 녹화 제목
+
+    Yields:
+        헤더 1줄 + 출력 이벤트 라인 (UTF-8 바이트)
+    """
+    start = None
+    async for _, chunk, timestamp in storage.iter_history(session_id):
+        ts = _to_epoch(timestamp)
+        if start is None:
+            start = ts
+            yield _header_line(width, height, start, title)
+
+        # 청크 저장 시각 기준 상대 시간 (초)
+        event = [round(max(ts - start, 0.0), 6), "o", chunk]
+        yield json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    if start is None:
+        # 히스토리가 없어도 재생 가능한 빈 녹화 반환
+        yield _header_line(width, height, datetime.now(timezone.utc).timestamp(), title)
+
+
+async def iter_asciicast_archive(
+    storage,
+    sessions: List[Dict],
+    sizes: Dict[str, Tuple[int, int]]
+) -> AsyncIterator[bytes]:
+    """
+    여러 세션을 .cast 파일 묶음 ZIP으로 스트리밍
+
+    Args:
+        storage: SQLiteStorage 인스턴스
+        sessions: 세션 정보 리스트 (id, name)
+        sizes: 세션 ID별 (width, height)
+
+    Yields:
+        ZIP 바이트
+    """
+    writer = ZipStreamWriter()
+
+    for session in sessions:
+        session_id = session["id"]
+        width, height = sizes.get(session_id, (80, 24))
+
+        data = writer.open_entry(f"{session_id}.cast")
+        if data:
+            yield data
+
+        async for line in iter_asciicast(storage, session_id, width, height, session.get("name")):
+            data = writer.write(line)
+            if data:
+                yield data
+
+        data = writer.close_entry()
+        if data:
+            yield data
+
+    yield writer.close()
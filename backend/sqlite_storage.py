@@ -4,9 +4,120 @@ SQLite Storage Manager
 """
 import sqlite3
 import asyncio
-from typing import List, Optional, Dict
-from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Set, Tuple
+from datetime import datetime, timedelta
+import logging
 import os
+import threading
+
+from metrics import metrics, timed
+
+logger = logging.getLogger(__name__)
+
+# 메서드별 처리 시간 (스레드 풀 대기 포함)
+STORAGE_SECONDS = metrics.histogram(
+    "storage_operation_seconds", "SQLiteStorage operation latency by method", ("method",)
+)
+
+# 할당량 초과 시 정책
+# - drop_oldest: 계속 기록하고 오래된 청크를 삭제
+# - stop: 더 이상 기록하지 않음
+# - downsample: N개 중 1개만 기록하고 오래된 청크를 삭제
+QUOTA_POLICIES = ("drop_oldest", "stop", "downsample")
+
+# 할당량 초과로 정리할 때 남길 비율 (매 append마다 정리하지 않도록 여유를 둠)
+QUOTA_TRIM_RATIO = 0.9
+
+
+class HistorySnapshot:
+    """
+    한 읽기 트랜잭션에 고정된 세션 히스토리
+
+    SQLiteStorage.open_history_snapshot()으로 생성.
+    쿼리는 잠금으로 하나씩 실행되며 close()는 여러 번 호출해도 됨
+    """
+
+    def __init__(self, conn: sqlite3.Connection, session_id: str, size: int):
+        self._conn: Optional[sqlite3.Connection] = conn
+        self._lock = threading.Lock()
+        self.session_id = session_id
+        self.size = size
+
+    def _query(self, sql: str, params: tuple) -> List[sqlite3.Row]:
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("history snapshot is closed")
+            return self._conn.execute(sql, params).fetchall()
+
+    def _locate(self, offset: int) -> Optional[Tuple[int, int]]:
+        """바이트 오프셋이 위치한 청크의 (seq, 청크 내부 바이트 오프셋)"""
+        rows = self._query("""
+            SELECT id, end_offset - size AS start_offset FROM (
+                SELECT id, size, SUM(size) OVER (ORDER BY id) AS end_offset
+                FROM session_history
+                WHERE session_id = ?
+            )
+            WHERE end_offset > ?
+            ORDER BY id ASC
+            LIMIT 1
+        """, (self.session_id, offset))
+
+        if not rows:
+            return None
+        return rows[0]["id"], offset - rows[0]["start_offset"]
+
+    async def iter_bytes(self, start: int, end: int, batch_size: int = 256) -> AsyncIterator[bytes]:
+        """
+        바이트 범위 순회
+
+        Args:
+            start: 시작 바이트 오프셋
+            end: 끝 바이트 오프셋 (포함)
+            batch_size: 한 번에 조회할 청크 수
+
+        Yields:
+            UTF-8 바이트 조각
+        """
+        if start > end:
+            return
+
+        located = await asyncio.to_thread(self._locate, start)
+        if located is None:
+            return
+
+        first_seq, skip = located
+        remaining = end - start + 1
+        last_id = first_seq - 1
+        while True:
+            rows = await asyncio.to_thread(
+                self._query,
+                "SELECT id, chunk FROM session_history WHERE session_id = ? AND id > ? ORDER BY id ASC LIMIT ?",
+                (self.session_id, last_id, batch_size)
+            )
+            for row in rows:
+                data = row["chunk"].encode("utf-8")
+                if skip:
+                    data = data[skip:]
+                    skip = 0
+                if len(data) > remaining:
+                    data = data[:remaining]
+                remaining -= len(data)
+                yield data
+                if remaining <= 0:
+                    return
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]["id"]
+
+    def _close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def close(self):
+        """읽기 트랜잭션 종료"""
+        await asyncio.to_thread(self._close)
 
 
 class SQLiteStorage:
@@ -17,6 +128,34 @@ class SQLiteStorage:
             # 환경 변수 또는 기본값 사용
             db_path = os.getenv("DB_PATH", "./data/iterminallist.db")
         self.db_path = db_path
+
+        # 세션 메타데이터 캐시 (session_id -> 세션 정보)
+        self._session_cache: Dict[str, Dict[str, str]] = {}
+        self._user_sessions: Dict[str, Set[str]] = {}
+        self._session_cache_loaded = False
+
+        # flush 대기 중인 last_active 갱신 (session_id -> ISO 시각)
+        self._dirty_activity: Dict[str, str] = {}
+        self.flush_interval = float(os.getenv("SESSION_FLUSH_INTERVAL", "5"))
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # 마지막 유지보수 결과
+        self.last_maintenance: Optional[Dict] = None
+
+        # 히스토리 사용량 카운터 (session_id -> [바이트, 청크 수]), 사용자별 바이트 합계
+        self._usage: Dict[str, List[int]] = {}
+        self._user_bytes: Dict[str, int] = {}
+
+        # 히스토리 할당량 (바이트, 0이면 무제한) 및 초과 시 정책
+        self.session_quota = int(os.getenv("SESSION_HISTORY_QUOTA", str(16 * 1024 * 1024)))
+        self.user_quota = int(os.getenv("USER_HISTORY_QUOTA", str(256 * 1024 * 1024)))
+        self.quota_policy = os.getenv("HISTORY_QUOTA_POLICY", "drop_oldest")
+        if self.quota_policy not in QUOTA_POLICIES:
+            raise ValueError(f"알 수 없는 할당량 정책: {self.quota_policy}")
+        self.downsample_rate = max(int(os.getenv("HISTORY_DOWNSAMPLE_RATE", "10")), 1)
+        self._downsample_counters: Dict[str, int] = {}
+        self._quota_notified: Set[str] = set()
+
         self._ensure_directory()
         self._init_db()
 
@@ -35,6 +174,23 @@ class SQLiteStorage:
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        # 빈 페이지를 점진적으로 반환할 수 있도록 incremental auto_vacuum 사용
+        # 새 DB는 생성 시 설정, 기존 DB 변환은 전체 VACUUM(긴 배타적 잠금)이 필요하므로
+        # DB_VACUUM_ON_START=true 또는 POST /api/storage/maintenance?vacuum=true로만 실행
+        cursor.execute("PRAGMA page_count")
+        if cursor.fetchone()[0] == 0:
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        cursor.execute("PRAGMA auto_vacuum")
+        self.incremental_vacuum = cursor.fetchone()[0] == 2
+        if not self.incremental_vacuum:
+            if os.getenv("DB_VACUUM_ON_START", "false").lower() == "true":
+                self._convert_incremental_vacuum(conn)
+            else:
+                logger.info("incremental auto_vacuum 미적용 DB (POST /api/storage/maintenance?vacuum=true로 변환)")
+
+        # WAL 모드: 유지보수 중에도 읽기/쓰기가 서로 막지 않도록
+        cursor.execute("PRAGMA journal_mode = WAL")
+
         # 관리자 계정 테이블
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS admin (
@@ -63,6 +219,7 @@ class SQLiteStorage:
                 session_id TEXT NOT NULL,
                 chunk TEXT NOT NULL,
                 timestamp TEXT NOT NULL,
+                size INTEGER NOT NULL DEFAULT 0,
                 UNIQUE(session_id, id)
             )
         """)
@@ -86,6 +243,15 @@ class SQLiteStorage:
             # 컬럼이 이미 존재하면 무시
             pass
 
+        # Migration: size 컬럼 추가 (청크 UTF-8 바이트 수, 사용량 집계용)
+        try:
+            cursor.execute("ALTER TABLE session_history ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+            cursor.execute("UPDATE session_history SET size = length(CAST(chunk AS BLOB))")
+            conn.commit()
+        except sqlite3.OperationalError:
+            # 컬럼이 이미 존재하면 무시
+            pass
+
         # 시스템 설정 테이블 (JWT SECRET_KEY 저장용)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS system_config (
@@ -100,6 +266,7 @@ class SQLiteStorage:
 
     # ==================== 관리자 계정 관리 ====================
 
+    @timed(STORAGE_SECONDS)
     async def admin_exists(self) -> bool:
         """관리자 계정 존재 여부 확인"""
         def _check():
@@ -112,6 +279,7 @@ class SQLiteStorage:
 
         return await asyncio.to_thread(_check)
 
+    @timed(STORAGE_SECONDS)
     async def create_admin(self, username: str, password_hash: str) -> bool:
         """관리자 계정 생성"""
         def _create():
@@ -130,6 +298,7 @@ class SQLiteStorage:
 
         return await asyncio.to_thread(_create)
 
+    @timed(STORAGE_SECONDS)
     async def get_admin(self) -> Optional[Dict[str, str]]:
         """관리자 정보 조회"""
         def _get():
@@ -151,35 +320,195 @@ class SQLiteStorage:
 
     # ==================== 세션 히스토리 관리 ====================
 
-    async def append_history(self, session_id: str, data: str):
-        """세션 히스토리 추가"""
+    @timed(STORAGE_SECONDS)
+    async def append_history(self, session_id: str, data: str) -> bool:
+        """
+        세션 히스토리 추가 (할당량 정책 적용)
+
+        Args:
+            session_id: 세션 ID
+            data: 터미널 출력
+
+        Returns:
+            기록 여부 (할당량 정책으로 버려지면 False)
+        """
+        await self._ensure_session_cache()
+        size = len(data.encode("utf-8"))
+
+        session_excess, user_excess = self._quota_excess(session_id, size)
+        if session_excess > 0 or user_excess > 0:
+            if session_id not in self._quota_notified:
+                self._quota_notified.add(session_id)
+                logger.warning(f"히스토리 할당량 초과 ({session_id}, 정책: {self.quota_policy})")
+
+            if self.quota_policy == "stop":
+                return False
+            if self.quota_policy == "downsample":
+                count = self._downsample_counters.get(session_id, 0) + 1
+                self._downsample_counters[session_id] = count
+                if count % self.downsample_rate:
+                    return False
+        else:
+            self._quota_notified.discard(session_id)
+            self._downsample_counters.pop(session_id, None)
+
+        username = self._session_cache.get(session_id, {}).get("username")
+
         def _append():
             conn = self._get_connection()
             cursor = conn.cursor()
 
             # 새 청크 추가
             cursor.execute(
-                "INSERT INTO session_history (session_id, chunk, timestamp) VALUES (?, ?, ?)",
-                (session_id, data, datetime.utcnow().isoformat())
+                "INSERT INTO session_history (session_id, chunk, timestamp, size) VALUES (?, ?, ?, ?)",
+                (session_id, data, datetime.utcnow().isoformat(), size)
             )
+            new_id = cursor.lastrowid
 
-            # 최근 10,000개만 유지 (오래된 것 삭제)
-            cursor.execute("""
-                DELETE FROM session_history
-                WHERE session_id = ?
-                AND id NOT IN (
-                    SELECT id FROM session_history
-                    WHERE session_id = ?
-                    ORDER BY id DESC
-                    LIMIT 10000
-                )
-            """, (session_id, session_id))
+            # 할당량을 넘었으면 같은 트랜잭션에서 오래된 청크 삭제
+            # - 세션 할당량: 이 세션의 오래된 청크
+            # - 사용자 할당량: 남은 초과분만큼 사용자의 모든 세션에서 가장 오래된 청크
+            freed: Dict[str, List[int]] = {}
+            if session_excess > 0:
+                freed = self._delete_oldest(cursor, session_excess, new_id, session_id=session_id)
+            remaining = user_excess - sum(usage[0] for usage in freed.values())
+            if remaining > 0 and username is not None:
+                for sid, (freed_bytes, freed_chunks) in self._delete_oldest(
+                    cursor, remaining, new_id, username=username
+                ).items():
+                    usage = freed.setdefault(sid, [0, 0])
+                    usage[0] += freed_bytes
+                    usage[1] += freed_chunks
 
             conn.commit()
             conn.close()
+            return freed
+
+        freed = await asyncio.to_thread(_append)
+        freed_bytes, freed_chunks = freed.pop(session_id, (0, 0))
+        self._account(session_id, size - freed_bytes, 1 - freed_chunks)
+        for sid, (other_bytes, other_chunks) in freed.items():
+            self._account(sid, -other_bytes, -other_chunks)
+        return True
+
+    def _quota_excess(self, session_id: str, size: int) -> Tuple[int, int]:
+        """
+        size 바이트를 추가할 때 할당량을 넘는지 확인
+
+        Returns:
+            (세션, 사용자) 각각 목표치(할당량의 QUOTA_TRIM_RATIO)까지 줄이려면 삭제해야 할 바이트
+            (초과가 아니면 0)
+        """
+        session_excess = 0
+        session_bytes = self._usage.get(session_id, (0, 0))[0]
+        if self.session_quota and session_bytes + size > self.session_quota:
+            session_excess = session_bytes + size - int(self.session_quota * QUOTA_TRIM_RATIO)
 
-        await asyncio.to_thread(_append)
+        user_excess = 0
+        session = self._session_cache.get(session_id)
+        if session and self.user_quota:
+            user_bytes = self._user_bytes.get(session["username"], 0)
+            if user_bytes + size > self.user_quota:
+                user_excess = user_bytes + size - int(self.user_quota * QUOTA_TRIM_RATIO)
+
+        return session_excess, user_excess
+
+    @staticmethod
+    def _delete_oldest(
+        cursor: sqlite3.Cursor,
+        target_bytes: int,
+        before_id: int,
+        session_id: str = None,
+        username: str = None
+    ) -> Dict[str, List[int]]:
+        """
+        세션(session_id) 또는 사용자의 모든 세션(username)에서
+        가장 오래된 청크를 target_bytes 이상 삭제 (before_id 미만만)
+
+        Returns:
+            세션별 [삭제된 바이트, 삭제된 청크 수]
+        """
+        if session_id is not None:
+            query = (
+                "SELECT id, session_id, size FROM session_history "
+                "WHERE session_id = ? AND id < ? ORDER BY id ASC LIMIT 256"
+            )
+            params = (session_id, before_id)
+        else:
+            query = (
+                "SELECT h.id, h.session_id, h.size FROM session_history h "
+                "JOIN sessions s ON s.session_id = h.session_id "
+                "WHERE s.username = ? AND h.id < ? ORDER BY h.id ASC LIMIT 256"
+            )
+            params = (username, before_id)
+
+        freed: Dict[str, List[int]] = {}
+        freed_bytes = 0
+        while freed_bytes < target_bytes:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            if not rows:
+                break
 
+            ids = []
+            for row in rows:
+                ids.append(row["id"])
+                usage = freed.setdefault(row["session_id"], [0, 0])
+                usage[0] += row["size"]
+                usage[1] += 1
+                freed_bytes += row["size"]
+                if freed_bytes >= target_bytes:
+                    break
+
+            cursor.execute(
+                f"DELETE FROM session_history WHERE id IN ({','.join('?' * len(ids))})",
+                ids
+            )
+
+        return freed
+
+    # ==================== 사용량 집계 ====================
+
+    def _account(self, session_id: str, delta_bytes: int, delta_chunks: int):
+        """세션/사용자 사용량 카운터 증감"""
+        usage = self._usage.setdefault(session_id, [0, 0])
+        usage[0] = max(usage[0] + delta_bytes, 0)
+        usage[1] = max(usage[1] + delta_chunks, 0)
+
+        session = self._session_cache.get(session_id)
+        if session:
+            username = session["username"]
+            self._user_bytes[username] = max(self._user_bytes.get(username, 0) + delta_bytes, 0)
+
+    def _reset_usage(self, session_id: str):
+        """세션 히스토리가 모두 삭제되었을 때 카운터 초기화"""
+        usage = self._usage.pop(session_id, None)
+        self._downsample_counters.pop(session_id, None)
+        self._quota_notified.discard(session_id)
+
+        session = self._session_cache.get(session_id)
+        if usage and session:
+            username = session["username"]
+            self._user_bytes[username] = max(self._user_bytes.get(username, 0) - usage[0], 0)
+
+    def get_usage(self, session_id: str) -> Dict[str, int]:
+        """세션 히스토리 사용량"""
+        history_bytes, history_chunks = self._usage.get(session_id, (0, 0))
+        return {"bytes": history_bytes, "chunks": history_chunks}
+
+    @timed(STORAGE_SECONDS)
+    async def get_user_usage(self, username: str) -> Dict:
+        """사용자 히스토리 사용량 및 할당량"""
+        await self._ensure_session_cache()
+        return {
+            "bytes": self._user_bytes.get(username, 0),
+            "sessions": len(self._user_sessions.get(username, ())),
+            "user_quota": self.user_quota,
+            "session_quota": self.session_quota,
+            "policy": self.quota_policy
+        }
+
+    @timed(STORAGE_SECONDS)
     async def get_history(self, session_id: str) -> List[str]:
         """세션 히스토리 조회"""
         def _get():
@@ -197,6 +526,149 @@ class SQLiteStorage:
 
         return await asyncio.to_thread(_get)
 
+    @timed(STORAGE_SECONDS)
+    async def get_history_page(
+        self,
+        session_id: str,
+        before: Optional[int] = None,
+        after: Optional[int] = None,
+        limit: int = 500
+    ) -> Dict:
+        """
+        세션 히스토리 페이지 조회 (시퀀스 번호 기반 커서)
+
+        Args:
+            session_id: 세션 ID
+            before: 이 시퀀스 번호보다 이전 청크 조회 (없으면 최신 페이지)
+            after: 이 시퀀스 번호보다 이후 청크 조회
+            limit: 최대 청크 수
+
+        Returns:
+            chunks (오름차순 (seq, chunk) 리스트), has_more_before, has_more_after
+        """
+        def _get():
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            # limit + 1개를 조회해서 다음 페이지 존재 여부 판단
+            if after is not None:
+                cursor.execute(
+                    "SELECT id, chunk FROM session_history WHERE session_id = ? AND id > ? ORDER BY id ASC LIMIT ?",
+                    (session_id, after, limit + 1)
+                )
+                rows = cursor.fetchall()
+                has_more_after = len(rows) > limit
+                rows = rows[:limit]
+                has_more_before = None
+            else:
+                if before is not None:
+                    cursor.execute(
+                        "SELECT id, chunk FROM session_history WHERE session_id = ? AND id < ? ORDER BY id DESC LIMIT ?",
+                        (session_id, before, limit + 1)
+                    )
+                else:
+                    cursor.execute(
+                        "SELECT id, chunk FROM session_history WHERE session_id = ? ORDER BY id DESC LIMIT ?",
+                        (session_id, limit + 1)
+                    )
+                rows = cursor.fetchall()
+                has_more_before = len(rows) > limit
+                rows = list(reversed(rows[:limit]))
+                has_more_after = None if before is not None else False
+
+            # 반대 방향의 존재 여부는 경계 시퀀스 하나만 확인
+            if rows and has_more_before is None:
+                cursor.execute(
+                    "SELECT 1 FROM session_history WHERE session_id = ? AND id < ? LIMIT 1",
+                    (session_id, rows[0]["id"])
+                )
+                has_more_before = cursor.fetchone() is not None
+            if rows and has_more_after is None:
+                cursor.execute(
+                    "SELECT 1 FROM session_history WHERE session_id = ? AND id > ? LIMIT 1",
+                    (session_id, rows[-1]["id"])
+                )
+                has_more_after = cursor.fetchone() is not None
+            conn.close()
+
+            return {
+                "chunks": [(row["id"], row["chunk"]) for row in rows],
+                "has_more_before": bool(has_more_before),
+                "has_more_after": bool(has_more_after)
+            }
+
+        return await asyncio.to_thread(_get)
+
+    async def iter_history(
+        self,
+        session_id: str,
+        after: int = 0,
+        batch_size: int = 256
+    ) -> AsyncIterator[Tuple[int, str, str]]:
+        """
+        세션 히스토리를 배치 단위로 순회 (전체를 메모리에 올리지 않음)
+
+        Args:
+            session_id: 세션 ID
+            after: 이 시퀀스 번호 이후부터 순회
+            batch_size: 한 번에 조회할 청크 수
+
+        Yields:
+            (seq, chunk, timestamp) 튜플
+        """
+        def _fetch(last_id: int):
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, chunk, timestamp FROM session_history WHERE session_id = ? AND id > ? ORDER BY id ASC LIMIT ?",
+                (session_id, last_id, batch_size)
+            )
+            rows = cursor.fetchall()
+            conn.close()
+            return [(row["id"], row["chunk"], row["timestamp"]) for row in rows]
+
+        last_id = after
+        while True:
+            rows = await asyncio.to_thread(_fetch, last_id)
+            for row in rows:
+                yield row
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1][0]
+
+    @timed(STORAGE_SECONDS)
+    async def open_history_snapshot(self, session_id: str) -> "HistorySnapshot":
+        """
+        세션 히스토리 읽기 스냅샷 열기 (바이트 범위 응답용)
+
+        크기 계산, 오프셋 위치 찾기, 본문 읽기가 모두 같은 읽기 트랜잭션에서 실행되므로
+        스트리밍 도중 기록되거나 할당량 정리로 삭제된 청크의 영향을 받지 않음.
+        사용 후 반드시 close() 호출
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            HistorySnapshot
+        """
+        def _open():
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            try:
+                # WAL 모드에서는 첫 SELECT 시점의 스냅샷이 트랜잭션이 끝날 때까지 유지됨
+                conn.execute("BEGIN")
+                row = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) AS size FROM session_history WHERE session_id = ?",
+                    (session_id,)
+                ).fetchone()
+            except Exception:
+                conn.close()
+                raise
+            return HistorySnapshot(conn, session_id, row["size"])
+
+        return await asyncio.to_thread(_open)
+
+    @timed(STORAGE_SECONDS)
     async def delete_history(self, session_id: str):
         """세션 히스토리 삭제"""
         def _delete():
@@ -207,37 +679,403 @@ class SQLiteStorage:
             conn.close()
 
         await asyncio.to_thread(_delete)
+        self._reset_usage(session_id)
+
+    @timed(STORAGE_SECONDS)
+    async def cleanup_old_sessions(
+        self,
+        older_than_hours: int = 24,
+        exclude: Iterable[str] = (),
+        batch_size: int = 500
+    ) -> int:
+        """
+        오래된 히스토리 청크 정리 (작은 배치 단위로 삭제)
+
+        id 순서가 저장 시각 순서와 같으므로 id 순으로 훑다가
+        기준 시각 이후 청크를 만나면 중단함
 
-    async def cleanup_old_sessions(self, older_than_hours: int = 24):
-        """오래된 세션 정리"""
-        def _cleanup():
+        Args:
+            older_than_hours: 보관 기간 (시간)
+            exclude: 정리하지 않을 세션 ID (연결 중인 세션)
+            batch_size: 한 트랜잭션에서 삭제할 최대 청크 수
+
+        Returns:
+            삭제된 청크 수
+        """
+        cutoff_iso = (datetime.utcnow() - timedelta(hours=older_than_hours)).isoformat()
+        excluded = set(exclude)
+
+        def _delete_batch(last_id: int):
             conn = self._get_connection()
             cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, session_id, timestamp, size FROM session_history WHERE id > ? ORDER BY id ASC LIMIT ?",
+                (last_id, batch_size)
+            )
+            rows = cursor.fetchall()
 
-            # 24시간 이상 된 세션 삭제
-            cutoff = datetime.utcnow().timestamp() - (older_than_hours * 3600)
-            cutoff_iso = datetime.fromtimestamp(cutoff).isoformat()
+            done = len(rows) < batch_size
+            ids = []
+            freed: Dict[str, List[int]] = {}
+            for row in rows:
+                if row["timestamp"] >= cutoff_iso:
+                    done = True
+                    break
+                last_id = row["id"]
+                if row["session_id"] not in excluded:
+                    ids.append(row["id"])
+                    session_freed = freed.setdefault(row["session_id"], [0, 0])
+                    session_freed[0] += row["size"]
+                    session_freed[1] += 1
 
+            if ids:
+                cursor.execute(
+                    f"DELETE FROM session_history WHERE id IN ({','.join('?' * len(ids))})",
+                    ids
+                )
+                conn.commit()
+            conn.close()
+            return freed, last_id, done
+
+        deleted = 0
+        last_id = 0
+        while True:
+            freed, last_id, done = await asyncio.to_thread(_delete_batch, last_id)
+            for session_id, (freed_bytes, freed_chunks) in freed.items():
+                self._account(session_id, -freed_bytes, -freed_chunks)
+                deleted += freed_chunks
+            if done:
+                break
+            # 배치 사이에 다른 쓰기 작업(실시간 출력 저장)이 끼어들 수 있도록 양보
+            await asyncio.sleep(0)
+
+        return deleted
+
+    @timed(STORAGE_SECONDS)
+    async def trim_history(
+        self,
+        max_chunks: int,
+        exclude: Iterable[str] = (),
+        batch_size: int = 500
+    ) -> int:
+        """
+        청크 수 제한 및 세션 할당량을 넘은 세션의 오래된 청크 삭제
+
+        대상 세션은 COUNT(*) 집계 대신 사용량 카운터로 선정함
+
+        Args:
+            max_chunks: 세션별 최대 청크 수
+            exclude: 정리하지 않을 세션 ID
+            batch_size: 한 트랜잭션에서 삭제할 최대 청크 수
+
+        Returns:
+            삭제된 청크 수
+        """
+        await self._ensure_session_cache()
+        excluded = set(exclude)
+
+        def _delete_batch(session_id: str, limit: int):
+            conn = self._get_connection()
+            cursor = conn.cursor()
             cursor.execute(
-                "DELETE FROM session_history WHERE timestamp < ?",
-                (cutoff_iso,)
+                "SELECT id, size FROM session_history WHERE session_id = ? ORDER BY id ASC LIMIT ?",
+                (session_id, limit)
             )
+            rows = cursor.fetchall()
+            if rows:
+                cursor.execute(
+                    "DELETE FROM session_history WHERE session_id = ? AND id <= ?",
+                    (session_id, rows[-1]["id"])
+                )
+                conn.commit()
+            conn.close()
+            return sum(row["size"] for row in rows), len(rows)
+
+        over_limit = [
+            session_id
+            for session_id, (history_bytes, history_chunks) in self._usage.items()
+            if session_id not in excluded and (
+                history_chunks > max_chunks
+                or (self.session_quota and history_bytes > self.session_quota)
+            )
+        ]
+
+        deleted = 0
+        for session_id in over_limit:
+            while True:
+                history_bytes, history_chunks = self._usage.get(session_id, (0, 0))
+                excess = history_chunks - max_chunks
+                if self.session_quota and history_bytes > self.session_quota:
+                    # 바이트 초과분은 평균 청크 크기로 환산
+                    average = max(history_bytes // max(history_chunks, 1), 1)
+                    excess = max(excess, (history_bytes - self.session_quota) // average + 1)
+                if excess <= 0:
+                    break
+
+                freed_bytes, freed_chunks = await asyncio.to_thread(
+                    _delete_batch, session_id, min(excess, batch_size)
+                )
+                self._account(session_id, -freed_bytes, -freed_chunks)
+                deleted += freed_chunks
+                if freed_chunks == 0:
+                    break
+                await asyncio.sleep(0)
+
+        return deleted
 
-            deleted = cursor.rowcount
+    async def _delete_history_batched(self, session_id: str, batch_size: int = 500) -> int:
+        """세션 히스토리를 짧은 트랜잭션 여러 번으로 나눠 삭제"""
+        def _delete_batch():
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM session_history WHERE id IN (
+                    SELECT id FROM session_history WHERE session_id = ? LIMIT ?
+                )
+            """, (session_id, batch_size))
+            count = cursor.rowcount
             conn.commit()
             conn.close()
-            return deleted
+            return count
+
+        deleted = 0
+        while True:
+            count = await asyncio.to_thread(_delete_batch)
+            deleted += count
+            if count < batch_size:
+                break
+            await asyncio.sleep(0)
+
+        self._reset_usage(session_id)
+        return deleted
+
+    @timed(STORAGE_SECONDS)
+    async def delete_stale_sessions(
+        self,
+        older_than_hours: int,
+        exclude: Iterable[str] = ()
+    ) -> List[str]:
+        """
+        실행 중이 아니면서 오래 사용하지 않은 세션 행과 주인 없는 히스토리 삭제
+
+        Args:
+            older_than_hours: 마지막 활동 후 보관 기간 (시간)
+            exclude: 삭제하지 않을 세션 ID (실행 중인 PTY 세션)
+
+        Returns:
+            삭제된 세션 ID 리스트
+        """
+        await self._ensure_session_cache()
+        await self.flush_session_activity()
+
+        cutoff_iso = (datetime.utcnow() - timedelta(hours=older_than_hours)).isoformat()
+        excluded = set(exclude)
+        stale = [
+            session_id
+            for session_id, session in self._session_cache.items()
+            if session["last_active"] < cutoff_iso and session_id not in excluded
+        ]
+
+        def _find_orphans():
+            # sessions 행이 없는 히스토리 (세션 삭제 후 남은 청크)
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT DISTINCT session_id FROM session_history WHERE session_id NOT IN (SELECT session_id FROM sessions)"
+            )
+            rows = cursor.fetchall()
+            conn.close()
+            return [row["session_id"] for row in rows]
+
+        def _delete_row(session_id: str):
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.commit()
+            conn.close()
+
+        for session_id in stale:
+            await self._delete_history_batched(session_id)
+            await asyncio.to_thread(_delete_row, session_id)
+            self._uncache_session(session_id)
+
+        for session_id in await asyncio.to_thread(_find_orphans):
+            if session_id not in excluded:
+                await self._delete_history_batched(session_id)
+
+        return stale
+
+    def _convert_incremental_vacuum(self, conn: sqlite3.Connection):
+        """기존 DB를 incremental auto_vacuum으로 변환 (전체 VACUUM, 블로킹)"""
+        logger.info("incremental auto_vacuum 변환 시작 (VACUUM)")
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        self.incremental_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        logger.info(f"incremental auto_vacuum 변환 {'완료' if self.incremental_vacuum else '실패'}")
+
+    @timed(STORAGE_SECONDS)
+    async def convert_incremental_vacuum(self) -> bool:
+        """
+        incremental auto_vacuum 변환 (이미 적용된 경우 아무것도 하지 않음)
+
+        Returns:
+            변환을 실행했는지 여부
+        """
+        if self.incremental_vacuum:
+            return False
+
+        def _convert():
+            conn = self._get_connection()
+            try:
+                self._convert_incremental_vacuum(conn)
+            finally:
+                conn.close()
+
+        await asyncio.to_thread(_convert)
+        return True
+
+    @timed(STORAGE_SECONDS)
+    async def compact(self, max_pages: int = 2000) -> int:
+        """
+        빈 페이지 반환 및 통계 갱신 (incremental_vacuum, optimize)
+
+        Args:
+            max_pages: 한 번에 반환할 최대 페이지 수
+
+        Returns:
+            반환된 바이트 수
+        """
+        def _compact():
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+            before = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+
+            # incremental_vacuum은 step마다 한 페이지씩 반환하므로
+            # 끝까지 실행되도록 executescript 사용
+            conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+            after = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+
+            cursor.execute("PRAGMA optimize")
+            cursor.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            conn.close()
+            return (before - after) * page_size
+
+        return await asyncio.to_thread(_compact)
 
-        return await asyncio.to_thread(_cleanup)
+    @timed(STORAGE_SECONDS)
+    async def run_maintenance(
+        self,
+        retention_hours: int,
+        max_chunks: int,
+        live_sessions: Iterable[str] = (),
+        attached_sessions: Iterable[str] = (),
+        vacuum: bool = False
+    ) -> Dict:
+        """
+        보관 정책 적용 및 DB 파일 압축
+
+        Args:
+            retention_hours: 히스토리/비활성 세션 보관 기간 (시간)
+            max_chunks: 세션별 최대 청크 수
+            live_sessions: 실행 중인 PTY 세션 ID (세션 행 삭제 제외)
+            attached_sessions: WebSocket이 연결된 세션 ID (기간 만료/청크 수 정리 제외)
+            vacuum: incremental auto_vacuum 미적용 DB면 전체 VACUUM으로 변환
+
+        Returns:
+            정리 결과 리포트
+        """
+        started = datetime.utcnow()
+        live = set(live_sessions)
+        attached = set(attached_sessions)
+
+        expired = await self.cleanup_old_sessions(retention_hours, exclude=attached)
+        trimmed = await self.trim_history(max_chunks, exclude=attached)
+        removed = await self.delete_stale_sessions(retention_hours, exclude=live)
+        converted = await self.convert_incremental_vacuum() if vacuum else False
+        reclaimed = await self.compact()
+
+        self.last_maintenance = {
+            "started_at": started.isoformat(),
+            "duration_ms": int((datetime.utcnow() - started).total_seconds() * 1000),
+            "expired_chunks": expired,
+            "trimmed_chunks": trimmed,
+            "deleted_sessions": len(removed),
+            "bytes_reclaimed": reclaimed,
+            "vacuum_converted": converted
+        }
+        return self.last_maintenance
 
     # ==================== 세션 관리 ====================
+    # 세션 메타데이터는 메모리 캐시에서 읽고, last_active 갱신은
+    # 모아두었다가 주기적으로 일괄 기록 (write-behind)
 
+    async def _ensure_session_cache(self):
+        """세션 메타데이터 캐시 로드 (최초 1회)"""
+        if self._session_cache_loaded:
+            return
+
+        def _load():
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT session_id, username, name, created_at, last_active FROM sessions")
+            rows = cursor.fetchall()
+            cursor.execute(
+                "SELECT session_id, SUM(size) AS total_bytes, COUNT(*) AS total_chunks FROM session_history GROUP BY session_id"
+            )
+            usage_rows = cursor.fetchall()
+            conn.close()
+            return rows, usage_rows
+
+        rows, usage_rows = await asyncio.to_thread(_load)
+        if self._session_cache_loaded:
+            return
+
+        # 사용량 카운터 초기값 (시작 시 1회 집계, 이후 증분 갱신)
+        for row in usage_rows:
+            self._usage[row["session_id"]] = [row["total_bytes"], row["total_chunks"]]
+
+        for row in rows:
+            self._cache_session({
+                "id": row["session_id"],
+                "username": row["username"],
+                "name": row["name"],
+                "created_at": row["created_at"],
+                "last_active": row["last_active"]
+            })
+        self._session_cache_loaded = True
+
+    def _cache_session(self, session: Dict[str, str]):
+        """캐시에 세션 등록 (사용자별 인덱스 포함)"""
+        history_bytes = self._usage.get(session["id"], (0, 0))[0]
+        previous = self._session_cache.get(session["id"])
+        if previous:
+            self._user_sessions.get(previous["username"], set()).discard(session["id"])
+            self._user_bytes[previous["username"]] = max(
+                self._user_bytes.get(previous["username"], 0) - history_bytes, 0
+            )
+
+        self._session_cache[session["id"]] = session
+        self._user_sessions.setdefault(session["username"], set()).add(session["id"])
+        self._user_bytes[session["username"]] = self._user_bytes.get(session["username"], 0) + history_bytes
+
+    def _uncache_session(self, session_id: str):
+        """캐시에서 세션 제거 (히스토리도 함께 삭제된 경우)"""
+        self._reset_usage(session_id)
+        session = self._session_cache.pop(session_id, None)
+        self._dirty_activity.pop(session_id, None)
+        if session:
+            self._user_sessions.get(session["username"], set()).discard(session_id)
+
+    @timed(STORAGE_SECONDS)
     async def create_session(self, session_id: str, username: str):
         """세션 생성"""
+        await self._ensure_session_cache()
+        now = datetime.utcnow().isoformat()
+
         def _create():
             conn = self._get_connection()
             cursor = conn.cursor()
-            now = datetime.utcnow().isoformat()
             cursor.execute(
                 "INSERT OR REPLACE INTO sessions (session_id, username, created_at, last_active) VALUES (?, ?, ?, ?)",
                 (session_id, username, now, now)
@@ -247,46 +1085,112 @@ class SQLiteStorage:
 
         await asyncio.to_thread(_create)
 
+        self._dirty_activity.pop(session_id, None)
+        self._cache_session({
+            "id": session_id,
+            "username": username,
+            "name": None,
+            "created_at": now,
+            "last_active": now
+        })
+
+    @timed(STORAGE_SECONDS)
+    async def get_session(self, session_id: str) -> Optional[Dict[str, str]]:
+        """단일 세션 정보 조회 (캐시)"""
+        await self._ensure_session_cache()
+        session = self._session_cache.get(session_id)
+        return dict(session) if session else None
+
+    @timed(STORAGE_SECONDS)
     async def get_user_sessions(self, username: str) -> List[Dict[str, str]]:
-        """사용자의 세션 목록 조회"""
-        def _get():
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT session_id, name, created_at, last_active FROM sessions WHERE username = ? ORDER BY last_active DESC",
-                (username,)
-            )
-            rows = cursor.fetchall()
-            conn.close()
+        """사용자의 세션 목록 조회 (캐시)"""
+        await self._ensure_session_cache()
+        sessions = [
+            self._session_cache[session_id]
+            for session_id in self._user_sessions.get(username, ())
+        ]
+        sessions.sort(key=lambda s: s["last_active"], reverse=True)
 
-            return [
-                {
-                    "id": row["session_id"],
-                    "name": row["name"],
-                    "created_at": row["created_at"],
-                    "last_active": row["last_active"]
-                }
-                for row in rows
-            ]
+        return [
+            {
+                "id": s["id"],
+                "name": s["name"],
+                "created_at": s["created_at"],
+                "last_active": s["last_active"],
+                "history_bytes": self._usage.get(s["id"], (0, 0))[0],
+                "history_chunks": self._usage.get(s["id"], (0, 0))[1]
+            }
+            for s in sessions
+        ]
 
-        return await asyncio.to_thread(_get)
+    def touch_session(self, session_id: str):
+        """
+        세션 마지막 활동 시간 갱신 (메모리만, DB는 주기적 flush)
+
+        키 입력마다 호출해도 될 만큼 가벼움
+        """
+        session = self._session_cache.get(session_id)
+        if session is None:
+            return
 
+        now = datetime.utcnow().isoformat()
+        session["last_active"] = now
+        self._dirty_activity[session_id] = now
+
+    @timed(STORAGE_SECONDS)
     async def update_session_activity(self, session_id: str):
         """세션 마지막 활동 시간 업데이트"""
-        def _update():
+        await self._ensure_session_cache()
+        self.touch_session(session_id)
+
+    @timed(STORAGE_SECONDS)
+    async def flush_session_activity(self) -> int:
+        """
+        모아둔 last_active 갱신을 한 트랜잭션으로 기록
+
+        Returns:
+            기록된 세션 수
+        """
+        if not self._dirty_activity:
+            return 0
+
+        pending = self._dirty_activity
+        self._dirty_activity = {}
+
+        def _flush():
             conn = self._get_connection()
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.executemany(
                 "UPDATE sessions SET last_active = ? WHERE session_id = ?",
-                (datetime.utcnow().isoformat(), session_id)
+                [(last_active, session_id) for session_id, last_active in pending.items()]
             )
             conn.commit()
             conn.close()
 
-        await asyncio.to_thread(_update)
+        try:
+            await asyncio.to_thread(_flush)
+        except Exception:
+            # 실패 시 다음 주기에 다시 기록 (그 사이 새로 들어온 값 우선)
+            for session_id, last_active in pending.items():
+                self._dirty_activity.setdefault(session_id, last_active)
+            raise
+
+        return len(pending)
 
+    async def _activity_flush_loop(self):
+        """주기적으로 last_active 갱신을 DB에 기록"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush_session_activity()
+            except Exception as e:
+                logger.error(f"세션 활동 시간 기록 실패: {e}")
+
+    @timed(STORAGE_SECONDS)
     async def update_session_name(self, session_id: str, name: str):
         """세션 이름 업데이트"""
+        await self._ensure_session_cache()
+
         def _update():
             conn = self._get_connection()
             cursor = conn.cursor()
@@ -299,8 +1203,15 @@ class SQLiteStorage:
 
         await asyncio.to_thread(_update)
 
+        session = self._session_cache.get(session_id)
+        if session:
+            session["name"] = name
+
+    @timed(STORAGE_SECONDS)
     async def delete_session(self, session_id: str):
         """세션 삭제"""
+        await self._ensure_session_cache()
+
         def _delete():
             conn = self._get_connection()
             cursor = conn.cursor()
@@ -310,9 +1221,11 @@ class SQLiteStorage:
             conn.close()
 
         await asyncio.to_thread(_delete)
+        self._uncache_session(session_id)
 
     # ==================== 시스템 설정 관리 ====================
 
+    @timed(STORAGE_SECONDS)
     async def get_config(self, key: str) -> Optional[str]:
         """시스템 설정 값 조회"""
         def _get():
@@ -325,6 +1238,7 @@ class SQLiteStorage:
 
         return await asyncio.to_thread(_get)
 
+    @timed(STORAGE_SECONDS)
     async def set_config(self, key: str, value: str) -> bool:
         """시스템 설정 값 저장"""
         def _set():
@@ -346,12 +1260,22 @@ class SQLiteStorage:
     # ==================== 연결 관리 ====================
 
     async def connect(self):
-        """연결 초기화 (호환성)"""
-        pass
+        """세션 캐시 로드 및 활동 시간 flush 루프 시작"""
+        await self._ensure_session_cache()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._activity_flush_loop())
 
     async def close(self):
-        """연결 종료 (호환성)"""
-        pass
+        """flush 루프 종료 및 남은 활동 시간 기록"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush_session_activity()
 
 
 # 싱글톤 인스턴스
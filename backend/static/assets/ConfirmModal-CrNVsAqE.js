@@ -1 +0,0 @@
-import{u as h,j as r}from"./index-Bu9V4qqL.js";const C=({isOpen:i,onConfirm:d,onCancel:l,title:a,message:c,confirmText:s,cancelText:p,language:x="en",danger:b=!1,theme:g})=>{const{t:n}=h(x);if(!i)return null;const o=g||{ui:{bg:"#1e1e2e",border:"#313244",text:"#cdd6f4"},green:"#a6e3a1",red:"#f38ba8",brightBlack:"#585b70"},u=()=>{d()},t=()=>{l()};return r.jsx("div",{style:e.overlay,onClick:t,children:r.jsxs("div",{style:{...e.modal,backgroundColor:o.ui.bg,borderColor:o.ui.border},onClick:f=>f.stopPropagation(),children:[r.jsx("div",{style:{...e.header,borderBottomColor:o.ui.border},children:r.jsx("h3",{style:{...e.title,color:o.ui.text},children:a||n("confirm")})}),r.jsx("div",{style:e.content,children:r.jsx("p",{style:{...e.message,color:o.ui.text},children:c})}),r.jsxs("div",{style:{...e.footer,borderTopColor:o.ui.border},children:[r.jsx("button",{onClick:t,style:{...e.cancelBtn,backgroundColor:o.brightBlack,color:o.ui.text},children:p||n("cancel")}),r.jsx("button",{onClick:u,style:b?{...e.dangerBtn,backgroundColor:o.red,color:o.ui.bg}:{...e.confirmBtn,backgroundColor:o.green,color:o.ui.bg},children:s||n("confirm")})]})]})})},e={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.7)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:10001},modal:{backgroundColor:"#1e1e2e",borderRadius:"2px",width:"90%",maxWidth:"450px",border:"1px solid #313244"},header:{padding:"16px 20px",borderBottom:"1px solid #313244"},title:{margin:0,color:"#cdd6f4",fontSize:"16px",fontWeight:"600"},content:{padding:"20px"},message:{margin:0,color:"#cdd6f4",fontSize:"14px",lineHeight:"1.6"},footer:{display:"flex",gap:"8px",padding:"16px 20px",borderTop:"1px solid #313244",justifyContent:"flex-end"},cancelBtn:{padding:"12px 24px",backgroundColor:"#585b70",color:"#cdd6f4",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"},confirmBtn:{padding:"12px 24px",backgroundColor:"#a6e3a1",color:"#1e1e2e",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"},dangerBtn:{padding:"12px 24px",backgroundColor:"#f38ba8",color:"#1e1e2e",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"}};export{C as default};
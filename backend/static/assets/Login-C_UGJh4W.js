@@ -1,6 +0,0 @@
-import{u as y,r as l,j as e}from"./index-D94zrwKa.js";const j=({onLogin:f,language:g="en"})=>{const{t:o}=y(g),[i,h]=l.useState(""),[d,p]=l.useState(""),[u,c]=l.useState(""),[s,x]=l.useState(!1),m=async t=>{if(t.preventDefault(),c(""),!i||!d){c(o("fillAllFields")||"Please fill in all fields");return}x(!0);try{const a=await fetch("/api/auth/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:i,password:d})}),n=await a.json();if(!a.ok)throw new Error(n.detail||"Login failed");localStorage.setItem("auth_token",n.access_token),localStorage.setItem("username",n.username),f(n.access_token,n.username)}catch(a){c(a.message||"Invalid username or password"),p("")}finally{x(!1)}};return e.jsxs(e.Fragment,{children:[e.jsx("style",{children:`
-        .login-overlay::-webkit-scrollbar,
-        .login-container::-webkit-scrollbar {
-          display: none;
-        }
-      `}),e.jsx("div",{style:r.overlay,className:"login-overlay",children:e.jsxs("div",{style:r.container,className:"login-container",children:[e.jsx("div",{style:r.header,children:e.jsx("div",{style:r.icon,children:e.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[e.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),e.jsx("path",{d:"M7 10l3 3-3 3"}),e.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})})}),e.jsxs("form",{onSubmit:m,style:r.form,children:[e.jsxs("div",{style:r.formGroup,children:[e.jsx("label",{style:r.label,children:o("username")||"Username"}),e.jsx("input",{type:"text",value:i,onChange:t=>h(t.target.value),style:r.input,placeholder:o("usernamePlaceholder")||"Enter username",disabled:s,autoFocus:!0,required:!0})]}),e.jsxs("div",{style:r.formGroup,children:[e.jsx("label",{style:r.label,children:o("password")||"Password"}),e.jsx("input",{type:"password",value:d,onChange:t=>p(t.target.value),style:r.input,placeholder:o("passwordPlaceholder")||"Enter password",disabled:s,required:!0})]}),u&&e.jsx("div",{style:r.error,children:u}),e.jsx("button",{type:"submit",style:r.submitBtn,disabled:s,children:s?o("signingIn")||"Signing in...":o("signIn")||"Sign In"})]})]})})]})},r={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"#282a36",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4,overflow:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},container:{backgroundColor:"#1e1f29",borderRadius:"12px",width:"90%",maxWidth:"380px",padding:"40px",border:"1px solid #44475a",margin:"20px auto",maxHeight:"calc(100vh - 40px)",overflowY:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},header:{textAlign:"center",marginBottom:"32px"},icon:{color:"#bd93f9",margin:"0 auto"},form:{display:"flex",flexDirection:"column",gap:"20px"},formGroup:{display:"flex",flexDirection:"column",gap:"8px"},label:{fontSize:"14px",fontWeight:"600",color:"#f8f8f2"},input:{padding:"12px 16px",fontSize:"14px",backgroundColor:"#282a36",color:"#f8f8f2",border:"1px solid #44475a",borderRadius:"6px",outline:"none",transition:"border-color 0.2s"},error:{padding:"12px 16px",backgroundColor:"#ff5555",color:"#f8f8f2",borderRadius:"6px",fontSize:"14px",textAlign:"center"},submitBtn:{padding:"14px 24px",backgroundColor:"#50fa7b",color:"#282a36",border:"none",borderRadius:"6px",fontSize:"16px",fontWeight:"700",cursor:"pointer",transition:"all 0.2s ease",marginTop:"8px"}};export{j as default};
@@ -1 +0,0 @@
-import{u as f,r as m,j as e,a as j}from"./index-DqcDFUo8.js";const S=({isOpen:u,onClose:s,settings:c,onSave:d,theme:p,username:x})=>{const{t:l}=f(c.language),[i,b]=m.useState(c);if(!u)return null;const t=p||{ui:{bg:"#1e1e2e",bgTertiary:"#313244",border:"#313244",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa"},green:"#a6e3a1",red:"#f38ba8",brightBlack:"#585b70"},n=(r,a)=>{b(y=>({...y,[r]:a}))},g=()=>{d(i),s()},h=()=>{confirm(l("reset"))&&(d({theme:"catppuccin",language:"en",fontSize:14,fontFamily:'Menlo, Monaco, "Courier New", monospace',autoScroll:"smart",smoothScroll:!0,scrollSensitivity:.8}),s())};return e.jsx("div",{style:o.overlay,onClick:s,children:e.jsxs("div",{style:{...o.modal,backgroundColor:t.ui.bg},onClick:r=>r.stopPropagation(),children:[e.jsxs("div",{style:{...o.header,borderBottomColor:t.ui.border},children:[e.jsx("h2",{style:{...o.title,color:t.ui.accent},children:l("settingsTitle")}),e.jsx("button",{onClick:s,style:{...o.closeBtn,color:t.ui.text},children:"✕"})]}),e.jsxs("div",{style:o.content,children:[x&&e.jsxs("div",{style:{...o.section,...o.userSection},children:[e.jsx("label",{style:{...o.label,color:t.ui.textSecondary},children:l("user")}),e.jsx("div",{style:{...o.userValue,color:t.ui.accent,backgroundColor:t.ui.bgTertiary,borderColor:t.ui.border},children:x})]}),e.jsxs("div",{style:o.row,children:[e.jsxs("div",{style:o.rowItem,children:[e.jsx("label",{style:{...o.label,color:t.ui.text},children:l("theme")}),e.jsx("select",{value:i.theme,onChange:r=>n("theme",r.target.value),style:{...o.select,backgroundColor:t.ui.bgTertiary,color:t.ui.text,borderColor:t.ui.border},children:j.map(r=>{const a=`theme${r.charAt(0).toUpperCase()}${r.slice(1)}`;return e.jsx("option",{value:r,children:l(a)},r)})})]}),e.jsxs("div",{style:o.rowItem,children:[e.jsx("label",{style:{...o.label,color:t.ui.text},children:l("language")}),e.jsxs("select",{value:i.language,onChange:r=>n("language",r.target.value),style:{...o.select,backgroundColor:t.ui.bgTertiary,color:t.ui.text,borderColor:t.ui.border},children:[e.jsx("option",{value:"en",children:l("languageEnglish")}),e.jsx("option",{value:"ko",children:l("languageKorean")})]})]})]}),e.jsxs("div",{style:o.section,children:[e.jsx("label",{style:{...o.label,color:t.ui.text},children:l("fontSize")}),e.jsx("input",{type:"number",min:"10",max:"24",value:i.fontSize,onChange:r=>n("fontSize",parseInt(r.target.value)),style:{...o.input,backgroundColor:t.ui.bgTertiary,color:t.ui.text,borderColor:t.ui.border}})]}),e.jsxs("div",{style:o.section,children:[e.jsx("label",{style:{...o.label,color:t.ui.text},children:l("autoScroll")}),e.jsxs("select",{value:i.autoScroll,onChange:r=>n("autoScroll",r.target.value),style:{...o.select,backgroundColor:t.ui.bgTertiary,color:t.ui.text,borderColor:t.ui.border},children:[e.jsx("option",{value:"always",children:"Always (항상)"}),e.jsx("option",{value:"smart",children:"Smart (AI 대응)"}),e.jsx("option",{value:"never",children:"Never (수동)"})]})]}),e.jsx("div",{style:o.section,children:e.jsxs("label",{style:{...o.checkboxLabel,color:t.ui.text},children:[e.jsx("input",{type:"checkbox",checked:i.smoothScroll,onChange:r=>n("smoothScroll",r.target.checked),style:o.checkbox}),l("smoothScroll")]})}),e.jsxs("div",{style:o.section,children:[e.jsxs("label",{style:{...o.label,color:t.ui.text},children:["Scroll Sensitivity (AI 스트리밍): ",i.scrollSensitivity.toFixed(1)]}),e.jsx("input",{type:"range",min:"0",max:"1",step:"0.1",value:i.scrollSensitivity,onChange:r=>n("scrollSensitivity",parseFloat(r.target.value)),style:o.slider}),e.jsx("small",{style:{...o.hint,color:t.ui.textSecondary},children:"높을수록 사용자 스크롤에 민감하게 반응 (AI 채팅 최적화)"})]})]}),e.jsxs("div",{style:{...o.footer,borderTopColor:t.ui.border},children:[e.jsx("button",{onClick:h,style:{...o.resetBtn,backgroundColor:t.red,color:t.ui.bg},children:l("reset")}),e.jsxs("div",{style:o.buttonGroup,children:[e.jsx("button",{onClick:s,style:{...o.cancelBtn,backgroundColor:t.brightBlack,color:t.ui.text},children:l("cancel")}),e.jsx("button",{onClick:g,style:{...o.saveBtn,backgroundColor:t.green,color:t.ui.bg},children:l("save")})]})]})]})})},o={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.7)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4},modal:{backgroundColor:"#1e1e2e",borderRadius:"2px",width:"90%",maxWidth:"650px",maxHeight:"85vh",overflow:"auto"},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"16px 20px",borderBottom:"1px solid #313244"},title:{margin:0,color:"#89b4fa",fontSize:"20px",fontWeight:"600"},closeBtn:{background:"none",border:"none",color:"#cdd6f4",fontSize:"24px",cursor:"pointer",padding:"0",width:"30px",height:"30px"},content:{padding:"20px"},section:{marginBottom:"20px"},row:{display:"flex",gap:"12px",marginBottom:"20px"},rowItem:{flex:1},userSection:{paddingBottom:"20px",borderBottom:"1px solid #313244"},userValue:{padding:"10px 14px",fontSize:"14px",fontWeight:"600",borderRadius:"4px",border:"1px solid"},label:{display:"block",marginBottom:"8px",color:"#cdd6f4",fontSize:"14px",fontWeight:"500"},select:{width:"100%",padding:"8px 32px 8px 12px",backgroundColor:"#313244",color:"#cdd6f4",border:"1px solid #45475a",borderRadius:"4px",fontSize:"14px"},input:{width:"100%",padding:"8px 12px",backgroundColor:"#313244",color:"#cdd6f4",border:"1px solid #45475a",borderRadius:"4px",fontSize:"14px"},checkboxLabel:{display:"flex",alignItems:"center",gap:"8px",color:"#cdd6f4",fontSize:"14px",cursor:"pointer"},checkbox:{width:"18px",height:"18px",cursor:"pointer"},slider:{width:"100%",marginTop:"8px"},hint:{display:"block",marginTop:"4px",color:"#6c7086",fontSize:"12px"},footer:{display:"flex",justifyContent:"space-between",padding:"16px 20px",borderTop:"1px solid #313244"},buttonGroup:{display:"flex",gap:"8px"},saveBtn:{padding:"8px 16px",backgroundColor:"#a6e3a1",color:"#1e1e2e",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"},cancelBtn:{padding:"8px 16px",backgroundColor:"#585b70",color:"#cdd6f4",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"},resetBtn:{padding:"8px 16px",backgroundColor:"#f38ba8",color:"#1e1e2e",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"}};export{S as default};
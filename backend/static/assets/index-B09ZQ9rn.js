@@ -1,301 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const c of document.querySelectorAll('link[rel="modulepreload"]'))i(c);new MutationObserver(c=>{for(const f of c)if(f.type==="childList")for(const g of f.addedNodes)g.tagName==="LINK"&&g.rel==="modulepreload"&&i(g)}).observe(document,{childList:!0,subtree:!0});function r(c){const f={};return c.integrity&&(f.integrity=c.integrity),c.referrerPolicy&&(f.referrerPolicy=c.referrerPolicy),c.crossOrigin==="use-credentials"?f.credentials="include":c.crossOrigin==="anonymous"?f.credentials="omit":f.credentials="same-origin",f}function i(c){if(c.ep)return;c.ep=!0;const f=r(c);fetch(c.href,f)}})();function lh(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Fa={exports:{}},Us={},za={exports:{}},re={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Fi=Symbol.for("react.element"),ah=Symbol.for("react.portal"),ch=Symbol.for("react.fragment"),uh=Symbol.for("react.strict_mode"),hh=Symbol.for("react.profiler"),dh=Symbol.for("react.provider"),fh=Symbol.for("react.context"),ph=Symbol.for("react.forward_ref"),_h=Symbol.for("react.suspense"),gh=Symbol.for("react.memo"),vh=Symbol.for("react.lazy"),kl=Symbol.iterator;function mh(e){return e===null||typeof e!="object"?null:(e=kl&&e[kl]||e["@@iterator"],typeof e=="function"?e:null)}var Na={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Wa=Object.assign,Ua={};function Gr(e,t,r){this.props=e,this.context=t,this.refs=Ua,this.updater=r||Na}Gr.prototype.isReactComponent={};Gr.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Gr.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function $a(){}$a.prototype=Gr.prototype;function Bo(e,t,r){this.props=e,this.context=t,this.refs=Ua,this.updater=r||Na}var Ao=Bo.prototype=new $a;Ao.constructor=Bo;Wa(Ao,Gr.prototype);Ao.isPureReactComponent=!0;var El=Array.isArray,Va=Object.prototype.hasOwnProperty,Mo={current:null},Ka={key:!0,ref:!0,__self:!0,__source:!0};function qa(e,t,r){var i,c={},f=null,g=null;if(t!=null)for(i in t.ref!==void 0&&(g=t.ref),t.key!==void 0&&(f=""+t.key),t)Va.call(t,i)&&!Ka.hasOwnProperty(i)&&(c[i]=t[i]);var n=arguments.length-2;if(n===1)c.children=r;else if(1<n){for(var u=Array(n),d=0;d<n;d++)u[d]=arguments[d+2];c.children=u}if(e&&e.defaultProps)for(i in n=e.defaultProps,n)c[i]===void 0&&(c[i]=n[i]);return{$$typeof:Fi,type:e,key:f,ref:g,props:c,_owner:Mo.current}}function yh(e,t){return{$$typeof:Fi,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function Po(e){return typeof e=="object"&&e!==null&&e.$$typeof===Fi}function Sh(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(r){return t[r]})}var Ll=/\/+/g;function on(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Sh(""+e.key):t.toString(36)}function ls(e,t,r,i,c){var f=typeof e;(f==="undefined"||f==="boolean")&&(e=null);var g=!1;if(e===null)g=!0;else switch(f){case"string":case"number":g=!0;break;case"object":switch(e.$$typeof){case Fi:case ah:g=!0}}if(g)return g=e,c=c(g),e=i===""?"."+on(g,0):i,El(c)?(r="",e!=null&&(r=e.replace(Ll,"$&/")+"/"),ls(c,t,r,"",function(d){return d})):c!=null&&(Po(c)&&(c=yh(c,r+(!c.key||g&&g.key===c.key?"":(""+c.key).replace(Ll,"$&/")+"/")+e)),t.push(c)),1;if(g=0,i=i===""?".":i+":",El(e))for(var n=0;n<e.length;n++){f=e[n];var u=i+on(f,n);g+=ls(f,t,r,u,c)}else if(u=mh(e),typeof u=="function")for(e=u.call(e),n=0;!(f=e.next()).done;)f=f.value,u=i+on(f,n++),g+=ls(f,t,r,u,c);else if(f==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return g}function $i(e,t,r){if(e==null)return e;var i=[],c=0;return ls(e,i,"","",function(f){return t.call(r,f,c++)}),i}function Ch(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(r){(e._status===0||e._status===-1)&&(e._status=1,e._result=r)},function(r){(e._status===0||e._status===-1)&&(e._status=2,e._result=r)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var Ue={current:null},as={transition:null},wh={ReactCurrentDispatcher:Ue,ReactCurrentBatchConfig:as,ReactCurrentOwner:Mo};function Ga(){throw Error("act(...) is not supported in production builds of React.")}re.Children={map:$i,forEach:function(e,t,r){$i(e,function(){t.apply(this,arguments)},r)},count:function(e){var t=0;return $i(e,function(){t++}),t},toArray:function(e){return $i(e,function(t){return t})||[]},only:function(e){if(!Po(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};re.Component=Gr;re.Fragment=ch;re.Profiler=hh;re.PureComponent=Bo;re.StrictMode=uh;re.Suspense=_h;re.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=wh;re.act=Ga;re.cloneElement=function(e,t,r){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var i=Wa({},e.props),c=e.key,f=e.ref,g=e._owner;if(t!=null){if(t.ref!==void 0&&(f=t.ref,g=Mo.current),t.key!==void 0&&(c=""+t.key),e.type&&e.type.defaultProps)var n=e.type.defaultProps;for(u in t)Va.call(t,u)&&!Ka.hasOwnProperty(u)&&(i[u]=t[u]===void 0&&n!==void 0?n[u]:t[u])}var u=arguments.length-2;if(u===1)i.children=r;else if(1<u){n=Array(u);for(var d=0;d<u;d++)n[d]=arguments[d+2];i.children=n}return{$$typeof:Fi,type:e.type,key:c,ref:f,props:i,_owner:g}};re.createContext=function(e){return e={$$typeof:fh,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:dh,_context:e},e.Consumer=e};re.createElement=qa;re.createFactory=function(e){var t=qa.bind(null,e);return t.type=e,t};re.createRef=function(){return{current:null}};re.forwardRef=function(e){return{$$typeof:ph,render:e}};re.isValidElement=Po;re.lazy=function(e){return{$$typeof:vh,_payload:{_status:-1,_result:e},_init:Ch}};re.memo=function(e,t){return{$$typeof:gh,type:e,compare:t===void 0?null:t}};re.startTransition=function(e){var t=as.transition;as.transition={};try{e()}finally{as.transition=t}};re.unstable_act=Ga;re.useCallback=function(e,t){return Ue.current.useCallback(e,t)};re.useContext=function(e){return Ue.current.useContext(e)};re.useDebugValue=function(){};re.useDeferredValue=function(e){return Ue.current.useDeferredValue(e)};re.useEffect=function(e,t){return Ue.current.useEffect(e,t)};re.useId=function(){return Ue.current.useId()};re.useImperativeHandle=function(e,t,r){return Ue.current.useImperativeHandle(e,t,r)};re.useInsertionEffect=function(e,t){return Ue.current.useInsertionEffect(e,t)};re.useLayoutEffect=function(e,t){return Ue.current.useLayoutEffect(e,t)};re.useMemo=function(e,t){return Ue.current.useMemo(e,t)};re.useReducer=function(e,t,r){return Ue.current.useReducer(e,t,r)};re.useRef=function(e){return Ue.current.useRef(e)};re.useState=function(e){return Ue.current.useState(e)};re.useSyncExternalStore=function(e,t,r){return Ue.current.useSyncExternalStore(e,t,r)};re.useTransition=function(){return Ue.current.useTransition()};re.version="18.3.1";za.exports=re;var $=za.exports;const xh=lh($);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var bh=$,kh=Symbol.for("react.element"),Eh=Symbol.for("react.fragment"),Lh=Object.prototype.hasOwnProperty,Dh=bh.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Rh={key:!0,ref:!0,__self:!0,__source:!0};function Xa(e,t,r){var i,c={},f=null,g=null;r!==void 0&&(f=""+r),t.key!==void 0&&(f=""+t.key),t.ref!==void 0&&(g=t.ref);for(i in t)Lh.call(t,i)&&!Rh.hasOwnProperty(i)&&(c[i]=t[i]);if(e&&e.defaultProps)for(i in t=e.defaultProps,t)c[i]===void 0&&(c[i]=t[i]);return{$$typeof:kh,type:e,key:f,ref:g,props:c,_owner:Dh.current}}Us.Fragment=Eh;Us.jsx=Xa;Us.jsxs=Xa;Fa.exports=Us;var L=Fa.exports,On={},Ya={exports:{}},rt={},Qa={exports:{}},Ja={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(b,R){var A=b.length;b.push(R);e:for(;0<A;){var I=A-1>>>1,F=b[I];if(0<c(F,R))b[I]=R,b[A]=F,A=I;else break e}}function r(b){return b.length===0?null:b[0]}function i(b){if(b.length===0)return null;var R=b[0],A=b.pop();if(A!==R){b[0]=A;e:for(var I=0,F=b.length,q=F>>>1;I<q;){var Q=2*(I+1)-1,Y=b[Q],ne=Q+1,D=b[ne];if(0>c(Y,A))ne<F&&0>c(D,Y)?(b[I]=D,b[ne]=A,I=ne):(b[I]=Y,b[Q]=A,I=Q);else if(ne<F&&0>c(D,A))b[I]=D,b[ne]=A,I=ne;else break e}}return R}function c(b,R){var A=b.sortIndex-R.sortIndex;return A!==0?A:b.id-R.id}if(typeof performance=="object"&&typeof performance.now=="function"){var f=performance;e.unstable_now=function(){return f.now()}}else{var g=Date,n=g.now();e.unstable_now=function(){return g.now()-n}}var u=[],d=[],y=1,h=null,_=3,S=!1,w=!1,C=!1,a=typeof setTimeout=="function"?setTimeout:null,l=typeof clearTimeout=="function"?clearTimeout:null,s=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function o(b){for(var R=r(d);R!==null;){if(R.callback===null)i(d);else if(R.startTime<=b)i(d),R.sortIndex=R.expirationTime,t(u,R);else break;R=r(d)}}function p(b){if(C=!1,o(b),!w)if(r(u)!==null)w=!0,U(m);else{var R=r(d);R!==null&&O(p,R.startTime-b)}}function m(b,R){w=!1,C&&(C=!1,l(v),v=-1),S=!0;var A=_;try{for(o(R),h=r(u);h!==null&&(!(h.expirationTime>R)||b&&!M());){var I=h.callback;if(typeof I=="function"){h.callback=null,_=h.priorityLevel;var F=I(h.expirationTime<=R);R=e.unstable_now(),typeof F=="function"?h.callback=F:h===r(u)&&i(u),o(R)}else i(u);h=r(u)}if(h!==null)var q=!0;else{var Q=r(d);Q!==null&&O(p,Q.startTime-R),q=!1}return q}finally{h=null,_=A,S=!1}}var x=!1,E=null,v=-1,k=5,B=-1;function M(){return!(e.unstable_now()-B<k)}function T(){if(E!==null){var b=e.unstable_now();B=b;var R=!0;try{R=E(!0,b)}finally{R?P():(x=!1,E=null)}}else x=!1}var P;if(typeof s=="function")P=function(){s(T)};else if(typeof MessageChannel<"u"){var H=new MessageChannel,N=H.port2;H.port1.onmessage=T,P=function(){N.postMessage(null)}}else P=function(){a(T,0)};function U(b){E=b,x||(x=!0,P())}function O(b,R){v=a(function(){b(e.unstable_now())},R)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(b){b.callback=null},e.unstable_continueExecution=function(){w||S||(w=!0,U(m))},e.unstable_forceFrameRate=function(b){0>b||125<b?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):k=0<b?Math.floor(1e3/b):5},e.unstable_getCurrentPriorityLevel=function(){return _},e.unstable_getFirstCallbackNode=function(){return r(u)},e.unstable_next=function(b){switch(_){case 1:case 2:case 3:var R=3;break;default:R=_}var A=_;_=R;try{return b()}finally{_=A}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(b,R){switch(b){case 1:case 2:case 3:case 4:case 5:break;default:b=3}var A=_;_=b;try{return R()}finally{_=A}},e.unstable_scheduleCallback=function(b,R,A){var I=e.unstable_now();switch(typeof A=="object"&&A!==null?(A=A.delay,A=typeof A=="number"&&0<A?I+A:I):A=I,b){case 1:var F=-1;break;case 2:F=250;break;case 5:F=1073741823;break;case 4:F=1e4;break;default:F=5e3}return F=A+F,b={id:y++,callback:R,priorityLevel:b,startTime:A,expirationTime:F,sortIndex:-1},A>I?(b.sortIndex=A,t(d,b),r(u)===null&&b===r(d)&&(C?(l(v),v=-1):C=!0,O(p,A-I))):(b.sortIndex=F,t(u,b),w||S||(w=!0,U(m))),b},e.unstable_shouldYield=M,e.unstable_wrapCallback=function(b){var R=_;return function(){var A=_;_=R;try{return b.apply(this,arguments)}finally{_=A}}}})(Ja);Qa.exports=Ja;var Th=Qa.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Bh=$,tt=Th;function V(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,r=1;r<arguments.length;r++)t+="&args[]="+encodeURIComponent(arguments[r]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Za=new Set,Ci={};function mr(e,t){Nr(e,t),Nr(e+"Capture",t)}function Nr(e,t){for(Ci[e]=t,e=0;e<t.length;e++)Za.add(t[e])}var At=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),jn=Object.prototype.hasOwnProperty,Ah=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Dl={},Rl={};function Mh(e){return jn.call(Rl,e)?!0:jn.call(Dl,e)?!1:Ah.test(e)?Rl[e]=!0:(Dl[e]=!0,!1)}function Ph(e,t,r,i){if(r!==null&&r.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return i?!1:r!==null?!r.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Ih(e,t,r,i){if(t===null||typeof t>"u"||Ph(e,t,r,i))return!0;if(i)return!1;if(r!==null)switch(r.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function $e(e,t,r,i,c,f,g){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=i,this.attributeNamespace=c,this.mustUseProperty=r,this.propertyName=e,this.type=t,this.sanitizeURL=f,this.removeEmptyString=g}var Ie={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){Ie[e]=new $e(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];Ie[t]=new $e(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){Ie[e]=new $e(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){Ie[e]=new $e(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){Ie[e]=new $e(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){Ie[e]=new $e(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){Ie[e]=new $e(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){Ie[e]=new $e(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){Ie[e]=new $e(e,5,!1,e.toLowerCase(),null,!1,!1)});var Io=/[\-:]([a-z])/g;function Oo(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(Io,Oo);Ie[t]=new $e(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(Io,Oo);Ie[t]=new $e(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(Io,Oo);Ie[t]=new $e(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){Ie[e]=new $e(e,1,!1,e.toLowerCase(),null,!1,!1)});Ie.xlinkHref=new $e("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){Ie[e]=new $e(e,1,!1,e.toLowerCase(),null,!0,!0)});function jo(e,t,r,i){var c=Ie.hasOwnProperty(t)?Ie[t]:null;(c!==null?c.type!==0:i||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Ih(t,r,c,i)&&(r=null),i||c===null?Mh(t)&&(r===null?e.removeAttribute(t):e.setAttribute(t,""+r)):c.mustUseProperty?e[c.propertyName]=r===null?c.type===3?!1:"":r:(t=c.attributeName,i=c.attributeNamespace,r===null?e.removeAttribute(t):(c=c.type,r=c===3||c===4&&r===!0?"":""+r,i?e.setAttributeNS(i,t,r):e.setAttribute(t,r))))}var Ot=Bh.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,Vi=Symbol.for("react.element"),xr=Symbol.for("react.portal"),br=Symbol.for("react.fragment"),Ho=Symbol.for("react.strict_mode"),Hn=Symbol.for("react.profiler"),ec=Symbol.for("react.provider"),tc=Symbol.for("react.context"),Fo=Symbol.for("react.forward_ref"),Fn=Symbol.for("react.suspense"),zn=Symbol.for("react.suspense_list"),zo=Symbol.for("react.memo"),Ft=Symbol.for("react.lazy"),rc=Symbol.for("react.offscreen"),Tl=Symbol.iterator;function ei(e){return e===null||typeof e!="object"?null:(e=Tl&&e[Tl]||e["@@iterator"],typeof e=="function"?e:null)}var Ce=Object.assign,ln;function ai(e){if(ln===void 0)try{throw Error()}catch(r){var t=r.stack.trim().match(/\n( *(at )?)/);ln=t&&t[1]||""}return`
-`+ln+e}var an=!1;function cn(e,t){if(!e||an)return"";an=!0;var r=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(d){var i=d}Reflect.construct(e,[],t)}else{try{t.call()}catch(d){i=d}e.call(t.prototype)}else{try{throw Error()}catch(d){i=d}e()}}catch(d){if(d&&i&&typeof d.stack=="string"){for(var c=d.stack.split(`
-`),f=i.stack.split(`
-`),g=c.length-1,n=f.length-1;1<=g&&0<=n&&c[g]!==f[n];)n--;for(;1<=g&&0<=n;g--,n--)if(c[g]!==f[n]){if(g!==1||n!==1)do if(g--,n--,0>n||c[g]!==f[n]){var u=`
-`+c[g].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}while(1<=g&&0<=n);break}}}finally{an=!1,Error.prepareStackTrace=r}return(e=e?e.displayName||e.name:"")?ai(e):""}function Oh(e){switch(e.tag){case 5:return ai(e.type);case 16:return ai("Lazy");case 13:return ai("Suspense");case 19:return ai("SuspenseList");case 0:case 2:case 15:return e=cn(e.type,!1),e;case 11:return e=cn(e.type.render,!1),e;case 1:return e=cn(e.type,!0),e;default:return""}}function Nn(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case br:return"Fragment";case xr:return"Portal";case Hn:return"Profiler";case Ho:return"StrictMode";case Fn:return"Suspense";case zn:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case tc:return(e.displayName||"Context")+".Consumer";case ec:return(e._context.displayName||"Context")+".Provider";case Fo:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case zo:return t=e.displayName||null,t!==null?t:Nn(e.type)||"Memo";case Ft:t=e._payload,e=e._init;try{return Nn(e(t))}catch{}}return null}function jh(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Nn(t);case 8:return t===Ho?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Zt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ic(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Hh(e){var t=ic(e)?"checked":"value",r=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),i=""+e[t];if(!e.hasOwnProperty(t)&&typeof r<"u"&&typeof r.get=="function"&&typeof r.set=="function"){var c=r.get,f=r.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return c.call(this)},set:function(g){i=""+g,f.call(this,g)}}),Object.defineProperty(e,t,{enumerable:r.enumerable}),{getValue:function(){return i},setValue:function(g){i=""+g},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Ki(e){e._valueTracker||(e._valueTracker=Hh(e))}function sc(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var r=t.getValue(),i="";return e&&(i=ic(e)?e.checked?"true":"false":e.value),e=i,e!==r?(t.setValue(e),!0):!1}function ys(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function Wn(e,t){var r=t.checked;return Ce({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:r??e._wrapperState.initialChecked})}function Bl(e,t){var r=t.defaultValue==null?"":t.defaultValue,i=t.checked!=null?t.checked:t.defaultChecked;r=Zt(t.value!=null?t.value:r),e._wrapperState={initialChecked:i,initialValue:r,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function nc(e,t){t=t.checked,t!=null&&jo(e,"checked",t,!1)}function Un(e,t){nc(e,t);var r=Zt(t.value),i=t.type;if(r!=null)i==="number"?(r===0&&e.value===""||e.value!=r)&&(e.value=""+r):e.value!==""+r&&(e.value=""+r);else if(i==="submit"||i==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?$n(e,t.type,r):t.hasOwnProperty("defaultValue")&&$n(e,t.type,Zt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Al(e,t,r){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var i=t.type;if(!(i!=="submit"&&i!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,r||t===e.value||(e.value=t),e.defaultValue=t}r=e.name,r!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,r!==""&&(e.name=r)}function $n(e,t,r){(t!=="number"||ys(e.ownerDocument)!==e)&&(r==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+r&&(e.defaultValue=""+r))}var ci=Array.isArray;function Ir(e,t,r,i){if(e=e.options,t){t={};for(var c=0;c<r.length;c++)t["$"+r[c]]=!0;for(r=0;r<e.length;r++)c=t.hasOwnProperty("$"+e[r].value),e[r].selected!==c&&(e[r].selected=c),c&&i&&(e[r].defaultSelected=!0)}else{for(r=""+Zt(r),t=null,c=0;c<e.length;c++){if(e[c].value===r){e[c].selected=!0,i&&(e[c].defaultSelected=!0);return}t!==null||e[c].disabled||(t=e[c])}t!==null&&(t.selected=!0)}}function Vn(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(V(91));return Ce({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ml(e,t){var r=t.value;if(r==null){if(r=t.children,t=t.defaultValue,r!=null){if(t!=null)throw Error(V(92));if(ci(r)){if(1<r.length)throw Error(V(93));r=r[0]}t=r}t==null&&(t=""),r=t}e._wrapperState={initialValue:Zt(r)}}function oc(e,t){var r=Zt(t.value),i=Zt(t.defaultValue);r!=null&&(r=""+r,r!==e.value&&(e.value=r),t.defaultValue==null&&e.defaultValue!==r&&(e.defaultValue=r)),i!=null&&(e.defaultValue=""+i)}function Pl(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function lc(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Kn(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?lc(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var qi,ac=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,r,i,c){MSApp.execUnsafeLocalFunction(function(){return e(t,r,i,c)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(qi=qi||document.createElement("div"),qi.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=qi.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function wi(e,t){if(t){var r=e.firstChild;if(r&&r===e.lastChild&&r.nodeType===3){r.nodeValue=t;return}}e.textContent=t}var di={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Fh=["Webkit","ms","Moz","O"];Object.keys(di).forEach(function(e){Fh.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),di[t]=di[e]})});function cc(e,t,r){return t==null||typeof t=="boolean"||t===""?"":r||typeof t!="number"||t===0||di.hasOwnProperty(e)&&di[e]?(""+t).trim():t+"px"}function uc(e,t){e=e.style;for(var r in t)if(t.hasOwnProperty(r)){var i=r.indexOf("--")===0,c=cc(r,t[r],i);r==="float"&&(r="cssFloat"),i?e.setProperty(r,c):e[r]=c}}var zh=Ce({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function qn(e,t){if(t){if(zh[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(V(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(V(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(V(61))}if(t.style!=null&&typeof t.style!="object")throw Error(V(62))}}function Gn(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Xn=null;function No(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Yn=null,Or=null,jr=null;function Il(e){if(e=Wi(e)){if(typeof Yn!="function")throw Error(V(280));var t=e.stateNode;t&&(t=Gs(t),Yn(e.stateNode,e.type,t))}}function hc(e){Or?jr?jr.push(e):jr=[e]:Or=e}function dc(){if(Or){var e=Or,t=jr;if(jr=Or=null,Il(e),t)for(e=0;e<t.length;e++)Il(t[e])}}function fc(e,t){return e(t)}function pc(){}var un=!1;function _c(e,t,r){if(un)return e(t,r);un=!0;try{return fc(e,t,r)}finally{un=!1,(Or!==null||jr!==null)&&(pc(),dc())}}function xi(e,t){var r=e.stateNode;if(r===null)return null;var i=Gs(r);if(i===null)return null;r=i[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(i=!i.disabled)||(e=e.type,i=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!i;break e;default:e=!1}if(e)return null;if(r&&typeof r!="function")throw Error(V(231,t,typeof r));return r}var Qn=!1;if(At)try{var ti={};Object.defineProperty(ti,"passive",{get:function(){Qn=!0}}),window.addEventListener("test",ti,ti),window.removeEventListener("test",ti,ti)}catch{Qn=!1}function Nh(e,t,r,i,c,f,g,n,u){var d=Array.prototype.slice.call(arguments,3);try{t.apply(r,d)}catch(y){this.onError(y)}}var fi=!1,Ss=null,Cs=!1,Jn=null,Wh={onError:function(e){fi=!0,Ss=e}};function Uh(e,t,r,i,c,f,g,n,u){fi=!1,Ss=null,Nh.apply(Wh,arguments)}function $h(e,t,r,i,c,f,g,n,u){if(Uh.apply(this,arguments),fi){if(fi){var d=Ss;fi=!1,Ss=null}else throw Error(V(198));Cs||(Cs=!0,Jn=d)}}function yr(e){var t=e,r=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(r=t.return),e=t.return;while(e)}return t.tag===3?r:null}function gc(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Ol(e){if(yr(e)!==e)throw Error(V(188))}function Vh(e){var t=e.alternate;if(!t){if(t=yr(e),t===null)throw Error(V(188));return t!==e?null:e}for(var r=e,i=t;;){var c=r.return;if(c===null)break;var f=c.alternate;if(f===null){if(i=c.return,i!==null){r=i;continue}break}if(c.child===f.child){for(f=c.child;f;){if(f===r)return Ol(c),e;if(f===i)return Ol(c),t;f=f.sibling}throw Error(V(188))}if(r.return!==i.return)r=c,i=f;else{for(var g=!1,n=c.child;n;){if(n===r){g=!0,r=c,i=f;break}if(n===i){g=!0,i=c,r=f;break}n=n.sibling}if(!g){for(n=f.child;n;){if(n===r){g=!0,r=f,i=c;break}if(n===i){g=!0,i=f,r=c;break}n=n.sibling}if(!g)throw Error(V(189))}}if(r.alternate!==i)throw Error(V(190))}if(r.tag!==3)throw Error(V(188));return r.stateNode.current===r?e:t}function vc(e){return e=Vh(e),e!==null?mc(e):null}function mc(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=mc(e);if(t!==null)return t;e=e.sibling}return null}var yc=tt.unstable_scheduleCallback,jl=tt.unstable_cancelCallback,Kh=tt.unstable_shouldYield,qh=tt.unstable_requestPaint,xe=tt.unstable_now,Gh=tt.unstable_getCurrentPriorityLevel,Wo=tt.unstable_ImmediatePriority,Sc=tt.unstable_UserBlockingPriority,ws=tt.unstable_NormalPriority,Xh=tt.unstable_LowPriority,Cc=tt.unstable_IdlePriority,$s=null,bt=null;function Yh(e){if(bt&&typeof bt.onCommitFiberRoot=="function")try{bt.onCommitFiberRoot($s,e,void 0,(e.current.flags&128)===128)}catch{}}var gt=Math.clz32?Math.clz32:Zh,Qh=Math.log,Jh=Math.LN2;function Zh(e){return e>>>=0,e===0?32:31-(Qh(e)/Jh|0)|0}var Gi=64,Xi=4194304;function ui(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function xs(e,t){var r=e.pendingLanes;if(r===0)return 0;var i=0,c=e.suspendedLanes,f=e.pingedLanes,g=r&268435455;if(g!==0){var n=g&~c;n!==0?i=ui(n):(f&=g,f!==0&&(i=ui(f)))}else g=r&~c,g!==0?i=ui(g):f!==0&&(i=ui(f));if(i===0)return 0;if(t!==0&&t!==i&&!(t&c)&&(c=i&-i,f=t&-t,c>=f||c===16&&(f&4194240)!==0))return t;if(i&4&&(i|=r&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=i;0<t;)r=31-gt(t),c=1<<r,i|=e[r],t&=~c;return i}function ed(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function td(e,t){for(var r=e.suspendedLanes,i=e.pingedLanes,c=e.expirationTimes,f=e.pendingLanes;0<f;){var g=31-gt(f),n=1<<g,u=c[g];u===-1?(!(n&r)||n&i)&&(c[g]=ed(n,t)):u<=t&&(e.expiredLanes|=n),f&=~n}}function Zn(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function wc(){var e=Gi;return Gi<<=1,!(Gi&4194240)&&(Gi=64),e}function hn(e){for(var t=[],r=0;31>r;r++)t.push(e);return t}function zi(e,t,r){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-gt(t),e[t]=r}function rd(e,t){var r=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var i=e.eventTimes;for(e=e.expirationTimes;0<r;){var c=31-gt(r),f=1<<c;t[c]=0,i[c]=-1,e[c]=-1,r&=~f}}function Uo(e,t){var r=e.entangledLanes|=t;for(e=e.entanglements;r;){var i=31-gt(r),c=1<<i;c&t|e[i]&t&&(e[i]|=t),r&=~c}}var he=0;function xc(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var bc,$o,kc,Ec,Lc,eo=!1,Yi=[],Vt=null,Kt=null,qt=null,bi=new Map,ki=new Map,Nt=[],id="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Hl(e,t){switch(e){case"focusin":case"focusout":Vt=null;break;case"dragenter":case"dragleave":Kt=null;break;case"mouseover":case"mouseout":qt=null;break;case"pointerover":case"pointerout":bi.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ki.delete(t.pointerId)}}function ri(e,t,r,i,c,f){return e===null||e.nativeEvent!==f?(e={blockedOn:t,domEventName:r,eventSystemFlags:i,nativeEvent:f,targetContainers:[c]},t!==null&&(t=Wi(t),t!==null&&$o(t)),e):(e.eventSystemFlags|=i,t=e.targetContainers,c!==null&&t.indexOf(c)===-1&&t.push(c),e)}function sd(e,t,r,i,c){switch(t){case"focusin":return Vt=ri(Vt,e,t,r,i,c),!0;case"dragenter":return Kt=ri(Kt,e,t,r,i,c),!0;case"mouseover":return qt=ri(qt,e,t,r,i,c),!0;case"pointerover":var f=c.pointerId;return bi.set(f,ri(bi.get(f)||null,e,t,r,i,c)),!0;case"gotpointercapture":return f=c.pointerId,ki.set(f,ri(ki.get(f)||null,e,t,r,i,c)),!0}return!1}function Dc(e){var t=ar(e.target);if(t!==null){var r=yr(t);if(r!==null){if(t=r.tag,t===13){if(t=gc(r),t!==null){e.blockedOn=t,Lc(e.priority,function(){kc(r)});return}}else if(t===3&&r.stateNode.current.memoizedState.isDehydrated){e.blockedOn=r.tag===3?r.stateNode.containerInfo:null;return}}}e.blockedOn=null}function cs(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var r=to(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(r===null){r=e.nativeEvent;var i=new r.constructor(r.type,r);Xn=i,r.target.dispatchEvent(i),Xn=null}else return t=Wi(r),t!==null&&$o(t),e.blockedOn=r,!1;t.shift()}return!0}function Fl(e,t,r){cs(e)&&r.delete(t)}function nd(){eo=!1,Vt!==null&&cs(Vt)&&(Vt=null),Kt!==null&&cs(Kt)&&(Kt=null),qt!==null&&cs(qt)&&(qt=null),bi.forEach(Fl),ki.forEach(Fl)}function ii(e,t){e.blockedOn===t&&(e.blockedOn=null,eo||(eo=!0,tt.unstable_scheduleCallback(tt.unstable_NormalPriority,nd)))}function Ei(e){function t(c){return ii(c,e)}if(0<Yi.length){ii(Yi[0],e);for(var r=1;r<Yi.length;r++){var i=Yi[r];i.blockedOn===e&&(i.blockedOn=null)}}for(Vt!==null&&ii(Vt,e),Kt!==null&&ii(Kt,e),qt!==null&&ii(qt,e),bi.forEach(t),ki.forEach(t),r=0;r<Nt.length;r++)i=Nt[r],i.blockedOn===e&&(i.blockedOn=null);for(;0<Nt.length&&(r=Nt[0],r.blockedOn===null);)Dc(r),r.blockedOn===null&&Nt.shift()}var Hr=Ot.ReactCurrentBatchConfig,bs=!0;function od(e,t,r,i){var c=he,f=Hr.transition;Hr.transition=null;try{he=1,Vo(e,t,r,i)}finally{he=c,Hr.transition=f}}function ld(e,t,r,i){var c=he,f=Hr.transition;Hr.transition=null;try{he=4,Vo(e,t,r,i)}finally{he=c,Hr.transition=f}}function Vo(e,t,r,i){if(bs){var c=to(e,t,r,i);if(c===null)Cn(e,t,i,ks,r),Hl(e,i);else if(sd(c,e,t,r,i))i.stopPropagation();else if(Hl(e,i),t&4&&-1<id.indexOf(e)){for(;c!==null;){var f=Wi(c);if(f!==null&&bc(f),f=to(e,t,r,i),f===null&&Cn(e,t,i,ks,r),f===c)break;c=f}c!==null&&i.stopPropagation()}else Cn(e,t,i,null,r)}}var ks=null;function to(e,t,r,i){if(ks=null,e=No(i),e=ar(e),e!==null)if(t=yr(e),t===null)e=null;else if(r=t.tag,r===13){if(e=gc(t),e!==null)return e;e=null}else if(r===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return ks=e,null}function Rc(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Gh()){case Wo:return 1;case Sc:return 4;case ws:case Xh:return 16;case Cc:return 536870912;default:return 16}default:return 16}}var Ut=null,Ko=null,us=null;function Tc(){if(us)return us;var e,t=Ko,r=t.length,i,c="value"in Ut?Ut.value:Ut.textContent,f=c.length;for(e=0;e<r&&t[e]===c[e];e++);var g=r-e;for(i=1;i<=g&&t[r-i]===c[f-i];i++);return us=c.slice(e,1<i?1-i:void 0)}function hs(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Qi(){return!0}function zl(){return!1}function it(e){function t(r,i,c,f,g){this._reactName=r,this._targetInst=c,this.type=i,this.nativeEvent=f,this.target=g,this.currentTarget=null;for(var n in e)e.hasOwnProperty(n)&&(r=e[n],this[n]=r?r(f):f[n]);return this.isDefaultPrevented=(f.defaultPrevented!=null?f.defaultPrevented:f.returnValue===!1)?Qi:zl,this.isPropagationStopped=zl,this}return Ce(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var r=this.nativeEvent;r&&(r.preventDefault?r.preventDefault():typeof r.returnValue!="unknown"&&(r.returnValue=!1),this.isDefaultPrevented=Qi)},stopPropagation:function(){var r=this.nativeEvent;r&&(r.stopPropagation?r.stopPropagation():typeof r.cancelBubble!="unknown"&&(r.cancelBubble=!0),this.isPropagationStopped=Qi)},persist:function(){},isPersistent:Qi}),t}var Xr={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},qo=it(Xr),Ni=Ce({},Xr,{view:0,detail:0}),ad=it(Ni),dn,fn,si,Vs=Ce({},Ni,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Go,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==si&&(si&&e.type==="mousemove"?(dn=e.screenX-si.screenX,fn=e.screenY-si.screenY):fn=dn=0,si=e),dn)},movementY:function(e){return"movementY"in e?e.movementY:fn}}),Nl=it(Vs),cd=Ce({},Vs,{dataTransfer:0}),ud=it(cd),hd=Ce({},Ni,{relatedTarget:0}),pn=it(hd),dd=Ce({},Xr,{animationName:0,elapsedTime:0,pseudoElement:0}),fd=it(dd),pd=Ce({},Xr,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),_d=it(pd),gd=Ce({},Xr,{data:0}),Wl=it(gd),vd={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},md={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},yd={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Sd(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=yd[e])?!!t[e]:!1}function Go(){return Sd}var Cd=Ce({},Ni,{key:function(e){if(e.key){var t=vd[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=hs(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?md[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Go,charCode:function(e){return e.type==="keypress"?hs(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?hs(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),wd=it(Cd),xd=Ce({},Vs,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Ul=it(xd),bd=Ce({},Ni,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Go}),kd=it(bd),Ed=Ce({},Xr,{propertyName:0,elapsedTime:0,pseudoElement:0}),Ld=it(Ed),Dd=Ce({},Vs,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Rd=it(Dd),Td=[9,13,27,32],Xo=At&&"CompositionEvent"in window,pi=null;At&&"documentMode"in document&&(pi=document.documentMode);var Bd=At&&"TextEvent"in window&&!pi,Bc=At&&(!Xo||pi&&8<pi&&11>=pi),$l=" ",Vl=!1;function Ac(e,t){switch(e){case"keyup":return Td.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Mc(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var kr=!1;function Ad(e,t){switch(e){case"compositionend":return Mc(t);case"keypress":return t.which!==32?null:(Vl=!0,$l);case"textInput":return e=t.data,e===$l&&Vl?null:e;default:return null}}function Md(e,t){if(kr)return e==="compositionend"||!Xo&&Ac(e,t)?(e=Tc(),us=Ko=Ut=null,kr=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Bc&&t.locale!=="ko"?null:t.data;default:return null}}var Pd={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Kl(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Pd[e.type]:t==="textarea"}function Pc(e,t,r,i){hc(i),t=Es(t,"onChange"),0<t.length&&(r=new qo("onChange","change",null,r,i),e.push({event:r,listeners:t}))}var _i=null,Li=null;function Id(e){Vc(e,0)}function Ks(e){var t=Dr(e);if(sc(t))return e}function Od(e,t){if(e==="change")return t}var Ic=!1;if(At){var _n;if(At){var gn="oninput"in document;if(!gn){var ql=document.createElement("div");ql.setAttribute("oninput","return;"),gn=typeof ql.oninput=="function"}_n=gn}else _n=!1;Ic=_n&&(!document.documentMode||9<document.documentMode)}function Gl(){_i&&(_i.detachEvent("onpropertychange",Oc),Li=_i=null)}function Oc(e){if(e.propertyName==="value"&&Ks(Li)){var t=[];Pc(t,Li,e,No(e)),_c(Id,t)}}function jd(e,t,r){e==="focusin"?(Gl(),_i=t,Li=r,_i.attachEvent("onpropertychange",Oc)):e==="focusout"&&Gl()}function Hd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Ks(Li)}function Fd(e,t){if(e==="click")return Ks(t)}function zd(e,t){if(e==="input"||e==="change")return Ks(t)}function Nd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var mt=typeof Object.is=="function"?Object.is:Nd;function Di(e,t){if(mt(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var r=Object.keys(e),i=Object.keys(t);if(r.length!==i.length)return!1;for(i=0;i<r.length;i++){var c=r[i];if(!jn.call(t,c)||!mt(e[c],t[c]))return!1}return!0}function Xl(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Yl(e,t){var r=Xl(e);e=0;for(var i;r;){if(r.nodeType===3){if(i=e+r.textContent.length,e<=t&&i>=t)return{node:r,offset:t-e};e=i}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Xl(r)}}function jc(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?jc(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Hc(){for(var e=window,t=ys();t instanceof e.HTMLIFrameElement;){try{var r=typeof t.contentWindow.location.href=="string"}catch{r=!1}if(r)e=t.contentWindow;else break;t=ys(e.document)}return t}function Yo(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Wd(e){var t=Hc(),r=e.focusedElem,i=e.selectionRange;if(t!==r&&r&&r.ownerDocument&&jc(r.ownerDocument.documentElement,r)){if(i!==null&&Yo(r)){if(t=i.start,e=i.end,e===void 0&&(e=t),"selectionStart"in r)r.selectionStart=t,r.selectionEnd=Math.min(e,r.value.length);else if(e=(t=r.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var c=r.textContent.length,f=Math.min(i.start,c);i=i.end===void 0?f:Math.min(i.end,c),!e.extend&&f>i&&(c=i,i=f,f=c),c=Yl(r,f);var g=Yl(r,i);c&&g&&(e.rangeCount!==1||e.anchorNode!==c.node||e.anchorOffset!==c.offset||e.focusNode!==g.node||e.focusOffset!==g.offset)&&(t=t.createRange(),t.setStart(c.node,c.offset),e.removeAllRanges(),f>i?(e.addRange(t),e.extend(g.node,g.offset)):(t.setEnd(g.node,g.offset),e.addRange(t)))}}for(t=[],e=r;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof r.focus=="function"&&r.focus(),r=0;r<t.length;r++)e=t[r],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Ud=At&&"documentMode"in document&&11>=document.documentMode,Er=null,ro=null,gi=null,io=!1;function Ql(e,t,r){var i=r.window===r?r.document:r.nodeType===9?r:r.ownerDocument;io||Er==null||Er!==ys(i)||(i=Er,"selectionStart"in i&&Yo(i)?i={start:i.selectionStart,end:i.selectionEnd}:(i=(i.ownerDocument&&i.ownerDocument.defaultView||window).getSelection(),i={anchorNode:i.anchorNode,anchorOffset:i.anchorOffset,focusNode:i.focusNode,focusOffset:i.focusOffset}),gi&&Di(gi,i)||(gi=i,i=Es(ro,"onSelect"),0<i.length&&(t=new qo("onSelect","select",null,t,r),e.push({event:t,listeners:i}),t.target=Er)))}function Ji(e,t){var r={};return r[e.toLowerCase()]=t.toLowerCase(),r["Webkit"+e]="webkit"+t,r["Moz"+e]="moz"+t,r}var Lr={animationend:Ji("Animation","AnimationEnd"),animationiteration:Ji("Animation","AnimationIteration"),animationstart:Ji("Animation","AnimationStart"),transitionend:Ji("Transition","TransitionEnd")},vn={},Fc={};At&&(Fc=document.createElement("div").style,"AnimationEvent"in window||(delete Lr.animationend.animation,delete Lr.animationiteration.animation,delete Lr.animationstart.animation),"TransitionEvent"in window||delete Lr.transitionend.transition);function qs(e){if(vn[e])return vn[e];if(!Lr[e])return e;var t=Lr[e],r;for(r in t)if(t.hasOwnProperty(r)&&r in Fc)return vn[e]=t[r];return e}var zc=qs("animationend"),Nc=qs("animationiteration"),Wc=qs("animationstart"),Uc=qs("transitionend"),$c=new Map,Jl="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function tr(e,t){$c.set(e,t),mr(t,[e])}for(var mn=0;mn<Jl.length;mn++){var yn=Jl[mn],$d=yn.toLowerCase(),Vd=yn[0].toUpperCase()+yn.slice(1);tr($d,"on"+Vd)}tr(zc,"onAnimationEnd");tr(Nc,"onAnimationIteration");tr(Wc,"onAnimationStart");tr("dblclick","onDoubleClick");tr("focusin","onFocus");tr("focusout","onBlur");tr(Uc,"onTransitionEnd");Nr("onMouseEnter",["mouseout","mouseover"]);Nr("onMouseLeave",["mouseout","mouseover"]);Nr("onPointerEnter",["pointerout","pointerover"]);Nr("onPointerLeave",["pointerout","pointerover"]);mr("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));mr("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));mr("onBeforeInput",["compositionend","keypress","textInput","paste"]);mr("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));mr("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));mr("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var hi="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Kd=new Set("cancel close invalid load scroll toggle".split(" ").concat(hi));function Zl(e,t,r){var i=e.type||"unknown-event";e.currentTarget=r,$h(i,t,void 0,e),e.currentTarget=null}function Vc(e,t){t=(t&4)!==0;for(var r=0;r<e.length;r++){var i=e[r],c=i.event;i=i.listeners;e:{var f=void 0;if(t)for(var g=i.length-1;0<=g;g--){var n=i[g],u=n.instance,d=n.currentTarget;if(n=n.listener,u!==f&&c.isPropagationStopped())break e;Zl(c,n,d),f=u}else for(g=0;g<i.length;g++){if(n=i[g],u=n.instance,d=n.currentTarget,n=n.listener,u!==f&&c.isPropagationStopped())break e;Zl(c,n,d),f=u}}}if(Cs)throw e=Jn,Cs=!1,Jn=null,e}function _e(e,t){var r=t[ao];r===void 0&&(r=t[ao]=new Set);var i=e+"__bubble";r.has(i)||(Kc(t,e,2,!1),r.add(i))}function Sn(e,t,r){var i=0;t&&(i|=4),Kc(r,e,i,t)}var Zi="_reactListening"+Math.random().toString(36).slice(2);function Ri(e){if(!e[Zi]){e[Zi]=!0,Za.forEach(function(r){r!=="selectionchange"&&(Kd.has(r)||Sn(r,!1,e),Sn(r,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Zi]||(t[Zi]=!0,Sn("selectionchange",!1,t))}}function Kc(e,t,r,i){switch(Rc(t)){case 1:var c=od;break;case 4:c=ld;break;default:c=Vo}r=c.bind(null,t,r,e),c=void 0,!Qn||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(c=!0),i?c!==void 0?e.addEventListener(t,r,{capture:!0,passive:c}):e.addEventListener(t,r,!0):c!==void 0?e.addEventListener(t,r,{passive:c}):e.addEventListener(t,r,!1)}function Cn(e,t,r,i,c){var f=i;if(!(t&1)&&!(t&2)&&i!==null)e:for(;;){if(i===null)return;var g=i.tag;if(g===3||g===4){var n=i.stateNode.containerInfo;if(n===c||n.nodeType===8&&n.parentNode===c)break;if(g===4)for(g=i.return;g!==null;){var u=g.tag;if((u===3||u===4)&&(u=g.stateNode.containerInfo,u===c||u.nodeType===8&&u.parentNode===c))return;g=g.return}for(;n!==null;){if(g=ar(n),g===null)return;if(u=g.tag,u===5||u===6){i=f=g;continue e}n=n.parentNode}}i=i.return}_c(function(){var d=f,y=No(r),h=[];e:{var _=$c.get(e);if(_!==void 0){var S=qo,w=e;switch(e){case"keypress":if(hs(r)===0)break e;case"keydown":case"keyup":S=wd;break;case"focusin":w="focus",S=pn;break;case"focusout":w="blur",S=pn;break;case"beforeblur":case"afterblur":S=pn;break;case"click":if(r.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":S=Nl;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":S=ud;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":S=kd;break;case zc:case Nc:case Wc:S=fd;break;case Uc:S=Ld;break;case"scroll":S=ad;break;case"wheel":S=Rd;break;case"copy":case"cut":case"paste":S=_d;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":S=Ul}var C=(t&4)!==0,a=!C&&e==="scroll",l=C?_!==null?_+"Capture":null:_;C=[];for(var s=d,o;s!==null;){o=s;var p=o.stateNode;if(o.tag===5&&p!==null&&(o=p,l!==null&&(p=xi(s,l),p!=null&&C.push(Ti(s,p,o)))),a)break;s=s.return}0<C.length&&(_=new S(_,w,null,r,y),h.push({event:_,listeners:C}))}}if(!(t&7)){e:{if(_=e==="mouseover"||e==="pointerover",S=e==="mouseout"||e==="pointerout",_&&r!==Xn&&(w=r.relatedTarget||r.fromElement)&&(ar(w)||w[Mt]))break e;if((S||_)&&(_=y.window===y?y:(_=y.ownerDocument)?_.defaultView||_.parentWindow:window,S?(w=r.relatedTarget||r.toElement,S=d,w=w?ar(w):null,w!==null&&(a=yr(w),w!==a||w.tag!==5&&w.tag!==6)&&(w=null)):(S=null,w=d),S!==w)){if(C=Nl,p="onMouseLeave",l="onMouseEnter",s="mouse",(e==="pointerout"||e==="pointerover")&&(C=Ul,p="onPointerLeave",l="onPointerEnter",s="pointer"),a=S==null?_:Dr(S),o=w==null?_:Dr(w),_=new C(p,s+"leave",S,r,y),_.target=a,_.relatedTarget=o,p=null,ar(y)===d&&(C=new C(l,s+"enter",w,r,y),C.target=o,C.relatedTarget=a,p=C),a=p,S&&w)t:{for(C=S,l=w,s=0,o=C;o;o=wr(o))s++;for(o=0,p=l;p;p=wr(p))o++;for(;0<s-o;)C=wr(C),s--;for(;0<o-s;)l=wr(l),o--;for(;s--;){if(C===l||l!==null&&C===l.alternate)break t;C=wr(C),l=wr(l)}C=null}else C=null;S!==null&&ea(h,_,S,C,!1),w!==null&&a!==null&&ea(h,a,w,C,!0)}}e:{if(_=d?Dr(d):window,S=_.nodeName&&_.nodeName.toLowerCase(),S==="select"||S==="input"&&_.type==="file")var m=Od;else if(Kl(_))if(Ic)m=zd;else{m=Hd;var x=jd}else(S=_.nodeName)&&S.toLowerCase()==="input"&&(_.type==="checkbox"||_.type==="radio")&&(m=Fd);if(m&&(m=m(e,d))){Pc(h,m,r,y);break e}x&&x(e,_,d),e==="focusout"&&(x=_._wrapperState)&&x.controlled&&_.type==="number"&&$n(_,"number",_.value)}switch(x=d?Dr(d):window,e){case"focusin":(Kl(x)||x.contentEditable==="true")&&(Er=x,ro=d,gi=null);break;case"focusout":gi=ro=Er=null;break;case"mousedown":io=!0;break;case"contextmenu":case"mouseup":case"dragend":io=!1,Ql(h,r,y);break;case"selectionchange":if(Ud)break;case"keydown":case"keyup":Ql(h,r,y)}var E;if(Xo)e:{switch(e){case"compositionstart":var v="onCompositionStart";break e;case"compositionend":v="onCompositionEnd";break e;case"compositionupdate":v="onCompositionUpdate";break e}v=void 0}else kr?Ac(e,r)&&(v="onCompositionEnd"):e==="keydown"&&r.keyCode===229&&(v="onCompositionStart");v&&(Bc&&r.locale!=="ko"&&(kr||v!=="onCompositionStart"?v==="onCompositionEnd"&&kr&&(E=Tc()):(Ut=y,Ko="value"in Ut?Ut.value:Ut.textContent,kr=!0)),x=Es(d,v),0<x.length&&(v=new Wl(v,e,null,r,y),h.push({event:v,listeners:x}),E?v.data=E:(E=Mc(r),E!==null&&(v.data=E)))),(E=Bd?Ad(e,r):Md(e,r))&&(d=Es(d,"onBeforeInput"),0<d.length&&(y=new Wl("onBeforeInput","beforeinput",null,r,y),h.push({event:y,listeners:d}),y.data=E))}Vc(h,t)})}function Ti(e,t,r){return{instance:e,listener:t,currentTarget:r}}function Es(e,t){for(var r=t+"Capture",i=[];e!==null;){var c=e,f=c.stateNode;c.tag===5&&f!==null&&(c=f,f=xi(e,r),f!=null&&i.unshift(Ti(e,f,c)),f=xi(e,t),f!=null&&i.push(Ti(e,f,c))),e=e.return}return i}function wr(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function ea(e,t,r,i,c){for(var f=t._reactName,g=[];r!==null&&r!==i;){var n=r,u=n.alternate,d=n.stateNode;if(u!==null&&u===i)break;n.tag===5&&d!==null&&(n=d,c?(u=xi(r,f),u!=null&&g.unshift(Ti(r,u,n))):c||(u=xi(r,f),u!=null&&g.push(Ti(r,u,n)))),r=r.return}g.length!==0&&e.push({event:t,listeners:g})}var qd=/\r\n?/g,Gd=/\u0000|\uFFFD/g;function ta(e){return(typeof e=="string"?e:""+e).replace(qd,`
-`).replace(Gd,"")}function es(e,t,r){if(t=ta(t),ta(e)!==t&&r)throw Error(V(425))}function Ls(){}var so=null,no=null;function oo(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var lo=typeof setTimeout=="function"?setTimeout:void 0,Xd=typeof clearTimeout=="function"?clearTimeout:void 0,ra=typeof Promise=="function"?Promise:void 0,Yd=typeof queueMicrotask=="function"?queueMicrotask:typeof ra<"u"?function(e){return ra.resolve(null).then(e).catch(Qd)}:lo;function Qd(e){setTimeout(function(){throw e})}function wn(e,t){var r=t,i=0;do{var c=r.nextSibling;if(e.removeChild(r),c&&c.nodeType===8)if(r=c.data,r==="/$"){if(i===0){e.removeChild(c),Ei(t);return}i--}else r!=="$"&&r!=="$?"&&r!=="$!"||i++;r=c}while(r);Ei(t)}function Gt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function ia(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var r=e.data;if(r==="$"||r==="$!"||r==="$?"){if(t===0)return e;t--}else r==="/$"&&t++}e=e.previousSibling}return null}var Yr=Math.random().toString(36).slice(2),xt="__reactFiber$"+Yr,Bi="__reactProps$"+Yr,Mt="__reactContainer$"+Yr,ao="__reactEvents$"+Yr,Jd="__reactListeners$"+Yr,Zd="__reactHandles$"+Yr;function ar(e){var t=e[xt];if(t)return t;for(var r=e.parentNode;r;){if(t=r[Mt]||r[xt]){if(r=t.alternate,t.child!==null||r!==null&&r.child!==null)for(e=ia(e);e!==null;){if(r=e[xt])return r;e=ia(e)}return t}e=r,r=e.parentNode}return null}function Wi(e){return e=e[xt]||e[Mt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Dr(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(V(33))}function Gs(e){return e[Bi]||null}var co=[],Rr=-1;function rr(e){return{current:e}}function ge(e){0>Rr||(e.current=co[Rr],co[Rr]=null,Rr--)}function fe(e,t){Rr++,co[Rr]=e.current,e.current=t}var er={},ze=rr(er),qe=rr(!1),fr=er;function Wr(e,t){var r=e.type.contextTypes;if(!r)return er;var i=e.stateNode;if(i&&i.__reactInternalMemoizedUnmaskedChildContext===t)return i.__reactInternalMemoizedMaskedChildContext;var c={},f;for(f in r)c[f]=t[f];return i&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=c),c}function Ge(e){return e=e.childContextTypes,e!=null}function Ds(){ge(qe),ge(ze)}function sa(e,t,r){if(ze.current!==er)throw Error(V(168));fe(ze,t),fe(qe,r)}function qc(e,t,r){var i=e.stateNode;if(t=t.childContextTypes,typeof i.getChildContext!="function")return r;i=i.getChildContext();for(var c in i)if(!(c in t))throw Error(V(108,jh(e)||"Unknown",c));return Ce({},r,i)}function Rs(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||er,fr=ze.current,fe(ze,e),fe(qe,qe.current),!0}function na(e,t,r){var i=e.stateNode;if(!i)throw Error(V(169));r?(e=qc(e,t,fr),i.__reactInternalMemoizedMergedChildContext=e,ge(qe),ge(ze),fe(ze,e)):ge(qe),fe(qe,r)}var Lt=null,Xs=!1,xn=!1;function Gc(e){Lt===null?Lt=[e]:Lt.push(e)}function ef(e){Xs=!0,Gc(e)}function ir(){if(!xn&&Lt!==null){xn=!0;var e=0,t=he;try{var r=Lt;for(he=1;e<r.length;e++){var i=r[e];do i=i(!0);while(i!==null)}Lt=null,Xs=!1}catch(c){throw Lt!==null&&(Lt=Lt.slice(e+1)),yc(Wo,ir),c}finally{he=t,xn=!1}}return null}var Tr=[],Br=0,Ts=null,Bs=0,st=[],nt=0,pr=null,Rt=1,Tt="";function or(e,t){Tr[Br++]=Bs,Tr[Br++]=Ts,Ts=e,Bs=t}function Xc(e,t,r){st[nt++]=Rt,st[nt++]=Tt,st[nt++]=pr,pr=e;var i=Rt;e=Tt;var c=32-gt(i)-1;i&=~(1<<c),r+=1;var f=32-gt(t)+c;if(30<f){var g=c-c%5;f=(i&(1<<g)-1).toString(32),i>>=g,c-=g,Rt=1<<32-gt(t)+c|r<<c|i,Tt=f+e}else Rt=1<<f|r<<c|i,Tt=e}function Qo(e){e.return!==null&&(or(e,1),Xc(e,1,0))}function Jo(e){for(;e===Ts;)Ts=Tr[--Br],Tr[Br]=null,Bs=Tr[--Br],Tr[Br]=null;for(;e===pr;)pr=st[--nt],st[nt]=null,Tt=st[--nt],st[nt]=null,Rt=st[--nt],st[nt]=null}var et=null,Ze=null,ve=!1,_t=null;function Yc(e,t){var r=ot(5,null,null,0);r.elementType="DELETED",r.stateNode=t,r.return=e,t=e.deletions,t===null?(e.deletions=[r],e.flags|=16):t.push(r)}function oa(e,t){switch(e.tag){case 5:var r=e.type;return t=t.nodeType!==1||r.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,et=e,Ze=Gt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,et=e,Ze=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(r=pr!==null?{id:Rt,overflow:Tt}:null,e.memoizedState={dehydrated:t,treeContext:r,retryLane:1073741824},r=ot(18,null,null,0),r.stateNode=t,r.return=e,e.child=r,et=e,Ze=null,!0):!1;default:return!1}}function uo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function ho(e){if(ve){var t=Ze;if(t){var r=t;if(!oa(e,t)){if(uo(e))throw Error(V(418));t=Gt(r.nextSibling);var i=et;t&&oa(e,t)?Yc(i,r):(e.flags=e.flags&-4097|2,ve=!1,et=e)}}else{if(uo(e))throw Error(V(418));e.flags=e.flags&-4097|2,ve=!1,et=e}}}function la(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;et=e}function ts(e){if(e!==et)return!1;if(!ve)return la(e),ve=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!oo(e.type,e.memoizedProps)),t&&(t=Ze)){if(uo(e))throw Qc(),Error(V(418));for(;t;)Yc(e,t),t=Gt(t.nextSibling)}if(la(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(V(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var r=e.data;if(r==="/$"){if(t===0){Ze=Gt(e.nextSibling);break e}t--}else r!=="$"&&r!=="$!"&&r!=="$?"||t++}e=e.nextSibling}Ze=null}}else Ze=et?Gt(e.stateNode.nextSibling):null;return!0}function Qc(){for(var e=Ze;e;)e=Gt(e.nextSibling)}function Ur(){Ze=et=null,ve=!1}function Zo(e){_t===null?_t=[e]:_t.push(e)}var tf=Ot.ReactCurrentBatchConfig;function ni(e,t,r){if(e=r.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(r._owner){if(r=r._owner,r){if(r.tag!==1)throw Error(V(309));var i=r.stateNode}if(!i)throw Error(V(147,e));var c=i,f=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===f?t.ref:(t=function(g){var n=c.refs;g===null?delete n[f]:n[f]=g},t._stringRef=f,t)}if(typeof e!="string")throw Error(V(284));if(!r._owner)throw Error(V(290,e))}return e}function rs(e,t){throw e=Object.prototype.toString.call(t),Error(V(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function aa(e){var t=e._init;return t(e._payload)}function Jc(e){function t(l,s){if(e){var o=l.deletions;o===null?(l.deletions=[s],l.flags|=16):o.push(s)}}function r(l,s){if(!e)return null;for(;s!==null;)t(l,s),s=s.sibling;return null}function i(l,s){for(l=new Map;s!==null;)s.key!==null?l.set(s.key,s):l.set(s.index,s),s=s.sibling;return l}function c(l,s){return l=Jt(l,s),l.index=0,l.sibling=null,l}function f(l,s,o){return l.index=o,e?(o=l.alternate,o!==null?(o=o.index,o<s?(l.flags|=2,s):o):(l.flags|=2,s)):(l.flags|=1048576,s)}function g(l){return e&&l.alternate===null&&(l.flags|=2),l}function n(l,s,o,p){return s===null||s.tag!==6?(s=Tn(o,l.mode,p),s.return=l,s):(s=c(s,o),s.return=l,s)}function u(l,s,o,p){var m=o.type;return m===br?y(l,s,o.props.children,p,o.key):s!==null&&(s.elementType===m||typeof m=="object"&&m!==null&&m.$$typeof===Ft&&aa(m)===s.type)?(p=c(s,o.props),p.ref=ni(l,s,o),p.return=l,p):(p=ms(o.type,o.key,o.props,null,l.mode,p),p.ref=ni(l,s,o),p.return=l,p)}function d(l,s,o,p){return s===null||s.tag!==4||s.stateNode.containerInfo!==o.containerInfo||s.stateNode.implementation!==o.implementation?(s=Bn(o,l.mode,p),s.return=l,s):(s=c(s,o.children||[]),s.return=l,s)}function y(l,s,o,p,m){return s===null||s.tag!==7?(s=dr(o,l.mode,p,m),s.return=l,s):(s=c(s,o),s.return=l,s)}function h(l,s,o){if(typeof s=="string"&&s!==""||typeof s=="number")return s=Tn(""+s,l.mode,o),s.return=l,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Vi:return o=ms(s.type,s.key,s.props,null,l.mode,o),o.ref=ni(l,null,s),o.return=l,o;case xr:return s=Bn(s,l.mode,o),s.return=l,s;case Ft:var p=s._init;return h(l,p(s._payload),o)}if(ci(s)||ei(s))return s=dr(s,l.mode,o,null),s.return=l,s;rs(l,s)}return null}function _(l,s,o,p){var m=s!==null?s.key:null;if(typeof o=="string"&&o!==""||typeof o=="number")return m!==null?null:n(l,s,""+o,p);if(typeof o=="object"&&o!==null){switch(o.$$typeof){case Vi:return o.key===m?u(l,s,o,p):null;case xr:return o.key===m?d(l,s,o,p):null;case Ft:return m=o._init,_(l,s,m(o._payload),p)}if(ci(o)||ei(o))return m!==null?null:y(l,s,o,p,null);rs(l,o)}return null}function S(l,s,o,p,m){if(typeof p=="string"&&p!==""||typeof p=="number")return l=l.get(o)||null,n(s,l,""+p,m);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case Vi:return l=l.get(p.key===null?o:p.key)||null,u(s,l,p,m);case xr:return l=l.get(p.key===null?o:p.key)||null,d(s,l,p,m);case Ft:var x=p._init;return S(l,s,o,x(p._payload),m)}if(ci(p)||ei(p))return l=l.get(o)||null,y(s,l,p,m,null);rs(s,p)}return null}function w(l,s,o,p){for(var m=null,x=null,E=s,v=s=0,k=null;E!==null&&v<o.length;v++){E.index>v?(k=E,E=null):k=E.sibling;var B=_(l,E,o[v],p);if(B===null){E===null&&(E=k);break}e&&E&&B.alternate===null&&t(l,E),s=f(B,s,v),x===null?m=B:x.sibling=B,x=B,E=k}if(v===o.length)return r(l,E),ve&&or(l,v),m;if(E===null){for(;v<o.length;v++)E=h(l,o[v],p),E!==null&&(s=f(E,s,v),x===null?m=E:x.sibling=E,x=E);return ve&&or(l,v),m}for(E=i(l,E);v<o.length;v++)k=S(E,l,v,o[v],p),k!==null&&(e&&k.alternate!==null&&E.delete(k.key===null?v:k.key),s=f(k,s,v),x===null?m=k:x.sibling=k,x=k);return e&&E.forEach(function(M){return t(l,M)}),ve&&or(l,v),m}function C(l,s,o,p){var m=ei(o);if(typeof m!="function")throw Error(V(150));if(o=m.call(o),o==null)throw Error(V(151));for(var x=m=null,E=s,v=s=0,k=null,B=o.next();E!==null&&!B.done;v++,B=o.next()){E.index>v?(k=E,E=null):k=E.sibling;var M=_(l,E,B.value,p);if(M===null){E===null&&(E=k);break}e&&E&&M.alternate===null&&t(l,E),s=f(M,s,v),x===null?m=M:x.sibling=M,x=M,E=k}if(B.done)return r(l,E),ve&&or(l,v),m;if(E===null){for(;!B.done;v++,B=o.next())B=h(l,B.value,p),B!==null&&(s=f(B,s,v),x===null?m=B:x.sibling=B,x=B);return ve&&or(l,v),m}for(E=i(l,E);!B.done;v++,B=o.next())B=S(E,l,v,B.value,p),B!==null&&(e&&B.alternate!==null&&E.delete(B.key===null?v:B.key),s=f(B,s,v),x===null?m=B:x.sibling=B,x=B);return e&&E.forEach(function(T){return t(l,T)}),ve&&or(l,v),m}function a(l,s,o,p){if(typeof o=="object"&&o!==null&&o.type===br&&o.key===null&&(o=o.props.children),typeof o=="object"&&o!==null){switch(o.$$typeof){case Vi:e:{for(var m=o.key,x=s;x!==null;){if(x.key===m){if(m=o.type,m===br){if(x.tag===7){r(l,x.sibling),s=c(x,o.props.children),s.return=l,l=s;break e}}else if(x.elementType===m||typeof m=="object"&&m!==null&&m.$$typeof===Ft&&aa(m)===x.type){r(l,x.sibling),s=c(x,o.props),s.ref=ni(l,x,o),s.return=l,l=s;break e}r(l,x);break}else t(l,x);x=x.sibling}o.type===br?(s=dr(o.props.children,l.mode,p,o.key),s.return=l,l=s):(p=ms(o.type,o.key,o.props,null,l.mode,p),p.ref=ni(l,s,o),p.return=l,l=p)}return g(l);case xr:e:{for(x=o.key;s!==null;){if(s.key===x)if(s.tag===4&&s.stateNode.containerInfo===o.containerInfo&&s.stateNode.implementation===o.implementation){r(l,s.sibling),s=c(s,o.children||[]),s.return=l,l=s;break e}else{r(l,s);break}else t(l,s);s=s.sibling}s=Bn(o,l.mode,p),s.return=l,l=s}return g(l);case Ft:return x=o._init,a(l,s,x(o._payload),p)}if(ci(o))return w(l,s,o,p);if(ei(o))return C(l,s,o,p);rs(l,o)}return typeof o=="string"&&o!==""||typeof o=="number"?(o=""+o,s!==null&&s.tag===6?(r(l,s.sibling),s=c(s,o),s.return=l,l=s):(r(l,s),s=Tn(o,l.mode,p),s.return=l,l=s),g(l)):r(l,s)}return a}var $r=Jc(!0),Zc=Jc(!1),As=rr(null),Ms=null,Ar=null,el=null;function tl(){el=Ar=Ms=null}function rl(e){var t=As.current;ge(As),e._currentValue=t}function fo(e,t,r){for(;e!==null;){var i=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,i!==null&&(i.childLanes|=t)):i!==null&&(i.childLanes&t)!==t&&(i.childLanes|=t),e===r)break;e=e.return}}function Fr(e,t){Ms=e,el=Ar=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(Ke=!0),e.firstContext=null)}function at(e){var t=e._currentValue;if(el!==e)if(e={context:e,memoizedValue:t,next:null},Ar===null){if(Ms===null)throw Error(V(308));Ar=e,Ms.dependencies={lanes:0,firstContext:e}}else Ar=Ar.next=e;return t}var cr=null;function il(e){cr===null?cr=[e]:cr.push(e)}function eu(e,t,r,i){var c=t.interleaved;return c===null?(r.next=r,il(t)):(r.next=c.next,c.next=r),t.interleaved=r,Pt(e,i)}function Pt(e,t){e.lanes|=t;var r=e.alternate;for(r!==null&&(r.lanes|=t),r=e,e=e.return;e!==null;)e.childLanes|=t,r=e.alternate,r!==null&&(r.childLanes|=t),r=e,e=e.return;return r.tag===3?r.stateNode:null}var zt=!1;function sl(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function tu(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Bt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Xt(e,t,r){var i=e.updateQueue;if(i===null)return null;if(i=i.shared,ae&2){var c=i.pending;return c===null?t.next=t:(t.next=c.next,c.next=t),i.pending=t,Pt(e,r)}return c=i.interleaved,c===null?(t.next=t,il(i)):(t.next=c.next,c.next=t),i.interleaved=t,Pt(e,r)}function ds(e,t,r){if(t=t.updateQueue,t!==null&&(t=t.shared,(r&4194240)!==0)){var i=t.lanes;i&=e.pendingLanes,r|=i,t.lanes=r,Uo(e,r)}}function ca(e,t){var r=e.updateQueue,i=e.alternate;if(i!==null&&(i=i.updateQueue,r===i)){var c=null,f=null;if(r=r.firstBaseUpdate,r!==null){do{var g={eventTime:r.eventTime,lane:r.lane,tag:r.tag,payload:r.payload,callback:r.callback,next:null};f===null?c=f=g:f=f.next=g,r=r.next}while(r!==null);f===null?c=f=t:f=f.next=t}else c=f=t;r={baseState:i.baseState,firstBaseUpdate:c,lastBaseUpdate:f,shared:i.shared,effects:i.effects},e.updateQueue=r;return}e=r.lastBaseUpdate,e===null?r.firstBaseUpdate=t:e.next=t,r.lastBaseUpdate=t}function Ps(e,t,r,i){var c=e.updateQueue;zt=!1;var f=c.firstBaseUpdate,g=c.lastBaseUpdate,n=c.shared.pending;if(n!==null){c.shared.pending=null;var u=n,d=u.next;u.next=null,g===null?f=d:g.next=d,g=u;var y=e.alternate;y!==null&&(y=y.updateQueue,n=y.lastBaseUpdate,n!==g&&(n===null?y.firstBaseUpdate=d:n.next=d,y.lastBaseUpdate=u))}if(f!==null){var h=c.baseState;g=0,y=d=u=null,n=f;do{var _=n.lane,S=n.eventTime;if((i&_)===_){y!==null&&(y=y.next={eventTime:S,lane:0,tag:n.tag,payload:n.payload,callback:n.callback,next:null});e:{var w=e,C=n;switch(_=t,S=r,C.tag){case 1:if(w=C.payload,typeof w=="function"){h=w.call(S,h,_);break e}h=w;break e;case 3:w.flags=w.flags&-65537|128;case 0:if(w=C.payload,_=typeof w=="function"?w.call(S,h,_):w,_==null)break e;h=Ce({},h,_);break e;case 2:zt=!0}}n.callback!==null&&n.lane!==0&&(e.flags|=64,_=c.effects,_===null?c.effects=[n]:_.push(n))}else S={eventTime:S,lane:_,tag:n.tag,payload:n.payload,callback:n.callback,next:null},y===null?(d=y=S,u=h):y=y.next=S,g|=_;if(n=n.next,n===null){if(n=c.shared.pending,n===null)break;_=n,n=_.next,_.next=null,c.lastBaseUpdate=_,c.shared.pending=null}}while(!0);if(y===null&&(u=h),c.baseState=u,c.firstBaseUpdate=d,c.lastBaseUpdate=y,t=c.shared.interleaved,t!==null){c=t;do g|=c.lane,c=c.next;while(c!==t)}else f===null&&(c.shared.lanes=0);gr|=g,e.lanes=g,e.memoizedState=h}}function ua(e,t,r){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var i=e[t],c=i.callback;if(c!==null){if(i.callback=null,i=r,typeof c!="function")throw Error(V(191,c));c.call(i)}}}var Ui={},kt=rr(Ui),Ai=rr(Ui),Mi=rr(Ui);function ur(e){if(e===Ui)throw Error(V(174));return e}function nl(e,t){switch(fe(Mi,t),fe(Ai,e),fe(kt,Ui),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:Kn(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=Kn(t,e)}ge(kt),fe(kt,t)}function Vr(){ge(kt),ge(Ai),ge(Mi)}function ru(e){ur(Mi.current);var t=ur(kt.current),r=Kn(t,e.type);t!==r&&(fe(Ai,e),fe(kt,r))}function ol(e){Ai.current===e&&(ge(kt),ge(Ai))}var ye=rr(0);function Is(e){for(var t=e;t!==null;){if(t.tag===13){var r=t.memoizedState;if(r!==null&&(r=r.dehydrated,r===null||r.data==="$?"||r.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var bn=[];function ll(){for(var e=0;e<bn.length;e++)bn[e]._workInProgressVersionPrimary=null;bn.length=0}var fs=Ot.ReactCurrentDispatcher,kn=Ot.ReactCurrentBatchConfig,_r=0,Se=null,Le=null,Be=null,Os=!1,vi=!1,Pi=0,rf=0;function je(){throw Error(V(321))}function al(e,t){if(t===null)return!1;for(var r=0;r<t.length&&r<e.length;r++)if(!mt(e[r],t[r]))return!1;return!0}function cl(e,t,r,i,c,f){if(_r=f,Se=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,fs.current=e===null||e.memoizedState===null?lf:af,e=r(i,c),vi){f=0;do{if(vi=!1,Pi=0,25<=f)throw Error(V(301));f+=1,Be=Le=null,t.updateQueue=null,fs.current=cf,e=r(i,c)}while(vi)}if(fs.current=js,t=Le!==null&&Le.next!==null,_r=0,Be=Le=Se=null,Os=!1,t)throw Error(V(300));return e}function ul(){var e=Pi!==0;return Pi=0,e}function wt(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Be===null?Se.memoizedState=Be=e:Be=Be.next=e,Be}function ct(){if(Le===null){var e=Se.alternate;e=e!==null?e.memoizedState:null}else e=Le.next;var t=Be===null?Se.memoizedState:Be.next;if(t!==null)Be=t,Le=e;else{if(e===null)throw Error(V(310));Le=e,e={memoizedState:Le.memoizedState,baseState:Le.baseState,baseQueue:Le.baseQueue,queue:Le.queue,next:null},Be===null?Se.memoizedState=Be=e:Be=Be.next=e}return Be}function Ii(e,t){return typeof t=="function"?t(e):t}function En(e){var t=ct(),r=t.queue;if(r===null)throw Error(V(311));r.lastRenderedReducer=e;var i=Le,c=i.baseQueue,f=r.pending;if(f!==null){if(c!==null){var g=c.next;c.next=f.next,f.next=g}i.baseQueue=c=f,r.pending=null}if(c!==null){f=c.next,i=i.baseState;var n=g=null,u=null,d=f;do{var y=d.lane;if((_r&y)===y)u!==null&&(u=u.next={lane:0,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null}),i=d.hasEagerState?d.eagerState:e(i,d.action);else{var h={lane:y,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null};u===null?(n=u=h,g=i):u=u.next=h,Se.lanes|=y,gr|=y}d=d.next}while(d!==null&&d!==f);u===null?g=i:u.next=n,mt(i,t.memoizedState)||(Ke=!0),t.memoizedState=i,t.baseState=g,t.baseQueue=u,r.lastRenderedState=i}if(e=r.interleaved,e!==null){c=e;do f=c.lane,Se.lanes|=f,gr|=f,c=c.next;while(c!==e)}else c===null&&(r.lanes=0);return[t.memoizedState,r.dispatch]}function Ln(e){var t=ct(),r=t.queue;if(r===null)throw Error(V(311));r.lastRenderedReducer=e;var i=r.dispatch,c=r.pending,f=t.memoizedState;if(c!==null){r.pending=null;var g=c=c.next;do f=e(f,g.action),g=g.next;while(g!==c);mt(f,t.memoizedState)||(Ke=!0),t.memoizedState=f,t.baseQueue===null&&(t.baseState=f),r.lastRenderedState=f}return[f,i]}function iu(){}function su(e,t){var r=Se,i=ct(),c=t(),f=!mt(i.memoizedState,c);if(f&&(i.memoizedState=c,Ke=!0),i=i.queue,hl(lu.bind(null,r,i,e),[e]),i.getSnapshot!==t||f||Be!==null&&Be.memoizedState.tag&1){if(r.flags|=2048,Oi(9,ou.bind(null,r,i,c,t),void 0,null),Ae===null)throw Error(V(349));_r&30||nu(r,t,c)}return c}function nu(e,t,r){e.flags|=16384,e={getSnapshot:t,value:r},t=Se.updateQueue,t===null?(t={lastEffect:null,stores:null},Se.updateQueue=t,t.stores=[e]):(r=t.stores,r===null?t.stores=[e]:r.push(e))}function ou(e,t,r,i){t.value=r,t.getSnapshot=i,au(t)&&cu(e)}function lu(e,t,r){return r(function(){au(t)&&cu(e)})}function au(e){var t=e.getSnapshot;e=e.value;try{var r=t();return!mt(e,r)}catch{return!0}}function cu(e){var t=Pt(e,1);t!==null&&vt(t,e,1,-1)}function ha(e){var t=wt();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Ii,lastRenderedState:e},t.queue=e,e=e.dispatch=of.bind(null,Se,e),[t.memoizedState,e]}function Oi(e,t,r,i){return e={tag:e,create:t,destroy:r,deps:i,next:null},t=Se.updateQueue,t===null?(t={lastEffect:null,stores:null},Se.updateQueue=t,t.lastEffect=e.next=e):(r=t.lastEffect,r===null?t.lastEffect=e.next=e:(i=r.next,r.next=e,e.next=i,t.lastEffect=e)),e}function uu(){return ct().memoizedState}function ps(e,t,r,i){var c=wt();Se.flags|=e,c.memoizedState=Oi(1|t,r,void 0,i===void 0?null:i)}function Ys(e,t,r,i){var c=ct();i=i===void 0?null:i;var f=void 0;if(Le!==null){var g=Le.memoizedState;if(f=g.destroy,i!==null&&al(i,g.deps)){c.memoizedState=Oi(t,r,f,i);return}}Se.flags|=e,c.memoizedState=Oi(1|t,r,f,i)}function da(e,t){return ps(8390656,8,e,t)}function hl(e,t){return Ys(2048,8,e,t)}function hu(e,t){return Ys(4,2,e,t)}function du(e,t){return Ys(4,4,e,t)}function fu(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function pu(e,t,r){return r=r!=null?r.concat([e]):null,Ys(4,4,fu.bind(null,t,e),r)}function dl(){}function _u(e,t){var r=ct();t=t===void 0?null:t;var i=r.memoizedState;return i!==null&&t!==null&&al(t,i[1])?i[0]:(r.memoizedState=[e,t],e)}function gu(e,t){var r=ct();t=t===void 0?null:t;var i=r.memoizedState;return i!==null&&t!==null&&al(t,i[1])?i[0]:(e=e(),r.memoizedState=[e,t],e)}function vu(e,t,r){return _r&21?(mt(r,t)||(r=wc(),Se.lanes|=r,gr|=r,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,Ke=!0),e.memoizedState=r)}function sf(e,t){var r=he;he=r!==0&&4>r?r:4,e(!0);var i=kn.transition;kn.transition={};try{e(!1),t()}finally{he=r,kn.transition=i}}function mu(){return ct().memoizedState}function nf(e,t,r){var i=Qt(e);if(r={lane:i,action:r,hasEagerState:!1,eagerState:null,next:null},yu(e))Su(t,r);else if(r=eu(e,t,r,i),r!==null){var c=We();vt(r,e,i,c),Cu(r,t,i)}}function of(e,t,r){var i=Qt(e),c={lane:i,action:r,hasEagerState:!1,eagerState:null,next:null};if(yu(e))Su(t,c);else{var f=e.alternate;if(e.lanes===0&&(f===null||f.lanes===0)&&(f=t.lastRenderedReducer,f!==null))try{var g=t.lastRenderedState,n=f(g,r);if(c.hasEagerState=!0,c.eagerState=n,mt(n,g)){var u=t.interleaved;u===null?(c.next=c,il(t)):(c.next=u.next,u.next=c),t.interleaved=c;return}}catch{}finally{}r=eu(e,t,c,i),r!==null&&(c=We(),vt(r,e,i,c),Cu(r,t,i))}}function yu(e){var t=e.alternate;return e===Se||t!==null&&t===Se}function Su(e,t){vi=Os=!0;var r=e.pending;r===null?t.next=t:(t.next=r.next,r.next=t),e.pending=t}function Cu(e,t,r){if(r&4194240){var i=t.lanes;i&=e.pendingLanes,r|=i,t.lanes=r,Uo(e,r)}}var js={readContext:at,useCallback:je,useContext:je,useEffect:je,useImperativeHandle:je,useInsertionEffect:je,useLayoutEffect:je,useMemo:je,useReducer:je,useRef:je,useState:je,useDebugValue:je,useDeferredValue:je,useTransition:je,useMutableSource:je,useSyncExternalStore:je,useId:je,unstable_isNewReconciler:!1},lf={readContext:at,useCallback:function(e,t){return wt().memoizedState=[e,t===void 0?null:t],e},useContext:at,useEffect:da,useImperativeHandle:function(e,t,r){return r=r!=null?r.concat([e]):null,ps(4194308,4,fu.bind(null,t,e),r)},useLayoutEffect:function(e,t){return ps(4194308,4,e,t)},useInsertionEffect:function(e,t){return ps(4,2,e,t)},useMemo:function(e,t){var r=wt();return t=t===void 0?null:t,e=e(),r.memoizedState=[e,t],e},useReducer:function(e,t,r){var i=wt();return t=r!==void 0?r(t):t,i.memoizedState=i.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},i.queue=e,e=e.dispatch=nf.bind(null,Se,e),[i.memoizedState,e]},useRef:function(e){var t=wt();return e={current:e},t.memoizedState=e},useState:ha,useDebugValue:dl,useDeferredValue:function(e){return wt().memoizedState=e},useTransition:function(){var e=ha(!1),t=e[0];return e=sf.bind(null,e[1]),wt().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,r){var i=Se,c=wt();if(ve){if(r===void 0)throw Error(V(407));r=r()}else{if(r=t(),Ae===null)throw Error(V(349));_r&30||nu(i,t,r)}c.memoizedState=r;var f={value:r,getSnapshot:t};return c.queue=f,da(lu.bind(null,i,f,e),[e]),i.flags|=2048,Oi(9,ou.bind(null,i,f,r,t),void 0,null),r},useId:function(){var e=wt(),t=Ae.identifierPrefix;if(ve){var r=Tt,i=Rt;r=(i&~(1<<32-gt(i)-1)).toString(32)+r,t=":"+t+"R"+r,r=Pi++,0<r&&(t+="H"+r.toString(32)),t+=":"}else r=rf++,t=":"+t+"r"+r.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},af={readContext:at,useCallback:_u,useContext:at,useEffect:hl,useImperativeHandle:pu,useInsertionEffect:hu,useLayoutEffect:du,useMemo:gu,useReducer:En,useRef:uu,useState:function(){return En(Ii)},useDebugValue:dl,useDeferredValue:function(e){var t=ct();return vu(t,Le.memoizedState,e)},useTransition:function(){var e=En(Ii)[0],t=ct().memoizedState;return[e,t]},useMutableSource:iu,useSyncExternalStore:su,useId:mu,unstable_isNewReconciler:!1},cf={readContext:at,useCallback:_u,useContext:at,useEffect:hl,useImperativeHandle:pu,useInsertionEffect:hu,useLayoutEffect:du,useMemo:gu,useReducer:Ln,useRef:uu,useState:function(){return Ln(Ii)},useDebugValue:dl,useDeferredValue:function(e){var t=ct();return Le===null?t.memoizedState=e:vu(t,Le.memoizedState,e)},useTransition:function(){var e=Ln(Ii)[0],t=ct().memoizedState;return[e,t]},useMutableSource:iu,useSyncExternalStore:su,useId:mu,unstable_isNewReconciler:!1};function ft(e,t){if(e&&e.defaultProps){t=Ce({},t),e=e.defaultProps;for(var r in e)t[r]===void 0&&(t[r]=e[r]);return t}return t}function po(e,t,r,i){t=e.memoizedState,r=r(i,t),r=r==null?t:Ce({},t,r),e.memoizedState=r,e.lanes===0&&(e.updateQueue.baseState=r)}var Qs={isMounted:function(e){return(e=e._reactInternals)?yr(e)===e:!1},enqueueSetState:function(e,t,r){e=e._reactInternals;var i=We(),c=Qt(e),f=Bt(i,c);f.payload=t,r!=null&&(f.callback=r),t=Xt(e,f,c),t!==null&&(vt(t,e,c,i),ds(t,e,c))},enqueueReplaceState:function(e,t,r){e=e._reactInternals;var i=We(),c=Qt(e),f=Bt(i,c);f.tag=1,f.payload=t,r!=null&&(f.callback=r),t=Xt(e,f,c),t!==null&&(vt(t,e,c,i),ds(t,e,c))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var r=We(),i=Qt(e),c=Bt(r,i);c.tag=2,t!=null&&(c.callback=t),t=Xt(e,c,i),t!==null&&(vt(t,e,i,r),ds(t,e,i))}};function fa(e,t,r,i,c,f,g){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(i,f,g):t.prototype&&t.prototype.isPureReactComponent?!Di(r,i)||!Di(c,f):!0}function wu(e,t,r){var i=!1,c=er,f=t.contextType;return typeof f=="object"&&f!==null?f=at(f):(c=Ge(t)?fr:ze.current,i=t.contextTypes,f=(i=i!=null)?Wr(e,c):er),t=new t(r,f),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Qs,e.stateNode=t,t._reactInternals=e,i&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=c,e.__reactInternalMemoizedMaskedChildContext=f),t}function pa(e,t,r,i){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(r,i),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(r,i),t.state!==e&&Qs.enqueueReplaceState(t,t.state,null)}function _o(e,t,r,i){var c=e.stateNode;c.props=r,c.state=e.memoizedState,c.refs={},sl(e);var f=t.contextType;typeof f=="object"&&f!==null?c.context=at(f):(f=Ge(t)?fr:ze.current,c.context=Wr(e,f)),c.state=e.memoizedState,f=t.getDerivedStateFromProps,typeof f=="function"&&(po(e,t,f,r),c.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof c.getSnapshotBeforeUpdate=="function"||typeof c.UNSAFE_componentWillMount!="function"&&typeof c.componentWillMount!="function"||(t=c.state,typeof c.componentWillMount=="function"&&c.componentWillMount(),typeof c.UNSAFE_componentWillMount=="function"&&c.UNSAFE_componentWillMount(),t!==c.state&&Qs.enqueueReplaceState(c,c.state,null),Ps(e,r,c,i),c.state=e.memoizedState),typeof c.componentDidMount=="function"&&(e.flags|=4194308)}function Kr(e,t){try{var r="",i=t;do r+=Oh(i),i=i.return;while(i);var c=r}catch(f){c=`
-Error generating stack: `+f.message+`
-`+f.stack}return{value:e,source:t,stack:c,digest:null}}function Dn(e,t,r){return{value:e,source:null,stack:r??null,digest:t??null}}function go(e,t){try{console.error(t.value)}catch(r){setTimeout(function(){throw r})}}var uf=typeof WeakMap=="function"?WeakMap:Map;function xu(e,t,r){r=Bt(-1,r),r.tag=3,r.payload={element:null};var i=t.value;return r.callback=function(){Fs||(Fs=!0,Eo=i),go(e,t)},r}function bu(e,t,r){r=Bt(-1,r),r.tag=3;var i=e.type.getDerivedStateFromError;if(typeof i=="function"){var c=t.value;r.payload=function(){return i(c)},r.callback=function(){go(e,t)}}var f=e.stateNode;return f!==null&&typeof f.componentDidCatch=="function"&&(r.callback=function(){go(e,t),typeof i!="function"&&(Yt===null?Yt=new Set([this]):Yt.add(this));var g=t.stack;this.componentDidCatch(t.value,{componentStack:g!==null?g:""})}),r}function _a(e,t,r){var i=e.pingCache;if(i===null){i=e.pingCache=new uf;var c=new Set;i.set(t,c)}else c=i.get(t),c===void 0&&(c=new Set,i.set(t,c));c.has(r)||(c.add(r),e=bf.bind(null,e,t,r),t.then(e,e))}function ga(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function va(e,t,r,i,c){return e.mode&1?(e.flags|=65536,e.lanes=c,e):(e===t?e.flags|=65536:(e.flags|=128,r.flags|=131072,r.flags&=-52805,r.tag===1&&(r.alternate===null?r.tag=17:(t=Bt(-1,1),t.tag=2,Xt(r,t,1))),r.lanes|=1),e)}var hf=Ot.ReactCurrentOwner,Ke=!1;function Ne(e,t,r,i){t.child=e===null?Zc(t,null,r,i):$r(t,e.child,r,i)}function ma(e,t,r,i,c){r=r.render;var f=t.ref;return Fr(t,c),i=cl(e,t,r,i,f,c),r=ul(),e!==null&&!Ke?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~c,It(e,t,c)):(ve&&r&&Qo(t),t.flags|=1,Ne(e,t,i,c),t.child)}function ya(e,t,r,i,c){if(e===null){var f=r.type;return typeof f=="function"&&!Sl(f)&&f.defaultProps===void 0&&r.compare===null&&r.defaultProps===void 0?(t.tag=15,t.type=f,ku(e,t,f,i,c)):(e=ms(r.type,null,i,t,t.mode,c),e.ref=t.ref,e.return=t,t.child=e)}if(f=e.child,!(e.lanes&c)){var g=f.memoizedProps;if(r=r.compare,r=r!==null?r:Di,r(g,i)&&e.ref===t.ref)return It(e,t,c)}return t.flags|=1,e=Jt(f,i),e.ref=t.ref,e.return=t,t.child=e}function ku(e,t,r,i,c){if(e!==null){var f=e.memoizedProps;if(Di(f,i)&&e.ref===t.ref)if(Ke=!1,t.pendingProps=i=f,(e.lanes&c)!==0)e.flags&131072&&(Ke=!0);else return t.lanes=e.lanes,It(e,t,c)}return vo(e,t,r,i,c)}function Eu(e,t,r){var i=t.pendingProps,c=i.children,f=e!==null?e.memoizedState:null;if(i.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},fe(Pr,Je),Je|=r;else{if(!(r&1073741824))return e=f!==null?f.baseLanes|r:r,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,fe(Pr,Je),Je|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},i=f!==null?f.baseLanes:r,fe(Pr,Je),Je|=i}else f!==null?(i=f.baseLanes|r,t.memoizedState=null):i=r,fe(Pr,Je),Je|=i;return Ne(e,t,c,r),t.child}function Lu(e,t){var r=t.ref;(e===null&&r!==null||e!==null&&e.ref!==r)&&(t.flags|=512,t.flags|=2097152)}function vo(e,t,r,i,c){var f=Ge(r)?fr:ze.current;return f=Wr(t,f),Fr(t,c),r=cl(e,t,r,i,f,c),i=ul(),e!==null&&!Ke?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~c,It(e,t,c)):(ve&&i&&Qo(t),t.flags|=1,Ne(e,t,r,c),t.child)}function Sa(e,t,r,i,c){if(Ge(r)){var f=!0;Rs(t)}else f=!1;if(Fr(t,c),t.stateNode===null)_s(e,t),wu(t,r,i),_o(t,r,i,c),i=!0;else if(e===null){var g=t.stateNode,n=t.memoizedProps;g.props=n;var u=g.context,d=r.contextType;typeof d=="object"&&d!==null?d=at(d):(d=Ge(r)?fr:ze.current,d=Wr(t,d));var y=r.getDerivedStateFromProps,h=typeof y=="function"||typeof g.getSnapshotBeforeUpdate=="function";h||typeof g.UNSAFE_componentWillReceiveProps!="function"&&typeof g.componentWillReceiveProps!="function"||(n!==i||u!==d)&&pa(t,g,i,d),zt=!1;var _=t.memoizedState;g.state=_,Ps(t,i,g,c),u=t.memoizedState,n!==i||_!==u||qe.current||zt?(typeof y=="function"&&(po(t,r,y,i),u=t.memoizedState),(n=zt||fa(t,r,n,i,_,u,d))?(h||typeof g.UNSAFE_componentWillMount!="function"&&typeof g.componentWillMount!="function"||(typeof g.componentWillMount=="function"&&g.componentWillMount(),typeof g.UNSAFE_componentWillMount=="function"&&g.UNSAFE_componentWillMount()),typeof g.componentDidMount=="function"&&(t.flags|=4194308)):(typeof g.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=i,t.memoizedState=u),g.props=i,g.state=u,g.context=d,i=n):(typeof g.componentDidMount=="function"&&(t.flags|=4194308),i=!1)}else{g=t.stateNode,tu(e,t),n=t.memoizedProps,d=t.type===t.elementType?n:ft(t.type,n),g.props=d,h=t.pendingProps,_=g.context,u=r.contextType,typeof u=="object"&&u!==null?u=at(u):(u=Ge(r)?fr:ze.current,u=Wr(t,u));var S=r.getDerivedStateFromProps;(y=typeof S=="function"||typeof g.getSnapshotBeforeUpdate=="function")||typeof g.UNSAFE_componentWillReceiveProps!="function"&&typeof g.componentWillReceiveProps!="function"||(n!==h||_!==u)&&pa(t,g,i,u),zt=!1,_=t.memoizedState,g.state=_,Ps(t,i,g,c);var w=t.memoizedState;n!==h||_!==w||qe.current||zt?(typeof S=="function"&&(po(t,r,S,i),w=t.memoizedState),(d=zt||fa(t,r,d,i,_,w,u)||!1)?(y||typeof g.UNSAFE_componentWillUpdate!="function"&&typeof g.componentWillUpdate!="function"||(typeof g.componentWillUpdate=="function"&&g.componentWillUpdate(i,w,u),typeof g.UNSAFE_componentWillUpdate=="function"&&g.UNSAFE_componentWillUpdate(i,w,u)),typeof g.componentDidUpdate=="function"&&(t.flags|=4),typeof g.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof g.componentDidUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=4),typeof g.getSnapshotBeforeUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=1024),t.memoizedProps=i,t.memoizedState=w),g.props=i,g.state=w,g.context=u,i=d):(typeof g.componentDidUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=4),typeof g.getSnapshotBeforeUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=1024),i=!1)}return mo(e,t,r,i,f,c)}function mo(e,t,r,i,c,f){Lu(e,t);var g=(t.flags&128)!==0;if(!i&&!g)return c&&na(t,r,!1),It(e,t,f);i=t.stateNode,hf.current=t;var n=g&&typeof r.getDerivedStateFromError!="function"?null:i.render();return t.flags|=1,e!==null&&g?(t.child=$r(t,e.child,null,f),t.child=$r(t,null,n,f)):Ne(e,t,n,f),t.memoizedState=i.state,c&&na(t,r,!0),t.child}function Du(e){var t=e.stateNode;t.pendingContext?sa(e,t.pendingContext,t.pendingContext!==t.context):t.context&&sa(e,t.context,!1),nl(e,t.containerInfo)}function Ca(e,t,r,i,c){return Ur(),Zo(c),t.flags|=256,Ne(e,t,r,i),t.child}var yo={dehydrated:null,treeContext:null,retryLane:0};function So(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ru(e,t,r){var i=t.pendingProps,c=ye.current,f=!1,g=(t.flags&128)!==0,n;if((n=g)||(n=e!==null&&e.memoizedState===null?!1:(c&2)!==0),n?(f=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(c|=1),fe(ye,c&1),e===null)return ho(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(g=i.children,e=i.fallback,f?(i=t.mode,f=t.child,g={mode:"hidden",children:g},!(i&1)&&f!==null?(f.childLanes=0,f.pendingProps=g):f=en(g,i,0,null),e=dr(e,i,r,null),f.return=t,e.return=t,f.sibling=e,t.child=f,t.child.memoizedState=So(r),t.memoizedState=yo,e):fl(t,g));if(c=e.memoizedState,c!==null&&(n=c.dehydrated,n!==null))return df(e,t,g,i,n,c,r);if(f){f=i.fallback,g=t.mode,c=e.child,n=c.sibling;var u={mode:"hidden",children:i.children};return!(g&1)&&t.child!==c?(i=t.child,i.childLanes=0,i.pendingProps=u,t.deletions=null):(i=Jt(c,u),i.subtreeFlags=c.subtreeFlags&14680064),n!==null?f=Jt(n,f):(f=dr(f,g,r,null),f.flags|=2),f.return=t,i.return=t,i.sibling=f,t.child=i,i=f,f=t.child,g=e.child.memoizedState,g=g===null?So(r):{baseLanes:g.baseLanes|r,cachePool:null,transitions:g.transitions},f.memoizedState=g,f.childLanes=e.childLanes&~r,t.memoizedState=yo,i}return f=e.child,e=f.sibling,i=Jt(f,{mode:"visible",children:i.children}),!(t.mode&1)&&(i.lanes=r),i.return=t,i.sibling=null,e!==null&&(r=t.deletions,r===null?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=i,t.memoizedState=null,i}function fl(e,t){return t=en({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function is(e,t,r,i){return i!==null&&Zo(i),$r(t,e.child,null,r),e=fl(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function df(e,t,r,i,c,f,g){if(r)return t.flags&256?(t.flags&=-257,i=Dn(Error(V(422))),is(e,t,g,i)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(f=i.fallback,c=t.mode,i=en({mode:"visible",children:i.children},c,0,null),f=dr(f,c,g,null),f.flags|=2,i.return=t,f.return=t,i.sibling=f,t.child=i,t.mode&1&&$r(t,e.child,null,g),t.child.memoizedState=So(g),t.memoizedState=yo,f);if(!(t.mode&1))return is(e,t,g,null);if(c.data==="$!"){if(i=c.nextSibling&&c.nextSibling.dataset,i)var n=i.dgst;return i=n,f=Error(V(419)),i=Dn(f,i,void 0),is(e,t,g,i)}if(n=(g&e.childLanes)!==0,Ke||n){if(i=Ae,i!==null){switch(g&-g){case 4:c=2;break;case 16:c=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:c=32;break;case 536870912:c=268435456;break;default:c=0}c=c&(i.suspendedLanes|g)?0:c,c!==0&&c!==f.retryLane&&(f.retryLane=c,Pt(e,c),vt(i,e,c,-1))}return yl(),i=Dn(Error(V(421))),is(e,t,g,i)}return c.data==="$?"?(t.flags|=128,t.child=e.child,t=kf.bind(null,e),c._reactRetry=t,null):(e=f.treeContext,Ze=Gt(c.nextSibling),et=t,ve=!0,_t=null,e!==null&&(st[nt++]=Rt,st[nt++]=Tt,st[nt++]=pr,Rt=e.id,Tt=e.overflow,pr=t),t=fl(t,i.children),t.flags|=4096,t)}function wa(e,t,r){e.lanes|=t;var i=e.alternate;i!==null&&(i.lanes|=t),fo(e.return,t,r)}function Rn(e,t,r,i,c){var f=e.memoizedState;f===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:i,tail:r,tailMode:c}:(f.isBackwards=t,f.rendering=null,f.renderingStartTime=0,f.last=i,f.tail=r,f.tailMode=c)}function Tu(e,t,r){var i=t.pendingProps,c=i.revealOrder,f=i.tail;if(Ne(e,t,i.children,r),i=ye.current,i&2)i=i&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&wa(e,r,t);else if(e.tag===19)wa(e,r,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}i&=1}if(fe(ye,i),!(t.mode&1))t.memoizedState=null;else switch(c){case"forwards":for(r=t.child,c=null;r!==null;)e=r.alternate,e!==null&&Is(e)===null&&(c=r),r=r.sibling;r=c,r===null?(c=t.child,t.child=null):(c=r.sibling,r.sibling=null),Rn(t,!1,c,r,f);break;case"backwards":for(r=null,c=t.child,t.child=null;c!==null;){if(e=c.alternate,e!==null&&Is(e)===null){t.child=c;break}e=c.sibling,c.sibling=r,r=c,c=e}Rn(t,!0,r,null,f);break;case"together":Rn(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function _s(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function It(e,t,r){if(e!==null&&(t.dependencies=e.dependencies),gr|=t.lanes,!(r&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(V(153));if(t.child!==null){for(e=t.child,r=Jt(e,e.pendingProps),t.child=r,r.return=t;e.sibling!==null;)e=e.sibling,r=r.sibling=Jt(e,e.pendingProps),r.return=t;r.sibling=null}return t.child}function ff(e,t,r){switch(t.tag){case 3:Du(t),Ur();break;case 5:ru(t);break;case 1:Ge(t.type)&&Rs(t);break;case 4:nl(t,t.stateNode.containerInfo);break;case 10:var i=t.type._context,c=t.memoizedProps.value;fe(As,i._currentValue),i._currentValue=c;break;case 13:if(i=t.memoizedState,i!==null)return i.dehydrated!==null?(fe(ye,ye.current&1),t.flags|=128,null):r&t.child.childLanes?Ru(e,t,r):(fe(ye,ye.current&1),e=It(e,t,r),e!==null?e.sibling:null);fe(ye,ye.current&1);break;case 19:if(i=(r&t.childLanes)!==0,e.flags&128){if(i)return Tu(e,t,r);t.flags|=128}if(c=t.memoizedState,c!==null&&(c.rendering=null,c.tail=null,c.lastEffect=null),fe(ye,ye.current),i)break;return null;case 22:case 23:return t.lanes=0,Eu(e,t,r)}return It(e,t,r)}var Bu,Co,Au,Mu;Bu=function(e,t){for(var r=t.child;r!==null;){if(r.tag===5||r.tag===6)e.appendChild(r.stateNode);else if(r.tag!==4&&r.child!==null){r.child.return=r,r=r.child;continue}if(r===t)break;for(;r.sibling===null;){if(r.return===null||r.return===t)return;r=r.return}r.sibling.return=r.return,r=r.sibling}};Co=function(){};Au=function(e,t,r,i){var c=e.memoizedProps;if(c!==i){e=t.stateNode,ur(kt.current);var f=null;switch(r){case"input":c=Wn(e,c),i=Wn(e,i),f=[];break;case"select":c=Ce({},c,{value:void 0}),i=Ce({},i,{value:void 0}),f=[];break;case"textarea":c=Vn(e,c),i=Vn(e,i),f=[];break;default:typeof c.onClick!="function"&&typeof i.onClick=="function"&&(e.onclick=Ls)}qn(r,i);var g;r=null;for(d in c)if(!i.hasOwnProperty(d)&&c.hasOwnProperty(d)&&c[d]!=null)if(d==="style"){var n=c[d];for(g in n)n.hasOwnProperty(g)&&(r||(r={}),r[g]="")}else d!=="dangerouslySetInnerHTML"&&d!=="children"&&d!=="suppressContentEditableWarning"&&d!=="suppressHydrationWarning"&&d!=="autoFocus"&&(Ci.hasOwnProperty(d)?f||(f=[]):(f=f||[]).push(d,null));for(d in i){var u=i[d];if(n=c!=null?c[d]:void 0,i.hasOwnProperty(d)&&u!==n&&(u!=null||n!=null))if(d==="style")if(n){for(g in n)!n.hasOwnProperty(g)||u&&u.hasOwnProperty(g)||(r||(r={}),r[g]="");for(g in u)u.hasOwnProperty(g)&&n[g]!==u[g]&&(r||(r={}),r[g]=u[g])}else r||(f||(f=[]),f.push(d,r)),r=u;else d==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,n=n?n.__html:void 0,u!=null&&n!==u&&(f=f||[]).push(d,u)):d==="children"?typeof u!="string"&&typeof u!="number"||(f=f||[]).push(d,""+u):d!=="suppressContentEditableWarning"&&d!=="suppressHydrationWarning"&&(Ci.hasOwnProperty(d)?(u!=null&&d==="onScroll"&&_e("scroll",e),f||n===u||(f=[])):(f=f||[]).push(d,u))}r&&(f=f||[]).push("style",r);var d=f;(t.updateQueue=d)&&(t.flags|=4)}};Mu=function(e,t,r,i){r!==i&&(t.flags|=4)};function oi(e,t){if(!ve)switch(e.tailMode){case"hidden":t=e.tail;for(var r=null;t!==null;)t.alternate!==null&&(r=t),t=t.sibling;r===null?e.tail=null:r.sibling=null;break;case"collapsed":r=e.tail;for(var i=null;r!==null;)r.alternate!==null&&(i=r),r=r.sibling;i===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:i.sibling=null}}function He(e){var t=e.alternate!==null&&e.alternate.child===e.child,r=0,i=0;if(t)for(var c=e.child;c!==null;)r|=c.lanes|c.childLanes,i|=c.subtreeFlags&14680064,i|=c.flags&14680064,c.return=e,c=c.sibling;else for(c=e.child;c!==null;)r|=c.lanes|c.childLanes,i|=c.subtreeFlags,i|=c.flags,c.return=e,c=c.sibling;return e.subtreeFlags|=i,e.childLanes=r,t}function pf(e,t,r){var i=t.pendingProps;switch(Jo(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return He(t),null;case 1:return Ge(t.type)&&Ds(),He(t),null;case 3:return i=t.stateNode,Vr(),ge(qe),ge(ze),ll(),i.pendingContext&&(i.context=i.pendingContext,i.pendingContext=null),(e===null||e.child===null)&&(ts(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,_t!==null&&(Ro(_t),_t=null))),Co(e,t),He(t),null;case 5:ol(t);var c=ur(Mi.current);if(r=t.type,e!==null&&t.stateNode!=null)Au(e,t,r,i,c),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!i){if(t.stateNode===null)throw Error(V(166));return He(t),null}if(e=ur(kt.current),ts(t)){i=t.stateNode,r=t.type;var f=t.memoizedProps;switch(i[xt]=t,i[Bi]=f,e=(t.mode&1)!==0,r){case"dialog":_e("cancel",i),_e("close",i);break;case"iframe":case"object":case"embed":_e("load",i);break;case"video":case"audio":for(c=0;c<hi.length;c++)_e(hi[c],i);break;case"source":_e("error",i);break;case"img":case"image":case"link":_e("error",i),_e("load",i);break;case"details":_e("toggle",i);break;case"input":Bl(i,f),_e("invalid",i);break;case"select":i._wrapperState={wasMultiple:!!f.multiple},_e("invalid",i);break;case"textarea":Ml(i,f),_e("invalid",i)}qn(r,f),c=null;for(var g in f)if(f.hasOwnProperty(g)){var n=f[g];g==="children"?typeof n=="string"?i.textContent!==n&&(f.suppressHydrationWarning!==!0&&es(i.textContent,n,e),c=["children",n]):typeof n=="number"&&i.textContent!==""+n&&(f.suppressHydrationWarning!==!0&&es(i.textContent,n,e),c=["children",""+n]):Ci.hasOwnProperty(g)&&n!=null&&g==="onScroll"&&_e("scroll",i)}switch(r){case"input":Ki(i),Al(i,f,!0);break;case"textarea":Ki(i),Pl(i);break;case"select":case"option":break;default:typeof f.onClick=="function"&&(i.onclick=Ls)}i=c,t.updateQueue=i,i!==null&&(t.flags|=4)}else{g=c.nodeType===9?c:c.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=lc(r)),e==="http://www.w3.org/1999/xhtml"?r==="script"?(e=g.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof i.is=="string"?e=g.createElement(r,{is:i.is}):(e=g.createElement(r),r==="select"&&(g=e,i.multiple?g.multiple=!0:i.size&&(g.size=i.size))):e=g.createElementNS(e,r),e[xt]=t,e[Bi]=i,Bu(e,t,!1,!1),t.stateNode=e;e:{switch(g=Gn(r,i),r){case"dialog":_e("cancel",e),_e("close",e),c=i;break;case"iframe":case"object":case"embed":_e("load",e),c=i;break;case"video":case"audio":for(c=0;c<hi.length;c++)_e(hi[c],e);c=i;break;case"source":_e("error",e),c=i;break;case"img":case"image":case"link":_e("error",e),_e("load",e),c=i;break;case"details":_e("toggle",e),c=i;break;case"input":Bl(e,i),c=Wn(e,i),_e("invalid",e);break;case"option":c=i;break;case"select":e._wrapperState={wasMultiple:!!i.multiple},c=Ce({},i,{value:void 0}),_e("invalid",e);break;case"textarea":Ml(e,i),c=Vn(e,i),_e("invalid",e);break;default:c=i}qn(r,c),n=c;for(f in n)if(n.hasOwnProperty(f)){var u=n[f];f==="style"?uc(e,u):f==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,u!=null&&ac(e,u)):f==="children"?typeof u=="string"?(r!=="textarea"||u!=="")&&wi(e,u):typeof u=="number"&&wi(e,""+u):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(Ci.hasOwnProperty(f)?u!=null&&f==="onScroll"&&_e("scroll",e):u!=null&&jo(e,f,u,g))}switch(r){case"input":Ki(e),Al(e,i,!1);break;case"textarea":Ki(e),Pl(e);break;case"option":i.value!=null&&e.setAttribute("value",""+Zt(i.value));break;case"select":e.multiple=!!i.multiple,f=i.value,f!=null?Ir(e,!!i.multiple,f,!1):i.defaultValue!=null&&Ir(e,!!i.multiple,i.defaultValue,!0);break;default:typeof c.onClick=="function"&&(e.onclick=Ls)}switch(r){case"button":case"input":case"select":case"textarea":i=!!i.autoFocus;break e;case"img":i=!0;break e;default:i=!1}}i&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return He(t),null;case 6:if(e&&t.stateNode!=null)Mu(e,t,e.memoizedProps,i);else{if(typeof i!="string"&&t.stateNode===null)throw Error(V(166));if(r=ur(Mi.current),ur(kt.current),ts(t)){if(i=t.stateNode,r=t.memoizedProps,i[xt]=t,(f=i.nodeValue!==r)&&(e=et,e!==null))switch(e.tag){case 3:es(i.nodeValue,r,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&es(i.nodeValue,r,(e.mode&1)!==0)}f&&(t.flags|=4)}else i=(r.nodeType===9?r:r.ownerDocument).createTextNode(i),i[xt]=t,t.stateNode=i}return He(t),null;case 13:if(ge(ye),i=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(ve&&Ze!==null&&t.mode&1&&!(t.flags&128))Qc(),Ur(),t.flags|=98560,f=!1;else if(f=ts(t),i!==null&&i.dehydrated!==null){if(e===null){if(!f)throw Error(V(318));if(f=t.memoizedState,f=f!==null?f.dehydrated:null,!f)throw Error(V(317));f[xt]=t}else Ur(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;He(t),f=!1}else _t!==null&&(Ro(_t),_t=null),f=!0;if(!f)return t.flags&65536?t:null}return t.flags&128?(t.lanes=r,t):(i=i!==null,i!==(e!==null&&e.memoizedState!==null)&&i&&(t.child.flags|=8192,t.mode&1&&(e===null||ye.current&1?De===0&&(De=3):yl())),t.updateQueue!==null&&(t.flags|=4),He(t),null);case 4:return Vr(),Co(e,t),e===null&&Ri(t.stateNode.containerInfo),He(t),null;case 10:return rl(t.type._context),He(t),null;case 17:return Ge(t.type)&&Ds(),He(t),null;case 19:if(ge(ye),f=t.memoizedState,f===null)return He(t),null;if(i=(t.flags&128)!==0,g=f.rendering,g===null)if(i)oi(f,!1);else{if(De!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(g=Is(e),g!==null){for(t.flags|=128,oi(f,!1),i=g.updateQueue,i!==null&&(t.updateQueue=i,t.flags|=4),t.subtreeFlags=0,i=r,r=t.child;r!==null;)f=r,e=i,f.flags&=14680066,g=f.alternate,g===null?(f.childLanes=0,f.lanes=e,f.child=null,f.subtreeFlags=0,f.memoizedProps=null,f.memoizedState=null,f.updateQueue=null,f.dependencies=null,f.stateNode=null):(f.childLanes=g.childLanes,f.lanes=g.lanes,f.child=g.child,f.subtreeFlags=0,f.deletions=null,f.memoizedProps=g.memoizedProps,f.memoizedState=g.memoizedState,f.updateQueue=g.updateQueue,f.type=g.type,e=g.dependencies,f.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),r=r.sibling;return fe(ye,ye.current&1|2),t.child}e=e.sibling}f.tail!==null&&xe()>qr&&(t.flags|=128,i=!0,oi(f,!1),t.lanes=4194304)}else{if(!i)if(e=Is(g),e!==null){if(t.flags|=128,i=!0,r=e.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),oi(f,!0),f.tail===null&&f.tailMode==="hidden"&&!g.alternate&&!ve)return He(t),null}else 2*xe()-f.renderingStartTime>qr&&r!==1073741824&&(t.flags|=128,i=!0,oi(f,!1),t.lanes=4194304);f.isBackwards?(g.sibling=t.child,t.child=g):(r=f.last,r!==null?r.sibling=g:t.child=g,f.last=g)}return f.tail!==null?(t=f.tail,f.rendering=t,f.tail=t.sibling,f.renderingStartTime=xe(),t.sibling=null,r=ye.current,fe(ye,i?r&1|2:r&1),t):(He(t),null);case 22:case 23:return ml(),i=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==i&&(t.flags|=8192),i&&t.mode&1?Je&1073741824&&(He(t),t.subtreeFlags&6&&(t.flags|=8192)):He(t),null;case 24:return null;case 25:return null}throw Error(V(156,t.tag))}function _f(e,t){switch(Jo(t),t.tag){case 1:return Ge(t.type)&&Ds(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Vr(),ge(qe),ge(ze),ll(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return ol(t),null;case 13:if(ge(ye),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(V(340));Ur()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return ge(ye),null;case 4:return Vr(),null;case 10:return rl(t.type._context),null;case 22:case 23:return ml(),null;case 24:return null;default:return null}}var ss=!1,Fe=!1,gf=typeof WeakSet=="function"?WeakSet:Set,X=null;function Mr(e,t){var r=e.ref;if(r!==null)if(typeof r=="function")try{r(null)}catch(i){we(e,t,i)}else r.current=null}function wo(e,t,r){try{r()}catch(i){we(e,t,i)}}var xa=!1;function vf(e,t){if(so=bs,e=Hc(),Yo(e)){if("selectionStart"in e)var r={start:e.selectionStart,end:e.selectionEnd};else e:{r=(r=e.ownerDocument)&&r.defaultView||window;var i=r.getSelection&&r.getSelection();if(i&&i.rangeCount!==0){r=i.anchorNode;var c=i.anchorOffset,f=i.focusNode;i=i.focusOffset;try{r.nodeType,f.nodeType}catch{r=null;break e}var g=0,n=-1,u=-1,d=0,y=0,h=e,_=null;t:for(;;){for(var S;h!==r||c!==0&&h.nodeType!==3||(n=g+c),h!==f||i!==0&&h.nodeType!==3||(u=g+i),h.nodeType===3&&(g+=h.nodeValue.length),(S=h.firstChild)!==null;)_=h,h=S;for(;;){if(h===e)break t;if(_===r&&++d===c&&(n=g),_===f&&++y===i&&(u=g),(S=h.nextSibling)!==null)break;h=_,_=h.parentNode}h=S}r=n===-1||u===-1?null:{start:n,end:u}}else r=null}r=r||{start:0,end:0}}else r=null;for(no={focusedElem:e,selectionRange:r},bs=!1,X=t;X!==null;)if(t=X,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,X=e;else for(;X!==null;){t=X;try{var w=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(w!==null){var C=w.memoizedProps,a=w.memoizedState,l=t.stateNode,s=l.getSnapshotBeforeUpdate(t.elementType===t.type?C:ft(t.type,C),a);l.__reactInternalSnapshotBeforeUpdate=s}break;case 3:var o=t.stateNode.containerInfo;o.nodeType===1?o.textContent="":o.nodeType===9&&o.documentElement&&o.removeChild(o.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(V(163))}}catch(p){we(t,t.return,p)}if(e=t.sibling,e!==null){e.return=t.return,X=e;break}X=t.return}return w=xa,xa=!1,w}function mi(e,t,r){var i=t.updateQueue;if(i=i!==null?i.lastEffect:null,i!==null){var c=i=i.next;do{if((c.tag&e)===e){var f=c.destroy;c.destroy=void 0,f!==void 0&&wo(t,r,f)}c=c.next}while(c!==i)}}function Js(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var r=t=t.next;do{if((r.tag&e)===e){var i=r.create;r.destroy=i()}r=r.next}while(r!==t)}}function xo(e){var t=e.ref;if(t!==null){var r=e.stateNode;switch(e.tag){case 5:e=r;break;default:e=r}typeof t=="function"?t(e):t.current=e}}function Pu(e){var t=e.alternate;t!==null&&(e.alternate=null,Pu(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[xt],delete t[Bi],delete t[ao],delete t[Jd],delete t[Zd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Iu(e){return e.tag===5||e.tag===3||e.tag===4}function ba(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Iu(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function bo(e,t,r){var i=e.tag;if(i===5||i===6)e=e.stateNode,t?r.nodeType===8?r.parentNode.insertBefore(e,t):r.insertBefore(e,t):(r.nodeType===8?(t=r.parentNode,t.insertBefore(e,r)):(t=r,t.appendChild(e)),r=r._reactRootContainer,r!=null||t.onclick!==null||(t.onclick=Ls));else if(i!==4&&(e=e.child,e!==null))for(bo(e,t,r),e=e.sibling;e!==null;)bo(e,t,r),e=e.sibling}function ko(e,t,r){var i=e.tag;if(i===5||i===6)e=e.stateNode,t?r.insertBefore(e,t):r.appendChild(e);else if(i!==4&&(e=e.child,e!==null))for(ko(e,t,r),e=e.sibling;e!==null;)ko(e,t,r),e=e.sibling}var Me=null,pt=!1;function Ht(e,t,r){for(r=r.child;r!==null;)Ou(e,t,r),r=r.sibling}function Ou(e,t,r){if(bt&&typeof bt.onCommitFiberUnmount=="function")try{bt.onCommitFiberUnmount($s,r)}catch{}switch(r.tag){case 5:Fe||Mr(r,t);case 6:var i=Me,c=pt;Me=null,Ht(e,t,r),Me=i,pt=c,Me!==null&&(pt?(e=Me,r=r.stateNode,e.nodeType===8?e.parentNode.removeChild(r):e.removeChild(r)):Me.removeChild(r.stateNode));break;case 18:Me!==null&&(pt?(e=Me,r=r.stateNode,e.nodeType===8?wn(e.parentNode,r):e.nodeType===1&&wn(e,r),Ei(e)):wn(Me,r.stateNode));break;case 4:i=Me,c=pt,Me=r.stateNode.containerInfo,pt=!0,Ht(e,t,r),Me=i,pt=c;break;case 0:case 11:case 14:case 15:if(!Fe&&(i=r.updateQueue,i!==null&&(i=i.lastEffect,i!==null))){c=i=i.next;do{var f=c,g=f.destroy;f=f.tag,g!==void 0&&(f&2||f&4)&&wo(r,t,g),c=c.next}while(c!==i)}Ht(e,t,r);break;case 1:if(!Fe&&(Mr(r,t),i=r.stateNode,typeof i.componentWillUnmount=="function"))try{i.props=r.memoizedProps,i.state=r.memoizedState,i.componentWillUnmount()}catch(n){we(r,t,n)}Ht(e,t,r);break;case 21:Ht(e,t,r);break;case 22:r.mode&1?(Fe=(i=Fe)||r.memoizedState!==null,Ht(e,t,r),Fe=i):Ht(e,t,r);break;default:Ht(e,t,r)}}function ka(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var r=e.stateNode;r===null&&(r=e.stateNode=new gf),t.forEach(function(i){var c=Ef.bind(null,e,i);r.has(i)||(r.add(i),i.then(c,c))})}}function ht(e,t){var r=t.deletions;if(r!==null)for(var i=0;i<r.length;i++){var c=r[i];try{var f=e,g=t,n=g;e:for(;n!==null;){switch(n.tag){case 5:Me=n.stateNode,pt=!1;break e;case 3:Me=n.stateNode.containerInfo,pt=!0;break e;case 4:Me=n.stateNode.containerInfo,pt=!0;break e}n=n.return}if(Me===null)throw Error(V(160));Ou(f,g,c),Me=null,pt=!1;var u=c.alternate;u!==null&&(u.return=null),c.return=null}catch(d){we(c,t,d)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)ju(t,e),t=t.sibling}function ju(e,t){var r=e.alternate,i=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(ht(t,e),St(e),i&4){try{mi(3,e,e.return),Js(3,e)}catch(C){we(e,e.return,C)}try{mi(5,e,e.return)}catch(C){we(e,e.return,C)}}break;case 1:ht(t,e),St(e),i&512&&r!==null&&Mr(r,r.return);break;case 5:if(ht(t,e),St(e),i&512&&r!==null&&Mr(r,r.return),e.flags&32){var c=e.stateNode;try{wi(c,"")}catch(C){we(e,e.return,C)}}if(i&4&&(c=e.stateNode,c!=null)){var f=e.memoizedProps,g=r!==null?r.memoizedProps:f,n=e.type,u=e.updateQueue;if(e.updateQueue=null,u!==null)try{n==="input"&&f.type==="radio"&&f.name!=null&&nc(c,f),Gn(n,g);var d=Gn(n,f);for(g=0;g<u.length;g+=2){var y=u[g],h=u[g+1];y==="style"?uc(c,h):y==="dangerouslySetInnerHTML"?ac(c,h):y==="children"?wi(c,h):jo(c,y,h,d)}switch(n){case"input":Un(c,f);break;case"textarea":oc(c,f);break;case"select":var _=c._wrapperState.wasMultiple;c._wrapperState.wasMultiple=!!f.multiple;var S=f.value;S!=null?Ir(c,!!f.multiple,S,!1):_!==!!f.multiple&&(f.defaultValue!=null?Ir(c,!!f.multiple,f.defaultValue,!0):Ir(c,!!f.multiple,f.multiple?[]:"",!1))}c[Bi]=f}catch(C){we(e,e.return,C)}}break;case 6:if(ht(t,e),St(e),i&4){if(e.stateNode===null)throw Error(V(162));c=e.stateNode,f=e.memoizedProps;try{c.nodeValue=f}catch(C){we(e,e.return,C)}}break;case 3:if(ht(t,e),St(e),i&4&&r!==null&&r.memoizedState.isDehydrated)try{Ei(t.containerInfo)}catch(C){we(e,e.return,C)}break;case 4:ht(t,e),St(e);break;case 13:ht(t,e),St(e),c=e.child,c.flags&8192&&(f=c.memoizedState!==null,c.stateNode.isHidden=f,!f||c.alternate!==null&&c.alternate.memoizedState!==null||(gl=xe())),i&4&&ka(e);break;case 22:if(y=r!==null&&r.memoizedState!==null,e.mode&1?(Fe=(d=Fe)||y,ht(t,e),Fe=d):ht(t,e),St(e),i&8192){if(d=e.memoizedState!==null,(e.stateNode.isHidden=d)&&!y&&e.mode&1)for(X=e,y=e.child;y!==null;){for(h=X=y;X!==null;){switch(_=X,S=_.child,_.tag){case 0:case 11:case 14:case 15:mi(4,_,_.return);break;case 1:Mr(_,_.return);var w=_.stateNode;if(typeof w.componentWillUnmount=="function"){i=_,r=_.return;try{t=i,w.props=t.memoizedProps,w.state=t.memoizedState,w.componentWillUnmount()}catch(C){we(i,r,C)}}break;case 5:Mr(_,_.return);break;case 22:if(_.memoizedState!==null){La(h);continue}}S!==null?(S.return=_,X=S):La(h)}y=y.sibling}e:for(y=null,h=e;;){if(h.tag===5){if(y===null){y=h;try{c=h.stateNode,d?(f=c.style,typeof f.setProperty=="function"?f.setProperty("display","none","important"):f.display="none"):(n=h.stateNode,u=h.memoizedProps.style,g=u!=null&&u.hasOwnProperty("display")?u.display:null,n.style.display=cc("display",g))}catch(C){we(e,e.return,C)}}}else if(h.tag===6){if(y===null)try{h.stateNode.nodeValue=d?"":h.memoizedProps}catch(C){we(e,e.return,C)}}else if((h.tag!==22&&h.tag!==23||h.memoizedState===null||h===e)&&h.child!==null){h.child.return=h,h=h.child;continue}if(h===e)break e;for(;h.sibling===null;){if(h.return===null||h.return===e)break e;y===h&&(y=null),h=h.return}y===h&&(y=null),h.sibling.return=h.return,h=h.sibling}}break;case 19:ht(t,e),St(e),i&4&&ka(e);break;case 21:break;default:ht(t,e),St(e)}}function St(e){var t=e.flags;if(t&2){try{e:{for(var r=e.return;r!==null;){if(Iu(r)){var i=r;break e}r=r.return}throw Error(V(160))}switch(i.tag){case 5:var c=i.stateNode;i.flags&32&&(wi(c,""),i.flags&=-33);var f=ba(e);ko(e,f,c);break;case 3:case 4:var g=i.stateNode.containerInfo,n=ba(e);bo(e,n,g);break;default:throw Error(V(161))}}catch(u){we(e,e.return,u)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function mf(e,t,r){X=e,Hu(e)}function Hu(e,t,r){for(var i=(e.mode&1)!==0;X!==null;){var c=X,f=c.child;if(c.tag===22&&i){var g=c.memoizedState!==null||ss;if(!g){var n=c.alternate,u=n!==null&&n.memoizedState!==null||Fe;n=ss;var d=Fe;if(ss=g,(Fe=u)&&!d)for(X=c;X!==null;)g=X,u=g.child,g.tag===22&&g.memoizedState!==null?Da(c):u!==null?(u.return=g,X=u):Da(c);for(;f!==null;)X=f,Hu(f),f=f.sibling;X=c,ss=n,Fe=d}Ea(e)}else c.subtreeFlags&8772&&f!==null?(f.return=c,X=f):Ea(e)}}function Ea(e){for(;X!==null;){var t=X;if(t.flags&8772){var r=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:Fe||Js(5,t);break;case 1:var i=t.stateNode;if(t.flags&4&&!Fe)if(r===null)i.componentDidMount();else{var c=t.elementType===t.type?r.memoizedProps:ft(t.type,r.memoizedProps);i.componentDidUpdate(c,r.memoizedState,i.__reactInternalSnapshotBeforeUpdate)}var f=t.updateQueue;f!==null&&ua(t,f,i);break;case 3:var g=t.updateQueue;if(g!==null){if(r=null,t.child!==null)switch(t.child.tag){case 5:r=t.child.stateNode;break;case 1:r=t.child.stateNode}ua(t,g,r)}break;case 5:var n=t.stateNode;if(r===null&&t.flags&4){r=n;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&r.focus();break;case"img":u.src&&(r.src=u.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var d=t.alternate;if(d!==null){var y=d.memoizedState;if(y!==null){var h=y.dehydrated;h!==null&&Ei(h)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(V(163))}Fe||t.flags&512&&xo(t)}catch(_){we(t,t.return,_)}}if(t===e){X=null;break}if(r=t.sibling,r!==null){r.return=t.return,X=r;break}X=t.return}}function La(e){for(;X!==null;){var t=X;if(t===e){X=null;break}var r=t.sibling;if(r!==null){r.return=t.return,X=r;break}X=t.return}}function Da(e){for(;X!==null;){var t=X;try{switch(t.tag){case 0:case 11:case 15:var r=t.return;try{Js(4,t)}catch(u){we(t,r,u)}break;case 1:var i=t.stateNode;if(typeof i.componentDidMount=="function"){var c=t.return;try{i.componentDidMount()}catch(u){we(t,c,u)}}var f=t.return;try{xo(t)}catch(u){we(t,f,u)}break;case 5:var g=t.return;try{xo(t)}catch(u){we(t,g,u)}}}catch(u){we(t,t.return,u)}if(t===e){X=null;break}var n=t.sibling;if(n!==null){n.return=t.return,X=n;break}X=t.return}}var yf=Math.ceil,Hs=Ot.ReactCurrentDispatcher,pl=Ot.ReactCurrentOwner,lt=Ot.ReactCurrentBatchConfig,ae=0,Ae=null,ke=null,Pe=0,Je=0,Pr=rr(0),De=0,ji=null,gr=0,Zs=0,_l=0,yi=null,Ve=null,gl=0,qr=1/0,Et=null,Fs=!1,Eo=null,Yt=null,ns=!1,$t=null,zs=0,Si=0,Lo=null,gs=-1,vs=0;function We(){return ae&6?xe():gs!==-1?gs:gs=xe()}function Qt(e){return e.mode&1?ae&2&&Pe!==0?Pe&-Pe:tf.transition!==null?(vs===0&&(vs=wc()),vs):(e=he,e!==0||(e=window.event,e=e===void 0?16:Rc(e.type)),e):1}function vt(e,t,r,i){if(50<Si)throw Si=0,Lo=null,Error(V(185));zi(e,r,i),(!(ae&2)||e!==Ae)&&(e===Ae&&(!(ae&2)&&(Zs|=r),De===4&&Wt(e,Pe)),Xe(e,i),r===1&&ae===0&&!(t.mode&1)&&(qr=xe()+500,Xs&&ir()))}function Xe(e,t){var r=e.callbackNode;td(e,t);var i=xs(e,e===Ae?Pe:0);if(i===0)r!==null&&jl(r),e.callbackNode=null,e.callbackPriority=0;else if(t=i&-i,e.callbackPriority!==t){if(r!=null&&jl(r),t===1)e.tag===0?ef(Ra.bind(null,e)):Gc(Ra.bind(null,e)),Yd(function(){!(ae&6)&&ir()}),r=null;else{switch(xc(i)){case 1:r=Wo;break;case 4:r=Sc;break;case 16:r=ws;break;case 536870912:r=Cc;break;default:r=ws}r=Ku(r,Fu.bind(null,e))}e.callbackPriority=t,e.callbackNode=r}}function Fu(e,t){if(gs=-1,vs=0,ae&6)throw Error(V(327));var r=e.callbackNode;if(zr()&&e.callbackNode!==r)return null;var i=xs(e,e===Ae?Pe:0);if(i===0)return null;if(i&30||i&e.expiredLanes||t)t=Ns(e,i);else{t=i;var c=ae;ae|=2;var f=Nu();(Ae!==e||Pe!==t)&&(Et=null,qr=xe()+500,hr(e,t));do try{wf();break}catch(n){zu(e,n)}while(!0);tl(),Hs.current=f,ae=c,ke!==null?t=0:(Ae=null,Pe=0,t=De)}if(t!==0){if(t===2&&(c=Zn(e),c!==0&&(i=c,t=Do(e,c))),t===1)throw r=ji,hr(e,0),Wt(e,i),Xe(e,xe()),r;if(t===6)Wt(e,i);else{if(c=e.current.alternate,!(i&30)&&!Sf(c)&&(t=Ns(e,i),t===2&&(f=Zn(e),f!==0&&(i=f,t=Do(e,f))),t===1))throw r=ji,hr(e,0),Wt(e,i),Xe(e,xe()),r;switch(e.finishedWork=c,e.finishedLanes=i,t){case 0:case 1:throw Error(V(345));case 2:lr(e,Ve,Et);break;case 3:if(Wt(e,i),(i&130023424)===i&&(t=gl+500-xe(),10<t)){if(xs(e,0)!==0)break;if(c=e.suspendedLanes,(c&i)!==i){We(),e.pingedLanes|=e.suspendedLanes&c;break}e.timeoutHandle=lo(lr.bind(null,e,Ve,Et),t);break}lr(e,Ve,Et);break;case 4:if(Wt(e,i),(i&4194240)===i)break;for(t=e.eventTimes,c=-1;0<i;){var g=31-gt(i);f=1<<g,g=t[g],g>c&&(c=g),i&=~f}if(i=c,i=xe()-i,i=(120>i?120:480>i?480:1080>i?1080:1920>i?1920:3e3>i?3e3:4320>i?4320:1960*yf(i/1960))-i,10<i){e.timeoutHandle=lo(lr.bind(null,e,Ve,Et),i);break}lr(e,Ve,Et);break;case 5:lr(e,Ve,Et);break;default:throw Error(V(329))}}}return Xe(e,xe()),e.callbackNode===r?Fu.bind(null,e):null}function Do(e,t){var r=yi;return e.current.memoizedState.isDehydrated&&(hr(e,t).flags|=256),e=Ns(e,t),e!==2&&(t=Ve,Ve=r,t!==null&&Ro(t)),e}function Ro(e){Ve===null?Ve=e:Ve.push.apply(Ve,e)}function Sf(e){for(var t=e;;){if(t.flags&16384){var r=t.updateQueue;if(r!==null&&(r=r.stores,r!==null))for(var i=0;i<r.length;i++){var c=r[i],f=c.getSnapshot;c=c.value;try{if(!mt(f(),c))return!1}catch{return!1}}}if(r=t.child,t.subtreeFlags&16384&&r!==null)r.return=t,t=r;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Wt(e,t){for(t&=~_l,t&=~Zs,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var r=31-gt(t),i=1<<r;e[r]=-1,t&=~i}}function Ra(e){if(ae&6)throw Error(V(327));zr();var t=xs(e,0);if(!(t&1))return Xe(e,xe()),null;var r=Ns(e,t);if(e.tag!==0&&r===2){var i=Zn(e);i!==0&&(t=i,r=Do(e,i))}if(r===1)throw r=ji,hr(e,0),Wt(e,t),Xe(e,xe()),r;if(r===6)throw Error(V(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,lr(e,Ve,Et),Xe(e,xe()),null}function vl(e,t){var r=ae;ae|=1;try{return e(t)}finally{ae=r,ae===0&&(qr=xe()+500,Xs&&ir())}}function vr(e){$t!==null&&$t.tag===0&&!(ae&6)&&zr();var t=ae;ae|=1;var r=lt.transition,i=he;try{if(lt.transition=null,he=1,e)return e()}finally{he=i,lt.transition=r,ae=t,!(ae&6)&&ir()}}function ml(){Je=Pr.current,ge(Pr)}function hr(e,t){e.finishedWork=null,e.finishedLanes=0;var r=e.timeoutHandle;if(r!==-1&&(e.timeoutHandle=-1,Xd(r)),ke!==null)for(r=ke.return;r!==null;){var i=r;switch(Jo(i),i.tag){case 1:i=i.type.childContextTypes,i!=null&&Ds();break;case 3:Vr(),ge(qe),ge(ze),ll();break;case 5:ol(i);break;case 4:Vr();break;case 13:ge(ye);break;case 19:ge(ye);break;case 10:rl(i.type._context);break;case 22:case 23:ml()}r=r.return}if(Ae=e,ke=e=Jt(e.current,null),Pe=Je=t,De=0,ji=null,_l=Zs=gr=0,Ve=yi=null,cr!==null){for(t=0;t<cr.length;t++)if(r=cr[t],i=r.interleaved,i!==null){r.interleaved=null;var c=i.next,f=r.pending;if(f!==null){var g=f.next;f.next=c,i.next=g}r.pending=i}cr=null}return e}function zu(e,t){do{var r=ke;try{if(tl(),fs.current=js,Os){for(var i=Se.memoizedState;i!==null;){var c=i.queue;c!==null&&(c.pending=null),i=i.next}Os=!1}if(_r=0,Be=Le=Se=null,vi=!1,Pi=0,pl.current=null,r===null||r.return===null){De=1,ji=t,ke=null;break}e:{var f=e,g=r.return,n=r,u=t;if(t=Pe,n.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){var d=u,y=n,h=y.tag;if(!(y.mode&1)&&(h===0||h===11||h===15)){var _=y.alternate;_?(y.updateQueue=_.updateQueue,y.memoizedState=_.memoizedState,y.lanes=_.lanes):(y.updateQueue=null,y.memoizedState=null)}var S=ga(g);if(S!==null){S.flags&=-257,va(S,g,n,f,t),S.mode&1&&_a(f,d,t),t=S,u=d;var w=t.updateQueue;if(w===null){var C=new Set;C.add(u),t.updateQueue=C}else w.add(u);break e}else{if(!(t&1)){_a(f,d,t),yl();break e}u=Error(V(426))}}else if(ve&&n.mode&1){var a=ga(g);if(a!==null){!(a.flags&65536)&&(a.flags|=256),va(a,g,n,f,t),Zo(Kr(u,n));break e}}f=u=Kr(u,n),De!==4&&(De=2),yi===null?yi=[f]:yi.push(f),f=g;do{switch(f.tag){case 3:f.flags|=65536,t&=-t,f.lanes|=t;var l=xu(f,u,t);ca(f,l);break e;case 1:n=u;var s=f.type,o=f.stateNode;if(!(f.flags&128)&&(typeof s.getDerivedStateFromError=="function"||o!==null&&typeof o.componentDidCatch=="function"&&(Yt===null||!Yt.has(o)))){f.flags|=65536,t&=-t,f.lanes|=t;var p=bu(f,n,t);ca(f,p);break e}}f=f.return}while(f!==null)}Uu(r)}catch(m){t=m,ke===r&&r!==null&&(ke=r=r.return);continue}break}while(!0)}function Nu(){var e=Hs.current;return Hs.current=js,e===null?js:e}function yl(){(De===0||De===3||De===2)&&(De=4),Ae===null||!(gr&268435455)&&!(Zs&268435455)||Wt(Ae,Pe)}function Ns(e,t){var r=ae;ae|=2;var i=Nu();(Ae!==e||Pe!==t)&&(Et=null,hr(e,t));do try{Cf();break}catch(c){zu(e,c)}while(!0);if(tl(),ae=r,Hs.current=i,ke!==null)throw Error(V(261));return Ae=null,Pe=0,De}function Cf(){for(;ke!==null;)Wu(ke)}function wf(){for(;ke!==null&&!Kh();)Wu(ke)}function Wu(e){var t=Vu(e.alternate,e,Je);e.memoizedProps=e.pendingProps,t===null?Uu(e):ke=t,pl.current=null}function Uu(e){var t=e;do{var r=t.alternate;if(e=t.return,t.flags&32768){if(r=_f(r,t),r!==null){r.flags&=32767,ke=r;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{De=6,ke=null;return}}else if(r=pf(r,t,Je),r!==null){ke=r;return}if(t=t.sibling,t!==null){ke=t;return}ke=t=e}while(t!==null);De===0&&(De=5)}function lr(e,t,r){var i=he,c=lt.transition;try{lt.transition=null,he=1,xf(e,t,r,i)}finally{lt.transition=c,he=i}return null}function xf(e,t,r,i){do zr();while($t!==null);if(ae&6)throw Error(V(327));r=e.finishedWork;var c=e.finishedLanes;if(r===null)return null;if(e.finishedWork=null,e.finishedLanes=0,r===e.current)throw Error(V(177));e.callbackNode=null,e.callbackPriority=0;var f=r.lanes|r.childLanes;if(rd(e,f),e===Ae&&(ke=Ae=null,Pe=0),!(r.subtreeFlags&2064)&&!(r.flags&2064)||ns||(ns=!0,Ku(ws,function(){return zr(),null})),f=(r.flags&15990)!==0,r.subtreeFlags&15990||f){f=lt.transition,lt.transition=null;var g=he;he=1;var n=ae;ae|=4,pl.current=null,vf(e,r),ju(r,e),Wd(no),bs=!!so,no=so=null,e.current=r,mf(r),qh(),ae=n,he=g,lt.transition=f}else e.current=r;if(ns&&(ns=!1,$t=e,zs=c),f=e.pendingLanes,f===0&&(Yt=null),Yh(r.stateNode),Xe(e,xe()),t!==null)for(i=e.onRecoverableError,r=0;r<t.length;r++)c=t[r],i(c.value,{componentStack:c.stack,digest:c.digest});if(Fs)throw Fs=!1,e=Eo,Eo=null,e;return zs&1&&e.tag!==0&&zr(),f=e.pendingLanes,f&1?e===Lo?Si++:(Si=0,Lo=e):Si=0,ir(),null}function zr(){if($t!==null){var e=xc(zs),t=lt.transition,r=he;try{if(lt.transition=null,he=16>e?16:e,$t===null)var i=!1;else{if(e=$t,$t=null,zs=0,ae&6)throw Error(V(331));var c=ae;for(ae|=4,X=e.current;X!==null;){var f=X,g=f.child;if(X.flags&16){var n=f.deletions;if(n!==null){for(var u=0;u<n.length;u++){var d=n[u];for(X=d;X!==null;){var y=X;switch(y.tag){case 0:case 11:case 15:mi(8,y,f)}var h=y.child;if(h!==null)h.return=y,X=h;else for(;X!==null;){y=X;var _=y.sibling,S=y.return;if(Pu(y),y===d){X=null;break}if(_!==null){_.return=S,X=_;break}X=S}}}var w=f.alternate;if(w!==null){var C=w.child;if(C!==null){w.child=null;do{var a=C.sibling;C.sibling=null,C=a}while(C!==null)}}X=f}}if(f.subtreeFlags&2064&&g!==null)g.return=f,X=g;else e:for(;X!==null;){if(f=X,f.flags&2048)switch(f.tag){case 0:case 11:case 15:mi(9,f,f.return)}var l=f.sibling;if(l!==null){l.return=f.return,X=l;break e}X=f.return}}var s=e.current;for(X=s;X!==null;){g=X;var o=g.child;if(g.subtreeFlags&2064&&o!==null)o.return=g,X=o;else e:for(g=s;X!==null;){if(n=X,n.flags&2048)try{switch(n.tag){case 0:case 11:case 15:Js(9,n)}}catch(m){we(n,n.return,m)}if(n===g){X=null;break e}var p=n.sibling;if(p!==null){p.return=n.return,X=p;break e}X=n.return}}if(ae=c,ir(),bt&&typeof bt.onPostCommitFiberRoot=="function")try{bt.onPostCommitFiberRoot($s,e)}catch{}i=!0}return i}finally{he=r,lt.transition=t}}return!1}function Ta(e,t,r){t=Kr(r,t),t=xu(e,t,1),e=Xt(e,t,1),t=We(),e!==null&&(zi(e,1,t),Xe(e,t))}function we(e,t,r){if(e.tag===3)Ta(e,e,r);else for(;t!==null;){if(t.tag===3){Ta(t,e,r);break}else if(t.tag===1){var i=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof i.componentDidCatch=="function"&&(Yt===null||!Yt.has(i))){e=Kr(r,e),e=bu(t,e,1),t=Xt(t,e,1),e=We(),t!==null&&(zi(t,1,e),Xe(t,e));break}}t=t.return}}function bf(e,t,r){var i=e.pingCache;i!==null&&i.delete(t),t=We(),e.pingedLanes|=e.suspendedLanes&r,Ae===e&&(Pe&r)===r&&(De===4||De===3&&(Pe&130023424)===Pe&&500>xe()-gl?hr(e,0):_l|=r),Xe(e,t)}function $u(e,t){t===0&&(e.mode&1?(t=Xi,Xi<<=1,!(Xi&130023424)&&(Xi=4194304)):t=1);var r=We();e=Pt(e,t),e!==null&&(zi(e,t,r),Xe(e,r))}function kf(e){var t=e.memoizedState,r=0;t!==null&&(r=t.retryLane),$u(e,r)}function Ef(e,t){var r=0;switch(e.tag){case 13:var i=e.stateNode,c=e.memoizedState;c!==null&&(r=c.retryLane);break;case 19:i=e.stateNode;break;default:throw Error(V(314))}i!==null&&i.delete(t),$u(e,r)}var Vu;Vu=function(e,t,r){if(e!==null)if(e.memoizedProps!==t.pendingProps||qe.current)Ke=!0;else{if(!(e.lanes&r)&&!(t.flags&128))return Ke=!1,ff(e,t,r);Ke=!!(e.flags&131072)}else Ke=!1,ve&&t.flags&1048576&&Xc(t,Bs,t.index);switch(t.lanes=0,t.tag){case 2:var i=t.type;_s(e,t),e=t.pendingProps;var c=Wr(t,ze.current);Fr(t,r),c=cl(null,t,i,e,c,r);var f=ul();return t.flags|=1,typeof c=="object"&&c!==null&&typeof c.render=="function"&&c.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Ge(i)?(f=!0,Rs(t)):f=!1,t.memoizedState=c.state!==null&&c.state!==void 0?c.state:null,sl(t),c.updater=Qs,t.stateNode=c,c._reactInternals=t,_o(t,i,e,r),t=mo(null,t,i,!0,f,r)):(t.tag=0,ve&&f&&Qo(t),Ne(null,t,c,r),t=t.child),t;case 16:i=t.elementType;e:{switch(_s(e,t),e=t.pendingProps,c=i._init,i=c(i._payload),t.type=i,c=t.tag=Df(i),e=ft(i,e),c){case 0:t=vo(null,t,i,e,r);break e;case 1:t=Sa(null,t,i,e,r);break e;case 11:t=ma(null,t,i,e,r);break e;case 14:t=ya(null,t,i,ft(i.type,e),r);break e}throw Error(V(306,i,""))}return t;case 0:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:ft(i,c),vo(e,t,i,c,r);case 1:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:ft(i,c),Sa(e,t,i,c,r);case 3:e:{if(Du(t),e===null)throw Error(V(387));i=t.pendingProps,f=t.memoizedState,c=f.element,tu(e,t),Ps(t,i,null,r);var g=t.memoizedState;if(i=g.element,f.isDehydrated)if(f={element:i,isDehydrated:!1,cache:g.cache,pendingSuspenseBoundaries:g.pendingSuspenseBoundaries,transitions:g.transitions},t.updateQueue.baseState=f,t.memoizedState=f,t.flags&256){c=Kr(Error(V(423)),t),t=Ca(e,t,i,r,c);break e}else if(i!==c){c=Kr(Error(V(424)),t),t=Ca(e,t,i,r,c);break e}else for(Ze=Gt(t.stateNode.containerInfo.firstChild),et=t,ve=!0,_t=null,r=Zc(t,null,i,r),t.child=r;r;)r.flags=r.flags&-3|4096,r=r.sibling;else{if(Ur(),i===c){t=It(e,t,r);break e}Ne(e,t,i,r)}t=t.child}return t;case 5:return ru(t),e===null&&ho(t),i=t.type,c=t.pendingProps,f=e!==null?e.memoizedProps:null,g=c.children,oo(i,c)?g=null:f!==null&&oo(i,f)&&(t.flags|=32),Lu(e,t),Ne(e,t,g,r),t.child;case 6:return e===null&&ho(t),null;case 13:return Ru(e,t,r);case 4:return nl(t,t.stateNode.containerInfo),i=t.pendingProps,e===null?t.child=$r(t,null,i,r):Ne(e,t,i,r),t.child;case 11:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:ft(i,c),ma(e,t,i,c,r);case 7:return Ne(e,t,t.pendingProps,r),t.child;case 8:return Ne(e,t,t.pendingProps.children,r),t.child;case 12:return Ne(e,t,t.pendingProps.children,r),t.child;case 10:e:{if(i=t.type._context,c=t.pendingProps,f=t.memoizedProps,g=c.value,fe(As,i._currentValue),i._currentValue=g,f!==null)if(mt(f.value,g)){if(f.children===c.children&&!qe.current){t=It(e,t,r);break e}}else for(f=t.child,f!==null&&(f.return=t);f!==null;){var n=f.dependencies;if(n!==null){g=f.child;for(var u=n.firstContext;u!==null;){if(u.context===i){if(f.tag===1){u=Bt(-1,r&-r),u.tag=2;var d=f.updateQueue;if(d!==null){d=d.shared;var y=d.pending;y===null?u.next=u:(u.next=y.next,y.next=u),d.pending=u}}f.lanes|=r,u=f.alternate,u!==null&&(u.lanes|=r),fo(f.return,r,t),n.lanes|=r;break}u=u.next}}else if(f.tag===10)g=f.type===t.type?null:f.child;else if(f.tag===18){if(g=f.return,g===null)throw Error(V(341));g.lanes|=r,n=g.alternate,n!==null&&(n.lanes|=r),fo(g,r,t),g=f.sibling}else g=f.child;if(g!==null)g.return=f;else for(g=f;g!==null;){if(g===t){g=null;break}if(f=g.sibling,f!==null){f.return=g.return,g=f;break}g=g.return}f=g}Ne(e,t,c.children,r),t=t.child}return t;case 9:return c=t.type,i=t.pendingProps.children,Fr(t,r),c=at(c),i=i(c),t.flags|=1,Ne(e,t,i,r),t.child;case 14:return i=t.type,c=ft(i,t.pendingProps),c=ft(i.type,c),ya(e,t,i,c,r);case 15:return ku(e,t,t.type,t.pendingProps,r);case 17:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:ft(i,c),_s(e,t),t.tag=1,Ge(i)?(e=!0,Rs(t)):e=!1,Fr(t,r),wu(t,i,c),_o(t,i,c,r),mo(null,t,i,!0,e,r);case 19:return Tu(e,t,r);case 22:return Eu(e,t,r)}throw Error(V(156,t.tag))};function Ku(e,t){return yc(e,t)}function Lf(e,t,r,i){this.tag=e,this.key=r,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=i,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ot(e,t,r,i){return new Lf(e,t,r,i)}function Sl(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Df(e){if(typeof e=="function")return Sl(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Fo)return 11;if(e===zo)return 14}return 2}function Jt(e,t){var r=e.alternate;return r===null?(r=ot(e.tag,t,e.key,e.mode),r.elementType=e.elementType,r.type=e.type,r.stateNode=e.stateNode,r.alternate=e,e.alternate=r):(r.pendingProps=t,r.type=e.type,r.flags=0,r.subtreeFlags=0,r.deletions=null),r.flags=e.flags&14680064,r.childLanes=e.childLanes,r.lanes=e.lanes,r.child=e.child,r.memoizedProps=e.memoizedProps,r.memoizedState=e.memoizedState,r.updateQueue=e.updateQueue,t=e.dependencies,r.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},r.sibling=e.sibling,r.index=e.index,r.ref=e.ref,r}function ms(e,t,r,i,c,f){var g=2;if(i=e,typeof e=="function")Sl(e)&&(g=1);else if(typeof e=="string")g=5;else e:switch(e){case br:return dr(r.children,c,f,t);case Ho:g=8,c|=8;break;case Hn:return e=ot(12,r,t,c|2),e.elementType=Hn,e.lanes=f,e;case Fn:return e=ot(13,r,t,c),e.elementType=Fn,e.lanes=f,e;case zn:return e=ot(19,r,t,c),e.elementType=zn,e.lanes=f,e;case rc:return en(r,c,f,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case ec:g=10;break e;case tc:g=9;break e;case Fo:g=11;break e;case zo:g=14;break e;case Ft:g=16,i=null;break e}throw Error(V(130,e==null?e:typeof e,""))}return t=ot(g,r,t,c),t.elementType=e,t.type=i,t.lanes=f,t}function dr(e,t,r,i){return e=ot(7,e,i,t),e.lanes=r,e}function en(e,t,r,i){return e=ot(22,e,i,t),e.elementType=rc,e.lanes=r,e.stateNode={isHidden:!1},e}function Tn(e,t,r){return e=ot(6,e,null,t),e.lanes=r,e}function Bn(e,t,r){return t=ot(4,e.children!==null?e.children:[],e.key,t),t.lanes=r,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Rf(e,t,r,i,c){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=hn(0),this.expirationTimes=hn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=hn(0),this.identifierPrefix=i,this.onRecoverableError=c,this.mutableSourceEagerHydrationData=null}function Cl(e,t,r,i,c,f,g,n,u){return e=new Rf(e,t,r,n,u),t===1?(t=1,f===!0&&(t|=8)):t=0,f=ot(3,null,null,t),e.current=f,f.stateNode=e,f.memoizedState={element:i,isDehydrated:r,cache:null,transitions:null,pendingSuspenseBoundaries:null},sl(f),e}function Tf(e,t,r){var i=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:xr,key:i==null?null:""+i,children:e,containerInfo:t,implementation:r}}function qu(e){if(!e)return er;e=e._reactInternals;e:{if(yr(e)!==e||e.tag!==1)throw Error(V(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Ge(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(V(171))}if(e.tag===1){var r=e.type;if(Ge(r))return qc(e,r,t)}return t}function Gu(e,t,r,i,c,f,g,n,u){return e=Cl(r,i,!0,e,c,f,g,n,u),e.context=qu(null),r=e.current,i=We(),c=Qt(r),f=Bt(i,c),f.callback=t??null,Xt(r,f,c),e.current.lanes=c,zi(e,c,i),Xe(e,i),e}function tn(e,t,r,i){var c=t.current,f=We(),g=Qt(c);return r=qu(r),t.context===null?t.context=r:t.pendingContext=r,t=Bt(f,g),t.payload={element:e},i=i===void 0?null:i,i!==null&&(t.callback=i),e=Xt(c,t,g),e!==null&&(vt(e,c,g,f),ds(e,c,g)),g}function Ws(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Ba(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var r=e.retryLane;e.retryLane=r!==0&&r<t?r:t}}function wl(e,t){Ba(e,t),(e=e.alternate)&&Ba(e,t)}function Bf(){return null}var Xu=typeof reportError=="function"?reportError:function(e){console.error(e)};function xl(e){this._internalRoot=e}rn.prototype.render=xl.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(V(409));tn(e,t,null,null)};rn.prototype.unmount=xl.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;vr(function(){tn(null,e,null,null)}),t[Mt]=null}};function rn(e){this._internalRoot=e}rn.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ec();e={blockedOn:null,target:e,priority:t};for(var r=0;r<Nt.length&&t!==0&&t<Nt[r].priority;r++);Nt.splice(r,0,e),r===0&&Dc(e)}};function bl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function sn(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Aa(){}function Af(e,t,r,i,c){if(c){if(typeof i=="function"){var f=i;i=function(){var d=Ws(g);f.call(d)}}var g=Gu(t,i,e,0,null,!1,!1,"",Aa);return e._reactRootContainer=g,e[Mt]=g.current,Ri(e.nodeType===8?e.parentNode:e),vr(),g}for(;c=e.lastChild;)e.removeChild(c);if(typeof i=="function"){var n=i;i=function(){var d=Ws(u);n.call(d)}}var u=Cl(e,0,!1,null,null,!1,!1,"",Aa);return e._reactRootContainer=u,e[Mt]=u.current,Ri(e.nodeType===8?e.parentNode:e),vr(function(){tn(t,u,r,i)}),u}function nn(e,t,r,i,c){var f=r._reactRootContainer;if(f){var g=f;if(typeof c=="function"){var n=c;c=function(){var u=Ws(g);n.call(u)}}tn(t,g,e,c)}else g=Af(r,t,e,c,i);return Ws(g)}bc=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var r=ui(t.pendingLanes);r!==0&&(Uo(t,r|1),Xe(t,xe()),!(ae&6)&&(qr=xe()+500,ir()))}break;case 13:vr(function(){var i=Pt(e,1);if(i!==null){var c=We();vt(i,e,1,c)}}),wl(e,1)}};$o=function(e){if(e.tag===13){var t=Pt(e,134217728);if(t!==null){var r=We();vt(t,e,134217728,r)}wl(e,134217728)}};kc=function(e){if(e.tag===13){var t=Qt(e),r=Pt(e,t);if(r!==null){var i=We();vt(r,e,t,i)}wl(e,t)}};Ec=function(){return he};Lc=function(e,t){var r=he;try{return he=e,t()}finally{he=r}};Yn=function(e,t,r){switch(t){case"input":if(Un(e,r),t=r.name,r.type==="radio"&&t!=null){for(r=e;r.parentNode;)r=r.parentNode;for(r=r.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<r.length;t++){var i=r[t];if(i!==e&&i.form===e.form){var c=Gs(i);if(!c)throw Error(V(90));sc(i),Un(i,c)}}}break;case"textarea":oc(e,r);break;case"select":t=r.value,t!=null&&Ir(e,!!r.multiple,t,!1)}};fc=vl;pc=vr;var Mf={usingClientEntryPoint:!1,Events:[Wi,Dr,Gs,hc,dc,vl]},li={findFiberByHostInstance:ar,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Pf={bundleType:li.bundleType,version:li.version,rendererPackageName:li.rendererPackageName,rendererConfig:li.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Ot.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=vc(e),e===null?null:e.stateNode},findFiberByHostInstance:li.findFiberByHostInstance||Bf,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var os=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!os.isDisabled&&os.supportsFiber)try{$s=os.inject(Pf),bt=os}catch{}}rt.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Mf;rt.createPortal=function(e,t){var r=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!bl(t))throw Error(V(200));return Tf(e,t,null,r)};rt.createRoot=function(e,t){if(!bl(e))throw Error(V(299));var r=!1,i="",c=Xu;return t!=null&&(t.unstable_strictMode===!0&&(r=!0),t.identifierPrefix!==void 0&&(i=t.identifierPrefix),t.onRecoverableError!==void 0&&(c=t.onRecoverableError)),t=Cl(e,1,!1,null,null,r,!1,i,c),e[Mt]=t.current,Ri(e.nodeType===8?e.parentNode:e),new xl(t)};rt.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(V(188)):(e=Object.keys(e).join(","),Error(V(268,e)));return e=vc(t),e=e===null?null:e.stateNode,e};rt.flushSync=function(e){return vr(e)};rt.hydrate=function(e,t,r){if(!sn(t))throw Error(V(200));return nn(null,e,t,!0,r)};rt.hydrateRoot=function(e,t,r){if(!bl(e))throw Error(V(405));var i=r!=null&&r.hydratedSources||null,c=!1,f="",g=Xu;if(r!=null&&(r.unstable_strictMode===!0&&(c=!0),r.identifierPrefix!==void 0&&(f=r.identifierPrefix),r.onRecoverableError!==void 0&&(g=r.onRecoverableError)),t=Gu(t,null,e,1,r??null,c,!1,f,g),e[Mt]=t.current,Ri(e),i)for(e=0;e<i.length;e++)r=i[e],c=r._getVersion,c=c(r._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[r,c]:t.mutableSourceEagerHydrationData.push(r,c);return new rn(t)};rt.render=function(e,t,r){if(!sn(t))throw Error(V(200));return nn(null,e,t,!1,r)};rt.unmountComponentAtNode=function(e){if(!sn(e))throw Error(V(40));return e._reactRootContainer?(vr(function(){nn(null,null,e,!1,function(){e._reactRootContainer=null,e[Mt]=null})}),!0):!1};rt.unstable_batchedUpdates=vl;rt.unstable_renderSubtreeIntoContainer=function(e,t,r,i){if(!sn(r))throw Error(V(200));if(e==null||e._reactInternals===void 0)throw Error(V(38));return nn(e,t,r,!1,i)};rt.version="18.3.1-next-f1338f8080-20240426";function Yu(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Yu)}catch(e){console.error(e)}}Yu(),Ya.exports=rt;var If=Ya.exports,Ma=If;On.createRoot=Ma.createRoot,On.hydrateRoot=Ma.hydrateRoot;/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Of=e=>e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),jf=e=>e.replace(/^([A-Z])|[\s-_]+(\w)/g,(t,r,i)=>i?i.toUpperCase():r.toLowerCase()),Pa=e=>{const t=jf(e);return t.charAt(0).toUpperCase()+t.slice(1)},Qu=(...e)=>e.filter((t,r,i)=>!!t&&t.trim()!==""&&i.indexOf(t)===r).join(" ").trim(),Hf=e=>{for(const t in e)if(t.startsWith("aria-")||t==="role"||t==="title")return!0};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var Ff={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const zf=$.forwardRef(({color:e="currentColor",size:t=24,strokeWidth:r=2,absoluteStrokeWidth:i,className:c="",children:f,iconNode:g,...n},u)=>$.createElement("svg",{ref:u,...Ff,width:t,height:t,stroke:e,strokeWidth:i?Number(r)*24/Number(t):r,className:Qu("lucide",c),...!f&&!Hf(n)&&{"aria-hidden":"true"},...n},[...g.map(([d,y])=>$.createElement(d,y)),...Array.isArray(f)?f:[f]]));/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ce=(e,t)=>{const r=$.forwardRef(({className:i,...c},f)=>$.createElement(zf,{ref:f,iconNode:t,className:Qu(`lucide-${Of(Pa(e))}`,`lucide-${e}`,i),...c}));return r.displayName=Pa(e),r};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Nf=[["path",{d:"M12 5v14",key:"s699le"}],["path",{d:"m19 12-7 7-7-7",key:"1idqje"}]],Wf=ce("arrow-down",Nf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Uf=[["path",{d:"m12 19-7-7 7-7",key:"1l729n"}],["path",{d:"M19 12H5",key:"x3x0zl"}]],$f=ce("arrow-left",Uf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Vf=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"m12 5 7 7-7 7",key:"xquz4c"}]],Kf=ce("arrow-right",Vf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const qf=[["path",{d:"m5 12 7-7 7 7",key:"hav0vg"}],["path",{d:"M12 19V5",key:"x0mq9r"}]],Gf=ce("arrow-up",qf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Xf=[["path",{d:"m6 9 6 6 6-6",key:"qrunsl"}]],Yf=ce("chevron-down",Xf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Qf=[["path",{d:"m15 18-6-6 6-6",key:"1wnfg3"}]],Jf=ce("chevron-left",Qf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Zf=[["path",{d:"m9 18 6-6-6-6",key:"mthhwq"}]],Ju=ce("chevron-right",Zf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ep=[["path",{d:"m7 6 5 5 5-5",key:"1lc07p"}],["path",{d:"m7 13 5 5 5-5",key:"1d48rs"}]],tp=ce("chevrons-down",ep);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const rp=[["path",{d:"M11 14h10",key:"1w8e9d"}],["path",{d:"M16 4h2a2 2 0 0 1 2 2v1.344",key:"1e62lh"}],["path",{d:"m17 18 4-4-4-4",key:"z2g111"}],["path",{d:"M8 4H6a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h12a2 2 0 0 0 1.793-1.113",key:"bjbb7m"}],["rect",{x:"8",y:"2",width:"8",height:"4",rx:"1",key:"ublpy"}]],Zu=ce("clipboard-paste",rp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ip=[["rect",{width:"14",height:"14",x:"8",y:"8",rx:"2",ry:"2",key:"17jyea"}],["path",{d:"M4 16c-1.1 0-2-.9-2-2V4c0-1.1.9-2 2-2h10c1.1 0 2 .9 2 2",key:"zix9uf"}]],sp=ce("copy",ip);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const np=[["path",{d:"M12 20v2",key:"1lh1kg"}],["path",{d:"M12 2v2",key:"tus03m"}],["path",{d:"M17 20v2",key:"1rnc9c"}],["path",{d:"M17 2v2",key:"11trls"}],["path",{d:"M2 12h2",key:"1t8f8n"}],["path",{d:"M2 17h2",key:"7oei6x"}],["path",{d:"M2 7h2",key:"asdhe0"}],["path",{d:"M20 12h2",key:"1q8mjw"}],["path",{d:"M20 17h2",key:"1fpfkl"}],["path",{d:"M20 7h2",key:"1o8tra"}],["path",{d:"M7 20v2",key:"4gnj0m"}],["path",{d:"M7 2v2",key:"1i4yhu"}],["rect",{x:"4",y:"4",width:"16",height:"16",rx:"2",key:"1vbyd7"}],["rect",{x:"8",y:"8",width:"8",height:"8",rx:"1",key:"z9xiuo"}]],op=ce("cpu",np);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const lp=[["path",{d:"M21 21H8a2 2 0 0 1-1.42-.587l-3.994-3.999a2 2 0 0 1 0-2.828l10-10a2 2 0 0 1 2.829 0l5.999 6a2 2 0 0 1 0 2.828L12.834 21",key:"g5wo59"}],["path",{d:"m5.082 11.09 8.828 8.828",key:"1wx5vj"}]],eh=ce("eraser",lp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ap=[["path",{d:"M6 22a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h8a2.4 2.4 0 0 1 1.704.706l3.588 3.588A2.4 2.4 0 0 1 20 8v12a2 2 0 0 1-2 2z",key:"1oefj6"}],["path",{d:"M14 2v5a1 1 0 0 0 1 1h5",key:"wfsgrz"}],["path",{d:"M9 15h6",key:"cctwl0"}],["path",{d:"M12 18v-6",key:"17g6i2"}]],An=ce("file-plus",ap);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const cp=[["path",{d:"M6 22a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h8a2.4 2.4 0 0 1 1.704.706l3.588 3.588A2.4 2.4 0 0 1 20 8v12a2 2 0 0 1-2 2z",key:"1oefj6"}],["path",{d:"M14 2v5a1 1 0 0 0 1 1h5",key:"wfsgrz"}]],th=ce("file",cp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const up=[["path",{d:"m6 14 1.5-2.9A2 2 0 0 1 9.24 10H20a2 2 0 0 1 1.94 2.5l-1.54 6a2 2 0 0 1-1.95 1.5H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h3.9a2 2 0 0 1 1.69.9l.81 1.2a2 2 0 0 0 1.67.9H18a2 2 0 0 1 2 2v2",key:"usdka0"}]],hp=ce("folder-open",up);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const dp=[["path",{d:"M12 10v6",key:"1bos4e"}],["path",{d:"M9 13h6",key:"1uhe8q"}],["path",{d:"M20 20a2 2 0 0 0 2-2V8a2 2 0 0 0-2-2h-7.9a2 2 0 0 1-1.69-.9L9.6 3.9A2 2 0 0 0 7.93 3H4a2 2 0 0 0-2 2v13a2 2 0 0 0 2 2Z",key:"1kt360"}]],Mn=ce("folder-plus",dp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const fp=[["path",{d:"M20 10a1 1 0 0 0 1-1V6a1 1 0 0 0-1-1h-2.5a1 1 0 0 1-.8-.4l-.9-1.2A1 1 0 0 0 15 3h-2a1 1 0 0 0-1 1v5a1 1 0 0 0 1 1Z",key:"hod4my"}],["path",{d:"M20 21a1 1 0 0 0 1-1v-3a1 1 0 0 0-1-1h-2.9a1 1 0 0 1-.88-.55l-.42-.85a1 1 0 0 0-.92-.6H13a1 1 0 0 0-1 1v5a1 1 0 0 0 1 1Z",key:"w4yl2u"}],["path",{d:"M3 5a2 2 0 0 0 2 2h3",key:"f2jnh7"}],["path",{d:"M3 3v13a2 2 0 0 0 2 2h3",key:"k8epm1"}]],pp=ce("folder-tree",fp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _p=[["path",{d:"M20 20a2 2 0 0 0 2-2V8a2 2 0 0 0-2-2h-7.9a2 2 0 0 1-1.69-.9L9.6 3.9A2 2 0 0 0 7.93 3H4a2 2 0 0 0-2 2v13a2 2 0 0 0 2 2Z",key:"1kt360"}]],gp=ce("folder",_p);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const vp=[["path",{d:"M4 5h16",key:"1tepv9"}],["path",{d:"M4 12h16",key:"1lakjw"}],["path",{d:"M4 19h16",key:"1djgab"}]],mp=ce("menu",vp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const yp=[["path",{d:"M22 17a2 2 0 0 1-2 2H6.828a2 2 0 0 0-1.414.586l-2.202 2.202A.71.71 0 0 1 2 21.286V5a2 2 0 0 1 2-2h16a2 2 0 0 1 2 2z",key:"18887p"}]],Sp=ce("message-square",yp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Cp=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2",key:"afitv7"}],["path",{d:"M9 3v18",key:"fh3hqa"}],["path",{d:"m16 15-3-3 3-3",key:"14y99z"}]],wp=ce("panel-left-close",Cp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const xp=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2",key:"afitv7"}],["path",{d:"M9 3v18",key:"fh3hqa"}]],bp=ce("panel-left",xp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const kp=[["path",{d:"M21.174 6.812a1 1 0 0 0-3.986-3.987L3.842 16.174a2 2 0 0 0-.5.83l-1.321 4.352a.5.5 0 0 0 .623.622l4.353-1.32a2 2 0 0 0 .83-.497z",key:"1a8usu"}]],Ep=ce("pen",kp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Lp=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"M12 5v14",key:"s699le"}]],Ia=ce("plus",Lp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Dp=[["path",{d:"M12 2v10",key:"mnfbl"}],["path",{d:"M18.4 6.6a9 9 0 1 1-12.77.04",key:"obofu9"}]],Oa=ce("power",Dp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Rp=[["path",{d:"M3 12a9 9 0 0 1 9-9 9.75 9.75 0 0 1 6.74 2.74L21 8",key:"v9h5vc"}],["path",{d:"M21 3v5h-5",key:"1q7to0"}],["path",{d:"M21 12a9 9 0 0 1-9 9 9.75 9.75 0 0 1-6.74-2.74L3 16",key:"3uifl3"}],["path",{d:"M8 16H3v5",key:"1cv678"}]],Tp=ce("refresh-cw",Rp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Bp=[["path",{d:"M15.2 3a2 2 0 0 1 1.4.6l3.8 3.8a2 2 0 0 1 .6 1.4V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2z",key:"1c8476"}],["path",{d:"M17 21v-7a1 1 0 0 0-1-1H8a1 1 0 0 0-1 1v7",key:"1ydtos"}],["path",{d:"M7 3v4a1 1 0 0 0 1 1h7",key:"t51u73"}]],Ap=ce("save",Bp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Mp=[["path",{d:"M14.536 21.686a.5.5 0 0 0 .937-.024l6.5-19a.496.496 0 0 0-.635-.635l-19 6.5a.5.5 0 0 0-.024.937l7.93 3.18a2 2 0 0 1 1.112 1.11z",key:"1ffxy3"}],["path",{d:"m21.854 2.147-10.94 10.939",key:"12cjpa"}]],Pp=ce("send",Mp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ip=[["path",{d:"M9.671 4.136a2.34 2.34 0 0 1 4.659 0 2.34 2.34 0 0 0 3.319 1.915 2.34 2.34 0 0 1 2.33 4.033 2.34 2.34 0 0 0 0 3.831 2.34 2.34 0 0 1-2.33 4.033 2.34 2.34 0 0 0-3.319 1.915 2.34 2.34 0 0 1-4.659 0 2.34 2.34 0 0 0-3.32-1.915 2.34 2.34 0 0 1-2.33-4.033 2.34 2.34 0 0 0 0-3.831A2.34 2.34 0 0 1 6.35 6.051a2.34 2.34 0 0 0 3.319-1.915",key:"1i5ecw"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],ja=ce("settings",Ip);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Op=[["path",{d:"M12 19h8",key:"baeox8"}],["path",{d:"m4 17 6-6-6-6",key:"1yngyt"}]],To=ce("terminal",Op);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const jp=[["path",{d:"M10 11v6",key:"nco0om"}],["path",{d:"M14 11v6",key:"outv1u"}],["path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6",key:"miytrc"}],["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2",key:"e791ji"}]],Hp=ce("trash-2",jp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Fp=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],Hi=ce("x",Fp);var rh={exports:{}};(function(e,t){(function(r,i){e.exports=i()})(self,()=>(()=>{var r={4567:function(g,n,u){var d=this&&this.__decorate||function(o,p,m,x){var E,v=arguments.length,k=v<3?p:x===null?x=Object.getOwnPropertyDescriptor(p,m):x;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")k=Reflect.decorate(o,p,m,x);else for(var B=o.length-1;B>=0;B--)(E=o[B])&&(k=(v<3?E(k):v>3?E(p,m,k):E(p,m))||k);return v>3&&k&&Object.defineProperty(p,m,k),k},y=this&&this.__param||function(o,p){return function(m,x){p(m,x,o)}};Object.defineProperty(n,"__esModule",{value:!0}),n.AccessibilityManager=void 0;const h=u(9042),_=u(6114),S=u(9924),w=u(844),C=u(5596),a=u(4725),l=u(3656);let s=n.AccessibilityManager=class extends w.Disposable{constructor(o,p){super(),this._terminal=o,this._renderService=p,this._liveRegionLineCount=0,this._charsToConsume=[],this._charsToAnnounce="",this._accessibilityContainer=document.createElement("div"),this._accessibilityContainer.classList.add("xterm-accessibility"),this._rowContainer=document.createElement("div"),this._rowContainer.setAttribute("role","list"),this._rowContainer.classList.add("xterm-accessibility-tree"),this._rowElements=[];for(let m=0;m<this._terminal.rows;m++)this._rowElements[m]=this._createAccessibilityTreeNode(),this._rowContainer.appendChild(this._rowElements[m]);if(this._topBoundaryFocusListener=m=>this._handleBoundaryFocus(m,0),this._bottomBoundaryFocusListener=m=>this._handleBoundaryFocus(m,1),this._rowElements[0].addEventListener("focus",this._topBoundaryFocusListener),this._rowElements[this._rowElements.length-1].addEventListener("focus",this._bottomBoundaryFocusListener),this._refreshRowsDimensions(),this._accessibilityContainer.appendChild(this._rowContainer),this._liveRegion=document.createElement("div"),this._liveRegion.classList.add("live-region"),this._liveRegion.setAttribute("aria-live","assertive"),this._accessibilityContainer.appendChild(this._liveRegion),this._liveRegionDebouncer=this.register(new S.TimeBasedDebouncer(this._renderRows.bind(this))),!this._terminal.element)throw new Error("Cannot enable accessibility before Terminal.open");this._terminal.element.insertAdjacentElement("afterbegin",this._accessibilityContainer),this.register(this._terminal.onResize(m=>this._handleResize(m.rows))),this.register(this._terminal.onRender(m=>this._refreshRows(m.start,m.end))),this.register(this._terminal.onScroll(()=>this._refreshRows())),this.register(this._terminal.onA11yChar(m=>this._handleChar(m))),this.register(this._terminal.onLineFeed(()=>this._handleChar(`
-`))),this.register(this._terminal.onA11yTab(m=>this._handleTab(m))),this.register(this._terminal.onKey(m=>this._handleKey(m.key))),this.register(this._terminal.onBlur(()=>this._clearLiveRegion())),this.register(this._renderService.onDimensionsChange(()=>this._refreshRowsDimensions())),this._screenDprMonitor=new C.ScreenDprMonitor(window),this.register(this._screenDprMonitor),this._screenDprMonitor.setListener(()=>this._refreshRowsDimensions()),this.register((0,l.addDisposableDomListener)(window,"resize",()=>this._refreshRowsDimensions())),this._refreshRows(),this.register((0,w.toDisposable)(()=>{this._accessibilityContainer.remove(),this._rowElements.length=0}))}_handleTab(o){for(let p=0;p<o;p++)this._handleChar(" ")}_handleChar(o){this._liveRegionLineCount<21&&(this._charsToConsume.length>0?this._charsToConsume.shift()!==o&&(this._charsToAnnounce+=o):this._charsToAnnounce+=o,o===`
-`&&(this._liveRegionLineCount++,this._liveRegionLineCount===21&&(this._liveRegion.textContent+=h.tooMuchOutput)),_.isMac&&this._liveRegion.textContent&&this._liveRegion.textContent.length>0&&!this._liveRegion.parentNode&&setTimeout(()=>{this._accessibilityContainer.appendChild(this._liveRegion)},0))}_clearLiveRegion(){this._liveRegion.textContent="",this._liveRegionLineCount=0,_.isMac&&this._liveRegion.remove()}_handleKey(o){this._clearLiveRegion(),new RegExp("\\p{Control}","u").test(o)||this._charsToConsume.push(o)}_refreshRows(o,p){this._liveRegionDebouncer.refresh(o,p,this._terminal.rows)}_renderRows(o,p){const m=this._terminal.buffer,x=m.lines.length.toString();for(let E=o;E<=p;E++){const v=m.translateBufferLineToString(m.ydisp+E,!0),k=(m.ydisp+E+1).toString(),B=this._rowElements[E];B&&(v.length===0?B.innerText=" ":B.textContent=v,B.setAttribute("aria-posinset",k),B.setAttribute("aria-setsize",x))}this._announceCharacters()}_announceCharacters(){this._charsToAnnounce.length!==0&&(this._liveRegion.textContent+=this._charsToAnnounce,this._charsToAnnounce="")}_handleBoundaryFocus(o,p){const m=o.target,x=this._rowElements[p===0?1:this._rowElements.length-2];if(m.getAttribute("aria-posinset")===(p===0?"1":`${this._terminal.buffer.lines.length}`)||o.relatedTarget!==x)return;let E,v;if(p===0?(E=m,v=this._rowElements.pop(),this._rowContainer.removeChild(v)):(E=this._rowElements.shift(),v=m,this._rowContainer.removeChild(E)),E.removeEventListener("focus",this._topBoundaryFocusListener),v.removeEventListener("focus",this._bottomBoundaryFocusListener),p===0){const k=this._createAccessibilityTreeNode();this._rowElements.unshift(k),this._rowContainer.insertAdjacentElement("afterbegin",k)}else{const k=this._createAccessibilityTreeNode();this._rowElements.push(k),this._rowContainer.appendChild(k)}this._rowElements[0].addEventListener("focus",this._topBoundaryFocusListener),this._rowElements[this._rowElements.length-1].addEventListener("focus",this._bottomBoundaryFocusListener),this._terminal.scrollLines(p===0?-1:1),this._rowElements[p===0?1:this._rowElements.length-2].focus(),o.preventDefault(),o.stopImmediatePropagation()}_handleResize(o){this._rowElements[this._rowElements.length-1].removeEventListener("focus",this._bottomBoundaryFocusListener);for(let p=this._rowContainer.children.length;p<this._terminal.rows;p++)this._rowElements[p]=this._createAccessibilityTreeNode(),this._rowContainer.appendChild(this._rowElements[p]);for(;this._rowElements.length>o;)this._rowContainer.removeChild(this._rowElements.pop());this._rowElements[this._rowElements.length-1].addEventListener("focus",this._bottomBoundaryFocusListener),this._refreshRowsDimensions()}_createAccessibilityTreeNode(){const o=document.createElement("div");return o.setAttribute("role","listitem"),o.tabIndex=-1,this._refreshRowDimensions(o),o}_refreshRowsDimensions(){if(this._renderService.dimensions.css.cell.height){this._accessibilityContainer.style.width=`${this._renderService.dimensions.css.canvas.width}px`,this._rowElements.length!==this._terminal.rows&&this._handleResize(this._terminal.rows);for(let o=0;o<this._terminal.rows;o++)this._refreshRowDimensions(this._rowElements[o])}}_refreshRowDimensions(o){o.style.height=`${this._renderService.dimensions.css.cell.height}px`}};n.AccessibilityManager=s=d([y(1,a.IRenderService)],s)},3614:(g,n)=>{function u(_){return _.replace(/\r?\n/g,"\r")}function d(_,S){return S?"\x1B[200~"+_+"\x1B[201~":_}function y(_,S,w,C){_=d(_=u(_),w.decPrivateModes.bracketedPasteMode&&C.rawOptions.ignoreBracketedPasteMode!==!0),w.triggerDataEvent(_,!0),S.value=""}function h(_,S,w){const C=w.getBoundingClientRect(),a=_.clientX-C.left-10,l=_.clientY-C.top-10;S.style.width="20px",S.style.height="20px",S.style.left=`${a}px`,S.style.top=`${l}px`,S.style.zIndex="1000",S.focus()}Object.defineProperty(n,"__esModule",{value:!0}),n.rightClickHandler=n.moveTextAreaUnderMouseCursor=n.paste=n.handlePasteEvent=n.copyHandler=n.bracketTextForPaste=n.prepareTextForTerminal=void 0,n.prepareTextForTerminal=u,n.bracketTextForPaste=d,n.copyHandler=function(_,S){_.clipboardData&&_.clipboardData.setData("text/plain",S.selectionText),_.preventDefault()},n.handlePasteEvent=function(_,S,w,C){_.stopPropagation(),_.clipboardData&&y(_.clipboardData.getData("text/plain"),S,w,C)},n.paste=y,n.moveTextAreaUnderMouseCursor=h,n.rightClickHandler=function(_,S,w,C,a){h(_,S,w),a&&C.rightClickSelect(_),S.value=C.selectionText,S.select()}},7239:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ColorContrastCache=void 0;const d=u(1505);n.ColorContrastCache=class{constructor(){this._color=new d.TwoKeyMap,this._css=new d.TwoKeyMap}setCss(y,h,_){this._css.set(y,h,_)}getCss(y,h){return this._css.get(y,h)}setColor(y,h,_){this._color.set(y,h,_)}getColor(y,h){return this._color.get(y,h)}clear(){this._color.clear(),this._css.clear()}}},3656:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.addDisposableDomListener=void 0,n.addDisposableDomListener=function(u,d,y,h){u.addEventListener(d,y,h);let _=!1;return{dispose:()=>{_||(_=!0,u.removeEventListener(d,y,h))}}}},6465:function(g,n,u){var d=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.Linkifier2=void 0;const h=u(3656),_=u(8460),S=u(844),w=u(2585);let C=n.Linkifier2=class extends S.Disposable{get currentLink(){return this._currentLink}constructor(a){super(),this._bufferService=a,this._linkProviders=[],this._linkCacheDisposables=[],this._isMouseOut=!0,this._wasResized=!1,this._activeLine=-1,this._onShowLinkUnderline=this.register(new _.EventEmitter),this.onShowLinkUnderline=this._onShowLinkUnderline.event,this._onHideLinkUnderline=this.register(new _.EventEmitter),this.onHideLinkUnderline=this._onHideLinkUnderline.event,this.register((0,S.getDisposeArrayDisposable)(this._linkCacheDisposables)),this.register((0,S.toDisposable)(()=>{this._lastMouseEvent=void 0})),this.register(this._bufferService.onResize(()=>{this._clearCurrentLink(),this._wasResized=!0}))}registerLinkProvider(a){return this._linkProviders.push(a),{dispose:()=>{const l=this._linkProviders.indexOf(a);l!==-1&&this._linkProviders.splice(l,1)}}}attachToDom(a,l,s){this._element=a,this._mouseService=l,this._renderService=s,this.register((0,h.addDisposableDomListener)(this._element,"mouseleave",()=>{this._isMouseOut=!0,this._clearCurrentLink()})),this.register((0,h.addDisposableDomListener)(this._element,"mousemove",this._handleMouseMove.bind(this))),this.register((0,h.addDisposableDomListener)(this._element,"mousedown",this._handleMouseDown.bind(this))),this.register((0,h.addDisposableDomListener)(this._element,"mouseup",this._handleMouseUp.bind(this)))}_handleMouseMove(a){if(this._lastMouseEvent=a,!this._element||!this._mouseService)return;const l=this._positionFromMouseEvent(a,this._element,this._mouseService);if(!l)return;this._isMouseOut=!1;const s=a.composedPath();for(let o=0;o<s.length;o++){const p=s[o];if(p.classList.contains("xterm"))break;if(p.classList.contains("xterm-hover"))return}this._lastBufferCell&&l.x===this._lastBufferCell.x&&l.y===this._lastBufferCell.y||(this._handleHover(l),this._lastBufferCell=l)}_handleHover(a){if(this._activeLine!==a.y||this._wasResized)return this._clearCurrentLink(),this._askForLink(a,!1),void(this._wasResized=!1);this._currentLink&&this._linkAtPosition(this._currentLink.link,a)||(this._clearCurrentLink(),this._askForLink(a,!0))}_askForLink(a,l){var s,o;this._activeProviderReplies&&l||((s=this._activeProviderReplies)===null||s===void 0||s.forEach(m=>{m==null||m.forEach(x=>{x.link.dispose&&x.link.dispose()})}),this._activeProviderReplies=new Map,this._activeLine=a.y);let p=!1;for(const[m,x]of this._linkProviders.entries())l?!((o=this._activeProviderReplies)===null||o===void 0)&&o.get(m)&&(p=this._checkLinkProviderResult(m,a,p)):x.provideLinks(a.y,E=>{var v,k;if(this._isMouseOut)return;const B=E==null?void 0:E.map(M=>({link:M}));(v=this._activeProviderReplies)===null||v===void 0||v.set(m,B),p=this._checkLinkProviderResult(m,a,p),((k=this._activeProviderReplies)===null||k===void 0?void 0:k.size)===this._linkProviders.length&&this._removeIntersectingLinks(a.y,this._activeProviderReplies)})}_removeIntersectingLinks(a,l){const s=new Set;for(let o=0;o<l.size;o++){const p=l.get(o);if(p)for(let m=0;m<p.length;m++){const x=p[m],E=x.link.range.start.y<a?0:x.link.range.start.x,v=x.link.range.end.y>a?this._bufferService.cols:x.link.range.end.x;for(let k=E;k<=v;k++){if(s.has(k)){p.splice(m--,1);break}s.add(k)}}}}_checkLinkProviderResult(a,l,s){var o;if(!this._activeProviderReplies)return s;const p=this._activeProviderReplies.get(a);let m=!1;for(let x=0;x<a;x++)this._activeProviderReplies.has(x)&&!this._activeProviderReplies.get(x)||(m=!0);if(!m&&p){const x=p.find(E=>this._linkAtPosition(E.link,l));x&&(s=!0,this._handleNewLink(x))}if(this._activeProviderReplies.size===this._linkProviders.length&&!s)for(let x=0;x<this._activeProviderReplies.size;x++){const E=(o=this._activeProviderReplies.get(x))===null||o===void 0?void 0:o.find(v=>this._linkAtPosition(v.link,l));if(E){s=!0,this._handleNewLink(E);break}}return s}_handleMouseDown(){this._mouseDownLink=this._currentLink}_handleMouseUp(a){if(!this._element||!this._mouseService||!this._currentLink)return;const l=this._positionFromMouseEvent(a,this._element,this._mouseService);l&&this._mouseDownLink===this._currentLink&&this._linkAtPosition(this._currentLink.link,l)&&this._currentLink.link.activate(a,this._currentLink.link.text)}_clearCurrentLink(a,l){this._element&&this._currentLink&&this._lastMouseEvent&&(!a||!l||this._currentLink.link.range.start.y>=a&&this._currentLink.link.range.end.y<=l)&&(this._linkLeave(this._element,this._currentLink.link,this._lastMouseEvent),this._currentLink=void 0,(0,S.disposeArray)(this._linkCacheDisposables))}_handleNewLink(a){if(!this._element||!this._lastMouseEvent||!this._mouseService)return;const l=this._positionFromMouseEvent(this._lastMouseEvent,this._element,this._mouseService);l&&this._linkAtPosition(a.link,l)&&(this._currentLink=a,this._currentLink.state={decorations:{underline:a.link.decorations===void 0||a.link.decorations.underline,pointerCursor:a.link.decorations===void 0||a.link.decorations.pointerCursor},isHovered:!0},this._linkHover(this._element,a.link,this._lastMouseEvent),a.link.decorations={},Object.defineProperties(a.link.decorations,{pointerCursor:{get:()=>{var s,o;return(o=(s=this._currentLink)===null||s===void 0?void 0:s.state)===null||o===void 0?void 0:o.decorations.pointerCursor},set:s=>{var o,p;!((o=this._currentLink)===null||o===void 0)&&o.state&&this._currentLink.state.decorations.pointerCursor!==s&&(this._currentLink.state.decorations.pointerCursor=s,this._currentLink.state.isHovered&&((p=this._element)===null||p===void 0||p.classList.toggle("xterm-cursor-pointer",s)))}},underline:{get:()=>{var s,o;return(o=(s=this._currentLink)===null||s===void 0?void 0:s.state)===null||o===void 0?void 0:o.decorations.underline},set:s=>{var o,p,m;!((o=this._currentLink)===null||o===void 0)&&o.state&&((m=(p=this._currentLink)===null||p===void 0?void 0:p.state)===null||m===void 0?void 0:m.decorations.underline)!==s&&(this._currentLink.state.decorations.underline=s,this._currentLink.state.isHovered&&this._fireUnderlineEvent(a.link,s))}}}),this._renderService&&this._linkCacheDisposables.push(this._renderService.onRenderedViewportChange(s=>{if(!this._currentLink)return;const o=s.start===0?0:s.start+1+this._bufferService.buffer.ydisp,p=this._bufferService.buffer.ydisp+1+s.end;if(this._currentLink.link.range.start.y>=o&&this._currentLink.link.range.end.y<=p&&(this._clearCurrentLink(o,p),this._lastMouseEvent&&this._element)){const m=this._positionFromMouseEvent(this._lastMouseEvent,this._element,this._mouseService);m&&this._askForLink(m,!1)}})))}_linkHover(a,l,s){var o;!((o=this._currentLink)===null||o===void 0)&&o.state&&(this._currentLink.state.isHovered=!0,this._currentLink.state.decorations.underline&&this._fireUnderlineEvent(l,!0),this._currentLink.state.decorations.pointerCursor&&a.classList.add("xterm-cursor-pointer")),l.hover&&l.hover(s,l.text)}_fireUnderlineEvent(a,l){const s=a.range,o=this._bufferService.buffer.ydisp,p=this._createLinkUnderlineEvent(s.start.x-1,s.start.y-o-1,s.end.x,s.end.y-o-1,void 0);(l?this._onShowLinkUnderline:this._onHideLinkUnderline).fire(p)}_linkLeave(a,l,s){var o;!((o=this._currentLink)===null||o===void 0)&&o.state&&(this._currentLink.state.isHovered=!1,this._currentLink.state.decorations.underline&&this._fireUnderlineEvent(l,!1),this._currentLink.state.decorations.pointerCursor&&a.classList.remove("xterm-cursor-pointer")),l.leave&&l.leave(s,l.text)}_linkAtPosition(a,l){const s=a.range.start.y*this._bufferService.cols+a.range.start.x,o=a.range.end.y*this._bufferService.cols+a.range.end.x,p=l.y*this._bufferService.cols+l.x;return s<=p&&p<=o}_positionFromMouseEvent(a,l,s){const o=s.getCoords(a,l,this._bufferService.cols,this._bufferService.rows);if(o)return{x:o[0],y:o[1]+this._bufferService.buffer.ydisp}}_createLinkUnderlineEvent(a,l,s,o,p){return{x1:a,y1:l,x2:s,y2:o,cols:this._bufferService.cols,fg:p}}};n.Linkifier2=C=d([y(0,w.IBufferService)],C)},9042:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.tooMuchOutput=n.promptLabel=void 0,n.promptLabel="Terminal input",n.tooMuchOutput="Too much output to announce, navigate to rows manually to read"},3730:function(g,n,u){var d=this&&this.__decorate||function(C,a,l,s){var o,p=arguments.length,m=p<3?a:s===null?s=Object.getOwnPropertyDescriptor(a,l):s;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")m=Reflect.decorate(C,a,l,s);else for(var x=C.length-1;x>=0;x--)(o=C[x])&&(m=(p<3?o(m):p>3?o(a,l,m):o(a,l))||m);return p>3&&m&&Object.defineProperty(a,l,m),m},y=this&&this.__param||function(C,a){return function(l,s){a(l,s,C)}};Object.defineProperty(n,"__esModule",{value:!0}),n.OscLinkProvider=void 0;const h=u(511),_=u(2585);let S=n.OscLinkProvider=class{constructor(C,a,l){this._bufferService=C,this._optionsService=a,this._oscLinkService=l}provideLinks(C,a){var l;const s=this._bufferService.buffer.lines.get(C-1);if(!s)return void a(void 0);const o=[],p=this._optionsService.rawOptions.linkHandler,m=new h.CellData,x=s.getTrimmedLength();let E=-1,v=-1,k=!1;for(let B=0;B<x;B++)if(v!==-1||s.hasContent(B)){if(s.loadCell(B,m),m.hasExtendedAttrs()&&m.extended.urlId){if(v===-1){v=B,E=m.extended.urlId;continue}k=m.extended.urlId!==E}else v!==-1&&(k=!0);if(k||v!==-1&&B===x-1){const M=(l=this._oscLinkService.getLinkData(E))===null||l===void 0?void 0:l.uri;if(M){const T={start:{x:v+1,y:C},end:{x:B+(k||B!==x-1?0:1),y:C}};let P=!1;if(!(p!=null&&p.allowNonHttpProtocols))try{const H=new URL(M);["http:","https:"].includes(H.protocol)||(P=!0)}catch{P=!0}P||o.push({text:M,range:T,activate:(H,N)=>p?p.activate(H,N,T):w(0,N),hover:(H,N)=>{var U;return(U=p==null?void 0:p.hover)===null||U===void 0?void 0:U.call(p,H,N,T)},leave:(H,N)=>{var U;return(U=p==null?void 0:p.leave)===null||U===void 0?void 0:U.call(p,H,N,T)}})}k=!1,m.hasExtendedAttrs()&&m.extended.urlId?(v=B,E=m.extended.urlId):(v=-1,E=-1)}}a(o)}};function w(C,a){if(confirm(`Do you want to navigate to ${a}?
-
-WARNING: This link could potentially be dangerous`)){const l=window.open();if(l){try{l.opener=null}catch{}l.location.href=a}else console.warn("Opening link blocked as opener could not be cleared")}}n.OscLinkProvider=S=d([y(0,_.IBufferService),y(1,_.IOptionsService),y(2,_.IOscLinkService)],S)},6193:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.RenderDebouncer=void 0,n.RenderDebouncer=class{constructor(u,d){this._parentWindow=u,this._renderCallback=d,this._refreshCallbacks=[]}dispose(){this._animationFrame&&(this._parentWindow.cancelAnimationFrame(this._animationFrame),this._animationFrame=void 0)}addRefreshCallback(u){return this._refreshCallbacks.push(u),this._animationFrame||(this._animationFrame=this._parentWindow.requestAnimationFrame(()=>this._innerRefresh())),this._animationFrame}refresh(u,d,y){this._rowCount=y,u=u!==void 0?u:0,d=d!==void 0?d:this._rowCount-1,this._rowStart=this._rowStart!==void 0?Math.min(this._rowStart,u):u,this._rowEnd=this._rowEnd!==void 0?Math.max(this._rowEnd,d):d,this._animationFrame||(this._animationFrame=this._parentWindow.requestAnimationFrame(()=>this._innerRefresh()))}_innerRefresh(){if(this._animationFrame=void 0,this._rowStart===void 0||this._rowEnd===void 0||this._rowCount===void 0)return void this._runRefreshCallbacks();const u=Math.max(this._rowStart,0),d=Math.min(this._rowEnd,this._rowCount-1);this._rowStart=void 0,this._rowEnd=void 0,this._renderCallback(u,d),this._runRefreshCallbacks()}_runRefreshCallbacks(){for(const u of this._refreshCallbacks)u(0);this._refreshCallbacks=[]}}},5596:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ScreenDprMonitor=void 0;const d=u(844);class y extends d.Disposable{constructor(_){super(),this._parentWindow=_,this._currentDevicePixelRatio=this._parentWindow.devicePixelRatio,this.register((0,d.toDisposable)(()=>{this.clearListener()}))}setListener(_){this._listener&&this.clearListener(),this._listener=_,this._outerListener=()=>{this._listener&&(this._listener(this._parentWindow.devicePixelRatio,this._currentDevicePixelRatio),this._updateDpr())},this._updateDpr()}_updateDpr(){var _;this._outerListener&&((_=this._resolutionMediaMatchList)===null||_===void 0||_.removeListener(this._outerListener),this._currentDevicePixelRatio=this._parentWindow.devicePixelRatio,this._resolutionMediaMatchList=this._parentWindow.matchMedia(`screen and (resolution: ${this._parentWindow.devicePixelRatio}dppx)`),this._resolutionMediaMatchList.addListener(this._outerListener))}clearListener(){this._resolutionMediaMatchList&&this._listener&&this._outerListener&&(this._resolutionMediaMatchList.removeListener(this._outerListener),this._resolutionMediaMatchList=void 0,this._listener=void 0,this._outerListener=void 0)}}n.ScreenDprMonitor=y},3236:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Terminal=void 0;const d=u(3614),y=u(3656),h=u(6465),_=u(9042),S=u(3730),w=u(1680),C=u(3107),a=u(5744),l=u(2950),s=u(1296),o=u(428),p=u(4269),m=u(5114),x=u(8934),E=u(3230),v=u(9312),k=u(4725),B=u(6731),M=u(8055),T=u(8969),P=u(8460),H=u(844),N=u(6114),U=u(8437),O=u(2584),b=u(7399),R=u(5941),A=u(9074),I=u(2585),F=u(5435),q=u(4567),Q=typeof window<"u"?window.document:null;class Y extends T.CoreTerminal{get onFocus(){return this._onFocus.event}get onBlur(){return this._onBlur.event}get onA11yChar(){return this._onA11yCharEmitter.event}get onA11yTab(){return this._onA11yTabEmitter.event}get onWillOpen(){return this._onWillOpen.event}constructor(D={}){super(D),this.browser=N,this._keyDownHandled=!1,this._keyDownSeen=!1,this._keyPressHandled=!1,this._unprocessedDeadKey=!1,this._accessibilityManager=this.register(new H.MutableDisposable),this._onCursorMove=this.register(new P.EventEmitter),this.onCursorMove=this._onCursorMove.event,this._onKey=this.register(new P.EventEmitter),this.onKey=this._onKey.event,this._onRender=this.register(new P.EventEmitter),this.onRender=this._onRender.event,this._onSelectionChange=this.register(new P.EventEmitter),this.onSelectionChange=this._onSelectionChange.event,this._onTitleChange=this.register(new P.EventEmitter),this.onTitleChange=this._onTitleChange.event,this._onBell=this.register(new P.EventEmitter),this.onBell=this._onBell.event,this._onFocus=this.register(new P.EventEmitter),this._onBlur=this.register(new P.EventEmitter),this._onA11yCharEmitter=this.register(new P.EventEmitter),this._onA11yTabEmitter=this.register(new P.EventEmitter),this._onWillOpen=this.register(new P.EventEmitter),this._setup(),this.linkifier2=this.register(this._instantiationService.createInstance(h.Linkifier2)),this.linkifier2.registerLinkProvider(this._instantiationService.createInstance(S.OscLinkProvider)),this._decorationService=this._instantiationService.createInstance(A.DecorationService),this._instantiationService.setService(I.IDecorationService,this._decorationService),this.register(this._inputHandler.onRequestBell(()=>this._onBell.fire())),this.register(this._inputHandler.onRequestRefreshRows((j,W)=>this.refresh(j,W))),this.register(this._inputHandler.onRequestSendFocus(()=>this._reportFocus())),this.register(this._inputHandler.onRequestReset(()=>this.reset())),this.register(this._inputHandler.onRequestWindowsOptionsReport(j=>this._reportWindowsOptions(j))),this.register(this._inputHandler.onColor(j=>this._handleColorEvent(j))),this.register((0,P.forwardEvent)(this._inputHandler.onCursorMove,this._onCursorMove)),this.register((0,P.forwardEvent)(this._inputHandler.onTitleChange,this._onTitleChange)),this.register((0,P.forwardEvent)(this._inputHandler.onA11yChar,this._onA11yCharEmitter)),this.register((0,P.forwardEvent)(this._inputHandler.onA11yTab,this._onA11yTabEmitter)),this.register(this._bufferService.onResize(j=>this._afterResize(j.cols,j.rows))),this.register((0,H.toDisposable)(()=>{var j,W;this._customKeyEventHandler=void 0,(W=(j=this.element)===null||j===void 0?void 0:j.parentNode)===null||W===void 0||W.removeChild(this.element)}))}_handleColorEvent(D){if(this._themeService)for(const j of D){let W,z="";switch(j.index){case 256:W="foreground",z="10";break;case 257:W="background",z="11";break;case 258:W="cursor",z="12";break;default:W="ansi",z="4;"+j.index}switch(j.type){case 0:const Z=M.color.toColorRGB(W==="ansi"?this._themeService.colors.ansi[j.index]:this._themeService.colors[W]);this.coreService.triggerDataEvent(`${O.C0.ESC}]${z};${(0,R.toRgbString)(Z)}${O.C1_ESCAPED.ST}`);break;case 1:if(W==="ansi")this._themeService.modifyColors(G=>G.ansi[j.index]=M.rgba.toColor(...j.color));else{const G=W;this._themeService.modifyColors(oe=>oe[G]=M.rgba.toColor(...j.color))}break;case 2:this._themeService.restoreColor(j.index)}}}_setup(){super._setup(),this._customKeyEventHandler=void 0}get buffer(){return this.buffers.active}focus(){this.textarea&&this.textarea.focus({preventScroll:!0})}_handleScreenReaderModeOptionChange(D){D?!this._accessibilityManager.value&&this._renderService&&(this._accessibilityManager.value=this._instantiationService.createInstance(q.AccessibilityManager,this)):this._accessibilityManager.clear()}_handleTextAreaFocus(D){this.coreService.decPrivateModes.sendFocus&&this.coreService.triggerDataEvent(O.C0.ESC+"[I"),this.updateCursorStyle(D),this.element.classList.add("focus"),this._showCursor(),this._onFocus.fire()}blur(){var D;return(D=this.textarea)===null||D===void 0?void 0:D.blur()}_handleTextAreaBlur(){this.textarea.value="",this.refresh(this.buffer.y,this.buffer.y),this.coreService.decPrivateModes.sendFocus&&this.coreService.triggerDataEvent(O.C0.ESC+"[O"),this.element.classList.remove("focus"),this._onBlur.fire()}_syncTextArea(){if(!this.textarea||!this.buffer.isCursorInViewport||this._compositionHelper.isComposing||!this._renderService)return;const D=this.buffer.ybase+this.buffer.y,j=this.buffer.lines.get(D);if(!j)return;const W=Math.min(this.buffer.x,this.cols-1),z=this._renderService.dimensions.css.cell.height,Z=j.getWidth(W),G=this._renderService.dimensions.css.cell.width*Z,oe=this.buffer.y*this._renderService.dimensions.css.cell.height,Ee=W*this._renderService.dimensions.css.cell.width;this.textarea.style.left=Ee+"px",this.textarea.style.top=oe+"px",this.textarea.style.width=G+"px",this.textarea.style.height=z+"px",this.textarea.style.lineHeight=z+"px",this.textarea.style.zIndex="-5"}_initGlobal(){this._bindKeys(),this.register((0,y.addDisposableDomListener)(this.element,"copy",j=>{this.hasSelection()&&(0,d.copyHandler)(j,this._selectionService)}));const D=j=>(0,d.handlePasteEvent)(j,this.textarea,this.coreService,this.optionsService);this.register((0,y.addDisposableDomListener)(this.textarea,"paste",D)),this.register((0,y.addDisposableDomListener)(this.element,"paste",D)),N.isFirefox?this.register((0,y.addDisposableDomListener)(this.element,"mousedown",j=>{j.button===2&&(0,d.rightClickHandler)(j,this.textarea,this.screenElement,this._selectionService,this.options.rightClickSelectsWord)})):this.register((0,y.addDisposableDomListener)(this.element,"contextmenu",j=>{(0,d.rightClickHandler)(j,this.textarea,this.screenElement,this._selectionService,this.options.rightClickSelectsWord)})),N.isLinux&&this.register((0,y.addDisposableDomListener)(this.element,"auxclick",j=>{j.button===1&&(0,d.moveTextAreaUnderMouseCursor)(j,this.textarea,this.screenElement)}))}_bindKeys(){this.register((0,y.addDisposableDomListener)(this.textarea,"keyup",D=>this._keyUp(D),!0)),this.register((0,y.addDisposableDomListener)(this.textarea,"keydown",D=>this._keyDown(D),!0)),this.register((0,y.addDisposableDomListener)(this.textarea,"keypress",D=>this._keyPress(D),!0)),this.register((0,y.addDisposableDomListener)(this.textarea,"compositionstart",()=>this._compositionHelper.compositionstart())),this.register((0,y.addDisposableDomListener)(this.textarea,"compositionupdate",D=>this._compositionHelper.compositionupdate(D))),this.register((0,y.addDisposableDomListener)(this.textarea,"compositionend",()=>this._compositionHelper.compositionend())),this.register((0,y.addDisposableDomListener)(this.textarea,"input",D=>this._inputEvent(D),!0)),this.register(this.onRender(()=>this._compositionHelper.updateCompositionElements()))}open(D){var j;if(!D)throw new Error("Terminal requires a parent element.");D.isConnected||this._logService.debug("Terminal.open was called on an element that was not attached to the DOM"),this._document=D.ownerDocument,this.element=this._document.createElement("div"),this.element.dir="ltr",this.element.classList.add("terminal"),this.element.classList.add("xterm"),D.appendChild(this.element);const W=Q.createDocumentFragment();this._viewportElement=Q.createElement("div"),this._viewportElement.classList.add("xterm-viewport"),W.appendChild(this._viewportElement),this._viewportScrollArea=Q.createElement("div"),this._viewportScrollArea.classList.add("xterm-scroll-area"),this._viewportElement.appendChild(this._viewportScrollArea),this.screenElement=Q.createElement("div"),this.screenElement.classList.add("xterm-screen"),this._helperContainer=Q.createElement("div"),this._helperContainer.classList.add("xterm-helpers"),this.screenElement.appendChild(this._helperContainer),W.appendChild(this.screenElement),this.textarea=Q.createElement("textarea"),this.textarea.classList.add("xterm-helper-textarea"),this.textarea.setAttribute("aria-label",_.promptLabel),N.isChromeOS||this.textarea.setAttribute("aria-multiline","false"),this.textarea.setAttribute("autocorrect","off"),this.textarea.setAttribute("autocapitalize","off"),this.textarea.setAttribute("spellcheck","false"),this.textarea.tabIndex=0,this._coreBrowserService=this._instantiationService.createInstance(m.CoreBrowserService,this.textarea,(j=this._document.defaultView)!==null&&j!==void 0?j:window),this._instantiationService.setService(k.ICoreBrowserService,this._coreBrowserService),this.register((0,y.addDisposableDomListener)(this.textarea,"focus",z=>this._handleTextAreaFocus(z))),this.register((0,y.addDisposableDomListener)(this.textarea,"blur",()=>this._handleTextAreaBlur())),this._helperContainer.appendChild(this.textarea),this._charSizeService=this._instantiationService.createInstance(o.CharSizeService,this._document,this._helperContainer),this._instantiationService.setService(k.ICharSizeService,this._charSizeService),this._themeService=this._instantiationService.createInstance(B.ThemeService),this._instantiationService.setService(k.IThemeService,this._themeService),this._characterJoinerService=this._instantiationService.createInstance(p.CharacterJoinerService),this._instantiationService.setService(k.ICharacterJoinerService,this._characterJoinerService),this._renderService=this.register(this._instantiationService.createInstance(E.RenderService,this.rows,this.screenElement)),this._instantiationService.setService(k.IRenderService,this._renderService),this.register(this._renderService.onRenderedViewportChange(z=>this._onRender.fire(z))),this.onResize(z=>this._renderService.resize(z.cols,z.rows)),this._compositionView=Q.createElement("div"),this._compositionView.classList.add("composition-view"),this._compositionHelper=this._instantiationService.createInstance(l.CompositionHelper,this.textarea,this._compositionView),this._helperContainer.appendChild(this._compositionView),this.element.appendChild(W);try{this._onWillOpen.fire(this.element)}catch{}this._renderService.hasRenderer()||this._renderService.setRenderer(this._createRenderer()),this._mouseService=this._instantiationService.createInstance(x.MouseService),this._instantiationService.setService(k.IMouseService,this._mouseService),this.viewport=this._instantiationService.createInstance(w.Viewport,this._viewportElement,this._viewportScrollArea),this.viewport.onRequestScrollLines(z=>this.scrollLines(z.amount,z.suppressScrollEvent,1)),this.register(this._inputHandler.onRequestSyncScrollBar(()=>this.viewport.syncScrollArea())),this.register(this.viewport),this.register(this.onCursorMove(()=>{this._renderService.handleCursorMove(),this._syncTextArea()})),this.register(this.onResize(()=>this._renderService.handleResize(this.cols,this.rows))),this.register(this.onBlur(()=>this._renderService.handleBlur())),this.register(this.onFocus(()=>this._renderService.handleFocus())),this.register(this._renderService.onDimensionsChange(()=>this.viewport.syncScrollArea())),this._selectionService=this.register(this._instantiationService.createInstance(v.SelectionService,this.element,this.screenElement,this.linkifier2)),this._instantiationService.setService(k.ISelectionService,this._selectionService),this.register(this._selectionService.onRequestScrollLines(z=>this.scrollLines(z.amount,z.suppressScrollEvent))),this.register(this._selectionService.onSelectionChange(()=>this._onSelectionChange.fire())),this.register(this._selectionService.onRequestRedraw(z=>this._renderService.handleSelectionChanged(z.start,z.end,z.columnSelectMode))),this.register(this._selectionService.onLinuxMouseSelection(z=>{this.textarea.value=z,this.textarea.focus(),this.textarea.select()})),this.register(this._onScroll.event(z=>{this.viewport.syncScrollArea(),this._selectionService.refresh()})),this.register((0,y.addDisposableDomListener)(this._viewportElement,"scroll",()=>this._selectionService.refresh())),this.linkifier2.attachToDom(this.screenElement,this._mouseService,this._renderService),this.register(this._instantiationService.createInstance(C.BufferDecorationRenderer,this.screenElement)),this.register((0,y.addDisposableDomListener)(this.element,"mousedown",z=>this._selectionService.handleMouseDown(z))),this.coreMouseService.areMouseEventsActive?(this._selectionService.disable(),this.element.classList.add("enable-mouse-events")):this._selectionService.enable(),this.options.screenReaderMode&&(this._accessibilityManager.value=this._instantiationService.createInstance(q.AccessibilityManager,this)),this.register(this.optionsService.onSpecificOptionChange("screenReaderMode",z=>this._handleScreenReaderModeOptionChange(z))),this.options.overviewRulerWidth&&(this._overviewRulerRenderer=this.register(this._instantiationService.createInstance(a.OverviewRulerRenderer,this._viewportElement,this.screenElement))),this.optionsService.onSpecificOptionChange("overviewRulerWidth",z=>{!this._overviewRulerRenderer&&z&&this._viewportElement&&this.screenElement&&(this._overviewRulerRenderer=this.register(this._instantiationService.createInstance(a.OverviewRulerRenderer,this._viewportElement,this.screenElement)))}),this._charSizeService.measure(),this.refresh(0,this.rows-1),this._initGlobal(),this.bindMouse()}_createRenderer(){return this._instantiationService.createInstance(s.DomRenderer,this.element,this.screenElement,this._viewportElement,this.linkifier2)}bindMouse(){const D=this,j=this.element;function W(G){const oe=D._mouseService.getMouseReportCoords(G,D.screenElement);if(!oe)return!1;let Ee,Oe;switch(G.overrideType||G.type){case"mousemove":Oe=32,G.buttons===void 0?(Ee=3,G.button!==void 0&&(Ee=G.button<3?G.button:3)):Ee=1&G.buttons?0:4&G.buttons?1:2&G.buttons?2:3;break;case"mouseup":Oe=0,Ee=G.button<3?G.button:3;break;case"mousedown":Oe=1,Ee=G.button<3?G.button:3;break;case"wheel":if(D.viewport.getLinesScrolled(G)===0)return!1;Oe=G.deltaY<0?0:1,Ee=4;break;default:return!1}return!(Oe===void 0||Ee===void 0||Ee>4)&&D.coreMouseService.triggerMouseEvent({col:oe.col,row:oe.row,x:oe.x,y:oe.y,button:Ee,action:Oe,ctrl:G.ctrlKey,alt:G.altKey,shift:G.shiftKey})}const z={mouseup:null,wheel:null,mousedrag:null,mousemove:null},Z={mouseup:G=>(W(G),G.buttons||(this._document.removeEventListener("mouseup",z.mouseup),z.mousedrag&&this._document.removeEventListener("mousemove",z.mousedrag)),this.cancel(G)),wheel:G=>(W(G),this.cancel(G,!0)),mousedrag:G=>{G.buttons&&W(G)},mousemove:G=>{G.buttons||W(G)}};this.register(this.coreMouseService.onProtocolChange(G=>{G?(this.optionsService.rawOptions.logLevel==="debug"&&this._logService.debug("Binding to mouse events:",this.coreMouseService.explainEvents(G)),this.element.classList.add("enable-mouse-events"),this._selectionService.disable()):(this._logService.debug("Unbinding from mouse events."),this.element.classList.remove("enable-mouse-events"),this._selectionService.enable()),8&G?z.mousemove||(j.addEventListener("mousemove",Z.mousemove),z.mousemove=Z.mousemove):(j.removeEventListener("mousemove",z.mousemove),z.mousemove=null),16&G?z.wheel||(j.addEventListener("wheel",Z.wheel,{passive:!1}),z.wheel=Z.wheel):(j.removeEventListener("wheel",z.wheel),z.wheel=null),2&G?z.mouseup||(j.addEventListener("mouseup",Z.mouseup),z.mouseup=Z.mouseup):(this._document.removeEventListener("mouseup",z.mouseup),j.removeEventListener("mouseup",z.mouseup),z.mouseup=null),4&G?z.mousedrag||(z.mousedrag=Z.mousedrag):(this._document.removeEventListener("mousemove",z.mousedrag),z.mousedrag=null)})),this.coreMouseService.activeProtocol=this.coreMouseService.activeProtocol,this.register((0,y.addDisposableDomListener)(j,"mousedown",G=>{if(G.preventDefault(),this.focus(),this.coreMouseService.areMouseEventsActive&&!this._selectionService.shouldForceSelection(G))return W(G),z.mouseup&&this._document.addEventListener("mouseup",z.mouseup),z.mousedrag&&this._document.addEventListener("mousemove",z.mousedrag),this.cancel(G)})),this.register((0,y.addDisposableDomListener)(j,"wheel",G=>{if(!z.wheel){if(!this.buffer.hasScrollback){const oe=this.viewport.getLinesScrolled(G);if(oe===0)return;const Ee=O.C0.ESC+(this.coreService.decPrivateModes.applicationCursorKeys?"O":"[")+(G.deltaY<0?"A":"B");let Oe="";for(let jt=0;jt<Math.abs(oe);jt++)Oe+=Ee;return this.coreService.triggerDataEvent(Oe,!0),this.cancel(G,!0)}return this.viewport.handleWheel(G)?this.cancel(G):void 0}},{passive:!1})),this.register((0,y.addDisposableDomListener)(j,"touchstart",G=>{if(!this.coreMouseService.areMouseEventsActive)return this.viewport.handleTouchStart(G),this.cancel(G)},{passive:!0})),this.register((0,y.addDisposableDomListener)(j,"touchmove",G=>{if(!this.coreMouseService.areMouseEventsActive)return this.viewport.handleTouchMove(G)?void 0:this.cancel(G)},{passive:!1}))}refresh(D,j){var W;(W=this._renderService)===null||W===void 0||W.refreshRows(D,j)}updateCursorStyle(D){var j;!((j=this._selectionService)===null||j===void 0)&&j.shouldColumnSelect(D)?this.element.classList.add("column-select"):this.element.classList.remove("column-select")}_showCursor(){this.coreService.isCursorInitialized||(this.coreService.isCursorInitialized=!0,this.refresh(this.buffer.y,this.buffer.y))}scrollLines(D,j,W=0){var z;W===1?(super.scrollLines(D,j,W),this.refresh(0,this.rows-1)):(z=this.viewport)===null||z===void 0||z.scrollLines(D)}paste(D){(0,d.paste)(D,this.textarea,this.coreService,this.optionsService)}attachCustomKeyEventHandler(D){this._customKeyEventHandler=D}registerLinkProvider(D){return this.linkifier2.registerLinkProvider(D)}registerCharacterJoiner(D){if(!this._characterJoinerService)throw new Error("Terminal must be opened first");const j=this._characterJoinerService.register(D);return this.refresh(0,this.rows-1),j}deregisterCharacterJoiner(D){if(!this._characterJoinerService)throw new Error("Terminal must be opened first");this._characterJoinerService.deregister(D)&&this.refresh(0,this.rows-1)}get markers(){return this.buffer.markers}registerMarker(D){return this.buffer.addMarker(this.buffer.ybase+this.buffer.y+D)}registerDecoration(D){return this._decorationService.registerDecoration(D)}hasSelection(){return!!this._selectionService&&this._selectionService.hasSelection}select(D,j,W){this._selectionService.setSelection(D,j,W)}getSelection(){return this._selectionService?this._selectionService.selectionText:""}getSelectionPosition(){if(this._selectionService&&this._selectionService.hasSelection)return{start:{x:this._selectionService.selectionStart[0],y:this._selectionService.selectionStart[1]},end:{x:this._selectionService.selectionEnd[0],y:this._selectionService.selectionEnd[1]}}}clearSelection(){var D;(D=this._selectionService)===null||D===void 0||D.clearSelection()}selectAll(){var D;(D=this._selectionService)===null||D===void 0||D.selectAll()}selectLines(D,j){var W;(W=this._selectionService)===null||W===void 0||W.selectLines(D,j)}_keyDown(D){if(this._keyDownHandled=!1,this._keyDownSeen=!0,this._customKeyEventHandler&&this._customKeyEventHandler(D)===!1)return!1;const j=this.browser.isMac&&this.options.macOptionIsMeta&&D.altKey;if(!j&&!this._compositionHelper.keydown(D))return this.options.scrollOnUserInput&&this.buffer.ybase!==this.buffer.ydisp&&this.scrollToBottom(),!1;j||D.key!=="Dead"&&D.key!=="AltGraph"||(this._unprocessedDeadKey=!0);const W=(0,b.evaluateKeyboardEvent)(D,this.coreService.decPrivateModes.applicationCursorKeys,this.browser.isMac,this.options.macOptionIsMeta);if(this.updateCursorStyle(D),W.type===3||W.type===2){const z=this.rows-1;return this.scrollLines(W.type===2?-z:z),this.cancel(D,!0)}return W.type===1&&this.selectAll(),!!this._isThirdLevelShift(this.browser,D)||(W.cancel&&this.cancel(D,!0),!W.key||!!(D.key&&!D.ctrlKey&&!D.altKey&&!D.metaKey&&D.key.length===1&&D.key.charCodeAt(0)>=65&&D.key.charCodeAt(0)<=90)||(this._unprocessedDeadKey?(this._unprocessedDeadKey=!1,!0):(W.key!==O.C0.ETX&&W.key!==O.C0.CR||(this.textarea.value=""),this._onKey.fire({key:W.key,domEvent:D}),this._showCursor(),this.coreService.triggerDataEvent(W.key,!0),!this.optionsService.rawOptions.screenReaderMode||D.altKey||D.ctrlKey?this.cancel(D,!0):void(this._keyDownHandled=!0))))}_isThirdLevelShift(D,j){const W=D.isMac&&!this.options.macOptionIsMeta&&j.altKey&&!j.ctrlKey&&!j.metaKey||D.isWindows&&j.altKey&&j.ctrlKey&&!j.metaKey||D.isWindows&&j.getModifierState("AltGraph");return j.type==="keypress"?W:W&&(!j.keyCode||j.keyCode>47)}_keyUp(D){this._keyDownSeen=!1,this._customKeyEventHandler&&this._customKeyEventHandler(D)===!1||(function(j){return j.keyCode===16||j.keyCode===17||j.keyCode===18}(D)||this.focus(),this.updateCursorStyle(D),this._keyPressHandled=!1)}_keyPress(D){let j;if(this._keyPressHandled=!1,this._keyDownHandled||this._customKeyEventHandler&&this._customKeyEventHandler(D)===!1)return!1;if(this.cancel(D),D.charCode)j=D.charCode;else if(D.which===null||D.which===void 0)j=D.keyCode;else{if(D.which===0||D.charCode===0)return!1;j=D.which}return!(!j||(D.altKey||D.ctrlKey||D.metaKey)&&!this._isThirdLevelShift(this.browser,D)||(j=String.fromCharCode(j),this._onKey.fire({key:j,domEvent:D}),this._showCursor(),this.coreService.triggerDataEvent(j,!0),this._keyPressHandled=!0,this._unprocessedDeadKey=!1,0))}_inputEvent(D){if(D.data&&D.inputType==="insertText"&&(!D.composed||!this._keyDownSeen)&&!this.optionsService.rawOptions.screenReaderMode){if(this._keyPressHandled)return!1;this._unprocessedDeadKey=!1;const j=D.data;return this.coreService.triggerDataEvent(j,!0),this.cancel(D),!0}return!1}resize(D,j){D!==this.cols||j!==this.rows?super.resize(D,j):this._charSizeService&&!this._charSizeService.hasValidSize&&this._charSizeService.measure()}_afterResize(D,j){var W,z;(W=this._charSizeService)===null||W===void 0||W.measure(),(z=this.viewport)===null||z===void 0||z.syncScrollArea(!0)}clear(){var D;if(this.buffer.ybase!==0||this.buffer.y!==0){this.buffer.clearAllMarkers(),this.buffer.lines.set(0,this.buffer.lines.get(this.buffer.ybase+this.buffer.y)),this.buffer.lines.length=1,this.buffer.ydisp=0,this.buffer.ybase=0,this.buffer.y=0;for(let j=1;j<this.rows;j++)this.buffer.lines.push(this.buffer.getBlankLine(U.DEFAULT_ATTR_DATA));this._onScroll.fire({position:this.buffer.ydisp,source:0}),(D=this.viewport)===null||D===void 0||D.reset(),this.refresh(0,this.rows-1)}}reset(){var D,j;this.options.rows=this.rows,this.options.cols=this.cols;const W=this._customKeyEventHandler;this._setup(),super.reset(),(D=this._selectionService)===null||D===void 0||D.reset(),this._decorationService.reset(),(j=this.viewport)===null||j===void 0||j.reset(),this._customKeyEventHandler=W,this.refresh(0,this.rows-1)}clearTextureAtlas(){var D;(D=this._renderService)===null||D===void 0||D.clearTextureAtlas()}_reportFocus(){var D;!((D=this.element)===null||D===void 0)&&D.classList.contains("focus")?this.coreService.triggerDataEvent(O.C0.ESC+"[I"):this.coreService.triggerDataEvent(O.C0.ESC+"[O")}_reportWindowsOptions(D){if(this._renderService)switch(D){case F.WindowsOptionsReportType.GET_WIN_SIZE_PIXELS:const j=this._renderService.dimensions.css.canvas.width.toFixed(0),W=this._renderService.dimensions.css.canvas.height.toFixed(0);this.coreService.triggerDataEvent(`${O.C0.ESC}[4;${W};${j}t`);break;case F.WindowsOptionsReportType.GET_CELL_SIZE_PIXELS:const z=this._renderService.dimensions.css.cell.width.toFixed(0),Z=this._renderService.dimensions.css.cell.height.toFixed(0);this.coreService.triggerDataEvent(`${O.C0.ESC}[6;${Z};${z}t`)}}cancel(D,j){if(this.options.cancelEvents||j)return D.preventDefault(),D.stopPropagation(),!1}}n.Terminal=Y},9924:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.TimeBasedDebouncer=void 0,n.TimeBasedDebouncer=class{constructor(u,d=1e3){this._renderCallback=u,this._debounceThresholdMS=d,this._lastRefreshMs=0,this._additionalRefreshRequested=!1}dispose(){this._refreshTimeoutID&&clearTimeout(this._refreshTimeoutID)}refresh(u,d,y){this._rowCount=y,u=u!==void 0?u:0,d=d!==void 0?d:this._rowCount-1,this._rowStart=this._rowStart!==void 0?Math.min(this._rowStart,u):u,this._rowEnd=this._rowEnd!==void 0?Math.max(this._rowEnd,d):d;const h=Date.now();if(h-this._lastRefreshMs>=this._debounceThresholdMS)this._lastRefreshMs=h,this._innerRefresh();else if(!this._additionalRefreshRequested){const _=h-this._lastRefreshMs,S=this._debounceThresholdMS-_;this._additionalRefreshRequested=!0,this._refreshTimeoutID=window.setTimeout(()=>{this._lastRefreshMs=Date.now(),this._innerRefresh(),this._additionalRefreshRequested=!1,this._refreshTimeoutID=void 0},S)}}_innerRefresh(){if(this._rowStart===void 0||this._rowEnd===void 0||this._rowCount===void 0)return;const u=Math.max(this._rowStart,0),d=Math.min(this._rowEnd,this._rowCount-1);this._rowStart=void 0,this._rowEnd=void 0,this._renderCallback(u,d)}}},1680:function(g,n,u){var d=this&&this.__decorate||function(l,s,o,p){var m,x=arguments.length,E=x<3?s:p===null?p=Object.getOwnPropertyDescriptor(s,o):p;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")E=Reflect.decorate(l,s,o,p);else for(var v=l.length-1;v>=0;v--)(m=l[v])&&(E=(x<3?m(E):x>3?m(s,o,E):m(s,o))||E);return x>3&&E&&Object.defineProperty(s,o,E),E},y=this&&this.__param||function(l,s){return function(o,p){s(o,p,l)}};Object.defineProperty(n,"__esModule",{value:!0}),n.Viewport=void 0;const h=u(3656),_=u(4725),S=u(8460),w=u(844),C=u(2585);let a=n.Viewport=class extends w.Disposable{constructor(l,s,o,p,m,x,E,v){super(),this._viewportElement=l,this._scrollArea=s,this._bufferService=o,this._optionsService=p,this._charSizeService=m,this._renderService=x,this._coreBrowserService=E,this.scrollBarWidth=0,this._currentRowHeight=0,this._currentDeviceCellHeight=0,this._lastRecordedBufferLength=0,this._lastRecordedViewportHeight=0,this._lastRecordedBufferHeight=0,this._lastTouchY=0,this._lastScrollTop=0,this._wheelPartialScroll=0,this._refreshAnimationFrame=null,this._ignoreNextScrollEvent=!1,this._smoothScrollState={startTime:0,origin:-1,target:-1},this._onRequestScrollLines=this.register(new S.EventEmitter),this.onRequestScrollLines=this._onRequestScrollLines.event,this.scrollBarWidth=this._viewportElement.offsetWidth-this._scrollArea.offsetWidth||15,this.register((0,h.addDisposableDomListener)(this._viewportElement,"scroll",this._handleScroll.bind(this))),this._activeBuffer=this._bufferService.buffer,this.register(this._bufferService.buffers.onBufferActivate(k=>this._activeBuffer=k.activeBuffer)),this._renderDimensions=this._renderService.dimensions,this.register(this._renderService.onDimensionsChange(k=>this._renderDimensions=k)),this._handleThemeChange(v.colors),this.register(v.onChangeColors(k=>this._handleThemeChange(k))),this.register(this._optionsService.onSpecificOptionChange("scrollback",()=>this.syncScrollArea())),setTimeout(()=>this.syncScrollArea())}_handleThemeChange(l){this._viewportElement.style.backgroundColor=l.background.css}reset(){this._currentRowHeight=0,this._currentDeviceCellHeight=0,this._lastRecordedBufferLength=0,this._lastRecordedViewportHeight=0,this._lastRecordedBufferHeight=0,this._lastTouchY=0,this._lastScrollTop=0,this._coreBrowserService.window.requestAnimationFrame(()=>this.syncScrollArea())}_refresh(l){if(l)return this._innerRefresh(),void(this._refreshAnimationFrame!==null&&this._coreBrowserService.window.cancelAnimationFrame(this._refreshAnimationFrame));this._refreshAnimationFrame===null&&(this._refreshAnimationFrame=this._coreBrowserService.window.requestAnimationFrame(()=>this._innerRefresh()))}_innerRefresh(){if(this._charSizeService.height>0){this._currentRowHeight=this._renderService.dimensions.device.cell.height/this._coreBrowserService.dpr,this._currentDeviceCellHeight=this._renderService.dimensions.device.cell.height,this._lastRecordedViewportHeight=this._viewportElement.offsetHeight;const s=Math.round(this._currentRowHeight*this._lastRecordedBufferLength)+(this._lastRecordedViewportHeight-this._renderService.dimensions.css.canvas.height);this._lastRecordedBufferHeight!==s&&(this._lastRecordedBufferHeight=s,this._scrollArea.style.height=this._lastRecordedBufferHeight+"px")}const l=this._bufferService.buffer.ydisp*this._currentRowHeight;this._viewportElement.scrollTop!==l&&(this._ignoreNextScrollEvent=!0,this._viewportElement.scrollTop=l),this._refreshAnimationFrame=null}syncScrollArea(l=!1){if(this._lastRecordedBufferLength!==this._bufferService.buffer.lines.length)return this._lastRecordedBufferLength=this._bufferService.buffer.lines.length,void this._refresh(l);this._lastRecordedViewportHeight===this._renderService.dimensions.css.canvas.height&&this._lastScrollTop===this._activeBuffer.ydisp*this._currentRowHeight&&this._renderDimensions.device.cell.height===this._currentDeviceCellHeight||this._refresh(l)}_handleScroll(l){if(this._lastScrollTop=this._viewportElement.scrollTop,!this._viewportElement.offsetParent)return;if(this._ignoreNextScrollEvent)return this._ignoreNextScrollEvent=!1,void this._onRequestScrollLines.fire({amount:0,suppressScrollEvent:!0});const s=Math.round(this._lastScrollTop/this._currentRowHeight)-this._bufferService.buffer.ydisp;this._onRequestScrollLines.fire({amount:s,suppressScrollEvent:!0})}_smoothScroll(){if(this._isDisposed||this._smoothScrollState.origin===-1||this._smoothScrollState.target===-1)return;const l=this._smoothScrollPercent();this._viewportElement.scrollTop=this._smoothScrollState.origin+Math.round(l*(this._smoothScrollState.target-this._smoothScrollState.origin)),l<1?this._coreBrowserService.window.requestAnimationFrame(()=>this._smoothScroll()):this._clearSmoothScrollState()}_smoothScrollPercent(){return this._optionsService.rawOptions.smoothScrollDuration&&this._smoothScrollState.startTime?Math.max(Math.min((Date.now()-this._smoothScrollState.startTime)/this._optionsService.rawOptions.smoothScrollDuration,1),0):1}_clearSmoothScrollState(){this._smoothScrollState.startTime=0,this._smoothScrollState.origin=-1,this._smoothScrollState.target=-1}_bubbleScroll(l,s){const o=this._viewportElement.scrollTop+this._lastRecordedViewportHeight;return!(s<0&&this._viewportElement.scrollTop!==0||s>0&&o<this._lastRecordedBufferHeight)||(l.cancelable&&l.preventDefault(),!1)}handleWheel(l){const s=this._getPixelsScrolled(l);return s!==0&&(this._optionsService.rawOptions.smoothScrollDuration?(this._smoothScrollState.startTime=Date.now(),this._smoothScrollPercent()<1?(this._smoothScrollState.origin=this._viewportElement.scrollTop,this._smoothScrollState.target===-1?this._smoothScrollState.target=this._viewportElement.scrollTop+s:this._smoothScrollState.target+=s,this._smoothScrollState.target=Math.max(Math.min(this._smoothScrollState.target,this._viewportElement.scrollHeight),0),this._smoothScroll()):this._clearSmoothScrollState()):this._viewportElement.scrollTop+=s,this._bubbleScroll(l,s))}scrollLines(l){if(l!==0)if(this._optionsService.rawOptions.smoothScrollDuration){const s=l*this._currentRowHeight;this._smoothScrollState.startTime=Date.now(),this._smoothScrollPercent()<1?(this._smoothScrollState.origin=this._viewportElement.scrollTop,this._smoothScrollState.target=this._smoothScrollState.origin+s,this._smoothScrollState.target=Math.max(Math.min(this._smoothScrollState.target,this._viewportElement.scrollHeight),0),this._smoothScroll()):this._clearSmoothScrollState()}else this._onRequestScrollLines.fire({amount:l,suppressScrollEvent:!1})}_getPixelsScrolled(l){if(l.deltaY===0||l.shiftKey)return 0;let s=this._applyScrollModifier(l.deltaY,l);return l.deltaMode===WheelEvent.DOM_DELTA_LINE?s*=this._currentRowHeight:l.deltaMode===WheelEvent.DOM_DELTA_PAGE&&(s*=this._currentRowHeight*this._bufferService.rows),s}getBufferElements(l,s){var o;let p,m="";const x=[],E=s??this._bufferService.buffer.lines.length,v=this._bufferService.buffer.lines;for(let k=l;k<E;k++){const B=v.get(k);if(!B)continue;const M=(o=v.get(k+1))===null||o===void 0?void 0:o.isWrapped;if(m+=B.translateToString(!M),!M||k===v.length-1){const T=document.createElement("div");T.textContent=m,x.push(T),m.length>0&&(p=T),m=""}}return{bufferElements:x,cursorElement:p}}getLinesScrolled(l){if(l.deltaY===0||l.shiftKey)return 0;let s=this._applyScrollModifier(l.deltaY,l);return l.deltaMode===WheelEvent.DOM_DELTA_PIXEL?(s/=this._currentRowHeight+0,this._wheelPartialScroll+=s,s=Math.floor(Math.abs(this._wheelPartialScroll))*(this._wheelPartialScroll>0?1:-1),this._wheelPartialScroll%=1):l.deltaMode===WheelEvent.DOM_DELTA_PAGE&&(s*=this._bufferService.rows),s}_applyScrollModifier(l,s){const o=this._optionsService.rawOptions.fastScrollModifier;return o==="alt"&&s.altKey||o==="ctrl"&&s.ctrlKey||o==="shift"&&s.shiftKey?l*this._optionsService.rawOptions.fastScrollSensitivity*this._optionsService.rawOptions.scrollSensitivity:l*this._optionsService.rawOptions.scrollSensitivity}handleTouchStart(l){this._lastTouchY=l.touches[0].pageY}handleTouchMove(l){const s=this._lastTouchY-l.touches[0].pageY;return this._lastTouchY=l.touches[0].pageY,s!==0&&(this._viewportElement.scrollTop+=s,this._bubbleScroll(l,s))}};n.Viewport=a=d([y(2,C.IBufferService),y(3,C.IOptionsService),y(4,_.ICharSizeService),y(5,_.IRenderService),y(6,_.ICoreBrowserService),y(7,_.IThemeService)],a)},3107:function(g,n,u){var d=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.BufferDecorationRenderer=void 0;const h=u(3656),_=u(4725),S=u(844),w=u(2585);let C=n.BufferDecorationRenderer=class extends S.Disposable{constructor(a,l,s,o){super(),this._screenElement=a,this._bufferService=l,this._decorationService=s,this._renderService=o,this._decorationElements=new Map,this._altBufferIsActive=!1,this._dimensionsChanged=!1,this._container=document.createElement("div"),this._container.classList.add("xterm-decoration-container"),this._screenElement.appendChild(this._container),this.register(this._renderService.onRenderedViewportChange(()=>this._doRefreshDecorations())),this.register(this._renderService.onDimensionsChange(()=>{this._dimensionsChanged=!0,this._queueRefresh()})),this.register((0,h.addDisposableDomListener)(window,"resize",()=>this._queueRefresh())),this.register(this._bufferService.buffers.onBufferActivate(()=>{this._altBufferIsActive=this._bufferService.buffer===this._bufferService.buffers.alt})),this.register(this._decorationService.onDecorationRegistered(()=>this._queueRefresh())),this.register(this._decorationService.onDecorationRemoved(p=>this._removeDecoration(p))),this.register((0,S.toDisposable)(()=>{this._container.remove(),this._decorationElements.clear()}))}_queueRefresh(){this._animationFrame===void 0&&(this._animationFrame=this._renderService.addRefreshCallback(()=>{this._doRefreshDecorations(),this._animationFrame=void 0}))}_doRefreshDecorations(){for(const a of this._decorationService.decorations)this._renderDecoration(a);this._dimensionsChanged=!1}_renderDecoration(a){this._refreshStyle(a),this._dimensionsChanged&&this._refreshXPosition(a)}_createElement(a){var l,s;const o=document.createElement("div");o.classList.add("xterm-decoration"),o.classList.toggle("xterm-decoration-top-layer",((l=a==null?void 0:a.options)===null||l===void 0?void 0:l.layer)==="top"),o.style.width=`${Math.round((a.options.width||1)*this._renderService.dimensions.css.cell.width)}px`,o.style.height=(a.options.height||1)*this._renderService.dimensions.css.cell.height+"px",o.style.top=(a.marker.line-this._bufferService.buffers.active.ydisp)*this._renderService.dimensions.css.cell.height+"px",o.style.lineHeight=`${this._renderService.dimensions.css.cell.height}px`;const p=(s=a.options.x)!==null&&s!==void 0?s:0;return p&&p>this._bufferService.cols&&(o.style.display="none"),this._refreshXPosition(a,o),o}_refreshStyle(a){const l=a.marker.line-this._bufferService.buffers.active.ydisp;if(l<0||l>=this._bufferService.rows)a.element&&(a.element.style.display="none",a.onRenderEmitter.fire(a.element));else{let s=this._decorationElements.get(a);s||(s=this._createElement(a),a.element=s,this._decorationElements.set(a,s),this._container.appendChild(s),a.onDispose(()=>{this._decorationElements.delete(a),s.remove()})),s.style.top=l*this._renderService.dimensions.css.cell.height+"px",s.style.display=this._altBufferIsActive?"none":"block",a.onRenderEmitter.fire(s)}}_refreshXPosition(a,l=a.element){var s;if(!l)return;const o=(s=a.options.x)!==null&&s!==void 0?s:0;(a.options.anchor||"left")==="right"?l.style.right=o?o*this._renderService.dimensions.css.cell.width+"px":"":l.style.left=o?o*this._renderService.dimensions.css.cell.width+"px":""}_removeDecoration(a){var l;(l=this._decorationElements.get(a))===null||l===void 0||l.remove(),this._decorationElements.delete(a),a.dispose()}};n.BufferDecorationRenderer=C=d([y(1,w.IBufferService),y(2,w.IDecorationService),y(3,_.IRenderService)],C)},5871:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ColorZoneStore=void 0,n.ColorZoneStore=class{constructor(){this._zones=[],this._zonePool=[],this._zonePoolIndex=0,this._linePadding={full:0,left:0,center:0,right:0}}get zones(){return this._zonePool.length=Math.min(this._zonePool.length,this._zones.length),this._zones}clear(){this._zones.length=0,this._zonePoolIndex=0}addDecoration(u){if(u.options.overviewRulerOptions){for(const d of this._zones)if(d.color===u.options.overviewRulerOptions.color&&d.position===u.options.overviewRulerOptions.position){if(this._lineIntersectsZone(d,u.marker.line))return;if(this._lineAdjacentToZone(d,u.marker.line,u.options.overviewRulerOptions.position))return void this._addLineToZone(d,u.marker.line)}if(this._zonePoolIndex<this._zonePool.length)return this._zonePool[this._zonePoolIndex].color=u.options.overviewRulerOptions.color,this._zonePool[this._zonePoolIndex].position=u.options.overviewRulerOptions.position,this._zonePool[this._zonePoolIndex].startBufferLine=u.marker.line,this._zonePool[this._zonePoolIndex].endBufferLine=u.marker.line,void this._zones.push(this._zonePool[this._zonePoolIndex++]);this._zones.push({color:u.options.overviewRulerOptions.color,position:u.options.overviewRulerOptions.position,startBufferLine:u.marker.line,endBufferLine:u.marker.line}),this._zonePool.push(this._zones[this._zones.length-1]),this._zonePoolIndex++}}setPadding(u){this._linePadding=u}_lineIntersectsZone(u,d){return d>=u.startBufferLine&&d<=u.endBufferLine}_lineAdjacentToZone(u,d,y){return d>=u.startBufferLine-this._linePadding[y||"full"]&&d<=u.endBufferLine+this._linePadding[y||"full"]}_addLineToZone(u,d){u.startBufferLine=Math.min(u.startBufferLine,d),u.endBufferLine=Math.max(u.endBufferLine,d)}}},5744:function(g,n,u){var d=this&&this.__decorate||function(p,m,x,E){var v,k=arguments.length,B=k<3?m:E===null?E=Object.getOwnPropertyDescriptor(m,x):E;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")B=Reflect.decorate(p,m,x,E);else for(var M=p.length-1;M>=0;M--)(v=p[M])&&(B=(k<3?v(B):k>3?v(m,x,B):v(m,x))||B);return k>3&&B&&Object.defineProperty(m,x,B),B},y=this&&this.__param||function(p,m){return function(x,E){m(x,E,p)}};Object.defineProperty(n,"__esModule",{value:!0}),n.OverviewRulerRenderer=void 0;const h=u(5871),_=u(3656),S=u(4725),w=u(844),C=u(2585),a={full:0,left:0,center:0,right:0},l={full:0,left:0,center:0,right:0},s={full:0,left:0,center:0,right:0};let o=n.OverviewRulerRenderer=class extends w.Disposable{get _width(){return this._optionsService.options.overviewRulerWidth||0}constructor(p,m,x,E,v,k,B){var M;super(),this._viewportElement=p,this._screenElement=m,this._bufferService=x,this._decorationService=E,this._renderService=v,this._optionsService=k,this._coreBrowseService=B,this._colorZoneStore=new h.ColorZoneStore,this._shouldUpdateDimensions=!0,this._shouldUpdateAnchor=!0,this._lastKnownBufferLength=0,this._canvas=document.createElement("canvas"),this._canvas.classList.add("xterm-decoration-overview-ruler"),this._refreshCanvasDimensions(),(M=this._viewportElement.parentElement)===null||M===void 0||M.insertBefore(this._canvas,this._viewportElement);const T=this._canvas.getContext("2d");if(!T)throw new Error("Ctx cannot be null");this._ctx=T,this._registerDecorationListeners(),this._registerBufferChangeListeners(),this._registerDimensionChangeListeners(),this.register((0,w.toDisposable)(()=>{var P;(P=this._canvas)===null||P===void 0||P.remove()}))}_registerDecorationListeners(){this.register(this._decorationService.onDecorationRegistered(()=>this._queueRefresh(void 0,!0))),this.register(this._decorationService.onDecorationRemoved(()=>this._queueRefresh(void 0,!0)))}_registerBufferChangeListeners(){this.register(this._renderService.onRenderedViewportChange(()=>this._queueRefresh())),this.register(this._bufferService.buffers.onBufferActivate(()=>{this._canvas.style.display=this._bufferService.buffer===this._bufferService.buffers.alt?"none":"block"})),this.register(this._bufferService.onScroll(()=>{this._lastKnownBufferLength!==this._bufferService.buffers.normal.lines.length&&(this._refreshDrawHeightConstants(),this._refreshColorZonePadding())}))}_registerDimensionChangeListeners(){this.register(this._renderService.onRender(()=>{this._containerHeight&&this._containerHeight===this._screenElement.clientHeight||(this._queueRefresh(!0),this._containerHeight=this._screenElement.clientHeight)})),this.register(this._optionsService.onSpecificOptionChange("overviewRulerWidth",()=>this._queueRefresh(!0))),this.register((0,_.addDisposableDomListener)(this._coreBrowseService.window,"resize",()=>this._queueRefresh(!0))),this._queueRefresh(!0)}_refreshDrawConstants(){const p=Math.floor(this._canvas.width/3),m=Math.ceil(this._canvas.width/3);l.full=this._canvas.width,l.left=p,l.center=m,l.right=p,this._refreshDrawHeightConstants(),s.full=0,s.left=0,s.center=l.left,s.right=l.left+l.center}_refreshDrawHeightConstants(){a.full=Math.round(2*this._coreBrowseService.dpr);const p=this._canvas.height/this._bufferService.buffer.lines.length,m=Math.round(Math.max(Math.min(p,12),6)*this._coreBrowseService.dpr);a.left=m,a.center=m,a.right=m}_refreshColorZonePadding(){this._colorZoneStore.setPadding({full:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.full),left:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.left),center:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.center),right:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.right)}),this._lastKnownBufferLength=this._bufferService.buffers.normal.lines.length}_refreshCanvasDimensions(){this._canvas.style.width=`${this._width}px`,this._canvas.width=Math.round(this._width*this._coreBrowseService.dpr),this._canvas.style.height=`${this._screenElement.clientHeight}px`,this._canvas.height=Math.round(this._screenElement.clientHeight*this._coreBrowseService.dpr),this._refreshDrawConstants(),this._refreshColorZonePadding()}_refreshDecorations(){this._shouldUpdateDimensions&&this._refreshCanvasDimensions(),this._ctx.clearRect(0,0,this._canvas.width,this._canvas.height),this._colorZoneStore.clear();for(const m of this._decorationService.decorations)this._colorZoneStore.addDecoration(m);this._ctx.lineWidth=1;const p=this._colorZoneStore.zones;for(const m of p)m.position!=="full"&&this._renderColorZone(m);for(const m of p)m.position==="full"&&this._renderColorZone(m);this._shouldUpdateDimensions=!1,this._shouldUpdateAnchor=!1}_renderColorZone(p){this._ctx.fillStyle=p.color,this._ctx.fillRect(s[p.position||"full"],Math.round((this._canvas.height-1)*(p.startBufferLine/this._bufferService.buffers.active.lines.length)-a[p.position||"full"]/2),l[p.position||"full"],Math.round((this._canvas.height-1)*((p.endBufferLine-p.startBufferLine)/this._bufferService.buffers.active.lines.length)+a[p.position||"full"]))}_queueRefresh(p,m){this._shouldUpdateDimensions=p||this._shouldUpdateDimensions,this._shouldUpdateAnchor=m||this._shouldUpdateAnchor,this._animationFrame===void 0&&(this._animationFrame=this._coreBrowseService.window.requestAnimationFrame(()=>{this._refreshDecorations(),this._animationFrame=void 0}))}};n.OverviewRulerRenderer=o=d([y(2,C.IBufferService),y(3,C.IDecorationService),y(4,S.IRenderService),y(5,C.IOptionsService),y(6,S.ICoreBrowserService)],o)},2950:function(g,n,u){var d=this&&this.__decorate||function(C,a,l,s){var o,p=arguments.length,m=p<3?a:s===null?s=Object.getOwnPropertyDescriptor(a,l):s;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")m=Reflect.decorate(C,a,l,s);else for(var x=C.length-1;x>=0;x--)(o=C[x])&&(m=(p<3?o(m):p>3?o(a,l,m):o(a,l))||m);return p>3&&m&&Object.defineProperty(a,l,m),m},y=this&&this.__param||function(C,a){return function(l,s){a(l,s,C)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CompositionHelper=void 0;const h=u(4725),_=u(2585),S=u(2584);let w=n.CompositionHelper=class{get isComposing(){return this._isComposing}constructor(C,a,l,s,o,p){this._textarea=C,this._compositionView=a,this._bufferService=l,this._optionsService=s,this._coreService=o,this._renderService=p,this._isComposing=!1,this._isSendingComposition=!1,this._compositionPosition={start:0,end:0},this._dataAlreadySent=""}compositionstart(){this._isComposing=!0,this._compositionPosition.start=this._textarea.value.length,this._compositionView.textContent="",this._dataAlreadySent="",this._compositionView.classList.add("active")}compositionupdate(C){this._compositionView.textContent=C.data,this.updateCompositionElements(),setTimeout(()=>{this._compositionPosition.end=this._textarea.value.length},0)}compositionend(){this._finalizeComposition(!0)}keydown(C){if(this._isComposing||this._isSendingComposition){if(C.keyCode===229||C.keyCode===16||C.keyCode===17||C.keyCode===18)return!1;this._finalizeComposition(!1)}return C.keyCode!==229||(this._handleAnyTextareaChanges(),!1)}_finalizeComposition(C){if(this._compositionView.classList.remove("active"),this._isComposing=!1,C){const a={start:this._compositionPosition.start,end:this._compositionPosition.end};this._isSendingComposition=!0,setTimeout(()=>{if(this._isSendingComposition){let l;this._isSendingComposition=!1,a.start+=this._dataAlreadySent.length,l=this._isComposing?this._textarea.value.substring(a.start,a.end):this._textarea.value.substring(a.start),l.length>0&&this._coreService.triggerDataEvent(l,!0)}},0)}else{this._isSendingComposition=!1;const a=this._textarea.value.substring(this._compositionPosition.start,this._compositionPosition.end);this._coreService.triggerDataEvent(a,!0)}}_handleAnyTextareaChanges(){const C=this._textarea.value;setTimeout(()=>{if(!this._isComposing){const a=this._textarea.value,l=a.replace(C,"");this._dataAlreadySent=l,a.length>C.length?this._coreService.triggerDataEvent(l,!0):a.length<C.length?this._coreService.triggerDataEvent(`${S.C0.DEL}`,!0):a.length===C.length&&a!==C&&this._coreService.triggerDataEvent(a,!0)}},0)}updateCompositionElements(C){if(this._isComposing){if(this._bufferService.buffer.isCursorInViewport){const a=Math.min(this._bufferService.buffer.x,this._bufferService.cols-1),l=this._renderService.dimensions.css.cell.height,s=this._bufferService.buffer.y*this._renderService.dimensions.css.cell.height,o=a*this._renderService.dimensions.css.cell.width;this._compositionView.style.left=o+"px",this._compositionView.style.top=s+"px",this._compositionView.style.height=l+"px",this._compositionView.style.lineHeight=l+"px",this._compositionView.style.fontFamily=this._optionsService.rawOptions.fontFamily,this._compositionView.style.fontSize=this._optionsService.rawOptions.fontSize+"px";const p=this._compositionView.getBoundingClientRect();this._textarea.style.left=o+"px",this._textarea.style.top=s+"px",this._textarea.style.width=Math.max(p.width,1)+"px",this._textarea.style.height=Math.max(p.height,1)+"px",this._textarea.style.lineHeight=p.height+"px"}C||setTimeout(()=>this.updateCompositionElements(!0),0)}}};n.CompositionHelper=w=d([y(2,_.IBufferService),y(3,_.IOptionsService),y(4,_.ICoreService),y(5,h.IRenderService)],w)},9806:(g,n)=>{function u(d,y,h){const _=h.getBoundingClientRect(),S=d.getComputedStyle(h),w=parseInt(S.getPropertyValue("padding-left")),C=parseInt(S.getPropertyValue("padding-top"));return[y.clientX-_.left-w,y.clientY-_.top-C]}Object.defineProperty(n,"__esModule",{value:!0}),n.getCoords=n.getCoordsRelativeToElement=void 0,n.getCoordsRelativeToElement=u,n.getCoords=function(d,y,h,_,S,w,C,a,l){if(!w)return;const s=u(d,y,h);return s?(s[0]=Math.ceil((s[0]+(l?C/2:0))/C),s[1]=Math.ceil(s[1]/a),s[0]=Math.min(Math.max(s[0],1),_+(l?1:0)),s[1]=Math.min(Math.max(s[1],1),S),s):void 0}},9504:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.moveToCellSequence=void 0;const d=u(2584);function y(a,l,s,o){const p=a-h(a,s),m=l-h(l,s),x=Math.abs(p-m)-function(E,v,k){let B=0;const M=E-h(E,k),T=v-h(v,k);for(let P=0;P<Math.abs(M-T);P++){const H=_(E,v)==="A"?-1:1,N=k.buffer.lines.get(M+H*P);N!=null&&N.isWrapped&&B++}return B}(a,l,s);return C(x,w(_(a,l),o))}function h(a,l){let s=0,o=l.buffer.lines.get(a),p=o==null?void 0:o.isWrapped;for(;p&&a>=0&&a<l.rows;)s++,o=l.buffer.lines.get(--a),p=o==null?void 0:o.isWrapped;return s}function _(a,l){return a>l?"A":"B"}function S(a,l,s,o,p,m){let x=a,E=l,v="";for(;x!==s||E!==o;)x+=p?1:-1,p&&x>m.cols-1?(v+=m.buffer.translateBufferLineToString(E,!1,a,x),x=0,a=0,E++):!p&&x<0&&(v+=m.buffer.translateBufferLineToString(E,!1,0,a+1),x=m.cols-1,a=x,E--);return v+m.buffer.translateBufferLineToString(E,!1,a,x)}function w(a,l){const s=l?"O":"[";return d.C0.ESC+s+a}function C(a,l){a=Math.floor(a);let s="";for(let o=0;o<a;o++)s+=l;return s}n.moveToCellSequence=function(a,l,s,o){const p=s.buffer.x,m=s.buffer.y;if(!s.buffer.hasScrollback)return function(v,k,B,M,T,P){return y(k,M,T,P).length===0?"":C(S(v,k,v,k-h(k,T),!1,T).length,w("D",P))}(p,m,0,l,s,o)+y(m,l,s,o)+function(v,k,B,M,T,P){let H;H=y(k,M,T,P).length>0?M-h(M,T):k;const N=M,U=function(O,b,R,A,I,F){let q;return q=y(R,A,I,F).length>0?A-h(A,I):b,O<R&&q<=A||O>=R&&q<A?"C":"D"}(v,k,B,M,T,P);return C(S(v,H,B,N,U==="C",T).length,w(U,P))}(p,m,a,l,s,o);let x;if(m===l)return x=p>a?"D":"C",C(Math.abs(p-a),w(x,o));x=m>l?"D":"C";const E=Math.abs(m-l);return C(function(v,k){return k.cols-v}(m>l?a:p,s)+(E-1)*s.cols+1+((m>l?p:a)-1),w(x,o))}},1296:function(g,n,u){var d=this&&this.__decorate||function(T,P,H,N){var U,O=arguments.length,b=O<3?P:N===null?N=Object.getOwnPropertyDescriptor(P,H):N;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")b=Reflect.decorate(T,P,H,N);else for(var R=T.length-1;R>=0;R--)(U=T[R])&&(b=(O<3?U(b):O>3?U(P,H,b):U(P,H))||b);return O>3&&b&&Object.defineProperty(P,H,b),b},y=this&&this.__param||function(T,P){return function(H,N){P(H,N,T)}};Object.defineProperty(n,"__esModule",{value:!0}),n.DomRenderer=void 0;const h=u(3787),_=u(2550),S=u(2223),w=u(6171),C=u(4725),a=u(8055),l=u(8460),s=u(844),o=u(2585),p="xterm-dom-renderer-owner-",m="xterm-rows",x="xterm-fg-",E="xterm-bg-",v="xterm-focus",k="xterm-selection";let B=1,M=n.DomRenderer=class extends s.Disposable{constructor(T,P,H,N,U,O,b,R,A,I){super(),this._element=T,this._screenElement=P,this._viewportElement=H,this._linkifier2=N,this._charSizeService=O,this._optionsService=b,this._bufferService=R,this._coreBrowserService=A,this._themeService=I,this._terminalClass=B++,this._rowElements=[],this.onRequestRedraw=this.register(new l.EventEmitter).event,this._rowContainer=document.createElement("div"),this._rowContainer.classList.add(m),this._rowContainer.style.lineHeight="normal",this._rowContainer.setAttribute("aria-hidden","true"),this._refreshRowElements(this._bufferService.cols,this._bufferService.rows),this._selectionContainer=document.createElement("div"),this._selectionContainer.classList.add(k),this._selectionContainer.setAttribute("aria-hidden","true"),this.dimensions=(0,w.createRenderDimensions)(),this._updateDimensions(),this.register(this._optionsService.onOptionChange(()=>this._handleOptionsChanged())),this.register(this._themeService.onChangeColors(F=>this._injectCss(F))),this._injectCss(this._themeService.colors),this._rowFactory=U.createInstance(h.DomRendererRowFactory,document),this._element.classList.add(p+this._terminalClass),this._screenElement.appendChild(this._rowContainer),this._screenElement.appendChild(this._selectionContainer),this.register(this._linkifier2.onShowLinkUnderline(F=>this._handleLinkHover(F))),this.register(this._linkifier2.onHideLinkUnderline(F=>this._handleLinkLeave(F))),this.register((0,s.toDisposable)(()=>{this._element.classList.remove(p+this._terminalClass),this._rowContainer.remove(),this._selectionContainer.remove(),this._widthCache.dispose(),this._themeStyleElement.remove(),this._dimensionsStyleElement.remove()})),this._widthCache=new _.WidthCache(document),this._widthCache.setFont(this._optionsService.rawOptions.fontFamily,this._optionsService.rawOptions.fontSize,this._optionsService.rawOptions.fontWeight,this._optionsService.rawOptions.fontWeightBold),this._setDefaultSpacing()}_updateDimensions(){const T=this._coreBrowserService.dpr;this.dimensions.device.char.width=this._charSizeService.width*T,this.dimensions.device.char.height=Math.ceil(this._charSizeService.height*T),this.dimensions.device.cell.width=this.dimensions.device.char.width+Math.round(this._optionsService.rawOptions.letterSpacing),this.dimensions.device.cell.height=Math.floor(this.dimensions.device.char.height*this._optionsService.rawOptions.lineHeight),this.dimensions.device.char.left=0,this.dimensions.device.char.top=0,this.dimensions.device.canvas.width=this.dimensions.device.cell.width*this._bufferService.cols,this.dimensions.device.canvas.height=this.dimensions.device.cell.height*this._bufferService.rows,this.dimensions.css.canvas.width=Math.round(this.dimensions.device.canvas.width/T),this.dimensions.css.canvas.height=Math.round(this.dimensions.device.canvas.height/T),this.dimensions.css.cell.width=this.dimensions.css.canvas.width/this._bufferService.cols,this.dimensions.css.cell.height=this.dimensions.css.canvas.height/this._bufferService.rows;for(const H of this._rowElements)H.style.width=`${this.dimensions.css.canvas.width}px`,H.style.height=`${this.dimensions.css.cell.height}px`,H.style.lineHeight=`${this.dimensions.css.cell.height}px`,H.style.overflow="hidden";this._dimensionsStyleElement||(this._dimensionsStyleElement=document.createElement("style"),this._screenElement.appendChild(this._dimensionsStyleElement));const P=`${this._terminalSelector} .${m} span { display: inline-block; height: 100%; vertical-align: top;}`;this._dimensionsStyleElement.textContent=P,this._selectionContainer.style.height=this._viewportElement.style.height,this._screenElement.style.width=`${this.dimensions.css.canvas.width}px`,this._screenElement.style.height=`${this.dimensions.css.canvas.height}px`}_injectCss(T){this._themeStyleElement||(this._themeStyleElement=document.createElement("style"),this._screenElement.appendChild(this._themeStyleElement));let P=`${this._terminalSelector} .${m} { color: ${T.foreground.css}; font-family: ${this._optionsService.rawOptions.fontFamily}; font-size: ${this._optionsService.rawOptions.fontSize}px; font-kerning: none; white-space: pre}`;P+=`${this._terminalSelector} .${m} .xterm-dim { color: ${a.color.multiplyOpacity(T.foreground,.5).css};}`,P+=`${this._terminalSelector} span:not(.xterm-bold) { font-weight: ${this._optionsService.rawOptions.fontWeight};}${this._terminalSelector} span.xterm-bold { font-weight: ${this._optionsService.rawOptions.fontWeightBold};}${this._terminalSelector} span.xterm-italic { font-style: italic;}`,P+="@keyframes blink_box_shadow_"+this._terminalClass+" { 50% {  border-bottom-style: hidden; }}",P+="@keyframes blink_block_"+this._terminalClass+` { 0% {  background-color: ${T.cursor.css};  color: ${T.cursorAccent.css}; } 50% {  background-color: inherit;  color: ${T.cursor.css}; }}`,P+=`${this._terminalSelector} .${m}.${v} .xterm-cursor.xterm-cursor-blink:not(.xterm-cursor-block) { animation: blink_box_shadow_`+this._terminalClass+` 1s step-end infinite;}${this._terminalSelector} .${m}.${v} .xterm-cursor.xterm-cursor-blink.xterm-cursor-block { animation: blink_block_`+this._terminalClass+` 1s step-end infinite;}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-block { background-color: ${T.cursor.css}; color: ${T.cursorAccent.css};}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-outline { outline: 1px solid ${T.cursor.css}; outline-offset: -1px;}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-bar { box-shadow: ${this._optionsService.rawOptions.cursorWidth}px 0 0 ${T.cursor.css} inset;}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-underline { border-bottom: 1px ${T.cursor.css}; border-bottom-style: solid; height: calc(100% - 1px);}`,P+=`${this._terminalSelector} .${k} { position: absolute; top: 0; left: 0; z-index: 1; pointer-events: none;}${this._terminalSelector}.focus .${k} div { position: absolute; background-color: ${T.selectionBackgroundOpaque.css};}${this._terminalSelector} .${k} div { position: absolute; background-color: ${T.selectionInactiveBackgroundOpaque.css};}`;for(const[H,N]of T.ansi.entries())P+=`${this._terminalSelector} .${x}${H} { color: ${N.css}; }${this._terminalSelector} .${x}${H}.xterm-dim { color: ${a.color.multiplyOpacity(N,.5).css}; }${this._terminalSelector} .${E}${H} { background-color: ${N.css}; }`;P+=`${this._terminalSelector} .${x}${S.INVERTED_DEFAULT_COLOR} { color: ${a.color.opaque(T.background).css}; }${this._terminalSelector} .${x}${S.INVERTED_DEFAULT_COLOR}.xterm-dim { color: ${a.color.multiplyOpacity(a.color.opaque(T.background),.5).css}; }${this._terminalSelector} .${E}${S.INVERTED_DEFAULT_COLOR} { background-color: ${T.foreground.css}; }`,this._themeStyleElement.textContent=P}_setDefaultSpacing(){const T=this.dimensions.css.cell.width-this._widthCache.get("W",!1,!1);this._rowContainer.style.letterSpacing=`${T}px`,this._rowFactory.defaultSpacing=T}handleDevicePixelRatioChange(){this._updateDimensions(),this._widthCache.clear(),this._setDefaultSpacing()}_refreshRowElements(T,P){for(let H=this._rowElements.length;H<=P;H++){const N=document.createElement("div");this._rowContainer.appendChild(N),this._rowElements.push(N)}for(;this._rowElements.length>P;)this._rowContainer.removeChild(this._rowElements.pop())}handleResize(T,P){this._refreshRowElements(T,P),this._updateDimensions()}handleCharSizeChanged(){this._updateDimensions(),this._widthCache.clear(),this._setDefaultSpacing()}handleBlur(){this._rowContainer.classList.remove(v)}handleFocus(){this._rowContainer.classList.add(v),this.renderRows(this._bufferService.buffer.y,this._bufferService.buffer.y)}handleSelectionChanged(T,P,H){if(this._selectionContainer.replaceChildren(),this._rowFactory.handleSelectionChanged(T,P,H),this.renderRows(0,this._bufferService.rows-1),!T||!P)return;const N=T[1]-this._bufferService.buffer.ydisp,U=P[1]-this._bufferService.buffer.ydisp,O=Math.max(N,0),b=Math.min(U,this._bufferService.rows-1);if(O>=this._bufferService.rows||b<0)return;const R=document.createDocumentFragment();if(H){const A=T[0]>P[0];R.appendChild(this._createSelectionElement(O,A?P[0]:T[0],A?T[0]:P[0],b-O+1))}else{const A=N===O?T[0]:0,I=O===U?P[0]:this._bufferService.cols;R.appendChild(this._createSelectionElement(O,A,I));const F=b-O-1;if(R.appendChild(this._createSelectionElement(O+1,0,this._bufferService.cols,F)),O!==b){const q=U===b?P[0]:this._bufferService.cols;R.appendChild(this._createSelectionElement(b,0,q))}}this._selectionContainer.appendChild(R)}_createSelectionElement(T,P,H,N=1){const U=document.createElement("div");return U.style.height=N*this.dimensions.css.cell.height+"px",U.style.top=T*this.dimensions.css.cell.height+"px",U.style.left=P*this.dimensions.css.cell.width+"px",U.style.width=this.dimensions.css.cell.width*(H-P)+"px",U}handleCursorMove(){}_handleOptionsChanged(){this._updateDimensions(),this._injectCss(this._themeService.colors),this._widthCache.setFont(this._optionsService.rawOptions.fontFamily,this._optionsService.rawOptions.fontSize,this._optionsService.rawOptions.fontWeight,this._optionsService.rawOptions.fontWeightBold),this._setDefaultSpacing()}clear(){for(const T of this._rowElements)T.replaceChildren()}renderRows(T,P){const H=this._bufferService.buffer,N=H.ybase+H.y,U=Math.min(H.x,this._bufferService.cols-1),O=this._optionsService.rawOptions.cursorBlink,b=this._optionsService.rawOptions.cursorStyle,R=this._optionsService.rawOptions.cursorInactiveStyle;for(let A=T;A<=P;A++){const I=A+H.ydisp,F=this._rowElements[A],q=H.lines.get(I);if(!F||!q)break;F.replaceChildren(...this._rowFactory.createRow(q,I,I===N,b,R,U,O,this.dimensions.css.cell.width,this._widthCache,-1,-1))}}get _terminalSelector(){return`.${p}${this._terminalClass}`}_handleLinkHover(T){this._setCellUnderline(T.x1,T.x2,T.y1,T.y2,T.cols,!0)}_handleLinkLeave(T){this._setCellUnderline(T.x1,T.x2,T.y1,T.y2,T.cols,!1)}_setCellUnderline(T,P,H,N,U,O){H<0&&(T=0),N<0&&(P=0);const b=this._bufferService.rows-1;H=Math.max(Math.min(H,b),0),N=Math.max(Math.min(N,b),0),U=Math.min(U,this._bufferService.cols);const R=this._bufferService.buffer,A=R.ybase+R.y,I=Math.min(R.x,U-1),F=this._optionsService.rawOptions.cursorBlink,q=this._optionsService.rawOptions.cursorStyle,Q=this._optionsService.rawOptions.cursorInactiveStyle;for(let Y=H;Y<=N;++Y){const ne=Y+R.ydisp,D=this._rowElements[Y],j=R.lines.get(ne);if(!D||!j)break;D.replaceChildren(...this._rowFactory.createRow(j,ne,ne===A,q,Q,I,F,this.dimensions.css.cell.width,this._widthCache,O?Y===H?T:0:-1,O?(Y===N?P:U)-1:-1))}}};n.DomRenderer=M=d([y(4,o.IInstantiationService),y(5,C.ICharSizeService),y(6,o.IOptionsService),y(7,o.IBufferService),y(8,C.ICoreBrowserService),y(9,C.IThemeService)],M)},3787:function(g,n,u){var d=this&&this.__decorate||function(x,E,v,k){var B,M=arguments.length,T=M<3?E:k===null?k=Object.getOwnPropertyDescriptor(E,v):k;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")T=Reflect.decorate(x,E,v,k);else for(var P=x.length-1;P>=0;P--)(B=x[P])&&(T=(M<3?B(T):M>3?B(E,v,T):B(E,v))||T);return M>3&&T&&Object.defineProperty(E,v,T),T},y=this&&this.__param||function(x,E){return function(v,k){E(v,k,x)}};Object.defineProperty(n,"__esModule",{value:!0}),n.DomRendererRowFactory=void 0;const h=u(2223),_=u(643),S=u(511),w=u(2585),C=u(8055),a=u(4725),l=u(4269),s=u(6171),o=u(3734);let p=n.DomRendererRowFactory=class{constructor(x,E,v,k,B,M,T){this._document=x,this._characterJoinerService=E,this._optionsService=v,this._coreBrowserService=k,this._coreService=B,this._decorationService=M,this._themeService=T,this._workCell=new S.CellData,this._columnSelectMode=!1,this.defaultSpacing=0}handleSelectionChanged(x,E,v){this._selectionStart=x,this._selectionEnd=E,this._columnSelectMode=v}createRow(x,E,v,k,B,M,T,P,H,N,U){const O=[],b=this._characterJoinerService.getJoinedCharacters(E),R=this._themeService.colors;let A,I=x.getNoBgTrimmedLength();v&&I<M+1&&(I=M+1);let F=0,q="",Q=0,Y=0,ne=0,D=!1,j=0,W=!1,z=0;const Z=[],G=N!==-1&&U!==-1;for(let oe=0;oe<I;oe++){x.loadCell(oe,this._workCell);let Ee=this._workCell.getWidth();if(Ee===0)continue;let Oe=!1,jt=oe,ee=this._workCell;if(b.length>0&&oe===b[0][0]){Oe=!0;const me=b.shift();ee=new l.JoinedCellData(this._workCell,x.translateToString(!0,me[0],me[1]),me[1]-me[0]),jt=me[1]-1,Ee=ee.getWidth()}const sr=this._isCellInSelection(oe,E),Qr=v&&oe===M,Jr=G&&oe>=N&&oe<=U;let Zr=!1;this._decorationService.forEachDecorationAtCell(oe,E,void 0,me=>{Zr=!0});let Cr=ee.getChars()||_.WHITESPACE_CELL_CHAR;if(Cr===" "&&(ee.isUnderline()||ee.isOverline())&&(Cr=" "),z=Ee*P-H.get(Cr,ee.isBold(),ee.isItalic()),A){if(F&&(sr&&W||!sr&&!W&&ee.bg===Q)&&(sr&&W&&R.selectionForeground||ee.fg===Y)&&ee.extended.ext===ne&&Jr===D&&z===j&&!Qr&&!Oe&&!Zr){q+=Cr,F++;continue}F&&(A.textContent=q),A=this._document.createElement("span"),F=0,q=""}else A=this._document.createElement("span");if(Q=ee.bg,Y=ee.fg,ne=ee.extended.ext,D=Jr,j=z,W=sr,Oe&&M>=oe&&M<=jt&&(M=oe),!this._coreService.isCursorHidden&&Qr){if(Z.push("xterm-cursor"),this._coreBrowserService.isFocused)T&&Z.push("xterm-cursor-blink"),Z.push(k==="bar"?"xterm-cursor-bar":k==="underline"?"xterm-cursor-underline":"xterm-cursor-block");else if(B)switch(B){case"outline":Z.push("xterm-cursor-outline");break;case"block":Z.push("xterm-cursor-block");break;case"bar":Z.push("xterm-cursor-bar");break;case"underline":Z.push("xterm-cursor-underline")}}if(ee.isBold()&&Z.push("xterm-bold"),ee.isItalic()&&Z.push("xterm-italic"),ee.isDim()&&Z.push("xterm-dim"),q=ee.isInvisible()?_.WHITESPACE_CELL_CHAR:ee.getChars()||_.WHITESPACE_CELL_CHAR,ee.isUnderline()&&(Z.push(`xterm-underline-${ee.extended.underlineStyle}`),q===" "&&(q=" "),!ee.isUnderlineColorDefault()))if(ee.isUnderlineColorRGB())A.style.textDecorationColor=`rgb(${o.AttributeData.toColorRGB(ee.getUnderlineColor()).join(",")})`;else{let me=ee.getUnderlineColor();this._optionsService.rawOptions.drawBoldTextInBrightColors&&ee.isBold()&&me<8&&(me+=8),A.style.textDecorationColor=R.ansi[me].css}ee.isOverline()&&(Z.push("xterm-overline"),q===" "&&(q=" ")),ee.isStrikethrough()&&Z.push("xterm-strikethrough"),Jr&&(A.style.textDecoration="underline");let J=ee.getFgColor(),K=ee.getFgColorMode(),te=ee.getBgColor(),ie=ee.getBgColorMode();const Re=!!ee.isInverse();if(Re){const me=J;J=te,te=me;const oh=K;K=ie,ie=oh}let be,ut,yt,nr=!1;switch(this._decorationService.forEachDecorationAtCell(oe,E,void 0,me=>{me.options.layer!=="top"&&nr||(me.backgroundColorRGB&&(ie=50331648,te=me.backgroundColorRGB.rgba>>8&16777215,be=me.backgroundColorRGB),me.foregroundColorRGB&&(K=50331648,J=me.foregroundColorRGB.rgba>>8&16777215,ut=me.foregroundColorRGB),nr=me.options.layer==="top")}),!nr&&sr&&(be=this._coreBrowserService.isFocused?R.selectionBackgroundOpaque:R.selectionInactiveBackgroundOpaque,te=be.rgba>>8&16777215,ie=50331648,nr=!0,R.selectionForeground&&(K=50331648,J=R.selectionForeground.rgba>>8&16777215,ut=R.selectionForeground)),nr&&Z.push("xterm-decoration-top"),ie){case 16777216:case 33554432:yt=R.ansi[te],Z.push(`xterm-bg-${te}`);break;case 50331648:yt=C.rgba.toColor(te>>16,te>>8&255,255&te),this._addStyle(A,`background-color:#${m((te>>>0).toString(16),"0",6)}`);break;default:Re?(yt=R.foreground,Z.push(`xterm-bg-${h.INVERTED_DEFAULT_COLOR}`)):yt=R.background}switch(be||ee.isDim()&&(be=C.color.multiplyOpacity(yt,.5)),K){case 16777216:case 33554432:ee.isBold()&&J<8&&this._optionsService.rawOptions.drawBoldTextInBrightColors&&(J+=8),this._applyMinimumContrast(A,yt,R.ansi[J],ee,be,void 0)||Z.push(`xterm-fg-${J}`);break;case 50331648:const me=C.rgba.toColor(J>>16&255,J>>8&255,255&J);this._applyMinimumContrast(A,yt,me,ee,be,ut)||this._addStyle(A,`color:#${m(J.toString(16),"0",6)}`);break;default:this._applyMinimumContrast(A,yt,R.foreground,ee,be,void 0)||Re&&Z.push(`xterm-fg-${h.INVERTED_DEFAULT_COLOR}`)}Z.length&&(A.className=Z.join(" "),Z.length=0),Qr||Oe||Zr?A.textContent=q:F++,z!==this.defaultSpacing&&(A.style.letterSpacing=`${z}px`),O.push(A),oe=jt}return A&&F&&(A.textContent=q),O}_applyMinimumContrast(x,E,v,k,B,M){if(this._optionsService.rawOptions.minimumContrastRatio===1||(0,s.excludeFromContrastRatioDemands)(k.getCode()))return!1;const T=this._getContrastCache(k);let P;if(B||M||(P=T.getColor(E.rgba,v.rgba)),P===void 0){const H=this._optionsService.rawOptions.minimumContrastRatio/(k.isDim()?2:1);P=C.color.ensureContrastRatio(B||E,M||v,H),T.setColor((B||E).rgba,(M||v).rgba,P??null)}return!!P&&(this._addStyle(x,`color:${P.css}`),!0)}_getContrastCache(x){return x.isDim()?this._themeService.colors.halfContrastCache:this._themeService.colors.contrastCache}_addStyle(x,E){x.setAttribute("style",`${x.getAttribute("style")||""}${E};`)}_isCellInSelection(x,E){const v=this._selectionStart,k=this._selectionEnd;return!(!v||!k)&&(this._columnSelectMode?v[0]<=k[0]?x>=v[0]&&E>=v[1]&&x<k[0]&&E<=k[1]:x<v[0]&&E>=v[1]&&x>=k[0]&&E<=k[1]:E>v[1]&&E<k[1]||v[1]===k[1]&&E===v[1]&&x>=v[0]&&x<k[0]||v[1]<k[1]&&E===k[1]&&x<k[0]||v[1]<k[1]&&E===v[1]&&x>=v[0])}};function m(x,E,v){for(;x.length<v;)x=E+x;return x}n.DomRendererRowFactory=p=d([y(1,a.ICharacterJoinerService),y(2,w.IOptionsService),y(3,a.ICoreBrowserService),y(4,w.ICoreService),y(5,w.IDecorationService),y(6,a.IThemeService)],p)},2550:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.WidthCache=void 0,n.WidthCache=class{constructor(u){this._flat=new Float32Array(256),this._font="",this._fontSize=0,this._weight="normal",this._weightBold="bold",this._measureElements=[],this._container=u.createElement("div"),this._container.style.position="absolute",this._container.style.top="-50000px",this._container.style.width="50000px",this._container.style.whiteSpace="pre",this._container.style.fontKerning="none";const d=u.createElement("span"),y=u.createElement("span");y.style.fontWeight="bold";const h=u.createElement("span");h.style.fontStyle="italic";const _=u.createElement("span");_.style.fontWeight="bold",_.style.fontStyle="italic",this._measureElements=[d,y,h,_],this._container.appendChild(d),this._container.appendChild(y),this._container.appendChild(h),this._container.appendChild(_),u.body.appendChild(this._container),this.clear()}dispose(){this._container.remove(),this._measureElements.length=0,this._holey=void 0}clear(){this._flat.fill(-9999),this._holey=new Map}setFont(u,d,y,h){u===this._font&&d===this._fontSize&&y===this._weight&&h===this._weightBold||(this._font=u,this._fontSize=d,this._weight=y,this._weightBold=h,this._container.style.fontFamily=this._font,this._container.style.fontSize=`${this._fontSize}px`,this._measureElements[0].style.fontWeight=`${y}`,this._measureElements[1].style.fontWeight=`${h}`,this._measureElements[2].style.fontWeight=`${y}`,this._measureElements[3].style.fontWeight=`${h}`,this.clear())}get(u,d,y){let h=0;if(!d&&!y&&u.length===1&&(h=u.charCodeAt(0))<256)return this._flat[h]!==-9999?this._flat[h]:this._flat[h]=this._measure(u,0);let _=u;d&&(_+="B"),y&&(_+="I");let S=this._holey.get(_);if(S===void 0){let w=0;d&&(w|=1),y&&(w|=2),S=this._measure(u,w),this._holey.set(_,S)}return S}_measure(u,d){const y=this._measureElements[d];return y.textContent=u.repeat(32),y.offsetWidth/32}}},2223:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.TEXT_BASELINE=n.DIM_OPACITY=n.INVERTED_DEFAULT_COLOR=void 0;const d=u(6114);n.INVERTED_DEFAULT_COLOR=257,n.DIM_OPACITY=.5,n.TEXT_BASELINE=d.isFirefox||d.isLegacyEdge?"bottom":"ideographic"},6171:(g,n)=>{function u(d){return 57508<=d&&d<=57558}Object.defineProperty(n,"__esModule",{value:!0}),n.createRenderDimensions=n.excludeFromContrastRatioDemands=n.isRestrictedPowerlineGlyph=n.isPowerlineGlyph=n.throwIfFalsy=void 0,n.throwIfFalsy=function(d){if(!d)throw new Error("value must not be falsy");return d},n.isPowerlineGlyph=u,n.isRestrictedPowerlineGlyph=function(d){return 57520<=d&&d<=57527},n.excludeFromContrastRatioDemands=function(d){return u(d)||function(y){return 9472<=y&&y<=9631}(d)},n.createRenderDimensions=function(){return{css:{canvas:{width:0,height:0},cell:{width:0,height:0}},device:{canvas:{width:0,height:0},cell:{width:0,height:0},char:{width:0,height:0,left:0,top:0}}}}},456:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.SelectionModel=void 0,n.SelectionModel=class{constructor(u){this._bufferService=u,this.isSelectAllActive=!1,this.selectionStartLength=0}clearSelection(){this.selectionStart=void 0,this.selectionEnd=void 0,this.isSelectAllActive=!1,this.selectionStartLength=0}get finalSelectionStart(){return this.isSelectAllActive?[0,0]:this.selectionEnd&&this.selectionStart&&this.areSelectionValuesReversed()?this.selectionEnd:this.selectionStart}get finalSelectionEnd(){if(this.isSelectAllActive)return[this._bufferService.cols,this._bufferService.buffer.ybase+this._bufferService.rows-1];if(this.selectionStart){if(!this.selectionEnd||this.areSelectionValuesReversed()){const u=this.selectionStart[0]+this.selectionStartLength;return u>this._bufferService.cols?u%this._bufferService.cols==0?[this._bufferService.cols,this.selectionStart[1]+Math.floor(u/this._bufferService.cols)-1]:[u%this._bufferService.cols,this.selectionStart[1]+Math.floor(u/this._bufferService.cols)]:[u,this.selectionStart[1]]}if(this.selectionStartLength&&this.selectionEnd[1]===this.selectionStart[1]){const u=this.selectionStart[0]+this.selectionStartLength;return u>this._bufferService.cols?[u%this._bufferService.cols,this.selectionStart[1]+Math.floor(u/this._bufferService.cols)]:[Math.max(u,this.selectionEnd[0]),this.selectionEnd[1]]}return this.selectionEnd}}areSelectionValuesReversed(){const u=this.selectionStart,d=this.selectionEnd;return!(!u||!d)&&(u[1]>d[1]||u[1]===d[1]&&u[0]>d[0])}handleTrim(u){return this.selectionStart&&(this.selectionStart[1]-=u),this.selectionEnd&&(this.selectionEnd[1]-=u),this.selectionEnd&&this.selectionEnd[1]<0?(this.clearSelection(),!0):(this.selectionStart&&this.selectionStart[1]<0&&(this.selectionStart[1]=0),!1)}}},428:function(g,n,u){var d=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CharSizeService=void 0;const h=u(2585),_=u(8460),S=u(844);let w=n.CharSizeService=class extends S.Disposable{get hasValidSize(){return this.width>0&&this.height>0}constructor(a,l,s){super(),this._optionsService=s,this.width=0,this.height=0,this._onCharSizeChange=this.register(new _.EventEmitter),this.onCharSizeChange=this._onCharSizeChange.event,this._measureStrategy=new C(a,l,this._optionsService),this.register(this._optionsService.onMultipleOptionChange(["fontFamily","fontSize"],()=>this.measure()))}measure(){const a=this._measureStrategy.measure();a.width===this.width&&a.height===this.height||(this.width=a.width,this.height=a.height,this._onCharSizeChange.fire())}};n.CharSizeService=w=d([y(2,h.IOptionsService)],w);class C{constructor(l,s,o){this._document=l,this._parentElement=s,this._optionsService=o,this._result={width:0,height:0},this._measureElement=this._document.createElement("span"),this._measureElement.classList.add("xterm-char-measure-element"),this._measureElement.textContent="W".repeat(32),this._measureElement.setAttribute("aria-hidden","true"),this._measureElement.style.whiteSpace="pre",this._measureElement.style.fontKerning="none",this._parentElement.appendChild(this._measureElement)}measure(){this._measureElement.style.fontFamily=this._optionsService.rawOptions.fontFamily,this._measureElement.style.fontSize=`${this._optionsService.rawOptions.fontSize}px`;const l={height:Number(this._measureElement.offsetHeight),width:Number(this._measureElement.offsetWidth)};return l.width!==0&&l.height!==0&&(this._result.width=l.width/32,this._result.height=Math.ceil(l.height)),this._result}}},4269:function(g,n,u){var d=this&&this.__decorate||function(l,s,o,p){var m,x=arguments.length,E=x<3?s:p===null?p=Object.getOwnPropertyDescriptor(s,o):p;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")E=Reflect.decorate(l,s,o,p);else for(var v=l.length-1;v>=0;v--)(m=l[v])&&(E=(x<3?m(E):x>3?m(s,o,E):m(s,o))||E);return x>3&&E&&Object.defineProperty(s,o,E),E},y=this&&this.__param||function(l,s){return function(o,p){s(o,p,l)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CharacterJoinerService=n.JoinedCellData=void 0;const h=u(3734),_=u(643),S=u(511),w=u(2585);class C extends h.AttributeData{constructor(s,o,p){super(),this.content=0,this.combinedData="",this.fg=s.fg,this.bg=s.bg,this.combinedData=o,this._width=p}isCombined(){return 2097152}getWidth(){return this._width}getChars(){return this.combinedData}getCode(){return 2097151}setFromCharData(s){throw new Error("not implemented")}getAsCharData(){return[this.fg,this.getChars(),this.getWidth(),this.getCode()]}}n.JoinedCellData=C;let a=n.CharacterJoinerService=class ih{constructor(s){this._bufferService=s,this._characterJoiners=[],this._nextCharacterJoinerId=0,this._workCell=new S.CellData}register(s){const o={id:this._nextCharacterJoinerId++,handler:s};return this._characterJoiners.push(o),o.id}deregister(s){for(let o=0;o<this._characterJoiners.length;o++)if(this._characterJoiners[o].id===s)return this._characterJoiners.splice(o,1),!0;return!1}getJoinedCharacters(s){if(this._characterJoiners.length===0)return[];const o=this._bufferService.buffer.lines.get(s);if(!o||o.length===0)return[];const p=[],m=o.translateToString(!0);let x=0,E=0,v=0,k=o.getFg(0),B=o.getBg(0);for(let M=0;M<o.getTrimmedLength();M++)if(o.loadCell(M,this._workCell),this._workCell.getWidth()!==0){if(this._workCell.fg!==k||this._workCell.bg!==B){if(M-x>1){const T=this._getJoinedRanges(m,v,E,o,x);for(let P=0;P<T.length;P++)p.push(T[P])}x=M,v=E,k=this._workCell.fg,B=this._workCell.bg}E+=this._workCell.getChars().length||_.WHITESPACE_CELL_CHAR.length}if(this._bufferService.cols-x>1){const M=this._getJoinedRanges(m,v,E,o,x);for(let T=0;T<M.length;T++)p.push(M[T])}return p}_getJoinedRanges(s,o,p,m,x){const E=s.substring(o,p);let v=[];try{v=this._characterJoiners[0].handler(E)}catch(k){console.error(k)}for(let k=1;k<this._characterJoiners.length;k++)try{const B=this._characterJoiners[k].handler(E);for(let M=0;M<B.length;M++)ih._mergeRanges(v,B[M])}catch(B){console.error(B)}return this._stringRangesToCellRanges(v,m,x),v}_stringRangesToCellRanges(s,o,p){let m=0,x=!1,E=0,v=s[m];if(v){for(let k=p;k<this._bufferService.cols;k++){const B=o.getWidth(k),M=o.getString(k).length||_.WHITESPACE_CELL_CHAR.length;if(B!==0){if(!x&&v[0]<=E&&(v[0]=k,x=!0),v[1]<=E){if(v[1]=k,v=s[++m],!v)break;v[0]<=E?(v[0]=k,x=!0):x=!1}E+=M}}v&&(v[1]=this._bufferService.cols)}}static _mergeRanges(s,o){let p=!1;for(let m=0;m<s.length;m++){const x=s[m];if(p){if(o[1]<=x[0])return s[m-1][1]=o[1],s;if(o[1]<=x[1])return s[m-1][1]=Math.max(o[1],x[1]),s.splice(m,1),s;s.splice(m,1),m--}else{if(o[1]<=x[0])return s.splice(m,0,o),s;if(o[1]<=x[1])return x[0]=Math.min(o[0],x[0]),s;o[0]<x[1]&&(x[0]=Math.min(o[0],x[0]),p=!0)}}return p?s[s.length-1][1]=o[1]:s.push(o),s}};n.CharacterJoinerService=a=d([y(0,w.IBufferService)],a)},5114:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CoreBrowserService=void 0,n.CoreBrowserService=class{constructor(u,d){this._textarea=u,this.window=d,this._isFocused=!1,this._cachedIsFocused=void 0,this._textarea.addEventListener("focus",()=>this._isFocused=!0),this._textarea.addEventListener("blur",()=>this._isFocused=!1)}get dpr(){return this.window.devicePixelRatio}get isFocused(){return this._cachedIsFocused===void 0&&(this._cachedIsFocused=this._isFocused&&this._textarea.ownerDocument.hasFocus(),queueMicrotask(()=>this._cachedIsFocused=void 0)),this._cachedIsFocused}}},8934:function(g,n,u){var d=this&&this.__decorate||function(w,C,a,l){var s,o=arguments.length,p=o<3?C:l===null?l=Object.getOwnPropertyDescriptor(C,a):l;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")p=Reflect.decorate(w,C,a,l);else for(var m=w.length-1;m>=0;m--)(s=w[m])&&(p=(o<3?s(p):o>3?s(C,a,p):s(C,a))||p);return o>3&&p&&Object.defineProperty(C,a,p),p},y=this&&this.__param||function(w,C){return function(a,l){C(a,l,w)}};Object.defineProperty(n,"__esModule",{value:!0}),n.MouseService=void 0;const h=u(4725),_=u(9806);let S=n.MouseService=class{constructor(w,C){this._renderService=w,this._charSizeService=C}getCoords(w,C,a,l,s){return(0,_.getCoords)(window,w,C,a,l,this._charSizeService.hasValidSize,this._renderService.dimensions.css.cell.width,this._renderService.dimensions.css.cell.height,s)}getMouseReportCoords(w,C){const a=(0,_.getCoordsRelativeToElement)(window,w,C);if(this._charSizeService.hasValidSize)return a[0]=Math.min(Math.max(a[0],0),this._renderService.dimensions.css.canvas.width-1),a[1]=Math.min(Math.max(a[1],0),this._renderService.dimensions.css.canvas.height-1),{col:Math.floor(a[0]/this._renderService.dimensions.css.cell.width),row:Math.floor(a[1]/this._renderService.dimensions.css.cell.height),x:Math.floor(a[0]),y:Math.floor(a[1])}}};n.MouseService=S=d([y(0,h.IRenderService),y(1,h.ICharSizeService)],S)},3230:function(g,n,u){var d=this&&this.__decorate||function(p,m,x,E){var v,k=arguments.length,B=k<3?m:E===null?E=Object.getOwnPropertyDescriptor(m,x):E;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")B=Reflect.decorate(p,m,x,E);else for(var M=p.length-1;M>=0;M--)(v=p[M])&&(B=(k<3?v(B):k>3?v(m,x,B):v(m,x))||B);return k>3&&B&&Object.defineProperty(m,x,B),B},y=this&&this.__param||function(p,m){return function(x,E){m(x,E,p)}};Object.defineProperty(n,"__esModule",{value:!0}),n.RenderService=void 0;const h=u(3656),_=u(6193),S=u(5596),w=u(4725),C=u(8460),a=u(844),l=u(7226),s=u(2585);let o=n.RenderService=class extends a.Disposable{get dimensions(){return this._renderer.value.dimensions}constructor(p,m,x,E,v,k,B,M){if(super(),this._rowCount=p,this._charSizeService=E,this._renderer=this.register(new a.MutableDisposable),this._pausedResizeTask=new l.DebouncedIdleTask,this._isPaused=!1,this._needsFullRefresh=!1,this._isNextRenderRedrawOnly=!0,this._needsSelectionRefresh=!1,this._canvasWidth=0,this._canvasHeight=0,this._selectionState={start:void 0,end:void 0,columnSelectMode:!1},this._onDimensionsChange=this.register(new C.EventEmitter),this.onDimensionsChange=this._onDimensionsChange.event,this._onRenderedViewportChange=this.register(new C.EventEmitter),this.onRenderedViewportChange=this._onRenderedViewportChange.event,this._onRender=this.register(new C.EventEmitter),this.onRender=this._onRender.event,this._onRefreshRequest=this.register(new C.EventEmitter),this.onRefreshRequest=this._onRefreshRequest.event,this._renderDebouncer=new _.RenderDebouncer(B.window,(T,P)=>this._renderRows(T,P)),this.register(this._renderDebouncer),this._screenDprMonitor=new S.ScreenDprMonitor(B.window),this._screenDprMonitor.setListener(()=>this.handleDevicePixelRatioChange()),this.register(this._screenDprMonitor),this.register(k.onResize(()=>this._fullRefresh())),this.register(k.buffers.onBufferActivate(()=>{var T;return(T=this._renderer.value)===null||T===void 0?void 0:T.clear()})),this.register(x.onOptionChange(()=>this._handleOptionsChanged())),this.register(this._charSizeService.onCharSizeChange(()=>this.handleCharSizeChanged())),this.register(v.onDecorationRegistered(()=>this._fullRefresh())),this.register(v.onDecorationRemoved(()=>this._fullRefresh())),this.register(x.onMultipleOptionChange(["customGlyphs","drawBoldTextInBrightColors","letterSpacing","lineHeight","fontFamily","fontSize","fontWeight","fontWeightBold","minimumContrastRatio"],()=>{this.clear(),this.handleResize(k.cols,k.rows),this._fullRefresh()})),this.register(x.onMultipleOptionChange(["cursorBlink","cursorStyle"],()=>this.refreshRows(k.buffer.y,k.buffer.y,!0))),this.register((0,h.addDisposableDomListener)(B.window,"resize",()=>this.handleDevicePixelRatioChange())),this.register(M.onChangeColors(()=>this._fullRefresh())),"IntersectionObserver"in B.window){const T=new B.window.IntersectionObserver(P=>this._handleIntersectionChange(P[P.length-1]),{threshold:0});T.observe(m),this.register({dispose:()=>T.disconnect()})}}_handleIntersectionChange(p){this._isPaused=p.isIntersecting===void 0?p.intersectionRatio===0:!p.isIntersecting,this._isPaused||this._charSizeService.hasValidSize||this._charSizeService.measure(),!this._isPaused&&this._needsFullRefresh&&(this._pausedResizeTask.flush(),this.refreshRows(0,this._rowCount-1),this._needsFullRefresh=!1)}refreshRows(p,m,x=!1){this._isPaused?this._needsFullRefresh=!0:(x||(this._isNextRenderRedrawOnly=!1),this._renderDebouncer.refresh(p,m,this._rowCount))}_renderRows(p,m){this._renderer.value&&(p=Math.min(p,this._rowCount-1),m=Math.min(m,this._rowCount-1),this._renderer.value.renderRows(p,m),this._needsSelectionRefresh&&(this._renderer.value.handleSelectionChanged(this._selectionState.start,this._selectionState.end,this._selectionState.columnSelectMode),this._needsSelectionRefresh=!1),this._isNextRenderRedrawOnly||this._onRenderedViewportChange.fire({start:p,end:m}),this._onRender.fire({start:p,end:m}),this._isNextRenderRedrawOnly=!0)}resize(p,m){this._rowCount=m,this._fireOnCanvasResize()}_handleOptionsChanged(){this._renderer.value&&(this.refreshRows(0,this._rowCount-1),this._fireOnCanvasResize())}_fireOnCanvasResize(){this._renderer.value&&(this._renderer.value.dimensions.css.canvas.width===this._canvasWidth&&this._renderer.value.dimensions.css.canvas.height===this._canvasHeight||this._onDimensionsChange.fire(this._renderer.value.dimensions))}hasRenderer(){return!!this._renderer.value}setRenderer(p){this._renderer.value=p,this._renderer.value.onRequestRedraw(m=>this.refreshRows(m.start,m.end,!0)),this._needsSelectionRefresh=!0,this._fullRefresh()}addRefreshCallback(p){return this._renderDebouncer.addRefreshCallback(p)}_fullRefresh(){this._isPaused?this._needsFullRefresh=!0:this.refreshRows(0,this._rowCount-1)}clearTextureAtlas(){var p,m;this._renderer.value&&((m=(p=this._renderer.value).clearTextureAtlas)===null||m===void 0||m.call(p),this._fullRefresh())}handleDevicePixelRatioChange(){this._charSizeService.measure(),this._renderer.value&&(this._renderer.value.handleDevicePixelRatioChange(),this.refreshRows(0,this._rowCount-1))}handleResize(p,m){this._renderer.value&&(this._isPaused?this._pausedResizeTask.set(()=>this._renderer.value.handleResize(p,m)):this._renderer.value.handleResize(p,m),this._fullRefresh())}handleCharSizeChanged(){var p;(p=this._renderer.value)===null||p===void 0||p.handleCharSizeChanged()}handleBlur(){var p;(p=this._renderer.value)===null||p===void 0||p.handleBlur()}handleFocus(){var p;(p=this._renderer.value)===null||p===void 0||p.handleFocus()}handleSelectionChanged(p,m,x){var E;this._selectionState.start=p,this._selectionState.end=m,this._selectionState.columnSelectMode=x,(E=this._renderer.value)===null||E===void 0||E.handleSelectionChanged(p,m,x)}handleCursorMove(){var p;(p=this._renderer.value)===null||p===void 0||p.handleCursorMove()}clear(){var p;(p=this._renderer.value)===null||p===void 0||p.clear()}};n.RenderService=o=d([y(2,s.IOptionsService),y(3,w.ICharSizeService),y(4,s.IDecorationService),y(5,s.IBufferService),y(6,w.ICoreBrowserService),y(7,w.IThemeService)],o)},9312:function(g,n,u){var d=this&&this.__decorate||function(v,k,B,M){var T,P=arguments.length,H=P<3?k:M===null?M=Object.getOwnPropertyDescriptor(k,B):M;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")H=Reflect.decorate(v,k,B,M);else for(var N=v.length-1;N>=0;N--)(T=v[N])&&(H=(P<3?T(H):P>3?T(k,B,H):T(k,B))||H);return P>3&&H&&Object.defineProperty(k,B,H),H},y=this&&this.__param||function(v,k){return function(B,M){k(B,M,v)}};Object.defineProperty(n,"__esModule",{value:!0}),n.SelectionService=void 0;const h=u(9806),_=u(9504),S=u(456),w=u(4725),C=u(8460),a=u(844),l=u(6114),s=u(4841),o=u(511),p=u(2585),m=" ",x=new RegExp(m,"g");let E=n.SelectionService=class extends a.Disposable{constructor(v,k,B,M,T,P,H,N,U){super(),this._element=v,this._screenElement=k,this._linkifier=B,this._bufferService=M,this._coreService=T,this._mouseService=P,this._optionsService=H,this._renderService=N,this._coreBrowserService=U,this._dragScrollAmount=0,this._enabled=!0,this._workCell=new o.CellData,this._mouseDownTimeStamp=0,this._oldHasSelection=!1,this._oldSelectionStart=void 0,this._oldSelectionEnd=void 0,this._onLinuxMouseSelection=this.register(new C.EventEmitter),this.onLinuxMouseSelection=this._onLinuxMouseSelection.event,this._onRedrawRequest=this.register(new C.EventEmitter),this.onRequestRedraw=this._onRedrawRequest.event,this._onSelectionChange=this.register(new C.EventEmitter),this.onSelectionChange=this._onSelectionChange.event,this._onRequestScrollLines=this.register(new C.EventEmitter),this.onRequestScrollLines=this._onRequestScrollLines.event,this._mouseMoveListener=O=>this._handleMouseMove(O),this._mouseUpListener=O=>this._handleMouseUp(O),this._coreService.onUserInput(()=>{this.hasSelection&&this.clearSelection()}),this._trimListener=this._bufferService.buffer.lines.onTrim(O=>this._handleTrim(O)),this.register(this._bufferService.buffers.onBufferActivate(O=>this._handleBufferActivate(O))),this.enable(),this._model=new S.SelectionModel(this._bufferService),this._activeSelectionMode=0,this.register((0,a.toDisposable)(()=>{this._removeMouseDownListeners()}))}reset(){this.clearSelection()}disable(){this.clearSelection(),this._enabled=!1}enable(){this._enabled=!0}get selectionStart(){return this._model.finalSelectionStart}get selectionEnd(){return this._model.finalSelectionEnd}get hasSelection(){const v=this._model.finalSelectionStart,k=this._model.finalSelectionEnd;return!(!v||!k||v[0]===k[0]&&v[1]===k[1])}get selectionText(){const v=this._model.finalSelectionStart,k=this._model.finalSelectionEnd;if(!v||!k)return"";const B=this._bufferService.buffer,M=[];if(this._activeSelectionMode===3){if(v[0]===k[0])return"";const T=v[0]<k[0]?v[0]:k[0],P=v[0]<k[0]?k[0]:v[0];for(let H=v[1];H<=k[1];H++){const N=B.translateBufferLineToString(H,!0,T,P);M.push(N)}}else{const T=v[1]===k[1]?k[0]:void 0;M.push(B.translateBufferLineToString(v[1],!0,v[0],T));for(let P=v[1]+1;P<=k[1]-1;P++){const H=B.lines.get(P),N=B.translateBufferLineToString(P,!0);H!=null&&H.isWrapped?M[M.length-1]+=N:M.push(N)}if(v[1]!==k[1]){const P=B.lines.get(k[1]),H=B.translateBufferLineToString(k[1],!0,0,k[0]);P&&P.isWrapped?M[M.length-1]+=H:M.push(H)}}return M.map(T=>T.replace(x," ")).join(l.isWindows?`\r
-`:`
-`)}clearSelection(){this._model.clearSelection(),this._removeMouseDownListeners(),this.refresh(),this._onSelectionChange.fire()}refresh(v){this._refreshAnimationFrame||(this._refreshAnimationFrame=this._coreBrowserService.window.requestAnimationFrame(()=>this._refresh())),l.isLinux&&v&&this.selectionText.length&&this._onLinuxMouseSelection.fire(this.selectionText)}_refresh(){this._refreshAnimationFrame=void 0,this._onRedrawRequest.fire({start:this._model.finalSelectionStart,end:this._model.finalSelectionEnd,columnSelectMode:this._activeSelectionMode===3})}_isClickInSelection(v){const k=this._getMouseBufferCoords(v),B=this._model.finalSelectionStart,M=this._model.finalSelectionEnd;return!!(B&&M&&k)&&this._areCoordsInSelection(k,B,M)}isCellInSelection(v,k){const B=this._model.finalSelectionStart,M=this._model.finalSelectionEnd;return!(!B||!M)&&this._areCoordsInSelection([v,k],B,M)}_areCoordsInSelection(v,k,B){return v[1]>k[1]&&v[1]<B[1]||k[1]===B[1]&&v[1]===k[1]&&v[0]>=k[0]&&v[0]<B[0]||k[1]<B[1]&&v[1]===B[1]&&v[0]<B[0]||k[1]<B[1]&&v[1]===k[1]&&v[0]>=k[0]}_selectWordAtCursor(v,k){var B,M;const T=(M=(B=this._linkifier.currentLink)===null||B===void 0?void 0:B.link)===null||M===void 0?void 0:M.range;if(T)return this._model.selectionStart=[T.start.x-1,T.start.y-1],this._model.selectionStartLength=(0,s.getRangeLength)(T,this._bufferService.cols),this._model.selectionEnd=void 0,!0;const P=this._getMouseBufferCoords(v);return!!P&&(this._selectWordAt(P,k),this._model.selectionEnd=void 0,!0)}selectAll(){this._model.isSelectAllActive=!0,this.refresh(),this._onSelectionChange.fire()}selectLines(v,k){this._model.clearSelection(),v=Math.max(v,0),k=Math.min(k,this._bufferService.buffer.lines.length-1),this._model.selectionStart=[0,v],this._model.selectionEnd=[this._bufferService.cols,k],this.refresh(),this._onSelectionChange.fire()}_handleTrim(v){this._model.handleTrim(v)&&this.refresh()}_getMouseBufferCoords(v){const k=this._mouseService.getCoords(v,this._screenElement,this._bufferService.cols,this._bufferService.rows,!0);if(k)return k[0]--,k[1]--,k[1]+=this._bufferService.buffer.ydisp,k}_getMouseEventScrollAmount(v){let k=(0,h.getCoordsRelativeToElement)(this._coreBrowserService.window,v,this._screenElement)[1];const B=this._renderService.dimensions.css.canvas.height;return k>=0&&k<=B?0:(k>B&&(k-=B),k=Math.min(Math.max(k,-50),50),k/=50,k/Math.abs(k)+Math.round(14*k))}shouldForceSelection(v){return l.isMac?v.altKey&&this._optionsService.rawOptions.macOptionClickForcesSelection:v.shiftKey}handleMouseDown(v){if(this._mouseDownTimeStamp=v.timeStamp,(v.button!==2||!this.hasSelection)&&v.button===0){if(!this._enabled){if(!this.shouldForceSelection(v))return;v.stopPropagation()}v.preventDefault(),this._dragScrollAmount=0,this._enabled&&v.shiftKey?this._handleIncrementalClick(v):v.detail===1?this._handleSingleClick(v):v.detail===2?this._handleDoubleClick(v):v.detail===3&&this._handleTripleClick(v),this._addMouseDownListeners(),this.refresh(!0)}}_addMouseDownListeners(){this._screenElement.ownerDocument&&(this._screenElement.ownerDocument.addEventListener("mousemove",this._mouseMoveListener),this._screenElement.ownerDocument.addEventListener("mouseup",this._mouseUpListener)),this._dragScrollIntervalTimer=this._coreBrowserService.window.setInterval(()=>this._dragScroll(),50)}_removeMouseDownListeners(){this._screenElement.ownerDocument&&(this._screenElement.ownerDocument.removeEventListener("mousemove",this._mouseMoveListener),this._screenElement.ownerDocument.removeEventListener("mouseup",this._mouseUpListener)),this._coreBrowserService.window.clearInterval(this._dragScrollIntervalTimer),this._dragScrollIntervalTimer=void 0}_handleIncrementalClick(v){this._model.selectionStart&&(this._model.selectionEnd=this._getMouseBufferCoords(v))}_handleSingleClick(v){if(this._model.selectionStartLength=0,this._model.isSelectAllActive=!1,this._activeSelectionMode=this.shouldColumnSelect(v)?3:0,this._model.selectionStart=this._getMouseBufferCoords(v),!this._model.selectionStart)return;this._model.selectionEnd=void 0;const k=this._bufferService.buffer.lines.get(this._model.selectionStart[1]);k&&k.length!==this._model.selectionStart[0]&&k.hasWidth(this._model.selectionStart[0])===0&&this._model.selectionStart[0]++}_handleDoubleClick(v){this._selectWordAtCursor(v,!0)&&(this._activeSelectionMode=1)}_handleTripleClick(v){const k=this._getMouseBufferCoords(v);k&&(this._activeSelectionMode=2,this._selectLineAt(k[1]))}shouldColumnSelect(v){return v.altKey&&!(l.isMac&&this._optionsService.rawOptions.macOptionClickForcesSelection)}_handleMouseMove(v){if(v.stopImmediatePropagation(),!this._model.selectionStart)return;const k=this._model.selectionEnd?[this._model.selectionEnd[0],this._model.selectionEnd[1]]:null;if(this._model.selectionEnd=this._getMouseBufferCoords(v),!this._model.selectionEnd)return void this.refresh(!0);this._activeSelectionMode===2?this._model.selectionEnd[1]<this._model.selectionStart[1]?this._model.selectionEnd[0]=0:this._model.selectionEnd[0]=this._bufferService.cols:this._activeSelectionMode===1&&this._selectToWordAt(this._model.selectionEnd),this._dragScrollAmount=this._getMouseEventScrollAmount(v),this._activeSelectionMode!==3&&(this._dragScrollAmount>0?this._model.selectionEnd[0]=this._bufferService.cols:this._dragScrollAmount<0&&(this._model.selectionEnd[0]=0));const B=this._bufferService.buffer;if(this._model.selectionEnd[1]<B.lines.length){const M=B.lines.get(this._model.selectionEnd[1]);M&&M.hasWidth(this._model.selectionEnd[0])===0&&this._model.selectionEnd[0]++}k&&k[0]===this._model.selectionEnd[0]&&k[1]===this._model.selectionEnd[1]||this.refresh(!0)}_dragScroll(){if(this._model.selectionEnd&&this._model.selectionStart&&this._dragScrollAmount){this._onRequestScrollLines.fire({amount:this._dragScrollAmount,suppressScrollEvent:!1});const v=this._bufferService.buffer;this._dragScrollAmount>0?(this._activeSelectionMode!==3&&(this._model.selectionEnd[0]=this._bufferService.cols),this._model.selectionEnd[1]=Math.min(v.ydisp+this._bufferService.rows,v.lines.length-1)):(this._activeSelectionMode!==3&&(this._model.selectionEnd[0]=0),this._model.selectionEnd[1]=v.ydisp),this.refresh()}}_handleMouseUp(v){const k=v.timeStamp-this._mouseDownTimeStamp;if(this._removeMouseDownListeners(),this.selectionText.length<=1&&k<500&&v.altKey&&this._optionsService.rawOptions.altClickMovesCursor){if(this._bufferService.buffer.ybase===this._bufferService.buffer.ydisp){const B=this._mouseService.getCoords(v,this._element,this._bufferService.cols,this._bufferService.rows,!1);if(B&&B[0]!==void 0&&B[1]!==void 0){const M=(0,_.moveToCellSequence)(B[0]-1,B[1]-1,this._bufferService,this._coreService.decPrivateModes.applicationCursorKeys);this._coreService.triggerDataEvent(M,!0)}}}else this._fireEventIfSelectionChanged()}_fireEventIfSelectionChanged(){const v=this._model.finalSelectionStart,k=this._model.finalSelectionEnd,B=!(!v||!k||v[0]===k[0]&&v[1]===k[1]);B?v&&k&&(this._oldSelectionStart&&this._oldSelectionEnd&&v[0]===this._oldSelectionStart[0]&&v[1]===this._oldSelectionStart[1]&&k[0]===this._oldSelectionEnd[0]&&k[1]===this._oldSelectionEnd[1]||this._fireOnSelectionChange(v,k,B)):this._oldHasSelection&&this._fireOnSelectionChange(v,k,B)}_fireOnSelectionChange(v,k,B){this._oldSelectionStart=v,this._oldSelectionEnd=k,this._oldHasSelection=B,this._onSelectionChange.fire()}_handleBufferActivate(v){this.clearSelection(),this._trimListener.dispose(),this._trimListener=v.activeBuffer.lines.onTrim(k=>this._handleTrim(k))}_convertViewportColToCharacterIndex(v,k){let B=k;for(let M=0;k>=M;M++){const T=v.loadCell(M,this._workCell).getChars().length;this._workCell.getWidth()===0?B--:T>1&&k!==M&&(B+=T-1)}return B}setSelection(v,k,B){this._model.clearSelection(),this._removeMouseDownListeners(),this._model.selectionStart=[v,k],this._model.selectionStartLength=B,this.refresh(),this._fireEventIfSelectionChanged()}rightClickSelect(v){this._isClickInSelection(v)||(this._selectWordAtCursor(v,!1)&&this.refresh(!0),this._fireEventIfSelectionChanged())}_getWordAt(v,k,B=!0,M=!0){if(v[0]>=this._bufferService.cols)return;const T=this._bufferService.buffer,P=T.lines.get(v[1]);if(!P)return;const H=T.translateBufferLineToString(v[1],!1);let N=this._convertViewportColToCharacterIndex(P,v[0]),U=N;const O=v[0]-N;let b=0,R=0,A=0,I=0;if(H.charAt(N)===" "){for(;N>0&&H.charAt(N-1)===" ";)N--;for(;U<H.length&&H.charAt(U+1)===" ";)U++}else{let Q=v[0],Y=v[0];P.getWidth(Q)===0&&(b++,Q--),P.getWidth(Y)===2&&(R++,Y++);const ne=P.getString(Y).length;for(ne>1&&(I+=ne-1,U+=ne-1);Q>0&&N>0&&!this._isCharWordSeparator(P.loadCell(Q-1,this._workCell));){P.loadCell(Q-1,this._workCell);const D=this._workCell.getChars().length;this._workCell.getWidth()===0?(b++,Q--):D>1&&(A+=D-1,N-=D-1),N--,Q--}for(;Y<P.length&&U+1<H.length&&!this._isCharWordSeparator(P.loadCell(Y+1,this._workCell));){P.loadCell(Y+1,this._workCell);const D=this._workCell.getChars().length;this._workCell.getWidth()===2?(R++,Y++):D>1&&(I+=D-1,U+=D-1),U++,Y++}}U++;let F=N+O-b+A,q=Math.min(this._bufferService.cols,U-N+b+R-A-I);if(k||H.slice(N,U).trim()!==""){if(B&&F===0&&P.getCodePoint(0)!==32){const Q=T.lines.get(v[1]-1);if(Q&&P.isWrapped&&Q.getCodePoint(this._bufferService.cols-1)!==32){const Y=this._getWordAt([this._bufferService.cols-1,v[1]-1],!1,!0,!1);if(Y){const ne=this._bufferService.cols-Y.start;F-=ne,q+=ne}}}if(M&&F+q===this._bufferService.cols&&P.getCodePoint(this._bufferService.cols-1)!==32){const Q=T.lines.get(v[1]+1);if(Q!=null&&Q.isWrapped&&Q.getCodePoint(0)!==32){const Y=this._getWordAt([0,v[1]+1],!1,!1,!0);Y&&(q+=Y.length)}}return{start:F,length:q}}}_selectWordAt(v,k){const B=this._getWordAt(v,k);if(B){for(;B.start<0;)B.start+=this._bufferService.cols,v[1]--;this._model.selectionStart=[B.start,v[1]],this._model.selectionStartLength=B.length}}_selectToWordAt(v){const k=this._getWordAt(v,!0);if(k){let B=v[1];for(;k.start<0;)k.start+=this._bufferService.cols,B--;if(!this._model.areSelectionValuesReversed())for(;k.start+k.length>this._bufferService.cols;)k.length-=this._bufferService.cols,B++;this._model.selectionEnd=[this._model.areSelectionValuesReversed()?k.start:k.start+k.length,B]}}_isCharWordSeparator(v){return v.getWidth()!==0&&this._optionsService.rawOptions.wordSeparator.indexOf(v.getChars())>=0}_selectLineAt(v){const k=this._bufferService.buffer.getWrappedRangeForLine(v),B={start:{x:0,y:k.first},end:{x:this._bufferService.cols-1,y:k.last}};this._model.selectionStart=[0,k.first],this._model.selectionEnd=void 0,this._model.selectionStartLength=(0,s.getRangeLength)(B,this._bufferService.cols)}};n.SelectionService=E=d([y(3,p.IBufferService),y(4,p.ICoreService),y(5,w.IMouseService),y(6,p.IOptionsService),y(7,w.IRenderService),y(8,w.ICoreBrowserService)],E)},4725:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.IThemeService=n.ICharacterJoinerService=n.ISelectionService=n.IRenderService=n.IMouseService=n.ICoreBrowserService=n.ICharSizeService=void 0;const d=u(8343);n.ICharSizeService=(0,d.createDecorator)("CharSizeService"),n.ICoreBrowserService=(0,d.createDecorator)("CoreBrowserService"),n.IMouseService=(0,d.createDecorator)("MouseService"),n.IRenderService=(0,d.createDecorator)("RenderService"),n.ISelectionService=(0,d.createDecorator)("SelectionService"),n.ICharacterJoinerService=(0,d.createDecorator)("CharacterJoinerService"),n.IThemeService=(0,d.createDecorator)("ThemeService")},6731:function(g,n,u){var d=this&&this.__decorate||function(E,v,k,B){var M,T=arguments.length,P=T<3?v:B===null?B=Object.getOwnPropertyDescriptor(v,k):B;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")P=Reflect.decorate(E,v,k,B);else for(var H=E.length-1;H>=0;H--)(M=E[H])&&(P=(T<3?M(P):T>3?M(v,k,P):M(v,k))||P);return T>3&&P&&Object.defineProperty(v,k,P),P},y=this&&this.__param||function(E,v){return function(k,B){v(k,B,E)}};Object.defineProperty(n,"__esModule",{value:!0}),n.ThemeService=n.DEFAULT_ANSI_COLORS=void 0;const h=u(7239),_=u(8055),S=u(8460),w=u(844),C=u(2585),a=_.css.toColor("#ffffff"),l=_.css.toColor("#000000"),s=_.css.toColor("#ffffff"),o=_.css.toColor("#000000"),p={css:"rgba(255, 255, 255, 0.3)",rgba:4294967117};n.DEFAULT_ANSI_COLORS=Object.freeze((()=>{const E=[_.css.toColor("#2e3436"),_.css.toColor("#cc0000"),_.css.toColor("#4e9a06"),_.css.toColor("#c4a000"),_.css.toColor("#3465a4"),_.css.toColor("#75507b"),_.css.toColor("#06989a"),_.css.toColor("#d3d7cf"),_.css.toColor("#555753"),_.css.toColor("#ef2929"),_.css.toColor("#8ae234"),_.css.toColor("#fce94f"),_.css.toColor("#729fcf"),_.css.toColor("#ad7fa8"),_.css.toColor("#34e2e2"),_.css.toColor("#eeeeec")],v=[0,95,135,175,215,255];for(let k=0;k<216;k++){const B=v[k/36%6|0],M=v[k/6%6|0],T=v[k%6];E.push({css:_.channels.toCss(B,M,T),rgba:_.channels.toRgba(B,M,T)})}for(let k=0;k<24;k++){const B=8+10*k;E.push({css:_.channels.toCss(B,B,B),rgba:_.channels.toRgba(B,B,B)})}return E})());let m=n.ThemeService=class extends w.Disposable{get colors(){return this._colors}constructor(E){super(),this._optionsService=E,this._contrastCache=new h.ColorContrastCache,this._halfContrastCache=new h.ColorContrastCache,this._onChangeColors=this.register(new S.EventEmitter),this.onChangeColors=this._onChangeColors.event,this._colors={foreground:a,background:l,cursor:s,cursorAccent:o,selectionForeground:void 0,selectionBackgroundTransparent:p,selectionBackgroundOpaque:_.color.blend(l,p),selectionInactiveBackgroundTransparent:p,selectionInactiveBackgroundOpaque:_.color.blend(l,p),ansi:n.DEFAULT_ANSI_COLORS.slice(),contrastCache:this._contrastCache,halfContrastCache:this._halfContrastCache},this._updateRestoreColors(),this._setTheme(this._optionsService.rawOptions.theme),this.register(this._optionsService.onSpecificOptionChange("minimumContrastRatio",()=>this._contrastCache.clear())),this.register(this._optionsService.onSpecificOptionChange("theme",()=>this._setTheme(this._optionsService.rawOptions.theme)))}_setTheme(E={}){const v=this._colors;if(v.foreground=x(E.foreground,a),v.background=x(E.background,l),v.cursor=x(E.cursor,s),v.cursorAccent=x(E.cursorAccent,o),v.selectionBackgroundTransparent=x(E.selectionBackground,p),v.selectionBackgroundOpaque=_.color.blend(v.background,v.selectionBackgroundTransparent),v.selectionInactiveBackgroundTransparent=x(E.selectionInactiveBackground,v.selectionBackgroundTransparent),v.selectionInactiveBackgroundOpaque=_.color.blend(v.background,v.selectionInactiveBackgroundTransparent),v.selectionForeground=E.selectionForeground?x(E.selectionForeground,_.NULL_COLOR):void 0,v.selectionForeground===_.NULL_COLOR&&(v.selectionForeground=void 0),_.color.isOpaque(v.selectionBackgroundTransparent)&&(v.selectionBackgroundTransparent=_.color.opacity(v.selectionBackgroundTransparent,.3)),_.color.isOpaque(v.selectionInactiveBackgroundTransparent)&&(v.selectionInactiveBackgroundTransparent=_.color.opacity(v.selectionInactiveBackgroundTransparent,.3)),v.ansi=n.DEFAULT_ANSI_COLORS.slice(),v.ansi[0]=x(E.black,n.DEFAULT_ANSI_COLORS[0]),v.ansi[1]=x(E.red,n.DEFAULT_ANSI_COLORS[1]),v.ansi[2]=x(E.green,n.DEFAULT_ANSI_COLORS[2]),v.ansi[3]=x(E.yellow,n.DEFAULT_ANSI_COLORS[3]),v.ansi[4]=x(E.blue,n.DEFAULT_ANSI_COLORS[4]),v.ansi[5]=x(E.magenta,n.DEFAULT_ANSI_COLORS[5]),v.ansi[6]=x(E.cyan,n.DEFAULT_ANSI_COLORS[6]),v.ansi[7]=x(E.white,n.DEFAULT_ANSI_COLORS[7]),v.ansi[8]=x(E.brightBlack,n.DEFAULT_ANSI_COLORS[8]),v.ansi[9]=x(E.brightRed,n.DEFAULT_ANSI_COLORS[9]),v.ansi[10]=x(E.brightGreen,n.DEFAULT_ANSI_COLORS[10]),v.ansi[11]=x(E.brightYellow,n.DEFAULT_ANSI_COLORS[11]),v.ansi[12]=x(E.brightBlue,n.DEFAULT_ANSI_COLORS[12]),v.ansi[13]=x(E.brightMagenta,n.DEFAULT_ANSI_COLORS[13]),v.ansi[14]=x(E.brightCyan,n.DEFAULT_ANSI_COLORS[14]),v.ansi[15]=x(E.brightWhite,n.DEFAULT_ANSI_COLORS[15]),E.extendedAnsi){const k=Math.min(v.ansi.length-16,E.extendedAnsi.length);for(let B=0;B<k;B++)v.ansi[B+16]=x(E.extendedAnsi[B],n.DEFAULT_ANSI_COLORS[B+16])}this._contrastCache.clear(),this._halfContrastCache.clear(),this._updateRestoreColors(),this._onChangeColors.fire(this.colors)}restoreColor(E){this._restoreColor(E),this._onChangeColors.fire(this.colors)}_restoreColor(E){if(E!==void 0)switch(E){case 256:this._colors.foreground=this._restoreColors.foreground;break;case 257:this._colors.background=this._restoreColors.background;break;case 258:this._colors.cursor=this._restoreColors.cursor;break;default:this._colors.ansi[E]=this._restoreColors.ansi[E]}else for(let v=0;v<this._restoreColors.ansi.length;++v)this._colors.ansi[v]=this._restoreColors.ansi[v]}modifyColors(E){E(this._colors),this._onChangeColors.fire(this.colors)}_updateRestoreColors(){this._restoreColors={foreground:this._colors.foreground,background:this._colors.background,cursor:this._colors.cursor,ansi:this._colors.ansi.slice()}}};function x(E,v){if(E!==void 0)try{return _.css.toColor(E)}catch{}return v}n.ThemeService=m=d([y(0,C.IOptionsService)],m)},6349:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CircularList=void 0;const d=u(8460),y=u(844);class h extends y.Disposable{constructor(S){super(),this._maxLength=S,this.onDeleteEmitter=this.register(new d.EventEmitter),this.onDelete=this.onDeleteEmitter.event,this.onInsertEmitter=this.register(new d.EventEmitter),this.onInsert=this.onInsertEmitter.event,this.onTrimEmitter=this.register(new d.EventEmitter),this.onTrim=this.onTrimEmitter.event,this._array=new Array(this._maxLength),this._startIndex=0,this._length=0}get maxLength(){return this._maxLength}set maxLength(S){if(this._maxLength===S)return;const w=new Array(S);for(let C=0;C<Math.min(S,this.length);C++)w[C]=this._array[this._getCyclicIndex(C)];this._array=w,this._maxLength=S,this._startIndex=0}get length(){return this._length}set length(S){if(S>this._length)for(let w=this._length;w<S;w++)this._array[w]=void 0;this._length=S}get(S){return this._array[this._getCyclicIndex(S)]}set(S,w){this._array[this._getCyclicIndex(S)]=w}push(S){this._array[this._getCyclicIndex(this._length)]=S,this._length===this._maxLength?(this._startIndex=++this._startIndex%this._maxLength,this.onTrimEmitter.fire(1)):this._length++}recycle(){if(this._length!==this._maxLength)throw new Error("Can only recycle when the buffer is full");return this._startIndex=++this._startIndex%this._maxLength,this.onTrimEmitter.fire(1),this._array[this._getCyclicIndex(this._length-1)]}get isFull(){return this._length===this._maxLength}pop(){return this._array[this._getCyclicIndex(this._length---1)]}splice(S,w,...C){if(w){for(let a=S;a<this._length-w;a++)this._array[this._getCyclicIndex(a)]=this._array[this._getCyclicIndex(a+w)];this._length-=w,this.onDeleteEmitter.fire({index:S,amount:w})}for(let a=this._length-1;a>=S;a--)this._array[this._getCyclicIndex(a+C.length)]=this._array[this._getCyclicIndex(a)];for(let a=0;a<C.length;a++)this._array[this._getCyclicIndex(S+a)]=C[a];if(C.length&&this.onInsertEmitter.fire({index:S,amount:C.length}),this._length+C.length>this._maxLength){const a=this._length+C.length-this._maxLength;this._startIndex+=a,this._length=this._maxLength,this.onTrimEmitter.fire(a)}else this._length+=C.length}trimStart(S){S>this._length&&(S=this._length),this._startIndex+=S,this._length-=S,this.onTrimEmitter.fire(S)}shiftElements(S,w,C){if(!(w<=0)){if(S<0||S>=this._length)throw new Error("start argument out of range");if(S+C<0)throw new Error("Cannot shift elements in list beyond index 0");if(C>0){for(let l=w-1;l>=0;l--)this.set(S+l+C,this.get(S+l));const a=S+w+C-this._length;if(a>0)for(this._length+=a;this._length>this._maxLength;)this._length--,this._startIndex++,this.onTrimEmitter.fire(1)}else for(let a=0;a<w;a++)this.set(S+a+C,this.get(S+a))}}_getCyclicIndex(S){return(this._startIndex+S)%this._maxLength}}n.CircularList=h},1439:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.clone=void 0,n.clone=function u(d,y=5){if(typeof d!="object")return d;const h=Array.isArray(d)?[]:{};for(const _ in d)h[_]=y<=1?d[_]:d[_]&&u(d[_],y-1);return h}},8055:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.contrastRatio=n.toPaddedHex=n.rgba=n.rgb=n.css=n.color=n.channels=n.NULL_COLOR=void 0;const d=u(6114);let y=0,h=0,_=0,S=0;var w,C,a,l,s;function o(m){const x=m.toString(16);return x.length<2?"0"+x:x}function p(m,x){return m<x?(x+.05)/(m+.05):(m+.05)/(x+.05)}n.NULL_COLOR={css:"#00000000",rgba:0},function(m){m.toCss=function(x,E,v,k){return k!==void 0?`#${o(x)}${o(E)}${o(v)}${o(k)}`:`#${o(x)}${o(E)}${o(v)}`},m.toRgba=function(x,E,v,k=255){return(x<<24|E<<16|v<<8|k)>>>0}}(w||(n.channels=w={})),function(m){function x(E,v){return S=Math.round(255*v),[y,h,_]=s.toChannels(E.rgba),{css:w.toCss(y,h,_,S),rgba:w.toRgba(y,h,_,S)}}m.blend=function(E,v){if(S=(255&v.rgba)/255,S===1)return{css:v.css,rgba:v.rgba};const k=v.rgba>>24&255,B=v.rgba>>16&255,M=v.rgba>>8&255,T=E.rgba>>24&255,P=E.rgba>>16&255,H=E.rgba>>8&255;return y=T+Math.round((k-T)*S),h=P+Math.round((B-P)*S),_=H+Math.round((M-H)*S),{css:w.toCss(y,h,_),rgba:w.toRgba(y,h,_)}},m.isOpaque=function(E){return(255&E.rgba)==255},m.ensureContrastRatio=function(E,v,k){const B=s.ensureContrastRatio(E.rgba,v.rgba,k);if(B)return s.toColor(B>>24&255,B>>16&255,B>>8&255)},m.opaque=function(E){const v=(255|E.rgba)>>>0;return[y,h,_]=s.toChannels(v),{css:w.toCss(y,h,_),rgba:v}},m.opacity=x,m.multiplyOpacity=function(E,v){return S=255&E.rgba,x(E,S*v/255)},m.toColorRGB=function(E){return[E.rgba>>24&255,E.rgba>>16&255,E.rgba>>8&255]}}(C||(n.color=C={})),function(m){let x,E;if(!d.isNode){const v=document.createElement("canvas");v.width=1,v.height=1;const k=v.getContext("2d",{willReadFrequently:!0});k&&(x=k,x.globalCompositeOperation="copy",E=x.createLinearGradient(0,0,1,1))}m.toColor=function(v){if(v.match(/#[\da-f]{3,8}/i))switch(v.length){case 4:return y=parseInt(v.slice(1,2).repeat(2),16),h=parseInt(v.slice(2,3).repeat(2),16),_=parseInt(v.slice(3,4).repeat(2),16),s.toColor(y,h,_);case 5:return y=parseInt(v.slice(1,2).repeat(2),16),h=parseInt(v.slice(2,3).repeat(2),16),_=parseInt(v.slice(3,4).repeat(2),16),S=parseInt(v.slice(4,5).repeat(2),16),s.toColor(y,h,_,S);case 7:return{css:v,rgba:(parseInt(v.slice(1),16)<<8|255)>>>0};case 9:return{css:v,rgba:parseInt(v.slice(1),16)>>>0}}const k=v.match(/rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(,\s*(0|1|\d?\.(\d+))\s*)?\)/);if(k)return y=parseInt(k[1]),h=parseInt(k[2]),_=parseInt(k[3]),S=Math.round(255*(k[5]===void 0?1:parseFloat(k[5]))),s.toColor(y,h,_,S);if(!x||!E)throw new Error("css.toColor: Unsupported css format");if(x.fillStyle=E,x.fillStyle=v,typeof x.fillStyle!="string")throw new Error("css.toColor: Unsupported css format");if(x.fillRect(0,0,1,1),[y,h,_,S]=x.getImageData(0,0,1,1).data,S!==255)throw new Error("css.toColor: Unsupported css format");return{rgba:w.toRgba(y,h,_,S),css:v}}}(a||(n.css=a={})),function(m){function x(E,v,k){const B=E/255,M=v/255,T=k/255;return .2126*(B<=.03928?B/12.92:Math.pow((B+.055)/1.055,2.4))+.7152*(M<=.03928?M/12.92:Math.pow((M+.055)/1.055,2.4))+.0722*(T<=.03928?T/12.92:Math.pow((T+.055)/1.055,2.4))}m.relativeLuminance=function(E){return x(E>>16&255,E>>8&255,255&E)},m.relativeLuminance2=x}(l||(n.rgb=l={})),function(m){function x(v,k,B){const M=v>>24&255,T=v>>16&255,P=v>>8&255;let H=k>>24&255,N=k>>16&255,U=k>>8&255,O=p(l.relativeLuminance2(H,N,U),l.relativeLuminance2(M,T,P));for(;O<B&&(H>0||N>0||U>0);)H-=Math.max(0,Math.ceil(.1*H)),N-=Math.max(0,Math.ceil(.1*N)),U-=Math.max(0,Math.ceil(.1*U)),O=p(l.relativeLuminance2(H,N,U),l.relativeLuminance2(M,T,P));return(H<<24|N<<16|U<<8|255)>>>0}function E(v,k,B){const M=v>>24&255,T=v>>16&255,P=v>>8&255;let H=k>>24&255,N=k>>16&255,U=k>>8&255,O=p(l.relativeLuminance2(H,N,U),l.relativeLuminance2(M,T,P));for(;O<B&&(H<255||N<255||U<255);)H=Math.min(255,H+Math.ceil(.1*(255-H))),N=Math.min(255,N+Math.ceil(.1*(255-N))),U=Math.min(255,U+Math.ceil(.1*(255-U))),O=p(l.relativeLuminance2(H,N,U),l.relativeLuminance2(M,T,P));return(H<<24|N<<16|U<<8|255)>>>0}m.ensureContrastRatio=function(v,k,B){const M=l.relativeLuminance(v>>8),T=l.relativeLuminance(k>>8);if(p(M,T)<B){if(T<M){const N=x(v,k,B),U=p(M,l.relativeLuminance(N>>8));if(U<B){const O=E(v,k,B);return U>p(M,l.relativeLuminance(O>>8))?N:O}return N}const P=E(v,k,B),H=p(M,l.relativeLuminance(P>>8));if(H<B){const N=x(v,k,B);return H>p(M,l.relativeLuminance(N>>8))?P:N}return P}},m.reduceLuminance=x,m.increaseLuminance=E,m.toChannels=function(v){return[v>>24&255,v>>16&255,v>>8&255,255&v]},m.toColor=function(v,k,B,M){return{css:w.toCss(v,k,B,M),rgba:w.toRgba(v,k,B,M)}}}(s||(n.rgba=s={})),n.toPaddedHex=o,n.contrastRatio=p},8969:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CoreTerminal=void 0;const d=u(844),y=u(2585),h=u(4348),_=u(7866),S=u(744),w=u(7302),C=u(6975),a=u(8460),l=u(1753),s=u(1480),o=u(7994),p=u(9282),m=u(5435),x=u(5981),E=u(2660);let v=!1;class k extends d.Disposable{get onScroll(){return this._onScrollApi||(this._onScrollApi=this.register(new a.EventEmitter),this._onScroll.event(M=>{var T;(T=this._onScrollApi)===null||T===void 0||T.fire(M.position)})),this._onScrollApi.event}get cols(){return this._bufferService.cols}get rows(){return this._bufferService.rows}get buffers(){return this._bufferService.buffers}get options(){return this.optionsService.options}set options(M){for(const T in M)this.optionsService.options[T]=M[T]}constructor(M){super(),this._windowsWrappingHeuristics=this.register(new d.MutableDisposable),this._onBinary=this.register(new a.EventEmitter),this.onBinary=this._onBinary.event,this._onData=this.register(new a.EventEmitter),this.onData=this._onData.event,this._onLineFeed=this.register(new a.EventEmitter),this.onLineFeed=this._onLineFeed.event,this._onResize=this.register(new a.EventEmitter),this.onResize=this._onResize.event,this._onWriteParsed=this.register(new a.EventEmitter),this.onWriteParsed=this._onWriteParsed.event,this._onScroll=this.register(new a.EventEmitter),this._instantiationService=new h.InstantiationService,this.optionsService=this.register(new w.OptionsService(M)),this._instantiationService.setService(y.IOptionsService,this.optionsService),this._bufferService=this.register(this._instantiationService.createInstance(S.BufferService)),this._instantiationService.setService(y.IBufferService,this._bufferService),this._logService=this.register(this._instantiationService.createInstance(_.LogService)),this._instantiationService.setService(y.ILogService,this._logService),this.coreService=this.register(this._instantiationService.createInstance(C.CoreService)),this._instantiationService.setService(y.ICoreService,this.coreService),this.coreMouseService=this.register(this._instantiationService.createInstance(l.CoreMouseService)),this._instantiationService.setService(y.ICoreMouseService,this.coreMouseService),this.unicodeService=this.register(this._instantiationService.createInstance(s.UnicodeService)),this._instantiationService.setService(y.IUnicodeService,this.unicodeService),this._charsetService=this._instantiationService.createInstance(o.CharsetService),this._instantiationService.setService(y.ICharsetService,this._charsetService),this._oscLinkService=this._instantiationService.createInstance(E.OscLinkService),this._instantiationService.setService(y.IOscLinkService,this._oscLinkService),this._inputHandler=this.register(new m.InputHandler(this._bufferService,this._charsetService,this.coreService,this._logService,this.optionsService,this._oscLinkService,this.coreMouseService,this.unicodeService)),this.register((0,a.forwardEvent)(this._inputHandler.onLineFeed,this._onLineFeed)),this.register(this._inputHandler),this.register((0,a.forwardEvent)(this._bufferService.onResize,this._onResize)),this.register((0,a.forwardEvent)(this.coreService.onData,this._onData)),this.register((0,a.forwardEvent)(this.coreService.onBinary,this._onBinary)),this.register(this.coreService.onRequestScrollToBottom(()=>this.scrollToBottom())),this.register(this.coreService.onUserInput(()=>this._writeBuffer.handleUserInput())),this.register(this.optionsService.onMultipleOptionChange(["windowsMode","windowsPty"],()=>this._handleWindowsPtyOptionChange())),this.register(this._bufferService.onScroll(T=>{this._onScroll.fire({position:this._bufferService.buffer.ydisp,source:0}),this._inputHandler.markRangeDirty(this._bufferService.buffer.scrollTop,this._bufferService.buffer.scrollBottom)})),this.register(this._inputHandler.onScroll(T=>{this._onScroll.fire({position:this._bufferService.buffer.ydisp,source:0}),this._inputHandler.markRangeDirty(this._bufferService.buffer.scrollTop,this._bufferService.buffer.scrollBottom)})),this._writeBuffer=this.register(new x.WriteBuffer((T,P)=>this._inputHandler.parse(T,P))),this.register((0,a.forwardEvent)(this._writeBuffer.onWriteParsed,this._onWriteParsed))}write(M,T){this._writeBuffer.write(M,T)}writeSync(M,T){this._logService.logLevel<=y.LogLevelEnum.WARN&&!v&&(this._logService.warn("writeSync is unreliable and will be removed soon."),v=!0),this._writeBuffer.writeSync(M,T)}resize(M,T){isNaN(M)||isNaN(T)||(M=Math.max(M,S.MINIMUM_COLS),T=Math.max(T,S.MINIMUM_ROWS),this._bufferService.resize(M,T))}scroll(M,T=!1){this._bufferService.scroll(M,T)}scrollLines(M,T,P){this._bufferService.scrollLines(M,T,P)}scrollPages(M){this.scrollLines(M*(this.rows-1))}scrollToTop(){this.scrollLines(-this._bufferService.buffer.ydisp)}scrollToBottom(){this.scrollLines(this._bufferService.buffer.ybase-this._bufferService.buffer.ydisp)}scrollToLine(M){const T=M-this._bufferService.buffer.ydisp;T!==0&&this.scrollLines(T)}registerEscHandler(M,T){return this._inputHandler.registerEscHandler(M,T)}registerDcsHandler(M,T){return this._inputHandler.registerDcsHandler(M,T)}registerCsiHandler(M,T){return this._inputHandler.registerCsiHandler(M,T)}registerOscHandler(M,T){return this._inputHandler.registerOscHandler(M,T)}_setup(){this._handleWindowsPtyOptionChange()}reset(){this._inputHandler.reset(),this._bufferService.reset(),this._charsetService.reset(),this.coreService.reset(),this.coreMouseService.reset()}_handleWindowsPtyOptionChange(){let M=!1;const T=this.optionsService.rawOptions.windowsPty;T&&T.buildNumber!==void 0&&T.buildNumber!==void 0?M=T.backend==="conpty"&&T.buildNumber<21376:this.optionsService.rawOptions.windowsMode&&(M=!0),M?this._enableWindowsWrappingHeuristics():this._windowsWrappingHeuristics.clear()}_enableWindowsWrappingHeuristics(){if(!this._windowsWrappingHeuristics.value){const M=[];M.push(this.onLineFeed(p.updateWindowsModeWrappedState.bind(null,this._bufferService))),M.push(this.registerCsiHandler({final:"H"},()=>((0,p.updateWindowsModeWrappedState)(this._bufferService),!1))),this._windowsWrappingHeuristics.value=(0,d.toDisposable)(()=>{for(const T of M)T.dispose()})}}}n.CoreTerminal=k},8460:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.forwardEvent=n.EventEmitter=void 0,n.EventEmitter=class{constructor(){this._listeners=[],this._disposed=!1}get event(){return this._event||(this._event=u=>(this._listeners.push(u),{dispose:()=>{if(!this._disposed){for(let d=0;d<this._listeners.length;d++)if(this._listeners[d]===u)return void this._listeners.splice(d,1)}}})),this._event}fire(u,d){const y=[];for(let h=0;h<this._listeners.length;h++)y.push(this._listeners[h]);for(let h=0;h<y.length;h++)y[h].call(void 0,u,d)}dispose(){this.clearListeners(),this._disposed=!0}clearListeners(){this._listeners&&(this._listeners.length=0)}},n.forwardEvent=function(u,d){return u(y=>d.fire(y))}},5435:function(g,n,u){var d=this&&this.__decorate||function(O,b,R,A){var I,F=arguments.length,q=F<3?b:A===null?A=Object.getOwnPropertyDescriptor(b,R):A;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")q=Reflect.decorate(O,b,R,A);else for(var Q=O.length-1;Q>=0;Q--)(I=O[Q])&&(q=(F<3?I(q):F>3?I(b,R,q):I(b,R))||q);return F>3&&q&&Object.defineProperty(b,R,q),q},y=this&&this.__param||function(O,b){return function(R,A){b(R,A,O)}};Object.defineProperty(n,"__esModule",{value:!0}),n.InputHandler=n.WindowsOptionsReportType=void 0;const h=u(2584),_=u(7116),S=u(2015),w=u(844),C=u(482),a=u(8437),l=u(8460),s=u(643),o=u(511),p=u(3734),m=u(2585),x=u(6242),E=u(6351),v=u(5941),k={"(":0,")":1,"*":2,"+":3,"-":1,".":2},B=131072;function M(O,b){if(O>24)return b.setWinLines||!1;switch(O){case 1:return!!b.restoreWin;case 2:return!!b.minimizeWin;case 3:return!!b.setWinPosition;case 4:return!!b.setWinSizePixels;case 5:return!!b.raiseWin;case 6:return!!b.lowerWin;case 7:return!!b.refreshWin;case 8:return!!b.setWinSizeChars;case 9:return!!b.maximizeWin;case 10:return!!b.fullscreenWin;case 11:return!!b.getWinState;case 13:return!!b.getWinPosition;case 14:return!!b.getWinSizePixels;case 15:return!!b.getScreenSizePixels;case 16:return!!b.getCellSizePixels;case 18:return!!b.getWinSizeChars;case 19:return!!b.getScreenSizeChars;case 20:return!!b.getIconTitle;case 21:return!!b.getWinTitle;case 22:return!!b.pushTitle;case 23:return!!b.popTitle;case 24:return!!b.setWinLines}return!1}var T;(function(O){O[O.GET_WIN_SIZE_PIXELS=0]="GET_WIN_SIZE_PIXELS",O[O.GET_CELL_SIZE_PIXELS=1]="GET_CELL_SIZE_PIXELS"})(T||(n.WindowsOptionsReportType=T={}));let P=0;class H extends w.Disposable{getAttrData(){return this._curAttrData}constructor(b,R,A,I,F,q,Q,Y,ne=new S.EscapeSequenceParser){super(),this._bufferService=b,this._charsetService=R,this._coreService=A,this._logService=I,this._optionsService=F,this._oscLinkService=q,this._coreMouseService=Q,this._unicodeService=Y,this._parser=ne,this._parseBuffer=new Uint32Array(4096),this._stringDecoder=new C.StringToUtf32,this._utf8Decoder=new C.Utf8ToUtf32,this._workCell=new o.CellData,this._windowTitle="",this._iconName="",this._windowTitleStack=[],this._iconNameStack=[],this._curAttrData=a.DEFAULT_ATTR_DATA.clone(),this._eraseAttrDataInternal=a.DEFAULT_ATTR_DATA.clone(),this._onRequestBell=this.register(new l.EventEmitter),this.onRequestBell=this._onRequestBell.event,this._onRequestRefreshRows=this.register(new l.EventEmitter),this.onRequestRefreshRows=this._onRequestRefreshRows.event,this._onRequestReset=this.register(new l.EventEmitter),this.onRequestReset=this._onRequestReset.event,this._onRequestSendFocus=this.register(new l.EventEmitter),this.onRequestSendFocus=this._onRequestSendFocus.event,this._onRequestSyncScrollBar=this.register(new l.EventEmitter),this.onRequestSyncScrollBar=this._onRequestSyncScrollBar.event,this._onRequestWindowsOptionsReport=this.register(new l.EventEmitter),this.onRequestWindowsOptionsReport=this._onRequestWindowsOptionsReport.event,this._onA11yChar=this.register(new l.EventEmitter),this.onA11yChar=this._onA11yChar.event,this._onA11yTab=this.register(new l.EventEmitter),this.onA11yTab=this._onA11yTab.event,this._onCursorMove=this.register(new l.EventEmitter),this.onCursorMove=this._onCursorMove.event,this._onLineFeed=this.register(new l.EventEmitter),this.onLineFeed=this._onLineFeed.event,this._onScroll=this.register(new l.EventEmitter),this.onScroll=this._onScroll.event,this._onTitleChange=this.register(new l.EventEmitter),this.onTitleChange=this._onTitleChange.event,this._onColor=this.register(new l.EventEmitter),this.onColor=this._onColor.event,this._parseStack={paused:!1,cursorStartX:0,cursorStartY:0,decodedLength:0,position:0},this._specialColors=[256,257,258],this.register(this._parser),this._dirtyRowTracker=new N(this._bufferService),this._activeBuffer=this._bufferService.buffer,this.register(this._bufferService.buffers.onBufferActivate(D=>this._activeBuffer=D.activeBuffer)),this._parser.setCsiHandlerFallback((D,j)=>{this._logService.debug("Unknown CSI code: ",{identifier:this._parser.identToString(D),params:j.toArray()})}),this._parser.setEscHandlerFallback(D=>{this._logService.debug("Unknown ESC code: ",{identifier:this._parser.identToString(D)})}),this._parser.setExecuteHandlerFallback(D=>{this._logService.debug("Unknown EXECUTE code: ",{code:D})}),this._parser.setOscHandlerFallback((D,j,W)=>{this._logService.debug("Unknown OSC code: ",{identifier:D,action:j,data:W})}),this._parser.setDcsHandlerFallback((D,j,W)=>{j==="HOOK"&&(W=W.toArray()),this._logService.debug("Unknown DCS code: ",{identifier:this._parser.identToString(D),action:j,payload:W})}),this._parser.setPrintHandler((D,j,W)=>this.print(D,j,W)),this._parser.registerCsiHandler({final:"@"},D=>this.insertChars(D)),this._parser.registerCsiHandler({intermediates:" ",final:"@"},D=>this.scrollLeft(D)),this._parser.registerCsiHandler({final:"A"},D=>this.cursorUp(D)),this._parser.registerCsiHandler({intermediates:" ",final:"A"},D=>this.scrollRight(D)),this._parser.registerCsiHandler({final:"B"},D=>this.cursorDown(D)),this._parser.registerCsiHandler({final:"C"},D=>this.cursorForward(D)),this._parser.registerCsiHandler({final:"D"},D=>this.cursorBackward(D)),this._parser.registerCsiHandler({final:"E"},D=>this.cursorNextLine(D)),this._parser.registerCsiHandler({final:"F"},D=>this.cursorPrecedingLine(D)),this._parser.registerCsiHandler({final:"G"},D=>this.cursorCharAbsolute(D)),this._parser.registerCsiHandler({final:"H"},D=>this.cursorPosition(D)),this._parser.registerCsiHandler({final:"I"},D=>this.cursorForwardTab(D)),this._parser.registerCsiHandler({final:"J"},D=>this.eraseInDisplay(D,!1)),this._parser.registerCsiHandler({prefix:"?",final:"J"},D=>this.eraseInDisplay(D,!0)),this._parser.registerCsiHandler({final:"K"},D=>this.eraseInLine(D,!1)),this._parser.registerCsiHandler({prefix:"?",final:"K"},D=>this.eraseInLine(D,!0)),this._parser.registerCsiHandler({final:"L"},D=>this.insertLines(D)),this._parser.registerCsiHandler({final:"M"},D=>this.deleteLines(D)),this._parser.registerCsiHandler({final:"P"},D=>this.deleteChars(D)),this._parser.registerCsiHandler({final:"S"},D=>this.scrollUp(D)),this._parser.registerCsiHandler({final:"T"},D=>this.scrollDown(D)),this._parser.registerCsiHandler({final:"X"},D=>this.eraseChars(D)),this._parser.registerCsiHandler({final:"Z"},D=>this.cursorBackwardTab(D)),this._parser.registerCsiHandler({final:"`"},D=>this.charPosAbsolute(D)),this._parser.registerCsiHandler({final:"a"},D=>this.hPositionRelative(D)),this._parser.registerCsiHandler({final:"b"},D=>this.repeatPrecedingCharacter(D)),this._parser.registerCsiHandler({final:"c"},D=>this.sendDeviceAttributesPrimary(D)),this._parser.registerCsiHandler({prefix:">",final:"c"},D=>this.sendDeviceAttributesSecondary(D)),this._parser.registerCsiHandler({final:"d"},D=>this.linePosAbsolute(D)),this._parser.registerCsiHandler({final:"e"},D=>this.vPositionRelative(D)),this._parser.registerCsiHandler({final:"f"},D=>this.hVPosition(D)),this._parser.registerCsiHandler({final:"g"},D=>this.tabClear(D)),this._parser.registerCsiHandler({final:"h"},D=>this.setMode(D)),this._parser.registerCsiHandler({prefix:"?",final:"h"},D=>this.setModePrivate(D)),this._parser.registerCsiHandler({final:"l"},D=>this.resetMode(D)),this._parser.registerCsiHandler({prefix:"?",final:"l"},D=>this.resetModePrivate(D)),this._parser.registerCsiHandler({final:"m"},D=>this.charAttributes(D)),this._parser.registerCsiHandler({final:"n"},D=>this.deviceStatus(D)),this._parser.registerCsiHandler({prefix:"?",final:"n"},D=>this.deviceStatusPrivate(D)),this._parser.registerCsiHandler({intermediates:"!",final:"p"},D=>this.softReset(D)),this._parser.registerCsiHandler({intermediates:" ",final:"q"},D=>this.setCursorStyle(D)),this._parser.registerCsiHandler({final:"r"},D=>this.setScrollRegion(D)),this._parser.registerCsiHandler({final:"s"},D=>this.saveCursor(D)),this._parser.registerCsiHandler({final:"t"},D=>this.windowOptions(D)),this._parser.registerCsiHandler({final:"u"},D=>this.restoreCursor(D)),this._parser.registerCsiHandler({intermediates:"'",final:"}"},D=>this.insertColumns(D)),this._parser.registerCsiHandler({intermediates:"'",final:"~"},D=>this.deleteColumns(D)),this._parser.registerCsiHandler({intermediates:'"',final:"q"},D=>this.selectProtected(D)),this._parser.registerCsiHandler({intermediates:"$",final:"p"},D=>this.requestMode(D,!0)),this._parser.registerCsiHandler({prefix:"?",intermediates:"$",final:"p"},D=>this.requestMode(D,!1)),this._parser.setExecuteHandler(h.C0.BEL,()=>this.bell()),this._parser.setExecuteHandler(h.C0.LF,()=>this.lineFeed()),this._parser.setExecuteHandler(h.C0.VT,()=>this.lineFeed()),this._parser.setExecuteHandler(h.C0.FF,()=>this.lineFeed()),this._parser.setExecuteHandler(h.C0.CR,()=>this.carriageReturn()),this._parser.setExecuteHandler(h.C0.BS,()=>this.backspace()),this._parser.setExecuteHandler(h.C0.HT,()=>this.tab()),this._parser.setExecuteHandler(h.C0.SO,()=>this.shiftOut()),this._parser.setExecuteHandler(h.C0.SI,()=>this.shiftIn()),this._parser.setExecuteHandler(h.C1.IND,()=>this.index()),this._parser.setExecuteHandler(h.C1.NEL,()=>this.nextLine()),this._parser.setExecuteHandler(h.C1.HTS,()=>this.tabSet()),this._parser.registerOscHandler(0,new x.OscHandler(D=>(this.setTitle(D),this.setIconName(D),!0))),this._parser.registerOscHandler(1,new x.OscHandler(D=>this.setIconName(D))),this._parser.registerOscHandler(2,new x.OscHandler(D=>this.setTitle(D))),this._parser.registerOscHandler(4,new x.OscHandler(D=>this.setOrReportIndexedColor(D))),this._parser.registerOscHandler(8,new x.OscHandler(D=>this.setHyperlink(D))),this._parser.registerOscHandler(10,new x.OscHandler(D=>this.setOrReportFgColor(D))),this._parser.registerOscHandler(11,new x.OscHandler(D=>this.setOrReportBgColor(D))),this._parser.registerOscHandler(12,new x.OscHandler(D=>this.setOrReportCursorColor(D))),this._parser.registerOscHandler(104,new x.OscHandler(D=>this.restoreIndexedColor(D))),this._parser.registerOscHandler(110,new x.OscHandler(D=>this.restoreFgColor(D))),this._parser.registerOscHandler(111,new x.OscHandler(D=>this.restoreBgColor(D))),this._parser.registerOscHandler(112,new x.OscHandler(D=>this.restoreCursorColor(D))),this._parser.registerEscHandler({final:"7"},()=>this.saveCursor()),this._parser.registerEscHandler({final:"8"},()=>this.restoreCursor()),this._parser.registerEscHandler({final:"D"},()=>this.index()),this._parser.registerEscHandler({final:"E"},()=>this.nextLine()),this._parser.registerEscHandler({final:"H"},()=>this.tabSet()),this._parser.registerEscHandler({final:"M"},()=>this.reverseIndex()),this._parser.registerEscHandler({final:"="},()=>this.keypadApplicationMode()),this._parser.registerEscHandler({final:">"},()=>this.keypadNumericMode()),this._parser.registerEscHandler({final:"c"},()=>this.fullReset()),this._parser.registerEscHandler({final:"n"},()=>this.setgLevel(2)),this._parser.registerEscHandler({final:"o"},()=>this.setgLevel(3)),this._parser.registerEscHandler({final:"|"},()=>this.setgLevel(3)),this._parser.registerEscHandler({final:"}"},()=>this.setgLevel(2)),this._parser.registerEscHandler({final:"~"},()=>this.setgLevel(1)),this._parser.registerEscHandler({intermediates:"%",final:"@"},()=>this.selectDefaultCharset()),this._parser.registerEscHandler({intermediates:"%",final:"G"},()=>this.selectDefaultCharset());for(const D in _.CHARSETS)this._parser.registerEscHandler({intermediates:"(",final:D},()=>this.selectCharset("("+D)),this._parser.registerEscHandler({intermediates:")",final:D},()=>this.selectCharset(")"+D)),this._parser.registerEscHandler({intermediates:"*",final:D},()=>this.selectCharset("*"+D)),this._parser.registerEscHandler({intermediates:"+",final:D},()=>this.selectCharset("+"+D)),this._parser.registerEscHandler({intermediates:"-",final:D},()=>this.selectCharset("-"+D)),this._parser.registerEscHandler({intermediates:".",final:D},()=>this.selectCharset("."+D)),this._parser.registerEscHandler({intermediates:"/",final:D},()=>this.selectCharset("/"+D));this._parser.registerEscHandler({intermediates:"#",final:"8"},()=>this.screenAlignmentPattern()),this._parser.setErrorHandler(D=>(this._logService.error("Parsing error: ",D),D)),this._parser.registerDcsHandler({intermediates:"$",final:"q"},new E.DcsHandler((D,j)=>this.requestStatusString(D,j)))}_preserveStack(b,R,A,I){this._parseStack.paused=!0,this._parseStack.cursorStartX=b,this._parseStack.cursorStartY=R,this._parseStack.decodedLength=A,this._parseStack.position=I}_logSlowResolvingAsync(b){this._logService.logLevel<=m.LogLevelEnum.WARN&&Promise.race([b,new Promise((R,A)=>setTimeout(()=>A("#SLOW_TIMEOUT"),5e3))]).catch(R=>{if(R!=="#SLOW_TIMEOUT")throw R;console.warn("async parser handler taking longer than 5000 ms")})}_getCurrentLinkId(){return this._curAttrData.extended.urlId}parse(b,R){let A,I=this._activeBuffer.x,F=this._activeBuffer.y,q=0;const Q=this._parseStack.paused;if(Q){if(A=this._parser.parse(this._parseBuffer,this._parseStack.decodedLength,R))return this._logSlowResolvingAsync(A),A;I=this._parseStack.cursorStartX,F=this._parseStack.cursorStartY,this._parseStack.paused=!1,b.length>B&&(q=this._parseStack.position+B)}if(this._logService.logLevel<=m.LogLevelEnum.DEBUG&&this._logService.debug("parsing data"+(typeof b=="string"?` "${b}"`:` "${Array.prototype.map.call(b,Y=>String.fromCharCode(Y)).join("")}"`),typeof b=="string"?b.split("").map(Y=>Y.charCodeAt(0)):b),this._parseBuffer.length<b.length&&this._parseBuffer.length<B&&(this._parseBuffer=new Uint32Array(Math.min(b.length,B))),Q||this._dirtyRowTracker.clearRange(),b.length>B)for(let Y=q;Y<b.length;Y+=B){const ne=Y+B<b.length?Y+B:b.length,D=typeof b=="string"?this._stringDecoder.decode(b.substring(Y,ne),this._parseBuffer):this._utf8Decoder.decode(b.subarray(Y,ne),this._parseBuffer);if(A=this._parser.parse(this._parseBuffer,D))return this._preserveStack(I,F,D,Y),this._logSlowResolvingAsync(A),A}else if(!Q){const Y=typeof b=="string"?this._stringDecoder.decode(b,this._parseBuffer):this._utf8Decoder.decode(b,this._parseBuffer);if(A=this._parser.parse(this._parseBuffer,Y))return this._preserveStack(I,F,Y,0),this._logSlowResolvingAsync(A),A}this._activeBuffer.x===I&&this._activeBuffer.y===F||this._onCursorMove.fire(),this._onRequestRefreshRows.fire(this._dirtyRowTracker.start,this._dirtyRowTracker.end)}print(b,R,A){let I,F;const q=this._charsetService.charset,Q=this._optionsService.rawOptions.screenReaderMode,Y=this._bufferService.cols,ne=this._coreService.decPrivateModes.wraparound,D=this._coreService.modes.insertMode,j=this._curAttrData;let W=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._activeBuffer.x&&A-R>0&&W.getWidth(this._activeBuffer.x-1)===2&&W.setCellFromCodePoint(this._activeBuffer.x-1,0,1,j.fg,j.bg,j.extended);for(let z=R;z<A;++z){if(I=b[z],F=this._unicodeService.wcwidth(I),I<127&&q){const Z=q[String.fromCharCode(I)];Z&&(I=Z.charCodeAt(0))}if(Q&&this._onA11yChar.fire((0,C.stringFromCodePoint)(I)),this._getCurrentLinkId()&&this._oscLinkService.addLineToLink(this._getCurrentLinkId(),this._activeBuffer.ybase+this._activeBuffer.y),F||!this._activeBuffer.x){if(this._activeBuffer.x+F-1>=Y){if(ne){for(;this._activeBuffer.x<Y;)W.setCellFromCodePoint(this._activeBuffer.x++,0,1,j.fg,j.bg,j.extended);this._activeBuffer.x=0,this._activeBuffer.y++,this._activeBuffer.y===this._activeBuffer.scrollBottom+1?(this._activeBuffer.y--,this._bufferService.scroll(this._eraseAttrData(),!0)):(this._activeBuffer.y>=this._bufferService.rows&&(this._activeBuffer.y=this._bufferService.rows-1),this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y).isWrapped=!0),W=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y)}else if(this._activeBuffer.x=Y-1,F===2)continue}if(D&&(W.insertCells(this._activeBuffer.x,F,this._activeBuffer.getNullCell(j),j),W.getWidth(Y-1)===2&&W.setCellFromCodePoint(Y-1,s.NULL_CELL_CODE,s.NULL_CELL_WIDTH,j.fg,j.bg,j.extended)),W.setCellFromCodePoint(this._activeBuffer.x++,I,F,j.fg,j.bg,j.extended),F>0)for(;--F;)W.setCellFromCodePoint(this._activeBuffer.x++,0,0,j.fg,j.bg,j.extended)}else W.getWidth(this._activeBuffer.x-1)?W.addCodepointToCell(this._activeBuffer.x-1,I):W.addCodepointToCell(this._activeBuffer.x-2,I)}A-R>0&&(W.loadCell(this._activeBuffer.x-1,this._workCell),this._workCell.getWidth()===2||this._workCell.getCode()>65535?this._parser.precedingCodepoint=0:this._workCell.isCombined()?this._parser.precedingCodepoint=this._workCell.getChars().charCodeAt(0):this._parser.precedingCodepoint=this._workCell.content),this._activeBuffer.x<Y&&A-R>0&&W.getWidth(this._activeBuffer.x)===0&&!W.hasContent(this._activeBuffer.x)&&W.setCellFromCodePoint(this._activeBuffer.x,0,1,j.fg,j.bg,j.extended),this._dirtyRowTracker.markDirty(this._activeBuffer.y)}registerCsiHandler(b,R){return b.final!=="t"||b.prefix||b.intermediates?this._parser.registerCsiHandler(b,R):this._parser.registerCsiHandler(b,A=>!M(A.params[0],this._optionsService.rawOptions.windowOptions)||R(A))}registerDcsHandler(b,R){return this._parser.registerDcsHandler(b,new E.DcsHandler(R))}registerEscHandler(b,R){return this._parser.registerEscHandler(b,R)}registerOscHandler(b,R){return this._parser.registerOscHandler(b,new x.OscHandler(R))}bell(){return this._onRequestBell.fire(),!0}lineFeed(){return this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._optionsService.rawOptions.convertEol&&(this._activeBuffer.x=0),this._activeBuffer.y++,this._activeBuffer.y===this._activeBuffer.scrollBottom+1?(this._activeBuffer.y--,this._bufferService.scroll(this._eraseAttrData())):this._activeBuffer.y>=this._bufferService.rows?this._activeBuffer.y=this._bufferService.rows-1:this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y).isWrapped=!1,this._activeBuffer.x>=this._bufferService.cols&&this._activeBuffer.x--,this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._onLineFeed.fire(),!0}carriageReturn(){return this._activeBuffer.x=0,!0}backspace(){var b;if(!this._coreService.decPrivateModes.reverseWraparound)return this._restrictCursor(),this._activeBuffer.x>0&&this._activeBuffer.x--,!0;if(this._restrictCursor(this._bufferService.cols),this._activeBuffer.x>0)this._activeBuffer.x--;else if(this._activeBuffer.x===0&&this._activeBuffer.y>this._activeBuffer.scrollTop&&this._activeBuffer.y<=this._activeBuffer.scrollBottom&&(!((b=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y))===null||b===void 0)&&b.isWrapped)){this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y).isWrapped=!1,this._activeBuffer.y--,this._activeBuffer.x=this._bufferService.cols-1;const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);R.hasWidth(this._activeBuffer.x)&&!R.hasContent(this._activeBuffer.x)&&this._activeBuffer.x--}return this._restrictCursor(),!0}tab(){if(this._activeBuffer.x>=this._bufferService.cols)return!0;const b=this._activeBuffer.x;return this._activeBuffer.x=this._activeBuffer.nextStop(),this._optionsService.rawOptions.screenReaderMode&&this._onA11yTab.fire(this._activeBuffer.x-b),!0}shiftOut(){return this._charsetService.setgLevel(1),!0}shiftIn(){return this._charsetService.setgLevel(0),!0}_restrictCursor(b=this._bufferService.cols-1){this._activeBuffer.x=Math.min(b,Math.max(0,this._activeBuffer.x)),this._activeBuffer.y=this._coreService.decPrivateModes.origin?Math.min(this._activeBuffer.scrollBottom,Math.max(this._activeBuffer.scrollTop,this._activeBuffer.y)):Math.min(this._bufferService.rows-1,Math.max(0,this._activeBuffer.y)),this._dirtyRowTracker.markDirty(this._activeBuffer.y)}_setCursor(b,R){this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._coreService.decPrivateModes.origin?(this._activeBuffer.x=b,this._activeBuffer.y=this._activeBuffer.scrollTop+R):(this._activeBuffer.x=b,this._activeBuffer.y=R),this._restrictCursor(),this._dirtyRowTracker.markDirty(this._activeBuffer.y)}_moveCursor(b,R){this._restrictCursor(),this._setCursor(this._activeBuffer.x+b,this._activeBuffer.y+R)}cursorUp(b){const R=this._activeBuffer.y-this._activeBuffer.scrollTop;return R>=0?this._moveCursor(0,-Math.min(R,b.params[0]||1)):this._moveCursor(0,-(b.params[0]||1)),!0}cursorDown(b){const R=this._activeBuffer.scrollBottom-this._activeBuffer.y;return R>=0?this._moveCursor(0,Math.min(R,b.params[0]||1)):this._moveCursor(0,b.params[0]||1),!0}cursorForward(b){return this._moveCursor(b.params[0]||1,0),!0}cursorBackward(b){return this._moveCursor(-(b.params[0]||1),0),!0}cursorNextLine(b){return this.cursorDown(b),this._activeBuffer.x=0,!0}cursorPrecedingLine(b){return this.cursorUp(b),this._activeBuffer.x=0,!0}cursorCharAbsolute(b){return this._setCursor((b.params[0]||1)-1,this._activeBuffer.y),!0}cursorPosition(b){return this._setCursor(b.length>=2?(b.params[1]||1)-1:0,(b.params[0]||1)-1),!0}charPosAbsolute(b){return this._setCursor((b.params[0]||1)-1,this._activeBuffer.y),!0}hPositionRelative(b){return this._moveCursor(b.params[0]||1,0),!0}linePosAbsolute(b){return this._setCursor(this._activeBuffer.x,(b.params[0]||1)-1),!0}vPositionRelative(b){return this._moveCursor(0,b.params[0]||1),!0}hVPosition(b){return this.cursorPosition(b),!0}tabClear(b){const R=b.params[0];return R===0?delete this._activeBuffer.tabs[this._activeBuffer.x]:R===3&&(this._activeBuffer.tabs={}),!0}cursorForwardTab(b){if(this._activeBuffer.x>=this._bufferService.cols)return!0;let R=b.params[0]||1;for(;R--;)this._activeBuffer.x=this._activeBuffer.nextStop();return!0}cursorBackwardTab(b){if(this._activeBuffer.x>=this._bufferService.cols)return!0;let R=b.params[0]||1;for(;R--;)this._activeBuffer.x=this._activeBuffer.prevStop();return!0}selectProtected(b){const R=b.params[0];return R===1&&(this._curAttrData.bg|=536870912),R!==2&&R!==0||(this._curAttrData.bg&=-536870913),!0}_eraseInBufferLine(b,R,A,I=!1,F=!1){const q=this._activeBuffer.lines.get(this._activeBuffer.ybase+b);q.replaceCells(R,A,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData(),F),I&&(q.isWrapped=!1)}_resetBufferLine(b,R=!1){const A=this._activeBuffer.lines.get(this._activeBuffer.ybase+b);A&&(A.fill(this._activeBuffer.getNullCell(this._eraseAttrData()),R),this._bufferService.buffer.clearMarkers(this._activeBuffer.ybase+b),A.isWrapped=!1)}eraseInDisplay(b,R=!1){let A;switch(this._restrictCursor(this._bufferService.cols),b.params[0]){case 0:for(A=this._activeBuffer.y,this._dirtyRowTracker.markDirty(A),this._eraseInBufferLine(A++,this._activeBuffer.x,this._bufferService.cols,this._activeBuffer.x===0,R);A<this._bufferService.rows;A++)this._resetBufferLine(A,R);this._dirtyRowTracker.markDirty(A);break;case 1:for(A=this._activeBuffer.y,this._dirtyRowTracker.markDirty(A),this._eraseInBufferLine(A,0,this._activeBuffer.x+1,!0,R),this._activeBuffer.x+1>=this._bufferService.cols&&(this._activeBuffer.lines.get(A+1).isWrapped=!1);A--;)this._resetBufferLine(A,R);this._dirtyRowTracker.markDirty(0);break;case 2:for(A=this._bufferService.rows,this._dirtyRowTracker.markDirty(A-1);A--;)this._resetBufferLine(A,R);this._dirtyRowTracker.markDirty(0);break;case 3:const I=this._activeBuffer.lines.length-this._bufferService.rows;I>0&&(this._activeBuffer.lines.trimStart(I),this._activeBuffer.ybase=Math.max(this._activeBuffer.ybase-I,0),this._activeBuffer.ydisp=Math.max(this._activeBuffer.ydisp-I,0),this._onScroll.fire(0))}return!0}eraseInLine(b,R=!1){switch(this._restrictCursor(this._bufferService.cols),b.params[0]){case 0:this._eraseInBufferLine(this._activeBuffer.y,this._activeBuffer.x,this._bufferService.cols,this._activeBuffer.x===0,R);break;case 1:this._eraseInBufferLine(this._activeBuffer.y,0,this._activeBuffer.x+1,!1,R);break;case 2:this._eraseInBufferLine(this._activeBuffer.y,0,this._bufferService.cols,!0,R)}return this._dirtyRowTracker.markDirty(this._activeBuffer.y),!0}insertLines(b){this._restrictCursor();let R=b.params[0]||1;if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const A=this._activeBuffer.ybase+this._activeBuffer.y,I=this._bufferService.rows-1-this._activeBuffer.scrollBottom,F=this._bufferService.rows-1+this._activeBuffer.ybase-I+1;for(;R--;)this._activeBuffer.lines.splice(F-1,1),this._activeBuffer.lines.splice(A,0,this._activeBuffer.getBlankLine(this._eraseAttrData()));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.y,this._activeBuffer.scrollBottom),this._activeBuffer.x=0,!0}deleteLines(b){this._restrictCursor();let R=b.params[0]||1;if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const A=this._activeBuffer.ybase+this._activeBuffer.y;let I;for(I=this._bufferService.rows-1-this._activeBuffer.scrollBottom,I=this._bufferService.rows-1+this._activeBuffer.ybase-I;R--;)this._activeBuffer.lines.splice(A,1),this._activeBuffer.lines.splice(I,0,this._activeBuffer.getBlankLine(this._eraseAttrData()));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.y,this._activeBuffer.scrollBottom),this._activeBuffer.x=0,!0}insertChars(b){this._restrictCursor();const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);return R&&(R.insertCells(this._activeBuffer.x,b.params[0]||1,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),this._dirtyRowTracker.markDirty(this._activeBuffer.y)),!0}deleteChars(b){this._restrictCursor();const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);return R&&(R.deleteCells(this._activeBuffer.x,b.params[0]||1,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),this._dirtyRowTracker.markDirty(this._activeBuffer.y)),!0}scrollUp(b){let R=b.params[0]||1;for(;R--;)this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollTop,1),this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollBottom,0,this._activeBuffer.getBlankLine(this._eraseAttrData()));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}scrollDown(b){let R=b.params[0]||1;for(;R--;)this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollBottom,1),this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollTop,0,this._activeBuffer.getBlankLine(a.DEFAULT_ATTR_DATA));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}scrollLeft(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const I=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);I.deleteCells(0,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),I.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}scrollRight(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const I=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);I.insertCells(0,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),I.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}insertColumns(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const I=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);I.insertCells(this._activeBuffer.x,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),I.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}deleteColumns(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const I=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);I.deleteCells(this._activeBuffer.x,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),I.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}eraseChars(b){this._restrictCursor();const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);return R&&(R.replaceCells(this._activeBuffer.x,this._activeBuffer.x+(b.params[0]||1),this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),this._dirtyRowTracker.markDirty(this._activeBuffer.y)),!0}repeatPrecedingCharacter(b){if(!this._parser.precedingCodepoint)return!0;const R=b.params[0]||1,A=new Uint32Array(R);for(let I=0;I<R;++I)A[I]=this._parser.precedingCodepoint;return this.print(A,0,A.length),!0}sendDeviceAttributesPrimary(b){return b.params[0]>0||(this._is("xterm")||this._is("rxvt-unicode")||this._is("screen")?this._coreService.triggerDataEvent(h.C0.ESC+"[?1;2c"):this._is("linux")&&this._coreService.triggerDataEvent(h.C0.ESC+"[?6c")),!0}sendDeviceAttributesSecondary(b){return b.params[0]>0||(this._is("xterm")?this._coreService.triggerDataEvent(h.C0.ESC+"[>0;276;0c"):this._is("rxvt-unicode")?this._coreService.triggerDataEvent(h.C0.ESC+"[>85;95;0c"):this._is("linux")?this._coreService.triggerDataEvent(b.params[0]+"c"):this._is("screen")&&this._coreService.triggerDataEvent(h.C0.ESC+"[>83;40003;0c")),!0}_is(b){return(this._optionsService.rawOptions.termName+"").indexOf(b)===0}setMode(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 4:this._coreService.modes.insertMode=!0;break;case 20:this._optionsService.options.convertEol=!0}return!0}setModePrivate(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 1:this._coreService.decPrivateModes.applicationCursorKeys=!0;break;case 2:this._charsetService.setgCharset(0,_.DEFAULT_CHARSET),this._charsetService.setgCharset(1,_.DEFAULT_CHARSET),this._charsetService.setgCharset(2,_.DEFAULT_CHARSET),this._charsetService.setgCharset(3,_.DEFAULT_CHARSET);break;case 3:this._optionsService.rawOptions.windowOptions.setWinLines&&(this._bufferService.resize(132,this._bufferService.rows),this._onRequestReset.fire());break;case 6:this._coreService.decPrivateModes.origin=!0,this._setCursor(0,0);break;case 7:this._coreService.decPrivateModes.wraparound=!0;break;case 12:this._optionsService.options.cursorBlink=!0;break;case 45:this._coreService.decPrivateModes.reverseWraparound=!0;break;case 66:this._logService.debug("Serial port requested application keypad."),this._coreService.decPrivateModes.applicationKeypad=!0,this._onRequestSyncScrollBar.fire();break;case 9:this._coreMouseService.activeProtocol="X10";break;case 1e3:this._coreMouseService.activeProtocol="VT200";break;case 1002:this._coreMouseService.activeProtocol="DRAG";break;case 1003:this._coreMouseService.activeProtocol="ANY";break;case 1004:this._coreService.decPrivateModes.sendFocus=!0,this._onRequestSendFocus.fire();break;case 1005:this._logService.debug("DECSET 1005 not supported (see #2507)");break;case 1006:this._coreMouseService.activeEncoding="SGR";break;case 1015:this._logService.debug("DECSET 1015 not supported (see #2507)");break;case 1016:this._coreMouseService.activeEncoding="SGR_PIXELS";break;case 25:this._coreService.isCursorHidden=!1;break;case 1048:this.saveCursor();break;case 1049:this.saveCursor();case 47:case 1047:this._bufferService.buffers.activateAltBuffer(this._eraseAttrData()),this._coreService.isCursorInitialized=!0,this._onRequestRefreshRows.fire(0,this._bufferService.rows-1),this._onRequestSyncScrollBar.fire();break;case 2004:this._coreService.decPrivateModes.bracketedPasteMode=!0}return!0}resetMode(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 4:this._coreService.modes.insertMode=!1;break;case 20:this._optionsService.options.convertEol=!1}return!0}resetModePrivate(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 1:this._coreService.decPrivateModes.applicationCursorKeys=!1;break;case 3:this._optionsService.rawOptions.windowOptions.setWinLines&&(this._bufferService.resize(80,this._bufferService.rows),this._onRequestReset.fire());break;case 6:this._coreService.decPrivateModes.origin=!1,this._setCursor(0,0);break;case 7:this._coreService.decPrivateModes.wraparound=!1;break;case 12:this._optionsService.options.cursorBlink=!1;break;case 45:this._coreService.decPrivateModes.reverseWraparound=!1;break;case 66:this._logService.debug("Switching back to normal keypad."),this._coreService.decPrivateModes.applicationKeypad=!1,this._onRequestSyncScrollBar.fire();break;case 9:case 1e3:case 1002:case 1003:this._coreMouseService.activeProtocol="NONE";break;case 1004:this._coreService.decPrivateModes.sendFocus=!1;break;case 1005:this._logService.debug("DECRST 1005 not supported (see #2507)");break;case 1006:case 1016:this._coreMouseService.activeEncoding="DEFAULT";break;case 1015:this._logService.debug("DECRST 1015 not supported (see #2507)");break;case 25:this._coreService.isCursorHidden=!0;break;case 1048:this.restoreCursor();break;case 1049:case 47:case 1047:this._bufferService.buffers.activateNormalBuffer(),b.params[R]===1049&&this.restoreCursor(),this._coreService.isCursorInitialized=!0,this._onRequestRefreshRows.fire(0,this._bufferService.rows-1),this._onRequestSyncScrollBar.fire();break;case 2004:this._coreService.decPrivateModes.bracketedPasteMode=!1}return!0}requestMode(b,R){const A=this._coreService.decPrivateModes,{activeProtocol:I,activeEncoding:F}=this._coreMouseService,q=this._coreService,{buffers:Q,cols:Y}=this._bufferService,{active:ne,alt:D}=Q,j=this._optionsService.rawOptions,W=oe=>oe?1:2,z=b.params[0];return Z=z,G=R?z===2?4:z===4?W(q.modes.insertMode):z===12?3:z===20?W(j.convertEol):0:z===1?W(A.applicationCursorKeys):z===3?j.windowOptions.setWinLines?Y===80?2:Y===132?1:0:0:z===6?W(A.origin):z===7?W(A.wraparound):z===8?3:z===9?W(I==="X10"):z===12?W(j.cursorBlink):z===25?W(!q.isCursorHidden):z===45?W(A.reverseWraparound):z===66?W(A.applicationKeypad):z===67?4:z===1e3?W(I==="VT200"):z===1002?W(I==="DRAG"):z===1003?W(I==="ANY"):z===1004?W(A.sendFocus):z===1005?4:z===1006?W(F==="SGR"):z===1015?4:z===1016?W(F==="SGR_PIXELS"):z===1048?1:z===47||z===1047||z===1049?W(ne===D):z===2004?W(A.bracketedPasteMode):0,q.triggerDataEvent(`${h.C0.ESC}[${R?"":"?"}${Z};${G}$y`),!0;var Z,G}_updateAttrColor(b,R,A,I,F){return R===2?(b|=50331648,b&=-16777216,b|=p.AttributeData.fromColorRGB([A,I,F])):R===5&&(b&=-50331904,b|=33554432|255&A),b}_extractColor(b,R,A){const I=[0,0,-1,0,0,0];let F=0,q=0;do{if(I[q+F]=b.params[R+q],b.hasSubParams(R+q)){const Q=b.getSubParams(R+q);let Y=0;do I[1]===5&&(F=1),I[q+Y+1+F]=Q[Y];while(++Y<Q.length&&Y+q+1+F<I.length);break}if(I[1]===5&&q+F>=2||I[1]===2&&q+F>=5)break;I[1]&&(F=1)}while(++q+R<b.length&&q+F<I.length);for(let Q=2;Q<I.length;++Q)I[Q]===-1&&(I[Q]=0);switch(I[0]){case 38:A.fg=this._updateAttrColor(A.fg,I[1],I[3],I[4],I[5]);break;case 48:A.bg=this._updateAttrColor(A.bg,I[1],I[3],I[4],I[5]);break;case 58:A.extended=A.extended.clone(),A.extended.underlineColor=this._updateAttrColor(A.extended.underlineColor,I[1],I[3],I[4],I[5])}return q}_processUnderline(b,R){R.extended=R.extended.clone(),(!~b||b>5)&&(b=1),R.extended.underlineStyle=b,R.fg|=268435456,b===0&&(R.fg&=-268435457),R.updateExtended()}_processSGR0(b){b.fg=a.DEFAULT_ATTR_DATA.fg,b.bg=a.DEFAULT_ATTR_DATA.bg,b.extended=b.extended.clone(),b.extended.underlineStyle=0,b.extended.underlineColor&=-67108864,b.updateExtended()}charAttributes(b){if(b.length===1&&b.params[0]===0)return this._processSGR0(this._curAttrData),!0;const R=b.length;let A;const I=this._curAttrData;for(let F=0;F<R;F++)A=b.params[F],A>=30&&A<=37?(I.fg&=-50331904,I.fg|=16777216|A-30):A>=40&&A<=47?(I.bg&=-50331904,I.bg|=16777216|A-40):A>=90&&A<=97?(I.fg&=-50331904,I.fg|=16777224|A-90):A>=100&&A<=107?(I.bg&=-50331904,I.bg|=16777224|A-100):A===0?this._processSGR0(I):A===1?I.fg|=134217728:A===3?I.bg|=67108864:A===4?(I.fg|=268435456,this._processUnderline(b.hasSubParams(F)?b.getSubParams(F)[0]:1,I)):A===5?I.fg|=536870912:A===7?I.fg|=67108864:A===8?I.fg|=1073741824:A===9?I.fg|=2147483648:A===2?I.bg|=134217728:A===21?this._processUnderline(2,I):A===22?(I.fg&=-134217729,I.bg&=-134217729):A===23?I.bg&=-67108865:A===24?(I.fg&=-268435457,this._processUnderline(0,I)):A===25?I.fg&=-536870913:A===27?I.fg&=-67108865:A===28?I.fg&=-1073741825:A===29?I.fg&=2147483647:A===39?(I.fg&=-67108864,I.fg|=16777215&a.DEFAULT_ATTR_DATA.fg):A===49?(I.bg&=-67108864,I.bg|=16777215&a.DEFAULT_ATTR_DATA.bg):A===38||A===48||A===58?F+=this._extractColor(b,F,I):A===53?I.bg|=1073741824:A===55?I.bg&=-1073741825:A===59?(I.extended=I.extended.clone(),I.extended.underlineColor=-1,I.updateExtended()):A===100?(I.fg&=-67108864,I.fg|=16777215&a.DEFAULT_ATTR_DATA.fg,I.bg&=-67108864,I.bg|=16777215&a.DEFAULT_ATTR_DATA.bg):this._logService.debug("Unknown SGR attribute: %d.",A);return!0}deviceStatus(b){switch(b.params[0]){case 5:this._coreService.triggerDataEvent(`${h.C0.ESC}[0n`);break;case 6:const R=this._activeBuffer.y+1,A=this._activeBuffer.x+1;this._coreService.triggerDataEvent(`${h.C0.ESC}[${R};${A}R`)}return!0}deviceStatusPrivate(b){if(b.params[0]===6){const R=this._activeBuffer.y+1,A=this._activeBuffer.x+1;this._coreService.triggerDataEvent(`${h.C0.ESC}[?${R};${A}R`)}return!0}softReset(b){return this._coreService.isCursorHidden=!1,this._onRequestSyncScrollBar.fire(),this._activeBuffer.scrollTop=0,this._activeBuffer.scrollBottom=this._bufferService.rows-1,this._curAttrData=a.DEFAULT_ATTR_DATA.clone(),this._coreService.reset(),this._charsetService.reset(),this._activeBuffer.savedX=0,this._activeBuffer.savedY=this._activeBuffer.ybase,this._activeBuffer.savedCurAttrData.fg=this._curAttrData.fg,this._activeBuffer.savedCurAttrData.bg=this._curAttrData.bg,this._activeBuffer.savedCharset=this._charsetService.charset,this._coreService.decPrivateModes.origin=!1,!0}setCursorStyle(b){const R=b.params[0]||1;switch(R){case 1:case 2:this._optionsService.options.cursorStyle="block";break;case 3:case 4:this._optionsService.options.cursorStyle="underline";break;case 5:case 6:this._optionsService.options.cursorStyle="bar"}const A=R%2==1;return this._optionsService.options.cursorBlink=A,!0}setScrollRegion(b){const R=b.params[0]||1;let A;return(b.length<2||(A=b.params[1])>this._bufferService.rows||A===0)&&(A=this._bufferService.rows),A>R&&(this._activeBuffer.scrollTop=R-1,this._activeBuffer.scrollBottom=A-1,this._setCursor(0,0)),!0}windowOptions(b){if(!M(b.params[0],this._optionsService.rawOptions.windowOptions))return!0;const R=b.length>1?b.params[1]:0;switch(b.params[0]){case 14:R!==2&&this._onRequestWindowsOptionsReport.fire(T.GET_WIN_SIZE_PIXELS);break;case 16:this._onRequestWindowsOptionsReport.fire(T.GET_CELL_SIZE_PIXELS);break;case 18:this._bufferService&&this._coreService.triggerDataEvent(`${h.C0.ESC}[8;${this._bufferService.rows};${this._bufferService.cols}t`);break;case 22:R!==0&&R!==2||(this._windowTitleStack.push(this._windowTitle),this._windowTitleStack.length>10&&this._windowTitleStack.shift()),R!==0&&R!==1||(this._iconNameStack.push(this._iconName),this._iconNameStack.length>10&&this._iconNameStack.shift());break;case 23:R!==0&&R!==2||this._windowTitleStack.length&&this.setTitle(this._windowTitleStack.pop()),R!==0&&R!==1||this._iconNameStack.length&&this.setIconName(this._iconNameStack.pop())}return!0}saveCursor(b){return this._activeBuffer.savedX=this._activeBuffer.x,this._activeBuffer.savedY=this._activeBuffer.ybase+this._activeBuffer.y,this._activeBuffer.savedCurAttrData.fg=this._curAttrData.fg,this._activeBuffer.savedCurAttrData.bg=this._curAttrData.bg,this._activeBuffer.savedCharset=this._charsetService.charset,!0}restoreCursor(b){return this._activeBuffer.x=this._activeBuffer.savedX||0,this._activeBuffer.y=Math.max(this._activeBuffer.savedY-this._activeBuffer.ybase,0),this._curAttrData.fg=this._activeBuffer.savedCurAttrData.fg,this._curAttrData.bg=this._activeBuffer.savedCurAttrData.bg,this._charsetService.charset=this._savedCharset,this._activeBuffer.savedCharset&&(this._charsetService.charset=this._activeBuffer.savedCharset),this._restrictCursor(),!0}setTitle(b){return this._windowTitle=b,this._onTitleChange.fire(b),!0}setIconName(b){return this._iconName=b,!0}setOrReportIndexedColor(b){const R=[],A=b.split(";");for(;A.length>1;){const I=A.shift(),F=A.shift();if(/^\d+$/.exec(I)){const q=parseInt(I);if(U(q))if(F==="?")R.push({type:0,index:q});else{const Q=(0,v.parseColor)(F);Q&&R.push({type:1,index:q,color:Q})}}}return R.length&&this._onColor.fire(R),!0}setHyperlink(b){const R=b.split(";");return!(R.length<2)&&(R[1]?this._createHyperlink(R[0],R[1]):!R[0]&&this._finishHyperlink())}_createHyperlink(b,R){this._getCurrentLinkId()&&this._finishHyperlink();const A=b.split(":");let I;const F=A.findIndex(q=>q.startsWith("id="));return F!==-1&&(I=A[F].slice(3)||void 0),this._curAttrData.extended=this._curAttrData.extended.clone(),this._curAttrData.extended.urlId=this._oscLinkService.registerLink({id:I,uri:R}),this._curAttrData.updateExtended(),!0}_finishHyperlink(){return this._curAttrData.extended=this._curAttrData.extended.clone(),this._curAttrData.extended.urlId=0,this._curAttrData.updateExtended(),!0}_setOrReportSpecialColor(b,R){const A=b.split(";");for(let I=0;I<A.length&&!(R>=this._specialColors.length);++I,++R)if(A[I]==="?")this._onColor.fire([{type:0,index:this._specialColors[R]}]);else{const F=(0,v.parseColor)(A[I]);F&&this._onColor.fire([{type:1,index:this._specialColors[R],color:F}])}return!0}setOrReportFgColor(b){return this._setOrReportSpecialColor(b,0)}setOrReportBgColor(b){return this._setOrReportSpecialColor(b,1)}setOrReportCursorColor(b){return this._setOrReportSpecialColor(b,2)}restoreIndexedColor(b){if(!b)return this._onColor.fire([{type:2}]),!0;const R=[],A=b.split(";");for(let I=0;I<A.length;++I)if(/^\d+$/.exec(A[I])){const F=parseInt(A[I]);U(F)&&R.push({type:2,index:F})}return R.length&&this._onColor.fire(R),!0}restoreFgColor(b){return this._onColor.fire([{type:2,index:256}]),!0}restoreBgColor(b){return this._onColor.fire([{type:2,index:257}]),!0}restoreCursorColor(b){return this._onColor.fire([{type:2,index:258}]),!0}nextLine(){return this._activeBuffer.x=0,this.index(),!0}keypadApplicationMode(){return this._logService.debug("Serial port requested application keypad."),this._coreService.decPrivateModes.applicationKeypad=!0,this._onRequestSyncScrollBar.fire(),!0}keypadNumericMode(){return this._logService.debug("Switching back to normal keypad."),this._coreService.decPrivateModes.applicationKeypad=!1,this._onRequestSyncScrollBar.fire(),!0}selectDefaultCharset(){return this._charsetService.setgLevel(0),this._charsetService.setgCharset(0,_.DEFAULT_CHARSET),!0}selectCharset(b){return b.length!==2?(this.selectDefaultCharset(),!0):(b[0]==="/"||this._charsetService.setgCharset(k[b[0]],_.CHARSETS[b[1]]||_.DEFAULT_CHARSET),!0)}index(){return this._restrictCursor(),this._activeBuffer.y++,this._activeBuffer.y===this._activeBuffer.scrollBottom+1?(this._activeBuffer.y--,this._bufferService.scroll(this._eraseAttrData())):this._activeBuffer.y>=this._bufferService.rows&&(this._activeBuffer.y=this._bufferService.rows-1),this._restrictCursor(),!0}tabSet(){return this._activeBuffer.tabs[this._activeBuffer.x]=!0,!0}reverseIndex(){if(this._restrictCursor(),this._activeBuffer.y===this._activeBuffer.scrollTop){const b=this._activeBuffer.scrollBottom-this._activeBuffer.scrollTop;this._activeBuffer.lines.shiftElements(this._activeBuffer.ybase+this._activeBuffer.y,b,1),this._activeBuffer.lines.set(this._activeBuffer.ybase+this._activeBuffer.y,this._activeBuffer.getBlankLine(this._eraseAttrData())),this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom)}else this._activeBuffer.y--,this._restrictCursor();return!0}fullReset(){return this._parser.reset(),this._onRequestReset.fire(),!0}reset(){this._curAttrData=a.DEFAULT_ATTR_DATA.clone(),this._eraseAttrDataInternal=a.DEFAULT_ATTR_DATA.clone()}_eraseAttrData(){return this._eraseAttrDataInternal.bg&=-67108864,this._eraseAttrDataInternal.bg|=67108863&this._curAttrData.bg,this._eraseAttrDataInternal}setgLevel(b){return this._charsetService.setgLevel(b),!0}screenAlignmentPattern(){const b=new o.CellData;b.content=4194373,b.fg=this._curAttrData.fg,b.bg=this._curAttrData.bg,this._setCursor(0,0);for(let R=0;R<this._bufferService.rows;++R){const A=this._activeBuffer.ybase+this._activeBuffer.y+R,I=this._activeBuffer.lines.get(A);I&&(I.fill(b),I.isWrapped=!1)}return this._dirtyRowTracker.markAllDirty(),this._setCursor(0,0),!0}requestStatusString(b,R){const A=this._bufferService.buffer,I=this._optionsService.rawOptions;return(F=>(this._coreService.triggerDataEvent(`${h.C0.ESC}${F}${h.C0.ESC}\\`),!0))(b==='"q'?`P1$r${this._curAttrData.isProtected()?1:0}"q`:b==='"p'?'P1$r61;1"p':b==="r"?`P1$r${A.scrollTop+1};${A.scrollBottom+1}r`:b==="m"?"P1$r0m":b===" q"?`P1$r${{block:2,underline:4,bar:6}[I.cursorStyle]-(I.cursorBlink?1:0)} q`:"P0$r")}markRangeDirty(b,R){this._dirtyRowTracker.markRangeDirty(b,R)}}n.InputHandler=H;let N=class{constructor(O){this._bufferService=O,this.clearRange()}clearRange(){this.start=this._bufferService.buffer.y,this.end=this._bufferService.buffer.y}markDirty(O){O<this.start?this.start=O:O>this.end&&(this.end=O)}markRangeDirty(O,b){O>b&&(P=O,O=b,b=P),O<this.start&&(this.start=O),b>this.end&&(this.end=b)}markAllDirty(){this.markRangeDirty(0,this._bufferService.rows-1)}};function U(O){return 0<=O&&O<256}N=d([y(0,m.IBufferService)],N)},844:(g,n)=>{function u(d){for(const y of d)y.dispose();d.length=0}Object.defineProperty(n,"__esModule",{value:!0}),n.getDisposeArrayDisposable=n.disposeArray=n.toDisposable=n.MutableDisposable=n.Disposable=void 0,n.Disposable=class{constructor(){this._disposables=[],this._isDisposed=!1}dispose(){this._isDisposed=!0;for(const d of this._disposables)d.dispose();this._disposables.length=0}register(d){return this._disposables.push(d),d}unregister(d){const y=this._disposables.indexOf(d);y!==-1&&this._disposables.splice(y,1)}},n.MutableDisposable=class{constructor(){this._isDisposed=!1}get value(){return this._isDisposed?void 0:this._value}set value(d){var y;this._isDisposed||d===this._value||((y=this._value)===null||y===void 0||y.dispose(),this._value=d)}clear(){this.value=void 0}dispose(){var d;this._isDisposed=!0,(d=this._value)===null||d===void 0||d.dispose(),this._value=void 0}},n.toDisposable=function(d){return{dispose:d}},n.disposeArray=u,n.getDisposeArrayDisposable=function(d){return{dispose:()=>u(d)}}},1505:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.FourKeyMap=n.TwoKeyMap=void 0;class u{constructor(){this._data={}}set(y,h,_){this._data[y]||(this._data[y]={}),this._data[y][h]=_}get(y,h){return this._data[y]?this._data[y][h]:void 0}clear(){this._data={}}}n.TwoKeyMap=u,n.FourKeyMap=class{constructor(){this._data=new u}set(d,y,h,_,S){this._data.get(d,y)||this._data.set(d,y,new u),this._data.get(d,y).set(h,_,S)}get(d,y,h,_){var S;return(S=this._data.get(d,y))===null||S===void 0?void 0:S.get(h,_)}clear(){this._data.clear()}}},6114:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.isChromeOS=n.isLinux=n.isWindows=n.isIphone=n.isIpad=n.isMac=n.getSafariVersion=n.isSafari=n.isLegacyEdge=n.isFirefox=n.isNode=void 0,n.isNode=typeof navigator>"u";const u=n.isNode?"node":navigator.userAgent,d=n.isNode?"node":navigator.platform;n.isFirefox=u.includes("Firefox"),n.isLegacyEdge=u.includes("Edge"),n.isSafari=/^((?!chrome|android).)*safari/i.test(u),n.getSafariVersion=function(){if(!n.isSafari)return 0;const y=u.match(/Version\/(\d+)/);return y===null||y.length<2?0:parseInt(y[1])},n.isMac=["Macintosh","MacIntel","MacPPC","Mac68K"].includes(d),n.isIpad=d==="iPad",n.isIphone=d==="iPhone",n.isWindows=["Windows","Win16","Win32","WinCE"].includes(d),n.isLinux=d.indexOf("Linux")>=0,n.isChromeOS=/\bCrOS\b/.test(u)},6106:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.SortedList=void 0;let u=0;n.SortedList=class{constructor(d){this._getKey=d,this._array=[]}clear(){this._array.length=0}insert(d){this._array.length!==0?(u=this._search(this._getKey(d)),this._array.splice(u,0,d)):this._array.push(d)}delete(d){if(this._array.length===0)return!1;const y=this._getKey(d);if(y===void 0||(u=this._search(y),u===-1)||this._getKey(this._array[u])!==y)return!1;do if(this._array[u]===d)return this._array.splice(u,1),!0;while(++u<this._array.length&&this._getKey(this._array[u])===y);return!1}*getKeyIterator(d){if(this._array.length!==0&&(u=this._search(d),!(u<0||u>=this._array.length)&&this._getKey(this._array[u])===d))do yield this._array[u];while(++u<this._array.length&&this._getKey(this._array[u])===d)}forEachByKey(d,y){if(this._array.length!==0&&(u=this._search(d),!(u<0||u>=this._array.length)&&this._getKey(this._array[u])===d))do y(this._array[u]);while(++u<this._array.length&&this._getKey(this._array[u])===d)}values(){return[...this._array].values()}_search(d){let y=0,h=this._array.length-1;for(;h>=y;){let _=y+h>>1;const S=this._getKey(this._array[_]);if(S>d)h=_-1;else{if(!(S<d)){for(;_>0&&this._getKey(this._array[_-1])===d;)_--;return _}y=_+1}}return y}}},7226:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DebouncedIdleTask=n.IdleTaskQueue=n.PriorityTaskQueue=void 0;const d=u(6114);class y{constructor(){this._tasks=[],this._i=0}enqueue(S){this._tasks.push(S),this._start()}flush(){for(;this._i<this._tasks.length;)this._tasks[this._i]()||this._i++;this.clear()}clear(){this._idleCallback&&(this._cancelCallback(this._idleCallback),this._idleCallback=void 0),this._i=0,this._tasks.length=0}_start(){this._idleCallback||(this._idleCallback=this._requestCallback(this._process.bind(this)))}_process(S){this._idleCallback=void 0;let w=0,C=0,a=S.timeRemaining(),l=0;for(;this._i<this._tasks.length;){if(w=Date.now(),this._tasks[this._i]()||this._i++,w=Math.max(1,Date.now()-w),C=Math.max(w,C),l=S.timeRemaining(),1.5*C>l)return a-w<-20&&console.warn(`task queue exceeded allotted deadline by ${Math.abs(Math.round(a-w))}ms`),void this._start();a=l}this.clear()}}class h extends y{_requestCallback(S){return setTimeout(()=>S(this._createDeadline(16)))}_cancelCallback(S){clearTimeout(S)}_createDeadline(S){const w=Date.now()+S;return{timeRemaining:()=>Math.max(0,w-Date.now())}}}n.PriorityTaskQueue=h,n.IdleTaskQueue=!d.isNode&&"requestIdleCallback"in window?class extends y{_requestCallback(_){return requestIdleCallback(_)}_cancelCallback(_){cancelIdleCallback(_)}}:h,n.DebouncedIdleTask=class{constructor(){this._queue=new n.IdleTaskQueue}set(_){this._queue.clear(),this._queue.enqueue(_)}flush(){this._queue.flush()}}},9282:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.updateWindowsModeWrappedState=void 0;const d=u(643);n.updateWindowsModeWrappedState=function(y){const h=y.buffer.lines.get(y.buffer.ybase+y.buffer.y-1),_=h==null?void 0:h.get(y.cols-1),S=y.buffer.lines.get(y.buffer.ybase+y.buffer.y);S&&_&&(S.isWrapped=_[d.CHAR_DATA_CODE_INDEX]!==d.NULL_CELL_CODE&&_[d.CHAR_DATA_CODE_INDEX]!==d.WHITESPACE_CELL_CODE)}},3734:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ExtendedAttrs=n.AttributeData=void 0;class u{constructor(){this.fg=0,this.bg=0,this.extended=new d}static toColorRGB(h){return[h>>>16&255,h>>>8&255,255&h]}static fromColorRGB(h){return(255&h[0])<<16|(255&h[1])<<8|255&h[2]}clone(){const h=new u;return h.fg=this.fg,h.bg=this.bg,h.extended=this.extended.clone(),h}isInverse(){return 67108864&this.fg}isBold(){return 134217728&this.fg}isUnderline(){return this.hasExtendedAttrs()&&this.extended.underlineStyle!==0?1:268435456&this.fg}isBlink(){return 536870912&this.fg}isInvisible(){return 1073741824&this.fg}isItalic(){return 67108864&this.bg}isDim(){return 134217728&this.bg}isStrikethrough(){return 2147483648&this.fg}isProtected(){return 536870912&this.bg}isOverline(){return 1073741824&this.bg}getFgColorMode(){return 50331648&this.fg}getBgColorMode(){return 50331648&this.bg}isFgRGB(){return(50331648&this.fg)==50331648}isBgRGB(){return(50331648&this.bg)==50331648}isFgPalette(){return(50331648&this.fg)==16777216||(50331648&this.fg)==33554432}isBgPalette(){return(50331648&this.bg)==16777216||(50331648&this.bg)==33554432}isFgDefault(){return(50331648&this.fg)==0}isBgDefault(){return(50331648&this.bg)==0}isAttributeDefault(){return this.fg===0&&this.bg===0}getFgColor(){switch(50331648&this.fg){case 16777216:case 33554432:return 255&this.fg;case 50331648:return 16777215&this.fg;default:return-1}}getBgColor(){switch(50331648&this.bg){case 16777216:case 33554432:return 255&this.bg;case 50331648:return 16777215&this.bg;default:return-1}}hasExtendedAttrs(){return 268435456&this.bg}updateExtended(){this.extended.isEmpty()?this.bg&=-268435457:this.bg|=268435456}getUnderlineColor(){if(268435456&this.bg&&~this.extended.underlineColor)switch(50331648&this.extended.underlineColor){case 16777216:case 33554432:return 255&this.extended.underlineColor;case 50331648:return 16777215&this.extended.underlineColor;default:return this.getFgColor()}return this.getFgColor()}getUnderlineColorMode(){return 268435456&this.bg&&~this.extended.underlineColor?50331648&this.extended.underlineColor:this.getFgColorMode()}isUnderlineColorRGB(){return 268435456&this.bg&&~this.extended.underlineColor?(50331648&this.extended.underlineColor)==50331648:this.isFgRGB()}isUnderlineColorPalette(){return 268435456&this.bg&&~this.extended.underlineColor?(50331648&this.extended.underlineColor)==16777216||(50331648&this.extended.underlineColor)==33554432:this.isFgPalette()}isUnderlineColorDefault(){return 268435456&this.bg&&~this.extended.underlineColor?(50331648&this.extended.underlineColor)==0:this.isFgDefault()}getUnderlineStyle(){return 268435456&this.fg?268435456&this.bg?this.extended.underlineStyle:1:0}}n.AttributeData=u;class d{get ext(){return this._urlId?-469762049&this._ext|this.underlineStyle<<26:this._ext}set ext(h){this._ext=h}get underlineStyle(){return this._urlId?5:(469762048&this._ext)>>26}set underlineStyle(h){this._ext&=-469762049,this._ext|=h<<26&469762048}get underlineColor(){return 67108863&this._ext}set underlineColor(h){this._ext&=-67108864,this._ext|=67108863&h}get urlId(){return this._urlId}set urlId(h){this._urlId=h}constructor(h=0,_=0){this._ext=0,this._urlId=0,this._ext=h,this._urlId=_}clone(){return new d(this._ext,this._urlId)}isEmpty(){return this.underlineStyle===0&&this._urlId===0}}n.ExtendedAttrs=d},9092:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Buffer=n.MAX_BUFFER_SIZE=void 0;const d=u(6349),y=u(7226),h=u(3734),_=u(8437),S=u(4634),w=u(511),C=u(643),a=u(4863),l=u(7116);n.MAX_BUFFER_SIZE=4294967295,n.Buffer=class{constructor(s,o,p){this._hasScrollback=s,this._optionsService=o,this._bufferService=p,this.ydisp=0,this.ybase=0,this.y=0,this.x=0,this.tabs={},this.savedY=0,this.savedX=0,this.savedCurAttrData=_.DEFAULT_ATTR_DATA.clone(),this.savedCharset=l.DEFAULT_CHARSET,this.markers=[],this._nullCell=w.CellData.fromCharData([0,C.NULL_CELL_CHAR,C.NULL_CELL_WIDTH,C.NULL_CELL_CODE]),this._whitespaceCell=w.CellData.fromCharData([0,C.WHITESPACE_CELL_CHAR,C.WHITESPACE_CELL_WIDTH,C.WHITESPACE_CELL_CODE]),this._isClearing=!1,this._memoryCleanupQueue=new y.IdleTaskQueue,this._memoryCleanupPosition=0,this._cols=this._bufferService.cols,this._rows=this._bufferService.rows,this.lines=new d.CircularList(this._getCorrectBufferLength(this._rows)),this.scrollTop=0,this.scrollBottom=this._rows-1,this.setupTabStops()}getNullCell(s){return s?(this._nullCell.fg=s.fg,this._nullCell.bg=s.bg,this._nullCell.extended=s.extended):(this._nullCell.fg=0,this._nullCell.bg=0,this._nullCell.extended=new h.ExtendedAttrs),this._nullCell}getWhitespaceCell(s){return s?(this._whitespaceCell.fg=s.fg,this._whitespaceCell.bg=s.bg,this._whitespaceCell.extended=s.extended):(this._whitespaceCell.fg=0,this._whitespaceCell.bg=0,this._whitespaceCell.extended=new h.ExtendedAttrs),this._whitespaceCell}getBlankLine(s,o){return new _.BufferLine(this._bufferService.cols,this.getNullCell(s),o)}get hasScrollback(){return this._hasScrollback&&this.lines.maxLength>this._rows}get isCursorInViewport(){const s=this.ybase+this.y-this.ydisp;return s>=0&&s<this._rows}_getCorrectBufferLength(s){if(!this._hasScrollback)return s;const o=s+this._optionsService.rawOptions.scrollback;return o>n.MAX_BUFFER_SIZE?n.MAX_BUFFER_SIZE:o}fillViewportRows(s){if(this.lines.length===0){s===void 0&&(s=_.DEFAULT_ATTR_DATA);let o=this._rows;for(;o--;)this.lines.push(this.getBlankLine(s))}}clear(){this.ydisp=0,this.ybase=0,this.y=0,this.x=0,this.lines=new d.CircularList(this._getCorrectBufferLength(this._rows)),this.scrollTop=0,this.scrollBottom=this._rows-1,this.setupTabStops()}resize(s,o){const p=this.getNullCell(_.DEFAULT_ATTR_DATA);let m=0;const x=this._getCorrectBufferLength(o);if(x>this.lines.maxLength&&(this.lines.maxLength=x),this.lines.length>0){if(this._cols<s)for(let v=0;v<this.lines.length;v++)m+=+this.lines.get(v).resize(s,p);let E=0;if(this._rows<o)for(let v=this._rows;v<o;v++)this.lines.length<o+this.ybase&&(this._optionsService.rawOptions.windowsMode||this._optionsService.rawOptions.windowsPty.backend!==void 0||this._optionsService.rawOptions.windowsPty.buildNumber!==void 0?this.lines.push(new _.BufferLine(s,p)):this.ybase>0&&this.lines.length<=this.ybase+this.y+E+1?(this.ybase--,E++,this.ydisp>0&&this.ydisp--):this.lines.push(new _.BufferLine(s,p)));else for(let v=this._rows;v>o;v--)this.lines.length>o+this.ybase&&(this.lines.length>this.ybase+this.y+1?this.lines.pop():(this.ybase++,this.ydisp++));if(x<this.lines.maxLength){const v=this.lines.length-x;v>0&&(this.lines.trimStart(v),this.ybase=Math.max(this.ybase-v,0),this.ydisp=Math.max(this.ydisp-v,0),this.savedY=Math.max(this.savedY-v,0)),this.lines.maxLength=x}this.x=Math.min(this.x,s-1),this.y=Math.min(this.y,o-1),E&&(this.y+=E),this.savedX=Math.min(this.savedX,s-1),this.scrollTop=0}if(this.scrollBottom=o-1,this._isReflowEnabled&&(this._reflow(s,o),this._cols>s))for(let E=0;E<this.lines.length;E++)m+=+this.lines.get(E).resize(s,p);this._cols=s,this._rows=o,this._memoryCleanupQueue.clear(),m>.1*this.lines.length&&(this._memoryCleanupPosition=0,this._memoryCleanupQueue.enqueue(()=>this._batchedMemoryCleanup()))}_batchedMemoryCleanup(){let s=!0;this._memoryCleanupPosition>=this.lines.length&&(this._memoryCleanupPosition=0,s=!1);let o=0;for(;this._memoryCleanupPosition<this.lines.length;)if(o+=this.lines.get(this._memoryCleanupPosition++).cleanupMemory(),o>100)return!0;return s}get _isReflowEnabled(){const s=this._optionsService.rawOptions.windowsPty;return s&&s.buildNumber?this._hasScrollback&&s.backend==="conpty"&&s.buildNumber>=21376:this._hasScrollback&&!this._optionsService.rawOptions.windowsMode}_reflow(s,o){this._cols!==s&&(s>this._cols?this._reflowLarger(s,o):this._reflowSmaller(s,o))}_reflowLarger(s,o){const p=(0,S.reflowLargerGetLinesToRemove)(this.lines,this._cols,s,this.ybase+this.y,this.getNullCell(_.DEFAULT_ATTR_DATA));if(p.length>0){const m=(0,S.reflowLargerCreateNewLayout)(this.lines,p);(0,S.reflowLargerApplyNewLayout)(this.lines,m.layout),this._reflowLargerAdjustViewport(s,o,m.countRemoved)}}_reflowLargerAdjustViewport(s,o,p){const m=this.getNullCell(_.DEFAULT_ATTR_DATA);let x=p;for(;x-- >0;)this.ybase===0?(this.y>0&&this.y--,this.lines.length<o&&this.lines.push(new _.BufferLine(s,m))):(this.ydisp===this.ybase&&this.ydisp--,this.ybase--);this.savedY=Math.max(this.savedY-p,0)}_reflowSmaller(s,o){const p=this.getNullCell(_.DEFAULT_ATTR_DATA),m=[];let x=0;for(let E=this.lines.length-1;E>=0;E--){let v=this.lines.get(E);if(!v||!v.isWrapped&&v.getTrimmedLength()<=s)continue;const k=[v];for(;v.isWrapped&&E>0;)v=this.lines.get(--E),k.unshift(v);const B=this.ybase+this.y;if(B>=E&&B<E+k.length)continue;const M=k[k.length-1].getTrimmedLength(),T=(0,S.reflowSmallerGetNewLineLengths)(k,this._cols,s),P=T.length-k.length;let H;H=this.ybase===0&&this.y!==this.lines.length-1?Math.max(0,this.y-this.lines.maxLength+P):Math.max(0,this.lines.length-this.lines.maxLength+P);const N=[];for(let I=0;I<P;I++){const F=this.getBlankLine(_.DEFAULT_ATTR_DATA,!0);N.push(F)}N.length>0&&(m.push({start:E+k.length+x,newLines:N}),x+=N.length),k.push(...N);let U=T.length-1,O=T[U];O===0&&(U--,O=T[U]);let b=k.length-P-1,R=M;for(;b>=0;){const I=Math.min(R,O);if(k[U]===void 0)break;if(k[U].copyCellsFrom(k[b],R-I,O-I,I,!0),O-=I,O===0&&(U--,O=T[U]),R-=I,R===0){b--;const F=Math.max(b,0);R=(0,S.getWrappedLineTrimmedLength)(k,F,this._cols)}}for(let I=0;I<k.length;I++)T[I]<s&&k[I].setCell(T[I],p);let A=P-H;for(;A-- >0;)this.ybase===0?this.y<o-1?(this.y++,this.lines.pop()):(this.ybase++,this.ydisp++):this.ybase<Math.min(this.lines.maxLength,this.lines.length+x)-o&&(this.ybase===this.ydisp&&this.ydisp++,this.ybase++);this.savedY=Math.min(this.savedY+P,this.ybase+o-1)}if(m.length>0){const E=[],v=[];for(let U=0;U<this.lines.length;U++)v.push(this.lines.get(U));const k=this.lines.length;let B=k-1,M=0,T=m[M];this.lines.length=Math.min(this.lines.maxLength,this.lines.length+x);let P=0;for(let U=Math.min(this.lines.maxLength-1,k+x-1);U>=0;U--)if(T&&T.start>B+P){for(let O=T.newLines.length-1;O>=0;O--)this.lines.set(U--,T.newLines[O]);U++,E.push({index:B+1,amount:T.newLines.length}),P+=T.newLines.length,T=m[++M]}else this.lines.set(U,v[B--]);let H=0;for(let U=E.length-1;U>=0;U--)E[U].index+=H,this.lines.onInsertEmitter.fire(E[U]),H+=E[U].amount;const N=Math.max(0,k+x-this.lines.maxLength);N>0&&this.lines.onTrimEmitter.fire(N)}}translateBufferLineToString(s,o,p=0,m){const x=this.lines.get(s);return x?x.translateToString(o,p,m):""}getWrappedRangeForLine(s){let o=s,p=s;for(;o>0&&this.lines.get(o).isWrapped;)o--;for(;p+1<this.lines.length&&this.lines.get(p+1).isWrapped;)p++;return{first:o,last:p}}setupTabStops(s){for(s!=null?this.tabs[s]||(s=this.prevStop(s)):(this.tabs={},s=0);s<this._cols;s+=this._optionsService.rawOptions.tabStopWidth)this.tabs[s]=!0}prevStop(s){for(s==null&&(s=this.x);!this.tabs[--s]&&s>0;);return s>=this._cols?this._cols-1:s<0?0:s}nextStop(s){for(s==null&&(s=this.x);!this.tabs[++s]&&s<this._cols;);return s>=this._cols?this._cols-1:s<0?0:s}clearMarkers(s){this._isClearing=!0;for(let o=0;o<this.markers.length;o++)this.markers[o].line===s&&(this.markers[o].dispose(),this.markers.splice(o--,1));this._isClearing=!1}clearAllMarkers(){this._isClearing=!0;for(let s=0;s<this.markers.length;s++)this.markers[s].dispose(),this.markers.splice(s--,1);this._isClearing=!1}addMarker(s){const o=new a.Marker(s);return this.markers.push(o),o.register(this.lines.onTrim(p=>{o.line-=p,o.line<0&&o.dispose()})),o.register(this.lines.onInsert(p=>{o.line>=p.index&&(o.line+=p.amount)})),o.register(this.lines.onDelete(p=>{o.line>=p.index&&o.line<p.index+p.amount&&o.dispose(),o.line>p.index&&(o.line-=p.amount)})),o.register(o.onDispose(()=>this._removeMarker(o))),o}_removeMarker(s){this._isClearing||this.markers.splice(this.markers.indexOf(s),1)}}},8437:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferLine=n.DEFAULT_ATTR_DATA=void 0;const d=u(3734),y=u(511),h=u(643),_=u(482);n.DEFAULT_ATTR_DATA=Object.freeze(new d.AttributeData);let S=0;class w{constructor(a,l,s=!1){this.isWrapped=s,this._combined={},this._extendedAttrs={},this._data=new Uint32Array(3*a);const o=l||y.CellData.fromCharData([0,h.NULL_CELL_CHAR,h.NULL_CELL_WIDTH,h.NULL_CELL_CODE]);for(let p=0;p<a;++p)this.setCell(p,o);this.length=a}get(a){const l=this._data[3*a+0],s=2097151&l;return[this._data[3*a+1],2097152&l?this._combined[a]:s?(0,_.stringFromCodePoint)(s):"",l>>22,2097152&l?this._combined[a].charCodeAt(this._combined[a].length-1):s]}set(a,l){this._data[3*a+1]=l[h.CHAR_DATA_ATTR_INDEX],l[h.CHAR_DATA_CHAR_INDEX].length>1?(this._combined[a]=l[1],this._data[3*a+0]=2097152|a|l[h.CHAR_DATA_WIDTH_INDEX]<<22):this._data[3*a+0]=l[h.CHAR_DATA_CHAR_INDEX].charCodeAt(0)|l[h.CHAR_DATA_WIDTH_INDEX]<<22}getWidth(a){return this._data[3*a+0]>>22}hasWidth(a){return 12582912&this._data[3*a+0]}getFg(a){return this._data[3*a+1]}getBg(a){return this._data[3*a+2]}hasContent(a){return 4194303&this._data[3*a+0]}getCodePoint(a){const l=this._data[3*a+0];return 2097152&l?this._combined[a].charCodeAt(this._combined[a].length-1):2097151&l}isCombined(a){return 2097152&this._data[3*a+0]}getString(a){const l=this._data[3*a+0];return 2097152&l?this._combined[a]:2097151&l?(0,_.stringFromCodePoint)(2097151&l):""}isProtected(a){return 536870912&this._data[3*a+2]}loadCell(a,l){return S=3*a,l.content=this._data[S+0],l.fg=this._data[S+1],l.bg=this._data[S+2],2097152&l.content&&(l.combinedData=this._combined[a]),268435456&l.bg&&(l.extended=this._extendedAttrs[a]),l}setCell(a,l){2097152&l.content&&(this._combined[a]=l.combinedData),268435456&l.bg&&(this._extendedAttrs[a]=l.extended),this._data[3*a+0]=l.content,this._data[3*a+1]=l.fg,this._data[3*a+2]=l.bg}setCellFromCodePoint(a,l,s,o,p,m){268435456&p&&(this._extendedAttrs[a]=m),this._data[3*a+0]=l|s<<22,this._data[3*a+1]=o,this._data[3*a+2]=p}addCodepointToCell(a,l){let s=this._data[3*a+0];2097152&s?this._combined[a]+=(0,_.stringFromCodePoint)(l):(2097151&s?(this._combined[a]=(0,_.stringFromCodePoint)(2097151&s)+(0,_.stringFromCodePoint)(l),s&=-2097152,s|=2097152):s=l|4194304,this._data[3*a+0]=s)}insertCells(a,l,s,o){if((a%=this.length)&&this.getWidth(a-1)===2&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs),l<this.length-a){const p=new y.CellData;for(let m=this.length-a-l-1;m>=0;--m)this.setCell(a+l+m,this.loadCell(a+m,p));for(let m=0;m<l;++m)this.setCell(a+m,s)}else for(let p=a;p<this.length;++p)this.setCell(p,s);this.getWidth(this.length-1)===2&&this.setCellFromCodePoint(this.length-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs)}deleteCells(a,l,s,o){if(a%=this.length,l<this.length-a){const p=new y.CellData;for(let m=0;m<this.length-a-l;++m)this.setCell(a+m,this.loadCell(a+l+m,p));for(let m=this.length-l;m<this.length;++m)this.setCell(m,s)}else for(let p=a;p<this.length;++p)this.setCell(p,s);a&&this.getWidth(a-1)===2&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs),this.getWidth(a)!==0||this.hasContent(a)||this.setCellFromCodePoint(a,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs)}replaceCells(a,l,s,o,p=!1){if(p)for(a&&this.getWidth(a-1)===2&&!this.isProtected(a-1)&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs),l<this.length&&this.getWidth(l-1)===2&&!this.isProtected(l)&&this.setCellFromCodePoint(l,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs);a<l&&a<this.length;)this.isProtected(a)||this.setCell(a,s),a++;else for(a&&this.getWidth(a-1)===2&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs),l<this.length&&this.getWidth(l-1)===2&&this.setCellFromCodePoint(l,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new d.ExtendedAttrs);a<l&&a<this.length;)this.setCell(a++,s)}resize(a,l){if(a===this.length)return 4*this._data.length*2<this._data.buffer.byteLength;const s=3*a;if(a>this.length){if(this._data.buffer.byteLength>=4*s)this._data=new Uint32Array(this._data.buffer,0,s);else{const o=new Uint32Array(s);o.set(this._data),this._data=o}for(let o=this.length;o<a;++o)this.setCell(o,l)}else{this._data=this._data.subarray(0,s);const o=Object.keys(this._combined);for(let m=0;m<o.length;m++){const x=parseInt(o[m],10);x>=a&&delete this._combined[x]}const p=Object.keys(this._extendedAttrs);for(let m=0;m<p.length;m++){const x=parseInt(p[m],10);x>=a&&delete this._extendedAttrs[x]}}return this.length=a,4*s*2<this._data.buffer.byteLength}cleanupMemory(){if(4*this._data.length*2<this._data.buffer.byteLength){const a=new Uint32Array(this._data.length);return a.set(this._data),this._data=a,1}return 0}fill(a,l=!1){if(l)for(let s=0;s<this.length;++s)this.isProtected(s)||this.setCell(s,a);else{this._combined={},this._extendedAttrs={};for(let s=0;s<this.length;++s)this.setCell(s,a)}}copyFrom(a){this.length!==a.length?this._data=new Uint32Array(a._data):this._data.set(a._data),this.length=a.length,this._combined={};for(const l in a._combined)this._combined[l]=a._combined[l];this._extendedAttrs={};for(const l in a._extendedAttrs)this._extendedAttrs[l]=a._extendedAttrs[l];this.isWrapped=a.isWrapped}clone(){const a=new w(0);a._data=new Uint32Array(this._data),a.length=this.length;for(const l in this._combined)a._combined[l]=this._combined[l];for(const l in this._extendedAttrs)a._extendedAttrs[l]=this._extendedAttrs[l];return a.isWrapped=this.isWrapped,a}getTrimmedLength(){for(let a=this.length-1;a>=0;--a)if(4194303&this._data[3*a+0])return a+(this._data[3*a+0]>>22);return 0}getNoBgTrimmedLength(){for(let a=this.length-1;a>=0;--a)if(4194303&this._data[3*a+0]||50331648&this._data[3*a+2])return a+(this._data[3*a+0]>>22);return 0}copyCellsFrom(a,l,s,o,p){const m=a._data;if(p)for(let E=o-1;E>=0;E--){for(let v=0;v<3;v++)this._data[3*(s+E)+v]=m[3*(l+E)+v];268435456&m[3*(l+E)+2]&&(this._extendedAttrs[s+E]=a._extendedAttrs[l+E])}else for(let E=0;E<o;E++){for(let v=0;v<3;v++)this._data[3*(s+E)+v]=m[3*(l+E)+v];268435456&m[3*(l+E)+2]&&(this._extendedAttrs[s+E]=a._extendedAttrs[l+E])}const x=Object.keys(a._combined);for(let E=0;E<x.length;E++){const v=parseInt(x[E],10);v>=l&&(this._combined[v-l+s]=a._combined[v])}}translateToString(a=!1,l=0,s=this.length){a&&(s=Math.min(s,this.getTrimmedLength()));let o="";for(;l<s;){const p=this._data[3*l+0],m=2097151&p;o+=2097152&p?this._combined[l]:m?(0,_.stringFromCodePoint)(m):h.WHITESPACE_CELL_CHAR,l+=p>>22||1}return o}}n.BufferLine=w},4841:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.getRangeLength=void 0,n.getRangeLength=function(u,d){if(u.start.y>u.end.y)throw new Error(`Buffer range end (${u.end.x}, ${u.end.y}) cannot be before start (${u.start.x}, ${u.start.y})`);return d*(u.end.y-u.start.y)+(u.end.x-u.start.x+1)}},4634:(g,n)=>{function u(d,y,h){if(y===d.length-1)return d[y].getTrimmedLength();const _=!d[y].hasContent(h-1)&&d[y].getWidth(h-1)===1,S=d[y+1].getWidth(0)===2;return _&&S?h-1:h}Object.defineProperty(n,"__esModule",{value:!0}),n.getWrappedLineTrimmedLength=n.reflowSmallerGetNewLineLengths=n.reflowLargerApplyNewLayout=n.reflowLargerCreateNewLayout=n.reflowLargerGetLinesToRemove=void 0,n.reflowLargerGetLinesToRemove=function(d,y,h,_,S){const w=[];for(let C=0;C<d.length-1;C++){let a=C,l=d.get(++a);if(!l.isWrapped)continue;const s=[d.get(C)];for(;a<d.length&&l.isWrapped;)s.push(l),l=d.get(++a);if(_>=C&&_<a){C+=s.length-1;continue}let o=0,p=u(s,o,y),m=1,x=0;for(;m<s.length;){const v=u(s,m,y),k=v-x,B=h-p,M=Math.min(k,B);s[o].copyCellsFrom(s[m],x,p,M,!1),p+=M,p===h&&(o++,p=0),x+=M,x===v&&(m++,x=0),p===0&&o!==0&&s[o-1].getWidth(h-1)===2&&(s[o].copyCellsFrom(s[o-1],h-1,p++,1,!1),s[o-1].setCell(h-1,S))}s[o].replaceCells(p,h,S);let E=0;for(let v=s.length-1;v>0&&(v>o||s[v].getTrimmedLength()===0);v--)E++;E>0&&(w.push(C+s.length-E),w.push(E)),C+=s.length-1}return w},n.reflowLargerCreateNewLayout=function(d,y){const h=[];let _=0,S=y[_],w=0;for(let C=0;C<d.length;C++)if(S===C){const a=y[++_];d.onDeleteEmitter.fire({index:C-w,amount:a}),C+=a-1,w+=a,S=y[++_]}else h.push(C);return{layout:h,countRemoved:w}},n.reflowLargerApplyNewLayout=function(d,y){const h=[];for(let _=0;_<y.length;_++)h.push(d.get(y[_]));for(let _=0;_<h.length;_++)d.set(_,h[_]);d.length=y.length},n.reflowSmallerGetNewLineLengths=function(d,y,h){const _=[],S=d.map((l,s)=>u(d,s,y)).reduce((l,s)=>l+s);let w=0,C=0,a=0;for(;a<S;){if(S-a<h){_.push(S-a);break}w+=h;const l=u(d,C,y);w>l&&(w-=l,C++);const s=d[C].getWidth(w-1)===2;s&&w--;const o=s?h-1:h;_.push(o),a+=o}return _},n.getWrappedLineTrimmedLength=u},5295:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferSet=void 0;const d=u(8460),y=u(844),h=u(9092);class _ extends y.Disposable{constructor(w,C){super(),this._optionsService=w,this._bufferService=C,this._onBufferActivate=this.register(new d.EventEmitter),this.onBufferActivate=this._onBufferActivate.event,this.reset(),this.register(this._optionsService.onSpecificOptionChange("scrollback",()=>this.resize(this._bufferService.cols,this._bufferService.rows))),this.register(this._optionsService.onSpecificOptionChange("tabStopWidth",()=>this.setupTabStops()))}reset(){this._normal=new h.Buffer(!0,this._optionsService,this._bufferService),this._normal.fillViewportRows(),this._alt=new h.Buffer(!1,this._optionsService,this._bufferService),this._activeBuffer=this._normal,this._onBufferActivate.fire({activeBuffer:this._normal,inactiveBuffer:this._alt}),this.setupTabStops()}get alt(){return this._alt}get active(){return this._activeBuffer}get normal(){return this._normal}activateNormalBuffer(){this._activeBuffer!==this._normal&&(this._normal.x=this._alt.x,this._normal.y=this._alt.y,this._alt.clearAllMarkers(),this._alt.clear(),this._activeBuffer=this._normal,this._onBufferActivate.fire({activeBuffer:this._normal,inactiveBuffer:this._alt}))}activateAltBuffer(w){this._activeBuffer!==this._alt&&(this._alt.fillViewportRows(w),this._alt.x=this._normal.x,this._alt.y=this._normal.y,this._activeBuffer=this._alt,this._onBufferActivate.fire({activeBuffer:this._alt,inactiveBuffer:this._normal}))}resize(w,C){this._normal.resize(w,C),this._alt.resize(w,C),this.setupTabStops(w)}setupTabStops(w){this._normal.setupTabStops(w),this._alt.setupTabStops(w)}}n.BufferSet=_},511:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CellData=void 0;const d=u(482),y=u(643),h=u(3734);class _ extends h.AttributeData{constructor(){super(...arguments),this.content=0,this.fg=0,this.bg=0,this.extended=new h.ExtendedAttrs,this.combinedData=""}static fromCharData(w){const C=new _;return C.setFromCharData(w),C}isCombined(){return 2097152&this.content}getWidth(){return this.content>>22}getChars(){return 2097152&this.content?this.combinedData:2097151&this.content?(0,d.stringFromCodePoint)(2097151&this.content):""}getCode(){return this.isCombined()?this.combinedData.charCodeAt(this.combinedData.length-1):2097151&this.content}setFromCharData(w){this.fg=w[y.CHAR_DATA_ATTR_INDEX],this.bg=0;let C=!1;if(w[y.CHAR_DATA_CHAR_INDEX].length>2)C=!0;else if(w[y.CHAR_DATA_CHAR_INDEX].length===2){const a=w[y.CHAR_DATA_CHAR_INDEX].charCodeAt(0);if(55296<=a&&a<=56319){const l=w[y.CHAR_DATA_CHAR_INDEX].charCodeAt(1);56320<=l&&l<=57343?this.content=1024*(a-55296)+l-56320+65536|w[y.CHAR_DATA_WIDTH_INDEX]<<22:C=!0}else C=!0}else this.content=w[y.CHAR_DATA_CHAR_INDEX].charCodeAt(0)|w[y.CHAR_DATA_WIDTH_INDEX]<<22;C&&(this.combinedData=w[y.CHAR_DATA_CHAR_INDEX],this.content=2097152|w[y.CHAR_DATA_WIDTH_INDEX]<<22)}getAsCharData(){return[this.fg,this.getChars(),this.getWidth(),this.getCode()]}}n.CellData=_},643:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.WHITESPACE_CELL_CODE=n.WHITESPACE_CELL_WIDTH=n.WHITESPACE_CELL_CHAR=n.NULL_CELL_CODE=n.NULL_CELL_WIDTH=n.NULL_CELL_CHAR=n.CHAR_DATA_CODE_INDEX=n.CHAR_DATA_WIDTH_INDEX=n.CHAR_DATA_CHAR_INDEX=n.CHAR_DATA_ATTR_INDEX=n.DEFAULT_EXT=n.DEFAULT_ATTR=n.DEFAULT_COLOR=void 0,n.DEFAULT_COLOR=0,n.DEFAULT_ATTR=256|n.DEFAULT_COLOR<<9,n.DEFAULT_EXT=0,n.CHAR_DATA_ATTR_INDEX=0,n.CHAR_DATA_CHAR_INDEX=1,n.CHAR_DATA_WIDTH_INDEX=2,n.CHAR_DATA_CODE_INDEX=3,n.NULL_CELL_CHAR="",n.NULL_CELL_WIDTH=1,n.NULL_CELL_CODE=0,n.WHITESPACE_CELL_CHAR=" ",n.WHITESPACE_CELL_WIDTH=1,n.WHITESPACE_CELL_CODE=32},4863:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Marker=void 0;const d=u(8460),y=u(844);class h{get id(){return this._id}constructor(S){this.line=S,this.isDisposed=!1,this._disposables=[],this._id=h._nextId++,this._onDispose=this.register(new d.EventEmitter),this.onDispose=this._onDispose.event}dispose(){this.isDisposed||(this.isDisposed=!0,this.line=-1,this._onDispose.fire(),(0,y.disposeArray)(this._disposables),this._disposables.length=0)}register(S){return this._disposables.push(S),S}}n.Marker=h,h._nextId=1},7116:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DEFAULT_CHARSET=n.CHARSETS=void 0,n.CHARSETS={},n.DEFAULT_CHARSET=n.CHARSETS.B,n.CHARSETS[0]={"`":"◆",a:"▒",b:"␉",c:"␌",d:"␍",e:"␊",f:"°",g:"±",h:"␤",i:"␋",j:"┘",k:"┐",l:"┌",m:"└",n:"┼",o:"⎺",p:"⎻",q:"─",r:"⎼",s:"⎽",t:"├",u:"┤",v:"┴",w:"┬",x:"│",y:"≤",z:"≥","{":"π","|":"≠","}":"£","~":"·"},n.CHARSETS.A={"#":"£"},n.CHARSETS.B=void 0,n.CHARSETS[4]={"#":"£","@":"¾","[":"ij","\\":"½","]":"|","{":"¨","|":"f","}":"¼","~":"´"},n.CHARSETS.C=n.CHARSETS[5]={"[":"Ä","\\":"Ö","]":"Å","^":"Ü","`":"é","{":"ä","|":"ö","}":"å","~":"ü"},n.CHARSETS.R={"#":"£","@":"à","[":"°","\\":"ç","]":"§","{":"é","|":"ù","}":"è","~":"¨"},n.CHARSETS.Q={"@":"à","[":"â","\\":"ç","]":"ê","^":"î","`":"ô","{":"é","|":"ù","}":"è","~":"û"},n.CHARSETS.K={"@":"§","[":"Ä","\\":"Ö","]":"Ü","{":"ä","|":"ö","}":"ü","~":"ß"},n.CHARSETS.Y={"#":"£","@":"§","[":"°","\\":"ç","]":"é","`":"ù","{":"à","|":"ò","}":"è","~":"ì"},n.CHARSETS.E=n.CHARSETS[6]={"@":"Ä","[":"Æ","\\":"Ø","]":"Å","^":"Ü","`":"ä","{":"æ","|":"ø","}":"å","~":"ü"},n.CHARSETS.Z={"#":"£","@":"§","[":"¡","\\":"Ñ","]":"¿","{":"°","|":"ñ","}":"ç"},n.CHARSETS.H=n.CHARSETS[7]={"@":"É","[":"Ä","\\":"Ö","]":"Å","^":"Ü","`":"é","{":"ä","|":"ö","}":"å","~":"ü"},n.CHARSETS["="]={"#":"ù","@":"à","[":"é","\\":"ç","]":"ê","^":"î",_:"è","`":"ô","{":"ä","|":"ö","}":"ü","~":"û"}},2584:(g,n)=>{var u,d,y;Object.defineProperty(n,"__esModule",{value:!0}),n.C1_ESCAPED=n.C1=n.C0=void 0,function(h){h.NUL="\0",h.SOH="",h.STX="",h.ETX="",h.EOT="",h.ENQ="",h.ACK="",h.BEL="\x07",h.BS="\b",h.HT="	",h.LF=`
-`,h.VT="\v",h.FF="\f",h.CR="\r",h.SO="",h.SI="",h.DLE="",h.DC1="",h.DC2="",h.DC3="",h.DC4="",h.NAK="",h.SYN="",h.ETB="",h.CAN="",h.EM="",h.SUB="",h.ESC="\x1B",h.FS="",h.GS="",h.RS="",h.US="",h.SP=" ",h.DEL=""}(u||(n.C0=u={})),function(h){h.PAD="",h.HOP="",h.BPH="",h.NBH="",h.IND="",h.NEL="",h.SSA="",h.ESA="",h.HTS="",h.HTJ="",h.VTS="",h.PLD="",h.PLU="",h.RI="",h.SS2="",h.SS3="",h.DCS="",h.PU1="",h.PU2="",h.STS="",h.CCH="",h.MW="",h.SPA="",h.EPA="",h.SOS="",h.SGCI="",h.SCI="",h.CSI="",h.ST="",h.OSC="",h.PM="",h.APC=""}(d||(n.C1=d={})),function(h){h.ST=`${u.ESC}\\`}(y||(n.C1_ESCAPED=y={}))},7399:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.evaluateKeyboardEvent=void 0;const d=u(2584),y={48:["0",")"],49:["1","!"],50:["2","@"],51:["3","#"],52:["4","$"],53:["5","%"],54:["6","^"],55:["7","&"],56:["8","*"],57:["9","("],186:[";",":"],187:["=","+"],188:[",","<"],189:["-","_"],190:[".",">"],191:["/","?"],192:["`","~"],219:["[","{"],220:["\\","|"],221:["]","}"],222:["'",'"']};n.evaluateKeyboardEvent=function(h,_,S,w){const C={type:0,cancel:!1,key:void 0},a=(h.shiftKey?1:0)|(h.altKey?2:0)|(h.ctrlKey?4:0)|(h.metaKey?8:0);switch(h.keyCode){case 0:h.key==="UIKeyInputUpArrow"?C.key=_?d.C0.ESC+"OA":d.C0.ESC+"[A":h.key==="UIKeyInputLeftArrow"?C.key=_?d.C0.ESC+"OD":d.C0.ESC+"[D":h.key==="UIKeyInputRightArrow"?C.key=_?d.C0.ESC+"OC":d.C0.ESC+"[C":h.key==="UIKeyInputDownArrow"&&(C.key=_?d.C0.ESC+"OB":d.C0.ESC+"[B");break;case 8:if(h.altKey){C.key=d.C0.ESC+d.C0.DEL;break}C.key=d.C0.DEL;break;case 9:if(h.shiftKey){C.key=d.C0.ESC+"[Z";break}C.key=d.C0.HT,C.cancel=!0;break;case 13:C.key=h.altKey?d.C0.ESC+d.C0.CR:d.C0.CR,C.cancel=!0;break;case 27:C.key=d.C0.ESC,h.altKey&&(C.key=d.C0.ESC+d.C0.ESC),C.cancel=!0;break;case 37:if(h.metaKey)break;a?(C.key=d.C0.ESC+"[1;"+(a+1)+"D",C.key===d.C0.ESC+"[1;3D"&&(C.key=d.C0.ESC+(S?"b":"[1;5D"))):C.key=_?d.C0.ESC+"OD":d.C0.ESC+"[D";break;case 39:if(h.metaKey)break;a?(C.key=d.C0.ESC+"[1;"+(a+1)+"C",C.key===d.C0.ESC+"[1;3C"&&(C.key=d.C0.ESC+(S?"f":"[1;5C"))):C.key=_?d.C0.ESC+"OC":d.C0.ESC+"[C";break;case 38:if(h.metaKey)break;a?(C.key=d.C0.ESC+"[1;"+(a+1)+"A",S||C.key!==d.C0.ESC+"[1;3A"||(C.key=d.C0.ESC+"[1;5A")):C.key=_?d.C0.ESC+"OA":d.C0.ESC+"[A";break;case 40:if(h.metaKey)break;a?(C.key=d.C0.ESC+"[1;"+(a+1)+"B",S||C.key!==d.C0.ESC+"[1;3B"||(C.key=d.C0.ESC+"[1;5B")):C.key=_?d.C0.ESC+"OB":d.C0.ESC+"[B";break;case 45:h.shiftKey||h.ctrlKey||(C.key=d.C0.ESC+"[2~");break;case 46:C.key=a?d.C0.ESC+"[3;"+(a+1)+"~":d.C0.ESC+"[3~";break;case 36:C.key=a?d.C0.ESC+"[1;"+(a+1)+"H":_?d.C0.ESC+"OH":d.C0.ESC+"[H";break;case 35:C.key=a?d.C0.ESC+"[1;"+(a+1)+"F":_?d.C0.ESC+"OF":d.C0.ESC+"[F";break;case 33:h.shiftKey?C.type=2:h.ctrlKey?C.key=d.C0.ESC+"[5;"+(a+1)+"~":C.key=d.C0.ESC+"[5~";break;case 34:h.shiftKey?C.type=3:h.ctrlKey?C.key=d.C0.ESC+"[6;"+(a+1)+"~":C.key=d.C0.ESC+"[6~";break;case 112:C.key=a?d.C0.ESC+"[1;"+(a+1)+"P":d.C0.ESC+"OP";break;case 113:C.key=a?d.C0.ESC+"[1;"+(a+1)+"Q":d.C0.ESC+"OQ";break;case 114:C.key=a?d.C0.ESC+"[1;"+(a+1)+"R":d.C0.ESC+"OR";break;case 115:C.key=a?d.C0.ESC+"[1;"+(a+1)+"S":d.C0.ESC+"OS";break;case 116:C.key=a?d.C0.ESC+"[15;"+(a+1)+"~":d.C0.ESC+"[15~";break;case 117:C.key=a?d.C0.ESC+"[17;"+(a+1)+"~":d.C0.ESC+"[17~";break;case 118:C.key=a?d.C0.ESC+"[18;"+(a+1)+"~":d.C0.ESC+"[18~";break;case 119:C.key=a?d.C0.ESC+"[19;"+(a+1)+"~":d.C0.ESC+"[19~";break;case 120:C.key=a?d.C0.ESC+"[20;"+(a+1)+"~":d.C0.ESC+"[20~";break;case 121:C.key=a?d.C0.ESC+"[21;"+(a+1)+"~":d.C0.ESC+"[21~";break;case 122:C.key=a?d.C0.ESC+"[23;"+(a+1)+"~":d.C0.ESC+"[23~";break;case 123:C.key=a?d.C0.ESC+"[24;"+(a+1)+"~":d.C0.ESC+"[24~";break;default:if(!h.ctrlKey||h.shiftKey||h.altKey||h.metaKey)if(S&&!w||!h.altKey||h.metaKey)!S||h.altKey||h.ctrlKey||h.shiftKey||!h.metaKey?h.key&&!h.ctrlKey&&!h.altKey&&!h.metaKey&&h.keyCode>=48&&h.key.length===1?C.key=h.key:h.key&&h.ctrlKey&&(h.key==="_"&&(C.key=d.C0.US),h.key==="@"&&(C.key=d.C0.NUL)):h.keyCode===65&&(C.type=1);else{const l=y[h.keyCode],s=l==null?void 0:l[h.shiftKey?1:0];if(s)C.key=d.C0.ESC+s;else if(h.keyCode>=65&&h.keyCode<=90){const o=h.ctrlKey?h.keyCode-64:h.keyCode+32;let p=String.fromCharCode(o);h.shiftKey&&(p=p.toUpperCase()),C.key=d.C0.ESC+p}else if(h.keyCode===32)C.key=d.C0.ESC+(h.ctrlKey?d.C0.NUL:" ");else if(h.key==="Dead"&&h.code.startsWith("Key")){let o=h.code.slice(3,4);h.shiftKey||(o=o.toLowerCase()),C.key=d.C0.ESC+o,C.cancel=!0}}else h.keyCode>=65&&h.keyCode<=90?C.key=String.fromCharCode(h.keyCode-64):h.keyCode===32?C.key=d.C0.NUL:h.keyCode>=51&&h.keyCode<=55?C.key=String.fromCharCode(h.keyCode-51+27):h.keyCode===56?C.key=d.C0.DEL:h.keyCode===219?C.key=d.C0.ESC:h.keyCode===220?C.key=d.C0.FS:h.keyCode===221&&(C.key=d.C0.GS)}return C}},482:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Utf8ToUtf32=n.StringToUtf32=n.utf32ToString=n.stringFromCodePoint=void 0,n.stringFromCodePoint=function(u){return u>65535?(u-=65536,String.fromCharCode(55296+(u>>10))+String.fromCharCode(u%1024+56320)):String.fromCharCode(u)},n.utf32ToString=function(u,d=0,y=u.length){let h="";for(let _=d;_<y;++_){let S=u[_];S>65535?(S-=65536,h+=String.fromCharCode(55296+(S>>10))+String.fromCharCode(S%1024+56320)):h+=String.fromCharCode(S)}return h},n.StringToUtf32=class{constructor(){this._interim=0}clear(){this._interim=0}decode(u,d){const y=u.length;if(!y)return 0;let h=0,_=0;if(this._interim){const S=u.charCodeAt(_++);56320<=S&&S<=57343?d[h++]=1024*(this._interim-55296)+S-56320+65536:(d[h++]=this._interim,d[h++]=S),this._interim=0}for(let S=_;S<y;++S){const w=u.charCodeAt(S);if(55296<=w&&w<=56319){if(++S>=y)return this._interim=w,h;const C=u.charCodeAt(S);56320<=C&&C<=57343?d[h++]=1024*(w-55296)+C-56320+65536:(d[h++]=w,d[h++]=C)}else w!==65279&&(d[h++]=w)}return h}},n.Utf8ToUtf32=class{constructor(){this.interim=new Uint8Array(3)}clear(){this.interim.fill(0)}decode(u,d){const y=u.length;if(!y)return 0;let h,_,S,w,C=0,a=0,l=0;if(this.interim[0]){let p=!1,m=this.interim[0];m&=(224&m)==192?31:(240&m)==224?15:7;let x,E=0;for(;(x=63&this.interim[++E])&&E<4;)m<<=6,m|=x;const v=(224&this.interim[0])==192?2:(240&this.interim[0])==224?3:4,k=v-E;for(;l<k;){if(l>=y)return 0;if(x=u[l++],(192&x)!=128){l--,p=!0;break}this.interim[E++]=x,m<<=6,m|=63&x}p||(v===2?m<128?l--:d[C++]=m:v===3?m<2048||m>=55296&&m<=57343||m===65279||(d[C++]=m):m<65536||m>1114111||(d[C++]=m)),this.interim.fill(0)}const s=y-4;let o=l;for(;o<y;){for(;!(!(o<s)||128&(h=u[o])||128&(_=u[o+1])||128&(S=u[o+2])||128&(w=u[o+3]));)d[C++]=h,d[C++]=_,d[C++]=S,d[C++]=w,o+=4;if(h=u[o++],h<128)d[C++]=h;else if((224&h)==192){if(o>=y)return this.interim[0]=h,C;if(_=u[o++],(192&_)!=128){o--;continue}if(a=(31&h)<<6|63&_,a<128){o--;continue}d[C++]=a}else if((240&h)==224){if(o>=y)return this.interim[0]=h,C;if(_=u[o++],(192&_)!=128){o--;continue}if(o>=y)return this.interim[0]=h,this.interim[1]=_,C;if(S=u[o++],(192&S)!=128){o--;continue}if(a=(15&h)<<12|(63&_)<<6|63&S,a<2048||a>=55296&&a<=57343||a===65279)continue;d[C++]=a}else if((248&h)==240){if(o>=y)return this.interim[0]=h,C;if(_=u[o++],(192&_)!=128){o--;continue}if(o>=y)return this.interim[0]=h,this.interim[1]=_,C;if(S=u[o++],(192&S)!=128){o--;continue}if(o>=y)return this.interim[0]=h,this.interim[1]=_,this.interim[2]=S,C;if(w=u[o++],(192&w)!=128){o--;continue}if(a=(7&h)<<18|(63&_)<<12|(63&S)<<6|63&w,a<65536||a>1114111)continue;d[C++]=a}}return C}}},225:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.UnicodeV6=void 0;const u=[[768,879],[1155,1158],[1160,1161],[1425,1469],[1471,1471],[1473,1474],[1476,1477],[1479,1479],[1536,1539],[1552,1557],[1611,1630],[1648,1648],[1750,1764],[1767,1768],[1770,1773],[1807,1807],[1809,1809],[1840,1866],[1958,1968],[2027,2035],[2305,2306],[2364,2364],[2369,2376],[2381,2381],[2385,2388],[2402,2403],[2433,2433],[2492,2492],[2497,2500],[2509,2509],[2530,2531],[2561,2562],[2620,2620],[2625,2626],[2631,2632],[2635,2637],[2672,2673],[2689,2690],[2748,2748],[2753,2757],[2759,2760],[2765,2765],[2786,2787],[2817,2817],[2876,2876],[2879,2879],[2881,2883],[2893,2893],[2902,2902],[2946,2946],[3008,3008],[3021,3021],[3134,3136],[3142,3144],[3146,3149],[3157,3158],[3260,3260],[3263,3263],[3270,3270],[3276,3277],[3298,3299],[3393,3395],[3405,3405],[3530,3530],[3538,3540],[3542,3542],[3633,3633],[3636,3642],[3655,3662],[3761,3761],[3764,3769],[3771,3772],[3784,3789],[3864,3865],[3893,3893],[3895,3895],[3897,3897],[3953,3966],[3968,3972],[3974,3975],[3984,3991],[3993,4028],[4038,4038],[4141,4144],[4146,4146],[4150,4151],[4153,4153],[4184,4185],[4448,4607],[4959,4959],[5906,5908],[5938,5940],[5970,5971],[6002,6003],[6068,6069],[6071,6077],[6086,6086],[6089,6099],[6109,6109],[6155,6157],[6313,6313],[6432,6434],[6439,6440],[6450,6450],[6457,6459],[6679,6680],[6912,6915],[6964,6964],[6966,6970],[6972,6972],[6978,6978],[7019,7027],[7616,7626],[7678,7679],[8203,8207],[8234,8238],[8288,8291],[8298,8303],[8400,8431],[12330,12335],[12441,12442],[43014,43014],[43019,43019],[43045,43046],[64286,64286],[65024,65039],[65056,65059],[65279,65279],[65529,65531]],d=[[68097,68099],[68101,68102],[68108,68111],[68152,68154],[68159,68159],[119143,119145],[119155,119170],[119173,119179],[119210,119213],[119362,119364],[917505,917505],[917536,917631],[917760,917999]];let y;n.UnicodeV6=class{constructor(){if(this.version="6",!y){y=new Uint8Array(65536),y.fill(1),y[0]=0,y.fill(0,1,32),y.fill(0,127,160),y.fill(2,4352,4448),y[9001]=2,y[9002]=2,y.fill(2,11904,42192),y[12351]=1,y.fill(2,44032,55204),y.fill(2,63744,64256),y.fill(2,65040,65050),y.fill(2,65072,65136),y.fill(2,65280,65377),y.fill(2,65504,65511);for(let h=0;h<u.length;++h)y.fill(0,u[h][0],u[h][1]+1)}}wcwidth(h){return h<32?0:h<127?1:h<65536?y[h]:function(_,S){let w,C=0,a=S.length-1;if(_<S[0][0]||_>S[a][1])return!1;for(;a>=C;)if(w=C+a>>1,_>S[w][1])C=w+1;else{if(!(_<S[w][0]))return!0;a=w-1}return!1}(h,d)?0:h>=131072&&h<=196605||h>=196608&&h<=262141?2:1}}},5981:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.WriteBuffer=void 0;const d=u(8460),y=u(844);class h extends y.Disposable{constructor(S){super(),this._action=S,this._writeBuffer=[],this._callbacks=[],this._pendingData=0,this._bufferOffset=0,this._isSyncWriting=!1,this._syncCalls=0,this._didUserInput=!1,this._onWriteParsed=this.register(new d.EventEmitter),this.onWriteParsed=this._onWriteParsed.event}handleUserInput(){this._didUserInput=!0}writeSync(S,w){if(w!==void 0&&this._syncCalls>w)return void(this._syncCalls=0);if(this._pendingData+=S.length,this._writeBuffer.push(S),this._callbacks.push(void 0),this._syncCalls++,this._isSyncWriting)return;let C;for(this._isSyncWriting=!0;C=this._writeBuffer.shift();){this._action(C);const a=this._callbacks.shift();a&&a()}this._pendingData=0,this._bufferOffset=2147483647,this._isSyncWriting=!1,this._syncCalls=0}write(S,w){if(this._pendingData>5e7)throw new Error("write data discarded, use flow control to avoid losing data");if(!this._writeBuffer.length){if(this._bufferOffset=0,this._didUserInput)return this._didUserInput=!1,this._pendingData+=S.length,this._writeBuffer.push(S),this._callbacks.push(w),void this._innerWrite();setTimeout(()=>this._innerWrite())}this._pendingData+=S.length,this._writeBuffer.push(S),this._callbacks.push(w)}_innerWrite(S=0,w=!0){const C=S||Date.now();for(;this._writeBuffer.length>this._bufferOffset;){const a=this._writeBuffer[this._bufferOffset],l=this._action(a,w);if(l){const o=p=>Date.now()-C>=12?setTimeout(()=>this._innerWrite(0,p)):this._innerWrite(C,p);return void l.catch(p=>(queueMicrotask(()=>{throw p}),Promise.resolve(!1))).then(o)}const s=this._callbacks[this._bufferOffset];if(s&&s(),this._bufferOffset++,this._pendingData-=a.length,Date.now()-C>=12)break}this._writeBuffer.length>this._bufferOffset?(this._bufferOffset>50&&(this._writeBuffer=this._writeBuffer.slice(this._bufferOffset),this._callbacks=this._callbacks.slice(this._bufferOffset),this._bufferOffset=0),setTimeout(()=>this._innerWrite())):(this._writeBuffer.length=0,this._callbacks.length=0,this._pendingData=0,this._bufferOffset=0),this._onWriteParsed.fire()}}n.WriteBuffer=h},5941:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.toRgbString=n.parseColor=void 0;const u=/^([\da-f])\/([\da-f])\/([\da-f])$|^([\da-f]{2})\/([\da-f]{2})\/([\da-f]{2})$|^([\da-f]{3})\/([\da-f]{3})\/([\da-f]{3})$|^([\da-f]{4})\/([\da-f]{4})\/([\da-f]{4})$/,d=/^[\da-f]+$/;function y(h,_){const S=h.toString(16),w=S.length<2?"0"+S:S;switch(_){case 4:return S[0];case 8:return w;case 12:return(w+w).slice(0,3);default:return w+w}}n.parseColor=function(h){if(!h)return;let _=h.toLowerCase();if(_.indexOf("rgb:")===0){_=_.slice(4);const S=u.exec(_);if(S){const w=S[1]?15:S[4]?255:S[7]?4095:65535;return[Math.round(parseInt(S[1]||S[4]||S[7]||S[10],16)/w*255),Math.round(parseInt(S[2]||S[5]||S[8]||S[11],16)/w*255),Math.round(parseInt(S[3]||S[6]||S[9]||S[12],16)/w*255)]}}else if(_.indexOf("#")===0&&(_=_.slice(1),d.exec(_)&&[3,6,9,12].includes(_.length))){const S=_.length/3,w=[0,0,0];for(let C=0;C<3;++C){const a=parseInt(_.slice(S*C,S*C+S),16);w[C]=S===1?a<<4:S===2?a:S===3?a>>4:a>>8}return w}},n.toRgbString=function(h,_=16){const[S,w,C]=h;return`rgb:${y(S,_)}/${y(w,_)}/${y(C,_)}`}},5770:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.PAYLOAD_LIMIT=void 0,n.PAYLOAD_LIMIT=1e7},6351:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DcsHandler=n.DcsParser=void 0;const d=u(482),y=u(8742),h=u(5770),_=[];n.DcsParser=class{constructor(){this._handlers=Object.create(null),this._active=_,this._ident=0,this._handlerFb=()=>{},this._stack={paused:!1,loopPosition:0,fallThrough:!1}}dispose(){this._handlers=Object.create(null),this._handlerFb=()=>{},this._active=_}registerHandler(w,C){this._handlers[w]===void 0&&(this._handlers[w]=[]);const a=this._handlers[w];return a.push(C),{dispose:()=>{const l=a.indexOf(C);l!==-1&&a.splice(l,1)}}}clearHandler(w){this._handlers[w]&&delete this._handlers[w]}setHandlerFallback(w){this._handlerFb=w}reset(){if(this._active.length)for(let w=this._stack.paused?this._stack.loopPosition-1:this._active.length-1;w>=0;--w)this._active[w].unhook(!1);this._stack.paused=!1,this._active=_,this._ident=0}hook(w,C){if(this.reset(),this._ident=w,this._active=this._handlers[w]||_,this._active.length)for(let a=this._active.length-1;a>=0;a--)this._active[a].hook(C);else this._handlerFb(this._ident,"HOOK",C)}put(w,C,a){if(this._active.length)for(let l=this._active.length-1;l>=0;l--)this._active[l].put(w,C,a);else this._handlerFb(this._ident,"PUT",(0,d.utf32ToString)(w,C,a))}unhook(w,C=!0){if(this._active.length){let a=!1,l=this._active.length-1,s=!1;if(this._stack.paused&&(l=this._stack.loopPosition-1,a=C,s=this._stack.fallThrough,this._stack.paused=!1),!s&&a===!1){for(;l>=0&&(a=this._active[l].unhook(w),a!==!0);l--)if(a instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=l,this._stack.fallThrough=!1,a;l--}for(;l>=0;l--)if(a=this._active[l].unhook(!1),a instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=l,this._stack.fallThrough=!0,a}else this._handlerFb(this._ident,"UNHOOK",w);this._active=_,this._ident=0}};const S=new y.Params;S.addParam(0),n.DcsHandler=class{constructor(w){this._handler=w,this._data="",this._params=S,this._hitLimit=!1}hook(w){this._params=w.length>1||w.params[0]?w.clone():S,this._data="",this._hitLimit=!1}put(w,C,a){this._hitLimit||(this._data+=(0,d.utf32ToString)(w,C,a),this._data.length>h.PAYLOAD_LIMIT&&(this._data="",this._hitLimit=!0))}unhook(w){let C=!1;if(this._hitLimit)C=!1;else if(w&&(C=this._handler(this._data,this._params),C instanceof Promise))return C.then(a=>(this._params=S,this._data="",this._hitLimit=!1,a));return this._params=S,this._data="",this._hitLimit=!1,C}}},2015:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.EscapeSequenceParser=n.VT500_TRANSITION_TABLE=n.TransitionTable=void 0;const d=u(844),y=u(8742),h=u(6242),_=u(6351);class S{constructor(l){this.table=new Uint8Array(l)}setDefault(l,s){this.table.fill(l<<4|s)}add(l,s,o,p){this.table[s<<8|l]=o<<4|p}addMany(l,s,o,p){for(let m=0;m<l.length;m++)this.table[s<<8|l[m]]=o<<4|p}}n.TransitionTable=S;const w=160;n.VT500_TRANSITION_TABLE=function(){const a=new S(4095),l=Array.apply(null,Array(256)).map((E,v)=>v),s=(E,v)=>l.slice(E,v),o=s(32,127),p=s(0,24);p.push(25),p.push.apply(p,s(28,32));const m=s(0,14);let x;for(x in a.setDefault(1,0),a.addMany(o,0,2,0),m)a.addMany([24,26,153,154],x,3,0),a.addMany(s(128,144),x,3,0),a.addMany(s(144,152),x,3,0),a.add(156,x,0,0),a.add(27,x,11,1),a.add(157,x,4,8),a.addMany([152,158,159],x,0,7),a.add(155,x,11,3),a.add(144,x,11,9);return a.addMany(p,0,3,0),a.addMany(p,1,3,1),a.add(127,1,0,1),a.addMany(p,8,0,8),a.addMany(p,3,3,3),a.add(127,3,0,3),a.addMany(p,4,3,4),a.add(127,4,0,4),a.addMany(p,6,3,6),a.addMany(p,5,3,5),a.add(127,5,0,5),a.addMany(p,2,3,2),a.add(127,2,0,2),a.add(93,1,4,8),a.addMany(o,8,5,8),a.add(127,8,5,8),a.addMany([156,27,24,26,7],8,6,0),a.addMany(s(28,32),8,0,8),a.addMany([88,94,95],1,0,7),a.addMany(o,7,0,7),a.addMany(p,7,0,7),a.add(156,7,0,0),a.add(127,7,0,7),a.add(91,1,11,3),a.addMany(s(64,127),3,7,0),a.addMany(s(48,60),3,8,4),a.addMany([60,61,62,63],3,9,4),a.addMany(s(48,60),4,8,4),a.addMany(s(64,127),4,7,0),a.addMany([60,61,62,63],4,0,6),a.addMany(s(32,64),6,0,6),a.add(127,6,0,6),a.addMany(s(64,127),6,0,0),a.addMany(s(32,48),3,9,5),a.addMany(s(32,48),5,9,5),a.addMany(s(48,64),5,0,6),a.addMany(s(64,127),5,7,0),a.addMany(s(32,48),4,9,5),a.addMany(s(32,48),1,9,2),a.addMany(s(32,48),2,9,2),a.addMany(s(48,127),2,10,0),a.addMany(s(48,80),1,10,0),a.addMany(s(81,88),1,10,0),a.addMany([89,90,92],1,10,0),a.addMany(s(96,127),1,10,0),a.add(80,1,11,9),a.addMany(p,9,0,9),a.add(127,9,0,9),a.addMany(s(28,32),9,0,9),a.addMany(s(32,48),9,9,12),a.addMany(s(48,60),9,8,10),a.addMany([60,61,62,63],9,9,10),a.addMany(p,11,0,11),a.addMany(s(32,128),11,0,11),a.addMany(s(28,32),11,0,11),a.addMany(p,10,0,10),a.add(127,10,0,10),a.addMany(s(28,32),10,0,10),a.addMany(s(48,60),10,8,10),a.addMany([60,61,62,63],10,0,11),a.addMany(s(32,48),10,9,12),a.addMany(p,12,0,12),a.add(127,12,0,12),a.addMany(s(28,32),12,0,12),a.addMany(s(32,48),12,9,12),a.addMany(s(48,64),12,0,11),a.addMany(s(64,127),12,12,13),a.addMany(s(64,127),10,12,13),a.addMany(s(64,127),9,12,13),a.addMany(p,13,13,13),a.addMany(o,13,13,13),a.add(127,13,0,13),a.addMany([27,156,24,26],13,14,0),a.add(w,0,2,0),a.add(w,8,5,8),a.add(w,6,0,6),a.add(w,11,0,11),a.add(w,13,13,13),a}();class C extends d.Disposable{constructor(l=n.VT500_TRANSITION_TABLE){super(),this._transitions=l,this._parseStack={state:0,handlers:[],handlerPos:0,transition:0,chunkPos:0},this.initialState=0,this.currentState=this.initialState,this._params=new y.Params,this._params.addParam(0),this._collect=0,this.precedingCodepoint=0,this._printHandlerFb=(s,o,p)=>{},this._executeHandlerFb=s=>{},this._csiHandlerFb=(s,o)=>{},this._escHandlerFb=s=>{},this._errorHandlerFb=s=>s,this._printHandler=this._printHandlerFb,this._executeHandlers=Object.create(null),this._csiHandlers=Object.create(null),this._escHandlers=Object.create(null),this.register((0,d.toDisposable)(()=>{this._csiHandlers=Object.create(null),this._executeHandlers=Object.create(null),this._escHandlers=Object.create(null)})),this._oscParser=this.register(new h.OscParser),this._dcsParser=this.register(new _.DcsParser),this._errorHandler=this._errorHandlerFb,this.registerEscHandler({final:"\\"},()=>!0)}_identifier(l,s=[64,126]){let o=0;if(l.prefix){if(l.prefix.length>1)throw new Error("only one byte as prefix supported");if(o=l.prefix.charCodeAt(0),o&&60>o||o>63)throw new Error("prefix must be in range 0x3c .. 0x3f")}if(l.intermediates){if(l.intermediates.length>2)throw new Error("only two bytes as intermediates are supported");for(let m=0;m<l.intermediates.length;++m){const x=l.intermediates.charCodeAt(m);if(32>x||x>47)throw new Error("intermediate must be in range 0x20 .. 0x2f");o<<=8,o|=x}}if(l.final.length!==1)throw new Error("final must be a single byte");const p=l.final.charCodeAt(0);if(s[0]>p||p>s[1])throw new Error(`final must be in range ${s[0]} .. ${s[1]}`);return o<<=8,o|=p,o}identToString(l){const s=[];for(;l;)s.push(String.fromCharCode(255&l)),l>>=8;return s.reverse().join("")}setPrintHandler(l){this._printHandler=l}clearPrintHandler(){this._printHandler=this._printHandlerFb}registerEscHandler(l,s){const o=this._identifier(l,[48,126]);this._escHandlers[o]===void 0&&(this._escHandlers[o]=[]);const p=this._escHandlers[o];return p.push(s),{dispose:()=>{const m=p.indexOf(s);m!==-1&&p.splice(m,1)}}}clearEscHandler(l){this._escHandlers[this._identifier(l,[48,126])]&&delete this._escHandlers[this._identifier(l,[48,126])]}setEscHandlerFallback(l){this._escHandlerFb=l}setExecuteHandler(l,s){this._executeHandlers[l.charCodeAt(0)]=s}clearExecuteHandler(l){this._executeHandlers[l.charCodeAt(0)]&&delete this._executeHandlers[l.charCodeAt(0)]}setExecuteHandlerFallback(l){this._executeHandlerFb=l}registerCsiHandler(l,s){const o=this._identifier(l);this._csiHandlers[o]===void 0&&(this._csiHandlers[o]=[]);const p=this._csiHandlers[o];return p.push(s),{dispose:()=>{const m=p.indexOf(s);m!==-1&&p.splice(m,1)}}}clearCsiHandler(l){this._csiHandlers[this._identifier(l)]&&delete this._csiHandlers[this._identifier(l)]}setCsiHandlerFallback(l){this._csiHandlerFb=l}registerDcsHandler(l,s){return this._dcsParser.registerHandler(this._identifier(l),s)}clearDcsHandler(l){this._dcsParser.clearHandler(this._identifier(l))}setDcsHandlerFallback(l){this._dcsParser.setHandlerFallback(l)}registerOscHandler(l,s){return this._oscParser.registerHandler(l,s)}clearOscHandler(l){this._oscParser.clearHandler(l)}setOscHandlerFallback(l){this._oscParser.setHandlerFallback(l)}setErrorHandler(l){this._errorHandler=l}clearErrorHandler(){this._errorHandler=this._errorHandlerFb}reset(){this.currentState=this.initialState,this._oscParser.reset(),this._dcsParser.reset(),this._params.reset(),this._params.addParam(0),this._collect=0,this.precedingCodepoint=0,this._parseStack.state!==0&&(this._parseStack.state=2,this._parseStack.handlers=[])}_preserveStack(l,s,o,p,m){this._parseStack.state=l,this._parseStack.handlers=s,this._parseStack.handlerPos=o,this._parseStack.transition=p,this._parseStack.chunkPos=m}parse(l,s,o){let p,m=0,x=0,E=0;if(this._parseStack.state)if(this._parseStack.state===2)this._parseStack.state=0,E=this._parseStack.chunkPos+1;else{if(o===void 0||this._parseStack.state===1)throw this._parseStack.state=1,new Error("improper continuation due to previous async handler, giving up parsing");const v=this._parseStack.handlers;let k=this._parseStack.handlerPos-1;switch(this._parseStack.state){case 3:if(o===!1&&k>-1){for(;k>=0&&(p=v[k](this._params),p!==!0);k--)if(p instanceof Promise)return this._parseStack.handlerPos=k,p}this._parseStack.handlers=[];break;case 4:if(o===!1&&k>-1){for(;k>=0&&(p=v[k](),p!==!0);k--)if(p instanceof Promise)return this._parseStack.handlerPos=k,p}this._parseStack.handlers=[];break;case 6:if(m=l[this._parseStack.chunkPos],p=this._dcsParser.unhook(m!==24&&m!==26,o),p)return p;m===27&&(this._parseStack.transition|=1),this._params.reset(),this._params.addParam(0),this._collect=0;break;case 5:if(m=l[this._parseStack.chunkPos],p=this._oscParser.end(m!==24&&m!==26,o),p)return p;m===27&&(this._parseStack.transition|=1),this._params.reset(),this._params.addParam(0),this._collect=0}this._parseStack.state=0,E=this._parseStack.chunkPos+1,this.precedingCodepoint=0,this.currentState=15&this._parseStack.transition}for(let v=E;v<s;++v){switch(m=l[v],x=this._transitions.table[this.currentState<<8|(m<160?m:w)],x>>4){case 2:for(let P=v+1;;++P){if(P>=s||(m=l[P])<32||m>126&&m<w){this._printHandler(l,v,P),v=P-1;break}if(++P>=s||(m=l[P])<32||m>126&&m<w){this._printHandler(l,v,P),v=P-1;break}if(++P>=s||(m=l[P])<32||m>126&&m<w){this._printHandler(l,v,P),v=P-1;break}if(++P>=s||(m=l[P])<32||m>126&&m<w){this._printHandler(l,v,P),v=P-1;break}}break;case 3:this._executeHandlers[m]?this._executeHandlers[m]():this._executeHandlerFb(m),this.precedingCodepoint=0;break;case 0:break;case 1:if(this._errorHandler({position:v,code:m,currentState:this.currentState,collect:this._collect,params:this._params,abort:!1}).abort)return;break;case 7:const k=this._csiHandlers[this._collect<<8|m];let B=k?k.length-1:-1;for(;B>=0&&(p=k[B](this._params),p!==!0);B--)if(p instanceof Promise)return this._preserveStack(3,k,B,x,v),p;B<0&&this._csiHandlerFb(this._collect<<8|m,this._params),this.precedingCodepoint=0;break;case 8:do switch(m){case 59:this._params.addParam(0);break;case 58:this._params.addSubParam(-1);break;default:this._params.addDigit(m-48)}while(++v<s&&(m=l[v])>47&&m<60);v--;break;case 9:this._collect<<=8,this._collect|=m;break;case 10:const M=this._escHandlers[this._collect<<8|m];let T=M?M.length-1:-1;for(;T>=0&&(p=M[T](),p!==!0);T--)if(p instanceof Promise)return this._preserveStack(4,M,T,x,v),p;T<0&&this._escHandlerFb(this._collect<<8|m),this.precedingCodepoint=0;break;case 11:this._params.reset(),this._params.addParam(0),this._collect=0;break;case 12:this._dcsParser.hook(this._collect<<8|m,this._params);break;case 13:for(let P=v+1;;++P)if(P>=s||(m=l[P])===24||m===26||m===27||m>127&&m<w){this._dcsParser.put(l,v,P),v=P-1;break}break;case 14:if(p=this._dcsParser.unhook(m!==24&&m!==26),p)return this._preserveStack(6,[],0,x,v),p;m===27&&(x|=1),this._params.reset(),this._params.addParam(0),this._collect=0,this.precedingCodepoint=0;break;case 4:this._oscParser.start();break;case 5:for(let P=v+1;;P++)if(P>=s||(m=l[P])<32||m>127&&m<w){this._oscParser.put(l,v,P),v=P-1;break}break;case 6:if(p=this._oscParser.end(m!==24&&m!==26),p)return this._preserveStack(5,[],0,x,v),p;m===27&&(x|=1),this._params.reset(),this._params.addParam(0),this._collect=0,this.precedingCodepoint=0}this.currentState=15&x}}}n.EscapeSequenceParser=C},6242:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.OscHandler=n.OscParser=void 0;const d=u(5770),y=u(482),h=[];n.OscParser=class{constructor(){this._state=0,this._active=h,this._id=-1,this._handlers=Object.create(null),this._handlerFb=()=>{},this._stack={paused:!1,loopPosition:0,fallThrough:!1}}registerHandler(_,S){this._handlers[_]===void 0&&(this._handlers[_]=[]);const w=this._handlers[_];return w.push(S),{dispose:()=>{const C=w.indexOf(S);C!==-1&&w.splice(C,1)}}}clearHandler(_){this._handlers[_]&&delete this._handlers[_]}setHandlerFallback(_){this._handlerFb=_}dispose(){this._handlers=Object.create(null),this._handlerFb=()=>{},this._active=h}reset(){if(this._state===2)for(let _=this._stack.paused?this._stack.loopPosition-1:this._active.length-1;_>=0;--_)this._active[_].end(!1);this._stack.paused=!1,this._active=h,this._id=-1,this._state=0}_start(){if(this._active=this._handlers[this._id]||h,this._active.length)for(let _=this._active.length-1;_>=0;_--)this._active[_].start();else this._handlerFb(this._id,"START")}_put(_,S,w){if(this._active.length)for(let C=this._active.length-1;C>=0;C--)this._active[C].put(_,S,w);else this._handlerFb(this._id,"PUT",(0,y.utf32ToString)(_,S,w))}start(){this.reset(),this._state=1}put(_,S,w){if(this._state!==3){if(this._state===1)for(;S<w;){const C=_[S++];if(C===59){this._state=2,this._start();break}if(C<48||57<C)return void(this._state=3);this._id===-1&&(this._id=0),this._id=10*this._id+C-48}this._state===2&&w-S>0&&this._put(_,S,w)}}end(_,S=!0){if(this._state!==0){if(this._state!==3)if(this._state===1&&this._start(),this._active.length){let w=!1,C=this._active.length-1,a=!1;if(this._stack.paused&&(C=this._stack.loopPosition-1,w=S,a=this._stack.fallThrough,this._stack.paused=!1),!a&&w===!1){for(;C>=0&&(w=this._active[C].end(_),w!==!0);C--)if(w instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=C,this._stack.fallThrough=!1,w;C--}for(;C>=0;C--)if(w=this._active[C].end(!1),w instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=C,this._stack.fallThrough=!0,w}else this._handlerFb(this._id,"END",_);this._active=h,this._id=-1,this._state=0}}},n.OscHandler=class{constructor(_){this._handler=_,this._data="",this._hitLimit=!1}start(){this._data="",this._hitLimit=!1}put(_,S,w){this._hitLimit||(this._data+=(0,y.utf32ToString)(_,S,w),this._data.length>d.PAYLOAD_LIMIT&&(this._data="",this._hitLimit=!0))}end(_){let S=!1;if(this._hitLimit)S=!1;else if(_&&(S=this._handler(this._data),S instanceof Promise))return S.then(w=>(this._data="",this._hitLimit=!1,w));return this._data="",this._hitLimit=!1,S}}},8742:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Params=void 0;const u=2147483647;class d{static fromArray(h){const _=new d;if(!h.length)return _;for(let S=Array.isArray(h[0])?1:0;S<h.length;++S){const w=h[S];if(Array.isArray(w))for(let C=0;C<w.length;++C)_.addSubParam(w[C]);else _.addParam(w)}return _}constructor(h=32,_=32){if(this.maxLength=h,this.maxSubParamsLength=_,_>256)throw new Error("maxSubParamsLength must not be greater than 256");this.params=new Int32Array(h),this.length=0,this._subParams=new Int32Array(_),this._subParamsLength=0,this._subParamsIdx=new Uint16Array(h),this._rejectDigits=!1,this._rejectSubDigits=!1,this._digitIsSub=!1}clone(){const h=new d(this.maxLength,this.maxSubParamsLength);return h.params.set(this.params),h.length=this.length,h._subParams.set(this._subParams),h._subParamsLength=this._subParamsLength,h._subParamsIdx.set(this._subParamsIdx),h._rejectDigits=this._rejectDigits,h._rejectSubDigits=this._rejectSubDigits,h._digitIsSub=this._digitIsSub,h}toArray(){const h=[];for(let _=0;_<this.length;++_){h.push(this.params[_]);const S=this._subParamsIdx[_]>>8,w=255&this._subParamsIdx[_];w-S>0&&h.push(Array.prototype.slice.call(this._subParams,S,w))}return h}reset(){this.length=0,this._subParamsLength=0,this._rejectDigits=!1,this._rejectSubDigits=!1,this._digitIsSub=!1}addParam(h){if(this._digitIsSub=!1,this.length>=this.maxLength)this._rejectDigits=!0;else{if(h<-1)throw new Error("values lesser than -1 are not allowed");this._subParamsIdx[this.length]=this._subParamsLength<<8|this._subParamsLength,this.params[this.length++]=h>u?u:h}}addSubParam(h){if(this._digitIsSub=!0,this.length)if(this._rejectDigits||this._subParamsLength>=this.maxSubParamsLength)this._rejectSubDigits=!0;else{if(h<-1)throw new Error("values lesser than -1 are not allowed");this._subParams[this._subParamsLength++]=h>u?u:h,this._subParamsIdx[this.length-1]++}}hasSubParams(h){return(255&this._subParamsIdx[h])-(this._subParamsIdx[h]>>8)>0}getSubParams(h){const _=this._subParamsIdx[h]>>8,S=255&this._subParamsIdx[h];return S-_>0?this._subParams.subarray(_,S):null}getSubParamsAll(){const h={};for(let _=0;_<this.length;++_){const S=this._subParamsIdx[_]>>8,w=255&this._subParamsIdx[_];w-S>0&&(h[_]=this._subParams.slice(S,w))}return h}addDigit(h){let _;if(this._rejectDigits||!(_=this._digitIsSub?this._subParamsLength:this.length)||this._digitIsSub&&this._rejectSubDigits)return;const S=this._digitIsSub?this._subParams:this.params,w=S[_-1];S[_-1]=~w?Math.min(10*w+h,u):h}}n.Params=d},5741:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.AddonManager=void 0,n.AddonManager=class{constructor(){this._addons=[]}dispose(){for(let u=this._addons.length-1;u>=0;u--)this._addons[u].instance.dispose()}loadAddon(u,d){const y={instance:d,dispose:d.dispose,isDisposed:!1};this._addons.push(y),d.dispose=()=>this._wrappedAddonDispose(y),d.activate(u)}_wrappedAddonDispose(u){if(u.isDisposed)return;let d=-1;for(let y=0;y<this._addons.length;y++)if(this._addons[y]===u){d=y;break}if(d===-1)throw new Error("Could not dispose an addon that has not been loaded");u.isDisposed=!0,u.dispose.apply(u.instance),this._addons.splice(d,1)}}},8771:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferApiView=void 0;const d=u(3785),y=u(511);n.BufferApiView=class{constructor(h,_){this._buffer=h,this.type=_}init(h){return this._buffer=h,this}get cursorY(){return this._buffer.y}get cursorX(){return this._buffer.x}get viewportY(){return this._buffer.ydisp}get baseY(){return this._buffer.ybase}get length(){return this._buffer.lines.length}getLine(h){const _=this._buffer.lines.get(h);if(_)return new d.BufferLineApiView(_)}getNullCell(){return new y.CellData}}},3785:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferLineApiView=void 0;const d=u(511);n.BufferLineApiView=class{constructor(y){this._line=y}get isWrapped(){return this._line.isWrapped}get length(){return this._line.length}getCell(y,h){if(!(y<0||y>=this._line.length))return h?(this._line.loadCell(y,h),h):this._line.loadCell(y,new d.CellData)}translateToString(y,h,_){return this._line.translateToString(y,h,_)}}},8285:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferNamespaceApi=void 0;const d=u(8771),y=u(8460),h=u(844);class _ extends h.Disposable{constructor(w){super(),this._core=w,this._onBufferChange=this.register(new y.EventEmitter),this.onBufferChange=this._onBufferChange.event,this._normal=new d.BufferApiView(this._core.buffers.normal,"normal"),this._alternate=new d.BufferApiView(this._core.buffers.alt,"alternate"),this._core.buffers.onBufferActivate(()=>this._onBufferChange.fire(this.active))}get active(){if(this._core.buffers.active===this._core.buffers.normal)return this.normal;if(this._core.buffers.active===this._core.buffers.alt)return this.alternate;throw new Error("Active buffer is neither normal nor alternate")}get normal(){return this._normal.init(this._core.buffers.normal)}get alternate(){return this._alternate.init(this._core.buffers.alt)}}n.BufferNamespaceApi=_},7975:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ParserApi=void 0,n.ParserApi=class{constructor(u){this._core=u}registerCsiHandler(u,d){return this._core.registerCsiHandler(u,y=>d(y.toArray()))}addCsiHandler(u,d){return this.registerCsiHandler(u,d)}registerDcsHandler(u,d){return this._core.registerDcsHandler(u,(y,h)=>d(y,h.toArray()))}addDcsHandler(u,d){return this.registerDcsHandler(u,d)}registerEscHandler(u,d){return this._core.registerEscHandler(u,d)}addEscHandler(u,d){return this.registerEscHandler(u,d)}registerOscHandler(u,d){return this._core.registerOscHandler(u,d)}addOscHandler(u,d){return this.registerOscHandler(u,d)}}},7090:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.UnicodeApi=void 0,n.UnicodeApi=class{constructor(u){this._core=u}register(u){this._core.unicodeService.register(u)}get versions(){return this._core.unicodeService.versions}get activeVersion(){return this._core.unicodeService.activeVersion}set activeVersion(u){this._core.unicodeService.activeVersion=u}}},744:function(g,n,u){var d=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.BufferService=n.MINIMUM_ROWS=n.MINIMUM_COLS=void 0;const h=u(8460),_=u(844),S=u(5295),w=u(2585);n.MINIMUM_COLS=2,n.MINIMUM_ROWS=1;let C=n.BufferService=class extends _.Disposable{get buffer(){return this.buffers.active}constructor(a){super(),this.isUserScrolling=!1,this._onResize=this.register(new h.EventEmitter),this.onResize=this._onResize.event,this._onScroll=this.register(new h.EventEmitter),this.onScroll=this._onScroll.event,this.cols=Math.max(a.rawOptions.cols||0,n.MINIMUM_COLS),this.rows=Math.max(a.rawOptions.rows||0,n.MINIMUM_ROWS),this.buffers=this.register(new S.BufferSet(a,this))}resize(a,l){this.cols=a,this.rows=l,this.buffers.resize(a,l),this._onResize.fire({cols:a,rows:l})}reset(){this.buffers.reset(),this.isUserScrolling=!1}scroll(a,l=!1){const s=this.buffer;let o;o=this._cachedBlankLine,o&&o.length===this.cols&&o.getFg(0)===a.fg&&o.getBg(0)===a.bg||(o=s.getBlankLine(a,l),this._cachedBlankLine=o),o.isWrapped=l;const p=s.ybase+s.scrollTop,m=s.ybase+s.scrollBottom;if(s.scrollTop===0){const x=s.lines.isFull;m===s.lines.length-1?x?s.lines.recycle().copyFrom(o):s.lines.push(o.clone()):s.lines.splice(m+1,0,o.clone()),x?this.isUserScrolling&&(s.ydisp=Math.max(s.ydisp-1,0)):(s.ybase++,this.isUserScrolling||s.ydisp++)}else{const x=m-p+1;s.lines.shiftElements(p+1,x-1,-1),s.lines.set(m,o.clone())}this.isUserScrolling||(s.ydisp=s.ybase),this._onScroll.fire(s.ydisp)}scrollLines(a,l,s){const o=this.buffer;if(a<0){if(o.ydisp===0)return;this.isUserScrolling=!0}else a+o.ydisp>=o.ybase&&(this.isUserScrolling=!1);const p=o.ydisp;o.ydisp=Math.max(Math.min(o.ydisp+a,o.ybase),0),p!==o.ydisp&&(l||this._onScroll.fire(o.ydisp))}};n.BufferService=C=d([y(0,w.IOptionsService)],C)},7994:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CharsetService=void 0,n.CharsetService=class{constructor(){this.glevel=0,this._charsets=[]}reset(){this.charset=void 0,this._charsets=[],this.glevel=0}setgLevel(u){this.glevel=u,this.charset=this._charsets[u]}setgCharset(u,d){this._charsets[u]=d,this.glevel===u&&(this.charset=d)}}},1753:function(g,n,u){var d=this&&this.__decorate||function(o,p,m,x){var E,v=arguments.length,k=v<3?p:x===null?x=Object.getOwnPropertyDescriptor(p,m):x;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")k=Reflect.decorate(o,p,m,x);else for(var B=o.length-1;B>=0;B--)(E=o[B])&&(k=(v<3?E(k):v>3?E(p,m,k):E(p,m))||k);return v>3&&k&&Object.defineProperty(p,m,k),k},y=this&&this.__param||function(o,p){return function(m,x){p(m,x,o)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CoreMouseService=void 0;const h=u(2585),_=u(8460),S=u(844),w={NONE:{events:0,restrict:()=>!1},X10:{events:1,restrict:o=>o.button!==4&&o.action===1&&(o.ctrl=!1,o.alt=!1,o.shift=!1,!0)},VT200:{events:19,restrict:o=>o.action!==32},DRAG:{events:23,restrict:o=>o.action!==32||o.button!==3},ANY:{events:31,restrict:o=>!0}};function C(o,p){let m=(o.ctrl?16:0)|(o.shift?4:0)|(o.alt?8:0);return o.button===4?(m|=64,m|=o.action):(m|=3&o.button,4&o.button&&(m|=64),8&o.button&&(m|=128),o.action===32?m|=32:o.action!==0||p||(m|=3)),m}const a=String.fromCharCode,l={DEFAULT:o=>{const p=[C(o,!1)+32,o.col+32,o.row+32];return p[0]>255||p[1]>255||p[2]>255?"":`\x1B[M${a(p[0])}${a(p[1])}${a(p[2])}`},SGR:o=>{const p=o.action===0&&o.button!==4?"m":"M";return`\x1B[<${C(o,!0)};${o.col};${o.row}${p}`},SGR_PIXELS:o=>{const p=o.action===0&&o.button!==4?"m":"M";return`\x1B[<${C(o,!0)};${o.x};${o.y}${p}`}};let s=n.CoreMouseService=class extends S.Disposable{constructor(o,p){super(),this._bufferService=o,this._coreService=p,this._protocols={},this._encodings={},this._activeProtocol="",this._activeEncoding="",this._lastEvent=null,this._onProtocolChange=this.register(new _.EventEmitter),this.onProtocolChange=this._onProtocolChange.event;for(const m of Object.keys(w))this.addProtocol(m,w[m]);for(const m of Object.keys(l))this.addEncoding(m,l[m]);this.reset()}addProtocol(o,p){this._protocols[o]=p}addEncoding(o,p){this._encodings[o]=p}get activeProtocol(){return this._activeProtocol}get areMouseEventsActive(){return this._protocols[this._activeProtocol].events!==0}set activeProtocol(o){if(!this._protocols[o])throw new Error(`unknown protocol "${o}"`);this._activeProtocol=o,this._onProtocolChange.fire(this._protocols[o].events)}get activeEncoding(){return this._activeEncoding}set activeEncoding(o){if(!this._encodings[o])throw new Error(`unknown encoding "${o}"`);this._activeEncoding=o}reset(){this.activeProtocol="NONE",this.activeEncoding="DEFAULT",this._lastEvent=null}triggerMouseEvent(o){if(o.col<0||o.col>=this._bufferService.cols||o.row<0||o.row>=this._bufferService.rows||o.button===4&&o.action===32||o.button===3&&o.action!==32||o.button!==4&&(o.action===2||o.action===3)||(o.col++,o.row++,o.action===32&&this._lastEvent&&this._equalEvents(this._lastEvent,o,this._activeEncoding==="SGR_PIXELS"))||!this._protocols[this._activeProtocol].restrict(o))return!1;const p=this._encodings[this._activeEncoding](o);return p&&(this._activeEncoding==="DEFAULT"?this._coreService.triggerBinaryEvent(p):this._coreService.triggerDataEvent(p,!0)),this._lastEvent=o,!0}explainEvents(o){return{down:!!(1&o),up:!!(2&o),drag:!!(4&o),move:!!(8&o),wheel:!!(16&o)}}_equalEvents(o,p,m){if(m){if(o.x!==p.x||o.y!==p.y)return!1}else if(o.col!==p.col||o.row!==p.row)return!1;return o.button===p.button&&o.action===p.action&&o.ctrl===p.ctrl&&o.alt===p.alt&&o.shift===p.shift}};n.CoreMouseService=s=d([y(0,h.IBufferService),y(1,h.ICoreService)],s)},6975:function(g,n,u){var d=this&&this.__decorate||function(s,o,p,m){var x,E=arguments.length,v=E<3?o:m===null?m=Object.getOwnPropertyDescriptor(o,p):m;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")v=Reflect.decorate(s,o,p,m);else for(var k=s.length-1;k>=0;k--)(x=s[k])&&(v=(E<3?x(v):E>3?x(o,p,v):x(o,p))||v);return E>3&&v&&Object.defineProperty(o,p,v),v},y=this&&this.__param||function(s,o){return function(p,m){o(p,m,s)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CoreService=void 0;const h=u(1439),_=u(8460),S=u(844),w=u(2585),C=Object.freeze({insertMode:!1}),a=Object.freeze({applicationCursorKeys:!1,applicationKeypad:!1,bracketedPasteMode:!1,origin:!1,reverseWraparound:!1,sendFocus:!1,wraparound:!0});let l=n.CoreService=class extends S.Disposable{constructor(s,o,p){super(),this._bufferService=s,this._logService=o,this._optionsService=p,this.isCursorInitialized=!1,this.isCursorHidden=!1,this._onData=this.register(new _.EventEmitter),this.onData=this._onData.event,this._onUserInput=this.register(new _.EventEmitter),this.onUserInput=this._onUserInput.event,this._onBinary=this.register(new _.EventEmitter),this.onBinary=this._onBinary.event,this._onRequestScrollToBottom=this.register(new _.EventEmitter),this.onRequestScrollToBottom=this._onRequestScrollToBottom.event,this.modes=(0,h.clone)(C),this.decPrivateModes=(0,h.clone)(a)}reset(){this.modes=(0,h.clone)(C),this.decPrivateModes=(0,h.clone)(a)}triggerDataEvent(s,o=!1){if(this._optionsService.rawOptions.disableStdin)return;const p=this._bufferService.buffer;o&&this._optionsService.rawOptions.scrollOnUserInput&&p.ybase!==p.ydisp&&this._onRequestScrollToBottom.fire(),o&&this._onUserInput.fire(),this._logService.debug(`sending data "${s}"`,()=>s.split("").map(m=>m.charCodeAt(0))),this._onData.fire(s)}triggerBinaryEvent(s){this._optionsService.rawOptions.disableStdin||(this._logService.debug(`sending binary "${s}"`,()=>s.split("").map(o=>o.charCodeAt(0))),this._onBinary.fire(s))}};n.CoreService=l=d([y(0,w.IBufferService),y(1,w.ILogService),y(2,w.IOptionsService)],l)},9074:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DecorationService=void 0;const d=u(8055),y=u(8460),h=u(844),_=u(6106);let S=0,w=0;class C extends h.Disposable{get decorations(){return this._decorations.values()}constructor(){super(),this._decorations=new _.SortedList(s=>s==null?void 0:s.marker.line),this._onDecorationRegistered=this.register(new y.EventEmitter),this.onDecorationRegistered=this._onDecorationRegistered.event,this._onDecorationRemoved=this.register(new y.EventEmitter),this.onDecorationRemoved=this._onDecorationRemoved.event,this.register((0,h.toDisposable)(()=>this.reset()))}registerDecoration(s){if(s.marker.isDisposed)return;const o=new a(s);if(o){const p=o.marker.onDispose(()=>o.dispose());o.onDispose(()=>{o&&(this._decorations.delete(o)&&this._onDecorationRemoved.fire(o),p.dispose())}),this._decorations.insert(o),this._onDecorationRegistered.fire(o)}return o}reset(){for(const s of this._decorations.values())s.dispose();this._decorations.clear()}*getDecorationsAtCell(s,o,p){var m,x,E;let v=0,k=0;for(const B of this._decorations.getKeyIterator(o))v=(m=B.options.x)!==null&&m!==void 0?m:0,k=v+((x=B.options.width)!==null&&x!==void 0?x:1),s>=v&&s<k&&(!p||((E=B.options.layer)!==null&&E!==void 0?E:"bottom")===p)&&(yield B)}forEachDecorationAtCell(s,o,p,m){this._decorations.forEachByKey(o,x=>{var E,v,k;S=(E=x.options.x)!==null&&E!==void 0?E:0,w=S+((v=x.options.width)!==null&&v!==void 0?v:1),s>=S&&s<w&&(!p||((k=x.options.layer)!==null&&k!==void 0?k:"bottom")===p)&&m(x)})}}n.DecorationService=C;class a extends h.Disposable{get isDisposed(){return this._isDisposed}get backgroundColorRGB(){return this._cachedBg===null&&(this.options.backgroundColor?this._cachedBg=d.css.toColor(this.options.backgroundColor):this._cachedBg=void 0),this._cachedBg}get foregroundColorRGB(){return this._cachedFg===null&&(this.options.foregroundColor?this._cachedFg=d.css.toColor(this.options.foregroundColor):this._cachedFg=void 0),this._cachedFg}constructor(s){super(),this.options=s,this.onRenderEmitter=this.register(new y.EventEmitter),this.onRender=this.onRenderEmitter.event,this._onDispose=this.register(new y.EventEmitter),this.onDispose=this._onDispose.event,this._cachedBg=null,this._cachedFg=null,this.marker=s.marker,this.options.overviewRulerOptions&&!this.options.overviewRulerOptions.position&&(this.options.overviewRulerOptions.position="full")}dispose(){this._onDispose.fire(),super.dispose()}}},4348:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.InstantiationService=n.ServiceCollection=void 0;const d=u(2585),y=u(8343);class h{constructor(...S){this._entries=new Map;for(const[w,C]of S)this.set(w,C)}set(S,w){const C=this._entries.get(S);return this._entries.set(S,w),C}forEach(S){for(const[w,C]of this._entries.entries())S(w,C)}has(S){return this._entries.has(S)}get(S){return this._entries.get(S)}}n.ServiceCollection=h,n.InstantiationService=class{constructor(){this._services=new h,this._services.set(d.IInstantiationService,this)}setService(_,S){this._services.set(_,S)}getService(_){return this._services.get(_)}createInstance(_,...S){const w=(0,y.getServiceDependencies)(_).sort((l,s)=>l.index-s.index),C=[];for(const l of w){const s=this._services.get(l.id);if(!s)throw new Error(`[createInstance] ${_.name} depends on UNKNOWN service ${l.id}.`);C.push(s)}const a=w.length>0?w[0].index:S.length;if(S.length!==a)throw new Error(`[createInstance] First service dependency of ${_.name} at position ${a+1} conflicts with ${S.length} static arguments`);return new _(...S,...C)}}},7866:function(g,n,u){var d=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.traceCall=n.setTraceLogger=n.LogService=void 0;const h=u(844),_=u(2585),S={trace:_.LogLevelEnum.TRACE,debug:_.LogLevelEnum.DEBUG,info:_.LogLevelEnum.INFO,warn:_.LogLevelEnum.WARN,error:_.LogLevelEnum.ERROR,off:_.LogLevelEnum.OFF};let w,C=n.LogService=class extends h.Disposable{get logLevel(){return this._logLevel}constructor(a){super(),this._optionsService=a,this._logLevel=_.LogLevelEnum.OFF,this._updateLogLevel(),this.register(this._optionsService.onSpecificOptionChange("logLevel",()=>this._updateLogLevel())),w=this}_updateLogLevel(){this._logLevel=S[this._optionsService.rawOptions.logLevel]}_evalLazyOptionalParams(a){for(let l=0;l<a.length;l++)typeof a[l]=="function"&&(a[l]=a[l]())}_log(a,l,s){this._evalLazyOptionalParams(s),a.call(console,(this._optionsService.options.logger?"":"xterm.js: ")+l,...s)}trace(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.TRACE&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.trace.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.log,a,l)}debug(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.DEBUG&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.debug.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.log,a,l)}info(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.INFO&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.info.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.info,a,l)}warn(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.WARN&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.warn.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.warn,a,l)}error(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.ERROR&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.error.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.error,a,l)}};n.LogService=C=d([y(0,_.IOptionsService)],C),n.setTraceLogger=function(a){w=a},n.traceCall=function(a,l,s){if(typeof s.value!="function")throw new Error("not supported");const o=s.value;s.value=function(...p){if(w.logLevel!==_.LogLevelEnum.TRACE)return o.apply(this,p);w.trace(`GlyphRenderer#${o.name}(${p.map(x=>JSON.stringify(x)).join(", ")})`);const m=o.apply(this,p);return w.trace(`GlyphRenderer#${o.name} return`,m),m}}},7302:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.OptionsService=n.DEFAULT_OPTIONS=void 0;const d=u(8460),y=u(844),h=u(6114);n.DEFAULT_OPTIONS={cols:80,rows:24,cursorBlink:!1,cursorStyle:"block",cursorWidth:1,cursorInactiveStyle:"outline",customGlyphs:!0,drawBoldTextInBrightColors:!0,fastScrollModifier:"alt",fastScrollSensitivity:5,fontFamily:"courier-new, courier, monospace",fontSize:15,fontWeight:"normal",fontWeightBold:"bold",ignoreBracketedPasteMode:!1,lineHeight:1,letterSpacing:0,linkHandler:null,logLevel:"info",logger:null,scrollback:1e3,scrollOnUserInput:!0,scrollSensitivity:1,screenReaderMode:!1,smoothScrollDuration:0,macOptionIsMeta:!1,macOptionClickForcesSelection:!1,minimumContrastRatio:1,disableStdin:!1,allowProposedApi:!1,allowTransparency:!1,tabStopWidth:8,theme:{},rightClickSelectsWord:h.isMac,windowOptions:{},windowsMode:!1,windowsPty:{},wordSeparator:" ()[]{}',\"`",altClickMovesCursor:!0,convertEol:!1,termName:"xterm",cancelEvents:!1,overviewRulerWidth:0};const _=["normal","bold","100","200","300","400","500","600","700","800","900"];class S extends y.Disposable{constructor(C){super(),this._onOptionChange=this.register(new d.EventEmitter),this.onOptionChange=this._onOptionChange.event;const a=Object.assign({},n.DEFAULT_OPTIONS);for(const l in C)if(l in a)try{const s=C[l];a[l]=this._sanitizeAndValidateOption(l,s)}catch(s){console.error(s)}this.rawOptions=a,this.options=Object.assign({},a),this._setupOptions()}onSpecificOptionChange(C,a){return this.onOptionChange(l=>{l===C&&a(this.rawOptions[C])})}onMultipleOptionChange(C,a){return this.onOptionChange(l=>{C.indexOf(l)!==-1&&a()})}_setupOptions(){const C=l=>{if(!(l in n.DEFAULT_OPTIONS))throw new Error(`No option with key "${l}"`);return this.rawOptions[l]},a=(l,s)=>{if(!(l in n.DEFAULT_OPTIONS))throw new Error(`No option with key "${l}"`);s=this._sanitizeAndValidateOption(l,s),this.rawOptions[l]!==s&&(this.rawOptions[l]=s,this._onOptionChange.fire(l))};for(const l in this.rawOptions){const s={get:C.bind(this,l),set:a.bind(this,l)};Object.defineProperty(this.options,l,s)}}_sanitizeAndValidateOption(C,a){switch(C){case"cursorStyle":if(a||(a=n.DEFAULT_OPTIONS[C]),!function(l){return l==="block"||l==="underline"||l==="bar"}(a))throw new Error(`"${a}" is not a valid value for ${C}`);break;case"wordSeparator":a||(a=n.DEFAULT_OPTIONS[C]);break;case"fontWeight":case"fontWeightBold":if(typeof a=="number"&&1<=a&&a<=1e3)break;a=_.includes(a)?a:n.DEFAULT_OPTIONS[C];break;case"cursorWidth":a=Math.floor(a);case"lineHeight":case"tabStopWidth":if(a<1)throw new Error(`${C} cannot be less than 1, value: ${a}`);break;case"minimumContrastRatio":a=Math.max(1,Math.min(21,Math.round(10*a)/10));break;case"scrollback":if((a=Math.min(a,4294967295))<0)throw new Error(`${C} cannot be less than 0, value: ${a}`);break;case"fastScrollSensitivity":case"scrollSensitivity":if(a<=0)throw new Error(`${C} cannot be less than or equal to 0, value: ${a}`);break;case"rows":case"cols":if(!a&&a!==0)throw new Error(`${C} must be numeric, value: ${a}`);break;case"windowsPty":a=a??{}}return a}}n.OptionsService=S},2660:function(g,n,u){var d=this&&this.__decorate||function(S,w,C,a){var l,s=arguments.length,o=s<3?w:a===null?a=Object.getOwnPropertyDescriptor(w,C):a;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")o=Reflect.decorate(S,w,C,a);else for(var p=S.length-1;p>=0;p--)(l=S[p])&&(o=(s<3?l(o):s>3?l(w,C,o):l(w,C))||o);return s>3&&o&&Object.defineProperty(w,C,o),o},y=this&&this.__param||function(S,w){return function(C,a){w(C,a,S)}};Object.defineProperty(n,"__esModule",{value:!0}),n.OscLinkService=void 0;const h=u(2585);let _=n.OscLinkService=class{constructor(S){this._bufferService=S,this._nextId=1,this._entriesWithId=new Map,this._dataByLinkId=new Map}registerLink(S){const w=this._bufferService.buffer;if(S.id===void 0){const p=w.addMarker(w.ybase+w.y),m={data:S,id:this._nextId++,lines:[p]};return p.onDispose(()=>this._removeMarkerFromLink(m,p)),this._dataByLinkId.set(m.id,m),m.id}const C=S,a=this._getEntryIdKey(C),l=this._entriesWithId.get(a);if(l)return this.addLineToLink(l.id,w.ybase+w.y),l.id;const s=w.addMarker(w.ybase+w.y),o={id:this._nextId++,key:this._getEntryIdKey(C),data:C,lines:[s]};return s.onDispose(()=>this._removeMarkerFromLink(o,s)),this._entriesWithId.set(o.key,o),this._dataByLinkId.set(o.id,o),o.id}addLineToLink(S,w){const C=this._dataByLinkId.get(S);if(C&&C.lines.every(a=>a.line!==w)){const a=this._bufferService.buffer.addMarker(w);C.lines.push(a),a.onDispose(()=>this._removeMarkerFromLink(C,a))}}getLinkData(S){var w;return(w=this._dataByLinkId.get(S))===null||w===void 0?void 0:w.data}_getEntryIdKey(S){return`${S.id};;${S.uri}`}_removeMarkerFromLink(S,w){const C=S.lines.indexOf(w);C!==-1&&(S.lines.splice(C,1),S.lines.length===0&&(S.data.id!==void 0&&this._entriesWithId.delete(S.key),this._dataByLinkId.delete(S.id)))}};n.OscLinkService=_=d([y(0,h.IBufferService)],_)},8343:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.createDecorator=n.getServiceDependencies=n.serviceRegistry=void 0;const u="di$target",d="di$dependencies";n.serviceRegistry=new Map,n.getServiceDependencies=function(y){return y[d]||[]},n.createDecorator=function(y){if(n.serviceRegistry.has(y))return n.serviceRegistry.get(y);const h=function(_,S,w){if(arguments.length!==3)throw new Error("@IServiceName-decorator can only be used to decorate a parameter");(function(C,a,l){a[u]===a?a[d].push({id:C,index:l}):(a[d]=[{id:C,index:l}],a[u]=a)})(h,_,w)};return h.toString=()=>y,n.serviceRegistry.set(y,h),h}},2585:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.IDecorationService=n.IUnicodeService=n.IOscLinkService=n.IOptionsService=n.ILogService=n.LogLevelEnum=n.IInstantiationService=n.ICharsetService=n.ICoreService=n.ICoreMouseService=n.IBufferService=void 0;const d=u(8343);var y;n.IBufferService=(0,d.createDecorator)("BufferService"),n.ICoreMouseService=(0,d.createDecorator)("CoreMouseService"),n.ICoreService=(0,d.createDecorator)("CoreService"),n.ICharsetService=(0,d.createDecorator)("CharsetService"),n.IInstantiationService=(0,d.createDecorator)("InstantiationService"),function(h){h[h.TRACE=0]="TRACE",h[h.DEBUG=1]="DEBUG",h[h.INFO=2]="INFO",h[h.WARN=3]="WARN",h[h.ERROR=4]="ERROR",h[h.OFF=5]="OFF"}(y||(n.LogLevelEnum=y={})),n.ILogService=(0,d.createDecorator)("LogService"),n.IOptionsService=(0,d.createDecorator)("OptionsService"),n.IOscLinkService=(0,d.createDecorator)("OscLinkService"),n.IUnicodeService=(0,d.createDecorator)("UnicodeService"),n.IDecorationService=(0,d.createDecorator)("DecorationService")},1480:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.UnicodeService=void 0;const d=u(8460),y=u(225);n.UnicodeService=class{constructor(){this._providers=Object.create(null),this._active="",this._onChange=new d.EventEmitter,this.onChange=this._onChange.event;const h=new y.UnicodeV6;this.register(h),this._active=h.version,this._activeProvider=h}dispose(){this._onChange.dispose()}get versions(){return Object.keys(this._providers)}get activeVersion(){return this._active}set activeVersion(h){if(!this._providers[h])throw new Error(`unknown Unicode version "${h}"`);this._active=h,this._activeProvider=this._providers[h],this._onChange.fire(h)}register(h){this._providers[h.version]=h}wcwidth(h){return this._activeProvider.wcwidth(h)}getStringCellWidth(h){let _=0;const S=h.length;for(let w=0;w<S;++w){let C=h.charCodeAt(w);if(55296<=C&&C<=56319){if(++w>=S)return _+this.wcwidth(C);const a=h.charCodeAt(w);56320<=a&&a<=57343?C=1024*(C-55296)+a-56320+65536:_+=this.wcwidth(a)}_+=this.wcwidth(C)}return _}}}},i={};function c(g){var n=i[g];if(n!==void 0)return n.exports;var u=i[g]={exports:{}};return r[g].call(u.exports,u,u.exports,c),u.exports}var f={};return(()=>{var g=f;Object.defineProperty(g,"__esModule",{value:!0}),g.Terminal=void 0;const n=c(9042),u=c(3236),d=c(844),y=c(5741),h=c(8285),_=c(7975),S=c(7090),w=["cols","rows"];class C extends d.Disposable{constructor(l){super(),this._core=this.register(new u.Terminal(l)),this._addonManager=this.register(new y.AddonManager),this._publicOptions=Object.assign({},this._core.options);const s=p=>this._core.options[p],o=(p,m)=>{this._checkReadonlyOptions(p),this._core.options[p]=m};for(const p in this._core.options){const m={get:s.bind(this,p),set:o.bind(this,p)};Object.defineProperty(this._publicOptions,p,m)}}_checkReadonlyOptions(l){if(w.includes(l))throw new Error(`Option "${l}" can only be set in the constructor`)}_checkProposedApi(){if(!this._core.optionsService.rawOptions.allowProposedApi)throw new Error("You must set the allowProposedApi option to true to use proposed API")}get onBell(){return this._core.onBell}get onBinary(){return this._core.onBinary}get onCursorMove(){return this._core.onCursorMove}get onData(){return this._core.onData}get onKey(){return this._core.onKey}get onLineFeed(){return this._core.onLineFeed}get onRender(){return this._core.onRender}get onResize(){return this._core.onResize}get onScroll(){return this._core.onScroll}get onSelectionChange(){return this._core.onSelectionChange}get onTitleChange(){return this._core.onTitleChange}get onWriteParsed(){return this._core.onWriteParsed}get element(){return this._core.element}get parser(){return this._parser||(this._parser=new _.ParserApi(this._core)),this._parser}get unicode(){return this._checkProposedApi(),new S.UnicodeApi(this._core)}get textarea(){return this._core.textarea}get rows(){return this._core.rows}get cols(){return this._core.cols}get buffer(){return this._buffer||(this._buffer=this.register(new h.BufferNamespaceApi(this._core))),this._buffer}get markers(){return this._checkProposedApi(),this._core.markers}get modes(){const l=this._core.coreService.decPrivateModes;let s="none";switch(this._core.coreMouseService.activeProtocol){case"X10":s="x10";break;case"VT200":s="vt200";break;case"DRAG":s="drag";break;case"ANY":s="any"}return{applicationCursorKeysMode:l.applicationCursorKeys,applicationKeypadMode:l.applicationKeypad,bracketedPasteMode:l.bracketedPasteMode,insertMode:this._core.coreService.modes.insertMode,mouseTrackingMode:s,originMode:l.origin,reverseWraparoundMode:l.reverseWraparound,sendFocusMode:l.sendFocus,wraparoundMode:l.wraparound}}get options(){return this._publicOptions}set options(l){for(const s in l)this._publicOptions[s]=l[s]}blur(){this._core.blur()}focus(){this._core.focus()}resize(l,s){this._verifyIntegers(l,s),this._core.resize(l,s)}open(l){this._core.open(l)}attachCustomKeyEventHandler(l){this._core.attachCustomKeyEventHandler(l)}registerLinkProvider(l){return this._core.registerLinkProvider(l)}registerCharacterJoiner(l){return this._checkProposedApi(),this._core.registerCharacterJoiner(l)}deregisterCharacterJoiner(l){this._checkProposedApi(),this._core.deregisterCharacterJoiner(l)}registerMarker(l=0){return this._verifyIntegers(l),this._core.registerMarker(l)}registerDecoration(l){var s,o,p;return this._checkProposedApi(),this._verifyPositiveIntegers((s=l.x)!==null&&s!==void 0?s:0,(o=l.width)!==null&&o!==void 0?o:0,(p=l.height)!==null&&p!==void 0?p:0),this._core.registerDecoration(l)}hasSelection(){return this._core.hasSelection()}select(l,s,o){this._verifyIntegers(l,s,o),this._core.select(l,s,o)}getSelection(){return this._core.getSelection()}getSelectionPosition(){return this._core.getSelectionPosition()}clearSelection(){this._core.clearSelection()}selectAll(){this._core.selectAll()}selectLines(l,s){this._verifyIntegers(l,s),this._core.selectLines(l,s)}dispose(){super.dispose()}scrollLines(l){this._verifyIntegers(l),this._core.scrollLines(l)}scrollPages(l){this._verifyIntegers(l),this._core.scrollPages(l)}scrollToTop(){this._core.scrollToTop()}scrollToBottom(){this._core.scrollToBottom()}scrollToLine(l){this._verifyIntegers(l),this._core.scrollToLine(l)}clear(){this._core.clear()}write(l,s){this._core.write(l,s)}writeln(l,s){this._core.write(l),this._core.write(`\r
-`,s)}paste(l){this._core.paste(l)}refresh(l,s){this._verifyIntegers(l,s),this._core.refresh(l,s)}reset(){this._core.reset()}clearTextureAtlas(){this._core.clearTextureAtlas()}loadAddon(l){this._addonManager.loadAddon(this,l)}static get strings(){return n}_verifyIntegers(...l){for(const s of l)if(s===1/0||isNaN(s)||s%1!=0)throw new Error("This API only accepts integers")}_verifyPositiveIntegers(...l){for(const s of l)if(s&&(s===1/0||isNaN(s)||s%1!=0||s<0))throw new Error("This API only accepts positive integers")}}g.Terminal=C})(),f})())})(rh);var zp=rh.exports,sh={exports:{}};(function(e,t){(function(r,i){e.exports=i()})(self,()=>(()=>{var r={};return(()=>{var i=r;Object.defineProperty(i,"__esModule",{value:!0}),i.FitAddon=void 0,i.FitAddon=class{activate(c){this._terminal=c}dispose(){}fit(){const c=this.proposeDimensions();if(!c||!this._terminal||isNaN(c.cols)||isNaN(c.rows))return;const f=this._terminal._core;this._terminal.rows===c.rows&&this._terminal.cols===c.cols||(f._renderService.clear(),this._terminal.resize(c.cols,c.rows))}proposeDimensions(){if(!this._terminal||!this._terminal.element||!this._terminal.element.parentElement)return;const c=this._terminal._core,f=c._renderService.dimensions;if(f.css.cell.width===0||f.css.cell.height===0)return;const g=this._terminal.options.scrollback===0?0:c.viewport.scrollBarWidth,n=window.getComputedStyle(this._terminal.element.parentElement),u=parseInt(n.getPropertyValue("height")),d=Math.max(0,parseInt(n.getPropertyValue("width"))),y=window.getComputedStyle(this._terminal.element),h=u-(parseInt(y.getPropertyValue("padding-top"))+parseInt(y.getPropertyValue("padding-bottom"))),_=d-(parseInt(y.getPropertyValue("padding-right"))+parseInt(y.getPropertyValue("padding-left")))-g;return{cols:Math.max(2,Math.floor(_/f.css.cell.width)),rows:Math.max(1,Math.floor(h/f.css.cell.height))}}}})(),r})())})(sh);var Np=sh.exports;const Wp={background:"#282a36",foreground:"#f8f8f2",cursor:"#f8f8f2",cursorAccent:"#282a36",selection:"rgba(68, 71, 90, 0.5)",black:"#21222c",red:"#ff5555",green:"#50fa7b",yellow:"#f1fa8c",blue:"#bd93f9",magenta:"#ff79c6",cyan:"#8be9fd",white:"#f8f8f2",brightBlack:"#6272a4",brightRed:"#ff6e6e",brightGreen:"#69ff94",brightYellow:"#ffffa5",brightBlue:"#d6acff",brightMagenta:"#ff92df",brightCyan:"#a4ffff",brightWhite:"#ffffff",ui:{bg:"#282a36",bgSecondary:"#21222c",bgTertiary:"#44475a",border:"#44475a",text:"#f8f8f2",textSecondary:"#6272a4",accent:"#bd93f9",iconColor:"#f8f8f2"}},Up={background:"#272822",foreground:"#f8f8f2",cursor:"#f8f8f0",cursorAccent:"#272822",selection:"rgba(73, 72, 62, 0.5)",black:"#272822",red:"#f92672",green:"#a6e22e",yellow:"#f4bf75",blue:"#66d9ef",magenta:"#ae81ff",cyan:"#a1efe4",white:"#f8f8f2",brightBlack:"#75715e",brightRed:"#f92672",brightGreen:"#a6e22e",brightYellow:"#f4bf75",brightBlue:"#66d9ef",brightMagenta:"#ae81ff",brightCyan:"#a1efe4",brightWhite:"#f9f8f5",ui:{bg:"#272822",bgSecondary:"#1e1f1c",bgTertiary:"#49483e",border:"#49483e",text:"#f8f8f2",textSecondary:"#75715e",accent:"#66d9ef",iconColor:"#f8f8f2"}},$p={background:"#002b36",foreground:"#839496",cursor:"#839496",cursorAccent:"#002b36",selection:"rgba(7, 54, 66, 0.5)",black:"#073642",red:"#dc322f",green:"#859900",yellow:"#b58900",blue:"#268bd2",magenta:"#d33682",cyan:"#2aa198",white:"#eee8d5",brightBlack:"#002b36",brightRed:"#cb4b16",brightGreen:"#586e75",brightYellow:"#657b83",brightBlue:"#839496",brightMagenta:"#6c71c4",brightCyan:"#93a1a1",brightWhite:"#fdf6e3",ui:{bg:"#002b36",bgSecondary:"#073642",bgTertiary:"#0a3540",border:"#0a3540",text:"#93a1a1",textSecondary:"#657b83",accent:"#268bd2",iconColor:"#93a1a1"}},Vp={background:"#0d1117",foreground:"#c9d1d9",cursor:"#c9d1d9",cursorAccent:"#0d1117",selection:"rgba(56, 139, 253, 0.3)",black:"#484f58",red:"#ff7b72",green:"#3fb950",yellow:"#d29922",blue:"#58a6ff",magenta:"#bc8cff",cyan:"#39c5cf",white:"#b1bac4",brightBlack:"#6e7681",brightRed:"#ffa198",brightGreen:"#56d364",brightYellow:"#e3b341",brightBlue:"#79c0ff",brightMagenta:"#d2a8ff",brightCyan:"#56d4dd",brightWhite:"#f0f6fc",ui:{bg:"#0d1117",bgSecondary:"#010409",bgTertiary:"#21262d",border:"#30363d",text:"#e6edf3",textSecondary:"#7d8590",accent:"#58a6ff",iconColor:"#e6edf3"}},Kp={background:"#1e1e2e",foreground:"#cdd6f4",cursor:"#f5e0dc",cursorAccent:"#1e1e2e",selection:"rgba(116, 199, 236, 0.3)",black:"#45475a",red:"#f38ba8",green:"#a6e3a1",yellow:"#f9e2af",blue:"#89b4fa",magenta:"#f5c2e7",cyan:"#94e2d5",white:"#bac2de",brightBlack:"#585b70",brightRed:"#f38ba8",brightGreen:"#a6e3a1",brightYellow:"#f9e2af",brightBlue:"#89b4fa",brightMagenta:"#f5c2e7",brightCyan:"#94e2d5",brightWhite:"#a6adc8",ui:{bg:"#1e1e2e",bgSecondary:"#181825",bgTertiary:"#313244",border:"#313244",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa",iconColor:"#cdd6f4"}},Dt={catppuccin:Kp,dracula:Wp,monokai:Up,solarizedDark:$p,github:Vp},qp=Object.keys(Dt),Gp=(e,t={})=>{const{autoScroll:r="smart",sensitivity:i=.8,smoothScroll:c=!0}=t,f=$.useRef(!1),g=$.useRef(0),n=$.useRef(null),u=$.useCallback(()=>{if(!e.current)return!1;const{scrollTop:S,scrollHeight:w,clientHeight:C}=e.current,a=w-C;if(a===0)return!0;const l=a*(1-i*.2);return S>=l},[e,i]),d=$.useCallback(()=>{if(!e.current)return;const{scrollHeight:S,clientHeight:w}=e.current;c?e.current.scrollTo({top:S-w,behavior:"smooth"}):e.current.scrollTop=S-w},[e,c]),y=$.useCallback(()=>{if(!e.current)return;const S=Date.now();S-g.current<100||(g.current=S,u()?f.current=!1:f.current=!0,n.current&&clearTimeout(n.current),n.current=setTimeout(()=>{u()&&(f.current=!1)},500))},[e,u]),h=$.useCallback(()=>{if(r!=="never"){if(r==="always"){setTimeout(d,10);return}f.current||setTimeout(d,10)}},[r,d]),_=$.useCallback(()=>{f.current=!1,d()},[d]);return{handleUserScroll:y,handleNewData:h,forceScrollToBottom:_,isNearBottom:u}},Ha={en:{appName:"Terminal List",session:"Session",newSession:"New Session",settings:"Settings",connecting:"Connecting...",connected:"Terminal Connected",disconnected:"Connection Lost",connectionError:"Connection Error",settingsTitle:"Settings",theme:"Theme",language:"Language",fontSize:"Font Size",fontFamily:"Font Family",scrollBehavior:"Scroll Behavior",autoScroll:"Auto Scroll",smoothScroll:"Smooth Scroll",save:"Save",cancel:"Cancel",reset:"Reset to Default",themeCatppuccin:"Catppuccin",themeDracula:"Dracula",themeMonokai:"Monokai",themeSolarizedDark:"Solarized Dark",themeGithub:"GitHub Dark",languageEnglish:"English",languageKorean:"한국어",paste:"Paste",commandInput:"Command Input",commandInputPlaceholder:"Enter command... (Ctrl+Enter to send)",commandInputHint:"💡 Enter for new line, Ctrl+Enter to send",send:"Send",clear:"Clear",clearInput:"Clear input",confirmClearInput:"Are you sure you want to clear all input?",settingsSaved:"Settings saved successfully",sessionCreated:"New session created",confirmNewSession:"Create a new session? Current session will continue in background.",confirm:"Confirm",close:"Close",closeTerminal:"Close Terminal",confirmCloseTerminal:"Are you sure you want to close this terminal? All unsaved work will be lost.",cannotCloseLastSession:"Cannot close the last terminal. Create a new one first.",sessions:"Sessions",closeSidebar:"Close sidebar",closeTerminal:"Close terminal",resizeSidebar:"Resize sidebar",activeTerminals:"Active Terminals",noTerminals:"No terminals open",createFirstTerminal:"Click + to create a new terminal",clipboardError:"Clipboard access denied",networkError:"Network error occurred",loading:"Loading...",logout:"Logout",confirmLogout:"Confirm Logout",logoutMessage:"Are you sure you want to logout?",user:"User",initialSetup:"Initial Setup",initialSetupDescription:"Create an administrator account to get started. You will need these credentials to access the terminal.",username:"Username",password:"Password",confirmPassword:"Confirm Password",usernamePlaceholder:"Enter username",passwordPlaceholder:"Enter password (min 8 characters)",confirmPasswordPlaceholder:"Re-enter password",createAccount:"Create Administrator",creating:"Creating...",setupFooter:"This account will have full access to all terminals and settings.",usernameMinLength:"Username must be at least 3 characters",passwordMinLength:"Password must be at least 8 characters",passwordMismatch:"Passwords do not match",login:"Sign In",loginDescription:"Enter your administrator credentials",signIn:"Sign In",signingIn:"Signing in...",fillAllFields:"Please fill in all fields"},ko:{appName:"Terminal List",session:"세션",newSession:"새로운 세션",settings:"설정",connecting:"연결 중...",connected:"터미널 연결됨",disconnected:"연결이 끊어졌습니다",connectionError:"연결 오류",settingsTitle:"설정",theme:"테마",language:"언어",fontSize:"글꼴 크기",fontFamily:"글꼴",scrollBehavior:"스크롤 동작",autoScroll:"자동 스크롤",smoothScroll:"부드러운 스크롤",save:"저장",cancel:"취소",reset:"기본값으로 재설정",themeCatppuccin:"Catppuccin",themeDracula:"Dracula",themeMonokai:"Monokai",themeSolarizedDark:"Solarized Dark",themeGithub:"GitHub Dark",languageEnglish:"English",languageKorean:"한국어",paste:"붙여넣기",commandInput:"명령어 입력",commandInputPlaceholder:"명령어를 입력하세요... (Ctrl+Enter로 전송)",commandInputHint:"💡 Enter로 줄바꿈, Ctrl+Enter로 전송",send:"전송",clear:"지우기",clearInput:"내용 지우기",confirmClearInput:"입력한 내용을 모두 지우시겠습니까?",settingsSaved:"설정이 저장되었습니다",sessionCreated:"새 세션이 생성되었습니다",confirmNewSession:"새 세션을 만드시겠습니까? 현재 세션은 백그라운드에서 계속됩니다.",confirm:"확인",close:"닫기",closeTerminal:"터미널 종료",confirmCloseTerminal:"이 터미널을 닫으시겠습니까? 저장되지 않은 모든 작업이 손실됩니다.",cannotCloseLastSession:"마지막 터미널은 닫을 수 없습니다. 먼저 새 터미널을 생성하세요.",sessions:"세션 목록",closeSidebar:"사이드바 닫기",closeTerminal:"터미널 종료",resizeSidebar:"사이드바 크기 조정",activeTerminals:"활성 터미널",noTerminals:"열려있는 터미널이 없습니다",createFirstTerminal:"+ 버튼을 눌러 새 터미널을 만드세요",clipboardError:"클립보드 접근 권한이 필요합니다",networkError:"네트워크 오류가 발생했습니다",loading:"로딩 중...",logout:"로그아웃",confirmLogout:"로그아웃 확인",logoutMessage:"로그아웃 하시겠습니까?",user:"사용자",initialSetup:"초기 설정",initialSetupDescription:"시작하려면 관리자 계정을 생성하세요. 터미널에 접근하려면 이 자격 증명이 필요합니다.",username:"사용자명",password:"비밀번호",confirmPassword:"비밀번호 확인",usernamePlaceholder:"사용자명을 입력하세요",passwordPlaceholder:"비밀번호를 입력하세요 (최소 8자)",confirmPasswordPlaceholder:"비밀번호를 다시 입력하세요",createAccount:"관리자 생성",creating:"생성 중...",setupFooter:"이 계정은 모든 터미널과 설정에 대한 전체 액세스 권한을 갖습니다.",usernameMinLength:"사용자명은 최소 3자 이상이어야 합니다",passwordMinLength:"비밀번호는 최소 8자 이상이어야 합니다",passwordMismatch:"비밀번호가 일치하지 않습니다",login:"로그인",loginDescription:"관리자 자격 증명을 입력하세요",signIn:"로그인",signingIn:"로그인 중...",fillAllFields:"모든 필드를 입력해주세요"}},Xp="en",Sr=e=>({t:$.useMemo(()=>{const r=Ha[e]||Ha[Xp];return(i,c=i)=>r[i]||c},[e])}),Yp=({sessionId:e,settings:t,onSendData:r,isActive:i=!0})=>{var o;const c=$.useRef(null),f=$.useRef(null),g=$.useRef(null),n=$.useRef(null),u=$.useRef(null),[d,y]=$.useState(!1),{t:h}=Sr(t.language),{handleUserScroll:_,handleNewData:S}=Gp(c,{autoScroll:t.autoScroll,sensitivity:t.scrollSensitivity,smoothScroll:t.smoothScroll}),w=Dt[t.theme]||Dt.catppuccin;$.useEffect(()=>{if(!c.current)return;y(!1);const p=new zp.Terminal({theme:w,fontFamily:'"JetBrains Mono", monospace',fontSize:t.fontSize,lineHeight:1.2,letterSpacing:0,cursorBlink:!0,cursorStyle:"block",allowTransparency:!1,scrollback:1e4,convertEol:!0,screenReaderMode:!1,smoothScrollDuration:t.smoothScroll?50:0,disableStdin:!1,windowOptions:{setWinLines:!0}}),m=new Np.FitAddon;p.loadAddon(m),p.open(c.current),p.reset(),f.current=p,g.current=m;try{m.fit(),p.focus()}catch(T){console.error("Initial fit error:",T)}setTimeout(()=>{try{m.fit()}catch(T){console.error("Fit error:",T)}},50);const x=new ResizeObserver(()=>{try{m.fit(),console.log(`Terminal resized: ${p.cols}x${p.rows}`)}catch(T){console.error("Immediate fit error:",T)}u.current&&clearTimeout(u.current),u.current=setTimeout(()=>{if(n.current&&n.current.readyState===WebSocket.OPEN){const T=localStorage.getItem("auth_token");fetch(`/api/sessions/${e}/resize`,{method:"POST",headers:{"Content-Type":"application/json",Authorization:T?`Bearer ${T}`:""},body:JSON.stringify({cols:p.cols,rows:p.rows})}).catch(P=>console.error("크기 변경 실패:",P))}},200)});x.observe(c.current);const E=window.location.protocol==="https:"?"wss:":"ws:",v=window.location.host||"localhost:8000",k=`${E}//${v}/ws/${e}?cols=${p.cols}&rows=${p.rows}`;console.log("WebSocket 연결 시도:",k,`(${p.cols}x${p.rows})`);const B=new WebSocket(k);n.current=B,B.onopen=()=>{console.log("WebSocket 연결됨:",e);try{m.fit()}catch(P){console.error("Fit error on connect:",P)}y(!0);const T=localStorage.getItem("auth_token");fetch(`/api/sessions/${e}/resize`,{method:"POST",headers:{"Content-Type":"application/json",Authorization:T?`Bearer ${T}`:""},body:JSON.stringify({cols:p.cols,rows:p.rows})}).catch(P=>console.error("초기 크기 설정 실패:",P))},B.onmessage=T=>{p.write(T.data),S()},B.onerror=T=>{console.error("WebSocket 에러:",T),p.writeln(`\x1B[1;31m✗ ${h("connectionError")}\x1B[0m`)},B.onclose=()=>{console.log("WebSocket 연결 종료"),p.writeln(`\x1B[1;33m⚠ ${h("disconnected")}\x1B[0m`)},p.onData(T=>{B.readyState===WebSocket.OPEN&&B.send(T),r&&r(T)});const M=c.current;return M&&M.addEventListener("scroll",_),()=>{x.disconnect(),u.current&&clearTimeout(u.current),M&&M.removeEventListener("scroll",_),B.readyState===WebSocket.OPEN&&B.close(),p.dispose()}},[e,_,S,h]),$.useEffect(()=>{if(!f.current)return;const p=f.current;p.options.theme=w,p.options.fontFamily='"JetBrains Mono", monospace',p.options.fontSize=t.fontSize,p.options.smoothScrollDuration=t.smoothScroll?50:0,p.refresh(0,p.rows-1)},[t.theme,t.fontFamily,t.fontSize,t.smoothScroll,w]),$.useEffect(()=>{if(!f.current)return;const p=f.current;p.options.cursorBlink=i},[i]);const C=$.useCallback(p=>{n.current&&n.current.readyState===WebSocket.OPEN&&n.current.send(p)},[]),a=$.useCallback(()=>f.current?f.current.getSelection():"",[]),l=$.useCallback(()=>{f.current&&f.current.scrollToBottom()},[]);$.useEffect(()=>(window.terminalSessions||(window.terminalSessions={}),window.terminalSessions[e]={sendData:C,getSelection:a,scrollToBottom:l},()=>{window.terminalSessions&&delete window.terminalSessions[e]}),[e,C,a,l]);const s=()=>{f.current&&f.current.focus()};return L.jsxs(L.Fragment,{children:[!d&&L.jsx("div",{style:{position:"absolute",top:0,left:0,right:0,bottom:0,backgroundColor:w.background,display:"flex",alignItems:"center",justifyContent:"center",zIndex:10},children:L.jsx("div",{style:{fontSize:"14px",color:((o=w.ui)==null?void 0:o.textSecondary)||"#6c7086"},children:h("connecting")})}),L.jsx("div",{ref:c,onClick:s,style:{width:"100%",height:"100%",overflow:"auto",backgroundColor:w.background,cursor:"text",boxSizing:"border-box",opacity:d?1:0,transition:"opacity 0.2s ease",caretColor:"transparent"}})]})},Qp=e=>{$.useEffect(()=>{if(!window.visualViewport||!e.current)return;const t=()=>{const r=window.visualViewport.height,i=window.visualViewport.offsetTop,c=window.innerHeight-r-i;e.current.style.bottom=`${c}px`};return t(),window.visualViewport.addEventListener("resize",t),window.visualViewport.addEventListener("scroll",t),()=>{window.visualViewport.removeEventListener("resize",t),window.visualViewport.removeEventListener("scroll",t)}},[e])},Jp=({onSendKey:e,isVisible:t,onClose:r,activeSessionId:i,onOpenCommandInput:c})=>{const f=$.useRef(null),g=$.useRef(null),[n,u]=$.useState(null),[d,y]=$.useState(!1),[h,_]=$.useState(!1);Qp(f);const S=()=>{if(!g.current)return;const{scrollLeft:o,scrollWidth:p,clientWidth:m}=g.current;y(o>10),_(o<p-m-10)};$.useEffect(()=>{S();const o=g.current;if(o)return o.addEventListener("scroll",S),()=>o.removeEventListener("scroll",S)},[]),$.useEffect(()=>{const o=()=>S();return window.addEventListener("resize",o),()=>window.removeEventListener("resize",o)},[]);const w=()=>{g.current&&g.current.scrollBy({left:-150,behavior:"smooth"})},C=()=>{g.current&&g.current.scrollBy({left:150,behavior:"smooth"})},a=()=>{const o=prompt("Paste text here:");o&&e&&e(o)},l=()=>{e&&e("")},s=(o,p)=>{u(o),p(),setTimeout(()=>u(null),150)};return L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .mobile-toolbar-scroll::-webkit-scrollbar {
-          display: none;
-        }
-      `}),L.jsxs("div",{ref:f,style:{...pe.toolbar,transform:t?"translateY(0)":"translateY(100%)",opacity:t?1:0},children:[d&&L.jsx("button",{onClick:w,style:pe.scrollButton,"aria-label":"Scroll left",children:L.jsx(Jf,{size:16,strokeWidth:2.5})}),L.jsx("div",{ref:g,className:"mobile-toolbar-scroll",style:pe.scrollContainer,onScroll:S,children:L.jsxs("div",{style:pe.buttonGroup,children:[L.jsx("button",{onTouchStart:()=>u("cmd"),onTouchEnd:o=>{o.preventDefault(),s("cmd",()=>c==null?void 0:c())},style:{...pe.button,...pe.primary,transform:n==="cmd"?"scale(0.9)":"scale(1)",opacity:n==="cmd"?.7:1},title:"명령어 입력 (한글 지원)",children:L.jsx(Sp,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("esc"),onTouchEnd:o=>{o.preventDefault(),s("esc",()=>e("\x1B"))},style:{...pe.button,...pe.secondary,transform:n==="esc"?"scale(0.9)":"scale(1)",opacity:n==="esc"?.7:1},children:"ESC"}),L.jsx("button",{onTouchStart:()=>u("tab"),onTouchEnd:o=>{o.preventDefault(),s("tab",()=>e("	"))},style:{...pe.button,...pe.secondary,transform:n==="tab"?"scale(0.9)":"scale(1)",opacity:n==="tab"?.7:1},children:"TAB"}),L.jsx("button",{onTouchStart:()=>u("ctrlc"),onTouchEnd:o=>{o.preventDefault(),s("ctrlc",()=>e(""))},style:{...pe.button,...pe.warning,transform:n==="ctrlc"?"scale(0.9)":"scale(1)",opacity:n==="ctrlc"?.7:1},title:"Ctrl+C (Stop)",children:"^C"}),L.jsx("button",{onTouchStart:()=>u("up"),onTouchEnd:o=>{o.preventDefault(),s("up",()=>e("\x1B[A"))},style:{...pe.button,...pe.secondary,transform:n==="up"?"scale(0.9)":"scale(1)",opacity:n==="up"?.7:1},children:L.jsx(Gf,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("down"),onTouchEnd:o=>{o.preventDefault(),s("down",()=>e("\x1B[B"))},style:{...pe.button,...pe.secondary,transform:n==="down"?"scale(0.9)":"scale(1)",opacity:n==="down"?.7:1},children:L.jsx(Wf,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("left"),onTouchEnd:o=>{o.preventDefault(),s("left",()=>e("\x1B[D"))},style:{...pe.button,...pe.secondary,transform:n==="left"?"scale(0.9)":"scale(1)",opacity:n==="left"?.7:1},children:L.jsx($f,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("right"),onTouchEnd:o=>{o.preventDefault(),s("right",()=>e("\x1B[C"))},style:{...pe.button,...pe.secondary,transform:n==="right"?"scale(0.9)":"scale(1)",opacity:n==="right"?.7:1},children:L.jsx(Kf,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("paste"),onTouchEnd:o=>{o.preventDefault(),s("paste",a)},style:{...pe.button,...pe.secondary,transform:n==="paste"?"scale(0.9)":"scale(1)",opacity:n==="paste"?.7:1},children:L.jsx(Zu,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("clear"),onTouchEnd:o=>{o.preventDefault(),s("clear",l)},style:{...pe.button,...pe.clear,transform:n==="clear"?"scale(0.9)":"scale(1)",opacity:n==="clear"?.7:1},title:"Clear current line (Ctrl+U)",children:L.jsx(eh,{size:13,strokeWidth:2})})]})}),h&&L.jsx("button",{onClick:C,style:pe.scrollButton,"aria-label":"Scroll right",children:L.jsx(Ju,{size:16,strokeWidth:2.5})})]})]})},pe={toolbar:{position:"fixed",left:0,right:0,bottom:0,backgroundColor:"transparent",padding:"4px",zIndex:9999,transition:"transform 0.2s ease, opacity 0.2s ease",display:"flex",alignItems:"center",gap:"4px"},scrollContainer:{flex:1,overflowX:"auto",overflowY:"hidden",WebkitOverflowScrolling:"touch",scrollbarWidth:"none",msOverflowStyle:"none",scrollSnapType:"x proximity",display:"flex",justifyContent:"center"},buttonGroup:{display:"flex",gap:"clamp(3px, 1vw, 6px)",alignItems:"center",flexWrap:"nowrap",padding:"0 4px"},scrollButton:{flexShrink:0,width:"32px",height:"32px",display:"flex",alignItems:"center",justifyContent:"center",backgroundColor:"rgba(24, 24, 37, 0.95)",backdropFilter:"blur(8px)",border:"none",borderRadius:"6px",color:"#cdd6f4",cursor:"pointer",boxShadow:"0 2px 8px rgba(0, 0, 0, 0.4)",transition:"all 0.15s ease",WebkitTapHighlightColor:"transparent"},button:{flex:"0 0 auto",padding:"clamp(4px, 1.5vw, 6px) clamp(6px, 2vw, 10px)",fontSize:"clamp(9px, 2.5vw, 11px)",fontWeight:"500",border:"none",borderRadius:"4px",cursor:"pointer",userSelect:"none",WebkitTapHighlightColor:"transparent",transition:"all 0.15s cubic-bezier(0.4, 0, 0.2, 1)",minWidth:"clamp(26px, 8vw, 32px)",minHeight:"clamp(26px, 8vw, 32px)",display:"flex",alignItems:"center",justifyContent:"center",boxShadow:"0 1px 3px rgba(0, 0, 0, 0.3)",willChange:"transform, opacity",scrollSnapAlign:"start"},primary:{backgroundColor:"#89b4fa",color:"#1e1e2e"},secondary:{backgroundColor:"#313244",color:"#cdd6f4"},warning:{backgroundColor:"#fab387",color:"#1e1e2e"},clear:{backgroundColor:"#94e2d5",color:"#1e1e2e"}},Zp=({isOpen:e,onClose:t,onSend:r,command:i,setCommand:c,theme:f,t:g})=>{const n=$.useRef(null);$.useEffect(()=>{e&&n.current&&setTimeout(()=>{var S;(S=n.current)==null||S.focus()},100)},[e]);const u=()=>{i.trim()&&(r(i),c(""),t())},d=()=>{var w;const S=(g==null?void 0:g("confirmClearInput"))||"입력한 내용을 모두 지우시겠습니까?";i.trim()&&!confirm(S)||(c(""),(w=n.current)==null||w.focus())},y=async()=>{var S,w;try{const C=await navigator.clipboard.readText();c(i+C),(S=n.current)==null||S.focus()}catch{const a=prompt((g==null?void 0:g("paste"))||"붙여넣을 텍스트:");a&&(c(i+a),(w=n.current)==null||w.focus())}},h=S=>{S.key==="Enter"&&(S.ctrlKey||S.metaKey)&&(S.preventDefault(),u()),S.key==="Escape"&&t()};if(!e)return null;const _=f;return L.jsxs(L.Fragment,{children:[L.jsx("div",{style:dt.backdrop,onClick:t}),L.jsx("style",{children:`
-        .command-input-textarea::placeholder {
-          color: ${_.foreground||_.white||"#a6adc8"};
-          opacity: 0.5;
-        }
-      `}),L.jsxs("div",{style:{...dt.modal,backgroundColor:_.ui.bg,borderColor:_.ui.border},children:[L.jsxs("div",{style:{...dt.header,borderBottomColor:_.ui.border},children:[L.jsx("h3",{style:{...dt.title,color:_.foreground||_.ui.fg||"#cdd6f4"},children:(g==null?void 0:g("commandInput"))||"명령어 입력"}),L.jsx("button",{onClick:t,style:{...dt.closeButton,color:_.foreground||_.white||"#bac2de"},title:(g==null?void 0:g("close"))||"닫기",children:L.jsx(Hi,{size:18})})]}),L.jsx("div",{style:dt.body,children:L.jsx("textarea",{ref:n,value:i,onChange:S=>c(S.target.value),onKeyDown:h,placeholder:(g==null?void 0:g("commandInputPlaceholder"))||"명령어를 입력하세요... (Ctrl+Enter로 전송)",className:"command-input-textarea",style:{...dt.textarea,backgroundColor:_.ui.bgSecondary,color:_.foreground||_.white||"#cdd6f4",borderColor:_.ui.border},autoFocus:!0})}),L.jsxs("div",{style:{...dt.footer,borderTopColor:_.ui.border},children:[L.jsx("button",{onClick:y,style:{...dt.clearButton,backgroundColor:_.ui.bgTertiary,color:_.foreground||_.white||"#cdd6f4",opacity:1},title:(g==null?void 0:g("paste"))||"붙여넣기",children:L.jsx(Zu,{size:16})}),L.jsx("button",{onClick:d,disabled:!i.trim(),style:{...dt.clearButton,backgroundColor:i.trim()?_.cyan||_.teal||"#94e2d5":_.ui.bgSecondary,color:i.trim()?"#1e1e2e":_.brightBlack||"#6c7086",opacity:i.trim()?1:.5},title:(g==null?void 0:g("clearInput"))||"내용 지우기",children:L.jsx(eh,{size:16})}),L.jsxs("button",{onClick:u,disabled:!i.trim(),style:{...dt.sendButton,backgroundColor:i.trim()?_.ui.accent:_.ui.bgSecondary,color:i.trim()?"#ffffff":_.brightBlack||"#6c7086",opacity:i.trim()?1:.5},children:[L.jsx(Pp,{size:14}),L.jsx("span",{children:(g==null?void 0:g("send"))||"전송"})]})]})]})]})},dt={backdrop:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.6)",zIndex:1e4,backdropFilter:"blur(2px)"},modal:{position:"fixed",top:"50%",left:"50%",transform:"translate(-50%, -50%)",width:"90%",maxWidth:"500px",maxHeight:"80vh",borderRadius:"8px",border:"1px solid",boxShadow:"0 8px 32px rgba(0, 0, 0, 0.4)",zIndex:10001,display:"flex",flexDirection:"column"},header:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"16px",borderBottom:"1px solid"},title:{margin:0,fontSize:"16px",fontWeight:"600"},closeButton:{background:"none",border:"none",cursor:"pointer",padding:"4px",display:"flex",alignItems:"center",justifyContent:"center",transition:"opacity 0.2s"},body:{flex:1,padding:"16px",display:"flex",flexDirection:"column",overflow:"auto"},textarea:{width:"100%",minHeight:"150px",maxHeight:"300px",padding:"12px",fontSize:"14px",fontFamily:"monospace",border:"1px solid",borderRadius:"4px",resize:"vertical",outline:"none",lineHeight:"1.5"},footer:{display:"flex",gap:"8px",padding:"16px",borderTop:"1px solid"},clearButton:{padding:"10px",fontSize:"14px",fontWeight:"500",border:"none",borderRadius:"6px",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",transition:"all 0.2s ease",minWidth:"44px",minHeight:"44px"},sendButton:{flex:1,padding:"10px 16px",fontSize:"14px",fontWeight:"500",border:"none",borderRadius:"6px",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",transition:"all 0.2s ease"}},e_=({isOpen:e,onClose:t,settings:r,onSave:i,theme:c,username:f})=>{const{t:g}=Sr(r.language),[n,u]=$.useState(r);if(!e)return null;const d=c||{ui:{bg:"#1e1e2e",bgTertiary:"#313244",border:"#313244",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa"},green:"#a6e3a1",red:"#f38ba8",brightBlack:"#585b70"},y=(S,w)=>{u(C=>({...C,[S]:w}))},h=()=>{i(n),t()},_=()=>{confirm(g("reset"))&&(i({theme:"catppuccin",language:"en",fontSize:14,fontFamily:'Menlo, Monaco, "Courier New", monospace',autoScroll:"smart",smoothScroll:!0,scrollSensitivity:.8}),t())};return L.jsx("div",{style:se.overlay,onClick:t,children:L.jsxs("div",{style:{...se.modal,backgroundColor:d.ui.bg},onClick:S=>S.stopPropagation(),children:[L.jsxs("div",{style:{...se.header,borderBottomColor:d.ui.border},children:[L.jsx("h2",{style:{...se.title,color:d.ui.accent},children:g("settingsTitle")}),L.jsx("button",{onClick:t,style:{...se.closeBtn,color:d.ui.text},children:"✕"})]}),L.jsxs("div",{style:se.content,children:[f&&L.jsxs("div",{style:{...se.section,...se.userSection},children:[L.jsx("label",{style:{...se.label,color:d.ui.textSecondary},children:g("user")}),L.jsx("div",{style:{...se.userValue,color:d.ui.accent,backgroundColor:d.ui.bgTertiary,borderColor:d.ui.border},children:f})]}),L.jsxs("div",{style:se.section,children:[L.jsx("label",{style:{...se.label,color:d.ui.text},children:g("theme")}),L.jsx("select",{value:n.theme,onChange:S=>y("theme",S.target.value),style:{...se.select,backgroundColor:d.ui.bgTertiary,color:d.ui.text,borderColor:d.ui.border},children:qp.map(S=>{const w=`theme${S.charAt(0).toUpperCase()}${S.slice(1)}`;return L.jsx("option",{value:S,children:g(w)},S)})})]}),L.jsxs("div",{style:se.section,children:[L.jsx("label",{style:{...se.label,color:d.ui.text},children:g("language")}),L.jsxs("select",{value:n.language,onChange:S=>y("language",S.target.value),style:{...se.select,backgroundColor:d.ui.bgTertiary,color:d.ui.text,borderColor:d.ui.border},children:[L.jsx("option",{value:"en",children:g("languageEnglish")}),L.jsx("option",{value:"ko",children:g("languageKorean")})]})]}),L.jsxs("div",{style:se.section,children:[L.jsx("label",{style:{...se.label,color:d.ui.text},children:g("fontSize")}),L.jsx("input",{type:"number",min:"10",max:"24",value:n.fontSize,onChange:S=>y("fontSize",parseInt(S.target.value)),style:{...se.input,backgroundColor:d.ui.bgTertiary,color:d.ui.text,borderColor:d.ui.border}})]}),L.jsxs("div",{style:se.section,children:[L.jsx("label",{style:{...se.label,color:d.ui.text},children:g("autoScroll")}),L.jsxs("select",{value:n.autoScroll,onChange:S=>y("autoScroll",S.target.value),style:{...se.select,backgroundColor:d.ui.bgTertiary,color:d.ui.text,borderColor:d.ui.border},children:[L.jsx("option",{value:"always",children:"Always (항상)"}),L.jsx("option",{value:"smart",children:"Smart (AI 대응)"}),L.jsx("option",{value:"never",children:"Never (수동)"})]})]}),L.jsx("div",{style:se.section,children:L.jsxs("label",{style:{...se.checkboxLabel,color:d.ui.text},children:[L.jsx("input",{type:"checkbox",checked:n.smoothScroll,onChange:S=>y("smoothScroll",S.target.checked),style:se.checkbox}),g("smoothScroll")]})}),L.jsxs("div",{style:se.section,children:[L.jsxs("label",{style:{...se.label,color:d.ui.text},children:["Scroll Sensitivity (AI 스트리밍): ",n.scrollSensitivity.toFixed(1)]}),L.jsx("input",{type:"range",min:"0",max:"1",step:"0.1",value:n.scrollSensitivity,onChange:S=>y("scrollSensitivity",parseFloat(S.target.value)),style:se.slider}),L.jsx("small",{style:{...se.hint,color:d.ui.textSecondary},children:"높을수록 사용자 스크롤에 민감하게 반응 (AI 채팅 최적화)"})]})]}),L.jsxs("div",{style:{...se.footer,borderTopColor:d.ui.border},children:[L.jsx("button",{onClick:_,style:{...se.resetBtn,backgroundColor:d.red,color:d.ui.bg},children:g("reset")}),L.jsxs("div",{style:se.buttonGroup,children:[L.jsx("button",{onClick:t,style:{...se.cancelBtn,backgroundColor:d.brightBlack,color:d.ui.text},children:g("cancel")}),L.jsx("button",{onClick:h,style:{...se.saveBtn,backgroundColor:d.green,color:d.ui.bg},children:g("save")})]})]})]})})},se={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.7)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4},modal:{backgroundColor:"#1e1e2e",borderRadius:"2px",width:"90%",maxWidth:"650px",maxHeight:"85vh",overflow:"auto"},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"16px 20px",borderBottom:"1px solid #313244"},title:{margin:0,color:"#89b4fa",fontSize:"20px",fontWeight:"600"},closeBtn:{background:"none",border:"none",color:"#cdd6f4",fontSize:"24px",cursor:"pointer",padding:"0",width:"30px",height:"30px"},content:{padding:"20px"},section:{marginBottom:"20px"},userSection:{paddingBottom:"20px",borderBottom:"1px solid #313244"},userValue:{padding:"10px 14px",fontSize:"14px",fontWeight:"600",borderRadius:"4px",border:"1px solid"},label:{display:"block",marginBottom:"8px",color:"#cdd6f4",fontSize:"14px",fontWeight:"500"},select:{width:"100%",padding:"8px 12px",backgroundColor:"#313244",color:"#cdd6f4",border:"1px solid #45475a",borderRadius:"4px",fontSize:"14px"},input:{width:"100%",padding:"8px 12px",backgroundColor:"#313244",color:"#cdd6f4",border:"1px solid #45475a",borderRadius:"4px",fontSize:"14px"},checkboxLabel:{display:"flex",alignItems:"center",gap:"8px",color:"#cdd6f4",fontSize:"14px",cursor:"pointer"},checkbox:{width:"18px",height:"18px",cursor:"pointer"},slider:{width:"100%",marginTop:"8px"},hint:{display:"block",marginTop:"4px",color:"#6c7086",fontSize:"12px"},footer:{display:"flex",justifyContent:"space-between",padding:"16px 20px",borderTop:"1px solid #313244"},buttonGroup:{display:"flex",gap:"8px"},saveBtn:{padding:"8px 16px",backgroundColor:"#a6e3a1",color:"#1e1e2e",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"},cancelBtn:{padding:"8px 16px",backgroundColor:"#585b70",color:"#cdd6f4",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"},resetBtn:{padding:"8px 16px",backgroundColor:"#f38ba8",color:"#1e1e2e",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"}},t_=({theme:e,onFileSelect:t,onFolderSelect:r,language:i="en"})=>{const[c,f]=$.useState(new Set([""])),[g,n]=$.useState([]),[u,d]=$.useState(!0),[y,h]=$.useState("/workspace"),[_,S]=$.useState(""),[w,C]=$.useState(null),[a,l]=$.useState(""),[s,o]=$.useState(null),[p,m]=$.useState(null);$.useEffect(()=>{x("")},[]);const x=async O=>{try{const b=localStorage.getItem("auth_token"),R=await fetch(`/api/files?path=${encodeURIComponent(O)}`,{headers:{Authorization:`Bearer ${b}`}});return R.ok?(await R.json()).items:(console.error("Failed to load directory:",O),[])}catch(b){return console.error("Failed to load directory:",b),[]}},E=async O=>{const b=new Set(c);b.has(O)?b.delete(O):b.add(O),f(b)};$.useEffect(()=>{(async()=>{d(!0);const b=await x("");n(b),d(!1)})()},[]);const v=()=>{l(""),C("file")},k=()=>{l(""),C("folder")},B=async()=>{if(a.trim())try{const O=localStorage.getItem("auth_token"),b=_?`${_}/${a}`:a,R=await fetch("/api/files/create",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${O}`},body:JSON.stringify({path:b,type:w==="file"?"file":"directory"})});if(R.ok){const A=await x("");n(A),C(null),l("")}else{const A=await R.json();alert(`${w==="file"?"파일":"폴더"} 생성 실패: ${A.detail||"알 수 없는 오류"}`)}}catch(O){console.error("Failed to create:",O),alert(`${w==="file"?"파일":"폴더"} 생성 실패`)}},M=O=>{S(O),h(O?`/workspace/${O}`:"/workspace"),r&&r(O)},T=async()=>{const O=await x("");n(O)},P=async O=>{if(confirm(`"${O.name}"을(를) 삭제하시겠습니까?`))try{const b=localStorage.getItem("auth_token"),R=await fetch(`/api/files?path=${encodeURIComponent(O.path)}`,{method:"DELETE",headers:{Authorization:`Bearer ${b}`}});if(R.ok)await T();else{const A=await R.json();alert(`삭제 실패: ${A.detail||"알 수 없는 오류"}`)}}catch(b){console.error("Failed to delete:",b),alert("삭제 실패")}},H=async O=>{try{await navigator.clipboard.writeText(`/workspace/${O.path}`),alert("경로가 복사되었습니다")}catch(b){console.error("Failed to copy path:",b),alert("경로 복사 실패")}},N=O=>{if(O.type==="directory")r(O.path);else{const b=O.path.substring(0,O.path.lastIndexOf("/"));r(b)}};$.useEffect(()=>{const O=()=>o(null);if(s)return document.addEventListener("click",O),()=>document.removeEventListener("click",O)},[s]);const U=$.useRef(null);return $.useEffect(()=>{w&&U.current&&setTimeout(()=>{var O;(O=U.current)==null||O.focus()},100)},[w]),L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .file-tree-btn:hover {
-          opacity: 0.7;
-        }
-        .create-input::placeholder {
-          color: ${e.foreground||e.white||"#a6adc8"};
-          opacity: 0.5;
-        }
-        .context-menu-item:hover {
-          background-color: ${e.ui.bgTertiary||"#313244"} !important;
-        }
-      `}),L.jsxs("div",{style:le.container,children:[L.jsxs("div",{style:{...le.header,backgroundColor:e.ui.bgSecondary,borderBottomColor:e.ui.border},children:[L.jsx("div",{style:{...le.pathDisplay,color:e.ui.textSecondary},children:y}),L.jsxs("div",{style:le.actions,children:[L.jsx("button",{onClick:v,className:"file-tree-btn",style:{...le.actionBtn,color:e.ui.text},title:"새 파일",children:L.jsx(An,{size:14})}),L.jsx("button",{onClick:k,className:"file-tree-btn",style:{...le.actionBtn,color:e.ui.text},title:"새 폴더",children:L.jsx(Mn,{size:14})})]})]}),L.jsx("div",{style:le.treeContainer,children:u?L.jsx("div",{style:{...le.loading,color:e.ui.textSecondary},children:"불러오는 중..."}):g.map(O=>L.jsx(nh,{item:O,depth:0,expanded:c.has(O.path),onToggle:E,onSelect:t,onFolderSelect:M,selectedPath:_,loadDirectory:x,theme:e,onContextMenu:o},O.path))}),L.jsx("div",{style:{...le.hint,color:e.ui.textSecondary,borderTopColor:e.ui.border},children:"💡 Shift + 우클릭으로 브라우저 메뉴 보기"})]}),s&&L.jsxs("div",{style:{...le.contextMenu,top:s.y,left:s.x,backgroundColor:e.ui.bg,borderColor:e.ui.border},onClick:O=>O.stopPropagation(),children:[s.item.type==="directory"&&L.jsxs(L.Fragment,{children:[L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{S(s.item.path),v(),o(null)},children:[L.jsx(An,{size:14}),L.jsx("span",{children:"새 파일"})]}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{S(s.item.path),k(),o(null)},children:[L.jsx(Mn,{size:14}),L.jsx("span",{children:"새 폴더"})]}),L.jsx("div",{style:{...le.menuDivider,backgroundColor:e.ui.border}})]}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{H(s.item),o(null)},children:[L.jsx(sp,{size:14}),L.jsx("span",{children:"경로 복사"})]}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{N(s.item),o(null)},children:[L.jsx(To,{size:14}),L.jsx("span",{children:"터미널에서 열기"})]}),L.jsx("div",{style:{...le.menuDivider,backgroundColor:e.ui.border}}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.red||"#f38ba8"},onClick:()=>{P(s.item),o(null)},children:[L.jsx(Hp,{size:14}),L.jsx("span",{children:"삭제"})]})]}),w&&L.jsxs(L.Fragment,{children:[L.jsx("div",{style:le.backdrop,onClick:()=>C(null)}),L.jsxs("div",{style:{...le.modal,backgroundColor:e.ui.bg,borderColor:e.ui.border},children:[L.jsxs("div",{style:{...le.modalHeader,borderBottomColor:e.ui.border},children:[L.jsx("h3",{style:{...le.modalTitle,color:e.foreground||e.ui.fg||"#cdd6f4"},children:w==="file"?"새 파일":"새 폴더"}),L.jsx("button",{onClick:()=>C(null),style:{...le.closeButton,color:e.foreground||e.white||"#bac2de"},children:L.jsx(Hi,{size:18})})]}),L.jsxs("div",{style:le.modalBody,children:[L.jsx("input",{ref:U,type:"text",value:a,onChange:O=>l(O.target.value),onKeyDown:O=>{O.key==="Enter"?(O.preventDefault(),B()):O.key==="Escape"&&C(null)},placeholder:w==="file"?"파일 이름을 입력하세요...":"폴더 이름을 입력하세요...",className:"create-input",style:{...le.input,backgroundColor:e.ui.bgSecondary,color:e.foreground||e.white||"#cdd6f4",borderColor:e.ui.border},autoFocus:!0}),L.jsxs("div",{style:{...le.hint,color:e.foreground||e.white||"#a6adc8"},children:["💡 위치: ",y||"/workspace"]})]}),L.jsx("div",{style:{...le.modalFooter,borderTopColor:e.ui.border},children:L.jsxs("button",{onClick:B,disabled:!a.trim(),style:{...le.createButton,backgroundColor:a.trim()?e.ui.accent:e.ui.bgSecondary,color:a.trim()?"#ffffff":e.brightBlack||"#6c7086",opacity:a.trim()?1:.5},children:[w==="file"?L.jsx(An,{size:14}):L.jsx(Mn,{size:14}),L.jsx("span",{children:"생성"})]})})]})]})]})},nh=({item:e,depth:t,expanded:r,onToggle:i,onSelect:c,onFolderSelect:f,selectedPath:g,loadDirectory:n,theme:u,onContextMenu:d})=>{const[y,h]=$.useState([]),[_,S]=$.useState(!1),[w,C]=$.useState(!1),a=g===e.path;$.useEffect(()=>{e.type==="directory"&&r&&y.length===0&&(async()=>{S(!0);const o=await n(e.path);h(o),S(!1)})()},[r,e.path,e.type]);const l=()=>{e.type==="directory"?(i(e.path),f(e.path)):c(e.path)};return L.jsxs(L.Fragment,{children:[L.jsxs("div",{style:{...le.treeItem,paddingLeft:`${t*16+8}px`,backgroundColor:a||w?u.ui.bgTertiary:"transparent",color:u.ui.text,borderLeft:a?`2px solid ${u.ui.accent}`:"none"},onClick:l,onMouseEnter:()=>C(!0),onMouseLeave:()=>C(!1),onContextMenu:s=>{s.shiftKey||(s.preventDefault(),s.stopPropagation(),d({x:s.clientX,y:s.clientY,item:e}))},children:[e.type==="directory"&&L.jsx("span",{style:{...le.icon,color:u.ui.textSecondary},children:r?L.jsx(Yf,{size:14}):L.jsx(Ju,{size:14})}),e.type!=="directory"&&L.jsx("span",{style:le.icon}),L.jsx("span",{style:{...le.icon,color:e.type==="directory"?u.ui.accent:u.ui.textSecondary},children:e.type==="directory"?r?L.jsx(hp,{size:14}):L.jsx(gp,{size:14}):L.jsx(th,{size:14})}),L.jsx("span",{style:le.name,children:e.name})]}),e.type==="directory"&&r&&(_?L.jsx("div",{style:{...le.loading,paddingLeft:`${(t+1)*16+8}px`,color:u.ui.textSecondary},children:"..."}):y.map(s=>L.jsx(nh,{item:s,depth:t+1,expanded:r&&s.type==="directory",onToggle:i,onSelect:c,onFolderSelect:f,selectedPath:g,loadDirectory:n,theme:u,onContextMenu:d},s.path)))]})},le={container:{flex:1,display:"flex",flexDirection:"column",overflow:"hidden"},header:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"8px",borderBottom:"1px solid",gap:"8px"},pathDisplay:{fontSize:"11px",fontFamily:"monospace",overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap",flex:1},actions:{display:"flex",gap:"4px",flexShrink:0},actionBtn:{display:"flex",alignItems:"center",justifyContent:"center",padding:"4px",border:"none",backgroundColor:"transparent",cursor:"pointer",borderRadius:"2px",transition:"opacity 0.15s ease"},treeContainer:{flex:1,overflowY:"auto",overflowX:"hidden"},loading:{padding:"8px",fontSize:"12px"},treeItem:{display:"flex",alignItems:"center",padding:"4px 8px",fontSize:"12px",cursor:"pointer",userSelect:"none",transition:"background-color 0.15s ease"},icon:{display:"flex",alignItems:"center",justifyContent:"center",marginRight:"4px",flexShrink:0},name:{flex:1,overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"},backdrop:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.6)",zIndex:1e4,backdropFilter:"blur(2px)"},modal:{position:"fixed",top:"50%",left:"50%",transform:"translate(-50%, -50%)",width:"90%",maxWidth:"400px",borderRadius:"8px",border:"1px solid",boxShadow:"0 8px 32px rgba(0, 0, 0, 0.4)",zIndex:10001,display:"flex",flexDirection:"column"},modalHeader:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"16px",borderBottom:"1px solid"},modalTitle:{margin:0,fontSize:"16px",fontWeight:"600"},closeButton:{background:"none",border:"none",cursor:"pointer",padding:"4px",display:"flex",alignItems:"center",justifyContent:"center",transition:"opacity 0.2s"},modalBody:{padding:"16px",display:"flex",flexDirection:"column",gap:"8px"},input:{width:"100%",padding:"12px",fontSize:"14px",fontFamily:"monospace",border:"1px solid",borderRadius:"4px",outline:"none"},hint:{fontSize:"11px",padding:"8px",borderTop:"1px solid",textAlign:"center",fontStyle:"italic"},contextMenu:{position:"fixed",minWidth:"200px",backgroundColor:"#1e1f29",border:"1px solid #44475a",borderRadius:"4px",boxShadow:"0 4px 12px rgba(0, 0, 0, 0.3)",zIndex:1e4,padding:"4px"},menuItem:{display:"flex",alignItems:"center",gap:"8px",padding:"8px 12px",fontSize:"13px",cursor:"pointer",borderRadius:"2px",transition:"background-color 0.15s ease",userSelect:"none"},menuDivider:{height:"1px",margin:"4px 0"},modalFooter:{display:"flex",padding:"16px",borderTop:"1px solid"},createButton:{flex:1,padding:"10px 16px",fontSize:"14px",fontWeight:"500",border:"none",borderRadius:"6px",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",transition:"all 0.2s ease"}},r_=({isOpen:e,onClose:t,sessions:r,activeSessionId:i,onSelectSession:c,onNewSession:f,onCloseSession:g,onRenameSession:n,onReconnectSession:u,language:d="en",theme:y,isMobile:h=!1,width:_=250,onResizeStart:S,onFileSelect:w,onFolderSelect:C})=>{const{t:a}=Sr(d),[l,s]=$.useState(null),[o,p]=$.useState(!1),[m,x]=$.useState("sessions"),[E,v]=$.useState(null),[k,B]=$.useState(""),M=$.useRef(null),T=y||{ui:{bg:"#1e1e2e",bgSecondary:"#181825",bgTertiary:"#313244",border:"#313244",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa",iconColor:"#cdd6f4"},green:"#a6e3a1",red:"#f38ba8"},P=(b,R)=>b.name||`Terminal ${R+1}`,H=b=>b.substring(0,8),N=(b,R)=>{v(b.id),B(b.name||`Terminal ${R+1}`)},U=async()=>{E&&k.trim()&&n&&await n(E,k.trim()),v(null),B("")},O=()=>{v(null),B("")};return $.useEffect(()=>{E&&M.current&&(M.current.focus(),M.current.select())},[E]),e?L.jsxs(L.Fragment,{children:[h&&L.jsx("div",{style:ue.overlay,onClick:t}),L.jsxs("div",{style:{...ue.sidebar,backgroundColor:T.ui.bg,borderRightColor:T.ui.border,width:h?"min(80vw, 250px)":`${_}px`,maxWidth:h?"80vw":"400px",minWidth:h?void 0:"180px",top:h?"0":"36px",height:h?"100vh":"auto"},children:[h&&L.jsxs("div",{style:{...ue.header,backgroundColor:T.ui.bgSecondary,borderBottomColor:T.ui.border},children:[L.jsx("h2",{style:{...ue.title,color:T.ui.accent},children:a("sessions")||"Sessions"}),L.jsx("button",{onClick:t,onMouseEnter:()=>p(!0),onMouseLeave:()=>p(!1),style:{...ue.closeBtn,color:T.ui.text,backgroundColor:o?T.ui.bgTertiary:"transparent"},title:a("closeSidebar"),children:L.jsx(Hi,{size:20,strokeWidth:2})})]}),L.jsxs("div",{style:{...ue.tabHeader,borderBottomColor:T.ui.border},children:[L.jsxs("button",{onClick:()=>x("sessions"),style:{...ue.tab,color:m==="sessions"?T.ui.accent:T.ui.textSecondary,borderBottomColor:m==="sessions"?T.ui.accent:"transparent"},children:[L.jsx(To,{size:14,strokeWidth:2}),L.jsx("span",{children:"세션"})]}),L.jsxs("button",{onClick:()=>x("files"),style:{...ue.tab,color:m==="files"?T.ui.accent:T.ui.textSecondary,borderBottomColor:m==="files"?T.ui.accent:"transparent"},children:[L.jsx(pp,{size:14,strokeWidth:2}),L.jsx("span",{children:"파일"})]})]}),m==="sessions"&&L.jsx("div",{style:{...ue.newSessionContainer,borderBottomColor:T.ui.border},children:L.jsxs("button",{onClick:f,style:{...ue.newSessionBtn,backgroundColor:T.ui.accent,color:T.ui.bg},children:[L.jsx("span",{style:ue.plusIcon,children:"+"}),a("newSession")]})}),m==="sessions"&&L.jsx("div",{style:ue.sessionList,children:r.length===0?L.jsxs("div",{style:ue.emptyState,children:[L.jsx("p",{style:{...ue.emptyText,color:T.ui.textSecondary},children:a("noTerminals")}),L.jsx("p",{style:{...ue.emptyHint,color:T.ui.border},children:a("createFirstTerminal")})]}):r.map((b,R)=>{const A=b.id===i,I=b.id===l;return L.jsxs("div",{style:{...ue.sessionItem,backgroundColor:A?T.ui.bgTertiary:T.ui.bgSecondary,borderColor:A?T.ui.accent:I?T.ui.border:"transparent"},onMouseEnter:()=>s(b.id),onMouseLeave:()=>s(null),children:[L.jsxs("div",{style:ue.sessionInfo,onClick:()=>{c(b.id),h&&t()},children:[L.jsx("div",{style:{...ue.sessionIcon,color:T.ui.accent},children:L.jsx(To,{size:14,strokeWidth:2})}),L.jsxs("div",{style:ue.sessionDetails,children:[E===b.id?L.jsx("input",{ref:M,type:"text",value:k,onChange:F=>B(F.target.value),onBlur:U,onKeyDown:F=>{F.key==="Enter"?U():F.key==="Escape"&&O()},onClick:F=>F.stopPropagation(),style:{...ue.sessionNameInput,backgroundColor:T.ui.bgTertiary,color:T.ui.text,borderColor:T.ui.accent}}):L.jsx("div",{style:{...ue.sessionName,color:T.ui.text},onDoubleClick:F=>{F.stopPropagation(),N(b,R)},children:P(b,R)}),L.jsx("div",{style:{...ue.sessionId,color:T.ui.textSecondary},children:H(b.id)})]})]}),L.jsx("button",{onClick:F=>{F.stopPropagation(),u&&u(b.id)},style:{...ue.sessionActionBtn,color:T.ui.accent,opacity:h?1:.7},title:"재연결",children:L.jsx(Tp,{size:14,strokeWidth:2})}),L.jsx("button",{onClick:F=>{F.stopPropagation(),g(b.id)},style:{...ue.sessionCloseBtn,color:T.red,opacity:h?1:.7},title:a("closeTerminal"),children:L.jsx(Hi,{size:16,strokeWidth:2.5})})]},b.id)})}),m==="files"&&L.jsx(t_,{theme:T,onFileSelect:w,onFolderSelect:C,language:d}),L.jsx("div",{style:{...ue.footer,backgroundColor:T.ui.bgSecondary,borderTopColor:T.ui.border},children:L.jsxs("div",{style:ue.footerInfo,children:[L.jsxs("div",{style:ue.footerLeft,children:[L.jsx(op,{size:14,strokeWidth:2,style:{color:T.ui.accent}}),L.jsxs("span",{style:{...ue.footerLabel,color:T.ui.textSecondary},children:[a("activeTerminals"),":"]})]}),L.jsx("span",{style:{...ue.footerValue,color:T.ui.accent},children:r.length})]})}),!h&&S&&L.jsx("div",{onMouseDown:S,style:ue.resizeHandle,title:a("resizeSidebar")})]})]}):null},ue={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,width:"100%",height:"100vh",backgroundColor:"rgba(0, 0, 0, 0.5)",zIndex:9998,animation:"fadeIn 0.2s ease"},sidebar:{position:"fixed",top:"36px",left:0,bottom:0,width:"250px",maxWidth:"80vw",backgroundColor:"#1e1e2e",zIndex:9999,display:"flex",flexDirection:"column",borderRight:"1px solid #313244"},tabHeader:{display:"flex",borderBottom:"1px solid #313244",backgroundColor:"#181825",gap:"1px"},tab:{flex:1,display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",padding:"10px",fontSize:"12px",fontWeight:"500",background:"none",border:"none",borderRight:"1px solid #313244",borderBottom:"2px solid transparent",cursor:"pointer",transition:"color 0.15s ease, border-color 0.15s ease, background-color 0.15s ease"},header:{position:"relative",display:"flex",justifyContent:"center",alignItems:"center",padding:"0",borderBottom:"1px solid #313244",backgroundColor:"#181825",height:"32px",boxSizing:"border-box"},title:{margin:0,color:"#89b4fa",fontSize:"13px",fontWeight:"600"},closeBtn:{position:"absolute",right:"8px",background:"none",border:"none",color:"#cdd6f4",cursor:"pointer",padding:"6px",display:"flex",alignItems:"center",justifyContent:"center",borderRadius:"2px",transition:"background-color 0.15s ease"},newSessionContainer:{padding:"8px",borderBottom:"1px solid #313244"},newSessionBtn:{width:"100%",padding:"10px 12px",backgroundColor:"#a6e3a1",color:"#1e1e2e",border:"none",borderRadius:"2px",fontSize:"13px",fontWeight:"600",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",transition:"opacity 0.15s ease"},plusIcon:{fontSize:"16px",fontWeight:"600"},sessionList:{flex:1,overflowY:"auto",padding:"8px"},emptyState:{textAlign:"center",padding:"40px 20px"},emptyText:{color:"#6c7086",fontSize:"14px",margin:"0 0 8px 0"},emptyHint:{color:"#45475a",fontSize:"12px",margin:0},sessionItem:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"8px",marginBottom:"8px",borderRadius:"2px",backgroundColor:"#181825",border:"1px solid transparent",cursor:"pointer",transition:"background-color 0.15s ease, border 0.15s ease"},sessionInfo:{flex:1,display:"flex",alignItems:"center",gap:"12px",minWidth:0},sessionIcon:{fontSize:"12px",color:"#a6e3a1",width:"16px",textAlign:"center"},sessionDetails:{flex:1,minWidth:0},sessionName:{color:"#cdd6f4",fontSize:"12px",fontWeight:"500",marginBottom:"2px",overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap",cursor:"default"},sessionNameInput:{width:"100%",fontSize:"12px",fontWeight:"500",padding:"2px 4px",border:"1px solid",borderRadius:"2px",outline:"none",marginBottom:"2px"},sessionId:{color:"#6c7086",fontSize:"10px",fontFamily:"monospace"},sessionActionBtn:{background:"none",border:"none",cursor:"pointer",padding:"4px",borderRadius:"2px",transition:"background-color 0.15s ease, opacity 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",marginRight:"4px"},sessionCloseBtn:{background:"none",border:"none",color:"#f38ba8",cursor:"pointer",padding:"4px",borderRadius:"2px",transition:"background-color 0.15s ease, opacity 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center"},footer:{padding:"8px 12px",borderTop:"1px solid #313244",backgroundColor:"#181825"},footerInfo:{display:"flex",justifyContent:"space-between",alignItems:"center"},footerLeft:{display:"flex",alignItems:"center",gap:"6px"},footerLabel:{color:"#6c7086",fontSize:"12px"},footerValue:{color:"#a6e3a1",fontSize:"13px",fontWeight:"600"},resizeHandle:{position:"absolute",top:0,right:0,bottom:0,width:"4px",cursor:"ew-resize",backgroundColor:"transparent",transition:"background-color 0.15s ease",zIndex:1e4}};if(!document.getElementById("sidebar-animations")){const e=document.createElement("style");e.id="sidebar-animations",e.textContent=`
-    @keyframes fadeIn {
-      from { opacity: 0; }
-      to { opacity: 1; }
-    }
-
-    @keyframes slideInLeft {
-      from {
-        transform: translateX(-100%);
-        opacity: 0.8;
-      }
-      to {
-        transform: translateX(0);
-        opacity: 1;
-      }
-    }
-  `,document.head.appendChild(e)}const i_=({isOpen:e,onConfirm:t,onCancel:r,title:i,message:c,confirmText:f,cancelText:g,language:n="en",danger:u=!1,theme:d})=>{const{t:y}=Sr(n);if(!e)return null;const h=d||{ui:{bg:"#1e1e2e",border:"#313244",text:"#cdd6f4"},green:"#a6e3a1",red:"#f38ba8",brightBlack:"#585b70"},_=()=>{t()},S=()=>{r()};return L.jsx("div",{style:Ct.overlay,onClick:S,children:L.jsxs("div",{style:{...Ct.modal,backgroundColor:h.ui.bg,borderColor:h.ui.border},onClick:w=>w.stopPropagation(),children:[L.jsx("div",{style:{...Ct.header,borderBottomColor:h.ui.border},children:L.jsx("h3",{style:{...Ct.title,color:h.ui.text},children:i||y("confirm")})}),L.jsx("div",{style:Ct.content,children:L.jsx("p",{style:{...Ct.message,color:h.ui.text},children:c})}),L.jsxs("div",{style:{...Ct.footer,borderTopColor:h.ui.border},children:[L.jsx("button",{onClick:S,style:{...Ct.cancelBtn,backgroundColor:h.brightBlack,color:h.ui.text},children:g||y("cancel")}),L.jsx("button",{onClick:_,style:u?{...Ct.dangerBtn,backgroundColor:h.red,color:h.ui.bg}:{...Ct.confirmBtn,backgroundColor:h.green,color:h.ui.bg},children:f||y("confirm")})]})]})})},Ct={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.7)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:10001},modal:{backgroundColor:"#1e1e2e",borderRadius:"2px",width:"90%",maxWidth:"450px",border:"1px solid #313244"},header:{padding:"16px 20px",borderBottom:"1px solid #313244"},title:{margin:0,color:"#cdd6f4",fontSize:"16px",fontWeight:"600"},content:{padding:"20px"},message:{margin:0,color:"#cdd6f4",fontSize:"14px",lineHeight:"1.6"},footer:{display:"flex",gap:"8px",padding:"16px 20px",borderTop:"1px solid #313244",justifyContent:"flex-end"},cancelBtn:{padding:"12px 24px",backgroundColor:"#585b70",color:"#cdd6f4",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"},confirmBtn:{padding:"12px 24px",backgroundColor:"#a6e3a1",color:"#1e1e2e",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"},dangerBtn:{padding:"12px 24px",backgroundColor:"#f38ba8",color:"#1e1e2e",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"}},s_=({onComplete:e,language:t="en"})=>{const{t:r}=Sr(t),[i,c]=$.useState(""),[f,g]=$.useState(""),[n,u]=$.useState(""),[d,y]=$.useState(""),[h,_]=$.useState(!1),S=async w=>{if(w.preventDefault(),y(""),i.length<3){y(r("usernameMinLength")||"Username must be at least 3 characters");return}if(f.length<8){y(r("passwordMinLength")||"Password must be at least 8 characters");return}if(f!==n){y(r("passwordMismatch")||"Passwords do not match");return}_(!0);try{const C=await fetch("/api/auth/setup",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:i,password:f})}),a=await C.json();if(!C.ok)throw new Error(a.detail||"Setup failed");e()}catch(C){y(C.message||"Failed to create admin account")}finally{_(!1)}};return L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .initial-setup-overlay::-webkit-scrollbar,
-        .initial-setup-container::-webkit-scrollbar {
-          display: none;
-        }
-      `}),L.jsx("div",{style:Te.overlay,className:"initial-setup-overlay",children:L.jsxs("div",{style:Te.container,className:"initial-setup-container",children:[L.jsx("div",{style:Te.header,children:L.jsx("div",{style:Te.icon,children:L.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[L.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),L.jsx("path",{d:"M7 10l3 3-3 3"}),L.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})})}),L.jsxs("form",{onSubmit:S,style:Te.form,children:[L.jsxs("div",{style:Te.formGroup,children:[L.jsx("label",{style:Te.label,children:r("username")||"Username"}),L.jsx("input",{type:"text",value:i,onChange:w=>c(w.target.value),style:Te.input,placeholder:r("usernamePlaceholder")||"Enter username",disabled:h,autoFocus:!0,required:!0})]}),L.jsxs("div",{style:Te.formGroup,children:[L.jsx("label",{style:Te.label,children:r("password")||"Password"}),L.jsx("input",{type:"password",value:f,onChange:w=>g(w.target.value),style:Te.input,placeholder:r("passwordPlaceholder")||"Enter password (min 8 characters)",disabled:h,required:!0})]}),L.jsxs("div",{style:Te.formGroup,children:[L.jsx("label",{style:Te.label,children:r("confirmPassword")||"Confirm Password"}),L.jsx("input",{type:"password",value:n,onChange:w=>u(w.target.value),style:Te.input,placeholder:r("confirmPasswordPlaceholder")||"Re-enter password",disabled:h,required:!0})]}),d&&L.jsx("div",{style:Te.error,children:d}),L.jsx("button",{type:"submit",style:Te.submitBtn,disabled:h,children:h?r("creating")||"Creating...":r("createAccount")||"Create Administrator"})]}),L.jsx("div",{style:Te.footer,children:L.jsx("p",{style:Te.footerText,children:r("setupFooter")||"This account will have full access to all terminals and settings."})})]})})]})},Te={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"#282a36",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4,overflow:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},container:{backgroundColor:"#1e1f29",borderRadius:"12px",width:"90%",maxWidth:"420px",padding:"40px",boxShadow:"0 10px 40px rgba(0, 0, 0, 0.5)",border:"1px solid #44475a",margin:"20px auto",maxHeight:"calc(100vh - 40px)",overflowY:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},header:{textAlign:"center",marginBottom:"32px"},icon:{color:"#bd93f9",margin:"0 auto"},form:{display:"flex",flexDirection:"column",gap:"20px"},formGroup:{display:"flex",flexDirection:"column",gap:"8px"},label:{fontSize:"14px",fontWeight:"600",color:"#f8f8f2"},input:{padding:"12px 16px",fontSize:"14px",backgroundColor:"#282a36",color:"#f8f8f2",border:"1px solid #44475a",borderRadius:"6px",outline:"none",transition:"border-color 0.2s"},error:{padding:"12px 16px",backgroundColor:"#ff5555",color:"#f8f8f2",borderRadius:"6px",fontSize:"14px",textAlign:"center"},submitBtn:{padding:"14px 24px",backgroundColor:"#50fa7b",color:"#282a36",border:"none",borderRadius:"6px",fontSize:"16px",fontWeight:"700",cursor:"pointer",transition:"all 0.2s ease",marginTop:"8px"},footer:{marginTop:"24px",paddingTop:"24px",borderTop:"1px solid #44475a"},footerText:{margin:0,fontSize:"12px",color:"#6272a4",textAlign:"center",lineHeight:"1.6"}},n_=({onLogin:e,language:t="en"})=>{const{t:r}=Sr(t),[i,c]=$.useState(""),[f,g]=$.useState(""),[n,u]=$.useState(""),[d,y]=$.useState(!1),h=async _=>{if(_.preventDefault(),u(""),!i||!f){u(r("fillAllFields")||"Please fill in all fields");return}y(!0);try{const S=await fetch("/api/auth/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:i,password:f})}),w=await S.json();if(!S.ok)throw new Error(w.detail||"Login failed");localStorage.setItem("auth_token",w.access_token),localStorage.setItem("username",w.username),e(w.access_token,w.username)}catch(S){u(S.message||"Invalid username or password"),g("")}finally{y(!1)}};return L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .login-overlay::-webkit-scrollbar,
-        .login-container::-webkit-scrollbar {
-          display: none;
-        }
-      `}),L.jsx("div",{style:Ye.overlay,className:"login-overlay",children:L.jsxs("div",{style:Ye.container,className:"login-container",children:[L.jsx("div",{style:Ye.header,children:L.jsx("div",{style:Ye.icon,children:L.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[L.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),L.jsx("path",{d:"M7 10l3 3-3 3"}),L.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})})}),L.jsxs("form",{onSubmit:h,style:Ye.form,children:[L.jsxs("div",{style:Ye.formGroup,children:[L.jsx("label",{style:Ye.label,children:r("username")||"Username"}),L.jsx("input",{type:"text",value:i,onChange:_=>c(_.target.value),style:Ye.input,placeholder:r("usernamePlaceholder")||"Enter username",disabled:d,autoFocus:!0,required:!0})]}),L.jsxs("div",{style:Ye.formGroup,children:[L.jsx("label",{style:Ye.label,children:r("password")||"Password"}),L.jsx("input",{type:"password",value:f,onChange:_=>g(_.target.value),style:Ye.input,placeholder:r("passwordPlaceholder")||"Enter password",disabled:d,required:!0})]}),n&&L.jsx("div",{style:Ye.error,children:n}),L.jsx("button",{type:"submit",style:Ye.submitBtn,disabled:d,children:d?r("signingIn")||"Signing in...":r("signIn")||"Sign In"})]})]})})]})},Ye={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"#282a36",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4,overflow:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},container:{backgroundColor:"#1e1f29",borderRadius:"12px",width:"90%",maxWidth:"380px",padding:"40px",boxShadow:"0 10px 40px rgba(0, 0, 0, 0.5)",border:"1px solid #44475a",margin:"20px auto",maxHeight:"calc(100vh - 40px)",overflowY:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},header:{textAlign:"center",marginBottom:"32px"},icon:{color:"#bd93f9",margin:"0 auto"},form:{display:"flex",flexDirection:"column",gap:"20px"},formGroup:{display:"flex",flexDirection:"column",gap:"8px"},label:{fontSize:"14px",fontWeight:"600",color:"#f8f8f2"},input:{padding:"12px 16px",fontSize:"14px",backgroundColor:"#282a36",color:"#f8f8f2",border:"1px solid #44475a",borderRadius:"6px",outline:"none",transition:"border-color 0.2s"},error:{padding:"12px 16px",backgroundColor:"#ff5555",color:"#f8f8f2",borderRadius:"6px",fontSize:"14px",textAlign:"center"},submitBtn:{padding:"14px 24px",backgroundColor:"#50fa7b",color:"#282a36",border:"none",borderRadius:"6px",fontSize:"16px",fontWeight:"700",cursor:"pointer",transition:"all 0.2s ease",marginTop:"8px"}},o_=({filePath:e,onClose:t,theme:r})=>{const[i,c]=$.useState(""),[f,g]=$.useState(!1),[n,u]=$.useState(!0),[d,y]=$.useState(!1),[h,_]=$.useState(null);$.useEffect(()=>{e&&S()},[e]);const S=async()=>{u(!0),_(null);try{const a=localStorage.getItem("auth_token"),l=await fetch(`/api/files/read?path=${encodeURIComponent(e)}`,{headers:{Authorization:`Bearer ${a}`}});if(!l.ok){const o=await l.json();throw new Error(o.detail||"Failed to load file")}const s=await l.json();c(s.content)}catch(a){console.error("Failed to load file:",a),_(a.message)}finally{u(!1)}},w=async()=>{y(!0),_(null);try{const a=localStorage.getItem("auth_token"),l=await fetch("/api/files/write",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${a}`},body:JSON.stringify({path:e,content:i})});if(!l.ok){const s=await l.json();throw new Error(s.detail||"Failed to save file")}g(!1)}catch(a){console.error("Failed to save file:",a),_(a.message)}finally{y(!1)}},C=()=>{S(),g(!1)};return e?L.jsxs("div",{style:{...Qe.container,backgroundColor:r.ui.bg},children:[L.jsxs("div",{style:{...Qe.header,backgroundColor:r.ui.bgSecondary,borderBottomColor:r.ui.border},children:[L.jsxs("div",{style:Qe.headerLeft,children:[L.jsx(th,{size:14,style:{color:r.ui.accent}}),L.jsx("span",{style:{...Qe.filePath,color:r.ui.text},children:e})]}),L.jsxs("div",{style:Qe.headerRight,children:[f?L.jsxs(L.Fragment,{children:[L.jsxs("button",{onClick:w,disabled:d,style:{...Qe.button,backgroundColor:r.green,color:r.ui.bg},children:[L.jsx(Ap,{size:14}),L.jsx("span",{children:d?"저장 중...":"저장"})]}),L.jsx("button",{onClick:C,disabled:d,style:{...Qe.button,backgroundColor:r.brightBlack,color:r.ui.text},children:"취소"})]}):L.jsxs("button",{onClick:()=>g(!0),style:{...Qe.button,backgroundColor:r.ui.bgTertiary,color:r.ui.text},disabled:n,children:[L.jsx(Ep,{size:14}),L.jsx("span",{children:"편집"})]}),L.jsxs("button",{onClick:t,style:{...Qe.button,backgroundColor:r.red,color:r.ui.bg},children:[L.jsx(Hi,{size:14}),L.jsx("span",{children:"닫기"})]})]})]}),L.jsx("div",{style:Qe.content,children:n?L.jsx("div",{style:{...Qe.message,color:r.ui.textSecondary},children:"불러오는 중..."}):h?L.jsx("div",{style:{...Qe.message,color:r.red},children:h}):L.jsx("textarea",{style:{...Qe.textarea,backgroundColor:r.ui.bgSecondary,color:r.ui.text,borderColor:r.ui.border},value:i,onChange:a=>c(a.target.value),readOnly:!f,spellCheck:!1})})]}):null},Qe={container:{position:"absolute",top:"36px",left:0,right:0,bottom:0,display:"flex",flexDirection:"column",backgroundColor:"#1e1e2e",zIndex:100},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"8px 12px",backgroundColor:"#181825",borderBottom:"1px solid #313244",gap:"12px"},headerLeft:{display:"flex",alignItems:"center",gap:"8px",flex:1,minWidth:0},filePath:{fontSize:"12px",fontWeight:"500",overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap",color:"#cdd6f4"},headerRight:{display:"flex",gap:"6px",alignItems:"center",flexShrink:0},button:{display:"flex",alignItems:"center",gap:"4px",padding:"6px 10px",fontSize:"11px",fontWeight:"500",border:"none",borderRadius:"2px",cursor:"pointer",transition:"opacity 0.15s ease"},content:{flex:1,display:"flex",flexDirection:"column",overflow:"hidden"},textarea:{flex:1,width:"100%",padding:"12px",backgroundColor:"#181825",color:"#cdd6f4",border:"none",outline:"none",fontFamily:'"JetBrains Mono", monospace',fontSize:"13px",lineHeight:"1.6",resize:"none",overflow:"auto"},message:{padding:"20px",textAlign:"center",fontSize:"14px"}},l_=()=>{var t;return(navigator.language||((t=navigator.languages)==null?void 0:t[0])||"en").toLowerCase().startsWith("ko")?"ko":"en"},Pn={theme:"catppuccin",language:l_(),fontSize:14,fontFamily:'"JetBrains Mono", Menlo, Monaco, "Courier New", monospace',autoScroll:"smart",smoothScroll:!0,scrollSensitivity:.8},In="terminal_settings",a_=()=>{const[e,t]=$.useState(()=>{try{const f=localStorage.getItem(In);if(f)return{...Pn,...JSON.parse(f)}}catch(f){console.error("Failed to load settings:",f)}return Pn});return $.useEffect(()=>{try{localStorage.setItem(In,JSON.stringify(e))}catch(f){console.error("Failed to save settings:",f)}},[e]),{settings:e,updateSetting:(f,g)=>{t(n=>({...n,[f]:g}))},updateSettings:f=>{t(g=>({...g,...f}))},resetSettings:()=>{t(Pn),localStorage.removeItem(In)}}},c_=()=>"xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx".replace(/[xy]/g,e=>{const t=Math.random()*16|0;return(e==="x"?t:t&3|8).toString(16)}),u_=async()=>{try{const e=localStorage.getItem("auth_token");if(!e)return console.log("[DEBUG] fetchSessions: 토큰 없음"),[];console.log("[DEBUG] fetchSessions: API 호출 시작");const t=await fetch("/api/sessions",{headers:{Authorization:`Bearer ${e}`}});if(!t.ok)return console.error("[DEBUG] fetchSessions 실패:",t.status),[];const r=await t.json();console.log("[DEBUG] fetchSessions API 응답:",r);const i=r.map(c=>({id:c.id,name:c.name}));return console.log("[DEBUG] fetchSessions 매핑 결과:",i),i}catch(e){return console.error("[DEBUG] fetchSessions 에러:",e),[]}};function h_(){const[e,t]=$.useState({isLoading:!0,needsSetup:!1,isAuthenticated:!1,username:null}),[r,i]=$.useState([]),[c,f]=$.useState(null);$.useEffect(()=>{console.log("[DEBUG] sessions 변경됨:",r.length,r)},[r]);const[g,n]=$.useState(!1),[u,d]=$.useState(!1),[y,h]=$.useState(()=>{const K=localStorage.getItem("sidebar_open");return K!==null?K==="true":!(/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768)}),[_,S]=$.useState(!1),[w,C]=$.useState(null),[a,l]=$.useState(()=>{const K=localStorage.getItem("sidebar_width");return K?parseInt(K):280}),[s,o]=$.useState(!1),[p,m]=$.useState(window.innerHeight),[x,E]=$.useState({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1}),[v,k]=$.useState(!1),[B,M]=$.useState(null),[T,P]=$.useState(!1),[H,N]=$.useState(""),U=$.useRef(null),{settings:O,updateSettings:b}=a_(),{t:R}=Sr(O.language);$.useEffect(()=>{if(!e.isAuthenticated)return;const K=Dt[O.theme]||Dt.catppuccin,te="dynamic-scrollbar-theme";let ie=document.getElementById(te);ie||(ie=document.createElement("style"),ie.id=te,document.head.appendChild(ie)),ie.textContent=`
-      ::-webkit-scrollbar {
-        width: 12px;
-        height: 12px;
-      }
-
-      ::-webkit-scrollbar-track {
-        background: ${K.ui.bg};
-      }
-
-      ::-webkit-scrollbar-thumb {
-        background: ${K.ui.border};
-        border-radius: 6px;
-        border: 2px solid ${K.ui.bg};
-      }
-
-      ::-webkit-scrollbar-thumb:hover {
-        background: ${K.ui.textSecondary};
-      }
-
-      /* Firefox */
-      * {
-        scrollbar-width: thin;
-        scrollbar-color: ${K.ui.border} ${K.ui.bg};
-      }
-    `},[O.theme,e.isAuthenticated]),$.useEffect(()=>{(async()=>{try{if(!(await(await fetch("/api/auth/status")).json()).setup_complete){localStorage.removeItem("auth_token"),localStorage.removeItem("username"),t({isLoading:!1,needsSetup:!0,isAuthenticated:!1,username:null});return}const Re=localStorage.getItem("auth_token");if(!Re){t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null});return}const be=await fetch("/api/auth/verify",{headers:{Authorization:`Bearer ${Re}`}});if(!be.ok){localStorage.removeItem("auth_token"),localStorage.removeItem("username"),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null});return}const ut=await be.json();t({isLoading:!1,needsSetup:!1,isAuthenticated:!0,username:ut.username})}catch(te){console.error("Auth check failed:",te),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null})}})()},[]);const A=()=>{t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null})},I=(K,te)=>{t({isLoading:!1,needsSetup:!1,isAuthenticated:!0,username:te})},F=()=>{E({isOpen:!0,sessionId:null,isLogout:!0,title:R("confirmLogout"),message:R("logoutMessage")})},q=()=>{localStorage.removeItem("auth_token"),localStorage.removeItem("username"),i([]),f(null),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null}),E({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})},Q=async()=>{console.log("[DEBUG] refreshSessions 호출됨");const K=await u_();return console.log("[DEBUG] refreshSessions - 로드된 세션:",K),i(K),console.log("[DEBUG] refreshSessions - setSessions 호출 완료"),K};$.useEffect(()=>{console.log("[DEBUG] 인증 상태 변경:",e),e.isAuthenticated&&(console.log("[DEBUG] 인증됨 - refreshSessions 호출"),Q().then(K=>{console.log("[DEBUG] 로드된 세션 목록:",K);const te=localStorage.getItem("active_session_id");te&&K.some(ie=>ie.id===te)?(console.log("[DEBUG] localStorage에서 활성 세션 복원:",te),f(te)):K.length>0?(console.log("[DEBUG] 첫 번째 세션 활성화:",K[0].id),f(K[0].id)):console.log("[DEBUG] 세션 없음")}))},[e.isAuthenticated]),$.useEffect(()=>{c&&localStorage.setItem("active_session_id",c)},[c]),$.useEffect(()=>{localStorage.setItem("sidebar_open",y.toString())},[y]),$.useEffect(()=>{localStorage.setItem("sidebar_width",a.toString())},[a]),$.useEffect(()=>{let K=/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768;const te=()=>{const ie=/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768;n(ie),ie!==K&&(h(!ie),K=ie)};return te(),window.addEventListener("resize",te),()=>window.removeEventListener("resize",te)},[]),$.useEffect(()=>{if(!window.visualViewport)return;const K=()=>{m(window.visualViewport.height)};return K(),window.visualViewport.addEventListener("resize",K),window.visualViewport.addEventListener("scroll",K),()=>{window.visualViewport.removeEventListener("resize",K),window.visualViewport.removeEventListener("scroll",K)}},[]);const Y=K=>{window.terminalSessions&&c&&window.terminalSessions[c]&&window.terminalSessions[c].sendData(K)},ne=()=>{window.terminalSessions&&c&&window.terminalSessions[c]&&window.terminalSessions[c].scrollToBottom()},D=K=>{window.terminalSessions&&c&&window.terminalSessions[c]&&window.terminalSessions[c].sendData(K+`
-`)},[j,W]=$.useState(""),z=K=>{M(K),k(!0)},Z=K=>{W(K)},G=()=>{k(!1),M(null)},oe=async()=>{const K=c_(),te=localStorage.getItem("auth_token");try{if(!(await fetch(`/api/sessions/${K}`,{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${te}`},body:JSON.stringify({cols:80,rows:24})})).ok){console.error("Failed to create session on server");return}const Re={id:K};i(be=>[...be,Re]),f(K),j&&setTimeout(()=>{if(window.terminalSessions&&window.terminalSessions[K]){const be=`/workspace/${j}`;window.terminalSessions[K].sendData(`cd "${be}"
-`)}},1e3)}catch(ie){console.error("Failed to create new session:",ie)}},Ee=K=>{f(K)},Oe=K=>{E({isOpen:!0,sessionId:K,isLogout:!1,title:R("closeTerminal"),message:R("confirmCloseTerminal")||"Are you sure you want to close this terminal? All unsaved work will be lost."})},jt=async()=>{if(x.isLogout)q();else{const K=x.sessionId,te=localStorage.getItem("auth_token");try{(await fetch(`/api/sessions/${K}`,{method:"DELETE",headers:{Authorization:`Bearer ${te}`}})).ok||console.error("Failed to delete session on server")}catch(ie){console.error("Failed to delete session:",ie)}if(i(ie=>ie.filter(Re=>Re.id!==K)),c===K){const ie=r.filter(Re=>Re.id!==K);ie.length>0?f(ie[0].id):f(null)}E({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})}},ee=()=>{E({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})},sr=K=>{b(K),alert(R("settingsSaved"))},Qr=()=>{console.log("[DEBUG] 사이드바 토글 전:",{isSidebarOpen:y,sessionsCount:r.length,activeSessionId:c}),h(K=>!K),console.log("[DEBUG] 사이드바 토글 후")},Jr=async(K,te)=>{const ie=localStorage.getItem("auth_token");try{(await fetch(`/api/sessions/${K}/name`,{method:"PATCH",headers:{"Content-Type":"application/json",Authorization:`Bearer ${ie}`},body:JSON.stringify({name:te})})).ok?i(be=>be.map(ut=>ut.id===K?{...ut,name:te}:ut)):console.error("Failed to rename session")}catch(Re){console.error("Failed to rename session:",Re)}},Zr=K=>{console.log("재연결 시도:",K),c===K?(f(null),setTimeout(()=>{f(K)},50)):f(K)},Cr=K=>{K.preventDefault(),o(!0);const te=K.clientX,ie=a,Re=ut=>{const yt=ut.clientX-te,nr=Math.max(180,Math.min(400,ie+yt));l(nr)},be=()=>{o(!1),document.removeEventListener("mousemove",Re),document.removeEventListener("mouseup",be),document.body.style.cursor="",document.body.style.userSelect=""};document.addEventListener("mousemove",Re),document.addEventListener("mouseup",be),document.body.style.cursor="ew-resize",document.body.style.userSelect="none"};if(e.isLoading){const K=Dt[O.theme]||Dt.catppuccin;return L.jsxs("div",{style:{...de.loadingContainer,backgroundColor:K.ui.bg},children:[L.jsx("h1",{style:{...de.loadingLogo,color:K.ui.accent},children:R("appName")}),L.jsx("p",{style:{...de.loadingText,color:K.ui.textSecondary},children:R("loading")||"Loading..."})]})}if(e.needsSetup)return L.jsx(s_,{onComplete:A,language:O.language});if(!e.isAuthenticated)return L.jsx(n_,{onLogin:I,language:O.language});const J=Dt[O.theme]||Dt.catppuccin;return L.jsxs("div",{style:{...de.container,backgroundColor:J.ui.bg,height:g?`${p}px`:"100vh"},children:[L.jsxs("div",{style:{...de.header,backgroundColor:J.ui.bgSecondary,borderBottomColor:J.ui.border},children:[L.jsxs("div",{style:de.headerLeft,children:[L.jsx("button",{onClick:Qr,style:{...de.hamburgerBtn,backgroundColor:"transparent",color:J.ui.iconColor},title:y?"Hide Sidebar":"Show Sidebar",children:y?L.jsx(wp,{size:20,strokeWidth:2}):L.jsx(bp,{size:20,strokeWidth:2})}),L.jsx("h1",{style:{...de.title,color:J.ui.accent},children:R("appName")})]}),L.jsxs("div",{style:de.headerRight,children:[r.length>0&&L.jsxs("div",{style:{...de.sessionInfo,color:J.ui.text,backgroundColor:J.ui.bgTertiary,borderColor:J.ui.border},children:[L.jsx("span",{style:{color:J.ui.accent,fontWeight:"600"},children:r.findIndex(K=>K.id===c)+1}),L.jsx("span",{style:{color:J.ui.textSecondary},children:" / "}),L.jsx("span",{style:{color:J.ui.textSecondary},children:r.length})]}),g?L.jsxs(L.Fragment,{children:[L.jsx("button",{onClick:ne,style:{...de.hamburgerBtn,backgroundColor:"transparent",color:J.ui.iconColor},title:"Scroll to bottom",children:L.jsx(tp,{size:20,strokeWidth:2})}),L.jsxs("div",{style:{position:"relative",height:"100%"},children:[L.jsx("button",{onClick:()=>S(!_),style:{...de.hamburgerBtn,backgroundColor:_?J.ui.bgTertiary:"transparent",color:J.ui.iconColor},children:L.jsx(mp,{size:20,strokeWidth:2})}),_&&L.jsxs(L.Fragment,{children:[L.jsx("div",{style:de.menuOverlay,onClick:()=>S(!1)}),L.jsxs("div",{style:{...de.dropdown,backgroundColor:J.ui.bgSecondary,borderColor:J.ui.border},children:[L.jsxs("div",{style:{...de.dropdownItem,borderBottomColor:J.ui.border},children:[L.jsx("span",{style:{...de.dropdownLabel,color:J.ui.textSecondary},children:R("user")}),L.jsx("span",{style:{...de.dropdownValue,color:J.ui.accent},children:e.username})]}),L.jsxs("button",{onClick:()=>{oe(),S(!1)},onMouseEnter:()=>C("new"),onMouseLeave:()=>C(null),style:{...de.dropdownButton,color:J.ui.text,backgroundColor:w==="new"?J.ui.bgTertiary:"transparent"},children:[L.jsx(Ia,{size:16,strokeWidth:2}),L.jsx("span",{children:R("newSession")})]}),L.jsxs("button",{onClick:()=>{d(!0),S(!1)},onMouseEnter:()=>C("settings"),onMouseLeave:()=>C(null),style:{...de.dropdownButton,color:J.ui.text,backgroundColor:w==="settings"?J.ui.bgTertiary:"transparent"},children:[L.jsx(ja,{size:16,strokeWidth:2}),L.jsx("span",{children:R("settings")})]}),L.jsxs("button",{onClick:()=>{F(),S(!1)},onMouseEnter:()=>C("logout"),onMouseLeave:()=>C(null),style:{...de.dropdownButton,color:J.red,backgroundColor:w==="logout"?J.ui.bgTertiary:"transparent"},children:[L.jsx(Oa,{size:16,strokeWidth:2}),L.jsx("span",{children:R("logout")})]})]})]})]})]}):L.jsxs(L.Fragment,{children:[L.jsx("button",{onClick:()=>d(!0),style:{...de.settingsBtn,color:J.ui.iconColor,borderColor:J.ui.border},title:R("settings"),children:L.jsx(ja,{size:18,strokeWidth:2.5})}),L.jsx("button",{onClick:F,style:{...de.logoutBtn,color:J.red,borderColor:J.ui.border},title:R("logout"),children:L.jsx(Oa,{size:18,strokeWidth:2.5})})]})]})]}),!v&&L.jsx("div",{ref:U,style:{...de.terminalContainer,paddingBottom:g?"45px":"0",backgroundColor:J.ui.bg,marginLeft:!g&&y?`${a}px`:"0",transition:s?"none":"margin-left 0.3s ease"},children:r.length===0?L.jsxs("div",{style:de.emptyState,children:[L.jsx("div",{style:{...de.emptyIcon,color:J.ui.textSecondary},children:L.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[L.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),L.jsx("path",{d:"M7 10l3 3-3 3"}),L.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})}),L.jsx("h2",{style:{...de.emptyTitle,color:J.ui.text},children:R("noTerminals")||"No Terminals Open"}),L.jsx("p",{style:{...de.emptyMessage,color:J.ui.textSecondary},children:R("createFirstTerminal")||"Create a new terminal to get started"}),L.jsxs("button",{onClick:oe,style:{...de.emptyButton,backgroundColor:J.ui.accent,color:J.ui.bg},children:[L.jsx(Ia,{size:20,strokeWidth:2.5}),L.jsx("span",{children:R("newSession")||"New Terminal"})]})]}):r.map(K=>L.jsx("div",{style:{display:K.id===c?"block":"none",width:"100%",height:"100%"},children:L.jsx(Yp,{sessionId:K.id,settings:O,isActive:K.id===c})},K.id))}),v&&B&&L.jsx("div",{style:{position:"absolute",top:"36px",left:!g&&y?`${a}px`:"0",right:0,bottom:g?"45px":0,transition:s?"none":"left 0.3s ease"},children:L.jsx(o_,{filePath:B,onClose:G,theme:J})}),g&&L.jsx(Jp,{onSendKey:Y,isVisible:!0,activeSessionId:c,onOpenCommandInput:()=>P(!0)}),L.jsx(Zp,{isOpen:T,onClose:()=>P(!1),onSend:D,command:H,setCommand:N,theme:J,t:R}),L.jsx(r_,{isOpen:y,onClose:()=>{console.log("[DEBUG] Sidebar onClose 호출됨:",{sessionsCount:r.length,activeSessionId:c}),h(!1)},sessions:r,activeSessionId:c,onSelectSession:Ee,onNewSession:oe,onCloseSession:Oe,onRenameSession:Jr,onReconnectSession:Zr,language:O.language,theme:J,isMobile:g,width:a,onResizeStart:Cr,onFileSelect:z,onFolderSelect:Z}),L.jsx(e_,{isOpen:u,onClose:()=>d(!1),settings:O,onSave:sr,theme:J,username:e.username}),L.jsx(i_,{isOpen:x.isOpen,title:x.title,message:x.message,confirmText:x.isLogout?R("logout"):R("close")||"Close",cancelText:R("cancel"),onConfirm:jt,onCancel:ee,language:O.language,danger:!0,theme:J})]})}const de={loadingContainer:{width:"100%",height:"100%",display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",backgroundColor:"#1e1e2e",position:"fixed"},loadingLogo:{margin:0,fontSize:"28px",fontWeight:"700",color:"#89b4fa",marginBottom:"12px",textTransform:"uppercase"},loadingText:{margin:0,fontSize:"16px",color:"#6c7086"},container:{width:"100vw",height:"100vh",display:"flex",flexDirection:"column",backgroundColor:"#1e1e2e",position:"fixed",top:0,left:0,overflow:"hidden"},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"0",backgroundColor:"#181825",borderBottom:"1px solid #313244",flexShrink:0,height:"32px",boxSizing:"border-box"},headerLeft:{display:"flex",alignItems:"center",gap:"0",flexWrap:"nowrap",height:"100%"},headerRight:{display:"flex",alignItems:"center",gap:"0",height:"100%"},hamburgerBtn:{background:"none",border:"none",borderRight:"1px solid #313244",cursor:"pointer",padding:"0 10px",display:"flex",alignItems:"center",justifyContent:"center",borderRadius:"0",transition:"background-color 0.15s ease",height:"100%"},title:{margin:0,fontSize:"13px",fontWeight:"600",color:"#89b4fa",textTransform:"uppercase",padding:"0 12px",display:"flex",alignItems:"center",borderRight:"1px solid #313244",height:"100%"},sessionInfo:{fontSize:"12px",display:"flex",alignItems:"center",gap:"4px",padding:"0 12px",borderRight:"1px solid #313244",borderRadius:"0",height:"100%"},settingsBtn:{padding:"0 10px",backgroundColor:"transparent",border:"none",borderRight:"1px solid #313244",borderRadius:"0",cursor:"pointer",transition:"background-color 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",height:"100%"},logoutBtn:{padding:"0 10px",backgroundColor:"transparent",border:"none",borderRadius:"0",cursor:"pointer",transition:"background-color 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",height:"100%"},terminalContainer:{flex:1,overflow:"hidden",position:"relative",padding:"8px"},emptyState:{display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",height:"100%",gap:"20px",padding:"40px"},emptyIcon:{opacity:.5},emptyTitle:{margin:0,fontSize:"24px",fontWeight:"600"},emptyMessage:{margin:0,fontSize:"14px"},emptyButton:{display:"flex",alignItems:"center",gap:"8px",padding:"10px 20px",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"500",cursor:"pointer",transition:"opacity 0.15s ease",marginTop:"12px"},menuOverlay:{position:"fixed",top:0,left:0,right:0,bottom:0,width:"100%",height:"100vh",backgroundColor:"rgba(0, 0, 0, 0.5)",zIndex:9998},dropdown:{position:"absolute",top:"calc(100% + 4px)",right:0,minWidth:"180px",backgroundColor:"#181825",border:"1px solid #313244",borderRadius:"2px",zIndex:9999,overflow:"hidden"},dropdownItem:{padding:"8px 12px",borderBottom:"1px solid #313244",display:"flex",justifyContent:"space-between",alignItems:"center"},dropdownLabel:{fontSize:"12px",color:"#6c7086",fontWeight:"500",textTransform:"uppercase"},dropdownValue:{fontSize:"13px",fontWeight:"600"},dropdownButton:{width:"100%",padding:"10px 12px",background:"none",border:"none",color:"#cdd6f4",fontSize:"12px",fontWeight:"500",cursor:"pointer",display:"flex",alignItems:"center",gap:"8px",transition:"background-color 0.15s ease",textAlign:"left",lineHeight:"1"}};On.createRoot(document.getElementById("root")).render(L.jsx(xh.StrictMode,{children:L.jsx(h_,{})}));
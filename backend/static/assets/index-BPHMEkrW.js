@@ -1,317 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const c of document.querySelectorAll('link[rel="modulepreload"]'))i(c);new MutationObserver(c=>{for(const h of c)if(h.type==="childList")for(const g of h.addedNodes)g.tagName==="LINK"&&g.rel==="modulepreload"&&i(g)}).observe(document,{childList:!0,subtree:!0});function r(c){const h={};return c.integrity&&(h.integrity=c.integrity),c.referrerPolicy&&(h.referrerPolicy=c.referrerPolicy),c.crossOrigin==="use-credentials"?h.credentials="include":c.crossOrigin==="anonymous"?h.credentials="omit":h.credentials="same-origin",h}function i(c){if(c.ep)return;c.ep=!0;const h=r(c);fetch(c.href,h)}})();function ah(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Na={exports:{}},$s={},Wa={exports:{}},re={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var zi=Symbol.for("react.element"),ch=Symbol.for("react.portal"),uh=Symbol.for("react.fragment"),hh=Symbol.for("react.strict_mode"),dh=Symbol.for("react.profiler"),fh=Symbol.for("react.provider"),ph=Symbol.for("react.context"),_h=Symbol.for("react.forward_ref"),gh=Symbol.for("react.suspense"),vh=Symbol.for("react.memo"),mh=Symbol.for("react.lazy"),Ll=Symbol.iterator;function yh(e){return e===null||typeof e!="object"?null:(e=Ll&&e[Ll]||e["@@iterator"],typeof e=="function"?e:null)}var Ua={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},$a=Object.assign,Va={};function Xr(e,t,r){this.props=e,this.context=t,this.refs=Va,this.updater=r||Ua}Xr.prototype.isReactComponent={};Xr.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Xr.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Ka(){}Ka.prototype=Xr.prototype;function Mo(e,t,r){this.props=e,this.context=t,this.refs=Va,this.updater=r||Ua}var Po=Mo.prototype=new Ka;Po.constructor=Mo;$a(Po,Xr.prototype);Po.isPureReactComponent=!0;var Dl=Array.isArray,qa=Object.prototype.hasOwnProperty,Io={current:null},Ga={key:!0,ref:!0,__self:!0,__source:!0};function Xa(e,t,r){var i,c={},h=null,g=null;if(t!=null)for(i in t.ref!==void 0&&(g=t.ref),t.key!==void 0&&(h=""+t.key),t)qa.call(t,i)&&!Ga.hasOwnProperty(i)&&(c[i]=t[i]);var n=arguments.length-2;if(n===1)c.children=r;else if(1<n){for(var u=Array(n),f=0;f<n;f++)u[f]=arguments[f+2];c.children=u}if(e&&e.defaultProps)for(i in n=e.defaultProps,n)c[i]===void 0&&(c[i]=n[i]);return{$$typeof:zi,type:e,key:h,ref:g,props:c,_owner:Io.current}}function Sh(e,t){return{$$typeof:zi,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function Oo(e){return typeof e=="object"&&e!==null&&e.$$typeof===zi}function Ch(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(r){return t[r]})}var Rl=/\/+/g;function an(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Ch(""+e.key):t.toString(36)}function as(e,t,r,i,c){var h=typeof e;(h==="undefined"||h==="boolean")&&(e=null);var g=!1;if(e===null)g=!0;else switch(h){case"string":case"number":g=!0;break;case"object":switch(e.$$typeof){case zi:case ch:g=!0}}if(g)return g=e,c=c(g),e=i===""?"."+an(g,0):i,Dl(c)?(r="",e!=null&&(r=e.replace(Rl,"$&/")+"/"),as(c,t,r,"",function(f){return f})):c!=null&&(Oo(c)&&(c=Sh(c,r+(!c.key||g&&g.key===c.key?"":(""+c.key).replace(Rl,"$&/")+"/")+e)),t.push(c)),1;if(g=0,i=i===""?".":i+":",Dl(e))for(var n=0;n<e.length;n++){h=e[n];var u=i+an(h,n);g+=as(h,t,r,u,c)}else if(u=yh(e),typeof u=="function")for(e=u.call(e),n=0;!(h=e.next()).done;)h=h.value,u=i+an(h,n++),g+=as(h,t,r,u,c);else if(h==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return g}function Vi(e,t,r){if(e==null)return e;var i=[],c=0;return as(e,i,"","",function(h){return t.call(r,h,c++)}),i}function wh(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(r){(e._status===0||e._status===-1)&&(e._status=1,e._result=r)},function(r){(e._status===0||e._status===-1)&&(e._status=2,e._result=r)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var Ue={current:null},cs={transition:null},xh={ReactCurrentDispatcher:Ue,ReactCurrentBatchConfig:cs,ReactCurrentOwner:Io};function Ya(){throw Error("act(...) is not supported in production builds of React.")}re.Children={map:Vi,forEach:function(e,t,r){Vi(e,function(){t.apply(this,arguments)},r)},count:function(e){var t=0;return Vi(e,function(){t++}),t},toArray:function(e){return Vi(e,function(t){return t})||[]},only:function(e){if(!Oo(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};re.Component=Xr;re.Fragment=uh;re.Profiler=dh;re.PureComponent=Mo;re.StrictMode=hh;re.Suspense=gh;re.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=xh;re.act=Ya;re.cloneElement=function(e,t,r){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var i=$a({},e.props),c=e.key,h=e.ref,g=e._owner;if(t!=null){if(t.ref!==void 0&&(h=t.ref,g=Io.current),t.key!==void 0&&(c=""+t.key),e.type&&e.type.defaultProps)var n=e.type.defaultProps;for(u in t)qa.call(t,u)&&!Ga.hasOwnProperty(u)&&(i[u]=t[u]===void 0&&n!==void 0?n[u]:t[u])}var u=arguments.length-2;if(u===1)i.children=r;else if(1<u){n=Array(u);for(var f=0;f<u;f++)n[f]=arguments[f+2];i.children=n}return{$$typeof:zi,type:e.type,key:c,ref:h,props:i,_owner:g}};re.createContext=function(e){return e={$$typeof:ph,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:fh,_context:e},e.Consumer=e};re.createElement=Xa;re.createFactory=function(e){var t=Xa.bind(null,e);return t.type=e,t};re.createRef=function(){return{current:null}};re.forwardRef=function(e){return{$$typeof:_h,render:e}};re.isValidElement=Oo;re.lazy=function(e){return{$$typeof:mh,_payload:{_status:-1,_result:e},_init:wh}};re.memo=function(e,t){return{$$typeof:vh,type:e,compare:t===void 0?null:t}};re.startTransition=function(e){var t=cs.transition;cs.transition={};try{e()}finally{cs.transition=t}};re.unstable_act=Ya;re.useCallback=function(e,t){return Ue.current.useCallback(e,t)};re.useContext=function(e){return Ue.current.useContext(e)};re.useDebugValue=function(){};re.useDeferredValue=function(e){return Ue.current.useDeferredValue(e)};re.useEffect=function(e,t){return Ue.current.useEffect(e,t)};re.useId=function(){return Ue.current.useId()};re.useImperativeHandle=function(e,t,r){return Ue.current.useImperativeHandle(e,t,r)};re.useInsertionEffect=function(e,t){return Ue.current.useInsertionEffect(e,t)};re.useLayoutEffect=function(e,t){return Ue.current.useLayoutEffect(e,t)};re.useMemo=function(e,t){return Ue.current.useMemo(e,t)};re.useReducer=function(e,t,r){return Ue.current.useReducer(e,t,r)};re.useRef=function(e){return Ue.current.useRef(e)};re.useState=function(e){return Ue.current.useState(e)};re.useSyncExternalStore=function(e,t,r){return Ue.current.useSyncExternalStore(e,t,r)};re.useTransition=function(){return Ue.current.useTransition()};re.version="18.3.1";Wa.exports=re;var U=Wa.exports;const bh=ah(U);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var kh=U,Eh=Symbol.for("react.element"),Lh=Symbol.for("react.fragment"),Dh=Object.prototype.hasOwnProperty,Rh=kh.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Th={key:!0,ref:!0,__self:!0,__source:!0};function Qa(e,t,r){var i,c={},h=null,g=null;r!==void 0&&(h=""+r),t.key!==void 0&&(h=""+t.key),t.ref!==void 0&&(g=t.ref);for(i in t)Dh.call(t,i)&&!Th.hasOwnProperty(i)&&(c[i]=t[i]);if(e&&e.defaultProps)for(i in t=e.defaultProps,t)c[i]===void 0&&(c[i]=t[i]);return{$$typeof:Eh,type:e,key:h,ref:g,props:c,_owner:Rh.current}}$s.Fragment=Lh;$s.jsx=Qa;$s.jsxs=Qa;Na.exports=$s;var L=Na.exports,Hn={},Ja={exports:{}},st={},Za={exports:{}},ec={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(b,R){var A=b.length;b.push(R);e:for(;0<A;){var M=A-1>>>1,z=b[M];if(0<c(z,R))b[M]=R,b[A]=z,A=M;else break e}}function r(b){return b.length===0?null:b[0]}function i(b){if(b.length===0)return null;var R=b[0],A=b.pop();if(A!==R){b[0]=A;e:for(var M=0,z=b.length,q=z>>>1;M<q;){var Q=2*(M+1)-1,Y=b[Q],se=Q+1,D=b[se];if(0>c(Y,A))se<z&&0>c(D,Y)?(b[M]=D,b[se]=A,M=se):(b[M]=Y,b[Q]=A,M=Q);else if(se<z&&0>c(D,A))b[M]=D,b[se]=A,M=se;else break e}}return R}function c(b,R){var A=b.sortIndex-R.sortIndex;return A!==0?A:b.id-R.id}if(typeof performance=="object"&&typeof performance.now=="function"){var h=performance;e.unstable_now=function(){return h.now()}}else{var g=Date,n=g.now();e.unstable_now=function(){return g.now()-n}}var u=[],f=[],y=1,d=null,_=3,S=!1,w=!1,C=!1,a=typeof setTimeout=="function"?setTimeout:null,l=typeof clearTimeout=="function"?clearTimeout:null,s=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function o(b){for(var R=r(f);R!==null;){if(R.callback===null)i(f);else if(R.startTime<=b)i(f),R.sortIndex=R.expirationTime,t(u,R);else break;R=r(f)}}function p(b){if(C=!1,o(b),!w)if(r(u)!==null)w=!0,W(m);else{var R=r(f);R!==null&&O(p,R.startTime-b)}}function m(b,R){w=!1,C&&(C=!1,l(v),v=-1),S=!0;var A=_;try{for(o(R),d=r(u);d!==null&&(!(d.expirationTime>R)||b&&!P());){var M=d.callback;if(typeof M=="function"){d.callback=null,_=d.priorityLevel;var z=M(d.expirationTime<=R);R=e.unstable_now(),typeof z=="function"?d.callback=z:d===r(u)&&i(u),o(R)}else i(u);d=r(u)}if(d!==null)var q=!0;else{var Q=r(f);Q!==null&&O(p,Q.startTime-R),q=!1}return q}finally{d=null,_=A,S=!1}}var x=!1,E=null,v=-1,k=5,T=-1;function P(){return!(e.unstable_now()-T<k)}function B(){if(E!==null){var b=e.unstable_now();T=b;var R=!0;try{R=E(!0,b)}finally{R?I():(x=!1,E=null)}}else x=!1}var I;if(typeof s=="function")I=function(){s(B)};else if(typeof MessageChannel<"u"){var F=new MessageChannel,H=F.port2;F.port1.onmessage=B,I=function(){H.postMessage(null)}}else I=function(){a(B,0)};function W(b){E=b,x||(x=!0,I())}function O(b,R){v=a(function(){b(e.unstable_now())},R)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(b){b.callback=null},e.unstable_continueExecution=function(){w||S||(w=!0,W(m))},e.unstable_forceFrameRate=function(b){0>b||125<b?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):k=0<b?Math.floor(1e3/b):5},e.unstable_getCurrentPriorityLevel=function(){return _},e.unstable_getFirstCallbackNode=function(){return r(u)},e.unstable_next=function(b){switch(_){case 1:case 2:case 3:var R=3;break;default:R=_}var A=_;_=R;try{return b()}finally{_=A}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(b,R){switch(b){case 1:case 2:case 3:case 4:case 5:break;default:b=3}var A=_;_=b;try{return R()}finally{_=A}},e.unstable_scheduleCallback=function(b,R,A){var M=e.unstable_now();switch(typeof A=="object"&&A!==null?(A=A.delay,A=typeof A=="number"&&0<A?M+A:M):A=M,b){case 1:var z=-1;break;case 2:z=250;break;case 5:z=1073741823;break;case 4:z=1e4;break;default:z=5e3}return z=A+z,b={id:y++,callback:R,priorityLevel:b,startTime:A,expirationTime:z,sortIndex:-1},A>M?(b.sortIndex=A,t(f,b),r(u)===null&&b===r(f)&&(C?(l(v),v=-1):C=!0,O(p,A-M))):(b.sortIndex=z,t(u,b),w||S||(w=!0,W(m))),b},e.unstable_shouldYield=P,e.unstable_wrapCallback=function(b){var R=_;return function(){var A=_;_=R;try{return b.apply(this,arguments)}finally{_=A}}}})(ec);Za.exports=ec;var Bh=Za.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Ah=U,it=Bh;function V(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,r=1;r<arguments.length;r++)t+="&args[]="+encodeURIComponent(arguments[r]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var tc=new Set,xi={};function mr(e,t){Nr(e,t),Nr(e+"Capture",t)}function Nr(e,t){for(xi[e]=t,e=0;e<t.length;e++)tc.add(t[e])}var At=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Fn=Object.prototype.hasOwnProperty,Mh=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Tl={},Bl={};function Ph(e){return Fn.call(Bl,e)?!0:Fn.call(Tl,e)?!1:Mh.test(e)?Bl[e]=!0:(Tl[e]=!0,!1)}function Ih(e,t,r,i){if(r!==null&&r.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return i?!1:r!==null?!r.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Oh(e,t,r,i){if(t===null||typeof t>"u"||Ih(e,t,r,i))return!0;if(i)return!1;if(r!==null)switch(r.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function $e(e,t,r,i,c,h,g){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=i,this.attributeNamespace=c,this.mustUseProperty=r,this.propertyName=e,this.type=t,this.sanitizeURL=h,this.removeEmptyString=g}var Oe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){Oe[e]=new $e(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];Oe[t]=new $e(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){Oe[e]=new $e(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){Oe[e]=new $e(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){Oe[e]=new $e(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){Oe[e]=new $e(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){Oe[e]=new $e(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){Oe[e]=new $e(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){Oe[e]=new $e(e,5,!1,e.toLowerCase(),null,!1,!1)});var jo=/[\-:]([a-z])/g;function Ho(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(jo,Ho);Oe[t]=new $e(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(jo,Ho);Oe[t]=new $e(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(jo,Ho);Oe[t]=new $e(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){Oe[e]=new $e(e,1,!1,e.toLowerCase(),null,!1,!1)});Oe.xlinkHref=new $e("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){Oe[e]=new $e(e,1,!1,e.toLowerCase(),null,!0,!0)});function Fo(e,t,r,i){var c=Oe.hasOwnProperty(t)?Oe[t]:null;(c!==null?c.type!==0:i||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Oh(t,r,c,i)&&(r=null),i||c===null?Ph(t)&&(r===null?e.removeAttribute(t):e.setAttribute(t,""+r)):c.mustUseProperty?e[c.propertyName]=r===null?c.type===3?!1:"":r:(t=c.attributeName,i=c.attributeNamespace,r===null?e.removeAttribute(t):(c=c.type,r=c===3||c===4&&r===!0?"":""+r,i?e.setAttributeNS(i,t,r):e.setAttribute(t,r))))}var Ot=Ah.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,Ki=Symbol.for("react.element"),xr=Symbol.for("react.portal"),br=Symbol.for("react.fragment"),zo=Symbol.for("react.strict_mode"),zn=Symbol.for("react.profiler"),rc=Symbol.for("react.provider"),ic=Symbol.for("react.context"),No=Symbol.for("react.forward_ref"),Nn=Symbol.for("react.suspense"),Wn=Symbol.for("react.suspense_list"),Wo=Symbol.for("react.memo"),Ft=Symbol.for("react.lazy"),sc=Symbol.for("react.offscreen"),Al=Symbol.iterator;function ti(e){return e===null||typeof e!="object"?null:(e=Al&&e[Al]||e["@@iterator"],typeof e=="function"?e:null)}var Ce=Object.assign,cn;function ui(e){if(cn===void 0)try{throw Error()}catch(r){var t=r.stack.trim().match(/\n( *(at )?)/);cn=t&&t[1]||""}return`
-`+cn+e}var un=!1;function hn(e,t){if(!e||un)return"";un=!0;var r=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(f){var i=f}Reflect.construct(e,[],t)}else{try{t.call()}catch(f){i=f}e.call(t.prototype)}else{try{throw Error()}catch(f){i=f}e()}}catch(f){if(f&&i&&typeof f.stack=="string"){for(var c=f.stack.split(`
-`),h=i.stack.split(`
-`),g=c.length-1,n=h.length-1;1<=g&&0<=n&&c[g]!==h[n];)n--;for(;1<=g&&0<=n;g--,n--)if(c[g]!==h[n]){if(g!==1||n!==1)do if(g--,n--,0>n||c[g]!==h[n]){var u=`
-`+c[g].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}while(1<=g&&0<=n);break}}}finally{un=!1,Error.prepareStackTrace=r}return(e=e?e.displayName||e.name:"")?ui(e):""}function jh(e){switch(e.tag){case 5:return ui(e.type);case 16:return ui("Lazy");case 13:return ui("Suspense");case 19:return ui("SuspenseList");case 0:case 2:case 15:return e=hn(e.type,!1),e;case 11:return e=hn(e.type.render,!1),e;case 1:return e=hn(e.type,!0),e;default:return""}}function Un(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case br:return"Fragment";case xr:return"Portal";case zn:return"Profiler";case zo:return"StrictMode";case Nn:return"Suspense";case Wn:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case ic:return(e.displayName||"Context")+".Consumer";case rc:return(e._context.displayName||"Context")+".Provider";case No:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Wo:return t=e.displayName||null,t!==null?t:Un(e.type)||"Memo";case Ft:t=e._payload,e=e._init;try{return Un(e(t))}catch{}}return null}function Hh(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Un(t);case 8:return t===zo?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Zt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function nc(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Fh(e){var t=nc(e)?"checked":"value",r=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),i=""+e[t];if(!e.hasOwnProperty(t)&&typeof r<"u"&&typeof r.get=="function"&&typeof r.set=="function"){var c=r.get,h=r.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return c.call(this)},set:function(g){i=""+g,h.call(this,g)}}),Object.defineProperty(e,t,{enumerable:r.enumerable}),{getValue:function(){return i},setValue:function(g){i=""+g},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function qi(e){e._valueTracker||(e._valueTracker=Fh(e))}function oc(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var r=t.getValue(),i="";return e&&(i=nc(e)?e.checked?"true":"false":e.value),e=i,e!==r?(t.setValue(e),!0):!1}function Ss(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function $n(e,t){var r=t.checked;return Ce({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:r??e._wrapperState.initialChecked})}function Ml(e,t){var r=t.defaultValue==null?"":t.defaultValue,i=t.checked!=null?t.checked:t.defaultChecked;r=Zt(t.value!=null?t.value:r),e._wrapperState={initialChecked:i,initialValue:r,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function lc(e,t){t=t.checked,t!=null&&Fo(e,"checked",t,!1)}function Vn(e,t){lc(e,t);var r=Zt(t.value),i=t.type;if(r!=null)i==="number"?(r===0&&e.value===""||e.value!=r)&&(e.value=""+r):e.value!==""+r&&(e.value=""+r);else if(i==="submit"||i==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?Kn(e,t.type,r):t.hasOwnProperty("defaultValue")&&Kn(e,t.type,Zt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Pl(e,t,r){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var i=t.type;if(!(i!=="submit"&&i!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,r||t===e.value||(e.value=t),e.defaultValue=t}r=e.name,r!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,r!==""&&(e.name=r)}function Kn(e,t,r){(t!=="number"||Ss(e.ownerDocument)!==e)&&(r==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+r&&(e.defaultValue=""+r))}var hi=Array.isArray;function Ir(e,t,r,i){if(e=e.options,t){t={};for(var c=0;c<r.length;c++)t["$"+r[c]]=!0;for(r=0;r<e.length;r++)c=t.hasOwnProperty("$"+e[r].value),e[r].selected!==c&&(e[r].selected=c),c&&i&&(e[r].defaultSelected=!0)}else{for(r=""+Zt(r),t=null,c=0;c<e.length;c++){if(e[c].value===r){e[c].selected=!0,i&&(e[c].defaultSelected=!0);return}t!==null||e[c].disabled||(t=e[c])}t!==null&&(t.selected=!0)}}function qn(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(V(91));return Ce({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Il(e,t){var r=t.value;if(r==null){if(r=t.children,t=t.defaultValue,r!=null){if(t!=null)throw Error(V(92));if(hi(r)){if(1<r.length)throw Error(V(93));r=r[0]}t=r}t==null&&(t=""),r=t}e._wrapperState={initialValue:Zt(r)}}function ac(e,t){var r=Zt(t.value),i=Zt(t.defaultValue);r!=null&&(r=""+r,r!==e.value&&(e.value=r),t.defaultValue==null&&e.defaultValue!==r&&(e.defaultValue=r)),i!=null&&(e.defaultValue=""+i)}function Ol(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function cc(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Gn(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?cc(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var Gi,uc=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,r,i,c){MSApp.execUnsafeLocalFunction(function(){return e(t,r,i,c)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(Gi=Gi||document.createElement("div"),Gi.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Gi.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function bi(e,t){if(t){var r=e.firstChild;if(r&&r===e.lastChild&&r.nodeType===3){r.nodeValue=t;return}}e.textContent=t}var pi={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},zh=["Webkit","ms","Moz","O"];Object.keys(pi).forEach(function(e){zh.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),pi[t]=pi[e]})});function hc(e,t,r){return t==null||typeof t=="boolean"||t===""?"":r||typeof t!="number"||t===0||pi.hasOwnProperty(e)&&pi[e]?(""+t).trim():t+"px"}function dc(e,t){e=e.style;for(var r in t)if(t.hasOwnProperty(r)){var i=r.indexOf("--")===0,c=hc(r,t[r],i);r==="float"&&(r="cssFloat"),i?e.setProperty(r,c):e[r]=c}}var Nh=Ce({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function Xn(e,t){if(t){if(Nh[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(V(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(V(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(V(61))}if(t.style!=null&&typeof t.style!="object")throw Error(V(62))}}function Yn(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Qn=null;function Uo(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Jn=null,Or=null,jr=null;function jl(e){if(e=Ui(e)){if(typeof Jn!="function")throw Error(V(280));var t=e.stateNode;t&&(t=Xs(t),Jn(e.stateNode,e.type,t))}}function fc(e){Or?jr?jr.push(e):jr=[e]:Or=e}function pc(){if(Or){var e=Or,t=jr;if(jr=Or=null,jl(e),t)for(e=0;e<t.length;e++)jl(t[e])}}function _c(e,t){return e(t)}function gc(){}var dn=!1;function vc(e,t,r){if(dn)return e(t,r);dn=!0;try{return _c(e,t,r)}finally{dn=!1,(Or!==null||jr!==null)&&(gc(),pc())}}function ki(e,t){var r=e.stateNode;if(r===null)return null;var i=Xs(r);if(i===null)return null;r=i[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(i=!i.disabled)||(e=e.type,i=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!i;break e;default:e=!1}if(e)return null;if(r&&typeof r!="function")throw Error(V(231,t,typeof r));return r}var Zn=!1;if(At)try{var ri={};Object.defineProperty(ri,"passive",{get:function(){Zn=!0}}),window.addEventListener("test",ri,ri),window.removeEventListener("test",ri,ri)}catch{Zn=!1}function Wh(e,t,r,i,c,h,g,n,u){var f=Array.prototype.slice.call(arguments,3);try{t.apply(r,f)}catch(y){this.onError(y)}}var _i=!1,Cs=null,ws=!1,eo=null,Uh={onError:function(e){_i=!0,Cs=e}};function $h(e,t,r,i,c,h,g,n,u){_i=!1,Cs=null,Wh.apply(Uh,arguments)}function Vh(e,t,r,i,c,h,g,n,u){if($h.apply(this,arguments),_i){if(_i){var f=Cs;_i=!1,Cs=null}else throw Error(V(198));ws||(ws=!0,eo=f)}}function yr(e){var t=e,r=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(r=t.return),e=t.return;while(e)}return t.tag===3?r:null}function mc(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Hl(e){if(yr(e)!==e)throw Error(V(188))}function Kh(e){var t=e.alternate;if(!t){if(t=yr(e),t===null)throw Error(V(188));return t!==e?null:e}for(var r=e,i=t;;){var c=r.return;if(c===null)break;var h=c.alternate;if(h===null){if(i=c.return,i!==null){r=i;continue}break}if(c.child===h.child){for(h=c.child;h;){if(h===r)return Hl(c),e;if(h===i)return Hl(c),t;h=h.sibling}throw Error(V(188))}if(r.return!==i.return)r=c,i=h;else{for(var g=!1,n=c.child;n;){if(n===r){g=!0,r=c,i=h;break}if(n===i){g=!0,i=c,r=h;break}n=n.sibling}if(!g){for(n=h.child;n;){if(n===r){g=!0,r=h,i=c;break}if(n===i){g=!0,i=h,r=c;break}n=n.sibling}if(!g)throw Error(V(189))}}if(r.alternate!==i)throw Error(V(190))}if(r.tag!==3)throw Error(V(188));return r.stateNode.current===r?e:t}function yc(e){return e=Kh(e),e!==null?Sc(e):null}function Sc(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Sc(e);if(t!==null)return t;e=e.sibling}return null}var Cc=it.unstable_scheduleCallback,Fl=it.unstable_cancelCallback,qh=it.unstable_shouldYield,Gh=it.unstable_requestPaint,xe=it.unstable_now,Xh=it.unstable_getCurrentPriorityLevel,$o=it.unstable_ImmediatePriority,wc=it.unstable_UserBlockingPriority,xs=it.unstable_NormalPriority,Yh=it.unstable_LowPriority,xc=it.unstable_IdlePriority,Vs=null,bt=null;function Qh(e){if(bt&&typeof bt.onCommitFiberRoot=="function")try{bt.onCommitFiberRoot(Vs,e,void 0,(e.current.flags&128)===128)}catch{}}var vt=Math.clz32?Math.clz32:ed,Jh=Math.log,Zh=Math.LN2;function ed(e){return e>>>=0,e===0?32:31-(Jh(e)/Zh|0)|0}var Xi=64,Yi=4194304;function di(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function bs(e,t){var r=e.pendingLanes;if(r===0)return 0;var i=0,c=e.suspendedLanes,h=e.pingedLanes,g=r&268435455;if(g!==0){var n=g&~c;n!==0?i=di(n):(h&=g,h!==0&&(i=di(h)))}else g=r&~c,g!==0?i=di(g):h!==0&&(i=di(h));if(i===0)return 0;if(t!==0&&t!==i&&!(t&c)&&(c=i&-i,h=t&-t,c>=h||c===16&&(h&4194240)!==0))return t;if(i&4&&(i|=r&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=i;0<t;)r=31-vt(t),c=1<<r,i|=e[r],t&=~c;return i}function td(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function rd(e,t){for(var r=e.suspendedLanes,i=e.pingedLanes,c=e.expirationTimes,h=e.pendingLanes;0<h;){var g=31-vt(h),n=1<<g,u=c[g];u===-1?(!(n&r)||n&i)&&(c[g]=td(n,t)):u<=t&&(e.expiredLanes|=n),h&=~n}}function to(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function bc(){var e=Xi;return Xi<<=1,!(Xi&4194240)&&(Xi=64),e}function fn(e){for(var t=[],r=0;31>r;r++)t.push(e);return t}function Ni(e,t,r){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-vt(t),e[t]=r}function id(e,t){var r=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var i=e.eventTimes;for(e=e.expirationTimes;0<r;){var c=31-vt(r),h=1<<c;t[c]=0,i[c]=-1,e[c]=-1,r&=~h}}function Vo(e,t){var r=e.entangledLanes|=t;for(e=e.entanglements;r;){var i=31-vt(r),c=1<<i;c&t|e[i]&t&&(e[i]|=t),r&=~c}}var he=0;function kc(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Ec,Ko,Lc,Dc,Rc,ro=!1,Qi=[],Vt=null,Kt=null,qt=null,Ei=new Map,Li=new Map,Nt=[],sd="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function zl(e,t){switch(e){case"focusin":case"focusout":Vt=null;break;case"dragenter":case"dragleave":Kt=null;break;case"mouseover":case"mouseout":qt=null;break;case"pointerover":case"pointerout":Ei.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Li.delete(t.pointerId)}}function ii(e,t,r,i,c,h){return e===null||e.nativeEvent!==h?(e={blockedOn:t,domEventName:r,eventSystemFlags:i,nativeEvent:h,targetContainers:[c]},t!==null&&(t=Ui(t),t!==null&&Ko(t)),e):(e.eventSystemFlags|=i,t=e.targetContainers,c!==null&&t.indexOf(c)===-1&&t.push(c),e)}function nd(e,t,r,i,c){switch(t){case"focusin":return Vt=ii(Vt,e,t,r,i,c),!0;case"dragenter":return Kt=ii(Kt,e,t,r,i,c),!0;case"mouseover":return qt=ii(qt,e,t,r,i,c),!0;case"pointerover":var h=c.pointerId;return Ei.set(h,ii(Ei.get(h)||null,e,t,r,i,c)),!0;case"gotpointercapture":return h=c.pointerId,Li.set(h,ii(Li.get(h)||null,e,t,r,i,c)),!0}return!1}function Tc(e){var t=ar(e.target);if(t!==null){var r=yr(t);if(r!==null){if(t=r.tag,t===13){if(t=mc(r),t!==null){e.blockedOn=t,Rc(e.priority,function(){Lc(r)});return}}else if(t===3&&r.stateNode.current.memoizedState.isDehydrated){e.blockedOn=r.tag===3?r.stateNode.containerInfo:null;return}}}e.blockedOn=null}function us(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var r=io(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(r===null){r=e.nativeEvent;var i=new r.constructor(r.type,r);Qn=i,r.target.dispatchEvent(i),Qn=null}else return t=Ui(r),t!==null&&Ko(t),e.blockedOn=r,!1;t.shift()}return!0}function Nl(e,t,r){us(e)&&r.delete(t)}function od(){ro=!1,Vt!==null&&us(Vt)&&(Vt=null),Kt!==null&&us(Kt)&&(Kt=null),qt!==null&&us(qt)&&(qt=null),Ei.forEach(Nl),Li.forEach(Nl)}function si(e,t){e.blockedOn===t&&(e.blockedOn=null,ro||(ro=!0,it.unstable_scheduleCallback(it.unstable_NormalPriority,od)))}function Di(e){function t(c){return si(c,e)}if(0<Qi.length){si(Qi[0],e);for(var r=1;r<Qi.length;r++){var i=Qi[r];i.blockedOn===e&&(i.blockedOn=null)}}for(Vt!==null&&si(Vt,e),Kt!==null&&si(Kt,e),qt!==null&&si(qt,e),Ei.forEach(t),Li.forEach(t),r=0;r<Nt.length;r++)i=Nt[r],i.blockedOn===e&&(i.blockedOn=null);for(;0<Nt.length&&(r=Nt[0],r.blockedOn===null);)Tc(r),r.blockedOn===null&&Nt.shift()}var Hr=Ot.ReactCurrentBatchConfig,ks=!0;function ld(e,t,r,i){var c=he,h=Hr.transition;Hr.transition=null;try{he=1,qo(e,t,r,i)}finally{he=c,Hr.transition=h}}function ad(e,t,r,i){var c=he,h=Hr.transition;Hr.transition=null;try{he=4,qo(e,t,r,i)}finally{he=c,Hr.transition=h}}function qo(e,t,r,i){if(ks){var c=io(e,t,r,i);if(c===null)xn(e,t,i,Es,r),zl(e,i);else if(nd(c,e,t,r,i))i.stopPropagation();else if(zl(e,i),t&4&&-1<sd.indexOf(e)){for(;c!==null;){var h=Ui(c);if(h!==null&&Ec(h),h=io(e,t,r,i),h===null&&xn(e,t,i,Es,r),h===c)break;c=h}c!==null&&i.stopPropagation()}else xn(e,t,i,null,r)}}var Es=null;function io(e,t,r,i){if(Es=null,e=Uo(i),e=ar(e),e!==null)if(t=yr(e),t===null)e=null;else if(r=t.tag,r===13){if(e=mc(t),e!==null)return e;e=null}else if(r===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Es=e,null}function Bc(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Xh()){case $o:return 1;case wc:return 4;case xs:case Yh:return 16;case xc:return 536870912;default:return 16}default:return 16}}var Ut=null,Go=null,hs=null;function Ac(){if(hs)return hs;var e,t=Go,r=t.length,i,c="value"in Ut?Ut.value:Ut.textContent,h=c.length;for(e=0;e<r&&t[e]===c[e];e++);var g=r-e;for(i=1;i<=g&&t[r-i]===c[h-i];i++);return hs=c.slice(e,1<i?1-i:void 0)}function ds(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Ji(){return!0}function Wl(){return!1}function nt(e){function t(r,i,c,h,g){this._reactName=r,this._targetInst=c,this.type=i,this.nativeEvent=h,this.target=g,this.currentTarget=null;for(var n in e)e.hasOwnProperty(n)&&(r=e[n],this[n]=r?r(h):h[n]);return this.isDefaultPrevented=(h.defaultPrevented!=null?h.defaultPrevented:h.returnValue===!1)?Ji:Wl,this.isPropagationStopped=Wl,this}return Ce(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var r=this.nativeEvent;r&&(r.preventDefault?r.preventDefault():typeof r.returnValue!="unknown"&&(r.returnValue=!1),this.isDefaultPrevented=Ji)},stopPropagation:function(){var r=this.nativeEvent;r&&(r.stopPropagation?r.stopPropagation():typeof r.cancelBubble!="unknown"&&(r.cancelBubble=!0),this.isPropagationStopped=Ji)},persist:function(){},isPersistent:Ji}),t}var Yr={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Xo=nt(Yr),Wi=Ce({},Yr,{view:0,detail:0}),cd=nt(Wi),pn,_n,ni,Ks=Ce({},Wi,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Yo,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==ni&&(ni&&e.type==="mousemove"?(pn=e.screenX-ni.screenX,_n=e.screenY-ni.screenY):_n=pn=0,ni=e),pn)},movementY:function(e){return"movementY"in e?e.movementY:_n}}),Ul=nt(Ks),ud=Ce({},Ks,{dataTransfer:0}),hd=nt(ud),dd=Ce({},Wi,{relatedTarget:0}),gn=nt(dd),fd=Ce({},Yr,{animationName:0,elapsedTime:0,pseudoElement:0}),pd=nt(fd),_d=Ce({},Yr,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),gd=nt(_d),vd=Ce({},Yr,{data:0}),$l=nt(vd),md={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},yd={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Sd={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Cd(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Sd[e])?!!t[e]:!1}function Yo(){return Cd}var wd=Ce({},Wi,{key:function(e){if(e.key){var t=md[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=ds(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?yd[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Yo,charCode:function(e){return e.type==="keypress"?ds(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?ds(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),xd=nt(wd),bd=Ce({},Ks,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Vl=nt(bd),kd=Ce({},Wi,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Yo}),Ed=nt(kd),Ld=Ce({},Yr,{propertyName:0,elapsedTime:0,pseudoElement:0}),Dd=nt(Ld),Rd=Ce({},Ks,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Td=nt(Rd),Bd=[9,13,27,32],Qo=At&&"CompositionEvent"in window,gi=null;At&&"documentMode"in document&&(gi=document.documentMode);var Ad=At&&"TextEvent"in window&&!gi,Mc=At&&(!Qo||gi&&8<gi&&11>=gi),Kl=" ",ql=!1;function Pc(e,t){switch(e){case"keyup":return Bd.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Ic(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var kr=!1;function Md(e,t){switch(e){case"compositionend":return Ic(t);case"keypress":return t.which!==32?null:(ql=!0,Kl);case"textInput":return e=t.data,e===Kl&&ql?null:e;default:return null}}function Pd(e,t){if(kr)return e==="compositionend"||!Qo&&Pc(e,t)?(e=Ac(),hs=Go=Ut=null,kr=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Mc&&t.locale!=="ko"?null:t.data;default:return null}}var Id={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Gl(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Id[e.type]:t==="textarea"}function Oc(e,t,r,i){fc(i),t=Ls(t,"onChange"),0<t.length&&(r=new Xo("onChange","change",null,r,i),e.push({event:r,listeners:t}))}var vi=null,Ri=null;function Od(e){qc(e,0)}function qs(e){var t=Dr(e);if(oc(t))return e}function jd(e,t){if(e==="change")return t}var jc=!1;if(At){var vn;if(At){var mn="oninput"in document;if(!mn){var Xl=document.createElement("div");Xl.setAttribute("oninput","return;"),mn=typeof Xl.oninput=="function"}vn=mn}else vn=!1;jc=vn&&(!document.documentMode||9<document.documentMode)}function Yl(){vi&&(vi.detachEvent("onpropertychange",Hc),Ri=vi=null)}function Hc(e){if(e.propertyName==="value"&&qs(Ri)){var t=[];Oc(t,Ri,e,Uo(e)),vc(Od,t)}}function Hd(e,t,r){e==="focusin"?(Yl(),vi=t,Ri=r,vi.attachEvent("onpropertychange",Hc)):e==="focusout"&&Yl()}function Fd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return qs(Ri)}function zd(e,t){if(e==="click")return qs(t)}function Nd(e,t){if(e==="input"||e==="change")return qs(t)}function Wd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var yt=typeof Object.is=="function"?Object.is:Wd;function Ti(e,t){if(yt(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var r=Object.keys(e),i=Object.keys(t);if(r.length!==i.length)return!1;for(i=0;i<r.length;i++){var c=r[i];if(!Fn.call(t,c)||!yt(e[c],t[c]))return!1}return!0}function Ql(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Jl(e,t){var r=Ql(e);e=0;for(var i;r;){if(r.nodeType===3){if(i=e+r.textContent.length,e<=t&&i>=t)return{node:r,offset:t-e};e=i}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Ql(r)}}function Fc(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Fc(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function zc(){for(var e=window,t=Ss();t instanceof e.HTMLIFrameElement;){try{var r=typeof t.contentWindow.location.href=="string"}catch{r=!1}if(r)e=t.contentWindow;else break;t=Ss(e.document)}return t}function Jo(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Ud(e){var t=zc(),r=e.focusedElem,i=e.selectionRange;if(t!==r&&r&&r.ownerDocument&&Fc(r.ownerDocument.documentElement,r)){if(i!==null&&Jo(r)){if(t=i.start,e=i.end,e===void 0&&(e=t),"selectionStart"in r)r.selectionStart=t,r.selectionEnd=Math.min(e,r.value.length);else if(e=(t=r.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var c=r.textContent.length,h=Math.min(i.start,c);i=i.end===void 0?h:Math.min(i.end,c),!e.extend&&h>i&&(c=i,i=h,h=c),c=Jl(r,h);var g=Jl(r,i);c&&g&&(e.rangeCount!==1||e.anchorNode!==c.node||e.anchorOffset!==c.offset||e.focusNode!==g.node||e.focusOffset!==g.offset)&&(t=t.createRange(),t.setStart(c.node,c.offset),e.removeAllRanges(),h>i?(e.addRange(t),e.extend(g.node,g.offset)):(t.setEnd(g.node,g.offset),e.addRange(t)))}}for(t=[],e=r;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof r.focus=="function"&&r.focus(),r=0;r<t.length;r++)e=t[r],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var $d=At&&"documentMode"in document&&11>=document.documentMode,Er=null,so=null,mi=null,no=!1;function Zl(e,t,r){var i=r.window===r?r.document:r.nodeType===9?r:r.ownerDocument;no||Er==null||Er!==Ss(i)||(i=Er,"selectionStart"in i&&Jo(i)?i={start:i.selectionStart,end:i.selectionEnd}:(i=(i.ownerDocument&&i.ownerDocument.defaultView||window).getSelection(),i={anchorNode:i.anchorNode,anchorOffset:i.anchorOffset,focusNode:i.focusNode,focusOffset:i.focusOffset}),mi&&Ti(mi,i)||(mi=i,i=Ls(so,"onSelect"),0<i.length&&(t=new Xo("onSelect","select",null,t,r),e.push({event:t,listeners:i}),t.target=Er)))}function Zi(e,t){var r={};return r[e.toLowerCase()]=t.toLowerCase(),r["Webkit"+e]="webkit"+t,r["Moz"+e]="moz"+t,r}var Lr={animationend:Zi("Animation","AnimationEnd"),animationiteration:Zi("Animation","AnimationIteration"),animationstart:Zi("Animation","AnimationStart"),transitionend:Zi("Transition","TransitionEnd")},yn={},Nc={};At&&(Nc=document.createElement("div").style,"AnimationEvent"in window||(delete Lr.animationend.animation,delete Lr.animationiteration.animation,delete Lr.animationstart.animation),"TransitionEvent"in window||delete Lr.transitionend.transition);function Gs(e){if(yn[e])return yn[e];if(!Lr[e])return e;var t=Lr[e],r;for(r in t)if(t.hasOwnProperty(r)&&r in Nc)return yn[e]=t[r];return e}var Wc=Gs("animationend"),Uc=Gs("animationiteration"),$c=Gs("animationstart"),Vc=Gs("transitionend"),Kc=new Map,ea="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function tr(e,t){Kc.set(e,t),mr(t,[e])}for(var Sn=0;Sn<ea.length;Sn++){var Cn=ea[Sn],Vd=Cn.toLowerCase(),Kd=Cn[0].toUpperCase()+Cn.slice(1);tr(Vd,"on"+Kd)}tr(Wc,"onAnimationEnd");tr(Uc,"onAnimationIteration");tr($c,"onAnimationStart");tr("dblclick","onDoubleClick");tr("focusin","onFocus");tr("focusout","onBlur");tr(Vc,"onTransitionEnd");Nr("onMouseEnter",["mouseout","mouseover"]);Nr("onMouseLeave",["mouseout","mouseover"]);Nr("onPointerEnter",["pointerout","pointerover"]);Nr("onPointerLeave",["pointerout","pointerover"]);mr("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));mr("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));mr("onBeforeInput",["compositionend","keypress","textInput","paste"]);mr("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));mr("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));mr("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var fi="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),qd=new Set("cancel close invalid load scroll toggle".split(" ").concat(fi));function ta(e,t,r){var i=e.type||"unknown-event";e.currentTarget=r,Vh(i,t,void 0,e),e.currentTarget=null}function qc(e,t){t=(t&4)!==0;for(var r=0;r<e.length;r++){var i=e[r],c=i.event;i=i.listeners;e:{var h=void 0;if(t)for(var g=i.length-1;0<=g;g--){var n=i[g],u=n.instance,f=n.currentTarget;if(n=n.listener,u!==h&&c.isPropagationStopped())break e;ta(c,n,f),h=u}else for(g=0;g<i.length;g++){if(n=i[g],u=n.instance,f=n.currentTarget,n=n.listener,u!==h&&c.isPropagationStopped())break e;ta(c,n,f),h=u}}}if(ws)throw e=eo,ws=!1,eo=null,e}function ge(e,t){var r=t[uo];r===void 0&&(r=t[uo]=new Set);var i=e+"__bubble";r.has(i)||(Gc(t,e,2,!1),r.add(i))}function wn(e,t,r){var i=0;t&&(i|=4),Gc(r,e,i,t)}var es="_reactListening"+Math.random().toString(36).slice(2);function Bi(e){if(!e[es]){e[es]=!0,tc.forEach(function(r){r!=="selectionchange"&&(qd.has(r)||wn(r,!1,e),wn(r,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[es]||(t[es]=!0,wn("selectionchange",!1,t))}}function Gc(e,t,r,i){switch(Bc(t)){case 1:var c=ld;break;case 4:c=ad;break;default:c=qo}r=c.bind(null,t,r,e),c=void 0,!Zn||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(c=!0),i?c!==void 0?e.addEventListener(t,r,{capture:!0,passive:c}):e.addEventListener(t,r,!0):c!==void 0?e.addEventListener(t,r,{passive:c}):e.addEventListener(t,r,!1)}function xn(e,t,r,i,c){var h=i;if(!(t&1)&&!(t&2)&&i!==null)e:for(;;){if(i===null)return;var g=i.tag;if(g===3||g===4){var n=i.stateNode.containerInfo;if(n===c||n.nodeType===8&&n.parentNode===c)break;if(g===4)for(g=i.return;g!==null;){var u=g.tag;if((u===3||u===4)&&(u=g.stateNode.containerInfo,u===c||u.nodeType===8&&u.parentNode===c))return;g=g.return}for(;n!==null;){if(g=ar(n),g===null)return;if(u=g.tag,u===5||u===6){i=h=g;continue e}n=n.parentNode}}i=i.return}vc(function(){var f=h,y=Uo(r),d=[];e:{var _=Kc.get(e);if(_!==void 0){var S=Xo,w=e;switch(e){case"keypress":if(ds(r)===0)break e;case"keydown":case"keyup":S=xd;break;case"focusin":w="focus",S=gn;break;case"focusout":w="blur",S=gn;break;case"beforeblur":case"afterblur":S=gn;break;case"click":if(r.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":S=Ul;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":S=hd;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":S=Ed;break;case Wc:case Uc:case $c:S=pd;break;case Vc:S=Dd;break;case"scroll":S=cd;break;case"wheel":S=Td;break;case"copy":case"cut":case"paste":S=gd;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":S=Vl}var C=(t&4)!==0,a=!C&&e==="scroll",l=C?_!==null?_+"Capture":null:_;C=[];for(var s=f,o;s!==null;){o=s;var p=o.stateNode;if(o.tag===5&&p!==null&&(o=p,l!==null&&(p=ki(s,l),p!=null&&C.push(Ai(s,p,o)))),a)break;s=s.return}0<C.length&&(_=new S(_,w,null,r,y),d.push({event:_,listeners:C}))}}if(!(t&7)){e:{if(_=e==="mouseover"||e==="pointerover",S=e==="mouseout"||e==="pointerout",_&&r!==Qn&&(w=r.relatedTarget||r.fromElement)&&(ar(w)||w[Mt]))break e;if((S||_)&&(_=y.window===y?y:(_=y.ownerDocument)?_.defaultView||_.parentWindow:window,S?(w=r.relatedTarget||r.toElement,S=f,w=w?ar(w):null,w!==null&&(a=yr(w),w!==a||w.tag!==5&&w.tag!==6)&&(w=null)):(S=null,w=f),S!==w)){if(C=Ul,p="onMouseLeave",l="onMouseEnter",s="mouse",(e==="pointerout"||e==="pointerover")&&(C=Vl,p="onPointerLeave",l="onPointerEnter",s="pointer"),a=S==null?_:Dr(S),o=w==null?_:Dr(w),_=new C(p,s+"leave",S,r,y),_.target=a,_.relatedTarget=o,p=null,ar(y)===f&&(C=new C(l,s+"enter",w,r,y),C.target=o,C.relatedTarget=a,p=C),a=p,S&&w)t:{for(C=S,l=w,s=0,o=C;o;o=wr(o))s++;for(o=0,p=l;p;p=wr(p))o++;for(;0<s-o;)C=wr(C),s--;for(;0<o-s;)l=wr(l),o--;for(;s--;){if(C===l||l!==null&&C===l.alternate)break t;C=wr(C),l=wr(l)}C=null}else C=null;S!==null&&ra(d,_,S,C,!1),w!==null&&a!==null&&ra(d,a,w,C,!0)}}e:{if(_=f?Dr(f):window,S=_.nodeName&&_.nodeName.toLowerCase(),S==="select"||S==="input"&&_.type==="file")var m=jd;else if(Gl(_))if(jc)m=Nd;else{m=Fd;var x=Hd}else(S=_.nodeName)&&S.toLowerCase()==="input"&&(_.type==="checkbox"||_.type==="radio")&&(m=zd);if(m&&(m=m(e,f))){Oc(d,m,r,y);break e}x&&x(e,_,f),e==="focusout"&&(x=_._wrapperState)&&x.controlled&&_.type==="number"&&Kn(_,"number",_.value)}switch(x=f?Dr(f):window,e){case"focusin":(Gl(x)||x.contentEditable==="true")&&(Er=x,so=f,mi=null);break;case"focusout":mi=so=Er=null;break;case"mousedown":no=!0;break;case"contextmenu":case"mouseup":case"dragend":no=!1,Zl(d,r,y);break;case"selectionchange":if($d)break;case"keydown":case"keyup":Zl(d,r,y)}var E;if(Qo)e:{switch(e){case"compositionstart":var v="onCompositionStart";break e;case"compositionend":v="onCompositionEnd";break e;case"compositionupdate":v="onCompositionUpdate";break e}v=void 0}else kr?Pc(e,r)&&(v="onCompositionEnd"):e==="keydown"&&r.keyCode===229&&(v="onCompositionStart");v&&(Mc&&r.locale!=="ko"&&(kr||v!=="onCompositionStart"?v==="onCompositionEnd"&&kr&&(E=Ac()):(Ut=y,Go="value"in Ut?Ut.value:Ut.textContent,kr=!0)),x=Ls(f,v),0<x.length&&(v=new $l(v,e,null,r,y),d.push({event:v,listeners:x}),E?v.data=E:(E=Ic(r),E!==null&&(v.data=E)))),(E=Ad?Md(e,r):Pd(e,r))&&(f=Ls(f,"onBeforeInput"),0<f.length&&(y=new $l("onBeforeInput","beforeinput",null,r,y),d.push({event:y,listeners:f}),y.data=E))}qc(d,t)})}function Ai(e,t,r){return{instance:e,listener:t,currentTarget:r}}function Ls(e,t){for(var r=t+"Capture",i=[];e!==null;){var c=e,h=c.stateNode;c.tag===5&&h!==null&&(c=h,h=ki(e,r),h!=null&&i.unshift(Ai(e,h,c)),h=ki(e,t),h!=null&&i.push(Ai(e,h,c))),e=e.return}return i}function wr(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function ra(e,t,r,i,c){for(var h=t._reactName,g=[];r!==null&&r!==i;){var n=r,u=n.alternate,f=n.stateNode;if(u!==null&&u===i)break;n.tag===5&&f!==null&&(n=f,c?(u=ki(r,h),u!=null&&g.unshift(Ai(r,u,n))):c||(u=ki(r,h),u!=null&&g.push(Ai(r,u,n)))),r=r.return}g.length!==0&&e.push({event:t,listeners:g})}var Gd=/\r\n?/g,Xd=/\u0000|\uFFFD/g;function ia(e){return(typeof e=="string"?e:""+e).replace(Gd,`
-`).replace(Xd,"")}function ts(e,t,r){if(t=ia(t),ia(e)!==t&&r)throw Error(V(425))}function Ds(){}var oo=null,lo=null;function ao(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var co=typeof setTimeout=="function"?setTimeout:void 0,Yd=typeof clearTimeout=="function"?clearTimeout:void 0,sa=typeof Promise=="function"?Promise:void 0,Qd=typeof queueMicrotask=="function"?queueMicrotask:typeof sa<"u"?function(e){return sa.resolve(null).then(e).catch(Jd)}:co;function Jd(e){setTimeout(function(){throw e})}function bn(e,t){var r=t,i=0;do{var c=r.nextSibling;if(e.removeChild(r),c&&c.nodeType===8)if(r=c.data,r==="/$"){if(i===0){e.removeChild(c),Di(t);return}i--}else r!=="$"&&r!=="$?"&&r!=="$!"||i++;r=c}while(r);Di(t)}function Gt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function na(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var r=e.data;if(r==="$"||r==="$!"||r==="$?"){if(t===0)return e;t--}else r==="/$"&&t++}e=e.previousSibling}return null}var Qr=Math.random().toString(36).slice(2),xt="__reactFiber$"+Qr,Mi="__reactProps$"+Qr,Mt="__reactContainer$"+Qr,uo="__reactEvents$"+Qr,Zd="__reactListeners$"+Qr,ef="__reactHandles$"+Qr;function ar(e){var t=e[xt];if(t)return t;for(var r=e.parentNode;r;){if(t=r[Mt]||r[xt]){if(r=t.alternate,t.child!==null||r!==null&&r.child!==null)for(e=na(e);e!==null;){if(r=e[xt])return r;e=na(e)}return t}e=r,r=e.parentNode}return null}function Ui(e){return e=e[xt]||e[Mt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Dr(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(V(33))}function Xs(e){return e[Mi]||null}var ho=[],Rr=-1;function rr(e){return{current:e}}function ve(e){0>Rr||(e.current=ho[Rr],ho[Rr]=null,Rr--)}function fe(e,t){Rr++,ho[Rr]=e.current,e.current=t}var er={},ze=rr(er),Ge=rr(!1),fr=er;function Wr(e,t){var r=e.type.contextTypes;if(!r)return er;var i=e.stateNode;if(i&&i.__reactInternalMemoizedUnmaskedChildContext===t)return i.__reactInternalMemoizedMaskedChildContext;var c={},h;for(h in r)c[h]=t[h];return i&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=c),c}function Xe(e){return e=e.childContextTypes,e!=null}function Rs(){ve(Ge),ve(ze)}function oa(e,t,r){if(ze.current!==er)throw Error(V(168));fe(ze,t),fe(Ge,r)}function Xc(e,t,r){var i=e.stateNode;if(t=t.childContextTypes,typeof i.getChildContext!="function")return r;i=i.getChildContext();for(var c in i)if(!(c in t))throw Error(V(108,Hh(e)||"Unknown",c));return Ce({},r,i)}function Ts(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||er,fr=ze.current,fe(ze,e),fe(Ge,Ge.current),!0}function la(e,t,r){var i=e.stateNode;if(!i)throw Error(V(169));r?(e=Xc(e,t,fr),i.__reactInternalMemoizedMergedChildContext=e,ve(Ge),ve(ze),fe(ze,e)):ve(Ge),fe(Ge,r)}var Lt=null,Ys=!1,kn=!1;function Yc(e){Lt===null?Lt=[e]:Lt.push(e)}function tf(e){Ys=!0,Yc(e)}function ir(){if(!kn&&Lt!==null){kn=!0;var e=0,t=he;try{var r=Lt;for(he=1;e<r.length;e++){var i=r[e];do i=i(!0);while(i!==null)}Lt=null,Ys=!1}catch(c){throw Lt!==null&&(Lt=Lt.slice(e+1)),Cc($o,ir),c}finally{he=t,kn=!1}}return null}var Tr=[],Br=0,Bs=null,As=0,ot=[],lt=0,pr=null,Rt=1,Tt="";function or(e,t){Tr[Br++]=As,Tr[Br++]=Bs,Bs=e,As=t}function Qc(e,t,r){ot[lt++]=Rt,ot[lt++]=Tt,ot[lt++]=pr,pr=e;var i=Rt;e=Tt;var c=32-vt(i)-1;i&=~(1<<c),r+=1;var h=32-vt(t)+c;if(30<h){var g=c-c%5;h=(i&(1<<g)-1).toString(32),i>>=g,c-=g,Rt=1<<32-vt(t)+c|r<<c|i,Tt=h+e}else Rt=1<<h|r<<c|i,Tt=e}function Zo(e){e.return!==null&&(or(e,1),Qc(e,1,0))}function el(e){for(;e===Bs;)Bs=Tr[--Br],Tr[Br]=null,As=Tr[--Br],Tr[Br]=null;for(;e===pr;)pr=ot[--lt],ot[lt]=null,Tt=ot[--lt],ot[lt]=null,Rt=ot[--lt],ot[lt]=null}var rt=null,tt=null,me=!1,gt=null;function Jc(e,t){var r=at(5,null,null,0);r.elementType="DELETED",r.stateNode=t,r.return=e,t=e.deletions,t===null?(e.deletions=[r],e.flags|=16):t.push(r)}function aa(e,t){switch(e.tag){case 5:var r=e.type;return t=t.nodeType!==1||r.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,rt=e,tt=Gt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,rt=e,tt=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(r=pr!==null?{id:Rt,overflow:Tt}:null,e.memoizedState={dehydrated:t,treeContext:r,retryLane:1073741824},r=at(18,null,null,0),r.stateNode=t,r.return=e,e.child=r,rt=e,tt=null,!0):!1;default:return!1}}function fo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function po(e){if(me){var t=tt;if(t){var r=t;if(!aa(e,t)){if(fo(e))throw Error(V(418));t=Gt(r.nextSibling);var i=rt;t&&aa(e,t)?Jc(i,r):(e.flags=e.flags&-4097|2,me=!1,rt=e)}}else{if(fo(e))throw Error(V(418));e.flags=e.flags&-4097|2,me=!1,rt=e}}}function ca(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;rt=e}function rs(e){if(e!==rt)return!1;if(!me)return ca(e),me=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!ao(e.type,e.memoizedProps)),t&&(t=tt)){if(fo(e))throw Zc(),Error(V(418));for(;t;)Jc(e,t),t=Gt(t.nextSibling)}if(ca(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(V(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var r=e.data;if(r==="/$"){if(t===0){tt=Gt(e.nextSibling);break e}t--}else r!=="$"&&r!=="$!"&&r!=="$?"||t++}e=e.nextSibling}tt=null}}else tt=rt?Gt(e.stateNode.nextSibling):null;return!0}function Zc(){for(var e=tt;e;)e=Gt(e.nextSibling)}function Ur(){tt=rt=null,me=!1}function tl(e){gt===null?gt=[e]:gt.push(e)}var rf=Ot.ReactCurrentBatchConfig;function oi(e,t,r){if(e=r.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(r._owner){if(r=r._owner,r){if(r.tag!==1)throw Error(V(309));var i=r.stateNode}if(!i)throw Error(V(147,e));var c=i,h=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===h?t.ref:(t=function(g){var n=c.refs;g===null?delete n[h]:n[h]=g},t._stringRef=h,t)}if(typeof e!="string")throw Error(V(284));if(!r._owner)throw Error(V(290,e))}return e}function is(e,t){throw e=Object.prototype.toString.call(t),Error(V(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ua(e){var t=e._init;return t(e._payload)}function eu(e){function t(l,s){if(e){var o=l.deletions;o===null?(l.deletions=[s],l.flags|=16):o.push(s)}}function r(l,s){if(!e)return null;for(;s!==null;)t(l,s),s=s.sibling;return null}function i(l,s){for(l=new Map;s!==null;)s.key!==null?l.set(s.key,s):l.set(s.index,s),s=s.sibling;return l}function c(l,s){return l=Jt(l,s),l.index=0,l.sibling=null,l}function h(l,s,o){return l.index=o,e?(o=l.alternate,o!==null?(o=o.index,o<s?(l.flags|=2,s):o):(l.flags|=2,s)):(l.flags|=1048576,s)}function g(l){return e&&l.alternate===null&&(l.flags|=2),l}function n(l,s,o,p){return s===null||s.tag!==6?(s=An(o,l.mode,p),s.return=l,s):(s=c(s,o),s.return=l,s)}function u(l,s,o,p){var m=o.type;return m===br?y(l,s,o.props.children,p,o.key):s!==null&&(s.elementType===m||typeof m=="object"&&m!==null&&m.$$typeof===Ft&&ua(m)===s.type)?(p=c(s,o.props),p.ref=oi(l,s,o),p.return=l,p):(p=ys(o.type,o.key,o.props,null,l.mode,p),p.ref=oi(l,s,o),p.return=l,p)}function f(l,s,o,p){return s===null||s.tag!==4||s.stateNode.containerInfo!==o.containerInfo||s.stateNode.implementation!==o.implementation?(s=Mn(o,l.mode,p),s.return=l,s):(s=c(s,o.children||[]),s.return=l,s)}function y(l,s,o,p,m){return s===null||s.tag!==7?(s=dr(o,l.mode,p,m),s.return=l,s):(s=c(s,o),s.return=l,s)}function d(l,s,o){if(typeof s=="string"&&s!==""||typeof s=="number")return s=An(""+s,l.mode,o),s.return=l,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Ki:return o=ys(s.type,s.key,s.props,null,l.mode,o),o.ref=oi(l,null,s),o.return=l,o;case xr:return s=Mn(s,l.mode,o),s.return=l,s;case Ft:var p=s._init;return d(l,p(s._payload),o)}if(hi(s)||ti(s))return s=dr(s,l.mode,o,null),s.return=l,s;is(l,s)}return null}function _(l,s,o,p){var m=s!==null?s.key:null;if(typeof o=="string"&&o!==""||typeof o=="number")return m!==null?null:n(l,s,""+o,p);if(typeof o=="object"&&o!==null){switch(o.$$typeof){case Ki:return o.key===m?u(l,s,o,p):null;case xr:return o.key===m?f(l,s,o,p):null;case Ft:return m=o._init,_(l,s,m(o._payload),p)}if(hi(o)||ti(o))return m!==null?null:y(l,s,o,p,null);is(l,o)}return null}function S(l,s,o,p,m){if(typeof p=="string"&&p!==""||typeof p=="number")return l=l.get(o)||null,n(s,l,""+p,m);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case Ki:return l=l.get(p.key===null?o:p.key)||null,u(s,l,p,m);case xr:return l=l.get(p.key===null?o:p.key)||null,f(s,l,p,m);case Ft:var x=p._init;return S(l,s,o,x(p._payload),m)}if(hi(p)||ti(p))return l=l.get(o)||null,y(s,l,p,m,null);is(s,p)}return null}function w(l,s,o,p){for(var m=null,x=null,E=s,v=s=0,k=null;E!==null&&v<o.length;v++){E.index>v?(k=E,E=null):k=E.sibling;var T=_(l,E,o[v],p);if(T===null){E===null&&(E=k);break}e&&E&&T.alternate===null&&t(l,E),s=h(T,s,v),x===null?m=T:x.sibling=T,x=T,E=k}if(v===o.length)return r(l,E),me&&or(l,v),m;if(E===null){for(;v<o.length;v++)E=d(l,o[v],p),E!==null&&(s=h(E,s,v),x===null?m=E:x.sibling=E,x=E);return me&&or(l,v),m}for(E=i(l,E);v<o.length;v++)k=S(E,l,v,o[v],p),k!==null&&(e&&k.alternate!==null&&E.delete(k.key===null?v:k.key),s=h(k,s,v),x===null?m=k:x.sibling=k,x=k);return e&&E.forEach(function(P){return t(l,P)}),me&&or(l,v),m}function C(l,s,o,p){var m=ti(o);if(typeof m!="function")throw Error(V(150));if(o=m.call(o),o==null)throw Error(V(151));for(var x=m=null,E=s,v=s=0,k=null,T=o.next();E!==null&&!T.done;v++,T=o.next()){E.index>v?(k=E,E=null):k=E.sibling;var P=_(l,E,T.value,p);if(P===null){E===null&&(E=k);break}e&&E&&P.alternate===null&&t(l,E),s=h(P,s,v),x===null?m=P:x.sibling=P,x=P,E=k}if(T.done)return r(l,E),me&&or(l,v),m;if(E===null){for(;!T.done;v++,T=o.next())T=d(l,T.value,p),T!==null&&(s=h(T,s,v),x===null?m=T:x.sibling=T,x=T);return me&&or(l,v),m}for(E=i(l,E);!T.done;v++,T=o.next())T=S(E,l,v,T.value,p),T!==null&&(e&&T.alternate!==null&&E.delete(T.key===null?v:T.key),s=h(T,s,v),x===null?m=T:x.sibling=T,x=T);return e&&E.forEach(function(B){return t(l,B)}),me&&or(l,v),m}function a(l,s,o,p){if(typeof o=="object"&&o!==null&&o.type===br&&o.key===null&&(o=o.props.children),typeof o=="object"&&o!==null){switch(o.$$typeof){case Ki:e:{for(var m=o.key,x=s;x!==null;){if(x.key===m){if(m=o.type,m===br){if(x.tag===7){r(l,x.sibling),s=c(x,o.props.children),s.return=l,l=s;break e}}else if(x.elementType===m||typeof m=="object"&&m!==null&&m.$$typeof===Ft&&ua(m)===x.type){r(l,x.sibling),s=c(x,o.props),s.ref=oi(l,x,o),s.return=l,l=s;break e}r(l,x);break}else t(l,x);x=x.sibling}o.type===br?(s=dr(o.props.children,l.mode,p,o.key),s.return=l,l=s):(p=ys(o.type,o.key,o.props,null,l.mode,p),p.ref=oi(l,s,o),p.return=l,l=p)}return g(l);case xr:e:{for(x=o.key;s!==null;){if(s.key===x)if(s.tag===4&&s.stateNode.containerInfo===o.containerInfo&&s.stateNode.implementation===o.implementation){r(l,s.sibling),s=c(s,o.children||[]),s.return=l,l=s;break e}else{r(l,s);break}else t(l,s);s=s.sibling}s=Mn(o,l.mode,p),s.return=l,l=s}return g(l);case Ft:return x=o._init,a(l,s,x(o._payload),p)}if(hi(o))return w(l,s,o,p);if(ti(o))return C(l,s,o,p);is(l,o)}return typeof o=="string"&&o!==""||typeof o=="number"?(o=""+o,s!==null&&s.tag===6?(r(l,s.sibling),s=c(s,o),s.return=l,l=s):(r(l,s),s=An(o,l.mode,p),s.return=l,l=s),g(l)):r(l,s)}return a}var $r=eu(!0),tu=eu(!1),Ms=rr(null),Ps=null,Ar=null,rl=null;function il(){rl=Ar=Ps=null}function sl(e){var t=Ms.current;ve(Ms),e._currentValue=t}function _o(e,t,r){for(;e!==null;){var i=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,i!==null&&(i.childLanes|=t)):i!==null&&(i.childLanes&t)!==t&&(i.childLanes|=t),e===r)break;e=e.return}}function Fr(e,t){Ps=e,rl=Ar=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(qe=!0),e.firstContext=null)}function ut(e){var t=e._currentValue;if(rl!==e)if(e={context:e,memoizedValue:t,next:null},Ar===null){if(Ps===null)throw Error(V(308));Ar=e,Ps.dependencies={lanes:0,firstContext:e}}else Ar=Ar.next=e;return t}var cr=null;function nl(e){cr===null?cr=[e]:cr.push(e)}function ru(e,t,r,i){var c=t.interleaved;return c===null?(r.next=r,nl(t)):(r.next=c.next,c.next=r),t.interleaved=r,Pt(e,i)}function Pt(e,t){e.lanes|=t;var r=e.alternate;for(r!==null&&(r.lanes|=t),r=e,e=e.return;e!==null;)e.childLanes|=t,r=e.alternate,r!==null&&(r.childLanes|=t),r=e,e=e.return;return r.tag===3?r.stateNode:null}var zt=!1;function ol(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function iu(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Bt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Xt(e,t,r){var i=e.updateQueue;if(i===null)return null;if(i=i.shared,ne&2){var c=i.pending;return c===null?t.next=t:(t.next=c.next,c.next=t),i.pending=t,Pt(e,r)}return c=i.interleaved,c===null?(t.next=t,nl(i)):(t.next=c.next,c.next=t),i.interleaved=t,Pt(e,r)}function fs(e,t,r){if(t=t.updateQueue,t!==null&&(t=t.shared,(r&4194240)!==0)){var i=t.lanes;i&=e.pendingLanes,r|=i,t.lanes=r,Vo(e,r)}}function ha(e,t){var r=e.updateQueue,i=e.alternate;if(i!==null&&(i=i.updateQueue,r===i)){var c=null,h=null;if(r=r.firstBaseUpdate,r!==null){do{var g={eventTime:r.eventTime,lane:r.lane,tag:r.tag,payload:r.payload,callback:r.callback,next:null};h===null?c=h=g:h=h.next=g,r=r.next}while(r!==null);h===null?c=h=t:h=h.next=t}else c=h=t;r={baseState:i.baseState,firstBaseUpdate:c,lastBaseUpdate:h,shared:i.shared,effects:i.effects},e.updateQueue=r;return}e=r.lastBaseUpdate,e===null?r.firstBaseUpdate=t:e.next=t,r.lastBaseUpdate=t}function Is(e,t,r,i){var c=e.updateQueue;zt=!1;var h=c.firstBaseUpdate,g=c.lastBaseUpdate,n=c.shared.pending;if(n!==null){c.shared.pending=null;var u=n,f=u.next;u.next=null,g===null?h=f:g.next=f,g=u;var y=e.alternate;y!==null&&(y=y.updateQueue,n=y.lastBaseUpdate,n!==g&&(n===null?y.firstBaseUpdate=f:n.next=f,y.lastBaseUpdate=u))}if(h!==null){var d=c.baseState;g=0,y=f=u=null,n=h;do{var _=n.lane,S=n.eventTime;if((i&_)===_){y!==null&&(y=y.next={eventTime:S,lane:0,tag:n.tag,payload:n.payload,callback:n.callback,next:null});e:{var w=e,C=n;switch(_=t,S=r,C.tag){case 1:if(w=C.payload,typeof w=="function"){d=w.call(S,d,_);break e}d=w;break e;case 3:w.flags=w.flags&-65537|128;case 0:if(w=C.payload,_=typeof w=="function"?w.call(S,d,_):w,_==null)break e;d=Ce({},d,_);break e;case 2:zt=!0}}n.callback!==null&&n.lane!==0&&(e.flags|=64,_=c.effects,_===null?c.effects=[n]:_.push(n))}else S={eventTime:S,lane:_,tag:n.tag,payload:n.payload,callback:n.callback,next:null},y===null?(f=y=S,u=d):y=y.next=S,g|=_;if(n=n.next,n===null){if(n=c.shared.pending,n===null)break;_=n,n=_.next,_.next=null,c.lastBaseUpdate=_,c.shared.pending=null}}while(!0);if(y===null&&(u=d),c.baseState=u,c.firstBaseUpdate=f,c.lastBaseUpdate=y,t=c.shared.interleaved,t!==null){c=t;do g|=c.lane,c=c.next;while(c!==t)}else h===null&&(c.shared.lanes=0);gr|=g,e.lanes=g,e.memoizedState=d}}function da(e,t,r){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var i=e[t],c=i.callback;if(c!==null){if(i.callback=null,i=r,typeof c!="function")throw Error(V(191,c));c.call(i)}}}var $i={},kt=rr($i),Pi=rr($i),Ii=rr($i);function ur(e){if(e===$i)throw Error(V(174));return e}function ll(e,t){switch(fe(Ii,t),fe(Pi,e),fe(kt,$i),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:Gn(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=Gn(t,e)}ve(kt),fe(kt,t)}function Vr(){ve(kt),ve(Pi),ve(Ii)}function su(e){ur(Ii.current);var t=ur(kt.current),r=Gn(t,e.type);t!==r&&(fe(Pi,e),fe(kt,r))}function al(e){Pi.current===e&&(ve(kt),ve(Pi))}var ye=rr(0);function Os(e){for(var t=e;t!==null;){if(t.tag===13){var r=t.memoizedState;if(r!==null&&(r=r.dehydrated,r===null||r.data==="$?"||r.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var En=[];function cl(){for(var e=0;e<En.length;e++)En[e]._workInProgressVersionPrimary=null;En.length=0}var ps=Ot.ReactCurrentDispatcher,Ln=Ot.ReactCurrentBatchConfig,_r=0,Se=null,Le=null,Ae=null,js=!1,yi=!1,Oi=0,sf=0;function je(){throw Error(V(321))}function ul(e,t){if(t===null)return!1;for(var r=0;r<t.length&&r<e.length;r++)if(!yt(e[r],t[r]))return!1;return!0}function hl(e,t,r,i,c,h){if(_r=h,Se=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,ps.current=e===null||e.memoizedState===null?af:cf,e=r(i,c),yi){h=0;do{if(yi=!1,Oi=0,25<=h)throw Error(V(301));h+=1,Ae=Le=null,t.updateQueue=null,ps.current=uf,e=r(i,c)}while(yi)}if(ps.current=Hs,t=Le!==null&&Le.next!==null,_r=0,Ae=Le=Se=null,js=!1,t)throw Error(V(300));return e}function dl(){var e=Oi!==0;return Oi=0,e}function wt(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ae===null?Se.memoizedState=Ae=e:Ae=Ae.next=e,Ae}function ht(){if(Le===null){var e=Se.alternate;e=e!==null?e.memoizedState:null}else e=Le.next;var t=Ae===null?Se.memoizedState:Ae.next;if(t!==null)Ae=t,Le=e;else{if(e===null)throw Error(V(310));Le=e,e={memoizedState:Le.memoizedState,baseState:Le.baseState,baseQueue:Le.baseQueue,queue:Le.queue,next:null},Ae===null?Se.memoizedState=Ae=e:Ae=Ae.next=e}return Ae}function ji(e,t){return typeof t=="function"?t(e):t}function Dn(e){var t=ht(),r=t.queue;if(r===null)throw Error(V(311));r.lastRenderedReducer=e;var i=Le,c=i.baseQueue,h=r.pending;if(h!==null){if(c!==null){var g=c.next;c.next=h.next,h.next=g}i.baseQueue=c=h,r.pending=null}if(c!==null){h=c.next,i=i.baseState;var n=g=null,u=null,f=h;do{var y=f.lane;if((_r&y)===y)u!==null&&(u=u.next={lane:0,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null}),i=f.hasEagerState?f.eagerState:e(i,f.action);else{var d={lane:y,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null};u===null?(n=u=d,g=i):u=u.next=d,Se.lanes|=y,gr|=y}f=f.next}while(f!==null&&f!==h);u===null?g=i:u.next=n,yt(i,t.memoizedState)||(qe=!0),t.memoizedState=i,t.baseState=g,t.baseQueue=u,r.lastRenderedState=i}if(e=r.interleaved,e!==null){c=e;do h=c.lane,Se.lanes|=h,gr|=h,c=c.next;while(c!==e)}else c===null&&(r.lanes=0);return[t.memoizedState,r.dispatch]}function Rn(e){var t=ht(),r=t.queue;if(r===null)throw Error(V(311));r.lastRenderedReducer=e;var i=r.dispatch,c=r.pending,h=t.memoizedState;if(c!==null){r.pending=null;var g=c=c.next;do h=e(h,g.action),g=g.next;while(g!==c);yt(h,t.memoizedState)||(qe=!0),t.memoizedState=h,t.baseQueue===null&&(t.baseState=h),r.lastRenderedState=h}return[h,i]}function nu(){}function ou(e,t){var r=Se,i=ht(),c=t(),h=!yt(i.memoizedState,c);if(h&&(i.memoizedState=c,qe=!0),i=i.queue,fl(cu.bind(null,r,i,e),[e]),i.getSnapshot!==t||h||Ae!==null&&Ae.memoizedState.tag&1){if(r.flags|=2048,Hi(9,au.bind(null,r,i,c,t),void 0,null),Me===null)throw Error(V(349));_r&30||lu(r,t,c)}return c}function lu(e,t,r){e.flags|=16384,e={getSnapshot:t,value:r},t=Se.updateQueue,t===null?(t={lastEffect:null,stores:null},Se.updateQueue=t,t.stores=[e]):(r=t.stores,r===null?t.stores=[e]:r.push(e))}function au(e,t,r,i){t.value=r,t.getSnapshot=i,uu(t)&&hu(e)}function cu(e,t,r){return r(function(){uu(t)&&hu(e)})}function uu(e){var t=e.getSnapshot;e=e.value;try{var r=t();return!yt(e,r)}catch{return!0}}function hu(e){var t=Pt(e,1);t!==null&&mt(t,e,1,-1)}function fa(e){var t=wt();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:ji,lastRenderedState:e},t.queue=e,e=e.dispatch=lf.bind(null,Se,e),[t.memoizedState,e]}function Hi(e,t,r,i){return e={tag:e,create:t,destroy:r,deps:i,next:null},t=Se.updateQueue,t===null?(t={lastEffect:null,stores:null},Se.updateQueue=t,t.lastEffect=e.next=e):(r=t.lastEffect,r===null?t.lastEffect=e.next=e:(i=r.next,r.next=e,e.next=i,t.lastEffect=e)),e}function du(){return ht().memoizedState}function _s(e,t,r,i){var c=wt();Se.flags|=e,c.memoizedState=Hi(1|t,r,void 0,i===void 0?null:i)}function Qs(e,t,r,i){var c=ht();i=i===void 0?null:i;var h=void 0;if(Le!==null){var g=Le.memoizedState;if(h=g.destroy,i!==null&&ul(i,g.deps)){c.memoizedState=Hi(t,r,h,i);return}}Se.flags|=e,c.memoizedState=Hi(1|t,r,h,i)}function pa(e,t){return _s(8390656,8,e,t)}function fl(e,t){return Qs(2048,8,e,t)}function fu(e,t){return Qs(4,2,e,t)}function pu(e,t){return Qs(4,4,e,t)}function _u(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function gu(e,t,r){return r=r!=null?r.concat([e]):null,Qs(4,4,_u.bind(null,t,e),r)}function pl(){}function vu(e,t){var r=ht();t=t===void 0?null:t;var i=r.memoizedState;return i!==null&&t!==null&&ul(t,i[1])?i[0]:(r.memoizedState=[e,t],e)}function mu(e,t){var r=ht();t=t===void 0?null:t;var i=r.memoizedState;return i!==null&&t!==null&&ul(t,i[1])?i[0]:(e=e(),r.memoizedState=[e,t],e)}function yu(e,t,r){return _r&21?(yt(r,t)||(r=bc(),Se.lanes|=r,gr|=r,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,qe=!0),e.memoizedState=r)}function nf(e,t){var r=he;he=r!==0&&4>r?r:4,e(!0);var i=Ln.transition;Ln.transition={};try{e(!1),t()}finally{he=r,Ln.transition=i}}function Su(){return ht().memoizedState}function of(e,t,r){var i=Qt(e);if(r={lane:i,action:r,hasEagerState:!1,eagerState:null,next:null},Cu(e))wu(t,r);else if(r=ru(e,t,r,i),r!==null){var c=We();mt(r,e,i,c),xu(r,t,i)}}function lf(e,t,r){var i=Qt(e),c={lane:i,action:r,hasEagerState:!1,eagerState:null,next:null};if(Cu(e))wu(t,c);else{var h=e.alternate;if(e.lanes===0&&(h===null||h.lanes===0)&&(h=t.lastRenderedReducer,h!==null))try{var g=t.lastRenderedState,n=h(g,r);if(c.hasEagerState=!0,c.eagerState=n,yt(n,g)){var u=t.interleaved;u===null?(c.next=c,nl(t)):(c.next=u.next,u.next=c),t.interleaved=c;return}}catch{}finally{}r=ru(e,t,c,i),r!==null&&(c=We(),mt(r,e,i,c),xu(r,t,i))}}function Cu(e){var t=e.alternate;return e===Se||t!==null&&t===Se}function wu(e,t){yi=js=!0;var r=e.pending;r===null?t.next=t:(t.next=r.next,r.next=t),e.pending=t}function xu(e,t,r){if(r&4194240){var i=t.lanes;i&=e.pendingLanes,r|=i,t.lanes=r,Vo(e,r)}}var Hs={readContext:ut,useCallback:je,useContext:je,useEffect:je,useImperativeHandle:je,useInsertionEffect:je,useLayoutEffect:je,useMemo:je,useReducer:je,useRef:je,useState:je,useDebugValue:je,useDeferredValue:je,useTransition:je,useMutableSource:je,useSyncExternalStore:je,useId:je,unstable_isNewReconciler:!1},af={readContext:ut,useCallback:function(e,t){return wt().memoizedState=[e,t===void 0?null:t],e},useContext:ut,useEffect:pa,useImperativeHandle:function(e,t,r){return r=r!=null?r.concat([e]):null,_s(4194308,4,_u.bind(null,t,e),r)},useLayoutEffect:function(e,t){return _s(4194308,4,e,t)},useInsertionEffect:function(e,t){return _s(4,2,e,t)},useMemo:function(e,t){var r=wt();return t=t===void 0?null:t,e=e(),r.memoizedState=[e,t],e},useReducer:function(e,t,r){var i=wt();return t=r!==void 0?r(t):t,i.memoizedState=i.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},i.queue=e,e=e.dispatch=of.bind(null,Se,e),[i.memoizedState,e]},useRef:function(e){var t=wt();return e={current:e},t.memoizedState=e},useState:fa,useDebugValue:pl,useDeferredValue:function(e){return wt().memoizedState=e},useTransition:function(){var e=fa(!1),t=e[0];return e=nf.bind(null,e[1]),wt().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,r){var i=Se,c=wt();if(me){if(r===void 0)throw Error(V(407));r=r()}else{if(r=t(),Me===null)throw Error(V(349));_r&30||lu(i,t,r)}c.memoizedState=r;var h={value:r,getSnapshot:t};return c.queue=h,pa(cu.bind(null,i,h,e),[e]),i.flags|=2048,Hi(9,au.bind(null,i,h,r,t),void 0,null),r},useId:function(){var e=wt(),t=Me.identifierPrefix;if(me){var r=Tt,i=Rt;r=(i&~(1<<32-vt(i)-1)).toString(32)+r,t=":"+t+"R"+r,r=Oi++,0<r&&(t+="H"+r.toString(32)),t+=":"}else r=sf++,t=":"+t+"r"+r.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},cf={readContext:ut,useCallback:vu,useContext:ut,useEffect:fl,useImperativeHandle:gu,useInsertionEffect:fu,useLayoutEffect:pu,useMemo:mu,useReducer:Dn,useRef:du,useState:function(){return Dn(ji)},useDebugValue:pl,useDeferredValue:function(e){var t=ht();return yu(t,Le.memoizedState,e)},useTransition:function(){var e=Dn(ji)[0],t=ht().memoizedState;return[e,t]},useMutableSource:nu,useSyncExternalStore:ou,useId:Su,unstable_isNewReconciler:!1},uf={readContext:ut,useCallback:vu,useContext:ut,useEffect:fl,useImperativeHandle:gu,useInsertionEffect:fu,useLayoutEffect:pu,useMemo:mu,useReducer:Rn,useRef:du,useState:function(){return Rn(ji)},useDebugValue:pl,useDeferredValue:function(e){var t=ht();return Le===null?t.memoizedState=e:yu(t,Le.memoizedState,e)},useTransition:function(){var e=Rn(ji)[0],t=ht().memoizedState;return[e,t]},useMutableSource:nu,useSyncExternalStore:ou,useId:Su,unstable_isNewReconciler:!1};function pt(e,t){if(e&&e.defaultProps){t=Ce({},t),e=e.defaultProps;for(var r in e)t[r]===void 0&&(t[r]=e[r]);return t}return t}function go(e,t,r,i){t=e.memoizedState,r=r(i,t),r=r==null?t:Ce({},t,r),e.memoizedState=r,e.lanes===0&&(e.updateQueue.baseState=r)}var Js={isMounted:function(e){return(e=e._reactInternals)?yr(e)===e:!1},enqueueSetState:function(e,t,r){e=e._reactInternals;var i=We(),c=Qt(e),h=Bt(i,c);h.payload=t,r!=null&&(h.callback=r),t=Xt(e,h,c),t!==null&&(mt(t,e,c,i),fs(t,e,c))},enqueueReplaceState:function(e,t,r){e=e._reactInternals;var i=We(),c=Qt(e),h=Bt(i,c);h.tag=1,h.payload=t,r!=null&&(h.callback=r),t=Xt(e,h,c),t!==null&&(mt(t,e,c,i),fs(t,e,c))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var r=We(),i=Qt(e),c=Bt(r,i);c.tag=2,t!=null&&(c.callback=t),t=Xt(e,c,i),t!==null&&(mt(t,e,i,r),fs(t,e,i))}};function _a(e,t,r,i,c,h,g){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(i,h,g):t.prototype&&t.prototype.isPureReactComponent?!Ti(r,i)||!Ti(c,h):!0}function bu(e,t,r){var i=!1,c=er,h=t.contextType;return typeof h=="object"&&h!==null?h=ut(h):(c=Xe(t)?fr:ze.current,i=t.contextTypes,h=(i=i!=null)?Wr(e,c):er),t=new t(r,h),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Js,e.stateNode=t,t._reactInternals=e,i&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=c,e.__reactInternalMemoizedMaskedChildContext=h),t}function ga(e,t,r,i){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(r,i),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(r,i),t.state!==e&&Js.enqueueReplaceState(t,t.state,null)}function vo(e,t,r,i){var c=e.stateNode;c.props=r,c.state=e.memoizedState,c.refs={},ol(e);var h=t.contextType;typeof h=="object"&&h!==null?c.context=ut(h):(h=Xe(t)?fr:ze.current,c.context=Wr(e,h)),c.state=e.memoizedState,h=t.getDerivedStateFromProps,typeof h=="function"&&(go(e,t,h,r),c.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof c.getSnapshotBeforeUpdate=="function"||typeof c.UNSAFE_componentWillMount!="function"&&typeof c.componentWillMount!="function"||(t=c.state,typeof c.componentWillMount=="function"&&c.componentWillMount(),typeof c.UNSAFE_componentWillMount=="function"&&c.UNSAFE_componentWillMount(),t!==c.state&&Js.enqueueReplaceState(c,c.state,null),Is(e,r,c,i),c.state=e.memoizedState),typeof c.componentDidMount=="function"&&(e.flags|=4194308)}function Kr(e,t){try{var r="",i=t;do r+=jh(i),i=i.return;while(i);var c=r}catch(h){c=`
-Error generating stack: `+h.message+`
-`+h.stack}return{value:e,source:t,stack:c,digest:null}}function Tn(e,t,r){return{value:e,source:null,stack:r??null,digest:t??null}}function mo(e,t){try{console.error(t.value)}catch(r){setTimeout(function(){throw r})}}var hf=typeof WeakMap=="function"?WeakMap:Map;function ku(e,t,r){r=Bt(-1,r),r.tag=3,r.payload={element:null};var i=t.value;return r.callback=function(){zs||(zs=!0,Do=i),mo(e,t)},r}function Eu(e,t,r){r=Bt(-1,r),r.tag=3;var i=e.type.getDerivedStateFromError;if(typeof i=="function"){var c=t.value;r.payload=function(){return i(c)},r.callback=function(){mo(e,t)}}var h=e.stateNode;return h!==null&&typeof h.componentDidCatch=="function"&&(r.callback=function(){mo(e,t),typeof i!="function"&&(Yt===null?Yt=new Set([this]):Yt.add(this));var g=t.stack;this.componentDidCatch(t.value,{componentStack:g!==null?g:""})}),r}function va(e,t,r){var i=e.pingCache;if(i===null){i=e.pingCache=new hf;var c=new Set;i.set(t,c)}else c=i.get(t),c===void 0&&(c=new Set,i.set(t,c));c.has(r)||(c.add(r),e=kf.bind(null,e,t,r),t.then(e,e))}function ma(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function ya(e,t,r,i,c){return e.mode&1?(e.flags|=65536,e.lanes=c,e):(e===t?e.flags|=65536:(e.flags|=128,r.flags|=131072,r.flags&=-52805,r.tag===1&&(r.alternate===null?r.tag=17:(t=Bt(-1,1),t.tag=2,Xt(r,t,1))),r.lanes|=1),e)}var df=Ot.ReactCurrentOwner,qe=!1;function Ne(e,t,r,i){t.child=e===null?tu(t,null,r,i):$r(t,e.child,r,i)}function Sa(e,t,r,i,c){r=r.render;var h=t.ref;return Fr(t,c),i=hl(e,t,r,i,h,c),r=dl(),e!==null&&!qe?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~c,It(e,t,c)):(me&&r&&Zo(t),t.flags|=1,Ne(e,t,i,c),t.child)}function Ca(e,t,r,i,c){if(e===null){var h=r.type;return typeof h=="function"&&!wl(h)&&h.defaultProps===void 0&&r.compare===null&&r.defaultProps===void 0?(t.tag=15,t.type=h,Lu(e,t,h,i,c)):(e=ys(r.type,null,i,t,t.mode,c),e.ref=t.ref,e.return=t,t.child=e)}if(h=e.child,!(e.lanes&c)){var g=h.memoizedProps;if(r=r.compare,r=r!==null?r:Ti,r(g,i)&&e.ref===t.ref)return It(e,t,c)}return t.flags|=1,e=Jt(h,i),e.ref=t.ref,e.return=t,t.child=e}function Lu(e,t,r,i,c){if(e!==null){var h=e.memoizedProps;if(Ti(h,i)&&e.ref===t.ref)if(qe=!1,t.pendingProps=i=h,(e.lanes&c)!==0)e.flags&131072&&(qe=!0);else return t.lanes=e.lanes,It(e,t,c)}return yo(e,t,r,i,c)}function Du(e,t,r){var i=t.pendingProps,c=i.children,h=e!==null?e.memoizedState:null;if(i.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},fe(Pr,et),et|=r;else{if(!(r&1073741824))return e=h!==null?h.baseLanes|r:r,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,fe(Pr,et),et|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},i=h!==null?h.baseLanes:r,fe(Pr,et),et|=i}else h!==null?(i=h.baseLanes|r,t.memoizedState=null):i=r,fe(Pr,et),et|=i;return Ne(e,t,c,r),t.child}function Ru(e,t){var r=t.ref;(e===null&&r!==null||e!==null&&e.ref!==r)&&(t.flags|=512,t.flags|=2097152)}function yo(e,t,r,i,c){var h=Xe(r)?fr:ze.current;return h=Wr(t,h),Fr(t,c),r=hl(e,t,r,i,h,c),i=dl(),e!==null&&!qe?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~c,It(e,t,c)):(me&&i&&Zo(t),t.flags|=1,Ne(e,t,r,c),t.child)}function wa(e,t,r,i,c){if(Xe(r)){var h=!0;Ts(t)}else h=!1;if(Fr(t,c),t.stateNode===null)gs(e,t),bu(t,r,i),vo(t,r,i,c),i=!0;else if(e===null){var g=t.stateNode,n=t.memoizedProps;g.props=n;var u=g.context,f=r.contextType;typeof f=="object"&&f!==null?f=ut(f):(f=Xe(r)?fr:ze.current,f=Wr(t,f));var y=r.getDerivedStateFromProps,d=typeof y=="function"||typeof g.getSnapshotBeforeUpdate=="function";d||typeof g.UNSAFE_componentWillReceiveProps!="function"&&typeof g.componentWillReceiveProps!="function"||(n!==i||u!==f)&&ga(t,g,i,f),zt=!1;var _=t.memoizedState;g.state=_,Is(t,i,g,c),u=t.memoizedState,n!==i||_!==u||Ge.current||zt?(typeof y=="function"&&(go(t,r,y,i),u=t.memoizedState),(n=zt||_a(t,r,n,i,_,u,f))?(d||typeof g.UNSAFE_componentWillMount!="function"&&typeof g.componentWillMount!="function"||(typeof g.componentWillMount=="function"&&g.componentWillMount(),typeof g.UNSAFE_componentWillMount=="function"&&g.UNSAFE_componentWillMount()),typeof g.componentDidMount=="function"&&(t.flags|=4194308)):(typeof g.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=i,t.memoizedState=u),g.props=i,g.state=u,g.context=f,i=n):(typeof g.componentDidMount=="function"&&(t.flags|=4194308),i=!1)}else{g=t.stateNode,iu(e,t),n=t.memoizedProps,f=t.type===t.elementType?n:pt(t.type,n),g.props=f,d=t.pendingProps,_=g.context,u=r.contextType,typeof u=="object"&&u!==null?u=ut(u):(u=Xe(r)?fr:ze.current,u=Wr(t,u));var S=r.getDerivedStateFromProps;(y=typeof S=="function"||typeof g.getSnapshotBeforeUpdate=="function")||typeof g.UNSAFE_componentWillReceiveProps!="function"&&typeof g.componentWillReceiveProps!="function"||(n!==d||_!==u)&&ga(t,g,i,u),zt=!1,_=t.memoizedState,g.state=_,Is(t,i,g,c);var w=t.memoizedState;n!==d||_!==w||Ge.current||zt?(typeof S=="function"&&(go(t,r,S,i),w=t.memoizedState),(f=zt||_a(t,r,f,i,_,w,u)||!1)?(y||typeof g.UNSAFE_componentWillUpdate!="function"&&typeof g.componentWillUpdate!="function"||(typeof g.componentWillUpdate=="function"&&g.componentWillUpdate(i,w,u),typeof g.UNSAFE_componentWillUpdate=="function"&&g.UNSAFE_componentWillUpdate(i,w,u)),typeof g.componentDidUpdate=="function"&&(t.flags|=4),typeof g.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof g.componentDidUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=4),typeof g.getSnapshotBeforeUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=1024),t.memoizedProps=i,t.memoizedState=w),g.props=i,g.state=w,g.context=u,i=f):(typeof g.componentDidUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=4),typeof g.getSnapshotBeforeUpdate!="function"||n===e.memoizedProps&&_===e.memoizedState||(t.flags|=1024),i=!1)}return So(e,t,r,i,h,c)}function So(e,t,r,i,c,h){Ru(e,t);var g=(t.flags&128)!==0;if(!i&&!g)return c&&la(t,r,!1),It(e,t,h);i=t.stateNode,df.current=t;var n=g&&typeof r.getDerivedStateFromError!="function"?null:i.render();return t.flags|=1,e!==null&&g?(t.child=$r(t,e.child,null,h),t.child=$r(t,null,n,h)):Ne(e,t,n,h),t.memoizedState=i.state,c&&la(t,r,!0),t.child}function Tu(e){var t=e.stateNode;t.pendingContext?oa(e,t.pendingContext,t.pendingContext!==t.context):t.context&&oa(e,t.context,!1),ll(e,t.containerInfo)}function xa(e,t,r,i,c){return Ur(),tl(c),t.flags|=256,Ne(e,t,r,i),t.child}var Co={dehydrated:null,treeContext:null,retryLane:0};function wo(e){return{baseLanes:e,cachePool:null,transitions:null}}function Bu(e,t,r){var i=t.pendingProps,c=ye.current,h=!1,g=(t.flags&128)!==0,n;if((n=g)||(n=e!==null&&e.memoizedState===null?!1:(c&2)!==0),n?(h=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(c|=1),fe(ye,c&1),e===null)return po(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(g=i.children,e=i.fallback,h?(i=t.mode,h=t.child,g={mode:"hidden",children:g},!(i&1)&&h!==null?(h.childLanes=0,h.pendingProps=g):h=tn(g,i,0,null),e=dr(e,i,r,null),h.return=t,e.return=t,h.sibling=e,t.child=h,t.child.memoizedState=wo(r),t.memoizedState=Co,e):_l(t,g));if(c=e.memoizedState,c!==null&&(n=c.dehydrated,n!==null))return ff(e,t,g,i,n,c,r);if(h){h=i.fallback,g=t.mode,c=e.child,n=c.sibling;var u={mode:"hidden",children:i.children};return!(g&1)&&t.child!==c?(i=t.child,i.childLanes=0,i.pendingProps=u,t.deletions=null):(i=Jt(c,u),i.subtreeFlags=c.subtreeFlags&14680064),n!==null?h=Jt(n,h):(h=dr(h,g,r,null),h.flags|=2),h.return=t,i.return=t,i.sibling=h,t.child=i,i=h,h=t.child,g=e.child.memoizedState,g=g===null?wo(r):{baseLanes:g.baseLanes|r,cachePool:null,transitions:g.transitions},h.memoizedState=g,h.childLanes=e.childLanes&~r,t.memoizedState=Co,i}return h=e.child,e=h.sibling,i=Jt(h,{mode:"visible",children:i.children}),!(t.mode&1)&&(i.lanes=r),i.return=t,i.sibling=null,e!==null&&(r=t.deletions,r===null?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=i,t.memoizedState=null,i}function _l(e,t){return t=tn({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function ss(e,t,r,i){return i!==null&&tl(i),$r(t,e.child,null,r),e=_l(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function ff(e,t,r,i,c,h,g){if(r)return t.flags&256?(t.flags&=-257,i=Tn(Error(V(422))),ss(e,t,g,i)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(h=i.fallback,c=t.mode,i=tn({mode:"visible",children:i.children},c,0,null),h=dr(h,c,g,null),h.flags|=2,i.return=t,h.return=t,i.sibling=h,t.child=i,t.mode&1&&$r(t,e.child,null,g),t.child.memoizedState=wo(g),t.memoizedState=Co,h);if(!(t.mode&1))return ss(e,t,g,null);if(c.data==="$!"){if(i=c.nextSibling&&c.nextSibling.dataset,i)var n=i.dgst;return i=n,h=Error(V(419)),i=Tn(h,i,void 0),ss(e,t,g,i)}if(n=(g&e.childLanes)!==0,qe||n){if(i=Me,i!==null){switch(g&-g){case 4:c=2;break;case 16:c=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:c=32;break;case 536870912:c=268435456;break;default:c=0}c=c&(i.suspendedLanes|g)?0:c,c!==0&&c!==h.retryLane&&(h.retryLane=c,Pt(e,c),mt(i,e,c,-1))}return Cl(),i=Tn(Error(V(421))),ss(e,t,g,i)}return c.data==="$?"?(t.flags|=128,t.child=e.child,t=Ef.bind(null,e),c._reactRetry=t,null):(e=h.treeContext,tt=Gt(c.nextSibling),rt=t,me=!0,gt=null,e!==null&&(ot[lt++]=Rt,ot[lt++]=Tt,ot[lt++]=pr,Rt=e.id,Tt=e.overflow,pr=t),t=_l(t,i.children),t.flags|=4096,t)}function ba(e,t,r){e.lanes|=t;var i=e.alternate;i!==null&&(i.lanes|=t),_o(e.return,t,r)}function Bn(e,t,r,i,c){var h=e.memoizedState;h===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:i,tail:r,tailMode:c}:(h.isBackwards=t,h.rendering=null,h.renderingStartTime=0,h.last=i,h.tail=r,h.tailMode=c)}function Au(e,t,r){var i=t.pendingProps,c=i.revealOrder,h=i.tail;if(Ne(e,t,i.children,r),i=ye.current,i&2)i=i&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&ba(e,r,t);else if(e.tag===19)ba(e,r,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}i&=1}if(fe(ye,i),!(t.mode&1))t.memoizedState=null;else switch(c){case"forwards":for(r=t.child,c=null;r!==null;)e=r.alternate,e!==null&&Os(e)===null&&(c=r),r=r.sibling;r=c,r===null?(c=t.child,t.child=null):(c=r.sibling,r.sibling=null),Bn(t,!1,c,r,h);break;case"backwards":for(r=null,c=t.child,t.child=null;c!==null;){if(e=c.alternate,e!==null&&Os(e)===null){t.child=c;break}e=c.sibling,c.sibling=r,r=c,c=e}Bn(t,!0,r,null,h);break;case"together":Bn(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function gs(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function It(e,t,r){if(e!==null&&(t.dependencies=e.dependencies),gr|=t.lanes,!(r&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(V(153));if(t.child!==null){for(e=t.child,r=Jt(e,e.pendingProps),t.child=r,r.return=t;e.sibling!==null;)e=e.sibling,r=r.sibling=Jt(e,e.pendingProps),r.return=t;r.sibling=null}return t.child}function pf(e,t,r){switch(t.tag){case 3:Tu(t),Ur();break;case 5:su(t);break;case 1:Xe(t.type)&&Ts(t);break;case 4:ll(t,t.stateNode.containerInfo);break;case 10:var i=t.type._context,c=t.memoizedProps.value;fe(Ms,i._currentValue),i._currentValue=c;break;case 13:if(i=t.memoizedState,i!==null)return i.dehydrated!==null?(fe(ye,ye.current&1),t.flags|=128,null):r&t.child.childLanes?Bu(e,t,r):(fe(ye,ye.current&1),e=It(e,t,r),e!==null?e.sibling:null);fe(ye,ye.current&1);break;case 19:if(i=(r&t.childLanes)!==0,e.flags&128){if(i)return Au(e,t,r);t.flags|=128}if(c=t.memoizedState,c!==null&&(c.rendering=null,c.tail=null,c.lastEffect=null),fe(ye,ye.current),i)break;return null;case 22:case 23:return t.lanes=0,Du(e,t,r)}return It(e,t,r)}var Mu,xo,Pu,Iu;Mu=function(e,t){for(var r=t.child;r!==null;){if(r.tag===5||r.tag===6)e.appendChild(r.stateNode);else if(r.tag!==4&&r.child!==null){r.child.return=r,r=r.child;continue}if(r===t)break;for(;r.sibling===null;){if(r.return===null||r.return===t)return;r=r.return}r.sibling.return=r.return,r=r.sibling}};xo=function(){};Pu=function(e,t,r,i){var c=e.memoizedProps;if(c!==i){e=t.stateNode,ur(kt.current);var h=null;switch(r){case"input":c=$n(e,c),i=$n(e,i),h=[];break;case"select":c=Ce({},c,{value:void 0}),i=Ce({},i,{value:void 0}),h=[];break;case"textarea":c=qn(e,c),i=qn(e,i),h=[];break;default:typeof c.onClick!="function"&&typeof i.onClick=="function"&&(e.onclick=Ds)}Xn(r,i);var g;r=null;for(f in c)if(!i.hasOwnProperty(f)&&c.hasOwnProperty(f)&&c[f]!=null)if(f==="style"){var n=c[f];for(g in n)n.hasOwnProperty(g)&&(r||(r={}),r[g]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(xi.hasOwnProperty(f)?h||(h=[]):(h=h||[]).push(f,null));for(f in i){var u=i[f];if(n=c!=null?c[f]:void 0,i.hasOwnProperty(f)&&u!==n&&(u!=null||n!=null))if(f==="style")if(n){for(g in n)!n.hasOwnProperty(g)||u&&u.hasOwnProperty(g)||(r||(r={}),r[g]="");for(g in u)u.hasOwnProperty(g)&&n[g]!==u[g]&&(r||(r={}),r[g]=u[g])}else r||(h||(h=[]),h.push(f,r)),r=u;else f==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,n=n?n.__html:void 0,u!=null&&n!==u&&(h=h||[]).push(f,u)):f==="children"?typeof u!="string"&&typeof u!="number"||(h=h||[]).push(f,""+u):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(xi.hasOwnProperty(f)?(u!=null&&f==="onScroll"&&ge("scroll",e),h||n===u||(h=[])):(h=h||[]).push(f,u))}r&&(h=h||[]).push("style",r);var f=h;(t.updateQueue=f)&&(t.flags|=4)}};Iu=function(e,t,r,i){r!==i&&(t.flags|=4)};function li(e,t){if(!me)switch(e.tailMode){case"hidden":t=e.tail;for(var r=null;t!==null;)t.alternate!==null&&(r=t),t=t.sibling;r===null?e.tail=null:r.sibling=null;break;case"collapsed":r=e.tail;for(var i=null;r!==null;)r.alternate!==null&&(i=r),r=r.sibling;i===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:i.sibling=null}}function He(e){var t=e.alternate!==null&&e.alternate.child===e.child,r=0,i=0;if(t)for(var c=e.child;c!==null;)r|=c.lanes|c.childLanes,i|=c.subtreeFlags&14680064,i|=c.flags&14680064,c.return=e,c=c.sibling;else for(c=e.child;c!==null;)r|=c.lanes|c.childLanes,i|=c.subtreeFlags,i|=c.flags,c.return=e,c=c.sibling;return e.subtreeFlags|=i,e.childLanes=r,t}function _f(e,t,r){var i=t.pendingProps;switch(el(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return He(t),null;case 1:return Xe(t.type)&&Rs(),He(t),null;case 3:return i=t.stateNode,Vr(),ve(Ge),ve(ze),cl(),i.pendingContext&&(i.context=i.pendingContext,i.pendingContext=null),(e===null||e.child===null)&&(rs(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,gt!==null&&(Bo(gt),gt=null))),xo(e,t),He(t),null;case 5:al(t);var c=ur(Ii.current);if(r=t.type,e!==null&&t.stateNode!=null)Pu(e,t,r,i,c),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!i){if(t.stateNode===null)throw Error(V(166));return He(t),null}if(e=ur(kt.current),rs(t)){i=t.stateNode,r=t.type;var h=t.memoizedProps;switch(i[xt]=t,i[Mi]=h,e=(t.mode&1)!==0,r){case"dialog":ge("cancel",i),ge("close",i);break;case"iframe":case"object":case"embed":ge("load",i);break;case"video":case"audio":for(c=0;c<fi.length;c++)ge(fi[c],i);break;case"source":ge("error",i);break;case"img":case"image":case"link":ge("error",i),ge("load",i);break;case"details":ge("toggle",i);break;case"input":Ml(i,h),ge("invalid",i);break;case"select":i._wrapperState={wasMultiple:!!h.multiple},ge("invalid",i);break;case"textarea":Il(i,h),ge("invalid",i)}Xn(r,h),c=null;for(var g in h)if(h.hasOwnProperty(g)){var n=h[g];g==="children"?typeof n=="string"?i.textContent!==n&&(h.suppressHydrationWarning!==!0&&ts(i.textContent,n,e),c=["children",n]):typeof n=="number"&&i.textContent!==""+n&&(h.suppressHydrationWarning!==!0&&ts(i.textContent,n,e),c=["children",""+n]):xi.hasOwnProperty(g)&&n!=null&&g==="onScroll"&&ge("scroll",i)}switch(r){case"input":qi(i),Pl(i,h,!0);break;case"textarea":qi(i),Ol(i);break;case"select":case"option":break;default:typeof h.onClick=="function"&&(i.onclick=Ds)}i=c,t.updateQueue=i,i!==null&&(t.flags|=4)}else{g=c.nodeType===9?c:c.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=cc(r)),e==="http://www.w3.org/1999/xhtml"?r==="script"?(e=g.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof i.is=="string"?e=g.createElement(r,{is:i.is}):(e=g.createElement(r),r==="select"&&(g=e,i.multiple?g.multiple=!0:i.size&&(g.size=i.size))):e=g.createElementNS(e,r),e[xt]=t,e[Mi]=i,Mu(e,t,!1,!1),t.stateNode=e;e:{switch(g=Yn(r,i),r){case"dialog":ge("cancel",e),ge("close",e),c=i;break;case"iframe":case"object":case"embed":ge("load",e),c=i;break;case"video":case"audio":for(c=0;c<fi.length;c++)ge(fi[c],e);c=i;break;case"source":ge("error",e),c=i;break;case"img":case"image":case"link":ge("error",e),ge("load",e),c=i;break;case"details":ge("toggle",e),c=i;break;case"input":Ml(e,i),c=$n(e,i),ge("invalid",e);break;case"option":c=i;break;case"select":e._wrapperState={wasMultiple:!!i.multiple},c=Ce({},i,{value:void 0}),ge("invalid",e);break;case"textarea":Il(e,i),c=qn(e,i),ge("invalid",e);break;default:c=i}Xn(r,c),n=c;for(h in n)if(n.hasOwnProperty(h)){var u=n[h];h==="style"?dc(e,u):h==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,u!=null&&uc(e,u)):h==="children"?typeof u=="string"?(r!=="textarea"||u!=="")&&bi(e,u):typeof u=="number"&&bi(e,""+u):h!=="suppressContentEditableWarning"&&h!=="suppressHydrationWarning"&&h!=="autoFocus"&&(xi.hasOwnProperty(h)?u!=null&&h==="onScroll"&&ge("scroll",e):u!=null&&Fo(e,h,u,g))}switch(r){case"input":qi(e),Pl(e,i,!1);break;case"textarea":qi(e),Ol(e);break;case"option":i.value!=null&&e.setAttribute("value",""+Zt(i.value));break;case"select":e.multiple=!!i.multiple,h=i.value,h!=null?Ir(e,!!i.multiple,h,!1):i.defaultValue!=null&&Ir(e,!!i.multiple,i.defaultValue,!0);break;default:typeof c.onClick=="function"&&(e.onclick=Ds)}switch(r){case"button":case"input":case"select":case"textarea":i=!!i.autoFocus;break e;case"img":i=!0;break e;default:i=!1}}i&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return He(t),null;case 6:if(e&&t.stateNode!=null)Iu(e,t,e.memoizedProps,i);else{if(typeof i!="string"&&t.stateNode===null)throw Error(V(166));if(r=ur(Ii.current),ur(kt.current),rs(t)){if(i=t.stateNode,r=t.memoizedProps,i[xt]=t,(h=i.nodeValue!==r)&&(e=rt,e!==null))switch(e.tag){case 3:ts(i.nodeValue,r,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&ts(i.nodeValue,r,(e.mode&1)!==0)}h&&(t.flags|=4)}else i=(r.nodeType===9?r:r.ownerDocument).createTextNode(i),i[xt]=t,t.stateNode=i}return He(t),null;case 13:if(ve(ye),i=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(me&&tt!==null&&t.mode&1&&!(t.flags&128))Zc(),Ur(),t.flags|=98560,h=!1;else if(h=rs(t),i!==null&&i.dehydrated!==null){if(e===null){if(!h)throw Error(V(318));if(h=t.memoizedState,h=h!==null?h.dehydrated:null,!h)throw Error(V(317));h[xt]=t}else Ur(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;He(t),h=!1}else gt!==null&&(Bo(gt),gt=null),h=!0;if(!h)return t.flags&65536?t:null}return t.flags&128?(t.lanes=r,t):(i=i!==null,i!==(e!==null&&e.memoizedState!==null)&&i&&(t.child.flags|=8192,t.mode&1&&(e===null||ye.current&1?De===0&&(De=3):Cl())),t.updateQueue!==null&&(t.flags|=4),He(t),null);case 4:return Vr(),xo(e,t),e===null&&Bi(t.stateNode.containerInfo),He(t),null;case 10:return sl(t.type._context),He(t),null;case 17:return Xe(t.type)&&Rs(),He(t),null;case 19:if(ve(ye),h=t.memoizedState,h===null)return He(t),null;if(i=(t.flags&128)!==0,g=h.rendering,g===null)if(i)li(h,!1);else{if(De!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(g=Os(e),g!==null){for(t.flags|=128,li(h,!1),i=g.updateQueue,i!==null&&(t.updateQueue=i,t.flags|=4),t.subtreeFlags=0,i=r,r=t.child;r!==null;)h=r,e=i,h.flags&=14680066,g=h.alternate,g===null?(h.childLanes=0,h.lanes=e,h.child=null,h.subtreeFlags=0,h.memoizedProps=null,h.memoizedState=null,h.updateQueue=null,h.dependencies=null,h.stateNode=null):(h.childLanes=g.childLanes,h.lanes=g.lanes,h.child=g.child,h.subtreeFlags=0,h.deletions=null,h.memoizedProps=g.memoizedProps,h.memoizedState=g.memoizedState,h.updateQueue=g.updateQueue,h.type=g.type,e=g.dependencies,h.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),r=r.sibling;return fe(ye,ye.current&1|2),t.child}e=e.sibling}h.tail!==null&&xe()>qr&&(t.flags|=128,i=!0,li(h,!1),t.lanes=4194304)}else{if(!i)if(e=Os(g),e!==null){if(t.flags|=128,i=!0,r=e.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),li(h,!0),h.tail===null&&h.tailMode==="hidden"&&!g.alternate&&!me)return He(t),null}else 2*xe()-h.renderingStartTime>qr&&r!==1073741824&&(t.flags|=128,i=!0,li(h,!1),t.lanes=4194304);h.isBackwards?(g.sibling=t.child,t.child=g):(r=h.last,r!==null?r.sibling=g:t.child=g,h.last=g)}return h.tail!==null?(t=h.tail,h.rendering=t,h.tail=t.sibling,h.renderingStartTime=xe(),t.sibling=null,r=ye.current,fe(ye,i?r&1|2:r&1),t):(He(t),null);case 22:case 23:return Sl(),i=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==i&&(t.flags|=8192),i&&t.mode&1?et&1073741824&&(He(t),t.subtreeFlags&6&&(t.flags|=8192)):He(t),null;case 24:return null;case 25:return null}throw Error(V(156,t.tag))}function gf(e,t){switch(el(t),t.tag){case 1:return Xe(t.type)&&Rs(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Vr(),ve(Ge),ve(ze),cl(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return al(t),null;case 13:if(ve(ye),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(V(340));Ur()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return ve(ye),null;case 4:return Vr(),null;case 10:return sl(t.type._context),null;case 22:case 23:return Sl(),null;case 24:return null;default:return null}}var ns=!1,Fe=!1,vf=typeof WeakSet=="function"?WeakSet:Set,X=null;function Mr(e,t){var r=e.ref;if(r!==null)if(typeof r=="function")try{r(null)}catch(i){we(e,t,i)}else r.current=null}function bo(e,t,r){try{r()}catch(i){we(e,t,i)}}var ka=!1;function mf(e,t){if(oo=ks,e=zc(),Jo(e)){if("selectionStart"in e)var r={start:e.selectionStart,end:e.selectionEnd};else e:{r=(r=e.ownerDocument)&&r.defaultView||window;var i=r.getSelection&&r.getSelection();if(i&&i.rangeCount!==0){r=i.anchorNode;var c=i.anchorOffset,h=i.focusNode;i=i.focusOffset;try{r.nodeType,h.nodeType}catch{r=null;break e}var g=0,n=-1,u=-1,f=0,y=0,d=e,_=null;t:for(;;){for(var S;d!==r||c!==0&&d.nodeType!==3||(n=g+c),d!==h||i!==0&&d.nodeType!==3||(u=g+i),d.nodeType===3&&(g+=d.nodeValue.length),(S=d.firstChild)!==null;)_=d,d=S;for(;;){if(d===e)break t;if(_===r&&++f===c&&(n=g),_===h&&++y===i&&(u=g),(S=d.nextSibling)!==null)break;d=_,_=d.parentNode}d=S}r=n===-1||u===-1?null:{start:n,end:u}}else r=null}r=r||{start:0,end:0}}else r=null;for(lo={focusedElem:e,selectionRange:r},ks=!1,X=t;X!==null;)if(t=X,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,X=e;else for(;X!==null;){t=X;try{var w=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(w!==null){var C=w.memoizedProps,a=w.memoizedState,l=t.stateNode,s=l.getSnapshotBeforeUpdate(t.elementType===t.type?C:pt(t.type,C),a);l.__reactInternalSnapshotBeforeUpdate=s}break;case 3:var o=t.stateNode.containerInfo;o.nodeType===1?o.textContent="":o.nodeType===9&&o.documentElement&&o.removeChild(o.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(V(163))}}catch(p){we(t,t.return,p)}if(e=t.sibling,e!==null){e.return=t.return,X=e;break}X=t.return}return w=ka,ka=!1,w}function Si(e,t,r){var i=t.updateQueue;if(i=i!==null?i.lastEffect:null,i!==null){var c=i=i.next;do{if((c.tag&e)===e){var h=c.destroy;c.destroy=void 0,h!==void 0&&bo(t,r,h)}c=c.next}while(c!==i)}}function Zs(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var r=t=t.next;do{if((r.tag&e)===e){var i=r.create;r.destroy=i()}r=r.next}while(r!==t)}}function ko(e){var t=e.ref;if(t!==null){var r=e.stateNode;switch(e.tag){case 5:e=r;break;default:e=r}typeof t=="function"?t(e):t.current=e}}function Ou(e){var t=e.alternate;t!==null&&(e.alternate=null,Ou(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[xt],delete t[Mi],delete t[uo],delete t[Zd],delete t[ef])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function ju(e){return e.tag===5||e.tag===3||e.tag===4}function Ea(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||ju(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Eo(e,t,r){var i=e.tag;if(i===5||i===6)e=e.stateNode,t?r.nodeType===8?r.parentNode.insertBefore(e,t):r.insertBefore(e,t):(r.nodeType===8?(t=r.parentNode,t.insertBefore(e,r)):(t=r,t.appendChild(e)),r=r._reactRootContainer,r!=null||t.onclick!==null||(t.onclick=Ds));else if(i!==4&&(e=e.child,e!==null))for(Eo(e,t,r),e=e.sibling;e!==null;)Eo(e,t,r),e=e.sibling}function Lo(e,t,r){var i=e.tag;if(i===5||i===6)e=e.stateNode,t?r.insertBefore(e,t):r.appendChild(e);else if(i!==4&&(e=e.child,e!==null))for(Lo(e,t,r),e=e.sibling;e!==null;)Lo(e,t,r),e=e.sibling}var Pe=null,_t=!1;function Ht(e,t,r){for(r=r.child;r!==null;)Hu(e,t,r),r=r.sibling}function Hu(e,t,r){if(bt&&typeof bt.onCommitFiberUnmount=="function")try{bt.onCommitFiberUnmount(Vs,r)}catch{}switch(r.tag){case 5:Fe||Mr(r,t);case 6:var i=Pe,c=_t;Pe=null,Ht(e,t,r),Pe=i,_t=c,Pe!==null&&(_t?(e=Pe,r=r.stateNode,e.nodeType===8?e.parentNode.removeChild(r):e.removeChild(r)):Pe.removeChild(r.stateNode));break;case 18:Pe!==null&&(_t?(e=Pe,r=r.stateNode,e.nodeType===8?bn(e.parentNode,r):e.nodeType===1&&bn(e,r),Di(e)):bn(Pe,r.stateNode));break;case 4:i=Pe,c=_t,Pe=r.stateNode.containerInfo,_t=!0,Ht(e,t,r),Pe=i,_t=c;break;case 0:case 11:case 14:case 15:if(!Fe&&(i=r.updateQueue,i!==null&&(i=i.lastEffect,i!==null))){c=i=i.next;do{var h=c,g=h.destroy;h=h.tag,g!==void 0&&(h&2||h&4)&&bo(r,t,g),c=c.next}while(c!==i)}Ht(e,t,r);break;case 1:if(!Fe&&(Mr(r,t),i=r.stateNode,typeof i.componentWillUnmount=="function"))try{i.props=r.memoizedProps,i.state=r.memoizedState,i.componentWillUnmount()}catch(n){we(r,t,n)}Ht(e,t,r);break;case 21:Ht(e,t,r);break;case 22:r.mode&1?(Fe=(i=Fe)||r.memoizedState!==null,Ht(e,t,r),Fe=i):Ht(e,t,r);break;default:Ht(e,t,r)}}function La(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var r=e.stateNode;r===null&&(r=e.stateNode=new vf),t.forEach(function(i){var c=Lf.bind(null,e,i);r.has(i)||(r.add(i),i.then(c,c))})}}function dt(e,t){var r=t.deletions;if(r!==null)for(var i=0;i<r.length;i++){var c=r[i];try{var h=e,g=t,n=g;e:for(;n!==null;){switch(n.tag){case 5:Pe=n.stateNode,_t=!1;break e;case 3:Pe=n.stateNode.containerInfo,_t=!0;break e;case 4:Pe=n.stateNode.containerInfo,_t=!0;break e}n=n.return}if(Pe===null)throw Error(V(160));Hu(h,g,c),Pe=null,_t=!1;var u=c.alternate;u!==null&&(u.return=null),c.return=null}catch(f){we(c,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Fu(t,e),t=t.sibling}function Fu(e,t){var r=e.alternate,i=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(dt(t,e),St(e),i&4){try{Si(3,e,e.return),Zs(3,e)}catch(C){we(e,e.return,C)}try{Si(5,e,e.return)}catch(C){we(e,e.return,C)}}break;case 1:dt(t,e),St(e),i&512&&r!==null&&Mr(r,r.return);break;case 5:if(dt(t,e),St(e),i&512&&r!==null&&Mr(r,r.return),e.flags&32){var c=e.stateNode;try{bi(c,"")}catch(C){we(e,e.return,C)}}if(i&4&&(c=e.stateNode,c!=null)){var h=e.memoizedProps,g=r!==null?r.memoizedProps:h,n=e.type,u=e.updateQueue;if(e.updateQueue=null,u!==null)try{n==="input"&&h.type==="radio"&&h.name!=null&&lc(c,h),Yn(n,g);var f=Yn(n,h);for(g=0;g<u.length;g+=2){var y=u[g],d=u[g+1];y==="style"?dc(c,d):y==="dangerouslySetInnerHTML"?uc(c,d):y==="children"?bi(c,d):Fo(c,y,d,f)}switch(n){case"input":Vn(c,h);break;case"textarea":ac(c,h);break;case"select":var _=c._wrapperState.wasMultiple;c._wrapperState.wasMultiple=!!h.multiple;var S=h.value;S!=null?Ir(c,!!h.multiple,S,!1):_!==!!h.multiple&&(h.defaultValue!=null?Ir(c,!!h.multiple,h.defaultValue,!0):Ir(c,!!h.multiple,h.multiple?[]:"",!1))}c[Mi]=h}catch(C){we(e,e.return,C)}}break;case 6:if(dt(t,e),St(e),i&4){if(e.stateNode===null)throw Error(V(162));c=e.stateNode,h=e.memoizedProps;try{c.nodeValue=h}catch(C){we(e,e.return,C)}}break;case 3:if(dt(t,e),St(e),i&4&&r!==null&&r.memoizedState.isDehydrated)try{Di(t.containerInfo)}catch(C){we(e,e.return,C)}break;case 4:dt(t,e),St(e);break;case 13:dt(t,e),St(e),c=e.child,c.flags&8192&&(h=c.memoizedState!==null,c.stateNode.isHidden=h,!h||c.alternate!==null&&c.alternate.memoizedState!==null||(ml=xe())),i&4&&La(e);break;case 22:if(y=r!==null&&r.memoizedState!==null,e.mode&1?(Fe=(f=Fe)||y,dt(t,e),Fe=f):dt(t,e),St(e),i&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!y&&e.mode&1)for(X=e,y=e.child;y!==null;){for(d=X=y;X!==null;){switch(_=X,S=_.child,_.tag){case 0:case 11:case 14:case 15:Si(4,_,_.return);break;case 1:Mr(_,_.return);var w=_.stateNode;if(typeof w.componentWillUnmount=="function"){i=_,r=_.return;try{t=i,w.props=t.memoizedProps,w.state=t.memoizedState,w.componentWillUnmount()}catch(C){we(i,r,C)}}break;case 5:Mr(_,_.return);break;case 22:if(_.memoizedState!==null){Ra(d);continue}}S!==null?(S.return=_,X=S):Ra(d)}y=y.sibling}e:for(y=null,d=e;;){if(d.tag===5){if(y===null){y=d;try{c=d.stateNode,f?(h=c.style,typeof h.setProperty=="function"?h.setProperty("display","none","important"):h.display="none"):(n=d.stateNode,u=d.memoizedProps.style,g=u!=null&&u.hasOwnProperty("display")?u.display:null,n.style.display=hc("display",g))}catch(C){we(e,e.return,C)}}}else if(d.tag===6){if(y===null)try{d.stateNode.nodeValue=f?"":d.memoizedProps}catch(C){we(e,e.return,C)}}else if((d.tag!==22&&d.tag!==23||d.memoizedState===null||d===e)&&d.child!==null){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;d.sibling===null;){if(d.return===null||d.return===e)break e;y===d&&(y=null),d=d.return}y===d&&(y=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:dt(t,e),St(e),i&4&&La(e);break;case 21:break;default:dt(t,e),St(e)}}function St(e){var t=e.flags;if(t&2){try{e:{for(var r=e.return;r!==null;){if(ju(r)){var i=r;break e}r=r.return}throw Error(V(160))}switch(i.tag){case 5:var c=i.stateNode;i.flags&32&&(bi(c,""),i.flags&=-33);var h=Ea(e);Lo(e,h,c);break;case 3:case 4:var g=i.stateNode.containerInfo,n=Ea(e);Eo(e,n,g);break;default:throw Error(V(161))}}catch(u){we(e,e.return,u)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function yf(e,t,r){X=e,zu(e)}function zu(e,t,r){for(var i=(e.mode&1)!==0;X!==null;){var c=X,h=c.child;if(c.tag===22&&i){var g=c.memoizedState!==null||ns;if(!g){var n=c.alternate,u=n!==null&&n.memoizedState!==null||Fe;n=ns;var f=Fe;if(ns=g,(Fe=u)&&!f)for(X=c;X!==null;)g=X,u=g.child,g.tag===22&&g.memoizedState!==null?Ta(c):u!==null?(u.return=g,X=u):Ta(c);for(;h!==null;)X=h,zu(h),h=h.sibling;X=c,ns=n,Fe=f}Da(e)}else c.subtreeFlags&8772&&h!==null?(h.return=c,X=h):Da(e)}}function Da(e){for(;X!==null;){var t=X;if(t.flags&8772){var r=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:Fe||Zs(5,t);break;case 1:var i=t.stateNode;if(t.flags&4&&!Fe)if(r===null)i.componentDidMount();else{var c=t.elementType===t.type?r.memoizedProps:pt(t.type,r.memoizedProps);i.componentDidUpdate(c,r.memoizedState,i.__reactInternalSnapshotBeforeUpdate)}var h=t.updateQueue;h!==null&&da(t,h,i);break;case 3:var g=t.updateQueue;if(g!==null){if(r=null,t.child!==null)switch(t.child.tag){case 5:r=t.child.stateNode;break;case 1:r=t.child.stateNode}da(t,g,r)}break;case 5:var n=t.stateNode;if(r===null&&t.flags&4){r=n;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&r.focus();break;case"img":u.src&&(r.src=u.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var y=f.memoizedState;if(y!==null){var d=y.dehydrated;d!==null&&Di(d)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(V(163))}Fe||t.flags&512&&ko(t)}catch(_){we(t,t.return,_)}}if(t===e){X=null;break}if(r=t.sibling,r!==null){r.return=t.return,X=r;break}X=t.return}}function Ra(e){for(;X!==null;){var t=X;if(t===e){X=null;break}var r=t.sibling;if(r!==null){r.return=t.return,X=r;break}X=t.return}}function Ta(e){for(;X!==null;){var t=X;try{switch(t.tag){case 0:case 11:case 15:var r=t.return;try{Zs(4,t)}catch(u){we(t,r,u)}break;case 1:var i=t.stateNode;if(typeof i.componentDidMount=="function"){var c=t.return;try{i.componentDidMount()}catch(u){we(t,c,u)}}var h=t.return;try{ko(t)}catch(u){we(t,h,u)}break;case 5:var g=t.return;try{ko(t)}catch(u){we(t,g,u)}}}catch(u){we(t,t.return,u)}if(t===e){X=null;break}var n=t.sibling;if(n!==null){n.return=t.return,X=n;break}X=t.return}}var Sf=Math.ceil,Fs=Ot.ReactCurrentDispatcher,gl=Ot.ReactCurrentOwner,ct=Ot.ReactCurrentBatchConfig,ne=0,Me=null,ke=null,Ie=0,et=0,Pr=rr(0),De=0,Fi=null,gr=0,en=0,vl=0,Ci=null,Ke=null,ml=0,qr=1/0,Et=null,zs=!1,Do=null,Yt=null,os=!1,$t=null,Ns=0,wi=0,Ro=null,vs=-1,ms=0;function We(){return ne&6?xe():vs!==-1?vs:vs=xe()}function Qt(e){return e.mode&1?ne&2&&Ie!==0?Ie&-Ie:rf.transition!==null?(ms===0&&(ms=bc()),ms):(e=he,e!==0||(e=window.event,e=e===void 0?16:Bc(e.type)),e):1}function mt(e,t,r,i){if(50<wi)throw wi=0,Ro=null,Error(V(185));Ni(e,r,i),(!(ne&2)||e!==Me)&&(e===Me&&(!(ne&2)&&(en|=r),De===4&&Wt(e,Ie)),Ye(e,i),r===1&&ne===0&&!(t.mode&1)&&(qr=xe()+500,Ys&&ir()))}function Ye(e,t){var r=e.callbackNode;rd(e,t);var i=bs(e,e===Me?Ie:0);if(i===0)r!==null&&Fl(r),e.callbackNode=null,e.callbackPriority=0;else if(t=i&-i,e.callbackPriority!==t){if(r!=null&&Fl(r),t===1)e.tag===0?tf(Ba.bind(null,e)):Yc(Ba.bind(null,e)),Qd(function(){!(ne&6)&&ir()}),r=null;else{switch(kc(i)){case 1:r=$o;break;case 4:r=wc;break;case 16:r=xs;break;case 536870912:r=xc;break;default:r=xs}r=Gu(r,Nu.bind(null,e))}e.callbackPriority=t,e.callbackNode=r}}function Nu(e,t){if(vs=-1,ms=0,ne&6)throw Error(V(327));var r=e.callbackNode;if(zr()&&e.callbackNode!==r)return null;var i=bs(e,e===Me?Ie:0);if(i===0)return null;if(i&30||i&e.expiredLanes||t)t=Ws(e,i);else{t=i;var c=ne;ne|=2;var h=Uu();(Me!==e||Ie!==t)&&(Et=null,qr=xe()+500,hr(e,t));do try{xf();break}catch(n){Wu(e,n)}while(!0);il(),Fs.current=h,ne=c,ke!==null?t=0:(Me=null,Ie=0,t=De)}if(t!==0){if(t===2&&(c=to(e),c!==0&&(i=c,t=To(e,c))),t===1)throw r=Fi,hr(e,0),Wt(e,i),Ye(e,xe()),r;if(t===6)Wt(e,i);else{if(c=e.current.alternate,!(i&30)&&!Cf(c)&&(t=Ws(e,i),t===2&&(h=to(e),h!==0&&(i=h,t=To(e,h))),t===1))throw r=Fi,hr(e,0),Wt(e,i),Ye(e,xe()),r;switch(e.finishedWork=c,e.finishedLanes=i,t){case 0:case 1:throw Error(V(345));case 2:lr(e,Ke,Et);break;case 3:if(Wt(e,i),(i&130023424)===i&&(t=ml+500-xe(),10<t)){if(bs(e,0)!==0)break;if(c=e.suspendedLanes,(c&i)!==i){We(),e.pingedLanes|=e.suspendedLanes&c;break}e.timeoutHandle=co(lr.bind(null,e,Ke,Et),t);break}lr(e,Ke,Et);break;case 4:if(Wt(e,i),(i&4194240)===i)break;for(t=e.eventTimes,c=-1;0<i;){var g=31-vt(i);h=1<<g,g=t[g],g>c&&(c=g),i&=~h}if(i=c,i=xe()-i,i=(120>i?120:480>i?480:1080>i?1080:1920>i?1920:3e3>i?3e3:4320>i?4320:1960*Sf(i/1960))-i,10<i){e.timeoutHandle=co(lr.bind(null,e,Ke,Et),i);break}lr(e,Ke,Et);break;case 5:lr(e,Ke,Et);break;default:throw Error(V(329))}}}return Ye(e,xe()),e.callbackNode===r?Nu.bind(null,e):null}function To(e,t){var r=Ci;return e.current.memoizedState.isDehydrated&&(hr(e,t).flags|=256),e=Ws(e,t),e!==2&&(t=Ke,Ke=r,t!==null&&Bo(t)),e}function Bo(e){Ke===null?Ke=e:Ke.push.apply(Ke,e)}function Cf(e){for(var t=e;;){if(t.flags&16384){var r=t.updateQueue;if(r!==null&&(r=r.stores,r!==null))for(var i=0;i<r.length;i++){var c=r[i],h=c.getSnapshot;c=c.value;try{if(!yt(h(),c))return!1}catch{return!1}}}if(r=t.child,t.subtreeFlags&16384&&r!==null)r.return=t,t=r;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Wt(e,t){for(t&=~vl,t&=~en,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var r=31-vt(t),i=1<<r;e[r]=-1,t&=~i}}function Ba(e){if(ne&6)throw Error(V(327));zr();var t=bs(e,0);if(!(t&1))return Ye(e,xe()),null;var r=Ws(e,t);if(e.tag!==0&&r===2){var i=to(e);i!==0&&(t=i,r=To(e,i))}if(r===1)throw r=Fi,hr(e,0),Wt(e,t),Ye(e,xe()),r;if(r===6)throw Error(V(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,lr(e,Ke,Et),Ye(e,xe()),null}function yl(e,t){var r=ne;ne|=1;try{return e(t)}finally{ne=r,ne===0&&(qr=xe()+500,Ys&&ir())}}function vr(e){$t!==null&&$t.tag===0&&!(ne&6)&&zr();var t=ne;ne|=1;var r=ct.transition,i=he;try{if(ct.transition=null,he=1,e)return e()}finally{he=i,ct.transition=r,ne=t,!(ne&6)&&ir()}}function Sl(){et=Pr.current,ve(Pr)}function hr(e,t){e.finishedWork=null,e.finishedLanes=0;var r=e.timeoutHandle;if(r!==-1&&(e.timeoutHandle=-1,Yd(r)),ke!==null)for(r=ke.return;r!==null;){var i=r;switch(el(i),i.tag){case 1:i=i.type.childContextTypes,i!=null&&Rs();break;case 3:Vr(),ve(Ge),ve(ze),cl();break;case 5:al(i);break;case 4:Vr();break;case 13:ve(ye);break;case 19:ve(ye);break;case 10:sl(i.type._context);break;case 22:case 23:Sl()}r=r.return}if(Me=e,ke=e=Jt(e.current,null),Ie=et=t,De=0,Fi=null,vl=en=gr=0,Ke=Ci=null,cr!==null){for(t=0;t<cr.length;t++)if(r=cr[t],i=r.interleaved,i!==null){r.interleaved=null;var c=i.next,h=r.pending;if(h!==null){var g=h.next;h.next=c,i.next=g}r.pending=i}cr=null}return e}function Wu(e,t){do{var r=ke;try{if(il(),ps.current=Hs,js){for(var i=Se.memoizedState;i!==null;){var c=i.queue;c!==null&&(c.pending=null),i=i.next}js=!1}if(_r=0,Ae=Le=Se=null,yi=!1,Oi=0,gl.current=null,r===null||r.return===null){De=1,Fi=t,ke=null;break}e:{var h=e,g=r.return,n=r,u=t;if(t=Ie,n.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){var f=u,y=n,d=y.tag;if(!(y.mode&1)&&(d===0||d===11||d===15)){var _=y.alternate;_?(y.updateQueue=_.updateQueue,y.memoizedState=_.memoizedState,y.lanes=_.lanes):(y.updateQueue=null,y.memoizedState=null)}var S=ma(g);if(S!==null){S.flags&=-257,ya(S,g,n,h,t),S.mode&1&&va(h,f,t),t=S,u=f;var w=t.updateQueue;if(w===null){var C=new Set;C.add(u),t.updateQueue=C}else w.add(u);break e}else{if(!(t&1)){va(h,f,t),Cl();break e}u=Error(V(426))}}else if(me&&n.mode&1){var a=ma(g);if(a!==null){!(a.flags&65536)&&(a.flags|=256),ya(a,g,n,h,t),tl(Kr(u,n));break e}}h=u=Kr(u,n),De!==4&&(De=2),Ci===null?Ci=[h]:Ci.push(h),h=g;do{switch(h.tag){case 3:h.flags|=65536,t&=-t,h.lanes|=t;var l=ku(h,u,t);ha(h,l);break e;case 1:n=u;var s=h.type,o=h.stateNode;if(!(h.flags&128)&&(typeof s.getDerivedStateFromError=="function"||o!==null&&typeof o.componentDidCatch=="function"&&(Yt===null||!Yt.has(o)))){h.flags|=65536,t&=-t,h.lanes|=t;var p=Eu(h,n,t);ha(h,p);break e}}h=h.return}while(h!==null)}Vu(r)}catch(m){t=m,ke===r&&r!==null&&(ke=r=r.return);continue}break}while(!0)}function Uu(){var e=Fs.current;return Fs.current=Hs,e===null?Hs:e}function Cl(){(De===0||De===3||De===2)&&(De=4),Me===null||!(gr&268435455)&&!(en&268435455)||Wt(Me,Ie)}function Ws(e,t){var r=ne;ne|=2;var i=Uu();(Me!==e||Ie!==t)&&(Et=null,hr(e,t));do try{wf();break}catch(c){Wu(e,c)}while(!0);if(il(),ne=r,Fs.current=i,ke!==null)throw Error(V(261));return Me=null,Ie=0,De}function wf(){for(;ke!==null;)$u(ke)}function xf(){for(;ke!==null&&!qh();)$u(ke)}function $u(e){var t=qu(e.alternate,e,et);e.memoizedProps=e.pendingProps,t===null?Vu(e):ke=t,gl.current=null}function Vu(e){var t=e;do{var r=t.alternate;if(e=t.return,t.flags&32768){if(r=gf(r,t),r!==null){r.flags&=32767,ke=r;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{De=6,ke=null;return}}else if(r=_f(r,t,et),r!==null){ke=r;return}if(t=t.sibling,t!==null){ke=t;return}ke=t=e}while(t!==null);De===0&&(De=5)}function lr(e,t,r){var i=he,c=ct.transition;try{ct.transition=null,he=1,bf(e,t,r,i)}finally{ct.transition=c,he=i}return null}function bf(e,t,r,i){do zr();while($t!==null);if(ne&6)throw Error(V(327));r=e.finishedWork;var c=e.finishedLanes;if(r===null)return null;if(e.finishedWork=null,e.finishedLanes=0,r===e.current)throw Error(V(177));e.callbackNode=null,e.callbackPriority=0;var h=r.lanes|r.childLanes;if(id(e,h),e===Me&&(ke=Me=null,Ie=0),!(r.subtreeFlags&2064)&&!(r.flags&2064)||os||(os=!0,Gu(xs,function(){return zr(),null})),h=(r.flags&15990)!==0,r.subtreeFlags&15990||h){h=ct.transition,ct.transition=null;var g=he;he=1;var n=ne;ne|=4,gl.current=null,mf(e,r),Fu(r,e),Ud(lo),ks=!!oo,lo=oo=null,e.current=r,yf(r),Gh(),ne=n,he=g,ct.transition=h}else e.current=r;if(os&&(os=!1,$t=e,Ns=c),h=e.pendingLanes,h===0&&(Yt=null),Qh(r.stateNode),Ye(e,xe()),t!==null)for(i=e.onRecoverableError,r=0;r<t.length;r++)c=t[r],i(c.value,{componentStack:c.stack,digest:c.digest});if(zs)throw zs=!1,e=Do,Do=null,e;return Ns&1&&e.tag!==0&&zr(),h=e.pendingLanes,h&1?e===Ro?wi++:(wi=0,Ro=e):wi=0,ir(),null}function zr(){if($t!==null){var e=kc(Ns),t=ct.transition,r=he;try{if(ct.transition=null,he=16>e?16:e,$t===null)var i=!1;else{if(e=$t,$t=null,Ns=0,ne&6)throw Error(V(331));var c=ne;for(ne|=4,X=e.current;X!==null;){var h=X,g=h.child;if(X.flags&16){var n=h.deletions;if(n!==null){for(var u=0;u<n.length;u++){var f=n[u];for(X=f;X!==null;){var y=X;switch(y.tag){case 0:case 11:case 15:Si(8,y,h)}var d=y.child;if(d!==null)d.return=y,X=d;else for(;X!==null;){y=X;var _=y.sibling,S=y.return;if(Ou(y),y===f){X=null;break}if(_!==null){_.return=S,X=_;break}X=S}}}var w=h.alternate;if(w!==null){var C=w.child;if(C!==null){w.child=null;do{var a=C.sibling;C.sibling=null,C=a}while(C!==null)}}X=h}}if(h.subtreeFlags&2064&&g!==null)g.return=h,X=g;else e:for(;X!==null;){if(h=X,h.flags&2048)switch(h.tag){case 0:case 11:case 15:Si(9,h,h.return)}var l=h.sibling;if(l!==null){l.return=h.return,X=l;break e}X=h.return}}var s=e.current;for(X=s;X!==null;){g=X;var o=g.child;if(g.subtreeFlags&2064&&o!==null)o.return=g,X=o;else e:for(g=s;X!==null;){if(n=X,n.flags&2048)try{switch(n.tag){case 0:case 11:case 15:Zs(9,n)}}catch(m){we(n,n.return,m)}if(n===g){X=null;break e}var p=n.sibling;if(p!==null){p.return=n.return,X=p;break e}X=n.return}}if(ne=c,ir(),bt&&typeof bt.onPostCommitFiberRoot=="function")try{bt.onPostCommitFiberRoot(Vs,e)}catch{}i=!0}return i}finally{he=r,ct.transition=t}}return!1}function Aa(e,t,r){t=Kr(r,t),t=ku(e,t,1),e=Xt(e,t,1),t=We(),e!==null&&(Ni(e,1,t),Ye(e,t))}function we(e,t,r){if(e.tag===3)Aa(e,e,r);else for(;t!==null;){if(t.tag===3){Aa(t,e,r);break}else if(t.tag===1){var i=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof i.componentDidCatch=="function"&&(Yt===null||!Yt.has(i))){e=Kr(r,e),e=Eu(t,e,1),t=Xt(t,e,1),e=We(),t!==null&&(Ni(t,1,e),Ye(t,e));break}}t=t.return}}function kf(e,t,r){var i=e.pingCache;i!==null&&i.delete(t),t=We(),e.pingedLanes|=e.suspendedLanes&r,Me===e&&(Ie&r)===r&&(De===4||De===3&&(Ie&130023424)===Ie&&500>xe()-ml?hr(e,0):vl|=r),Ye(e,t)}function Ku(e,t){t===0&&(e.mode&1?(t=Yi,Yi<<=1,!(Yi&130023424)&&(Yi=4194304)):t=1);var r=We();e=Pt(e,t),e!==null&&(Ni(e,t,r),Ye(e,r))}function Ef(e){var t=e.memoizedState,r=0;t!==null&&(r=t.retryLane),Ku(e,r)}function Lf(e,t){var r=0;switch(e.tag){case 13:var i=e.stateNode,c=e.memoizedState;c!==null&&(r=c.retryLane);break;case 19:i=e.stateNode;break;default:throw Error(V(314))}i!==null&&i.delete(t),Ku(e,r)}var qu;qu=function(e,t,r){if(e!==null)if(e.memoizedProps!==t.pendingProps||Ge.current)qe=!0;else{if(!(e.lanes&r)&&!(t.flags&128))return qe=!1,pf(e,t,r);qe=!!(e.flags&131072)}else qe=!1,me&&t.flags&1048576&&Qc(t,As,t.index);switch(t.lanes=0,t.tag){case 2:var i=t.type;gs(e,t),e=t.pendingProps;var c=Wr(t,ze.current);Fr(t,r),c=hl(null,t,i,e,c,r);var h=dl();return t.flags|=1,typeof c=="object"&&c!==null&&typeof c.render=="function"&&c.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Xe(i)?(h=!0,Ts(t)):h=!1,t.memoizedState=c.state!==null&&c.state!==void 0?c.state:null,ol(t),c.updater=Js,t.stateNode=c,c._reactInternals=t,vo(t,i,e,r),t=So(null,t,i,!0,h,r)):(t.tag=0,me&&h&&Zo(t),Ne(null,t,c,r),t=t.child),t;case 16:i=t.elementType;e:{switch(gs(e,t),e=t.pendingProps,c=i._init,i=c(i._payload),t.type=i,c=t.tag=Rf(i),e=pt(i,e),c){case 0:t=yo(null,t,i,e,r);break e;case 1:t=wa(null,t,i,e,r);break e;case 11:t=Sa(null,t,i,e,r);break e;case 14:t=Ca(null,t,i,pt(i.type,e),r);break e}throw Error(V(306,i,""))}return t;case 0:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:pt(i,c),yo(e,t,i,c,r);case 1:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:pt(i,c),wa(e,t,i,c,r);case 3:e:{if(Tu(t),e===null)throw Error(V(387));i=t.pendingProps,h=t.memoizedState,c=h.element,iu(e,t),Is(t,i,null,r);var g=t.memoizedState;if(i=g.element,h.isDehydrated)if(h={element:i,isDehydrated:!1,cache:g.cache,pendingSuspenseBoundaries:g.pendingSuspenseBoundaries,transitions:g.transitions},t.updateQueue.baseState=h,t.memoizedState=h,t.flags&256){c=Kr(Error(V(423)),t),t=xa(e,t,i,r,c);break e}else if(i!==c){c=Kr(Error(V(424)),t),t=xa(e,t,i,r,c);break e}else for(tt=Gt(t.stateNode.containerInfo.firstChild),rt=t,me=!0,gt=null,r=tu(t,null,i,r),t.child=r;r;)r.flags=r.flags&-3|4096,r=r.sibling;else{if(Ur(),i===c){t=It(e,t,r);break e}Ne(e,t,i,r)}t=t.child}return t;case 5:return su(t),e===null&&po(t),i=t.type,c=t.pendingProps,h=e!==null?e.memoizedProps:null,g=c.children,ao(i,c)?g=null:h!==null&&ao(i,h)&&(t.flags|=32),Ru(e,t),Ne(e,t,g,r),t.child;case 6:return e===null&&po(t),null;case 13:return Bu(e,t,r);case 4:return ll(t,t.stateNode.containerInfo),i=t.pendingProps,e===null?t.child=$r(t,null,i,r):Ne(e,t,i,r),t.child;case 11:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:pt(i,c),Sa(e,t,i,c,r);case 7:return Ne(e,t,t.pendingProps,r),t.child;case 8:return Ne(e,t,t.pendingProps.children,r),t.child;case 12:return Ne(e,t,t.pendingProps.children,r),t.child;case 10:e:{if(i=t.type._context,c=t.pendingProps,h=t.memoizedProps,g=c.value,fe(Ms,i._currentValue),i._currentValue=g,h!==null)if(yt(h.value,g)){if(h.children===c.children&&!Ge.current){t=It(e,t,r);break e}}else for(h=t.child,h!==null&&(h.return=t);h!==null;){var n=h.dependencies;if(n!==null){g=h.child;for(var u=n.firstContext;u!==null;){if(u.context===i){if(h.tag===1){u=Bt(-1,r&-r),u.tag=2;var f=h.updateQueue;if(f!==null){f=f.shared;var y=f.pending;y===null?u.next=u:(u.next=y.next,y.next=u),f.pending=u}}h.lanes|=r,u=h.alternate,u!==null&&(u.lanes|=r),_o(h.return,r,t),n.lanes|=r;break}u=u.next}}else if(h.tag===10)g=h.type===t.type?null:h.child;else if(h.tag===18){if(g=h.return,g===null)throw Error(V(341));g.lanes|=r,n=g.alternate,n!==null&&(n.lanes|=r),_o(g,r,t),g=h.sibling}else g=h.child;if(g!==null)g.return=h;else for(g=h;g!==null;){if(g===t){g=null;break}if(h=g.sibling,h!==null){h.return=g.return,g=h;break}g=g.return}h=g}Ne(e,t,c.children,r),t=t.child}return t;case 9:return c=t.type,i=t.pendingProps.children,Fr(t,r),c=ut(c),i=i(c),t.flags|=1,Ne(e,t,i,r),t.child;case 14:return i=t.type,c=pt(i,t.pendingProps),c=pt(i.type,c),Ca(e,t,i,c,r);case 15:return Lu(e,t,t.type,t.pendingProps,r);case 17:return i=t.type,c=t.pendingProps,c=t.elementType===i?c:pt(i,c),gs(e,t),t.tag=1,Xe(i)?(e=!0,Ts(t)):e=!1,Fr(t,r),bu(t,i,c),vo(t,i,c,r),So(null,t,i,!0,e,r);case 19:return Au(e,t,r);case 22:return Du(e,t,r)}throw Error(V(156,t.tag))};function Gu(e,t){return Cc(e,t)}function Df(e,t,r,i){this.tag=e,this.key=r,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=i,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function at(e,t,r,i){return new Df(e,t,r,i)}function wl(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Rf(e){if(typeof e=="function")return wl(e)?1:0;if(e!=null){if(e=e.$$typeof,e===No)return 11;if(e===Wo)return 14}return 2}function Jt(e,t){var r=e.alternate;return r===null?(r=at(e.tag,t,e.key,e.mode),r.elementType=e.elementType,r.type=e.type,r.stateNode=e.stateNode,r.alternate=e,e.alternate=r):(r.pendingProps=t,r.type=e.type,r.flags=0,r.subtreeFlags=0,r.deletions=null),r.flags=e.flags&14680064,r.childLanes=e.childLanes,r.lanes=e.lanes,r.child=e.child,r.memoizedProps=e.memoizedProps,r.memoizedState=e.memoizedState,r.updateQueue=e.updateQueue,t=e.dependencies,r.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},r.sibling=e.sibling,r.index=e.index,r.ref=e.ref,r}function ys(e,t,r,i,c,h){var g=2;if(i=e,typeof e=="function")wl(e)&&(g=1);else if(typeof e=="string")g=5;else e:switch(e){case br:return dr(r.children,c,h,t);case zo:g=8,c|=8;break;case zn:return e=at(12,r,t,c|2),e.elementType=zn,e.lanes=h,e;case Nn:return e=at(13,r,t,c),e.elementType=Nn,e.lanes=h,e;case Wn:return e=at(19,r,t,c),e.elementType=Wn,e.lanes=h,e;case sc:return tn(r,c,h,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case rc:g=10;break e;case ic:g=9;break e;case No:g=11;break e;case Wo:g=14;break e;case Ft:g=16,i=null;break e}throw Error(V(130,e==null?e:typeof e,""))}return t=at(g,r,t,c),t.elementType=e,t.type=i,t.lanes=h,t}function dr(e,t,r,i){return e=at(7,e,i,t),e.lanes=r,e}function tn(e,t,r,i){return e=at(22,e,i,t),e.elementType=sc,e.lanes=r,e.stateNode={isHidden:!1},e}function An(e,t,r){return e=at(6,e,null,t),e.lanes=r,e}function Mn(e,t,r){return t=at(4,e.children!==null?e.children:[],e.key,t),t.lanes=r,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Tf(e,t,r,i,c){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=fn(0),this.expirationTimes=fn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=fn(0),this.identifierPrefix=i,this.onRecoverableError=c,this.mutableSourceEagerHydrationData=null}function xl(e,t,r,i,c,h,g,n,u){return e=new Tf(e,t,r,n,u),t===1?(t=1,h===!0&&(t|=8)):t=0,h=at(3,null,null,t),e.current=h,h.stateNode=e,h.memoizedState={element:i,isDehydrated:r,cache:null,transitions:null,pendingSuspenseBoundaries:null},ol(h),e}function Bf(e,t,r){var i=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:xr,key:i==null?null:""+i,children:e,containerInfo:t,implementation:r}}function Xu(e){if(!e)return er;e=e._reactInternals;e:{if(yr(e)!==e||e.tag!==1)throw Error(V(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Xe(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(V(171))}if(e.tag===1){var r=e.type;if(Xe(r))return Xc(e,r,t)}return t}function Yu(e,t,r,i,c,h,g,n,u){return e=xl(r,i,!0,e,c,h,g,n,u),e.context=Xu(null),r=e.current,i=We(),c=Qt(r),h=Bt(i,c),h.callback=t??null,Xt(r,h,c),e.current.lanes=c,Ni(e,c,i),Ye(e,i),e}function rn(e,t,r,i){var c=t.current,h=We(),g=Qt(c);return r=Xu(r),t.context===null?t.context=r:t.pendingContext=r,t=Bt(h,g),t.payload={element:e},i=i===void 0?null:i,i!==null&&(t.callback=i),e=Xt(c,t,g),e!==null&&(mt(e,c,g,h),fs(e,c,g)),g}function Us(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Ma(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var r=e.retryLane;e.retryLane=r!==0&&r<t?r:t}}function bl(e,t){Ma(e,t),(e=e.alternate)&&Ma(e,t)}function Af(){return null}var Qu=typeof reportError=="function"?reportError:function(e){console.error(e)};function kl(e){this._internalRoot=e}sn.prototype.render=kl.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(V(409));rn(e,t,null,null)};sn.prototype.unmount=kl.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;vr(function(){rn(null,e,null,null)}),t[Mt]=null}};function sn(e){this._internalRoot=e}sn.prototype.unstable_scheduleHydration=function(e){if(e){var t=Dc();e={blockedOn:null,target:e,priority:t};for(var r=0;r<Nt.length&&t!==0&&t<Nt[r].priority;r++);Nt.splice(r,0,e),r===0&&Tc(e)}};function El(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function nn(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Pa(){}function Mf(e,t,r,i,c){if(c){if(typeof i=="function"){var h=i;i=function(){var f=Us(g);h.call(f)}}var g=Yu(t,i,e,0,null,!1,!1,"",Pa);return e._reactRootContainer=g,e[Mt]=g.current,Bi(e.nodeType===8?e.parentNode:e),vr(),g}for(;c=e.lastChild;)e.removeChild(c);if(typeof i=="function"){var n=i;i=function(){var f=Us(u);n.call(f)}}var u=xl(e,0,!1,null,null,!1,!1,"",Pa);return e._reactRootContainer=u,e[Mt]=u.current,Bi(e.nodeType===8?e.parentNode:e),vr(function(){rn(t,u,r,i)}),u}function on(e,t,r,i,c){var h=r._reactRootContainer;if(h){var g=h;if(typeof c=="function"){var n=c;c=function(){var u=Us(g);n.call(u)}}rn(t,g,e,c)}else g=Mf(r,t,e,c,i);return Us(g)}Ec=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var r=di(t.pendingLanes);r!==0&&(Vo(t,r|1),Ye(t,xe()),!(ne&6)&&(qr=xe()+500,ir()))}break;case 13:vr(function(){var i=Pt(e,1);if(i!==null){var c=We();mt(i,e,1,c)}}),bl(e,1)}};Ko=function(e){if(e.tag===13){var t=Pt(e,134217728);if(t!==null){var r=We();mt(t,e,134217728,r)}bl(e,134217728)}};Lc=function(e){if(e.tag===13){var t=Qt(e),r=Pt(e,t);if(r!==null){var i=We();mt(r,e,t,i)}bl(e,t)}};Dc=function(){return he};Rc=function(e,t){var r=he;try{return he=e,t()}finally{he=r}};Jn=function(e,t,r){switch(t){case"input":if(Vn(e,r),t=r.name,r.type==="radio"&&t!=null){for(r=e;r.parentNode;)r=r.parentNode;for(r=r.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<r.length;t++){var i=r[t];if(i!==e&&i.form===e.form){var c=Xs(i);if(!c)throw Error(V(90));oc(i),Vn(i,c)}}}break;case"textarea":ac(e,r);break;case"select":t=r.value,t!=null&&Ir(e,!!r.multiple,t,!1)}};_c=yl;gc=vr;var Pf={usingClientEntryPoint:!1,Events:[Ui,Dr,Xs,fc,pc,yl]},ai={findFiberByHostInstance:ar,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},If={bundleType:ai.bundleType,version:ai.version,rendererPackageName:ai.rendererPackageName,rendererConfig:ai.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Ot.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=yc(e),e===null?null:e.stateNode},findFiberByHostInstance:ai.findFiberByHostInstance||Af,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var ls=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ls.isDisabled&&ls.supportsFiber)try{Vs=ls.inject(If),bt=ls}catch{}}st.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Pf;st.createPortal=function(e,t){var r=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!El(t))throw Error(V(200));return Bf(e,t,null,r)};st.createRoot=function(e,t){if(!El(e))throw Error(V(299));var r=!1,i="",c=Qu;return t!=null&&(t.unstable_strictMode===!0&&(r=!0),t.identifierPrefix!==void 0&&(i=t.identifierPrefix),t.onRecoverableError!==void 0&&(c=t.onRecoverableError)),t=xl(e,1,!1,null,null,r,!1,i,c),e[Mt]=t.current,Bi(e.nodeType===8?e.parentNode:e),new kl(t)};st.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(V(188)):(e=Object.keys(e).join(","),Error(V(268,e)));return e=yc(t),e=e===null?null:e.stateNode,e};st.flushSync=function(e){return vr(e)};st.hydrate=function(e,t,r){if(!nn(t))throw Error(V(200));return on(null,e,t,!0,r)};st.hydrateRoot=function(e,t,r){if(!El(e))throw Error(V(405));var i=r!=null&&r.hydratedSources||null,c=!1,h="",g=Qu;if(r!=null&&(r.unstable_strictMode===!0&&(c=!0),r.identifierPrefix!==void 0&&(h=r.identifierPrefix),r.onRecoverableError!==void 0&&(g=r.onRecoverableError)),t=Yu(t,null,e,1,r??null,c,!1,h,g),e[Mt]=t.current,Bi(e),i)for(e=0;e<i.length;e++)r=i[e],c=r._getVersion,c=c(r._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[r,c]:t.mutableSourceEagerHydrationData.push(r,c);return new sn(t)};st.render=function(e,t,r){if(!nn(t))throw Error(V(200));return on(null,e,t,!1,r)};st.unmountComponentAtNode=function(e){if(!nn(e))throw Error(V(40));return e._reactRootContainer?(vr(function(){on(null,null,e,!1,function(){e._reactRootContainer=null,e[Mt]=null})}),!0):!1};st.unstable_batchedUpdates=yl;st.unstable_renderSubtreeIntoContainer=function(e,t,r,i){if(!nn(r))throw Error(V(200));if(e==null||e._reactInternals===void 0)throw Error(V(38));return on(e,t,r,!1,i)};st.version="18.3.1-next-f1338f8080-20240426";function Ju(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Ju)}catch(e){console.error(e)}}Ju(),Ja.exports=st;var Of=Ja.exports,Ia=Of;Hn.createRoot=Ia.createRoot,Hn.hydrateRoot=Ia.hydrateRoot;/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const jf=e=>e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),Hf=e=>e.replace(/^([A-Z])|[\s-_]+(\w)/g,(t,r,i)=>i?i.toUpperCase():r.toLowerCase()),Oa=e=>{const t=Hf(e);return t.charAt(0).toUpperCase()+t.slice(1)},Zu=(...e)=>e.filter((t,r,i)=>!!t&&t.trim()!==""&&i.indexOf(t)===r).join(" ").trim(),Ff=e=>{for(const t in e)if(t.startsWith("aria-")||t==="role"||t==="title")return!0};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var zf={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Nf=U.forwardRef(({color:e="currentColor",size:t=24,strokeWidth:r=2,absoluteStrokeWidth:i,className:c="",children:h,iconNode:g,...n},u)=>U.createElement("svg",{ref:u,...zf,width:t,height:t,stroke:e,strokeWidth:i?Number(r)*24/Number(t):r,className:Zu("lucide",c),...!h&&!Ff(n)&&{"aria-hidden":"true"},...n},[...g.map(([f,y])=>U.createElement(f,y)),...Array.isArray(h)?h:[h]]));/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const oe=(e,t)=>{const r=U.forwardRef(({className:i,...c},h)=>U.createElement(Nf,{ref:h,iconNode:t,className:Zu(`lucide-${jf(Oa(e))}`,`lucide-${e}`,i),...c}));return r.displayName=Oa(e),r};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Wf=[["path",{d:"M12 5v14",key:"s699le"}],["path",{d:"m19 12-7 7-7-7",key:"1idqje"}]],Uf=oe("arrow-down",Wf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const $f=[["path",{d:"m12 19-7-7 7-7",key:"1l729n"}],["path",{d:"M19 12H5",key:"x3x0zl"}]],Vf=oe("arrow-left",$f);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Kf=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"m12 5 7 7-7 7",key:"xquz4c"}]],qf=oe("arrow-right",Kf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Gf=[["path",{d:"m5 12 7-7 7 7",key:"hav0vg"}],["path",{d:"M12 19V5",key:"x0mq9r"}]],Xf=oe("arrow-up",Gf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Yf=[["path",{d:"M20 6 9 17l-5-5",key:"1gmf2c"}]],Qf=oe("check",Yf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Jf=[["path",{d:"m6 9 6 6 6-6",key:"qrunsl"}]],Zf=oe("chevron-down",Jf);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ep=[["path",{d:"m15 18-6-6 6-6",key:"1wnfg3"}]],tp=oe("chevron-left",ep);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const rp=[["path",{d:"m9 18 6-6-6-6",key:"mthhwq"}]],eh=oe("chevron-right",rp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ip=[["path",{d:"m7 6 5 5 5-5",key:"1lc07p"}],["path",{d:"m7 13 5 5 5-5",key:"1d48rs"}]],sp=oe("chevrons-down",ip);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const np=[["path",{d:"M11 14h10",key:"1w8e9d"}],["path",{d:"M16 4h2a2 2 0 0 1 2 2v1.344",key:"1e62lh"}],["path",{d:"m17 18 4-4-4-4",key:"z2g111"}],["path",{d:"M8 4H6a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h12a2 2 0 0 0 1.793-1.113",key:"bjbb7m"}],["rect",{x:"8",y:"2",width:"8",height:"4",rx:"1",key:"ublpy"}]],th=oe("clipboard-paste",np);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const op=[["rect",{width:"14",height:"14",x:"8",y:"8",rx:"2",ry:"2",key:"17jyea"}],["path",{d:"M4 16c-1.1 0-2-.9-2-2V4c0-1.1.9-2 2-2h10c1.1 0 2 .9 2 2",key:"zix9uf"}]],lp=oe("copy",op);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ap=[["path",{d:"M12 20v2",key:"1lh1kg"}],["path",{d:"M12 2v2",key:"tus03m"}],["path",{d:"M17 20v2",key:"1rnc9c"}],["path",{d:"M17 2v2",key:"11trls"}],["path",{d:"M2 12h2",key:"1t8f8n"}],["path",{d:"M2 17h2",key:"7oei6x"}],["path",{d:"M2 7h2",key:"asdhe0"}],["path",{d:"M20 12h2",key:"1q8mjw"}],["path",{d:"M20 17h2",key:"1fpfkl"}],["path",{d:"M20 7h2",key:"1o8tra"}],["path",{d:"M7 20v2",key:"4gnj0m"}],["path",{d:"M7 2v2",key:"1i4yhu"}],["rect",{x:"4",y:"4",width:"16",height:"16",rx:"2",key:"1vbyd7"}],["rect",{x:"8",y:"8",width:"8",height:"8",rx:"1",key:"z9xiuo"}]],cp=oe("cpu",ap);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const up=[["path",{d:"M21 21H8a2 2 0 0 1-1.42-.587l-3.994-3.999a2 2 0 0 1 0-2.828l10-10a2 2 0 0 1 2.829 0l5.999 6a2 2 0 0 1 0 2.828L12.834 21",key:"g5wo59"}],["path",{d:"m5.082 11.09 8.828 8.828",key:"1wx5vj"}]],rh=oe("eraser",up);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const hp=[["path",{d:"M6 22a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h8a2.4 2.4 0 0 1 1.704.706l3.588 3.588A2.4 2.4 0 0 1 20 8v12a2 2 0 0 1-2 2z",key:"1oefj6"}],["path",{d:"M14 2v5a1 1 0 0 0 1 1h5",key:"wfsgrz"}],["path",{d:"M9 15h6",key:"cctwl0"}],["path",{d:"M12 18v-6",key:"17g6i2"}]],Pn=oe("file-plus",hp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const dp=[["path",{d:"M6 22a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h8a2.4 2.4 0 0 1 1.704.706l3.588 3.588A2.4 2.4 0 0 1 20 8v12a2 2 0 0 1-2 2z",key:"1oefj6"}],["path",{d:"M14 2v5a1 1 0 0 0 1 1h5",key:"wfsgrz"}]],ih=oe("file",dp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const fp=[["path",{d:"m6 14 1.5-2.9A2 2 0 0 1 9.24 10H20a2 2 0 0 1 1.94 2.5l-1.54 6a2 2 0 0 1-1.95 1.5H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h3.9a2 2 0 0 1 1.69.9l.81 1.2a2 2 0 0 0 1.67.9H18a2 2 0 0 1 2 2v2",key:"usdka0"}]],pp=oe("folder-open",fp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _p=[["path",{d:"M12 10v6",key:"1bos4e"}],["path",{d:"M9 13h6",key:"1uhe8q"}],["path",{d:"M20 20a2 2 0 0 0 2-2V8a2 2 0 0 0-2-2h-7.9a2 2 0 0 1-1.69-.9L9.6 3.9A2 2 0 0 0 7.93 3H4a2 2 0 0 0-2 2v13a2 2 0 0 0 2 2Z",key:"1kt360"}]],In=oe("folder-plus",_p);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const gp=[["path",{d:"M20 10a1 1 0 0 0 1-1V6a1 1 0 0 0-1-1h-2.5a1 1 0 0 1-.8-.4l-.9-1.2A1 1 0 0 0 15 3h-2a1 1 0 0 0-1 1v5a1 1 0 0 0 1 1Z",key:"hod4my"}],["path",{d:"M20 21a1 1 0 0 0 1-1v-3a1 1 0 0 0-1-1h-2.9a1 1 0 0 1-.88-.55l-.42-.85a1 1 0 0 0-.92-.6H13a1 1 0 0 0-1 1v5a1 1 0 0 0 1 1Z",key:"w4yl2u"}],["path",{d:"M3 5a2 2 0 0 0 2 2h3",key:"f2jnh7"}],["path",{d:"M3 3v13a2 2 0 0 0 2 2h3",key:"k8epm1"}]],vp=oe("folder-tree",gp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const mp=[["path",{d:"M20 20a2 2 0 0 0 2-2V8a2 2 0 0 0-2-2h-7.9a2 2 0 0 1-1.69-.9L9.6 3.9A2 2 0 0 0 7.93 3H4a2 2 0 0 0-2 2v13a2 2 0 0 0 2 2Z",key:"1kt360"}]],yp=oe("folder",mp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Sp=[["path",{d:"M4 5h16",key:"1tepv9"}],["path",{d:"M4 12h16",key:"1lakjw"}],["path",{d:"M4 19h16",key:"1djgab"}]],Cp=oe("menu",Sp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const wp=[["path",{d:"M22 17a2 2 0 0 1-2 2H6.828a2 2 0 0 0-1.414.586l-2.202 2.202A.71.71 0 0 1 2 21.286V5a2 2 0 0 1 2-2h16a2 2 0 0 1 2 2z",key:"18887p"}]],xp=oe("message-square",wp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const bp=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2",key:"afitv7"}],["path",{d:"M9 3v18",key:"fh3hqa"}],["path",{d:"m16 15-3-3 3-3",key:"14y99z"}]],kp=oe("panel-left-close",bp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ep=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2",key:"afitv7"}],["path",{d:"M9 3v18",key:"fh3hqa"}]],Lp=oe("panel-left",Ep);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Dp=[["path",{d:"M21.174 6.812a1 1 0 0 0-3.986-3.987L3.842 16.174a2 2 0 0 0-.5.83l-1.321 4.352a.5.5 0 0 0 .623.622l4.353-1.32a2 2 0 0 0 .83-.497z",key:"1a8usu"}]],Rp=oe("pen",Dp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Tp=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"M12 5v14",key:"s699le"}]],ja=oe("plus",Tp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Bp=[["path",{d:"M12 2v10",key:"mnfbl"}],["path",{d:"M18.4 6.6a9 9 0 1 1-12.77.04",key:"obofu9"}]],Ha=oe("power",Bp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ap=[["path",{d:"M3 12a9 9 0 0 1 9-9 9.75 9.75 0 0 1 6.74 2.74L21 8",key:"v9h5vc"}],["path",{d:"M21 3v5h-5",key:"1q7to0"}],["path",{d:"M21 12a9 9 0 0 1-9 9 9.75 9.75 0 0 1-6.74-2.74L3 16",key:"3uifl3"}],["path",{d:"M8 16H3v5",key:"1cv678"}]],Mp=oe("refresh-cw",Ap);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Pp=[["path",{d:"M15.2 3a2 2 0 0 1 1.4.6l3.8 3.8a2 2 0 0 1 .6 1.4V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2z",key:"1c8476"}],["path",{d:"M17 21v-7a1 1 0 0 0-1-1H8a1 1 0 0 0-1 1v7",key:"1ydtos"}],["path",{d:"M7 3v4a1 1 0 0 0 1 1h7",key:"t51u73"}]],Ip=oe("save",Pp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Op=[["path",{d:"M14.536 21.686a.5.5 0 0 0 .937-.024l6.5-19a.496.496 0 0 0-.635-.635l-19 6.5a.5.5 0 0 0-.024.937l7.93 3.18a2 2 0 0 1 1.112 1.11z",key:"1ffxy3"}],["path",{d:"m21.854 2.147-10.94 10.939",key:"12cjpa"}]],jp=oe("send",Op);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Hp=[["path",{d:"M9.671 4.136a2.34 2.34 0 0 1 4.659 0 2.34 2.34 0 0 0 3.319 1.915 2.34 2.34 0 0 1 2.33 4.033 2.34 2.34 0 0 0 0 3.831 2.34 2.34 0 0 1-2.33 4.033 2.34 2.34 0 0 0-3.319 1.915 2.34 2.34 0 0 1-4.659 0 2.34 2.34 0 0 0-3.32-1.915 2.34 2.34 0 0 1-2.33-4.033 2.34 2.34 0 0 0 0-3.831A2.34 2.34 0 0 1 6.35 6.051a2.34 2.34 0 0 0 3.319-1.915",key:"1i5ecw"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],Fa=oe("settings",Hp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Fp=[["path",{d:"M12 19h8",key:"baeox8"}],["path",{d:"m4 17 6-6-6-6",key:"1yngyt"}]],Ao=oe("terminal",Fp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const zp=[["path",{d:"M10 11v6",key:"nco0om"}],["path",{d:"M14 11v6",key:"outv1u"}],["path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6",key:"miytrc"}],["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2",key:"e791ji"}]],Np=oe("trash-2",zp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Wp=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],Gr=oe("x",Wp);var sh={exports:{}};(function(e,t){(function(r,i){e.exports=i()})(self,()=>(()=>{var r={4567:function(g,n,u){var f=this&&this.__decorate||function(o,p,m,x){var E,v=arguments.length,k=v<3?p:x===null?x=Object.getOwnPropertyDescriptor(p,m):x;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")k=Reflect.decorate(o,p,m,x);else for(var T=o.length-1;T>=0;T--)(E=o[T])&&(k=(v<3?E(k):v>3?E(p,m,k):E(p,m))||k);return v>3&&k&&Object.defineProperty(p,m,k),k},y=this&&this.__param||function(o,p){return function(m,x){p(m,x,o)}};Object.defineProperty(n,"__esModule",{value:!0}),n.AccessibilityManager=void 0;const d=u(9042),_=u(6114),S=u(9924),w=u(844),C=u(5596),a=u(4725),l=u(3656);let s=n.AccessibilityManager=class extends w.Disposable{constructor(o,p){super(),this._terminal=o,this._renderService=p,this._liveRegionLineCount=0,this._charsToConsume=[],this._charsToAnnounce="",this._accessibilityContainer=document.createElement("div"),this._accessibilityContainer.classList.add("xterm-accessibility"),this._rowContainer=document.createElement("div"),this._rowContainer.setAttribute("role","list"),this._rowContainer.classList.add("xterm-accessibility-tree"),this._rowElements=[];for(let m=0;m<this._terminal.rows;m++)this._rowElements[m]=this._createAccessibilityTreeNode(),this._rowContainer.appendChild(this._rowElements[m]);if(this._topBoundaryFocusListener=m=>this._handleBoundaryFocus(m,0),this._bottomBoundaryFocusListener=m=>this._handleBoundaryFocus(m,1),this._rowElements[0].addEventListener("focus",this._topBoundaryFocusListener),this._rowElements[this._rowElements.length-1].addEventListener("focus",this._bottomBoundaryFocusListener),this._refreshRowsDimensions(),this._accessibilityContainer.appendChild(this._rowContainer),this._liveRegion=document.createElement("div"),this._liveRegion.classList.add("live-region"),this._liveRegion.setAttribute("aria-live","assertive"),this._accessibilityContainer.appendChild(this._liveRegion),this._liveRegionDebouncer=this.register(new S.TimeBasedDebouncer(this._renderRows.bind(this))),!this._terminal.element)throw new Error("Cannot enable accessibility before Terminal.open");this._terminal.element.insertAdjacentElement("afterbegin",this._accessibilityContainer),this.register(this._terminal.onResize(m=>this._handleResize(m.rows))),this.register(this._terminal.onRender(m=>this._refreshRows(m.start,m.end))),this.register(this._terminal.onScroll(()=>this._refreshRows())),this.register(this._terminal.onA11yChar(m=>this._handleChar(m))),this.register(this._terminal.onLineFeed(()=>this._handleChar(`
-`))),this.register(this._terminal.onA11yTab(m=>this._handleTab(m))),this.register(this._terminal.onKey(m=>this._handleKey(m.key))),this.register(this._terminal.onBlur(()=>this._clearLiveRegion())),this.register(this._renderService.onDimensionsChange(()=>this._refreshRowsDimensions())),this._screenDprMonitor=new C.ScreenDprMonitor(window),this.register(this._screenDprMonitor),this._screenDprMonitor.setListener(()=>this._refreshRowsDimensions()),this.register((0,l.addDisposableDomListener)(window,"resize",()=>this._refreshRowsDimensions())),this._refreshRows(),this.register((0,w.toDisposable)(()=>{this._accessibilityContainer.remove(),this._rowElements.length=0}))}_handleTab(o){for(let p=0;p<o;p++)this._handleChar(" ")}_handleChar(o){this._liveRegionLineCount<21&&(this._charsToConsume.length>0?this._charsToConsume.shift()!==o&&(this._charsToAnnounce+=o):this._charsToAnnounce+=o,o===`
-`&&(this._liveRegionLineCount++,this._liveRegionLineCount===21&&(this._liveRegion.textContent+=d.tooMuchOutput)),_.isMac&&this._liveRegion.textContent&&this._liveRegion.textContent.length>0&&!this._liveRegion.parentNode&&setTimeout(()=>{this._accessibilityContainer.appendChild(this._liveRegion)},0))}_clearLiveRegion(){this._liveRegion.textContent="",this._liveRegionLineCount=0,_.isMac&&this._liveRegion.remove()}_handleKey(o){this._clearLiveRegion(),new RegExp("\\p{Control}","u").test(o)||this._charsToConsume.push(o)}_refreshRows(o,p){this._liveRegionDebouncer.refresh(o,p,this._terminal.rows)}_renderRows(o,p){const m=this._terminal.buffer,x=m.lines.length.toString();for(let E=o;E<=p;E++){const v=m.translateBufferLineToString(m.ydisp+E,!0),k=(m.ydisp+E+1).toString(),T=this._rowElements[E];T&&(v.length===0?T.innerText=" ":T.textContent=v,T.setAttribute("aria-posinset",k),T.setAttribute("aria-setsize",x))}this._announceCharacters()}_announceCharacters(){this._charsToAnnounce.length!==0&&(this._liveRegion.textContent+=this._charsToAnnounce,this._charsToAnnounce="")}_handleBoundaryFocus(o,p){const m=o.target,x=this._rowElements[p===0?1:this._rowElements.length-2];if(m.getAttribute("aria-posinset")===(p===0?"1":`${this._terminal.buffer.lines.length}`)||o.relatedTarget!==x)return;let E,v;if(p===0?(E=m,v=this._rowElements.pop(),this._rowContainer.removeChild(v)):(E=this._rowElements.shift(),v=m,this._rowContainer.removeChild(E)),E.removeEventListener("focus",this._topBoundaryFocusListener),v.removeEventListener("focus",this._bottomBoundaryFocusListener),p===0){const k=this._createAccessibilityTreeNode();this._rowElements.unshift(k),this._rowContainer.insertAdjacentElement("afterbegin",k)}else{const k=this._createAccessibilityTreeNode();this._rowElements.push(k),this._rowContainer.appendChild(k)}this._rowElements[0].addEventListener("focus",this._topBoundaryFocusListener),this._rowElements[this._rowElements.length-1].addEventListener("focus",this._bottomBoundaryFocusListener),this._terminal.scrollLines(p===0?-1:1),this._rowElements[p===0?1:this._rowElements.length-2].focus(),o.preventDefault(),o.stopImmediatePropagation()}_handleResize(o){this._rowElements[this._rowElements.length-1].removeEventListener("focus",this._bottomBoundaryFocusListener);for(let p=this._rowContainer.children.length;p<this._terminal.rows;p++)this._rowElements[p]=this._createAccessibilityTreeNode(),this._rowContainer.appendChild(this._rowElements[p]);for(;this._rowElements.length>o;)this._rowContainer.removeChild(this._rowElements.pop());this._rowElements[this._rowElements.length-1].addEventListener("focus",this._bottomBoundaryFocusListener),this._refreshRowsDimensions()}_createAccessibilityTreeNode(){const o=document.createElement("div");return o.setAttribute("role","listitem"),o.tabIndex=-1,this._refreshRowDimensions(o),o}_refreshRowsDimensions(){if(this._renderService.dimensions.css.cell.height){this._accessibilityContainer.style.width=`${this._renderService.dimensions.css.canvas.width}px`,this._rowElements.length!==this._terminal.rows&&this._handleResize(this._terminal.rows);for(let o=0;o<this._terminal.rows;o++)this._refreshRowDimensions(this._rowElements[o])}}_refreshRowDimensions(o){o.style.height=`${this._renderService.dimensions.css.cell.height}px`}};n.AccessibilityManager=s=f([y(1,a.IRenderService)],s)},3614:(g,n)=>{function u(_){return _.replace(/\r?\n/g,"\r")}function f(_,S){return S?"\x1B[200~"+_+"\x1B[201~":_}function y(_,S,w,C){_=f(_=u(_),w.decPrivateModes.bracketedPasteMode&&C.rawOptions.ignoreBracketedPasteMode!==!0),w.triggerDataEvent(_,!0),S.value=""}function d(_,S,w){const C=w.getBoundingClientRect(),a=_.clientX-C.left-10,l=_.clientY-C.top-10;S.style.width="20px",S.style.height="20px",S.style.left=`${a}px`,S.style.top=`${l}px`,S.style.zIndex="1000",S.focus()}Object.defineProperty(n,"__esModule",{value:!0}),n.rightClickHandler=n.moveTextAreaUnderMouseCursor=n.paste=n.handlePasteEvent=n.copyHandler=n.bracketTextForPaste=n.prepareTextForTerminal=void 0,n.prepareTextForTerminal=u,n.bracketTextForPaste=f,n.copyHandler=function(_,S){_.clipboardData&&_.clipboardData.setData("text/plain",S.selectionText),_.preventDefault()},n.handlePasteEvent=function(_,S,w,C){_.stopPropagation(),_.clipboardData&&y(_.clipboardData.getData("text/plain"),S,w,C)},n.paste=y,n.moveTextAreaUnderMouseCursor=d,n.rightClickHandler=function(_,S,w,C,a){d(_,S,w),a&&C.rightClickSelect(_),S.value=C.selectionText,S.select()}},7239:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ColorContrastCache=void 0;const f=u(1505);n.ColorContrastCache=class{constructor(){this._color=new f.TwoKeyMap,this._css=new f.TwoKeyMap}setCss(y,d,_){this._css.set(y,d,_)}getCss(y,d){return this._css.get(y,d)}setColor(y,d,_){this._color.set(y,d,_)}getColor(y,d){return this._color.get(y,d)}clear(){this._color.clear(),this._css.clear()}}},3656:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.addDisposableDomListener=void 0,n.addDisposableDomListener=function(u,f,y,d){u.addEventListener(f,y,d);let _=!1;return{dispose:()=>{_||(_=!0,u.removeEventListener(f,y,d))}}}},6465:function(g,n,u){var f=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.Linkifier2=void 0;const d=u(3656),_=u(8460),S=u(844),w=u(2585);let C=n.Linkifier2=class extends S.Disposable{get currentLink(){return this._currentLink}constructor(a){super(),this._bufferService=a,this._linkProviders=[],this._linkCacheDisposables=[],this._isMouseOut=!0,this._wasResized=!1,this._activeLine=-1,this._onShowLinkUnderline=this.register(new _.EventEmitter),this.onShowLinkUnderline=this._onShowLinkUnderline.event,this._onHideLinkUnderline=this.register(new _.EventEmitter),this.onHideLinkUnderline=this._onHideLinkUnderline.event,this.register((0,S.getDisposeArrayDisposable)(this._linkCacheDisposables)),this.register((0,S.toDisposable)(()=>{this._lastMouseEvent=void 0})),this.register(this._bufferService.onResize(()=>{this._clearCurrentLink(),this._wasResized=!0}))}registerLinkProvider(a){return this._linkProviders.push(a),{dispose:()=>{const l=this._linkProviders.indexOf(a);l!==-1&&this._linkProviders.splice(l,1)}}}attachToDom(a,l,s){this._element=a,this._mouseService=l,this._renderService=s,this.register((0,d.addDisposableDomListener)(this._element,"mouseleave",()=>{this._isMouseOut=!0,this._clearCurrentLink()})),this.register((0,d.addDisposableDomListener)(this._element,"mousemove",this._handleMouseMove.bind(this))),this.register((0,d.addDisposableDomListener)(this._element,"mousedown",this._handleMouseDown.bind(this))),this.register((0,d.addDisposableDomListener)(this._element,"mouseup",this._handleMouseUp.bind(this)))}_handleMouseMove(a){if(this._lastMouseEvent=a,!this._element||!this._mouseService)return;const l=this._positionFromMouseEvent(a,this._element,this._mouseService);if(!l)return;this._isMouseOut=!1;const s=a.composedPath();for(let o=0;o<s.length;o++){const p=s[o];if(p.classList.contains("xterm"))break;if(p.classList.contains("xterm-hover"))return}this._lastBufferCell&&l.x===this._lastBufferCell.x&&l.y===this._lastBufferCell.y||(this._handleHover(l),this._lastBufferCell=l)}_handleHover(a){if(this._activeLine!==a.y||this._wasResized)return this._clearCurrentLink(),this._askForLink(a,!1),void(this._wasResized=!1);this._currentLink&&this._linkAtPosition(this._currentLink.link,a)||(this._clearCurrentLink(),this._askForLink(a,!0))}_askForLink(a,l){var s,o;this._activeProviderReplies&&l||((s=this._activeProviderReplies)===null||s===void 0||s.forEach(m=>{m==null||m.forEach(x=>{x.link.dispose&&x.link.dispose()})}),this._activeProviderReplies=new Map,this._activeLine=a.y);let p=!1;for(const[m,x]of this._linkProviders.entries())l?!((o=this._activeProviderReplies)===null||o===void 0)&&o.get(m)&&(p=this._checkLinkProviderResult(m,a,p)):x.provideLinks(a.y,E=>{var v,k;if(this._isMouseOut)return;const T=E==null?void 0:E.map(P=>({link:P}));(v=this._activeProviderReplies)===null||v===void 0||v.set(m,T),p=this._checkLinkProviderResult(m,a,p),((k=this._activeProviderReplies)===null||k===void 0?void 0:k.size)===this._linkProviders.length&&this._removeIntersectingLinks(a.y,this._activeProviderReplies)})}_removeIntersectingLinks(a,l){const s=new Set;for(let o=0;o<l.size;o++){const p=l.get(o);if(p)for(let m=0;m<p.length;m++){const x=p[m],E=x.link.range.start.y<a?0:x.link.range.start.x,v=x.link.range.end.y>a?this._bufferService.cols:x.link.range.end.x;for(let k=E;k<=v;k++){if(s.has(k)){p.splice(m--,1);break}s.add(k)}}}}_checkLinkProviderResult(a,l,s){var o;if(!this._activeProviderReplies)return s;const p=this._activeProviderReplies.get(a);let m=!1;for(let x=0;x<a;x++)this._activeProviderReplies.has(x)&&!this._activeProviderReplies.get(x)||(m=!0);if(!m&&p){const x=p.find(E=>this._linkAtPosition(E.link,l));x&&(s=!0,this._handleNewLink(x))}if(this._activeProviderReplies.size===this._linkProviders.length&&!s)for(let x=0;x<this._activeProviderReplies.size;x++){const E=(o=this._activeProviderReplies.get(x))===null||o===void 0?void 0:o.find(v=>this._linkAtPosition(v.link,l));if(E){s=!0,this._handleNewLink(E);break}}return s}_handleMouseDown(){this._mouseDownLink=this._currentLink}_handleMouseUp(a){if(!this._element||!this._mouseService||!this._currentLink)return;const l=this._positionFromMouseEvent(a,this._element,this._mouseService);l&&this._mouseDownLink===this._currentLink&&this._linkAtPosition(this._currentLink.link,l)&&this._currentLink.link.activate(a,this._currentLink.link.text)}_clearCurrentLink(a,l){this._element&&this._currentLink&&this._lastMouseEvent&&(!a||!l||this._currentLink.link.range.start.y>=a&&this._currentLink.link.range.end.y<=l)&&(this._linkLeave(this._element,this._currentLink.link,this._lastMouseEvent),this._currentLink=void 0,(0,S.disposeArray)(this._linkCacheDisposables))}_handleNewLink(a){if(!this._element||!this._lastMouseEvent||!this._mouseService)return;const l=this._positionFromMouseEvent(this._lastMouseEvent,this._element,this._mouseService);l&&this._linkAtPosition(a.link,l)&&(this._currentLink=a,this._currentLink.state={decorations:{underline:a.link.decorations===void 0||a.link.decorations.underline,pointerCursor:a.link.decorations===void 0||a.link.decorations.pointerCursor},isHovered:!0},this._linkHover(this._element,a.link,this._lastMouseEvent),a.link.decorations={},Object.defineProperties(a.link.decorations,{pointerCursor:{get:()=>{var s,o;return(o=(s=this._currentLink)===null||s===void 0?void 0:s.state)===null||o===void 0?void 0:o.decorations.pointerCursor},set:s=>{var o,p;!((o=this._currentLink)===null||o===void 0)&&o.state&&this._currentLink.state.decorations.pointerCursor!==s&&(this._currentLink.state.decorations.pointerCursor=s,this._currentLink.state.isHovered&&((p=this._element)===null||p===void 0||p.classList.toggle("xterm-cursor-pointer",s)))}},underline:{get:()=>{var s,o;return(o=(s=this._currentLink)===null||s===void 0?void 0:s.state)===null||o===void 0?void 0:o.decorations.underline},set:s=>{var o,p,m;!((o=this._currentLink)===null||o===void 0)&&o.state&&((m=(p=this._currentLink)===null||p===void 0?void 0:p.state)===null||m===void 0?void 0:m.decorations.underline)!==s&&(this._currentLink.state.decorations.underline=s,this._currentLink.state.isHovered&&this._fireUnderlineEvent(a.link,s))}}}),this._renderService&&this._linkCacheDisposables.push(this._renderService.onRenderedViewportChange(s=>{if(!this._currentLink)return;const o=s.start===0?0:s.start+1+this._bufferService.buffer.ydisp,p=this._bufferService.buffer.ydisp+1+s.end;if(this._currentLink.link.range.start.y>=o&&this._currentLink.link.range.end.y<=p&&(this._clearCurrentLink(o,p),this._lastMouseEvent&&this._element)){const m=this._positionFromMouseEvent(this._lastMouseEvent,this._element,this._mouseService);m&&this._askForLink(m,!1)}})))}_linkHover(a,l,s){var o;!((o=this._currentLink)===null||o===void 0)&&o.state&&(this._currentLink.state.isHovered=!0,this._currentLink.state.decorations.underline&&this._fireUnderlineEvent(l,!0),this._currentLink.state.decorations.pointerCursor&&a.classList.add("xterm-cursor-pointer")),l.hover&&l.hover(s,l.text)}_fireUnderlineEvent(a,l){const s=a.range,o=this._bufferService.buffer.ydisp,p=this._createLinkUnderlineEvent(s.start.x-1,s.start.y-o-1,s.end.x,s.end.y-o-1,void 0);(l?this._onShowLinkUnderline:this._onHideLinkUnderline).fire(p)}_linkLeave(a,l,s){var o;!((o=this._currentLink)===null||o===void 0)&&o.state&&(this._currentLink.state.isHovered=!1,this._currentLink.state.decorations.underline&&this._fireUnderlineEvent(l,!1),this._currentLink.state.decorations.pointerCursor&&a.classList.remove("xterm-cursor-pointer")),l.leave&&l.leave(s,l.text)}_linkAtPosition(a,l){const s=a.range.start.y*this._bufferService.cols+a.range.start.x,o=a.range.end.y*this._bufferService.cols+a.range.end.x,p=l.y*this._bufferService.cols+l.x;return s<=p&&p<=o}_positionFromMouseEvent(a,l,s){const o=s.getCoords(a,l,this._bufferService.cols,this._bufferService.rows);if(o)return{x:o[0],y:o[1]+this._bufferService.buffer.ydisp}}_createLinkUnderlineEvent(a,l,s,o,p){return{x1:a,y1:l,x2:s,y2:o,cols:this._bufferService.cols,fg:p}}};n.Linkifier2=C=f([y(0,w.IBufferService)],C)},9042:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.tooMuchOutput=n.promptLabel=void 0,n.promptLabel="Terminal input",n.tooMuchOutput="Too much output to announce, navigate to rows manually to read"},3730:function(g,n,u){var f=this&&this.__decorate||function(C,a,l,s){var o,p=arguments.length,m=p<3?a:s===null?s=Object.getOwnPropertyDescriptor(a,l):s;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")m=Reflect.decorate(C,a,l,s);else for(var x=C.length-1;x>=0;x--)(o=C[x])&&(m=(p<3?o(m):p>3?o(a,l,m):o(a,l))||m);return p>3&&m&&Object.defineProperty(a,l,m),m},y=this&&this.__param||function(C,a){return function(l,s){a(l,s,C)}};Object.defineProperty(n,"__esModule",{value:!0}),n.OscLinkProvider=void 0;const d=u(511),_=u(2585);let S=n.OscLinkProvider=class{constructor(C,a,l){this._bufferService=C,this._optionsService=a,this._oscLinkService=l}provideLinks(C,a){var l;const s=this._bufferService.buffer.lines.get(C-1);if(!s)return void a(void 0);const o=[],p=this._optionsService.rawOptions.linkHandler,m=new d.CellData,x=s.getTrimmedLength();let E=-1,v=-1,k=!1;for(let T=0;T<x;T++)if(v!==-1||s.hasContent(T)){if(s.loadCell(T,m),m.hasExtendedAttrs()&&m.extended.urlId){if(v===-1){v=T,E=m.extended.urlId;continue}k=m.extended.urlId!==E}else v!==-1&&(k=!0);if(k||v!==-1&&T===x-1){const P=(l=this._oscLinkService.getLinkData(E))===null||l===void 0?void 0:l.uri;if(P){const B={start:{x:v+1,y:C},end:{x:T+(k||T!==x-1?0:1),y:C}};let I=!1;if(!(p!=null&&p.allowNonHttpProtocols))try{const F=new URL(P);["http:","https:"].includes(F.protocol)||(I=!0)}catch{I=!0}I||o.push({text:P,range:B,activate:(F,H)=>p?p.activate(F,H,B):w(0,H),hover:(F,H)=>{var W;return(W=p==null?void 0:p.hover)===null||W===void 0?void 0:W.call(p,F,H,B)},leave:(F,H)=>{var W;return(W=p==null?void 0:p.leave)===null||W===void 0?void 0:W.call(p,F,H,B)}})}k=!1,m.hasExtendedAttrs()&&m.extended.urlId?(v=T,E=m.extended.urlId):(v=-1,E=-1)}}a(o)}};function w(C,a){if(confirm(`Do you want to navigate to ${a}?
-
-WARNING: This link could potentially be dangerous`)){const l=window.open();if(l){try{l.opener=null}catch{}l.location.href=a}else console.warn("Opening link blocked as opener could not be cleared")}}n.OscLinkProvider=S=f([y(0,_.IBufferService),y(1,_.IOptionsService),y(2,_.IOscLinkService)],S)},6193:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.RenderDebouncer=void 0,n.RenderDebouncer=class{constructor(u,f){this._parentWindow=u,this._renderCallback=f,this._refreshCallbacks=[]}dispose(){this._animationFrame&&(this._parentWindow.cancelAnimationFrame(this._animationFrame),this._animationFrame=void 0)}addRefreshCallback(u){return this._refreshCallbacks.push(u),this._animationFrame||(this._animationFrame=this._parentWindow.requestAnimationFrame(()=>this._innerRefresh())),this._animationFrame}refresh(u,f,y){this._rowCount=y,u=u!==void 0?u:0,f=f!==void 0?f:this._rowCount-1,this._rowStart=this._rowStart!==void 0?Math.min(this._rowStart,u):u,this._rowEnd=this._rowEnd!==void 0?Math.max(this._rowEnd,f):f,this._animationFrame||(this._animationFrame=this._parentWindow.requestAnimationFrame(()=>this._innerRefresh()))}_innerRefresh(){if(this._animationFrame=void 0,this._rowStart===void 0||this._rowEnd===void 0||this._rowCount===void 0)return void this._runRefreshCallbacks();const u=Math.max(this._rowStart,0),f=Math.min(this._rowEnd,this._rowCount-1);this._rowStart=void 0,this._rowEnd=void 0,this._renderCallback(u,f),this._runRefreshCallbacks()}_runRefreshCallbacks(){for(const u of this._refreshCallbacks)u(0);this._refreshCallbacks=[]}}},5596:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ScreenDprMonitor=void 0;const f=u(844);class y extends f.Disposable{constructor(_){super(),this._parentWindow=_,this._currentDevicePixelRatio=this._parentWindow.devicePixelRatio,this.register((0,f.toDisposable)(()=>{this.clearListener()}))}setListener(_){this._listener&&this.clearListener(),this._listener=_,this._outerListener=()=>{this._listener&&(this._listener(this._parentWindow.devicePixelRatio,this._currentDevicePixelRatio),this._updateDpr())},this._updateDpr()}_updateDpr(){var _;this._outerListener&&((_=this._resolutionMediaMatchList)===null||_===void 0||_.removeListener(this._outerListener),this._currentDevicePixelRatio=this._parentWindow.devicePixelRatio,this._resolutionMediaMatchList=this._parentWindow.matchMedia(`screen and (resolution: ${this._parentWindow.devicePixelRatio}dppx)`),this._resolutionMediaMatchList.addListener(this._outerListener))}clearListener(){this._resolutionMediaMatchList&&this._listener&&this._outerListener&&(this._resolutionMediaMatchList.removeListener(this._outerListener),this._resolutionMediaMatchList=void 0,this._listener=void 0,this._outerListener=void 0)}}n.ScreenDprMonitor=y},3236:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Terminal=void 0;const f=u(3614),y=u(3656),d=u(6465),_=u(9042),S=u(3730),w=u(1680),C=u(3107),a=u(5744),l=u(2950),s=u(1296),o=u(428),p=u(4269),m=u(5114),x=u(8934),E=u(3230),v=u(9312),k=u(4725),T=u(6731),P=u(8055),B=u(8969),I=u(8460),F=u(844),H=u(6114),W=u(8437),O=u(2584),b=u(7399),R=u(5941),A=u(9074),M=u(2585),z=u(5435),q=u(4567),Q=typeof window<"u"?window.document:null;class Y extends B.CoreTerminal{get onFocus(){return this._onFocus.event}get onBlur(){return this._onBlur.event}get onA11yChar(){return this._onA11yCharEmitter.event}get onA11yTab(){return this._onA11yTabEmitter.event}get onWillOpen(){return this._onWillOpen.event}constructor(D={}){super(D),this.browser=H,this._keyDownHandled=!1,this._keyDownSeen=!1,this._keyPressHandled=!1,this._unprocessedDeadKey=!1,this._accessibilityManager=this.register(new F.MutableDisposable),this._onCursorMove=this.register(new I.EventEmitter),this.onCursorMove=this._onCursorMove.event,this._onKey=this.register(new I.EventEmitter),this.onKey=this._onKey.event,this._onRender=this.register(new I.EventEmitter),this.onRender=this._onRender.event,this._onSelectionChange=this.register(new I.EventEmitter),this.onSelectionChange=this._onSelectionChange.event,this._onTitleChange=this.register(new I.EventEmitter),this.onTitleChange=this._onTitleChange.event,this._onBell=this.register(new I.EventEmitter),this.onBell=this._onBell.event,this._onFocus=this.register(new I.EventEmitter),this._onBlur=this.register(new I.EventEmitter),this._onA11yCharEmitter=this.register(new I.EventEmitter),this._onA11yTabEmitter=this.register(new I.EventEmitter),this._onWillOpen=this.register(new I.EventEmitter),this._setup(),this.linkifier2=this.register(this._instantiationService.createInstance(d.Linkifier2)),this.linkifier2.registerLinkProvider(this._instantiationService.createInstance(S.OscLinkProvider)),this._decorationService=this._instantiationService.createInstance(A.DecorationService),this._instantiationService.setService(M.IDecorationService,this._decorationService),this.register(this._inputHandler.onRequestBell(()=>this._onBell.fire())),this.register(this._inputHandler.onRequestRefreshRows((j,$)=>this.refresh(j,$))),this.register(this._inputHandler.onRequestSendFocus(()=>this._reportFocus())),this.register(this._inputHandler.onRequestReset(()=>this.reset())),this.register(this._inputHandler.onRequestWindowsOptionsReport(j=>this._reportWindowsOptions(j))),this.register(this._inputHandler.onColor(j=>this._handleColorEvent(j))),this.register((0,I.forwardEvent)(this._inputHandler.onCursorMove,this._onCursorMove)),this.register((0,I.forwardEvent)(this._inputHandler.onTitleChange,this._onTitleChange)),this.register((0,I.forwardEvent)(this._inputHandler.onA11yChar,this._onA11yCharEmitter)),this.register((0,I.forwardEvent)(this._inputHandler.onA11yTab,this._onA11yTabEmitter)),this.register(this._bufferService.onResize(j=>this._afterResize(j.cols,j.rows))),this.register((0,F.toDisposable)(()=>{var j,$;this._customKeyEventHandler=void 0,($=(j=this.element)===null||j===void 0?void 0:j.parentNode)===null||$===void 0||$.removeChild(this.element)}))}_handleColorEvent(D){if(this._themeService)for(const j of D){let $,N="";switch(j.index){case 256:$="foreground",N="10";break;case 257:$="background",N="11";break;case 258:$="cursor",N="12";break;default:$="ansi",N="4;"+j.index}switch(j.type){case 0:const Z=P.color.toColorRGB($==="ansi"?this._themeService.colors.ansi[j.index]:this._themeService.colors[$]);this.coreService.triggerDataEvent(`${O.C0.ESC}]${N};${(0,R.toRgbString)(Z)}${O.C1_ESCAPED.ST}`);break;case 1:if($==="ansi")this._themeService.modifyColors(G=>G.ansi[j.index]=P.rgba.toColor(...j.color));else{const G=$;this._themeService.modifyColors(ae=>ae[G]=P.rgba.toColor(...j.color))}break;case 2:this._themeService.restoreColor(j.index)}}}_setup(){super._setup(),this._customKeyEventHandler=void 0}get buffer(){return this.buffers.active}focus(){this.textarea&&this.textarea.focus({preventScroll:!0})}_handleScreenReaderModeOptionChange(D){D?!this._accessibilityManager.value&&this._renderService&&(this._accessibilityManager.value=this._instantiationService.createInstance(q.AccessibilityManager,this)):this._accessibilityManager.clear()}_handleTextAreaFocus(D){this.coreService.decPrivateModes.sendFocus&&this.coreService.triggerDataEvent(O.C0.ESC+"[I"),this.updateCursorStyle(D),this.element.classList.add("focus"),this._showCursor(),this._onFocus.fire()}blur(){var D;return(D=this.textarea)===null||D===void 0?void 0:D.blur()}_handleTextAreaBlur(){this.textarea.value="",this.refresh(this.buffer.y,this.buffer.y),this.coreService.decPrivateModes.sendFocus&&this.coreService.triggerDataEvent(O.C0.ESC+"[O"),this.element.classList.remove("focus"),this._onBlur.fire()}_syncTextArea(){if(!this.textarea||!this.buffer.isCursorInViewport||this._compositionHelper.isComposing||!this._renderService)return;const D=this.buffer.ybase+this.buffer.y,j=this.buffer.lines.get(D);if(!j)return;const $=Math.min(this.buffer.x,this.cols-1),N=this._renderService.dimensions.css.cell.height,Z=j.getWidth($),G=this._renderService.dimensions.css.cell.width*Z,ae=this.buffer.y*this._renderService.dimensions.css.cell.height,Ee=$*this._renderService.dimensions.css.cell.width;this.textarea.style.left=Ee+"px",this.textarea.style.top=ae+"px",this.textarea.style.width=G+"px",this.textarea.style.height=N+"px",this.textarea.style.lineHeight=N+"px",this.textarea.style.zIndex="-5"}_initGlobal(){this._bindKeys(),this.register((0,y.addDisposableDomListener)(this.element,"copy",j=>{this.hasSelection()&&(0,f.copyHandler)(j,this._selectionService)}));const D=j=>(0,f.handlePasteEvent)(j,this.textarea,this.coreService,this.optionsService);this.register((0,y.addDisposableDomListener)(this.textarea,"paste",D)),this.register((0,y.addDisposableDomListener)(this.element,"paste",D)),H.isFirefox?this.register((0,y.addDisposableDomListener)(this.element,"mousedown",j=>{j.button===2&&(0,f.rightClickHandler)(j,this.textarea,this.screenElement,this._selectionService,this.options.rightClickSelectsWord)})):this.register((0,y.addDisposableDomListener)(this.element,"contextmenu",j=>{(0,f.rightClickHandler)(j,this.textarea,this.screenElement,this._selectionService,this.options.rightClickSelectsWord)})),H.isLinux&&this.register((0,y.addDisposableDomListener)(this.element,"auxclick",j=>{j.button===1&&(0,f.moveTextAreaUnderMouseCursor)(j,this.textarea,this.screenElement)}))}_bindKeys(){this.register((0,y.addDisposableDomListener)(this.textarea,"keyup",D=>this._keyUp(D),!0)),this.register((0,y.addDisposableDomListener)(this.textarea,"keydown",D=>this._keyDown(D),!0)),this.register((0,y.addDisposableDomListener)(this.textarea,"keypress",D=>this._keyPress(D),!0)),this.register((0,y.addDisposableDomListener)(this.textarea,"compositionstart",()=>this._compositionHelper.compositionstart())),this.register((0,y.addDisposableDomListener)(this.textarea,"compositionupdate",D=>this._compositionHelper.compositionupdate(D))),this.register((0,y.addDisposableDomListener)(this.textarea,"compositionend",()=>this._compositionHelper.compositionend())),this.register((0,y.addDisposableDomListener)(this.textarea,"input",D=>this._inputEvent(D),!0)),this.register(this.onRender(()=>this._compositionHelper.updateCompositionElements()))}open(D){var j;if(!D)throw new Error("Terminal requires a parent element.");D.isConnected||this._logService.debug("Terminal.open was called on an element that was not attached to the DOM"),this._document=D.ownerDocument,this.element=this._document.createElement("div"),this.element.dir="ltr",this.element.classList.add("terminal"),this.element.classList.add("xterm"),D.appendChild(this.element);const $=Q.createDocumentFragment();this._viewportElement=Q.createElement("div"),this._viewportElement.classList.add("xterm-viewport"),$.appendChild(this._viewportElement),this._viewportScrollArea=Q.createElement("div"),this._viewportScrollArea.classList.add("xterm-scroll-area"),this._viewportElement.appendChild(this._viewportScrollArea),this.screenElement=Q.createElement("div"),this.screenElement.classList.add("xterm-screen"),this._helperContainer=Q.createElement("div"),this._helperContainer.classList.add("xterm-helpers"),this.screenElement.appendChild(this._helperContainer),$.appendChild(this.screenElement),this.textarea=Q.createElement("textarea"),this.textarea.classList.add("xterm-helper-textarea"),this.textarea.setAttribute("aria-label",_.promptLabel),H.isChromeOS||this.textarea.setAttribute("aria-multiline","false"),this.textarea.setAttribute("autocorrect","off"),this.textarea.setAttribute("autocapitalize","off"),this.textarea.setAttribute("spellcheck","false"),this.textarea.tabIndex=0,this._coreBrowserService=this._instantiationService.createInstance(m.CoreBrowserService,this.textarea,(j=this._document.defaultView)!==null&&j!==void 0?j:window),this._instantiationService.setService(k.ICoreBrowserService,this._coreBrowserService),this.register((0,y.addDisposableDomListener)(this.textarea,"focus",N=>this._handleTextAreaFocus(N))),this.register((0,y.addDisposableDomListener)(this.textarea,"blur",()=>this._handleTextAreaBlur())),this._helperContainer.appendChild(this.textarea),this._charSizeService=this._instantiationService.createInstance(o.CharSizeService,this._document,this._helperContainer),this._instantiationService.setService(k.ICharSizeService,this._charSizeService),this._themeService=this._instantiationService.createInstance(T.ThemeService),this._instantiationService.setService(k.IThemeService,this._themeService),this._characterJoinerService=this._instantiationService.createInstance(p.CharacterJoinerService),this._instantiationService.setService(k.ICharacterJoinerService,this._characterJoinerService),this._renderService=this.register(this._instantiationService.createInstance(E.RenderService,this.rows,this.screenElement)),this._instantiationService.setService(k.IRenderService,this._renderService),this.register(this._renderService.onRenderedViewportChange(N=>this._onRender.fire(N))),this.onResize(N=>this._renderService.resize(N.cols,N.rows)),this._compositionView=Q.createElement("div"),this._compositionView.classList.add("composition-view"),this._compositionHelper=this._instantiationService.createInstance(l.CompositionHelper,this.textarea,this._compositionView),this._helperContainer.appendChild(this._compositionView),this.element.appendChild($);try{this._onWillOpen.fire(this.element)}catch{}this._renderService.hasRenderer()||this._renderService.setRenderer(this._createRenderer()),this._mouseService=this._instantiationService.createInstance(x.MouseService),this._instantiationService.setService(k.IMouseService,this._mouseService),this.viewport=this._instantiationService.createInstance(w.Viewport,this._viewportElement,this._viewportScrollArea),this.viewport.onRequestScrollLines(N=>this.scrollLines(N.amount,N.suppressScrollEvent,1)),this.register(this._inputHandler.onRequestSyncScrollBar(()=>this.viewport.syncScrollArea())),this.register(this.viewport),this.register(this.onCursorMove(()=>{this._renderService.handleCursorMove(),this._syncTextArea()})),this.register(this.onResize(()=>this._renderService.handleResize(this.cols,this.rows))),this.register(this.onBlur(()=>this._renderService.handleBlur())),this.register(this.onFocus(()=>this._renderService.handleFocus())),this.register(this._renderService.onDimensionsChange(()=>this.viewport.syncScrollArea())),this._selectionService=this.register(this._instantiationService.createInstance(v.SelectionService,this.element,this.screenElement,this.linkifier2)),this._instantiationService.setService(k.ISelectionService,this._selectionService),this.register(this._selectionService.onRequestScrollLines(N=>this.scrollLines(N.amount,N.suppressScrollEvent))),this.register(this._selectionService.onSelectionChange(()=>this._onSelectionChange.fire())),this.register(this._selectionService.onRequestRedraw(N=>this._renderService.handleSelectionChanged(N.start,N.end,N.columnSelectMode))),this.register(this._selectionService.onLinuxMouseSelection(N=>{this.textarea.value=N,this.textarea.focus(),this.textarea.select()})),this.register(this._onScroll.event(N=>{this.viewport.syncScrollArea(),this._selectionService.refresh()})),this.register((0,y.addDisposableDomListener)(this._viewportElement,"scroll",()=>this._selectionService.refresh())),this.linkifier2.attachToDom(this.screenElement,this._mouseService,this._renderService),this.register(this._instantiationService.createInstance(C.BufferDecorationRenderer,this.screenElement)),this.register((0,y.addDisposableDomListener)(this.element,"mousedown",N=>this._selectionService.handleMouseDown(N))),this.coreMouseService.areMouseEventsActive?(this._selectionService.disable(),this.element.classList.add("enable-mouse-events")):this._selectionService.enable(),this.options.screenReaderMode&&(this._accessibilityManager.value=this._instantiationService.createInstance(q.AccessibilityManager,this)),this.register(this.optionsService.onSpecificOptionChange("screenReaderMode",N=>this._handleScreenReaderModeOptionChange(N))),this.options.overviewRulerWidth&&(this._overviewRulerRenderer=this.register(this._instantiationService.createInstance(a.OverviewRulerRenderer,this._viewportElement,this.screenElement))),this.optionsService.onSpecificOptionChange("overviewRulerWidth",N=>{!this._overviewRulerRenderer&&N&&this._viewportElement&&this.screenElement&&(this._overviewRulerRenderer=this.register(this._instantiationService.createInstance(a.OverviewRulerRenderer,this._viewportElement,this.screenElement)))}),this._charSizeService.measure(),this.refresh(0,this.rows-1),this._initGlobal(),this.bindMouse()}_createRenderer(){return this._instantiationService.createInstance(s.DomRenderer,this.element,this.screenElement,this._viewportElement,this.linkifier2)}bindMouse(){const D=this,j=this.element;function $(G){const ae=D._mouseService.getMouseReportCoords(G,D.screenElement);if(!ae)return!1;let Ee,Re;switch(G.overrideType||G.type){case"mousemove":Re=32,G.buttons===void 0?(Ee=3,G.button!==void 0&&(Ee=G.button<3?G.button:3)):Ee=1&G.buttons?0:4&G.buttons?1:2&G.buttons?2:3;break;case"mouseup":Re=0,Ee=G.button<3?G.button:3;break;case"mousedown":Re=1,Ee=G.button<3?G.button:3;break;case"wheel":if(D.viewport.getLinesScrolled(G)===0)return!1;Re=G.deltaY<0?0:1,Ee=4;break;default:return!1}return!(Re===void 0||Ee===void 0||Ee>4)&&D.coreMouseService.triggerMouseEvent({col:ae.col,row:ae.row,x:ae.x,y:ae.y,button:Ee,action:Re,ctrl:G.ctrlKey,alt:G.altKey,shift:G.shiftKey})}const N={mouseup:null,wheel:null,mousedrag:null,mousemove:null},Z={mouseup:G=>($(G),G.buttons||(this._document.removeEventListener("mouseup",N.mouseup),N.mousedrag&&this._document.removeEventListener("mousemove",N.mousedrag)),this.cancel(G)),wheel:G=>($(G),this.cancel(G,!0)),mousedrag:G=>{G.buttons&&$(G)},mousemove:G=>{G.buttons||$(G)}};this.register(this.coreMouseService.onProtocolChange(G=>{G?(this.optionsService.rawOptions.logLevel==="debug"&&this._logService.debug("Binding to mouse events:",this.coreMouseService.explainEvents(G)),this.element.classList.add("enable-mouse-events"),this._selectionService.disable()):(this._logService.debug("Unbinding from mouse events."),this.element.classList.remove("enable-mouse-events"),this._selectionService.enable()),8&G?N.mousemove||(j.addEventListener("mousemove",Z.mousemove),N.mousemove=Z.mousemove):(j.removeEventListener("mousemove",N.mousemove),N.mousemove=null),16&G?N.wheel||(j.addEventListener("wheel",Z.wheel,{passive:!1}),N.wheel=Z.wheel):(j.removeEventListener("wheel",N.wheel),N.wheel=null),2&G?N.mouseup||(j.addEventListener("mouseup",Z.mouseup),N.mouseup=Z.mouseup):(this._document.removeEventListener("mouseup",N.mouseup),j.removeEventListener("mouseup",N.mouseup),N.mouseup=null),4&G?N.mousedrag||(N.mousedrag=Z.mousedrag):(this._document.removeEventListener("mousemove",N.mousedrag),N.mousedrag=null)})),this.coreMouseService.activeProtocol=this.coreMouseService.activeProtocol,this.register((0,y.addDisposableDomListener)(j,"mousedown",G=>{if(G.preventDefault(),this.focus(),this.coreMouseService.areMouseEventsActive&&!this._selectionService.shouldForceSelection(G))return $(G),N.mouseup&&this._document.addEventListener("mouseup",N.mouseup),N.mousedrag&&this._document.addEventListener("mousemove",N.mousedrag),this.cancel(G)})),this.register((0,y.addDisposableDomListener)(j,"wheel",G=>{if(!N.wheel){if(!this.buffer.hasScrollback){const ae=this.viewport.getLinesScrolled(G);if(ae===0)return;const Ee=O.C0.ESC+(this.coreService.decPrivateModes.applicationCursorKeys?"O":"[")+(G.deltaY<0?"A":"B");let Re="";for(let jt=0;jt<Math.abs(ae);jt++)Re+=Ee;return this.coreService.triggerDataEvent(Re,!0),this.cancel(G,!0)}return this.viewport.handleWheel(G)?this.cancel(G):void 0}},{passive:!1})),this.register((0,y.addDisposableDomListener)(j,"touchstart",G=>{if(!this.coreMouseService.areMouseEventsActive)return this.viewport.handleTouchStart(G),this.cancel(G)},{passive:!0})),this.register((0,y.addDisposableDomListener)(j,"touchmove",G=>{if(!this.coreMouseService.areMouseEventsActive)return this.viewport.handleTouchMove(G)?void 0:this.cancel(G)},{passive:!1}))}refresh(D,j){var $;($=this._renderService)===null||$===void 0||$.refreshRows(D,j)}updateCursorStyle(D){var j;!((j=this._selectionService)===null||j===void 0)&&j.shouldColumnSelect(D)?this.element.classList.add("column-select"):this.element.classList.remove("column-select")}_showCursor(){this.coreService.isCursorInitialized||(this.coreService.isCursorInitialized=!0,this.refresh(this.buffer.y,this.buffer.y))}scrollLines(D,j,$=0){var N;$===1?(super.scrollLines(D,j,$),this.refresh(0,this.rows-1)):(N=this.viewport)===null||N===void 0||N.scrollLines(D)}paste(D){(0,f.paste)(D,this.textarea,this.coreService,this.optionsService)}attachCustomKeyEventHandler(D){this._customKeyEventHandler=D}registerLinkProvider(D){return this.linkifier2.registerLinkProvider(D)}registerCharacterJoiner(D){if(!this._characterJoinerService)throw new Error("Terminal must be opened first");const j=this._characterJoinerService.register(D);return this.refresh(0,this.rows-1),j}deregisterCharacterJoiner(D){if(!this._characterJoinerService)throw new Error("Terminal must be opened first");this._characterJoinerService.deregister(D)&&this.refresh(0,this.rows-1)}get markers(){return this.buffer.markers}registerMarker(D){return this.buffer.addMarker(this.buffer.ybase+this.buffer.y+D)}registerDecoration(D){return this._decorationService.registerDecoration(D)}hasSelection(){return!!this._selectionService&&this._selectionService.hasSelection}select(D,j,$){this._selectionService.setSelection(D,j,$)}getSelection(){return this._selectionService?this._selectionService.selectionText:""}getSelectionPosition(){if(this._selectionService&&this._selectionService.hasSelection)return{start:{x:this._selectionService.selectionStart[0],y:this._selectionService.selectionStart[1]},end:{x:this._selectionService.selectionEnd[0],y:this._selectionService.selectionEnd[1]}}}clearSelection(){var D;(D=this._selectionService)===null||D===void 0||D.clearSelection()}selectAll(){var D;(D=this._selectionService)===null||D===void 0||D.selectAll()}selectLines(D,j){var $;($=this._selectionService)===null||$===void 0||$.selectLines(D,j)}_keyDown(D){if(this._keyDownHandled=!1,this._keyDownSeen=!0,this._customKeyEventHandler&&this._customKeyEventHandler(D)===!1)return!1;const j=this.browser.isMac&&this.options.macOptionIsMeta&&D.altKey;if(!j&&!this._compositionHelper.keydown(D))return this.options.scrollOnUserInput&&this.buffer.ybase!==this.buffer.ydisp&&this.scrollToBottom(),!1;j||D.key!=="Dead"&&D.key!=="AltGraph"||(this._unprocessedDeadKey=!0);const $=(0,b.evaluateKeyboardEvent)(D,this.coreService.decPrivateModes.applicationCursorKeys,this.browser.isMac,this.options.macOptionIsMeta);if(this.updateCursorStyle(D),$.type===3||$.type===2){const N=this.rows-1;return this.scrollLines($.type===2?-N:N),this.cancel(D,!0)}return $.type===1&&this.selectAll(),!!this._isThirdLevelShift(this.browser,D)||($.cancel&&this.cancel(D,!0),!$.key||!!(D.key&&!D.ctrlKey&&!D.altKey&&!D.metaKey&&D.key.length===1&&D.key.charCodeAt(0)>=65&&D.key.charCodeAt(0)<=90)||(this._unprocessedDeadKey?(this._unprocessedDeadKey=!1,!0):($.key!==O.C0.ETX&&$.key!==O.C0.CR||(this.textarea.value=""),this._onKey.fire({key:$.key,domEvent:D}),this._showCursor(),this.coreService.triggerDataEvent($.key,!0),!this.optionsService.rawOptions.screenReaderMode||D.altKey||D.ctrlKey?this.cancel(D,!0):void(this._keyDownHandled=!0))))}_isThirdLevelShift(D,j){const $=D.isMac&&!this.options.macOptionIsMeta&&j.altKey&&!j.ctrlKey&&!j.metaKey||D.isWindows&&j.altKey&&j.ctrlKey&&!j.metaKey||D.isWindows&&j.getModifierState("AltGraph");return j.type==="keypress"?$:$&&(!j.keyCode||j.keyCode>47)}_keyUp(D){this._keyDownSeen=!1,this._customKeyEventHandler&&this._customKeyEventHandler(D)===!1||(function(j){return j.keyCode===16||j.keyCode===17||j.keyCode===18}(D)||this.focus(),this.updateCursorStyle(D),this._keyPressHandled=!1)}_keyPress(D){let j;if(this._keyPressHandled=!1,this._keyDownHandled||this._customKeyEventHandler&&this._customKeyEventHandler(D)===!1)return!1;if(this.cancel(D),D.charCode)j=D.charCode;else if(D.which===null||D.which===void 0)j=D.keyCode;else{if(D.which===0||D.charCode===0)return!1;j=D.which}return!(!j||(D.altKey||D.ctrlKey||D.metaKey)&&!this._isThirdLevelShift(this.browser,D)||(j=String.fromCharCode(j),this._onKey.fire({key:j,domEvent:D}),this._showCursor(),this.coreService.triggerDataEvent(j,!0),this._keyPressHandled=!0,this._unprocessedDeadKey=!1,0))}_inputEvent(D){if(D.data&&D.inputType==="insertText"&&(!D.composed||!this._keyDownSeen)&&!this.optionsService.rawOptions.screenReaderMode){if(this._keyPressHandled)return!1;this._unprocessedDeadKey=!1;const j=D.data;return this.coreService.triggerDataEvent(j,!0),this.cancel(D),!0}return!1}resize(D,j){D!==this.cols||j!==this.rows?super.resize(D,j):this._charSizeService&&!this._charSizeService.hasValidSize&&this._charSizeService.measure()}_afterResize(D,j){var $,N;($=this._charSizeService)===null||$===void 0||$.measure(),(N=this.viewport)===null||N===void 0||N.syncScrollArea(!0)}clear(){var D;if(this.buffer.ybase!==0||this.buffer.y!==0){this.buffer.clearAllMarkers(),this.buffer.lines.set(0,this.buffer.lines.get(this.buffer.ybase+this.buffer.y)),this.buffer.lines.length=1,this.buffer.ydisp=0,this.buffer.ybase=0,this.buffer.y=0;for(let j=1;j<this.rows;j++)this.buffer.lines.push(this.buffer.getBlankLine(W.DEFAULT_ATTR_DATA));this._onScroll.fire({position:this.buffer.ydisp,source:0}),(D=this.viewport)===null||D===void 0||D.reset(),this.refresh(0,this.rows-1)}}reset(){var D,j;this.options.rows=this.rows,this.options.cols=this.cols;const $=this._customKeyEventHandler;this._setup(),super.reset(),(D=this._selectionService)===null||D===void 0||D.reset(),this._decorationService.reset(),(j=this.viewport)===null||j===void 0||j.reset(),this._customKeyEventHandler=$,this.refresh(0,this.rows-1)}clearTextureAtlas(){var D;(D=this._renderService)===null||D===void 0||D.clearTextureAtlas()}_reportFocus(){var D;!((D=this.element)===null||D===void 0)&&D.classList.contains("focus")?this.coreService.triggerDataEvent(O.C0.ESC+"[I"):this.coreService.triggerDataEvent(O.C0.ESC+"[O")}_reportWindowsOptions(D){if(this._renderService)switch(D){case z.WindowsOptionsReportType.GET_WIN_SIZE_PIXELS:const j=this._renderService.dimensions.css.canvas.width.toFixed(0),$=this._renderService.dimensions.css.canvas.height.toFixed(0);this.coreService.triggerDataEvent(`${O.C0.ESC}[4;${$};${j}t`);break;case z.WindowsOptionsReportType.GET_CELL_SIZE_PIXELS:const N=this._renderService.dimensions.css.cell.width.toFixed(0),Z=this._renderService.dimensions.css.cell.height.toFixed(0);this.coreService.triggerDataEvent(`${O.C0.ESC}[6;${Z};${N}t`)}}cancel(D,j){if(this.options.cancelEvents||j)return D.preventDefault(),D.stopPropagation(),!1}}n.Terminal=Y},9924:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.TimeBasedDebouncer=void 0,n.TimeBasedDebouncer=class{constructor(u,f=1e3){this._renderCallback=u,this._debounceThresholdMS=f,this._lastRefreshMs=0,this._additionalRefreshRequested=!1}dispose(){this._refreshTimeoutID&&clearTimeout(this._refreshTimeoutID)}refresh(u,f,y){this._rowCount=y,u=u!==void 0?u:0,f=f!==void 0?f:this._rowCount-1,this._rowStart=this._rowStart!==void 0?Math.min(this._rowStart,u):u,this._rowEnd=this._rowEnd!==void 0?Math.max(this._rowEnd,f):f;const d=Date.now();if(d-this._lastRefreshMs>=this._debounceThresholdMS)this._lastRefreshMs=d,this._innerRefresh();else if(!this._additionalRefreshRequested){const _=d-this._lastRefreshMs,S=this._debounceThresholdMS-_;this._additionalRefreshRequested=!0,this._refreshTimeoutID=window.setTimeout(()=>{this._lastRefreshMs=Date.now(),this._innerRefresh(),this._additionalRefreshRequested=!1,this._refreshTimeoutID=void 0},S)}}_innerRefresh(){if(this._rowStart===void 0||this._rowEnd===void 0||this._rowCount===void 0)return;const u=Math.max(this._rowStart,0),f=Math.min(this._rowEnd,this._rowCount-1);this._rowStart=void 0,this._rowEnd=void 0,this._renderCallback(u,f)}}},1680:function(g,n,u){var f=this&&this.__decorate||function(l,s,o,p){var m,x=arguments.length,E=x<3?s:p===null?p=Object.getOwnPropertyDescriptor(s,o):p;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")E=Reflect.decorate(l,s,o,p);else for(var v=l.length-1;v>=0;v--)(m=l[v])&&(E=(x<3?m(E):x>3?m(s,o,E):m(s,o))||E);return x>3&&E&&Object.defineProperty(s,o,E),E},y=this&&this.__param||function(l,s){return function(o,p){s(o,p,l)}};Object.defineProperty(n,"__esModule",{value:!0}),n.Viewport=void 0;const d=u(3656),_=u(4725),S=u(8460),w=u(844),C=u(2585);let a=n.Viewport=class extends w.Disposable{constructor(l,s,o,p,m,x,E,v){super(),this._viewportElement=l,this._scrollArea=s,this._bufferService=o,this._optionsService=p,this._charSizeService=m,this._renderService=x,this._coreBrowserService=E,this.scrollBarWidth=0,this._currentRowHeight=0,this._currentDeviceCellHeight=0,this._lastRecordedBufferLength=0,this._lastRecordedViewportHeight=0,this._lastRecordedBufferHeight=0,this._lastTouchY=0,this._lastScrollTop=0,this._wheelPartialScroll=0,this._refreshAnimationFrame=null,this._ignoreNextScrollEvent=!1,this._smoothScrollState={startTime:0,origin:-1,target:-1},this._onRequestScrollLines=this.register(new S.EventEmitter),this.onRequestScrollLines=this._onRequestScrollLines.event,this.scrollBarWidth=this._viewportElement.offsetWidth-this._scrollArea.offsetWidth||15,this.register((0,d.addDisposableDomListener)(this._viewportElement,"scroll",this._handleScroll.bind(this))),this._activeBuffer=this._bufferService.buffer,this.register(this._bufferService.buffers.onBufferActivate(k=>this._activeBuffer=k.activeBuffer)),this._renderDimensions=this._renderService.dimensions,this.register(this._renderService.onDimensionsChange(k=>this._renderDimensions=k)),this._handleThemeChange(v.colors),this.register(v.onChangeColors(k=>this._handleThemeChange(k))),this.register(this._optionsService.onSpecificOptionChange("scrollback",()=>this.syncScrollArea())),setTimeout(()=>this.syncScrollArea())}_handleThemeChange(l){this._viewportElement.style.backgroundColor=l.background.css}reset(){this._currentRowHeight=0,this._currentDeviceCellHeight=0,this._lastRecordedBufferLength=0,this._lastRecordedViewportHeight=0,this._lastRecordedBufferHeight=0,this._lastTouchY=0,this._lastScrollTop=0,this._coreBrowserService.window.requestAnimationFrame(()=>this.syncScrollArea())}_refresh(l){if(l)return this._innerRefresh(),void(this._refreshAnimationFrame!==null&&this._coreBrowserService.window.cancelAnimationFrame(this._refreshAnimationFrame));this._refreshAnimationFrame===null&&(this._refreshAnimationFrame=this._coreBrowserService.window.requestAnimationFrame(()=>this._innerRefresh()))}_innerRefresh(){if(this._charSizeService.height>0){this._currentRowHeight=this._renderService.dimensions.device.cell.height/this._coreBrowserService.dpr,this._currentDeviceCellHeight=this._renderService.dimensions.device.cell.height,this._lastRecordedViewportHeight=this._viewportElement.offsetHeight;const s=Math.round(this._currentRowHeight*this._lastRecordedBufferLength)+(this._lastRecordedViewportHeight-this._renderService.dimensions.css.canvas.height);this._lastRecordedBufferHeight!==s&&(this._lastRecordedBufferHeight=s,this._scrollArea.style.height=this._lastRecordedBufferHeight+"px")}const l=this._bufferService.buffer.ydisp*this._currentRowHeight;this._viewportElement.scrollTop!==l&&(this._ignoreNextScrollEvent=!0,this._viewportElement.scrollTop=l),this._refreshAnimationFrame=null}syncScrollArea(l=!1){if(this._lastRecordedBufferLength!==this._bufferService.buffer.lines.length)return this._lastRecordedBufferLength=this._bufferService.buffer.lines.length,void this._refresh(l);this._lastRecordedViewportHeight===this._renderService.dimensions.css.canvas.height&&this._lastScrollTop===this._activeBuffer.ydisp*this._currentRowHeight&&this._renderDimensions.device.cell.height===this._currentDeviceCellHeight||this._refresh(l)}_handleScroll(l){if(this._lastScrollTop=this._viewportElement.scrollTop,!this._viewportElement.offsetParent)return;if(this._ignoreNextScrollEvent)return this._ignoreNextScrollEvent=!1,void this._onRequestScrollLines.fire({amount:0,suppressScrollEvent:!0});const s=Math.round(this._lastScrollTop/this._currentRowHeight)-this._bufferService.buffer.ydisp;this._onRequestScrollLines.fire({amount:s,suppressScrollEvent:!0})}_smoothScroll(){if(this._isDisposed||this._smoothScrollState.origin===-1||this._smoothScrollState.target===-1)return;const l=this._smoothScrollPercent();this._viewportElement.scrollTop=this._smoothScrollState.origin+Math.round(l*(this._smoothScrollState.target-this._smoothScrollState.origin)),l<1?this._coreBrowserService.window.requestAnimationFrame(()=>this._smoothScroll()):this._clearSmoothScrollState()}_smoothScrollPercent(){return this._optionsService.rawOptions.smoothScrollDuration&&this._smoothScrollState.startTime?Math.max(Math.min((Date.now()-this._smoothScrollState.startTime)/this._optionsService.rawOptions.smoothScrollDuration,1),0):1}_clearSmoothScrollState(){this._smoothScrollState.startTime=0,this._smoothScrollState.origin=-1,this._smoothScrollState.target=-1}_bubbleScroll(l,s){const o=this._viewportElement.scrollTop+this._lastRecordedViewportHeight;return!(s<0&&this._viewportElement.scrollTop!==0||s>0&&o<this._lastRecordedBufferHeight)||(l.cancelable&&l.preventDefault(),!1)}handleWheel(l){const s=this._getPixelsScrolled(l);return s!==0&&(this._optionsService.rawOptions.smoothScrollDuration?(this._smoothScrollState.startTime=Date.now(),this._smoothScrollPercent()<1?(this._smoothScrollState.origin=this._viewportElement.scrollTop,this._smoothScrollState.target===-1?this._smoothScrollState.target=this._viewportElement.scrollTop+s:this._smoothScrollState.target+=s,this._smoothScrollState.target=Math.max(Math.min(this._smoothScrollState.target,this._viewportElement.scrollHeight),0),this._smoothScroll()):this._clearSmoothScrollState()):this._viewportElement.scrollTop+=s,this._bubbleScroll(l,s))}scrollLines(l){if(l!==0)if(this._optionsService.rawOptions.smoothScrollDuration){const s=l*this._currentRowHeight;this._smoothScrollState.startTime=Date.now(),this._smoothScrollPercent()<1?(this._smoothScrollState.origin=this._viewportElement.scrollTop,this._smoothScrollState.target=this._smoothScrollState.origin+s,this._smoothScrollState.target=Math.max(Math.min(this._smoothScrollState.target,this._viewportElement.scrollHeight),0),this._smoothScroll()):this._clearSmoothScrollState()}else this._onRequestScrollLines.fire({amount:l,suppressScrollEvent:!1})}_getPixelsScrolled(l){if(l.deltaY===0||l.shiftKey)return 0;let s=this._applyScrollModifier(l.deltaY,l);return l.deltaMode===WheelEvent.DOM_DELTA_LINE?s*=this._currentRowHeight:l.deltaMode===WheelEvent.DOM_DELTA_PAGE&&(s*=this._currentRowHeight*this._bufferService.rows),s}getBufferElements(l,s){var o;let p,m="";const x=[],E=s??this._bufferService.buffer.lines.length,v=this._bufferService.buffer.lines;for(let k=l;k<E;k++){const T=v.get(k);if(!T)continue;const P=(o=v.get(k+1))===null||o===void 0?void 0:o.isWrapped;if(m+=T.translateToString(!P),!P||k===v.length-1){const B=document.createElement("div");B.textContent=m,x.push(B),m.length>0&&(p=B),m=""}}return{bufferElements:x,cursorElement:p}}getLinesScrolled(l){if(l.deltaY===0||l.shiftKey)return 0;let s=this._applyScrollModifier(l.deltaY,l);return l.deltaMode===WheelEvent.DOM_DELTA_PIXEL?(s/=this._currentRowHeight+0,this._wheelPartialScroll+=s,s=Math.floor(Math.abs(this._wheelPartialScroll))*(this._wheelPartialScroll>0?1:-1),this._wheelPartialScroll%=1):l.deltaMode===WheelEvent.DOM_DELTA_PAGE&&(s*=this._bufferService.rows),s}_applyScrollModifier(l,s){const o=this._optionsService.rawOptions.fastScrollModifier;return o==="alt"&&s.altKey||o==="ctrl"&&s.ctrlKey||o==="shift"&&s.shiftKey?l*this._optionsService.rawOptions.fastScrollSensitivity*this._optionsService.rawOptions.scrollSensitivity:l*this._optionsService.rawOptions.scrollSensitivity}handleTouchStart(l){this._lastTouchY=l.touches[0].pageY}handleTouchMove(l){const s=this._lastTouchY-l.touches[0].pageY;return this._lastTouchY=l.touches[0].pageY,s!==0&&(this._viewportElement.scrollTop+=s,this._bubbleScroll(l,s))}};n.Viewport=a=f([y(2,C.IBufferService),y(3,C.IOptionsService),y(4,_.ICharSizeService),y(5,_.IRenderService),y(6,_.ICoreBrowserService),y(7,_.IThemeService)],a)},3107:function(g,n,u){var f=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.BufferDecorationRenderer=void 0;const d=u(3656),_=u(4725),S=u(844),w=u(2585);let C=n.BufferDecorationRenderer=class extends S.Disposable{constructor(a,l,s,o){super(),this._screenElement=a,this._bufferService=l,this._decorationService=s,this._renderService=o,this._decorationElements=new Map,this._altBufferIsActive=!1,this._dimensionsChanged=!1,this._container=document.createElement("div"),this._container.classList.add("xterm-decoration-container"),this._screenElement.appendChild(this._container),this.register(this._renderService.onRenderedViewportChange(()=>this._doRefreshDecorations())),this.register(this._renderService.onDimensionsChange(()=>{this._dimensionsChanged=!0,this._queueRefresh()})),this.register((0,d.addDisposableDomListener)(window,"resize",()=>this._queueRefresh())),this.register(this._bufferService.buffers.onBufferActivate(()=>{this._altBufferIsActive=this._bufferService.buffer===this._bufferService.buffers.alt})),this.register(this._decorationService.onDecorationRegistered(()=>this._queueRefresh())),this.register(this._decorationService.onDecorationRemoved(p=>this._removeDecoration(p))),this.register((0,S.toDisposable)(()=>{this._container.remove(),this._decorationElements.clear()}))}_queueRefresh(){this._animationFrame===void 0&&(this._animationFrame=this._renderService.addRefreshCallback(()=>{this._doRefreshDecorations(),this._animationFrame=void 0}))}_doRefreshDecorations(){for(const a of this._decorationService.decorations)this._renderDecoration(a);this._dimensionsChanged=!1}_renderDecoration(a){this._refreshStyle(a),this._dimensionsChanged&&this._refreshXPosition(a)}_createElement(a){var l,s;const o=document.createElement("div");o.classList.add("xterm-decoration"),o.classList.toggle("xterm-decoration-top-layer",((l=a==null?void 0:a.options)===null||l===void 0?void 0:l.layer)==="top"),o.style.width=`${Math.round((a.options.width||1)*this._renderService.dimensions.css.cell.width)}px`,o.style.height=(a.options.height||1)*this._renderService.dimensions.css.cell.height+"px",o.style.top=(a.marker.line-this._bufferService.buffers.active.ydisp)*this._renderService.dimensions.css.cell.height+"px",o.style.lineHeight=`${this._renderService.dimensions.css.cell.height}px`;const p=(s=a.options.x)!==null&&s!==void 0?s:0;return p&&p>this._bufferService.cols&&(o.style.display="none"),this._refreshXPosition(a,o),o}_refreshStyle(a){const l=a.marker.line-this._bufferService.buffers.active.ydisp;if(l<0||l>=this._bufferService.rows)a.element&&(a.element.style.display="none",a.onRenderEmitter.fire(a.element));else{let s=this._decorationElements.get(a);s||(s=this._createElement(a),a.element=s,this._decorationElements.set(a,s),this._container.appendChild(s),a.onDispose(()=>{this._decorationElements.delete(a),s.remove()})),s.style.top=l*this._renderService.dimensions.css.cell.height+"px",s.style.display=this._altBufferIsActive?"none":"block",a.onRenderEmitter.fire(s)}}_refreshXPosition(a,l=a.element){var s;if(!l)return;const o=(s=a.options.x)!==null&&s!==void 0?s:0;(a.options.anchor||"left")==="right"?l.style.right=o?o*this._renderService.dimensions.css.cell.width+"px":"":l.style.left=o?o*this._renderService.dimensions.css.cell.width+"px":""}_removeDecoration(a){var l;(l=this._decorationElements.get(a))===null||l===void 0||l.remove(),this._decorationElements.delete(a),a.dispose()}};n.BufferDecorationRenderer=C=f([y(1,w.IBufferService),y(2,w.IDecorationService),y(3,_.IRenderService)],C)},5871:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ColorZoneStore=void 0,n.ColorZoneStore=class{constructor(){this._zones=[],this._zonePool=[],this._zonePoolIndex=0,this._linePadding={full:0,left:0,center:0,right:0}}get zones(){return this._zonePool.length=Math.min(this._zonePool.length,this._zones.length),this._zones}clear(){this._zones.length=0,this._zonePoolIndex=0}addDecoration(u){if(u.options.overviewRulerOptions){for(const f of this._zones)if(f.color===u.options.overviewRulerOptions.color&&f.position===u.options.overviewRulerOptions.position){if(this._lineIntersectsZone(f,u.marker.line))return;if(this._lineAdjacentToZone(f,u.marker.line,u.options.overviewRulerOptions.position))return void this._addLineToZone(f,u.marker.line)}if(this._zonePoolIndex<this._zonePool.length)return this._zonePool[this._zonePoolIndex].color=u.options.overviewRulerOptions.color,this._zonePool[this._zonePoolIndex].position=u.options.overviewRulerOptions.position,this._zonePool[this._zonePoolIndex].startBufferLine=u.marker.line,this._zonePool[this._zonePoolIndex].endBufferLine=u.marker.line,void this._zones.push(this._zonePool[this._zonePoolIndex++]);this._zones.push({color:u.options.overviewRulerOptions.color,position:u.options.overviewRulerOptions.position,startBufferLine:u.marker.line,endBufferLine:u.marker.line}),this._zonePool.push(this._zones[this._zones.length-1]),this._zonePoolIndex++}}setPadding(u){this._linePadding=u}_lineIntersectsZone(u,f){return f>=u.startBufferLine&&f<=u.endBufferLine}_lineAdjacentToZone(u,f,y){return f>=u.startBufferLine-this._linePadding[y||"full"]&&f<=u.endBufferLine+this._linePadding[y||"full"]}_addLineToZone(u,f){u.startBufferLine=Math.min(u.startBufferLine,f),u.endBufferLine=Math.max(u.endBufferLine,f)}}},5744:function(g,n,u){var f=this&&this.__decorate||function(p,m,x,E){var v,k=arguments.length,T=k<3?m:E===null?E=Object.getOwnPropertyDescriptor(m,x):E;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")T=Reflect.decorate(p,m,x,E);else for(var P=p.length-1;P>=0;P--)(v=p[P])&&(T=(k<3?v(T):k>3?v(m,x,T):v(m,x))||T);return k>3&&T&&Object.defineProperty(m,x,T),T},y=this&&this.__param||function(p,m){return function(x,E){m(x,E,p)}};Object.defineProperty(n,"__esModule",{value:!0}),n.OverviewRulerRenderer=void 0;const d=u(5871),_=u(3656),S=u(4725),w=u(844),C=u(2585),a={full:0,left:0,center:0,right:0},l={full:0,left:0,center:0,right:0},s={full:0,left:0,center:0,right:0};let o=n.OverviewRulerRenderer=class extends w.Disposable{get _width(){return this._optionsService.options.overviewRulerWidth||0}constructor(p,m,x,E,v,k,T){var P;super(),this._viewportElement=p,this._screenElement=m,this._bufferService=x,this._decorationService=E,this._renderService=v,this._optionsService=k,this._coreBrowseService=T,this._colorZoneStore=new d.ColorZoneStore,this._shouldUpdateDimensions=!0,this._shouldUpdateAnchor=!0,this._lastKnownBufferLength=0,this._canvas=document.createElement("canvas"),this._canvas.classList.add("xterm-decoration-overview-ruler"),this._refreshCanvasDimensions(),(P=this._viewportElement.parentElement)===null||P===void 0||P.insertBefore(this._canvas,this._viewportElement);const B=this._canvas.getContext("2d");if(!B)throw new Error("Ctx cannot be null");this._ctx=B,this._registerDecorationListeners(),this._registerBufferChangeListeners(),this._registerDimensionChangeListeners(),this.register((0,w.toDisposable)(()=>{var I;(I=this._canvas)===null||I===void 0||I.remove()}))}_registerDecorationListeners(){this.register(this._decorationService.onDecorationRegistered(()=>this._queueRefresh(void 0,!0))),this.register(this._decorationService.onDecorationRemoved(()=>this._queueRefresh(void 0,!0)))}_registerBufferChangeListeners(){this.register(this._renderService.onRenderedViewportChange(()=>this._queueRefresh())),this.register(this._bufferService.buffers.onBufferActivate(()=>{this._canvas.style.display=this._bufferService.buffer===this._bufferService.buffers.alt?"none":"block"})),this.register(this._bufferService.onScroll(()=>{this._lastKnownBufferLength!==this._bufferService.buffers.normal.lines.length&&(this._refreshDrawHeightConstants(),this._refreshColorZonePadding())}))}_registerDimensionChangeListeners(){this.register(this._renderService.onRender(()=>{this._containerHeight&&this._containerHeight===this._screenElement.clientHeight||(this._queueRefresh(!0),this._containerHeight=this._screenElement.clientHeight)})),this.register(this._optionsService.onSpecificOptionChange("overviewRulerWidth",()=>this._queueRefresh(!0))),this.register((0,_.addDisposableDomListener)(this._coreBrowseService.window,"resize",()=>this._queueRefresh(!0))),this._queueRefresh(!0)}_refreshDrawConstants(){const p=Math.floor(this._canvas.width/3),m=Math.ceil(this._canvas.width/3);l.full=this._canvas.width,l.left=p,l.center=m,l.right=p,this._refreshDrawHeightConstants(),s.full=0,s.left=0,s.center=l.left,s.right=l.left+l.center}_refreshDrawHeightConstants(){a.full=Math.round(2*this._coreBrowseService.dpr);const p=this._canvas.height/this._bufferService.buffer.lines.length,m=Math.round(Math.max(Math.min(p,12),6)*this._coreBrowseService.dpr);a.left=m,a.center=m,a.right=m}_refreshColorZonePadding(){this._colorZoneStore.setPadding({full:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.full),left:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.left),center:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.center),right:Math.floor(this._bufferService.buffers.active.lines.length/(this._canvas.height-1)*a.right)}),this._lastKnownBufferLength=this._bufferService.buffers.normal.lines.length}_refreshCanvasDimensions(){this._canvas.style.width=`${this._width}px`,this._canvas.width=Math.round(this._width*this._coreBrowseService.dpr),this._canvas.style.height=`${this._screenElement.clientHeight}px`,this._canvas.height=Math.round(this._screenElement.clientHeight*this._coreBrowseService.dpr),this._refreshDrawConstants(),this._refreshColorZonePadding()}_refreshDecorations(){this._shouldUpdateDimensions&&this._refreshCanvasDimensions(),this._ctx.clearRect(0,0,this._canvas.width,this._canvas.height),this._colorZoneStore.clear();for(const m of this._decorationService.decorations)this._colorZoneStore.addDecoration(m);this._ctx.lineWidth=1;const p=this._colorZoneStore.zones;for(const m of p)m.position!=="full"&&this._renderColorZone(m);for(const m of p)m.position==="full"&&this._renderColorZone(m);this._shouldUpdateDimensions=!1,this._shouldUpdateAnchor=!1}_renderColorZone(p){this._ctx.fillStyle=p.color,this._ctx.fillRect(s[p.position||"full"],Math.round((this._canvas.height-1)*(p.startBufferLine/this._bufferService.buffers.active.lines.length)-a[p.position||"full"]/2),l[p.position||"full"],Math.round((this._canvas.height-1)*((p.endBufferLine-p.startBufferLine)/this._bufferService.buffers.active.lines.length)+a[p.position||"full"]))}_queueRefresh(p,m){this._shouldUpdateDimensions=p||this._shouldUpdateDimensions,this._shouldUpdateAnchor=m||this._shouldUpdateAnchor,this._animationFrame===void 0&&(this._animationFrame=this._coreBrowseService.window.requestAnimationFrame(()=>{this._refreshDecorations(),this._animationFrame=void 0}))}};n.OverviewRulerRenderer=o=f([y(2,C.IBufferService),y(3,C.IDecorationService),y(4,S.IRenderService),y(5,C.IOptionsService),y(6,S.ICoreBrowserService)],o)},2950:function(g,n,u){var f=this&&this.__decorate||function(C,a,l,s){var o,p=arguments.length,m=p<3?a:s===null?s=Object.getOwnPropertyDescriptor(a,l):s;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")m=Reflect.decorate(C,a,l,s);else for(var x=C.length-1;x>=0;x--)(o=C[x])&&(m=(p<3?o(m):p>3?o(a,l,m):o(a,l))||m);return p>3&&m&&Object.defineProperty(a,l,m),m},y=this&&this.__param||function(C,a){return function(l,s){a(l,s,C)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CompositionHelper=void 0;const d=u(4725),_=u(2585),S=u(2584);let w=n.CompositionHelper=class{get isComposing(){return this._isComposing}constructor(C,a,l,s,o,p){this._textarea=C,this._compositionView=a,this._bufferService=l,this._optionsService=s,this._coreService=o,this._renderService=p,this._isComposing=!1,this._isSendingComposition=!1,this._compositionPosition={start:0,end:0},this._dataAlreadySent=""}compositionstart(){this._isComposing=!0,this._compositionPosition.start=this._textarea.value.length,this._compositionView.textContent="",this._dataAlreadySent="",this._compositionView.classList.add("active")}compositionupdate(C){this._compositionView.textContent=C.data,this.updateCompositionElements(),setTimeout(()=>{this._compositionPosition.end=this._textarea.value.length},0)}compositionend(){this._finalizeComposition(!0)}keydown(C){if(this._isComposing||this._isSendingComposition){if(C.keyCode===229||C.keyCode===16||C.keyCode===17||C.keyCode===18)return!1;this._finalizeComposition(!1)}return C.keyCode!==229||(this._handleAnyTextareaChanges(),!1)}_finalizeComposition(C){if(this._compositionView.classList.remove("active"),this._isComposing=!1,C){const a={start:this._compositionPosition.start,end:this._compositionPosition.end};this._isSendingComposition=!0,setTimeout(()=>{if(this._isSendingComposition){let l;this._isSendingComposition=!1,a.start+=this._dataAlreadySent.length,l=this._isComposing?this._textarea.value.substring(a.start,a.end):this._textarea.value.substring(a.start),l.length>0&&this._coreService.triggerDataEvent(l,!0)}},0)}else{this._isSendingComposition=!1;const a=this._textarea.value.substring(this._compositionPosition.start,this._compositionPosition.end);this._coreService.triggerDataEvent(a,!0)}}_handleAnyTextareaChanges(){const C=this._textarea.value;setTimeout(()=>{if(!this._isComposing){const a=this._textarea.value,l=a.replace(C,"");this._dataAlreadySent=l,a.length>C.length?this._coreService.triggerDataEvent(l,!0):a.length<C.length?this._coreService.triggerDataEvent(`${S.C0.DEL}`,!0):a.length===C.length&&a!==C&&this._coreService.triggerDataEvent(a,!0)}},0)}updateCompositionElements(C){if(this._isComposing){if(this._bufferService.buffer.isCursorInViewport){const a=Math.min(this._bufferService.buffer.x,this._bufferService.cols-1),l=this._renderService.dimensions.css.cell.height,s=this._bufferService.buffer.y*this._renderService.dimensions.css.cell.height,o=a*this._renderService.dimensions.css.cell.width;this._compositionView.style.left=o+"px",this._compositionView.style.top=s+"px",this._compositionView.style.height=l+"px",this._compositionView.style.lineHeight=l+"px",this._compositionView.style.fontFamily=this._optionsService.rawOptions.fontFamily,this._compositionView.style.fontSize=this._optionsService.rawOptions.fontSize+"px";const p=this._compositionView.getBoundingClientRect();this._textarea.style.left=o+"px",this._textarea.style.top=s+"px",this._textarea.style.width=Math.max(p.width,1)+"px",this._textarea.style.height=Math.max(p.height,1)+"px",this._textarea.style.lineHeight=p.height+"px"}C||setTimeout(()=>this.updateCompositionElements(!0),0)}}};n.CompositionHelper=w=f([y(2,_.IBufferService),y(3,_.IOptionsService),y(4,_.ICoreService),y(5,d.IRenderService)],w)},9806:(g,n)=>{function u(f,y,d){const _=d.getBoundingClientRect(),S=f.getComputedStyle(d),w=parseInt(S.getPropertyValue("padding-left")),C=parseInt(S.getPropertyValue("padding-top"));return[y.clientX-_.left-w,y.clientY-_.top-C]}Object.defineProperty(n,"__esModule",{value:!0}),n.getCoords=n.getCoordsRelativeToElement=void 0,n.getCoordsRelativeToElement=u,n.getCoords=function(f,y,d,_,S,w,C,a,l){if(!w)return;const s=u(f,y,d);return s?(s[0]=Math.ceil((s[0]+(l?C/2:0))/C),s[1]=Math.ceil(s[1]/a),s[0]=Math.min(Math.max(s[0],1),_+(l?1:0)),s[1]=Math.min(Math.max(s[1],1),S),s):void 0}},9504:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.moveToCellSequence=void 0;const f=u(2584);function y(a,l,s,o){const p=a-d(a,s),m=l-d(l,s),x=Math.abs(p-m)-function(E,v,k){let T=0;const P=E-d(E,k),B=v-d(v,k);for(let I=0;I<Math.abs(P-B);I++){const F=_(E,v)==="A"?-1:1,H=k.buffer.lines.get(P+F*I);H!=null&&H.isWrapped&&T++}return T}(a,l,s);return C(x,w(_(a,l),o))}function d(a,l){let s=0,o=l.buffer.lines.get(a),p=o==null?void 0:o.isWrapped;for(;p&&a>=0&&a<l.rows;)s++,o=l.buffer.lines.get(--a),p=o==null?void 0:o.isWrapped;return s}function _(a,l){return a>l?"A":"B"}function S(a,l,s,o,p,m){let x=a,E=l,v="";for(;x!==s||E!==o;)x+=p?1:-1,p&&x>m.cols-1?(v+=m.buffer.translateBufferLineToString(E,!1,a,x),x=0,a=0,E++):!p&&x<0&&(v+=m.buffer.translateBufferLineToString(E,!1,0,a+1),x=m.cols-1,a=x,E--);return v+m.buffer.translateBufferLineToString(E,!1,a,x)}function w(a,l){const s=l?"O":"[";return f.C0.ESC+s+a}function C(a,l){a=Math.floor(a);let s="";for(let o=0;o<a;o++)s+=l;return s}n.moveToCellSequence=function(a,l,s,o){const p=s.buffer.x,m=s.buffer.y;if(!s.buffer.hasScrollback)return function(v,k,T,P,B,I){return y(k,P,B,I).length===0?"":C(S(v,k,v,k-d(k,B),!1,B).length,w("D",I))}(p,m,0,l,s,o)+y(m,l,s,o)+function(v,k,T,P,B,I){let F;F=y(k,P,B,I).length>0?P-d(P,B):k;const H=P,W=function(O,b,R,A,M,z){let q;return q=y(R,A,M,z).length>0?A-d(A,M):b,O<R&&q<=A||O>=R&&q<A?"C":"D"}(v,k,T,P,B,I);return C(S(v,F,T,H,W==="C",B).length,w(W,I))}(p,m,a,l,s,o);let x;if(m===l)return x=p>a?"D":"C",C(Math.abs(p-a),w(x,o));x=m>l?"D":"C";const E=Math.abs(m-l);return C(function(v,k){return k.cols-v}(m>l?a:p,s)+(E-1)*s.cols+1+((m>l?p:a)-1),w(x,o))}},1296:function(g,n,u){var f=this&&this.__decorate||function(B,I,F,H){var W,O=arguments.length,b=O<3?I:H===null?H=Object.getOwnPropertyDescriptor(I,F):H;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")b=Reflect.decorate(B,I,F,H);else for(var R=B.length-1;R>=0;R--)(W=B[R])&&(b=(O<3?W(b):O>3?W(I,F,b):W(I,F))||b);return O>3&&b&&Object.defineProperty(I,F,b),b},y=this&&this.__param||function(B,I){return function(F,H){I(F,H,B)}};Object.defineProperty(n,"__esModule",{value:!0}),n.DomRenderer=void 0;const d=u(3787),_=u(2550),S=u(2223),w=u(6171),C=u(4725),a=u(8055),l=u(8460),s=u(844),o=u(2585),p="xterm-dom-renderer-owner-",m="xterm-rows",x="xterm-fg-",E="xterm-bg-",v="xterm-focus",k="xterm-selection";let T=1,P=n.DomRenderer=class extends s.Disposable{constructor(B,I,F,H,W,O,b,R,A,M){super(),this._element=B,this._screenElement=I,this._viewportElement=F,this._linkifier2=H,this._charSizeService=O,this._optionsService=b,this._bufferService=R,this._coreBrowserService=A,this._themeService=M,this._terminalClass=T++,this._rowElements=[],this.onRequestRedraw=this.register(new l.EventEmitter).event,this._rowContainer=document.createElement("div"),this._rowContainer.classList.add(m),this._rowContainer.style.lineHeight="normal",this._rowContainer.setAttribute("aria-hidden","true"),this._refreshRowElements(this._bufferService.cols,this._bufferService.rows),this._selectionContainer=document.createElement("div"),this._selectionContainer.classList.add(k),this._selectionContainer.setAttribute("aria-hidden","true"),this.dimensions=(0,w.createRenderDimensions)(),this._updateDimensions(),this.register(this._optionsService.onOptionChange(()=>this._handleOptionsChanged())),this.register(this._themeService.onChangeColors(z=>this._injectCss(z))),this._injectCss(this._themeService.colors),this._rowFactory=W.createInstance(d.DomRendererRowFactory,document),this._element.classList.add(p+this._terminalClass),this._screenElement.appendChild(this._rowContainer),this._screenElement.appendChild(this._selectionContainer),this.register(this._linkifier2.onShowLinkUnderline(z=>this._handleLinkHover(z))),this.register(this._linkifier2.onHideLinkUnderline(z=>this._handleLinkLeave(z))),this.register((0,s.toDisposable)(()=>{this._element.classList.remove(p+this._terminalClass),this._rowContainer.remove(),this._selectionContainer.remove(),this._widthCache.dispose(),this._themeStyleElement.remove(),this._dimensionsStyleElement.remove()})),this._widthCache=new _.WidthCache(document),this._widthCache.setFont(this._optionsService.rawOptions.fontFamily,this._optionsService.rawOptions.fontSize,this._optionsService.rawOptions.fontWeight,this._optionsService.rawOptions.fontWeightBold),this._setDefaultSpacing()}_updateDimensions(){const B=this._coreBrowserService.dpr;this.dimensions.device.char.width=this._charSizeService.width*B,this.dimensions.device.char.height=Math.ceil(this._charSizeService.height*B),this.dimensions.device.cell.width=this.dimensions.device.char.width+Math.round(this._optionsService.rawOptions.letterSpacing),this.dimensions.device.cell.height=Math.floor(this.dimensions.device.char.height*this._optionsService.rawOptions.lineHeight),this.dimensions.device.char.left=0,this.dimensions.device.char.top=0,this.dimensions.device.canvas.width=this.dimensions.device.cell.width*this._bufferService.cols,this.dimensions.device.canvas.height=this.dimensions.device.cell.height*this._bufferService.rows,this.dimensions.css.canvas.width=Math.round(this.dimensions.device.canvas.width/B),this.dimensions.css.canvas.height=Math.round(this.dimensions.device.canvas.height/B),this.dimensions.css.cell.width=this.dimensions.css.canvas.width/this._bufferService.cols,this.dimensions.css.cell.height=this.dimensions.css.canvas.height/this._bufferService.rows;for(const F of this._rowElements)F.style.width=`${this.dimensions.css.canvas.width}px`,F.style.height=`${this.dimensions.css.cell.height}px`,F.style.lineHeight=`${this.dimensions.css.cell.height}px`,F.style.overflow="hidden";this._dimensionsStyleElement||(this._dimensionsStyleElement=document.createElement("style"),this._screenElement.appendChild(this._dimensionsStyleElement));const I=`${this._terminalSelector} .${m} span { display: inline-block; height: 100%; vertical-align: top;}`;this._dimensionsStyleElement.textContent=I,this._selectionContainer.style.height=this._viewportElement.style.height,this._screenElement.style.width=`${this.dimensions.css.canvas.width}px`,this._screenElement.style.height=`${this.dimensions.css.canvas.height}px`}_injectCss(B){this._themeStyleElement||(this._themeStyleElement=document.createElement("style"),this._screenElement.appendChild(this._themeStyleElement));let I=`${this._terminalSelector} .${m} { color: ${B.foreground.css}; font-family: ${this._optionsService.rawOptions.fontFamily}; font-size: ${this._optionsService.rawOptions.fontSize}px; font-kerning: none; white-space: pre}`;I+=`${this._terminalSelector} .${m} .xterm-dim { color: ${a.color.multiplyOpacity(B.foreground,.5).css};}`,I+=`${this._terminalSelector} span:not(.xterm-bold) { font-weight: ${this._optionsService.rawOptions.fontWeight};}${this._terminalSelector} span.xterm-bold { font-weight: ${this._optionsService.rawOptions.fontWeightBold};}${this._terminalSelector} span.xterm-italic { font-style: italic;}`,I+="@keyframes blink_box_shadow_"+this._terminalClass+" { 50% {  border-bottom-style: hidden; }}",I+="@keyframes blink_block_"+this._terminalClass+` { 0% {  background-color: ${B.cursor.css};  color: ${B.cursorAccent.css}; } 50% {  background-color: inherit;  color: ${B.cursor.css}; }}`,I+=`${this._terminalSelector} .${m}.${v} .xterm-cursor.xterm-cursor-blink:not(.xterm-cursor-block) { animation: blink_box_shadow_`+this._terminalClass+` 1s step-end infinite;}${this._terminalSelector} .${m}.${v} .xterm-cursor.xterm-cursor-blink.xterm-cursor-block { animation: blink_block_`+this._terminalClass+` 1s step-end infinite;}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-block { background-color: ${B.cursor.css}; color: ${B.cursorAccent.css};}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-outline { outline: 1px solid ${B.cursor.css}; outline-offset: -1px;}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-bar { box-shadow: ${this._optionsService.rawOptions.cursorWidth}px 0 0 ${B.cursor.css} inset;}${this._terminalSelector} .${m} .xterm-cursor.xterm-cursor-underline { border-bottom: 1px ${B.cursor.css}; border-bottom-style: solid; height: calc(100% - 1px);}`,I+=`${this._terminalSelector} .${k} { position: absolute; top: 0; left: 0; z-index: 1; pointer-events: none;}${this._terminalSelector}.focus .${k} div { position: absolute; background-color: ${B.selectionBackgroundOpaque.css};}${this._terminalSelector} .${k} div { position: absolute; background-color: ${B.selectionInactiveBackgroundOpaque.css};}`;for(const[F,H]of B.ansi.entries())I+=`${this._terminalSelector} .${x}${F} { color: ${H.css}; }${this._terminalSelector} .${x}${F}.xterm-dim { color: ${a.color.multiplyOpacity(H,.5).css}; }${this._terminalSelector} .${E}${F} { background-color: ${H.css}; }`;I+=`${this._terminalSelector} .${x}${S.INVERTED_DEFAULT_COLOR} { color: ${a.color.opaque(B.background).css}; }${this._terminalSelector} .${x}${S.INVERTED_DEFAULT_COLOR}.xterm-dim { color: ${a.color.multiplyOpacity(a.color.opaque(B.background),.5).css}; }${this._terminalSelector} .${E}${S.INVERTED_DEFAULT_COLOR} { background-color: ${B.foreground.css}; }`,this._themeStyleElement.textContent=I}_setDefaultSpacing(){const B=this.dimensions.css.cell.width-this._widthCache.get("W",!1,!1);this._rowContainer.style.letterSpacing=`${B}px`,this._rowFactory.defaultSpacing=B}handleDevicePixelRatioChange(){this._updateDimensions(),this._widthCache.clear(),this._setDefaultSpacing()}_refreshRowElements(B,I){for(let F=this._rowElements.length;F<=I;F++){const H=document.createElement("div");this._rowContainer.appendChild(H),this._rowElements.push(H)}for(;this._rowElements.length>I;)this._rowContainer.removeChild(this._rowElements.pop())}handleResize(B,I){this._refreshRowElements(B,I),this._updateDimensions()}handleCharSizeChanged(){this._updateDimensions(),this._widthCache.clear(),this._setDefaultSpacing()}handleBlur(){this._rowContainer.classList.remove(v)}handleFocus(){this._rowContainer.classList.add(v),this.renderRows(this._bufferService.buffer.y,this._bufferService.buffer.y)}handleSelectionChanged(B,I,F){if(this._selectionContainer.replaceChildren(),this._rowFactory.handleSelectionChanged(B,I,F),this.renderRows(0,this._bufferService.rows-1),!B||!I)return;const H=B[1]-this._bufferService.buffer.ydisp,W=I[1]-this._bufferService.buffer.ydisp,O=Math.max(H,0),b=Math.min(W,this._bufferService.rows-1);if(O>=this._bufferService.rows||b<0)return;const R=document.createDocumentFragment();if(F){const A=B[0]>I[0];R.appendChild(this._createSelectionElement(O,A?I[0]:B[0],A?B[0]:I[0],b-O+1))}else{const A=H===O?B[0]:0,M=O===W?I[0]:this._bufferService.cols;R.appendChild(this._createSelectionElement(O,A,M));const z=b-O-1;if(R.appendChild(this._createSelectionElement(O+1,0,this._bufferService.cols,z)),O!==b){const q=W===b?I[0]:this._bufferService.cols;R.appendChild(this._createSelectionElement(b,0,q))}}this._selectionContainer.appendChild(R)}_createSelectionElement(B,I,F,H=1){const W=document.createElement("div");return W.style.height=H*this.dimensions.css.cell.height+"px",W.style.top=B*this.dimensions.css.cell.height+"px",W.style.left=I*this.dimensions.css.cell.width+"px",W.style.width=this.dimensions.css.cell.width*(F-I)+"px",W}handleCursorMove(){}_handleOptionsChanged(){this._updateDimensions(),this._injectCss(this._themeService.colors),this._widthCache.setFont(this._optionsService.rawOptions.fontFamily,this._optionsService.rawOptions.fontSize,this._optionsService.rawOptions.fontWeight,this._optionsService.rawOptions.fontWeightBold),this._setDefaultSpacing()}clear(){for(const B of this._rowElements)B.replaceChildren()}renderRows(B,I){const F=this._bufferService.buffer,H=F.ybase+F.y,W=Math.min(F.x,this._bufferService.cols-1),O=this._optionsService.rawOptions.cursorBlink,b=this._optionsService.rawOptions.cursorStyle,R=this._optionsService.rawOptions.cursorInactiveStyle;for(let A=B;A<=I;A++){const M=A+F.ydisp,z=this._rowElements[A],q=F.lines.get(M);if(!z||!q)break;z.replaceChildren(...this._rowFactory.createRow(q,M,M===H,b,R,W,O,this.dimensions.css.cell.width,this._widthCache,-1,-1))}}get _terminalSelector(){return`.${p}${this._terminalClass}`}_handleLinkHover(B){this._setCellUnderline(B.x1,B.x2,B.y1,B.y2,B.cols,!0)}_handleLinkLeave(B){this._setCellUnderline(B.x1,B.x2,B.y1,B.y2,B.cols,!1)}_setCellUnderline(B,I,F,H,W,O){F<0&&(B=0),H<0&&(I=0);const b=this._bufferService.rows-1;F=Math.max(Math.min(F,b),0),H=Math.max(Math.min(H,b),0),W=Math.min(W,this._bufferService.cols);const R=this._bufferService.buffer,A=R.ybase+R.y,M=Math.min(R.x,W-1),z=this._optionsService.rawOptions.cursorBlink,q=this._optionsService.rawOptions.cursorStyle,Q=this._optionsService.rawOptions.cursorInactiveStyle;for(let Y=F;Y<=H;++Y){const se=Y+R.ydisp,D=this._rowElements[Y],j=R.lines.get(se);if(!D||!j)break;D.replaceChildren(...this._rowFactory.createRow(j,se,se===A,q,Q,M,z,this.dimensions.css.cell.width,this._widthCache,O?Y===F?B:0:-1,O?(Y===H?I:W)-1:-1))}}};n.DomRenderer=P=f([y(4,o.IInstantiationService),y(5,C.ICharSizeService),y(6,o.IOptionsService),y(7,o.IBufferService),y(8,C.ICoreBrowserService),y(9,C.IThemeService)],P)},3787:function(g,n,u){var f=this&&this.__decorate||function(x,E,v,k){var T,P=arguments.length,B=P<3?E:k===null?k=Object.getOwnPropertyDescriptor(E,v):k;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")B=Reflect.decorate(x,E,v,k);else for(var I=x.length-1;I>=0;I--)(T=x[I])&&(B=(P<3?T(B):P>3?T(E,v,B):T(E,v))||B);return P>3&&B&&Object.defineProperty(E,v,B),B},y=this&&this.__param||function(x,E){return function(v,k){E(v,k,x)}};Object.defineProperty(n,"__esModule",{value:!0}),n.DomRendererRowFactory=void 0;const d=u(2223),_=u(643),S=u(511),w=u(2585),C=u(8055),a=u(4725),l=u(4269),s=u(6171),o=u(3734);let p=n.DomRendererRowFactory=class{constructor(x,E,v,k,T,P,B){this._document=x,this._characterJoinerService=E,this._optionsService=v,this._coreBrowserService=k,this._coreService=T,this._decorationService=P,this._themeService=B,this._workCell=new S.CellData,this._columnSelectMode=!1,this.defaultSpacing=0}handleSelectionChanged(x,E,v){this._selectionStart=x,this._selectionEnd=E,this._columnSelectMode=v}createRow(x,E,v,k,T,P,B,I,F,H,W){const O=[],b=this._characterJoinerService.getJoinedCharacters(E),R=this._themeService.colors;let A,M=x.getNoBgTrimmedLength();v&&M<P+1&&(M=P+1);let z=0,q="",Q=0,Y=0,se=0,D=!1,j=0,$=!1,N=0;const Z=[],G=H!==-1&&W!==-1;for(let ae=0;ae<M;ae++){x.loadCell(ae,this._workCell);let Ee=this._workCell.getWidth();if(Ee===0)continue;let Re=!1,jt=ae,ee=this._workCell;if(b.length>0&&ae===b[0][0]){Re=!0;const pe=b.shift();ee=new l.JoinedCellData(this._workCell,x.translateToString(!0,pe[0],pe[1]),pe[1]-pe[0]),jt=pe[1]-1,Ee=ee.getWidth()}const sr=this._isCellInSelection(ae,E),Jr=v&&ae===P,Zr=G&&ae>=H&&ae<=W;let ei=!1;this._decorationService.forEachDecorationAtCell(ae,E,void 0,pe=>{ei=!0});let Cr=ee.getChars()||_.WHITESPACE_CELL_CHAR;if(Cr===" "&&(ee.isUnderline()||ee.isOverline())&&(Cr=" "),N=Ee*I-F.get(Cr,ee.isBold(),ee.isItalic()),A){if(z&&(sr&&$||!sr&&!$&&ee.bg===Q)&&(sr&&$&&R.selectionForeground||ee.fg===Y)&&ee.extended.ext===se&&Zr===D&&N===j&&!Jr&&!Re&&!ei){q+=Cr,z++;continue}z&&(A.textContent=q),A=this._document.createElement("span"),z=0,q=""}else A=this._document.createElement("span");if(Q=ee.bg,Y=ee.fg,se=ee.extended.ext,D=Zr,j=N,$=sr,Re&&P>=ae&&P<=jt&&(P=ae),!this._coreService.isCursorHidden&&Jr){if(Z.push("xterm-cursor"),this._coreBrowserService.isFocused)B&&Z.push("xterm-cursor-blink"),Z.push(k==="bar"?"xterm-cursor-bar":k==="underline"?"xterm-cursor-underline":"xterm-cursor-block");else if(T)switch(T){case"outline":Z.push("xterm-cursor-outline");break;case"block":Z.push("xterm-cursor-block");break;case"bar":Z.push("xterm-cursor-bar");break;case"underline":Z.push("xterm-cursor-underline")}}if(ee.isBold()&&Z.push("xterm-bold"),ee.isItalic()&&Z.push("xterm-italic"),ee.isDim()&&Z.push("xterm-dim"),q=ee.isInvisible()?_.WHITESPACE_CELL_CHAR:ee.getChars()||_.WHITESPACE_CELL_CHAR,ee.isUnderline()&&(Z.push(`xterm-underline-${ee.extended.underlineStyle}`),q===" "&&(q=" "),!ee.isUnderlineColorDefault()))if(ee.isUnderlineColorRGB())A.style.textDecorationColor=`rgb(${o.AttributeData.toColorRGB(ee.getUnderlineColor()).join(",")})`;else{let pe=ee.getUnderlineColor();this._optionsService.rawOptions.drawBoldTextInBrightColors&&ee.isBold()&&pe<8&&(pe+=8),A.style.textDecorationColor=R.ansi[pe].css}ee.isOverline()&&(Z.push("xterm-overline"),q===" "&&(q=" ")),ee.isStrikethrough()&&Z.push("xterm-strikethrough"),Zr&&(A.style.textDecoration="underline");let Ve=ee.getFgColor(),nr=ee.getFgColorMode(),J=ee.getBgColor(),K=ee.getBgColorMode();const ce=!!ee.isInverse();if(ce){const pe=Ve;Ve=J,J=pe;const ln=nr;nr=K,K=ln}let te,Te,be,Qe=!1;switch(this._decorationService.forEachDecorationAtCell(ae,E,void 0,pe=>{pe.options.layer!=="top"&&Qe||(pe.backgroundColorRGB&&(K=50331648,J=pe.backgroundColorRGB.rgba>>8&16777215,te=pe.backgroundColorRGB),pe.foregroundColorRGB&&(nr=50331648,Ve=pe.foregroundColorRGB.rgba>>8&16777215,Te=pe.foregroundColorRGB),Qe=pe.options.layer==="top")}),!Qe&&sr&&(te=this._coreBrowserService.isFocused?R.selectionBackgroundOpaque:R.selectionInactiveBackgroundOpaque,J=te.rgba>>8&16777215,K=50331648,Qe=!0,R.selectionForeground&&(nr=50331648,Ve=R.selectionForeground.rgba>>8&16777215,Te=R.selectionForeground)),Qe&&Z.push("xterm-decoration-top"),K){case 16777216:case 33554432:be=R.ansi[J],Z.push(`xterm-bg-${J}`);break;case 50331648:be=C.rgba.toColor(J>>16,J>>8&255,255&J),this._addStyle(A,`background-color:#${m((J>>>0).toString(16),"0",6)}`);break;default:ce?(be=R.foreground,Z.push(`xterm-bg-${d.INVERTED_DEFAULT_COLOR}`)):be=R.background}switch(te||ee.isDim()&&(te=C.color.multiplyOpacity(be,.5)),nr){case 16777216:case 33554432:ee.isBold()&&Ve<8&&this._optionsService.rawOptions.drawBoldTextInBrightColors&&(Ve+=8),this._applyMinimumContrast(A,be,R.ansi[Ve],ee,te,void 0)||Z.push(`xterm-fg-${Ve}`);break;case 50331648:const pe=C.rgba.toColor(Ve>>16&255,Ve>>8&255,255&Ve);this._applyMinimumContrast(A,be,pe,ee,te,Te)||this._addStyle(A,`color:#${m(Ve.toString(16),"0",6)}`);break;default:this._applyMinimumContrast(A,be,R.foreground,ee,te,void 0)||ce&&Z.push(`xterm-fg-${d.INVERTED_DEFAULT_COLOR}`)}Z.length&&(A.className=Z.join(" "),Z.length=0),Jr||Re||ei?A.textContent=q:z++,N!==this.defaultSpacing&&(A.style.letterSpacing=`${N}px`),O.push(A),ae=jt}return A&&z&&(A.textContent=q),O}_applyMinimumContrast(x,E,v,k,T,P){if(this._optionsService.rawOptions.minimumContrastRatio===1||(0,s.excludeFromContrastRatioDemands)(k.getCode()))return!1;const B=this._getContrastCache(k);let I;if(T||P||(I=B.getColor(E.rgba,v.rgba)),I===void 0){const F=this._optionsService.rawOptions.minimumContrastRatio/(k.isDim()?2:1);I=C.color.ensureContrastRatio(T||E,P||v,F),B.setColor((T||E).rgba,(P||v).rgba,I??null)}return!!I&&(this._addStyle(x,`color:${I.css}`),!0)}_getContrastCache(x){return x.isDim()?this._themeService.colors.halfContrastCache:this._themeService.colors.contrastCache}_addStyle(x,E){x.setAttribute("style",`${x.getAttribute("style")||""}${E};`)}_isCellInSelection(x,E){const v=this._selectionStart,k=this._selectionEnd;return!(!v||!k)&&(this._columnSelectMode?v[0]<=k[0]?x>=v[0]&&E>=v[1]&&x<k[0]&&E<=k[1]:x<v[0]&&E>=v[1]&&x>=k[0]&&E<=k[1]:E>v[1]&&E<k[1]||v[1]===k[1]&&E===v[1]&&x>=v[0]&&x<k[0]||v[1]<k[1]&&E===k[1]&&x<k[0]||v[1]<k[1]&&E===v[1]&&x>=v[0])}};function m(x,E,v){for(;x.length<v;)x=E+x;return x}n.DomRendererRowFactory=p=f([y(1,a.ICharacterJoinerService),y(2,w.IOptionsService),y(3,a.ICoreBrowserService),y(4,w.ICoreService),y(5,w.IDecorationService),y(6,a.IThemeService)],p)},2550:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.WidthCache=void 0,n.WidthCache=class{constructor(u){this._flat=new Float32Array(256),this._font="",this._fontSize=0,this._weight="normal",this._weightBold="bold",this._measureElements=[],this._container=u.createElement("div"),this._container.style.position="absolute",this._container.style.top="-50000px",this._container.style.width="50000px",this._container.style.whiteSpace="pre",this._container.style.fontKerning="none";const f=u.createElement("span"),y=u.createElement("span");y.style.fontWeight="bold";const d=u.createElement("span");d.style.fontStyle="italic";const _=u.createElement("span");_.style.fontWeight="bold",_.style.fontStyle="italic",this._measureElements=[f,y,d,_],this._container.appendChild(f),this._container.appendChild(y),this._container.appendChild(d),this._container.appendChild(_),u.body.appendChild(this._container),this.clear()}dispose(){this._container.remove(),this._measureElements.length=0,this._holey=void 0}clear(){this._flat.fill(-9999),this._holey=new Map}setFont(u,f,y,d){u===this._font&&f===this._fontSize&&y===this._weight&&d===this._weightBold||(this._font=u,this._fontSize=f,this._weight=y,this._weightBold=d,this._container.style.fontFamily=this._font,this._container.style.fontSize=`${this._fontSize}px`,this._measureElements[0].style.fontWeight=`${y}`,this._measureElements[1].style.fontWeight=`${d}`,this._measureElements[2].style.fontWeight=`${y}`,this._measureElements[3].style.fontWeight=`${d}`,this.clear())}get(u,f,y){let d=0;if(!f&&!y&&u.length===1&&(d=u.charCodeAt(0))<256)return this._flat[d]!==-9999?this._flat[d]:this._flat[d]=this._measure(u,0);let _=u;f&&(_+="B"),y&&(_+="I");let S=this._holey.get(_);if(S===void 0){let w=0;f&&(w|=1),y&&(w|=2),S=this._measure(u,w),this._holey.set(_,S)}return S}_measure(u,f){const y=this._measureElements[f];return y.textContent=u.repeat(32),y.offsetWidth/32}}},2223:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.TEXT_BASELINE=n.DIM_OPACITY=n.INVERTED_DEFAULT_COLOR=void 0;const f=u(6114);n.INVERTED_DEFAULT_COLOR=257,n.DIM_OPACITY=.5,n.TEXT_BASELINE=f.isFirefox||f.isLegacyEdge?"bottom":"ideographic"},6171:(g,n)=>{function u(f){return 57508<=f&&f<=57558}Object.defineProperty(n,"__esModule",{value:!0}),n.createRenderDimensions=n.excludeFromContrastRatioDemands=n.isRestrictedPowerlineGlyph=n.isPowerlineGlyph=n.throwIfFalsy=void 0,n.throwIfFalsy=function(f){if(!f)throw new Error("value must not be falsy");return f},n.isPowerlineGlyph=u,n.isRestrictedPowerlineGlyph=function(f){return 57520<=f&&f<=57527},n.excludeFromContrastRatioDemands=function(f){return u(f)||function(y){return 9472<=y&&y<=9631}(f)},n.createRenderDimensions=function(){return{css:{canvas:{width:0,height:0},cell:{width:0,height:0}},device:{canvas:{width:0,height:0},cell:{width:0,height:0},char:{width:0,height:0,left:0,top:0}}}}},456:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.SelectionModel=void 0,n.SelectionModel=class{constructor(u){this._bufferService=u,this.isSelectAllActive=!1,this.selectionStartLength=0}clearSelection(){this.selectionStart=void 0,this.selectionEnd=void 0,this.isSelectAllActive=!1,this.selectionStartLength=0}get finalSelectionStart(){return this.isSelectAllActive?[0,0]:this.selectionEnd&&this.selectionStart&&this.areSelectionValuesReversed()?this.selectionEnd:this.selectionStart}get finalSelectionEnd(){if(this.isSelectAllActive)return[this._bufferService.cols,this._bufferService.buffer.ybase+this._bufferService.rows-1];if(this.selectionStart){if(!this.selectionEnd||this.areSelectionValuesReversed()){const u=this.selectionStart[0]+this.selectionStartLength;return u>this._bufferService.cols?u%this._bufferService.cols==0?[this._bufferService.cols,this.selectionStart[1]+Math.floor(u/this._bufferService.cols)-1]:[u%this._bufferService.cols,this.selectionStart[1]+Math.floor(u/this._bufferService.cols)]:[u,this.selectionStart[1]]}if(this.selectionStartLength&&this.selectionEnd[1]===this.selectionStart[1]){const u=this.selectionStart[0]+this.selectionStartLength;return u>this._bufferService.cols?[u%this._bufferService.cols,this.selectionStart[1]+Math.floor(u/this._bufferService.cols)]:[Math.max(u,this.selectionEnd[0]),this.selectionEnd[1]]}return this.selectionEnd}}areSelectionValuesReversed(){const u=this.selectionStart,f=this.selectionEnd;return!(!u||!f)&&(u[1]>f[1]||u[1]===f[1]&&u[0]>f[0])}handleTrim(u){return this.selectionStart&&(this.selectionStart[1]-=u),this.selectionEnd&&(this.selectionEnd[1]-=u),this.selectionEnd&&this.selectionEnd[1]<0?(this.clearSelection(),!0):(this.selectionStart&&this.selectionStart[1]<0&&(this.selectionStart[1]=0),!1)}}},428:function(g,n,u){var f=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CharSizeService=void 0;const d=u(2585),_=u(8460),S=u(844);let w=n.CharSizeService=class extends S.Disposable{get hasValidSize(){return this.width>0&&this.height>0}constructor(a,l,s){super(),this._optionsService=s,this.width=0,this.height=0,this._onCharSizeChange=this.register(new _.EventEmitter),this.onCharSizeChange=this._onCharSizeChange.event,this._measureStrategy=new C(a,l,this._optionsService),this.register(this._optionsService.onMultipleOptionChange(["fontFamily","fontSize"],()=>this.measure()))}measure(){const a=this._measureStrategy.measure();a.width===this.width&&a.height===this.height||(this.width=a.width,this.height=a.height,this._onCharSizeChange.fire())}};n.CharSizeService=w=f([y(2,d.IOptionsService)],w);class C{constructor(l,s,o){this._document=l,this._parentElement=s,this._optionsService=o,this._result={width:0,height:0},this._measureElement=this._document.createElement("span"),this._measureElement.classList.add("xterm-char-measure-element"),this._measureElement.textContent="W".repeat(32),this._measureElement.setAttribute("aria-hidden","true"),this._measureElement.style.whiteSpace="pre",this._measureElement.style.fontKerning="none",this._parentElement.appendChild(this._measureElement)}measure(){this._measureElement.style.fontFamily=this._optionsService.rawOptions.fontFamily,this._measureElement.style.fontSize=`${this._optionsService.rawOptions.fontSize}px`;const l={height:Number(this._measureElement.offsetHeight),width:Number(this._measureElement.offsetWidth)};return l.width!==0&&l.height!==0&&(this._result.width=l.width/32,this._result.height=Math.ceil(l.height)),this._result}}},4269:function(g,n,u){var f=this&&this.__decorate||function(l,s,o,p){var m,x=arguments.length,E=x<3?s:p===null?p=Object.getOwnPropertyDescriptor(s,o):p;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")E=Reflect.decorate(l,s,o,p);else for(var v=l.length-1;v>=0;v--)(m=l[v])&&(E=(x<3?m(E):x>3?m(s,o,E):m(s,o))||E);return x>3&&E&&Object.defineProperty(s,o,E),E},y=this&&this.__param||function(l,s){return function(o,p){s(o,p,l)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CharacterJoinerService=n.JoinedCellData=void 0;const d=u(3734),_=u(643),S=u(511),w=u(2585);class C extends d.AttributeData{constructor(s,o,p){super(),this.content=0,this.combinedData="",this.fg=s.fg,this.bg=s.bg,this.combinedData=o,this._width=p}isCombined(){return 2097152}getWidth(){return this._width}getChars(){return this.combinedData}getCode(){return 2097151}setFromCharData(s){throw new Error("not implemented")}getAsCharData(){return[this.fg,this.getChars(),this.getWidth(),this.getCode()]}}n.JoinedCellData=C;let a=n.CharacterJoinerService=class nh{constructor(s){this._bufferService=s,this._characterJoiners=[],this._nextCharacterJoinerId=0,this._workCell=new S.CellData}register(s){const o={id:this._nextCharacterJoinerId++,handler:s};return this._characterJoiners.push(o),o.id}deregister(s){for(let o=0;o<this._characterJoiners.length;o++)if(this._characterJoiners[o].id===s)return this._characterJoiners.splice(o,1),!0;return!1}getJoinedCharacters(s){if(this._characterJoiners.length===0)return[];const o=this._bufferService.buffer.lines.get(s);if(!o||o.length===0)return[];const p=[],m=o.translateToString(!0);let x=0,E=0,v=0,k=o.getFg(0),T=o.getBg(0);for(let P=0;P<o.getTrimmedLength();P++)if(o.loadCell(P,this._workCell),this._workCell.getWidth()!==0){if(this._workCell.fg!==k||this._workCell.bg!==T){if(P-x>1){const B=this._getJoinedRanges(m,v,E,o,x);for(let I=0;I<B.length;I++)p.push(B[I])}x=P,v=E,k=this._workCell.fg,T=this._workCell.bg}E+=this._workCell.getChars().length||_.WHITESPACE_CELL_CHAR.length}if(this._bufferService.cols-x>1){const P=this._getJoinedRanges(m,v,E,o,x);for(let B=0;B<P.length;B++)p.push(P[B])}return p}_getJoinedRanges(s,o,p,m,x){const E=s.substring(o,p);let v=[];try{v=this._characterJoiners[0].handler(E)}catch(k){console.error(k)}for(let k=1;k<this._characterJoiners.length;k++)try{const T=this._characterJoiners[k].handler(E);for(let P=0;P<T.length;P++)nh._mergeRanges(v,T[P])}catch(T){console.error(T)}return this._stringRangesToCellRanges(v,m,x),v}_stringRangesToCellRanges(s,o,p){let m=0,x=!1,E=0,v=s[m];if(v){for(let k=p;k<this._bufferService.cols;k++){const T=o.getWidth(k),P=o.getString(k).length||_.WHITESPACE_CELL_CHAR.length;if(T!==0){if(!x&&v[0]<=E&&(v[0]=k,x=!0),v[1]<=E){if(v[1]=k,v=s[++m],!v)break;v[0]<=E?(v[0]=k,x=!0):x=!1}E+=P}}v&&(v[1]=this._bufferService.cols)}}static _mergeRanges(s,o){let p=!1;for(let m=0;m<s.length;m++){const x=s[m];if(p){if(o[1]<=x[0])return s[m-1][1]=o[1],s;if(o[1]<=x[1])return s[m-1][1]=Math.max(o[1],x[1]),s.splice(m,1),s;s.splice(m,1),m--}else{if(o[1]<=x[0])return s.splice(m,0,o),s;if(o[1]<=x[1])return x[0]=Math.min(o[0],x[0]),s;o[0]<x[1]&&(x[0]=Math.min(o[0],x[0]),p=!0)}}return p?s[s.length-1][1]=o[1]:s.push(o),s}};n.CharacterJoinerService=a=f([y(0,w.IBufferService)],a)},5114:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CoreBrowserService=void 0,n.CoreBrowserService=class{constructor(u,f){this._textarea=u,this.window=f,this._isFocused=!1,this._cachedIsFocused=void 0,this._textarea.addEventListener("focus",()=>this._isFocused=!0),this._textarea.addEventListener("blur",()=>this._isFocused=!1)}get dpr(){return this.window.devicePixelRatio}get isFocused(){return this._cachedIsFocused===void 0&&(this._cachedIsFocused=this._isFocused&&this._textarea.ownerDocument.hasFocus(),queueMicrotask(()=>this._cachedIsFocused=void 0)),this._cachedIsFocused}}},8934:function(g,n,u){var f=this&&this.__decorate||function(w,C,a,l){var s,o=arguments.length,p=o<3?C:l===null?l=Object.getOwnPropertyDescriptor(C,a):l;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")p=Reflect.decorate(w,C,a,l);else for(var m=w.length-1;m>=0;m--)(s=w[m])&&(p=(o<3?s(p):o>3?s(C,a,p):s(C,a))||p);return o>3&&p&&Object.defineProperty(C,a,p),p},y=this&&this.__param||function(w,C){return function(a,l){C(a,l,w)}};Object.defineProperty(n,"__esModule",{value:!0}),n.MouseService=void 0;const d=u(4725),_=u(9806);let S=n.MouseService=class{constructor(w,C){this._renderService=w,this._charSizeService=C}getCoords(w,C,a,l,s){return(0,_.getCoords)(window,w,C,a,l,this._charSizeService.hasValidSize,this._renderService.dimensions.css.cell.width,this._renderService.dimensions.css.cell.height,s)}getMouseReportCoords(w,C){const a=(0,_.getCoordsRelativeToElement)(window,w,C);if(this._charSizeService.hasValidSize)return a[0]=Math.min(Math.max(a[0],0),this._renderService.dimensions.css.canvas.width-1),a[1]=Math.min(Math.max(a[1],0),this._renderService.dimensions.css.canvas.height-1),{col:Math.floor(a[0]/this._renderService.dimensions.css.cell.width),row:Math.floor(a[1]/this._renderService.dimensions.css.cell.height),x:Math.floor(a[0]),y:Math.floor(a[1])}}};n.MouseService=S=f([y(0,d.IRenderService),y(1,d.ICharSizeService)],S)},3230:function(g,n,u){var f=this&&this.__decorate||function(p,m,x,E){var v,k=arguments.length,T=k<3?m:E===null?E=Object.getOwnPropertyDescriptor(m,x):E;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")T=Reflect.decorate(p,m,x,E);else for(var P=p.length-1;P>=0;P--)(v=p[P])&&(T=(k<3?v(T):k>3?v(m,x,T):v(m,x))||T);return k>3&&T&&Object.defineProperty(m,x,T),T},y=this&&this.__param||function(p,m){return function(x,E){m(x,E,p)}};Object.defineProperty(n,"__esModule",{value:!0}),n.RenderService=void 0;const d=u(3656),_=u(6193),S=u(5596),w=u(4725),C=u(8460),a=u(844),l=u(7226),s=u(2585);let o=n.RenderService=class extends a.Disposable{get dimensions(){return this._renderer.value.dimensions}constructor(p,m,x,E,v,k,T,P){if(super(),this._rowCount=p,this._charSizeService=E,this._renderer=this.register(new a.MutableDisposable),this._pausedResizeTask=new l.DebouncedIdleTask,this._isPaused=!1,this._needsFullRefresh=!1,this._isNextRenderRedrawOnly=!0,this._needsSelectionRefresh=!1,this._canvasWidth=0,this._canvasHeight=0,this._selectionState={start:void 0,end:void 0,columnSelectMode:!1},this._onDimensionsChange=this.register(new C.EventEmitter),this.onDimensionsChange=this._onDimensionsChange.event,this._onRenderedViewportChange=this.register(new C.EventEmitter),this.onRenderedViewportChange=this._onRenderedViewportChange.event,this._onRender=this.register(new C.EventEmitter),this.onRender=this._onRender.event,this._onRefreshRequest=this.register(new C.EventEmitter),this.onRefreshRequest=this._onRefreshRequest.event,this._renderDebouncer=new _.RenderDebouncer(T.window,(B,I)=>this._renderRows(B,I)),this.register(this._renderDebouncer),this._screenDprMonitor=new S.ScreenDprMonitor(T.window),this._screenDprMonitor.setListener(()=>this.handleDevicePixelRatioChange()),this.register(this._screenDprMonitor),this.register(k.onResize(()=>this._fullRefresh())),this.register(k.buffers.onBufferActivate(()=>{var B;return(B=this._renderer.value)===null||B===void 0?void 0:B.clear()})),this.register(x.onOptionChange(()=>this._handleOptionsChanged())),this.register(this._charSizeService.onCharSizeChange(()=>this.handleCharSizeChanged())),this.register(v.onDecorationRegistered(()=>this._fullRefresh())),this.register(v.onDecorationRemoved(()=>this._fullRefresh())),this.register(x.onMultipleOptionChange(["customGlyphs","drawBoldTextInBrightColors","letterSpacing","lineHeight","fontFamily","fontSize","fontWeight","fontWeightBold","minimumContrastRatio"],()=>{this.clear(),this.handleResize(k.cols,k.rows),this._fullRefresh()})),this.register(x.onMultipleOptionChange(["cursorBlink","cursorStyle"],()=>this.refreshRows(k.buffer.y,k.buffer.y,!0))),this.register((0,d.addDisposableDomListener)(T.window,"resize",()=>this.handleDevicePixelRatioChange())),this.register(P.onChangeColors(()=>this._fullRefresh())),"IntersectionObserver"in T.window){const B=new T.window.IntersectionObserver(I=>this._handleIntersectionChange(I[I.length-1]),{threshold:0});B.observe(m),this.register({dispose:()=>B.disconnect()})}}_handleIntersectionChange(p){this._isPaused=p.isIntersecting===void 0?p.intersectionRatio===0:!p.isIntersecting,this._isPaused||this._charSizeService.hasValidSize||this._charSizeService.measure(),!this._isPaused&&this._needsFullRefresh&&(this._pausedResizeTask.flush(),this.refreshRows(0,this._rowCount-1),this._needsFullRefresh=!1)}refreshRows(p,m,x=!1){this._isPaused?this._needsFullRefresh=!0:(x||(this._isNextRenderRedrawOnly=!1),this._renderDebouncer.refresh(p,m,this._rowCount))}_renderRows(p,m){this._renderer.value&&(p=Math.min(p,this._rowCount-1),m=Math.min(m,this._rowCount-1),this._renderer.value.renderRows(p,m),this._needsSelectionRefresh&&(this._renderer.value.handleSelectionChanged(this._selectionState.start,this._selectionState.end,this._selectionState.columnSelectMode),this._needsSelectionRefresh=!1),this._isNextRenderRedrawOnly||this._onRenderedViewportChange.fire({start:p,end:m}),this._onRender.fire({start:p,end:m}),this._isNextRenderRedrawOnly=!0)}resize(p,m){this._rowCount=m,this._fireOnCanvasResize()}_handleOptionsChanged(){this._renderer.value&&(this.refreshRows(0,this._rowCount-1),this._fireOnCanvasResize())}_fireOnCanvasResize(){this._renderer.value&&(this._renderer.value.dimensions.css.canvas.width===this._canvasWidth&&this._renderer.value.dimensions.css.canvas.height===this._canvasHeight||this._onDimensionsChange.fire(this._renderer.value.dimensions))}hasRenderer(){return!!this._renderer.value}setRenderer(p){this._renderer.value=p,this._renderer.value.onRequestRedraw(m=>this.refreshRows(m.start,m.end,!0)),this._needsSelectionRefresh=!0,this._fullRefresh()}addRefreshCallback(p){return this._renderDebouncer.addRefreshCallback(p)}_fullRefresh(){this._isPaused?this._needsFullRefresh=!0:this.refreshRows(0,this._rowCount-1)}clearTextureAtlas(){var p,m;this._renderer.value&&((m=(p=this._renderer.value).clearTextureAtlas)===null||m===void 0||m.call(p),this._fullRefresh())}handleDevicePixelRatioChange(){this._charSizeService.measure(),this._renderer.value&&(this._renderer.value.handleDevicePixelRatioChange(),this.refreshRows(0,this._rowCount-1))}handleResize(p,m){this._renderer.value&&(this._isPaused?this._pausedResizeTask.set(()=>this._renderer.value.handleResize(p,m)):this._renderer.value.handleResize(p,m),this._fullRefresh())}handleCharSizeChanged(){var p;(p=this._renderer.value)===null||p===void 0||p.handleCharSizeChanged()}handleBlur(){var p;(p=this._renderer.value)===null||p===void 0||p.handleBlur()}handleFocus(){var p;(p=this._renderer.value)===null||p===void 0||p.handleFocus()}handleSelectionChanged(p,m,x){var E;this._selectionState.start=p,this._selectionState.end=m,this._selectionState.columnSelectMode=x,(E=this._renderer.value)===null||E===void 0||E.handleSelectionChanged(p,m,x)}handleCursorMove(){var p;(p=this._renderer.value)===null||p===void 0||p.handleCursorMove()}clear(){var p;(p=this._renderer.value)===null||p===void 0||p.clear()}};n.RenderService=o=f([y(2,s.IOptionsService),y(3,w.ICharSizeService),y(4,s.IDecorationService),y(5,s.IBufferService),y(6,w.ICoreBrowserService),y(7,w.IThemeService)],o)},9312:function(g,n,u){var f=this&&this.__decorate||function(v,k,T,P){var B,I=arguments.length,F=I<3?k:P===null?P=Object.getOwnPropertyDescriptor(k,T):P;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")F=Reflect.decorate(v,k,T,P);else for(var H=v.length-1;H>=0;H--)(B=v[H])&&(F=(I<3?B(F):I>3?B(k,T,F):B(k,T))||F);return I>3&&F&&Object.defineProperty(k,T,F),F},y=this&&this.__param||function(v,k){return function(T,P){k(T,P,v)}};Object.defineProperty(n,"__esModule",{value:!0}),n.SelectionService=void 0;const d=u(9806),_=u(9504),S=u(456),w=u(4725),C=u(8460),a=u(844),l=u(6114),s=u(4841),o=u(511),p=u(2585),m=" ",x=new RegExp(m,"g");let E=n.SelectionService=class extends a.Disposable{constructor(v,k,T,P,B,I,F,H,W){super(),this._element=v,this._screenElement=k,this._linkifier=T,this._bufferService=P,this._coreService=B,this._mouseService=I,this._optionsService=F,this._renderService=H,this._coreBrowserService=W,this._dragScrollAmount=0,this._enabled=!0,this._workCell=new o.CellData,this._mouseDownTimeStamp=0,this._oldHasSelection=!1,this._oldSelectionStart=void 0,this._oldSelectionEnd=void 0,this._onLinuxMouseSelection=this.register(new C.EventEmitter),this.onLinuxMouseSelection=this._onLinuxMouseSelection.event,this._onRedrawRequest=this.register(new C.EventEmitter),this.onRequestRedraw=this._onRedrawRequest.event,this._onSelectionChange=this.register(new C.EventEmitter),this.onSelectionChange=this._onSelectionChange.event,this._onRequestScrollLines=this.register(new C.EventEmitter),this.onRequestScrollLines=this._onRequestScrollLines.event,this._mouseMoveListener=O=>this._handleMouseMove(O),this._mouseUpListener=O=>this._handleMouseUp(O),this._coreService.onUserInput(()=>{this.hasSelection&&this.clearSelection()}),this._trimListener=this._bufferService.buffer.lines.onTrim(O=>this._handleTrim(O)),this.register(this._bufferService.buffers.onBufferActivate(O=>this._handleBufferActivate(O))),this.enable(),this._model=new S.SelectionModel(this._bufferService),this._activeSelectionMode=0,this.register((0,a.toDisposable)(()=>{this._removeMouseDownListeners()}))}reset(){this.clearSelection()}disable(){this.clearSelection(),this._enabled=!1}enable(){this._enabled=!0}get selectionStart(){return this._model.finalSelectionStart}get selectionEnd(){return this._model.finalSelectionEnd}get hasSelection(){const v=this._model.finalSelectionStart,k=this._model.finalSelectionEnd;return!(!v||!k||v[0]===k[0]&&v[1]===k[1])}get selectionText(){const v=this._model.finalSelectionStart,k=this._model.finalSelectionEnd;if(!v||!k)return"";const T=this._bufferService.buffer,P=[];if(this._activeSelectionMode===3){if(v[0]===k[0])return"";const B=v[0]<k[0]?v[0]:k[0],I=v[0]<k[0]?k[0]:v[0];for(let F=v[1];F<=k[1];F++){const H=T.translateBufferLineToString(F,!0,B,I);P.push(H)}}else{const B=v[1]===k[1]?k[0]:void 0;P.push(T.translateBufferLineToString(v[1],!0,v[0],B));for(let I=v[1]+1;I<=k[1]-1;I++){const F=T.lines.get(I),H=T.translateBufferLineToString(I,!0);F!=null&&F.isWrapped?P[P.length-1]+=H:P.push(H)}if(v[1]!==k[1]){const I=T.lines.get(k[1]),F=T.translateBufferLineToString(k[1],!0,0,k[0]);I&&I.isWrapped?P[P.length-1]+=F:P.push(F)}}return P.map(B=>B.replace(x," ")).join(l.isWindows?`\r
-`:`
-`)}clearSelection(){this._model.clearSelection(),this._removeMouseDownListeners(),this.refresh(),this._onSelectionChange.fire()}refresh(v){this._refreshAnimationFrame||(this._refreshAnimationFrame=this._coreBrowserService.window.requestAnimationFrame(()=>this._refresh())),l.isLinux&&v&&this.selectionText.length&&this._onLinuxMouseSelection.fire(this.selectionText)}_refresh(){this._refreshAnimationFrame=void 0,this._onRedrawRequest.fire({start:this._model.finalSelectionStart,end:this._model.finalSelectionEnd,columnSelectMode:this._activeSelectionMode===3})}_isClickInSelection(v){const k=this._getMouseBufferCoords(v),T=this._model.finalSelectionStart,P=this._model.finalSelectionEnd;return!!(T&&P&&k)&&this._areCoordsInSelection(k,T,P)}isCellInSelection(v,k){const T=this._model.finalSelectionStart,P=this._model.finalSelectionEnd;return!(!T||!P)&&this._areCoordsInSelection([v,k],T,P)}_areCoordsInSelection(v,k,T){return v[1]>k[1]&&v[1]<T[1]||k[1]===T[1]&&v[1]===k[1]&&v[0]>=k[0]&&v[0]<T[0]||k[1]<T[1]&&v[1]===T[1]&&v[0]<T[0]||k[1]<T[1]&&v[1]===k[1]&&v[0]>=k[0]}_selectWordAtCursor(v,k){var T,P;const B=(P=(T=this._linkifier.currentLink)===null||T===void 0?void 0:T.link)===null||P===void 0?void 0:P.range;if(B)return this._model.selectionStart=[B.start.x-1,B.start.y-1],this._model.selectionStartLength=(0,s.getRangeLength)(B,this._bufferService.cols),this._model.selectionEnd=void 0,!0;const I=this._getMouseBufferCoords(v);return!!I&&(this._selectWordAt(I,k),this._model.selectionEnd=void 0,!0)}selectAll(){this._model.isSelectAllActive=!0,this.refresh(),this._onSelectionChange.fire()}selectLines(v,k){this._model.clearSelection(),v=Math.max(v,0),k=Math.min(k,this._bufferService.buffer.lines.length-1),this._model.selectionStart=[0,v],this._model.selectionEnd=[this._bufferService.cols,k],this.refresh(),this._onSelectionChange.fire()}_handleTrim(v){this._model.handleTrim(v)&&this.refresh()}_getMouseBufferCoords(v){const k=this._mouseService.getCoords(v,this._screenElement,this._bufferService.cols,this._bufferService.rows,!0);if(k)return k[0]--,k[1]--,k[1]+=this._bufferService.buffer.ydisp,k}_getMouseEventScrollAmount(v){let k=(0,d.getCoordsRelativeToElement)(this._coreBrowserService.window,v,this._screenElement)[1];const T=this._renderService.dimensions.css.canvas.height;return k>=0&&k<=T?0:(k>T&&(k-=T),k=Math.min(Math.max(k,-50),50),k/=50,k/Math.abs(k)+Math.round(14*k))}shouldForceSelection(v){return l.isMac?v.altKey&&this._optionsService.rawOptions.macOptionClickForcesSelection:v.shiftKey}handleMouseDown(v){if(this._mouseDownTimeStamp=v.timeStamp,(v.button!==2||!this.hasSelection)&&v.button===0){if(!this._enabled){if(!this.shouldForceSelection(v))return;v.stopPropagation()}v.preventDefault(),this._dragScrollAmount=0,this._enabled&&v.shiftKey?this._handleIncrementalClick(v):v.detail===1?this._handleSingleClick(v):v.detail===2?this._handleDoubleClick(v):v.detail===3&&this._handleTripleClick(v),this._addMouseDownListeners(),this.refresh(!0)}}_addMouseDownListeners(){this._screenElement.ownerDocument&&(this._screenElement.ownerDocument.addEventListener("mousemove",this._mouseMoveListener),this._screenElement.ownerDocument.addEventListener("mouseup",this._mouseUpListener)),this._dragScrollIntervalTimer=this._coreBrowserService.window.setInterval(()=>this._dragScroll(),50)}_removeMouseDownListeners(){this._screenElement.ownerDocument&&(this._screenElement.ownerDocument.removeEventListener("mousemove",this._mouseMoveListener),this._screenElement.ownerDocument.removeEventListener("mouseup",this._mouseUpListener)),this._coreBrowserService.window.clearInterval(this._dragScrollIntervalTimer),this._dragScrollIntervalTimer=void 0}_handleIncrementalClick(v){this._model.selectionStart&&(this._model.selectionEnd=this._getMouseBufferCoords(v))}_handleSingleClick(v){if(this._model.selectionStartLength=0,this._model.isSelectAllActive=!1,this._activeSelectionMode=this.shouldColumnSelect(v)?3:0,this._model.selectionStart=this._getMouseBufferCoords(v),!this._model.selectionStart)return;this._model.selectionEnd=void 0;const k=this._bufferService.buffer.lines.get(this._model.selectionStart[1]);k&&k.length!==this._model.selectionStart[0]&&k.hasWidth(this._model.selectionStart[0])===0&&this._model.selectionStart[0]++}_handleDoubleClick(v){this._selectWordAtCursor(v,!0)&&(this._activeSelectionMode=1)}_handleTripleClick(v){const k=this._getMouseBufferCoords(v);k&&(this._activeSelectionMode=2,this._selectLineAt(k[1]))}shouldColumnSelect(v){return v.altKey&&!(l.isMac&&this._optionsService.rawOptions.macOptionClickForcesSelection)}_handleMouseMove(v){if(v.stopImmediatePropagation(),!this._model.selectionStart)return;const k=this._model.selectionEnd?[this._model.selectionEnd[0],this._model.selectionEnd[1]]:null;if(this._model.selectionEnd=this._getMouseBufferCoords(v),!this._model.selectionEnd)return void this.refresh(!0);this._activeSelectionMode===2?this._model.selectionEnd[1]<this._model.selectionStart[1]?this._model.selectionEnd[0]=0:this._model.selectionEnd[0]=this._bufferService.cols:this._activeSelectionMode===1&&this._selectToWordAt(this._model.selectionEnd),this._dragScrollAmount=this._getMouseEventScrollAmount(v),this._activeSelectionMode!==3&&(this._dragScrollAmount>0?this._model.selectionEnd[0]=this._bufferService.cols:this._dragScrollAmount<0&&(this._model.selectionEnd[0]=0));const T=this._bufferService.buffer;if(this._model.selectionEnd[1]<T.lines.length){const P=T.lines.get(this._model.selectionEnd[1]);P&&P.hasWidth(this._model.selectionEnd[0])===0&&this._model.selectionEnd[0]++}k&&k[0]===this._model.selectionEnd[0]&&k[1]===this._model.selectionEnd[1]||this.refresh(!0)}_dragScroll(){if(this._model.selectionEnd&&this._model.selectionStart&&this._dragScrollAmount){this._onRequestScrollLines.fire({amount:this._dragScrollAmount,suppressScrollEvent:!1});const v=this._bufferService.buffer;this._dragScrollAmount>0?(this._activeSelectionMode!==3&&(this._model.selectionEnd[0]=this._bufferService.cols),this._model.selectionEnd[1]=Math.min(v.ydisp+this._bufferService.rows,v.lines.length-1)):(this._activeSelectionMode!==3&&(this._model.selectionEnd[0]=0),this._model.selectionEnd[1]=v.ydisp),this.refresh()}}_handleMouseUp(v){const k=v.timeStamp-this._mouseDownTimeStamp;if(this._removeMouseDownListeners(),this.selectionText.length<=1&&k<500&&v.altKey&&this._optionsService.rawOptions.altClickMovesCursor){if(this._bufferService.buffer.ybase===this._bufferService.buffer.ydisp){const T=this._mouseService.getCoords(v,this._element,this._bufferService.cols,this._bufferService.rows,!1);if(T&&T[0]!==void 0&&T[1]!==void 0){const P=(0,_.moveToCellSequence)(T[0]-1,T[1]-1,this._bufferService,this._coreService.decPrivateModes.applicationCursorKeys);this._coreService.triggerDataEvent(P,!0)}}}else this._fireEventIfSelectionChanged()}_fireEventIfSelectionChanged(){const v=this._model.finalSelectionStart,k=this._model.finalSelectionEnd,T=!(!v||!k||v[0]===k[0]&&v[1]===k[1]);T?v&&k&&(this._oldSelectionStart&&this._oldSelectionEnd&&v[0]===this._oldSelectionStart[0]&&v[1]===this._oldSelectionStart[1]&&k[0]===this._oldSelectionEnd[0]&&k[1]===this._oldSelectionEnd[1]||this._fireOnSelectionChange(v,k,T)):this._oldHasSelection&&this._fireOnSelectionChange(v,k,T)}_fireOnSelectionChange(v,k,T){this._oldSelectionStart=v,this._oldSelectionEnd=k,this._oldHasSelection=T,this._onSelectionChange.fire()}_handleBufferActivate(v){this.clearSelection(),this._trimListener.dispose(),this._trimListener=v.activeBuffer.lines.onTrim(k=>this._handleTrim(k))}_convertViewportColToCharacterIndex(v,k){let T=k;for(let P=0;k>=P;P++){const B=v.loadCell(P,this._workCell).getChars().length;this._workCell.getWidth()===0?T--:B>1&&k!==P&&(T+=B-1)}return T}setSelection(v,k,T){this._model.clearSelection(),this._removeMouseDownListeners(),this._model.selectionStart=[v,k],this._model.selectionStartLength=T,this.refresh(),this._fireEventIfSelectionChanged()}rightClickSelect(v){this._isClickInSelection(v)||(this._selectWordAtCursor(v,!1)&&this.refresh(!0),this._fireEventIfSelectionChanged())}_getWordAt(v,k,T=!0,P=!0){if(v[0]>=this._bufferService.cols)return;const B=this._bufferService.buffer,I=B.lines.get(v[1]);if(!I)return;const F=B.translateBufferLineToString(v[1],!1);let H=this._convertViewportColToCharacterIndex(I,v[0]),W=H;const O=v[0]-H;let b=0,R=0,A=0,M=0;if(F.charAt(H)===" "){for(;H>0&&F.charAt(H-1)===" ";)H--;for(;W<F.length&&F.charAt(W+1)===" ";)W++}else{let Q=v[0],Y=v[0];I.getWidth(Q)===0&&(b++,Q--),I.getWidth(Y)===2&&(R++,Y++);const se=I.getString(Y).length;for(se>1&&(M+=se-1,W+=se-1);Q>0&&H>0&&!this._isCharWordSeparator(I.loadCell(Q-1,this._workCell));){I.loadCell(Q-1,this._workCell);const D=this._workCell.getChars().length;this._workCell.getWidth()===0?(b++,Q--):D>1&&(A+=D-1,H-=D-1),H--,Q--}for(;Y<I.length&&W+1<F.length&&!this._isCharWordSeparator(I.loadCell(Y+1,this._workCell));){I.loadCell(Y+1,this._workCell);const D=this._workCell.getChars().length;this._workCell.getWidth()===2?(R++,Y++):D>1&&(M+=D-1,W+=D-1),W++,Y++}}W++;let z=H+O-b+A,q=Math.min(this._bufferService.cols,W-H+b+R-A-M);if(k||F.slice(H,W).trim()!==""){if(T&&z===0&&I.getCodePoint(0)!==32){const Q=B.lines.get(v[1]-1);if(Q&&I.isWrapped&&Q.getCodePoint(this._bufferService.cols-1)!==32){const Y=this._getWordAt([this._bufferService.cols-1,v[1]-1],!1,!0,!1);if(Y){const se=this._bufferService.cols-Y.start;z-=se,q+=se}}}if(P&&z+q===this._bufferService.cols&&I.getCodePoint(this._bufferService.cols-1)!==32){const Q=B.lines.get(v[1]+1);if(Q!=null&&Q.isWrapped&&Q.getCodePoint(0)!==32){const Y=this._getWordAt([0,v[1]+1],!1,!1,!0);Y&&(q+=Y.length)}}return{start:z,length:q}}}_selectWordAt(v,k){const T=this._getWordAt(v,k);if(T){for(;T.start<0;)T.start+=this._bufferService.cols,v[1]--;this._model.selectionStart=[T.start,v[1]],this._model.selectionStartLength=T.length}}_selectToWordAt(v){const k=this._getWordAt(v,!0);if(k){let T=v[1];for(;k.start<0;)k.start+=this._bufferService.cols,T--;if(!this._model.areSelectionValuesReversed())for(;k.start+k.length>this._bufferService.cols;)k.length-=this._bufferService.cols,T++;this._model.selectionEnd=[this._model.areSelectionValuesReversed()?k.start:k.start+k.length,T]}}_isCharWordSeparator(v){return v.getWidth()!==0&&this._optionsService.rawOptions.wordSeparator.indexOf(v.getChars())>=0}_selectLineAt(v){const k=this._bufferService.buffer.getWrappedRangeForLine(v),T={start:{x:0,y:k.first},end:{x:this._bufferService.cols-1,y:k.last}};this._model.selectionStart=[0,k.first],this._model.selectionEnd=void 0,this._model.selectionStartLength=(0,s.getRangeLength)(T,this._bufferService.cols)}};n.SelectionService=E=f([y(3,p.IBufferService),y(4,p.ICoreService),y(5,w.IMouseService),y(6,p.IOptionsService),y(7,w.IRenderService),y(8,w.ICoreBrowserService)],E)},4725:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.IThemeService=n.ICharacterJoinerService=n.ISelectionService=n.IRenderService=n.IMouseService=n.ICoreBrowserService=n.ICharSizeService=void 0;const f=u(8343);n.ICharSizeService=(0,f.createDecorator)("CharSizeService"),n.ICoreBrowserService=(0,f.createDecorator)("CoreBrowserService"),n.IMouseService=(0,f.createDecorator)("MouseService"),n.IRenderService=(0,f.createDecorator)("RenderService"),n.ISelectionService=(0,f.createDecorator)("SelectionService"),n.ICharacterJoinerService=(0,f.createDecorator)("CharacterJoinerService"),n.IThemeService=(0,f.createDecorator)("ThemeService")},6731:function(g,n,u){var f=this&&this.__decorate||function(E,v,k,T){var P,B=arguments.length,I=B<3?v:T===null?T=Object.getOwnPropertyDescriptor(v,k):T;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")I=Reflect.decorate(E,v,k,T);else for(var F=E.length-1;F>=0;F--)(P=E[F])&&(I=(B<3?P(I):B>3?P(v,k,I):P(v,k))||I);return B>3&&I&&Object.defineProperty(v,k,I),I},y=this&&this.__param||function(E,v){return function(k,T){v(k,T,E)}};Object.defineProperty(n,"__esModule",{value:!0}),n.ThemeService=n.DEFAULT_ANSI_COLORS=void 0;const d=u(7239),_=u(8055),S=u(8460),w=u(844),C=u(2585),a=_.css.toColor("#ffffff"),l=_.css.toColor("#000000"),s=_.css.toColor("#ffffff"),o=_.css.toColor("#000000"),p={css:"rgba(255, 255, 255, 0.3)",rgba:4294967117};n.DEFAULT_ANSI_COLORS=Object.freeze((()=>{const E=[_.css.toColor("#2e3436"),_.css.toColor("#cc0000"),_.css.toColor("#4e9a06"),_.css.toColor("#c4a000"),_.css.toColor("#3465a4"),_.css.toColor("#75507b"),_.css.toColor("#06989a"),_.css.toColor("#d3d7cf"),_.css.toColor("#555753"),_.css.toColor("#ef2929"),_.css.toColor("#8ae234"),_.css.toColor("#fce94f"),_.css.toColor("#729fcf"),_.css.toColor("#ad7fa8"),_.css.toColor("#34e2e2"),_.css.toColor("#eeeeec")],v=[0,95,135,175,215,255];for(let k=0;k<216;k++){const T=v[k/36%6|0],P=v[k/6%6|0],B=v[k%6];E.push({css:_.channels.toCss(T,P,B),rgba:_.channels.toRgba(T,P,B)})}for(let k=0;k<24;k++){const T=8+10*k;E.push({css:_.channels.toCss(T,T,T),rgba:_.channels.toRgba(T,T,T)})}return E})());let m=n.ThemeService=class extends w.Disposable{get colors(){return this._colors}constructor(E){super(),this._optionsService=E,this._contrastCache=new d.ColorContrastCache,this._halfContrastCache=new d.ColorContrastCache,this._onChangeColors=this.register(new S.EventEmitter),this.onChangeColors=this._onChangeColors.event,this._colors={foreground:a,background:l,cursor:s,cursorAccent:o,selectionForeground:void 0,selectionBackgroundTransparent:p,selectionBackgroundOpaque:_.color.blend(l,p),selectionInactiveBackgroundTransparent:p,selectionInactiveBackgroundOpaque:_.color.blend(l,p),ansi:n.DEFAULT_ANSI_COLORS.slice(),contrastCache:this._contrastCache,halfContrastCache:this._halfContrastCache},this._updateRestoreColors(),this._setTheme(this._optionsService.rawOptions.theme),this.register(this._optionsService.onSpecificOptionChange("minimumContrastRatio",()=>this._contrastCache.clear())),this.register(this._optionsService.onSpecificOptionChange("theme",()=>this._setTheme(this._optionsService.rawOptions.theme)))}_setTheme(E={}){const v=this._colors;if(v.foreground=x(E.foreground,a),v.background=x(E.background,l),v.cursor=x(E.cursor,s),v.cursorAccent=x(E.cursorAccent,o),v.selectionBackgroundTransparent=x(E.selectionBackground,p),v.selectionBackgroundOpaque=_.color.blend(v.background,v.selectionBackgroundTransparent),v.selectionInactiveBackgroundTransparent=x(E.selectionInactiveBackground,v.selectionBackgroundTransparent),v.selectionInactiveBackgroundOpaque=_.color.blend(v.background,v.selectionInactiveBackgroundTransparent),v.selectionForeground=E.selectionForeground?x(E.selectionForeground,_.NULL_COLOR):void 0,v.selectionForeground===_.NULL_COLOR&&(v.selectionForeground=void 0),_.color.isOpaque(v.selectionBackgroundTransparent)&&(v.selectionBackgroundTransparent=_.color.opacity(v.selectionBackgroundTransparent,.3)),_.color.isOpaque(v.selectionInactiveBackgroundTransparent)&&(v.selectionInactiveBackgroundTransparent=_.color.opacity(v.selectionInactiveBackgroundTransparent,.3)),v.ansi=n.DEFAULT_ANSI_COLORS.slice(),v.ansi[0]=x(E.black,n.DEFAULT_ANSI_COLORS[0]),v.ansi[1]=x(E.red,n.DEFAULT_ANSI_COLORS[1]),v.ansi[2]=x(E.green,n.DEFAULT_ANSI_COLORS[2]),v.ansi[3]=x(E.yellow,n.DEFAULT_ANSI_COLORS[3]),v.ansi[4]=x(E.blue,n.DEFAULT_ANSI_COLORS[4]),v.ansi[5]=x(E.magenta,n.DEFAULT_ANSI_COLORS[5]),v.ansi[6]=x(E.cyan,n.DEFAULT_ANSI_COLORS[6]),v.ansi[7]=x(E.white,n.DEFAULT_ANSI_COLORS[7]),v.ansi[8]=x(E.brightBlack,n.DEFAULT_ANSI_COLORS[8]),v.ansi[9]=x(E.brightRed,n.DEFAULT_ANSI_COLORS[9]),v.ansi[10]=x(E.brightGreen,n.DEFAULT_ANSI_COLORS[10]),v.ansi[11]=x(E.brightYellow,n.DEFAULT_ANSI_COLORS[11]),v.ansi[12]=x(E.brightBlue,n.DEFAULT_ANSI_COLORS[12]),v.ansi[13]=x(E.brightMagenta,n.DEFAULT_ANSI_COLORS[13]),v.ansi[14]=x(E.brightCyan,n.DEFAULT_ANSI_COLORS[14]),v.ansi[15]=x(E.brightWhite,n.DEFAULT_ANSI_COLORS[15]),E.extendedAnsi){const k=Math.min(v.ansi.length-16,E.extendedAnsi.length);for(let T=0;T<k;T++)v.ansi[T+16]=x(E.extendedAnsi[T],n.DEFAULT_ANSI_COLORS[T+16])}this._contrastCache.clear(),this._halfContrastCache.clear(),this._updateRestoreColors(),this._onChangeColors.fire(this.colors)}restoreColor(E){this._restoreColor(E),this._onChangeColors.fire(this.colors)}_restoreColor(E){if(E!==void 0)switch(E){case 256:this._colors.foreground=this._restoreColors.foreground;break;case 257:this._colors.background=this._restoreColors.background;break;case 258:this._colors.cursor=this._restoreColors.cursor;break;default:this._colors.ansi[E]=this._restoreColors.ansi[E]}else for(let v=0;v<this._restoreColors.ansi.length;++v)this._colors.ansi[v]=this._restoreColors.ansi[v]}modifyColors(E){E(this._colors),this._onChangeColors.fire(this.colors)}_updateRestoreColors(){this._restoreColors={foreground:this._colors.foreground,background:this._colors.background,cursor:this._colors.cursor,ansi:this._colors.ansi.slice()}}};function x(E,v){if(E!==void 0)try{return _.css.toColor(E)}catch{}return v}n.ThemeService=m=f([y(0,C.IOptionsService)],m)},6349:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CircularList=void 0;const f=u(8460),y=u(844);class d extends y.Disposable{constructor(S){super(),this._maxLength=S,this.onDeleteEmitter=this.register(new f.EventEmitter),this.onDelete=this.onDeleteEmitter.event,this.onInsertEmitter=this.register(new f.EventEmitter),this.onInsert=this.onInsertEmitter.event,this.onTrimEmitter=this.register(new f.EventEmitter),this.onTrim=this.onTrimEmitter.event,this._array=new Array(this._maxLength),this._startIndex=0,this._length=0}get maxLength(){return this._maxLength}set maxLength(S){if(this._maxLength===S)return;const w=new Array(S);for(let C=0;C<Math.min(S,this.length);C++)w[C]=this._array[this._getCyclicIndex(C)];this._array=w,this._maxLength=S,this._startIndex=0}get length(){return this._length}set length(S){if(S>this._length)for(let w=this._length;w<S;w++)this._array[w]=void 0;this._length=S}get(S){return this._array[this._getCyclicIndex(S)]}set(S,w){this._array[this._getCyclicIndex(S)]=w}push(S){this._array[this._getCyclicIndex(this._length)]=S,this._length===this._maxLength?(this._startIndex=++this._startIndex%this._maxLength,this.onTrimEmitter.fire(1)):this._length++}recycle(){if(this._length!==this._maxLength)throw new Error("Can only recycle when the buffer is full");return this._startIndex=++this._startIndex%this._maxLength,this.onTrimEmitter.fire(1),this._array[this._getCyclicIndex(this._length-1)]}get isFull(){return this._length===this._maxLength}pop(){return this._array[this._getCyclicIndex(this._length---1)]}splice(S,w,...C){if(w){for(let a=S;a<this._length-w;a++)this._array[this._getCyclicIndex(a)]=this._array[this._getCyclicIndex(a+w)];this._length-=w,this.onDeleteEmitter.fire({index:S,amount:w})}for(let a=this._length-1;a>=S;a--)this._array[this._getCyclicIndex(a+C.length)]=this._array[this._getCyclicIndex(a)];for(let a=0;a<C.length;a++)this._array[this._getCyclicIndex(S+a)]=C[a];if(C.length&&this.onInsertEmitter.fire({index:S,amount:C.length}),this._length+C.length>this._maxLength){const a=this._length+C.length-this._maxLength;this._startIndex+=a,this._length=this._maxLength,this.onTrimEmitter.fire(a)}else this._length+=C.length}trimStart(S){S>this._length&&(S=this._length),this._startIndex+=S,this._length-=S,this.onTrimEmitter.fire(S)}shiftElements(S,w,C){if(!(w<=0)){if(S<0||S>=this._length)throw new Error("start argument out of range");if(S+C<0)throw new Error("Cannot shift elements in list beyond index 0");if(C>0){for(let l=w-1;l>=0;l--)this.set(S+l+C,this.get(S+l));const a=S+w+C-this._length;if(a>0)for(this._length+=a;this._length>this._maxLength;)this._length--,this._startIndex++,this.onTrimEmitter.fire(1)}else for(let a=0;a<w;a++)this.set(S+a+C,this.get(S+a))}}_getCyclicIndex(S){return(this._startIndex+S)%this._maxLength}}n.CircularList=d},1439:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.clone=void 0,n.clone=function u(f,y=5){if(typeof f!="object")return f;const d=Array.isArray(f)?[]:{};for(const _ in f)d[_]=y<=1?f[_]:f[_]&&u(f[_],y-1);return d}},8055:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.contrastRatio=n.toPaddedHex=n.rgba=n.rgb=n.css=n.color=n.channels=n.NULL_COLOR=void 0;const f=u(6114);let y=0,d=0,_=0,S=0;var w,C,a,l,s;function o(m){const x=m.toString(16);return x.length<2?"0"+x:x}function p(m,x){return m<x?(x+.05)/(m+.05):(m+.05)/(x+.05)}n.NULL_COLOR={css:"#00000000",rgba:0},function(m){m.toCss=function(x,E,v,k){return k!==void 0?`#${o(x)}${o(E)}${o(v)}${o(k)}`:`#${o(x)}${o(E)}${o(v)}`},m.toRgba=function(x,E,v,k=255){return(x<<24|E<<16|v<<8|k)>>>0}}(w||(n.channels=w={})),function(m){function x(E,v){return S=Math.round(255*v),[y,d,_]=s.toChannels(E.rgba),{css:w.toCss(y,d,_,S),rgba:w.toRgba(y,d,_,S)}}m.blend=function(E,v){if(S=(255&v.rgba)/255,S===1)return{css:v.css,rgba:v.rgba};const k=v.rgba>>24&255,T=v.rgba>>16&255,P=v.rgba>>8&255,B=E.rgba>>24&255,I=E.rgba>>16&255,F=E.rgba>>8&255;return y=B+Math.round((k-B)*S),d=I+Math.round((T-I)*S),_=F+Math.round((P-F)*S),{css:w.toCss(y,d,_),rgba:w.toRgba(y,d,_)}},m.isOpaque=function(E){return(255&E.rgba)==255},m.ensureContrastRatio=function(E,v,k){const T=s.ensureContrastRatio(E.rgba,v.rgba,k);if(T)return s.toColor(T>>24&255,T>>16&255,T>>8&255)},m.opaque=function(E){const v=(255|E.rgba)>>>0;return[y,d,_]=s.toChannels(v),{css:w.toCss(y,d,_),rgba:v}},m.opacity=x,m.multiplyOpacity=function(E,v){return S=255&E.rgba,x(E,S*v/255)},m.toColorRGB=function(E){return[E.rgba>>24&255,E.rgba>>16&255,E.rgba>>8&255]}}(C||(n.color=C={})),function(m){let x,E;if(!f.isNode){const v=document.createElement("canvas");v.width=1,v.height=1;const k=v.getContext("2d",{willReadFrequently:!0});k&&(x=k,x.globalCompositeOperation="copy",E=x.createLinearGradient(0,0,1,1))}m.toColor=function(v){if(v.match(/#[\da-f]{3,8}/i))switch(v.length){case 4:return y=parseInt(v.slice(1,2).repeat(2),16),d=parseInt(v.slice(2,3).repeat(2),16),_=parseInt(v.slice(3,4).repeat(2),16),s.toColor(y,d,_);case 5:return y=parseInt(v.slice(1,2).repeat(2),16),d=parseInt(v.slice(2,3).repeat(2),16),_=parseInt(v.slice(3,4).repeat(2),16),S=parseInt(v.slice(4,5).repeat(2),16),s.toColor(y,d,_,S);case 7:return{css:v,rgba:(parseInt(v.slice(1),16)<<8|255)>>>0};case 9:return{css:v,rgba:parseInt(v.slice(1),16)>>>0}}const k=v.match(/rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(,\s*(0|1|\d?\.(\d+))\s*)?\)/);if(k)return y=parseInt(k[1]),d=parseInt(k[2]),_=parseInt(k[3]),S=Math.round(255*(k[5]===void 0?1:parseFloat(k[5]))),s.toColor(y,d,_,S);if(!x||!E)throw new Error("css.toColor: Unsupported css format");if(x.fillStyle=E,x.fillStyle=v,typeof x.fillStyle!="string")throw new Error("css.toColor: Unsupported css format");if(x.fillRect(0,0,1,1),[y,d,_,S]=x.getImageData(0,0,1,1).data,S!==255)throw new Error("css.toColor: Unsupported css format");return{rgba:w.toRgba(y,d,_,S),css:v}}}(a||(n.css=a={})),function(m){function x(E,v,k){const T=E/255,P=v/255,B=k/255;return .2126*(T<=.03928?T/12.92:Math.pow((T+.055)/1.055,2.4))+.7152*(P<=.03928?P/12.92:Math.pow((P+.055)/1.055,2.4))+.0722*(B<=.03928?B/12.92:Math.pow((B+.055)/1.055,2.4))}m.relativeLuminance=function(E){return x(E>>16&255,E>>8&255,255&E)},m.relativeLuminance2=x}(l||(n.rgb=l={})),function(m){function x(v,k,T){const P=v>>24&255,B=v>>16&255,I=v>>8&255;let F=k>>24&255,H=k>>16&255,W=k>>8&255,O=p(l.relativeLuminance2(F,H,W),l.relativeLuminance2(P,B,I));for(;O<T&&(F>0||H>0||W>0);)F-=Math.max(0,Math.ceil(.1*F)),H-=Math.max(0,Math.ceil(.1*H)),W-=Math.max(0,Math.ceil(.1*W)),O=p(l.relativeLuminance2(F,H,W),l.relativeLuminance2(P,B,I));return(F<<24|H<<16|W<<8|255)>>>0}function E(v,k,T){const P=v>>24&255,B=v>>16&255,I=v>>8&255;let F=k>>24&255,H=k>>16&255,W=k>>8&255,O=p(l.relativeLuminance2(F,H,W),l.relativeLuminance2(P,B,I));for(;O<T&&(F<255||H<255||W<255);)F=Math.min(255,F+Math.ceil(.1*(255-F))),H=Math.min(255,H+Math.ceil(.1*(255-H))),W=Math.min(255,W+Math.ceil(.1*(255-W))),O=p(l.relativeLuminance2(F,H,W),l.relativeLuminance2(P,B,I));return(F<<24|H<<16|W<<8|255)>>>0}m.ensureContrastRatio=function(v,k,T){const P=l.relativeLuminance(v>>8),B=l.relativeLuminance(k>>8);if(p(P,B)<T){if(B<P){const H=x(v,k,T),W=p(P,l.relativeLuminance(H>>8));if(W<T){const O=E(v,k,T);return W>p(P,l.relativeLuminance(O>>8))?H:O}return H}const I=E(v,k,T),F=p(P,l.relativeLuminance(I>>8));if(F<T){const H=x(v,k,T);return F>p(P,l.relativeLuminance(H>>8))?I:H}return I}},m.reduceLuminance=x,m.increaseLuminance=E,m.toChannels=function(v){return[v>>24&255,v>>16&255,v>>8&255,255&v]},m.toColor=function(v,k,T,P){return{css:w.toCss(v,k,T,P),rgba:w.toRgba(v,k,T,P)}}}(s||(n.rgba=s={})),n.toPaddedHex=o,n.contrastRatio=p},8969:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CoreTerminal=void 0;const f=u(844),y=u(2585),d=u(4348),_=u(7866),S=u(744),w=u(7302),C=u(6975),a=u(8460),l=u(1753),s=u(1480),o=u(7994),p=u(9282),m=u(5435),x=u(5981),E=u(2660);let v=!1;class k extends f.Disposable{get onScroll(){return this._onScrollApi||(this._onScrollApi=this.register(new a.EventEmitter),this._onScroll.event(P=>{var B;(B=this._onScrollApi)===null||B===void 0||B.fire(P.position)})),this._onScrollApi.event}get cols(){return this._bufferService.cols}get rows(){return this._bufferService.rows}get buffers(){return this._bufferService.buffers}get options(){return this.optionsService.options}set options(P){for(const B in P)this.optionsService.options[B]=P[B]}constructor(P){super(),this._windowsWrappingHeuristics=this.register(new f.MutableDisposable),this._onBinary=this.register(new a.EventEmitter),this.onBinary=this._onBinary.event,this._onData=this.register(new a.EventEmitter),this.onData=this._onData.event,this._onLineFeed=this.register(new a.EventEmitter),this.onLineFeed=this._onLineFeed.event,this._onResize=this.register(new a.EventEmitter),this.onResize=this._onResize.event,this._onWriteParsed=this.register(new a.EventEmitter),this.onWriteParsed=this._onWriteParsed.event,this._onScroll=this.register(new a.EventEmitter),this._instantiationService=new d.InstantiationService,this.optionsService=this.register(new w.OptionsService(P)),this._instantiationService.setService(y.IOptionsService,this.optionsService),this._bufferService=this.register(this._instantiationService.createInstance(S.BufferService)),this._instantiationService.setService(y.IBufferService,this._bufferService),this._logService=this.register(this._instantiationService.createInstance(_.LogService)),this._instantiationService.setService(y.ILogService,this._logService),this.coreService=this.register(this._instantiationService.createInstance(C.CoreService)),this._instantiationService.setService(y.ICoreService,this.coreService),this.coreMouseService=this.register(this._instantiationService.createInstance(l.CoreMouseService)),this._instantiationService.setService(y.ICoreMouseService,this.coreMouseService),this.unicodeService=this.register(this._instantiationService.createInstance(s.UnicodeService)),this._instantiationService.setService(y.IUnicodeService,this.unicodeService),this._charsetService=this._instantiationService.createInstance(o.CharsetService),this._instantiationService.setService(y.ICharsetService,this._charsetService),this._oscLinkService=this._instantiationService.createInstance(E.OscLinkService),this._instantiationService.setService(y.IOscLinkService,this._oscLinkService),this._inputHandler=this.register(new m.InputHandler(this._bufferService,this._charsetService,this.coreService,this._logService,this.optionsService,this._oscLinkService,this.coreMouseService,this.unicodeService)),this.register((0,a.forwardEvent)(this._inputHandler.onLineFeed,this._onLineFeed)),this.register(this._inputHandler),this.register((0,a.forwardEvent)(this._bufferService.onResize,this._onResize)),this.register((0,a.forwardEvent)(this.coreService.onData,this._onData)),this.register((0,a.forwardEvent)(this.coreService.onBinary,this._onBinary)),this.register(this.coreService.onRequestScrollToBottom(()=>this.scrollToBottom())),this.register(this.coreService.onUserInput(()=>this._writeBuffer.handleUserInput())),this.register(this.optionsService.onMultipleOptionChange(["windowsMode","windowsPty"],()=>this._handleWindowsPtyOptionChange())),this.register(this._bufferService.onScroll(B=>{this._onScroll.fire({position:this._bufferService.buffer.ydisp,source:0}),this._inputHandler.markRangeDirty(this._bufferService.buffer.scrollTop,this._bufferService.buffer.scrollBottom)})),this.register(this._inputHandler.onScroll(B=>{this._onScroll.fire({position:this._bufferService.buffer.ydisp,source:0}),this._inputHandler.markRangeDirty(this._bufferService.buffer.scrollTop,this._bufferService.buffer.scrollBottom)})),this._writeBuffer=this.register(new x.WriteBuffer((B,I)=>this._inputHandler.parse(B,I))),this.register((0,a.forwardEvent)(this._writeBuffer.onWriteParsed,this._onWriteParsed))}write(P,B){this._writeBuffer.write(P,B)}writeSync(P,B){this._logService.logLevel<=y.LogLevelEnum.WARN&&!v&&(this._logService.warn("writeSync is unreliable and will be removed soon."),v=!0),this._writeBuffer.writeSync(P,B)}resize(P,B){isNaN(P)||isNaN(B)||(P=Math.max(P,S.MINIMUM_COLS),B=Math.max(B,S.MINIMUM_ROWS),this._bufferService.resize(P,B))}scroll(P,B=!1){this._bufferService.scroll(P,B)}scrollLines(P,B,I){this._bufferService.scrollLines(P,B,I)}scrollPages(P){this.scrollLines(P*(this.rows-1))}scrollToTop(){this.scrollLines(-this._bufferService.buffer.ydisp)}scrollToBottom(){this.scrollLines(this._bufferService.buffer.ybase-this._bufferService.buffer.ydisp)}scrollToLine(P){const B=P-this._bufferService.buffer.ydisp;B!==0&&this.scrollLines(B)}registerEscHandler(P,B){return this._inputHandler.registerEscHandler(P,B)}registerDcsHandler(P,B){return this._inputHandler.registerDcsHandler(P,B)}registerCsiHandler(P,B){return this._inputHandler.registerCsiHandler(P,B)}registerOscHandler(P,B){return this._inputHandler.registerOscHandler(P,B)}_setup(){this._handleWindowsPtyOptionChange()}reset(){this._inputHandler.reset(),this._bufferService.reset(),this._charsetService.reset(),this.coreService.reset(),this.coreMouseService.reset()}_handleWindowsPtyOptionChange(){let P=!1;const B=this.optionsService.rawOptions.windowsPty;B&&B.buildNumber!==void 0&&B.buildNumber!==void 0?P=B.backend==="conpty"&&B.buildNumber<21376:this.optionsService.rawOptions.windowsMode&&(P=!0),P?this._enableWindowsWrappingHeuristics():this._windowsWrappingHeuristics.clear()}_enableWindowsWrappingHeuristics(){if(!this._windowsWrappingHeuristics.value){const P=[];P.push(this.onLineFeed(p.updateWindowsModeWrappedState.bind(null,this._bufferService))),P.push(this.registerCsiHandler({final:"H"},()=>((0,p.updateWindowsModeWrappedState)(this._bufferService),!1))),this._windowsWrappingHeuristics.value=(0,f.toDisposable)(()=>{for(const B of P)B.dispose()})}}}n.CoreTerminal=k},8460:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.forwardEvent=n.EventEmitter=void 0,n.EventEmitter=class{constructor(){this._listeners=[],this._disposed=!1}get event(){return this._event||(this._event=u=>(this._listeners.push(u),{dispose:()=>{if(!this._disposed){for(let f=0;f<this._listeners.length;f++)if(this._listeners[f]===u)return void this._listeners.splice(f,1)}}})),this._event}fire(u,f){const y=[];for(let d=0;d<this._listeners.length;d++)y.push(this._listeners[d]);for(let d=0;d<y.length;d++)y[d].call(void 0,u,f)}dispose(){this.clearListeners(),this._disposed=!0}clearListeners(){this._listeners&&(this._listeners.length=0)}},n.forwardEvent=function(u,f){return u(y=>f.fire(y))}},5435:function(g,n,u){var f=this&&this.__decorate||function(O,b,R,A){var M,z=arguments.length,q=z<3?b:A===null?A=Object.getOwnPropertyDescriptor(b,R):A;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")q=Reflect.decorate(O,b,R,A);else for(var Q=O.length-1;Q>=0;Q--)(M=O[Q])&&(q=(z<3?M(q):z>3?M(b,R,q):M(b,R))||q);return z>3&&q&&Object.defineProperty(b,R,q),q},y=this&&this.__param||function(O,b){return function(R,A){b(R,A,O)}};Object.defineProperty(n,"__esModule",{value:!0}),n.InputHandler=n.WindowsOptionsReportType=void 0;const d=u(2584),_=u(7116),S=u(2015),w=u(844),C=u(482),a=u(8437),l=u(8460),s=u(643),o=u(511),p=u(3734),m=u(2585),x=u(6242),E=u(6351),v=u(5941),k={"(":0,")":1,"*":2,"+":3,"-":1,".":2},T=131072;function P(O,b){if(O>24)return b.setWinLines||!1;switch(O){case 1:return!!b.restoreWin;case 2:return!!b.minimizeWin;case 3:return!!b.setWinPosition;case 4:return!!b.setWinSizePixels;case 5:return!!b.raiseWin;case 6:return!!b.lowerWin;case 7:return!!b.refreshWin;case 8:return!!b.setWinSizeChars;case 9:return!!b.maximizeWin;case 10:return!!b.fullscreenWin;case 11:return!!b.getWinState;case 13:return!!b.getWinPosition;case 14:return!!b.getWinSizePixels;case 15:return!!b.getScreenSizePixels;case 16:return!!b.getCellSizePixels;case 18:return!!b.getWinSizeChars;case 19:return!!b.getScreenSizeChars;case 20:return!!b.getIconTitle;case 21:return!!b.getWinTitle;case 22:return!!b.pushTitle;case 23:return!!b.popTitle;case 24:return!!b.setWinLines}return!1}var B;(function(O){O[O.GET_WIN_SIZE_PIXELS=0]="GET_WIN_SIZE_PIXELS",O[O.GET_CELL_SIZE_PIXELS=1]="GET_CELL_SIZE_PIXELS"})(B||(n.WindowsOptionsReportType=B={}));let I=0;class F extends w.Disposable{getAttrData(){return this._curAttrData}constructor(b,R,A,M,z,q,Q,Y,se=new S.EscapeSequenceParser){super(),this._bufferService=b,this._charsetService=R,this._coreService=A,this._logService=M,this._optionsService=z,this._oscLinkService=q,this._coreMouseService=Q,this._unicodeService=Y,this._parser=se,this._parseBuffer=new Uint32Array(4096),this._stringDecoder=new C.StringToUtf32,this._utf8Decoder=new C.Utf8ToUtf32,this._workCell=new o.CellData,this._windowTitle="",this._iconName="",this._windowTitleStack=[],this._iconNameStack=[],this._curAttrData=a.DEFAULT_ATTR_DATA.clone(),this._eraseAttrDataInternal=a.DEFAULT_ATTR_DATA.clone(),this._onRequestBell=this.register(new l.EventEmitter),this.onRequestBell=this._onRequestBell.event,this._onRequestRefreshRows=this.register(new l.EventEmitter),this.onRequestRefreshRows=this._onRequestRefreshRows.event,this._onRequestReset=this.register(new l.EventEmitter),this.onRequestReset=this._onRequestReset.event,this._onRequestSendFocus=this.register(new l.EventEmitter),this.onRequestSendFocus=this._onRequestSendFocus.event,this._onRequestSyncScrollBar=this.register(new l.EventEmitter),this.onRequestSyncScrollBar=this._onRequestSyncScrollBar.event,this._onRequestWindowsOptionsReport=this.register(new l.EventEmitter),this.onRequestWindowsOptionsReport=this._onRequestWindowsOptionsReport.event,this._onA11yChar=this.register(new l.EventEmitter),this.onA11yChar=this._onA11yChar.event,this._onA11yTab=this.register(new l.EventEmitter),this.onA11yTab=this._onA11yTab.event,this._onCursorMove=this.register(new l.EventEmitter),this.onCursorMove=this._onCursorMove.event,this._onLineFeed=this.register(new l.EventEmitter),this.onLineFeed=this._onLineFeed.event,this._onScroll=this.register(new l.EventEmitter),this.onScroll=this._onScroll.event,this._onTitleChange=this.register(new l.EventEmitter),this.onTitleChange=this._onTitleChange.event,this._onColor=this.register(new l.EventEmitter),this.onColor=this._onColor.event,this._parseStack={paused:!1,cursorStartX:0,cursorStartY:0,decodedLength:0,position:0},this._specialColors=[256,257,258],this.register(this._parser),this._dirtyRowTracker=new H(this._bufferService),this._activeBuffer=this._bufferService.buffer,this.register(this._bufferService.buffers.onBufferActivate(D=>this._activeBuffer=D.activeBuffer)),this._parser.setCsiHandlerFallback((D,j)=>{this._logService.debug("Unknown CSI code: ",{identifier:this._parser.identToString(D),params:j.toArray()})}),this._parser.setEscHandlerFallback(D=>{this._logService.debug("Unknown ESC code: ",{identifier:this._parser.identToString(D)})}),this._parser.setExecuteHandlerFallback(D=>{this._logService.debug("Unknown EXECUTE code: ",{code:D})}),this._parser.setOscHandlerFallback((D,j,$)=>{this._logService.debug("Unknown OSC code: ",{identifier:D,action:j,data:$})}),this._parser.setDcsHandlerFallback((D,j,$)=>{j==="HOOK"&&($=$.toArray()),this._logService.debug("Unknown DCS code: ",{identifier:this._parser.identToString(D),action:j,payload:$})}),this._parser.setPrintHandler((D,j,$)=>this.print(D,j,$)),this._parser.registerCsiHandler({final:"@"},D=>this.insertChars(D)),this._parser.registerCsiHandler({intermediates:" ",final:"@"},D=>this.scrollLeft(D)),this._parser.registerCsiHandler({final:"A"},D=>this.cursorUp(D)),this._parser.registerCsiHandler({intermediates:" ",final:"A"},D=>this.scrollRight(D)),this._parser.registerCsiHandler({final:"B"},D=>this.cursorDown(D)),this._parser.registerCsiHandler({final:"C"},D=>this.cursorForward(D)),this._parser.registerCsiHandler({final:"D"},D=>this.cursorBackward(D)),this._parser.registerCsiHandler({final:"E"},D=>this.cursorNextLine(D)),this._parser.registerCsiHandler({final:"F"},D=>this.cursorPrecedingLine(D)),this._parser.registerCsiHandler({final:"G"},D=>this.cursorCharAbsolute(D)),this._parser.registerCsiHandler({final:"H"},D=>this.cursorPosition(D)),this._parser.registerCsiHandler({final:"I"},D=>this.cursorForwardTab(D)),this._parser.registerCsiHandler({final:"J"},D=>this.eraseInDisplay(D,!1)),this._parser.registerCsiHandler({prefix:"?",final:"J"},D=>this.eraseInDisplay(D,!0)),this._parser.registerCsiHandler({final:"K"},D=>this.eraseInLine(D,!1)),this._parser.registerCsiHandler({prefix:"?",final:"K"},D=>this.eraseInLine(D,!0)),this._parser.registerCsiHandler({final:"L"},D=>this.insertLines(D)),this._parser.registerCsiHandler({final:"M"},D=>this.deleteLines(D)),this._parser.registerCsiHandler({final:"P"},D=>this.deleteChars(D)),this._parser.registerCsiHandler({final:"S"},D=>this.scrollUp(D)),this._parser.registerCsiHandler({final:"T"},D=>this.scrollDown(D)),this._parser.registerCsiHandler({final:"X"},D=>this.eraseChars(D)),this._parser.registerCsiHandler({final:"Z"},D=>this.cursorBackwardTab(D)),this._parser.registerCsiHandler({final:"`"},D=>this.charPosAbsolute(D)),this._parser.registerCsiHandler({final:"a"},D=>this.hPositionRelative(D)),this._parser.registerCsiHandler({final:"b"},D=>this.repeatPrecedingCharacter(D)),this._parser.registerCsiHandler({final:"c"},D=>this.sendDeviceAttributesPrimary(D)),this._parser.registerCsiHandler({prefix:">",final:"c"},D=>this.sendDeviceAttributesSecondary(D)),this._parser.registerCsiHandler({final:"d"},D=>this.linePosAbsolute(D)),this._parser.registerCsiHandler({final:"e"},D=>this.vPositionRelative(D)),this._parser.registerCsiHandler({final:"f"},D=>this.hVPosition(D)),this._parser.registerCsiHandler({final:"g"},D=>this.tabClear(D)),this._parser.registerCsiHandler({final:"h"},D=>this.setMode(D)),this._parser.registerCsiHandler({prefix:"?",final:"h"},D=>this.setModePrivate(D)),this._parser.registerCsiHandler({final:"l"},D=>this.resetMode(D)),this._parser.registerCsiHandler({prefix:"?",final:"l"},D=>this.resetModePrivate(D)),this._parser.registerCsiHandler({final:"m"},D=>this.charAttributes(D)),this._parser.registerCsiHandler({final:"n"},D=>this.deviceStatus(D)),this._parser.registerCsiHandler({prefix:"?",final:"n"},D=>this.deviceStatusPrivate(D)),this._parser.registerCsiHandler({intermediates:"!",final:"p"},D=>this.softReset(D)),this._parser.registerCsiHandler({intermediates:" ",final:"q"},D=>this.setCursorStyle(D)),this._parser.registerCsiHandler({final:"r"},D=>this.setScrollRegion(D)),this._parser.registerCsiHandler({final:"s"},D=>this.saveCursor(D)),this._parser.registerCsiHandler({final:"t"},D=>this.windowOptions(D)),this._parser.registerCsiHandler({final:"u"},D=>this.restoreCursor(D)),this._parser.registerCsiHandler({intermediates:"'",final:"}"},D=>this.insertColumns(D)),this._parser.registerCsiHandler({intermediates:"'",final:"~"},D=>this.deleteColumns(D)),this._parser.registerCsiHandler({intermediates:'"',final:"q"},D=>this.selectProtected(D)),this._parser.registerCsiHandler({intermediates:"$",final:"p"},D=>this.requestMode(D,!0)),this._parser.registerCsiHandler({prefix:"?",intermediates:"$",final:"p"},D=>this.requestMode(D,!1)),this._parser.setExecuteHandler(d.C0.BEL,()=>this.bell()),this._parser.setExecuteHandler(d.C0.LF,()=>this.lineFeed()),this._parser.setExecuteHandler(d.C0.VT,()=>this.lineFeed()),this._parser.setExecuteHandler(d.C0.FF,()=>this.lineFeed()),this._parser.setExecuteHandler(d.C0.CR,()=>this.carriageReturn()),this._parser.setExecuteHandler(d.C0.BS,()=>this.backspace()),this._parser.setExecuteHandler(d.C0.HT,()=>this.tab()),this._parser.setExecuteHandler(d.C0.SO,()=>this.shiftOut()),this._parser.setExecuteHandler(d.C0.SI,()=>this.shiftIn()),this._parser.setExecuteHandler(d.C1.IND,()=>this.index()),this._parser.setExecuteHandler(d.C1.NEL,()=>this.nextLine()),this._parser.setExecuteHandler(d.C1.HTS,()=>this.tabSet()),this._parser.registerOscHandler(0,new x.OscHandler(D=>(this.setTitle(D),this.setIconName(D),!0))),this._parser.registerOscHandler(1,new x.OscHandler(D=>this.setIconName(D))),this._parser.registerOscHandler(2,new x.OscHandler(D=>this.setTitle(D))),this._parser.registerOscHandler(4,new x.OscHandler(D=>this.setOrReportIndexedColor(D))),this._parser.registerOscHandler(8,new x.OscHandler(D=>this.setHyperlink(D))),this._parser.registerOscHandler(10,new x.OscHandler(D=>this.setOrReportFgColor(D))),this._parser.registerOscHandler(11,new x.OscHandler(D=>this.setOrReportBgColor(D))),this._parser.registerOscHandler(12,new x.OscHandler(D=>this.setOrReportCursorColor(D))),this._parser.registerOscHandler(104,new x.OscHandler(D=>this.restoreIndexedColor(D))),this._parser.registerOscHandler(110,new x.OscHandler(D=>this.restoreFgColor(D))),this._parser.registerOscHandler(111,new x.OscHandler(D=>this.restoreBgColor(D))),this._parser.registerOscHandler(112,new x.OscHandler(D=>this.restoreCursorColor(D))),this._parser.registerEscHandler({final:"7"},()=>this.saveCursor()),this._parser.registerEscHandler({final:"8"},()=>this.restoreCursor()),this._parser.registerEscHandler({final:"D"},()=>this.index()),this._parser.registerEscHandler({final:"E"},()=>this.nextLine()),this._parser.registerEscHandler({final:"H"},()=>this.tabSet()),this._parser.registerEscHandler({final:"M"},()=>this.reverseIndex()),this._parser.registerEscHandler({final:"="},()=>this.keypadApplicationMode()),this._parser.registerEscHandler({final:">"},()=>this.keypadNumericMode()),this._parser.registerEscHandler({final:"c"},()=>this.fullReset()),this._parser.registerEscHandler({final:"n"},()=>this.setgLevel(2)),this._parser.registerEscHandler({final:"o"},()=>this.setgLevel(3)),this._parser.registerEscHandler({final:"|"},()=>this.setgLevel(3)),this._parser.registerEscHandler({final:"}"},()=>this.setgLevel(2)),this._parser.registerEscHandler({final:"~"},()=>this.setgLevel(1)),this._parser.registerEscHandler({intermediates:"%",final:"@"},()=>this.selectDefaultCharset()),this._parser.registerEscHandler({intermediates:"%",final:"G"},()=>this.selectDefaultCharset());for(const D in _.CHARSETS)this._parser.registerEscHandler({intermediates:"(",final:D},()=>this.selectCharset("("+D)),this._parser.registerEscHandler({intermediates:")",final:D},()=>this.selectCharset(")"+D)),this._parser.registerEscHandler({intermediates:"*",final:D},()=>this.selectCharset("*"+D)),this._parser.registerEscHandler({intermediates:"+",final:D},()=>this.selectCharset("+"+D)),this._parser.registerEscHandler({intermediates:"-",final:D},()=>this.selectCharset("-"+D)),this._parser.registerEscHandler({intermediates:".",final:D},()=>this.selectCharset("."+D)),this._parser.registerEscHandler({intermediates:"/",final:D},()=>this.selectCharset("/"+D));this._parser.registerEscHandler({intermediates:"#",final:"8"},()=>this.screenAlignmentPattern()),this._parser.setErrorHandler(D=>(this._logService.error("Parsing error: ",D),D)),this._parser.registerDcsHandler({intermediates:"$",final:"q"},new E.DcsHandler((D,j)=>this.requestStatusString(D,j)))}_preserveStack(b,R,A,M){this._parseStack.paused=!0,this._parseStack.cursorStartX=b,this._parseStack.cursorStartY=R,this._parseStack.decodedLength=A,this._parseStack.position=M}_logSlowResolvingAsync(b){this._logService.logLevel<=m.LogLevelEnum.WARN&&Promise.race([b,new Promise((R,A)=>setTimeout(()=>A("#SLOW_TIMEOUT"),5e3))]).catch(R=>{if(R!=="#SLOW_TIMEOUT")throw R;console.warn("async parser handler taking longer than 5000 ms")})}_getCurrentLinkId(){return this._curAttrData.extended.urlId}parse(b,R){let A,M=this._activeBuffer.x,z=this._activeBuffer.y,q=0;const Q=this._parseStack.paused;if(Q){if(A=this._parser.parse(this._parseBuffer,this._parseStack.decodedLength,R))return this._logSlowResolvingAsync(A),A;M=this._parseStack.cursorStartX,z=this._parseStack.cursorStartY,this._parseStack.paused=!1,b.length>T&&(q=this._parseStack.position+T)}if(this._logService.logLevel<=m.LogLevelEnum.DEBUG&&this._logService.debug("parsing data"+(typeof b=="string"?` "${b}"`:` "${Array.prototype.map.call(b,Y=>String.fromCharCode(Y)).join("")}"`),typeof b=="string"?b.split("").map(Y=>Y.charCodeAt(0)):b),this._parseBuffer.length<b.length&&this._parseBuffer.length<T&&(this._parseBuffer=new Uint32Array(Math.min(b.length,T))),Q||this._dirtyRowTracker.clearRange(),b.length>T)for(let Y=q;Y<b.length;Y+=T){const se=Y+T<b.length?Y+T:b.length,D=typeof b=="string"?this._stringDecoder.decode(b.substring(Y,se),this._parseBuffer):this._utf8Decoder.decode(b.subarray(Y,se),this._parseBuffer);if(A=this._parser.parse(this._parseBuffer,D))return this._preserveStack(M,z,D,Y),this._logSlowResolvingAsync(A),A}else if(!Q){const Y=typeof b=="string"?this._stringDecoder.decode(b,this._parseBuffer):this._utf8Decoder.decode(b,this._parseBuffer);if(A=this._parser.parse(this._parseBuffer,Y))return this._preserveStack(M,z,Y,0),this._logSlowResolvingAsync(A),A}this._activeBuffer.x===M&&this._activeBuffer.y===z||this._onCursorMove.fire(),this._onRequestRefreshRows.fire(this._dirtyRowTracker.start,this._dirtyRowTracker.end)}print(b,R,A){let M,z;const q=this._charsetService.charset,Q=this._optionsService.rawOptions.screenReaderMode,Y=this._bufferService.cols,se=this._coreService.decPrivateModes.wraparound,D=this._coreService.modes.insertMode,j=this._curAttrData;let $=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._activeBuffer.x&&A-R>0&&$.getWidth(this._activeBuffer.x-1)===2&&$.setCellFromCodePoint(this._activeBuffer.x-1,0,1,j.fg,j.bg,j.extended);for(let N=R;N<A;++N){if(M=b[N],z=this._unicodeService.wcwidth(M),M<127&&q){const Z=q[String.fromCharCode(M)];Z&&(M=Z.charCodeAt(0))}if(Q&&this._onA11yChar.fire((0,C.stringFromCodePoint)(M)),this._getCurrentLinkId()&&this._oscLinkService.addLineToLink(this._getCurrentLinkId(),this._activeBuffer.ybase+this._activeBuffer.y),z||!this._activeBuffer.x){if(this._activeBuffer.x+z-1>=Y){if(se){for(;this._activeBuffer.x<Y;)$.setCellFromCodePoint(this._activeBuffer.x++,0,1,j.fg,j.bg,j.extended);this._activeBuffer.x=0,this._activeBuffer.y++,this._activeBuffer.y===this._activeBuffer.scrollBottom+1?(this._activeBuffer.y--,this._bufferService.scroll(this._eraseAttrData(),!0)):(this._activeBuffer.y>=this._bufferService.rows&&(this._activeBuffer.y=this._bufferService.rows-1),this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y).isWrapped=!0),$=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y)}else if(this._activeBuffer.x=Y-1,z===2)continue}if(D&&($.insertCells(this._activeBuffer.x,z,this._activeBuffer.getNullCell(j),j),$.getWidth(Y-1)===2&&$.setCellFromCodePoint(Y-1,s.NULL_CELL_CODE,s.NULL_CELL_WIDTH,j.fg,j.bg,j.extended)),$.setCellFromCodePoint(this._activeBuffer.x++,M,z,j.fg,j.bg,j.extended),z>0)for(;--z;)$.setCellFromCodePoint(this._activeBuffer.x++,0,0,j.fg,j.bg,j.extended)}else $.getWidth(this._activeBuffer.x-1)?$.addCodepointToCell(this._activeBuffer.x-1,M):$.addCodepointToCell(this._activeBuffer.x-2,M)}A-R>0&&($.loadCell(this._activeBuffer.x-1,this._workCell),this._workCell.getWidth()===2||this._workCell.getCode()>65535?this._parser.precedingCodepoint=0:this._workCell.isCombined()?this._parser.precedingCodepoint=this._workCell.getChars().charCodeAt(0):this._parser.precedingCodepoint=this._workCell.content),this._activeBuffer.x<Y&&A-R>0&&$.getWidth(this._activeBuffer.x)===0&&!$.hasContent(this._activeBuffer.x)&&$.setCellFromCodePoint(this._activeBuffer.x,0,1,j.fg,j.bg,j.extended),this._dirtyRowTracker.markDirty(this._activeBuffer.y)}registerCsiHandler(b,R){return b.final!=="t"||b.prefix||b.intermediates?this._parser.registerCsiHandler(b,R):this._parser.registerCsiHandler(b,A=>!P(A.params[0],this._optionsService.rawOptions.windowOptions)||R(A))}registerDcsHandler(b,R){return this._parser.registerDcsHandler(b,new E.DcsHandler(R))}registerEscHandler(b,R){return this._parser.registerEscHandler(b,R)}registerOscHandler(b,R){return this._parser.registerOscHandler(b,new x.OscHandler(R))}bell(){return this._onRequestBell.fire(),!0}lineFeed(){return this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._optionsService.rawOptions.convertEol&&(this._activeBuffer.x=0),this._activeBuffer.y++,this._activeBuffer.y===this._activeBuffer.scrollBottom+1?(this._activeBuffer.y--,this._bufferService.scroll(this._eraseAttrData())):this._activeBuffer.y>=this._bufferService.rows?this._activeBuffer.y=this._bufferService.rows-1:this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y).isWrapped=!1,this._activeBuffer.x>=this._bufferService.cols&&this._activeBuffer.x--,this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._onLineFeed.fire(),!0}carriageReturn(){return this._activeBuffer.x=0,!0}backspace(){var b;if(!this._coreService.decPrivateModes.reverseWraparound)return this._restrictCursor(),this._activeBuffer.x>0&&this._activeBuffer.x--,!0;if(this._restrictCursor(this._bufferService.cols),this._activeBuffer.x>0)this._activeBuffer.x--;else if(this._activeBuffer.x===0&&this._activeBuffer.y>this._activeBuffer.scrollTop&&this._activeBuffer.y<=this._activeBuffer.scrollBottom&&(!((b=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y))===null||b===void 0)&&b.isWrapped)){this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y).isWrapped=!1,this._activeBuffer.y--,this._activeBuffer.x=this._bufferService.cols-1;const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);R.hasWidth(this._activeBuffer.x)&&!R.hasContent(this._activeBuffer.x)&&this._activeBuffer.x--}return this._restrictCursor(),!0}tab(){if(this._activeBuffer.x>=this._bufferService.cols)return!0;const b=this._activeBuffer.x;return this._activeBuffer.x=this._activeBuffer.nextStop(),this._optionsService.rawOptions.screenReaderMode&&this._onA11yTab.fire(this._activeBuffer.x-b),!0}shiftOut(){return this._charsetService.setgLevel(1),!0}shiftIn(){return this._charsetService.setgLevel(0),!0}_restrictCursor(b=this._bufferService.cols-1){this._activeBuffer.x=Math.min(b,Math.max(0,this._activeBuffer.x)),this._activeBuffer.y=this._coreService.decPrivateModes.origin?Math.min(this._activeBuffer.scrollBottom,Math.max(this._activeBuffer.scrollTop,this._activeBuffer.y)):Math.min(this._bufferService.rows-1,Math.max(0,this._activeBuffer.y)),this._dirtyRowTracker.markDirty(this._activeBuffer.y)}_setCursor(b,R){this._dirtyRowTracker.markDirty(this._activeBuffer.y),this._coreService.decPrivateModes.origin?(this._activeBuffer.x=b,this._activeBuffer.y=this._activeBuffer.scrollTop+R):(this._activeBuffer.x=b,this._activeBuffer.y=R),this._restrictCursor(),this._dirtyRowTracker.markDirty(this._activeBuffer.y)}_moveCursor(b,R){this._restrictCursor(),this._setCursor(this._activeBuffer.x+b,this._activeBuffer.y+R)}cursorUp(b){const R=this._activeBuffer.y-this._activeBuffer.scrollTop;return R>=0?this._moveCursor(0,-Math.min(R,b.params[0]||1)):this._moveCursor(0,-(b.params[0]||1)),!0}cursorDown(b){const R=this._activeBuffer.scrollBottom-this._activeBuffer.y;return R>=0?this._moveCursor(0,Math.min(R,b.params[0]||1)):this._moveCursor(0,b.params[0]||1),!0}cursorForward(b){return this._moveCursor(b.params[0]||1,0),!0}cursorBackward(b){return this._moveCursor(-(b.params[0]||1),0),!0}cursorNextLine(b){return this.cursorDown(b),this._activeBuffer.x=0,!0}cursorPrecedingLine(b){return this.cursorUp(b),this._activeBuffer.x=0,!0}cursorCharAbsolute(b){return this._setCursor((b.params[0]||1)-1,this._activeBuffer.y),!0}cursorPosition(b){return this._setCursor(b.length>=2?(b.params[1]||1)-1:0,(b.params[0]||1)-1),!0}charPosAbsolute(b){return this._setCursor((b.params[0]||1)-1,this._activeBuffer.y),!0}hPositionRelative(b){return this._moveCursor(b.params[0]||1,0),!0}linePosAbsolute(b){return this._setCursor(this._activeBuffer.x,(b.params[0]||1)-1),!0}vPositionRelative(b){return this._moveCursor(0,b.params[0]||1),!0}hVPosition(b){return this.cursorPosition(b),!0}tabClear(b){const R=b.params[0];return R===0?delete this._activeBuffer.tabs[this._activeBuffer.x]:R===3&&(this._activeBuffer.tabs={}),!0}cursorForwardTab(b){if(this._activeBuffer.x>=this._bufferService.cols)return!0;let R=b.params[0]||1;for(;R--;)this._activeBuffer.x=this._activeBuffer.nextStop();return!0}cursorBackwardTab(b){if(this._activeBuffer.x>=this._bufferService.cols)return!0;let R=b.params[0]||1;for(;R--;)this._activeBuffer.x=this._activeBuffer.prevStop();return!0}selectProtected(b){const R=b.params[0];return R===1&&(this._curAttrData.bg|=536870912),R!==2&&R!==0||(this._curAttrData.bg&=-536870913),!0}_eraseInBufferLine(b,R,A,M=!1,z=!1){const q=this._activeBuffer.lines.get(this._activeBuffer.ybase+b);q.replaceCells(R,A,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData(),z),M&&(q.isWrapped=!1)}_resetBufferLine(b,R=!1){const A=this._activeBuffer.lines.get(this._activeBuffer.ybase+b);A&&(A.fill(this._activeBuffer.getNullCell(this._eraseAttrData()),R),this._bufferService.buffer.clearMarkers(this._activeBuffer.ybase+b),A.isWrapped=!1)}eraseInDisplay(b,R=!1){let A;switch(this._restrictCursor(this._bufferService.cols),b.params[0]){case 0:for(A=this._activeBuffer.y,this._dirtyRowTracker.markDirty(A),this._eraseInBufferLine(A++,this._activeBuffer.x,this._bufferService.cols,this._activeBuffer.x===0,R);A<this._bufferService.rows;A++)this._resetBufferLine(A,R);this._dirtyRowTracker.markDirty(A);break;case 1:for(A=this._activeBuffer.y,this._dirtyRowTracker.markDirty(A),this._eraseInBufferLine(A,0,this._activeBuffer.x+1,!0,R),this._activeBuffer.x+1>=this._bufferService.cols&&(this._activeBuffer.lines.get(A+1).isWrapped=!1);A--;)this._resetBufferLine(A,R);this._dirtyRowTracker.markDirty(0);break;case 2:for(A=this._bufferService.rows,this._dirtyRowTracker.markDirty(A-1);A--;)this._resetBufferLine(A,R);this._dirtyRowTracker.markDirty(0);break;case 3:const M=this._activeBuffer.lines.length-this._bufferService.rows;M>0&&(this._activeBuffer.lines.trimStart(M),this._activeBuffer.ybase=Math.max(this._activeBuffer.ybase-M,0),this._activeBuffer.ydisp=Math.max(this._activeBuffer.ydisp-M,0),this._onScroll.fire(0))}return!0}eraseInLine(b,R=!1){switch(this._restrictCursor(this._bufferService.cols),b.params[0]){case 0:this._eraseInBufferLine(this._activeBuffer.y,this._activeBuffer.x,this._bufferService.cols,this._activeBuffer.x===0,R);break;case 1:this._eraseInBufferLine(this._activeBuffer.y,0,this._activeBuffer.x+1,!1,R);break;case 2:this._eraseInBufferLine(this._activeBuffer.y,0,this._bufferService.cols,!0,R)}return this._dirtyRowTracker.markDirty(this._activeBuffer.y),!0}insertLines(b){this._restrictCursor();let R=b.params[0]||1;if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const A=this._activeBuffer.ybase+this._activeBuffer.y,M=this._bufferService.rows-1-this._activeBuffer.scrollBottom,z=this._bufferService.rows-1+this._activeBuffer.ybase-M+1;for(;R--;)this._activeBuffer.lines.splice(z-1,1),this._activeBuffer.lines.splice(A,0,this._activeBuffer.getBlankLine(this._eraseAttrData()));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.y,this._activeBuffer.scrollBottom),this._activeBuffer.x=0,!0}deleteLines(b){this._restrictCursor();let R=b.params[0]||1;if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const A=this._activeBuffer.ybase+this._activeBuffer.y;let M;for(M=this._bufferService.rows-1-this._activeBuffer.scrollBottom,M=this._bufferService.rows-1+this._activeBuffer.ybase-M;R--;)this._activeBuffer.lines.splice(A,1),this._activeBuffer.lines.splice(M,0,this._activeBuffer.getBlankLine(this._eraseAttrData()));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.y,this._activeBuffer.scrollBottom),this._activeBuffer.x=0,!0}insertChars(b){this._restrictCursor();const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);return R&&(R.insertCells(this._activeBuffer.x,b.params[0]||1,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),this._dirtyRowTracker.markDirty(this._activeBuffer.y)),!0}deleteChars(b){this._restrictCursor();const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);return R&&(R.deleteCells(this._activeBuffer.x,b.params[0]||1,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),this._dirtyRowTracker.markDirty(this._activeBuffer.y)),!0}scrollUp(b){let R=b.params[0]||1;for(;R--;)this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollTop,1),this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollBottom,0,this._activeBuffer.getBlankLine(this._eraseAttrData()));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}scrollDown(b){let R=b.params[0]||1;for(;R--;)this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollBottom,1),this._activeBuffer.lines.splice(this._activeBuffer.ybase+this._activeBuffer.scrollTop,0,this._activeBuffer.getBlankLine(a.DEFAULT_ATTR_DATA));return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}scrollLeft(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const M=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);M.deleteCells(0,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),M.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}scrollRight(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const M=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);M.insertCells(0,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),M.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}insertColumns(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const M=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);M.insertCells(this._activeBuffer.x,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),M.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}deleteColumns(b){if(this._activeBuffer.y>this._activeBuffer.scrollBottom||this._activeBuffer.y<this._activeBuffer.scrollTop)return!0;const R=b.params[0]||1;for(let A=this._activeBuffer.scrollTop;A<=this._activeBuffer.scrollBottom;++A){const M=this._activeBuffer.lines.get(this._activeBuffer.ybase+A);M.deleteCells(this._activeBuffer.x,R,this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),M.isWrapped=!1}return this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom),!0}eraseChars(b){this._restrictCursor();const R=this._activeBuffer.lines.get(this._activeBuffer.ybase+this._activeBuffer.y);return R&&(R.replaceCells(this._activeBuffer.x,this._activeBuffer.x+(b.params[0]||1),this._activeBuffer.getNullCell(this._eraseAttrData()),this._eraseAttrData()),this._dirtyRowTracker.markDirty(this._activeBuffer.y)),!0}repeatPrecedingCharacter(b){if(!this._parser.precedingCodepoint)return!0;const R=b.params[0]||1,A=new Uint32Array(R);for(let M=0;M<R;++M)A[M]=this._parser.precedingCodepoint;return this.print(A,0,A.length),!0}sendDeviceAttributesPrimary(b){return b.params[0]>0||(this._is("xterm")||this._is("rxvt-unicode")||this._is("screen")?this._coreService.triggerDataEvent(d.C0.ESC+"[?1;2c"):this._is("linux")&&this._coreService.triggerDataEvent(d.C0.ESC+"[?6c")),!0}sendDeviceAttributesSecondary(b){return b.params[0]>0||(this._is("xterm")?this._coreService.triggerDataEvent(d.C0.ESC+"[>0;276;0c"):this._is("rxvt-unicode")?this._coreService.triggerDataEvent(d.C0.ESC+"[>85;95;0c"):this._is("linux")?this._coreService.triggerDataEvent(b.params[0]+"c"):this._is("screen")&&this._coreService.triggerDataEvent(d.C0.ESC+"[>83;40003;0c")),!0}_is(b){return(this._optionsService.rawOptions.termName+"").indexOf(b)===0}setMode(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 4:this._coreService.modes.insertMode=!0;break;case 20:this._optionsService.options.convertEol=!0}return!0}setModePrivate(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 1:this._coreService.decPrivateModes.applicationCursorKeys=!0;break;case 2:this._charsetService.setgCharset(0,_.DEFAULT_CHARSET),this._charsetService.setgCharset(1,_.DEFAULT_CHARSET),this._charsetService.setgCharset(2,_.DEFAULT_CHARSET),this._charsetService.setgCharset(3,_.DEFAULT_CHARSET);break;case 3:this._optionsService.rawOptions.windowOptions.setWinLines&&(this._bufferService.resize(132,this._bufferService.rows),this._onRequestReset.fire());break;case 6:this._coreService.decPrivateModes.origin=!0,this._setCursor(0,0);break;case 7:this._coreService.decPrivateModes.wraparound=!0;break;case 12:this._optionsService.options.cursorBlink=!0;break;case 45:this._coreService.decPrivateModes.reverseWraparound=!0;break;case 66:this._logService.debug("Serial port requested application keypad."),this._coreService.decPrivateModes.applicationKeypad=!0,this._onRequestSyncScrollBar.fire();break;case 9:this._coreMouseService.activeProtocol="X10";break;case 1e3:this._coreMouseService.activeProtocol="VT200";break;case 1002:this._coreMouseService.activeProtocol="DRAG";break;case 1003:this._coreMouseService.activeProtocol="ANY";break;case 1004:this._coreService.decPrivateModes.sendFocus=!0,this._onRequestSendFocus.fire();break;case 1005:this._logService.debug("DECSET 1005 not supported (see #2507)");break;case 1006:this._coreMouseService.activeEncoding="SGR";break;case 1015:this._logService.debug("DECSET 1015 not supported (see #2507)");break;case 1016:this._coreMouseService.activeEncoding="SGR_PIXELS";break;case 25:this._coreService.isCursorHidden=!1;break;case 1048:this.saveCursor();break;case 1049:this.saveCursor();case 47:case 1047:this._bufferService.buffers.activateAltBuffer(this._eraseAttrData()),this._coreService.isCursorInitialized=!0,this._onRequestRefreshRows.fire(0,this._bufferService.rows-1),this._onRequestSyncScrollBar.fire();break;case 2004:this._coreService.decPrivateModes.bracketedPasteMode=!0}return!0}resetMode(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 4:this._coreService.modes.insertMode=!1;break;case 20:this._optionsService.options.convertEol=!1}return!0}resetModePrivate(b){for(let R=0;R<b.length;R++)switch(b.params[R]){case 1:this._coreService.decPrivateModes.applicationCursorKeys=!1;break;case 3:this._optionsService.rawOptions.windowOptions.setWinLines&&(this._bufferService.resize(80,this._bufferService.rows),this._onRequestReset.fire());break;case 6:this._coreService.decPrivateModes.origin=!1,this._setCursor(0,0);break;case 7:this._coreService.decPrivateModes.wraparound=!1;break;case 12:this._optionsService.options.cursorBlink=!1;break;case 45:this._coreService.decPrivateModes.reverseWraparound=!1;break;case 66:this._logService.debug("Switching back to normal keypad."),this._coreService.decPrivateModes.applicationKeypad=!1,this._onRequestSyncScrollBar.fire();break;case 9:case 1e3:case 1002:case 1003:this._coreMouseService.activeProtocol="NONE";break;case 1004:this._coreService.decPrivateModes.sendFocus=!1;break;case 1005:this._logService.debug("DECRST 1005 not supported (see #2507)");break;case 1006:case 1016:this._coreMouseService.activeEncoding="DEFAULT";break;case 1015:this._logService.debug("DECRST 1015 not supported (see #2507)");break;case 25:this._coreService.isCursorHidden=!0;break;case 1048:this.restoreCursor();break;case 1049:case 47:case 1047:this._bufferService.buffers.activateNormalBuffer(),b.params[R]===1049&&this.restoreCursor(),this._coreService.isCursorInitialized=!0,this._onRequestRefreshRows.fire(0,this._bufferService.rows-1),this._onRequestSyncScrollBar.fire();break;case 2004:this._coreService.decPrivateModes.bracketedPasteMode=!1}return!0}requestMode(b,R){const A=this._coreService.decPrivateModes,{activeProtocol:M,activeEncoding:z}=this._coreMouseService,q=this._coreService,{buffers:Q,cols:Y}=this._bufferService,{active:se,alt:D}=Q,j=this._optionsService.rawOptions,$=ae=>ae?1:2,N=b.params[0];return Z=N,G=R?N===2?4:N===4?$(q.modes.insertMode):N===12?3:N===20?$(j.convertEol):0:N===1?$(A.applicationCursorKeys):N===3?j.windowOptions.setWinLines?Y===80?2:Y===132?1:0:0:N===6?$(A.origin):N===7?$(A.wraparound):N===8?3:N===9?$(M==="X10"):N===12?$(j.cursorBlink):N===25?$(!q.isCursorHidden):N===45?$(A.reverseWraparound):N===66?$(A.applicationKeypad):N===67?4:N===1e3?$(M==="VT200"):N===1002?$(M==="DRAG"):N===1003?$(M==="ANY"):N===1004?$(A.sendFocus):N===1005?4:N===1006?$(z==="SGR"):N===1015?4:N===1016?$(z==="SGR_PIXELS"):N===1048?1:N===47||N===1047||N===1049?$(se===D):N===2004?$(A.bracketedPasteMode):0,q.triggerDataEvent(`${d.C0.ESC}[${R?"":"?"}${Z};${G}$y`),!0;var Z,G}_updateAttrColor(b,R,A,M,z){return R===2?(b|=50331648,b&=-16777216,b|=p.AttributeData.fromColorRGB([A,M,z])):R===5&&(b&=-50331904,b|=33554432|255&A),b}_extractColor(b,R,A){const M=[0,0,-1,0,0,0];let z=0,q=0;do{if(M[q+z]=b.params[R+q],b.hasSubParams(R+q)){const Q=b.getSubParams(R+q);let Y=0;do M[1]===5&&(z=1),M[q+Y+1+z]=Q[Y];while(++Y<Q.length&&Y+q+1+z<M.length);break}if(M[1]===5&&q+z>=2||M[1]===2&&q+z>=5)break;M[1]&&(z=1)}while(++q+R<b.length&&q+z<M.length);for(let Q=2;Q<M.length;++Q)M[Q]===-1&&(M[Q]=0);switch(M[0]){case 38:A.fg=this._updateAttrColor(A.fg,M[1],M[3],M[4],M[5]);break;case 48:A.bg=this._updateAttrColor(A.bg,M[1],M[3],M[4],M[5]);break;case 58:A.extended=A.extended.clone(),A.extended.underlineColor=this._updateAttrColor(A.extended.underlineColor,M[1],M[3],M[4],M[5])}return q}_processUnderline(b,R){R.extended=R.extended.clone(),(!~b||b>5)&&(b=1),R.extended.underlineStyle=b,R.fg|=268435456,b===0&&(R.fg&=-268435457),R.updateExtended()}_processSGR0(b){b.fg=a.DEFAULT_ATTR_DATA.fg,b.bg=a.DEFAULT_ATTR_DATA.bg,b.extended=b.extended.clone(),b.extended.underlineStyle=0,b.extended.underlineColor&=-67108864,b.updateExtended()}charAttributes(b){if(b.length===1&&b.params[0]===0)return this._processSGR0(this._curAttrData),!0;const R=b.length;let A;const M=this._curAttrData;for(let z=0;z<R;z++)A=b.params[z],A>=30&&A<=37?(M.fg&=-50331904,M.fg|=16777216|A-30):A>=40&&A<=47?(M.bg&=-50331904,M.bg|=16777216|A-40):A>=90&&A<=97?(M.fg&=-50331904,M.fg|=16777224|A-90):A>=100&&A<=107?(M.bg&=-50331904,M.bg|=16777224|A-100):A===0?this._processSGR0(M):A===1?M.fg|=134217728:A===3?M.bg|=67108864:A===4?(M.fg|=268435456,this._processUnderline(b.hasSubParams(z)?b.getSubParams(z)[0]:1,M)):A===5?M.fg|=536870912:A===7?M.fg|=67108864:A===8?M.fg|=1073741824:A===9?M.fg|=2147483648:A===2?M.bg|=134217728:A===21?this._processUnderline(2,M):A===22?(M.fg&=-134217729,M.bg&=-134217729):A===23?M.bg&=-67108865:A===24?(M.fg&=-268435457,this._processUnderline(0,M)):A===25?M.fg&=-536870913:A===27?M.fg&=-67108865:A===28?M.fg&=-1073741825:A===29?M.fg&=2147483647:A===39?(M.fg&=-67108864,M.fg|=16777215&a.DEFAULT_ATTR_DATA.fg):A===49?(M.bg&=-67108864,M.bg|=16777215&a.DEFAULT_ATTR_DATA.bg):A===38||A===48||A===58?z+=this._extractColor(b,z,M):A===53?M.bg|=1073741824:A===55?M.bg&=-1073741825:A===59?(M.extended=M.extended.clone(),M.extended.underlineColor=-1,M.updateExtended()):A===100?(M.fg&=-67108864,M.fg|=16777215&a.DEFAULT_ATTR_DATA.fg,M.bg&=-67108864,M.bg|=16777215&a.DEFAULT_ATTR_DATA.bg):this._logService.debug("Unknown SGR attribute: %d.",A);return!0}deviceStatus(b){switch(b.params[0]){case 5:this._coreService.triggerDataEvent(`${d.C0.ESC}[0n`);break;case 6:const R=this._activeBuffer.y+1,A=this._activeBuffer.x+1;this._coreService.triggerDataEvent(`${d.C0.ESC}[${R};${A}R`)}return!0}deviceStatusPrivate(b){if(b.params[0]===6){const R=this._activeBuffer.y+1,A=this._activeBuffer.x+1;this._coreService.triggerDataEvent(`${d.C0.ESC}[?${R};${A}R`)}return!0}softReset(b){return this._coreService.isCursorHidden=!1,this._onRequestSyncScrollBar.fire(),this._activeBuffer.scrollTop=0,this._activeBuffer.scrollBottom=this._bufferService.rows-1,this._curAttrData=a.DEFAULT_ATTR_DATA.clone(),this._coreService.reset(),this._charsetService.reset(),this._activeBuffer.savedX=0,this._activeBuffer.savedY=this._activeBuffer.ybase,this._activeBuffer.savedCurAttrData.fg=this._curAttrData.fg,this._activeBuffer.savedCurAttrData.bg=this._curAttrData.bg,this._activeBuffer.savedCharset=this._charsetService.charset,this._coreService.decPrivateModes.origin=!1,!0}setCursorStyle(b){const R=b.params[0]||1;switch(R){case 1:case 2:this._optionsService.options.cursorStyle="block";break;case 3:case 4:this._optionsService.options.cursorStyle="underline";break;case 5:case 6:this._optionsService.options.cursorStyle="bar"}const A=R%2==1;return this._optionsService.options.cursorBlink=A,!0}setScrollRegion(b){const R=b.params[0]||1;let A;return(b.length<2||(A=b.params[1])>this._bufferService.rows||A===0)&&(A=this._bufferService.rows),A>R&&(this._activeBuffer.scrollTop=R-1,this._activeBuffer.scrollBottom=A-1,this._setCursor(0,0)),!0}windowOptions(b){if(!P(b.params[0],this._optionsService.rawOptions.windowOptions))return!0;const R=b.length>1?b.params[1]:0;switch(b.params[0]){case 14:R!==2&&this._onRequestWindowsOptionsReport.fire(B.GET_WIN_SIZE_PIXELS);break;case 16:this._onRequestWindowsOptionsReport.fire(B.GET_CELL_SIZE_PIXELS);break;case 18:this._bufferService&&this._coreService.triggerDataEvent(`${d.C0.ESC}[8;${this._bufferService.rows};${this._bufferService.cols}t`);break;case 22:R!==0&&R!==2||(this._windowTitleStack.push(this._windowTitle),this._windowTitleStack.length>10&&this._windowTitleStack.shift()),R!==0&&R!==1||(this._iconNameStack.push(this._iconName),this._iconNameStack.length>10&&this._iconNameStack.shift());break;case 23:R!==0&&R!==2||this._windowTitleStack.length&&this.setTitle(this._windowTitleStack.pop()),R!==0&&R!==1||this._iconNameStack.length&&this.setIconName(this._iconNameStack.pop())}return!0}saveCursor(b){return this._activeBuffer.savedX=this._activeBuffer.x,this._activeBuffer.savedY=this._activeBuffer.ybase+this._activeBuffer.y,this._activeBuffer.savedCurAttrData.fg=this._curAttrData.fg,this._activeBuffer.savedCurAttrData.bg=this._curAttrData.bg,this._activeBuffer.savedCharset=this._charsetService.charset,!0}restoreCursor(b){return this._activeBuffer.x=this._activeBuffer.savedX||0,this._activeBuffer.y=Math.max(this._activeBuffer.savedY-this._activeBuffer.ybase,0),this._curAttrData.fg=this._activeBuffer.savedCurAttrData.fg,this._curAttrData.bg=this._activeBuffer.savedCurAttrData.bg,this._charsetService.charset=this._savedCharset,this._activeBuffer.savedCharset&&(this._charsetService.charset=this._activeBuffer.savedCharset),this._restrictCursor(),!0}setTitle(b){return this._windowTitle=b,this._onTitleChange.fire(b),!0}setIconName(b){return this._iconName=b,!0}setOrReportIndexedColor(b){const R=[],A=b.split(";");for(;A.length>1;){const M=A.shift(),z=A.shift();if(/^\d+$/.exec(M)){const q=parseInt(M);if(W(q))if(z==="?")R.push({type:0,index:q});else{const Q=(0,v.parseColor)(z);Q&&R.push({type:1,index:q,color:Q})}}}return R.length&&this._onColor.fire(R),!0}setHyperlink(b){const R=b.split(";");return!(R.length<2)&&(R[1]?this._createHyperlink(R[0],R[1]):!R[0]&&this._finishHyperlink())}_createHyperlink(b,R){this._getCurrentLinkId()&&this._finishHyperlink();const A=b.split(":");let M;const z=A.findIndex(q=>q.startsWith("id="));return z!==-1&&(M=A[z].slice(3)||void 0),this._curAttrData.extended=this._curAttrData.extended.clone(),this._curAttrData.extended.urlId=this._oscLinkService.registerLink({id:M,uri:R}),this._curAttrData.updateExtended(),!0}_finishHyperlink(){return this._curAttrData.extended=this._curAttrData.extended.clone(),this._curAttrData.extended.urlId=0,this._curAttrData.updateExtended(),!0}_setOrReportSpecialColor(b,R){const A=b.split(";");for(let M=0;M<A.length&&!(R>=this._specialColors.length);++M,++R)if(A[M]==="?")this._onColor.fire([{type:0,index:this._specialColors[R]}]);else{const z=(0,v.parseColor)(A[M]);z&&this._onColor.fire([{type:1,index:this._specialColors[R],color:z}])}return!0}setOrReportFgColor(b){return this._setOrReportSpecialColor(b,0)}setOrReportBgColor(b){return this._setOrReportSpecialColor(b,1)}setOrReportCursorColor(b){return this._setOrReportSpecialColor(b,2)}restoreIndexedColor(b){if(!b)return this._onColor.fire([{type:2}]),!0;const R=[],A=b.split(";");for(let M=0;M<A.length;++M)if(/^\d+$/.exec(A[M])){const z=parseInt(A[M]);W(z)&&R.push({type:2,index:z})}return R.length&&this._onColor.fire(R),!0}restoreFgColor(b){return this._onColor.fire([{type:2,index:256}]),!0}restoreBgColor(b){return this._onColor.fire([{type:2,index:257}]),!0}restoreCursorColor(b){return this._onColor.fire([{type:2,index:258}]),!0}nextLine(){return this._activeBuffer.x=0,this.index(),!0}keypadApplicationMode(){return this._logService.debug("Serial port requested application keypad."),this._coreService.decPrivateModes.applicationKeypad=!0,this._onRequestSyncScrollBar.fire(),!0}keypadNumericMode(){return this._logService.debug("Switching back to normal keypad."),this._coreService.decPrivateModes.applicationKeypad=!1,this._onRequestSyncScrollBar.fire(),!0}selectDefaultCharset(){return this._charsetService.setgLevel(0),this._charsetService.setgCharset(0,_.DEFAULT_CHARSET),!0}selectCharset(b){return b.length!==2?(this.selectDefaultCharset(),!0):(b[0]==="/"||this._charsetService.setgCharset(k[b[0]],_.CHARSETS[b[1]]||_.DEFAULT_CHARSET),!0)}index(){return this._restrictCursor(),this._activeBuffer.y++,this._activeBuffer.y===this._activeBuffer.scrollBottom+1?(this._activeBuffer.y--,this._bufferService.scroll(this._eraseAttrData())):this._activeBuffer.y>=this._bufferService.rows&&(this._activeBuffer.y=this._bufferService.rows-1),this._restrictCursor(),!0}tabSet(){return this._activeBuffer.tabs[this._activeBuffer.x]=!0,!0}reverseIndex(){if(this._restrictCursor(),this._activeBuffer.y===this._activeBuffer.scrollTop){const b=this._activeBuffer.scrollBottom-this._activeBuffer.scrollTop;this._activeBuffer.lines.shiftElements(this._activeBuffer.ybase+this._activeBuffer.y,b,1),this._activeBuffer.lines.set(this._activeBuffer.ybase+this._activeBuffer.y,this._activeBuffer.getBlankLine(this._eraseAttrData())),this._dirtyRowTracker.markRangeDirty(this._activeBuffer.scrollTop,this._activeBuffer.scrollBottom)}else this._activeBuffer.y--,this._restrictCursor();return!0}fullReset(){return this._parser.reset(),this._onRequestReset.fire(),!0}reset(){this._curAttrData=a.DEFAULT_ATTR_DATA.clone(),this._eraseAttrDataInternal=a.DEFAULT_ATTR_DATA.clone()}_eraseAttrData(){return this._eraseAttrDataInternal.bg&=-67108864,this._eraseAttrDataInternal.bg|=67108863&this._curAttrData.bg,this._eraseAttrDataInternal}setgLevel(b){return this._charsetService.setgLevel(b),!0}screenAlignmentPattern(){const b=new o.CellData;b.content=4194373,b.fg=this._curAttrData.fg,b.bg=this._curAttrData.bg,this._setCursor(0,0);for(let R=0;R<this._bufferService.rows;++R){const A=this._activeBuffer.ybase+this._activeBuffer.y+R,M=this._activeBuffer.lines.get(A);M&&(M.fill(b),M.isWrapped=!1)}return this._dirtyRowTracker.markAllDirty(),this._setCursor(0,0),!0}requestStatusString(b,R){const A=this._bufferService.buffer,M=this._optionsService.rawOptions;return(z=>(this._coreService.triggerDataEvent(`${d.C0.ESC}${z}${d.C0.ESC}\\`),!0))(b==='"q'?`P1$r${this._curAttrData.isProtected()?1:0}"q`:b==='"p'?'P1$r61;1"p':b==="r"?`P1$r${A.scrollTop+1};${A.scrollBottom+1}r`:b==="m"?"P1$r0m":b===" q"?`P1$r${{block:2,underline:4,bar:6}[M.cursorStyle]-(M.cursorBlink?1:0)} q`:"P0$r")}markRangeDirty(b,R){this._dirtyRowTracker.markRangeDirty(b,R)}}n.InputHandler=F;let H=class{constructor(O){this._bufferService=O,this.clearRange()}clearRange(){this.start=this._bufferService.buffer.y,this.end=this._bufferService.buffer.y}markDirty(O){O<this.start?this.start=O:O>this.end&&(this.end=O)}markRangeDirty(O,b){O>b&&(I=O,O=b,b=I),O<this.start&&(this.start=O),b>this.end&&(this.end=b)}markAllDirty(){this.markRangeDirty(0,this._bufferService.rows-1)}};function W(O){return 0<=O&&O<256}H=f([y(0,m.IBufferService)],H)},844:(g,n)=>{function u(f){for(const y of f)y.dispose();f.length=0}Object.defineProperty(n,"__esModule",{value:!0}),n.getDisposeArrayDisposable=n.disposeArray=n.toDisposable=n.MutableDisposable=n.Disposable=void 0,n.Disposable=class{constructor(){this._disposables=[],this._isDisposed=!1}dispose(){this._isDisposed=!0;for(const f of this._disposables)f.dispose();this._disposables.length=0}register(f){return this._disposables.push(f),f}unregister(f){const y=this._disposables.indexOf(f);y!==-1&&this._disposables.splice(y,1)}},n.MutableDisposable=class{constructor(){this._isDisposed=!1}get value(){return this._isDisposed?void 0:this._value}set value(f){var y;this._isDisposed||f===this._value||((y=this._value)===null||y===void 0||y.dispose(),this._value=f)}clear(){this.value=void 0}dispose(){var f;this._isDisposed=!0,(f=this._value)===null||f===void 0||f.dispose(),this._value=void 0}},n.toDisposable=function(f){return{dispose:f}},n.disposeArray=u,n.getDisposeArrayDisposable=function(f){return{dispose:()=>u(f)}}},1505:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.FourKeyMap=n.TwoKeyMap=void 0;class u{constructor(){this._data={}}set(y,d,_){this._data[y]||(this._data[y]={}),this._data[y][d]=_}get(y,d){return this._data[y]?this._data[y][d]:void 0}clear(){this._data={}}}n.TwoKeyMap=u,n.FourKeyMap=class{constructor(){this._data=new u}set(f,y,d,_,S){this._data.get(f,y)||this._data.set(f,y,new u),this._data.get(f,y).set(d,_,S)}get(f,y,d,_){var S;return(S=this._data.get(f,y))===null||S===void 0?void 0:S.get(d,_)}clear(){this._data.clear()}}},6114:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.isChromeOS=n.isLinux=n.isWindows=n.isIphone=n.isIpad=n.isMac=n.getSafariVersion=n.isSafari=n.isLegacyEdge=n.isFirefox=n.isNode=void 0,n.isNode=typeof navigator>"u";const u=n.isNode?"node":navigator.userAgent,f=n.isNode?"node":navigator.platform;n.isFirefox=u.includes("Firefox"),n.isLegacyEdge=u.includes("Edge"),n.isSafari=/^((?!chrome|android).)*safari/i.test(u),n.getSafariVersion=function(){if(!n.isSafari)return 0;const y=u.match(/Version\/(\d+)/);return y===null||y.length<2?0:parseInt(y[1])},n.isMac=["Macintosh","MacIntel","MacPPC","Mac68K"].includes(f),n.isIpad=f==="iPad",n.isIphone=f==="iPhone",n.isWindows=["Windows","Win16","Win32","WinCE"].includes(f),n.isLinux=f.indexOf("Linux")>=0,n.isChromeOS=/\bCrOS\b/.test(u)},6106:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.SortedList=void 0;let u=0;n.SortedList=class{constructor(f){this._getKey=f,this._array=[]}clear(){this._array.length=0}insert(f){this._array.length!==0?(u=this._search(this._getKey(f)),this._array.splice(u,0,f)):this._array.push(f)}delete(f){if(this._array.length===0)return!1;const y=this._getKey(f);if(y===void 0||(u=this._search(y),u===-1)||this._getKey(this._array[u])!==y)return!1;do if(this._array[u]===f)return this._array.splice(u,1),!0;while(++u<this._array.length&&this._getKey(this._array[u])===y);return!1}*getKeyIterator(f){if(this._array.length!==0&&(u=this._search(f),!(u<0||u>=this._array.length)&&this._getKey(this._array[u])===f))do yield this._array[u];while(++u<this._array.length&&this._getKey(this._array[u])===f)}forEachByKey(f,y){if(this._array.length!==0&&(u=this._search(f),!(u<0||u>=this._array.length)&&this._getKey(this._array[u])===f))do y(this._array[u]);while(++u<this._array.length&&this._getKey(this._array[u])===f)}values(){return[...this._array].values()}_search(f){let y=0,d=this._array.length-1;for(;d>=y;){let _=y+d>>1;const S=this._getKey(this._array[_]);if(S>f)d=_-1;else{if(!(S<f)){for(;_>0&&this._getKey(this._array[_-1])===f;)_--;return _}y=_+1}}return y}}},7226:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DebouncedIdleTask=n.IdleTaskQueue=n.PriorityTaskQueue=void 0;const f=u(6114);class y{constructor(){this._tasks=[],this._i=0}enqueue(S){this._tasks.push(S),this._start()}flush(){for(;this._i<this._tasks.length;)this._tasks[this._i]()||this._i++;this.clear()}clear(){this._idleCallback&&(this._cancelCallback(this._idleCallback),this._idleCallback=void 0),this._i=0,this._tasks.length=0}_start(){this._idleCallback||(this._idleCallback=this._requestCallback(this._process.bind(this)))}_process(S){this._idleCallback=void 0;let w=0,C=0,a=S.timeRemaining(),l=0;for(;this._i<this._tasks.length;){if(w=Date.now(),this._tasks[this._i]()||this._i++,w=Math.max(1,Date.now()-w),C=Math.max(w,C),l=S.timeRemaining(),1.5*C>l)return a-w<-20&&console.warn(`task queue exceeded allotted deadline by ${Math.abs(Math.round(a-w))}ms`),void this._start();a=l}this.clear()}}class d extends y{_requestCallback(S){return setTimeout(()=>S(this._createDeadline(16)))}_cancelCallback(S){clearTimeout(S)}_createDeadline(S){const w=Date.now()+S;return{timeRemaining:()=>Math.max(0,w-Date.now())}}}n.PriorityTaskQueue=d,n.IdleTaskQueue=!f.isNode&&"requestIdleCallback"in window?class extends y{_requestCallback(_){return requestIdleCallback(_)}_cancelCallback(_){cancelIdleCallback(_)}}:d,n.DebouncedIdleTask=class{constructor(){this._queue=new n.IdleTaskQueue}set(_){this._queue.clear(),this._queue.enqueue(_)}flush(){this._queue.flush()}}},9282:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.updateWindowsModeWrappedState=void 0;const f=u(643);n.updateWindowsModeWrappedState=function(y){const d=y.buffer.lines.get(y.buffer.ybase+y.buffer.y-1),_=d==null?void 0:d.get(y.cols-1),S=y.buffer.lines.get(y.buffer.ybase+y.buffer.y);S&&_&&(S.isWrapped=_[f.CHAR_DATA_CODE_INDEX]!==f.NULL_CELL_CODE&&_[f.CHAR_DATA_CODE_INDEX]!==f.WHITESPACE_CELL_CODE)}},3734:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ExtendedAttrs=n.AttributeData=void 0;class u{constructor(){this.fg=0,this.bg=0,this.extended=new f}static toColorRGB(d){return[d>>>16&255,d>>>8&255,255&d]}static fromColorRGB(d){return(255&d[0])<<16|(255&d[1])<<8|255&d[2]}clone(){const d=new u;return d.fg=this.fg,d.bg=this.bg,d.extended=this.extended.clone(),d}isInverse(){return 67108864&this.fg}isBold(){return 134217728&this.fg}isUnderline(){return this.hasExtendedAttrs()&&this.extended.underlineStyle!==0?1:268435456&this.fg}isBlink(){return 536870912&this.fg}isInvisible(){return 1073741824&this.fg}isItalic(){return 67108864&this.bg}isDim(){return 134217728&this.bg}isStrikethrough(){return 2147483648&this.fg}isProtected(){return 536870912&this.bg}isOverline(){return 1073741824&this.bg}getFgColorMode(){return 50331648&this.fg}getBgColorMode(){return 50331648&this.bg}isFgRGB(){return(50331648&this.fg)==50331648}isBgRGB(){return(50331648&this.bg)==50331648}isFgPalette(){return(50331648&this.fg)==16777216||(50331648&this.fg)==33554432}isBgPalette(){return(50331648&this.bg)==16777216||(50331648&this.bg)==33554432}isFgDefault(){return(50331648&this.fg)==0}isBgDefault(){return(50331648&this.bg)==0}isAttributeDefault(){return this.fg===0&&this.bg===0}getFgColor(){switch(50331648&this.fg){case 16777216:case 33554432:return 255&this.fg;case 50331648:return 16777215&this.fg;default:return-1}}getBgColor(){switch(50331648&this.bg){case 16777216:case 33554432:return 255&this.bg;case 50331648:return 16777215&this.bg;default:return-1}}hasExtendedAttrs(){return 268435456&this.bg}updateExtended(){this.extended.isEmpty()?this.bg&=-268435457:this.bg|=268435456}getUnderlineColor(){if(268435456&this.bg&&~this.extended.underlineColor)switch(50331648&this.extended.underlineColor){case 16777216:case 33554432:return 255&this.extended.underlineColor;case 50331648:return 16777215&this.extended.underlineColor;default:return this.getFgColor()}return this.getFgColor()}getUnderlineColorMode(){return 268435456&this.bg&&~this.extended.underlineColor?50331648&this.extended.underlineColor:this.getFgColorMode()}isUnderlineColorRGB(){return 268435456&this.bg&&~this.extended.underlineColor?(50331648&this.extended.underlineColor)==50331648:this.isFgRGB()}isUnderlineColorPalette(){return 268435456&this.bg&&~this.extended.underlineColor?(50331648&this.extended.underlineColor)==16777216||(50331648&this.extended.underlineColor)==33554432:this.isFgPalette()}isUnderlineColorDefault(){return 268435456&this.bg&&~this.extended.underlineColor?(50331648&this.extended.underlineColor)==0:this.isFgDefault()}getUnderlineStyle(){return 268435456&this.fg?268435456&this.bg?this.extended.underlineStyle:1:0}}n.AttributeData=u;class f{get ext(){return this._urlId?-469762049&this._ext|this.underlineStyle<<26:this._ext}set ext(d){this._ext=d}get underlineStyle(){return this._urlId?5:(469762048&this._ext)>>26}set underlineStyle(d){this._ext&=-469762049,this._ext|=d<<26&469762048}get underlineColor(){return 67108863&this._ext}set underlineColor(d){this._ext&=-67108864,this._ext|=67108863&d}get urlId(){return this._urlId}set urlId(d){this._urlId=d}constructor(d=0,_=0){this._ext=0,this._urlId=0,this._ext=d,this._urlId=_}clone(){return new f(this._ext,this._urlId)}isEmpty(){return this.underlineStyle===0&&this._urlId===0}}n.ExtendedAttrs=f},9092:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Buffer=n.MAX_BUFFER_SIZE=void 0;const f=u(6349),y=u(7226),d=u(3734),_=u(8437),S=u(4634),w=u(511),C=u(643),a=u(4863),l=u(7116);n.MAX_BUFFER_SIZE=4294967295,n.Buffer=class{constructor(s,o,p){this._hasScrollback=s,this._optionsService=o,this._bufferService=p,this.ydisp=0,this.ybase=0,this.y=0,this.x=0,this.tabs={},this.savedY=0,this.savedX=0,this.savedCurAttrData=_.DEFAULT_ATTR_DATA.clone(),this.savedCharset=l.DEFAULT_CHARSET,this.markers=[],this._nullCell=w.CellData.fromCharData([0,C.NULL_CELL_CHAR,C.NULL_CELL_WIDTH,C.NULL_CELL_CODE]),this._whitespaceCell=w.CellData.fromCharData([0,C.WHITESPACE_CELL_CHAR,C.WHITESPACE_CELL_WIDTH,C.WHITESPACE_CELL_CODE]),this._isClearing=!1,this._memoryCleanupQueue=new y.IdleTaskQueue,this._memoryCleanupPosition=0,this._cols=this._bufferService.cols,this._rows=this._bufferService.rows,this.lines=new f.CircularList(this._getCorrectBufferLength(this._rows)),this.scrollTop=0,this.scrollBottom=this._rows-1,this.setupTabStops()}getNullCell(s){return s?(this._nullCell.fg=s.fg,this._nullCell.bg=s.bg,this._nullCell.extended=s.extended):(this._nullCell.fg=0,this._nullCell.bg=0,this._nullCell.extended=new d.ExtendedAttrs),this._nullCell}getWhitespaceCell(s){return s?(this._whitespaceCell.fg=s.fg,this._whitespaceCell.bg=s.bg,this._whitespaceCell.extended=s.extended):(this._whitespaceCell.fg=0,this._whitespaceCell.bg=0,this._whitespaceCell.extended=new d.ExtendedAttrs),this._whitespaceCell}getBlankLine(s,o){return new _.BufferLine(this._bufferService.cols,this.getNullCell(s),o)}get hasScrollback(){return this._hasScrollback&&this.lines.maxLength>this._rows}get isCursorInViewport(){const s=this.ybase+this.y-this.ydisp;return s>=0&&s<this._rows}_getCorrectBufferLength(s){if(!this._hasScrollback)return s;const o=s+this._optionsService.rawOptions.scrollback;return o>n.MAX_BUFFER_SIZE?n.MAX_BUFFER_SIZE:o}fillViewportRows(s){if(this.lines.length===0){s===void 0&&(s=_.DEFAULT_ATTR_DATA);let o=this._rows;for(;o--;)this.lines.push(this.getBlankLine(s))}}clear(){this.ydisp=0,this.ybase=0,this.y=0,this.x=0,this.lines=new f.CircularList(this._getCorrectBufferLength(this._rows)),this.scrollTop=0,this.scrollBottom=this._rows-1,this.setupTabStops()}resize(s,o){const p=this.getNullCell(_.DEFAULT_ATTR_DATA);let m=0;const x=this._getCorrectBufferLength(o);if(x>this.lines.maxLength&&(this.lines.maxLength=x),this.lines.length>0){if(this._cols<s)for(let v=0;v<this.lines.length;v++)m+=+this.lines.get(v).resize(s,p);let E=0;if(this._rows<o)for(let v=this._rows;v<o;v++)this.lines.length<o+this.ybase&&(this._optionsService.rawOptions.windowsMode||this._optionsService.rawOptions.windowsPty.backend!==void 0||this._optionsService.rawOptions.windowsPty.buildNumber!==void 0?this.lines.push(new _.BufferLine(s,p)):this.ybase>0&&this.lines.length<=this.ybase+this.y+E+1?(this.ybase--,E++,this.ydisp>0&&this.ydisp--):this.lines.push(new _.BufferLine(s,p)));else for(let v=this._rows;v>o;v--)this.lines.length>o+this.ybase&&(this.lines.length>this.ybase+this.y+1?this.lines.pop():(this.ybase++,this.ydisp++));if(x<this.lines.maxLength){const v=this.lines.length-x;v>0&&(this.lines.trimStart(v),this.ybase=Math.max(this.ybase-v,0),this.ydisp=Math.max(this.ydisp-v,0),this.savedY=Math.max(this.savedY-v,0)),this.lines.maxLength=x}this.x=Math.min(this.x,s-1),this.y=Math.min(this.y,o-1),E&&(this.y+=E),this.savedX=Math.min(this.savedX,s-1),this.scrollTop=0}if(this.scrollBottom=o-1,this._isReflowEnabled&&(this._reflow(s,o),this._cols>s))for(let E=0;E<this.lines.length;E++)m+=+this.lines.get(E).resize(s,p);this._cols=s,this._rows=o,this._memoryCleanupQueue.clear(),m>.1*this.lines.length&&(this._memoryCleanupPosition=0,this._memoryCleanupQueue.enqueue(()=>this._batchedMemoryCleanup()))}_batchedMemoryCleanup(){let s=!0;this._memoryCleanupPosition>=this.lines.length&&(this._memoryCleanupPosition=0,s=!1);let o=0;for(;this._memoryCleanupPosition<this.lines.length;)if(o+=this.lines.get(this._memoryCleanupPosition++).cleanupMemory(),o>100)return!0;return s}get _isReflowEnabled(){const s=this._optionsService.rawOptions.windowsPty;return s&&s.buildNumber?this._hasScrollback&&s.backend==="conpty"&&s.buildNumber>=21376:this._hasScrollback&&!this._optionsService.rawOptions.windowsMode}_reflow(s,o){this._cols!==s&&(s>this._cols?this._reflowLarger(s,o):this._reflowSmaller(s,o))}_reflowLarger(s,o){const p=(0,S.reflowLargerGetLinesToRemove)(this.lines,this._cols,s,this.ybase+this.y,this.getNullCell(_.DEFAULT_ATTR_DATA));if(p.length>0){const m=(0,S.reflowLargerCreateNewLayout)(this.lines,p);(0,S.reflowLargerApplyNewLayout)(this.lines,m.layout),this._reflowLargerAdjustViewport(s,o,m.countRemoved)}}_reflowLargerAdjustViewport(s,o,p){const m=this.getNullCell(_.DEFAULT_ATTR_DATA);let x=p;for(;x-- >0;)this.ybase===0?(this.y>0&&this.y--,this.lines.length<o&&this.lines.push(new _.BufferLine(s,m))):(this.ydisp===this.ybase&&this.ydisp--,this.ybase--);this.savedY=Math.max(this.savedY-p,0)}_reflowSmaller(s,o){const p=this.getNullCell(_.DEFAULT_ATTR_DATA),m=[];let x=0;for(let E=this.lines.length-1;E>=0;E--){let v=this.lines.get(E);if(!v||!v.isWrapped&&v.getTrimmedLength()<=s)continue;const k=[v];for(;v.isWrapped&&E>0;)v=this.lines.get(--E),k.unshift(v);const T=this.ybase+this.y;if(T>=E&&T<E+k.length)continue;const P=k[k.length-1].getTrimmedLength(),B=(0,S.reflowSmallerGetNewLineLengths)(k,this._cols,s),I=B.length-k.length;let F;F=this.ybase===0&&this.y!==this.lines.length-1?Math.max(0,this.y-this.lines.maxLength+I):Math.max(0,this.lines.length-this.lines.maxLength+I);const H=[];for(let M=0;M<I;M++){const z=this.getBlankLine(_.DEFAULT_ATTR_DATA,!0);H.push(z)}H.length>0&&(m.push({start:E+k.length+x,newLines:H}),x+=H.length),k.push(...H);let W=B.length-1,O=B[W];O===0&&(W--,O=B[W]);let b=k.length-I-1,R=P;for(;b>=0;){const M=Math.min(R,O);if(k[W]===void 0)break;if(k[W].copyCellsFrom(k[b],R-M,O-M,M,!0),O-=M,O===0&&(W--,O=B[W]),R-=M,R===0){b--;const z=Math.max(b,0);R=(0,S.getWrappedLineTrimmedLength)(k,z,this._cols)}}for(let M=0;M<k.length;M++)B[M]<s&&k[M].setCell(B[M],p);let A=I-F;for(;A-- >0;)this.ybase===0?this.y<o-1?(this.y++,this.lines.pop()):(this.ybase++,this.ydisp++):this.ybase<Math.min(this.lines.maxLength,this.lines.length+x)-o&&(this.ybase===this.ydisp&&this.ydisp++,this.ybase++);this.savedY=Math.min(this.savedY+I,this.ybase+o-1)}if(m.length>0){const E=[],v=[];for(let W=0;W<this.lines.length;W++)v.push(this.lines.get(W));const k=this.lines.length;let T=k-1,P=0,B=m[P];this.lines.length=Math.min(this.lines.maxLength,this.lines.length+x);let I=0;for(let W=Math.min(this.lines.maxLength-1,k+x-1);W>=0;W--)if(B&&B.start>T+I){for(let O=B.newLines.length-1;O>=0;O--)this.lines.set(W--,B.newLines[O]);W++,E.push({index:T+1,amount:B.newLines.length}),I+=B.newLines.length,B=m[++P]}else this.lines.set(W,v[T--]);let F=0;for(let W=E.length-1;W>=0;W--)E[W].index+=F,this.lines.onInsertEmitter.fire(E[W]),F+=E[W].amount;const H=Math.max(0,k+x-this.lines.maxLength);H>0&&this.lines.onTrimEmitter.fire(H)}}translateBufferLineToString(s,o,p=0,m){const x=this.lines.get(s);return x?x.translateToString(o,p,m):""}getWrappedRangeForLine(s){let o=s,p=s;for(;o>0&&this.lines.get(o).isWrapped;)o--;for(;p+1<this.lines.length&&this.lines.get(p+1).isWrapped;)p++;return{first:o,last:p}}setupTabStops(s){for(s!=null?this.tabs[s]||(s=this.prevStop(s)):(this.tabs={},s=0);s<this._cols;s+=this._optionsService.rawOptions.tabStopWidth)this.tabs[s]=!0}prevStop(s){for(s==null&&(s=this.x);!this.tabs[--s]&&s>0;);return s>=this._cols?this._cols-1:s<0?0:s}nextStop(s){for(s==null&&(s=this.x);!this.tabs[++s]&&s<this._cols;);return s>=this._cols?this._cols-1:s<0?0:s}clearMarkers(s){this._isClearing=!0;for(let o=0;o<this.markers.length;o++)this.markers[o].line===s&&(this.markers[o].dispose(),this.markers.splice(o--,1));this._isClearing=!1}clearAllMarkers(){this._isClearing=!0;for(let s=0;s<this.markers.length;s++)this.markers[s].dispose(),this.markers.splice(s--,1);this._isClearing=!1}addMarker(s){const o=new a.Marker(s);return this.markers.push(o),o.register(this.lines.onTrim(p=>{o.line-=p,o.line<0&&o.dispose()})),o.register(this.lines.onInsert(p=>{o.line>=p.index&&(o.line+=p.amount)})),o.register(this.lines.onDelete(p=>{o.line>=p.index&&o.line<p.index+p.amount&&o.dispose(),o.line>p.index&&(o.line-=p.amount)})),o.register(o.onDispose(()=>this._removeMarker(o))),o}_removeMarker(s){this._isClearing||this.markers.splice(this.markers.indexOf(s),1)}}},8437:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferLine=n.DEFAULT_ATTR_DATA=void 0;const f=u(3734),y=u(511),d=u(643),_=u(482);n.DEFAULT_ATTR_DATA=Object.freeze(new f.AttributeData);let S=0;class w{constructor(a,l,s=!1){this.isWrapped=s,this._combined={},this._extendedAttrs={},this._data=new Uint32Array(3*a);const o=l||y.CellData.fromCharData([0,d.NULL_CELL_CHAR,d.NULL_CELL_WIDTH,d.NULL_CELL_CODE]);for(let p=0;p<a;++p)this.setCell(p,o);this.length=a}get(a){const l=this._data[3*a+0],s=2097151&l;return[this._data[3*a+1],2097152&l?this._combined[a]:s?(0,_.stringFromCodePoint)(s):"",l>>22,2097152&l?this._combined[a].charCodeAt(this._combined[a].length-1):s]}set(a,l){this._data[3*a+1]=l[d.CHAR_DATA_ATTR_INDEX],l[d.CHAR_DATA_CHAR_INDEX].length>1?(this._combined[a]=l[1],this._data[3*a+0]=2097152|a|l[d.CHAR_DATA_WIDTH_INDEX]<<22):this._data[3*a+0]=l[d.CHAR_DATA_CHAR_INDEX].charCodeAt(0)|l[d.CHAR_DATA_WIDTH_INDEX]<<22}getWidth(a){return this._data[3*a+0]>>22}hasWidth(a){return 12582912&this._data[3*a+0]}getFg(a){return this._data[3*a+1]}getBg(a){return this._data[3*a+2]}hasContent(a){return 4194303&this._data[3*a+0]}getCodePoint(a){const l=this._data[3*a+0];return 2097152&l?this._combined[a].charCodeAt(this._combined[a].length-1):2097151&l}isCombined(a){return 2097152&this._data[3*a+0]}getString(a){const l=this._data[3*a+0];return 2097152&l?this._combined[a]:2097151&l?(0,_.stringFromCodePoint)(2097151&l):""}isProtected(a){return 536870912&this._data[3*a+2]}loadCell(a,l){return S=3*a,l.content=this._data[S+0],l.fg=this._data[S+1],l.bg=this._data[S+2],2097152&l.content&&(l.combinedData=this._combined[a]),268435456&l.bg&&(l.extended=this._extendedAttrs[a]),l}setCell(a,l){2097152&l.content&&(this._combined[a]=l.combinedData),268435456&l.bg&&(this._extendedAttrs[a]=l.extended),this._data[3*a+0]=l.content,this._data[3*a+1]=l.fg,this._data[3*a+2]=l.bg}setCellFromCodePoint(a,l,s,o,p,m){268435456&p&&(this._extendedAttrs[a]=m),this._data[3*a+0]=l|s<<22,this._data[3*a+1]=o,this._data[3*a+2]=p}addCodepointToCell(a,l){let s=this._data[3*a+0];2097152&s?this._combined[a]+=(0,_.stringFromCodePoint)(l):(2097151&s?(this._combined[a]=(0,_.stringFromCodePoint)(2097151&s)+(0,_.stringFromCodePoint)(l),s&=-2097152,s|=2097152):s=l|4194304,this._data[3*a+0]=s)}insertCells(a,l,s,o){if((a%=this.length)&&this.getWidth(a-1)===2&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs),l<this.length-a){const p=new y.CellData;for(let m=this.length-a-l-1;m>=0;--m)this.setCell(a+l+m,this.loadCell(a+m,p));for(let m=0;m<l;++m)this.setCell(a+m,s)}else for(let p=a;p<this.length;++p)this.setCell(p,s);this.getWidth(this.length-1)===2&&this.setCellFromCodePoint(this.length-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs)}deleteCells(a,l,s,o){if(a%=this.length,l<this.length-a){const p=new y.CellData;for(let m=0;m<this.length-a-l;++m)this.setCell(a+m,this.loadCell(a+l+m,p));for(let m=this.length-l;m<this.length;++m)this.setCell(m,s)}else for(let p=a;p<this.length;++p)this.setCell(p,s);a&&this.getWidth(a-1)===2&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs),this.getWidth(a)!==0||this.hasContent(a)||this.setCellFromCodePoint(a,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs)}replaceCells(a,l,s,o,p=!1){if(p)for(a&&this.getWidth(a-1)===2&&!this.isProtected(a-1)&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs),l<this.length&&this.getWidth(l-1)===2&&!this.isProtected(l)&&this.setCellFromCodePoint(l,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs);a<l&&a<this.length;)this.isProtected(a)||this.setCell(a,s),a++;else for(a&&this.getWidth(a-1)===2&&this.setCellFromCodePoint(a-1,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs),l<this.length&&this.getWidth(l-1)===2&&this.setCellFromCodePoint(l,0,1,(o==null?void 0:o.fg)||0,(o==null?void 0:o.bg)||0,(o==null?void 0:o.extended)||new f.ExtendedAttrs);a<l&&a<this.length;)this.setCell(a++,s)}resize(a,l){if(a===this.length)return 4*this._data.length*2<this._data.buffer.byteLength;const s=3*a;if(a>this.length){if(this._data.buffer.byteLength>=4*s)this._data=new Uint32Array(this._data.buffer,0,s);else{const o=new Uint32Array(s);o.set(this._data),this._data=o}for(let o=this.length;o<a;++o)this.setCell(o,l)}else{this._data=this._data.subarray(0,s);const o=Object.keys(this._combined);for(let m=0;m<o.length;m++){const x=parseInt(o[m],10);x>=a&&delete this._combined[x]}const p=Object.keys(this._extendedAttrs);for(let m=0;m<p.length;m++){const x=parseInt(p[m],10);x>=a&&delete this._extendedAttrs[x]}}return this.length=a,4*s*2<this._data.buffer.byteLength}cleanupMemory(){if(4*this._data.length*2<this._data.buffer.byteLength){const a=new Uint32Array(this._data.length);return a.set(this._data),this._data=a,1}return 0}fill(a,l=!1){if(l)for(let s=0;s<this.length;++s)this.isProtected(s)||this.setCell(s,a);else{this._combined={},this._extendedAttrs={};for(let s=0;s<this.length;++s)this.setCell(s,a)}}copyFrom(a){this.length!==a.length?this._data=new Uint32Array(a._data):this._data.set(a._data),this.length=a.length,this._combined={};for(const l in a._combined)this._combined[l]=a._combined[l];this._extendedAttrs={};for(const l in a._extendedAttrs)this._extendedAttrs[l]=a._extendedAttrs[l];this.isWrapped=a.isWrapped}clone(){const a=new w(0);a._data=new Uint32Array(this._data),a.length=this.length;for(const l in this._combined)a._combined[l]=this._combined[l];for(const l in this._extendedAttrs)a._extendedAttrs[l]=this._extendedAttrs[l];return a.isWrapped=this.isWrapped,a}getTrimmedLength(){for(let a=this.length-1;a>=0;--a)if(4194303&this._data[3*a+0])return a+(this._data[3*a+0]>>22);return 0}getNoBgTrimmedLength(){for(let a=this.length-1;a>=0;--a)if(4194303&this._data[3*a+0]||50331648&this._data[3*a+2])return a+(this._data[3*a+0]>>22);return 0}copyCellsFrom(a,l,s,o,p){const m=a._data;if(p)for(let E=o-1;E>=0;E--){for(let v=0;v<3;v++)this._data[3*(s+E)+v]=m[3*(l+E)+v];268435456&m[3*(l+E)+2]&&(this._extendedAttrs[s+E]=a._extendedAttrs[l+E])}else for(let E=0;E<o;E++){for(let v=0;v<3;v++)this._data[3*(s+E)+v]=m[3*(l+E)+v];268435456&m[3*(l+E)+2]&&(this._extendedAttrs[s+E]=a._extendedAttrs[l+E])}const x=Object.keys(a._combined);for(let E=0;E<x.length;E++){const v=parseInt(x[E],10);v>=l&&(this._combined[v-l+s]=a._combined[v])}}translateToString(a=!1,l=0,s=this.length){a&&(s=Math.min(s,this.getTrimmedLength()));let o="";for(;l<s;){const p=this._data[3*l+0],m=2097151&p;o+=2097152&p?this._combined[l]:m?(0,_.stringFromCodePoint)(m):d.WHITESPACE_CELL_CHAR,l+=p>>22||1}return o}}n.BufferLine=w},4841:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.getRangeLength=void 0,n.getRangeLength=function(u,f){if(u.start.y>u.end.y)throw new Error(`Buffer range end (${u.end.x}, ${u.end.y}) cannot be before start (${u.start.x}, ${u.start.y})`);return f*(u.end.y-u.start.y)+(u.end.x-u.start.x+1)}},4634:(g,n)=>{function u(f,y,d){if(y===f.length-1)return f[y].getTrimmedLength();const _=!f[y].hasContent(d-1)&&f[y].getWidth(d-1)===1,S=f[y+1].getWidth(0)===2;return _&&S?d-1:d}Object.defineProperty(n,"__esModule",{value:!0}),n.getWrappedLineTrimmedLength=n.reflowSmallerGetNewLineLengths=n.reflowLargerApplyNewLayout=n.reflowLargerCreateNewLayout=n.reflowLargerGetLinesToRemove=void 0,n.reflowLargerGetLinesToRemove=function(f,y,d,_,S){const w=[];for(let C=0;C<f.length-1;C++){let a=C,l=f.get(++a);if(!l.isWrapped)continue;const s=[f.get(C)];for(;a<f.length&&l.isWrapped;)s.push(l),l=f.get(++a);if(_>=C&&_<a){C+=s.length-1;continue}let o=0,p=u(s,o,y),m=1,x=0;for(;m<s.length;){const v=u(s,m,y),k=v-x,T=d-p,P=Math.min(k,T);s[o].copyCellsFrom(s[m],x,p,P,!1),p+=P,p===d&&(o++,p=0),x+=P,x===v&&(m++,x=0),p===0&&o!==0&&s[o-1].getWidth(d-1)===2&&(s[o].copyCellsFrom(s[o-1],d-1,p++,1,!1),s[o-1].setCell(d-1,S))}s[o].replaceCells(p,d,S);let E=0;for(let v=s.length-1;v>0&&(v>o||s[v].getTrimmedLength()===0);v--)E++;E>0&&(w.push(C+s.length-E),w.push(E)),C+=s.length-1}return w},n.reflowLargerCreateNewLayout=function(f,y){const d=[];let _=0,S=y[_],w=0;for(let C=0;C<f.length;C++)if(S===C){const a=y[++_];f.onDeleteEmitter.fire({index:C-w,amount:a}),C+=a-1,w+=a,S=y[++_]}else d.push(C);return{layout:d,countRemoved:w}},n.reflowLargerApplyNewLayout=function(f,y){const d=[];for(let _=0;_<y.length;_++)d.push(f.get(y[_]));for(let _=0;_<d.length;_++)f.set(_,d[_]);f.length=y.length},n.reflowSmallerGetNewLineLengths=function(f,y,d){const _=[],S=f.map((l,s)=>u(f,s,y)).reduce((l,s)=>l+s);let w=0,C=0,a=0;for(;a<S;){if(S-a<d){_.push(S-a);break}w+=d;const l=u(f,C,y);w>l&&(w-=l,C++);const s=f[C].getWidth(w-1)===2;s&&w--;const o=s?d-1:d;_.push(o),a+=o}return _},n.getWrappedLineTrimmedLength=u},5295:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferSet=void 0;const f=u(8460),y=u(844),d=u(9092);class _ extends y.Disposable{constructor(w,C){super(),this._optionsService=w,this._bufferService=C,this._onBufferActivate=this.register(new f.EventEmitter),this.onBufferActivate=this._onBufferActivate.event,this.reset(),this.register(this._optionsService.onSpecificOptionChange("scrollback",()=>this.resize(this._bufferService.cols,this._bufferService.rows))),this.register(this._optionsService.onSpecificOptionChange("tabStopWidth",()=>this.setupTabStops()))}reset(){this._normal=new d.Buffer(!0,this._optionsService,this._bufferService),this._normal.fillViewportRows(),this._alt=new d.Buffer(!1,this._optionsService,this._bufferService),this._activeBuffer=this._normal,this._onBufferActivate.fire({activeBuffer:this._normal,inactiveBuffer:this._alt}),this.setupTabStops()}get alt(){return this._alt}get active(){return this._activeBuffer}get normal(){return this._normal}activateNormalBuffer(){this._activeBuffer!==this._normal&&(this._normal.x=this._alt.x,this._normal.y=this._alt.y,this._alt.clearAllMarkers(),this._alt.clear(),this._activeBuffer=this._normal,this._onBufferActivate.fire({activeBuffer:this._normal,inactiveBuffer:this._alt}))}activateAltBuffer(w){this._activeBuffer!==this._alt&&(this._alt.fillViewportRows(w),this._alt.x=this._normal.x,this._alt.y=this._normal.y,this._activeBuffer=this._alt,this._onBufferActivate.fire({activeBuffer:this._alt,inactiveBuffer:this._normal}))}resize(w,C){this._normal.resize(w,C),this._alt.resize(w,C),this.setupTabStops(w)}setupTabStops(w){this._normal.setupTabStops(w),this._alt.setupTabStops(w)}}n.BufferSet=_},511:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CellData=void 0;const f=u(482),y=u(643),d=u(3734);class _ extends d.AttributeData{constructor(){super(...arguments),this.content=0,this.fg=0,this.bg=0,this.extended=new d.ExtendedAttrs,this.combinedData=""}static fromCharData(w){const C=new _;return C.setFromCharData(w),C}isCombined(){return 2097152&this.content}getWidth(){return this.content>>22}getChars(){return 2097152&this.content?this.combinedData:2097151&this.content?(0,f.stringFromCodePoint)(2097151&this.content):""}getCode(){return this.isCombined()?this.combinedData.charCodeAt(this.combinedData.length-1):2097151&this.content}setFromCharData(w){this.fg=w[y.CHAR_DATA_ATTR_INDEX],this.bg=0;let C=!1;if(w[y.CHAR_DATA_CHAR_INDEX].length>2)C=!0;else if(w[y.CHAR_DATA_CHAR_INDEX].length===2){const a=w[y.CHAR_DATA_CHAR_INDEX].charCodeAt(0);if(55296<=a&&a<=56319){const l=w[y.CHAR_DATA_CHAR_INDEX].charCodeAt(1);56320<=l&&l<=57343?this.content=1024*(a-55296)+l-56320+65536|w[y.CHAR_DATA_WIDTH_INDEX]<<22:C=!0}else C=!0}else this.content=w[y.CHAR_DATA_CHAR_INDEX].charCodeAt(0)|w[y.CHAR_DATA_WIDTH_INDEX]<<22;C&&(this.combinedData=w[y.CHAR_DATA_CHAR_INDEX],this.content=2097152|w[y.CHAR_DATA_WIDTH_INDEX]<<22)}getAsCharData(){return[this.fg,this.getChars(),this.getWidth(),this.getCode()]}}n.CellData=_},643:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.WHITESPACE_CELL_CODE=n.WHITESPACE_CELL_WIDTH=n.WHITESPACE_CELL_CHAR=n.NULL_CELL_CODE=n.NULL_CELL_WIDTH=n.NULL_CELL_CHAR=n.CHAR_DATA_CODE_INDEX=n.CHAR_DATA_WIDTH_INDEX=n.CHAR_DATA_CHAR_INDEX=n.CHAR_DATA_ATTR_INDEX=n.DEFAULT_EXT=n.DEFAULT_ATTR=n.DEFAULT_COLOR=void 0,n.DEFAULT_COLOR=0,n.DEFAULT_ATTR=256|n.DEFAULT_COLOR<<9,n.DEFAULT_EXT=0,n.CHAR_DATA_ATTR_INDEX=0,n.CHAR_DATA_CHAR_INDEX=1,n.CHAR_DATA_WIDTH_INDEX=2,n.CHAR_DATA_CODE_INDEX=3,n.NULL_CELL_CHAR="",n.NULL_CELL_WIDTH=1,n.NULL_CELL_CODE=0,n.WHITESPACE_CELL_CHAR=" ",n.WHITESPACE_CELL_WIDTH=1,n.WHITESPACE_CELL_CODE=32},4863:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Marker=void 0;const f=u(8460),y=u(844);class d{get id(){return this._id}constructor(S){this.line=S,this.isDisposed=!1,this._disposables=[],this._id=d._nextId++,this._onDispose=this.register(new f.EventEmitter),this.onDispose=this._onDispose.event}dispose(){this.isDisposed||(this.isDisposed=!0,this.line=-1,this._onDispose.fire(),(0,y.disposeArray)(this._disposables),this._disposables.length=0)}register(S){return this._disposables.push(S),S}}n.Marker=d,d._nextId=1},7116:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DEFAULT_CHARSET=n.CHARSETS=void 0,n.CHARSETS={},n.DEFAULT_CHARSET=n.CHARSETS.B,n.CHARSETS[0]={"`":"◆",a:"▒",b:"␉",c:"␌",d:"␍",e:"␊",f:"°",g:"±",h:"␤",i:"␋",j:"┘",k:"┐",l:"┌",m:"└",n:"┼",o:"⎺",p:"⎻",q:"─",r:"⎼",s:"⎽",t:"├",u:"┤",v:"┴",w:"┬",x:"│",y:"≤",z:"≥","{":"π","|":"≠","}":"£","~":"·"},n.CHARSETS.A={"#":"£"},n.CHARSETS.B=void 0,n.CHARSETS[4]={"#":"£","@":"¾","[":"ij","\\":"½","]":"|","{":"¨","|":"f","}":"¼","~":"´"},n.CHARSETS.C=n.CHARSETS[5]={"[":"Ä","\\":"Ö","]":"Å","^":"Ü","`":"é","{":"ä","|":"ö","}":"å","~":"ü"},n.CHARSETS.R={"#":"£","@":"à","[":"°","\\":"ç","]":"§","{":"é","|":"ù","}":"è","~":"¨"},n.CHARSETS.Q={"@":"à","[":"â","\\":"ç","]":"ê","^":"î","`":"ô","{":"é","|":"ù","}":"è","~":"û"},n.CHARSETS.K={"@":"§","[":"Ä","\\":"Ö","]":"Ü","{":"ä","|":"ö","}":"ü","~":"ß"},n.CHARSETS.Y={"#":"£","@":"§","[":"°","\\":"ç","]":"é","`":"ù","{":"à","|":"ò","}":"è","~":"ì"},n.CHARSETS.E=n.CHARSETS[6]={"@":"Ä","[":"Æ","\\":"Ø","]":"Å","^":"Ü","`":"ä","{":"æ","|":"ø","}":"å","~":"ü"},n.CHARSETS.Z={"#":"£","@":"§","[":"¡","\\":"Ñ","]":"¿","{":"°","|":"ñ","}":"ç"},n.CHARSETS.H=n.CHARSETS[7]={"@":"É","[":"Ä","\\":"Ö","]":"Å","^":"Ü","`":"é","{":"ä","|":"ö","}":"å","~":"ü"},n.CHARSETS["="]={"#":"ù","@":"à","[":"é","\\":"ç","]":"ê","^":"î",_:"è","`":"ô","{":"ä","|":"ö","}":"ü","~":"û"}},2584:(g,n)=>{var u,f,y;Object.defineProperty(n,"__esModule",{value:!0}),n.C1_ESCAPED=n.C1=n.C0=void 0,function(d){d.NUL="\0",d.SOH="",d.STX="",d.ETX="",d.EOT="",d.ENQ="",d.ACK="",d.BEL="\x07",d.BS="\b",d.HT="	",d.LF=`
-`,d.VT="\v",d.FF="\f",d.CR="\r",d.SO="",d.SI="",d.DLE="",d.DC1="",d.DC2="",d.DC3="",d.DC4="",d.NAK="",d.SYN="",d.ETB="",d.CAN="",d.EM="",d.SUB="",d.ESC="\x1B",d.FS="",d.GS="",d.RS="",d.US="",d.SP=" ",d.DEL=""}(u||(n.C0=u={})),function(d){d.PAD="",d.HOP="",d.BPH="",d.NBH="",d.IND="",d.NEL="",d.SSA="",d.ESA="",d.HTS="",d.HTJ="",d.VTS="",d.PLD="",d.PLU="",d.RI="",d.SS2="",d.SS3="",d.DCS="",d.PU1="",d.PU2="",d.STS="",d.CCH="",d.MW="",d.SPA="",d.EPA="",d.SOS="",d.SGCI="",d.SCI="",d.CSI="",d.ST="",d.OSC="",d.PM="",d.APC=""}(f||(n.C1=f={})),function(d){d.ST=`${u.ESC}\\`}(y||(n.C1_ESCAPED=y={}))},7399:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.evaluateKeyboardEvent=void 0;const f=u(2584),y={48:["0",")"],49:["1","!"],50:["2","@"],51:["3","#"],52:["4","$"],53:["5","%"],54:["6","^"],55:["7","&"],56:["8","*"],57:["9","("],186:[";",":"],187:["=","+"],188:[",","<"],189:["-","_"],190:[".",">"],191:["/","?"],192:["`","~"],219:["[","{"],220:["\\","|"],221:["]","}"],222:["'",'"']};n.evaluateKeyboardEvent=function(d,_,S,w){const C={type:0,cancel:!1,key:void 0},a=(d.shiftKey?1:0)|(d.altKey?2:0)|(d.ctrlKey?4:0)|(d.metaKey?8:0);switch(d.keyCode){case 0:d.key==="UIKeyInputUpArrow"?C.key=_?f.C0.ESC+"OA":f.C0.ESC+"[A":d.key==="UIKeyInputLeftArrow"?C.key=_?f.C0.ESC+"OD":f.C0.ESC+"[D":d.key==="UIKeyInputRightArrow"?C.key=_?f.C0.ESC+"OC":f.C0.ESC+"[C":d.key==="UIKeyInputDownArrow"&&(C.key=_?f.C0.ESC+"OB":f.C0.ESC+"[B");break;case 8:if(d.altKey){C.key=f.C0.ESC+f.C0.DEL;break}C.key=f.C0.DEL;break;case 9:if(d.shiftKey){C.key=f.C0.ESC+"[Z";break}C.key=f.C0.HT,C.cancel=!0;break;case 13:C.key=d.altKey?f.C0.ESC+f.C0.CR:f.C0.CR,C.cancel=!0;break;case 27:C.key=f.C0.ESC,d.altKey&&(C.key=f.C0.ESC+f.C0.ESC),C.cancel=!0;break;case 37:if(d.metaKey)break;a?(C.key=f.C0.ESC+"[1;"+(a+1)+"D",C.key===f.C0.ESC+"[1;3D"&&(C.key=f.C0.ESC+(S?"b":"[1;5D"))):C.key=_?f.C0.ESC+"OD":f.C0.ESC+"[D";break;case 39:if(d.metaKey)break;a?(C.key=f.C0.ESC+"[1;"+(a+1)+"C",C.key===f.C0.ESC+"[1;3C"&&(C.key=f.C0.ESC+(S?"f":"[1;5C"))):C.key=_?f.C0.ESC+"OC":f.C0.ESC+"[C";break;case 38:if(d.metaKey)break;a?(C.key=f.C0.ESC+"[1;"+(a+1)+"A",S||C.key!==f.C0.ESC+"[1;3A"||(C.key=f.C0.ESC+"[1;5A")):C.key=_?f.C0.ESC+"OA":f.C0.ESC+"[A";break;case 40:if(d.metaKey)break;a?(C.key=f.C0.ESC+"[1;"+(a+1)+"B",S||C.key!==f.C0.ESC+"[1;3B"||(C.key=f.C0.ESC+"[1;5B")):C.key=_?f.C0.ESC+"OB":f.C0.ESC+"[B";break;case 45:d.shiftKey||d.ctrlKey||(C.key=f.C0.ESC+"[2~");break;case 46:C.key=a?f.C0.ESC+"[3;"+(a+1)+"~":f.C0.ESC+"[3~";break;case 36:C.key=a?f.C0.ESC+"[1;"+(a+1)+"H":_?f.C0.ESC+"OH":f.C0.ESC+"[H";break;case 35:C.key=a?f.C0.ESC+"[1;"+(a+1)+"F":_?f.C0.ESC+"OF":f.C0.ESC+"[F";break;case 33:d.shiftKey?C.type=2:d.ctrlKey?C.key=f.C0.ESC+"[5;"+(a+1)+"~":C.key=f.C0.ESC+"[5~";break;case 34:d.shiftKey?C.type=3:d.ctrlKey?C.key=f.C0.ESC+"[6;"+(a+1)+"~":C.key=f.C0.ESC+"[6~";break;case 112:C.key=a?f.C0.ESC+"[1;"+(a+1)+"P":f.C0.ESC+"OP";break;case 113:C.key=a?f.C0.ESC+"[1;"+(a+1)+"Q":f.C0.ESC+"OQ";break;case 114:C.key=a?f.C0.ESC+"[1;"+(a+1)+"R":f.C0.ESC+"OR";break;case 115:C.key=a?f.C0.ESC+"[1;"+(a+1)+"S":f.C0.ESC+"OS";break;case 116:C.key=a?f.C0.ESC+"[15;"+(a+1)+"~":f.C0.ESC+"[15~";break;case 117:C.key=a?f.C0.ESC+"[17;"+(a+1)+"~":f.C0.ESC+"[17~";break;case 118:C.key=a?f.C0.ESC+"[18;"+(a+1)+"~":f.C0.ESC+"[18~";break;case 119:C.key=a?f.C0.ESC+"[19;"+(a+1)+"~":f.C0.ESC+"[19~";break;case 120:C.key=a?f.C0.ESC+"[20;"+(a+1)+"~":f.C0.ESC+"[20~";break;case 121:C.key=a?f.C0.ESC+"[21;"+(a+1)+"~":f.C0.ESC+"[21~";break;case 122:C.key=a?f.C0.ESC+"[23;"+(a+1)+"~":f.C0.ESC+"[23~";break;case 123:C.key=a?f.C0.ESC+"[24;"+(a+1)+"~":f.C0.ESC+"[24~";break;default:if(!d.ctrlKey||d.shiftKey||d.altKey||d.metaKey)if(S&&!w||!d.altKey||d.metaKey)!S||d.altKey||d.ctrlKey||d.shiftKey||!d.metaKey?d.key&&!d.ctrlKey&&!d.altKey&&!d.metaKey&&d.keyCode>=48&&d.key.length===1?C.key=d.key:d.key&&d.ctrlKey&&(d.key==="_"&&(C.key=f.C0.US),d.key==="@"&&(C.key=f.C0.NUL)):d.keyCode===65&&(C.type=1);else{const l=y[d.keyCode],s=l==null?void 0:l[d.shiftKey?1:0];if(s)C.key=f.C0.ESC+s;else if(d.keyCode>=65&&d.keyCode<=90){const o=d.ctrlKey?d.keyCode-64:d.keyCode+32;let p=String.fromCharCode(o);d.shiftKey&&(p=p.toUpperCase()),C.key=f.C0.ESC+p}else if(d.keyCode===32)C.key=f.C0.ESC+(d.ctrlKey?f.C0.NUL:" ");else if(d.key==="Dead"&&d.code.startsWith("Key")){let o=d.code.slice(3,4);d.shiftKey||(o=o.toLowerCase()),C.key=f.C0.ESC+o,C.cancel=!0}}else d.keyCode>=65&&d.keyCode<=90?C.key=String.fromCharCode(d.keyCode-64):d.keyCode===32?C.key=f.C0.NUL:d.keyCode>=51&&d.keyCode<=55?C.key=String.fromCharCode(d.keyCode-51+27):d.keyCode===56?C.key=f.C0.DEL:d.keyCode===219?C.key=f.C0.ESC:d.keyCode===220?C.key=f.C0.FS:d.keyCode===221&&(C.key=f.C0.GS)}return C}},482:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Utf8ToUtf32=n.StringToUtf32=n.utf32ToString=n.stringFromCodePoint=void 0,n.stringFromCodePoint=function(u){return u>65535?(u-=65536,String.fromCharCode(55296+(u>>10))+String.fromCharCode(u%1024+56320)):String.fromCharCode(u)},n.utf32ToString=function(u,f=0,y=u.length){let d="";for(let _=f;_<y;++_){let S=u[_];S>65535?(S-=65536,d+=String.fromCharCode(55296+(S>>10))+String.fromCharCode(S%1024+56320)):d+=String.fromCharCode(S)}return d},n.StringToUtf32=class{constructor(){this._interim=0}clear(){this._interim=0}decode(u,f){const y=u.length;if(!y)return 0;let d=0,_=0;if(this._interim){const S=u.charCodeAt(_++);56320<=S&&S<=57343?f[d++]=1024*(this._interim-55296)+S-56320+65536:(f[d++]=this._interim,f[d++]=S),this._interim=0}for(let S=_;S<y;++S){const w=u.charCodeAt(S);if(55296<=w&&w<=56319){if(++S>=y)return this._interim=w,d;const C=u.charCodeAt(S);56320<=C&&C<=57343?f[d++]=1024*(w-55296)+C-56320+65536:(f[d++]=w,f[d++]=C)}else w!==65279&&(f[d++]=w)}return d}},n.Utf8ToUtf32=class{constructor(){this.interim=new Uint8Array(3)}clear(){this.interim.fill(0)}decode(u,f){const y=u.length;if(!y)return 0;let d,_,S,w,C=0,a=0,l=0;if(this.interim[0]){let p=!1,m=this.interim[0];m&=(224&m)==192?31:(240&m)==224?15:7;let x,E=0;for(;(x=63&this.interim[++E])&&E<4;)m<<=6,m|=x;const v=(224&this.interim[0])==192?2:(240&this.interim[0])==224?3:4,k=v-E;for(;l<k;){if(l>=y)return 0;if(x=u[l++],(192&x)!=128){l--,p=!0;break}this.interim[E++]=x,m<<=6,m|=63&x}p||(v===2?m<128?l--:f[C++]=m:v===3?m<2048||m>=55296&&m<=57343||m===65279||(f[C++]=m):m<65536||m>1114111||(f[C++]=m)),this.interim.fill(0)}const s=y-4;let o=l;for(;o<y;){for(;!(!(o<s)||128&(d=u[o])||128&(_=u[o+1])||128&(S=u[o+2])||128&(w=u[o+3]));)f[C++]=d,f[C++]=_,f[C++]=S,f[C++]=w,o+=4;if(d=u[o++],d<128)f[C++]=d;else if((224&d)==192){if(o>=y)return this.interim[0]=d,C;if(_=u[o++],(192&_)!=128){o--;continue}if(a=(31&d)<<6|63&_,a<128){o--;continue}f[C++]=a}else if((240&d)==224){if(o>=y)return this.interim[0]=d,C;if(_=u[o++],(192&_)!=128){o--;continue}if(o>=y)return this.interim[0]=d,this.interim[1]=_,C;if(S=u[o++],(192&S)!=128){o--;continue}if(a=(15&d)<<12|(63&_)<<6|63&S,a<2048||a>=55296&&a<=57343||a===65279)continue;f[C++]=a}else if((248&d)==240){if(o>=y)return this.interim[0]=d,C;if(_=u[o++],(192&_)!=128){o--;continue}if(o>=y)return this.interim[0]=d,this.interim[1]=_,C;if(S=u[o++],(192&S)!=128){o--;continue}if(o>=y)return this.interim[0]=d,this.interim[1]=_,this.interim[2]=S,C;if(w=u[o++],(192&w)!=128){o--;continue}if(a=(7&d)<<18|(63&_)<<12|(63&S)<<6|63&w,a<65536||a>1114111)continue;f[C++]=a}}return C}}},225:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.UnicodeV6=void 0;const u=[[768,879],[1155,1158],[1160,1161],[1425,1469],[1471,1471],[1473,1474],[1476,1477],[1479,1479],[1536,1539],[1552,1557],[1611,1630],[1648,1648],[1750,1764],[1767,1768],[1770,1773],[1807,1807],[1809,1809],[1840,1866],[1958,1968],[2027,2035],[2305,2306],[2364,2364],[2369,2376],[2381,2381],[2385,2388],[2402,2403],[2433,2433],[2492,2492],[2497,2500],[2509,2509],[2530,2531],[2561,2562],[2620,2620],[2625,2626],[2631,2632],[2635,2637],[2672,2673],[2689,2690],[2748,2748],[2753,2757],[2759,2760],[2765,2765],[2786,2787],[2817,2817],[2876,2876],[2879,2879],[2881,2883],[2893,2893],[2902,2902],[2946,2946],[3008,3008],[3021,3021],[3134,3136],[3142,3144],[3146,3149],[3157,3158],[3260,3260],[3263,3263],[3270,3270],[3276,3277],[3298,3299],[3393,3395],[3405,3405],[3530,3530],[3538,3540],[3542,3542],[3633,3633],[3636,3642],[3655,3662],[3761,3761],[3764,3769],[3771,3772],[3784,3789],[3864,3865],[3893,3893],[3895,3895],[3897,3897],[3953,3966],[3968,3972],[3974,3975],[3984,3991],[3993,4028],[4038,4038],[4141,4144],[4146,4146],[4150,4151],[4153,4153],[4184,4185],[4448,4607],[4959,4959],[5906,5908],[5938,5940],[5970,5971],[6002,6003],[6068,6069],[6071,6077],[6086,6086],[6089,6099],[6109,6109],[6155,6157],[6313,6313],[6432,6434],[6439,6440],[6450,6450],[6457,6459],[6679,6680],[6912,6915],[6964,6964],[6966,6970],[6972,6972],[6978,6978],[7019,7027],[7616,7626],[7678,7679],[8203,8207],[8234,8238],[8288,8291],[8298,8303],[8400,8431],[12330,12335],[12441,12442],[43014,43014],[43019,43019],[43045,43046],[64286,64286],[65024,65039],[65056,65059],[65279,65279],[65529,65531]],f=[[68097,68099],[68101,68102],[68108,68111],[68152,68154],[68159,68159],[119143,119145],[119155,119170],[119173,119179],[119210,119213],[119362,119364],[917505,917505],[917536,917631],[917760,917999]];let y;n.UnicodeV6=class{constructor(){if(this.version="6",!y){y=new Uint8Array(65536),y.fill(1),y[0]=0,y.fill(0,1,32),y.fill(0,127,160),y.fill(2,4352,4448),y[9001]=2,y[9002]=2,y.fill(2,11904,42192),y[12351]=1,y.fill(2,44032,55204),y.fill(2,63744,64256),y.fill(2,65040,65050),y.fill(2,65072,65136),y.fill(2,65280,65377),y.fill(2,65504,65511);for(let d=0;d<u.length;++d)y.fill(0,u[d][0],u[d][1]+1)}}wcwidth(d){return d<32?0:d<127?1:d<65536?y[d]:function(_,S){let w,C=0,a=S.length-1;if(_<S[0][0]||_>S[a][1])return!1;for(;a>=C;)if(w=C+a>>1,_>S[w][1])C=w+1;else{if(!(_<S[w][0]))return!0;a=w-1}return!1}(d,f)?0:d>=131072&&d<=196605||d>=196608&&d<=262141?2:1}}},5981:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.WriteBuffer=void 0;const f=u(8460),y=u(844);class d extends y.Disposable{constructor(S){super(),this._action=S,this._writeBuffer=[],this._callbacks=[],this._pendingData=0,this._bufferOffset=0,this._isSyncWriting=!1,this._syncCalls=0,this._didUserInput=!1,this._onWriteParsed=this.register(new f.EventEmitter),this.onWriteParsed=this._onWriteParsed.event}handleUserInput(){this._didUserInput=!0}writeSync(S,w){if(w!==void 0&&this._syncCalls>w)return void(this._syncCalls=0);if(this._pendingData+=S.length,this._writeBuffer.push(S),this._callbacks.push(void 0),this._syncCalls++,this._isSyncWriting)return;let C;for(this._isSyncWriting=!0;C=this._writeBuffer.shift();){this._action(C);const a=this._callbacks.shift();a&&a()}this._pendingData=0,this._bufferOffset=2147483647,this._isSyncWriting=!1,this._syncCalls=0}write(S,w){if(this._pendingData>5e7)throw new Error("write data discarded, use flow control to avoid losing data");if(!this._writeBuffer.length){if(this._bufferOffset=0,this._didUserInput)return this._didUserInput=!1,this._pendingData+=S.length,this._writeBuffer.push(S),this._callbacks.push(w),void this._innerWrite();setTimeout(()=>this._innerWrite())}this._pendingData+=S.length,this._writeBuffer.push(S),this._callbacks.push(w)}_innerWrite(S=0,w=!0){const C=S||Date.now();for(;this._writeBuffer.length>this._bufferOffset;){const a=this._writeBuffer[this._bufferOffset],l=this._action(a,w);if(l){const o=p=>Date.now()-C>=12?setTimeout(()=>this._innerWrite(0,p)):this._innerWrite(C,p);return void l.catch(p=>(queueMicrotask(()=>{throw p}),Promise.resolve(!1))).then(o)}const s=this._callbacks[this._bufferOffset];if(s&&s(),this._bufferOffset++,this._pendingData-=a.length,Date.now()-C>=12)break}this._writeBuffer.length>this._bufferOffset?(this._bufferOffset>50&&(this._writeBuffer=this._writeBuffer.slice(this._bufferOffset),this._callbacks=this._callbacks.slice(this._bufferOffset),this._bufferOffset=0),setTimeout(()=>this._innerWrite())):(this._writeBuffer.length=0,this._callbacks.length=0,this._pendingData=0,this._bufferOffset=0),this._onWriteParsed.fire()}}n.WriteBuffer=d},5941:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.toRgbString=n.parseColor=void 0;const u=/^([\da-f])\/([\da-f])\/([\da-f])$|^([\da-f]{2})\/([\da-f]{2})\/([\da-f]{2})$|^([\da-f]{3})\/([\da-f]{3})\/([\da-f]{3})$|^([\da-f]{4})\/([\da-f]{4})\/([\da-f]{4})$/,f=/^[\da-f]+$/;function y(d,_){const S=d.toString(16),w=S.length<2?"0"+S:S;switch(_){case 4:return S[0];case 8:return w;case 12:return(w+w).slice(0,3);default:return w+w}}n.parseColor=function(d){if(!d)return;let _=d.toLowerCase();if(_.indexOf("rgb:")===0){_=_.slice(4);const S=u.exec(_);if(S){const w=S[1]?15:S[4]?255:S[7]?4095:65535;return[Math.round(parseInt(S[1]||S[4]||S[7]||S[10],16)/w*255),Math.round(parseInt(S[2]||S[5]||S[8]||S[11],16)/w*255),Math.round(parseInt(S[3]||S[6]||S[9]||S[12],16)/w*255)]}}else if(_.indexOf("#")===0&&(_=_.slice(1),f.exec(_)&&[3,6,9,12].includes(_.length))){const S=_.length/3,w=[0,0,0];for(let C=0;C<3;++C){const a=parseInt(_.slice(S*C,S*C+S),16);w[C]=S===1?a<<4:S===2?a:S===3?a>>4:a>>8}return w}},n.toRgbString=function(d,_=16){const[S,w,C]=d;return`rgb:${y(S,_)}/${y(w,_)}/${y(C,_)}`}},5770:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.PAYLOAD_LIMIT=void 0,n.PAYLOAD_LIMIT=1e7},6351:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DcsHandler=n.DcsParser=void 0;const f=u(482),y=u(8742),d=u(5770),_=[];n.DcsParser=class{constructor(){this._handlers=Object.create(null),this._active=_,this._ident=0,this._handlerFb=()=>{},this._stack={paused:!1,loopPosition:0,fallThrough:!1}}dispose(){this._handlers=Object.create(null),this._handlerFb=()=>{},this._active=_}registerHandler(w,C){this._handlers[w]===void 0&&(this._handlers[w]=[]);const a=this._handlers[w];return a.push(C),{dispose:()=>{const l=a.indexOf(C);l!==-1&&a.splice(l,1)}}}clearHandler(w){this._handlers[w]&&delete this._handlers[w]}setHandlerFallback(w){this._handlerFb=w}reset(){if(this._active.length)for(let w=this._stack.paused?this._stack.loopPosition-1:this._active.length-1;w>=0;--w)this._active[w].unhook(!1);this._stack.paused=!1,this._active=_,this._ident=0}hook(w,C){if(this.reset(),this._ident=w,this._active=this._handlers[w]||_,this._active.length)for(let a=this._active.length-1;a>=0;a--)this._active[a].hook(C);else this._handlerFb(this._ident,"HOOK",C)}put(w,C,a){if(this._active.length)for(let l=this._active.length-1;l>=0;l--)this._active[l].put(w,C,a);else this._handlerFb(this._ident,"PUT",(0,f.utf32ToString)(w,C,a))}unhook(w,C=!0){if(this._active.length){let a=!1,l=this._active.length-1,s=!1;if(this._stack.paused&&(l=this._stack.loopPosition-1,a=C,s=this._stack.fallThrough,this._stack.paused=!1),!s&&a===!1){for(;l>=0&&(a=this._active[l].unhook(w),a!==!0);l--)if(a instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=l,this._stack.fallThrough=!1,a;l--}for(;l>=0;l--)if(a=this._active[l].unhook(!1),a instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=l,this._stack.fallThrough=!0,a}else this._handlerFb(this._ident,"UNHOOK",w);this._active=_,this._ident=0}};const S=new y.Params;S.addParam(0),n.DcsHandler=class{constructor(w){this._handler=w,this._data="",this._params=S,this._hitLimit=!1}hook(w){this._params=w.length>1||w.params[0]?w.clone():S,this._data="",this._hitLimit=!1}put(w,C,a){this._hitLimit||(this._data+=(0,f.utf32ToString)(w,C,a),this._data.length>d.PAYLOAD_LIMIT&&(this._data="",this._hitLimit=!0))}unhook(w){let C=!1;if(this._hitLimit)C=!1;else if(w&&(C=this._handler(this._data,this._params),C instanceof Promise))return C.then(a=>(this._params=S,this._data="",this._hitLimit=!1,a));return this._params=S,this._data="",this._hitLimit=!1,C}}},2015:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.EscapeSequenceParser=n.VT500_TRANSITION_TABLE=n.TransitionTable=void 0;const f=u(844),y=u(8742),d=u(6242),_=u(6351);class S{constructor(l){this.table=new Uint8Array(l)}setDefault(l,s){this.table.fill(l<<4|s)}add(l,s,o,p){this.table[s<<8|l]=o<<4|p}addMany(l,s,o,p){for(let m=0;m<l.length;m++)this.table[s<<8|l[m]]=o<<4|p}}n.TransitionTable=S;const w=160;n.VT500_TRANSITION_TABLE=function(){const a=new S(4095),l=Array.apply(null,Array(256)).map((E,v)=>v),s=(E,v)=>l.slice(E,v),o=s(32,127),p=s(0,24);p.push(25),p.push.apply(p,s(28,32));const m=s(0,14);let x;for(x in a.setDefault(1,0),a.addMany(o,0,2,0),m)a.addMany([24,26,153,154],x,3,0),a.addMany(s(128,144),x,3,0),a.addMany(s(144,152),x,3,0),a.add(156,x,0,0),a.add(27,x,11,1),a.add(157,x,4,8),a.addMany([152,158,159],x,0,7),a.add(155,x,11,3),a.add(144,x,11,9);return a.addMany(p,0,3,0),a.addMany(p,1,3,1),a.add(127,1,0,1),a.addMany(p,8,0,8),a.addMany(p,3,3,3),a.add(127,3,0,3),a.addMany(p,4,3,4),a.add(127,4,0,4),a.addMany(p,6,3,6),a.addMany(p,5,3,5),a.add(127,5,0,5),a.addMany(p,2,3,2),a.add(127,2,0,2),a.add(93,1,4,8),a.addMany(o,8,5,8),a.add(127,8,5,8),a.addMany([156,27,24,26,7],8,6,0),a.addMany(s(28,32),8,0,8),a.addMany([88,94,95],1,0,7),a.addMany(o,7,0,7),a.addMany(p,7,0,7),a.add(156,7,0,0),a.add(127,7,0,7),a.add(91,1,11,3),a.addMany(s(64,127),3,7,0),a.addMany(s(48,60),3,8,4),a.addMany([60,61,62,63],3,9,4),a.addMany(s(48,60),4,8,4),a.addMany(s(64,127),4,7,0),a.addMany([60,61,62,63],4,0,6),a.addMany(s(32,64),6,0,6),a.add(127,6,0,6),a.addMany(s(64,127),6,0,0),a.addMany(s(32,48),3,9,5),a.addMany(s(32,48),5,9,5),a.addMany(s(48,64),5,0,6),a.addMany(s(64,127),5,7,0),a.addMany(s(32,48),4,9,5),a.addMany(s(32,48),1,9,2),a.addMany(s(32,48),2,9,2),a.addMany(s(48,127),2,10,0),a.addMany(s(48,80),1,10,0),a.addMany(s(81,88),1,10,0),a.addMany([89,90,92],1,10,0),a.addMany(s(96,127),1,10,0),a.add(80,1,11,9),a.addMany(p,9,0,9),a.add(127,9,0,9),a.addMany(s(28,32),9,0,9),a.addMany(s(32,48),9,9,12),a.addMany(s(48,60),9,8,10),a.addMany([60,61,62,63],9,9,10),a.addMany(p,11,0,11),a.addMany(s(32,128),11,0,11),a.addMany(s(28,32),11,0,11),a.addMany(p,10,0,10),a.add(127,10,0,10),a.addMany(s(28,32),10,0,10),a.addMany(s(48,60),10,8,10),a.addMany([60,61,62,63],10,0,11),a.addMany(s(32,48),10,9,12),a.addMany(p,12,0,12),a.add(127,12,0,12),a.addMany(s(28,32),12,0,12),a.addMany(s(32,48),12,9,12),a.addMany(s(48,64),12,0,11),a.addMany(s(64,127),12,12,13),a.addMany(s(64,127),10,12,13),a.addMany(s(64,127),9,12,13),a.addMany(p,13,13,13),a.addMany(o,13,13,13),a.add(127,13,0,13),a.addMany([27,156,24,26],13,14,0),a.add(w,0,2,0),a.add(w,8,5,8),a.add(w,6,0,6),a.add(w,11,0,11),a.add(w,13,13,13),a}();class C extends f.Disposable{constructor(l=n.VT500_TRANSITION_TABLE){super(),this._transitions=l,this._parseStack={state:0,handlers:[],handlerPos:0,transition:0,chunkPos:0},this.initialState=0,this.currentState=this.initialState,this._params=new y.Params,this._params.addParam(0),this._collect=0,this.precedingCodepoint=0,this._printHandlerFb=(s,o,p)=>{},this._executeHandlerFb=s=>{},this._csiHandlerFb=(s,o)=>{},this._escHandlerFb=s=>{},this._errorHandlerFb=s=>s,this._printHandler=this._printHandlerFb,this._executeHandlers=Object.create(null),this._csiHandlers=Object.create(null),this._escHandlers=Object.create(null),this.register((0,f.toDisposable)(()=>{this._csiHandlers=Object.create(null),this._executeHandlers=Object.create(null),this._escHandlers=Object.create(null)})),this._oscParser=this.register(new d.OscParser),this._dcsParser=this.register(new _.DcsParser),this._errorHandler=this._errorHandlerFb,this.registerEscHandler({final:"\\"},()=>!0)}_identifier(l,s=[64,126]){let o=0;if(l.prefix){if(l.prefix.length>1)throw new Error("only one byte as prefix supported");if(o=l.prefix.charCodeAt(0),o&&60>o||o>63)throw new Error("prefix must be in range 0x3c .. 0x3f")}if(l.intermediates){if(l.intermediates.length>2)throw new Error("only two bytes as intermediates are supported");for(let m=0;m<l.intermediates.length;++m){const x=l.intermediates.charCodeAt(m);if(32>x||x>47)throw new Error("intermediate must be in range 0x20 .. 0x2f");o<<=8,o|=x}}if(l.final.length!==1)throw new Error("final must be a single byte");const p=l.final.charCodeAt(0);if(s[0]>p||p>s[1])throw new Error(`final must be in range ${s[0]} .. ${s[1]}`);return o<<=8,o|=p,o}identToString(l){const s=[];for(;l;)s.push(String.fromCharCode(255&l)),l>>=8;return s.reverse().join("")}setPrintHandler(l){this._printHandler=l}clearPrintHandler(){this._printHandler=this._printHandlerFb}registerEscHandler(l,s){const o=this._identifier(l,[48,126]);this._escHandlers[o]===void 0&&(this._escHandlers[o]=[]);const p=this._escHandlers[o];return p.push(s),{dispose:()=>{const m=p.indexOf(s);m!==-1&&p.splice(m,1)}}}clearEscHandler(l){this._escHandlers[this._identifier(l,[48,126])]&&delete this._escHandlers[this._identifier(l,[48,126])]}setEscHandlerFallback(l){this._escHandlerFb=l}setExecuteHandler(l,s){this._executeHandlers[l.charCodeAt(0)]=s}clearExecuteHandler(l){this._executeHandlers[l.charCodeAt(0)]&&delete this._executeHandlers[l.charCodeAt(0)]}setExecuteHandlerFallback(l){this._executeHandlerFb=l}registerCsiHandler(l,s){const o=this._identifier(l);this._csiHandlers[o]===void 0&&(this._csiHandlers[o]=[]);const p=this._csiHandlers[o];return p.push(s),{dispose:()=>{const m=p.indexOf(s);m!==-1&&p.splice(m,1)}}}clearCsiHandler(l){this._csiHandlers[this._identifier(l)]&&delete this._csiHandlers[this._identifier(l)]}setCsiHandlerFallback(l){this._csiHandlerFb=l}registerDcsHandler(l,s){return this._dcsParser.registerHandler(this._identifier(l),s)}clearDcsHandler(l){this._dcsParser.clearHandler(this._identifier(l))}setDcsHandlerFallback(l){this._dcsParser.setHandlerFallback(l)}registerOscHandler(l,s){return this._oscParser.registerHandler(l,s)}clearOscHandler(l){this._oscParser.clearHandler(l)}setOscHandlerFallback(l){this._oscParser.setHandlerFallback(l)}setErrorHandler(l){this._errorHandler=l}clearErrorHandler(){this._errorHandler=this._errorHandlerFb}reset(){this.currentState=this.initialState,this._oscParser.reset(),this._dcsParser.reset(),this._params.reset(),this._params.addParam(0),this._collect=0,this.precedingCodepoint=0,this._parseStack.state!==0&&(this._parseStack.state=2,this._parseStack.handlers=[])}_preserveStack(l,s,o,p,m){this._parseStack.state=l,this._parseStack.handlers=s,this._parseStack.handlerPos=o,this._parseStack.transition=p,this._parseStack.chunkPos=m}parse(l,s,o){let p,m=0,x=0,E=0;if(this._parseStack.state)if(this._parseStack.state===2)this._parseStack.state=0,E=this._parseStack.chunkPos+1;else{if(o===void 0||this._parseStack.state===1)throw this._parseStack.state=1,new Error("improper continuation due to previous async handler, giving up parsing");const v=this._parseStack.handlers;let k=this._parseStack.handlerPos-1;switch(this._parseStack.state){case 3:if(o===!1&&k>-1){for(;k>=0&&(p=v[k](this._params),p!==!0);k--)if(p instanceof Promise)return this._parseStack.handlerPos=k,p}this._parseStack.handlers=[];break;case 4:if(o===!1&&k>-1){for(;k>=0&&(p=v[k](),p!==!0);k--)if(p instanceof Promise)return this._parseStack.handlerPos=k,p}this._parseStack.handlers=[];break;case 6:if(m=l[this._parseStack.chunkPos],p=this._dcsParser.unhook(m!==24&&m!==26,o),p)return p;m===27&&(this._parseStack.transition|=1),this._params.reset(),this._params.addParam(0),this._collect=0;break;case 5:if(m=l[this._parseStack.chunkPos],p=this._oscParser.end(m!==24&&m!==26,o),p)return p;m===27&&(this._parseStack.transition|=1),this._params.reset(),this._params.addParam(0),this._collect=0}this._parseStack.state=0,E=this._parseStack.chunkPos+1,this.precedingCodepoint=0,this.currentState=15&this._parseStack.transition}for(let v=E;v<s;++v){switch(m=l[v],x=this._transitions.table[this.currentState<<8|(m<160?m:w)],x>>4){case 2:for(let I=v+1;;++I){if(I>=s||(m=l[I])<32||m>126&&m<w){this._printHandler(l,v,I),v=I-1;break}if(++I>=s||(m=l[I])<32||m>126&&m<w){this._printHandler(l,v,I),v=I-1;break}if(++I>=s||(m=l[I])<32||m>126&&m<w){this._printHandler(l,v,I),v=I-1;break}if(++I>=s||(m=l[I])<32||m>126&&m<w){this._printHandler(l,v,I),v=I-1;break}}break;case 3:this._executeHandlers[m]?this._executeHandlers[m]():this._executeHandlerFb(m),this.precedingCodepoint=0;break;case 0:break;case 1:if(this._errorHandler({position:v,code:m,currentState:this.currentState,collect:this._collect,params:this._params,abort:!1}).abort)return;break;case 7:const k=this._csiHandlers[this._collect<<8|m];let T=k?k.length-1:-1;for(;T>=0&&(p=k[T](this._params),p!==!0);T--)if(p instanceof Promise)return this._preserveStack(3,k,T,x,v),p;T<0&&this._csiHandlerFb(this._collect<<8|m,this._params),this.precedingCodepoint=0;break;case 8:do switch(m){case 59:this._params.addParam(0);break;case 58:this._params.addSubParam(-1);break;default:this._params.addDigit(m-48)}while(++v<s&&(m=l[v])>47&&m<60);v--;break;case 9:this._collect<<=8,this._collect|=m;break;case 10:const P=this._escHandlers[this._collect<<8|m];let B=P?P.length-1:-1;for(;B>=0&&(p=P[B](),p!==!0);B--)if(p instanceof Promise)return this._preserveStack(4,P,B,x,v),p;B<0&&this._escHandlerFb(this._collect<<8|m),this.precedingCodepoint=0;break;case 11:this._params.reset(),this._params.addParam(0),this._collect=0;break;case 12:this._dcsParser.hook(this._collect<<8|m,this._params);break;case 13:for(let I=v+1;;++I)if(I>=s||(m=l[I])===24||m===26||m===27||m>127&&m<w){this._dcsParser.put(l,v,I),v=I-1;break}break;case 14:if(p=this._dcsParser.unhook(m!==24&&m!==26),p)return this._preserveStack(6,[],0,x,v),p;m===27&&(x|=1),this._params.reset(),this._params.addParam(0),this._collect=0,this.precedingCodepoint=0;break;case 4:this._oscParser.start();break;case 5:for(let I=v+1;;I++)if(I>=s||(m=l[I])<32||m>127&&m<w){this._oscParser.put(l,v,I),v=I-1;break}break;case 6:if(p=this._oscParser.end(m!==24&&m!==26),p)return this._preserveStack(5,[],0,x,v),p;m===27&&(x|=1),this._params.reset(),this._params.addParam(0),this._collect=0,this.precedingCodepoint=0}this.currentState=15&x}}}n.EscapeSequenceParser=C},6242:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.OscHandler=n.OscParser=void 0;const f=u(5770),y=u(482),d=[];n.OscParser=class{constructor(){this._state=0,this._active=d,this._id=-1,this._handlers=Object.create(null),this._handlerFb=()=>{},this._stack={paused:!1,loopPosition:0,fallThrough:!1}}registerHandler(_,S){this._handlers[_]===void 0&&(this._handlers[_]=[]);const w=this._handlers[_];return w.push(S),{dispose:()=>{const C=w.indexOf(S);C!==-1&&w.splice(C,1)}}}clearHandler(_){this._handlers[_]&&delete this._handlers[_]}setHandlerFallback(_){this._handlerFb=_}dispose(){this._handlers=Object.create(null),this._handlerFb=()=>{},this._active=d}reset(){if(this._state===2)for(let _=this._stack.paused?this._stack.loopPosition-1:this._active.length-1;_>=0;--_)this._active[_].end(!1);this._stack.paused=!1,this._active=d,this._id=-1,this._state=0}_start(){if(this._active=this._handlers[this._id]||d,this._active.length)for(let _=this._active.length-1;_>=0;_--)this._active[_].start();else this._handlerFb(this._id,"START")}_put(_,S,w){if(this._active.length)for(let C=this._active.length-1;C>=0;C--)this._active[C].put(_,S,w);else this._handlerFb(this._id,"PUT",(0,y.utf32ToString)(_,S,w))}start(){this.reset(),this._state=1}put(_,S,w){if(this._state!==3){if(this._state===1)for(;S<w;){const C=_[S++];if(C===59){this._state=2,this._start();break}if(C<48||57<C)return void(this._state=3);this._id===-1&&(this._id=0),this._id=10*this._id+C-48}this._state===2&&w-S>0&&this._put(_,S,w)}}end(_,S=!0){if(this._state!==0){if(this._state!==3)if(this._state===1&&this._start(),this._active.length){let w=!1,C=this._active.length-1,a=!1;if(this._stack.paused&&(C=this._stack.loopPosition-1,w=S,a=this._stack.fallThrough,this._stack.paused=!1),!a&&w===!1){for(;C>=0&&(w=this._active[C].end(_),w!==!0);C--)if(w instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=C,this._stack.fallThrough=!1,w;C--}for(;C>=0;C--)if(w=this._active[C].end(!1),w instanceof Promise)return this._stack.paused=!0,this._stack.loopPosition=C,this._stack.fallThrough=!0,w}else this._handlerFb(this._id,"END",_);this._active=d,this._id=-1,this._state=0}}},n.OscHandler=class{constructor(_){this._handler=_,this._data="",this._hitLimit=!1}start(){this._data="",this._hitLimit=!1}put(_,S,w){this._hitLimit||(this._data+=(0,y.utf32ToString)(_,S,w),this._data.length>f.PAYLOAD_LIMIT&&(this._data="",this._hitLimit=!0))}end(_){let S=!1;if(this._hitLimit)S=!1;else if(_&&(S=this._handler(this._data),S instanceof Promise))return S.then(w=>(this._data="",this._hitLimit=!1,w));return this._data="",this._hitLimit=!1,S}}},8742:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.Params=void 0;const u=2147483647;class f{static fromArray(d){const _=new f;if(!d.length)return _;for(let S=Array.isArray(d[0])?1:0;S<d.length;++S){const w=d[S];if(Array.isArray(w))for(let C=0;C<w.length;++C)_.addSubParam(w[C]);else _.addParam(w)}return _}constructor(d=32,_=32){if(this.maxLength=d,this.maxSubParamsLength=_,_>256)throw new Error("maxSubParamsLength must not be greater than 256");this.params=new Int32Array(d),this.length=0,this._subParams=new Int32Array(_),this._subParamsLength=0,this._subParamsIdx=new Uint16Array(d),this._rejectDigits=!1,this._rejectSubDigits=!1,this._digitIsSub=!1}clone(){const d=new f(this.maxLength,this.maxSubParamsLength);return d.params.set(this.params),d.length=this.length,d._subParams.set(this._subParams),d._subParamsLength=this._subParamsLength,d._subParamsIdx.set(this._subParamsIdx),d._rejectDigits=this._rejectDigits,d._rejectSubDigits=this._rejectSubDigits,d._digitIsSub=this._digitIsSub,d}toArray(){const d=[];for(let _=0;_<this.length;++_){d.push(this.params[_]);const S=this._subParamsIdx[_]>>8,w=255&this._subParamsIdx[_];w-S>0&&d.push(Array.prototype.slice.call(this._subParams,S,w))}return d}reset(){this.length=0,this._subParamsLength=0,this._rejectDigits=!1,this._rejectSubDigits=!1,this._digitIsSub=!1}addParam(d){if(this._digitIsSub=!1,this.length>=this.maxLength)this._rejectDigits=!0;else{if(d<-1)throw new Error("values lesser than -1 are not allowed");this._subParamsIdx[this.length]=this._subParamsLength<<8|this._subParamsLength,this.params[this.length++]=d>u?u:d}}addSubParam(d){if(this._digitIsSub=!0,this.length)if(this._rejectDigits||this._subParamsLength>=this.maxSubParamsLength)this._rejectSubDigits=!0;else{if(d<-1)throw new Error("values lesser than -1 are not allowed");this._subParams[this._subParamsLength++]=d>u?u:d,this._subParamsIdx[this.length-1]++}}hasSubParams(d){return(255&this._subParamsIdx[d])-(this._subParamsIdx[d]>>8)>0}getSubParams(d){const _=this._subParamsIdx[d]>>8,S=255&this._subParamsIdx[d];return S-_>0?this._subParams.subarray(_,S):null}getSubParamsAll(){const d={};for(let _=0;_<this.length;++_){const S=this._subParamsIdx[_]>>8,w=255&this._subParamsIdx[_];w-S>0&&(d[_]=this._subParams.slice(S,w))}return d}addDigit(d){let _;if(this._rejectDigits||!(_=this._digitIsSub?this._subParamsLength:this.length)||this._digitIsSub&&this._rejectSubDigits)return;const S=this._digitIsSub?this._subParams:this.params,w=S[_-1];S[_-1]=~w?Math.min(10*w+d,u):d}}n.Params=f},5741:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.AddonManager=void 0,n.AddonManager=class{constructor(){this._addons=[]}dispose(){for(let u=this._addons.length-1;u>=0;u--)this._addons[u].instance.dispose()}loadAddon(u,f){const y={instance:f,dispose:f.dispose,isDisposed:!1};this._addons.push(y),f.dispose=()=>this._wrappedAddonDispose(y),f.activate(u)}_wrappedAddonDispose(u){if(u.isDisposed)return;let f=-1;for(let y=0;y<this._addons.length;y++)if(this._addons[y]===u){f=y;break}if(f===-1)throw new Error("Could not dispose an addon that has not been loaded");u.isDisposed=!0,u.dispose.apply(u.instance),this._addons.splice(f,1)}}},8771:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferApiView=void 0;const f=u(3785),y=u(511);n.BufferApiView=class{constructor(d,_){this._buffer=d,this.type=_}init(d){return this._buffer=d,this}get cursorY(){return this._buffer.y}get cursorX(){return this._buffer.x}get viewportY(){return this._buffer.ydisp}get baseY(){return this._buffer.ybase}get length(){return this._buffer.lines.length}getLine(d){const _=this._buffer.lines.get(d);if(_)return new f.BufferLineApiView(_)}getNullCell(){return new y.CellData}}},3785:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferLineApiView=void 0;const f=u(511);n.BufferLineApiView=class{constructor(y){this._line=y}get isWrapped(){return this._line.isWrapped}get length(){return this._line.length}getCell(y,d){if(!(y<0||y>=this._line.length))return d?(this._line.loadCell(y,d),d):this._line.loadCell(y,new f.CellData)}translateToString(y,d,_){return this._line.translateToString(y,d,_)}}},8285:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.BufferNamespaceApi=void 0;const f=u(8771),y=u(8460),d=u(844);class _ extends d.Disposable{constructor(w){super(),this._core=w,this._onBufferChange=this.register(new y.EventEmitter),this.onBufferChange=this._onBufferChange.event,this._normal=new f.BufferApiView(this._core.buffers.normal,"normal"),this._alternate=new f.BufferApiView(this._core.buffers.alt,"alternate"),this._core.buffers.onBufferActivate(()=>this._onBufferChange.fire(this.active))}get active(){if(this._core.buffers.active===this._core.buffers.normal)return this.normal;if(this._core.buffers.active===this._core.buffers.alt)return this.alternate;throw new Error("Active buffer is neither normal nor alternate")}get normal(){return this._normal.init(this._core.buffers.normal)}get alternate(){return this._alternate.init(this._core.buffers.alt)}}n.BufferNamespaceApi=_},7975:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.ParserApi=void 0,n.ParserApi=class{constructor(u){this._core=u}registerCsiHandler(u,f){return this._core.registerCsiHandler(u,y=>f(y.toArray()))}addCsiHandler(u,f){return this.registerCsiHandler(u,f)}registerDcsHandler(u,f){return this._core.registerDcsHandler(u,(y,d)=>f(y,d.toArray()))}addDcsHandler(u,f){return this.registerDcsHandler(u,f)}registerEscHandler(u,f){return this._core.registerEscHandler(u,f)}addEscHandler(u,f){return this.registerEscHandler(u,f)}registerOscHandler(u,f){return this._core.registerOscHandler(u,f)}addOscHandler(u,f){return this.registerOscHandler(u,f)}}},7090:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.UnicodeApi=void 0,n.UnicodeApi=class{constructor(u){this._core=u}register(u){this._core.unicodeService.register(u)}get versions(){return this._core.unicodeService.versions}get activeVersion(){return this._core.unicodeService.activeVersion}set activeVersion(u){this._core.unicodeService.activeVersion=u}}},744:function(g,n,u){var f=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.BufferService=n.MINIMUM_ROWS=n.MINIMUM_COLS=void 0;const d=u(8460),_=u(844),S=u(5295),w=u(2585);n.MINIMUM_COLS=2,n.MINIMUM_ROWS=1;let C=n.BufferService=class extends _.Disposable{get buffer(){return this.buffers.active}constructor(a){super(),this.isUserScrolling=!1,this._onResize=this.register(new d.EventEmitter),this.onResize=this._onResize.event,this._onScroll=this.register(new d.EventEmitter),this.onScroll=this._onScroll.event,this.cols=Math.max(a.rawOptions.cols||0,n.MINIMUM_COLS),this.rows=Math.max(a.rawOptions.rows||0,n.MINIMUM_ROWS),this.buffers=this.register(new S.BufferSet(a,this))}resize(a,l){this.cols=a,this.rows=l,this.buffers.resize(a,l),this._onResize.fire({cols:a,rows:l})}reset(){this.buffers.reset(),this.isUserScrolling=!1}scroll(a,l=!1){const s=this.buffer;let o;o=this._cachedBlankLine,o&&o.length===this.cols&&o.getFg(0)===a.fg&&o.getBg(0)===a.bg||(o=s.getBlankLine(a,l),this._cachedBlankLine=o),o.isWrapped=l;const p=s.ybase+s.scrollTop,m=s.ybase+s.scrollBottom;if(s.scrollTop===0){const x=s.lines.isFull;m===s.lines.length-1?x?s.lines.recycle().copyFrom(o):s.lines.push(o.clone()):s.lines.splice(m+1,0,o.clone()),x?this.isUserScrolling&&(s.ydisp=Math.max(s.ydisp-1,0)):(s.ybase++,this.isUserScrolling||s.ydisp++)}else{const x=m-p+1;s.lines.shiftElements(p+1,x-1,-1),s.lines.set(m,o.clone())}this.isUserScrolling||(s.ydisp=s.ybase),this._onScroll.fire(s.ydisp)}scrollLines(a,l,s){const o=this.buffer;if(a<0){if(o.ydisp===0)return;this.isUserScrolling=!0}else a+o.ydisp>=o.ybase&&(this.isUserScrolling=!1);const p=o.ydisp;o.ydisp=Math.max(Math.min(o.ydisp+a,o.ybase),0),p!==o.ydisp&&(l||this._onScroll.fire(o.ydisp))}};n.BufferService=C=f([y(0,w.IOptionsService)],C)},7994:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.CharsetService=void 0,n.CharsetService=class{constructor(){this.glevel=0,this._charsets=[]}reset(){this.charset=void 0,this._charsets=[],this.glevel=0}setgLevel(u){this.glevel=u,this.charset=this._charsets[u]}setgCharset(u,f){this._charsets[u]=f,this.glevel===u&&(this.charset=f)}}},1753:function(g,n,u){var f=this&&this.__decorate||function(o,p,m,x){var E,v=arguments.length,k=v<3?p:x===null?x=Object.getOwnPropertyDescriptor(p,m):x;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")k=Reflect.decorate(o,p,m,x);else for(var T=o.length-1;T>=0;T--)(E=o[T])&&(k=(v<3?E(k):v>3?E(p,m,k):E(p,m))||k);return v>3&&k&&Object.defineProperty(p,m,k),k},y=this&&this.__param||function(o,p){return function(m,x){p(m,x,o)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CoreMouseService=void 0;const d=u(2585),_=u(8460),S=u(844),w={NONE:{events:0,restrict:()=>!1},X10:{events:1,restrict:o=>o.button!==4&&o.action===1&&(o.ctrl=!1,o.alt=!1,o.shift=!1,!0)},VT200:{events:19,restrict:o=>o.action!==32},DRAG:{events:23,restrict:o=>o.action!==32||o.button!==3},ANY:{events:31,restrict:o=>!0}};function C(o,p){let m=(o.ctrl?16:0)|(o.shift?4:0)|(o.alt?8:0);return o.button===4?(m|=64,m|=o.action):(m|=3&o.button,4&o.button&&(m|=64),8&o.button&&(m|=128),o.action===32?m|=32:o.action!==0||p||(m|=3)),m}const a=String.fromCharCode,l={DEFAULT:o=>{const p=[C(o,!1)+32,o.col+32,o.row+32];return p[0]>255||p[1]>255||p[2]>255?"":`\x1B[M${a(p[0])}${a(p[1])}${a(p[2])}`},SGR:o=>{const p=o.action===0&&o.button!==4?"m":"M";return`\x1B[<${C(o,!0)};${o.col};${o.row}${p}`},SGR_PIXELS:o=>{const p=o.action===0&&o.button!==4?"m":"M";return`\x1B[<${C(o,!0)};${o.x};${o.y}${p}`}};let s=n.CoreMouseService=class extends S.Disposable{constructor(o,p){super(),this._bufferService=o,this._coreService=p,this._protocols={},this._encodings={},this._activeProtocol="",this._activeEncoding="",this._lastEvent=null,this._onProtocolChange=this.register(new _.EventEmitter),this.onProtocolChange=this._onProtocolChange.event;for(const m of Object.keys(w))this.addProtocol(m,w[m]);for(const m of Object.keys(l))this.addEncoding(m,l[m]);this.reset()}addProtocol(o,p){this._protocols[o]=p}addEncoding(o,p){this._encodings[o]=p}get activeProtocol(){return this._activeProtocol}get areMouseEventsActive(){return this._protocols[this._activeProtocol].events!==0}set activeProtocol(o){if(!this._protocols[o])throw new Error(`unknown protocol "${o}"`);this._activeProtocol=o,this._onProtocolChange.fire(this._protocols[o].events)}get activeEncoding(){return this._activeEncoding}set activeEncoding(o){if(!this._encodings[o])throw new Error(`unknown encoding "${o}"`);this._activeEncoding=o}reset(){this.activeProtocol="NONE",this.activeEncoding="DEFAULT",this._lastEvent=null}triggerMouseEvent(o){if(o.col<0||o.col>=this._bufferService.cols||o.row<0||o.row>=this._bufferService.rows||o.button===4&&o.action===32||o.button===3&&o.action!==32||o.button!==4&&(o.action===2||o.action===3)||(o.col++,o.row++,o.action===32&&this._lastEvent&&this._equalEvents(this._lastEvent,o,this._activeEncoding==="SGR_PIXELS"))||!this._protocols[this._activeProtocol].restrict(o))return!1;const p=this._encodings[this._activeEncoding](o);return p&&(this._activeEncoding==="DEFAULT"?this._coreService.triggerBinaryEvent(p):this._coreService.triggerDataEvent(p,!0)),this._lastEvent=o,!0}explainEvents(o){return{down:!!(1&o),up:!!(2&o),drag:!!(4&o),move:!!(8&o),wheel:!!(16&o)}}_equalEvents(o,p,m){if(m){if(o.x!==p.x||o.y!==p.y)return!1}else if(o.col!==p.col||o.row!==p.row)return!1;return o.button===p.button&&o.action===p.action&&o.ctrl===p.ctrl&&o.alt===p.alt&&o.shift===p.shift}};n.CoreMouseService=s=f([y(0,d.IBufferService),y(1,d.ICoreService)],s)},6975:function(g,n,u){var f=this&&this.__decorate||function(s,o,p,m){var x,E=arguments.length,v=E<3?o:m===null?m=Object.getOwnPropertyDescriptor(o,p):m;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")v=Reflect.decorate(s,o,p,m);else for(var k=s.length-1;k>=0;k--)(x=s[k])&&(v=(E<3?x(v):E>3?x(o,p,v):x(o,p))||v);return E>3&&v&&Object.defineProperty(o,p,v),v},y=this&&this.__param||function(s,o){return function(p,m){o(p,m,s)}};Object.defineProperty(n,"__esModule",{value:!0}),n.CoreService=void 0;const d=u(1439),_=u(8460),S=u(844),w=u(2585),C=Object.freeze({insertMode:!1}),a=Object.freeze({applicationCursorKeys:!1,applicationKeypad:!1,bracketedPasteMode:!1,origin:!1,reverseWraparound:!1,sendFocus:!1,wraparound:!0});let l=n.CoreService=class extends S.Disposable{constructor(s,o,p){super(),this._bufferService=s,this._logService=o,this._optionsService=p,this.isCursorInitialized=!1,this.isCursorHidden=!1,this._onData=this.register(new _.EventEmitter),this.onData=this._onData.event,this._onUserInput=this.register(new _.EventEmitter),this.onUserInput=this._onUserInput.event,this._onBinary=this.register(new _.EventEmitter),this.onBinary=this._onBinary.event,this._onRequestScrollToBottom=this.register(new _.EventEmitter),this.onRequestScrollToBottom=this._onRequestScrollToBottom.event,this.modes=(0,d.clone)(C),this.decPrivateModes=(0,d.clone)(a)}reset(){this.modes=(0,d.clone)(C),this.decPrivateModes=(0,d.clone)(a)}triggerDataEvent(s,o=!1){if(this._optionsService.rawOptions.disableStdin)return;const p=this._bufferService.buffer;o&&this._optionsService.rawOptions.scrollOnUserInput&&p.ybase!==p.ydisp&&this._onRequestScrollToBottom.fire(),o&&this._onUserInput.fire(),this._logService.debug(`sending data "${s}"`,()=>s.split("").map(m=>m.charCodeAt(0))),this._onData.fire(s)}triggerBinaryEvent(s){this._optionsService.rawOptions.disableStdin||(this._logService.debug(`sending binary "${s}"`,()=>s.split("").map(o=>o.charCodeAt(0))),this._onBinary.fire(s))}};n.CoreService=l=f([y(0,w.IBufferService),y(1,w.ILogService),y(2,w.IOptionsService)],l)},9074:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.DecorationService=void 0;const f=u(8055),y=u(8460),d=u(844),_=u(6106);let S=0,w=0;class C extends d.Disposable{get decorations(){return this._decorations.values()}constructor(){super(),this._decorations=new _.SortedList(s=>s==null?void 0:s.marker.line),this._onDecorationRegistered=this.register(new y.EventEmitter),this.onDecorationRegistered=this._onDecorationRegistered.event,this._onDecorationRemoved=this.register(new y.EventEmitter),this.onDecorationRemoved=this._onDecorationRemoved.event,this.register((0,d.toDisposable)(()=>this.reset()))}registerDecoration(s){if(s.marker.isDisposed)return;const o=new a(s);if(o){const p=o.marker.onDispose(()=>o.dispose());o.onDispose(()=>{o&&(this._decorations.delete(o)&&this._onDecorationRemoved.fire(o),p.dispose())}),this._decorations.insert(o),this._onDecorationRegistered.fire(o)}return o}reset(){for(const s of this._decorations.values())s.dispose();this._decorations.clear()}*getDecorationsAtCell(s,o,p){var m,x,E;let v=0,k=0;for(const T of this._decorations.getKeyIterator(o))v=(m=T.options.x)!==null&&m!==void 0?m:0,k=v+((x=T.options.width)!==null&&x!==void 0?x:1),s>=v&&s<k&&(!p||((E=T.options.layer)!==null&&E!==void 0?E:"bottom")===p)&&(yield T)}forEachDecorationAtCell(s,o,p,m){this._decorations.forEachByKey(o,x=>{var E,v,k;S=(E=x.options.x)!==null&&E!==void 0?E:0,w=S+((v=x.options.width)!==null&&v!==void 0?v:1),s>=S&&s<w&&(!p||((k=x.options.layer)!==null&&k!==void 0?k:"bottom")===p)&&m(x)})}}n.DecorationService=C;class a extends d.Disposable{get isDisposed(){return this._isDisposed}get backgroundColorRGB(){return this._cachedBg===null&&(this.options.backgroundColor?this._cachedBg=f.css.toColor(this.options.backgroundColor):this._cachedBg=void 0),this._cachedBg}get foregroundColorRGB(){return this._cachedFg===null&&(this.options.foregroundColor?this._cachedFg=f.css.toColor(this.options.foregroundColor):this._cachedFg=void 0),this._cachedFg}constructor(s){super(),this.options=s,this.onRenderEmitter=this.register(new y.EventEmitter),this.onRender=this.onRenderEmitter.event,this._onDispose=this.register(new y.EventEmitter),this.onDispose=this._onDispose.event,this._cachedBg=null,this._cachedFg=null,this.marker=s.marker,this.options.overviewRulerOptions&&!this.options.overviewRulerOptions.position&&(this.options.overviewRulerOptions.position="full")}dispose(){this._onDispose.fire(),super.dispose()}}},4348:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.InstantiationService=n.ServiceCollection=void 0;const f=u(2585),y=u(8343);class d{constructor(...S){this._entries=new Map;for(const[w,C]of S)this.set(w,C)}set(S,w){const C=this._entries.get(S);return this._entries.set(S,w),C}forEach(S){for(const[w,C]of this._entries.entries())S(w,C)}has(S){return this._entries.has(S)}get(S){return this._entries.get(S)}}n.ServiceCollection=d,n.InstantiationService=class{constructor(){this._services=new d,this._services.set(f.IInstantiationService,this)}setService(_,S){this._services.set(_,S)}getService(_){return this._services.get(_)}createInstance(_,...S){const w=(0,y.getServiceDependencies)(_).sort((l,s)=>l.index-s.index),C=[];for(const l of w){const s=this._services.get(l.id);if(!s)throw new Error(`[createInstance] ${_.name} depends on UNKNOWN service ${l.id}.`);C.push(s)}const a=w.length>0?w[0].index:S.length;if(S.length!==a)throw new Error(`[createInstance] First service dependency of ${_.name} at position ${a+1} conflicts with ${S.length} static arguments`);return new _(...S,...C)}}},7866:function(g,n,u){var f=this&&this.__decorate||function(a,l,s,o){var p,m=arguments.length,x=m<3?l:o===null?o=Object.getOwnPropertyDescriptor(l,s):o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")x=Reflect.decorate(a,l,s,o);else for(var E=a.length-1;E>=0;E--)(p=a[E])&&(x=(m<3?p(x):m>3?p(l,s,x):p(l,s))||x);return m>3&&x&&Object.defineProperty(l,s,x),x},y=this&&this.__param||function(a,l){return function(s,o){l(s,o,a)}};Object.defineProperty(n,"__esModule",{value:!0}),n.traceCall=n.setTraceLogger=n.LogService=void 0;const d=u(844),_=u(2585),S={trace:_.LogLevelEnum.TRACE,debug:_.LogLevelEnum.DEBUG,info:_.LogLevelEnum.INFO,warn:_.LogLevelEnum.WARN,error:_.LogLevelEnum.ERROR,off:_.LogLevelEnum.OFF};let w,C=n.LogService=class extends d.Disposable{get logLevel(){return this._logLevel}constructor(a){super(),this._optionsService=a,this._logLevel=_.LogLevelEnum.OFF,this._updateLogLevel(),this.register(this._optionsService.onSpecificOptionChange("logLevel",()=>this._updateLogLevel())),w=this}_updateLogLevel(){this._logLevel=S[this._optionsService.rawOptions.logLevel]}_evalLazyOptionalParams(a){for(let l=0;l<a.length;l++)typeof a[l]=="function"&&(a[l]=a[l]())}_log(a,l,s){this._evalLazyOptionalParams(s),a.call(console,(this._optionsService.options.logger?"":"xterm.js: ")+l,...s)}trace(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.TRACE&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.trace.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.log,a,l)}debug(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.DEBUG&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.debug.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.log,a,l)}info(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.INFO&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.info.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.info,a,l)}warn(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.WARN&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.warn.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.warn,a,l)}error(a,...l){var s,o;this._logLevel<=_.LogLevelEnum.ERROR&&this._log((o=(s=this._optionsService.options.logger)===null||s===void 0?void 0:s.error.bind(this._optionsService.options.logger))!==null&&o!==void 0?o:console.error,a,l)}};n.LogService=C=f([y(0,_.IOptionsService)],C),n.setTraceLogger=function(a){w=a},n.traceCall=function(a,l,s){if(typeof s.value!="function")throw new Error("not supported");const o=s.value;s.value=function(...p){if(w.logLevel!==_.LogLevelEnum.TRACE)return o.apply(this,p);w.trace(`GlyphRenderer#${o.name}(${p.map(x=>JSON.stringify(x)).join(", ")})`);const m=o.apply(this,p);return w.trace(`GlyphRenderer#${o.name} return`,m),m}}},7302:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.OptionsService=n.DEFAULT_OPTIONS=void 0;const f=u(8460),y=u(844),d=u(6114);n.DEFAULT_OPTIONS={cols:80,rows:24,cursorBlink:!1,cursorStyle:"block",cursorWidth:1,cursorInactiveStyle:"outline",customGlyphs:!0,drawBoldTextInBrightColors:!0,fastScrollModifier:"alt",fastScrollSensitivity:5,fontFamily:"courier-new, courier, monospace",fontSize:15,fontWeight:"normal",fontWeightBold:"bold",ignoreBracketedPasteMode:!1,lineHeight:1,letterSpacing:0,linkHandler:null,logLevel:"info",logger:null,scrollback:1e3,scrollOnUserInput:!0,scrollSensitivity:1,screenReaderMode:!1,smoothScrollDuration:0,macOptionIsMeta:!1,macOptionClickForcesSelection:!1,minimumContrastRatio:1,disableStdin:!1,allowProposedApi:!1,allowTransparency:!1,tabStopWidth:8,theme:{},rightClickSelectsWord:d.isMac,windowOptions:{},windowsMode:!1,windowsPty:{},wordSeparator:" ()[]{}',\"`",altClickMovesCursor:!0,convertEol:!1,termName:"xterm",cancelEvents:!1,overviewRulerWidth:0};const _=["normal","bold","100","200","300","400","500","600","700","800","900"];class S extends y.Disposable{constructor(C){super(),this._onOptionChange=this.register(new f.EventEmitter),this.onOptionChange=this._onOptionChange.event;const a=Object.assign({},n.DEFAULT_OPTIONS);for(const l in C)if(l in a)try{const s=C[l];a[l]=this._sanitizeAndValidateOption(l,s)}catch(s){console.error(s)}this.rawOptions=a,this.options=Object.assign({},a),this._setupOptions()}onSpecificOptionChange(C,a){return this.onOptionChange(l=>{l===C&&a(this.rawOptions[C])})}onMultipleOptionChange(C,a){return this.onOptionChange(l=>{C.indexOf(l)!==-1&&a()})}_setupOptions(){const C=l=>{if(!(l in n.DEFAULT_OPTIONS))throw new Error(`No option with key "${l}"`);return this.rawOptions[l]},a=(l,s)=>{if(!(l in n.DEFAULT_OPTIONS))throw new Error(`No option with key "${l}"`);s=this._sanitizeAndValidateOption(l,s),this.rawOptions[l]!==s&&(this.rawOptions[l]=s,this._onOptionChange.fire(l))};for(const l in this.rawOptions){const s={get:C.bind(this,l),set:a.bind(this,l)};Object.defineProperty(this.options,l,s)}}_sanitizeAndValidateOption(C,a){switch(C){case"cursorStyle":if(a||(a=n.DEFAULT_OPTIONS[C]),!function(l){return l==="block"||l==="underline"||l==="bar"}(a))throw new Error(`"${a}" is not a valid value for ${C}`);break;case"wordSeparator":a||(a=n.DEFAULT_OPTIONS[C]);break;case"fontWeight":case"fontWeightBold":if(typeof a=="number"&&1<=a&&a<=1e3)break;a=_.includes(a)?a:n.DEFAULT_OPTIONS[C];break;case"cursorWidth":a=Math.floor(a);case"lineHeight":case"tabStopWidth":if(a<1)throw new Error(`${C} cannot be less than 1, value: ${a}`);break;case"minimumContrastRatio":a=Math.max(1,Math.min(21,Math.round(10*a)/10));break;case"scrollback":if((a=Math.min(a,4294967295))<0)throw new Error(`${C} cannot be less than 0, value: ${a}`);break;case"fastScrollSensitivity":case"scrollSensitivity":if(a<=0)throw new Error(`${C} cannot be less than or equal to 0, value: ${a}`);break;case"rows":case"cols":if(!a&&a!==0)throw new Error(`${C} must be numeric, value: ${a}`);break;case"windowsPty":a=a??{}}return a}}n.OptionsService=S},2660:function(g,n,u){var f=this&&this.__decorate||function(S,w,C,a){var l,s=arguments.length,o=s<3?w:a===null?a=Object.getOwnPropertyDescriptor(w,C):a;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")o=Reflect.decorate(S,w,C,a);else for(var p=S.length-1;p>=0;p--)(l=S[p])&&(o=(s<3?l(o):s>3?l(w,C,o):l(w,C))||o);return s>3&&o&&Object.defineProperty(w,C,o),o},y=this&&this.__param||function(S,w){return function(C,a){w(C,a,S)}};Object.defineProperty(n,"__esModule",{value:!0}),n.OscLinkService=void 0;const d=u(2585);let _=n.OscLinkService=class{constructor(S){this._bufferService=S,this._nextId=1,this._entriesWithId=new Map,this._dataByLinkId=new Map}registerLink(S){const w=this._bufferService.buffer;if(S.id===void 0){const p=w.addMarker(w.ybase+w.y),m={data:S,id:this._nextId++,lines:[p]};return p.onDispose(()=>this._removeMarkerFromLink(m,p)),this._dataByLinkId.set(m.id,m),m.id}const C=S,a=this._getEntryIdKey(C),l=this._entriesWithId.get(a);if(l)return this.addLineToLink(l.id,w.ybase+w.y),l.id;const s=w.addMarker(w.ybase+w.y),o={id:this._nextId++,key:this._getEntryIdKey(C),data:C,lines:[s]};return s.onDispose(()=>this._removeMarkerFromLink(o,s)),this._entriesWithId.set(o.key,o),this._dataByLinkId.set(o.id,o),o.id}addLineToLink(S,w){const C=this._dataByLinkId.get(S);if(C&&C.lines.every(a=>a.line!==w)){const a=this._bufferService.buffer.addMarker(w);C.lines.push(a),a.onDispose(()=>this._removeMarkerFromLink(C,a))}}getLinkData(S){var w;return(w=this._dataByLinkId.get(S))===null||w===void 0?void 0:w.data}_getEntryIdKey(S){return`${S.id};;${S.uri}`}_removeMarkerFromLink(S,w){const C=S.lines.indexOf(w);C!==-1&&(S.lines.splice(C,1),S.lines.length===0&&(S.data.id!==void 0&&this._entriesWithId.delete(S.key),this._dataByLinkId.delete(S.id)))}};n.OscLinkService=_=f([y(0,d.IBufferService)],_)},8343:(g,n)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.createDecorator=n.getServiceDependencies=n.serviceRegistry=void 0;const u="di$target",f="di$dependencies";n.serviceRegistry=new Map,n.getServiceDependencies=function(y){return y[f]||[]},n.createDecorator=function(y){if(n.serviceRegistry.has(y))return n.serviceRegistry.get(y);const d=function(_,S,w){if(arguments.length!==3)throw new Error("@IServiceName-decorator can only be used to decorate a parameter");(function(C,a,l){a[u]===a?a[f].push({id:C,index:l}):(a[f]=[{id:C,index:l}],a[u]=a)})(d,_,w)};return d.toString=()=>y,n.serviceRegistry.set(y,d),d}},2585:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.IDecorationService=n.IUnicodeService=n.IOscLinkService=n.IOptionsService=n.ILogService=n.LogLevelEnum=n.IInstantiationService=n.ICharsetService=n.ICoreService=n.ICoreMouseService=n.IBufferService=void 0;const f=u(8343);var y;n.IBufferService=(0,f.createDecorator)("BufferService"),n.ICoreMouseService=(0,f.createDecorator)("CoreMouseService"),n.ICoreService=(0,f.createDecorator)("CoreService"),n.ICharsetService=(0,f.createDecorator)("CharsetService"),n.IInstantiationService=(0,f.createDecorator)("InstantiationService"),function(d){d[d.TRACE=0]="TRACE",d[d.DEBUG=1]="DEBUG",d[d.INFO=2]="INFO",d[d.WARN=3]="WARN",d[d.ERROR=4]="ERROR",d[d.OFF=5]="OFF"}(y||(n.LogLevelEnum=y={})),n.ILogService=(0,f.createDecorator)("LogService"),n.IOptionsService=(0,f.createDecorator)("OptionsService"),n.IOscLinkService=(0,f.createDecorator)("OscLinkService"),n.IUnicodeService=(0,f.createDecorator)("UnicodeService"),n.IDecorationService=(0,f.createDecorator)("DecorationService")},1480:(g,n,u)=>{Object.defineProperty(n,"__esModule",{value:!0}),n.UnicodeService=void 0;const f=u(8460),y=u(225);n.UnicodeService=class{constructor(){this._providers=Object.create(null),this._active="",this._onChange=new f.EventEmitter,this.onChange=this._onChange.event;const d=new y.UnicodeV6;this.register(d),this._active=d.version,this._activeProvider=d}dispose(){this._onChange.dispose()}get versions(){return Object.keys(this._providers)}get activeVersion(){return this._active}set activeVersion(d){if(!this._providers[d])throw new Error(`unknown Unicode version "${d}"`);this._active=d,this._activeProvider=this._providers[d],this._onChange.fire(d)}register(d){this._providers[d.version]=d}wcwidth(d){return this._activeProvider.wcwidth(d)}getStringCellWidth(d){let _=0;const S=d.length;for(let w=0;w<S;++w){let C=d.charCodeAt(w);if(55296<=C&&C<=56319){if(++w>=S)return _+this.wcwidth(C);const a=d.charCodeAt(w);56320<=a&&a<=57343?C=1024*(C-55296)+a-56320+65536:_+=this.wcwidth(a)}_+=this.wcwidth(C)}return _}}}},i={};function c(g){var n=i[g];if(n!==void 0)return n.exports;var u=i[g]={exports:{}};return r[g].call(u.exports,u,u.exports,c),u.exports}var h={};return(()=>{var g=h;Object.defineProperty(g,"__esModule",{value:!0}),g.Terminal=void 0;const n=c(9042),u=c(3236),f=c(844),y=c(5741),d=c(8285),_=c(7975),S=c(7090),w=["cols","rows"];class C extends f.Disposable{constructor(l){super(),this._core=this.register(new u.Terminal(l)),this._addonManager=this.register(new y.AddonManager),this._publicOptions=Object.assign({},this._core.options);const s=p=>this._core.options[p],o=(p,m)=>{this._checkReadonlyOptions(p),this._core.options[p]=m};for(const p in this._core.options){const m={get:s.bind(this,p),set:o.bind(this,p)};Object.defineProperty(this._publicOptions,p,m)}}_checkReadonlyOptions(l){if(w.includes(l))throw new Error(`Option "${l}" can only be set in the constructor`)}_checkProposedApi(){if(!this._core.optionsService.rawOptions.allowProposedApi)throw new Error("You must set the allowProposedApi option to true to use proposed API")}get onBell(){return this._core.onBell}get onBinary(){return this._core.onBinary}get onCursorMove(){return this._core.onCursorMove}get onData(){return this._core.onData}get onKey(){return this._core.onKey}get onLineFeed(){return this._core.onLineFeed}get onRender(){return this._core.onRender}get onResize(){return this._core.onResize}get onScroll(){return this._core.onScroll}get onSelectionChange(){return this._core.onSelectionChange}get onTitleChange(){return this._core.onTitleChange}get onWriteParsed(){return this._core.onWriteParsed}get element(){return this._core.element}get parser(){return this._parser||(this._parser=new _.ParserApi(this._core)),this._parser}get unicode(){return this._checkProposedApi(),new S.UnicodeApi(this._core)}get textarea(){return this._core.textarea}get rows(){return this._core.rows}get cols(){return this._core.cols}get buffer(){return this._buffer||(this._buffer=this.register(new d.BufferNamespaceApi(this._core))),this._buffer}get markers(){return this._checkProposedApi(),this._core.markers}get modes(){const l=this._core.coreService.decPrivateModes;let s="none";switch(this._core.coreMouseService.activeProtocol){case"X10":s="x10";break;case"VT200":s="vt200";break;case"DRAG":s="drag";break;case"ANY":s="any"}return{applicationCursorKeysMode:l.applicationCursorKeys,applicationKeypadMode:l.applicationKeypad,bracketedPasteMode:l.bracketedPasteMode,insertMode:this._core.coreService.modes.insertMode,mouseTrackingMode:s,originMode:l.origin,reverseWraparoundMode:l.reverseWraparound,sendFocusMode:l.sendFocus,wraparoundMode:l.wraparound}}get options(){return this._publicOptions}set options(l){for(const s in l)this._publicOptions[s]=l[s]}blur(){this._core.blur()}focus(){this._core.focus()}resize(l,s){this._verifyIntegers(l,s),this._core.resize(l,s)}open(l){this._core.open(l)}attachCustomKeyEventHandler(l){this._core.attachCustomKeyEventHandler(l)}registerLinkProvider(l){return this._core.registerLinkProvider(l)}registerCharacterJoiner(l){return this._checkProposedApi(),this._core.registerCharacterJoiner(l)}deregisterCharacterJoiner(l){this._checkProposedApi(),this._core.deregisterCharacterJoiner(l)}registerMarker(l=0){return this._verifyIntegers(l),this._core.registerMarker(l)}registerDecoration(l){var s,o,p;return this._checkProposedApi(),this._verifyPositiveIntegers((s=l.x)!==null&&s!==void 0?s:0,(o=l.width)!==null&&o!==void 0?o:0,(p=l.height)!==null&&p!==void 0?p:0),this._core.registerDecoration(l)}hasSelection(){return this._core.hasSelection()}select(l,s,o){this._verifyIntegers(l,s,o),this._core.select(l,s,o)}getSelection(){return this._core.getSelection()}getSelectionPosition(){return this._core.getSelectionPosition()}clearSelection(){this._core.clearSelection()}selectAll(){this._core.selectAll()}selectLines(l,s){this._verifyIntegers(l,s),this._core.selectLines(l,s)}dispose(){super.dispose()}scrollLines(l){this._verifyIntegers(l),this._core.scrollLines(l)}scrollPages(l){this._verifyIntegers(l),this._core.scrollPages(l)}scrollToTop(){this._core.scrollToTop()}scrollToBottom(){this._core.scrollToBottom()}scrollToLine(l){this._verifyIntegers(l),this._core.scrollToLine(l)}clear(){this._core.clear()}write(l,s){this._core.write(l,s)}writeln(l,s){this._core.write(l),this._core.write(`\r
-`,s)}paste(l){this._core.paste(l)}refresh(l,s){this._verifyIntegers(l,s),this._core.refresh(l,s)}reset(){this._core.reset()}clearTextureAtlas(){this._core.clearTextureAtlas()}loadAddon(l){this._addonManager.loadAddon(this,l)}static get strings(){return n}_verifyIntegers(...l){for(const s of l)if(s===1/0||isNaN(s)||s%1!=0)throw new Error("This API only accepts integers")}_verifyPositiveIntegers(...l){for(const s of l)if(s&&(s===1/0||isNaN(s)||s%1!=0||s<0))throw new Error("This API only accepts positive integers")}}g.Terminal=C})(),h})())})(sh);var Up=sh.exports,oh={exports:{}};(function(e,t){(function(r,i){e.exports=i()})(self,()=>(()=>{var r={};return(()=>{var i=r;Object.defineProperty(i,"__esModule",{value:!0}),i.FitAddon=void 0,i.FitAddon=class{activate(c){this._terminal=c}dispose(){}fit(){const c=this.proposeDimensions();if(!c||!this._terminal||isNaN(c.cols)||isNaN(c.rows))return;const h=this._terminal._core;this._terminal.rows===c.rows&&this._terminal.cols===c.cols||(h._renderService.clear(),this._terminal.resize(c.cols,c.rows))}proposeDimensions(){if(!this._terminal||!this._terminal.element||!this._terminal.element.parentElement)return;const c=this._terminal._core,h=c._renderService.dimensions;if(h.css.cell.width===0||h.css.cell.height===0)return;const g=this._terminal.options.scrollback===0?0:c.viewport.scrollBarWidth,n=window.getComputedStyle(this._terminal.element.parentElement),u=parseInt(n.getPropertyValue("height")),f=Math.max(0,parseInt(n.getPropertyValue("width"))),y=window.getComputedStyle(this._terminal.element),d=u-(parseInt(y.getPropertyValue("padding-top"))+parseInt(y.getPropertyValue("padding-bottom"))),_=f-(parseInt(y.getPropertyValue("padding-right"))+parseInt(y.getPropertyValue("padding-left")))-g;return{cols:Math.max(2,Math.floor(_/h.css.cell.width)),rows:Math.max(1,Math.floor(d/h.css.cell.height))}}}})(),r})())})(oh);var $p=oh.exports;const Vp={background:"#282a36",foreground:"#f8f8f2",cursor:"#f8f8f2",cursorAccent:"#282a36",selection:"rgba(68, 71, 90, 0.5)",black:"#21222c",red:"#ff5555",green:"#50fa7b",yellow:"#f1fa8c",blue:"#bd93f9",magenta:"#ff79c6",cyan:"#8be9fd",white:"#f8f8f2",brightBlack:"#6272a4",brightRed:"#ff6e6e",brightGreen:"#69ff94",brightYellow:"#ffffa5",brightBlue:"#d6acff",brightMagenta:"#ff92df",brightCyan:"#a4ffff",brightWhite:"#ffffff",ui:{bg:"#282a36",bgSecondary:"#21222c",bgTertiary:"#44475a",border:"#2f3142",text:"#f8f8f2",textSecondary:"#6272a4",accent:"#bd93f9",iconColor:"#f8f8f2"}},Kp={background:"#272822",foreground:"#f8f8f2",cursor:"#f8f8f0",cursorAccent:"#272822",selection:"rgba(73, 72, 62, 0.5)",black:"#272822",red:"#f92672",green:"#a6e22e",yellow:"#f4bf75",blue:"#66d9ef",magenta:"#ae81ff",cyan:"#a1efe4",white:"#f8f8f2",brightBlack:"#75715e",brightRed:"#f92672",brightGreen:"#a6e22e",brightYellow:"#f4bf75",brightBlue:"#66d9ef",brightMagenta:"#ae81ff",brightCyan:"#a1efe4",brightWhite:"#f9f8f5",ui:{bg:"#272822",bgSecondary:"#1e1f1c",bgTertiary:"#49483e",border:"#32332b",text:"#f8f8f2",textSecondary:"#75715e",accent:"#66d9ef",iconColor:"#f8f8f2"}},qp={background:"#002b36",foreground:"#839496",cursor:"#839496",cursorAccent:"#002b36",selection:"rgba(7, 54, 66, 0.5)",black:"#073642",red:"#dc322f",green:"#859900",yellow:"#b58900",blue:"#268bd2",magenta:"#d33682",cyan:"#2aa198",white:"#eee8d5",brightBlack:"#002b36",brightRed:"#cb4b16",brightGreen:"#586e75",brightYellow:"#657b83",brightBlue:"#839496",brightMagenta:"#6c71c4",brightCyan:"#93a1a1",brightWhite:"#fdf6e3",ui:{bg:"#002b36",bgSecondary:"#073642",bgTertiary:"#0d4450",border:"#0a3c47",text:"#93a1a1",textSecondary:"#839496",accent:"#268bd2",iconColor:"#93a1a1"}},Gp={background:"#0d1117",foreground:"#c9d1d9",cursor:"#c9d1d9",cursorAccent:"#0d1117",selection:"rgba(56, 139, 253, 0.3)",black:"#484f58",red:"#ff7b72",green:"#3fb950",yellow:"#d29922",blue:"#58a6ff",magenta:"#bc8cff",cyan:"#39c5cf",white:"#b1bac4",brightBlack:"#6e7681",brightRed:"#ffa198",brightGreen:"#56d364",brightYellow:"#e3b341",brightBlue:"#79c0ff",brightMagenta:"#d2a8ff",brightCyan:"#56d4dd",brightWhite:"#f0f6fc",ui:{bg:"#0d1117",bgSecondary:"#010409",bgTertiary:"#21262d",border:"#181b20",text:"#e6edf3",textSecondary:"#7d8590",accent:"#58a6ff",iconColor:"#e6edf3"}},Xp={background:"#1e1e2e",foreground:"#cdd6f4",cursor:"#f5e0dc",cursorAccent:"#1e1e2e",selection:"rgba(116, 199, 236, 0.3)",black:"#45475a",red:"#f38ba8",green:"#a6e3a1",yellow:"#f9e2af",blue:"#89b4fa",magenta:"#f5c2e7",cyan:"#94e2d5",white:"#bac2de",brightBlack:"#585b70",brightRed:"#f38ba8",brightGreen:"#a6e3a1",brightYellow:"#f9e2af",brightBlue:"#89b4fa",brightMagenta:"#f5c2e7",brightCyan:"#94e2d5",brightWhite:"#a6adc8",ui:{bg:"#1e1e2e",bgSecondary:"#181825",bgTertiary:"#313244",border:"#25263a",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa",iconColor:"#cdd6f4"}},Dt={catppuccin:Xp,dracula:Vp,monokai:Kp,solarizedDark:qp,github:Gp},Yp=Object.keys(Dt),Qp=(e,t={})=>{const{autoScroll:r="smart",sensitivity:i=.8,smoothScroll:c=!0}=t,h=U.useRef(!1),g=U.useRef(0),n=U.useRef(null),u=U.useCallback(()=>{if(!e.current)return!1;const{scrollTop:S,scrollHeight:w,clientHeight:C}=e.current,a=w-C;if(a===0)return!0;const l=a*(1-i*.2);return S>=l},[e,i]),f=U.useCallback(()=>{if(!e.current)return;const{scrollHeight:S,clientHeight:w}=e.current;c?e.current.scrollTo({top:S-w,behavior:"smooth"}):e.current.scrollTop=S-w},[e,c]),y=U.useCallback(()=>{if(!e.current)return;const S=Date.now();S-g.current<100||(g.current=S,u()?h.current=!1:h.current=!0,n.current&&clearTimeout(n.current),n.current=setTimeout(()=>{u()&&(h.current=!1)},500))},[e,u]),d=U.useCallback(()=>{if(r!=="never"){if(r==="always"){setTimeout(f,10);return}h.current||setTimeout(f,10)}},[r,f]),_=U.useCallback(()=>{h.current=!1,f()},[f]);return{handleUserScroll:y,handleNewData:d,forceScrollToBottom:_,isNearBottom:u}},za={en:{appName:"Terminal List",session:"Session",newSession:"New Session",settings:"Settings",connecting:"Connecting...",connected:"Terminal Connected",disconnected:"Connection Lost",connectionError:"Connection Error",settingsTitle:"Settings",theme:"Theme",language:"Language",fontSize:"Font Size",fontFamily:"Font Family",scrollBehavior:"Scroll Behavior",autoScroll:"Auto Scroll",smoothScroll:"Smooth Scroll",save:"Save",cancel:"Cancel",reset:"Reset to Default",themeCatppuccin:"Catppuccin",themeDracula:"Dracula",themeMonokai:"Monokai",themeSolarizedDark:"Solarized Dark",themeGithub:"GitHub Dark",languageEnglish:"English",languageKorean:"한국어",paste:"Paste",commandInput:"Command Input",commandInputPlaceholder:"Enter command... (Ctrl+Enter to send)",commandInputHint:"💡 Enter for new line, Ctrl+Enter to send",send:"Send",clear:"Clear",clearInput:"Clear input",confirmClearInput:"Are you sure you want to clear all input?",settingsSaved:"Settings saved successfully",sessionCreated:"New session created",confirmNewSession:"Create a new session? Current session will continue in background.",confirm:"Confirm",close:"Close",closeTerminal:"Close Terminal",confirmCloseTerminal:"Are you sure you want to close this terminal? All unsaved work will be lost.",cannotCloseLastSession:"Cannot close the last terminal. Create a new one first.",sessions:"Sessions",closeSidebar:"Close sidebar",closeTerminal:"Close terminal",resizeSidebar:"Resize sidebar",activeTerminals:"Active Terminals",noTerminals:"No terminals open",createFirstTerminal:"Click + to create a new terminal",clipboardError:"Clipboard access denied",networkError:"Network error occurred",loading:"Loading...",logout:"Logout",confirmLogout:"Confirm Logout",logoutMessage:"Are you sure you want to logout?",user:"User",initialSetup:"Initial Setup",initialSetupDescription:"Create an administrator account to get started. You will need these credentials to access the terminal.",username:"Username",password:"Password",confirmPassword:"Confirm Password",usernamePlaceholder:"Enter username",passwordPlaceholder:"Enter password (min 8 characters)",confirmPasswordPlaceholder:"Re-enter password",createAccount:"Create Administrator",creating:"Creating...",setupFooter:"This account will have full access to all terminals and settings.",usernameMinLength:"Username must be at least 3 characters",passwordMinLength:"Password must be at least 8 characters",passwordMismatch:"Passwords do not match",login:"Sign In",loginDescription:"Enter your administrator credentials",signIn:"Sign In",signingIn:"Signing in...",fillAllFields:"Please fill in all fields"},ko:{appName:"Terminal List",session:"세션",newSession:"새로운 세션",settings:"설정",connecting:"연결 중...",connected:"터미널 연결됨",disconnected:"연결이 끊어졌습니다",connectionError:"연결 오류",settingsTitle:"설정",theme:"테마",language:"언어",fontSize:"글꼴 크기",fontFamily:"글꼴",scrollBehavior:"스크롤 동작",autoScroll:"자동 스크롤",smoothScroll:"부드러운 스크롤",save:"저장",cancel:"취소",reset:"기본값으로 재설정",themeCatppuccin:"Catppuccin",themeDracula:"Dracula",themeMonokai:"Monokai",themeSolarizedDark:"Solarized Dark",themeGithub:"GitHub Dark",languageEnglish:"English",languageKorean:"한국어",paste:"붙여넣기",commandInput:"명령어 입력",commandInputPlaceholder:"명령어를 입력하세요... (Ctrl+Enter로 전송)",commandInputHint:"💡 Enter로 줄바꿈, Ctrl+Enter로 전송",send:"전송",clear:"지우기",clearInput:"내용 지우기",confirmClearInput:"입력한 내용을 모두 지우시겠습니까?",settingsSaved:"설정이 저장되었습니다",sessionCreated:"새 세션이 생성되었습니다",confirmNewSession:"새 세션을 만드시겠습니까? 현재 세션은 백그라운드에서 계속됩니다.",confirm:"확인",close:"닫기",closeTerminal:"터미널 종료",confirmCloseTerminal:"이 터미널을 닫으시겠습니까? 저장되지 않은 모든 작업이 손실됩니다.",cannotCloseLastSession:"마지막 터미널은 닫을 수 없습니다. 먼저 새 터미널을 생성하세요.",sessions:"세션 목록",closeSidebar:"사이드바 닫기",closeTerminal:"터미널 종료",resizeSidebar:"사이드바 크기 조정",activeTerminals:"활성 터미널",noTerminals:"열려있는 터미널이 없습니다",createFirstTerminal:"+ 버튼을 눌러 새 터미널을 만드세요",clipboardError:"클립보드 접근 권한이 필요합니다",networkError:"네트워크 오류가 발생했습니다",loading:"로딩 중...",logout:"로그아웃",confirmLogout:"로그아웃 확인",logoutMessage:"로그아웃 하시겠습니까?",user:"사용자",initialSetup:"초기 설정",initialSetupDescription:"시작하려면 관리자 계정을 생성하세요. 터미널에 접근하려면 이 자격 증명이 필요합니다.",username:"사용자명",password:"비밀번호",confirmPassword:"비밀번호 확인",usernamePlaceholder:"사용자명을 입력하세요",passwordPlaceholder:"비밀번호를 입력하세요 (최소 8자)",confirmPasswordPlaceholder:"비밀번호를 다시 입력하세요",createAccount:"관리자 생성",creating:"생성 중...",setupFooter:"이 계정은 모든 터미널과 설정에 대한 전체 액세스 권한을 갖습니다.",usernameMinLength:"사용자명은 최소 3자 이상이어야 합니다",passwordMinLength:"비밀번호는 최소 8자 이상이어야 합니다",passwordMismatch:"비밀번호가 일치하지 않습니다",login:"로그인",loginDescription:"관리자 자격 증명을 입력하세요",signIn:"로그인",signingIn:"로그인 중...",fillAllFields:"모든 필드를 입력해주세요"}},Jp="en",Sr=e=>({t:U.useMemo(()=>{const r=za[e]||za[Jp];return(i,c=i)=>r[i]||c},[e])}),Zp=({sessionId:e,settings:t,onSendData:r,isActive:i=!0})=>{var o;const c=U.useRef(null),h=U.useRef(null),g=U.useRef(null),n=U.useRef(null),u=U.useRef(null),[f,y]=U.useState(!1),{t:d}=Sr(t.language),{handleUserScroll:_,handleNewData:S}=Qp(c,{autoScroll:t.autoScroll,sensitivity:t.scrollSensitivity,smoothScroll:t.smoothScroll}),w=Dt[t.theme]||Dt.catppuccin;U.useEffect(()=>{if(!c.current)return;y(!1);const p=new Up.Terminal({theme:w,fontFamily:'"JetBrains Mono", monospace',fontSize:t.fontSize,lineHeight:1.2,letterSpacing:0,cursorBlink:!0,cursorStyle:"block",allowTransparency:!1,scrollback:1e4,convertEol:!0,screenReaderMode:!1,smoothScrollDuration:t.smoothScroll?50:0,disableStdin:!1,windowOptions:{setWinLines:!0},fastScrollModifier:"shift",fastScrollSensitivity:5,scrollSensitivity:3,rendererType:"canvas",drawBoldTextInBrightColors:!1}),m=new $p.FitAddon;p.loadAddon(m),p.open(c.current),p.reset(),h.current=p,g.current=m;try{m.fit(),p.focus()}catch(H){console.error("Initial fit error:",H)}setTimeout(()=>{try{m.fit()}catch(H){console.error("Fit error:",H)}},50);const x=new ResizeObserver(()=>{try{m.fit(),console.log(`Terminal resized: ${p.cols}x${p.rows}`)}catch(H){console.error("Immediate fit error:",H)}u.current&&clearTimeout(u.current),u.current=setTimeout(()=>{if(n.current&&n.current.readyState===WebSocket.OPEN){const H=localStorage.getItem("auth_token");fetch(`/api/sessions/${e}/resize`,{method:"POST",headers:{"Content-Type":"application/json",Authorization:H?`Bearer ${H}`:""},body:JSON.stringify({cols:p.cols,rows:p.rows})}).catch(W=>console.error("크기 변경 실패:",W))}},200)});x.observe(c.current);const E=window.location.protocol==="https:"?"wss:":"ws:",v=window.location.host||"localhost:8000",k=`${E}//${v}/ws/${e}?cols=${p.cols}&rows=${p.rows}`;console.log("WebSocket 연결 시도:",k,`(${p.cols}x${p.rows})`);const T=new WebSocket(k);n.current=T,T.onopen=()=>{console.log("WebSocket 연결됨:",e);try{m.fit()}catch(W){console.error("Fit error on connect:",W)}y(!0);const H=localStorage.getItem("auth_token");fetch(`/api/sessions/${e}/resize`,{method:"POST",headers:{"Content-Type":"application/json",Authorization:H?`Bearer ${H}`:""},body:JSON.stringify({cols:p.cols,rows:p.rows})}).catch(W=>console.error("초기 크기 설정 실패:",W))};let P=[],B=null;const I=()=>{P.length>0&&(p.write(P.join("")),P=[],S()),B=null};T.onmessage=H=>{P.push(H.data),B||(B=requestAnimationFrame(I))},T.onerror=H=>{console.error("WebSocket 에러:",H),p.writeln(`\x1B[1;31m✗ ${d("connectionError")}\x1B[0m`)},T.onclose=()=>{console.log("WebSocket 연결 종료"),p.writeln(`\x1B[1;33m⚠ ${d("disconnected")}\x1B[0m`)},p.onData(H=>{T.readyState===WebSocket.OPEN&&T.send(H),r&&r(H)});const F=c.current;return F&&F.addEventListener("scroll",_),()=>{B&&cancelAnimationFrame(B),x.disconnect(),u.current&&clearTimeout(u.current),F&&F.removeEventListener("scroll",_),T.readyState===WebSocket.OPEN&&T.close(),p.dispose()}},[e,_,S,d]),U.useEffect(()=>{if(!h.current)return;const p=h.current;p.options.theme=w,p.options.fontFamily='"JetBrains Mono", monospace',p.options.fontSize=t.fontSize,p.options.smoothScrollDuration=t.smoothScroll?50:0,p.refresh(0,p.rows-1)},[t.theme,t.fontFamily,t.fontSize,t.smoothScroll,w]),U.useEffect(()=>{if(!h.current)return;const p=h.current;p.options.cursorBlink=i},[i]);const C=U.useCallback(p=>{n.current&&n.current.readyState===WebSocket.OPEN&&n.current.send(p)},[]),a=U.useCallback(()=>h.current?h.current.getSelection():"",[]),l=U.useCallback(()=>{h.current&&h.current.scrollToBottom()},[]);U.useEffect(()=>(window.terminalSessions||(window.terminalSessions={}),window.terminalSessions[e]={sendData:C,getSelection:a,scrollToBottom:l},()=>{window.terminalSessions&&delete window.terminalSessions[e]}),[e,C,a,l]);const s=()=>{h.current&&h.current.focus()};return L.jsxs(L.Fragment,{children:[!f&&L.jsx("div",{style:{position:"absolute",top:0,left:0,right:0,bottom:0,backgroundColor:w.background,display:"flex",alignItems:"center",justifyContent:"center",zIndex:10},children:L.jsx("div",{style:{fontSize:"14px",color:((o=w.ui)==null?void 0:o.textSecondary)||"#6c7086"},children:d("connecting")})}),L.jsx("div",{ref:c,onClick:s,style:{width:"100%",height:"100%",overflow:"auto",backgroundColor:w.background,cursor:"text",boxSizing:"border-box",opacity:f?1:0,transition:"opacity 0.2s ease",caretColor:"transparent"}})]})},e_=U.memo(Zp),t_=e=>{U.useEffect(()=>{if(!window.visualViewport||!e.current)return;const t=()=>{const r=window.visualViewport.height,i=window.visualViewport.offsetTop,c=window.innerHeight-r-i;e.current.style.bottom=`${c}px`};return t(),window.visualViewport.addEventListener("resize",t),window.visualViewport.addEventListener("scroll",t),()=>{window.visualViewport.removeEventListener("resize",t),window.visualViewport.removeEventListener("scroll",t)}},[e])},r_=({onSendKey:e,isVisible:t,onClose:r,activeSessionId:i,onOpenCommandInput:c})=>{const h=U.useRef(null),g=U.useRef(null),[n,u]=U.useState(null),[f,y]=U.useState(!1),[d,_]=U.useState(!1);t_(h);const S=()=>{if(!g.current)return;const{scrollLeft:o,scrollWidth:p,clientWidth:m}=g.current;y(o>10),_(o<p-m-10)};U.useEffect(()=>{S();const o=g.current;if(o)return o.addEventListener("scroll",S),()=>o.removeEventListener("scroll",S)},[]),U.useEffect(()=>{const o=()=>S();return window.addEventListener("resize",o),()=>window.removeEventListener("resize",o)},[]);const w=()=>{g.current&&g.current.scrollBy({left:-150,behavior:"smooth"})},C=()=>{g.current&&g.current.scrollBy({left:150,behavior:"smooth"})},a=()=>{const o=prompt("Paste text here:");o&&e&&e(o)},l=()=>{e&&e("")},s=(o,p)=>{u(o),p(),setTimeout(()=>u(null),150)};return L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .mobile-toolbar-scroll::-webkit-scrollbar {
-          display: none;
-        }
-      `}),L.jsxs("div",{ref:h,style:{..._e.toolbar,transform:t?"translateY(0)":"translateY(100%)",opacity:t?1:0},children:[f&&L.jsx("button",{onClick:w,style:_e.scrollButton,"aria-label":"Scroll left",children:L.jsx(tp,{size:16,strokeWidth:2.5})}),L.jsx("div",{ref:g,className:"mobile-toolbar-scroll",style:_e.scrollContainer,onScroll:S,children:L.jsxs("div",{style:_e.buttonGroup,children:[L.jsx("button",{onTouchStart:()=>u("cmd"),onTouchEnd:o=>{o.preventDefault(),s("cmd",()=>c==null?void 0:c())},style:{..._e.button,..._e.primary,transform:n==="cmd"?"scale(0.9)":"scale(1)",opacity:n==="cmd"?.7:1},title:"명령어 입력 (한글 지원)",children:L.jsx(xp,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("esc"),onTouchEnd:o=>{o.preventDefault(),s("esc",()=>e("\x1B"))},style:{..._e.button,..._e.secondary,transform:n==="esc"?"scale(0.9)":"scale(1)",opacity:n==="esc"?.7:1},children:"ESC"}),L.jsx("button",{onTouchStart:()=>u("tab"),onTouchEnd:o=>{o.preventDefault(),s("tab",()=>e("	"))},style:{..._e.button,..._e.secondary,transform:n==="tab"?"scale(0.9)":"scale(1)",opacity:n==="tab"?.7:1},children:"TAB"}),L.jsx("button",{onTouchStart:()=>u("ctrlc"),onTouchEnd:o=>{o.preventDefault(),s("ctrlc",()=>e(""))},style:{..._e.button,..._e.warning,transform:n==="ctrlc"?"scale(0.9)":"scale(1)",opacity:n==="ctrlc"?.7:1},title:"Ctrl+C (Stop)",children:"^C"}),L.jsx("button",{onTouchStart:()=>u("up"),onTouchEnd:o=>{o.preventDefault(),s("up",()=>e("\x1B[A"))},style:{..._e.button,..._e.secondary,transform:n==="up"?"scale(0.9)":"scale(1)",opacity:n==="up"?.7:1},children:L.jsx(Xf,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("down"),onTouchEnd:o=>{o.preventDefault(),s("down",()=>e("\x1B[B"))},style:{..._e.button,..._e.secondary,transform:n==="down"?"scale(0.9)":"scale(1)",opacity:n==="down"?.7:1},children:L.jsx(Uf,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("left"),onTouchEnd:o=>{o.preventDefault(),s("left",()=>e("\x1B[D"))},style:{..._e.button,..._e.secondary,transform:n==="left"?"scale(0.9)":"scale(1)",opacity:n==="left"?.7:1},children:L.jsx(Vf,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("right"),onTouchEnd:o=>{o.preventDefault(),s("right",()=>e("\x1B[C"))},style:{..._e.button,..._e.secondary,transform:n==="right"?"scale(0.9)":"scale(1)",opacity:n==="right"?.7:1},children:L.jsx(qf,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("paste"),onTouchEnd:o=>{o.preventDefault(),s("paste",a)},style:{..._e.button,..._e.secondary,transform:n==="paste"?"scale(0.9)":"scale(1)",opacity:n==="paste"?.7:1},children:L.jsx(th,{size:13,strokeWidth:2})}),L.jsx("button",{onTouchStart:()=>u("clear"),onTouchEnd:o=>{o.preventDefault(),s("clear",l)},style:{..._e.button,..._e.clear,transform:n==="clear"?"scale(0.9)":"scale(1)",opacity:n==="clear"?.7:1},title:"Clear current line (Ctrl+U)",children:L.jsx(rh,{size:13,strokeWidth:2})})]})}),d&&L.jsx("button",{onClick:C,style:_e.scrollButton,"aria-label":"Scroll right",children:L.jsx(eh,{size:16,strokeWidth:2.5})})]})]})},_e={toolbar:{position:"fixed",left:0,right:0,bottom:0,backgroundColor:"transparent",padding:"4px",zIndex:9999,transition:"transform 0.2s ease, opacity 0.2s ease",display:"flex",alignItems:"center",gap:"4px"},scrollContainer:{flex:1,overflowX:"auto",overflowY:"hidden",WebkitOverflowScrolling:"touch",scrollbarWidth:"none",msOverflowStyle:"none",scrollSnapType:"x proximity",display:"flex",justifyContent:"center"},buttonGroup:{display:"flex",gap:"clamp(3px, 1vw, 6px)",alignItems:"center",flexWrap:"nowrap",padding:"0 4px"},scrollButton:{flexShrink:0,width:"32px",height:"32px",display:"flex",alignItems:"center",justifyContent:"center",backgroundColor:"rgba(24, 24, 37, 0.95)",backdropFilter:"blur(8px)",border:"none",borderRadius:"6px",color:"#cdd6f4",cursor:"pointer",boxShadow:"0 2px 8px rgba(0, 0, 0, 0.4)",transition:"all 0.15s ease",WebkitTapHighlightColor:"transparent"},button:{flex:"0 0 auto",padding:"clamp(4px, 1.5vw, 6px) clamp(6px, 2vw, 10px)",fontSize:"clamp(9px, 2.5vw, 11px)",fontWeight:"500",border:"none",borderRadius:"4px",cursor:"pointer",userSelect:"none",WebkitTapHighlightColor:"transparent",transition:"all 0.15s cubic-bezier(0.4, 0, 0.2, 1)",minWidth:"clamp(26px, 8vw, 32px)",minHeight:"clamp(26px, 8vw, 32px)",display:"flex",alignItems:"center",justifyContent:"center",boxShadow:"0 1px 3px rgba(0, 0, 0, 0.3)",willChange:"transform, opacity",scrollSnapAlign:"start"},primary:{backgroundColor:"#89b4fa",color:"#1e1e2e"},secondary:{backgroundColor:"#313244",color:"#cdd6f4"},warning:{backgroundColor:"#fab387",color:"#1e1e2e"},clear:{backgroundColor:"#94e2d5",color:"#1e1e2e"}},i_=({isOpen:e,onClose:t,onSend:r,command:i,setCommand:c,theme:h,t:g})=>{const n=U.useRef(null);U.useEffect(()=>{e&&n.current&&setTimeout(()=>{var S;(S=n.current)==null||S.focus()},100)},[e]);const u=()=>{i.trim()&&(r(i),c(""),t())},f=()=>{var w;const S=(g==null?void 0:g("confirmClearInput"))||"입력한 내용을 모두 지우시겠습니까?";i.trim()&&!confirm(S)||(c(""),(w=n.current)==null||w.focus())},y=async()=>{var S,w;try{const C=await navigator.clipboard.readText();c(i+C),(S=n.current)==null||S.focus()}catch{const a=prompt((g==null?void 0:g("paste"))||"붙여넣을 텍스트:");a&&(c(i+a),(w=n.current)==null||w.focus())}},d=S=>{S.key==="Enter"&&(S.ctrlKey||S.metaKey)&&(S.preventDefault(),u()),S.key==="Escape"&&t()};if(!e)return null;const _=h;return L.jsxs(L.Fragment,{children:[L.jsx("div",{style:ft.backdrop,onClick:t}),L.jsx("style",{children:`
-        .command-input-textarea::placeholder {
-          color: ${_.foreground||_.white||"#a6adc8"};
-          opacity: 0.5;
-        }
-      `}),L.jsxs("div",{style:{...ft.modal,backgroundColor:_.ui.bg,borderColor:_.ui.border},children:[L.jsxs("div",{style:{...ft.header,borderBottomColor:_.ui.border},children:[L.jsx("h3",{style:{...ft.title,color:_.foreground||_.ui.fg||"#cdd6f4"},children:(g==null?void 0:g("commandInput"))||"명령어 입력"}),L.jsx("button",{onClick:t,style:{...ft.closeButton,color:_.foreground||_.white||"#bac2de"},title:(g==null?void 0:g("close"))||"닫기",children:L.jsx(Gr,{size:18})})]}),L.jsx("div",{style:ft.body,children:L.jsx("textarea",{ref:n,value:i,onChange:S=>c(S.target.value),onKeyDown:d,placeholder:(g==null?void 0:g("commandInputPlaceholder"))||"명령어를 입력하세요... (Ctrl+Enter로 전송)",className:"command-input-textarea",style:{...ft.textarea,backgroundColor:_.ui.bgSecondary,color:_.foreground||_.white||"#cdd6f4",borderColor:_.ui.border},autoFocus:!0})}),L.jsxs("div",{style:{...ft.footer,borderTopColor:_.ui.border},children:[L.jsx("button",{onClick:y,style:{...ft.clearButton,backgroundColor:_.ui.bgTertiary,color:_.foreground||_.white||"#cdd6f4",opacity:1},title:(g==null?void 0:g("paste"))||"붙여넣기",children:L.jsx(th,{size:16})}),L.jsx("button",{onClick:f,disabled:!i.trim(),style:{...ft.clearButton,backgroundColor:i.trim()?_.cyan||_.teal||"#94e2d5":_.ui.bgSecondary,color:i.trim()?"#1e1e2e":_.brightBlack||"#6c7086",opacity:i.trim()?1:.5},title:(g==null?void 0:g("clearInput"))||"내용 지우기",children:L.jsx(rh,{size:16})}),L.jsxs("button",{onClick:u,disabled:!i.trim(),style:{...ft.sendButton,backgroundColor:i.trim()?_.ui.accent:_.ui.bgSecondary,color:i.trim()?"#ffffff":_.brightBlack||"#6c7086",opacity:i.trim()?1:.5},children:[L.jsx(jp,{size:14}),L.jsx("span",{children:(g==null?void 0:g("send"))||"전송"})]})]})]})]})},ft={backdrop:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.6)",zIndex:1e4,backdropFilter:"blur(2px)"},modal:{position:"fixed",top:"50%",left:"50%",transform:"translate(-50%, -50%)",width:"90%",maxWidth:"500px",maxHeight:"80vh",borderRadius:"8px",border:"1px solid",zIndex:10001,display:"flex",flexDirection:"column"},header:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"16px",borderBottom:"1px solid"},title:{margin:0,fontSize:"16px",fontWeight:"600"},closeButton:{background:"none",border:"none",cursor:"pointer",padding:"4px",display:"flex",alignItems:"center",justifyContent:"center",transition:"opacity 0.2s"},body:{flex:1,padding:"16px",display:"flex",flexDirection:"column",overflow:"auto"},textarea:{width:"100%",minHeight:"150px",maxHeight:"300px",padding:"12px",fontSize:"14px",fontFamily:"monospace",border:"1px solid",borderRadius:"4px",resize:"vertical",outline:"none",lineHeight:"1.5"},footer:{display:"flex",gap:"8px",padding:"16px",borderTop:"1px solid"},clearButton:{padding:"10px",fontSize:"14px",fontWeight:"500",border:"none",borderRadius:"6px",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",transition:"all 0.2s ease",minWidth:"44px",minHeight:"44px"},sendButton:{flex:1,padding:"10px 16px",fontSize:"14px",fontWeight:"500",border:"none",borderRadius:"6px",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",transition:"all 0.2s ease"}},s_=({isOpen:e,onClose:t,settings:r,onSave:i,theme:c,username:h})=>{const{t:g}=Sr(r.language),[n,u]=U.useState(r);if(!e)return null;const f=c||{ui:{bg:"#1e1e2e",bgTertiary:"#313244",border:"#313244",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa"},green:"#a6e3a1",red:"#f38ba8",brightBlack:"#585b70"},y=(S,w)=>{u(C=>({...C,[S]:w}))},d=()=>{i(n),t()},_=()=>{confirm(g("reset"))&&(i({theme:"catppuccin",language:"en",fontSize:14,fontFamily:'Menlo, Monaco, "Courier New", monospace',autoScroll:"smart",smoothScroll:!0,scrollSensitivity:.8}),t())};return L.jsx("div",{style:ie.overlay,onClick:t,children:L.jsxs("div",{style:{...ie.modal,backgroundColor:f.ui.bg},onClick:S=>S.stopPropagation(),children:[L.jsxs("div",{style:{...ie.header,borderBottomColor:f.ui.border},children:[L.jsx("h2",{style:{...ie.title,color:f.ui.accent},children:g("settingsTitle")}),L.jsx("button",{onClick:t,style:{...ie.closeBtn,color:f.ui.text},children:"✕"})]}),L.jsxs("div",{style:ie.content,children:[h&&L.jsxs("div",{style:{...ie.section,...ie.userSection},children:[L.jsx("label",{style:{...ie.label,color:f.ui.textSecondary},children:g("user")}),L.jsx("div",{style:{...ie.userValue,color:f.ui.accent,backgroundColor:f.ui.bgTertiary,borderColor:f.ui.border},children:h})]}),L.jsxs("div",{style:ie.row,children:[L.jsxs("div",{style:ie.rowItem,children:[L.jsx("label",{style:{...ie.label,color:f.ui.text},children:g("theme")}),L.jsx("select",{value:n.theme,onChange:S=>y("theme",S.target.value),style:{...ie.select,backgroundColor:f.ui.bgTertiary,color:f.ui.text,borderColor:f.ui.border},children:Yp.map(S=>{const w=`theme${S.charAt(0).toUpperCase()}${S.slice(1)}`;return L.jsx("option",{value:S,children:g(w)},S)})})]}),L.jsxs("div",{style:ie.rowItem,children:[L.jsx("label",{style:{...ie.label,color:f.ui.text},children:g("language")}),L.jsxs("select",{value:n.language,onChange:S=>y("language",S.target.value),style:{...ie.select,backgroundColor:f.ui.bgTertiary,color:f.ui.text,borderColor:f.ui.border},children:[L.jsx("option",{value:"en",children:g("languageEnglish")}),L.jsx("option",{value:"ko",children:g("languageKorean")})]})]})]}),L.jsxs("div",{style:ie.section,children:[L.jsx("label",{style:{...ie.label,color:f.ui.text},children:g("fontSize")}),L.jsx("input",{type:"number",min:"10",max:"24",value:n.fontSize,onChange:S=>y("fontSize",parseInt(S.target.value)),style:{...ie.input,backgroundColor:f.ui.bgTertiary,color:f.ui.text,borderColor:f.ui.border}})]}),L.jsxs("div",{style:ie.section,children:[L.jsx("label",{style:{...ie.label,color:f.ui.text},children:g("autoScroll")}),L.jsxs("select",{value:n.autoScroll,onChange:S=>y("autoScroll",S.target.value),style:{...ie.select,backgroundColor:f.ui.bgTertiary,color:f.ui.text,borderColor:f.ui.border},children:[L.jsx("option",{value:"always",children:"Always (항상)"}),L.jsx("option",{value:"smart",children:"Smart (AI 대응)"}),L.jsx("option",{value:"never",children:"Never (수동)"})]})]}),L.jsx("div",{style:ie.section,children:L.jsxs("label",{style:{...ie.checkboxLabel,color:f.ui.text},children:[L.jsx("input",{type:"checkbox",checked:n.smoothScroll,onChange:S=>y("smoothScroll",S.target.checked),style:ie.checkbox}),g("smoothScroll")]})}),L.jsxs("div",{style:ie.section,children:[L.jsxs("label",{style:{...ie.label,color:f.ui.text},children:["Scroll Sensitivity (AI 스트리밍): ",n.scrollSensitivity.toFixed(1)]}),L.jsx("input",{type:"range",min:"0",max:"1",step:"0.1",value:n.scrollSensitivity,onChange:S=>y("scrollSensitivity",parseFloat(S.target.value)),style:ie.slider}),L.jsx("small",{style:{...ie.hint,color:f.ui.textSecondary},children:"높을수록 사용자 스크롤에 민감하게 반응 (AI 채팅 최적화)"})]})]}),L.jsxs("div",{style:{...ie.footer,borderTopColor:f.ui.border},children:[L.jsx("button",{onClick:_,style:{...ie.resetBtn,backgroundColor:f.red,color:f.ui.bg},children:g("reset")}),L.jsxs("div",{style:ie.buttonGroup,children:[L.jsx("button",{onClick:t,style:{...ie.cancelBtn,backgroundColor:f.brightBlack,color:f.ui.text},children:g("cancel")}),L.jsx("button",{onClick:d,style:{...ie.saveBtn,backgroundColor:f.green,color:f.ui.bg},children:g("save")})]})]})]})})},ie={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.7)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4},modal:{backgroundColor:"#1e1e2e",borderRadius:"2px",width:"90%",maxWidth:"650px",maxHeight:"85vh",overflow:"auto"},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"16px 20px",borderBottom:"1px solid #313244"},title:{margin:0,color:"#89b4fa",fontSize:"20px",fontWeight:"600"},closeBtn:{background:"none",border:"none",color:"#cdd6f4",fontSize:"24px",cursor:"pointer",padding:"0",width:"30px",height:"30px"},content:{padding:"20px"},section:{marginBottom:"20px"},row:{display:"flex",gap:"12px",marginBottom:"20px"},rowItem:{flex:1},userSection:{paddingBottom:"20px",borderBottom:"1px solid #313244"},userValue:{padding:"10px 14px",fontSize:"14px",fontWeight:"600",borderRadius:"4px",border:"1px solid"},label:{display:"block",marginBottom:"8px",color:"#cdd6f4",fontSize:"14px",fontWeight:"500"},select:{width:"100%",padding:"8px 32px 8px 12px",backgroundColor:"#313244",color:"#cdd6f4",border:"1px solid #45475a",borderRadius:"4px",fontSize:"14px"},input:{width:"100%",padding:"8px 12px",backgroundColor:"#313244",color:"#cdd6f4",border:"1px solid #45475a",borderRadius:"4px",fontSize:"14px"},checkboxLabel:{display:"flex",alignItems:"center",gap:"8px",color:"#cdd6f4",fontSize:"14px",cursor:"pointer"},checkbox:{width:"18px",height:"18px",cursor:"pointer"},slider:{width:"100%",marginTop:"8px"},hint:{display:"block",marginTop:"4px",color:"#6c7086",fontSize:"12px"},footer:{display:"flex",justifyContent:"space-between",padding:"16px 20px",borderTop:"1px solid #313244"},buttonGroup:{display:"flex",gap:"8px"},saveBtn:{padding:"8px 16px",backgroundColor:"#a6e3a1",color:"#1e1e2e",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"},cancelBtn:{padding:"8px 16px",backgroundColor:"#585b70",color:"#cdd6f4",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"},resetBtn:{padding:"8px 16px",backgroundColor:"#f38ba8",color:"#1e1e2e",border:"none",borderRadius:"4px",fontSize:"14px",fontWeight:"600",cursor:"pointer"}},n_=({theme:e,onFileSelect:t,onFolderSelect:r,language:i="en"})=>{const[c,h]=U.useState(new Set([""])),[g,n]=U.useState([]),[u,f]=U.useState(!0),[y,d]=U.useState("/workspace"),[_,S]=U.useState(""),[w,C]=U.useState(null),[a,l]=U.useState(""),[s,o]=U.useState(null),[p,m]=U.useState(null);U.useEffect(()=>{x("")},[]);const x=async O=>{try{const b=localStorage.getItem("auth_token"),R=await fetch(`/api/files?path=${encodeURIComponent(O)}`,{headers:{Authorization:`Bearer ${b}`}});return R.ok?(await R.json()).items:(console.error("Failed to load directory:",O),[])}catch(b){return console.error("Failed to load directory:",b),[]}},E=async O=>{const b=new Set(c);b.has(O)?b.delete(O):b.add(O),h(b)};U.useEffect(()=>{(async()=>{f(!0);const b=await x("");n(b),f(!1)})()},[]);const v=()=>{l(""),C("file")},k=()=>{l(""),C("folder")},T=async()=>{if(a.trim())try{const O=localStorage.getItem("auth_token"),b=_?`${_}/${a}`:a,R=await fetch("/api/files/create",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${O}`},body:JSON.stringify({path:b,type:w==="file"?"file":"directory"})});if(R.ok){const A=await x("");n(A),C(null),l("")}else{const A=await R.json();alert(`${w==="file"?"파일":"폴더"} 생성 실패: ${A.detail||"알 수 없는 오류"}`)}}catch(O){console.error("Failed to create:",O),alert(`${w==="file"?"파일":"폴더"} 생성 실패`)}},P=O=>{S(O),d(O?`/workspace/${O}`:"/workspace"),r&&r(O)},B=async()=>{const O=await x("");n(O)},I=async O=>{if(confirm(`"${O.name}"을(를) 삭제하시겠습니까?`))try{const b=localStorage.getItem("auth_token"),R=await fetch(`/api/files?path=${encodeURIComponent(O.path)}`,{method:"DELETE",headers:{Authorization:`Bearer ${b}`}});if(R.ok)await B();else{const A=await R.json();alert(`삭제 실패: ${A.detail||"알 수 없는 오류"}`)}}catch(b){console.error("Failed to delete:",b),alert("삭제 실패")}},F=async O=>{try{await navigator.clipboard.writeText(`/workspace/${O.path}`),alert("경로가 복사되었습니다")}catch(b){console.error("Failed to copy path:",b),alert("경로 복사 실패")}},H=O=>{if(O.type==="directory")r(O.path);else{const b=O.path.substring(0,O.path.lastIndexOf("/"));r(b)}};U.useEffect(()=>{const O=()=>o(null);if(s)return document.addEventListener("click",O),()=>document.removeEventListener("click",O)},[s]);const W=U.useRef(null);return U.useEffect(()=>{w&&W.current&&setTimeout(()=>{var O;(O=W.current)==null||O.focus()},100)},[w]),L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .file-tree-btn:hover {
-          opacity: 0.7;
-        }
-        .create-input::placeholder {
-          color: ${e.foreground||e.white||"#a6adc8"};
-          opacity: 0.5;
-        }
-        .context-menu-item:hover {
-          background-color: ${e.ui.bgTertiary||"#313244"} !important;
-        }
-      `}),L.jsxs("div",{style:le.container,children:[L.jsxs("div",{style:{...le.header,backgroundColor:e.ui.bgSecondary,borderBottomColor:e.ui.border},children:[L.jsx("div",{style:{...le.pathDisplay,color:e.ui.textSecondary},children:y}),L.jsxs("div",{style:le.actions,children:[L.jsx("button",{onClick:v,className:"file-tree-btn",style:{...le.actionBtn,color:e.ui.text},title:"새 파일",children:L.jsx(Pn,{size:14})}),L.jsx("button",{onClick:k,className:"file-tree-btn",style:{...le.actionBtn,color:e.ui.text},title:"새 폴더",children:L.jsx(In,{size:14})})]})]}),L.jsx("div",{style:le.treeContainer,children:u?L.jsx("div",{style:{...le.loading,color:e.ui.textSecondary},children:"불러오는 중..."}):g.map(O=>L.jsx(lh,{item:O,depth:0,expanded:c.has(O.path),onToggle:E,onSelect:t,onFolderSelect:P,selectedPath:_,loadDirectory:x,theme:e,onContextMenu:o},O.path))})]}),s&&L.jsxs("div",{style:{...le.contextMenu,top:s.y,left:s.x,backgroundColor:e.ui.bg,borderColor:e.ui.border},onClick:O=>O.stopPropagation(),children:[s.item.type==="directory"&&L.jsxs(L.Fragment,{children:[L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{S(s.item.path),v(),o(null)},children:[L.jsx(Pn,{size:14}),L.jsx("span",{children:"새 파일"})]}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{S(s.item.path),k(),o(null)},children:[L.jsx(In,{size:14}),L.jsx("span",{children:"새 폴더"})]}),L.jsx("div",{style:{...le.menuDivider,backgroundColor:e.ui.border}})]}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{F(s.item),o(null)},children:[L.jsx(lp,{size:14}),L.jsx("span",{children:"경로 복사"})]}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.ui.text},onClick:()=>{H(s.item),o(null)},children:[L.jsx(Ao,{size:14}),L.jsx("span",{children:"터미널에서 열기"})]}),L.jsx("div",{style:{...le.menuDivider,backgroundColor:e.ui.border}}),L.jsxs("div",{className:"context-menu-item",style:{...le.menuItem,color:e.red||"#f38ba8"},onClick:()=>{I(s.item),o(null)},children:[L.jsx(Np,{size:14}),L.jsx("span",{children:"삭제"})]})]}),w&&L.jsxs(L.Fragment,{children:[L.jsx("div",{style:le.backdrop,onClick:()=>C(null)}),L.jsxs("div",{style:{...le.modal,backgroundColor:e.ui.bg,borderColor:e.ui.border},children:[L.jsxs("div",{style:{...le.modalHeader,borderBottomColor:e.ui.border},children:[L.jsx("h3",{style:{...le.modalTitle,color:e.foreground||e.ui.fg||"#cdd6f4"},children:w==="file"?"새 파일":"새 폴더"}),L.jsx("button",{onClick:()=>C(null),style:{...le.closeButton,color:e.foreground||e.white||"#bac2de"},children:L.jsx(Gr,{size:18})})]}),L.jsxs("div",{style:le.modalBody,children:[L.jsx("input",{ref:W,type:"text",value:a,onChange:O=>l(O.target.value),onKeyDown:O=>{O.key==="Enter"?(O.preventDefault(),T()):O.key==="Escape"&&C(null)},placeholder:w==="file"?"파일 이름을 입력하세요...":"폴더 이름을 입력하세요...",className:"create-input",style:{...le.input,backgroundColor:e.ui.bgSecondary,color:e.foreground||e.white||"#cdd6f4",borderColor:e.ui.border},autoFocus:!0}),L.jsxs("div",{style:{...le.hint,color:e.foreground||e.white||"#a6adc8"},children:["💡 위치: ",y||"/workspace"]})]}),L.jsx("div",{style:{...le.modalFooter,borderTopColor:e.ui.border},children:L.jsxs("button",{onClick:T,disabled:!a.trim(),style:{...le.createButton,backgroundColor:a.trim()?e.ui.accent:e.ui.bgSecondary,color:a.trim()?"#ffffff":e.brightBlack||"#6c7086",opacity:a.trim()?1:.5},children:[w==="file"?L.jsx(Pn,{size:14}):L.jsx(In,{size:14}),L.jsx("span",{children:"생성"})]})})]})]})]})},lh=({item:e,depth:t,expanded:r,onToggle:i,onSelect:c,onFolderSelect:h,selectedPath:g,loadDirectory:n,theme:u,onContextMenu:f})=>{const[y,d]=U.useState([]),[_,S]=U.useState(!1),[w,C]=U.useState(!1),a=g===e.path;U.useEffect(()=>{e.type==="directory"&&r&&y.length===0&&(async()=>{S(!0);const o=await n(e.path);d(o),S(!1)})()},[r,e.path,e.type]);const l=()=>{e.type==="directory"?(i(e.path),h(e.path)):c(e.path)};return L.jsxs(L.Fragment,{children:[L.jsxs("div",{style:{...le.treeItem,paddingLeft:`${t*16+8}px`,backgroundColor:a||w?u.ui.bgTertiary:"transparent",color:u.ui.text,borderLeft:a?`2px solid ${u.ui.accent}`:"none"},onClick:l,onMouseEnter:()=>C(!0),onMouseLeave:()=>C(!1),onContextMenu:s=>{s.preventDefault(),s.stopPropagation(),f({x:s.clientX,y:s.clientY,item:e})},children:[e.type==="directory"&&L.jsx("span",{style:{...le.icon,color:u.ui.textSecondary},children:r?L.jsx(Zf,{size:14}):L.jsx(eh,{size:14})}),e.type!=="directory"&&L.jsx("span",{style:le.icon}),L.jsx("span",{style:{...le.icon,color:e.type==="directory"?u.ui.accent:u.ui.textSecondary},children:e.type==="directory"?r?L.jsx(pp,{size:14}):L.jsx(yp,{size:14}):L.jsx(ih,{size:14})}),L.jsx("span",{style:le.name,children:e.name})]}),e.type==="directory"&&r&&(_?L.jsx("div",{style:{...le.loading,paddingLeft:`${(t+1)*16+8}px`,color:u.ui.textSecondary},children:"..."}):y.map(s=>L.jsx(lh,{item:s,depth:t+1,expanded:r&&s.type==="directory",onToggle:i,onSelect:c,onFolderSelect:h,selectedPath:g,loadDirectory:n,theme:u,onContextMenu:f},s.path)))]})},le={container:{flex:1,display:"flex",flexDirection:"column",overflow:"hidden"},header:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"8px",borderBottom:"1px solid",gap:"8px"},pathDisplay:{fontSize:"11px",fontFamily:"monospace",overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap",flex:1},actions:{display:"flex",gap:"4px",flexShrink:0},actionBtn:{display:"flex",alignItems:"center",justifyContent:"center",padding:"4px",border:"none",backgroundColor:"transparent",cursor:"pointer",borderRadius:"2px",transition:"opacity 0.15s ease"},treeContainer:{flex:1,overflowY:"auto",overflowX:"hidden"},loading:{padding:"8px",fontSize:"12px"},treeItem:{display:"flex",alignItems:"center",padding:"4px 8px",fontSize:"12px",cursor:"pointer",userSelect:"none",transition:"background-color 0.15s ease"},icon:{display:"flex",alignItems:"center",justifyContent:"center",marginRight:"4px",flexShrink:0},name:{flex:1,overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"},backdrop:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.6)",zIndex:1e4,backdropFilter:"blur(2px)"},modal:{position:"fixed",top:"50%",left:"50%",transform:"translate(-50%, -50%)",width:"90%",maxWidth:"400px",borderRadius:"8px",border:"1px solid",zIndex:10001,display:"flex",flexDirection:"column"},modalHeader:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"16px",borderBottom:"1px solid"},modalTitle:{margin:0,fontSize:"16px",fontWeight:"600"},closeButton:{background:"none",border:"none",cursor:"pointer",padding:"4px",display:"flex",alignItems:"center",justifyContent:"center",transition:"opacity 0.2s"},modalBody:{padding:"16px",display:"flex",flexDirection:"column",gap:"8px"},input:{width:"100%",padding:"12px",fontSize:"14px",fontFamily:"monospace",border:"1px solid",borderRadius:"4px",outline:"none"},contextMenu:{position:"fixed",minWidth:"200px",borderRadius:"4px",border:"1px solid",zIndex:1e4,padding:"4px"},menuItem:{display:"flex",alignItems:"center",gap:"8px",padding:"8px 12px",fontSize:"13px",cursor:"pointer",borderRadius:"2px",transition:"background-color 0.15s ease",userSelect:"none"},menuDivider:{height:"1px",margin:"4px 0"},modalFooter:{display:"flex",padding:"16px",borderTop:"1px solid"},createButton:{flex:1,padding:"10px 16px",fontSize:"14px",fontWeight:"500",border:"none",borderRadius:"6px",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",transition:"all 0.2s ease"}},o_=({isOpen:e,onClose:t,sessions:r,activeSessionId:i,onSelectSession:c,onNewSession:h,onCloseSession:g,onRenameSession:n,onReconnectSession:u,language:f="en",theme:y,isMobile:d=!1,width:_=250,onResizeStart:S,onFileSelect:w,onFolderSelect:C})=>{const{t:a}=Sr(f),[l,s]=U.useState(null),[o,p]=U.useState(!1),[m,x]=U.useState("sessions"),[E,v]=U.useState(null),[k,T]=U.useState(""),P=U.useRef(null),B=y||{ui:{bg:"#1e1e2e",bgSecondary:"#181825",bgTertiary:"#313244",border:"#313244",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa",iconColor:"#cdd6f4"},green:"#a6e3a1",red:"#f38ba8"},I=(b,R)=>b.name||`Terminal ${R+1}`,F=b=>b.substring(0,8),H=(b,R)=>{v(b.id),T(b.name||`Terminal ${R+1}`)},W=async()=>{E&&k.trim()&&n&&await n(E,k.trim()),v(null),T("")},O=()=>{v(null),T("")};return U.useEffect(()=>{E&&P.current&&(P.current.focus(),P.current.select())},[E]),e?L.jsxs(L.Fragment,{children:[d&&L.jsx("div",{style:ue.overlay,onClick:t}),L.jsxs("div",{style:{...ue.sidebar,backgroundColor:B.ui.bg,borderRightColor:B.ui.border,width:d?"min(80vw, 250px)":`${_}px`,maxWidth:d?"80vw":"400px",minWidth:d?void 0:"180px",top:d?"0":"33px",height:d?"100vh":"auto"},children:[d&&L.jsxs("div",{style:{...ue.header,backgroundColor:B.ui.bgSecondary,borderBottomColor:B.ui.border},children:[L.jsx("h2",{style:{...ue.title,color:B.ui.accent},children:a("sessions")||"Sessions"}),L.jsx("button",{onClick:t,onMouseEnter:()=>p(!0),onMouseLeave:()=>p(!1),style:{...ue.closeBtn,color:B.ui.text,backgroundColor:o?B.ui.bgTertiary:"transparent"},title:a("closeSidebar"),children:L.jsx(Gr,{size:20,strokeWidth:2})})]}),L.jsxs("div",{style:{...ue.tabHeader,borderBottomColor:B.ui.border,backgroundColor:B.ui.bgSecondary},children:[L.jsxs("button",{onClick:()=>x("sessions"),style:{...ue.tab,color:m==="sessions"?B.ui.accent:B.ui.textSecondary,borderBottomColor:m==="sessions"?B.ui.accent:"transparent",borderRightColor:B.ui.border},children:[L.jsx(Ao,{size:14,strokeWidth:2}),L.jsx("span",{children:"세션"})]}),L.jsxs("button",{onClick:()=>x("files"),style:{...ue.tab,color:m==="files"?B.ui.accent:B.ui.textSecondary,borderBottomColor:m==="files"?B.ui.accent:"transparent",borderRightColor:B.ui.border},children:[L.jsx(vp,{size:14,strokeWidth:2}),L.jsx("span",{children:"파일"})]})]}),m==="sessions"&&L.jsx("div",{style:{...ue.newSessionContainer,borderBottomColor:B.ui.border},children:L.jsxs("button",{onClick:h,style:{...ue.newSessionBtn,backgroundColor:B.ui.accent,color:B.ui.bg},children:[L.jsx("span",{style:ue.plusIcon,children:"+"}),a("newSession")]})}),m==="sessions"&&L.jsx("div",{style:ue.sessionList,children:r.length===0?L.jsxs("div",{style:ue.emptyState,children:[L.jsx("p",{style:{...ue.emptyText,color:B.ui.textSecondary},children:a("noTerminals")}),L.jsx("p",{style:{...ue.emptyHint,color:B.ui.textSecondary,opacity:.9},children:a("createFirstTerminal")})]}):r.map((b,R)=>{const A=b.id===i,M=b.id===l;return L.jsxs("div",{style:{...ue.sessionItem,backgroundColor:A?B.ui.bgTertiary:B.ui.bgSecondary,borderColor:A?B.ui.accent:M?B.ui.border:"transparent"},onMouseEnter:()=>s(b.id),onMouseLeave:()=>s(null),children:[L.jsxs("div",{style:ue.sessionInfo,onClick:()=>{c(b.id),d&&t()},children:[L.jsx("div",{style:{...ue.sessionIcon,color:B.ui.accent},children:L.jsx(Ao,{size:14,strokeWidth:2})}),L.jsxs("div",{style:ue.sessionDetails,children:[E===b.id?L.jsx("input",{ref:P,type:"text",value:k,onChange:z=>T(z.target.value),onBlur:W,onKeyDown:z=>{z.key==="Enter"?W():z.key==="Escape"&&O()},onClick:z=>z.stopPropagation(),style:{...ue.sessionNameInput,backgroundColor:B.ui.bgTertiary,color:B.ui.text,borderColor:B.ui.accent}}):L.jsx("div",{style:{...ue.sessionName,color:B.ui.text},onDoubleClick:z=>{z.stopPropagation(),H(b,R)},children:I(b,R)}),L.jsx("div",{style:{...ue.sessionId,color:B.ui.textSecondary},children:F(b.id)})]})]}),L.jsx("button",{onClick:z=>{z.stopPropagation(),u&&u(b.id)},style:{...ue.sessionActionBtn,color:B.ui.accent,opacity:d?1:.7},title:"재연결",children:L.jsx(Mp,{size:14,strokeWidth:2})}),L.jsx("button",{onClick:z=>{z.stopPropagation(),g(b.id)},style:{...ue.sessionCloseBtn,color:B.red,opacity:d?1:.7},title:a("closeTerminal"),children:L.jsx(Gr,{size:16,strokeWidth:2.5})})]},b.id)})}),m==="files"&&L.jsx(n_,{theme:B,onFileSelect:w,onFolderSelect:C,language:f}),L.jsx("div",{style:{...ue.footer,backgroundColor:B.ui.bgSecondary,borderTopColor:B.ui.border},children:L.jsxs("div",{style:ue.footerInfo,children:[L.jsxs("div",{style:ue.footerLeft,children:[L.jsx(cp,{size:14,strokeWidth:2,style:{color:B.ui.accent}}),L.jsxs("span",{style:{...ue.footerLabel,color:B.ui.textSecondary},children:[a("activeTerminals"),":"]})]}),L.jsx("span",{style:{...ue.footerValue,color:B.ui.accent},children:r.length})]})}),!d&&S&&L.jsx("div",{onMouseDown:S,style:ue.resizeHandle,title:a("resizeSidebar")})]})]}):null},ue={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,width:"100%",height:"100vh",backgroundColor:"rgba(0, 0, 0, 0.5)",zIndex:9998,animation:"fadeIn 0.2s ease"},sidebar:{position:"fixed",top:"32px",left:0,bottom:0,width:"250px",maxWidth:"80vw",zIndex:9999,display:"flex",flexDirection:"column",borderRight:"1px solid"},tabHeader:{display:"flex",borderBottom:"1px solid",gap:"1px"},tab:{flex:1,display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",padding:"10px",fontSize:"12px",fontWeight:"500",background:"none",border:"none",borderRight:"1px solid",borderBottom:"2px solid transparent",cursor:"pointer",transition:"color 0.15s ease, border-color 0.15s ease, background-color 0.15s ease"},header:{position:"relative",display:"flex",justifyContent:"center",alignItems:"center",padding:"0",borderBottom:"1px solid",height:"32px",boxSizing:"border-box"},title:{margin:0,fontSize:"13px",fontWeight:"600"},closeBtn:{position:"absolute",right:"8px",background:"none",border:"none",cursor:"pointer",padding:"6px",display:"flex",alignItems:"center",justifyContent:"center",borderRadius:"2px",transition:"background-color 0.15s ease"},newSessionContainer:{padding:"8px",borderBottom:"1px solid"},newSessionBtn:{width:"100%",padding:"10px 12px",border:"none",borderRadius:"2px",fontSize:"13px",fontWeight:"600",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",gap:"6px",transition:"opacity 0.15s ease"},plusIcon:{fontSize:"16px",fontWeight:"600"},sessionList:{flex:1,overflowY:"auto",padding:"8px"},emptyState:{textAlign:"center",padding:"40px 20px"},emptyText:{fontSize:"14px",margin:"0 0 8px 0"},emptyHint:{fontSize:"12px",margin:0},sessionItem:{display:"flex",alignItems:"center",justifyContent:"space-between",padding:"8px",marginBottom:"8px",borderRadius:"2px",border:"1px solid transparent",cursor:"pointer",transition:"background-color 0.15s ease, border 0.15s ease"},sessionInfo:{flex:1,display:"flex",alignItems:"center",gap:"12px",minWidth:0},sessionIcon:{fontSize:"12px",width:"16px",textAlign:"center"},sessionDetails:{flex:1,minWidth:0},sessionName:{fontSize:"12px",fontWeight:"500",marginBottom:"2px",overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap",cursor:"default"},sessionNameInput:{width:"100%",fontSize:"12px",fontWeight:"500",padding:"2px 4px",border:"1px solid",borderRadius:"2px",outline:"none",marginBottom:"2px"},sessionId:{fontSize:"10px",fontFamily:"monospace"},sessionActionBtn:{background:"none",border:"none",cursor:"pointer",padding:"4px",borderRadius:"2px",transition:"background-color 0.15s ease, opacity 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",marginRight:"4px"},sessionCloseBtn:{background:"none",border:"none",cursor:"pointer",padding:"4px",borderRadius:"2px",transition:"background-color 0.15s ease, opacity 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center"},footer:{padding:"8px 12px",borderTop:"1px solid"},footerInfo:{display:"flex",justifyContent:"space-between",alignItems:"center"},footerLeft:{display:"flex",alignItems:"center",gap:"6px"},footerLabel:{fontSize:"12px"},footerValue:{fontSize:"13px",fontWeight:"600"},resizeHandle:{position:"absolute",top:0,right:0,bottom:0,width:"4px",cursor:"ew-resize",backgroundColor:"transparent",transition:"background-color 0.15s ease",zIndex:1e4}};if(!document.getElementById("sidebar-animations")){const e=document.createElement("style");e.id="sidebar-animations",e.textContent=`
-    @keyframes fadeIn {
-      from { opacity: 0; }
-      to { opacity: 1; }
-    }
-
-    @keyframes slideInLeft {
-      from {
-        transform: translateX(-100%);
-        opacity: 0.8;
-      }
-      to {
-        transform: translateX(0);
-        opacity: 1;
-      }
-    }
-  `,document.head.appendChild(e)}const l_=U.memo(o_),a_=({isOpen:e,onConfirm:t,onCancel:r,title:i,message:c,confirmText:h,cancelText:g,language:n="en",danger:u=!1,theme:f})=>{const{t:y}=Sr(n);if(!e)return null;const d=f||{ui:{bg:"#1e1e2e",border:"#313244",text:"#cdd6f4"},green:"#a6e3a1",red:"#f38ba8",brightBlack:"#585b70"},_=()=>{t()},S=()=>{r()};return L.jsx("div",{style:Ct.overlay,onClick:S,children:L.jsxs("div",{style:{...Ct.modal,backgroundColor:d.ui.bg,borderColor:d.ui.border},onClick:w=>w.stopPropagation(),children:[L.jsx("div",{style:{...Ct.header,borderBottomColor:d.ui.border},children:L.jsx("h3",{style:{...Ct.title,color:d.ui.text},children:i||y("confirm")})}),L.jsx("div",{style:Ct.content,children:L.jsx("p",{style:{...Ct.message,color:d.ui.text},children:c})}),L.jsxs("div",{style:{...Ct.footer,borderTopColor:d.ui.border},children:[L.jsx("button",{onClick:S,style:{...Ct.cancelBtn,backgroundColor:d.brightBlack,color:d.ui.text},children:g||y("cancel")}),L.jsx("button",{onClick:_,style:u?{...Ct.dangerBtn,backgroundColor:d.red,color:d.ui.bg}:{...Ct.confirmBtn,backgroundColor:d.green,color:d.ui.bg},children:h||y("confirm")})]})]})})},Ct={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0, 0, 0, 0.7)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:10001},modal:{backgroundColor:"#1e1e2e",borderRadius:"2px",width:"90%",maxWidth:"450px",border:"1px solid #313244"},header:{padding:"16px 20px",borderBottom:"1px solid #313244"},title:{margin:0,color:"#cdd6f4",fontSize:"16px",fontWeight:"600"},content:{padding:"20px"},message:{margin:0,color:"#cdd6f4",fontSize:"14px",lineHeight:"1.6"},footer:{display:"flex",gap:"8px",padding:"16px 20px",borderTop:"1px solid #313244",justifyContent:"flex-end"},cancelBtn:{padding:"12px 24px",backgroundColor:"#585b70",color:"#cdd6f4",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"},confirmBtn:{padding:"12px 24px",backgroundColor:"#a6e3a1",color:"#1e1e2e",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"},dangerBtn:{padding:"12px 24px",backgroundColor:"#f38ba8",color:"#1e1e2e",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"600",cursor:"pointer",transition:"opacity 0.15s ease"}},c_=({isOpen:e,message:t,onClose:r,theme:i,duration:c=3e3})=>{if(U.useEffect(()=>{if(e&&c>0){const g=setTimeout(()=>{r()},c);return()=>clearTimeout(g)}},[e,c,r]),!e)return null;const h=i||{ui:{bgTertiary:"#313244",border:"#2a2b3d",text:"#cdd6f4",textSecondary:"#6c7086"},green:"#a6e3a1"};return L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        @keyframes slideInUp {
-          from {
-            transform: translate(-50%, 100px);
-            opacity: 0;
-          }
-          to {
-            transform: translate(-50%, 0);
-            opacity: 1;
-          }
-        }
-      `}),L.jsxs("div",{style:{...ci.toast,backgroundColor:h.ui.bgTertiary,borderColor:h.ui.border,animation:"slideInUp 0.3s ease"},children:[L.jsxs("div",{style:ci.content,children:[L.jsx("div",{style:{...ci.iconCircle,backgroundColor:h.green+"25"},children:L.jsx(Qf,{size:18,color:h.green,strokeWidth:2.5})}),L.jsx("span",{style:{...ci.message,color:h.ui.text},children:t})]}),L.jsx("button",{onClick:r,style:{...ci.closeBtn,color:h.ui.textSecondary},onMouseEnter:g=>{g.currentTarget.style.color=h.ui.text},onMouseLeave:g=>{g.currentTarget.style.color=h.ui.textSecondary},children:L.jsx(Gr,{size:16})})]})]})},ci={toast:{position:"fixed",bottom:"24px",left:"50%",transform:"translateX(-50%)",zIndex:10001,backgroundColor:"#313244",borderRadius:"8px",padding:"14px 16px",border:"1px solid",display:"flex",alignItems:"center",justifyContent:"space-between",gap:"12px",minWidth:"320px",maxWidth:"400px"},content:{display:"flex",alignItems:"center",gap:"12px",flex:1},iconCircle:{width:"32px",height:"32px",borderRadius:"50%",display:"flex",alignItems:"center",justifyContent:"center",flexShrink:0},message:{fontSize:"14px",fontWeight:"500",lineHeight:"1.4"},closeBtn:{background:"none",border:"none",cursor:"pointer",padding:"4px",display:"flex",alignItems:"center",justifyContent:"center",borderRadius:"4px",transition:"color 0.15s ease",flexShrink:0}},u_=({onComplete:e,language:t="en"})=>{const{t:r}=Sr(t),[i,c]=U.useState(""),[h,g]=U.useState(""),[n,u]=U.useState(""),[f,y]=U.useState(""),[d,_]=U.useState(!1),S=async w=>{if(w.preventDefault(),y(""),i.length<3){y(r("usernameMinLength")||"Username must be at least 3 characters");return}if(h.length<8){y(r("passwordMinLength")||"Password must be at least 8 characters");return}if(h!==n){y(r("passwordMismatch")||"Passwords do not match");return}_(!0);try{const C=await fetch("/api/auth/setup",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:i,password:h})}),a=await C.json();if(!C.ok)throw new Error(a.detail||"Setup failed");e()}catch(C){y(C.message||"Failed to create admin account")}finally{_(!1)}};return L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .initial-setup-overlay::-webkit-scrollbar,
-        .initial-setup-container::-webkit-scrollbar {
-          display: none;
-        }
-      `}),L.jsx("div",{style:Be.overlay,className:"initial-setup-overlay",children:L.jsxs("div",{style:Be.container,className:"initial-setup-container",children:[L.jsx("div",{style:Be.header,children:L.jsx("div",{style:Be.icon,children:L.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[L.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),L.jsx("path",{d:"M7 10l3 3-3 3"}),L.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})})}),L.jsxs("form",{onSubmit:S,style:Be.form,children:[L.jsxs("div",{style:Be.formGroup,children:[L.jsx("label",{style:Be.label,children:r("username")||"Username"}),L.jsx("input",{type:"text",value:i,onChange:w=>c(w.target.value),style:Be.input,placeholder:r("usernamePlaceholder")||"Enter username",disabled:d,autoFocus:!0,required:!0})]}),L.jsxs("div",{style:Be.formGroup,children:[L.jsx("label",{style:Be.label,children:r("password")||"Password"}),L.jsx("input",{type:"password",value:h,onChange:w=>g(w.target.value),style:Be.input,placeholder:r("passwordPlaceholder")||"Enter password (min 8 characters)",disabled:d,required:!0})]}),L.jsxs("div",{style:Be.formGroup,children:[L.jsx("label",{style:Be.label,children:r("confirmPassword")||"Confirm Password"}),L.jsx("input",{type:"password",value:n,onChange:w=>u(w.target.value),style:Be.input,placeholder:r("confirmPasswordPlaceholder")||"Re-enter password",disabled:d,required:!0})]}),f&&L.jsx("div",{style:Be.error,children:f}),L.jsx("button",{type:"submit",style:Be.submitBtn,disabled:d,children:d?r("creating")||"Creating...":r("createAccount")||"Create Administrator"})]}),L.jsx("div",{style:Be.footer,children:L.jsx("p",{style:Be.footerText,children:r("setupFooter")||"This account will have full access to all terminals and settings."})})]})})]})},Be={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"#282a36",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4,overflow:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},container:{backgroundColor:"#1e1f29",borderRadius:"12px",width:"90%",maxWidth:"420px",padding:"40px",border:"1px solid #44475a",margin:"20px auto",maxHeight:"calc(100vh - 40px)",overflowY:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},header:{textAlign:"center",marginBottom:"32px"},icon:{color:"#bd93f9",margin:"0 auto"},form:{display:"flex",flexDirection:"column",gap:"20px"},formGroup:{display:"flex",flexDirection:"column",gap:"8px"},label:{fontSize:"14px",fontWeight:"600",color:"#f8f8f2"},input:{padding:"12px 16px",fontSize:"14px",backgroundColor:"#282a36",color:"#f8f8f2",border:"1px solid #44475a",borderRadius:"6px",outline:"none",transition:"border-color 0.2s"},error:{padding:"12px 16px",backgroundColor:"#ff5555",color:"#f8f8f2",borderRadius:"6px",fontSize:"14px",textAlign:"center"},submitBtn:{padding:"14px 24px",backgroundColor:"#50fa7b",color:"#282a36",border:"none",borderRadius:"6px",fontSize:"16px",fontWeight:"700",cursor:"pointer",transition:"all 0.2s ease",marginTop:"8px"},footer:{marginTop:"24px",paddingTop:"24px",borderTop:"1px solid #44475a"},footerText:{margin:0,fontSize:"12px",color:"#6272a4",textAlign:"center",lineHeight:"1.6"}},h_=({onLogin:e,language:t="en"})=>{const{t:r}=Sr(t),[i,c]=U.useState(""),[h,g]=U.useState(""),[n,u]=U.useState(""),[f,y]=U.useState(!1),d=async _=>{if(_.preventDefault(),u(""),!i||!h){u(r("fillAllFields")||"Please fill in all fields");return}y(!0);try{const S=await fetch("/api/auth/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:i,password:h})}),w=await S.json();if(!S.ok)throw new Error(w.detail||"Login failed");localStorage.setItem("auth_token",w.access_token),localStorage.setItem("username",w.username),e(w.access_token,w.username)}catch(S){u(S.message||"Invalid username or password"),g("")}finally{y(!1)}};return L.jsxs(L.Fragment,{children:[L.jsx("style",{children:`
-        .login-overlay::-webkit-scrollbar,
-        .login-container::-webkit-scrollbar {
-          display: none;
-        }
-      `}),L.jsx("div",{style:Je.overlay,className:"login-overlay",children:L.jsxs("div",{style:Je.container,className:"login-container",children:[L.jsx("div",{style:Je.header,children:L.jsx("div",{style:Je.icon,children:L.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[L.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),L.jsx("path",{d:"M7 10l3 3-3 3"}),L.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})})}),L.jsxs("form",{onSubmit:d,style:Je.form,children:[L.jsxs("div",{style:Je.formGroup,children:[L.jsx("label",{style:Je.label,children:r("username")||"Username"}),L.jsx("input",{type:"text",value:i,onChange:_=>c(_.target.value),style:Je.input,placeholder:r("usernamePlaceholder")||"Enter username",disabled:f,autoFocus:!0,required:!0})]}),L.jsxs("div",{style:Je.formGroup,children:[L.jsx("label",{style:Je.label,children:r("password")||"Password"}),L.jsx("input",{type:"password",value:h,onChange:_=>g(_.target.value),style:Je.input,placeholder:r("passwordPlaceholder")||"Enter password",disabled:f,required:!0})]}),n&&L.jsx("div",{style:Je.error,children:n}),L.jsx("button",{type:"submit",style:Je.submitBtn,disabled:f,children:f?r("signingIn")||"Signing in...":r("signIn")||"Sign In"})]})]})})]})},Je={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"#282a36",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e4,overflow:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},container:{backgroundColor:"#1e1f29",borderRadius:"12px",width:"90%",maxWidth:"380px",padding:"40px",border:"1px solid #44475a",margin:"20px auto",maxHeight:"calc(100vh - 40px)",overflowY:"auto",scrollbarWidth:"none",msOverflowStyle:"none"},header:{textAlign:"center",marginBottom:"32px"},icon:{color:"#bd93f9",margin:"0 auto"},form:{display:"flex",flexDirection:"column",gap:"20px"},formGroup:{display:"flex",flexDirection:"column",gap:"8px"},label:{fontSize:"14px",fontWeight:"600",color:"#f8f8f2"},input:{padding:"12px 16px",fontSize:"14px",backgroundColor:"#282a36",color:"#f8f8f2",border:"1px solid #44475a",borderRadius:"6px",outline:"none",transition:"border-color 0.2s"},error:{padding:"12px 16px",backgroundColor:"#ff5555",color:"#f8f8f2",borderRadius:"6px",fontSize:"14px",textAlign:"center"},submitBtn:{padding:"14px 24px",backgroundColor:"#50fa7b",color:"#282a36",border:"none",borderRadius:"6px",fontSize:"16px",fontWeight:"700",cursor:"pointer",transition:"all 0.2s ease",marginTop:"8px"}},d_=({filePath:e,onClose:t,theme:r})=>{const[i,c]=U.useState(""),[h,g]=U.useState(!1),[n,u]=U.useState(!0),[f,y]=U.useState(!1),[d,_]=U.useState(null);U.useEffect(()=>{e&&S()},[e]);const S=async()=>{u(!0),_(null);try{const a=localStorage.getItem("auth_token"),l=await fetch(`/api/files/read?path=${encodeURIComponent(e)}`,{headers:{Authorization:`Bearer ${a}`}});if(!l.ok){const o=await l.json();throw new Error(o.detail||"Failed to load file")}const s=await l.json();c(s.content)}catch(a){console.error("Failed to load file:",a),_(a.message)}finally{u(!1)}},w=async()=>{y(!0),_(null);try{const a=localStorage.getItem("auth_token"),l=await fetch("/api/files/write",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${a}`},body:JSON.stringify({path:e,content:i})});if(!l.ok){const s=await l.json();throw new Error(s.detail||"Failed to save file")}g(!1)}catch(a){console.error("Failed to save file:",a),_(a.message)}finally{y(!1)}},C=()=>{S(),g(!1)};return e?L.jsxs("div",{style:{...Ze.container,backgroundColor:r.ui.bg},children:[L.jsxs("div",{style:{...Ze.header,backgroundColor:r.ui.bgSecondary,borderBottomColor:r.ui.border},children:[L.jsxs("div",{style:Ze.headerLeft,children:[L.jsx(ih,{size:14,style:{color:r.ui.accent}}),L.jsx("span",{style:{...Ze.filePath,color:r.ui.text},children:e})]}),L.jsxs("div",{style:Ze.headerRight,children:[h?L.jsxs(L.Fragment,{children:[L.jsxs("button",{onClick:w,disabled:f,style:{...Ze.button,backgroundColor:r.green,color:r.ui.bg},children:[L.jsx(Ip,{size:14}),L.jsx("span",{children:f?"저장 중...":"저장"})]}),L.jsx("button",{onClick:C,disabled:f,style:{...Ze.button,backgroundColor:r.brightBlack,color:r.ui.text},children:"취소"})]}):L.jsxs("button",{onClick:()=>g(!0),style:{...Ze.button,backgroundColor:r.ui.bgTertiary,color:r.ui.text},disabled:n,children:[L.jsx(Rp,{size:14}),L.jsx("span",{children:"편집"})]}),L.jsxs("button",{onClick:t,style:{...Ze.button,backgroundColor:r.red,color:r.ui.bg},children:[L.jsx(Gr,{size:14}),L.jsx("span",{children:"닫기"})]})]})]}),L.jsx("div",{style:Ze.content,children:n?L.jsx("div",{style:{...Ze.message,color:r.ui.textSecondary},children:"불러오는 중..."}):d?L.jsx("div",{style:{...Ze.message,color:r.red},children:d}):L.jsx("textarea",{style:{...Ze.textarea,backgroundColor:r.ui.bgSecondary,color:r.ui.text,borderColor:r.ui.border},value:i,onChange:a=>c(a.target.value),readOnly:!h,spellCheck:!1})})]}):null},Ze={container:{position:"absolute",top:"36px",left:0,right:0,bottom:0,display:"flex",flexDirection:"column",backgroundColor:"#1e1e2e",zIndex:100},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"8px 12px",backgroundColor:"#181825",borderBottom:"1px solid #313244",gap:"12px"},headerLeft:{display:"flex",alignItems:"center",gap:"8px",flex:1,minWidth:0},filePath:{fontSize:"12px",fontWeight:"500",overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap",color:"#cdd6f4"},headerRight:{display:"flex",gap:"6px",alignItems:"center",flexShrink:0},button:{display:"flex",alignItems:"center",gap:"4px",padding:"6px 10px",fontSize:"11px",fontWeight:"500",border:"none",borderRadius:"2px",cursor:"pointer",transition:"opacity 0.15s ease"},content:{flex:1,display:"flex",flexDirection:"column",overflow:"hidden"},textarea:{flex:1,width:"100%",padding:"12px",backgroundColor:"#181825",color:"#cdd6f4",border:"none",outline:"none",fontFamily:'"JetBrains Mono", monospace',fontSize:"13px",lineHeight:"1.6",resize:"none",overflow:"auto"},message:{padding:"20px",textAlign:"center",fontSize:"14px"}},f_=()=>{var t;return(navigator.language||((t=navigator.languages)==null?void 0:t[0])||"en").toLowerCase().startsWith("ko")?"ko":"en"},On={theme:"catppuccin",language:f_(),fontSize:14,fontFamily:'"JetBrains Mono", Menlo, Monaco, "Courier New", monospace',autoScroll:"smart",smoothScroll:!0,scrollSensitivity:.8},jn="terminal_settings",p_=()=>{const[e,t]=U.useState(()=>{try{const h=localStorage.getItem(jn);if(h)return{...On,...JSON.parse(h)}}catch(h){console.error("Failed to load settings:",h)}return On});return U.useEffect(()=>{try{localStorage.setItem(jn,JSON.stringify(e))}catch(h){console.error("Failed to save settings:",h)}},[e]),{settings:e,updateSetting:(h,g)=>{t(n=>({...n,[h]:g}))},updateSettings:h=>{t(g=>({...g,...h}))},resetSettings:()=>{t(On),localStorage.removeItem(jn)}}},__=()=>"xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx".replace(/[xy]/g,e=>{const t=Math.random()*16|0;return(e==="x"?t:t&3|8).toString(16)}),g_=async()=>{try{const e=localStorage.getItem("auth_token");if(!e)return console.log("[DEBUG] fetchSessions: 토큰 없음"),[];console.log("[DEBUG] fetchSessions: API 호출 시작");const t=await fetch("/api/sessions",{headers:{Authorization:`Bearer ${e}`}});if(!t.ok)return console.error("[DEBUG] fetchSessions 실패:",t.status),[];const r=await t.json();console.log("[DEBUG] fetchSessions API 응답:",r);const i=r.map(c=>({id:c.id,name:c.name}));return console.log("[DEBUG] fetchSessions 매핑 결과:",i),i}catch(e){return console.error("[DEBUG] fetchSessions 에러:",e),[]}};function v_(){const[e,t]=U.useState({isLoading:!0,needsSetup:!1,isAuthenticated:!1,username:null}),[r,i]=U.useState([]),[c,h]=U.useState(null);U.useEffect(()=>{console.log("[DEBUG] sessions 변경됨:",r.length,r)},[r]);const[g,n]=U.useState(!1),[u,f]=U.useState(!1),[y,d]=U.useState(()=>{const K=localStorage.getItem("sidebar_open");return K!==null?K==="true":!(/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768)}),[_,S]=U.useState(!1),[w,C]=U.useState(null),[a,l]=U.useState(()=>{const K=localStorage.getItem("sidebar_width");return K?parseInt(K):280}),[s,o]=U.useState(!1),[p,m]=U.useState(window.innerHeight),[x,E]=U.useState({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1}),[v,k]=U.useState({isOpen:!1,message:""}),[T,P]=U.useState(!1),[B,I]=U.useState(null),[F,H]=U.useState(!1),[W,O]=U.useState(""),b=U.useRef(null),{settings:R,updateSettings:A}=p_(),{t:M}=Sr(R.language);U.useEffect(()=>{if(!e.isAuthenticated)return;const K=Dt[R.theme]||Dt.catppuccin,ce="dynamic-scrollbar-theme";let te=document.getElementById(ce);te||(te=document.createElement("style"),te.id=ce,document.head.appendChild(te)),te.textContent=`
-      ::-webkit-scrollbar {
-        width: 12px;
-        height: 12px;
-      }
-
-      ::-webkit-scrollbar-track {
-        background: ${K.ui.bg};
-      }
-
-      ::-webkit-scrollbar-thumb {
-        background: ${K.ui.border};
-        border-radius: 6px;
-        border: 2px solid ${K.ui.bg};
-      }
-
-      ::-webkit-scrollbar-thumb:hover {
-        background: ${K.ui.textSecondary};
-      }
-
-      /* Firefox */
-      * {
-        scrollbar-width: thin;
-        scrollbar-color: ${K.ui.border} ${K.ui.bg};
-      }
-    `},[R.theme,e.isAuthenticated]),U.useEffect(()=>{(async()=>{try{if(!(await(await fetch("/api/auth/status")).json()).setup_complete){localStorage.removeItem("auth_token"),localStorage.removeItem("username"),t({isLoading:!1,needsSetup:!0,isAuthenticated:!1,username:null});return}const Te=localStorage.getItem("auth_token");if(!Te){t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null});return}const be=await fetch("/api/auth/verify",{headers:{Authorization:`Bearer ${Te}`}});if(!be.ok){localStorage.removeItem("auth_token"),localStorage.removeItem("username"),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null});return}const Qe=await be.json();t({isLoading:!1,needsSetup:!1,isAuthenticated:!0,username:Qe.username})}catch(ce){console.error("Auth check failed:",ce),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null})}})()},[]);const z=()=>{t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null})},q=(K,ce)=>{t({isLoading:!1,needsSetup:!1,isAuthenticated:!0,username:ce})},Q=()=>{E({isOpen:!0,sessionId:null,isLogout:!0,title:M("confirmLogout"),message:M("logoutMessage")})},Y=()=>{localStorage.removeItem("auth_token"),localStorage.removeItem("username"),i([]),h(null),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null}),E({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})},se=async()=>{console.log("[DEBUG] refreshSessions 호출됨");const K=await g_();return console.log("[DEBUG] refreshSessions - 로드된 세션:",K),i(K),console.log("[DEBUG] refreshSessions - setSessions 호출 완료"),K};U.useEffect(()=>{console.log("[DEBUG] 인증 상태 변경:",e),e.isAuthenticated&&(console.log("[DEBUG] 인증됨 - refreshSessions 호출"),se().then(K=>{console.log("[DEBUG] 로드된 세션 목록:",K);const ce=localStorage.getItem("active_session_id");ce&&K.some(te=>te.id===ce)?(console.log("[DEBUG] localStorage에서 활성 세션 복원:",ce),h(ce)):K.length>0?(console.log("[DEBUG] 첫 번째 세션 활성화:",K[0].id),h(K[0].id)):console.log("[DEBUG] 세션 없음")}))},[e.isAuthenticated]),U.useEffect(()=>{c&&localStorage.setItem("active_session_id",c)},[c]),U.useEffect(()=>{localStorage.setItem("sidebar_open",y.toString())},[y]),U.useEffect(()=>{localStorage.setItem("sidebar_width",a.toString())},[a]),U.useEffect(()=>{let K=/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768;const ce=()=>{const te=/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768;n(te),te!==K&&(d(!te),K=te)};return ce(),window.addEventListener("resize",ce),()=>window.removeEventListener("resize",ce)},[]),U.useEffect(()=>{if(!window.visualViewport)return;const K=()=>{m(window.visualViewport.height)};return K(),window.visualViewport.addEventListener("resize",K),window.visualViewport.addEventListener("scroll",K),()=>{window.visualViewport.removeEventListener("resize",K),window.visualViewport.removeEventListener("scroll",K)}},[]);const D=K=>{window.terminalSessions&&c&&window.terminalSessions[c]&&window.terminalSessions[c].sendData(K)},j=()=>{window.terminalSessions&&c&&window.terminalSessions[c]&&window.terminalSessions[c].scrollToBottom()},$=K=>{window.terminalSessions&&c&&window.terminalSessions[c]&&window.terminalSessions[c].sendData(K+`
-`)},[N,Z]=U.useState(""),G=K=>{I(K),P(!0)},ae=K=>{Z(K)},Ee=()=>{P(!1),I(null)},Re=async()=>{const K=__(),ce=localStorage.getItem("auth_token");try{if(!(await fetch(`/api/sessions/${K}`,{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${ce}`},body:JSON.stringify({cols:80,rows:24})})).ok){console.error("Failed to create session on server");return}const Te={id:K};i(be=>[...be,Te]),h(K),N&&setTimeout(()=>{if(window.terminalSessions&&window.terminalSessions[K]){const be=`/workspace/${N}`;window.terminalSessions[K].sendData(`cd "${be}"
-`)}},1e3)}catch(te){console.error("Failed to create new session:",te)}},jt=K=>{h(K)},ee=K=>{E({isOpen:!0,sessionId:K,isLogout:!1,title:M("closeTerminal"),message:M("confirmCloseTerminal")||"Are you sure you want to close this terminal? All unsaved work will be lost."})},sr=async()=>{if(x.isLogout)Y();else{const K=x.sessionId,ce=localStorage.getItem("auth_token");try{(await fetch(`/api/sessions/${K}`,{method:"DELETE",headers:{Authorization:`Bearer ${ce}`}})).ok||console.error("Failed to delete session on server")}catch(te){console.error("Failed to delete session:",te)}if(i(te=>te.filter(Te=>Te.id!==K)),c===K){const te=r.filter(Te=>Te.id!==K);te.length>0?h(te[0].id):h(null)}E({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})}},Jr=()=>{E({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})},Zr=K=>{A(K),k({isOpen:!0,message:M("settingsSaved")})},ei=()=>{console.log("[DEBUG] 사이드바 토글 전:",{isSidebarOpen:y,sessionsCount:r.length,activeSessionId:c}),d(K=>!K),console.log("[DEBUG] 사이드바 토글 후")},Cr=async(K,ce)=>{const te=localStorage.getItem("auth_token");try{(await fetch(`/api/sessions/${K}/name`,{method:"PATCH",headers:{"Content-Type":"application/json",Authorization:`Bearer ${te}`},body:JSON.stringify({name:ce})})).ok?i(be=>be.map(Qe=>Qe.id===K?{...Qe,name:ce}:Qe)):console.error("Failed to rename session")}catch(Te){console.error("Failed to rename session:",Te)}},Ve=K=>{console.log("재연결 시도:",K),c===K?(h(null),setTimeout(()=>{h(K)},50)):h(K)},nr=K=>{K.preventDefault(),o(!0);const ce=K.clientX,te=a,Te=Qe=>{const pe=Qe.clientX-ce,ln=Math.max(180,Math.min(400,te+pe));l(ln)},be=()=>{o(!1),document.removeEventListener("mousemove",Te),document.removeEventListener("mouseup",be),document.body.style.cursor="",document.body.style.userSelect=""};document.addEventListener("mousemove",Te),document.addEventListener("mouseup",be),document.body.style.cursor="ew-resize",document.body.style.userSelect="none"};if(e.isLoading){const K=Dt[R.theme]||Dt.catppuccin;return L.jsxs("div",{style:{...de.loadingContainer,backgroundColor:K.ui.bg},children:[L.jsx("h1",{style:{...de.loadingLogo,color:K.ui.accent},children:M("appName")}),L.jsx("p",{style:{...de.loadingText,color:K.ui.textSecondary},children:M("loading")||"Loading..."})]})}if(e.needsSetup)return L.jsx(u_,{onComplete:z,language:R.language});if(!e.isAuthenticated)return L.jsx(h_,{onLogin:q,language:R.language});const J=Dt[R.theme]||Dt.catppuccin;return L.jsxs("div",{style:{...de.container,backgroundColor:J.ui.bg,height:g?`${p}px`:"100vh"},children:[L.jsxs("div",{style:{...de.header,backgroundColor:J.ui.bgSecondary,borderBottomColor:J.ui.border},children:[L.jsxs("div",{style:de.headerLeft,children:[L.jsx("button",{onClick:ei,style:{...de.hamburgerBtn,backgroundColor:"transparent",color:J.ui.iconColor},title:y?"Hide Sidebar":"Show Sidebar",children:y?L.jsx(kp,{size:20,strokeWidth:2}):L.jsx(Lp,{size:20,strokeWidth:2})}),L.jsx("h1",{style:{...de.title,color:J.ui.accent},children:M("appName")})]}),L.jsxs("div",{style:de.headerRight,children:[r.length>0&&L.jsxs("div",{style:{...de.sessionInfo,color:J.ui.text,backgroundColor:J.ui.bgTertiary,borderColor:J.ui.border},children:[L.jsx("span",{style:{color:J.ui.accent,fontWeight:"600"},children:r.findIndex(K=>K.id===c)+1}),L.jsx("span",{style:{color:J.ui.textSecondary},children:" / "}),L.jsx("span",{style:{color:J.ui.textSecondary},children:r.length})]}),g?L.jsxs(L.Fragment,{children:[L.jsx("button",{onClick:j,style:{...de.hamburgerBtn,backgroundColor:"transparent",color:J.ui.iconColor},title:"Scroll to bottom",children:L.jsx(sp,{size:20,strokeWidth:2})}),L.jsxs("div",{style:{position:"relative",height:"100%"},children:[L.jsx("button",{onClick:()=>S(!_),style:{...de.hamburgerBtn,backgroundColor:_?J.ui.bgTertiary:"transparent",color:J.ui.iconColor},children:L.jsx(Cp,{size:20,strokeWidth:2})}),_&&L.jsxs(L.Fragment,{children:[L.jsx("div",{style:de.menuOverlay,onClick:()=>S(!1)}),L.jsxs("div",{style:{...de.dropdown,backgroundColor:J.ui.bgSecondary,borderColor:J.ui.border},children:[L.jsxs("div",{style:{...de.dropdownItem,borderBottomColor:J.ui.border},children:[L.jsx("span",{style:{...de.dropdownLabel,color:J.ui.textSecondary},children:M("user")}),L.jsx("span",{style:{...de.dropdownValue,color:J.ui.accent},children:e.username})]}),L.jsxs("button",{onClick:()=>{Re(),S(!1)},onMouseEnter:()=>C("new"),onMouseLeave:()=>C(null),style:{...de.dropdownButton,color:J.ui.text,backgroundColor:w==="new"?J.ui.bgTertiary:"transparent"},children:[L.jsx(ja,{size:16,strokeWidth:2}),L.jsx("span",{children:M("newSession")})]}),L.jsxs("button",{onClick:()=>{f(!0),S(!1)},onMouseEnter:()=>C("settings"),onMouseLeave:()=>C(null),style:{...de.dropdownButton,color:J.ui.text,backgroundColor:w==="settings"?J.ui.bgTertiary:"transparent"},children:[L.jsx(Fa,{size:16,strokeWidth:2}),L.jsx("span",{children:M("settings")})]}),L.jsxs("button",{onClick:()=>{Q(),S(!1)},onMouseEnter:()=>C("logout"),onMouseLeave:()=>C(null),style:{...de.dropdownButton,color:J.red,backgroundColor:w==="logout"?J.ui.bgTertiary:"transparent"},children:[L.jsx(Ha,{size:16,strokeWidth:2}),L.jsx("span",{children:M("logout")})]})]})]})]})]}):L.jsxs(L.Fragment,{children:[L.jsx("button",{onClick:()=>f(!0),style:{...de.settingsBtn,color:J.ui.iconColor,borderColor:J.ui.border},title:M("settings"),children:L.jsx(Fa,{size:18,strokeWidth:2.5})}),L.jsx("button",{onClick:Q,style:{...de.logoutBtn,color:J.red,borderColor:J.ui.border},title:M("logout"),children:L.jsx(Ha,{size:18,strokeWidth:2.5})})]})]})]}),!T&&L.jsx("div",{ref:b,style:{...de.terminalContainer,paddingBottom:g?"45px":"0",backgroundColor:J.ui.bg,marginLeft:!g&&y?`${a}px`:"0",transition:s?"none":"margin-left 0.3s ease"},children:r.length===0?L.jsxs("div",{style:de.emptyState,children:[L.jsx("div",{style:{...de.emptyIcon,color:J.ui.textSecondary},children:L.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[L.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),L.jsx("path",{d:"M7 10l3 3-3 3"}),L.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})}),L.jsx("h2",{style:{...de.emptyTitle,color:J.ui.text},children:M("noTerminals")||"No Terminals Open"}),L.jsx("p",{style:{...de.emptyMessage,color:J.ui.textSecondary,opacity:.95},children:M("createFirstTerminal")||"Create a new terminal to get started"}),L.jsxs("button",{onClick:Re,style:{...de.emptyButton,backgroundColor:J.ui.accent,color:J.ui.bg},children:[L.jsx(ja,{size:20,strokeWidth:2.5}),L.jsx("span",{children:M("newSession")||"New Terminal"})]})]}):r.map(K=>L.jsx("div",{style:{display:K.id===c?"block":"none",width:"100%",height:"100%"},children:L.jsx(e_,{sessionId:K.id,settings:R,isActive:K.id===c})},K.id))}),T&&B&&L.jsx("div",{style:{position:"absolute",top:"36px",left:!g&&y?`${a}px`:"0",right:0,bottom:g?"45px":0,transition:s?"none":"left 0.3s ease"},children:L.jsx(d_,{filePath:B,onClose:Ee,theme:J})}),g&&L.jsx(r_,{onSendKey:D,isVisible:!0,activeSessionId:c,onOpenCommandInput:()=>H(!0)}),L.jsx(i_,{isOpen:F,onClose:()=>H(!1),onSend:$,command:W,setCommand:O,theme:J,t:M}),L.jsx(l_,{isOpen:y,onClose:()=>{console.log("[DEBUG] Sidebar onClose 호출됨:",{sessionsCount:r.length,activeSessionId:c}),d(!1)},sessions:r,activeSessionId:c,onSelectSession:jt,onNewSession:Re,onCloseSession:ee,onRenameSession:Cr,onReconnectSession:Ve,language:R.language,theme:J,isMobile:g,width:a,onResizeStart:nr,onFileSelect:G,onFolderSelect:ae}),L.jsx(s_,{isOpen:u,onClose:()=>f(!1),settings:R,onSave:Zr,theme:J,username:e.username}),L.jsx(a_,{isOpen:x.isOpen,title:x.title,message:x.message,confirmText:x.isLogout?M("logout"):M("close")||"Close",cancelText:M("cancel"),onConfirm:sr,onCancel:Jr,language:R.language,danger:!0,theme:J}),L.jsx(c_,{isOpen:v.isOpen,message:v.message,onClose:()=>k({isOpen:!1,message:""}),theme:J})]})}const de={loadingContainer:{width:"100%",height:"100%",display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",backgroundColor:"#1e1e2e",position:"fixed"},loadingLogo:{margin:0,fontSize:"28px",fontWeight:"700",color:"#89b4fa",marginBottom:"12px",textTransform:"uppercase"},loadingText:{margin:0,fontSize:"16px",color:"#6c7086"},container:{width:"100vw",height:"100vh",display:"flex",flexDirection:"column",backgroundColor:"#1e1e2e",position:"fixed",top:0,left:0,overflow:"hidden"},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"0",backgroundColor:"#181825",borderBottom:"1px solid #313244",flexShrink:0,height:"32px",boxSizing:"border-box"},headerLeft:{display:"flex",alignItems:"center",gap:"0",flexWrap:"nowrap",height:"100%"},headerRight:{display:"flex",alignItems:"center",gap:"0",height:"100%"},hamburgerBtn:{background:"none",border:"none",cursor:"pointer",padding:"0 10px",display:"flex",alignItems:"center",justifyContent:"center",borderRadius:"0",transition:"background-color 0.15s ease",height:"100%"},title:{margin:0,fontSize:"13px",fontWeight:"600",textTransform:"uppercase",padding:"0 12px",display:"flex",alignItems:"center",height:"100%"},sessionInfo:{fontSize:"12px",display:"flex",alignItems:"center",gap:"4px",padding:"0 12px",borderRight:"1px solid #313244",borderRadius:"0",height:"100%"},settingsBtn:{padding:"0 10px",backgroundColor:"transparent",border:"none",borderRight:"1px solid #313244",borderRadius:"0",cursor:"pointer",transition:"background-color 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",height:"100%"},logoutBtn:{padding:"0 10px",backgroundColor:"transparent",border:"none",borderRadius:"0",cursor:"pointer",transition:"background-color 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",height:"100%"},terminalContainer:{flex:1,overflow:"hidden",position:"relative",padding:"8px"},emptyState:{display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",height:"100%",gap:"20px",padding:"40px"},emptyIcon:{opacity:.5},emptyTitle:{margin:0,fontSize:"24px",fontWeight:"600"},emptyMessage:{margin:0,fontSize:"14px"},emptyButton:{display:"flex",alignItems:"center",gap:"8px",padding:"10px 20px",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"500",cursor:"pointer",transition:"opacity 0.15s ease",marginTop:"12px"},menuOverlay:{position:"fixed",top:0,left:0,right:0,bottom:0,width:"100%",height:"100vh",backgroundColor:"rgba(0, 0, 0, 0.5)",zIndex:9998},dropdown:{position:"absolute",top:"calc(100% + 4px)",right:0,minWidth:"180px",backgroundColor:"#181825",border:"1px solid #313244",borderRadius:"2px",zIndex:9999,overflow:"hidden"},dropdownItem:{padding:"8px 12px",borderBottom:"1px solid #313244",display:"flex",justifyContent:"space-between",alignItems:"center"},dropdownLabel:{fontSize:"12px",color:"#6c7086",fontWeight:"500",textTransform:"uppercase"},dropdownValue:{fontSize:"13px",fontWeight:"600"},dropdownButton:{width:"100%",padding:"10px 12px",background:"none",border:"none",color:"#cdd6f4",fontSize:"12px",fontWeight:"500",cursor:"pointer",display:"flex",alignItems:"center",gap:"8px",transition:"background-color 0.15s ease",textAlign:"left",lineHeight:"1"}};Hn.createRoot(document.getElementById("root")).render(L.jsx(bh.StrictMode,{children:L.jsx(v_,{})}));
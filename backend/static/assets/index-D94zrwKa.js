@@ -1,123 +0,0 @@
-const __vite__mapDeps=(i,m=__vite__mapDeps,d=(m.f||(m.f=["assets/Terminal-CbkHWI8J.js","assets/Terminal-Beg8tuEN.css","assets/MobileToolbar-B_evRuJW.js","assets/eraser-BcqNPBPW.js","assets/chevron-right-IUFAq8qT.js","assets/CommandInput-DnpUi1me.js","assets/x-C47bfFCx.js","assets/Sidebar-D2IV05Xr.js","assets/file-D2hfYiQo.js","assets/NotificationModal-CWql03-2.js","assets/FileEditor-CTGzdANj.js"])))=>i.map(i=>d[i]);
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function Vc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var ds={exports:{}},gl={},ps={exports:{}},M={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var cr=Symbol.for("react.element"),Hc=Symbol.for("react.portal"),Qc=Symbol.for("react.fragment"),Gc=Symbol.for("react.strict_mode"),Kc=Symbol.for("react.profiler"),Yc=Symbol.for("react.provider"),Xc=Symbol.for("react.context"),Zc=Symbol.for("react.forward_ref"),Jc=Symbol.for("react.suspense"),qc=Symbol.for("react.memo"),bc=Symbol.for("react.lazy"),Ji=Symbol.iterator;function ef(e){return e===null||typeof e!="object"?null:(e=Ji&&e[Ji]||e["@@iterator"],typeof e=="function"?e:null)}var ms={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},hs=Object.assign,gs={};function Sn(e,t,n){this.props=e,this.context=t,this.refs=gs,this.updater=n||ms}Sn.prototype.isReactComponent={};Sn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Sn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function vs(){}vs.prototype=Sn.prototype;function ti(e,t,n){this.props=e,this.context=t,this.refs=gs,this.updater=n||ms}var ni=ti.prototype=new vs;ni.constructor=ti;hs(ni,Sn.prototype);ni.isPureReactComponent=!0;var qi=Array.isArray,ys=Object.prototype.hasOwnProperty,ri={current:null},ws={key:!0,ref:!0,__self:!0,__source:!0};function Ss(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)ys.call(t,r)&&!ws.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:cr,type:e,key:o,ref:i,props:l,_owner:ri.current}}function tf(e,t){return{$$typeof:cr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function li(e){return typeof e=="object"&&e!==null&&e.$$typeof===cr}function nf(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var bi=/\/+/g;function jl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?nf(""+e.key):t.toString(36)}function Dr(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case cr:case Hc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+jl(i,0):r,qi(l)?(n="",e!=null&&(n=e.replace(bi,"$&/")+"/"),Dr(l,t,n,"",function(c){return c})):l!=null&&(li(l)&&(l=tf(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(bi,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",qi(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+jl(o,u);i+=Dr(o,t,n,s,l)}else if(s=ef(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+jl(o,u++),i+=Dr(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function vr(e,t,n){if(e==null)return e;var r=[],l=0;return Dr(e,r,"","",function(o){return t.call(n,o,l++)}),r}function rf(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var pe={current:null},Mr={transition:null},lf={ReactCurrentDispatcher:pe,ReactCurrentBatchConfig:Mr,ReactCurrentOwner:ri};function ks(){throw Error("act(...) is not supported in production builds of React.")}M.Children={map:vr,forEach:function(e,t,n){vr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return vr(e,function(){t++}),t},toArray:function(e){return vr(e,function(t){return t})||[]},only:function(e){if(!li(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};M.Component=Sn;M.Fragment=Qc;M.Profiler=Kc;M.PureComponent=ti;M.StrictMode=Gc;M.Suspense=Jc;M.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=lf;M.act=ks;M.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=hs({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=ri.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)ys.call(t,s)&&!ws.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:cr,type:e.type,key:l,ref:o,props:r,_owner:i}};M.createContext=function(e){return e={$$typeof:Xc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Yc,_context:e},e.Consumer=e};M.createElement=Ss;M.createFactory=function(e){var t=Ss.bind(null,e);return t.type=e,t};M.createRef=function(){return{current:null}};M.forwardRef=function(e){return{$$typeof:Zc,render:e}};M.isValidElement=li;M.lazy=function(e){return{$$typeof:bc,_payload:{_status:-1,_result:e},_init:rf}};M.memo=function(e,t){return{$$typeof:qc,type:e,compare:t===void 0?null:t}};M.startTransition=function(e){var t=Mr.transition;Mr.transition={};try{e()}finally{Mr.transition=t}};M.unstable_act=ks;M.useCallback=function(e,t){return pe.current.useCallback(e,t)};M.useContext=function(e){return pe.current.useContext(e)};M.useDebugValue=function(){};M.useDeferredValue=function(e){return pe.current.useDeferredValue(e)};M.useEffect=function(e,t){return pe.current.useEffect(e,t)};M.useId=function(){return pe.current.useId()};M.useImperativeHandle=function(e,t,n){return pe.current.useImperativeHandle(e,t,n)};M.useInsertionEffect=function(e,t){return pe.current.useInsertionEffect(e,t)};M.useLayoutEffect=function(e,t){return pe.current.useLayoutEffect(e,t)};M.useMemo=function(e,t){return pe.current.useMemo(e,t)};M.useReducer=function(e,t,n){return pe.current.useReducer(e,t,n)};M.useRef=function(e){return pe.current.useRef(e)};M.useState=function(e){return pe.current.useState(e)};M.useSyncExternalStore=function(e,t,n){return pe.current.useSyncExternalStore(e,t,n)};M.useTransition=function(){return pe.current.useTransition()};M.version="18.3.1";ps.exports=M;var N=ps.exports;const of=Vc(N);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var uf=N,sf=Symbol.for("react.element"),af=Symbol.for("react.fragment"),cf=Object.prototype.hasOwnProperty,ff=uf.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,df={key:!0,ref:!0,__self:!0,__source:!0};function xs(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)cf.call(t,r)&&!df.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:sf,type:e,key:o,ref:i,props:l,_owner:ff.current}}gl.Fragment=af;gl.jsx=xs;gl.jsxs=xs;ds.exports=gl;var x=ds.exports,uo={},Es={exports:{}},Pe={},Cs={exports:{}},_s={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(C,T){var j=C.length;C.push(T);e:for(;0<j;){var I=j-1>>>1,q=C[I];if(0<l(q,T))C[I]=T,C[j]=q,j=I;else break e}}function n(C){return C.length===0?null:C[0]}function r(C){if(C.length===0)return null;var T=C[0],j=C.pop();if(j!==T){C[0]=j;e:for(var I=0,q=C.length,Qt=q>>>1;I<Qt;){var We=2*(I+1)-1,_n=C[We],Xe=We+1,Gt=C[Xe];if(0>l(_n,j))Xe<q&&0>l(Gt,_n)?(C[I]=Gt,C[Xe]=j,I=Xe):(C[I]=_n,C[We]=j,I=We);else if(Xe<q&&0>l(Gt,j))C[I]=Gt,C[Xe]=j,I=Xe;else break e}}return T}function l(C,T){var j=C.sortIndex-T.sortIndex;return j!==0?j:C.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],c=[],h=1,m=null,p=3,y=!1,S=!1,k=!1,F=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function d(C){for(var T=n(c);T!==null;){if(T.callback===null)r(c);else if(T.startTime<=C)r(c),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(c)}}function g(C){if(k=!1,d(C),!S)if(n(s)!==null)S=!0,En(E);else{var T=n(c);T!==null&&Cn(g,T.startTime-C)}}function E(C,T){S=!1,k&&(k=!1,f(L),L=-1),y=!0;var j=p;try{for(d(T),m=n(s);m!==null&&(!(m.expirationTime>T)||C&&!he());){var I=m.callback;if(typeof I=="function"){m.callback=null,p=m.priorityLevel;var q=I(m.expirationTime<=T);T=e.unstable_now(),typeof q=="function"?m.callback=q:m===n(s)&&r(s),d(T)}else r(s);m=n(s)}if(m!==null)var Qt=!0;else{var We=n(c);We!==null&&Cn(g,We.startTime-T),Qt=!1}return Qt}finally{m=null,p=j,y=!1}}var P=!1,z=null,L=-1,Q=5,D=-1;function he(){return!(e.unstable_now()-D<Q)}function it(){if(z!==null){var C=e.unstable_now();D=C;var T=!0;try{T=z(!0,C)}finally{T?ut():(P=!1,z=null)}}else P=!1}var ut;if(typeof a=="function")ut=function(){a(it)};else if(typeof MessageChannel<"u"){var hr=new MessageChannel,gr=hr.port2;hr.port1.onmessage=it,ut=function(){gr.postMessage(null)}}else ut=function(){F(it,0)};function En(C){z=C,P||(P=!0,ut())}function Cn(C,T){L=F(function(){C(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(C){C.callback=null},e.unstable_continueExecution=function(){S||y||(S=!0,En(E))},e.unstable_forceFrameRate=function(C){0>C||125<C?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Q=0<C?Math.floor(1e3/C):5},e.unstable_getCurrentPriorityLevel=function(){return p},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(C){switch(p){case 1:case 2:case 3:var T=3;break;default:T=p}var j=p;p=T;try{return C()}finally{p=j}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(C,T){switch(C){case 1:case 2:case 3:case 4:case 5:break;default:C=3}var j=p;p=C;try{return T()}finally{p=j}},e.unstable_scheduleCallback=function(C,T,j){var I=e.unstable_now();switch(typeof j=="object"&&j!==null?(j=j.delay,j=typeof j=="number"&&0<j?I+j:I):j=I,C){case 1:var q=-1;break;case 2:q=250;break;case 5:q=1073741823;break;case 4:q=1e4;break;default:q=5e3}return q=j+q,C={id:h++,callback:T,priorityLevel:C,startTime:j,expirationTime:q,sortIndex:-1},j>I?(C.sortIndex=j,t(c,C),n(s)===null&&C===n(c)&&(k?(f(L),L=-1):k=!0,Cn(g,j-I))):(C.sortIndex=q,t(s,C),S||y||(S=!0,En(E))),C},e.unstable_shouldYield=he,e.unstable_wrapCallback=function(C){var T=p;return function(){var j=p;p=T;try{return C.apply(this,arguments)}finally{p=j}}}})(_s);Cs.exports=_s;var pf=Cs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var mf=N,_e=pf;function v(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Ps=new Set,Kn={};function Wt(e,t){pn(e,t),pn(e+"Capture",t)}function pn(e,t){for(Kn[e]=t,e=0;e<t.length;e++)Ps.add(t[e])}var tt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),so=Object.prototype.hasOwnProperty,hf=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,eu={},tu={};function gf(e){return so.call(tu,e)?!0:so.call(eu,e)?!1:hf.test(e)?tu[e]=!0:(eu[e]=!0,!1)}function vf(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function yf(e,t,n,r){if(t===null||typeof t>"u"||vf(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function me(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var ie={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ie[e]=new me(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ie[t]=new me(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ie[e]=new me(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ie[e]=new me(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ie[e]=new me(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ie[e]=new me(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ie[e]=new me(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ie[e]=new me(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ie[e]=new me(e,5,!1,e.toLowerCase(),null,!1,!1)});var oi=/[\-:]([a-z])/g;function ii(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(oi,ii);ie[t]=new me(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(oi,ii);ie[t]=new me(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(oi,ii);ie[t]=new me(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ie[e]=new me(e,1,!1,e.toLowerCase(),null,!1,!1)});ie.xlinkHref=new me("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ie[e]=new me(e,1,!1,e.toLowerCase(),null,!0,!0)});function ui(e,t,n,r){var l=ie.hasOwnProperty(t)?ie[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(yf(t,n,l,r)&&(n=null),r||l===null?gf(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var ot=mf.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,yr=Symbol.for("react.element"),Yt=Symbol.for("react.portal"),Xt=Symbol.for("react.fragment"),si=Symbol.for("react.strict_mode"),ao=Symbol.for("react.profiler"),zs=Symbol.for("react.provider"),Ls=Symbol.for("react.context"),ai=Symbol.for("react.forward_ref"),co=Symbol.for("react.suspense"),fo=Symbol.for("react.suspense_list"),ci=Symbol.for("react.memo"),at=Symbol.for("react.lazy"),Ts=Symbol.for("react.offscreen"),nu=Symbol.iterator;function Pn(e){return e===null||typeof e!="object"?null:(e=nu&&e[nu]||e["@@iterator"],typeof e=="function"?e:null)}var X=Object.assign,Dl;function Dn(e){if(Dl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Dl=t&&t[1]||""}return`
-`+Dl+e}var Ml=!1;function Ol(e,t){if(!e||Ml)return"";Ml=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{Ml=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Dn(e):""}function wf(e){switch(e.tag){case 5:return Dn(e.type);case 16:return Dn("Lazy");case 13:return Dn("Suspense");case 19:return Dn("SuspenseList");case 0:case 2:case 15:return e=Ol(e.type,!1),e;case 11:return e=Ol(e.type.render,!1),e;case 1:return e=Ol(e.type,!0),e;default:return""}}function po(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Xt:return"Fragment";case Yt:return"Portal";case ao:return"Profiler";case si:return"StrictMode";case co:return"Suspense";case fo:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Ls:return(e.displayName||"Context")+".Consumer";case zs:return(e._context.displayName||"Context")+".Provider";case ai:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ci:return t=e.displayName||null,t!==null?t:po(e.type)||"Memo";case at:t=e._payload,e=e._init;try{return po(e(t))}catch{}}return null}function Sf(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return po(t);case 8:return t===si?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Et(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Ns(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function kf(e){var t=Ns(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function wr(e){e._valueTracker||(e._valueTracker=kf(e))}function Is(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Ns(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Gr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function mo(e,t){var n=t.checked;return X({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function ru(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Et(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Rs(e,t){t=t.checked,t!=null&&ui(e,"checked",t,!1)}function ho(e,t){Rs(e,t);var n=Et(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?go(e,t.type,n):t.hasOwnProperty("defaultValue")&&go(e,t.type,Et(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function lu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function go(e,t,n){(t!=="number"||Gr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Mn=Array.isArray;function un(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Et(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function vo(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(v(91));return X({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function ou(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(v(92));if(Mn(n)){if(1<n.length)throw Error(v(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Et(n)}}function js(e,t){var n=Et(t.value),r=Et(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function iu(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Ds(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function yo(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Ds(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var Sr,Ms=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(Sr=Sr||document.createElement("div"),Sr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Sr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Yn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var An={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},xf=["Webkit","ms","Moz","O"];Object.keys(An).forEach(function(e){xf.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),An[t]=An[e]})});function Os(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||An.hasOwnProperty(e)&&An[e]?(""+t).trim():t+"px"}function Fs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Os(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Ef=X({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function wo(e,t){if(t){if(Ef[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(v(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(v(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(v(61))}if(t.style!=null&&typeof t.style!="object")throw Error(v(62))}}function So(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ko=null;function fi(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var xo=null,sn=null,an=null;function uu(e){if(e=pr(e)){if(typeof xo!="function")throw Error(v(280));var t=e.stateNode;t&&(t=kl(t),xo(e.stateNode,e.type,t))}}function As(e){sn?an?an.push(e):an=[e]:sn=e}function Us(){if(sn){var e=sn,t=an;if(an=sn=null,uu(e),t)for(e=0;e<t.length;e++)uu(t[e])}}function Bs(e,t){return e(t)}function $s(){}var Fl=!1;function Ws(e,t,n){if(Fl)return e(t,n);Fl=!0;try{return Bs(e,t,n)}finally{Fl=!1,(sn!==null||an!==null)&&($s(),Us())}}function Xn(e,t){var n=e.stateNode;if(n===null)return null;var r=kl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(v(231,t,typeof n));return n}var Eo=!1;if(tt)try{var zn={};Object.defineProperty(zn,"passive",{get:function(){Eo=!0}}),window.addEventListener("test",zn,zn),window.removeEventListener("test",zn,zn)}catch{Eo=!1}function Cf(e,t,n,r,l,o,i,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(h){this.onError(h)}}var Un=!1,Kr=null,Yr=!1,Co=null,_f={onError:function(e){Un=!0,Kr=e}};function Pf(e,t,n,r,l,o,i,u,s){Un=!1,Kr=null,Cf.apply(_f,arguments)}function zf(e,t,n,r,l,o,i,u,s){if(Pf.apply(this,arguments),Un){if(Un){var c=Kr;Un=!1,Kr=null}else throw Error(v(198));Yr||(Yr=!0,Co=c)}}function Vt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Vs(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function su(e){if(Vt(e)!==e)throw Error(v(188))}function Lf(e){var t=e.alternate;if(!t){if(t=Vt(e),t===null)throw Error(v(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return su(l),e;if(o===r)return su(l),t;o=o.sibling}throw Error(v(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(v(189))}}if(n.alternate!==r)throw Error(v(190))}if(n.tag!==3)throw Error(v(188));return n.stateNode.current===n?e:t}function Hs(e){return e=Lf(e),e!==null?Qs(e):null}function Qs(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Qs(e);if(t!==null)return t;e=e.sibling}return null}var Gs=_e.unstable_scheduleCallback,au=_e.unstable_cancelCallback,Tf=_e.unstable_shouldYield,Nf=_e.unstable_requestPaint,J=_e.unstable_now,If=_e.unstable_getCurrentPriorityLevel,di=_e.unstable_ImmediatePriority,Ks=_e.unstable_UserBlockingPriority,Xr=_e.unstable_NormalPriority,Rf=_e.unstable_LowPriority,Ys=_e.unstable_IdlePriority,vl=null,Ge=null;function jf(e){if(Ge&&typeof Ge.onCommitFiberRoot=="function")try{Ge.onCommitFiberRoot(vl,e,void 0,(e.current.flags&128)===128)}catch{}}var Ue=Math.clz32?Math.clz32:Of,Df=Math.log,Mf=Math.LN2;function Of(e){return e>>>=0,e===0?32:31-(Df(e)/Mf|0)|0}var kr=64,xr=4194304;function On(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Zr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=On(u):(o&=i,o!==0&&(r=On(o)))}else i=n&~l,i!==0?r=On(i):o!==0&&(r=On(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Ue(t),l=1<<n,r|=e[n],t&=~l;return r}function Ff(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Af(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-Ue(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=Ff(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function _o(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Xs(){var e=kr;return kr<<=1,!(kr&4194240)&&(kr=64),e}function Al(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function fr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Ue(t),e[t]=n}function Uf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Ue(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function pi(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Ue(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var A=0;function Zs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Js,mi,qs,bs,ea,Po=!1,Er=[],ht=null,gt=null,vt=null,Zn=new Map,Jn=new Map,ft=[],Bf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function cu(e,t){switch(e){case"focusin":case"focusout":ht=null;break;case"dragenter":case"dragleave":gt=null;break;case"mouseover":case"mouseout":vt=null;break;case"pointerover":case"pointerout":Zn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Jn.delete(t.pointerId)}}function Ln(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=pr(t),t!==null&&mi(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function $f(e,t,n,r,l){switch(t){case"focusin":return ht=Ln(ht,e,t,n,r,l),!0;case"dragenter":return gt=Ln(gt,e,t,n,r,l),!0;case"mouseover":return vt=Ln(vt,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return Zn.set(o,Ln(Zn.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,Jn.set(o,Ln(Jn.get(o)||null,e,t,n,r,l)),!0}return!1}function ta(e){var t=Rt(e.target);if(t!==null){var n=Vt(t);if(n!==null){if(t=n.tag,t===13){if(t=Vs(n),t!==null){e.blockedOn=t,ea(e.priority,function(){qs(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Or(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=zo(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ko=r,n.target.dispatchEvent(r),ko=null}else return t=pr(n),t!==null&&mi(t),e.blockedOn=n,!1;t.shift()}return!0}function fu(e,t,n){Or(e)&&n.delete(t)}function Wf(){Po=!1,ht!==null&&Or(ht)&&(ht=null),gt!==null&&Or(gt)&&(gt=null),vt!==null&&Or(vt)&&(vt=null),Zn.forEach(fu),Jn.forEach(fu)}function Tn(e,t){e.blockedOn===t&&(e.blockedOn=null,Po||(Po=!0,_e.unstable_scheduleCallback(_e.unstable_NormalPriority,Wf)))}function qn(e){function t(l){return Tn(l,e)}if(0<Er.length){Tn(Er[0],e);for(var n=1;n<Er.length;n++){var r=Er[n];r.blockedOn===e&&(r.blockedOn=null)}}for(ht!==null&&Tn(ht,e),gt!==null&&Tn(gt,e),vt!==null&&Tn(vt,e),Zn.forEach(t),Jn.forEach(t),n=0;n<ft.length;n++)r=ft[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<ft.length&&(n=ft[0],n.blockedOn===null);)ta(n),n.blockedOn===null&&ft.shift()}var cn=ot.ReactCurrentBatchConfig,Jr=!0;function Vf(e,t,n,r){var l=A,o=cn.transition;cn.transition=null;try{A=1,hi(e,t,n,r)}finally{A=l,cn.transition=o}}function Hf(e,t,n,r){var l=A,o=cn.transition;cn.transition=null;try{A=4,hi(e,t,n,r)}finally{A=l,cn.transition=o}}function hi(e,t,n,r){if(Jr){var l=zo(e,t,n,r);if(l===null)Yl(e,t,r,qr,n),cu(e,r);else if($f(l,e,t,n,r))r.stopPropagation();else if(cu(e,r),t&4&&-1<Bf.indexOf(e)){for(;l!==null;){var o=pr(l);if(o!==null&&Js(o),o=zo(e,t,n,r),o===null&&Yl(e,t,r,qr,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Yl(e,t,r,null,n)}}var qr=null;function zo(e,t,n,r){if(qr=null,e=fi(r),e=Rt(e),e!==null)if(t=Vt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Vs(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return qr=e,null}function na(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(If()){case di:return 1;case Ks:return 4;case Xr:case Rf:return 16;case Ys:return 536870912;default:return 16}default:return 16}}var pt=null,gi=null,Fr=null;function ra(){if(Fr)return Fr;var e,t=gi,n=t.length,r,l="value"in pt?pt.value:pt.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Fr=l.slice(e,1<r?1-r:void 0)}function Ar(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Cr(){return!0}function du(){return!1}function ze(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Cr:du,this.isPropagationStopped=du,this}return X(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Cr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Cr)},persist:function(){},isPersistent:Cr}),t}var kn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},vi=ze(kn),dr=X({},kn,{view:0,detail:0}),Qf=ze(dr),Ul,Bl,Nn,yl=X({},dr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:yi,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Nn&&(Nn&&e.type==="mousemove"?(Ul=e.screenX-Nn.screenX,Bl=e.screenY-Nn.screenY):Bl=Ul=0,Nn=e),Ul)},movementY:function(e){return"movementY"in e?e.movementY:Bl}}),pu=ze(yl),Gf=X({},yl,{dataTransfer:0}),Kf=ze(Gf),Yf=X({},dr,{relatedTarget:0}),$l=ze(Yf),Xf=X({},kn,{animationName:0,elapsedTime:0,pseudoElement:0}),Zf=ze(Xf),Jf=X({},kn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),qf=ze(Jf),bf=X({},kn,{data:0}),mu=ze(bf),ed={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},td={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},nd={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function rd(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=nd[e])?!!t[e]:!1}function yi(){return rd}var ld=X({},dr,{key:function(e){if(e.key){var t=ed[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Ar(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?td[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:yi,charCode:function(e){return e.type==="keypress"?Ar(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Ar(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),od=ze(ld),id=X({},yl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),hu=ze(id),ud=X({},dr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:yi}),sd=ze(ud),ad=X({},kn,{propertyName:0,elapsedTime:0,pseudoElement:0}),cd=ze(ad),fd=X({},yl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),dd=ze(fd),pd=[9,13,27,32],wi=tt&&"CompositionEvent"in window,Bn=null;tt&&"documentMode"in document&&(Bn=document.documentMode);var md=tt&&"TextEvent"in window&&!Bn,la=tt&&(!wi||Bn&&8<Bn&&11>=Bn),gu=" ",vu=!1;function oa(e,t){switch(e){case"keyup":return pd.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ia(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Zt=!1;function hd(e,t){switch(e){case"compositionend":return ia(t);case"keypress":return t.which!==32?null:(vu=!0,gu);case"textInput":return e=t.data,e===gu&&vu?null:e;default:return null}}function gd(e,t){if(Zt)return e==="compositionend"||!wi&&oa(e,t)?(e=ra(),Fr=gi=pt=null,Zt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return la&&t.locale!=="ko"?null:t.data;default:return null}}var vd={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function yu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!vd[e.type]:t==="textarea"}function ua(e,t,n,r){As(r),t=br(t,"onChange"),0<t.length&&(n=new vi("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var $n=null,bn=null;function yd(e){ya(e,0)}function wl(e){var t=bt(e);if(Is(t))return e}function wd(e,t){if(e==="change")return t}var sa=!1;if(tt){var Wl;if(tt){var Vl="oninput"in document;if(!Vl){var wu=document.createElement("div");wu.setAttribute("oninput","return;"),Vl=typeof wu.oninput=="function"}Wl=Vl}else Wl=!1;sa=Wl&&(!document.documentMode||9<document.documentMode)}function Su(){$n&&($n.detachEvent("onpropertychange",aa),bn=$n=null)}function aa(e){if(e.propertyName==="value"&&wl(bn)){var t=[];ua(t,bn,e,fi(e)),Ws(yd,t)}}function Sd(e,t,n){e==="focusin"?(Su(),$n=t,bn=n,$n.attachEvent("onpropertychange",aa)):e==="focusout"&&Su()}function kd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return wl(bn)}function xd(e,t){if(e==="click")return wl(t)}function Ed(e,t){if(e==="input"||e==="change")return wl(t)}function Cd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var $e=typeof Object.is=="function"?Object.is:Cd;function er(e,t){if($e(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!so.call(t,l)||!$e(e[l],t[l]))return!1}return!0}function ku(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function xu(e,t){var n=ku(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=ku(n)}}function ca(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ca(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function fa(){for(var e=window,t=Gr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Gr(e.document)}return t}function Si(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function _d(e){var t=fa(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ca(n.ownerDocument.documentElement,n)){if(r!==null&&Si(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=xu(n,o);var i=xu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Pd=tt&&"documentMode"in document&&11>=document.documentMode,Jt=null,Lo=null,Wn=null,To=!1;function Eu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;To||Jt==null||Jt!==Gr(r)||(r=Jt,"selectionStart"in r&&Si(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Wn&&er(Wn,r)||(Wn=r,r=br(Lo,"onSelect"),0<r.length&&(t=new vi("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Jt)))}function _r(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var qt={animationend:_r("Animation","AnimationEnd"),animationiteration:_r("Animation","AnimationIteration"),animationstart:_r("Animation","AnimationStart"),transitionend:_r("Transition","TransitionEnd")},Hl={},da={};tt&&(da=document.createElement("div").style,"AnimationEvent"in window||(delete qt.animationend.animation,delete qt.animationiteration.animation,delete qt.animationstart.animation),"TransitionEvent"in window||delete qt.transitionend.transition);function Sl(e){if(Hl[e])return Hl[e];if(!qt[e])return e;var t=qt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in da)return Hl[e]=t[n];return e}var pa=Sl("animationend"),ma=Sl("animationiteration"),ha=Sl("animationstart"),ga=Sl("transitionend"),va=new Map,Cu="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function _t(e,t){va.set(e,t),Wt(t,[e])}for(var Ql=0;Ql<Cu.length;Ql++){var Gl=Cu[Ql],zd=Gl.toLowerCase(),Ld=Gl[0].toUpperCase()+Gl.slice(1);_t(zd,"on"+Ld)}_t(pa,"onAnimationEnd");_t(ma,"onAnimationIteration");_t(ha,"onAnimationStart");_t("dblclick","onDoubleClick");_t("focusin","onFocus");_t("focusout","onBlur");_t(ga,"onTransitionEnd");pn("onMouseEnter",["mouseout","mouseover"]);pn("onMouseLeave",["mouseout","mouseover"]);pn("onPointerEnter",["pointerout","pointerover"]);pn("onPointerLeave",["pointerout","pointerover"]);Wt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Wt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Wt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Wt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Wt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Wt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Fn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Td=new Set("cancel close invalid load scroll toggle".split(" ").concat(Fn));function _u(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,zf(r,t,void 0,e),e.currentTarget=null}function ya(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;_u(l,u,c),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,c=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;_u(l,u,c),o=s}}}if(Yr)throw e=Co,Yr=!1,Co=null,e}function V(e,t){var n=t[Do];n===void 0&&(n=t[Do]=new Set);var r=e+"__bubble";n.has(r)||(wa(t,e,2,!1),n.add(r))}function Kl(e,t,n){var r=0;t&&(r|=4),wa(n,e,r,t)}var Pr="_reactListening"+Math.random().toString(36).slice(2);function tr(e){if(!e[Pr]){e[Pr]=!0,Ps.forEach(function(n){n!=="selectionchange"&&(Td.has(n)||Kl(n,!1,e),Kl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Pr]||(t[Pr]=!0,Kl("selectionchange",!1,t))}}function wa(e,t,n,r){switch(na(t)){case 1:var l=Vf;break;case 4:l=Hf;break;default:l=hi}n=l.bind(null,t,n,e),l=void 0,!Eo||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Yl(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Rt(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}Ws(function(){var c=o,h=fi(n),m=[];e:{var p=va.get(e);if(p!==void 0){var y=vi,S=e;switch(e){case"keypress":if(Ar(n)===0)break e;case"keydown":case"keyup":y=od;break;case"focusin":S="focus",y=$l;break;case"focusout":S="blur",y=$l;break;case"beforeblur":case"afterblur":y=$l;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":y=pu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":y=Kf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":y=sd;break;case pa:case ma:case ha:y=Zf;break;case ga:y=cd;break;case"scroll":y=Qf;break;case"wheel":y=dd;break;case"copy":case"cut":case"paste":y=qf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":y=hu}var k=(t&4)!==0,F=!k&&e==="scroll",f=k?p!==null?p+"Capture":null:p;k=[];for(var a=c,d;a!==null;){d=a;var g=d.stateNode;if(d.tag===5&&g!==null&&(d=g,f!==null&&(g=Xn(a,f),g!=null&&k.push(nr(a,g,d)))),F)break;a=a.return}0<k.length&&(p=new y(p,S,null,n,h),m.push({event:p,listeners:k}))}}if(!(t&7)){e:{if(p=e==="mouseover"||e==="pointerover",y=e==="mouseout"||e==="pointerout",p&&n!==ko&&(S=n.relatedTarget||n.fromElement)&&(Rt(S)||S[nt]))break e;if((y||p)&&(p=h.window===h?h:(p=h.ownerDocument)?p.defaultView||p.parentWindow:window,y?(S=n.relatedTarget||n.toElement,y=c,S=S?Rt(S):null,S!==null&&(F=Vt(S),S!==F||S.tag!==5&&S.tag!==6)&&(S=null)):(y=null,S=c),y!==S)){if(k=pu,g="onMouseLeave",f="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=hu,g="onPointerLeave",f="onPointerEnter",a="pointer"),F=y==null?p:bt(y),d=S==null?p:bt(S),p=new k(g,a+"leave",y,n,h),p.target=F,p.relatedTarget=d,g=null,Rt(h)===c&&(k=new k(f,a+"enter",S,n,h),k.target=d,k.relatedTarget=F,g=k),F=g,y&&S)t:{for(k=y,f=S,a=0,d=k;d;d=Kt(d))a++;for(d=0,g=f;g;g=Kt(g))d++;for(;0<a-d;)k=Kt(k),a--;for(;0<d-a;)f=Kt(f),d--;for(;a--;){if(k===f||f!==null&&k===f.alternate)break t;k=Kt(k),f=Kt(f)}k=null}else k=null;y!==null&&Pu(m,p,y,k,!1),S!==null&&F!==null&&Pu(m,F,S,k,!0)}}e:{if(p=c?bt(c):window,y=p.nodeName&&p.nodeName.toLowerCase(),y==="select"||y==="input"&&p.type==="file")var E=wd;else if(yu(p))if(sa)E=Ed;else{E=kd;var P=Sd}else(y=p.nodeName)&&y.toLowerCase()==="input"&&(p.type==="checkbox"||p.type==="radio")&&(E=xd);if(E&&(E=E(e,c))){ua(m,E,n,h);break e}P&&P(e,p,c),e==="focusout"&&(P=p._wrapperState)&&P.controlled&&p.type==="number"&&go(p,"number",p.value)}switch(P=c?bt(c):window,e){case"focusin":(yu(P)||P.contentEditable==="true")&&(Jt=P,Lo=c,Wn=null);break;case"focusout":Wn=Lo=Jt=null;break;case"mousedown":To=!0;break;case"contextmenu":case"mouseup":case"dragend":To=!1,Eu(m,n,h);break;case"selectionchange":if(Pd)break;case"keydown":case"keyup":Eu(m,n,h)}var z;if(wi)e:{switch(e){case"compositionstart":var L="onCompositionStart";break e;case"compositionend":L="onCompositionEnd";break e;case"compositionupdate":L="onCompositionUpdate";break e}L=void 0}else Zt?oa(e,n)&&(L="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(L="onCompositionStart");L&&(la&&n.locale!=="ko"&&(Zt||L!=="onCompositionStart"?L==="onCompositionEnd"&&Zt&&(z=ra()):(pt=h,gi="value"in pt?pt.value:pt.textContent,Zt=!0)),P=br(c,L),0<P.length&&(L=new mu(L,e,null,n,h),m.push({event:L,listeners:P}),z?L.data=z:(z=ia(n),z!==null&&(L.data=z)))),(z=md?hd(e,n):gd(e,n))&&(c=br(c,"onBeforeInput"),0<c.length&&(h=new mu("onBeforeInput","beforeinput",null,n,h),m.push({event:h,listeners:c}),h.data=z))}ya(m,t)})}function nr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function br(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Xn(e,n),o!=null&&r.unshift(nr(e,o,l)),o=Xn(e,t),o!=null&&r.push(nr(e,o,l))),e=e.return}return r}function Kt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Pu(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Xn(n,o),s!=null&&i.unshift(nr(n,s,u))):l||(s=Xn(n,o),s!=null&&i.push(nr(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var Nd=/\r\n?/g,Id=/\u0000|\uFFFD/g;function zu(e){return(typeof e=="string"?e:""+e).replace(Nd,`
-`).replace(Id,"")}function zr(e,t,n){if(t=zu(t),zu(e)!==t&&n)throw Error(v(425))}function el(){}var No=null,Io=null;function Ro(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var jo=typeof setTimeout=="function"?setTimeout:void 0,Rd=typeof clearTimeout=="function"?clearTimeout:void 0,Lu=typeof Promise=="function"?Promise:void 0,jd=typeof queueMicrotask=="function"?queueMicrotask:typeof Lu<"u"?function(e){return Lu.resolve(null).then(e).catch(Dd)}:jo;function Dd(e){setTimeout(function(){throw e})}function Xl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),qn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);qn(t)}function yt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Tu(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var xn=Math.random().toString(36).slice(2),Qe="__reactFiber$"+xn,rr="__reactProps$"+xn,nt="__reactContainer$"+xn,Do="__reactEvents$"+xn,Md="__reactListeners$"+xn,Od="__reactHandles$"+xn;function Rt(e){var t=e[Qe];if(t)return t;for(var n=e.parentNode;n;){if(t=n[nt]||n[Qe]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Tu(e);e!==null;){if(n=e[Qe])return n;e=Tu(e)}return t}e=n,n=e.parentNode}return null}function pr(e){return e=e[Qe]||e[nt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function bt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(v(33))}function kl(e){return e[rr]||null}var Mo=[],en=-1;function Pt(e){return{current:e}}function H(e){0>en||(e.current=Mo[en],Mo[en]=null,en--)}function W(e,t){en++,Mo[en]=e.current,e.current=t}var Ct={},ce=Pt(Ct),we=Pt(!1),Ft=Ct;function mn(e,t){var n=e.type.contextTypes;if(!n)return Ct;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function Se(e){return e=e.childContextTypes,e!=null}function tl(){H(we),H(ce)}function Nu(e,t,n){if(ce.current!==Ct)throw Error(v(168));W(ce,t),W(we,n)}function Sa(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(v(108,Sf(e)||"Unknown",l));return X({},n,r)}function nl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ct,Ft=ce.current,W(ce,e),W(we,we.current),!0}function Iu(e,t,n){var r=e.stateNode;if(!r)throw Error(v(169));n?(e=Sa(e,t,Ft),r.__reactInternalMemoizedMergedChildContext=e,H(we),H(ce),W(ce,e)):H(we),W(we,n)}var Je=null,xl=!1,Zl=!1;function ka(e){Je===null?Je=[e]:Je.push(e)}function Fd(e){xl=!0,ka(e)}function zt(){if(!Zl&&Je!==null){Zl=!0;var e=0,t=A;try{var n=Je;for(A=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}Je=null,xl=!1}catch(l){throw Je!==null&&(Je=Je.slice(e+1)),Gs(di,zt),l}finally{A=t,Zl=!1}}return null}var tn=[],nn=0,rl=null,ll=0,Le=[],Te=0,At=null,qe=1,be="";function Tt(e,t){tn[nn++]=ll,tn[nn++]=rl,rl=e,ll=t}function xa(e,t,n){Le[Te++]=qe,Le[Te++]=be,Le[Te++]=At,At=e;var r=qe;e=be;var l=32-Ue(r)-1;r&=~(1<<l),n+=1;var o=32-Ue(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,qe=1<<32-Ue(t)+l|n<<l|r,be=o+e}else qe=1<<o|n<<l|r,be=e}function ki(e){e.return!==null&&(Tt(e,1),xa(e,1,0))}function xi(e){for(;e===rl;)rl=tn[--nn],tn[nn]=null,ll=tn[--nn],tn[nn]=null;for(;e===At;)At=Le[--Te],Le[Te]=null,be=Le[--Te],Le[Te]=null,qe=Le[--Te],Le[Te]=null}var Ce=null,Ee=null,G=!1,Ae=null;function Ea(e,t){var n=Ne(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Ru(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ce=e,Ee=yt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ce=e,Ee=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=At!==null?{id:qe,overflow:be}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Ne(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ce=e,Ee=null,!0):!1;default:return!1}}function Oo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Fo(e){if(G){var t=Ee;if(t){var n=t;if(!Ru(e,t)){if(Oo(e))throw Error(v(418));t=yt(n.nextSibling);var r=Ce;t&&Ru(e,t)?Ea(r,n):(e.flags=e.flags&-4097|2,G=!1,Ce=e)}}else{if(Oo(e))throw Error(v(418));e.flags=e.flags&-4097|2,G=!1,Ce=e}}}function ju(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ce=e}function Lr(e){if(e!==Ce)return!1;if(!G)return ju(e),G=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Ro(e.type,e.memoizedProps)),t&&(t=Ee)){if(Oo(e))throw Ca(),Error(v(418));for(;t;)Ea(e,t),t=yt(t.nextSibling)}if(ju(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(v(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Ee=yt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Ee=null}}else Ee=Ce?yt(e.stateNode.nextSibling):null;return!0}function Ca(){for(var e=Ee;e;)e=yt(e.nextSibling)}function hn(){Ee=Ce=null,G=!1}function Ei(e){Ae===null?Ae=[e]:Ae.push(e)}var Ad=ot.ReactCurrentBatchConfig;function In(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(v(309));var r=n.stateNode}if(!r)throw Error(v(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(v(284));if(!n._owner)throw Error(v(290,e))}return e}function Tr(e,t){throw e=Object.prototype.toString.call(t),Error(v(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Du(e){var t=e._init;return t(e._payload)}function _a(e){function t(f,a){if(e){var d=f.deletions;d===null?(f.deletions=[a],f.flags|=16):d.push(a)}}function n(f,a){if(!e)return null;for(;a!==null;)t(f,a),a=a.sibling;return null}function r(f,a){for(f=new Map;a!==null;)a.key!==null?f.set(a.key,a):f.set(a.index,a),a=a.sibling;return f}function l(f,a){return f=xt(f,a),f.index=0,f.sibling=null,f}function o(f,a,d){return f.index=d,e?(d=f.alternate,d!==null?(d=d.index,d<a?(f.flags|=2,a):d):(f.flags|=2,a)):(f.flags|=1048576,a)}function i(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,a,d,g){return a===null||a.tag!==6?(a=ro(d,f.mode,g),a.return=f,a):(a=l(a,d),a.return=f,a)}function s(f,a,d,g){var E=d.type;return E===Xt?h(f,a,d.props.children,g,d.key):a!==null&&(a.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===at&&Du(E)===a.type)?(g=l(a,d.props),g.ref=In(f,a,d),g.return=f,g):(g=Qr(d.type,d.key,d.props,null,f.mode,g),g.ref=In(f,a,d),g.return=f,g)}function c(f,a,d,g){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=lo(d,f.mode,g),a.return=f,a):(a=l(a,d.children||[]),a.return=f,a)}function h(f,a,d,g,E){return a===null||a.tag!==7?(a=Ot(d,f.mode,g,E),a.return=f,a):(a=l(a,d),a.return=f,a)}function m(f,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=ro(""+a,f.mode,d),a.return=f,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case yr:return d=Qr(a.type,a.key,a.props,null,f.mode,d),d.ref=In(f,null,a),d.return=f,d;case Yt:return a=lo(a,f.mode,d),a.return=f,a;case at:var g=a._init;return m(f,g(a._payload),d)}if(Mn(a)||Pn(a))return a=Ot(a,f.mode,d,null),a.return=f,a;Tr(f,a)}return null}function p(f,a,d,g){var E=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return E!==null?null:u(f,a,""+d,g);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case yr:return d.key===E?s(f,a,d,g):null;case Yt:return d.key===E?c(f,a,d,g):null;case at:return E=d._init,p(f,a,E(d._payload),g)}if(Mn(d)||Pn(d))return E!==null?null:h(f,a,d,g,null);Tr(f,d)}return null}function y(f,a,d,g,E){if(typeof g=="string"&&g!==""||typeof g=="number")return f=f.get(d)||null,u(a,f,""+g,E);if(typeof g=="object"&&g!==null){switch(g.$$typeof){case yr:return f=f.get(g.key===null?d:g.key)||null,s(a,f,g,E);case Yt:return f=f.get(g.key===null?d:g.key)||null,c(a,f,g,E);case at:var P=g._init;return y(f,a,d,P(g._payload),E)}if(Mn(g)||Pn(g))return f=f.get(d)||null,h(a,f,g,E,null);Tr(a,g)}return null}function S(f,a,d,g){for(var E=null,P=null,z=a,L=a=0,Q=null;z!==null&&L<d.length;L++){z.index>L?(Q=z,z=null):Q=z.sibling;var D=p(f,z,d[L],g);if(D===null){z===null&&(z=Q);break}e&&z&&D.alternate===null&&t(f,z),a=o(D,a,L),P===null?E=D:P.sibling=D,P=D,z=Q}if(L===d.length)return n(f,z),G&&Tt(f,L),E;if(z===null){for(;L<d.length;L++)z=m(f,d[L],g),z!==null&&(a=o(z,a,L),P===null?E=z:P.sibling=z,P=z);return G&&Tt(f,L),E}for(z=r(f,z);L<d.length;L++)Q=y(z,f,L,d[L],g),Q!==null&&(e&&Q.alternate!==null&&z.delete(Q.key===null?L:Q.key),a=o(Q,a,L),P===null?E=Q:P.sibling=Q,P=Q);return e&&z.forEach(function(he){return t(f,he)}),G&&Tt(f,L),E}function k(f,a,d,g){var E=Pn(d);if(typeof E!="function")throw Error(v(150));if(d=E.call(d),d==null)throw Error(v(151));for(var P=E=null,z=a,L=a=0,Q=null,D=d.next();z!==null&&!D.done;L++,D=d.next()){z.index>L?(Q=z,z=null):Q=z.sibling;var he=p(f,z,D.value,g);if(he===null){z===null&&(z=Q);break}e&&z&&he.alternate===null&&t(f,z),a=o(he,a,L),P===null?E=he:P.sibling=he,P=he,z=Q}if(D.done)return n(f,z),G&&Tt(f,L),E;if(z===null){for(;!D.done;L++,D=d.next())D=m(f,D.value,g),D!==null&&(a=o(D,a,L),P===null?E=D:P.sibling=D,P=D);return G&&Tt(f,L),E}for(z=r(f,z);!D.done;L++,D=d.next())D=y(z,f,L,D.value,g),D!==null&&(e&&D.alternate!==null&&z.delete(D.key===null?L:D.key),a=o(D,a,L),P===null?E=D:P.sibling=D,P=D);return e&&z.forEach(function(it){return t(f,it)}),G&&Tt(f,L),E}function F(f,a,d,g){if(typeof d=="object"&&d!==null&&d.type===Xt&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case yr:e:{for(var E=d.key,P=a;P!==null;){if(P.key===E){if(E=d.type,E===Xt){if(P.tag===7){n(f,P.sibling),a=l(P,d.props.children),a.return=f,f=a;break e}}else if(P.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===at&&Du(E)===P.type){n(f,P.sibling),a=l(P,d.props),a.ref=In(f,P,d),a.return=f,f=a;break e}n(f,P);break}else t(f,P);P=P.sibling}d.type===Xt?(a=Ot(d.props.children,f.mode,g,d.key),a.return=f,f=a):(g=Qr(d.type,d.key,d.props,null,f.mode,g),g.ref=In(f,a,d),g.return=f,f=g)}return i(f);case Yt:e:{for(P=d.key;a!==null;){if(a.key===P)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(f,a.sibling),a=l(a,d.children||[]),a.return=f,f=a;break e}else{n(f,a);break}else t(f,a);a=a.sibling}a=lo(d,f.mode,g),a.return=f,f=a}return i(f);case at:return P=d._init,F(f,a,P(d._payload),g)}if(Mn(d))return S(f,a,d,g);if(Pn(d))return k(f,a,d,g);Tr(f,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(f,a.sibling),a=l(a,d),a.return=f,f=a):(n(f,a),a=ro(d,f.mode,g),a.return=f,f=a),i(f)):n(f,a)}return F}var gn=_a(!0),Pa=_a(!1),ol=Pt(null),il=null,rn=null,Ci=null;function _i(){Ci=rn=il=null}function Pi(e){var t=ol.current;H(ol),e._currentValue=t}function Ao(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function fn(e,t){il=e,Ci=rn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(ye=!0),e.firstContext=null)}function Re(e){var t=e._currentValue;if(Ci!==e)if(e={context:e,memoizedValue:t,next:null},rn===null){if(il===null)throw Error(v(308));rn=e,il.dependencies={lanes:0,firstContext:e}}else rn=rn.next=e;return t}var jt=null;function zi(e){jt===null?jt=[e]:jt.push(e)}function za(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,zi(t)):(n.next=l.next,l.next=n),t.interleaved=n,rt(e,r)}function rt(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var ct=!1;function Li(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function La(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function et(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function wt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,O&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,rt(e,n)}return l=r.interleaved,l===null?(t.next=t,zi(r)):(t.next=l.next,l.next=t),r.interleaved=t,rt(e,n)}function Ur(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,pi(e,n)}}function Mu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function ul(e,t,n,r){var l=e.updateQueue;ct=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,i===null?o=c:i.next=c,i=s;var h=e.alternate;h!==null&&(h=h.updateQueue,u=h.lastBaseUpdate,u!==i&&(u===null?h.firstBaseUpdate=c:u.next=c,h.lastBaseUpdate=s))}if(o!==null){var m=l.baseState;i=0,h=c=s=null,u=o;do{var p=u.lane,y=u.eventTime;if((r&p)===p){h!==null&&(h=h.next={eventTime:y,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var S=e,k=u;switch(p=t,y=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){m=S.call(y,m,p);break e}m=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,p=typeof S=="function"?S.call(y,m,p):S,p==null)break e;m=X({},m,p);break e;case 2:ct=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,p=l.effects,p===null?l.effects=[u]:p.push(u))}else y={eventTime:y,lane:p,tag:u.tag,payload:u.payload,callback:u.callback,next:null},h===null?(c=h=y,s=m):h=h.next=y,i|=p;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;p=u,u=p.next,p.next=null,l.lastBaseUpdate=p,l.shared.pending=null}}while(!0);if(h===null&&(s=m),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Bt|=i,e.lanes=i,e.memoizedState=m}}function Ou(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(v(191,l));l.call(r)}}}var mr={},Ke=Pt(mr),lr=Pt(mr),or=Pt(mr);function Dt(e){if(e===mr)throw Error(v(174));return e}function Ti(e,t){switch(W(or,t),W(lr,e),W(Ke,mr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:yo(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=yo(t,e)}H(Ke),W(Ke,t)}function vn(){H(Ke),H(lr),H(or)}function Ta(e){Dt(or.current);var t=Dt(Ke.current),n=yo(t,e.type);t!==n&&(W(lr,e),W(Ke,n))}function Ni(e){lr.current===e&&(H(Ke),H(lr))}var K=Pt(0);function sl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Jl=[];function Ii(){for(var e=0;e<Jl.length;e++)Jl[e]._workInProgressVersionPrimary=null;Jl.length=0}var Br=ot.ReactCurrentDispatcher,ql=ot.ReactCurrentBatchConfig,Ut=0,Y=null,ee=null,ne=null,al=!1,Vn=!1,ir=0,Ud=0;function ue(){throw Error(v(321))}function Ri(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!$e(e[n],t[n]))return!1;return!0}function ji(e,t,n,r,l,o){if(Ut=o,Y=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Br.current=e===null||e.memoizedState===null?Vd:Hd,e=n(r,l),Vn){o=0;do{if(Vn=!1,ir=0,25<=o)throw Error(v(301));o+=1,ne=ee=null,t.updateQueue=null,Br.current=Qd,e=n(r,l)}while(Vn)}if(Br.current=cl,t=ee!==null&&ee.next!==null,Ut=0,ne=ee=Y=null,al=!1,t)throw Error(v(300));return e}function Di(){var e=ir!==0;return ir=0,e}function He(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ne===null?Y.memoizedState=ne=e:ne=ne.next=e,ne}function je(){if(ee===null){var e=Y.alternate;e=e!==null?e.memoizedState:null}else e=ee.next;var t=ne===null?Y.memoizedState:ne.next;if(t!==null)ne=t,ee=e;else{if(e===null)throw Error(v(310));ee=e,e={memoizedState:ee.memoizedState,baseState:ee.baseState,baseQueue:ee.baseQueue,queue:ee.queue,next:null},ne===null?Y.memoizedState=ne=e:ne=ne.next=e}return ne}function ur(e,t){return typeof t=="function"?t(e):t}function bl(e){var t=je(),n=t.queue;if(n===null)throw Error(v(311));n.lastRenderedReducer=e;var r=ee,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var h=c.lane;if((Ut&h)===h)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var m={lane:h,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=m,i=r):s=s.next=m,Y.lanes|=h,Bt|=h}c=c.next}while(c!==null&&c!==o);s===null?i=r:s.next=u,$e(r,t.memoizedState)||(ye=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,Y.lanes|=o,Bt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function eo(e){var t=je(),n=t.queue;if(n===null)throw Error(v(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);$e(o,t.memoizedState)||(ye=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function Na(){}function Ia(e,t){var n=Y,r=je(),l=t(),o=!$e(r.memoizedState,l);if(o&&(r.memoizedState=l,ye=!0),r=r.queue,Mi(Da.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||ne!==null&&ne.memoizedState.tag&1){if(n.flags|=2048,sr(9,ja.bind(null,n,r,l,t),void 0,null),re===null)throw Error(v(349));Ut&30||Ra(n,t,l)}return l}function Ra(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=Y.updateQueue,t===null?(t={lastEffect:null,stores:null},Y.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function ja(e,t,n,r){t.value=n,t.getSnapshot=r,Ma(t)&&Oa(e)}function Da(e,t,n){return n(function(){Ma(t)&&Oa(e)})}function Ma(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!$e(e,n)}catch{return!0}}function Oa(e){var t=rt(e,1);t!==null&&Be(t,e,1,-1)}function Fu(e){var t=He();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:ur,lastRenderedState:e},t.queue=e,e=e.dispatch=Wd.bind(null,Y,e),[t.memoizedState,e]}function sr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=Y.updateQueue,t===null?(t={lastEffect:null,stores:null},Y.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Fa(){return je().memoizedState}function $r(e,t,n,r){var l=He();Y.flags|=e,l.memoizedState=sr(1|t,n,void 0,r===void 0?null:r)}function El(e,t,n,r){var l=je();r=r===void 0?null:r;var o=void 0;if(ee!==null){var i=ee.memoizedState;if(o=i.destroy,r!==null&&Ri(r,i.deps)){l.memoizedState=sr(t,n,o,r);return}}Y.flags|=e,l.memoizedState=sr(1|t,n,o,r)}function Au(e,t){return $r(8390656,8,e,t)}function Mi(e,t){return El(2048,8,e,t)}function Aa(e,t){return El(4,2,e,t)}function Ua(e,t){return El(4,4,e,t)}function Ba(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function $a(e,t,n){return n=n!=null?n.concat([e]):null,El(4,4,Ba.bind(null,t,e),n)}function Oi(){}function Wa(e,t){var n=je();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Ri(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Va(e,t){var n=je();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Ri(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ha(e,t,n){return Ut&21?($e(n,t)||(n=Xs(),Y.lanes|=n,Bt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ye=!0),e.memoizedState=n)}function Bd(e,t){var n=A;A=n!==0&&4>n?n:4,e(!0);var r=ql.transition;ql.transition={};try{e(!1),t()}finally{A=n,ql.transition=r}}function Qa(){return je().memoizedState}function $d(e,t,n){var r=kt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ga(e))Ka(t,n);else if(n=za(e,t,n,r),n!==null){var l=de();Be(n,e,r,l),Ya(n,t,r)}}function Wd(e,t,n){var r=kt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ga(e))Ka(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,$e(u,i)){var s=t.interleaved;s===null?(l.next=l,zi(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=za(e,t,l,r),n!==null&&(l=de(),Be(n,e,r,l),Ya(n,t,r))}}function Ga(e){var t=e.alternate;return e===Y||t!==null&&t===Y}function Ka(e,t){Vn=al=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ya(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,pi(e,n)}}var cl={readContext:Re,useCallback:ue,useContext:ue,useEffect:ue,useImperativeHandle:ue,useInsertionEffect:ue,useLayoutEffect:ue,useMemo:ue,useReducer:ue,useRef:ue,useState:ue,useDebugValue:ue,useDeferredValue:ue,useTransition:ue,useMutableSource:ue,useSyncExternalStore:ue,useId:ue,unstable_isNewReconciler:!1},Vd={readContext:Re,useCallback:function(e,t){return He().memoizedState=[e,t===void 0?null:t],e},useContext:Re,useEffect:Au,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,$r(4194308,4,Ba.bind(null,t,e),n)},useLayoutEffect:function(e,t){return $r(4194308,4,e,t)},useInsertionEffect:function(e,t){return $r(4,2,e,t)},useMemo:function(e,t){var n=He();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=He();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=$d.bind(null,Y,e),[r.memoizedState,e]},useRef:function(e){var t=He();return e={current:e},t.memoizedState=e},useState:Fu,useDebugValue:Oi,useDeferredValue:function(e){return He().memoizedState=e},useTransition:function(){var e=Fu(!1),t=e[0];return e=Bd.bind(null,e[1]),He().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=Y,l=He();if(G){if(n===void 0)throw Error(v(407));n=n()}else{if(n=t(),re===null)throw Error(v(349));Ut&30||Ra(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Au(Da.bind(null,r,o,e),[e]),r.flags|=2048,sr(9,ja.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=He(),t=re.identifierPrefix;if(G){var n=be,r=qe;n=(r&~(1<<32-Ue(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ir++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Ud++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Hd={readContext:Re,useCallback:Wa,useContext:Re,useEffect:Mi,useImperativeHandle:$a,useInsertionEffect:Aa,useLayoutEffect:Ua,useMemo:Va,useReducer:bl,useRef:Fa,useState:function(){return bl(ur)},useDebugValue:Oi,useDeferredValue:function(e){var t=je();return Ha(t,ee.memoizedState,e)},useTransition:function(){var e=bl(ur)[0],t=je().memoizedState;return[e,t]},useMutableSource:Na,useSyncExternalStore:Ia,useId:Qa,unstable_isNewReconciler:!1},Qd={readContext:Re,useCallback:Wa,useContext:Re,useEffect:Mi,useImperativeHandle:$a,useInsertionEffect:Aa,useLayoutEffect:Ua,useMemo:Va,useReducer:eo,useRef:Fa,useState:function(){return eo(ur)},useDebugValue:Oi,useDeferredValue:function(e){var t=je();return ee===null?t.memoizedState=e:Ha(t,ee.memoizedState,e)},useTransition:function(){var e=eo(ur)[0],t=je().memoizedState;return[e,t]},useMutableSource:Na,useSyncExternalStore:Ia,useId:Qa,unstable_isNewReconciler:!1};function Oe(e,t){if(e&&e.defaultProps){t=X({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Uo(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:X({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Cl={isMounted:function(e){return(e=e._reactInternals)?Vt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=de(),l=kt(e),o=et(r,l);o.payload=t,n!=null&&(o.callback=n),t=wt(e,o,l),t!==null&&(Be(t,e,l,r),Ur(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=de(),l=kt(e),o=et(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=wt(e,o,l),t!==null&&(Be(t,e,l,r),Ur(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=de(),r=kt(e),l=et(n,r);l.tag=2,t!=null&&(l.callback=t),t=wt(e,l,r),t!==null&&(Be(t,e,r,n),Ur(t,e,r))}};function Uu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!er(n,r)||!er(l,o):!0}function Xa(e,t,n){var r=!1,l=Ct,o=t.contextType;return typeof o=="object"&&o!==null?o=Re(o):(l=Se(t)?Ft:ce.current,r=t.contextTypes,o=(r=r!=null)?mn(e,l):Ct),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Cl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Bu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Cl.enqueueReplaceState(t,t.state,null)}function Bo(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Li(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Re(o):(o=Se(t)?Ft:ce.current,l.context=mn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Uo(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&Cl.enqueueReplaceState(l,l.state,null),ul(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function yn(e,t){try{var n="",r=t;do n+=wf(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function to(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function $o(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Gd=typeof WeakMap=="function"?WeakMap:Map;function Za(e,t,n){n=et(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){dl||(dl=!0,Jo=r),$o(e,t)},n}function Ja(e,t,n){n=et(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){$o(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){$o(e,t),typeof r!="function"&&(St===null?St=new Set([this]):St.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function $u(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Gd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=ip.bind(null,e,t,n),t.then(e,e))}function Wu(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Vu(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=et(-1,1),t.tag=2,wt(n,t,1))),n.lanes|=1),e)}var Kd=ot.ReactCurrentOwner,ye=!1;function fe(e,t,n,r){t.child=e===null?Pa(t,null,n,r):gn(t,e.child,n,r)}function Hu(e,t,n,r,l){n=n.render;var o=t.ref;return fn(t,l),r=ji(e,t,n,r,o,l),n=Di(),e!==null&&!ye?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,lt(e,t,l)):(G&&n&&ki(t),t.flags|=1,fe(e,t,r,l),t.child)}function Qu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Hi(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,qa(e,t,o,r,l)):(e=Qr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:er,n(i,r)&&e.ref===t.ref)return lt(e,t,l)}return t.flags|=1,e=xt(o,r),e.ref=t.ref,e.return=t,t.child=e}function qa(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(er(o,r)&&e.ref===t.ref)if(ye=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(ye=!0);else return t.lanes=e.lanes,lt(e,t,l)}return Wo(e,t,n,r,l)}function ba(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},W(on,xe),xe|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,W(on,xe),xe|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,W(on,xe),xe|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,W(on,xe),xe|=r;return fe(e,t,l,n),t.child}function ec(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Wo(e,t,n,r,l){var o=Se(n)?Ft:ce.current;return o=mn(t,o),fn(t,l),n=ji(e,t,n,r,o,l),r=Di(),e!==null&&!ye?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,lt(e,t,l)):(G&&r&&ki(t),t.flags|=1,fe(e,t,n,l),t.child)}function Gu(e,t,n,r,l){if(Se(n)){var o=!0;nl(t)}else o=!1;if(fn(t,l),t.stateNode===null)Wr(e,t),Xa(t,n,r),Bo(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,c=n.contextType;typeof c=="object"&&c!==null?c=Re(c):(c=Se(n)?Ft:ce.current,c=mn(t,c));var h=n.getDerivedStateFromProps,m=typeof h=="function"||typeof i.getSnapshotBeforeUpdate=="function";m||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==c)&&Bu(t,i,r,c),ct=!1;var p=t.memoizedState;i.state=p,ul(t,r,i,l),s=t.memoizedState,u!==r||p!==s||we.current||ct?(typeof h=="function"&&(Uo(t,n,h,r),s=t.memoizedState),(u=ct||Uu(t,n,u,r,p,s,c))?(m||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=c,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,La(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:Oe(t.type,u),i.props=c,m=t.pendingProps,p=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Re(s):(s=Se(n)?Ft:ce.current,s=mn(t,s));var y=n.getDerivedStateFromProps;(h=typeof y=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==m||p!==s)&&Bu(t,i,r,s),ct=!1,p=t.memoizedState,i.state=p,ul(t,r,i,l);var S=t.memoizedState;u!==m||p!==S||we.current||ct?(typeof y=="function"&&(Uo(t,n,y,r),S=t.memoizedState),(c=ct||Uu(t,n,c,r,p,S,s)||!1)?(h||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,S,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,S,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),i.props=r,i.state=S,i.context=s,r=c):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),r=!1)}return Vo(e,t,n,r,o,l)}function Vo(e,t,n,r,l,o){ec(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&Iu(t,n,!1),lt(e,t,o);r=t.stateNode,Kd.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=gn(t,e.child,null,o),t.child=gn(t,null,u,o)):fe(e,t,u,o),t.memoizedState=r.state,l&&Iu(t,n,!0),t.child}function tc(e){var t=e.stateNode;t.pendingContext?Nu(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Nu(e,t.context,!1),Ti(e,t.containerInfo)}function Ku(e,t,n,r,l){return hn(),Ei(l),t.flags|=256,fe(e,t,n,r),t.child}var Ho={dehydrated:null,treeContext:null,retryLane:0};function Qo(e){return{baseLanes:e,cachePool:null,transitions:null}}function nc(e,t,n){var r=t.pendingProps,l=K.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),W(K,l&1),e===null)return Fo(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=zl(i,r,0,null),e=Ot(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Qo(n),t.memoizedState=Ho,e):Fi(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return Yd(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=xt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=xt(u,o):(o=Ot(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?Qo(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Ho,r}return o=e.child,e=o.sibling,r=xt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Fi(e,t){return t=zl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Nr(e,t,n,r){return r!==null&&Ei(r),gn(t,e.child,null,n),e=Fi(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Yd(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=to(Error(v(422))),Nr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=zl({mode:"visible",children:r.children},l,0,null),o=Ot(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&gn(t,e.child,null,i),t.child.memoizedState=Qo(i),t.memoizedState=Ho,o);if(!(t.mode&1))return Nr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(v(419)),r=to(o,r,void 0),Nr(e,t,i,r)}if(u=(i&e.childLanes)!==0,ye||u){if(r=re,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,rt(e,l),Be(r,e,l,-1))}return Vi(),r=to(Error(v(421))),Nr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=up.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Ee=yt(l.nextSibling),Ce=t,G=!0,Ae=null,e!==null&&(Le[Te++]=qe,Le[Te++]=be,Le[Te++]=At,qe=e.id,be=e.overflow,At=t),t=Fi(t,r.children),t.flags|=4096,t)}function Yu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Ao(e.return,t,n)}function no(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function rc(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(fe(e,t,r.children,n),r=K.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Yu(e,n,t);else if(e.tag===19)Yu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(W(K,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&sl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),no(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&sl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}no(t,!0,n,null,o);break;case"together":no(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Wr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function lt(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Bt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(v(153));if(t.child!==null){for(e=t.child,n=xt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=xt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function Xd(e,t,n){switch(t.tag){case 3:tc(t),hn();break;case 5:Ta(t);break;case 1:Se(t.type)&&nl(t);break;case 4:Ti(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;W(ol,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(W(K,K.current&1),t.flags|=128,null):n&t.child.childLanes?nc(e,t,n):(W(K,K.current&1),e=lt(e,t,n),e!==null?e.sibling:null);W(K,K.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return rc(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),W(K,K.current),r)break;return null;case 22:case 23:return t.lanes=0,ba(e,t,n)}return lt(e,t,n)}var lc,Go,oc,ic;lc=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Go=function(){};oc=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Dt(Ke.current);var o=null;switch(n){case"input":l=mo(e,l),r=mo(e,r),o=[];break;case"select":l=X({},l,{value:void 0}),r=X({},r,{value:void 0}),o=[];break;case"textarea":l=vo(e,l),r=vo(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=el)}wo(n,r);var i;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Kn.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Kn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&V("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}n&&(o=o||[]).push("style",n);var c=o;(t.updateQueue=c)&&(t.flags|=4)}};ic=function(e,t,n,r){n!==r&&(t.flags|=4)};function Rn(e,t){if(!G)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function se(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Zd(e,t,n){var r=t.pendingProps;switch(xi(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return se(t),null;case 1:return Se(t.type)&&tl(),se(t),null;case 3:return r=t.stateNode,vn(),H(we),H(ce),Ii(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Lr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ae!==null&&(ei(Ae),Ae=null))),Go(e,t),se(t),null;case 5:Ni(t);var l=Dt(or.current);if(n=t.type,e!==null&&t.stateNode!=null)oc(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(v(166));return se(t),null}if(e=Dt(Ke.current),Lr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[Qe]=t,r[rr]=o,e=(t.mode&1)!==0,n){case"dialog":V("cancel",r),V("close",r);break;case"iframe":case"object":case"embed":V("load",r);break;case"video":case"audio":for(l=0;l<Fn.length;l++)V(Fn[l],r);break;case"source":V("error",r);break;case"img":case"image":case"link":V("error",r),V("load",r);break;case"details":V("toggle",r);break;case"input":ru(r,o),V("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},V("invalid",r);break;case"textarea":ou(r,o),V("invalid",r)}wo(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&zr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&zr(r.textContent,u,e),l=["children",""+u]):Kn.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&V("scroll",r)}switch(n){case"input":wr(r),lu(r,o,!0);break;case"textarea":wr(r),iu(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=el)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Ds(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[Qe]=t,e[rr]=r,lc(e,t,!1,!1),t.stateNode=e;e:{switch(i=So(n,r),n){case"dialog":V("cancel",e),V("close",e),l=r;break;case"iframe":case"object":case"embed":V("load",e),l=r;break;case"video":case"audio":for(l=0;l<Fn.length;l++)V(Fn[l],e);l=r;break;case"source":V("error",e),l=r;break;case"img":case"image":case"link":V("error",e),V("load",e),l=r;break;case"details":V("toggle",e),l=r;break;case"input":ru(e,r),l=mo(e,r),V("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=X({},r,{value:void 0}),V("invalid",e);break;case"textarea":ou(e,r),l=vo(e,r),V("invalid",e);break;default:l=r}wo(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?Fs(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Ms(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Yn(e,s):typeof s=="number"&&Yn(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Kn.hasOwnProperty(o)?s!=null&&o==="onScroll"&&V("scroll",e):s!=null&&ui(e,o,s,i))}switch(n){case"input":wr(e),lu(e,r,!1);break;case"textarea":wr(e),iu(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Et(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?un(e,!!r.multiple,o,!1):r.defaultValue!=null&&un(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=el)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return se(t),null;case 6:if(e&&t.stateNode!=null)ic(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(v(166));if(n=Dt(or.current),Dt(Ke.current),Lr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Qe]=t,(o=r.nodeValue!==n)&&(e=Ce,e!==null))switch(e.tag){case 3:zr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&zr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Qe]=t,t.stateNode=r}return se(t),null;case 13:if(H(K),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(G&&Ee!==null&&t.mode&1&&!(t.flags&128))Ca(),hn(),t.flags|=98560,o=!1;else if(o=Lr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(v(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(v(317));o[Qe]=t}else hn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;se(t),o=!1}else Ae!==null&&(ei(Ae),Ae=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||K.current&1?te===0&&(te=3):Vi())),t.updateQueue!==null&&(t.flags|=4),se(t),null);case 4:return vn(),Go(e,t),e===null&&tr(t.stateNode.containerInfo),se(t),null;case 10:return Pi(t.type._context),se(t),null;case 17:return Se(t.type)&&tl(),se(t),null;case 19:if(H(K),o=t.memoizedState,o===null)return se(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)Rn(o,!1);else{if(te!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=sl(e),i!==null){for(t.flags|=128,Rn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return W(K,K.current&1|2),t.child}e=e.sibling}o.tail!==null&&J()>wn&&(t.flags|=128,r=!0,Rn(o,!1),t.lanes=4194304)}else{if(!r)if(e=sl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Rn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!G)return se(t),null}else 2*J()-o.renderingStartTime>wn&&n!==1073741824&&(t.flags|=128,r=!0,Rn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=J(),t.sibling=null,n=K.current,W(K,r?n&1|2:n&1),t):(se(t),null);case 22:case 23:return Wi(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?xe&1073741824&&(se(t),t.subtreeFlags&6&&(t.flags|=8192)):se(t),null;case 24:return null;case 25:return null}throw Error(v(156,t.tag))}function Jd(e,t){switch(xi(t),t.tag){case 1:return Se(t.type)&&tl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return vn(),H(we),H(ce),Ii(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ni(t),null;case 13:if(H(K),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(v(340));hn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return H(K),null;case 4:return vn(),null;case 10:return Pi(t.type._context),null;case 22:case 23:return Wi(),null;case 24:return null;default:return null}}var Ir=!1,ae=!1,qd=typeof WeakSet=="function"?WeakSet:Set,_=null;function ln(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){Z(e,t,r)}else n.current=null}function Ko(e,t,n){try{n()}catch(r){Z(e,t,r)}}var Xu=!1;function bd(e,t){if(No=Jr,e=fa(),Si(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,c=0,h=0,m=e,p=null;t:for(;;){for(var y;m!==n||l!==0&&m.nodeType!==3||(u=i+l),m!==o||r!==0&&m.nodeType!==3||(s=i+r),m.nodeType===3&&(i+=m.nodeValue.length),(y=m.firstChild)!==null;)p=m,m=y;for(;;){if(m===e)break t;if(p===n&&++c===l&&(u=i),p===o&&++h===r&&(s=i),(y=m.nextSibling)!==null)break;m=p,p=m.parentNode}m=y}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Io={focusedElem:e,selectionRange:n},Jr=!1,_=t;_!==null;)if(t=_,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,_=e;else for(;_!==null;){t=_;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,F=S.memoizedState,f=t.stateNode,a=f.getSnapshotBeforeUpdate(t.elementType===t.type?k:Oe(t.type,k),F);f.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(v(163))}}catch(g){Z(t,t.return,g)}if(e=t.sibling,e!==null){e.return=t.return,_=e;break}_=t.return}return S=Xu,Xu=!1,S}function Hn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Ko(t,n,o)}l=l.next}while(l!==r)}}function _l(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Yo(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function uc(e){var t=e.alternate;t!==null&&(e.alternate=null,uc(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Qe],delete t[rr],delete t[Do],delete t[Md],delete t[Od])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function sc(e){return e.tag===5||e.tag===3||e.tag===4}function Zu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||sc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Xo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=el));else if(r!==4&&(e=e.child,e!==null))for(Xo(e,t,n),e=e.sibling;e!==null;)Xo(e,t,n),e=e.sibling}function Zo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Zo(e,t,n),e=e.sibling;e!==null;)Zo(e,t,n),e=e.sibling}var le=null,Fe=!1;function st(e,t,n){for(n=n.child;n!==null;)ac(e,t,n),n=n.sibling}function ac(e,t,n){if(Ge&&typeof Ge.onCommitFiberUnmount=="function")try{Ge.onCommitFiberUnmount(vl,n)}catch{}switch(n.tag){case 5:ae||ln(n,t);case 6:var r=le,l=Fe;le=null,st(e,t,n),le=r,Fe=l,le!==null&&(Fe?(e=le,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):le.removeChild(n.stateNode));break;case 18:le!==null&&(Fe?(e=le,n=n.stateNode,e.nodeType===8?Xl(e.parentNode,n):e.nodeType===1&&Xl(e,n),qn(e)):Xl(le,n.stateNode));break;case 4:r=le,l=Fe,le=n.stateNode.containerInfo,Fe=!0,st(e,t,n),le=r,Fe=l;break;case 0:case 11:case 14:case 15:if(!ae&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Ko(n,t,i),l=l.next}while(l!==r)}st(e,t,n);break;case 1:if(!ae&&(ln(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){Z(n,t,u)}st(e,t,n);break;case 21:st(e,t,n);break;case 22:n.mode&1?(ae=(r=ae)||n.memoizedState!==null,st(e,t,n),ae=r):st(e,t,n);break;default:st(e,t,n)}}function Ju(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new qd),t.forEach(function(r){var l=sp.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Me(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:le=u.stateNode,Fe=!1;break e;case 3:le=u.stateNode.containerInfo,Fe=!0;break e;case 4:le=u.stateNode.containerInfo,Fe=!0;break e}u=u.return}if(le===null)throw Error(v(160));ac(o,i,l),le=null,Fe=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){Z(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)cc(t,e),t=t.sibling}function cc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Me(t,e),Ve(e),r&4){try{Hn(3,e,e.return),_l(3,e)}catch(k){Z(e,e.return,k)}try{Hn(5,e,e.return)}catch(k){Z(e,e.return,k)}}break;case 1:Me(t,e),Ve(e),r&512&&n!==null&&ln(n,n.return);break;case 5:if(Me(t,e),Ve(e),r&512&&n!==null&&ln(n,n.return),e.flags&32){var l=e.stateNode;try{Yn(l,"")}catch(k){Z(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&Rs(l,o),So(u,i);var c=So(u,o);for(i=0;i<s.length;i+=2){var h=s[i],m=s[i+1];h==="style"?Fs(l,m):h==="dangerouslySetInnerHTML"?Ms(l,m):h==="children"?Yn(l,m):ui(l,h,m,c)}switch(u){case"input":ho(l,o);break;case"textarea":js(l,o);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var y=o.value;y!=null?un(l,!!o.multiple,y,!1):p!==!!o.multiple&&(o.defaultValue!=null?un(l,!!o.multiple,o.defaultValue,!0):un(l,!!o.multiple,o.multiple?[]:"",!1))}l[rr]=o}catch(k){Z(e,e.return,k)}}break;case 6:if(Me(t,e),Ve(e),r&4){if(e.stateNode===null)throw Error(v(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(k){Z(e,e.return,k)}}break;case 3:if(Me(t,e),Ve(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{qn(t.containerInfo)}catch(k){Z(e,e.return,k)}break;case 4:Me(t,e),Ve(e);break;case 13:Me(t,e),Ve(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Bi=J())),r&4&&Ju(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ae=(c=ae)||h,Me(t,e),ae=c):Me(t,e),Ve(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!h&&e.mode&1)for(_=e,h=e.child;h!==null;){for(m=_=h;_!==null;){switch(p=_,y=p.child,p.tag){case 0:case 11:case 14:case 15:Hn(4,p,p.return);break;case 1:ln(p,p.return);var S=p.stateNode;if(typeof S.componentWillUnmount=="function"){r=p,n=p.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){Z(r,n,k)}}break;case 5:ln(p,p.return);break;case 22:if(p.memoizedState!==null){bu(m);continue}}y!==null?(y.return=p,_=y):bu(m)}h=h.sibling}e:for(h=null,m=e;;){if(m.tag===5){if(h===null){h=m;try{l=m.stateNode,c?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=m.stateNode,s=m.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=Os("display",i))}catch(k){Z(e,e.return,k)}}}else if(m.tag===6){if(h===null)try{m.stateNode.nodeValue=c?"":m.memoizedProps}catch(k){Z(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;h===m&&(h=null),m=m.return}h===m&&(h=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:Me(t,e),Ve(e),r&4&&Ju(e);break;case 21:break;default:Me(t,e),Ve(e)}}function Ve(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(sc(n)){var r=n;break e}n=n.return}throw Error(v(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Yn(l,""),r.flags&=-33);var o=Zu(e);Zo(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=Zu(e);Xo(e,u,i);break;default:throw Error(v(161))}}catch(s){Z(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function ep(e,t,n){_=e,fc(e)}function fc(e,t,n){for(var r=(e.mode&1)!==0;_!==null;){var l=_,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||Ir;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ae;u=Ir;var c=ae;if(Ir=i,(ae=s)&&!c)for(_=l;_!==null;)i=_,s=i.child,i.tag===22&&i.memoizedState!==null?es(l):s!==null?(s.return=i,_=s):es(l);for(;o!==null;)_=o,fc(o),o=o.sibling;_=l,Ir=u,ae=c}qu(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,_=o):qu(e)}}function qu(e){for(;_!==null;){var t=_;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ae||_l(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ae)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Oe(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&Ou(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Ou(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var h=c.memoizedState;if(h!==null){var m=h.dehydrated;m!==null&&qn(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(v(163))}ae||t.flags&512&&Yo(t)}catch(p){Z(t,t.return,p)}}if(t===e){_=null;break}if(n=t.sibling,n!==null){n.return=t.return,_=n;break}_=t.return}}function bu(e){for(;_!==null;){var t=_;if(t===e){_=null;break}var n=t.sibling;if(n!==null){n.return=t.return,_=n;break}_=t.return}}function es(e){for(;_!==null;){var t=_;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{_l(4,t)}catch(s){Z(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){Z(t,l,s)}}var o=t.return;try{Yo(t)}catch(s){Z(t,o,s)}break;case 5:var i=t.return;try{Yo(t)}catch(s){Z(t,i,s)}}}catch(s){Z(t,t.return,s)}if(t===e){_=null;break}var u=t.sibling;if(u!==null){u.return=t.return,_=u;break}_=t.return}}var tp=Math.ceil,fl=ot.ReactCurrentDispatcher,Ai=ot.ReactCurrentOwner,Ie=ot.ReactCurrentBatchConfig,O=0,re=null,b=null,oe=0,xe=0,on=Pt(0),te=0,ar=null,Bt=0,Pl=0,Ui=0,Qn=null,ve=null,Bi=0,wn=1/0,Ze=null,dl=!1,Jo=null,St=null,Rr=!1,mt=null,pl=0,Gn=0,qo=null,Vr=-1,Hr=0;function de(){return O&6?J():Vr!==-1?Vr:Vr=J()}function kt(e){return e.mode&1?O&2&&oe!==0?oe&-oe:Ad.transition!==null?(Hr===0&&(Hr=Xs()),Hr):(e=A,e!==0||(e=window.event,e=e===void 0?16:na(e.type)),e):1}function Be(e,t,n,r){if(50<Gn)throw Gn=0,qo=null,Error(v(185));fr(e,n,r),(!(O&2)||e!==re)&&(e===re&&(!(O&2)&&(Pl|=n),te===4&&dt(e,oe)),ke(e,r),n===1&&O===0&&!(t.mode&1)&&(wn=J()+500,xl&&zt()))}function ke(e,t){var n=e.callbackNode;Af(e,t);var r=Zr(e,e===re?oe:0);if(r===0)n!==null&&au(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&au(n),t===1)e.tag===0?Fd(ts.bind(null,e)):ka(ts.bind(null,e)),jd(function(){!(O&6)&&zt()}),n=null;else{switch(Zs(r)){case 1:n=di;break;case 4:n=Ks;break;case 16:n=Xr;break;case 536870912:n=Ys;break;default:n=Xr}n=wc(n,dc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function dc(e,t){if(Vr=-1,Hr=0,O&6)throw Error(v(327));var n=e.callbackNode;if(dn()&&e.callbackNode!==n)return null;var r=Zr(e,e===re?oe:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=ml(e,r);else{t=r;var l=O;O|=2;var o=mc();(re!==e||oe!==t)&&(Ze=null,wn=J()+500,Mt(e,t));do try{lp();break}catch(u){pc(e,u)}while(!0);_i(),fl.current=o,O=l,b!==null?t=0:(re=null,oe=0,t=te)}if(t!==0){if(t===2&&(l=_o(e),l!==0&&(r=l,t=bo(e,l))),t===1)throw n=ar,Mt(e,0),dt(e,r),ke(e,J()),n;if(t===6)dt(e,r);else{if(l=e.current.alternate,!(r&30)&&!np(l)&&(t=ml(e,r),t===2&&(o=_o(e),o!==0&&(r=o,t=bo(e,o))),t===1))throw n=ar,Mt(e,0),dt(e,r),ke(e,J()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(v(345));case 2:Nt(e,ve,Ze);break;case 3:if(dt(e,r),(r&130023424)===r&&(t=Bi+500-J(),10<t)){if(Zr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){de(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=jo(Nt.bind(null,e,ve,Ze),t);break}Nt(e,ve,Ze);break;case 4:if(dt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Ue(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=J()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*tp(r/1960))-r,10<r){e.timeoutHandle=jo(Nt.bind(null,e,ve,Ze),r);break}Nt(e,ve,Ze);break;case 5:Nt(e,ve,Ze);break;default:throw Error(v(329))}}}return ke(e,J()),e.callbackNode===n?dc.bind(null,e):null}function bo(e,t){var n=Qn;return e.current.memoizedState.isDehydrated&&(Mt(e,t).flags|=256),e=ml(e,t),e!==2&&(t=ve,ve=n,t!==null&&ei(t)),e}function ei(e){ve===null?ve=e:ve.push.apply(ve,e)}function np(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!$e(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function dt(e,t){for(t&=~Ui,t&=~Pl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Ue(t),r=1<<n;e[n]=-1,t&=~r}}function ts(e){if(O&6)throw Error(v(327));dn();var t=Zr(e,0);if(!(t&1))return ke(e,J()),null;var n=ml(e,t);if(e.tag!==0&&n===2){var r=_o(e);r!==0&&(t=r,n=bo(e,r))}if(n===1)throw n=ar,Mt(e,0),dt(e,t),ke(e,J()),n;if(n===6)throw Error(v(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Nt(e,ve,Ze),ke(e,J()),null}function $i(e,t){var n=O;O|=1;try{return e(t)}finally{O=n,O===0&&(wn=J()+500,xl&&zt())}}function $t(e){mt!==null&&mt.tag===0&&!(O&6)&&dn();var t=O;O|=1;var n=Ie.transition,r=A;try{if(Ie.transition=null,A=1,e)return e()}finally{A=r,Ie.transition=n,O=t,!(O&6)&&zt()}}function Wi(){xe=on.current,H(on)}function Mt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Rd(n)),b!==null)for(n=b.return;n!==null;){var r=n;switch(xi(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&tl();break;case 3:vn(),H(we),H(ce),Ii();break;case 5:Ni(r);break;case 4:vn();break;case 13:H(K);break;case 19:H(K);break;case 10:Pi(r.type._context);break;case 22:case 23:Wi()}n=n.return}if(re=e,b=e=xt(e.current,null),oe=xe=t,te=0,ar=null,Ui=Pl=Bt=0,ve=Qn=null,jt!==null){for(t=0;t<jt.length;t++)if(n=jt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}jt=null}return e}function pc(e,t){do{var n=b;try{if(_i(),Br.current=cl,al){for(var r=Y.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}al=!1}if(Ut=0,ne=ee=Y=null,Vn=!1,ir=0,Ai.current=null,n===null||n.return===null){te=1,ar=t,b=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=oe,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,h=u,m=h.tag;if(!(h.mode&1)&&(m===0||m===11||m===15)){var p=h.alternate;p?(h.updateQueue=p.updateQueue,h.memoizedState=p.memoizedState,h.lanes=p.lanes):(h.updateQueue=null,h.memoizedState=null)}var y=Wu(i);if(y!==null){y.flags&=-257,Vu(y,i,u,o,t),y.mode&1&&$u(o,c,t),t=y,s=c;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){$u(o,c,t),Vi();break e}s=Error(v(426))}}else if(G&&u.mode&1){var F=Wu(i);if(F!==null){!(F.flags&65536)&&(F.flags|=256),Vu(F,i,u,o,t),Ei(yn(s,u));break e}}o=s=yn(s,u),te!==4&&(te=2),Qn===null?Qn=[o]:Qn.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var f=Za(o,s,t);Mu(o,f);break e;case 1:u=s;var a=o.type,d=o.stateNode;if(!(o.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(St===null||!St.has(d)))){o.flags|=65536,t&=-t,o.lanes|=t;var g=Ja(o,u,t);Mu(o,g);break e}}o=o.return}while(o!==null)}gc(n)}catch(E){t=E,b===n&&n!==null&&(b=n=n.return);continue}break}while(!0)}function mc(){var e=fl.current;return fl.current=cl,e===null?cl:e}function Vi(){(te===0||te===3||te===2)&&(te=4),re===null||!(Bt&268435455)&&!(Pl&268435455)||dt(re,oe)}function ml(e,t){var n=O;O|=2;var r=mc();(re!==e||oe!==t)&&(Ze=null,Mt(e,t));do try{rp();break}catch(l){pc(e,l)}while(!0);if(_i(),O=n,fl.current=r,b!==null)throw Error(v(261));return re=null,oe=0,te}function rp(){for(;b!==null;)hc(b)}function lp(){for(;b!==null&&!Tf();)hc(b)}function hc(e){var t=yc(e.alternate,e,xe);e.memoizedProps=e.pendingProps,t===null?gc(e):b=t,Ai.current=null}function gc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Jd(n,t),n!==null){n.flags&=32767,b=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{te=6,b=null;return}}else if(n=Zd(n,t,xe),n!==null){b=n;return}if(t=t.sibling,t!==null){b=t;return}b=t=e}while(t!==null);te===0&&(te=5)}function Nt(e,t,n){var r=A,l=Ie.transition;try{Ie.transition=null,A=1,op(e,t,n,r)}finally{Ie.transition=l,A=r}return null}function op(e,t,n,r){do dn();while(mt!==null);if(O&6)throw Error(v(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(v(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(Uf(e,o),e===re&&(b=re=null,oe=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Rr||(Rr=!0,wc(Xr,function(){return dn(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Ie.transition,Ie.transition=null;var i=A;A=1;var u=O;O|=4,Ai.current=null,bd(e,n),cc(n,e),_d(Io),Jr=!!No,Io=No=null,e.current=n,ep(n),Nf(),O=u,A=i,Ie.transition=o}else e.current=n;if(Rr&&(Rr=!1,mt=e,pl=l),o=e.pendingLanes,o===0&&(St=null),jf(n.stateNode),ke(e,J()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(dl)throw dl=!1,e=Jo,Jo=null,e;return pl&1&&e.tag!==0&&dn(),o=e.pendingLanes,o&1?e===qo?Gn++:(Gn=0,qo=e):Gn=0,zt(),null}function dn(){if(mt!==null){var e=Zs(pl),t=Ie.transition,n=A;try{if(Ie.transition=null,A=16>e?16:e,mt===null)var r=!1;else{if(e=mt,mt=null,pl=0,O&6)throw Error(v(331));var l=O;for(O|=4,_=e.current;_!==null;){var o=_,i=o.child;if(_.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(_=c;_!==null;){var h=_;switch(h.tag){case 0:case 11:case 15:Hn(8,h,o)}var m=h.child;if(m!==null)m.return=h,_=m;else for(;_!==null;){h=_;var p=h.sibling,y=h.return;if(uc(h),h===c){_=null;break}if(p!==null){p.return=y,_=p;break}_=y}}}var S=o.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var F=k.sibling;k.sibling=null,k=F}while(k!==null)}}_=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,_=i;else e:for(;_!==null;){if(o=_,o.flags&2048)switch(o.tag){case 0:case 11:case 15:Hn(9,o,o.return)}var f=o.sibling;if(f!==null){f.return=o.return,_=f;break e}_=o.return}}var a=e.current;for(_=a;_!==null;){i=_;var d=i.child;if(i.subtreeFlags&2064&&d!==null)d.return=i,_=d;else e:for(i=a;_!==null;){if(u=_,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:_l(9,u)}}catch(E){Z(u,u.return,E)}if(u===i){_=null;break e}var g=u.sibling;if(g!==null){g.return=u.return,_=g;break e}_=u.return}}if(O=l,zt(),Ge&&typeof Ge.onPostCommitFiberRoot=="function")try{Ge.onPostCommitFiberRoot(vl,e)}catch{}r=!0}return r}finally{A=n,Ie.transition=t}}return!1}function ns(e,t,n){t=yn(n,t),t=Za(e,t,1),e=wt(e,t,1),t=de(),e!==null&&(fr(e,1,t),ke(e,t))}function Z(e,t,n){if(e.tag===3)ns(e,e,n);else for(;t!==null;){if(t.tag===3){ns(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(St===null||!St.has(r))){e=yn(n,e),e=Ja(t,e,1),t=wt(t,e,1),e=de(),t!==null&&(fr(t,1,e),ke(t,e));break}}t=t.return}}function ip(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=de(),e.pingedLanes|=e.suspendedLanes&n,re===e&&(oe&n)===n&&(te===4||te===3&&(oe&130023424)===oe&&500>J()-Bi?Mt(e,0):Ui|=n),ke(e,t)}function vc(e,t){t===0&&(e.mode&1?(t=xr,xr<<=1,!(xr&130023424)&&(xr=4194304)):t=1);var n=de();e=rt(e,t),e!==null&&(fr(e,t,n),ke(e,n))}function up(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),vc(e,n)}function sp(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(v(314))}r!==null&&r.delete(t),vc(e,n)}var yc;yc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||we.current)ye=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return ye=!1,Xd(e,t,n);ye=!!(e.flags&131072)}else ye=!1,G&&t.flags&1048576&&xa(t,ll,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Wr(e,t),e=t.pendingProps;var l=mn(t,ce.current);fn(t,n),l=ji(null,t,r,e,l,n);var o=Di();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Se(r)?(o=!0,nl(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Li(t),l.updater=Cl,t.stateNode=l,l._reactInternals=t,Bo(t,r,e,n),t=Vo(null,t,r,!0,o,n)):(t.tag=0,G&&o&&ki(t),fe(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Wr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=cp(r),e=Oe(r,e),l){case 0:t=Wo(null,t,r,e,n);break e;case 1:t=Gu(null,t,r,e,n);break e;case 11:t=Hu(null,t,r,e,n);break e;case 14:t=Qu(null,t,r,Oe(r.type,e),n);break e}throw Error(v(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Wo(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Gu(e,t,r,l,n);case 3:e:{if(tc(t),e===null)throw Error(v(387));r=t.pendingProps,o=t.memoizedState,l=o.element,La(e,t),ul(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=yn(Error(v(423)),t),t=Ku(e,t,r,n,l);break e}else if(r!==l){l=yn(Error(v(424)),t),t=Ku(e,t,r,n,l);break e}else for(Ee=yt(t.stateNode.containerInfo.firstChild),Ce=t,G=!0,Ae=null,n=Pa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(hn(),r===l){t=lt(e,t,n);break e}fe(e,t,r,n)}t=t.child}return t;case 5:return Ta(t),e===null&&Fo(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,Ro(r,l)?i=null:o!==null&&Ro(r,o)&&(t.flags|=32),ec(e,t),fe(e,t,i,n),t.child;case 6:return e===null&&Fo(t),null;case 13:return nc(e,t,n);case 4:return Ti(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=gn(t,null,r,n):fe(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Hu(e,t,r,l,n);case 7:return fe(e,t,t.pendingProps,n),t.child;case 8:return fe(e,t,t.pendingProps.children,n),t.child;case 12:return fe(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,W(ol,r._currentValue),r._currentValue=i,o!==null)if($e(o.value,i)){if(o.children===l.children&&!we.current){t=lt(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=et(-1,n&-n),s.tag=2;var c=o.updateQueue;if(c!==null){c=c.shared;var h=c.pending;h===null?s.next=s:(s.next=h.next,h.next=s),c.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Ao(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(v(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Ao(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}fe(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,fn(t,n),l=Re(l),r=r(l),t.flags|=1,fe(e,t,r,n),t.child;case 14:return r=t.type,l=Oe(r,t.pendingProps),l=Oe(r.type,l),Qu(e,t,r,l,n);case 15:return qa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Wr(e,t),t.tag=1,Se(r)?(e=!0,nl(t)):e=!1,fn(t,n),Xa(t,r,l),Bo(t,r,l,n),Vo(null,t,r,!0,e,n);case 19:return rc(e,t,n);case 22:return ba(e,t,n)}throw Error(v(156,t.tag))};function wc(e,t){return Gs(e,t)}function ap(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ne(e,t,n,r){return new ap(e,t,n,r)}function Hi(e){return e=e.prototype,!(!e||!e.isReactComponent)}function cp(e){if(typeof e=="function")return Hi(e)?1:0;if(e!=null){if(e=e.$$typeof,e===ai)return 11;if(e===ci)return 14}return 2}function xt(e,t){var n=e.alternate;return n===null?(n=Ne(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Qr(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Hi(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case Xt:return Ot(n.children,l,o,t);case si:i=8,l|=8;break;case ao:return e=Ne(12,n,t,l|2),e.elementType=ao,e.lanes=o,e;case co:return e=Ne(13,n,t,l),e.elementType=co,e.lanes=o,e;case fo:return e=Ne(19,n,t,l),e.elementType=fo,e.lanes=o,e;case Ts:return zl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case zs:i=10;break e;case Ls:i=9;break e;case ai:i=11;break e;case ci:i=14;break e;case at:i=16,r=null;break e}throw Error(v(130,e==null?e:typeof e,""))}return t=Ne(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Ot(e,t,n,r){return e=Ne(7,e,r,t),e.lanes=n,e}function zl(e,t,n,r){return e=Ne(22,e,r,t),e.elementType=Ts,e.lanes=n,e.stateNode={isHidden:!1},e}function ro(e,t,n){return e=Ne(6,e,null,t),e.lanes=n,e}function lo(e,t,n){return t=Ne(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function fp(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Al(0),this.expirationTimes=Al(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Al(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Qi(e,t,n,r,l,o,i,u,s){return e=new fp(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=Ne(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Li(o),e}function dp(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Yt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function Sc(e){if(!e)return Ct;e=e._reactInternals;e:{if(Vt(e)!==e||e.tag!==1)throw Error(v(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Se(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(v(171))}if(e.tag===1){var n=e.type;if(Se(n))return Sa(e,n,t)}return t}function kc(e,t,n,r,l,o,i,u,s){return e=Qi(n,r,!0,e,l,o,i,u,s),e.context=Sc(null),n=e.current,r=de(),l=kt(n),o=et(r,l),o.callback=t??null,wt(n,o,l),e.current.lanes=l,fr(e,l,r),ke(e,r),e}function Ll(e,t,n,r){var l=t.current,o=de(),i=kt(l);return n=Sc(n),t.context===null?t.context=n:t.pendingContext=n,t=et(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=wt(l,t,i),e!==null&&(Be(e,l,i,o),Ur(e,l,i)),i}function hl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function rs(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Gi(e,t){rs(e,t),(e=e.alternate)&&rs(e,t)}function pp(){return null}var xc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Ki(e){this._internalRoot=e}Tl.prototype.render=Ki.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(v(409));Ll(e,t,null,null)};Tl.prototype.unmount=Ki.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;$t(function(){Ll(null,e,null,null)}),t[nt]=null}};function Tl(e){this._internalRoot=e}Tl.prototype.unstable_scheduleHydration=function(e){if(e){var t=bs();e={blockedOn:null,target:e,priority:t};for(var n=0;n<ft.length&&t!==0&&t<ft[n].priority;n++);ft.splice(n,0,e),n===0&&ta(e)}};function Yi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Nl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function ls(){}function mp(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var c=hl(i);o.call(c)}}var i=kc(t,r,e,0,null,!1,!1,"",ls);return e._reactRootContainer=i,e[nt]=i.current,tr(e.nodeType===8?e.parentNode:e),$t(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=hl(s);u.call(c)}}var s=Qi(e,0,!1,null,null,!1,!1,"",ls);return e._reactRootContainer=s,e[nt]=s.current,tr(e.nodeType===8?e.parentNode:e),$t(function(){Ll(t,s,n,r)}),s}function Il(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=hl(i);u.call(s)}}Ll(t,i,e,l)}else i=mp(n,t,e,l,r);return hl(i)}Js=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=On(t.pendingLanes);n!==0&&(pi(t,n|1),ke(t,J()),!(O&6)&&(wn=J()+500,zt()))}break;case 13:$t(function(){var r=rt(e,1);if(r!==null){var l=de();Be(r,e,1,l)}}),Gi(e,1)}};mi=function(e){if(e.tag===13){var t=rt(e,134217728);if(t!==null){var n=de();Be(t,e,134217728,n)}Gi(e,134217728)}};qs=function(e){if(e.tag===13){var t=kt(e),n=rt(e,t);if(n!==null){var r=de();Be(n,e,t,r)}Gi(e,t)}};bs=function(){return A};ea=function(e,t){var n=A;try{return A=e,t()}finally{A=n}};xo=function(e,t,n){switch(t){case"input":if(ho(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=kl(r);if(!l)throw Error(v(90));Is(r),ho(r,l)}}}break;case"textarea":js(e,n);break;case"select":t=n.value,t!=null&&un(e,!!n.multiple,t,!1)}};Bs=$i;$s=$t;var hp={usingClientEntryPoint:!1,Events:[pr,bt,kl,As,Us,$i]},jn={findFiberByHostInstance:Rt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},gp={bundleType:jn.bundleType,version:jn.version,rendererPackageName:jn.rendererPackageName,rendererConfig:jn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ot.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Hs(e),e===null?null:e.stateNode},findFiberByHostInstance:jn.findFiberByHostInstance||pp,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var jr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!jr.isDisabled&&jr.supportsFiber)try{vl=jr.inject(gp),Ge=jr}catch{}}Pe.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=hp;Pe.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Yi(t))throw Error(v(200));return dp(e,t,null,n)};Pe.createRoot=function(e,t){if(!Yi(e))throw Error(v(299));var n=!1,r="",l=xc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Qi(e,1,!1,null,null,n,!1,r,l),e[nt]=t.current,tr(e.nodeType===8?e.parentNode:e),new Ki(t)};Pe.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(v(188)):(e=Object.keys(e).join(","),Error(v(268,e)));return e=Hs(t),e=e===null?null:e.stateNode,e};Pe.flushSync=function(e){return $t(e)};Pe.hydrate=function(e,t,n){if(!Nl(t))throw Error(v(200));return Il(null,e,t,!0,n)};Pe.hydrateRoot=function(e,t,n){if(!Yi(e))throw Error(v(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=xc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=kc(t,null,e,1,n??null,l,!1,o,i),e[nt]=t.current,tr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Tl(t)};Pe.render=function(e,t,n){if(!Nl(t))throw Error(v(200));return Il(null,e,t,!1,n)};Pe.unmountComponentAtNode=function(e){if(!Nl(e))throw Error(v(40));return e._reactRootContainer?($t(function(){Il(null,null,e,!1,function(){e._reactRootContainer=null,e[nt]=null})}),!0):!1};Pe.unstable_batchedUpdates=$i;Pe.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Nl(n))throw Error(v(200));if(e==null||e._reactInternals===void 0)throw Error(v(38));return Il(e,t,n,!1,r)};Pe.version="18.3.1-next-f1338f8080-20240426";function Ec(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Ec)}catch(e){console.error(e)}}Ec(),Es.exports=Pe;var vp=Es.exports,os=vp;uo.createRoot=os.createRoot,uo.hydrateRoot=os.hydrateRoot;const yp="modulepreload",wp=function(e){return"/"+e},is={},Ye=function(t,n,r){let l=Promise.resolve();if(n&&n.length>0){document.getElementsByTagName("link");const i=document.querySelector("meta[property=csp-nonce]"),u=(i==null?void 0:i.nonce)||(i==null?void 0:i.getAttribute("nonce"));l=Promise.allSettled(n.map(s=>{if(s=wp(s),s in is)return;is[s]=!0;const c=s.endsWith(".css"),h=c?'[rel="stylesheet"]':"";if(document.querySelector(`link[href="${s}"]${h}`))return;const m=document.createElement("link");if(m.rel=c?"stylesheet":yp,c||(m.as="script"),m.crossOrigin="",m.href=s,u&&m.setAttribute("nonce",u),document.head.appendChild(m),c)return new Promise((p,y)=>{m.addEventListener("load",p),m.addEventListener("error",()=>y(new Error(`Unable to preload CSS for ${s}`)))})}))}function o(i){const u=new Event("vite:preloadError",{cancelable:!0});if(u.payload=i,window.dispatchEvent(u),!u.defaultPrevented)throw i}return l.then(i=>{for(const u of i||[])u.status==="rejected"&&o(u.reason);return t().catch(o)})};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Sp=e=>e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),kp=e=>e.replace(/^([A-Z])|[\s-_]+(\w)/g,(t,n,r)=>r?r.toUpperCase():n.toLowerCase()),us=e=>{const t=kp(e);return t.charAt(0).toUpperCase()+t.slice(1)},Cc=(...e)=>e.filter((t,n,r)=>!!t&&t.trim()!==""&&r.indexOf(t)===n).join(" ").trim(),xp=e=>{for(const t in e)if(t.startsWith("aria-")||t==="role"||t==="title")return!0};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var Ep={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Cp=N.forwardRef(({color:e="currentColor",size:t=24,strokeWidth:n=2,absoluteStrokeWidth:r,className:l="",children:o,iconNode:i,...u},s)=>N.createElement("svg",{ref:s,...Ep,width:t,height:t,stroke:e,strokeWidth:r?Number(n)*24/Number(t):n,className:Cc("lucide",l),...!o&&!xp(u)&&{"aria-hidden":"true"},...u},[...i.map(([c,h])=>N.createElement(c,h)),...Array.isArray(o)?o:[o]]));/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ht=(e,t)=>{const n=N.forwardRef(({className:r,...l},o)=>N.createElement(Cp,{ref:o,iconNode:t,className:Cc(`lucide-${Sp(us(e))}`,`lucide-${e}`,r),...l}));return n.displayName=us(e),n};/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _p=[["path",{d:"m7 6 5 5 5-5",key:"1lc07p"}],["path",{d:"m7 13 5 5 5-5",key:"1d48rs"}]],Pp=Ht("chevrons-down",_p);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const zp=[["path",{d:"M4 5h16",key:"1tepv9"}],["path",{d:"M4 12h16",key:"1lakjw"}],["path",{d:"M4 19h16",key:"1djgab"}]],Lp=Ht("menu",zp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Tp=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2",key:"afitv7"}],["path",{d:"M9 3v18",key:"fh3hqa"}],["path",{d:"m16 15-3-3 3-3",key:"14y99z"}]],Np=Ht("panel-left-close",Tp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ip=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2",key:"afitv7"}],["path",{d:"M9 3v18",key:"fh3hqa"}]],Rp=Ht("panel-left",Ip);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const jp=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"M12 5v14",key:"s699le"}]],ss=Ht("plus",jp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Dp=[["path",{d:"M12 2v10",key:"mnfbl"}],["path",{d:"M18.4 6.6a9 9 0 1 1-12.77.04",key:"obofu9"}]],as=Ht("power",Dp);/**
- * @license lucide-react v0.560.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Mp=[["path",{d:"M9.671 4.136a2.34 2.34 0 0 1 4.659 0 2.34 2.34 0 0 0 3.319 1.915 2.34 2.34 0 0 1 2.33 4.033 2.34 2.34 0 0 0 0 3.831 2.34 2.34 0 0 1-2.33 4.033 2.34 2.34 0 0 0-3.319 1.915 2.34 2.34 0 0 1-4.659 0 2.34 2.34 0 0 0-3.32-1.915 2.34 2.34 0 0 1-2.33-4.033 2.34 2.34 0 0 0 0-3.831A2.34 2.34 0 0 1 6.35 6.051a2.34 2.34 0 0 0 3.319-1.915",key:"1i5ecw"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],cs=Ht("settings",Mp),Op=()=>{var t;return(navigator.language||((t=navigator.languages)==null?void 0:t[0])||"en").toLowerCase().startsWith("ko")?"ko":"en"},oo={theme:"catppuccin",language:Op(),fontSize:14,fontFamily:'"JetBrains Mono", Menlo, Monaco, "Courier New", monospace',autoScroll:"smart",smoothScroll:!0,scrollSensitivity:.8},io="terminal_settings",Fp=()=>{const[e,t]=N.useState(()=>{try{const o=localStorage.getItem(io);if(o)return{...oo,...JSON.parse(o)}}catch(o){console.error("Failed to load settings:",o)}return oo});return N.useEffect(()=>{try{localStorage.setItem(io,JSON.stringify(e))}catch(o){console.error("Failed to save settings:",o)}},[e]),{settings:e,updateSetting:(o,i)=>{t(u=>({...u,[o]:i}))},updateSettings:o=>{t(i=>({...i,...o}))},resetSettings:()=>{t(oo),localStorage.removeItem(io)}}},fs={en:{appName:"Terminal List",session:"Session",newSession:"New Session",settings:"Settings",connecting:"Connecting...",connected:"Terminal Connected",disconnected:"Connection Lost",connectionError:"Connection Error",settingsTitle:"Settings",theme:"Theme",language:"Language",fontSize:"Font Size",fontFamily:"Font Family",scrollBehavior:"Scroll Behavior",autoScroll:"Auto Scroll",smoothScroll:"Smooth Scroll",save:"Save",cancel:"Cancel",reset:"Reset to Default",themeCatppuccin:"Catppuccin",themeDracula:"Dracula",themeMonokai:"Monokai",themeSolarizedDark:"Solarized Dark",themeGithub:"GitHub Dark",languageEnglish:"English",languageKorean:"한국어",paste:"Paste",commandInput:"Command Input",commandInputPlaceholder:"Enter command... (Ctrl+Enter to send)",commandInputHint:"💡 Enter for new line, Ctrl+Enter to send",send:"Send",clear:"Clear",clearInput:"Clear input",confirmClearInput:"Are you sure you want to clear all input?",settingsSaved:"Settings saved successfully",sessionCreated:"New session created",confirmNewSession:"Create a new session? Current session will continue in background.",confirm:"Confirm",close:"Close",closeTerminal:"Close Terminal",confirmCloseTerminal:"Are you sure you want to close this terminal? All unsaved work will be lost.",cannotCloseLastSession:"Cannot close the last terminal. Create a new one first.",sessions:"Sessions",closeSidebar:"Close sidebar",closeTerminal:"Close terminal",resizeSidebar:"Resize sidebar",activeTerminals:"Active Terminals",noTerminals:"No terminals open",createFirstTerminal:"Click + to create a new terminal",clipboardError:"Clipboard access denied",networkError:"Network error occurred",loading:"Loading...",logout:"Logout",confirmLogout:"Confirm Logout",logoutMessage:"Are you sure you want to logout?",user:"User",initialSetup:"Initial Setup",initialSetupDescription:"Create an administrator account to get started. You will need these credentials to access the terminal.",username:"Username",password:"Password",confirmPassword:"Confirm Password",usernamePlaceholder:"Enter username",passwordPlaceholder:"Enter password (min 8 characters)",confirmPasswordPlaceholder:"Re-enter password",createAccount:"Create Administrator",creating:"Creating...",setupFooter:"This account will have full access to all terminals and settings.",usernameMinLength:"Username must be at least 3 characters",passwordMinLength:"Password must be at least 8 characters",passwordMismatch:"Passwords do not match",login:"Sign In",loginDescription:"Enter your administrator credentials",signIn:"Sign In",signingIn:"Signing in...",fillAllFields:"Please fill in all fields"},ko:{appName:"Terminal List",session:"세션",newSession:"새로운 세션",settings:"설정",connecting:"연결 중...",connected:"터미널 연결됨",disconnected:"연결이 끊어졌습니다",connectionError:"연결 오류",settingsTitle:"설정",theme:"테마",language:"언어",fontSize:"글꼴 크기",fontFamily:"글꼴",scrollBehavior:"스크롤 동작",autoScroll:"자동 스크롤",smoothScroll:"부드러운 스크롤",save:"저장",cancel:"취소",reset:"기본값으로 재설정",themeCatppuccin:"Catppuccin",themeDracula:"Dracula",themeMonokai:"Monokai",themeSolarizedDark:"Solarized Dark",themeGithub:"GitHub Dark",languageEnglish:"English",languageKorean:"한국어",paste:"붙여넣기",commandInput:"명령어 입력",commandInputPlaceholder:"명령어를 입력하세요... (Ctrl+Enter로 전송)",commandInputHint:"💡 Enter로 줄바꿈, Ctrl+Enter로 전송",send:"전송",clear:"지우기",clearInput:"내용 지우기",confirmClearInput:"입력한 내용을 모두 지우시겠습니까?",settingsSaved:"설정이 저장되었습니다",sessionCreated:"새 세션이 생성되었습니다",confirmNewSession:"새 세션을 만드시겠습니까? 현재 세션은 백그라운드에서 계속됩니다.",confirm:"확인",close:"닫기",closeTerminal:"터미널 종료",confirmCloseTerminal:"이 터미널을 닫으시겠습니까? 저장되지 않은 모든 작업이 손실됩니다.",cannotCloseLastSession:"마지막 터미널은 닫을 수 없습니다. 먼저 새 터미널을 생성하세요.",sessions:"세션 목록",closeSidebar:"사이드바 닫기",closeTerminal:"터미널 종료",resizeSidebar:"사이드바 크기 조정",activeTerminals:"활성 터미널",noTerminals:"열려있는 터미널이 없습니다",createFirstTerminal:"+ 버튼을 눌러 새 터미널을 만드세요",clipboardError:"클립보드 접근 권한이 필요합니다",networkError:"네트워크 오류가 발생했습니다",loading:"로딩 중...",logout:"로그아웃",confirmLogout:"로그아웃 확인",logoutMessage:"로그아웃 하시겠습니까?",user:"사용자",initialSetup:"초기 설정",initialSetupDescription:"시작하려면 관리자 계정을 생성하세요. 터미널에 접근하려면 이 자격 증명이 필요합니다.",username:"사용자명",password:"비밀번호",confirmPassword:"비밀번호 확인",usernamePlaceholder:"사용자명을 입력하세요",passwordPlaceholder:"비밀번호를 입력하세요 (최소 8자)",confirmPasswordPlaceholder:"비밀번호를 다시 입력하세요",createAccount:"관리자 생성",creating:"생성 중...",setupFooter:"이 계정은 모든 터미널과 설정에 대한 전체 액세스 권한을 갖습니다.",usernameMinLength:"사용자명은 최소 3자 이상이어야 합니다",passwordMinLength:"비밀번호는 최소 8자 이상이어야 합니다",passwordMismatch:"비밀번호가 일치하지 않습니다",login:"로그인",loginDescription:"관리자 자격 증명을 입력하세요",signIn:"로그인",signingIn:"로그인 중...",fillAllFields:"모든 필드를 입력해주세요"}},Ap="en",Up=e=>({t:N.useMemo(()=>{const n=fs[e]||fs[Ap];return(r,l=r)=>n[r]||l},[e])}),Bp={background:"#282a36",foreground:"#f8f8f2",cursor:"#f8f8f2",cursorAccent:"#282a36",selection:"rgba(68, 71, 90, 0.5)",black:"#21222c",red:"#ff5555",green:"#50fa7b",yellow:"#f1fa8c",blue:"#bd93f9",magenta:"#ff79c6",cyan:"#8be9fd",white:"#f8f8f2",brightBlack:"#6272a4",brightRed:"#ff6e6e",brightGreen:"#69ff94",brightYellow:"#ffffa5",brightBlue:"#d6acff",brightMagenta:"#ff92df",brightCyan:"#a4ffff",brightWhite:"#ffffff",ui:{bg:"#282a36",bgSecondary:"#21222c",bgTertiary:"#44475a",border:"#2f3142",text:"#f8f8f2",textSecondary:"#6272a4",accent:"#bd93f9",iconColor:"#f8f8f2"}},$p={background:"#272822",foreground:"#f8f8f2",cursor:"#f8f8f0",cursorAccent:"#272822",selection:"rgba(73, 72, 62, 0.5)",black:"#272822",red:"#f92672",green:"#a6e22e",yellow:"#f4bf75",blue:"#66d9ef",magenta:"#ae81ff",cyan:"#a1efe4",white:"#f8f8f2",brightBlack:"#75715e",brightRed:"#f92672",brightGreen:"#a6e22e",brightYellow:"#f4bf75",brightBlue:"#66d9ef",brightMagenta:"#ae81ff",brightCyan:"#a1efe4",brightWhite:"#f9f8f5",ui:{bg:"#272822",bgSecondary:"#1e1f1c",bgTertiary:"#49483e",border:"#32332b",text:"#f8f8f2",textSecondary:"#75715e",accent:"#66d9ef",iconColor:"#f8f8f2"}},Wp={background:"#002b36",foreground:"#839496",cursor:"#839496",cursorAccent:"#002b36",selection:"rgba(7, 54, 66, 0.5)",black:"#073642",red:"#dc322f",green:"#859900",yellow:"#b58900",blue:"#268bd2",magenta:"#d33682",cyan:"#2aa198",white:"#eee8d5",brightBlack:"#002b36",brightRed:"#cb4b16",brightGreen:"#586e75",brightYellow:"#657b83",brightBlue:"#839496",brightMagenta:"#6c71c4",brightCyan:"#93a1a1",brightWhite:"#fdf6e3",ui:{bg:"#002b36",bgSecondary:"#073642",bgTertiary:"#0d4450",border:"#0a3c47",text:"#93a1a1",textSecondary:"#839496",accent:"#268bd2",iconColor:"#93a1a1"}},Vp={background:"#0d1117",foreground:"#c9d1d9",cursor:"#c9d1d9",cursorAccent:"#0d1117",selection:"rgba(56, 139, 253, 0.3)",black:"#484f58",red:"#ff7b72",green:"#3fb950",yellow:"#d29922",blue:"#58a6ff",magenta:"#bc8cff",cyan:"#39c5cf",white:"#b1bac4",brightBlack:"#6e7681",brightRed:"#ffa198",brightGreen:"#56d364",brightYellow:"#e3b341",brightBlue:"#79c0ff",brightMagenta:"#d2a8ff",brightCyan:"#56d4dd",brightWhite:"#f0f6fc",ui:{bg:"#0d1117",bgSecondary:"#010409",bgTertiary:"#21262d",border:"#181b20",text:"#e6edf3",textSecondary:"#7d8590",accent:"#58a6ff",iconColor:"#e6edf3"}},Hp={background:"#1e1e2e",foreground:"#cdd6f4",cursor:"#f5e0dc",cursorAccent:"#1e1e2e",selection:"rgba(116, 199, 236, 0.3)",black:"#45475a",red:"#f38ba8",green:"#a6e3a1",yellow:"#f9e2af",blue:"#89b4fa",magenta:"#f5c2e7",cyan:"#94e2d5",white:"#bac2de",brightBlack:"#585b70",brightRed:"#f38ba8",brightGreen:"#a6e3a1",brightYellow:"#f9e2af",brightBlue:"#89b4fa",brightMagenta:"#f5c2e7",brightCyan:"#94e2d5",brightWhite:"#a6adc8",ui:{bg:"#1e1e2e",bgSecondary:"#181825",bgTertiary:"#313244",border:"#25263a",text:"#cdd6f4",textSecondary:"#6c7086",accent:"#89b4fa",iconColor:"#cdd6f4"}},It={catppuccin:Hp,dracula:Bp,monokai:$p,solarizedDark:Wp,github:Vp},lm=Object.keys(It),Qp=N.lazy(()=>Ye(()=>import("./Terminal-CbkHWI8J.js"),__vite__mapDeps([0,1]))),Gp=N.lazy(()=>Ye(()=>import("./MobileToolbar-B_evRuJW.js"),__vite__mapDeps([2,3,4]))),Kp=N.lazy(()=>Ye(()=>import("./CommandInput-DnpUi1me.js"),__vite__mapDeps([5,6,3]))),Yp=N.lazy(()=>Ye(()=>import("./Settings-B7CmJ4pg.js"),[])),Xp=N.lazy(()=>Ye(()=>import("./Sidebar-D2IV05Xr.js"),__vite__mapDeps([7,6,4,8]))),Zp=N.lazy(()=>Ye(()=>import("./ConfirmModal-DutmKJKn.js"),[])),Jp=N.lazy(()=>Ye(()=>import("./NotificationModal-CWql03-2.js"),__vite__mapDeps([9,6]))),qp=N.lazy(()=>Ye(()=>import("./InitialSetup-C3lz54EQ.js"),[])),bp=N.lazy(()=>Ye(()=>import("./Login-C_UGJh4W.js"),[])),em=N.lazy(()=>Ye(()=>import("./FileEditor-CTGzdANj.js"),__vite__mapDeps([10,8,6]))),tm=()=>"xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx".replace(/[xy]/g,e=>{const t=Math.random()*16|0;return(e==="x"?t:t&3|8).toString(16)}),nm=async()=>{try{const e=localStorage.getItem("auth_token");if(!e)return console.log("[DEBUG] fetchSessions: 토큰 없음"),[];console.log("[DEBUG] fetchSessions: API 호출 시작");const t=await fetch("/api/sessions",{headers:{Authorization:`Bearer ${e}`}});if(!t.ok)return console.error("[DEBUG] fetchSessions 실패:",t.status),[];const n=await t.json();console.log("[DEBUG] fetchSessions API 응답:",n);const r=n.map(l=>({id:l.id,name:l.name}));return console.log("[DEBUG] fetchSessions 매핑 결과:",r),r}catch(e){return console.error("[DEBUG] fetchSessions 에러:",e),[]}};function rm(){const[e,t]=N.useState({isLoading:!0,needsSetup:!1,isAuthenticated:!1,username:null}),[n,r]=N.useState([]),[l,o]=N.useState(null);N.useEffect(()=>{console.log("[DEBUG] sessions 변경됨:",n.length,n)},[n]);const[i,u]=N.useState(!1),[s,c]=N.useState(!1),[h,m]=N.useState(()=>{const w=localStorage.getItem("sidebar_open");return w!==null?w==="true":!(/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768)}),[p,y]=N.useState(!1),[S,k]=N.useState(null),[F,f]=N.useState(()=>{const w=localStorage.getItem("sidebar_width");return w?parseInt(w):280}),[a,d]=N.useState(!1),[g,E]=N.useState(window.innerHeight),[P,z]=N.useState({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1}),[L,Q]=N.useState({isOpen:!1,message:""}),[D,he]=N.useState(!1),[it,ut]=N.useState(null),[hr,gr]=N.useState(!1),[En,Cn]=N.useState(""),C=N.useRef(null),{settings:T,updateSettings:j}=Fp(),{t:I}=Up(T.language);N.useEffect(()=>{if(!e.isAuthenticated)return;const w=It[T.theme]||It.catppuccin,$="dynamic-scrollbar-theme";let U=document.getElementById($);U||(U=document.createElement("style"),U.id=$,document.head.appendChild(U)),U.textContent=`
-      ::-webkit-scrollbar {
-        width: 12px;
-        height: 12px;
-      }
-
-      ::-webkit-scrollbar-track {
-        background: ${w.ui.bg};
-      }
-
-      ::-webkit-scrollbar-thumb {
-        background: ${w.ui.border};
-        border-radius: 6px;
-        border: 2px solid ${w.ui.bg};
-      }
-
-      ::-webkit-scrollbar-thumb:hover {
-        background: ${w.ui.textSecondary};
-      }
-
-      /* Firefox */
-      * {
-        scrollbar-width: thin;
-        scrollbar-color: ${w.ui.border} ${w.ui.bg};
-      }
-    `},[T.theme,e.isAuthenticated]),N.useEffect(()=>{(async()=>{try{if(!(await(await fetch("/api/auth/status")).json()).setup_complete){localStorage.removeItem("auth_token"),localStorage.removeItem("username"),t({isLoading:!1,needsSetup:!0,isAuthenticated:!1,username:null});return}const ge=localStorage.getItem("auth_token");if(!ge){t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null});return}const De=await fetch("/api/auth/verify",{headers:{Authorization:`Bearer ${ge}`}});if(!De.ok){localStorage.removeItem("auth_token"),localStorage.removeItem("username"),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null});return}const Lt=await De.json();t({isLoading:!1,needsSetup:!1,isAuthenticated:!0,username:Lt.username})}catch($){console.error("Auth check failed:",$),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null})}})()},[]);const q=()=>{t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null})},Qt=(w,$)=>{t({isLoading:!1,needsSetup:!1,isAuthenticated:!0,username:$})},We=()=>{z({isOpen:!0,sessionId:null,isLogout:!0,title:I("confirmLogout"),message:I("logoutMessage")})},_n=()=>{localStorage.removeItem("auth_token"),localStorage.removeItem("username"),r([]),o(null),t({isLoading:!1,needsSetup:!1,isAuthenticated:!1,username:null}),z({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})},Xe=async()=>{console.log("[DEBUG] refreshSessions 호출됨");const w=await nm();return console.log("[DEBUG] refreshSessions - 로드된 세션:",w),r(w),console.log("[DEBUG] refreshSessions - setSessions 호출 완료"),w};N.useEffect(()=>{console.log("[DEBUG] 인증 상태 변경:",e),e.isAuthenticated&&(console.log("[DEBUG] 인증됨 - refreshSessions 호출"),Xe().then(w=>{console.log("[DEBUG] 로드된 세션 목록:",w);const $=localStorage.getItem("active_session_id");$&&w.some(U=>U.id===$)?(console.log("[DEBUG] localStorage에서 활성 세션 복원:",$),o($)):w.length>0?(console.log("[DEBUG] 첫 번째 세션 활성화:",w[0].id),o(w[0].id)):console.log("[DEBUG] 세션 없음")}))},[e.isAuthenticated]),N.useEffect(()=>{l&&localStorage.setItem("active_session_id",l)},[l]),N.useEffect(()=>{localStorage.setItem("sidebar_open",h.toString())},[h]),N.useEffect(()=>{localStorage.setItem("sidebar_width",F.toString())},[F]),N.useEffect(()=>{let w=/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768;const $=()=>{const U=/iPhone|iPad|iPod|Android/i.test(navigator.userAgent)||window.innerWidth<768;u(U),U!==w&&(m(!U),w=U)};return $(),window.addEventListener("resize",$),()=>window.removeEventListener("resize",$)},[]),N.useEffect(()=>{if(!window.visualViewport)return;const w=()=>{E(window.visualViewport.height)};return w(),window.visualViewport.addEventListener("resize",w),window.visualViewport.addEventListener("scroll",w),()=>{window.visualViewport.removeEventListener("resize",w),window.visualViewport.removeEventListener("scroll",w)}},[]);const Gt=w=>{window.terminalSessions&&l&&window.terminalSessions[l]&&window.terminalSessions[l].sendData(w)},[_c,Xi]=N.useState(!1),Pc=()=>{window.terminalSessions&&l&&window.terminalSessions[l]&&(Xi(!0),setTimeout(()=>Xi(!1),300),window.terminalSessions[l].scrollToBottom())},zc=w=>{window.terminalSessions&&l&&window.terminalSessions[l]&&window.terminalSessions[l].sendData(w+`
-`)},[Zi,Lc]=N.useState(""),Tc=w=>{ut(w),he(!0)},Nc=w=>{Lc(w)},Ic=()=>{he(!1),ut(null)},Rl=async()=>{const w=tm(),$=localStorage.getItem("auth_token");try{if(!(await fetch(`/api/sessions/${w}`,{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${$}`},body:JSON.stringify({cols:80,rows:24})})).ok){console.error("Failed to create session on server");return}const ge={id:w};r(De=>[...De,ge]),o(w),Zi&&setTimeout(()=>{if(window.terminalSessions&&window.terminalSessions[w]){const De=`/workspace/${Zi}`;window.terminalSessions[w].sendData(`cd "${De}"
-`)}},1e3)}catch(U){console.error("Failed to create new session:",U)}},Rc=w=>{o(w)},jc=w=>{z({isOpen:!0,sessionId:w,isLogout:!1,title:I("closeTerminal"),message:I("confirmCloseTerminal")||"Are you sure you want to close this terminal? All unsaved work will be lost."})},Dc=async()=>{if(P.isLogout)_n();else{const w=P.sessionId,$=localStorage.getItem("auth_token");try{(await fetch(`/api/sessions/${w}`,{method:"DELETE",headers:{Authorization:`Bearer ${$}`}})).ok||console.error("Failed to delete session on server")}catch(U){console.error("Failed to delete session:",U)}if(r(U=>U.filter(ge=>ge.id!==w)),l===w){const U=n.filter(ge=>ge.id!==w);U.length>0?o(U[0].id):o(null)}z({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})}},Mc=()=>{z({isOpen:!1,sessionId:null,title:"",message:"",isLogout:!1})},Oc=w=>{j(w),Q({isOpen:!0,message:I("settingsSaved")})},Fc=()=>{console.log("[DEBUG] 사이드바 토글 전:",{isSidebarOpen:h,sessionsCount:n.length,activeSessionId:l}),m(w=>!w),console.log("[DEBUG] 사이드바 토글 후")},Ac=async(w,$)=>{const U=localStorage.getItem("auth_token");try{(await fetch(`/api/sessions/${w}/name`,{method:"PATCH",headers:{"Content-Type":"application/json",Authorization:`Bearer ${U}`},body:JSON.stringify({name:$})})).ok?r(De=>De.map(Lt=>Lt.id===w?{...Lt,name:$}:Lt)):console.error("Failed to rename session")}catch(ge){console.error("Failed to rename session:",ge)}},Uc=w=>{console.log("재연결 시도:",w),l===w?(o(null),setTimeout(()=>{o(w)},50)):o(w)},Bc=w=>{w.preventDefault(),d(!0);const $=w.clientX,U=F,ge=Lt=>{const $c=Lt.clientX-$,Wc=Math.max(180,Math.min(400,U+$c));f(Wc)},De=()=>{d(!1),document.removeEventListener("mousemove",ge),document.removeEventListener("mouseup",De),document.body.style.cursor="",document.body.style.userSelect=""};document.addEventListener("mousemove",ge),document.addEventListener("mouseup",De),document.body.style.cursor="ew-resize",document.body.style.userSelect="none"};if(e.isLoading){const w=It[T.theme]||It.catppuccin;return x.jsxs("div",{style:{...B.loadingContainer,backgroundColor:w.ui.bg},children:[x.jsx("h1",{style:{...B.loadingLogo,color:w.ui.accent},children:I("appName")}),x.jsx("p",{style:{...B.loadingText,color:w.ui.textSecondary},children:I("loading")||"Loading..."})]})}if(e.needsSetup)return x.jsx(qp,{onComplete:q,language:T.language});if(!e.isAuthenticated)return x.jsx(bp,{onLogin:Qt,language:T.language});const R=It[T.theme]||It.catppuccin;return x.jsxs("div",{style:{...B.container,backgroundColor:R.ui.bg,height:i?`${g}px`:"100vh"},children:[x.jsxs("div",{style:{...B.header,backgroundColor:R.ui.bgSecondary,borderBottomColor:R.ui.border},children:[x.jsxs("div",{style:B.headerLeft,children:[x.jsx("button",{onClick:Fc,style:{...B.hamburgerBtn,backgroundColor:"transparent",color:R.ui.iconColor},title:h?"Hide Sidebar":"Show Sidebar",children:h?x.jsx(Np,{size:20,strokeWidth:2}):x.jsx(Rp,{size:20,strokeWidth:2})}),x.jsx("h1",{style:{...B.title,color:R.ui.accent},children:I("appName")})]}),x.jsxs("div",{style:B.headerRight,children:[n.length>0&&x.jsxs("div",{style:{...B.sessionInfo,color:R.ui.text,backgroundColor:R.ui.bgTertiary,borderColor:R.ui.border},children:[x.jsx("span",{style:{color:R.ui.accent,fontWeight:"600"},children:n.findIndex(w=>w.id===l)+1}),x.jsx("span",{style:{color:R.ui.textSecondary},children:" / "}),x.jsx("span",{style:{color:R.ui.textSecondary},children:n.length})]}),i?x.jsxs(x.Fragment,{children:[x.jsx("button",{onClick:Pc,style:{...B.hamburgerBtn,backgroundColor:_c?R.ui.bgTertiary:"transparent",color:R.ui.iconColor,transition:"background-color 0.15s ease"},title:"Scroll to bottom",children:x.jsx(Pp,{size:20,strokeWidth:2})}),x.jsxs("div",{style:{position:"relative",height:"100%"},children:[x.jsx("button",{onClick:()=>y(!p),style:{...B.hamburgerBtn,backgroundColor:p?R.ui.bgTertiary:"transparent",color:R.ui.iconColor},children:x.jsx(Lp,{size:20,strokeWidth:2})}),p&&x.jsxs(x.Fragment,{children:[x.jsx("div",{style:B.menuOverlay,onClick:()=>y(!1)}),x.jsxs("div",{style:{...B.dropdown,backgroundColor:R.ui.bgSecondary,borderColor:R.ui.border},children:[x.jsxs("div",{style:{...B.dropdownItem,borderBottomColor:R.ui.border},children:[x.jsx("span",{style:{...B.dropdownLabel,color:R.ui.textSecondary},children:I("user")}),x.jsx("span",{style:{...B.dropdownValue,color:R.ui.accent},children:e.username})]}),x.jsxs("button",{onClick:()=>{Rl(),y(!1)},onMouseEnter:()=>k("new"),onMouseLeave:()=>k(null),style:{...B.dropdownButton,color:R.ui.text,backgroundColor:S==="new"?R.ui.bgTertiary:"transparent"},children:[x.jsx(ss,{size:16,strokeWidth:2}),x.jsx("span",{children:I("newSession")})]}),x.jsxs("button",{onClick:()=>{c(!0),y(!1)},onMouseEnter:()=>k("settings"),onMouseLeave:()=>k(null),style:{...B.dropdownButton,color:R.ui.text,backgroundColor:S==="settings"?R.ui.bgTertiary:"transparent"},children:[x.jsx(cs,{size:16,strokeWidth:2}),x.jsx("span",{children:I("settings")})]}),x.jsxs("button",{onClick:()=>{We(),y(!1)},onMouseEnter:()=>k("logout"),onMouseLeave:()=>k(null),style:{...B.dropdownButton,color:R.red,backgroundColor:S==="logout"?R.ui.bgTertiary:"transparent"},children:[x.jsx(as,{size:16,strokeWidth:2}),x.jsx("span",{children:I("logout")})]})]})]})]})]}):x.jsxs(x.Fragment,{children:[x.jsx("button",{onClick:()=>c(!0),style:{...B.settingsBtn,color:R.ui.iconColor,borderColor:R.ui.border},title:I("settings"),children:x.jsx(cs,{size:18,strokeWidth:2.5})}),x.jsx("button",{onClick:We,style:{...B.logoutBtn,color:R.red,borderColor:R.ui.border},title:I("logout"),children:x.jsx(as,{size:18,strokeWidth:2.5})})]})]})]}),!D&&x.jsx("div",{ref:C,style:{...B.terminalContainer,paddingBottom:i?"45px":"0",backgroundColor:R.ui.bg,marginLeft:!i&&h?`${F}px`:"0",transition:a?"none":"margin-left 0.3s ease"},children:n.length===0?x.jsxs("div",{style:B.emptyState,children:[x.jsx("div",{style:{...B.emptyIcon,color:R.ui.textSecondary},children:x.jsxs("svg",{width:"120",height:"120",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",children:[x.jsx("rect",{x:"2",y:"4",width:"20",height:"16",rx:"2"}),x.jsx("path",{d:"M7 10l3 3-3 3"}),x.jsx("line",{x1:"13",y1:"16",x2:"17",y2:"16"})]})}),x.jsx("h2",{style:{...B.emptyTitle,color:R.ui.text},children:I("noTerminals")||"No Terminals Open"}),x.jsx("p",{style:{...B.emptyMessage,color:R.ui.textSecondary,opacity:.95},children:I("createFirstTerminal")||"Create a new terminal to get started"}),x.jsxs("button",{onClick:Rl,style:{...B.emptyButton,backgroundColor:R.ui.accent,color:R.ui.bg},children:[x.jsx(ss,{size:20,strokeWidth:2.5}),x.jsx("span",{children:I("newSession")||"New Terminal"})]})]}):n.map(w=>x.jsx("div",{style:{display:w.id===l?"block":"none",width:"100%",height:"100%"},children:x.jsx(Qp,{sessionId:w.id,settings:T,isActive:w.id===l})},w.id))}),D&&it&&x.jsx("div",{style:{position:"absolute",top:"36px",left:!i&&h?`${F}px`:"0",right:0,bottom:i?"45px":0,transition:a?"none":"left 0.3s ease"},children:x.jsx(em,{filePath:it,onClose:Ic,theme:R})}),i&&x.jsx(Gp,{onSendKey:Gt,isVisible:!0,activeSessionId:l,onOpenCommandInput:()=>gr(!0)}),x.jsx(Kp,{isOpen:hr,onClose:()=>gr(!1),onSend:zc,command:En,setCommand:Cn,theme:R,t:I}),x.jsx(Xp,{isOpen:h,onClose:()=>{console.log("[DEBUG] Sidebar onClose 호출됨:",{sessionsCount:n.length,activeSessionId:l}),m(!1)},sessions:n,activeSessionId:l,onSelectSession:Rc,onNewSession:Rl,onCloseSession:jc,onRenameSession:Ac,onReconnectSession:Uc,language:T.language,theme:R,isMobile:i,width:F,onResizeStart:Bc,onFileSelect:Tc,onFolderSelect:Nc}),x.jsx(Yp,{isOpen:s,onClose:()=>c(!1),settings:T,onSave:Oc,theme:R,username:e.username}),x.jsx(Zp,{isOpen:P.isOpen,title:P.title,message:P.message,confirmText:P.isLogout?I("logout"):I("close")||"Close",cancelText:I("cancel"),onConfirm:Dc,onCancel:Mc,language:T.language,danger:!0,theme:R}),x.jsx(Jp,{isOpen:L.isOpen,message:L.message,onClose:()=>Q({isOpen:!1,message:""}),theme:R})]})}const B={loadingContainer:{width:"100%",height:"100%",display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",backgroundColor:"#1e1e2e",position:"fixed"},loadingLogo:{margin:0,fontSize:"28px",fontWeight:"700",color:"#89b4fa",marginBottom:"12px",textTransform:"uppercase"},loadingText:{margin:0,fontSize:"16px",color:"#6c7086"},container:{width:"100vw",height:"100vh",display:"flex",flexDirection:"column",backgroundColor:"#1e1e2e",position:"fixed",top:0,left:0,overflow:"hidden"},header:{display:"flex",justifyContent:"space-between",alignItems:"center",padding:"0",backgroundColor:"#181825",borderBottom:"1px solid #313244",flexShrink:0,height:"32px",boxSizing:"border-box"},headerLeft:{display:"flex",alignItems:"center",gap:"0",flexWrap:"nowrap",height:"100%"},headerRight:{display:"flex",alignItems:"center",gap:"0",height:"100%"},hamburgerBtn:{background:"none",border:"none",cursor:"pointer",padding:"0 10px",display:"flex",alignItems:"center",justifyContent:"center",borderRadius:"0",transition:"background-color 0.15s ease",height:"100%"},title:{margin:0,fontSize:"13px",fontWeight:"600",textTransform:"uppercase",padding:"0 12px",display:"flex",alignItems:"center",height:"100%"},sessionInfo:{fontSize:"12px",display:"flex",alignItems:"center",gap:"4px",padding:"0 12px",borderRight:"1px solid #313244",borderRadius:"0",height:"100%"},settingsBtn:{padding:"0 10px",backgroundColor:"transparent",border:"none",borderRight:"1px solid #313244",borderRadius:"0",cursor:"pointer",transition:"background-color 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",height:"100%"},logoutBtn:{padding:"0 10px",backgroundColor:"transparent",border:"none",borderRadius:"0",cursor:"pointer",transition:"background-color 0.15s ease",display:"flex",alignItems:"center",justifyContent:"center",height:"100%"},terminalContainer:{flex:1,overflow:"hidden",position:"relative",padding:"8px"},emptyState:{display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",height:"100%",gap:"20px",padding:"40px"},emptyIcon:{opacity:.5},emptyTitle:{margin:0,fontSize:"24px",fontWeight:"600"},emptyMessage:{margin:0,fontSize:"14px"},emptyButton:{display:"flex",alignItems:"center",gap:"8px",padding:"10px 20px",border:"none",borderRadius:"2px",fontSize:"14px",fontWeight:"500",cursor:"pointer",transition:"opacity 0.15s ease",marginTop:"12px"},menuOverlay:{position:"fixed",top:0,left:0,right:0,bottom:0,width:"100%",height:"100vh",backgroundColor:"rgba(0, 0, 0, 0.5)",zIndex:9998},dropdown:{position:"absolute",top:"calc(100% + 4px)",right:0,minWidth:"180px",backgroundColor:"#181825",border:"1px solid #313244",borderRadius:"2px",zIndex:9999,overflow:"hidden"},dropdownItem:{padding:"8px 12px",borderBottom:"1px solid #313244",display:"flex",justifyContent:"space-between",alignItems:"center"},dropdownLabel:{fontSize:"12px",color:"#6c7086",fontWeight:"500",textTransform:"uppercase"},dropdownValue:{fontSize:"13px",fontWeight:"600"},dropdownButton:{width:"100%",padding:"10px 12px",background:"none",border:"none",color:"#cdd6f4",fontSize:"12px",fontWeight:"500",cursor:"pointer",display:"flex",alignItems:"center",gap:"8px",transition:"background-color 0.15s ease",textAlign:"left",lineHeight:"1"}};uo.createRoot(document.getElementById("root")).render(x.jsx(of.StrictMode,{children:x.jsx(rm,{})}));export{lm as a,Ht as c,x as j,N as r,It as t,Up as u};
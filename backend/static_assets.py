@@ -0,0 +1,372 @@
+"""
+프론트엔드 정적 파일 서빙
+빌드 시 만들어 둔 .br/.gz 파일을 Accept-Encoding에 맞춰 그대로 전송 (요청마다 압축하지 않음)
+작은 파일과 index.html은 메모리에 보관해 디스크 I/O 없이 응답하고, ETag로 304 응답
+"""
+import asyncio
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import stat
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+from compression import is_compressible
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 - 없으면 빌드 시 만든 .br 파일만 사용
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 선호 순서대로 (Content-Encoding, 파일 확장자)
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# 빌드 도구가 붙이는 콘텐츠 해시 파일명 (index-DqcDFUo8.js, CommandInput-Btnc-gsM.js.map)
+HASHED_NAME_RE = re.compile(r"[A-Za-z0-9_.-]+-[A-Za-z0-9_-]{8}(?:\.[A-Za-z0-9]+)+")
+
+# 변경될 수 있는 파일(index.html 등)의 디스크 재확인 간격 (초)
+REVALIDATE_INTERVAL = 2.0
+
+# 메모리에서 gzip을 만들 최소 크기 (압축 미들웨어 기본 minimum_size와 동일)
+MIN_COMPRESS_SIZE = 1000
+
+
+class StaticAsset:
+    """정적 파일 하나의 메타데이터 (압축 변형 포함)"""
+
+    __slots__ = ("path", "media_type", "size", "mtime_ns", "etag", "immutable", "variants", "checked")
+
+    def __init__(self, path: Path, media_type: str, size: int, mtime_ns: int, etag: str, immutable: bool):
+        self.path = path
+        self.media_type = media_type
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.etag = etag
+        self.immutable = immutable
+        # Content-Encoding -> 디스크의 압축 파일 (None이면 메모리에서 생성)
+        self.variants: Dict[str, Optional[Path]] = {}
+        self.checked = time.monotonic()
+
+
+class StaticAssetServer:
+    """
+    정적 파일 서버
+
+    - 콘텐츠 해시 파일명(assets/)은 1년 immutable 캐시, 그 외는 짧은 캐시, index.html은 매번 재검증(no-cache)
+    - 작은 파일은 본문(압축 변형 포함)을 LRU 메모리 캐시에 보관
+    - ETag는 내용의 sha256 (큰 파일은 mtime/크기), 압축 변형은 접미사로 구분
+    - 시작 시 index.html에서 참조되지 않는 오래된 번들 정리
+    """
+
+    def __init__(self, directory: Path, cache_bytes: int = None, max_file_size: int = None):
+        if cache_bytes is None:
+            cache_bytes = int(os.getenv("STATIC_CACHE_BYTES", str(8 * 1024 * 1024)))
+        if max_file_size is None:
+            max_file_size = int(os.getenv("STATIC_CACHE_MAX_FILE", str(512 * 1024)))
+
+        self.root = Path(os.path.realpath(directory))
+        self.cache_bytes = cache_bytes
+        self.max_file_size = max_file_size
+
+        self._assets: "OrderedDict[str, StaticAsset]" = OrderedDict()
+        self._bodies: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ==================== 요청 처리 ====================
+
+    async def serve(self, relative: str, request: Request) -> Optional[Response]:
+        """
+        정적 파일 응답 생성
+
+        Args:
+            relative: static 디렉토리 기준 상대 경로
+            request: 요청 (Accept-Encoding, If-None-Match 확인)
+
+        Returns:
+            응답, 파일이 없으면 None
+        """
+        asset = await self._lookup(relative)
+        if asset is None:
+            return None
+
+        encoding = self._negotiate(asset, request.headers.get("accept-encoding", ""))
+        etag = asset.etag if encoding == "identity" else f'{asset.etag[:-1]}-{encoding}"'
+
+        headers = {
+            "ETag": etag,
+            "Cache-Control": self._cache_control(relative, asset),
+            "Vary": "Accept-Encoding",
+        }
+
+        if self._not_modified(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        # Content-Encoding이 있으면 압축 미들웨어가 건너뜀
+        # (압축 변형이 없는 파일만 기존처럼 미들웨어가 압축)
+        if asset.variants:
+            headers["Content-Encoding"] = encoding
+
+        body = await self._body(relative, asset, encoding)
+        if body is not None:
+            return Response(content=body, media_type=asset.media_type, headers=headers)
+
+        path = asset.path if encoding == "identity" else asset.variants[encoding]
+        return FileResponse(path, media_type=asset.media_type, headers=headers)
+
+    @staticmethod
+    def _negotiate(asset: StaticAsset, accept_encoding: str) -> str:
+        """Accept-Encoding에서 허용한 압축 변형 중 가장 선호하는 것 선택"""
+        if not asset.variants or not accept_encoding:
+            return "identity"
+
+        accepted: Set[str] = set()
+        for part in accept_encoding.lower().split(","):
+            name, _, params = part.strip().partition(";")
+            quality = params.strip()
+            if quality.startswith("q="):
+                try:
+                    if float(quality[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(name.strip())
+
+        for encoding, _ in ENCODINGS:
+            if encoding in asset.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+    @staticmethod
+    def _not_modified(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match 비교 (약한 비교, RFC 9110)"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+    @staticmethod
+    def _cache_control(relative: str, asset: StaticAsset) -> str:
+        if asset.immutable:
+            return "public, max-age=31536000, immutable"
+        if relative == "index.html":
+            return "no-cache"
+        return "public, max-age=3600"
+
+    # ==================== 메타데이터 ====================
+
+    async def _lookup(self, relative: str) -> Optional[StaticAsset]:
+        """메타데이터 조회 (변경될 수 있는 파일만 주기적으로 디스크 재확인)"""
+        asset = self._assets.get(relative)
+        if asset is not None:
+            self._assets.move_to_end(relative)
+            if asset.immutable or time.monotonic() - asset.checked < REVALIDATE_INTERVAL:
+                return asset
+
+        loaded, content = await asyncio.to_thread(self._load, relative, asset)
+        if loaded is None:
+            self._forget(relative)
+            return None
+
+        if loaded is not asset:
+            self._forget(relative)
+            self._assets[relative] = loaded
+            if content is not None:
+                self._store((relative, "identity"), content)
+            # 오래 쓰지 않은 메타데이터는 정리 (본문 캐시와 별도로 개수 제한)
+            while len(self._assets) > 4096:
+                self._forget(next(iter(self._assets)))
+        return loaded
+
+    def _load(
+        self, relative: str, previous: Optional[StaticAsset]
+    ) -> Tuple[Optional[StaticAsset], Optional[bytes]]:
+        """
+        파일 정보와 압축 변형 확인 (스레드 풀)
+
+        Returns:
+            (메타데이터, 작은 파일이면 원본 내용), 파일이 없으면 (None, None)
+        """
+        if "\0" in relative:
+            return None, None
+        path = Path(os.path.realpath(self.root / relative))
+        if path == self.root or self.root not in path.parents:
+            return None, None
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, None
+        if not stat.S_ISREG(st.st_mode):
+            return None, None
+
+        if previous is not None and previous.mtime_ns == st.st_mtime_ns and previous.size == st.st_size:
+            previous.checked = time.monotonic()
+            return previous, None
+
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        immutable = relative.startswith("assets/") and HASHED_NAME_RE.fullmatch(path.name) is not None
+
+        content = None
+        if st.st_size <= self.max_file_size:
+            content = path.read_bytes()
+            etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+        else:
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+        asset = StaticAsset(path, media_type, st.st_size, st.st_mtime_ns, etag, immutable)
+
+        # 원본보다 오래된 압축 파일은 무시 (원본만 교체된 경우)
+        for encoding, suffix in ENCODINGS:
+            sibling = path.with_name(path.name + suffix)
+            try:
+                if os.stat(sibling).st_mtime_ns >= st.st_mtime_ns:
+                    asset.variants[encoding] = sibling
+            except OSError:
+                pass
+
+        # 빌드 산출물이 아닌 작은 텍스트 파일(favicon.svg 등)은 메모리에서 한 번만 압축
+        if content is not None and "gzip" not in asset.variants and is_compressible(media_type) \
+                and st.st_size >= MIN_COMPRESS_SIZE:
+            asset.variants["gzip"] = None
+            if brotli is not None and "br" not in asset.variants:
+                asset.variants["br"] = None
+
+        return asset, content
+
+    def _forget(self, relative: str):
+        """메타데이터와 캐시된 본문 제거"""
+        self._assets.pop(relative, None)
+        for key in [key for key in self._bodies if key[0] == relative]:
+            self._cached_bytes -= len(self._bodies.pop(key))
+
+    # ==================== 본문 캐시 ====================
+
+    async def _body(self, relative: str, asset: StaticAsset, encoding: str) -> Optional[bytes]:
+        """
+        메모리 캐시된 본문 조회 (없으면 읽어서 캐시)
+
+        Returns:
+            본문, 캐시하기에 큰 파일이면 None (디스크에서 스트리밍)
+        """
+        key = (relative, encoding)
+        body = self._bodies.get(key)
+        if body is not None:
+            self._bodies.move_to_end(key)
+            self.hits += 1
+            return body
+
+        if asset.size > self.max_file_size:
+            return None
+
+        self.misses += 1
+        body = await asyncio.to_thread(self._read_variant, asset, encoding)
+        self._store(key, body)
+        return body
+
+    @staticmethod
+    def _read_variant(asset: StaticAsset, encoding: str) -> bytes:
+        """압축 변형 읽기 또는 생성 (스레드 풀)"""
+        path = asset.path if encoding == "identity" else asset.variants[encoding]
+        if path is not None:
+            return path.read_bytes()
+
+        content = asset.path.read_bytes()
+        if encoding == "br":
+            return brotli.compress(content, quality=11)
+        return gzip.compress(content, compresslevel=9, mtime=0)
+
+    def _store(self, key: Tuple[str, str], body: bytes):
+        """LRU 캐시에 저장 (전체 크기 제한)"""
+        if len(body) > self.max_file_size:
+            return
+        previous = self._bodies.pop(key, None)
+        if previous is not None:
+            self._cached_bytes -= len(previous)
+        self._bodies[key] = body
+        self._cached_bytes += len(body)
+        while self._cached_bytes > self.cache_bytes and self._bodies:
+            _, evicted = self._bodies.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        return {
+            "assets": len(self._assets),
+            "cached_bodies": len(self._bodies),
+            "cached_bytes": self._cached_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    # ==================== 오래된 번들 정리 ====================
+
+    def prune(self) -> int:
+        """
+        index.html에서 (간접적으로라도) 참조되지 않는 해시 파일명 번들 삭제
+
+        이전 빌드 결과 위에 새 빌드를 덮어쓰면 예전 index-*.js 등이 계속 쌓이므로
+        index.html에서 시작해 JS/CSS가 참조하는 파일을 따라가며 사용 중인 파일을 구한 뒤 나머지를 삭제.
+        해시 파일명이 아닌 파일은 건드리지 않음
+
+        Returns:
+            삭제한 파일 수
+        """
+        index_path = self.root / "index.html"
+        assets_dir = self.root / "assets"
+        if not index_path.is_file() or not assets_dir.is_dir():
+            return 0
+
+        available = {
+            name for name in os.listdir(assets_dir)
+            if not name.endswith((".br", ".gz")) and (assets_dir / name).is_file()
+        }
+
+        referenced: Set[str] = set()
+        pending = [index_path.read_text(encoding="utf-8", errors="replace")]
+        while pending:
+            text = pending.pop()
+            for match in HASHED_NAME_RE.finditer(text):
+                name = match.group(0)
+                if name not in available or name in referenced:
+                    continue
+                referenced.add(name)
+                if name.endswith((".js", ".mjs", ".css", ".html")):
+                    pending.append((assets_dir / name).read_text(encoding="utf-8", errors="replace"))
+
+        # 개발용 index.html 등 번들을 참조하지 않으면 판단할 수 없으므로 정리하지 않음
+        if not referenced:
+            return 0
+
+        removed = 0
+        for name in os.listdir(assets_dir):
+            base = name
+            for suffix in (".br", ".gz", ".map"):
+                base = base.removesuffix(suffix)
+            if base in referenced or HASHED_NAME_RE.fullmatch(base) is None:
+                continue
+            try:
+                os.unlink(assets_dir / name)
+                removed += 1
+            except OSError as e:
+                logger.warning(f"오래된 정적 파일 삭제 실패 {name}: {e}")
+
+        if removed:
+            logger.info(f"참조되지 않는 정적 파일 {removed}개 정리 (사용 중 {len(referenced)}개)")
+        return removed
+
+
+# 전역 정적 파일 서버 인스턴스
+static_assets = StaticAssetServer(Path(__file__).parent / "static")
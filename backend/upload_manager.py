@@ -0,0 +1,252 @@
+"""
+이어받기 가능한 분할 업로드 관리
+모바일처럼 연결이 자주 끊기는 환경에서 받은 부분부터 다시 전송할 수 있도록 함
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+
+from file_manager import file_manager, WRITE_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{16,64}")
+
+
+class UploadManager:
+    """
+    분할 업로드 세션 관리
+
+    받은 데이터는 업로드 디렉토리의 <id>.part에, 메타데이터는 <id>.json에 저장하므로
+    서버가 재시작되어도 이어서 받을 수 있음 (현재 오프셋 = .part 파일 크기)
+    """
+
+    def __init__(self, upload_dir: str = None, max_size: int = None, ttl_hours: int = None):
+        if upload_dir is None:
+            upload_dir = os.getenv("UPLOAD_DIR", "/tmp/iterminal-uploads")
+        if max_size is None:
+            max_size = int(os.getenv("UPLOAD_MAX_SIZE", str(10 * 1024 * 1024 * 1024)))
+        if ttl_hours is None:
+            ttl_hours = int(os.getenv("UPLOAD_TTL_HOURS", "24"))
+
+        self.upload_dir = upload_dir
+        self.max_size = max_size
+        self.ttl_hours = ttl_hours
+        # 사용 중인 잠금만 유지 (404가 난 ID나 만료된 업로드의 항목이 쌓이지 않도록)
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def _paths(self, upload_id: str):
+        if not UPLOAD_ID_PATTERN.fullmatch(upload_id):
+            raise HTTPException(status_code=404, detail="Upload not found")
+        base = os.path.join(self.upload_dir, upload_id)
+        return base + ".json", base + ".part"
+
+    def _lock(self, upload_id: str) -> asyncio.Lock:
+        """같은 업로드에 대한 동시 요청 직렬화 (재시도 중복 방지)"""
+        lock = self._locks.get(upload_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[upload_id] = lock
+        return lock
+
+    # ==================== 동기 작업 (file_manager 스레드 풀에서 실행) ====================
+
+    def _create(self, cancel: threading.Event, upload_id: str, meta: dict):
+        os.makedirs(self.upload_dir, mode=0o700, exist_ok=True)
+        self._prune(cancel)
+        meta_path, part_path = self._paths(upload_id)
+        open(part_path, "xb").close()
+        with open(meta_path, "x", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def _load(self, cancel: threading.Event, upload_id: str, username: str) -> dict:
+        """업로드 메타데이터 + 현재 오프셋"""
+        meta_path, part_path = self._paths(upload_id)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["offset"] = os.path.getsize(part_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Upload not found")
+
+        if meta.get("username") != username:
+            raise HTTPException(status_code=404, detail="Upload not found")
+        return meta
+
+    def _open_append(self, cancel: threading.Event, upload_id: str) -> int:
+        _, part_path = self._paths(upload_id)
+        return os.open(part_path, os.O_WRONLY | os.O_APPEND)
+
+    def _close(self, cancel: threading.Event, fd: int):
+        os.fsync(fd)
+        os.close(fd)
+
+    def _remove(self, cancel: threading.Event, upload_id: str):
+        for path in self._paths(upload_id):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def _prune(self, cancel: threading.Event):
+        """만료된 업로드 정리"""
+        cutoff = time.time() - self.ttl_hours * 3600
+        try:
+            names = os.listdir(self.upload_dir)
+        except FileNotFoundError:
+            return
+
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            upload_id = name[:-5]
+            try:
+                if os.path.getmtime(os.path.join(self.upload_dir, name)) < cutoff:
+                    self._remove(cancel, upload_id)
+                    logger.info(f"만료된 업로드 정리: {upload_id}")
+            except (OSError, HTTPException):
+                continue
+
+    # ==================== API ====================
+
+    async def create(
+        self,
+        path: Path,
+        relative_path: str,
+        size: int,
+        username: str,
+        expected_etag: Optional[str] = None,
+        overwrite: bool = True
+    ) -> dict:
+        """
+        업로드 세션 생성
+
+        Args:
+            path: 검증된 대상 경로
+            relative_path: 대상 상대 경로 (응답용)
+            size: 전체 크기 (바이트)
+            username: 업로드 사용자
+            expected_etag: 완료 시 확인할 대상 파일 ETag
+            overwrite: False면 대상이 이미 있을 때 409
+
+        Returns:
+            id, path, size, offset
+        """
+        if size > self.max_size:
+            raise HTTPException(status_code=413, detail="Upload too large")
+
+        # 시작 전에 충돌 여부를 먼저 알려줌 (완료 시 다시 확인)
+        await file_manager.run(file_manager.check_etag, path, expected_etag, overwrite)
+
+        upload_id = secrets.token_urlsafe(24)
+        meta = {
+            "id": upload_id,
+            "path": relative_path,
+            "target": str(path),
+            "size": size,
+            "username": username,
+            "expected_etag": expected_etag,
+            "overwrite": overwrite,
+            "created_at": time.time()
+        }
+        await file_manager.run(self._create, upload_id, meta)
+        logger.info(f"업로드 시작: {relative_path} ({size} bytes) by {username}")
+        return {"id": upload_id, "path": relative_path, "size": size, "offset": 0}
+
+    async def status(self, upload_id: str, username: str) -> dict:
+        """업로드 진행 상태 (이어받기 시 offset부터 전송)"""
+        meta = await file_manager.run(self._load, upload_id, username)
+        return {"id": upload_id, "path": meta["path"], "size": meta["size"], "offset": meta["offset"]}
+
+    async def append(
+        self,
+        upload_id: str,
+        username: str,
+        offset: int,
+        chunks: AsyncIterator[bytes]
+    ) -> dict:
+        """
+        업로드 데이터 추가
+
+        offset이 현재 받은 크기와 다르면 409와 함께 현재 offset을 알려주므로
+        클라이언트는 그 위치부터 다시 보내면 됨
+
+        Returns:
+            id, size, offset
+        """
+        async with self._lock(upload_id):
+            meta = await file_manager.run(self._load, upload_id, username)
+            if offset != meta["offset"]:
+                raise HTTPException(
+                    status_code=409,
+                    detail="Offset mismatch",
+                    headers={"Upload-Offset": str(meta["offset"])}
+                )
+
+            fd = await file_manager.run(self._open_append, upload_id)
+            received = meta["offset"]
+            buffer = bytearray()
+            try:
+                async for chunk in chunks:
+                    if received + len(chunk) > meta["size"]:
+                        raise HTTPException(status_code=413, detail="Upload exceeds declared size")
+                    received += len(chunk)
+                    buffer += chunk
+                    if len(buffer) >= WRITE_BUFFER_SIZE:
+                        await file_manager.run(file_manager.write_all, fd, bytes(buffer))
+                        buffer.clear()
+            finally:
+                # 연결이 끊겨도 이미 받은 부분은 기록해서 이어받기 가능
+                try:
+                    if buffer:
+                        await file_manager.run(file_manager.write_all, fd, bytes(buffer))
+                finally:
+                    await file_manager.run(self._close, fd)
+
+        return await self.status(upload_id, username)
+
+    async def complete(self, upload_id: str, username: str) -> dict:
+        """
+        업로드 완료: 대상 경로로 원자적 이동
+
+        Returns:
+            path, size, etag
+        """
+        async with self._lock(upload_id):
+            meta = await file_manager.run(self._load, upload_id, username)
+            if meta["offset"] != meta["size"]:
+                raise HTTPException(
+                    status_code=409,
+                    detail="Upload incomplete",
+                    headers={"Upload-Offset": str(meta["offset"])}
+                )
+
+            _, part_path = self._paths(upload_id)
+            etag = await file_manager.run(
+                file_manager.move_into_place, part_path, Path(meta["target"]),
+                meta["expected_etag"], meta["overwrite"]
+            )
+            await file_manager.run(self._remove, upload_id)
+
+        logger.info(f"업로드 완료: {meta['path']} by {username}")
+        return {"path": meta["path"], "size": meta["size"], "etag": etag}
+
+    async def abort(self, upload_id: str, username: str):
+        """업로드 취소"""
+        async with self._lock(upload_id):
+            await file_manager.run(self._load, upload_id, username)
+            await file_manager.run(self._remove, upload_id)
+
+
+# 전역 업로드 매니저 인스턴스
+upload_manager = UploadManager()
@@ -54,7 +54,7 @@ const fetchSessionsFromAPI = async () => {
     console.log('[DEBUG] fetchSessions API 응답:', sessions);
 
     // API 응답 형식을 앱 형식으로 변환
-    const mapped = sessions.map(s => ({ id: s.id, name: s.name }));
+    const mapped = sessions.map(s => ({ id: s.id, name: s.name, historyBytes: s.history_bytes }));
     console.log('[DEBUG] fetchSessions 매핑 결과:', mapped);
     return mapped;
   } catch (error) {
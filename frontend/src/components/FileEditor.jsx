@@ -2,15 +2,51 @@
  * FileEditor 컴포넌트
  * 파일 내용 표시 및 편집
  */
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { File, X, Edit2, Save } from 'lucide-react';
 
+const isHighSurrogate = (code) => code >= 0xd800 && code <= 0xdbff;
+const isLowSurrogate = (code) => code >= 0xdc00 && code <= 0xdfff;
+
+/**
+ * 원본과 수정본의 앞뒤 공통 부분을 제외한 변경 구간 계산
+ * 서버는 UTF-8 바이트 오프셋을 사용하므로 바이트 단위로 변환
+ */
+const computeEdit = (before, after) => {
+  const minLength = Math.min(before.length, after.length);
+  let start = 0;
+  while (start < minLength && before.charCodeAt(start) === after.charCodeAt(start)) {
+    start++;
+  }
+  let end = 0;
+  while (
+    end < minLength - start &&
+    before.charCodeAt(before.length - 1 - end) === after.charCodeAt(after.length - 1 - end)
+  ) {
+    end++;
+  }
+
+  // 서로게이트 쌍(이모지 등) 중간에서 자르지 않음
+  if (start > 0 && isHighSurrogate(before.charCodeAt(start - 1))) start--;
+  if (end > 0 && isLowSurrogate(before.charCodeAt(before.length - end))) end--;
+
+  const encoder = new TextEncoder();
+  return {
+    offset: encoder.encode(before.slice(0, start)).length,
+    delete: encoder.encode(before.slice(start, before.length - end)).length,
+    insert: after.slice(start, after.length - end)
+  };
+};
+
 const FileEditor = ({ filePath, onClose, theme }) => {
   const [content, setContent] = useState('');
   const [isEditing, setIsEditing] = useState(false);
   const [loading, setLoading] = useState(true);
   const [saving, setSaving] = useState(false);
   const [error, setError] = useState(null);
+  // 마지막으로 불러온/저장한 파일 버전
+  // etag: 다른 곳에서 수정된 경우 덮어쓰기 방지, sha256 + content: 변경 구간만 저장
+  const baseRef = useRef({ content: null, etag: null, sha256: null });
 
   // 파일 로드
   useEffect(() => {
@@ -36,6 +72,7 @@ const FileEditor = ({ filePath, onClose, theme }) => {
 
       const data = await res.json();
       setContent(data.content);
+      baseRef.current = { content: data.content, etag: data.etag || null, sha256: data.sha256 || null };
     } catch (error) {
       console.error('Failed to load file:', error);
       setError(error.message);
@@ -44,26 +81,75 @@ const FileEditor = ({ filePath, onClose, theme }) => {
     }
   };
 
-  const saveFile = async () => {
+  // 변경 구간만 전송 (기준 버전이 다르면 false를 반환해 전체 저장으로 대체)
+  const patchFile = async (token) => {
+    const base = baseRef.current;
+    if (!base.sha256 || base.content === null) return false;
+
+    const res = await fetch('/api/files/patch', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        Authorization: `Bearer ${token}`
+      },
+      body: JSON.stringify({
+        path: filePath,
+        base_sha256: base.sha256,
+        edits: [computeEdit(base.content, content)]
+      })
+    });
+
+    if (!res.ok) return false;
+
+    const data = await res.json();
+    baseRef.current = { content, etag: data.etag || null, sha256: data.sha256 || null };
+    return true;
+  };
+
+  const saveFile = async (force = false) => {
     setSaving(true);
     setError(null);
 
     try {
       const token = localStorage.getItem('auth_token');
+
+      if (!force && content === baseRef.current.content) {
+        setIsEditing(false);
+        return;
+      }
+      if (!force && await patchFile(token)) {
+        setIsEditing(false);
+        return;
+      }
+
       const res = await fetch('/api/files/write', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
           Authorization: `Bearer ${token}`
         },
-        body: JSON.stringify({ path: filePath, content })
+        body: JSON.stringify({
+          path: filePath,
+          content,
+          expected_etag: force ? null : baseRef.current.etag
+        })
       });
 
+      if (res.status === 412) {
+        // 불러온 뒤 터미널 등에서 파일이 변경됨
+        if (window.confirm('파일이 다른 곳에서 변경되었습니다. 덮어쓸까요?\n(취소하면 편집 내용을 유지합니다)')) {
+          return await saveFile(true);
+        }
+        return;
+      }
+
       if (!res.ok) {
         const errorData = await res.json();
         throw new Error(errorData.detail || 'Failed to save file');
       }
 
+      const data = await res.json();
+      baseRef.current = { content, etag: data.etag || null, sha256: data.sha256 || null };
       setIsEditing(false);
     } catch (error) {
       console.error('Failed to save file:', error);
@@ -101,7 +187,7 @@ const FileEditor = ({ filePath, onClose, theme }) => {
           ) : (
             <>
               <button
-                onClick={saveFile}
+                onClick={() => saveFile()}
                 disabled={saving}
                 style={{ ...styles.button, backgroundColor: theme.green, color: theme.ui.bg }}
               >
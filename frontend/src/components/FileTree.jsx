@@ -3,7 +3,16 @@
  * VS Code 스타일 파일 브라우저 트리
  */
 import { useState, useEffect, useRef } from 'react';
-import { Folder, File, ChevronRight, ChevronDown, FolderOpen, FilePlus, FolderPlus, X, Trash2, Edit3, Copy, Terminal } from 'lucide-react';
+import { Folder, File, ChevronRight, ChevronDown, FolderOpen, FilePlus, FolderPlus, X, Trash2, Edit3, Copy, Terminal, Search, Download } from 'lucide-react';
+
+// 하위 폴더 목록 페이지 크기 (큰 폴더도 첫 페이지를 빠르게 표시)
+const DIRECTORY_PAGE_SIZE = 500;
+
+// 파일 검색 입력 지연 (ms)
+const SEARCH_DEBOUNCE_MS = 150;
+
+// 일괄 작업 진행 상황 확인 주기 (ms)
+const JOB_POLL_MS = 300;
 
 const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
   const [expandedDirs, setExpandedDirs] = useState(new Set([''])); // 루트는 기본 확장
@@ -15,6 +24,11 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
   const [inputValue, setInputValue] = useState('');
   const [contextMenu, setContextMenu] = useState(null); // { x, y, item }
   const [renameItem, setRenameItem] = useState(null); // 이름 변경 중인 아이템
+  const [changeVersions, setChangeVersions] = useState({}); // 경로별 변경 알림 횟수
+  const [searchQuery, setSearchQuery] = useState('');
+  const [searchResults, setSearchResults] = useState([]);
+  const watchSocketRef = useRef(null);
+  const watchedPathsRef = useRef(new Set(['']));
 
   // 루트 디렉토리 로드
   useEffect(() => {
@@ -41,6 +55,146 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
     }
   };
 
+  // 디렉토리 한 페이지 로드 (cursor: 이전 페이지의 nextCursor)
+  const loadDirectoryPage = async (path, cursor = null) => {
+    try {
+      const token = localStorage.getItem('auth_token');
+      const params = new URLSearchParams({ path, limit: String(DIRECTORY_PAGE_SIZE) });
+      if (cursor) {
+        params.set('cursor', cursor);
+      }
+      const res = await fetch(`/api/files?${params.toString()}`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+
+      if (!res.ok) {
+        console.error('Failed to load directory:', path);
+        return { items: [], nextCursor: null };
+      }
+
+      const data = await res.json();
+      return { items: data.items, nextCursor: data.next_cursor };
+    } catch (error) {
+      console.error('Failed to load directory:', error);
+      return { items: [], nextCursor: null };
+    }
+  };
+
+  // 디렉토리 변경 알림 구독 (펼친 폴더만 서버에서 감시)
+  useEffect(() => {
+    const token = localStorage.getItem('auth_token');
+    if (!token) return;
+
+    let closed = false;
+    let ws = null;
+
+    const connect = async () => {
+      // 연결용 일회용 티켓 발급 (JWT를 WebSocket URL에 넣지 않음)
+      let ticket;
+      try {
+        const res = await fetch('/api/files/watch/ticket', {
+          method: 'POST',
+          headers: { Authorization: `Bearer ${token}` },
+        });
+        if (!res.ok) {
+          throw new Error(`ticket request failed (${res.status})`);
+        }
+        ticket = (await res.json()).ticket;
+      } catch (error) {
+        console.error('Failed to get file watch ticket:', error);
+        return;
+      }
+      if (closed) return;
+
+      const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+      ws = new WebSocket(`${protocol}//${window.location.host}/api/files/watch?ticket=${encodeURIComponent(ticket)}`);
+      watchSocketRef.current = ws;
+
+      ws.onopen = () => {
+        watchedPathsRef.current.forEach((path) => {
+          ws.send(JSON.stringify({ action: 'watch', path }));
+        });
+      };
+
+      ws.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        if (message.type !== 'changed') return;
+
+        if (message.path === '') {
+          refreshTree();
+        } else {
+          setChangeVersions((prev) => ({ ...prev, [message.path]: (prev[message.path] || 0) + 1 }));
+        }
+      };
+    };
+
+    connect();
+
+    return () => {
+      closed = true;
+      watchSocketRef.current = null;
+      if (ws) {
+        ws.close();
+      }
+    };
+  }, []);
+
+  // 파일명 검색 (입력이 멈추면 요청)
+  useEffect(() => {
+    const query = searchQuery.trim();
+    if (!query) {
+      setSearchResults([]);
+      return;
+    }
+
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const token = localStorage.getItem('auth_token');
+        const params = new URLSearchParams({ q: query, limit: '100' });
+        const res = await fetch(`/api/files/search?${params.toString()}`, {
+          headers: { Authorization: `Bearer ${token}` },
+          signal: controller.signal
+        });
+
+        if (res.ok) {
+          const data = await res.json();
+          setSearchResults(data.items);
+        }
+      } catch (error) {
+        if (error.name !== 'AbortError') {
+          console.error('Failed to search files:', error);
+        }
+      }
+    }, SEARCH_DEBOUNCE_MS);
+
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [searchQuery]);
+
+  const handleSearchSelect = (item) => {
+    if (item.type === 'directory') {
+      handleFolderSelect(item.path);
+    } else {
+      onFileSelect(item.path);
+    }
+  };
+
+  const watchDirectory = (path, enabled) => {
+    if (enabled) {
+      watchedPathsRef.current.add(path);
+    } else {
+      watchedPathsRef.current.delete(path);
+    }
+
+    const ws = watchSocketRef.current;
+    if (ws && ws.readyState === WebSocket.OPEN) {
+      ws.send(JSON.stringify({ action: enabled ? 'watch' : 'unwatch', path }));
+    }
+  };
+
   const toggleDirectory = async (path) => {
     const newExpanded = new Set(expandedDirs);
     if (newExpanded.has(path)) {
@@ -122,30 +276,47 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
     setRootItems(items);
   };
 
+  // 일괄 작업 실행 후 완료될 때까지 대기 (큰 폴더 삭제/이동은 서버에서 백그라운드로 처리)
+  const runBatch = async (operations) => {
+    const token = localStorage.getItem('auth_token');
+    const headers = { Authorization: `Bearer ${token}` };
+    const res = await fetch('/api/files/batch', {
+      method: 'POST',
+      headers: { ...headers, 'Content-Type': 'application/json' },
+      body: JSON.stringify({ operations })
+    });
+    if (!res.ok) {
+      const error = await res.json();
+      throw new Error(error.detail || '알 수 없는 오류');
+    }
+
+    let job = await res.json();
+    while (job.status === 'pending' || job.status === 'running') {
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_MS));
+      const poll = await fetch(`/api/jobs/${job.id}`, { headers });
+      if (!poll.ok) throw new Error('작업 상태를 확인할 수 없습니다');
+      job = await poll.json();
+    }
+    if (job.errors.length > 0) {
+      throw new Error(job.errors.map((e) => `${e.path}: ${e.detail}`).join('\n'));
+    }
+    return job;
+  };
+
   // 파일/폴더 삭제
   const handleDelete = async (item) => {
     if (!confirm(`"${item.name}"을(를) 삭제하시겠습니까?`)) return;
 
     try {
-      const token = localStorage.getItem('auth_token');
-      const res = await fetch(`/api/files?path=${encodeURIComponent(item.path)}`, {
-        method: 'DELETE',
-        headers: { Authorization: `Bearer ${token}` }
-      });
-
-      if (res.ok) {
-        await refreshTree();
-      } else {
-        const error = await res.json();
-        alert(`삭제 실패: ${error.detail || '알 수 없는 오류'}`);
-      }
+      await runBatch([{ op: 'delete', path: item.path }]);
     } catch (error) {
       console.error('Failed to delete:', error);
-      alert('삭제 실패');
+      alert(`삭제 실패: ${error.message}`);
     }
+    await refreshTree();
   };
 
-  // 이름 변경
+  // 이름 변경 (같은 폴더 안에서 이동)
   const handleRename = async (item, newName) => {
     if (!newName.trim() || newName === item.name) {
       setRenameItem(null);
@@ -153,17 +324,38 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
     }
 
     try {
-      const token = localStorage.getItem('auth_token');
       const parentPath = item.path.substring(0, item.path.lastIndexOf('/'));
-      const newPath = parentPath ? `${parentPath}/${newName}` : newName;
-
-      // 이름 변경 = 삭제 + 생성 (또는 파일 이동 API 추가 필요)
-      // 간단하게 복사 후 삭제로 구현
-      alert('이름 변경 기능은 추후 추가 예정입니다');
-      setRenameItem(null);
+      await runBatch([{ op: 'move', path: item.path, dest: parentPath, name: newName.trim() }]);
+      await refreshTree();
     } catch (error) {
       console.error('Failed to rename:', error);
-      alert('이름 변경 실패');
+      alert(`이름 변경 실패: ${error.message}`);
+    } finally {
+      setRenameItem(null);
+    }
+  };
+
+  // 폴더 압축 다운로드
+  const handleDownloadFolder = async (item) => {
+    try {
+      const token = localStorage.getItem('auth_token');
+      const res = await fetch(`/api/files/archive?path=${encodeURIComponent(item.path)}&format=zip`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      if (!res.ok) {
+        const error = await res.json();
+        throw new Error(error.detail || '알 수 없는 오류');
+      }
+
+      const url = URL.createObjectURL(await res.blob());
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `${item.name}.zip`;
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (error) {
+      console.error('Failed to download folder:', error);
+      alert(`다운로드 실패: ${error.message}`);
     }
   };
 
@@ -249,9 +441,54 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
           </div>
         </div>
 
-      {/* 파일 트리 */}
+        {/* 파일 검색 */}
+        <div style={{ ...styles.searchBar, borderBottomColor: theme.ui.border }}>
+          <Search size={12} style={{ color: theme.ui.textSecondary, flexShrink: 0 }} />
+          <input
+            type="text"
+            value={searchQuery}
+            onChange={(e) => setSearchQuery(e.target.value)}
+            onKeyDown={(e) => {
+              if (e.key === 'Escape') {
+                setSearchQuery('');
+              } else if (e.key === 'Enter' && searchResults.length > 0) {
+                handleSearchSelect(searchResults[0]);
+              }
+            }}
+            placeholder="파일 검색..."
+            className="create-input"
+            style={{ ...styles.searchInput, color: theme.ui.text }}
+          />
+          {searchQuery && (
+            <button
+              onClick={() => setSearchQuery('')}
+              className="file-tree-btn"
+              style={{ ...styles.actionBtn, color: theme.ui.textSecondary }}
+            >
+              <X size={12} />
+            </button>
+          )}
+        </div>
+
+      {/* 파일 트리 (검색 중이면 검색 결과) */}
       <div style={styles.treeContainer}>
-        {loading ? (
+        {searchQuery.trim() ? (
+          searchResults.map(item => (
+            <div
+              key={item.path}
+              className="context-menu-item"
+              style={{ ...styles.treeItem, color: theme.ui.text }}
+              onClick={() => handleSearchSelect(item)}
+              title={item.path}
+            >
+              <span style={{ ...styles.icon, color: item.type === 'directory' ? theme.ui.accent : theme.ui.textSecondary }}>
+                {item.type === 'directory' ? <Folder size={14} /> : <File size={14} />}
+              </span>
+              <span style={styles.name}>{item.name}</span>
+              <span style={{ ...styles.searchPath, color: theme.ui.textSecondary }}>{item.path}</span>
+            </div>
+          ))
+        ) : loading ? (
           <div style={{ ...styles.loading, color: theme.ui.textSecondary }}>
             불러오는 중...
           </div>
@@ -266,7 +503,9 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
               onSelect={onFileSelect}
               onFolderSelect={handleFolderSelect}
               selectedPath={selectedPath}
-              loadDirectory={loadDirectory}
+              loadDirectoryPage={loadDirectoryPage}
+              changeVersions={changeVersions}
+              onWatch={watchDirectory}
               theme={theme}
               onContextMenu={setContextMenu}
             />
@@ -313,6 +552,17 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
               <FolderPlus size={14} />
               <span>새 폴더</span>
             </div>
+            <div
+              className="context-menu-item"
+              style={{ ...styles.menuItem, color: theme.ui.text }}
+              onClick={() => {
+                handleDownloadFolder(contextMenu.item);
+                setContextMenu(null);
+              }}
+            >
+              <Download size={14} />
+              <span>압축 다운로드</span>
+            </div>
             <div style={{ ...styles.menuDivider, backgroundColor: theme.ui.border }} />
           </>
         )}
@@ -442,8 +692,9 @@ const FileTree = ({ theme, onFileSelect, onFolderSelect, language = 'en' }) => {
 };
 
 // 재귀적 트리 노드
-const FileTreeNode = ({ item, depth, expanded, onToggle, onSelect, onFolderSelect, selectedPath, loadDirectory, theme, onContextMenu }) => {
+const FileTreeNode = ({ item, depth, expanded, onToggle, onSelect, onFolderSelect, selectedPath, loadDirectoryPage, changeVersions, onWatch, theme, onContextMenu }) => {
   const [children, setChildren] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(false);
   const [isHovered, setIsHovered] = useState(false);
   const isSelected = selectedPath === item.path;
@@ -453,14 +704,42 @@ const FileTreeNode = ({ item, depth, expanded, onToggle, onSelect, onFolderSelec
     if (item.type === 'directory' && expanded && children.length === 0) {
       const fetchChildren = async () => {
         setLoading(true);
-        const items = await loadDirectory(item.path);
-        setChildren(items);
+        const page = await loadDirectoryPage(item.path);
+        setChildren(page.items);
+        setNextCursor(page.nextCursor);
         setLoading(false);
       };
       fetchChildren();
     }
   }, [expanded, item.path, item.type]);
 
+  // 펼쳐진 동안 변경 알림 구독
+  useEffect(() => {
+    if (item.type !== 'directory' || !expanded) return;
+    onWatch(item.path, true);
+    return () => onWatch(item.path, false);
+  }, [expanded, item.path, item.type]);
+
+  // 변경 알림 수신 시 첫 페이지 다시 로드 (서버 캐시/ETag로 변경분만 전송)
+  const changeVersion = changeVersions[item.path] || 0;
+  useEffect(() => {
+    if (item.type !== 'directory' || !expanded || changeVersion === 0) return;
+    const reloadChildren = async () => {
+      const page = await loadDirectoryPage(item.path);
+      setChildren(page.items);
+      setNextCursor(page.nextCursor);
+    };
+    reloadChildren();
+  }, [changeVersion]);
+
+  // 다음 페이지 로드
+  const loadMore = async (e) => {
+    e.stopPropagation();
+    const page = await loadDirectoryPage(item.path, nextCursor);
+    setChildren((prev) => [...prev, ...page.items]);
+    setNextCursor(page.nextCursor);
+  };
+
   const handleClick = () => {
     if (item.type === 'directory') {
       onToggle(item.path);
@@ -527,11 +806,21 @@ const FileTreeNode = ({ item, depth, expanded, onToggle, onSelect, onFolderSelec
               onSelect={onSelect}
               onFolderSelect={onFolderSelect}
               selectedPath={selectedPath}
-              loadDirectory={loadDirectory}
+              loadDirectoryPage={loadDirectoryPage}
+              changeVersions={changeVersions}
+              onWatch={onWatch}
               theme={theme}
               onContextMenu={onContextMenu}
             />
-          ))
+          )).concat(nextCursor ? [
+            <div
+              key={`${item.path}/__more__`}
+              style={{ ...styles.loading, paddingLeft: `${(depth + 1) * 16 + 8}px`, color: theme.ui.accent, cursor: 'pointer' }}
+              onClick={loadMore}
+            >
+              더 보기...
+            </div>
+          ] : [])
         )
       )}
     </>
@@ -577,6 +866,31 @@ const styles = {
     borderRadius: '2px',
     transition: 'opacity 0.15s ease',
   },
+  searchBar: {
+    display: 'flex',
+    alignItems: 'center',
+    gap: '6px',
+    padding: '4px 8px',
+    borderBottom: '1px solid',
+  },
+  searchInput: {
+    flex: 1,
+    minWidth: 0,
+    padding: '4px 0',
+    fontSize: '12px',
+    border: 'none',
+    outline: 'none',
+    backgroundColor: 'transparent',
+  },
+  searchPath: {
+    marginLeft: '8px',
+    fontSize: '10px',
+    overflow: 'hidden',
+    textOverflow: 'ellipsis',
+    whiteSpace: 'nowrap',
+    maxWidth: '50%',
+    direction: 'rtl',
+  },
   treeContainer: {
     flex: 1,
     overflowY: 'auto',
@@ -40,6 +40,19 @@ const Sidebar = ({ isOpen, onClose, sessions, activeSessionId, onSelectSession,
     return sessionId.substring(0, 8);
   };
 
+  // 히스토리 저장 사용량 표시 (예: 1.2 MB)
+  const formatBytes = (bytes) => {
+    if (!bytes) return '';
+    const units = ['B', 'KB', 'MB', 'GB'];
+    let value = bytes;
+    let unit = 0;
+    while (value >= 1024 && unit < units.length - 1) {
+      value /= 1024;
+      unit += 1;
+    }
+    return `${unit === 0 ? value : value.toFixed(1)} ${units[unit]}`;
+  };
+
   // 편집 시작
   const handleStartEdit = (session, index) => {
     setEditingSessionId(session.id);
@@ -222,6 +235,7 @@ const Sidebar = ({ isOpen, onClose, sessions, activeSessionId, onSelectSession,
                         )}
                         <div style={{ ...styles.sessionId, color: currentTheme.ui.textSecondary }}>
                           {formatSessionId(session.id)}
+                          {session.historyBytes ? ` · ${formatBytes(session.historyBytes)}` : ''}
                         </div>
                       </div>
                     </div>
@@ -11,6 +11,13 @@ import themes from '../styles/themes';
 import useSmartScroll from '../hooks/useSmartScroll';
 import useTranslation from '../hooks/useTranslation';
 
+// 히스토리 한 페이지의 청크 수 (서버 HISTORY_PAGE_SIZE 기본값과 같게)
+const HISTORY_PAGE_SIZE = 500;
+// 이전 스크롤백을 불러온 뒤의 최대 스크롤백 줄 수
+const SCROLLBACK_MAX = 50000;
+// 다시 그리기용으로 보관하는 출력 최대 크기 (문자 수, 넘으면 이전 페이지 로딩 중단)
+const TRANSCRIPT_LIMIT = 4 * 1024 * 1024;
+
 const TerminalComponent = ({ sessionId, settings, onSendData, isActive = true }) => {
   const terminalRef = useRef(null);
   const xtermRef = useRef(null);
@@ -136,6 +143,24 @@ const TerminalComponent = ({ sessionId, settings, onSendData, isActive = true })
     });
     resizeObserver.observe(terminalRef.current);
 
+    // 스크롤백 지연 로딩 상태
+    // transcript: 지금까지 터미널에 쓴 내용 (이전 페이지를 앞에 붙여 다시 그릴 때 사용)
+    let transcript = [];
+    let transcriptSize = 0;
+    let prevCursor = null;
+    let loadingOlder = false;
+    let generation = 0;
+
+    const appendTranscript = (text) => {
+      transcript.push(text);
+      transcriptSize += text.length;
+      // 너무 커지면 앞쪽을 버리고 이전 페이지 로딩 중단 (커서와 내용이 더 이상 이어지지 않음)
+      while (transcriptSize > TRANSCRIPT_LIMIT && transcript.length > 1) {
+        transcriptSize -= transcript.shift().length;
+        prevCursor = null;
+      }
+    };
+
     // 초고속 배치 처리 (더 공격적)
     let messageBuffer = [];
     let timerId = null;
@@ -144,6 +169,7 @@ const TerminalComponent = ({ sessionId, settings, onSendData, isActive = true })
       if (messageBuffer.length > 0) {
         // 버퍼 크기가 크면 잘라서 처리 (메모리 절약)
         const batch = messageBuffer.splice(0, 100).join('');
+        appendTranscript(batch);
         term.write(batch);
 
         // 남은 데이터가 있으면 다음 프레임에 처리
@@ -156,13 +182,132 @@ const TerminalComponent = ({ sessionId, settings, onSendData, isActive = true })
       }
     };
 
+    // 재연결 예약 (지수 백오프)
+    const scheduleReconnect = () => {
+      if (intentionalCloseRef.current) return;
+      setIsReady(false);
+
+      const maxAttempts = 10;
+      if (reconnectAttemptsRef.current < maxAttempts) {
+        reconnectAttemptsRef.current += 1;
+        // 지수 백오프: 1초, 2초, 4초, 8초... (최대 30초)
+        const delay = Math.min(1000 * Math.pow(2, reconnectAttemptsRef.current - 1), 30000);
+
+        term.writeln(`\x1b[1;33m⚠ ${t('disconnected')} - 재연결 시도 ${reconnectAttemptsRef.current}/${maxAttempts} (${delay/1000}초 후)\x1b[0m`);
+
+        reconnectTimeoutRef.current = setTimeout(() => {
+          console.log(`재연결 시도 ${reconnectAttemptsRef.current}/${maxAttempts}`);
+          connectWebSocket();
+        }, delay);
+      } else {
+        term.writeln(`\x1b[1;31m✗ 재연결 실패: 최대 시도 횟수 초과\x1b[0m`);
+      }
+    };
+
+    // 히스토리 페이지 조회 (아직 만들어지지 않은 세션이면 null)
+    const fetchHistory = async (params) => {
+      const token = localStorage.getItem('auth_token');
+      const res = await fetch(`/api/sessions/${sessionId}/history?${new URLSearchParams(params)}`, {
+        headers: { Authorization: token ? `Bearer ${token}` : '' },
+      });
+      if (res.status === 404) {
+        return null;
+      }
+      if (!res.ok) {
+        throw new Error(`history request failed (${res.status})`);
+      }
+      return res.json();
+    };
+
+    // 맨 위까지 스크롤하면 이전 페이지를 불러와 앞에 붙여 다시 그림
+    const loadOlder = async () => {
+      if (loadingOlder || prevCursor === null) return;
+      loadingOlder = true;
+      const loadGeneration = generation;
+      try {
+        const page = await fetchHistory({ before: prevCursor, limit: HISTORY_PAGE_SIZE });
+        // 그 사이 재연결로 다시 그려졌으면 무시
+        if (!page || intentionalCloseRef.current || loadGeneration !== generation) return;
+        if (transcriptSize + page.history.length > TRANSCRIPT_LIMIT) {
+          prevCursor = null;
+          return;
+        }
+        prevCursor = page.prev_cursor;
+        if (!page.history) return;
+
+        transcript.unshift(page.history);
+        transcriptSize += page.history.length;
+
+        const linesBefore = term.buffer.active.length;
+        term.options.scrollback = SCROLLBACK_MAX;
+        term.reset();
+        term.write(transcript.join(''), () => {
+          // 보던 위치 유지 (앞에 추가된 줄 수만큼 아래로)
+          term.scrollToLine(Math.max(term.buffer.active.length - linesBefore, 0));
+        });
+      } catch (err) {
+        console.error('이전 히스토리 조회 실패:', err);
+      } finally {
+        loadingOlder = false;
+      }
+    };
+
+    // 연결용 일회용 티켓 발급 (JWT를 WebSocket URL에 넣지 않음)
+    const fetchTicket = async () => {
+      const token = localStorage.getItem('auth_token');
+      const res = await fetch(`/api/sessions/${sessionId}/ticket`, {
+        method: 'POST',
+        headers: { Authorization: token ? `Bearer ${token}` : '' },
+      });
+      if (!res.ok) {
+        throw new Error(`ticket request failed (${res.status})`);
+      }
+      const data = await res.json();
+      return data.ticket;
+    };
+
     // WebSocket 연결 함수 (재연결 가능)
-    const connectWebSocket = () => {
+    const connectWebSocket = async () => {
       const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
       const wsHost = window.location.host || 'localhost:8000';
-      const wsUrl = `${protocol}//${wsHost}/ws/${sessionId}?cols=${term.cols}&rows=${term.rows}`;
 
-      console.log('WebSocket 연결 시도:', wsUrl, `(${term.cols}x${term.rows})`);
+      // 최신 히스토리 페이지만 받고, 이전 스크롤백은 스크롤할 때 prev_cursor로 조회
+      let page;
+      try {
+        page = await fetchHistory({ limit: HISTORY_PAGE_SIZE });
+      } catch (err) {
+        console.error('히스토리 조회 실패:', err);
+        scheduleReconnect();
+        return null;
+      }
+
+      let ticket;
+      try {
+        ticket = await fetchTicket();
+      } catch (err) {
+        console.error('WebSocket 티켓 발급 실패:', err);
+        scheduleReconnect();
+        return null;
+      }
+      if (intentionalCloseRef.current) return null;
+
+      // 최신 페이지로 다시 그림 (재연결 시 이전 출력이 중복되지 않도록)
+      generation += 1;
+      messageBuffer = [];
+      transcript = [];
+      transcriptSize = 0;
+      prevCursor = page ? page.prev_cursor : null;
+      term.reset();
+      if (page && page.history) {
+        appendTranscript(page.history);
+        term.write(page.history);
+      }
+      // 받은 페이지 이후의 출력만 WebSocket으로 받음
+      const after = page && page.end_seq !== null ? page.end_seq : 0;
+
+      const wsUrl = `${protocol}//${wsHost}/ws/${sessionId}?ticket=${encodeURIComponent(ticket)}&cols=${term.cols}&rows=${term.rows}&after=${after}`;
+
+      console.log('WebSocket 연결 시도:', sessionId, `(${term.cols}x${term.rows})`);
       const ws = new WebSocket(wsUrl);
       wsRef.current = ws;
 
@@ -214,33 +359,15 @@ const TerminalComponent = ({ sessionId, settings, onSendData, isActive = true })
       ws.onclose = (event) => {
         console.log('WebSocket 연결 종료:', event.code, event.reason);
 
-        // 의도적인 종료가 아니면 재연결 시도
-        if (!intentionalCloseRef.current) {
-          setIsReady(false);
-
-          const maxAttempts = 10;
-          if (reconnectAttemptsRef.current < maxAttempts) {
-            reconnectAttemptsRef.current += 1;
-            // 지수 백오프: 1초, 2초, 4초, 8초... (최대 30초)
-            const delay = Math.min(1000 * Math.pow(2, reconnectAttemptsRef.current - 1), 30000);
-
-            term.writeln(`\x1b[1;33m⚠ ${t('disconnected')} - 재연결 시도 ${reconnectAttemptsRef.current}/${maxAttempts} (${delay/1000}초 후)\x1b[0m`);
-
-            reconnectTimeoutRef.current = setTimeout(() => {
-              console.log(`재연결 시도 ${reconnectAttemptsRef.current}/${maxAttempts}`);
-              connectWebSocket();
-            }, delay);
-          } else {
-            term.writeln(`\x1b[1;31m✗ 재연결 실패: 최대 시도 횟수 초과\x1b[0m`);
-          }
-        }
+        // 의도적인 종료가 아니면 재연결 시도 (새 티켓 발급)
+        scheduleReconnect();
       };
 
       return ws;
     };
 
     // 초기 WebSocket 연결
-    const ws = connectWebSocket();
+    connectWebSocket();
 
     // 한글 IME 조합 처리
     let isComposing = false;
@@ -295,6 +422,17 @@ const TerminalComponent = ({ sessionId, settings, onSendData, isActive = true })
       container.addEventListener('scroll', handleUserScroll);
     }
 
+    // 맨 위에 도달하면 이전 스크롤백 로딩 (스크롤바/키보드는 onScroll, 이미 맨 위에서 휠은 wheel)
+    const scrollDisposable = term.onScroll((viewportY) => {
+      if (viewportY === 0) loadOlder();
+    });
+    const handleWheel = (event) => {
+      if (event.deltaY < 0 && term.buffer.active.viewportY === 0) loadOlder();
+    };
+    if (container) {
+      container.addEventListener('wheel', handleWheel, { passive: true });
+    }
+
     // 정리
     return () => {
       // 의도적인 종료 플래그 설정 (재연결 방지)
@@ -311,8 +449,10 @@ const TerminalComponent = ({ sessionId, settings, onSendData, isActive = true })
       if (resizeTimeoutRef.current) {
         clearTimeout(resizeTimeoutRef.current);
       }
+      scrollDisposable.dispose();
       if (container) {
         container.removeEventListener('scroll', handleUserScroll);
+        container.removeEventListener('wheel', handleWheel);
         // IME 이벤트 리스너 제거
         const textarea = container.querySelector('textarea');
         if (textarea && textarea._compositionEndHandler) {
@@ -1,8 +1,56 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
+import { promises as fs } from 'node:fs'
+import path from 'node:path'
+import { promisify } from 'node:util'
+import zlib from 'node:zlib'
+
+const brotli = promisify(zlib.brotliCompress)
+const gzip = promisify(zlib.gzip)
+
+// 빌드 결과물 옆에 .br/.gz를 미리 만들어 둠 (백엔드가 Accept-Encoding에 맞춰 그대로 전송)
+function precompress({ threshold = 1024, include = /\.(js|mjs|css|html|svg|json)$/ } = {}) {
+  let outDir
+  return {
+    name: 'precompress',
+    apply: 'build',
+    enforce: 'post',
+    configResolved(config) {
+      outDir = path.resolve(config.root, config.build.outDir)
+    },
+    async closeBundle() {
+      const files = []
+      const walk = async (dir) => {
+        for (const entry of await fs.readdir(dir, { withFileTypes: true })) {
+          const full = path.join(dir, entry.name)
+          if (entry.isDirectory()) await walk(full)
+          else if (include.test(entry.name)) files.push(full)
+        }
+      }
+      await walk(outDir)
+
+      await Promise.all(files.map(async (file) => {
+        const content = await fs.readFile(file)
+        if (content.length < threshold) return
+        const [br, gz] = await Promise.all([
+          brotli(content, {
+            params: {
+              [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+              [zlib.constants.BROTLI_PARAM_SIZE_HINT]: content.length,
+            },
+          }),
+          gzip(content, { level: 9 }),
+        ])
+        // 압축해도 작아지지 않으면 원본만 사용
+        if (br.length < content.length) await fs.writeFile(`${file}.br`, br)
+        if (gz.length < content.length) await fs.writeFile(`${file}.gz`, gz)
+      }))
+    },
+  }
+}
 
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), precompress()],
   server: {
     host: '0.0.0.0',
     port: 5173,
@@ -14,6 +62,7 @@ export default defineConfig({
       '/api': {
         target: 'http://iterminal-backend:8000',
         changeOrigin: true,
+        ws: true, // /api/files/watch 변경 알림
       },
       '/ws': {
         target: 'ws://iterminal-backend:8000',